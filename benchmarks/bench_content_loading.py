@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Compare inline content literals against the lazy content package.
+
+"before" models the old app.py: every rerun executes the code that builds all
+training topics, Learn & Practice lessons, courses and curated banks, and the
+first run also pays to compile it.  "after" models the content loader: the
+first request for a topic imports one module, later reruns hit the cache.
+
+Run from the repository root:
+    python benchmarks/bench_content_loading.py --reruns 50
+"""
+
+import argparse
+import importlib
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+CONTENT_DIR = ROOT / "content"
+
+
+def content_sources():
+    return [p for p in sorted(CONTENT_DIR.rglob("*.py")) if p.name != "__init__.py"]
+
+
+def timed(fn):
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    fn()
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def bench_inline(reruns):
+    sources = [(str(p), p.read_text(encoding="utf-8")) for p in content_sources()]
+    compiled = []
+
+    def first_paint():
+        for name, src in sources:
+            code = compile(src, name, "exec")
+            compiled.append(code)
+            exec(code, {})
+
+    def rerun():
+        for code in compiled:
+            exec(code, {})
+
+    first = timed(first_paint)
+    runs = [timed(rerun) for _ in range(reruns)]
+    return first, runs
+
+
+def bench_lazy(reruns, topic):
+    for name in [m for m in sys.modules if m == "content" or m.startswith("content.")]:
+        del sys.modules[name]
+    content = importlib.import_module("content")
+
+    def first_paint():
+        content.get_courses()
+        content.get_training_module(topic)
+
+    def rerun():
+        content.get_courses()
+        content.get_training_module(topic)
+
+    first = timed(first_paint)
+    runs = [timed(rerun) for _ in range(reruns)]
+    return first, runs
+
+
+def report(label, first, runs):
+    wall = [w for w, _ in runs]
+    cpu = [c for _, c in runs]
+    print(f"{label:<8} first paint {first[0] * 1000:9.3f} ms wall {first[1] * 1000:9.3f} ms cpu | "
+          f"rerun median {statistics.median(wall) * 1000:9.4f} ms wall {statistics.median(cpu) * 1000:9.4f} ms cpu")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark course content loading.")
+    parser.add_argument("--reruns", type=int, default=30, help="Number of simulated reruns.")
+    parser.add_argument("--topic", default="Tool: SQL & Databases", help="Training topic to load.")
+    args = parser.parse_args()
+
+    report("inline", *bench_inline(args.reruns))
+    report("lazy", *bench_lazy(args.reruns, args.topic))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Correlation matrix: one scipy call per pair vs. one vectorized pass vs. the cache.
+
+Builds ``--rows`` rows of ``--columns`` correlated numeric columns with
+``--missing`` values blanked, then computes every pairwise correlation with its
+p-value three ways: ``scipy.stats.pearsonr`` / ``spearmanr`` once per pair
+(what one click per pair in the Statistical Analysis tool amounted to),
+``correlation_matrix.pairwise_matrices``, and ``MatrixCache.get`` on a table it
+has already seen.  Reports times and the largest difference from scipy.
+
+Run from the repository root:
+    python benchmarks/bench_correlation_matrix.py --rows 100000 --columns 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from scipy import stats  # noqa: E402
+
+from correlation_matrix import MatrixCache, pairwise_matrices  # noqa: E402
+
+
+def table(rows, columns, missing, seed=0):
+    rng = np.random.default_rng(seed)
+    factors = rng.normal(size=(rows, 3))
+    values = factors @ rng.normal(size=(3, columns)) + rng.normal(size=(rows, columns))
+    values[rng.random((rows, columns)) < missing] = np.nan
+    return pd.DataFrame(values, columns=[f"x{i}" for i in range(columns)])
+
+
+def per_pair(frame, method):
+    test = stats.pearsonr if method == "pearson" else stats.spearmanr
+    k = frame.shape[1]
+    r, p = np.eye(k), np.zeros((k, k))
+    for i in range(k):
+        for j in range(i + 1, k):
+            pair = frame.iloc[:, [i, j]].dropna()
+            result = test(pair.iloc[:, 0], pair.iloc[:, 1])
+            r[i, j] = r[j, i] = result[0]
+            p[i, j] = p[j, i] = result[1]
+    return r, p
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark vectorized correlation matrices.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--columns", type=int, default=20)
+    parser.add_argument("--missing", type=float, default=0.02)
+    args = parser.parse_args()
+
+    frame = table(args.rows, args.columns, args.missing)
+    pairs = args.columns * (args.columns - 1) // 2
+    print(f"table                      {args.rows:,} rows x {args.columns} columns, {pairs} pairs, {args.missing:.0%} missing")
+    for method in ("pearson", "spearman"):
+        (r, p), loop_s = timed(lambda: per_pair(frame, method))
+        matrices, matrix_s = timed(lambda: pairwise_matrices(frame, method))
+        cache = MatrixCache()
+        cache.get(frame, method)
+        _, cached_s = timed(lambda: cache.get(frame, method))
+        r_diff = np.max(np.abs(matrices["r"].to_numpy() - r))
+        p_diff = np.max(np.abs(matrices["p"].to_numpy() - p))
+        print(f"{method:9s} one call per pair  {loop_s * 1000:9.1f} ms")
+        print(f"{method:9s} vectorized pass    {matrix_s * 1000:9.1f} ms   ({loop_s / matrix_s:.1f}x)")
+        print(f"{method:9s} cached             {cached_s * 1000:9.1f} ms")
+        print(f"{method:9s} max |r - scipy| {r_diff:.2e}, max |p - scipy| {p_diff:.2e}")
+
+
+if __name__ == "__main__":
+    main()
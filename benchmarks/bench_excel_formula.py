@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Formula engine: cross-checking workbooks and evaluating criteria formulas.
+
+Evaluates every formula of the repository's workbooks against the results
+Excel saved, then builds a sheet of ``--rows`` employees with ``--formulas``
+COUNTIFS/SUMIFS/AVERAGEIFS/MAXIFS/INDEX-MATCH cells over whole columns and
+times a full recalculation against looping over the rows in Python for the
+same criteria.
+
+Run from the repository root:
+    python benchmarks/bench_excel_formula.py --rows 50000 --formulas 200
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from excel_formula import FormulaEngine, cross_check, values_match  # noqa: E402
+from workbook_cache import load_workbook  # noqa: E402
+
+DEPARTMENTS = ["Sales", "Finance", "IT", "HR", "Marketing", "Operations"]
+
+
+def build_sheet(n_rows, n_formulas, rng):
+    rows = [("Employee", "Department", "Salary", "Years")]
+    for i in range(n_rows):
+        rows.append((f"Employee {i}", rng.choice(DEPARTMENTS), rng.randrange(30_000, 120_000, 500), rng.randint(0, 30)))
+    last = n_rows + 1
+    formulas = {}
+    for i in range(n_formulas):
+        dept, years = DEPARTMENTS[i % len(DEPARTMENTS)], i % 20
+        kind = i % 5
+        if kind == 0:
+            text = f'=COUNTIFS(B2:B{last},"{dept}",D2:D{last},">={years}")'
+        elif kind == 1:
+            text = f'=SUMIFS(C2:C{last},B2:B{last},"{dept}",D2:D{last},"<{years}")'
+        elif kind == 2:
+            text = f'=AVERAGEIFS(C2:C{last},B2:B{last},"{dept}")'
+        elif kind == 3:
+            text = f'=MAXIFS(C2:C{last},B2:B{last},"{dept}",D2:D{last},">{years}")'
+        else:
+            text = f'=INDEX(C2:C{last},MATCH("Employee {rng.randrange(n_rows)}",A2:A{last},0))'
+        formulas[(last + 2 + i, 1)] = text
+    return rows, formulas
+
+
+def loop_results(rows, formulas):
+    """The same answers from a Python loop over the data rows."""
+    data = rows[1:]
+    results = {}
+    for cell, text in formulas.items():
+        quoted = text.split('"')
+        if text.startswith("=INDEX"):
+            name = quoted[1]
+            results[cell] = next(row[2] for row in data if row[0] == name)
+            continue
+        dept = quoted[1]
+        if text.startswith("=AVERAGEIFS"):
+            salaries = [row[2] for row in data if row[1] == dept]
+            results[cell] = sum(salaries) / len(salaries)
+            continue
+        condition = quoted[3]
+        op, bound = condition.rstrip("0123456789"), int(condition.lstrip("<>="))
+        test = {">=": lambda v: v >= bound, "<": lambda v: v < bound, ">": lambda v: v > bound}[op]
+        picked = [row for row in data if row[1] == dept and test(row[3])]
+        if text.startswith("=COUNTIFS"):
+            results[cell] = len(picked)
+        elif text.startswith("=SUMIFS"):
+            results[cell] = sum(row[2] for row in picked)
+        else:
+            results[cell] = max((row[2] for row in picked), default=0)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Excel formula engine.")
+    parser.add_argument("--rows", type=int, default=50_000)
+    parser.add_argument("--formulas", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    for path in sorted(ROOT.glob("*.xlsx")):
+        book = load_workbook(path)
+        if not book.formulas:
+            continue
+        start = time.perf_counter()
+        checks = cross_check(book)
+        elapsed = (time.perf_counter() - start) * 1000
+        matched = sum(check["match"] for check in checks)
+        print(f"{path.name[:45]:45} {matched:4d}/{len(checks):<4d} match Excel   {elapsed:7.1f} ms")
+
+    rows, formulas = build_sheet(args.rows, args.formulas, random.Random(args.seed))
+    start = time.perf_counter()
+    engine = FormulaEngine(rows, formulas)
+    build_s = time.perf_counter() - start
+    start = time.perf_counter()
+    results = engine.recalculate()
+    engine_s = time.perf_counter() - start
+    start = time.perf_counter()
+    expected = loop_results(rows, formulas)
+    loop_s = time.perf_counter() - start
+    agree = sum(values_match(results[cell], expected[cell]) for cell in formulas)
+
+    print(f"\nsheet                      {args.rows} rows, {args.formulas} formulas over whole columns")
+    print(f"load grid + parse          {build_s * 1000:8.1f} ms")
+    print(f"engine recalculation       {engine_s * 1000:8.1f} ms   ({engine_s / args.formulas * 1e3:.2f} ms/formula)")
+    print(f"python row loop            {loop_s * 1000:8.1f} ms   ({loop_s / args.formulas * 1e3:.2f} ms/formula)")
+    print(f"results agree              {agree}/{args.formulas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Next-due-card lookup: per-rerun scan vs. the ReviewQueue index.
+
+Run from the repository root:
+    python benchmarks/bench_flashcard_queue.py --cards 100000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from flashcard_queue import ReviewQueue  # noqa: E402
+
+COURSES = ["FI1BBDF05", "FI1BBSF05", "FI1BBST05", "FI1BBDD75", "FI1BBP175", "FI1BBEO10"]
+
+
+def build_deck(n, rng):
+    now = datetime.now()
+    return {
+        f"card_{i}": {
+            "front": f"Q{i}",
+            "back": f"A{i}",
+            "course": rng.choice(COURSES),
+            "next_review": (now + timedelta(days=rng.randint(-30, 60), minutes=rng.randint(0, 1440))).isoformat(),
+        }
+        for i in range(n)
+    }
+
+
+def scan(cards, course, now):
+    # What the Flashcards page did on every rerun before the index.
+    cards_to_review = []
+    for card_id, card in cards.items():
+        next_review = card.get("next_review")
+        if next_review:
+            try:
+                if datetime.fromisoformat(next_review) <= now:
+                    cards_to_review.append((card_id, card))
+            except ValueError:
+                cards_to_review.append((card_id, card))
+        else:
+            cards_to_review.append((card_id, card))
+    cards_to_review = [(cid, c) for cid, c in cards_to_review if c.get("course") == course]
+    return cards_to_review[0][0] if cards_to_review else None
+
+
+def median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the flashcard review queue.")
+    parser.add_argument("--cards", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cards = build_deck(args.cards, rng)
+    now = datetime.now()
+    course = COURSES[0]
+
+    start = time.perf_counter()
+    queue = ReviewQueue(cards)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    def review_one():
+        card_id = queue.next_due(course, now=now)
+        card = cards[card_id]
+        card["next_review"] = (now + timedelta(days=6)).isoformat()
+        queue.upsert(card_id, card)
+
+    print(f"cards                     {args.cards}")
+    print(f"scan + filter per rerun   {median_ms(lambda: scan(cards, course, now), args.repeat):10.3f} ms")
+    print(f"queue build (once)        {build_ms:10.3f} ms")
+    print(f"queue next due + count    {median_ms(lambda: (queue.next_due(course, now=now), queue.due_count(course, now=now)), args.repeat * 50):10.4f} ms")
+    print(f"queue review + reschedule {median_ms(review_one, args.repeat * 50):10.4f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Formula engine: full recalculation vs. recalculating only dirty dependents.
+
+Builds a sheet of ``--cells`` cells: half are inputs in column A, half are a
+running-total chain in column B (``B2 = B1 + A2``), with a few summary
+formulas over the whole input column.  Times a full recalculation against
+``FormulaEngine.set_cells`` for edits near the end of the chain (few
+dependents), in the middle and at the start (the whole chain is dirty),
+and checks every incremental result against a full recalculation.
+
+Run from the repository root:
+    python benchmarks/bench_formula_recalc.py --cells 10000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from excel_formula import FormulaEngine, values_match  # noqa: E402
+
+
+def build_sheet(n_cells, rng):
+    n = n_cells // 2
+    rows = [[rng.randint(1, 100)] for _ in range(n)]
+    formulas = {(1, 2): "=A1"}
+    for i in range(2, n + 1):
+        formulas[(i, 2)] = f"=B{i - 1}+A{i}"
+    formulas[(1, 3)] = f"=SUM(A1:A{n})"
+    formulas[(2, 3)] = f'=COUNTIF(A1:A{n},">50")'
+    formulas[(3, 3)] = f"=B{n}-C1"
+    return rows, formulas
+
+
+def timed(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark incremental formula recalculation.")
+    parser.add_argument("--cells", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rows, formulas = build_sheet(args.cells, rng)
+    n = len(rows)
+    engine = FormulaEngine(rows, formulas)
+    full_ms, _ = timed(engine.recalculate, args.repeats)
+    print(f"sheet                      {n} inputs + {len(formulas)} formulas (chain of {n})")
+    print(f"full recalculation         {full_ms:9.2f} ms   {len(formulas)} cells")
+
+    for label, row in (("edit near chain end", n - 10), ("edit mid chain", n // 2), ("edit chain start", 1)):
+        ms, recalculated = timed(lambda: engine.set_cells({(row, 1): rng.randint(1, 100)}), args.repeats)
+        print(f"{label:26} {ms:9.2f} ms   {len(recalculated)} cells   x{full_ms / ms:6.1f}")
+
+    ms, recalculated = timed(lambda: engine.set_cells({(n - 5, 2): f"=B{n - 6}*2"}), args.repeats)
+    print(f"{'replace a chain formula':26} {ms:9.2f} ms   {len(recalculated)} cells   x{full_ms / ms:6.1f}")
+
+    check = FormulaEngine(engine.values.tolist(), engine.formulas).recalculate()
+    agree = sum(values_match(engine.results[cell], check[cell]) for cell in check)
+    print(f"results agree              {agree}/{len(check)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""Global sidebar search: static index build time and query latency.
+
+Builds the process-wide index over lessons, flashcards and formulas, adds a
+session with generated notes and snippets, and reports query percentiles for
+``search_everything`` plus the cost of re-syncing one edited snippet.
+
+Run from the repository root:
+    python benchmarks/bench_global_search.py --notes 2000 --snippets 500
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from content import get_default_snippets  # noqa: E402
+from global_search import get_snippet_index, search_everything, static_index  # noqa: E402
+
+WORDS = (
+    "regression correlation variance median mean pivot table lookup dashboard kpi chart histogram "
+    "outlier dataset sampling hypothesis significance forecast cleaning duplicates filter query join "
+    "aggregate visualisation stakeholder report excel python sql index formula distribution"
+).split()
+QUERIES = ["vlookup", "standard deviation", '"pivot table"', "hypothesis test p-value", "regr", "sql join", "descriptive analytics"]
+
+
+def build_session(n_notes, n_snippets, rng):
+    notes = {}
+    for i in range(n_notes):
+        notes.setdefault(f"COURSE{i % 6}", []).append({
+            "title": " ".join(rng.choices(WORDS, k=3)).title(),
+            "content": "<p>" + " ".join(rng.choices(WORDS, k=rng.randint(50, 300))) + "</p>",
+        })
+    snippets = get_default_snippets()
+    for i in range(n_snippets):
+        snippets[f"generated_{i}"] = {
+            "title": " ".join(rng.choices(WORDS, k=2)).title(),
+            "description": " ".join(rng.choices(WORDS, k=12)),
+            "code": "\n".join(f"df['{w}'] = df['{w}'].fillna(0)" for w in rng.choices(WORDS, k=10)),
+            "language": "python",
+            "category": "Generated",
+        }
+    return {"study_notes": notes, "code_snippets": snippets}
+
+
+def percentiles_ms(times):
+    times = sorted(t * 1000 for t in times)
+    return statistics.median(times), times[max(0, int(len(times) * 0.95) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the global search index.")
+    parser.add_argument("--notes", type=int, default=2000)
+    parser.add_argument("--snippets", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index, _ = static_index()
+    build_ms = (time.perf_counter() - start) * 1000
+    static_index()
+    cached_ms = (time.perf_counter() - start) * 1000 - build_ms
+
+    session = build_session(args.notes, args.snippets, random.Random(args.seed))
+    start = time.perf_counter()
+    search_everything(session, "warm up")
+    session_ms = (time.perf_counter() - start) * 1000
+
+    print(f"static documents           {len(index)}")
+    print(f"static build (once)        {build_ms:10.1f} ms   (content import included; cached lookup {cached_ms:.3f} ms)")
+    print(f"session indexes (first)    {session_ms:10.1f} ms   ({args.notes} notes, {len(session['code_snippets'])} snippets)")
+
+    all_times = []
+    for query in QUERIES:
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            search_everything(session, query, limit=8)
+            times.append(time.perf_counter() - start)
+        all_times.extend(times)
+        median, p95 = percentiles_ms(times)
+        print(f"{query!r:26} median {median:7.3f} ms  p95 {p95:7.3f} ms")
+    median, p95 = percentiles_ms(all_times)
+    print(f"{'all queries':26} median {median:7.3f} ms  p95 {p95:7.3f} ms")
+
+    times = []
+    for i in range(args.repeat):
+        session["code_snippets"]["generated_0"]["code"] += f"\n# edit {i}"
+        start = time.perf_counter()
+        get_snippet_index(session)
+        times.append(time.perf_counter() - start)
+    median, _ = percentiles_ms(times)
+    print(f"re-sync after one edit     {median:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""LLM response cache, exercised offline with the fake chat client.
+
+Replays a stream of Study Notes style requests where a share of them repeat
+(re-summarizing an unchanged note, re-evaluating an identical answer) and
+reports latency and the gateway's hit/miss/eviction counters.
+
+Run from the repository root:
+    python benchmarks/bench_llm_cache.py --requests 500 --distinct 120 --latency 0.05
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from llm_gateway import FakeChatClient, LLMGateway, ResponseCache  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the LLM response cache.")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--distinct", type=int, default=120, help="distinct prompts in the request stream")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake API latency in seconds")
+    parser.add_argument("--max-entries", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    workdir = Path(tempfile.mkdtemp(prefix="sb_llm_cache_bench_"))
+    fake = FakeChatClient(latency=args.latency)
+    gateway = LLMGateway(fake, ResponseCache(workdir / "cache.db", max_entries=args.max_entries))
+
+    # Skewed prompt popularity: a few notes get summarized over and over.
+    weights = [1.0 / (rank + 1) for rank in range(args.distinct)]
+    prompts = rng.choices(range(args.distinct), weights=weights, k=args.requests)
+    times = []
+    for prompt in prompts:
+        start = time.perf_counter()
+        gateway.complete(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You are an expert study assistant."},
+                {"role": "user", "content": f"Summarize this content:\n\nNote {prompt} " + "lorem ipsum " * 200},
+            ],
+            max_tokens=2000,
+            temperature=0.7,
+        )
+        times.append(time.perf_counter() - start)
+
+    stats = gateway.stats()
+    times.sort()
+    print(f"requests              {args.requests}  (distinct prompts {args.distinct}, cache size {args.max_entries})")
+    print(f"API calls made        {fake.calls}")
+    print(f"hits / misses         {stats['hits']} / {stats['misses']}  hit rate {stats['hit_rate']:.1%}")
+    print(f"evictions             {stats['evictions']}  entries {stats['entries']}")
+    print(f"latency median        {statistics.median(times) * 1000:8.2f} ms")
+    print(f"latency p95           {times[int(len(times) * 0.95) - 1] * 1000:8.2f} ms")
+    print(f"uncached total        {args.requests * args.latency:8.2f} s   cached total {sum(times):8.2f} s")
+
+
+if __name__ == "__main__":
+    main()
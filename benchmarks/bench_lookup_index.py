@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Excel Formula Simulator lookups: scanning the table vs. the hash index.
+
+Builds a lookup table of ``--rows`` rows and times ``--lookups`` exact
+lookups three ways: the old per-lookup scan (``astype(str).str.lower() ==
+value`` over the key column), ``LookupEngine.lookup`` one key at a time
+against the cached index, and ``lookup_many`` filling a whole column at
+once.  Also times approximate matches (VLOOKUP ``TRUE``) one by one against
+the batch ``searchsorted``, and the index rebuild after the table changes.
+
+Run from the repository root:
+    python benchmarks/bench_lookup_index.py --rows 100000 --lookups 2000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from lookup_index import EXACT, NEXT_SMALLER, LookupEngine, column_digest  # noqa: E402
+
+
+def build_table(n_rows, rng):
+    return pd.DataFrame({
+        "Code": [f"EMP{i:07d}" for i in rng.permutation(n_rows)],
+        "Threshold": np.sort(rng.integers(0, n_rows * 10, n_rows)),
+        "Manager": [f"Manager {i % 997}" for i in range(n_rows)],
+        "Budget": rng.integers(10_000, 90_000, n_rows),
+    })
+
+
+def scan_lookup(table, key_column, value, return_column):
+    match = table[table[key_column].astype(str).str.lower() == str(value).lower()]
+    return match.iloc[0][return_column] if len(match) > 0 else None
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the hash-indexed lookup engine.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=2_000)
+    parser.add_argument("--sample", type=int, default=100, help="time the slow one-at-a-time paths on this many keys and scale")
+    parser.add_argument("--seed", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    table = build_table(args.rows, rng)
+    keys = pd.Series(table["Code"].sample(args.lookups, replace=True, random_state=args.seed).str.lower().to_numpy())
+    engine = LookupEngine()
+
+    sample = keys[:min(args.sample, args.lookups)]
+    scale = args.lookups / len(sample)
+
+    scan_ms, scanned = timed(lambda: [scan_lookup(table, "Code", key, "Budget") for key in sample])
+    build_ms, _ = timed(lambda: engine.column_index("lookup", table, "Code"))
+    rehash_ms, _ = timed(lambda: [engine.lookup("lookup", table, "Code", key, "Budget") for key in sample])
+    digest = column_digest(table["Code"])
+    one_ms, single = timed(lambda: [engine.lookup("lookup", table, "Code", key, "Budget", digest=digest)[1] for key in keys])
+    many_ms, batch = timed(lambda: engine.lookup_many("lookup", table, "Code", keys, "Budget"))
+    assert scanned == single[:len(scanned)] and single == batch.tolist()
+    scan_ms *= scale
+
+    print(f"table                      {args.rows} rows, {args.lookups} exact lookups (case-insensitive)")
+    print(f"scan per lookup (old)      {scan_ms:10.1f} ms  (scaled from {len(sample)} lookups)")
+    print(f"build index once           {build_ms:10.1f} ms")
+    print(f"indexed, hash per lookup   {rehash_ms * scale:10.1f} ms  (re-hashes the key column each call)")
+    print(f"indexed, digest passed     {one_ms:10.1f} ms")
+    print(f"indexed, filled down       {many_ms:10.1f} ms   x{scan_ms / many_ms:8.0f} vs scan")
+
+    values = rng.integers(0, args.rows * 10, args.lookups)
+    digest = column_digest(table["Threshold"])
+    engine.column_index("lookup", table, "Threshold", digest)
+    approx_one_ms, one = timed(lambda: [engine.lookup("lookup", table, "Threshold", v, "Budget", mode=NEXT_SMALLER, digest=digest)[1] for v in values])
+    approx_many_ms, many = timed(lambda: engine.lookup_many("lookup", table, "Threshold", values, "Budget", mode=NEXT_SMALLER))
+    # The largest threshold not above each value; a duplicated one answers from its first row.
+    thresholds = np.sort(table["Threshold"].to_numpy())
+    at = np.searchsorted(thresholds, values, side="right") - 1
+    first_budget = table.drop_duplicates("Threshold").set_index("Threshold")["Budget"]
+    expected = [first_budget[thresholds[i]] if i >= 0 else None for i in at]
+    assert one == many.tolist() == expected
+    print(f"approximate, one at a time {approx_one_ms:10.1f} ms")
+    print(f"approximate, filled down   {approx_many_ms:10.1f} ms  (np.searchsorted)")
+
+    table.loc[0, "Code"] = "EDITED"
+    rebuild_ms, _ = timed(lambda: engine.lookup("lookup", table, "Code", "edited", "Budget", mode=EXACT))
+    print(f"lookup after a table edit  {rebuild_ms:10.1f} ms  (content hash changed: index rebuilt)")
+    print(f"stats                      {engine.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""Study Notes version history: full snapshots vs. reverse deltas.
+
+Simulates a note that is edited and saved repeatedly and reports the
+persisted JSON size of one note when the history keeps full copies of the
+previous content versus reverse deltas, plus the cost of saving and of
+rebuilding the oldest version.  Before timing, it checks that past versions
+of plain-text notes with comparisons such as ``x < 5`` rebuild exactly.
+
+Run from the repository root:
+    python benchmarks/bench_note_history.py --paragraphs 40 --saves 30 --depth 10
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from note_history import _TOKEN_RE, reconstruct, record_version  # noqa: E402
+
+WORDS = (
+    "regression correlation variance median mean pivot table lookup dashboard kpi chart histogram "
+    "outlier dataset sampling hypothesis significance forecast cleaning duplicates filter query join"
+).split()
+
+
+def paragraph(rng):
+    return "<p>" + " ".join(rng.choices(WORDS, k=rng.randint(30, 80))) + "</p>"
+
+
+def edit(paragraphs, rng):
+    """A typical save: touch a couple of paragraphs, sometimes add one."""
+    paragraphs = list(paragraphs)
+    for _ in range(rng.randint(1, 3)):
+        i = rng.randrange(len(paragraphs))
+        words = paragraphs[i][3:-4].split()
+        words[rng.randrange(len(words))] = f"<b>{rng.choice(WORDS)}</b>"
+        paragraphs[i] = "<p>" + " ".join(words) + "</p>"
+    if rng.random() < 0.3:
+        paragraphs.insert(rng.randrange(len(paragraphs) + 1), paragraph(rng))
+    return paragraphs
+
+
+def check_plain_text(rng, saves=200):
+    """Edit a plain-text note with bare "<" comparisons; every past version must rebuild exactly."""
+    lines = [f"if {rng.choice(WORDS)} < {rng.randint(1, 9)} then keep the row" for _ in range(5)]
+    versions = ["\n".join(lines)]
+    for _ in range(saves):
+        i = rng.randrange(len(lines))
+        words = lines[i].split(" ")
+        words[rng.randrange(len(words))] = rng.choice(WORDS + ["<", "<<", str(rng.randint(1, 9))])
+        lines[i] = " ".join(words)
+        if "\n".join(lines) != versions[-1]:
+            versions.append("\n".join(lines))
+    history = []
+    for i in range(1, len(versions)):
+        assert "".join(_TOKEN_RE.findall(versions[i])) == versions[i]
+        history = record_version(history, versions[i - 1], versions[i], f"save {i}", "Edited: Note", depth=saves)
+    for i in range(len(history)):
+        assert reconstruct(versions[-1], history, i) == versions[i]
+
+
+def note_bytes(content, history):
+    return len(json.dumps({"title": "Note", "content": content, "version_history": history}, ensure_ascii=False).encode("utf-8"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark note version history storage.")
+    parser.add_argument("--paragraphs", type=int, default=40)
+    parser.add_argument("--saves", type=int, default=30)
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    check_plain_text(random.Random(args.seed))
+    paragraphs = [paragraph(rng) for _ in range(args.paragraphs)]
+    versions = ["".join(paragraphs)]
+    for _ in range(args.saves):
+        paragraphs = edit(paragraphs, rng)
+        versions.append("".join(paragraphs))
+
+    snapshots = []
+    deltas = []
+    save_times = []
+    for i in range(1, len(versions)):
+        snapshots.append({"date": f"save {i}", "summary": "Edited: Note", "content": versions[i - 1]})
+        snapshots = snapshots[-args.depth:]
+        start = time.perf_counter()
+        deltas = record_version(deltas, versions[i - 1], versions[i], f"save {i}", "Edited: Note", depth=args.depth)
+        save_times.append(time.perf_counter() - start)
+
+    current = versions[-1]
+    for i in range(len(deltas)):
+        assert reconstruct(current, deltas, i) == versions[len(versions) - 1 - len(deltas) + i]
+    start = time.perf_counter()
+    reconstruct(current, deltas, 0)
+    oldest_ms = (time.perf_counter() - start) * 1000
+
+    content_only = note_bytes(current, [])
+    full = note_bytes(current, snapshots)
+    delta = note_bytes(current, deltas)
+    print(f"note content               {len(current.encode('utf-8')):10d} bytes   ({args.saves} saves, depth {args.depth})")
+    print(f"note with full snapshots   {full:10d} bytes   history {full - content_only} bytes")
+    print(f"note with reverse deltas   {delta:10d} bytes   history {delta - content_only} bytes")
+    print(f"history size ratio         {(full - content_only) / max(delta - content_only, 1):10.1f}x")
+    print(f"save (record_version)      {statistics.median(save_times) * 1000:10.3f} ms median")
+    print(f"rebuild oldest version     {oldest_ms:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
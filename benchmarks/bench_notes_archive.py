@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Notes export/import: one JSON string vs. the streaming ZIP archive.
+
+Generates several years' worth of notes (some with pasted pictures and
+version history) and reports time, output size and peak Python memory
+(tracemalloc, on top of the notes themselves) for building a single
+``json.dumps`` string of every course versus writing the ZIP archive, and
+for importing the archive into an empty and into an already-populated
+notebook.
+
+Run from the repository root:
+    python benchmarks/bench_notes_archive.py --notes 5000
+"""
+
+import argparse
+import base64
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from note_history import record_version  # noqa: E402
+from notes_archive import read_notes_archive, write_notes_archive  # noqa: E402
+
+COURSES = ["FI1BBDF05", "FI1BBSF05", "FI1BBST05", "FI1BBDD75", "FI1BBP175", "FI1BBEO10"]
+WORDS = "regression correlation variance median pivot table lookup dashboard kpi chart outlier dataset".split()
+
+
+def build_notes(n, rng):
+    pictures = [base64.b64encode(os.urandom(rng.randint(20_000, 60_000))).decode("ascii") for _ in range(20)]
+    notes = {}
+    for i in range(n):
+        content = "".join(f"<p>{' '.join(rng.choices(WORDS, k=60))}</p>" for _ in range(rng.randint(3, 15)))
+        if rng.random() < 0.1:
+            content += f'<p><img src="data:image/png;base64,{rng.choice(pictures)}"></p>'
+        history = []
+        if rng.random() < 0.3:
+            older = content.replace("regression", "regresion", 1)
+            history = record_version([], older, content, "2024-01-01 10:00", "Edited")
+        notes.setdefault(rng.choice(COURSES), []).append({
+            "title": f"Note {i}: " + " ".join(rng.choices(WORDS, k=3)),
+            "content": content,
+            "date": "2024-01-01 10:00",
+            "tags": rng.sample(WORDS, 2),
+            "category": "lecture",
+            "importance": "normal",
+            "learning_outcome": "",
+            "version_history": history,
+        })
+    return notes
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark notes export/import.")
+    parser.add_argument("--notes", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=23)
+    args = parser.parse_args()
+
+    notes = build_notes(args.notes, random.Random(args.seed))
+
+    dumped, json_s, json_peak = measure(lambda: json.dumps(notes, indent=2, ensure_ascii=False))
+    print(f"notes                      {args.notes}")
+    print(f"json.dumps (all courses)   {json_s:7.2f} s  {len(dumped.encode('utf-8')) / 1e6:8.1f} MB  peak {json_peak:8.1f} MB")
+    del dumped
+
+    archive_path = Path(os.environ.get("TMPDIR", "/tmp")) / "bench_notes_archive.zip"
+    with open(archive_path, "wb") as out:
+        _, zip_s, zip_peak = measure(lambda: write_notes_archive(notes, out))
+    print(f"ZIP archive (streamed)     {zip_s:7.2f} s  {archive_path.stat().st_size / 1e6:8.1f} MB  peak {zip_peak:8.1f} MB")
+
+    with open(archive_path, "rb") as archive:
+        imported = {}
+        stats, import_s, import_peak = measure(lambda: read_notes_archive(archive, imported))
+    print(f"import into empty          {import_s:7.2f} s  {stats}  peak {import_peak:8.1f} MB (incl. imported notes)")
+
+    with open(archive_path, "rb") as archive:
+        stats, again_s, again_peak = measure(lambda: read_notes_archive(archive, imported))
+    print(f"re-import (all duplicates) {again_s:7.2f} s  {stats}  peak {again_peak:8.1f} MB")
+    archive_path.unlink()
+
+
+if __name__ == "__main__":
+    main()
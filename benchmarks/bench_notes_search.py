@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Study Notes search: per-keystroke substring scan vs. the NotesIndex.
+
+Run from the repository root:
+    python benchmarks/bench_notes_search.py --notes 10000
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from notes_index import NotesIndex  # noqa: E402
+
+COURSES = ["FI1BBDF05", "FI1BBSF05", "FI1BBST05", "FI1BBDD75", "FI1BBP175", "FI1BBEO10"]
+VOCABULARY = (
+    "regression correlation variance median mean pivot table lookup dashboard kpi chart histogram "
+    "outlier dataset sampling hypothesis significance forecast cleaning duplicates filter query join "
+    "aggregate visualisation stakeholder report excel python sql index formula distribution"
+).split()
+QUERIES = ["regression", "pivot table", '"standard deviation"', "kpi dashboard report", "outl", "sql join query"]
+
+
+def build_notes(n, rng):
+    # Course vocabulary plus a Zipf-distributed tail, like real prose.
+    words = VOCABULARY + [f"term{i}" for i in range(20_000)]
+    weights = [20.0] * len(VOCABULARY) + [1.0 / (rank + 1) ** 1.1 * 200 for rank in range(20_000)]
+    notes = {}
+    for i in range(n):
+        tokens = rng.choices(words, weights=weights, k=rng.randint(80, 400))
+        if rng.random() < 0.2:
+            tokens[rng.randrange(len(tokens))] = "standard deviation"
+        body = "".join(f"<p>{' '.join(tokens[j:j + 20])}</p>" for j in range(0, len(tokens), 20))
+        notes.setdefault(rng.choice(COURSES), []).append({
+            "title": " ".join(rng.choices(VOCABULARY, k=3)).title(),
+            "content": body,
+        })
+    return notes
+
+
+def scan(notes, course, term):
+    # What the page did on every rerun: one course, lowercased HTML, substring test.
+    return [n for n in notes.get(course, []) if term.lower() in n.get('title', '').lower() or term.lower() in n.get('content', '').lower()]
+
+
+def timings_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    times.sort()
+    return statistics.median(times), times[max(0, int(len(times) * 0.95) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Study Notes search.")
+    parser.add_argument("--notes", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=13)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    notes = build_notes(args.notes, rng)
+
+    start = time.perf_counter()
+    index = NotesIndex(notes)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    print(f"notes                      {args.notes}")
+    print(f"index build (once)         {build_ms:10.1f} ms")
+    for query in QUERIES:
+        scan_med, _ = timings_ms(lambda: scan(notes, COURSES[0], query.strip('"')), max(3, args.repeat // 10))
+        one_med, one_p95 = timings_ms(lambda: index.search(query, course=COURSES[0], limit=50), args.repeat)
+        all_med, all_p95 = timings_ms(lambda: index.search(query, limit=50), args.repeat)
+        print(f"{query!r:24} scan(1 course) {scan_med:8.2f} ms | index(1 course) {one_med:6.3f} ms p95 {one_p95:6.3f} | index(all) {all_med:6.3f} ms p95 {all_p95:6.3f}")
+
+    course = COURSES[0]
+    note = dict(notes[course][0], content=notes[course][0]["content"] + "<p>edited regression</p>")
+    update_med, _ = timings_ms(lambda: index.update(course, 0, note), args.repeat)
+    print(f"incremental update (save)  {update_med:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Bytes written per rerun: full JSON rewrite vs. incremental sections.
+
+Builds a synthetic session (notes with version history, a flashcard deck and
+study sessions), then simulates reruns where most clicks only change
+navigation keys and a few edit a note or review a card.
+
+Run from the repository root:
+    python benchmarks/bench_persistence.py --notes 300 --cards 3000 --reruns 200
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+
+def build_state(notes, cards, rng):
+    body = "<p>" + "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 40 + "</p>"
+    study_notes = {}
+    for i in range(notes):
+        course = f"FI1BB{i % 9:02d}"
+        study_notes.setdefault(course, {})[f"note_{i}"] = {
+            "title": f"Note {i}",
+            "content": body,
+            "category": "lecture",
+            "version_history": [{"content": body, "timestamp": "2026-01-01T10:00:00"} for _ in range(10)],
+        }
+    flashcards = {
+        f"card_{i}": {
+            "front": f"Question {i}?", "back": f"Answer {i}.", "course": f"FI1BB{i % 9:02d}",
+            "interval": rng.randint(1, 30), "repetitions": rng.randint(0, 8), "ease_factor": 2.5,
+            "next_review": "2026-02-01T09:00:00", "created": "2026-01-01T09:00:00",
+        }
+        for i in range(cards)
+    }
+    return {
+        "study_notes": study_notes,
+        "flashcards": flashcards,
+        "flashcard_stats": {"total_cards": cards, "cards_reviewed": 0, "cards_mastered": 0},
+        "study_sessions": [{"course": "FI1BB01", "minutes": 25} for _ in range(500)],
+        "nav_section": "Dashboard",
+        "nav_page": "Overview",
+        "last_page": "Overview",
+    }
+
+
+def mutate(state, rng, step):
+    roll = rng.random()
+    if roll < 0.7:
+        page = rng.choice(["Overview", "Flashcards", "Study Notes", "Training Center"])
+        state["nav_page"] = page
+        state["last_page"] = page
+    elif roll < 0.85:
+        card = state["flashcards"][f"card_{rng.randrange(len(state['flashcards']))}"]
+        card["repetitions"] += 1
+        state["flashcard_stats"]["cards_reviewed"] += 1
+    elif roll < 0.95:
+        course = rng.choice(list(state["study_notes"]))
+        note = next(iter(state["study_notes"][course].values()))
+        note["content"] += f"<p>edit {step}</p>"
+    # remaining clicks change nothing persistent
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark state persistence.")
+    parser.add_argument("--notes", type=int, default=300)
+    parser.add_argument("--cards", type=int, default=3000)
+    parser.add_argument("--reruns", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="sb_state_bench_")
+    os.chdir(workdir)
+    import study_buddy_state as sbs
+
+    rng = random.Random(args.seed)
+    state = build_state(args.notes, args.cards, rng)
+
+    full_bytes = 0
+    full_time = 0.0
+    incr_time = 0.0
+    for step in range(args.reruns):
+        mutate(state, rng, step)
+
+        start = time.perf_counter()
+        payload = {key: state.get(key) for key in sbs.PERSIST_KEYS if key in state}
+        data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+        Path("full_rewrite.json").write_bytes(data)
+        full_time += time.perf_counter() - start
+        full_bytes += len(data)
+
+        start = time.perf_counter()
+        sbs.save_persisted_state(state)
+        incr_time += time.perf_counter() - start
+    sbs.flush_persisted_state()
+
+    stats = sbs.WRITE_STATS
+    print(f"reruns                 {args.reruns}")
+    print(f"full rewrite           {full_bytes / args.reruns / 1024:10.1f} KiB/rerun  {full_time / args.reruns * 1000:8.2f} ms/rerun")
+    print(f"incremental sections   {stats['bytes_written'] / args.reruns / 1024:10.1f} KiB/rerun  {incr_time / args.reruns * 1000:8.2f} ms/rerun (caller side)")
+    print(f"sections written       {stats['sections_written']}  skipped saves {stats['skipped_saves']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""SQL Query Tester index lab: queries on a large orders table, before and after an index.
+
+Loads ``generate("orders", --rows)`` into a ``SqlSandbox`` and runs
+``compare_index`` for a point lookup, a date range, a grouped filter and a
+join, printing the median time, VM steps, rows read by full scans and the
+plan step for each, without and with the index.
+
+Run from the repository root:
+    python benchmarks/bench_query_profile.py --rows 1000000 --repeats 5
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from sql_sandbox import SqlSandbox  # noqa: E402
+from synthetic_data import generate  # noqa: E402
+
+CASES = [
+    ("point lookup", ["customer_id"],
+     "SELECT * FROM orders_large WHERE customer_id = 42"),
+    ("date range", ["order_date"],
+     "SELECT COUNT(*), SUM(amount) FROM orders_large WHERE order_date BETWEEN '2024-03-01' AND '2024-03-07'"),
+    ("grouped filter", ["customer_id", "product"],
+     "SELECT product, SUM(amount) FROM orders_large WHERE customer_id = 42 GROUP BY product"),
+    ("join", ["customer_id"],
+     "SELECT c.city, SUM(o.amount) FROM customers c JOIN orders_large o ON o.customer_id = c.id "
+     "WHERE c.city = 'Phoenix' AND c.id < 50 GROUP BY c.city"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark queries before and after an index.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    sandbox = SqlSandbox()
+    load = sandbox.sync("orders_large", generate("orders", args.rows))
+    sandbox.sync("customers", pd.DataFrame({
+        "id": np.arange(1, 5001),
+        "city": np.random.default_rng(1).choice(["New York", "Chicago", "Phoenix"], 5000),
+    }))
+    print(f"orders_large               {args.rows:,} rows loaded in {load['ms'] / 1000:.1f} s")
+
+    for label, columns, sql in CASES:
+        before, after = sandbox.compare_index(sql, "orders_large", columns, repeats=args.repeats)
+        print(f"\n{label} -- index on ({', '.join(columns)})")
+        for name, profile in (("before", before), ("after", after)):
+            step = profile["plan_text"].splitlines()[0].strip() if profile["plan_text"] else ""
+            print(f"  {name:7} {profile['median_ms']:9.2f} ms  {profile['vm_steps']:>11,} VM steps  "
+                  f"{profile['rows_scanned']:>10,} rows scanned  {step}")
+        print(f"  speedup x{before['median_ms'] / after['median_ms']:.0f}, same rows: {before['rows'] == after['rows']}")
+        for index in sandbox.indexes()["name"]:
+            sandbox.drop_index(index)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Semester workload forecast: per-card Python loop vs. the NumPy scheduler.
+
+Run from the repository root:
+    python benchmarks/bench_scheduler.py --cards 10000 --days 120
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from flashcard_scheduler import ALGORITHMS, DeckState, review_batch, simulate_workload  # noqa: E402
+
+
+def build_deck(n, rng):
+    now = datetime.now()
+    return {
+        f"card_{i}": {
+            "interval": rng.choice([1, 1, 6, 15, 40]),
+            "repetitions": rng.randint(0, 6),
+            "ease_factor": round(rng.uniform(1.3, 2.8), 2),
+            "next_review": (now + timedelta(days=rng.randint(-5, 30))).isoformat(),
+        }
+        for i in range(n)
+    }
+
+
+def loop_forecast(cards, days, rng):
+    # One SM-2 update per due card per day, the way the page closure works.
+    today = datetime.now().date()
+    deck = {cid: dict(card, due=max(datetime.fromisoformat(card["next_review"]).date(), today)) for cid, card in cards.items()}
+    counts = []
+    for d in range(days):
+        day = today + timedelta(days=d)
+        due = [card for card in deck.values() if card["due"] <= day]
+        counts.append(len(due))
+        for card in due:
+            if rng.random() < 0.1:
+                card["interval"], card["repetitions"] = 1, 0
+                card["ease_factor"] = max(1.3, card["ease_factor"] - 0.2)
+            else:
+                card["interval"] = 6 if card["repetitions"] == 1 else max(1, int(card["interval"] * card["ease_factor"]))
+                card["repetitions"] += 1
+            card["due"] = day + timedelta(days=card["interval"])
+    return counts
+
+
+def median_ms(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the flashcard scheduler.")
+    parser.add_argument("--cards", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=11)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    cards = build_deck(args.cards, rng)
+
+    start = time.perf_counter()
+    deck = DeckState.from_cards(cards)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    print(f"cards                    {args.cards}")
+    print(f"days                     {args.days}")
+    print(f"deck -> arrays (once)    {load_ms:10.2f} ms")
+    print(f"python loop forecast     {median_ms(lambda: loop_forecast(cards, args.days, random.Random(args.seed)), 1):10.2f} ms")
+    for algorithm in ALGORITHMS:
+        ms = median_ms(lambda: simulate_workload(deck, args.days, algorithm=algorithm), args.repeat)
+        print(f"{algorithm:<6} vectorized        {ms:10.2f} ms")
+    rows = list(range(0, len(deck), 2))
+    batch = deck.copy()
+    ms = median_ms(lambda: review_batch(batch, rows, ["Good"] * len(rows)), args.repeat)
+    print(f"batch review {len(rows):>6} cards {ms:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Study Notes spell check: whole note per rerun vs. the paragraph cache.
+
+Times checking a generated note synchronously from scratch (what a naive
+per-rerun check costs) against ``SpellCheckService`` for a first check, a
+rerun with nothing changed, and a rerun after one paragraph was edited.
+
+Run from the repository root:
+    python benchmarks/bench_spell_check.py --paragraphs 60
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from spellchecker import SpellChecker  # noqa: E402
+
+from spell_check import DOMAIN_WORDS, SUGGESTION_DISTANCE, SpellCheckService  # noqa: E402
+
+WORDS = (
+    "the regression line shows how the mean of the outcome changes with each predictor and the variance "
+    "of residuals tells us about the fit of a model built on a sample of customers from the dataset"
+).split()
+TYPOS = ["regresion", "varience", "analsis", "corelation", "sampel", "distribtion", "teh", "recieve"]
+
+
+def paragraph(rng):
+    words = rng.choices(WORDS, k=rng.randint(40, 90))
+    for _ in range(rng.randint(0, 2)):
+        words[rng.randrange(len(words))] = rng.choice(TYPOS)
+    return "<p>" + " ".join(words) + "</p>"
+
+
+def timed_ms(fn):
+    start = time.perf_counter()
+    result = fn()
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Study Notes spell checker.")
+    parser.add_argument("--paragraphs", type=int, default=60)
+    parser.add_argument("--edits", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=17)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    paragraphs = [paragraph(rng) for _ in range(args.paragraphs)]
+    note = "".join(paragraphs)
+
+    checker = SpellChecker(distance=SUGGESTION_DISTANCE)
+    checker.word_frequency.load_words(DOMAIN_WORDS)
+    service = SpellCheckService(checker=checker)
+
+    # Without a cache every rerun repeats the same work on the whole note.
+    full_ms, _ = timed_ms(lambda: SpellCheckService(checker=checker).squiggles(note, timeout=60))
+    first_ms, squiggles = timed_ms(lambda: service.squiggles(note, timeout=60))
+    unchanged = [timed_ms(lambda: service.squiggles(note, timeout=60))[0] for _ in range(args.edits)]
+    edited = []
+    for _ in range(args.edits):
+        paragraphs[rng.randrange(len(paragraphs))] = paragraph(rng)
+        note = "".join(paragraphs)
+        edited.append(timed_ms(lambda: service.squiggles(note, timeout=60))[0])
+
+    print(f"note                       {args.paragraphs} paragraphs, {len(note)} chars, {len(squiggles)} squiggles")
+    print(f"whole note, no cache       {full_ms:10.2f} ms per rerun")
+    print(f"service, first check       {first_ms:10.2f} ms")
+    print(f"service, unchanged rerun   {statistics.median(unchanged):10.2f} ms median")
+    print(f"service, one paragraph     {statistics.median(edited):10.2f} ms median")
+    print(f"stats                      {service.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""SQL Query Tester: rebuild the database per click vs. the session sandbox.
+
+Replays ``--clicks`` "Run Query" clicks against a customers table and an
+orders table of ``--rows`` rows.  The old path opened ``:memory:``, loaded
+both tables with ``to_sql``, ran the query and closed the connection; the
+sandbox syncs the (unchanged) tables by hash and runs the query on its open
+connection.  Then times a one-cell edit, a few added and deleted rows, and a
+query before and after ``create_index``.
+
+Run from the repository root:
+    python benchmarks/bench_sql_sandbox.py --rows 200000 --clicks 10
+"""
+
+import argparse
+import sqlite3
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from sql_sandbox import SqlSandbox  # noqa: E402
+
+QUERY = (
+    "SELECT c.city, COUNT(*) AS orders, SUM(o.amount) AS total FROM orders o "
+    "JOIN customers c ON o.customer_id = c.id WHERE o.customer_id = 42 GROUP BY c.city"
+)
+
+
+def build_tables(n_rows, rng):
+    n_customers = max(n_rows // 20, 50)
+    customers = pd.DataFrame({
+        "id": np.arange(1, n_customers + 1),
+        "name": [f"Customer {i}" for i in range(1, n_customers + 1)],
+        "city": rng.choice(["New York", "Los Angeles", "Chicago", "Houston", "Phoenix"], n_customers),
+    })
+    orders = pd.DataFrame({
+        "order_id": np.arange(100, 100 + n_rows),
+        "customer_id": rng.integers(1, n_customers + 1, n_rows),
+        "product": rng.choice(["Laptop", "Phone", "Tablet", "Watch", "Headphones"], n_rows),
+        "amount": rng.integers(50, 2000, n_rows),
+        "order_date": pd.Timestamp("2024-01-01").strftime("%Y-%m-%d"),
+    })
+    return customers, orders
+
+
+def fresh_database_click(customers, orders):
+    conn = sqlite3.connect(":memory:")
+    customers.to_sql("customers", conn, index=False, if_exists="replace")
+    orders.to_sql("orders", conn, index=False, if_exists="replace")
+    result = pd.read_sql_query(QUERY, conn)
+    conn.close()
+    return result
+
+
+def sandbox_click(sandbox, customers, orders):
+    sandbox.sync("customers", customers)
+    sandbox.sync("orders", orders)
+    return sandbox.query(QUERY)
+
+
+def timed(fn, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQL Query Tester's session database.")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--clicks", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    customers, orders = build_tables(args.rows, np.random.default_rng(args.seed))
+    sandbox = SqlSandbox()
+
+    fresh_ms, expected = timed(lambda: fresh_database_click(customers, orders), args.clicks)
+    first_ms, _ = timed(lambda: sandbox_click(sandbox, customers, orders), 1)
+    click_ms, result = timed(lambda: sandbox_click(sandbox, customers, orders), args.clicks)
+    assert result.equals(expected)
+    print(f"tables                     customers {len(customers):,} rows, orders {len(orders):,} rows")
+    print(f"fresh database per click   median {fresh_ms:8.1f} ms")
+    print(f"sandbox, first click       {first_ms:15.1f} ms  (loads both tables)")
+    print(f"sandbox, later clicks      median {click_ms:8.1f} ms  (hash check + query)")
+
+    edited = orders.copy()
+    edited.loc[5, "amount"] = 1
+    edit_ms = sandbox.sync("orders", edited)["ms"]
+    grown = pd.concat([edited.drop(index=[1, 2, 3]), orders.tail(5).set_axis(range(args.rows, args.rows + 5))])
+    change = sandbox.sync("orders", grown)
+    check = sandbox.query("SELECT COUNT(*) AS n, SUM(amount) AS total FROM orders").iloc[0]
+    assert (check["n"], check["total"]) == (len(grown), grown["amount"].sum())
+    print(f"one cell edited            {edit_ms:15.1f} ms  (1 UPDATE)")
+    print(f"3 deleted, 5 added         {change['ms']:15.1f} ms  ({change})")
+
+    scan_ms, _ = timed(lambda: sandbox.query(QUERY), args.clicks)
+    sandbox.create_index("orders", ["customer_id"])
+    indexed_ms, _ = timed(lambda: sandbox.query(QUERY), args.clicks)
+    print(f"query, no index            median {scan_ms:8.2f} ms")
+    print(f"query, index on customer_id median {indexed_ms:7.2f} ms")
+    print(f"stats                      {sandbox.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Statistical Analysis on a file: load it whole vs. stream it through one-pass accumulators.
+
+Writes ``--rows`` rows of the ``stats`` synthetic dataset (with missing values)
+to Parquet or CSV, then computes correlation, covariance, regression, ANOVA
+and descriptive statistics two ways: ``pd.read_*`` of the whole file followed
+by pandas / ``scipy.stats``, and ``streaming_stats.summarize`` in chunks of
+``--chunk-rows``.  Reports time, peak traced memory and the largest
+difference between the two sets of results.
+
+Run from the repository root:
+    python benchmarks/bench_streaming_stats.py --rows 5000000 --format parquet
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from scipy import stats  # noqa: E402
+
+from streaming_stats import summarize  # noqa: E402
+from synthetic_data import write_dataset  # noqa: E402
+
+NUMERIC = ["Advertising", "Sales", "Employees"]
+
+
+def in_memory(path):
+    frame = pd.read_parquet(path) if path.suffix == ".parquet" else pd.read_csv(path)
+    pair = frame[["Advertising", "Sales"]].dropna()
+    fit = stats.linregress(pair["Advertising"], pair["Sales"])
+    groups = frame[["Quarter", "Sales"]].dropna().groupby("Quarter")["Sales"]
+    sales = frame["Sales"].dropna()
+    return {
+        "corr": frame[NUMERIC].corr().to_numpy(),
+        "cov": frame[NUMERIC].cov().to_numpy(),
+        "slope": fit.slope, "intercept": fit.intercept,
+        "anova_f": stats.f_oneway(*[values.to_numpy() for _, values in groups]).statistic,
+        "mean": sales.mean(), "std": sales.std(), "skew": stats.skew(sales),
+    }
+
+
+def streamed(path, chunk_rows):
+    summary = summarize(path, chunk_rows=chunk_rows)
+    fit = summary.regression("Advertising", "Sales")
+    described = summary.describe("Sales")
+    return {
+        "corr": summary.correlation_matrix().to_numpy(),
+        "cov": summary.covariance_matrix().to_numpy(),
+        "slope": fit["slope"], "intercept": fit["intercept"],
+        "anova_f": summary.anova("Quarter", "Sales")["f"],
+        "mean": described["mean"], "std": described["std"], "skew": described["skewness"],
+    }
+
+
+def measured(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    seconds = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark chunked one-pass statistics.")
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--chunk-rows", type=int, default=100_000)
+    parser.add_argument("--format", choices=["parquet", "csv"], default="parquet")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / f"stats.{args.format}"
+        write_dataset("stats", args.rows, path, seed=1, missing=0.02)
+        print(f"file                       {args.rows:,} rows, {path.stat().st_size / 1e6:.0f} MB {args.format}")
+
+        expected, full_s, full_mb = measured(lambda: in_memory(path))
+        result, stream_s, stream_mb = measured(lambda: streamed(path, args.chunk_rows))
+
+    worst = max(
+        float(np.max(np.abs(np.asarray(result[key]) - np.asarray(expected[key])) / np.maximum(np.abs(expected[key]), 1e-12)))
+        for key in expected
+    )
+    print(f"load whole file + scipy    {full_s:6.1f} s   peak {full_mb:8.1f} MB")
+    print(f"stream, {args.chunk_rows:,}-row chunks  {stream_s:6.1f} s   peak {stream_mb:8.1f} MB")
+    print(f"largest relative difference {worst:.2e}")
+
+
+if __name__ == "__main__":
+    main()
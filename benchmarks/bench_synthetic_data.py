@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Synthetic dataset generator: rows per second from 10 to 10M rows, and file output.
+
+Times ``generate`` for every schema at each size in ``--sizes`` (with 2%
+missing, 1% duplicates and 1% outliers), streams the largest orders dataset to
+Parquet and CSV with ``write_dataset``, and checks that reading the Parquet
+file back gives exactly what ``generate`` builds in memory.
+
+Run from the repository root:
+    python benchmarks/bench_synthetic_data.py --sizes 10,1000,100000,1000000,10000000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import pandas as pd  # noqa: E402
+
+from synthetic_data import SCHEMAS, generate, write_dataset  # noqa: E402
+
+DEFECTS = {"missing": 0.02, "duplicates": 0.01, "outliers": 0.01}
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the synthetic dataset generator.")
+    parser.add_argument("--sizes", default="10,1000,100000,1000000,10000000")
+    parser.add_argument("--write-rows", type=int, default=2_000_000, help="rows streamed to Parquet and CSV")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+
+    print(f"{'schema':12}" + "".join(f"{size:>14,}" for size in sizes) + "   (seconds)")
+    for schema in SCHEMAS:
+        cells = []
+        for size in sizes:
+            seconds, frame = timed(lambda: generate(schema, size, seed=args.seed, **DEFECTS))
+            assert len(frame) == size
+            cells.append(f"{seconds:14.3f}")
+            del frame
+        print(f"{schema:12}" + "".join(cells))
+    largest = max(sizes)
+    seconds, _ = timed(lambda: generate("orders", largest, seed=args.seed, **DEFECTS))
+    print(f"orders at {largest:,} rows: {largest / seconds / 1e6:.1f}M rows/s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix in (".parquet", ".csv"):
+            path = Path(tmp) / f"orders{suffix}"
+            seconds, rows = timed(lambda: write_dataset("orders", args.write_rows, path, seed=args.seed, **DEFECTS))
+            print(f"write {suffix:9} {rows:,} rows in {seconds:6.2f} s   {path.stat().st_size / 1e6:8.1f} MB")
+        expected = generate("orders", args.write_rows, seed=args.seed, **DEFECTS).reset_index(drop=True)
+        round_trip = pd.read_parquet(Path(tmp) / "orders.parquet")
+        pd.testing.assert_frame_equal(round_trip, expected, check_dtype=False)
+        print("parquet round trip matches generate(): True")
+
+
+if __name__ == "__main__":
+    main()
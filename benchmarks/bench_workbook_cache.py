@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Dataset Calculator workbook loading: parse per rerun vs. the workbook cache.
+
+Replays the loads one rerun of ``dataset_calculator.py`` used to make (pandas
+for the CA Lesson datasets, openpyxl plus pandas for each resolved workbook,
+openpyxl for CA Lesson 2) against ``WorkbookCache`` lookups.
+
+Run from the repository root:
+    python benchmarks/bench_workbook_cache.py --reruns 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import openpyxl  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from workbook_cache import WorkbookCache  # noqa: E402
+
+DATASETS = [ROOT / f"CA Lesson {n} dataset.xlsx" for n in (1, 3, 4)]
+RAW_OPENPYXL = [ROOT / "CA Lesson 2 dataset.xlsx"]
+RESOLVED = [ROOT / f"CA Lesson {n} dataset - Resolved.xlsx" for n in (1, 3, 4, 2)]
+
+
+def uncached_rerun():
+    for path in DATASETS:
+        pd.read_excel(path, header=0)
+    for path in RAW_OPENPYXL:
+        list(openpyxl.load_workbook(path).active.iter_rows(min_row=2, max_row=21, values_only=True))
+    for path in RESOLVED:
+        sheet = openpyxl.load_workbook(path).active
+        sheet.cell(22, 3).value
+        pd.read_excel(path, header=0, nrows=20)
+
+
+def cached_rerun(cache):
+    for path in DATASETS:
+        cache.load(path).values()
+    for path in RAW_OPENPYXL:
+        cache.load(path).rows[1:21]
+    for path in RESOLVED:
+        book = cache.load(path)
+        book.formula(22, 3)
+        book.values(nrows=20)
+
+
+def timed(fn, reruns):
+    times = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), max(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Dataset Calculator workbook cache.")
+    parser.add_argument("--reruns", type=int, default=20)
+    args = parser.parse_args()
+
+    cache = WorkbookCache()
+    start = time.perf_counter()
+    cached_rerun(cache)
+    first_ms = (time.perf_counter() - start) * 1000
+
+    uncached_med, uncached_max = timed(uncached_rerun, args.reruns)
+    cached_med, cached_max = timed(lambda: cached_rerun(cache), args.reruns)
+    print(f"workbooks per rerun        {len(DATASETS) + len(RAW_OPENPYXL) + len(RESOLVED)}")
+    print(f"parse every rerun          median {uncached_med:8.1f} ms   max {uncached_max:8.1f} ms")
+    print(f"cache, first rerun         {first_ms:15.1f} ms")
+    print(f"cache, later reruns        median {cached_med:8.2f} ms   max {cached_max:8.2f} ms")
+    print(f"stats                      {cache.stats()}")
+
+    small = WorkbookCache(max_entries=3)
+    cached_rerun(small)
+    cached_rerun(small)
+    print(f"max_entries=3 (LRU)        {small.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""Parsing a resolved workbook: openpyxl plus pandas vs. the single-pass reader.
+
+Times the two parses ``workbook_cache.parse_workbook`` used to make for each
+workbook (openpyxl for the rows and formulas, ``pd.read_excel`` for the
+values) against one ``workbook_reader.read_sheet`` pass, on the repository's
+CA Lesson workbooks and on a generated sheet of formulas.
+
+Run from the repository root:
+    python benchmarks/bench_workbook_reader.py --rows 20000
+"""
+
+import argparse
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import openpyxl  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from workbook_reader import read_sheet  # noqa: E402
+
+WORKBOOKS = sorted(ROOT.glob("CA Lesson * dataset*.xlsx"))
+
+
+def two_parsers(data):
+    sheet = openpyxl.load_workbook(io.BytesIO(data)).active
+    rows = []
+    formulas = {}
+    for row in sheet.iter_rows():
+        rows.append(tuple(cell.value for cell in row))
+        for cell in row:
+            if cell.data_type == "f":
+                formulas[(cell.row, cell.column)] = cell.value
+    values = pd.read_excel(io.BytesIO(data), header=0, dtype=object)
+    return rows, formulas, values
+
+
+def generated_workbook(n_rows):
+    book = openpyxl.Workbook()
+    sheet = book.active
+    sheet.append(["Id", "Units", "Price", "Revenue", "Band"])
+    for i in range(2, n_rows + 2):
+        sheet.append([i - 1, i % 37, round(1 + (i % 91) * 0.25, 2), f"=B{i}*C{i}", f'=IF(D{i}>50,"high","low")'])
+    buffer = io.BytesIO()
+    book.save(buffer)
+    return buffer.getvalue()
+
+
+def timed(fn, data, repeats):
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(data)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the single-pass workbook reader.")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    books = [(path.name, path.read_bytes()) for path in WORKBOOKS]
+    books.append((f"generated ({args.rows} rows, 2 formulas/row)", generated_workbook(args.rows)))
+    print(f"{'workbook':45} {'openpyxl+pandas':>16} {'single pass':>12}")
+    for name, data in books:
+        old_ms = timed(two_parsers, data, args.repeats)
+        new_ms = timed(read_sheet, data, args.repeats)
+        print(f"{name[:45]:45} {old_ms:13.1f} ms {new_ms:9.1f} ms   x{old_ms / new_ms:4.1f}")
+
+
+if __name__ == "__main__":
+    main()
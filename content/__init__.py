@@ -0,0 +1,87 @@
+"""Course content loader.
+
+Lesson text, exercises, quizzes and curated question banks used to be defined
+inline in app.py, which meant every Streamlit rerun rebuilt all of them.  They
+now live in per-topic modules and are imported on first use.  Imports and the
+lookups below are cached for the lifetime of the process, so every session in a
+worker shares one copy and reruns only pay a dictionary lookup.
+
+Callers must treat returned objects as read-only.
+"""
+
+import importlib
+from functools import lru_cache
+
+from content.lessons import LESSON_INDEX
+from content.training import TOPIC_INDEX
+
+
+def training_topics():
+    return list(TOPIC_INDEX)
+
+
+def get_topic_course(topic):
+    entry = TOPIC_INDEX.get(topic)
+    return entry["course"] if entry else None
+
+
+def topic_lesson_count(topic):
+    entry = TOPIC_INDEX.get(topic)
+    return entry["lessons"] if entry else 0
+
+
+@lru_cache(maxsize=None)
+def get_training_module(topic):
+    entry = TOPIC_INDEX.get(topic)
+    if entry is None:
+        return None
+    return importlib.import_module(f"content.training.{entry['module']}").MODULE
+
+
+def has_course_lessons(course_code):
+    return course_code in LESSON_INDEX
+
+
+@lru_cache(maxsize=None)
+def get_course_lessons(course_code):
+    entry = LESSON_INDEX.get(course_code)
+    if entry is None:
+        return []
+    return importlib.import_module(f"content.lessons.{entry['module']}").LESSONS
+
+
+@lru_cache(maxsize=1)
+def get_courses():
+    from content.courses import COURSES
+    return COURSES
+
+
+def get_curated_flashcards(course_code):
+    from content.curated import CURATED_FLASHCARD_SETS
+    return CURATED_FLASHCARD_SETS.get(course_code, [])
+
+
+def get_curated_exam_questions(course_code):
+    from content.curated import CURATED_EXAM_QUESTION_BANK
+    return CURATED_EXAM_QUESTION_BANK.get(course_code, [])
+
+
+def get_curated_practice_questions(course_code):
+    from content.curated import CURATED_PRACTICE_QUESTION_BANK
+    return CURATED_PRACTICE_QUESTION_BANK.get(course_code, [])
+
+
+def has_curated_exam_questions(course_code):
+    return bool(get_curated_exam_questions(course_code))
+
+
+@lru_cache(maxsize=1)
+def get_formulas():
+    from content.formulas import FORMULAS
+    return FORMULAS
+
+
+def get_default_snippets():
+    """A fresh copy: the Code Library edits the snippets it is given."""
+    from content.snippets import DEFAULT_SNIPPETS
+    return {snippet_id: dict(snippet) for snippet_id, snippet in DEFAULT_SNIPPETS.items()}
@@ -0,0 +1,558 @@
+"""Programme course catalogue (codes, credits, semesters and outcomes)."""
+
+COURSES = [
+    {
+        "code": "FI1BBDF05", 
+        "name": "Data Analysis Fundamentals", 
+        "type": "Core Course", 
+        "credits": 5, 
+        "semester": "2025 Spring",
+        "weeks": 3,
+        "hours": 126,
+        "description": "This course delivers an introductory overview of Data Analysis. It provides the foundational material required to build a strong theoretical understanding of why data analysis is required in industry and how using analytics tools can shape decision making in the real world.",
+        "knowledge": [
+            "History of data and data sources",
+            "Significance of data in the real world",
+            "Introduction to business intelligence and big data",
+            "Data strategies: exploration, visualization, trends and estimates",
+            "Data warehouses, data silos, and open data platforms"
+        ],
+        "skills": [
+            "Apply problem division and solving into each stage in the data lifecycle",
+            "Apply theoretical data analysis strategies into real world scenarios",
+            "Find information relevant to problem scenarios and suggest solutions",
+            "Identify where data can be collected first-hand and alternative sources",
+            "Use online data collection tools such as Google Forms",
+            "Identify and source data ethically with GDPR standards"
+        ],
+        "competence": [
+            "Understand ethical principles for successful data analysis projects",
+            "Understand ethical principles of collecting and maintaining data",
+            "Carry out data strategies from real world scenarios",
+            "Develop data analysis terminology"
+        ]
+    },
+    {
+        "code": "FI1BBSF05", 
+        "name": "Spreadsheet Fundamentals", 
+        "type": "Core Course", 
+        "credits": 5, 
+        "semester": "2025 Spring",
+        "weeks": 3,
+        "hours": 126,
+        "description": "This course teaches a foundation level introduction to the spreadsheet work environment, specifically Microsoft Excel. Learn to gather, clean, manage, and organize data. Also covers Google Sheets for collaborative work.",
+        "knowledge": [
+            "Concepts and processes to gather, clean, manage, and organize data in spreadsheets",
+            "Data management techniques: storing, sorting, and presenting data",
+            "Cloud-based spreadsheet software (Google Sheets)",
+            "Data flow pipelines to link spreadsheet software to external tools",
+            "Why spreadsheets are useful in society and value-creation"
+        ],
+        "skills": [
+            "Apply spreadsheet software to gather, sort, store, manage and organize data",
+            "Use conditional formatting and pivot tables to summarize key data points",
+            "Find information to develop transformative spreadsheet projects",
+            "Master two spreadsheet software suites (offline and online)",
+            "Master basic workbook manipulation tools",
+            "Use basic field formulas to automate data tasks"
+        ],
+        "competence": [
+            "Create workbooks to manage data from start to finish",
+            "Build relations with clients using real world data sets",
+            "Develop collaborative workbooks using cloud-based software"
+        ]
+    },
+    {
+        "code": "FI1BBDD75", 
+        "name": "Data Driven Decision-Making", 
+        "type": "Core Course", 
+        "credits": 7.5, 
+        "semester": "2025 Spring",
+        "weeks": 4,
+        "hours": 168,
+        "description": "This course establishes the core concepts of decision-making techniques applied to relevant data models. It prepares candidates to use data for informed decisions, act proactively on predictions, explore real-world industry use cases, and apply decision-making techniques and criteria through the full data lifecycle.",
+        "knowledge": [
+            "Decision-making techniques applied to relevant data models",
+            "The full data analysis lifecycle from problem definition to action",
+            "Real-world before-and-after scenarios and practical industry use case studies",
+            "Key Performance Indicators (KPI) as heuristics for tracking data behaviour",
+            "Qualitative versus quantitative data and when each is appropriate",
+            "How data subsets are used to isolate problem domains for further analysis",
+            "How predictions support proactive business responses and earlier intervention"
+        ],
+        "skills": [
+            "Apply data-driven decision-making to realistic business scenarios",
+            "Select the analytical method that best matches the problem and desired outcome",
+            "Apply the data lifecycle to build iterative, evidence-based solutions",
+            "Use data subsets to isolate relevant problem domains for deeper analysis",
+            "Compare qualitative and quantitative evidence to improve recommendations",
+            "Use predictions and decision criteria to justify proactive action"
+        ],
+        "competence": [
+            "Understand the fidelity of data within a project",
+            "Develop work methods using KPIs to guide decision-making",
+            "Deliver insights that show whether a model or intervention is fit for its intended use",
+            "Explain why a chosen criterion, forecast, or recommendation fits the business context"
+        ],
+        "learning_outcomes": [
+            {
+                "category": "Knowledge",
+                "items": [
+                    "Has knowledge of data structures models and where to apply applicable data sets to the correct scenario",
+                    "Has knowledge of concepts and processes used for data cleaning using proxy real world data",
+                    "Has knowledge of real-world use case stories and how it has impacted companies outside the data analysis field",
+                    "Has knowledge of key performance indicators (KPI), data types (qualitative vs quantitative) and the data analysis lifecycle",
+                    "Has knowledge of the four data analysis philosophies: descriptive, diagnostic, predictive, prescriptive; as well as surface error detection, elimination, and correction"
+                ]
+            },
+            {
+                "category": "Skills",
+                "items": [
+                    "Can apply knowledge to practical problems, such as market price prediction, using data driven decision making techniques",
+                    "Can apply knowledge to strategically select appropriate data models to solve problem scenarios",
+                    "Can apply knowledge of the data lifecycle to proposed scenarios to create an iterative solution and analyse key performance indicators",
+                    "Can identify incorrect erroneous data and use insights on how to eliminate and correct them",
+                    "Masters relevant theoretical models to proxy real world data"
+                ]
+            },
+            {
+                "category": "Competence",
+                "items": [
+                    "Understands the fidelity of data within a project and its owners",
+                    "Can develop work methods using KPIs as a guide the decision-making process",
+                    "Can deliver insights to entire data sets to gauge if the model is accurate for the intended use"
+                ]
+            }
+        ]
+    },
+    {
+        "code": "FI1BBST05", 
+        "name": "Statistical Tools", 
+        "type": "Core Course", 
+        "credits": 5, 
+        "semester": "2025 Spring",
+        "weeks": 3,
+        "hours": 126,
+        "description": "This course provides knowledge of using integrated spreadsheet tools and introductory statistical modelling software. Builds on Spreadsheet Fundamentals competence.",
+        "knowledge": [
+            "Spreadsheet data tools for statistical analysis using built-in functions",
+            "Statistical methodologies to extract KPIs from numerical values",
+            "Advanced data analytics tool packs in spreadsheet software",
+            "Correlation, regression, ANOVA, histogram and covariance analysis",
+            "Power Query for automation",
+            "Z-scores and z-testing for outlier reduction"
+        ],
+        "skills": [
+            "Perform statistical analysis on data sets using spreadsheet tools",
+            "Install and use advanced data analysis suite",
+            "Use Power Query to automate tasks",
+            "Apply z-values to reduce errors and eliminate outliers"
+        ],
+        "competence": [
+            "Carry out work using advanced spreadsheet tools",
+            "Develop effective work methods for analysis within spreadsheets"
+        ]
+    },
+    {
+        "code": "FI1BBP175", 
+        "name": "Semester Project 1", 
+        "type": "Core Course", 
+        "credits": 7.5, 
+        "semester": "2025 Spring",
+        "weeks": 4,
+        "hours": 168,
+        "description": "Apply first semester knowledge to a practical data analysis project. Demonstrate understanding of data fundamentals, spreadsheets, and decision-making.",
+        "knowledge": [
+            "Project planning and scope definition",
+            "Data collection for real-world problems",
+            "Applying analytical techniques learned",
+            "Documentation and reporting standards",
+            "Presentation skills for data findings"
+        ],
+        "skills": [
+            "Execute a complete data analysis project",
+            "Apply spreadsheet and statistical tools",
+            "Present findings to an audience",
+            "Document work professionally"
+        ],
+        "competence": [
+            "Plan and execute data analysis tasks independently",
+            "Work according to ethical requirements",
+            "Deliver professional project documentation"
+        ]
+    },
+    {
+        "code": "FI1BBEO10", 
+        "name": "Evaluation of Outcomes", 
+        "type": "Core Course", 
+        "credits": 10, 
+        "semester": "2025 Fall",
+        "weeks": 8,
+        "hours": 336,
+        "description": "Learn to review, assess, and appraise the results of analytical models. Covers statistical inferences, confidence levels, and iterative error elimination.",
+        "knowledge": [
+            "Key Performance Indicators (KPI) as heuristics in decision making",
+            "Statistical inferences: sampled sets, linear regression, variance, five-point summaries, z-testing",
+            "Confidence levels and multiple probability outcomes",
+            "Iterative error elimination processes and tools",
+            "Ensambling data techniques",
+            "Version control for collaborative data work",
+            "ETL systems in data analysis lifecycle"
+        ],
+        "skills": [
+            "Apply statistical inferences to identify and solve problems",
+            "Apply iterative error elimination to improve results",
+            "Create multiple outcome scenarios with confidence levels",
+            "Critically assess and analyse data models",
+            "Improve reliability using ensambling techniques"
+        ],
+        "competence": [
+            "Independently assess and critique analysis approaches",
+            "Develop ethical approach to solving data problems",
+            "Facilitate solution discussions among project members"
+        ]
+    },
+    {
+        "code": "FI1BBDV75", 
+        "name": "Data Visualisation", 
+        "type": "Core Course", 
+        "credits": 7.5, 
+        "semester": "2025 Fall",
+        "weeks": 5,
+        "hours": 210,
+        "description": "Learn visualization and graphing techniques to represent data using graphical illustrations. Create intuitive graphs for professional settings and presentations.",
+        "knowledge": [
+            "Concepts, processes and tools for creating data visualizations",
+            "Selecting correct visualization for problem domains",
+            "Design principles for effective data visualizations",
+            "User experience techniques for accessible visualizations"
+        ],
+        "skills": [
+            "Select data subsets for visualization",
+            "Communicate to non-technical audiences",
+            "Master tools and techniques to visualize data",
+            "Create slideshow presentations",
+            "Identify problem areas and provide insights"
+        ],
+        "competence": [
+            "Understand ethical requirements for data visualizations",
+            "Develop ethical attitude in presentations and publications",
+            "Apply visualization techniques based on audience",
+            "Develop work methods to create graphics for clients"
+        ]
+    },
+    {
+        "code": "FI1BBAR05", 
+        "name": "Analysis Reporting", 
+        "type": "Core Course", 
+        "credits": 5, 
+        "semester": "2025 Fall",
+        "weeks": 3,
+        "hours": 126,
+        "description": "Learn conclusive report writing methodologies to communicate results clearly and concisely. Cover technical vs non-technical reporting.",
+        "knowledge": [
+            "Report structure and organization",
+            "Executive summaries writing",
+            "Technical vs non-technical reporting",
+            "Data documentation best practices",
+            "Presenting findings to stakeholders"
+        ],
+        "skills": [
+            "Write clear, concise analysis reports",
+            "Structure reports for different audiences",
+            "Document data analysis professionally",
+            "Present findings effectively"
+        ],
+        "competence": [
+            "Communicate results to various stakeholders",
+            "Develop professional documentation standards",
+            "Deliver insights in accessible formats"
+        ]
+    },
+    {
+        "code": "FI1BBP275", 
+        "name": "Exam Project 1", 
+        "type": "Core Course", 
+        "credits": 7.5, 
+        "semester": "2025 Fall",
+        "weeks": 6,
+        "hours": 252,
+        "description": "Complete a comprehensive exam project demonstrating first-year competencies in data analysis, visualization, and reporting.",
+        "knowledge": [
+            "End-to-end data analysis workflow",
+            "Professional presentation standards",
+            "Portfolio development",
+            "Self-assessment and reflection"
+        ],
+        "skills": [
+            "Execute comprehensive data analysis project",
+            "Present findings professionally",
+            "Document work for portfolio",
+            "Receive and apply peer feedback"
+        ],
+        "competence": [
+            "Demonstrate first-year learning outcomes",
+            "Work independently on complex projects",
+            "Deliver professional-quality deliverables"
+        ]
+    },
+    {
+        "code": "FI2BCDC75", 
+        "name": "Databases and Cloud Services", 
+        "type": "Core Course", 
+        "credits": 7.5, 
+        "semester": "2026 Spring",
+        "weeks": 4,
+        "hours": 168,
+        "description": "Learn core concepts of databases, SQL language, and cloud-based data services. Cover ETL practices, data warehouses, and on-premises vs cloud databases.",
+        "knowledge": [
+            "Data warehouses and ETL (Extract, Transform, Load) practices",
+            "Database components for building and maintaining databases",
+            "SQL data language for interfacing with databases",
+            "On-premises vs cloud-based database decision-making",
+            "History and traditions of databases and cloud services"
+        ],
+        "skills": [
+            "Use cloud-based native tools to interact with databases",
+            "Determine between on-premises and cloud-based solutions",
+            "Apply ETL practices to stage data into access layers",
+            "Use SQL to create, read, update and delete data",
+            "Find and refer to database documentation"
+        ],
+        "competence": [
+            "Plan and carry out database-related tasks independently or in groups",
+            "Develop effective methods for database solutions",
+            "Work according to ethical requirements and principles"
+        ]
+    },
+    {
+        "code": "FI2BCPP10", 
+        "name": "Programming Fundamentals", 
+        "type": "Core Course", 
+        "credits": 10, 
+        "semester": "2026 Spring",
+        "weeks": 6,
+        "hours": 252,
+        "description": "Introduction to programming using Python 3.x. Learn data types, operators, collections, objects, file I/O, libraries, and APIs. Use Jupyter Notebook for documentation.",
+        "knowledge": [
+            "Computational thinking to solve data analysis problems",
+            "Processes and techniques in Python programming",
+            "Tools to export code examples to Markdown",
+            "Data access layers and APIs",
+            "History of programming languages"
+        ],
+        "skills": [
+            "Use control structures and objects for iterative solutions",
+            "Use APIs to access databases from programs",
+            "Integrate databases with programming environment",
+            "Use programming syntax and interactive interpreter",
+            "Use alternative text editing syntax in coded reports",
+            "Find materials about programming to develop robust programs"
+        ],
+        "competence": [
+            "Create well-documented programs to solve real-world problems",
+            "Write fast, powerful scripts ethically",
+            "Collaborate with other analysts and programmers"
+        ]
+    },
+    {
+        "code": "FI2BCPA05", 
+        "name": "Programmatic Data Analysis", 
+        "type": "Core Course", 
+        "credits": 5, 
+        "semester": "2026 Spring",
+        "weeks": 3,
+        "hours": 126,
+        "description": "Apply programming skills to automate and enhance data analysis workflows. Use pandas, numpy, and create reproducible analysis pipelines.",
+        "knowledge": [
+            "Data manipulation with pandas library",
+            "Data cleaning with code",
+            "Automated data pipelines",
+            "Statistical analysis with Python",
+            "Reproducible analysis workflows",
+            "Version control basics (Git)"
+        ],
+        "skills": [
+            "Manipulate data programmatically",
+            "Clean and transform data with code",
+            "Automate repetitive analysis tasks",
+            "Perform statistical analysis with Python"
+        ],
+        "competence": [
+            "Create reproducible analysis workflows",
+            "Develop efficient data processing methods",
+            "Collaborate using version control"
+        ]
+    },
+    {
+        "code": "FI2BCP175", 
+        "name": "Semester Project 2", 
+        "type": "Core Course", 
+        "credits": 7.5, 
+        "semester": "2026 Spring",
+        "weeks": 4,
+        "hours": 168,
+        "description": "Apply second-year skills including databases, programming, and programmatic analysis to a comprehensive technical project.",
+        "knowledge": [
+            "Advanced project management",
+            "Technical implementation standards",
+            "Code documentation practices",
+            "Testing and validation methods"
+        ],
+        "skills": [
+            "Execute technical data analysis project",
+            "Use databases and programming together",
+            "Document code professionally",
+            "Test and validate results"
+        ],
+        "competence": [
+            "Work on complex technical projects",
+            "Deliver professional technical deliverables",
+            "Collaborate in development teams"
+        ]
+    },
+    {
+        "code": "FI2BCIT75", 
+        "name": "Industry Tools", 
+        "type": "Core Course", 
+        "credits": 7.5, 
+        "semester": "2026 Fall",
+        "weeks": 5,
+        "hours": 210,
+        "description": "Learn industry-standard tools used by professional data analysts including Business Intelligence tools, ETL processes, and data warehousing.",
+        "knowledge": [
+            "Business Intelligence tools",
+            "ETL processes and tools",
+            "Data warehousing concepts",
+            "Reporting automation",
+            "Industry-standard software",
+            "Tool selection criteria"
+        ],
+        "skills": [
+            "Use BI tools for data analysis",
+            "Implement ETL processes",
+            "Work with data warehouses",
+            "Automate reporting tasks"
+        ],
+        "competence": [
+            "Select appropriate tools for projects",
+            "Apply industry best practices",
+            "Develop efficient work methods"
+        ]
+    },
+    {
+        "code": "FI2BCCT05", 
+        "name": "Critical Data Thinking", 
+        "type": "Core Course", 
+        "credits": 5, 
+        "semester": "2026 Fall",
+        "weeks": 4,
+        "hours": 168,
+        "description": "Develop critical thinking skills for evaluating data and analysis quality. Cover data quality, bias, source credibility, and ethical data practices.",
+        "knowledge": [
+            "Data quality assessment methods",
+            "Bias identification and mitigation",
+            "Source credibility evaluation",
+            "Logical reasoning with data",
+            "Common data fallacies",
+            "GDPR and ethical data practices"
+        ],
+        "skills": [
+            "Assess data quality critically",
+            "Identify and address bias in data",
+            "Evaluate source credibility",
+            "Apply logical reasoning to analysis"
+        ],
+        "competence": [
+            "Think critically about data and results",
+            "Maintain ethical standards in analysis",
+            "Question assumptions and validate findings"
+        ]
+    },
+    {
+        "code": "FI2BCBD05", 
+        "name": "Big Data and Advanced Topics", 
+        "type": "Core Course", 
+        "credits": 5, 
+        "semester": "2026 Fall",
+        "weeks": 4,
+        "hours": 168,
+        "description": "Explore big data technologies and advanced analytical concepts including distributed computing, data lakes, and machine learning basics.",
+        "knowledge": [
+            "Big data concepts and characteristics (Volume, Velocity, Variety)",
+            "Introduction to distributed computing",
+            "Data lakes vs data warehouses",
+            "Machine learning basics",
+            "Advanced analytics overview",
+            "Future trends in data analysis"
+        ],
+        "skills": [
+            "Work with big data concepts",
+            "Understand distributed systems basics",
+            "Apply basic machine learning concepts",
+            "Evaluate advanced analytics solutions"
+        ],
+        "competence": [
+            "Assess when big data solutions are needed",
+            "Stay current with industry trends",
+            "Apply advanced concepts appropriately"
+        ]
+    },
+    {
+        "code": "FI2BCID05", 
+        "name": "Interactive Dashboards", 
+        "type": "Core Course", 
+        "credits": 5, 
+        "semester": "2026 Fall",
+        "weeks": 3,
+        "hours": 126,
+        "description": "Create interactive dashboards for data exploration. Cover dashboard design, universal design principles, real-time data integration, and tools like Tableau/Power BI.",
+        "knowledge": [
+            "Dashboard theory and design principles",
+            "Universal design for accessibility",
+            "Interactive elements and filters",
+            "Real-time data integration",
+            "Dashboard tools (Tableau, Power BI)",
+            "Performance optimization"
+        ],
+        "skills": [
+            "Design effective dashboards",
+            "Create interactive data visualizations",
+            "Integrate real-time data sources",
+            "Optimize dashboard performance"
+        ],
+        "competence": [
+            "Develop dashboards for various audiences",
+            "Apply universal design principles",
+            "Create accessible interactive experiences"
+        ]
+    },
+    {
+        "code": "FI2BCP275", 
+        "name": "Exam Project 2", 
+        "type": "Core Course", 
+        "credits": 7.5, 
+        "semester": "2026 Fall",
+        "weeks": 6,
+        "hours": 126,
+        "description": "Complete a final capstone project demonstrating all program competencies. Full data analysis lifecycle from problem identification to stakeholder presentation.",
+        "knowledge": [
+            "Full data analysis lifecycle",
+            "Professional documentation standards",
+            "Stakeholder presentation techniques",
+            "Portfolio finalization",
+            "Career preparation"
+        ],
+        "skills": [
+            "Execute end-to-end data analysis project",
+            "Apply all learned techniques",
+            "Present to stakeholders professionally",
+            "Build professional portfolio"
+        ],
+        "competence": [
+            "Demonstrate program competencies",
+            "Work independently on complex projects",
+            "Prepare for industry employment"
+        ]
+    },
+]
@@ -0,0 +1,181 @@
+"""Hand-written flashcards, exam questions and practice questions per course code."""
+
+CURATED_FLASHCARD_SETS = {
+    "FI1BBDD75": [
+        {
+            "front": "What question does descriptive analytics answer?",
+            "back": "Descriptive analytics answers 'What happened?' It summarizes historical data using reports, dashboards, counts, averages, and trends.",
+            "tags": ["analytics", "descriptive", "ddm"]
+        },
+        {
+            "front": "What is the main purpose of diagnostic analytics?",
+            "back": "Diagnostic analytics explains why something happened. It uses drill-down analysis, correlation, segmentation, and root-cause investigation.",
+            "tags": ["analytics", "diagnostic", "ddm"]
+        },
+        {
+            "front": "How is predictive analytics different from prescriptive analytics?",
+            "back": "Predictive analytics forecasts what is likely to happen next, while prescriptive analytics recommends what action should be taken based on those forecasts.",
+            "tags": ["analytics", "predictive", "prescriptive"]
+        },
+        {
+            "front": "List the six stages of the data analysis lifecycle.",
+            "back": "Define, Collect, Clean, Analyze, Interpret, and Act. The lifecycle is iterative, so analysts may return to earlier stages when needed.",
+            "tags": ["lifecycle", "process", "ddm"]
+        },
+        {
+            "front": "Why are KPIs important in decision-making?",
+            "back": "KPIs translate business goals into measurable signals. They help teams track performance, compare before-and-after results, and decide whether an intervention is working.",
+            "tags": ["kpi", "metrics", "ddm"]
+        },
+        {
+            "front": "What is the difference between qualitative and quantitative data?",
+            "back": "Qualitative data describes experiences, opinions, and categories. Quantitative data measures counts, amounts, frequencies, or changes using numbers.",
+            "tags": ["data types", "qualitative", "quantitative"]
+        },
+        {
+            "front": "Why do analysts use data subsets?",
+            "back": "Analysts use data subsets to isolate a relevant problem domain, such as a specific region, product line, or customer segment, instead of averaging unrelated data together.",
+            "tags": ["subsets", "problem framing", "ddm"]
+        },
+        {
+            "front": "Give one example of proxy real-world data.",
+            "back": "Proxy real-world data is practice data that simulates realistic business conditions, such as anonymized sales data, sample churn records, or mock support tickets used for training and analysis.",
+            "tags": ["proxy data", "data cleaning", "ddm"]
+        },
+        {
+            "front": "What does 'data fidelity' mean in a project?",
+            "back": "Data fidelity refers to how trustworthy, accurate, complete, and fit-for-purpose the data is for the analysis being performed.",
+            "tags": ["data quality", "fidelity", "ddm"]
+        },
+        {
+            "front": "How can before-and-after analysis support business decisions?",
+            "back": "Before-and-after analysis compares KPI performance around a change or intervention. It helps teams assess whether results improved and whether the change should be expanded, revised, or reversed.",
+            "tags": ["before-after", "evaluation", "ddm"]
+        },
+        {
+            "front": "What is surface error detection in data analysis?",
+            "back": "Surface error detection is the initial identification of obvious issues such as missing values, duplicates, impossible values, wrong formats, or inconsistent labels before deeper analysis begins.",
+            "tags": ["errors", "data cleaning", "ddm"]
+        },
+        {
+            "front": "Why must the analytical method match the scenario?",
+            "back": "Different problems require different methods. A summary report, root-cause investigation, forecast, and action recommendation are not the same task, so the wrong method can lead to weak decisions.",
+            "tags": ["method selection", "scenarios", "ddm"]
+        }
+    ]
+}
+
+CURATED_EXAM_QUESTION_BANK = {
+    "FI1BBDD75": [
+        {
+            "type": "knowledge",
+            "question": "A retailer sees a 12% drop in weekend sales. Explain which analytical method should be used first and why.",
+            "answer": "The first method should usually be descriptive analytics because the team must first confirm what happened, when it happened, and how large the drop is. This means checking sales by date, store, product, and region before moving into diagnostic analysis to explain the cause."
+        },
+        {
+            "type": "knowledge",
+            "question": "Describe the difference between qualitative and quantitative data, and give one realistic business example of each.",
+            "answer": "Qualitative data captures descriptive or categorical information such as comments, interview responses, or support themes. Quantitative data captures measurable numeric values such as revenue, conversion rate, or number of complaints. For example, customer comments about confusing checkout are qualitative, while a drop in conversion rate from 4.2% to 3.1% is quantitative."
+        },
+        {
+            "type": "skills",
+            "question": "A company wants to predict housing prices in a local market. Explain how data-driven decision-making could be applied to this scenario.",
+            "answer": "The analyst would define the prediction goal, collect relevant data such as size, location, age, and recent sale prices, clean the dataset, and choose an appropriate predictive model. After evaluating model accuracy, the analyst would interpret the results, check whether the model is fit for the intended use, and communicate any limitations before it is used for pricing decisions."
+        },
+        {
+            "type": "skills",
+            "question": "Explain how you would use a data subset to investigate a churn problem more effectively.",
+            "answer": "Instead of analyzing the full customer base at once, I would isolate a relevant subset such as new customers in their first 90 days or customers on one pricing plan. This reduces noise, makes patterns easier to spot, and helps identify whether the churn issue is concentrated in a particular segment rather than across the entire business."
+        },
+        {
+            "type": "case_study",
+            "question": "A hospital introduces a new appointment reminder system. Missed appointments fall from 14% to 9%, and patient comments say reminders are now easier to understand. What should the analyst conclude, and what should happen next?",
+            "answer": "The analyst can conclude that the intervention is associated with an improvement because both KPI performance and qualitative feedback moved in a positive direction. The next step is to continue monitoring the missed-appointment KPI, compare results across patient groups, and confirm no other major process changes caused the improvement before expanding the system."
+        },
+        {
+            "type": "knowledge",
+            "question": "Why are KPIs described as heuristics in data-driven decision-making?",
+            "answer": "KPIs are heuristics because they give practical, simplified signals about performance that help guide decisions. They do not capture everything about a business situation, but they help teams monitor behavior, compare outcomes, and decide where to investigate further."
+        },
+        {
+            "type": "skills",
+            "question": "Name two common forms of erroneous data and explain how you would correct them.",
+            "answer": "Two common forms are duplicate records and inconsistent labels. Duplicates can be removed using unique identifiers or deduplication rules, while inconsistent labels such as 'USA', 'U.S.A.', and 'United States' can be standardized into one format before analysis."
+        },
+        {
+            "type": "case_study",
+            "question": "A support team says customer satisfaction has declined. Build a short analytical plan using the data lifecycle.",
+            "answer": "Define the problem by agreeing on the KPI and timeframe. Collect support scores, ticket data, and customer comments. Clean the data by standardizing categories and checking for missing values. Analyze patterns by channel, queue, and issue type. Interpret the main causes, then recommend actions such as staffing changes, training, or process improvements and monitor whether satisfaction improves afterward."
+        },
+        {
+            "type": "knowledge",
+            "question": "What does it mean to understand the fidelity of data and its owners within a project?",
+            "answer": "It means understanding how trustworthy and fit-for-purpose the data is, who is responsible for collecting or maintaining it, and what limitations or permissions apply. This matters because poor-quality or poorly governed data can lead to weak models and bad decisions."
+        },
+        {
+            "type": "general",
+            "question": "Explain why real-world use case stories are important in a decision-making course.",
+            "answer": "Use case stories show how analytical methods affect real businesses, operations, and customers outside the classroom. They help candidates connect theory to action by seeing how data models, KPIs, and decisions produce measurable impact in practical settings."
+        },
+        {
+            "type": "skills",
+            "question": "How would you decide whether a descriptive, diagnostic, predictive, or prescriptive approach is most appropriate for a scenario?",
+            "answer": "I would start by identifying the business question. If the team needs a summary of what happened, use descriptive analytics. If they need the cause, use diagnostic analytics. If they want a forecast, use predictive analytics. If they need the best action to take, use prescriptive analytics."
+        },
+        {
+            "type": "case_study",
+            "question": "An e-commerce business sees more product returns after changing its sizing guide. Describe how qualitative and quantitative evidence should be combined before making a recommendation.",
+            "answer": "Quantitative data should be used to measure return rate changes, affected product groups, and time periods. Qualitative evidence such as customer comments and support messages should be used to understand confusion or friction in the sizing guide. A recommendation should combine both by linking the KPI increase to the customer feedback before redesigning the guide and testing results afterward."
+        }
+    ]
+}
+
+CURATED_PRACTICE_QUESTION_BANK = {
+    "FI1BBDD75": [
+        {
+            "type": "knowledge",
+            "question": "In the grocery-delivery scenario, what is the difference between the Maximax and Maximin criteria?",
+            "answer": "Maximax chooses the option with the best possible payoff, so it suits an optimistic decision maker. Maximin chooses the option with the strongest worst-case payoff, so it suits a cautious decision maker who wants to limit downside risk."
+        },
+        {
+            "type": "knowledge",
+            "question": "What does the Hurwicz criterion add that Maximax and Maximin do not?",
+            "answer": "Hurwicz blends optimism and caution by weighting each strategy's best and worst outcomes using an optimism factor. This makes it useful when a decision maker is neither fully risk-seeking nor fully risk-averse."
+        },
+        {
+            "type": "knowledge",
+            "question": "Why is the Laplace rule useful when you do not trust any single market scenario more than the others?",
+            "answer": "The Laplace rule assumes all scenarios are equally likely and compares average payoffs. It is useful when no reliable probability estimates are available, so the analyst needs a neutral starting point."
+        },
+        {
+            "type": "skills",
+            "question": "A delivery team can choose between hiring more drivers, optimizing routes, or outsourcing overflow orders. How would you calculate minimax regret for these three options?",
+            "answer": "List the payoff for each option under every demand scenario, then find the best payoff in each scenario. Subtract each option's payoff from that scenario's best payoff to build the regret matrix, then choose the option with the smallest maximum regret."
+        },
+        {
+            "type": "skills",
+            "question": "You estimate probabilities of 0.2, 0.5, and 0.3 for low, medium, and high demand. Explain how to compute expected payoff for each grocery-delivery strategy.",
+            "answer": "Multiply each scenario payoff by its probability and add the three weighted values for each strategy. The strategy with the highest total expected payoff is preferred when those probabilities are considered trustworthy."
+        },
+        {
+            "type": "skills",
+            "question": "How would you explain expected loss of opportunity to a manager who is unfamiliar with decision theory?",
+            "answer": "Expected loss of opportunity is the average cost of not picking the best strategy for each scenario. You calculate it from the regret matrix, weight regrets by scenario probability, and prefer the strategy with the lowest expected missed opportunity."
+        },
+        {
+            "type": "case_study",
+            "question": "A grocery platform expects demand to rise before a holiday weekend, but the forecast is uncertain. Which criterion would you use if management wants a balanced decision rather than a fully optimistic or pessimistic one, and why?",
+            "answer": "The Hurwicz criterion is a strong choice because it balances the best-case and worst-case outcomes using an explicit optimism factor. That lets management state its risk attitude directly instead of pretending to be fully optimistic or fully defensive."
+        },
+        {
+            "type": "case_study",
+            "question": "In the grocery-delivery scenario, management says: 'We care most about avoiding the embarrassment of making the visibly wrong decision after the fact.' Which decision criterion best fits that mindset?",
+            "answer": "Minimax regret fits that mindset because it focuses on limiting the largest possible regret. It is designed for teams that want to avoid looking back and seeing that another choice would clearly have been much better in a given scenario."
+        },
+        {
+            "type": "general",
+            "question": "Why should an analyst compare several decision criteria instead of relying on only one rule in uncertain business situations?",
+            "answer": "Different criteria reflect different assumptions about uncertainty, probabilities, and risk tolerance. Comparing them helps the analyst explain tradeoffs clearly and show whether a recommendation is robust or sensitive to managerial preferences."
+        }
+    ]
+}
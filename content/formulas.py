@@ -0,0 +1,122 @@
+"""Formula Reference entries by category."""
+
+FORMULAS = {
+    "Descriptive Statistics": [
+        {
+            "name": "Mean (Average)",
+            "formula": r"\bar{x} = \frac{1}{n}\sum_{i=1}^{n} x_i",
+            "description": "The average of all values in a dataset",
+            "example": "For [1, 2, 3, 4, 5]: mean = (1+2+3+4+5)/5 = 3"
+        },
+        {
+            "name": "Median",
+            "formula": r"\text{Median} = \begin{cases} x_{\frac{n+1}{2}} & \text{if } n \text{ is odd} \\ \frac{x_{\frac{n}{2}} + x_{\frac{n}{2}+1}}{2} & \text{if } n \text{ is even} \end{cases}",
+            "description": "The middle value when data is sorted",
+            "example": "For [1, 2, 3, 4, 5]: median = 3\nFor [1, 2, 3, 4]: median = (2+3)/2 = 2.5"
+        },
+        {
+            "name": "Standard Deviation",
+            "formula": r"s = \sqrt{\frac{1}{n-1}\sum_{i=1}^{n}(x_i - \bar{x})^2}",
+            "description": "Measures the spread of data around the mean",
+            "example": "For [1, 2, 3, 4, 5] with mean=3:\ns = √[((1-3)²+(2-3)²+(3-3)²+(4-3)²+(5-3)²)/4] = √2.5 ≈ 1.58"
+        },
+        {
+            "name": "Variance",
+            "formula": r"s^2 = \frac{1}{n-1}\sum_{i=1}^{n}(x_i - \bar{x})^2",
+            "description": "The square of standard deviation",
+            "example": "Variance = (Standard Deviation)²"
+        },
+        {
+            "name": "Range",
+            "formula": r"\text{Range} = \max(x_i) - \min(x_i)",
+            "description": "Difference between maximum and minimum values",
+            "example": "For [1, 2, 3, 4, 5]: range = 5 - 1 = 4"
+        }
+    ],
+    "Inferential Statistics": [
+        {
+            "name": "Z-Score",
+            "formula": r"z = \frac{x - \mu}{\sigma}",
+            "description": "Number of standard deviations a value is from the mean",
+            "example": "If x=110, μ=100, σ=10: z = (110-100)/10 = 1.0"
+        },
+        {
+            "name": "T-Test (One Sample)",
+            "formula": r"t = \frac{\bar{x} - \mu_0}{s/\sqrt{n}}",
+            "description": "Tests if sample mean differs from population mean",
+            "example": "Compare sample mean to hypothesized population mean"
+        },
+        {
+            "name": "Confidence Interval (Mean)",
+            "formula": r"\bar{x} \pm z_{\alpha/2} \frac{\sigma}{\sqrt{n}}",
+            "description": "Range likely to contain population mean",
+            "example": "95% CI: x̄ ± 1.96 × (σ/√n)"
+        },
+        {
+            "name": "Sample Size",
+            "formula": r"n = \left(\frac{z_{\alpha/2} \cdot \sigma}{E}\right)^2",
+            "description": "Required sample size for desired margin of error",
+            "example": "For E=2, σ=10, 95% confidence: n = (1.96×10/2)² ≈ 96"
+        }
+    ],
+    "Regression": [
+        {
+            "name": "Simple Linear Regression",
+            "formula": r"y = \beta_0 + \beta_1 x + \epsilon",
+            "description": "Predicts y from x using a linear relationship",
+            "example": "y = 2 + 3x means for each unit increase in x, y increases by 3"
+        },
+        {
+            "name": "Slope (β₁)",
+            "formula": r"\beta_1 = \frac{\sum(x_i - \bar{x})(y_i - \bar{y})}{\sum(x_i - \bar{x})^2}",
+            "description": "Rate of change in y per unit change in x",
+            "example": "Positive slope = positive correlation"
+        },
+        {
+            "name": "Intercept (β₀)",
+            "formula": r"\beta_0 = \bar{y} - \beta_1 \bar{x}",
+            "description": "Value of y when x = 0",
+            "example": "Starting point of the regression line"
+        },
+        {
+            "name": "R² (Coefficient of Determination)",
+            "formula": r"R^2 = 1 - \frac{SS_{res}}{SS_{tot}}",
+            "description": "Proportion of variance explained by the model",
+            "example": "R² = 0.85 means 85% of variance is explained"
+        }
+    ],
+    "Correlation": [
+        {
+            "name": "Pearson Correlation",
+            "formula": r"r = \frac{\sum(x_i - \bar{x})(y_i - \bar{y})}{\sqrt{\sum(x_i - \bar{x})^2 \sum(y_i - \bar{y})^2}}",
+            "description": "Measures linear relationship between two variables",
+            "example": "r ranges from -1 (perfect negative) to +1 (perfect positive)"
+        },
+        {
+            "name": "Covariance",
+            "formula": r"\text{Cov}(X,Y) = \frac{1}{n-1}\sum(x_i - \bar{x})(y_i - \bar{y})",
+            "description": "Measures how two variables vary together",
+            "example": "Positive = variables increase together"
+        }
+    ],
+    "Probability": [
+        {
+            "name": "Probability",
+            "formula": r"P(A) = \frac{\text{Number of favorable outcomes}}{\text{Total outcomes}}",
+            "description": "Likelihood of an event occurring",
+            "example": "P(rolling 6 on die) = 1/6 ≈ 0.167"
+        },
+        {
+            "name": "Conditional Probability",
+            "formula": r"P(A|B) = \frac{P(A \cap B)}{P(B)}",
+            "description": "Probability of A given B has occurred",
+            "example": "P(rain|cloudy) = probability of rain when it's cloudy"
+        },
+        {
+            "name": "Bayes' Theorem",
+            "formula": r"P(A|B) = \frac{P(B|A) \cdot P(A)}{P(B)}",
+            "description": "Updates probability based on new evidence",
+            "example": "Used in medical diagnosis and machine learning"
+        }
+    ]
+}
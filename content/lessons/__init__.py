@@ -0,0 +1,6 @@
+"""Index of Learn & Practice lesson sets, keyed by course code."""
+
+LESSON_INDEX = {
+    "FI1BBDF05": {"module": "fi1bbdf05", "lessons": 5},
+    "FI1BBDD75": {"module": "fi1bbdd75", "lessons": 11},
+}
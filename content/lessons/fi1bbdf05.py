@@ -0,0 +1,13042 @@
+"""Learn & Practice lessons for FI1BBDF05."""
+
+LESSONS = [
+    {
+        "lesson_number": "1.1",
+        "title": "Introduction to Data Analysis",
+        "content": """
+### What is Data Analysis?
+
+Understanding and using data is becoming increasingly important in the quickly changing digital environment. The discipline of **data analysis** is focused on drawing insightful conclusions from data. It involves methods and tools for gathering unprocessed data and then turning it into information that can help with decision-making. Typically, specialised hardware and software are used to accomplish this.
+
+#### 🎯 Core Concept
+
+<div class="mermaid">
+flowchart LR
+    A[Raw Data<br/>📊<br/>Unprocessed Information] -->|Processing| B[Clean & Transform<br/>🔄]
+    B -->|Analysis| C[Extract Patterns<br/>🔍]
+    C -->|Insights| D[Decision-Making<br/>💡]
+    
+    style A fill:#e3f2fd,stroke:#2196F3,stroke-width:2px
+    style B fill:#fff3cd,stroke:#ffc107,stroke-width:2px
+    style C fill:#c8e6c9,stroke:#4CAF50,stroke-width:2px
+    style D fill:#f3e5f5,stroke:#9C27B0,stroke-width:2px
+</div>
+
+#### 📊 Types of Data Analysis
+
+Based on the unique requirements of a task or project, different methods and techniques are used in the broad field of data analysis. Here are the most popular types:
+
+| Type | Purpose | Example |
+|------|---------|---------|
+| **Text Analysis** | Extract insights from text data | Analyzing customer reviews |
+| **Statistical Analysis** | Use statistical methods to understand data | Calculating averages, correlations |
+| **Diagnostic Analysis** | Understand why something happened | Root cause analysis |
+| **Predictive Analysis** | Forecast future trends | Sales forecasting |
+| **Data Mining** | Discover patterns in large datasets | Market basket analysis |
+
+#### 🔗 Related Fields
+
+Data analysis is closely related to several other fields that enhance its capabilities:
+
+**1. Programming** 💻
+- Create scripts to pre-process, transform, and analyse data
+- Languages: Python, R, SQL
+- Enables: Large datasets, intricate calculations, task automation
+
+**2. Machine Learning** 🤖
+- Subset of artificial intelligence
+- Systems learn from experience without explicit programming
+- Build predictive models from historical data
+- Helps with trend forecasting and data-driven decision-making
+
+**3. Statistics** 📈
+- Foundation of data analysis
+- Methods for understanding and interpreting data
+- From basic (mean, median, mode) to advanced (hypothesis testing, regression)
+
+**4. Data Visualisation** 📊
+- Communicate complex findings using graphs and charts
+- Tools: Tableau, PowerBI, Matplotlib, Seaborn
+- Makes data accessible to non-technical audiences
+
+**5. Business Intelligence** 🏢
+- Technology-driven process for data analysis and information presentation
+- Helps executives and managers make informed business decisions
+- Data analysts work within BI boundaries to help organizations use data effectively
+
+**6. Big Data** 🌐
+- Focuses on handling massive datasets that traditional software can't address
+- Techniques: MapReduce, Hadoop frameworks
+- Essential for data analysts working with extremely large datasets
+
+#### 🎨 Visual Overview: Data Analysis Ecosystem
+
+<div class="mermaid">
+graph TD
+    A[Data Analysis Fundamentals] --> B[Statistics]
+    A --> C[Machine Learning]
+    A --> D[Business Intelligence]
+    
+    B --> E[Programming & Tools]
+    C --> E
+    D --> E
+    
+    E --> F[Python]
+    E --> G[R]
+    E --> H[SQL]
+    E --> I[Tableau]
+    
+    E --> J[Big Data]
+    J --> K[Hadoop]
+    J --> L[Spark]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px
+    style D fill:#4ECDC4,stroke:#2C7873,stroke-width:2px
+    style E fill:#95E1D3,stroke:#4ECDC4,stroke-width:2px
+    style J fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+</div>
+
+#### 🔄 Data Analysis Workflow
+
+<div class="mermaid">
+flowchart TD
+    Start([Start Analysis]) --> Collect[Collect Data]
+    Collect --> Clean[Clean Data]
+    Clean --> Explore[Explore Data]
+    Explore --> Analyze[Analyze Data]
+    Analyze --> Visualize[Visualize Results]
+    Visualize --> Interpret[Interpret Findings]
+    Interpret --> Decision{Make Decision}
+    Decision -->|Action Needed| Act[Take Action]
+    Decision -->|More Analysis| Analyze
+    Act --> End([End])
+    
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style Collect fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Clean fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px
+    style Explore fill:#4ECDC4,stroke:#2C7873,stroke-width:2px
+    style Analyze fill:#95E1D3,stroke:#4ECDC4,stroke-width:2px
+    style Visualize fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+    style Interpret fill:#C7CEEA,stroke:#8B9DC3,stroke-width:2px
+    style Decision fill:#F8B500,stroke:#E6A200,stroke-width:3px
+    style Act fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style End fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+</div>
+
+#### 👥 Roles and Responsibilities
+
+The discipline of data analysis encompasses a variety of roles and responsibilities. In data-driven businesses, these various roles frequently overlap, but each has a specific function in handling, comprehending, and presenting data. The following are descriptions of the general roles and responsibilities within the field of data analysis:
+
+**1. Data Analyst** 📊
+- Gathers, organises, and analyses data statistically
+- Interprets data using statistical methods
+- Delivers ongoing reports and identifies patterns and trends
+- Maintains databases and data systems
+- Designs and implements data collection methods
+- Enhances statistical effectiveness and data quality
+
+**2. Data Scientist** 🔬
+- Uses algorithms and predictive models to create new data modelling processes
+- Creates Artificial Intelligence (AI) systems using machine learning
+- Applies ML algorithms to data, text, images, video, audio, and other data types
+- Tasks include: enhancing marketing efficiency, forecasting election outcomes, diagnosing diseases
+
+**3. Data Engineer** ⚙️
+- Sets up the 'big data' infrastructure for data scientists
+- Designs, builds, and integrates data from various sources
+- Manages software systems for big data
+- Ensures data is easily accessible and performance-optimised
+- Writes complex queries
+
+**4. Business Intelligence Analyst** 💼
+- Analyses data to create a clearer picture of the company's position
+- Identifies business and market trends
+- Gathers data from various sources
+- Develops thorough reports and dashboards
+- Presents findings to business decision-makers
+
+**5. Data Architect** 🏗️
+- Focuses on design and management of high-level structures in data ecosystem
+- Creates frameworks for data engineers to implement
+- Big-picture aspects of data management
+- Closely related to data engineer role (design vs implementation)
+
+**6. Statistician** 📈
+- Uses statistical methods to gather and analyse data
+- Assists in resolving practical issues in business, engineering, healthcare, and other fields
+- Chooses what information is needed and how to gather it
+- Plans surveys and experiments
+- Examines data to identify patterns and make inferences
+- Presents findings
+
+**7. Machine Learning Engineer** 🤖
+- Creates and maintains platforms for machine learning projects
+- Expert programmers who develop machines and systems
+- Systems that can learn and apply knowledge independently
+- Develops algorithms and programs for autonomous device behavior
+
+**8. Data Visualisation Specialist** 🎨
+- Turns complex findings into understandable visual presentations
+- Produces dashboards, charts, and graphs
+- Uses tools like Tableau, PowerBI, Python and R libraries
+- Supports business decision-making through visual communication
+
+#### 🎯 Roles Relationship Diagram
+
+<div class="mermaid">
+graph TB
+    subgraph "Data Collection & Infrastructure"
+        DE[Data Engineer<br/>⚙️<br/>Big Data Infrastructure]
+        DA[Data Architect<br/>🏗️<br/>System Design]
+    end
+    
+    subgraph "Data Processing & Analysis"
+        DA2[Data Analyst<br/>📊<br/>Statistical Analysis]
+        DS[Data Scientist<br/>🔬<br/>ML & AI Models]
+        ST[Statistician<br/>📈<br/>Statistical Methods]
+    end
+    
+    subgraph "Visualization & Reporting"
+        BI[BI Analyst<br/>💼<br/>Business Insights]
+        DV[Data Visualization<br/>Specialist<br/>🎨<br/>Charts & Dashboards]
+    end
+    
+    subgraph "Advanced Implementation"
+        MLE[ML Engineer<br/>🤖<br/>ML Platforms]
+    end
+    
+    DA --> DE
+    DE --> DA2
+    DE --> DS
+    DA2 --> ST
+    DS --> MLE
+    DA2 --> BI
+    DS --> BI
+    ST --> BI
+    BI --> DV
+    DS --> DV
+    
+    style DE fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style DA fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style DA2 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style DS fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style ST fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style BI fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style DV fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+    style MLE fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+#### 🔄 Data Analysis Team Workflow
+
+<div class="mermaid">
+flowchart LR
+    A[Data Architect<br/>Designs System] --> B[Data Engineer<br/>Builds Infrastructure]
+    B --> C[Data Sources]
+    C --> D[Data Analyst<br/>Statistical Analysis]
+    C --> E[Data Scientist<br/>ML Models]
+    C --> F[Statistician<br/>Experiments]
+    D --> G[BI Analyst<br/>Business Insights]
+    E --> H[ML Engineer<br/>Deploy Models]
+    F --> G
+    G --> I[Data Visualization<br/>Specialist]
+    H --> I
+    I --> J[Decision Makers<br/>💡]
+    
+    style A fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style B fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style C fill:#95E1D3,stroke:#4ECDC4,stroke-width:2px
+    style D fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style I fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+    style J fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+</div>
+
+#### 📋 Roles Comparison Table
+
+| Role | Primary Focus | Key Skills | Typical Output |
+|------|---------------|------------|---------------|
+| **Data Analyst** | Statistical analysis & reporting | Statistics, SQL, Excel | Reports, insights |
+| **Data Scientist** | ML models & AI systems | Python, ML, algorithms | Predictive models, AI systems |
+| **Data Engineer** | Infrastructure & pipelines | Big data tools, databases | Data pipelines, infrastructure |
+| **BI Analyst** | Business insights | Business acumen, dashboards | Business reports, dashboards |
+| **Data Architect** | System design | System design, architecture | Data architecture frameworks |
+| **Statistician** | Statistical methods | Advanced statistics, R | Statistical analysis, experiments |
+| **ML Engineer** | ML platforms | Programming, ML ops | ML platforms, deployed models |
+| **Data Visualization Specialist** | Visual communication | Tableau, PowerBI, design | Charts, dashboards, visualizations |
+
+#### 💡 Important Notes
+
+<div class="key-concept">
+**Role Overlap**: In smaller organisations, one person might oversee several of these positions. Organisations may have their own internal definition of roles and may use role names specific to their organisation.
+</div>
+
+#### 🎯 Skills Requirements
+
+The two types of skills significant in the workplace are **hard skills** and **soft skills**, which frequently complement one another. Technical or specialised skills are considered hard skills because they are simple to define and quantify. Formal education, training courses, certification programmes, or on-the-job training are frequently used to acquire them. Hard skills are often unique to a given job or task.
+
+##### 💻 Hard Skills
+
+**1. Mathematical and Statistical Skills** 📊
+- Basic understanding of statistics and maths when interpreting data
+- Understanding the data, performing calculations, and reaching reliable conclusions
+- Essential for producing accurate reports
+
+**2. Programming Skills** 💻
+- Languages: Python, R, SQL
+- Not all data analyst roles require it, but it's a tremendous asset
+- Enables automation of procedures
+- Clean up and process massive amounts of data
+- Carry out more complex analyses
+
+**3. Database Management/SQL** 🗄️
+- Fundamental skill for a data analyst
+- Ability to write SQL queries and comprehend database systems
+- Extract, modify, manage, and store data
+- Comfortable working with database systems
+
+**4. Data Visualisation Skills** 📈
+- One of the most important aspects of a data analyst's job
+- Present data in an understandable visual format
+- Tools: Tableau, PowerBI, Python libraries (Matplotlib, Seaborn)
+- Create graphs, charts, and other visualisations
+
+**5. Knowledge of Data Cleaning/Wrangling** 🧹
+- Rarely is data pure and prepared for analysis
+- Handle missing or inconsistent data
+- Prepare data for analysis through cleaning and pre-processing
+- Essential for data quality
+
+##### 🤝 Soft Skills
+
+Soft skills often correlate with a person's personality traits, social graces, communication skills, and personal attributes. Soft skills are less concrete and more difficult to measure. They have to do with how you conduct yourself at work and with others.
+
+**1. Analytical Skills** 🔍
+- Examine statistics, patterns, and other information
+- Draw conclusions from the results
+- Pose the proper inquiries
+- Interpret the findings
+- Offer perceptions that can aid decision-making
+
+**2. Problem-Solving Skills** 🧩
+- Troubleshoot and find solutions
+- Handle problems with data or analysis
+- Troubleshoot data collection procedures
+- Determine how to deal with incomplete or inconsistent data
+
+**3. Communication Skills** 💬
+- Strong written and verbal communication skills
+- Convey findings to audiences that may not share technical expertise
+- Communicate complex ideas in a way that others can comprehend
+- Present findings clearly and effectively
+
+**4. Understanding of the Business/Industry** 🏢
+- Business or industry knowledge is significantly beneficial
+- Comprehend the context of the data being used
+- Produce pertinent and beneficial analyses for the enterprise
+- Connect data insights to business objectives
+
+#### 📊 Skills Overview Diagram
+
+<div class="mermaid">
+graph TB
+    subgraph "Hard Skills 💻"
+        HS1[Mathematical &<br/>Statistical Skills<br/>📊]
+        HS2[Programming Skills<br/>Python, R, SQL<br/>💻]
+        HS3[Database Management<br/>SQL Queries<br/>🗄️]
+        HS4[Data Visualization<br/>Tableau, PowerBI<br/>📈]
+        HS5[Data Cleaning<br/>Wrangling<br/>🧹]
+    end
+    
+    subgraph "Soft Skills 🤝"
+        SS1[Analytical Skills<br/>Critical Thinking<br/>🔍]
+        SS2[Problem-Solving<br/>Troubleshooting<br/>🧩]
+        SS3[Communication<br/>Written & Verbal<br/>💬]
+        SS4[Business Understanding<br/>Industry Knowledge<br/>🏢]
+    end
+    
+    HS1 --> Success[Successful<br/>Data Analyst<br/>✅]
+    HS2 --> Success
+    HS3 --> Success
+    HS4 --> Success
+    HS5 --> Success
+    SS1 --> Success
+    SS2 --> Success
+    SS3 --> Success
+    SS4 --> Success
+    
+    style HS1 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style HS2 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style HS3 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style HS4 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style HS5 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style SS1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style SS2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style SS3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style SS4 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Success fill:#FFD700,stroke:#B8860B,stroke-width:3px
+</div>
+
+#### 🔄 Skills Development Path
+
+<div class="mermaid">
+flowchart TD
+    Start([Begin Learning]) --> Foundation[Foundation Skills]
+    
+    Foundation --> Hard[Hard Skills Development]
+    Foundation --> Soft[Soft Skills Development]
+    
+    Hard --> H1[Math & Statistics]
+    Hard --> H2[Programming]
+    Hard --> H3[Database/SQL]
+    Hard --> H4[Visualization]
+    Hard --> H5[Data Cleaning]
+    
+    Soft --> S1[Analytical Thinking]
+    Soft --> S2[Problem Solving]
+    Soft --> S3[Communication]
+    Soft --> S4[Business Acumen]
+    
+    H1 --> Practice[Practice & Apply]
+    H2 --> Practice
+    H3 --> Practice
+    H4 --> Practice
+    H5 --> Practice
+    S1 --> Practice
+    S2 --> Practice
+    S3 --> Practice
+    S4 --> Practice
+    
+    Practice --> Experience[Gain Experience]
+    Experience --> Expert[Expert Data Analyst]
+    
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style Foundation fill:#95E1D3,stroke:#4ECDC4,stroke-width:2px
+    style Hard fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style Soft fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Practice fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Experience fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style Expert fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 📋 Skills Comparison Table
+
+| Skill Type | Characteristics | How Acquired | Examples |
+|------------|----------------|--------------|----------|
+| **Hard Skills** | Technical, quantifiable, job-specific | Formal education, training, certifications | SQL, Python, Statistics, Tableau |
+| **Soft Skills** | Personality-based, interpersonal | Experience, practice, self-development | Communication, Problem-solving, Analytical thinking |
+| **Complementary** | Both essential for success | Continuous learning and development | Technical expertise + Communication = Effective analyst |
+
+#### 💡 Key Insights
+
+<div class="important-info">
+**Why Both Skills Matter**: In the workplace, it's crucial to have both hard and soft skills. Technical expertise is frequently built on a foundation of hard skills. Still, soft skills are essential for effectively putting those technical skills to use, working with teammates, and fostering a positive work environment. Employers frequently place a high value on soft skills because they can be more challenging to teach than hard skills and because they are crucial to a person's capacity for collaborative work.
+</div>
+
+#### 📅 A Day in the Life of a Data Analyst
+
+There are never any two alike days at this job. There are always fresh data sets to examine, new issues to resolve, and fresh revelations to make. People who enjoy puzzles, have a keen eye for detail, and are curious to find the stories hidden in data are well suited for this role.
+
+Let's discuss a typical day for a data analyst working in a mid-sized tech company. A data analyst's day can vary greatly depending on the industry, company size, and specific role.
+
+#### ⏰ Daily Timeline
+
+<div class="mermaid">
+gantt
+    title A Day in the Life of a Data Analyst
+    dateFormat HH:mm
+    axisFormat %H:%M
+    
+    section Morning
+    Coffee & Email Check           :08:00, 30m
+    Daily Stand-up Meeting         :08:30, 30m
+    Draft Sales Report             :09:00, 90m
+    Data Validation & Cleaning     :09:00, 90m
+    
+    section Analysis
+    Data Analysis (Python)         :10:30, 90m
+    Lunch Break                    :12:00, 60m
+    
+    section Afternoon
+    Create Visualizations          :13:00, 60m
+    Complete & Send Report         :14:00, 30m
+    Prepare New Dataset            :14:30, 60m
+    ML Team Meeting                :15:30, 30m
+    Wrap Up & Planning             :16:00, 30m
+</div>
+
+#### 📋 Detailed Daily Activities
+
+**08:00 - Morning Routine** ☕
+- Start the day with coffee
+- Check email for updates from team and departments
+- Respond to critical messages
+- Scan for urgent data requests requiring immediate attention
+
+**08:30 - Team Collaboration** 👥
+- Attend daily stand-up meeting
+- Discuss daily tasks and project updates
+- Share problems and upcoming deadlines
+- Communicate current work: cleaning new dataset for predictive model and quarterly sales report
+
+**09:00 - Data Preparation** 📊
+- Begin drafting sales report for current quarter
+- Use SQL queries to retrieve data from company database
+- Verify data accuracy
+- Look for outliers and inconsistencies
+- Check for gaps in data
+
+**10:30 - Data Analysis** 🔍
+- Begin analysis after validating and organizing data
+- Examine sales patterns
+- Identify top-performing products
+- Understand consumer behavior
+- Compare current quarter with previous quarters
+- Use Python with Pandas and NumPy for data manipulation and calculations
+
+**12:00 - Break** 🍽️
+- Lunch break
+- Catch up with co-workers
+
+**13:00 - Data Visualization** 📈
+- Visualize interesting insights from sales data
+- Use Tableau to create dynamic dashboards
+- Display data on:
+  - Customer behavior
+  - Product performance
+  - Sales trends
+
+**14:00 - Report Delivery** 📤
+- Complete the sales report
+- Send report with summary of findings to sales team
+- Make yourself available for additional analysis or questions
+
+**14:30 - New Project Preparation** 🆕
+- Prepare fresh dataset for predictive model
+- Handle large dataset with many missing values
+- Perform extensive pre-processing and cleaning
+
+**15:30 - Cross-Team Collaboration** 🤝
+- Meeting with machine learning team
+- Review cleaned data together
+- Explain what each variable means
+- Discuss problems encountered during cleaning
+- Hand off data for model construction
+
+**16:00 - End of Day** ✅
+- Finish up for the day
+- Set to-do items for tomorrow:
+  - Finish data cleaning
+  - Begin exploratory data analysis on new dataset
+  - Respond to sales team comments on quarterly report
+
+#### 🔄 Daily Workflow Diagram
+
+<div class="mermaid">
+flowchart TD
+    Start([Start of Day<br/>08:00]) --> Email[Check Email<br/>& Updates<br/>☕]
+    Email --> Standup[Daily Stand-up<br/>Team Meeting<br/>👥]
+    Standup --> SQL[SQL Queries<br/>Retrieve Data<br/>🗄️]
+    SQL --> Validate[Validate Data<br/>Check Quality<br/>✓]
+    Validate --> Analyze[Analyze Data<br/>Python/Pandas<br/>🔍]
+    Analyze --> Lunch[Lunch Break<br/>🍽️]
+    Lunch --> Visualize[Create Visualizations<br/>Tableau<br/>📈]
+    Visualize --> Report[Complete Report<br/>Send to Team<br/>📤]
+    Report --> Clean[Clean New Dataset<br/>Pre-processing<br/>🧹]
+    Clean --> Meeting[ML Team Meeting<br/>Review Data<br/>🤝]
+    Meeting --> Plan[Plan Tomorrow<br/>Set To-Dos<br/>✅]
+    Plan --> End([End of Day<br/>16:00])
+    
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style Email fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Standup fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style SQL fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style Validate fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style Analyze fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style Lunch fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+    style Visualize fill:#95E1D3,stroke:#4ECDC4,stroke-width:2px
+    style Report fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Clean fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style Meeting fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style Plan fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style End fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+</div>
+
+#### 🎯 Key Activities Breakdown
+
+<div class="mermaid">
+pie title Daily Time Distribution
+    "Data Analysis" : 90
+    "Data Preparation" : 90
+    "Visualization" : 60
+    "Meetings" : 60
+    "Report Writing" : 30
+    "Email & Planning" : 60
+    "Lunch" : 60
+</div>
+
+#### 💡 Key Insights from a Typical Day
+
+<div class="key-concept">
+**Variety is Key**: No two days are the same. Data analysts work on multiple projects simultaneously, handle various data sources, and collaborate with different teams. This variety keeps the role interesting and challenging.
+
+**Technical Skills in Action**: The day demonstrates the practical application of:
+- SQL for data retrieval
+- Python (Pandas, NumPy) for analysis
+- Tableau for visualization
+- Data cleaning and validation techniques
+
+**Collaboration is Essential**: The role involves constant communication with:
+- Team members (stand-ups)
+- Other departments (sales team)
+- Cross-functional teams (ML team)
+
+**Problem-Solving Focus**: Much of the day involves identifying and solving data quality issues, finding patterns, and making data-driven recommendations.
+</div>
+
+#### 📊 Levels of Data Analysis
+
+Four levels or types of data analysis can be distinguished, each offering more profound insights and increasing complexity. These are the four levels in this hierarchy: **descriptive**, **diagnostic**, **predictive**, and **prescriptive analytics**.
+
+##### 1. Descriptive Analytics 📈
+
+The most fundamental type of data analytics is **descriptive analytics**. The raw data must be comprehended and summarised to find patterns and trends. The main goal of descriptive analytics is to summarise or describe data in a way humans can understand.
+
+**Key Questions**: "What happened?"
+
+**Examples**:
+- Statistical data on website traffic
+- Social media post metrics
+- Monthly revenue reports
+- Sales summaries
+- Customer demographics
+
+**Characteristics**:
+- Most basic level
+- Summarizes historical data
+- Identifies patterns and trends
+- Provides context for what occurred
+
+##### 2. Diagnostic Analytics 🔍
+
+Deeper data analysis is used in **diagnostic analytics** to identify the factors that led to a particular result. It looks at information or content to address concerns about the reasons behind events. More varied data inputs and statistical techniques are used to analyse the data and look for patterns or correlations.
+
+**Key Questions**: "Why did it happen?"
+
+**Examples**:
+- Investigating decline in quarterly sales
+- Root cause analysis
+- Identifying factors affecting performance
+- Understanding correlations between variables
+
+**Characteristics**:
+- Deeper than descriptive
+- Investigates causes
+- Uses statistical techniques
+- Looks for patterns and correlations
+- Explains past events
+
+##### 3. Predictive Analytics 🔮
+
+Forecasting future outcomes based on historical data is the goal of **predictive analytics**. Regression analysis, time series analysis, and other sophisticated statistical techniques are utilised.
+
+**Key Questions**: "What is likely to occur in the future?" and "What trends can we anticipate?"
+
+**Examples**:
+- Predicting sales for upcoming quarter
+- Forecasting customer churn
+- Weather predictions
+- Stock market forecasts
+- Demand forecasting
+
+**Characteristics**:
+- Looks to the future
+- Uses historical data patterns
+- Employs advanced statistical techniques
+- Regression analysis, time series analysis
+- Machine learning models
+
+##### 4. Prescriptive Analytics 💡
+
+The highest level of data analytics is **prescriptive analytics**. In addition to making future predictions, it makes recommendations for different actions. It can give advice and provide solutions to problems.
+
+**Key Questions**: "What should we do to achieve our goals?"
+
+**Examples**:
+- Optimizing delivery routes to save time and fuel
+- Recommending marketing strategies
+- Resource allocation optimization
+- Risk management recommendations
+- Pricing optimization
+
+**Characteristics**:
+- Highest complexity level
+- Provides recommendations
+- Uses complex event processing
+- Decision trees, simulation, optimization methods
+- Actionable insights
+
+#### 🎯 Analytics Hierarchy Diagram
+
+<div class="mermaid">
+graph TD
+    A[Prescriptive Analytics<br/>💡<br/>What should we do?<br/>Highest Complexity] --> B[Predictive Analytics<br/>🔮<br/>What will happen?<br/>Future Forecasting]
+    B --> C[Diagnostic Analytics<br/>🔍<br/>Why did it happen?<br/>Root Cause Analysis]
+    C --> D[Descriptive Analytics<br/>📈<br/>What happened?<br/>Most Basic]
+    
+    style A fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style B fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+</div>
+
+#### 🔄 Analytics Progression Flow
+
+<div class="mermaid">
+flowchart LR
+    Past[Past Events<br/>Historical Data] --> Desc[Descriptive<br/>What Happened?<br/>📈]
+    Desc --> Diag[Diagnostic<br/>Why Did It Happen?<br/>🔍]
+    Diag --> Pred[Predictive<br/>What Will Happen?<br/>🔮]
+    Pred --> Presc[Prescriptive<br/>What Should We Do?<br/>💡]
+    Presc --> Future[Future Actions<br/>Optimized Decisions]
+    
+    style Past fill:#E0E0E0,stroke:#757575,stroke-width:2px
+    style Desc fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style Diag fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Pred fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style Presc fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Future fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 📋 Analytics Levels Comparison
+
+| Level | Question | Focus | Complexity | Techniques | Example |
+|-------|----------|-------|------------|------------|---------|
+| **Descriptive** | What happened? | Past events | Low | Aggregation, summarization | Monthly sales report |
+| **Diagnostic** | Why did it happen? | Root causes | Medium | Statistical analysis, correlation | Investigating sales decline |
+| **Predictive** | What will happen? | Future outcomes | High | Regression, time series, ML | Sales forecast for next quarter |
+| **Prescriptive** | What should we do? | Recommendations | Very High | Optimization, simulation, decision trees | Optimize delivery routes |
+
+#### 🎨 Analytics Value Pyramid
+
+<div class="mermaid">
+graph TB
+    subgraph "Value & Complexity"
+        P1[Prescriptive Analytics<br/>Highest Value<br/>Most Complex<br/>💡]
+        P2[Predictive Analytics<br/>High Value<br/>Complex<br/>🔮]
+        P3[Diagnostic Analytics<br/>Medium Value<br/>Moderate Complexity<br/>🔍]
+        P4[Descriptive Analytics<br/>Foundation Value<br/>Basic Complexity<br/>📈]
+    end
+    
+    P4 --> P3
+    P3 --> P2
+    P2 --> P1
+    
+    style P1 fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style P2 fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style P3 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style P4 fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+</div>
+
+#### 💡 Key Insights
+
+<div class="important-info">
+**Foundation to Advanced**: The four levels form a hierarchy where each level builds upon the previous one. Descriptive analytics provides the foundation, diagnostic explains the past, predictive looks to the future, and prescriptive provides actionable recommendations.
+
+**Increasing Complexity**: As you move from descriptive to prescriptive analytics, both the complexity and the value of insights increase. However, each level serves an important purpose in data-driven decision-making.
+
+**Complementary Use**: Organizations typically use multiple levels simultaneously. Descriptive analytics provides context, diagnostic explains issues, predictive forecasts trends, and prescriptive optimizes actions.
+</div>
+
+#### 🔍 Exploratory Data Analysis (EDA)
+
+EDA is a data analysis method that focuses on visual, intuitive techniques. This method frequently comes before formal statistical modelling and is used to look for patterns and anomalies, test theories, and validate presumptions about the statistical model of choice. The first two levels of data analytics, **descriptive** and **diagnostic analytics**, are where EDA primarily fits in.
+
+##### 📊 EDA Overview
+
+**Purpose**: To get a sense of what the data can tell us by exploring and understanding the data before formal modeling.
+
+**Key Characteristics**:
+- Visual and intuitive techniques
+- Performed before formal statistical modeling
+- Identifies patterns and anomalies
+- Tests theories and validates assumptions
+- Prepares data for advanced analytics
+
+##### 🎯 EDA Techniques
+
+**1. Early Stage EDA - Descriptive Analytics** 📈
+
+Analysts summarise the key characteristics of the data during the early stages of EDA. This includes:
+
+**Measures of Central Tendency**:
+- **Mean**: Average value
+- **Median**: Middle value
+- **Mode**: Most frequent value
+
+**Measures of Dispersion**:
+- **Range**: Difference between max and min
+- **Variance**: Measure of spread
+- **Standard Deviation**: Square root of variance
+
+**Data Distribution Visualisations**:
+- **Histograms**: Show frequency distribution
+- **Box Plots**: Display quartiles and outliers
+- **Bar Charts**: Compare categories
+- **Summary Statistics**: Numerical summaries
+
+**2. Advanced EDA - Diagnostic Analytics** 🔍
+
+As the EDA process progresses, analysts delve deeper into relationships and causes:
+
+**Relationship Analysis**:
+- **Scatter Plots**: Understand relationships between variables
+- **Correlation Analysis**: Measure strength of relationships
+- **Heatmaps**: Visualize correlation matrices
+
+**Pattern Discovery**:
+- **Grouping Data**: Discover patterns through segmentation
+- **Anomaly Detection**: Identify outliers and unusual patterns
+- **Trend Analysis**: Identify trends over time
+
+**Root Cause Investigation**:
+- **Comparative Analysis**: Compare different groups
+- **Drill-down Analysis**: Investigate specific anomalies
+- **Hypothesis Testing**: Test assumptions about data
+
+##### 🔄 EDA Workflow
+
+<div class="mermaid">
+flowchart TD
+    Start([Start EDA]) --> Load[Load Data]
+    Load --> Initial[Initial Exploration]
+    
+    Initial --> Desc[Descriptive Analytics<br/>📈<br/>Summarize Characteristics]
+    Desc --> Central[Central Tendency<br/>Mean, Median, Mode]
+    Desc --> Dispersion[Dispersion<br/>Range, Variance, Std Dev]
+    Desc --> Visual[Distribution Visualizations<br/>Histograms, Box Plots]
+    
+    Visual --> Diag[Diagnostic Analytics<br/>🔍<br/>Investigate Relationships]
+    Diag --> Scatter[Scatter Plots<br/>Relationships]
+    Diag --> Group[Group Data<br/>Pattern Discovery]
+    Diag --> Anomaly[Anomaly Detection<br/>Outliers]
+    
+    Anomaly --> Validate[Validate Assumptions]
+    Validate --> Prepare[Prepare for Advanced Analytics]
+    
+    Prepare --> Predictive[Predictive Analytics<br/>🔮<br/>Feature Engineering]
+    Prepare --> Prescriptive[Prescriptive Analytics<br/>💡<br/>Decision Scenarios]
+    
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style Load fill:#95E1D3,stroke:#4ECDC4,stroke-width:2px
+    style Initial fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Desc fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style Central fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style Dispersion fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style Visual fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style Diag fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Scatter fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Group fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Anomaly fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Validate fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style Prepare fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Predictive fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style Prescriptive fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+##### 🎨 EDA in Analytics Hierarchy
+
+<div class="mermaid">
+graph TB
+    subgraph "EDA Primary Focus"
+        Desc[Descriptive Analytics<br/>📈<br/>Summarize Data]
+        Diag[Diagnostic Analytics<br/>🔍<br/>Investigate Causes]
+    end
+    
+    subgraph "EDA Prepares For"
+        Pred[Predictive Analytics<br/>🔮<br/>Feature Engineering]
+        Presc[Prescriptive Analytics<br/>💡<br/>Decision Scenarios]
+    end
+    
+    Desc --> Diag
+    Desc --> Pred
+    Diag --> Pred
+    Desc --> Presc
+    Diag --> Presc
+    
+    style Desc fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style Diag fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Pred fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style Presc fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+##### 📋 EDA Techniques Summary
+
+| Stage | Analytics Level | Techniques | Purpose |
+|-------|----------------|------------|---------|
+| **Early EDA** | Descriptive | Mean, Median, Mode, Range, Variance, Histograms, Box Plots | Summarize key characteristics |
+| **Advanced EDA** | Diagnostic | Scatter Plots, Correlation, Grouping, Anomaly Detection | Investigate relationships and causes |
+| **Preparation** | Predictive/Prescriptive | Feature Engineering, Pattern Recognition | Prepare for advanced analytics |
+
+##### 🔬 EDA Process Steps
+
+<div class="mermaid">
+flowchart LR
+    A[1. Load Data] --> B[2. Initial Exploration]
+    B --> C[3. Descriptive Statistics]
+    C --> D[4. Visualizations]
+    D --> E[5. Identify Patterns]
+    E --> F[6. Detect Anomalies]
+    F --> G[7. Investigate Relationships]
+    G --> H[8. Validate Assumptions]
+    H --> I[9. Document Findings]
+    I --> J[10. Prepare for Modeling]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#95E1D3,stroke:#4ECDC4,stroke-width:2px
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style G fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style H fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style I fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+    style J fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+##### 💡 Key Insights
+
+<div class="key-concept">
+**Primary Focus**: EDA primarily fits into descriptive and diagnostic analytics levels. It helps summarize data characteristics and investigate relationships and causes.
+
+**Foundation for Advanced Analytics**: While EDA's main objective aligns with descriptive and diagnostic analytics, it also prepares for predictive and prescriptive analytics. Understanding data patterns and anomalies through EDA greatly influences feature engineering for predictive analytics and decision-making scenarios for prescriptive analytics.
+
+**Visual and Intuitive**: EDA emphasizes visual techniques that make data exploration intuitive and accessible, helping analysts understand data before formal modeling.
+
+**Iterative Process**: EDA is an iterative process where initial exploration leads to deeper investigation, which then informs further exploration and analysis.
+</div>
+
+#### 📚 What Did I Learn in This Lesson?
+
+This lesson provided comprehensive insights into the field of data analysis. Here's a summary of the key learnings:
+
+##### 🎯 Key Learning Points
+
+**1. Various Aspects of Data Analysis** 🌐
+
+Data analysis is a multifaceted discipline that involves:
+- Transforming raw data into actionable insights
+- Using specialized tools and software
+- Connecting multiple fields: programming, ML, statistics, visualization, BI, and big data
+- Applying different types of analysis: text, statistical, diagnostic, predictive, and data mining
+
+**2. Roles and Responsibilities** 👥
+
+- There are **eight key roles** within the field of data analysis:
+  - Data Analyst, Data Scientist, Data Engineer
+  - Business Intelligence Analyst, Data Architect
+  - Statistician, Machine Learning Engineer
+  - Data Visualization Specialist
+- These roles might be named differently in different organisations
+- A single individual may fulfil more than one of these roles, especially in smaller organizations
+- Each role has specific responsibilities but collaboration is essential
+
+**3. Hard and Soft Skills** 🎓
+
+A data analyst requires various skills:
+
+**Hard Skills** (Technical):
+- Mathematical and statistical skills
+- Programming skills (Python, R, SQL)
+- Database management/SQL
+- Data visualization skills
+- Data cleaning/wrangling knowledge
+
+**Soft Skills** (Interpersonal):
+- Analytical skills
+- Problem-solving skills
+- Communication skills
+- Business/industry understanding
+
+Both skill types are essential and complement each other.
+
+**4. Daily Tasks and Activities** 📅
+
+A data analyst may be required to perform various tasks on any given day:
+- Email management and planning
+- Team meetings and collaboration
+- Data retrieval using SQL
+- Data validation and cleaning
+- Data analysis using Python/Pandas
+- Creating visualizations with Tableau
+- Report writing and delivery
+- Cross-team collaboration
+- Project preparation and planning
+
+**5. Four Primary Levels of Data Analysis** 📊
+
+The four primary levels form a hierarchy:
+1. **Descriptive Analytics** - "What happened?" (Foundation)
+2. **Diagnostic Analytics** - "Why did it happen?" (Root cause)
+3. **Predictive Analytics** - "What will happen?" (Forecasting)
+4. **Prescriptive Analytics** - "What should we do?" (Recommendations)
+
+Complexity and value increase from descriptive to prescriptive analytics.
+
+**6. Exploratory Data Analysis (EDA)** 🔍
+
+Exploratory data analysis allows a data analyst to:
+- Test hypotheses and check assumptions
+- Discover patterns and anomalies
+- Summarize data characteristics (descriptive)
+- Investigate relationships and causes (diagnostic)
+- Prepare data for advanced analytics (predictive/prescriptive)
+
+EDA primarily fits into descriptive and diagnostic analytics but serves as foundation for higher levels.
+
+#### 🎨 Lesson Overview Diagram
+
+<div class="mermaid">
+mindmap
+  root((Data Analysis<br/>Introduction))
+    Aspects
+      Multiple Fields
+      Tools & Software
+      Analysis Types
+      Interdisciplinary
+    Roles
+      Data Analyst
+      Data Scientist
+      Data Engineer
+      BI Analyst
+      Data Architect
+      Statistician
+      ML Engineer
+      Visualization Specialist
+    Skills
+      Hard Skills
+        Math & Statistics
+        Programming
+        Database/SQL
+        Visualization
+        Data Cleaning
+      Soft Skills
+        Analytical
+        Problem-Solving
+        Communication
+        Business Understanding
+    Daily Tasks
+      Email & Planning
+      Meetings
+      Data Retrieval
+      Analysis
+      Visualization
+      Reporting
+      Collaboration
+    Analytics Levels
+      Descriptive
+      Diagnostic
+      Predictive
+      Prescriptive
+    EDA
+      Visual Techniques
+      Pattern Discovery
+      Hypothesis Testing
+      Assumption Validation
+</div>
+
+#### 📋 Lesson Summary Checklist
+
+<div class="mermaid">
+flowchart TD
+    Start([Lesson Complete]) --> L1[✓ Understand Data Analysis Aspects]
+    L1 --> L2[✓ Know Roles & Responsibilities]
+    L2 --> L3[✓ Identify Required Skills]
+    L3 --> L4[✓ Understand Daily Tasks]
+    L4 --> L5[✓ Learn Analytics Levels]
+    L5 --> L6[✓ Master EDA Techniques]
+    L6 --> Ready([Ready for Next Lesson])
+    
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style L1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style L2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style L3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style L4 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style L5 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style L6 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Ready fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 💡 Reflection Questions
+
+<div class="important-info">
+**Test Your Understanding**:
+1. Can you explain the difference between descriptive and prescriptive analytics?
+2. What are the key hard and soft skills needed for a data analyst?
+3. How does EDA relate to the four levels of data analysis?
+4. Why might roles overlap in smaller organizations?
+5. How do the four analytics levels build upon each other?
+</div>
+
+#### 📝 The Task
+
+In this lesson, you learnt about the fundamental roles in the field of data analysis, the various hard and soft skills required by data analysts and the different types of analysis which may be performed. For today's lesson task, you need to consider your goals in data analysis.
+
+##### 🎯 Self-Reflection Exercise
+
+This is a bit of self-reflection to help you with your first step on your journey to becoming a data analyst. Take some time to think about and answer the following questions:
+
+**1. Your Motivation** 💭
+- Why are you pursuing this type of career?
+- What interests you about data analysis?
+- What problems do you want to solve with data?
+
+**2. Your Current Skill Set** 📊
+- **Hard Skills**: Where do you currently see your technical skills?
+  - Mathematical and statistical skills
+  - Programming skills (Python, R, SQL)
+  - Database management
+  - Data visualization
+  - Data cleaning/wrangling
+- **Soft Skills**: How would you rate your interpersonal skills?
+  - Analytical thinking
+  - Problem-solving
+  - Communication
+  - Business understanding
+
+**3. Your Role Aspiration** 👥
+- What role do you see yourself fulfilling in data analysis?
+  - Data Analyst
+  - Data Scientist
+  - Data Engineer
+  - Business Intelligence Analyst
+  - Data Architect
+  - Statistician
+  - Machine Learning Engineer
+  - Data Visualization Specialist
+- Why does this role appeal to you?
+
+**4. Your Analytics Interest** 📈
+- What level of analysis sounds the most interesting to you?
+  - Descriptive Analytics (What happened?)
+  - Diagnostic Analytics (Why did it happen?)
+  - Predictive Analytics (What will happen?)
+  - Prescriptive Analytics (What should we do?)
+- Why are you drawn to this level?
+
+##### 🗺️ Your Data Analysis Journey
+
+<div class="mermaid">
+flowchart TD
+    Start([Start Your Journey]) --> Reflect[Self-Reflection<br/>Assess Skills & Goals]
+    Reflect --> Identify[Identify Your Path<br/>Role & Analytics Level]
+    Identify --> Learn[Learn & Practice<br/>Build Skills]
+    Learn --> Apply[Apply Knowledge<br/>Real Projects]
+    Apply --> Grow[Grow & Specialize<br/>Advanced Skills]
+    Grow --> Achieve[Achieve Your Goals<br/>Career Success]
+    
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style Reflect fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Identify fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Learn fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style Apply fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Grow fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style Achieve fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+##### 📋 Skills Assessment Template
+
+<div class="key-concept">
+**Rate Your Current Skills (1-5 scale)**:
+
+**Hard Skills:**
+- Mathematical/Statistical Skills: ⭐⭐⭐⭐⭐
+- Programming (Python/R/SQL): ⭐⭐⭐⭐⭐
+- Database Management: ⭐⭐⭐⭐⭐
+- Data Visualization: ⭐⭐⭐⭐⭐
+- Data Cleaning/Wrangling: ⭐⭐⭐⭐⭐
+
+**Soft Skills:**
+- Analytical Thinking: ⭐⭐⭐⭐⭐
+- Problem-Solving: ⭐⭐⭐⭐⭐
+- Communication: ⭐⭐⭐⭐⭐
+- Business Understanding: ⭐⭐⭐⭐⭐
+
+**Areas for Growth:**
+- [ ] Identify 2-3 skills you want to develop
+- [ ] Set specific learning goals
+- [ ] Plan your skill development path
+</div>
+
+##### 🎨 Role Interest Assessment
+
+<div class="mermaid">
+pie title Which Role Interests You Most?
+    "Data Analyst" : 25
+    "Data Scientist" : 20
+    "Data Engineer" : 15
+    "BI Analyst" : 10
+    "Data Architect" : 8
+    "Statistician" : 7
+    "ML Engineer" : 10
+    "Visualization Specialist" : 5
+</div>
+
+##### 📊 Analytics Level Interest
+
+<div class="mermaid">
+graph LR
+    A[Your Interest] --> B{Which Level?}
+    B -->|Foundation| C[Descriptive<br/>📈<br/>Understanding Past]
+    B -->|Investigation| D[Diagnostic<br/>🔍<br/>Finding Causes]
+    B -->|Forecasting| E[Predictive<br/>🔮<br/>Predicting Future]
+    B -->|Optimization| F[Prescriptive<br/>💡<br/>Recommending Actions]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style C fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style F fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+##### 💬 Share Your Reflection
+
+<div class="important-info">
+**Remember**: You aren't on this journey alone! 
+
+Feel free to share your reflection in your class group's Teams channel to:
+- Hear what your fellow students have to say
+- Learn from others' perspectives
+- Build connections with classmates
+- Get support and encouragement
+- Exchange ideas and insights
+
+**What to Share:**
+- Your motivation for pursuing data analysis
+- Your current skill assessment
+- Your role and analytics level interests
+- Your learning goals
+- Any questions or concerns you have
+</div>
+
+##### ✍️ Reflection Template
+
+Use this template to structure your reflection:
+
+```
+**My Data Analysis Journey Reflection**
+
+**1. My Motivation:**
+[Why are you pursuing this career?]
+
+**2. My Current Skills:**
+- Hard Skills: [Rate and describe]
+- Soft Skills: [Rate and describe]
+
+**3. My Role Interest:**
+[Which role appeals to you and why?]
+
+**4. My Analytics Interest:**
+[Which level of analysis interests you most?]
+
+**5. My Learning Goals:**
+[What skills do you want to develop?]
+
+**6. My Questions:**
+[What would you like to learn more about?]
+```
+
+#### 📚 Exam Preparation: What's Important for the Exam
+
+Based on this lesson, here are the **critical concepts and information** you need to know for your exam:
+
+##### 🎯 Core Definitions (Must Know)
+
+**Data Analysis**: The discipline focused on drawing insightful conclusions from data. It involves methods and tools for gathering unprocessed data and turning it into information that can help with decision-making.
+
+**Exploratory Data Analysis (EDA)**: A data analysis method that focuses on visual, intuitive techniques used before formal statistical modeling to look for patterns and anomalies, test theories, and validate assumptions.
+
+##### 📊 The Four Levels of Analytics (Critical Distinction)
+
+You **MUST** be able to distinguish between these four levels:
+
+| Level | Question | Focus | Complexity | Key Characteristics | Examples |
+|-------|----------|-------|------------|-------------------|----------|
+| **Descriptive** | "What happened?" | Past events | Low | Summarizes historical data, identifies patterns | Monthly sales report, website traffic statistics, social media metrics, revenue summaries |
+| **Diagnostic** | "Why did it happen?" | Root causes | Medium | Investigates causes, uses statistical techniques | Investigating sales decline, root cause analysis, correlation analysis, identifying factors affecting performance |
+| **Predictive** | "What will happen?" | Future outcomes | High | Forecasts based on historical data, uses ML/regression | Sales forecast for next quarter, customer churn prediction, weather forecasting, demand forecasting |
+| **Prescriptive** | "What should we do?" | Recommendations | Very High | Provides actionable recommendations, uses optimization | Optimize delivery routes, recommend marketing strategies, resource allocation optimization, pricing optimization |
+
+**Exam Tip**: Be able to identify which level is being described in a scenario or example.
+
+##### 🎨 Visual Examples of Each Analytics Level
+
+**1. Descriptive Analytics - "What happened?"**
+
+<div class="mermaid">
+graph LR
+    A[Historical Data<br/>Q1-Q4 Sales] --> B[Calculate Metrics]
+    B --> C[Total Sales: $2.5M<br/>Avg Monthly: $625K<br/>Best Month: December]
+    C --> D[Visualization<br/>Bar Chart]
+    D --> E[Report: What Happened<br/>📊]
+    
+    style A fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style B fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style C fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style D fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style E fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+**Example**: A retail store analyzes last year's sales data and creates a report showing:
+- Total annual revenue: $2.5 million
+- Best performing month: December ($350K)
+- Worst performing month: February ($180K)
+- Average monthly sales: $208K
+
+**2. Diagnostic Analytics - "Why did it happen?"**
+
+<div class="mermaid">
+flowchart TD
+    A[Problem: Sales Dropped 30%<br/>in Q3] --> B[Collect Data]
+    B --> C[Compare Variables]
+    C --> D{Investigate Causes}
+    D --> E[Marketing Budget<br/>Reduced 40%]
+    D --> F[Competitor Launched<br/>New Product]
+    D --> G[Seasonal Factors<br/>Summer Slump]
+    E --> H[Root Cause Found:<br/>Marketing Reduction]
+    F --> H
+    G --> H
+    H --> I[Report: Why It Happened<br/>🔍]
+    
+    style A fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style G fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style I fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+**Example**: After noticing a 30% sales drop in Q3, the analyst investigates and finds:
+- Marketing budget was reduced by 40% in the same period
+- Strong correlation (r=0.85) between marketing spend and sales
+- Competitor launched a similar product in July
+- **Conclusion**: The sales drop was primarily caused by reduced marketing investment
+
+**3. Predictive Analytics - "What will happen?"**
+
+<div class="mermaid">
+graph TD
+    A[Historical Data<br/>2019-2024 Sales] --> B[Build ML Model]
+    B --> C[Train on Past Patterns]
+    C --> D[Time Series Analysis]
+    D --> E[Regression Model]
+    E --> F[Forecast Next Quarter]
+    F --> G[Prediction: Q1 2025<br/>Sales: $650K ± $50K<br/>Confidence: 85%]
+    G --> H[Report: What Will Happen<br/>🔮]
+    
+    style A fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style B fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style C fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style D fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style E fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style F fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+**Example**: Using 5 years of sales data, the analyst builds a predictive model that forecasts:
+- **Q1 2025 Sales**: $650,000 (with 85% confidence interval of $600K-$700K)
+- **Trend**: Upward trajectory expected based on seasonal patterns
+- **Risk Factors**: Economic indicators suggest potential 10% variance
+
+**4. Prescriptive Analytics - "What should we do?"**
+
+<div class="mermaid">
+flowchart TD
+    A[Goal: Maximize Profit<br/>Minimize Costs] --> B[Current Situation]
+    B --> C[Multiple Scenarios]
+    C --> D[Scenario 1:<br/>Increase Price 10%<br/>Profit: +$50K<br/>Risk: -15% Sales]
+    C --> E[Scenario 2:<br/>Optimize Routes<br/>Cost: -$30K<br/>Time: -20%]
+    C --> F[Scenario 3:<br/>Bundle Products<br/>Profit: +$40K<br/>Risk: Low]
+    D --> G[Optimization Algorithm]
+    E --> G
+    F --> G
+    G --> H[Recommendation:<br/>Implement Scenario 2 + 3<br/>Expected ROI: 25%]
+    H --> I[Action Plan: What Should We Do<br/>💡]
+    
+    style A fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style D fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style F fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style G fill:#9B59B6,stroke:#6C3483,stroke-width:3px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style I fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+**Example**: To maximize profit, the system analyzes multiple options:
+- **Option 1**: Increase prices by 10% → +$50K profit but -15% sales risk
+- **Option 2**: Optimize delivery routes → -$30K costs, -20% delivery time
+- **Option 3**: Bundle products → +$40K profit, low risk
+- **Recommendation**: Implement Option 2 + Option 3 together
+- **Expected Result**: 25% ROI increase with manageable risk
+
+##### 📈 Real-World Scenario Comparison
+
+<div class="mermaid">
+graph TB
+    subgraph "Business Problem: Declining Customer Retention"
+        Problem[Customer Churn Rate<br/>Increased to 25%]
+    end
+    
+    subgraph "Descriptive Analytics 📈"
+        Desc[What Happened?<br/>Report shows:<br/>- Churn rate: 25%<br/>- Most churn in Q3<br/>- 60% are premium users]
+    end
+    
+    subgraph "Diagnostic Analytics 🔍"
+        Diag[Why Did It Happen?<br/>Analysis reveals:<br/>- Price increase caused churn<br/>- Support response time ↑<br/>- Competitor offers better value]
+    end
+    
+    subgraph "Predictive Analytics 🔮"
+        Pred[What Will Happen?<br/>Model predicts:<br/>- Churn will reach 30%<br/>- Revenue loss: $500K<br/>- If no action taken]
+    end
+    
+    subgraph "Prescriptive Analytics 💡"
+        Presc[What Should We Do?<br/>Recommendations:<br/>1. Reduce price for loyal customers<br/>2. Improve support response time<br/>3. Add value-added features<br/>Expected: Churn ↓ to 15%]
+    end
+    
+    Problem --> Desc
+    Desc --> Diag
+    Diag --> Pred
+    Pred --> Presc
+    
+    style Problem fill:#E74C3C,stroke:#C0392B,stroke-width:3px,color:#fff
+    style Desc fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style Diag fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Pred fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style Presc fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+##### 👥 Key Roles in Data Analysis (Know the Differences)
+
+You should be able to **identify and distinguish** between these roles:
+
+1. **Data Analyst**: Gathers, organizes, analyzes data statistically; interprets data and delivers reports
+2. **Data Scientist**: Uses algorithms and predictive models; creates AI systems with machine learning
+3. **Data Engineer**: Sets up big data infrastructure; designs, builds, integrates data from sources
+4. **Business Intelligence Analyst**: Analyzes data to identify business/market trends; creates reports and dashboards
+5. **Data Architect**: Designs and manages high-level structures in data ecosystem (design focus)
+6. **Statistician**: Uses statistical methods to gather/analyze data; plans surveys and experiments
+7. **Machine Learning Engineer**: Creates and maintains ML platforms; develops autonomous systems
+8. **Data Visualization Specialist**: Turns complex findings into visual presentations; creates dashboards and charts
+
+**Exam Tip**: Questions may ask you to match role descriptions to role names, or identify which role performs specific tasks.
+
+##### 📋 Role Examples and Scenarios
+
+**1. Data Analyst** 📊
+
+**Example Scenario**: A retail company wants to understand their Q4 sales performance.
+
+**Tasks**:
+- Gathers sales data from the database using SQL queries
+- Calculates total revenue: $2.5M (up 15% from Q3)
+- Identifies top-selling products: Electronics (40%), Clothing (35%), Home (25%)
+- Creates a statistical summary: average order value, customer demographics
+- Delivers a report: "Q4 Sales Analysis Report" with findings and recommendations
+
+**Key Output**: Statistical reports, data summaries, trend analysis
+
+**2. Data Scientist** 🔬
+
+**Example Scenario**: An e-commerce company wants to predict which customers are likely to churn.
+
+**Tasks**:
+- Builds a machine learning model using historical customer data
+- Trains a predictive algorithm (Random Forest) on 100,000 customer records
+- Creates an AI system that scores each customer's churn probability (0-100%)
+- Identifies key factors: low purchase frequency, no engagement with emails, negative reviews
+- Deploys model that predicts: "Customer #12345 has 85% churn risk"
+
+**Key Output**: Predictive models, AI systems, ML algorithms
+
+**3. Data Engineer** ⚙️
+
+**Example Scenario**: A company needs to integrate data from 5 different sources into a data warehouse.
+
+**Tasks**:
+- Sets up Hadoop cluster for big data processing
+- Designs ETL pipeline to extract data from: CRM, ERP, website, mobile app, social media
+- Builds data integration system that processes 10TB of data daily
+- Ensures data is accessible and performance-optimized
+- Creates automated data pipeline that runs every hour
+
+**Key Output**: Data pipelines, infrastructure, data warehouses, ETL systems
+
+**4. Business Intelligence Analyst** 💼
+
+**Example Scenario**: A company's executives need to understand market trends and competitive position.
+
+**Tasks**:
+- Analyzes market data to identify trends: "E-commerce growing 25% YoY"
+- Gathers data from industry reports, competitor analysis, internal metrics
+- Creates executive dashboard showing: market share (15%), growth rate, competitor comparison
+- Identifies opportunity: "Untapped market segment in 25-35 age group"
+- Presents findings to C-suite: "Market Position Report Q1 2025"
+
+**Key Output**: Business reports, executive dashboards, market analysis
+
+**5. Data Architect** 🏗️
+
+**Example Scenario**: A company is planning a new data infrastructure to support analytics.
+
+**Tasks**:
+- Designs high-level data architecture: "3-tier architecture with data lake, warehouse, and marts"
+- Creates framework for data governance and security
+- Plans data flow: "Raw data → Staging → Cleansed → Analytics → Reporting"
+- Designs schema for 50+ data sources
+- Creates blueprint for data engineers to implement
+
+**Key Output**: Architecture blueprints, system designs, data frameworks
+
+**6. Statistician** 📈
+
+**Example Scenario**: A pharmaceutical company needs to test if a new drug is effective.
+
+**Tasks**:
+- Designs randomized controlled trial with 1,000 participants
+- Plans survey methodology: control group vs treatment group
+- Uses statistical methods: hypothesis testing, p-values, confidence intervals
+- Analyzes results: "Drug shows 30% improvement (p < 0.01, 95% CI)"
+- Makes statistical inference: "Drug is significantly more effective than placebo"
+
+**Key Output**: Statistical analysis, experimental designs, survey results
+
+**7. Machine Learning Engineer** 🤖
+
+**Example Scenario**: A company wants to deploy a recommendation system for their website.
+
+**Tasks**:
+- Creates ML platform infrastructure using TensorFlow and Kubernetes
+- Develops recommendation algorithm that learns from user behavior
+- Builds system that processes 1M requests/day in real-time
+- Maintains and monitors model performance (accuracy, latency)
+- Implements A/B testing framework for model improvements
+
+**Key Output**: ML platforms, deployed models, autonomous systems
+
+**8. Data Visualization Specialist** 🎨
+
+**Example Scenario**: Complex data analysis results need to be presented to non-technical stakeholders.
+
+**Tasks**:
+- Takes statistical findings from data scientist
+- Creates interactive Tableau dashboard with 10+ visualizations
+- Designs charts: sales trends (line), product distribution (pie), regional performance (map)
+- Makes complex data accessible: "Revenue increased 25% - shown as clear bar chart"
+- Produces presentation-ready visualizations for board meeting
+
+**Key Output**: Dashboards, charts, visual presentations, infographics
+
+##### 🎨 Role Comparison: Same Problem, Different Approaches
+
+<div class="mermaid">
+graph TB
+    subgraph "Business Problem: Improve Customer Retention"
+        Problem[Customer Churn Rate: 30%<br/>Need to Reduce to 15%]
+    end
+    
+    subgraph "Data Analyst 📊"
+        DA[Analyzes historical churn data<br/>Creates report: Who churned?<br/>When? What products?]
+    end
+    
+    subgraph "Data Scientist 🔬"
+        DS[Builds ML model to predict churn<br/>Identifies at-risk customers<br/>Churn probability scores]
+    end
+    
+    subgraph "Data Engineer ⚙️"
+        DE[Sets up data pipeline<br/>Integrates customer data sources<br/>Ensures real-time data access]
+    end
+    
+    subgraph "BI Analyst 💼"
+        BI[Analyzes market trends<br/>Competitor retention strategies<br/>Business recommendations]
+    end
+    
+    subgraph "Data Architect 🏗️"
+        DArch[Designs customer data architecture<br/>Plans data warehouse structure<br/>Creates data framework]
+    end
+    
+    subgraph "Statistician 📈"
+        Stat[Designs A/B test for retention<br/>Statistical significance testing<br/>Confidence intervals]
+    end
+    
+    subgraph "ML Engineer 🤖"
+        MLE[Deploys churn prediction model<br/>Creates ML platform<br/>Monitors model performance]
+    end
+    
+    subgraph "Visualization Specialist 🎨"
+        DV[Creates retention dashboard<br/>Visualizes churn patterns<br/>Executive presentation]
+    end
+    
+    Problem --> DA
+    Problem --> DS
+    Problem --> DE
+    Problem --> BI
+    Problem --> DArch
+    Problem --> Stat
+    Problem --> MLE
+    Problem --> DV
+    
+    style Problem fill:#E74C3C,stroke:#C0392B,stroke-width:3px,color:#fff
+    style DA fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style DS fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style DE fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style BI fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style DArch fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style Stat fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style MLE fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style DV fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+</div>
+
+##### 🔄 Role Workflow: How Roles Collaborate
+
+<div class="mermaid">
+flowchart LR
+    A[Data Architect<br/>🏗️<br/>Designs System] --> B[Data Engineer<br/>⚙️<br/>Builds Infrastructure]
+    B --> C[Data Sources<br/>Ready]
+    C --> D[Data Analyst<br/>📊<br/>Analyzes Data]
+    C --> E[Data Scientist<br/>🔬<br/>Builds Models]
+    C --> F[Statistician<br/>📈<br/>Statistical Tests]
+    D --> G[BI Analyst<br/>💼<br/>Business Insights]
+    E --> H[ML Engineer<br/>🤖<br/>Deploys Models]
+    F --> G
+    G --> I[Visualization Specialist<br/>🎨<br/>Creates Dashboards]
+    H --> I
+    I --> J[Decision Makers<br/>💡]
+    
+    style A fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style B fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style C fill:#95E1D3,stroke:#4ECDC4,stroke-width:2px
+    style D fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style I fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+    style J fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+</div>
+
+##### 📊 Role Responsibilities Matrix
+
+<div class="mermaid">
+graph TB
+    subgraph "Data Collection & Infrastructure"
+        DE[Data Engineer<br/>⚙️<br/>Builds pipelines<br/>Sets up infrastructure]
+        DArch[Data Architect<br/>🏗️<br/>Designs architecture<br/>Creates frameworks]
+    end
+    
+    subgraph "Data Analysis & Modeling"
+        DA[Data Analyst<br/>📊<br/>Statistical analysis<br/>Reports]
+        DS[Data Scientist<br/>🔬<br/>ML models<br/>AI systems]
+        Stat[Statistician<br/>📈<br/>Experiments<br/>Hypothesis testing]
+    end
+    
+    subgraph "Business & Visualization"
+        BI[BI Analyst<br/>💼<br/>Business insights<br/>Market trends]
+        DV[Visualization Specialist<br/>🎨<br/>Dashboards<br/>Charts]
+    end
+    
+    subgraph "ML Operations"
+        MLE[ML Engineer<br/>🤖<br/>Deploy models<br/>ML platforms]
+    end
+    
+    DArch --> DE
+    DE --> DA
+    DE --> DS
+    DE --> Stat
+    DA --> BI
+    DS --> MLE
+    Stat --> BI
+    BI --> DV
+    MLE --> DV
+    
+    style DE fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style DArch fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style DA fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style DS fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style Stat fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style BI fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style DV fill:#FFA07A,stroke:#FF6347,stroke-width:2px
+    style MLE fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+##### 🎓 Hard Skills vs Soft Skills (Critical Distinction)
+
+**Hard Skills** (Technical, quantifiable):
+- Mathematical and statistical skills
+- Programming skills (Python, R, SQL)
+- Database management/SQL
+- Data visualization skills
+- Data cleaning/wrangling knowledge
+
+**Soft Skills** (Interpersonal, personality-based):
+- Analytical skills
+- Problem-solving skills
+- Communication skills
+- Business/industry understanding
+
+**Exam Tip**: Be able to categorize skills as hard or soft, and explain why both are important.
+
+##### 🎨 Visual Comparison: Hard vs Soft Skills
+
+<div class="mermaid">
+graph TB
+    subgraph "Hard Skills 💻<br/>Technical & Quantifiable"
+        HS1[Mathematical &<br/>Statistical Skills<br/>📊<br/>Calculate mean, median<br/>Perform regression analysis]
+        HS2[Programming Skills<br/>Python, R, SQL<br/>💻<br/>Write code, automate tasks<br/>Process large datasets]
+        HS3[Database Management<br/>SQL Queries<br/>🗄️<br/>Extract data, optimize queries<br/>Manage data systems]
+        HS4[Data Visualization<br/>Tableau, PowerBI<br/>📈<br/>Create charts, dashboards<br/>Design visualizations]
+        HS5[Data Cleaning<br/>Wrangling<br/>🧹<br/>Handle missing data<br/>Transform datasets]
+    end
+    
+    subgraph "Soft Skills 🤝<br/>Interpersonal & Personality-based"
+        SS1[Analytical Skills<br/>Critical Thinking<br/>🔍<br/>Examine patterns<br/>Draw conclusions]
+        SS2[Problem-Solving<br/>Troubleshooting<br/>🧩<br/>Identify issues<br/>Find solutions]
+        SS3[Communication<br/>Written & Verbal<br/>💬<br/>Explain findings<br/>Present to stakeholders]
+        SS4[Business Understanding<br/>Industry Knowledge<br/>🏢<br/>Context for data<br/>Business objectives]
+    end
+    
+    HS1 --> Success[Successful<br/>Data Analyst<br/>✅]
+    HS2 --> Success
+    HS3 --> Success
+    HS4 --> Success
+    HS5 --> Success
+    SS1 --> Success
+    SS2 --> Success
+    SS3 --> Success
+    SS4 --> Success
+    
+    style HS1 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style HS2 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style HS3 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style HS4 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style HS5 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style SS1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style SS2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style SS3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style SS4 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Success fill:#FFD700,stroke:#B8860B,stroke-width:3px
+</div>
+
+##### 📋 Real-World Examples
+
+**Hard Skills Examples:**
+
+**1. Mathematical and Statistical Skills** 📊
+
+**Example Scenario**: Analyzing customer purchase patterns
+
+**Hard Skill Application**:
+- Calculates mean order value: $125.50
+- Performs correlation analysis: Purchase frequency vs Customer lifetime value (r = 0.78)
+- Uses regression to predict: Revenue = 50 + (2.5 × Marketing Spend)
+- Applies hypothesis testing: "Is the new pricing strategy effective?" (p < 0.05)
+
+**2. Programming Skills (Python, R, SQL)** 💻
+
+**Example Scenario**: Processing 1 million customer records
+
+**Hard Skill Application**:
+```python
+# Python example
+import pandas as pd
+df = pd.read_csv('customers.csv')
+df.groupby('region')['sales'].sum()
+```
+
+```sql
+-- SQL example
+SELECT region, SUM(sales) as total_sales
+FROM customers
+GROUP BY region
+ORDER BY total_sales DESC;
+```
+
+- Writes SQL query to extract data from database
+- Uses Python to automate data processing
+- Creates script that processes 1M records in 5 minutes
+
+**3. Database Management/SQL** 🗄️
+
+**Example Scenario**: Setting up data warehouse for analytics
+
+**Hard Skill Application**:
+- Designs database schema with 20+ tables
+- Writes optimized SQL queries (execution time: 2 seconds vs 30 seconds)
+- Creates indexes to improve query performance
+- Manages data integrity and relationships
+
+**4. Data Visualization Skills** 📈
+
+**Example Scenario**: Creating executive dashboard
+
+**Hard Skill Application**:
+- Uses Tableau to create interactive dashboard
+- Designs 10+ charts: bar charts, line graphs, heatmaps
+- Implements filters and drill-down capabilities
+- Exports to PowerPoint for presentation
+
+**5. Data Cleaning/Wrangling** 🧹
+
+**Example Scenario**: Preparing messy dataset for analysis
+
+**Hard Skill Application**:
+- Handles 15,000 missing values (30% of dataset)
+- Removes 500 duplicate records
+- Standardizes date formats across 3 different formats
+- Transforms data from wide to long format
+- Validates data quality: checks for outliers, inconsistencies
+
+**Soft Skills Examples:**
+
+**1. Analytical Skills** 🔍
+
+**Example Scenario**: Interpreting complex data patterns
+
+**Soft Skill Application**:
+- Examines sales data and notices: "Sales spike every Friday"
+- Asks critical question: "Why do customers buy more on Fridays?"
+- Identifies pattern: "Email campaigns sent on Thursdays correlate with Friday sales"
+- Draws conclusion: "Email timing affects purchase behavior"
+
+**2. Problem-Solving Skills** 🧩
+
+**Example Scenario**: Data analysis reveals unexpected results
+
+**Soft Skill Application**:
+- **Problem**: Analysis shows negative correlation when positive was expected
+- **Investigation**: Checks data quality, verifies calculations, reviews methodology
+- **Solution**: Discovers data entry error in source system
+- **Resolution**: Corrects data and re-runs analysis with accurate results
+
+**3. Communication Skills** 💬
+
+**Example Scenario**: Presenting technical findings to non-technical executives
+
+**Soft Skill Application**:
+- **Technical finding**: "The model shows a 0.85 correlation coefficient"
+- **Communication**: "Our analysis shows a strong relationship (85%) between marketing spend and sales"
+- **Presentation**: Uses simple language, visual aids, and real-world examples
+- **Result**: Executives understand and can make decisions based on findings
+
+**4. Business/Industry Understanding** 🏢
+
+**Example Scenario**: Analyzing retail sales data
+
+**Soft Skill Application**:
+- **Data shows**: Sales drop in January
+- **Business context**: "January is post-holiday season, expected sales decline"
+- **Industry knowledge**: "Retail industry typically sees 20-30% drop in January"
+- **Insight**: "Our 25% drop is within normal range, not a concern"
+- **Action**: Recommends focusing on February recovery strategies
+
+##### 🔄 How Hard and Soft Skills Work Together
+
+<div class="mermaid">
+flowchart TD
+    A[Business Problem:<br/>Sales Declining] --> B[Hard Skill: SQL Query<br/>Extract Sales Data]
+    B --> C[Hard Skill: Python Analysis<br/>Calculate Trends]
+    C --> D[Soft Skill: Analytical Thinking<br/>Identify Pattern]
+    D --> E[Soft Skill: Problem-Solving<br/>Investigate Cause]
+    E --> F[Hard Skill: Statistical Analysis<br/>Test Hypothesis]
+    F --> G[Soft Skill: Business Understanding<br/>Interpret Results]
+    G --> H[Soft Skill: Communication<br/>Present Findings]
+    H --> I[Hard Skill: Visualization<br/>Create Dashboard]
+    I --> J[Solution Implemented<br/>✅]
+    
+    style A fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style C fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style D fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style F fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style I fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style J fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+##### 📊 Skills in Action: Complete Scenario
+
+<div class="mermaid">
+graph TB
+    subgraph "Scenario: Customer Churn Analysis Project"
+        Start[Project Goal:<br/>Reduce Churn by 20%]
+    end
+    
+    subgraph "Hard Skills Applied 💻"
+        H1[SQL: Extract 100K customer records<br/>from database]
+        H2[Python: Clean data, handle<br/>15K missing values]
+        H3[Statistics: Calculate churn rate<br/>25%, correlation analysis]
+        H4[ML: Build predictive model<br/>85% accuracy]
+        H5[Tableau: Create churn dashboard<br/>with 8 visualizations]
+    end
+    
+    subgraph "Soft Skills Applied 🤝"
+        S1[Analytical: Identify that premium<br/>users churn more]
+        S2[Problem-Solving: Debug model<br/>performance issues]
+        S3[Communication: Present findings<br/>to C-suite executives]
+        S4[Business Understanding: Recommend<br/>retention strategies]
+    end
+    
+    Start --> H1
+    H1 --> H2
+    H2 --> H3
+    H3 --> S1
+    S1 --> H4
+    H4 --> S2
+    S2 --> H5
+    H5 --> S3
+    S3 --> S4
+    S4 --> Success[Result: Churn Reduced<br/>to 18% ✅]
+    
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style H1 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style H2 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style H3 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style H4 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style H5 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style S1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style S2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style S3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style S4 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Success fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+##### 💡 Why Both Skills Are Important
+
+<div class="mermaid">
+mindmap
+  root((Data Analyst Success))
+    Hard Skills
+      Technical Foundation
+        Can perform analysis
+        Can use tools
+        Can process data
+      Quantifiable
+        Certifications
+        Code quality
+        Performance metrics
+    Soft Skills
+      Effective Application
+        Can explain results
+        Can solve problems
+        Can work in teams
+      Interpersonal
+        Communication
+        Collaboration
+        Business acumen
+    Combined Power
+      Technical Expertise
+        Hard skills enable
+      Effective Delivery
+        Soft skills enable
+      Complete Analyst
+        Both essential
+</div>
+
+##### 🎯 Skills Comparison Table with Examples
+
+| Skill Type | Characteristic | How Measured | Example | Why Important |
+|------------|---------------|--------------|---------|---------------|
+| **Hard Skills** | Technical, quantifiable | Certifications, tests, code reviews | Can write SQL query that extracts data in 2 seconds | Provides technical foundation to perform analysis |
+| **Soft Skills** | Interpersonal, personality-based | Performance reviews, feedback, observations | Can explain complex findings to non-technical audience | Enables effective application and collaboration |
+| **Combined** | Complementary | Project success, stakeholder satisfaction | Uses SQL (hard) to extract data, then communicates findings (soft) to executives | Both essential for successful data analyst career |
+
+##### 🔍 EDA Techniques (Know the Categories)
+
+**Early EDA (Descriptive Analytics)**:
+- Measures of central tendency: Mean, Median, Mode
+- Measures of dispersion: Range, Variance, Standard Deviation
+- Visualizations: Histograms, Box Plots, Bar Charts
+
+**Advanced EDA (Diagnostic Analytics)**:
+- Scatter Plots (relationships)
+- Correlation Analysis
+- Grouping Data (pattern discovery)
+- Anomaly Detection
+
+**Exam Tip**: Questions may ask which EDA technique is appropriate for a given scenario, or which analytics level a technique belongs to.
+
+##### 📊 EDA Techniques Visual Overview
+
+<div class="mermaid">
+graph TB
+    subgraph "Early EDA - Descriptive Analytics 📈"
+        E1[Measures of Central Tendency<br/>Mean, Median, Mode]
+        E2[Measures of Dispersion<br/>Range, Variance, Std Dev]
+        E3[Visualizations<br/>Histograms, Box Plots, Bar Charts]
+    end
+    
+    subgraph "Advanced EDA - Diagnostic Analytics 🔍"
+        A1[Scatter Plots<br/>Relationships]
+        A2[Correlation Analysis<br/>Strength of Relationships]
+        A3[Grouping Data<br/>Pattern Discovery]
+        A4[Anomaly Detection<br/>Outliers]
+    end
+    
+    E1 --> Summary[Summarize Data<br/>What Happened?]
+    E2 --> Summary
+    E3 --> Summary
+    Summary --> A1
+    Summary --> A2
+    Summary --> A3
+    Summary --> A4
+    A1 --> Investigate[Investigate Causes<br/>Why Did It Happen?]
+    A2 --> Investigate
+    A3 --> Investigate
+    A4 --> Investigate
+    
+    style E1 fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style E2 fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style E3 fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style A1 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style A2 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style A3 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style A4 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Summary fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style Investigate fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+##### 📈 Early EDA Techniques - Examples
+
+**1. Measures of Central Tendency**
+
+**Example Scenario**: Analyzing customer purchase amounts
+
+**Data**: [25, 30, 30, 35, 40, 45, 50, 50, 50, 100]
+
+**Calculations**:
+- **Mean (Average)**: (25+30+30+35+40+45+50+50+50+100) ÷ 10 = **$43.50**
+  - *Use when*: Data is normally distributed, no extreme outliers
+  - *Reveals*: Typical purchase amount
+
+- **Median (Middle value)**: [25, 30, 30, 35, **40**, 45, 50, 50, 50, 100] = **$42.50**
+  - *Use when*: Data has outliers (like the $100 purchase)
+  - *Reveals*: Middle value, less affected by outliers
+
+- **Mode (Most frequent)**: **$50** (appears 3 times)
+  - *Use when*: Finding most common value
+  - *Reveals*: Most popular purchase amount
+
+**Visual Example**:
+```
+Purchase Amounts: $25, $30, $30, $35, $40, $45, $50, $50, $50, $100
+                    ↓
+Mean: $43.50 (affected by $100 outlier)
+Median: $42.50 (middle value, robust to outliers)
+Mode: $50 (most frequent)
+```
+
+**2. Measures of Dispersion**
+
+**Example Scenario**: Comparing sales consistency across two stores
+
+**Store A Sales**: [100, 105, 110, 115, 120] (in thousands)
+**Store B Sales**: [80, 100, 110, 120, 140] (in thousands)
+
+**Calculations**:
+- **Range**: 
+  - Store A: 120 - 100 = **$20K** (consistent)
+  - Store B: 140 - 80 = **$60K** (variable)
+  
+- **Variance**:
+  - Store A: **62.5** (low variance = consistent)
+  - Store B: **400** (high variance = inconsistent)
+  
+- **Standard Deviation**:
+  - Store A: **$7.91K** (predictable sales)
+  - Store B: **$20K** (unpredictable sales)
+
+**Insight**: Store A has more consistent sales (lower dispersion), while Store B has higher variability.
+
+**3. Visualizations - Histograms**
+
+**Example Scenario**: Understanding customer age distribution
+
+**Data**: Customer ages from 18 to 65
+
+**Histogram reveals**:
+- **Peak**: Most customers are 25-35 years old
+- **Distribution**: Bell-shaped (normal distribution)
+- **Outliers**: Few customers over 60
+
+**Use case**: "What age group should we target for marketing?"
+
+**4. Visualizations - Box Plots**
+
+**Example Scenario**: Comparing product prices across categories
+
+**Box Plot shows**:
+- **Median price**: Electronics ($500), Clothing ($50), Home ($200)
+- **Quartiles**: 25th, 50th (median), 75th percentiles
+- **Outliers**: Electronics has high-value outliers ($2000+ items)
+
+**Use case**: "Which product category has the most price variation?"
+
+**5. Visualizations - Bar Charts**
+
+**Example Scenario**: Monthly sales comparison
+
+**Bar Chart shows**:
+- January: $100K
+- February: $120K
+- March: $150K
+- April: $140K
+
+**Use case**: "Which month had the highest sales?"
+
+##### 🔍 Advanced EDA Techniques - Examples
+
+**1. Scatter Plots (Relationships)**
+
+**Example Scenario**: Understanding relationship between marketing spend and sales
+
+**Data Points**:
+- Marketing $10K → Sales $50K
+- Marketing $20K → Sales $80K
+- Marketing $30K → Sales $120K
+- Marketing $40K → Sales $150K
+
+**Scatter Plot reveals**:
+- **Positive relationship**: As marketing increases, sales increase
+- **Linear pattern**: Points form a straight line
+- **Strength**: Strong relationship (points close to line)
+
+**Use case**: "Does increasing marketing budget lead to higher sales?"
+
+**2. Correlation Analysis**
+
+**Example Scenario**: Finding factors that affect customer satisfaction
+
+**Correlation Matrix**:
+| Factor | Satisfaction Score |
+|--------|-------------------|
+| Response Time | **0.85** (strong positive) |
+| Price | **-0.60** (moderate negative) |
+| Product Quality | **0.75** (strong positive) |
+| Website Speed | **0.45** (weak positive) |
+
+**Interpretation**:
+- **Response Time (0.85)**: Strong positive correlation - faster response = higher satisfaction
+- **Price (-0.60)**: Moderate negative - higher price = lower satisfaction
+- **Product Quality (0.75)**: Strong positive - better quality = higher satisfaction
+
+**Use case**: "What factors most strongly influence customer satisfaction?"
+
+**3. Grouping Data (Pattern Discovery)**
+
+**Example Scenario**: Discovering customer segments
+
+**Grouping by Purchase Behavior**:
+- **Group 1 (High Value)**: 20% of customers, 60% of revenue
+  - Characteristics: Frequent purchases, high average order value
+- **Group 2 (Regular)**: 50% of customers, 35% of revenue
+  - Characteristics: Monthly purchases, moderate spending
+- **Group 3 (Occasional)**: 30% of customers, 5% of revenue
+  - Characteristics: Rare purchases, low spending
+
+**Pattern discovered**: Small group (20%) generates most revenue (60%)
+
+**Use case**: "How should we segment customers for targeted marketing?"
+
+**4. Anomaly Detection**
+
+**Example Scenario**: Identifying fraudulent transactions
+
+**Normal Transaction Pattern**:
+- Average: $50-200
+- Frequency: 2-5 per month
+- Location: Customer's home city
+
+**Anomalies Detected**:
+- **Transaction 1**: $5,000 (25x average) → Flagged
+- **Transaction 2**: 50 transactions in 1 day → Flagged
+- **Transaction 3**: Location: Different country → Flagged
+
+**Use case**: "Which transactions are unusual and need investigation?"
+
+##### 🎯 EDA Techniques Workflow Example
+
+<div class="mermaid">
+flowchart TD
+    A[Dataset: 10,000 Customer Records] --> B[Early EDA - Descriptive]
+    
+    B --> C[Calculate Central Tendency<br/>Mean Age: 35<br/>Median Income: $50K<br/>Mode: City A]
+    B --> D[Calculate Dispersion<br/>Age Range: 18-65<br/>Income Std Dev: $15K]
+    B --> E[Create Visualizations<br/>Histogram: Age distribution<br/>Box Plot: Income by city<br/>Bar Chart: City counts]
+    
+    C --> F[Summary: What Happened?<br/>Average customer: 35 years,<br/>$50K income, lives in City A]
+    D --> F
+    E --> F
+    
+    F --> G[Advanced EDA - Diagnostic]
+    
+    G --> H[Scatter Plot<br/>Age vs Income<br/>Shows positive relationship]
+    G --> I[Correlation Analysis<br/>Age & Income: r=0.65<br/>Strong positive correlation]
+    G --> J[Grouping Data<br/>3 customer segments<br/>High/Medium/Low value]
+    G --> K[Anomaly Detection<br/>5 outliers identified<br/>Unusual patterns found]
+    
+    H --> L[Insight: Why Patterns Exist?<br/>Older customers earn more<br/>Segments have different behaviors<br/>Outliers need investigation]
+    I --> L
+    J --> L
+    K --> L
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style C fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style D fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style E fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style H fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style I fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style J fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style K fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style L fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+##### 📋 When to Use Each EDA Technique
+
+<div class="mermaid">
+graph LR
+    A[EDA Goal] --> B{What Question?}
+    
+    B -->|Summarize Data| C[Early EDA<br/>Descriptive]
+    B -->|Find Relationships| D[Advanced EDA<br/>Diagnostic]
+    
+    C --> E[Central Tendency<br/>Mean/Median/Mode]
+    C --> F[Dispersion<br/>Range/Variance/Std Dev]
+    C --> G[Visualizations<br/>Histogram/Box/Bar]
+    
+    D --> H[Scatter Plot<br/>See relationships]
+    D --> I[Correlation<br/>Measure strength]
+    D --> J[Grouping<br/>Find patterns]
+    D --> K[Anomaly Detection<br/>Find outliers]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style C fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style F fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style G fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style H fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style I fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style J fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style K fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+</div>
+
+##### 💡 Real-World EDA Scenario
+
+**Scenario**: E-commerce company wants to understand customer behavior
+
+**Step 1: Early EDA (Descriptive)**
+- **Mean purchase**: $75
+- **Median purchase**: $60 (outliers affect mean)
+- **Range**: $5 - $500
+- **Histogram**: Shows most purchases are $30-$100
+- **Bar Chart**: Electronics (40%), Clothing (35%), Home (25%)
+
+**Step 2: Advanced EDA (Diagnostic)**
+- **Scatter Plot**: Age vs Purchase Amount → Positive relationship
+- **Correlation**: Age & Purchase (r=0.65), Income & Purchase (r=0.80)
+- **Grouping**: 3 segments identified (High/Medium/Low spenders)
+- **Anomaly Detection**: 50 transactions flagged (unusual patterns)
+
+**Result**: 
+- **What happened?** (Descriptive): Average customer spends $75, mostly on electronics
+- **Why?** (Diagnostic): Older, higher-income customers spend more; 3 distinct customer segments exist
+
+##### 🎨 EDA Techniques Summary Table
+
+| Technique | Analytics Level | When to Use | Example Question | Reveals |
+|-----------|----------------|-------------|------------------|---------|
+| **Mean/Median/Mode** | Descriptive | Summarize data | "What's the typical value?" | Central value |
+| **Range/Variance** | Descriptive | Measure spread | "How consistent is the data?" | Data variability |
+| **Histogram** | Descriptive | Distribution shape | "How is data distributed?" | Frequency patterns |
+| **Box Plot** | Descriptive | Compare groups | "Which group varies more?" | Quartiles, outliers |
+| **Bar Chart** | Descriptive | Compare categories | "Which category is largest?" | Category comparison |
+| **Scatter Plot** | Diagnostic | See relationships | "Do two variables relate?" | Relationship pattern |
+| **Correlation** | Diagnostic | Measure relationship strength | "How strong is the relationship?" | Correlation coefficient |
+| **Grouping** | Diagnostic | Find patterns | "What groups exist in data?" | Segments, clusters |
+| **Anomaly Detection** | Diagnostic | Find unusual data | "What data points are unusual?" | Outliers, exceptions |
+
+##### 🔗 Key Relationships (Important Connections)
+
+**EDA and Analytics Levels**:
+- EDA primarily fits into **descriptive** and **diagnostic** analytics
+- EDA results serve as inputs to **predictive** (feature engineering) and **prescriptive** (decision scenarios) analytics
+
+**Analytics Hierarchy**:
+- Each level builds upon the previous one
+- Complexity and value increase from descriptive → prescriptive
+- All levels are important for decision-making
+
+**Roles and Skills**:
+- Different roles require different skill combinations
+- Roles often overlap in smaller organizations
+- Collaboration across roles is essential
+
+##### 📋 Exam Question Types to Expect
+
+<div class="important-info">
+**1. Definition Questions**: "What is [concept]?"
+- Be able to define key terms clearly and concisely
+
+**2. Comparison Questions**: "What is the difference between X and Y?"
+- Descriptive vs Prescriptive analytics
+- Hard skills vs Soft skills
+- Data Analyst vs Data Scientist
+
+**3. Classification Questions**: "Which analytics level does this describe?"
+- Given a scenario, identify the analytics level
+- Given a technique, identify which analytics level it belongs to
+
+**4. Role Identification**: "Which role is responsible for [task]?"
+- Match tasks to roles
+- Understand role responsibilities
+
+**5. EDA Questions**: "Which EDA technique would you use to [purpose]?"
+- Match techniques to purposes
+- Identify which analytics level EDA techniques belong to
+
+**6. Application Questions**: "In this scenario, what would a data analyst do?"
+- Apply concepts to real-world situations
+- Understand the data analysis workflow
+</div>
+
+##### 🎯 Critical Exam Topics Summary
+
+<div class="mermaid">
+mindmap
+  root((Exam Topics))
+    Analytics Levels
+      Descriptive
+        What happened
+        Past events
+        Foundation level
+      Diagnostic
+        Why happened
+        Root causes
+        Statistical techniques
+      Predictive
+        What will happen
+        Forecasting
+        ML models
+      Prescriptive
+        What should do
+        Recommendations
+        Optimization
+    Roles
+      Data Analyst
+      Data Scientist
+      Data Engineer
+      BI Analyst
+      Others
+    Skills
+      Hard Skills
+        Technical
+        Quantifiable
+      Soft Skills
+        Interpersonal
+        Personality-based
+    EDA
+      Descriptive Techniques
+      Diagnostic Techniques
+      Purpose
+      Analytics Levels
+</div>
+
+##### 💡 Study Tips
+
+1. **Create Flashcards** for:
+   - Four analytics levels (questions, focus, complexity)
+   - Eight roles (responsibilities, key differences)
+   - Hard vs Soft skills (examples of each)
+   - EDA techniques (which level they belong to)
+
+2. **Practice Scenarios**: 
+   - Given a business problem, identify which analytics level would be used
+   - Given a task, identify which role would perform it
+   - Given a goal, identify which EDA technique is appropriate
+
+3. **Understand Relationships**:
+   - How EDA relates to analytics levels
+   - How roles work together
+   - How skills complement each other
+
+4. **Key Distinctions**:
+   - Descriptive vs Diagnostic vs Predictive vs Prescriptive
+   - Data Analyst vs Data Scientist vs Data Engineer
+   - Hard Skills vs Soft Skills
+   - Early EDA vs Advanced EDA
+
+##### ⚠️ Common Exam Mistakes to Avoid
+
+1. **Confusing Analytics Levels**: Don't mix up descriptive (what happened) with prescriptive (what should we do)
+2. **Role Confusion**: Data Analyst focuses on statistical analysis; Data Scientist focuses on ML/AI
+3. **Skill Categorization**: Programming is a hard skill; Communication is a soft skill
+4. **EDA Placement**: Remember EDA primarily fits descriptive/diagnostic but prepares for predictive/prescriptive
+
+#### ⭐ Key Takeaways
+
+1. **Data analysis transforms raw data into actionable insights** for decision-making
+2. **Multiple types of analysis** exist (text, statistical, diagnostic, predictive, mining)
+3. **Interdisciplinary field** connecting programming, ML, statistics, visualization, BI, and big data
+4. **Specialized tools and software** are essential for effective data analysis
+5. **Real-world application** requires understanding both technical and business contexts
+6. **Eight key roles** in data analysis, each with specific responsibilities
+7. **Roles often overlap** in smaller organizations
+8. **Team collaboration** is essential for successful data projects
+            """,
+        "key_points": [
+            "Data analysis converts raw data into actionable insights for decision-making",
+            "Multiple analysis types: text, statistical, diagnostic, predictive, and data mining",
+            "Interdisciplinary field combining programming, ML, statistics, visualization, BI, and big data",
+            "Programming (Python/R/SQL) enables automation and complex calculations",
+            "Machine learning builds predictive models from historical data",
+            "Statistics provides the foundation for understanding and interpreting data",
+            "Data visualization makes complex findings accessible through graphs and charts",
+            "Business Intelligence helps organizations make data-driven decisions",
+            "Big Data techniques handle massive datasets beyond traditional software capabilities",
+            "Eight key roles: Data Analyst, Data Scientist, Data Engineer, BI Analyst, Data Architect, Statistician, ML Engineer, and Data Visualization Specialist",
+            "Each role has specific responsibilities but roles often overlap in smaller organizations",
+            "Data Architect designs systems, Data Engineer builds infrastructure, Data Analyst/Scientist analyze data, BI Analyst provides business insights, and Visualization Specialist creates visual presentations",
+            "Team collaboration across roles is essential for successful data projects",
+            "Hard skills (technical, quantifiable) include: Mathematical/Statistical skills, Programming (Python/R/SQL), Database management, Data visualization, and Data cleaning/wrangling",
+            "Soft skills (interpersonal, personality-based) include: Analytical skills, Problem-solving, Communication, and Business/industry understanding",
+            "Both hard and soft skills are essential - hard skills provide technical foundation, soft skills enable effective application and collaboration",
+            "Employers value soft skills highly as they're harder to teach and crucial for collaborative work",
+            "A typical day includes: email/planning, team meetings, data retrieval (SQL), data validation, analysis (Python), visualization (Tableau), report writing, and cross-team collaboration",
+            "No two days are the same - data analysts work on multiple projects, handle various data sources, and collaborate with different teams",
+            "Daily activities demonstrate practical application of technical skills: SQL, Python (Pandas/NumPy), Tableau, and data cleaning techniques",
+            "The role requires balancing technical work (analysis, coding) with communication (meetings, reports, presentations)",
+            "Four levels of data analysis: Descriptive (What happened?), Diagnostic (Why did it happen?), Predictive (What will happen?), and Prescriptive (What should we do?)",
+            "Descriptive analytics is the foundation - summarizes historical data and identifies patterns",
+            "Diagnostic analytics investigates root causes using statistical techniques and correlation analysis",
+            "Predictive analytics forecasts future outcomes using regression, time series, and machine learning",
+            "Prescriptive analytics provides actionable recommendations using optimization, simulation, and decision trees",
+            "Complexity and value increase from descriptive to prescriptive analytics, but all levels are important for decision-making",
+            "Exploratory Data Analysis (EDA) focuses on visual, intuitive techniques performed before formal statistical modeling",
+            "EDA primarily fits into descriptive and diagnostic analytics levels - summarizing data and investigating relationships",
+            "Early EDA uses measures of central tendency (mean, median, mode) and dispersion (range, variance, standard deviation)",
+            "EDA visualizations include histograms, box plots, scatter plots for understanding data distributions and relationships",
+            "Advanced EDA investigates relationships between variables, detects anomalies, and discovers patterns through grouping",
+            "EDA results serve as critical inputs to predictive analytics (feature engineering) and prescriptive analytics (decision scenarios)",
+            "EDA is an iterative process: load data → explore → describe → visualize → investigate → validate → prepare for modeling"
+        ],
+        "visual_elements": {
+            "diagrams": True,
+            "tables": True,
+            "highlighted_sections": True
+        }
+    },
+    {
+        "lesson_number": "1.2",
+        "title": "It's All About Data",
+        "content": """
+### What is Data?
+
+When discussing data analysis, **data** refers to unprocessed, raw facts or statistics gathered for analysis. Data can be collected from various sources for various tasks, such as making decisions, forecasting trends, figuring out how users behave, and more. Data can be broadly divided into **qualitative** and **quantitative** categories.
+
+#### 🎯 Data Overview
+
+<div class="mermaid">
+graph TB
+    A[Data<br/>Raw Facts & Statistics] --> B[Qualitative Data<br/>Non-numerical<br/>Categorical Variables]
+    A --> C[Quantitative Data<br/>Numerical<br/>Measurable]
+    
+    B --> B1[Nominal<br/>No order]
+    B --> B2[Ordinal<br/>Has order]
+    B --> B3[Dichotomous<br/>Only 2 categories]
+    
+    C --> D[Discrete Data<br/>Countable<br/>Whole numbers only]
+    C --> E[Continuous Data<br/>Any value in range<br/>Decimals possible]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B1 fill:#8E44AD,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B2 fill:#7D3C98,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B3 fill:#6C3483,stroke:#4A235A,stroke-width:2px,color:#fff
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+</div>
+
+#### 📊 Qualitative vs Quantitative Data
+
+| Type | Description | Examples |
+|------|-------------|----------|
+| **Qualitative** | Non-numerical, descriptive information | Customer feedback, survey responses, interview notes, categories (e.g., "satisfied", "neutral") |
+| **Quantitative** | Numerical, measurable information | Sales figures, temperature, weight, number of visitors, revenue |
+
+#### 📝 Qualitative Data: Categories
+
+Non-numerical, text-based **qualitative data** typically describes qualities or characteristics. They stand for distinct classifications or groups to which an observation may belong. This type of data's individual data points can be considered **categorical variables**, and they are not intended for use in calculations. However, they are necessary when classifying or grouping data. Additional categories for qualitative data include:
+
+##### 1. Nominal Data 🏷️
+
+**Definition**: Although this data can be divided into categories, it **lacks any sense of priority or order**. Categories are labels with no inherent ranking.
+
+**Characteristics**:
+- Categories with no order
+- Cannot rank or compare (apple is not "better" than banana)
+- Used for classification only
+- Often represented as text or codes
+
+**Examples**:
+- Types of fruit (apple, banana, orange)
+- Gender (male, female, other)
+- Country of residence (Norway, Sweden, Denmark)
+- Product category (Electronics, Clothing, Home)
+- Blood type (A, B, AB, O)
+
+<div class="mermaid">
+flowchart LR
+    A[Nominal Data] --> B[No Order]
+    B --> C[Categories Only]
+    C --> D[Examples:<br/>• Fruit types<br/>• Gender<br/>• Country]
+    
+    style A fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+</div>
+
+##### 2. Ordinal Data 📊
+
+**Definition**: This data is divided into different categories and has a **distinct order**. Categories can be ranked, but the distance between categories may not be equal.
+
+**Characteristics**:
+- Categories with meaningful order
+- Can rank (good > average > poor)
+- Distance between levels may not be equal
+- Used for ratings and rankings
+
+**Examples**:
+- Movie ratings (poor, average, good, excellent)
+- Satisfaction level (very dissatisfied, dissatisfied, neutral, satisfied, very satisfied)
+- Education level (high school, bachelor's, master's, PhD)
+- Size (small, medium, large)
+- Likert scale (strongly disagree, disagree, neutral, agree, strongly agree)
+
+<div class="mermaid">
+flowchart LR
+    A[Ordinal Data] --> B[Has Order]
+    B --> C[Rankable]
+    C --> D[Examples:<br/>• Movie ratings<br/>• Satisfaction<br/>• Education level]
+    
+    style A fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+</div>
+
+##### 3. Dichotomous (Binary/Binomial) Data ⚖️
+
+**Definition**: There are **only two categories** for nominal variables. They serve as indicators of an attribute's **presence or absence**.
+
+**Characteristics**:
+- Exactly two categories
+- Yes/No, True/False type
+- Special case of nominal data
+- Often used in logic and filtering
+
+**Examples**:
+- Employment status (employed / unemployed)
+- Gender (male / female) — when only two options
+- Purchase made (yes / no)
+- Pass/Fail
+- Active/Inactive
+- True/False
+
+<div class="mermaid">
+flowchart LR
+    A[Dichotomous Data] --> B[Only 2 Categories]
+    B --> C[Presence/Absence]
+    C --> D[Examples:<br/>• Employed/Unemployed<br/>• Yes/No<br/>• Pass/Fail]
+    
+    style A fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+</div>
+
+#### 🎨 Qualitative Data Types Overview
+
+<div class="mermaid">
+graph TB
+    subgraph "Qualitative Data - Categorical Variables"
+        Q[Qualitative Data<br/>Non-numerical<br/>Descriptive]
+        Q --> N[Nominal<br/>No order<br/>e.g. Fruit: apple, banana, orange]
+        Q --> O[Ordinal<br/>Has order<br/>e.g. Ratings: poor, average, good, excellent]
+        Q --> D[Dichotomous<br/>Only 2 categories<br/>e.g. Employed / Unemployed]
+    end
+    
+    style Q fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style N fill:#8E44AD,stroke:#6C3483,stroke-width:2px,color:#fff
+    style O fill:#7D3C98,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#6C3483,stroke:#4A235A,stroke-width:2px,color:#fff
+</div>
+
+#### 📋 Qualitative Data Types Comparison
+
+| Type | Order? | Categories | Examples |
+|------|--------|------------|----------|
+| **Nominal** | No | Multiple, no ranking | Fruit types, country, blood type |
+| **Ordinal** | Yes | Multiple, rankable | Movie ratings, satisfaction level, education |
+| **Dichotomous** | No (or N/A) | Exactly 2 | Employed/Unemployed, Yes/No, Pass/Fail |
+
+#### 💡 Why This Matters: Data Types Affect Analysis
+
+Comprehending these types of variables and data in data analysis is **essential** because:
+
+1. **Types of analyses you can run**: Different statistical tests and methods apply to different data types (e.g., chi-square for categorical, t-test for continuous).
+2. **Data pre-processing methods**: How you handle the data depends on its type:
+   - **Missing data**: Different strategies for categorical vs numerical (e.g., mode for nominal, mean for continuous).
+   - **Normalisation/Scaling**: Numerical data may need scaling; categorical data may need encoding (e.g., one-hot encoding for nominal).
+3. **Visualisation choices**: Bar charts for categorical, histograms for continuous, etc.
+4. **Model selection**: Machine learning models require appropriate input types (e.g., decision trees handle categories, regression needs numerical).
+
+<div class="mermaid">
+flowchart TD
+    A[Data Type] --> B[Affects Analysis]
+    A --> C[Affects Pre-processing]
+    
+    B --> B1[Statistical tests<br/>e.g. Chi-square vs t-test]
+    B --> B2[Visualisation<br/>Bar chart vs Histogram]
+    B --> B3[Model selection<br/>Encoding requirements]
+    
+    C --> C1[Missing data handling<br/>Mode vs Mean]
+    C --> C2[Normalise/Scale<br/>When and how]
+    C --> C3[Encoding<br/>One-hot for categorical]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+#### 📈 Quantitative Data: Two Main Categories
+
+**Quantitative information** is measurable or numerical information that can be used in statistical or mathematical calculations. These kinds of discrete data points are sometimes referred to as **numerical variables**.
+
+Additional categories for quantitative data include:
+
+##### 1. Discrete Data 📊
+
+**Definition**: Only particular (countable) values are allowable for this data. Only whole numbers should be used.
+
+**Characteristics**:
+- Countable values
+- Whole numbers only
+- No values between counts
+- Often represents counts or categories
+
+**Examples**:
+- Number of people who visit a website (e.g., 1, 2, 3, 150, 1000)
+- Number of automobiles a person owns (0, 1, 2, 3...)
+- Number of students in a class
+- Number of products sold
+- Number of customer complaints
+
+<div class="mermaid">
+flowchart LR
+    A[Discrete Data] --> B[Whole Numbers Only]
+    B --> C[Countable]
+    C --> D[Examples:<br/>• Website visitors<br/>• Cars owned<br/>• Products sold]
+    
+    style A fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+</div>
+
+##### 2. Continuous Data 📏
+
+**Definition**: This data is not limited to whole numbers and can take any value within a specified range. Can include decimals and fractions.
+
+**Characteristics**:
+- Any value within a range
+- Decimals and fractions possible
+- Measurable (not just countable)
+- Often represents measurements
+
+**Examples**:
+- Temperature of a room (20.5°C, 21.3°C, 22.7°C)
+- A person's weight (70.45 kg, 70.47 kg, 71.2 kg)
+- Height (175.3 cm)
+- Time (2.5 hours, 3.75 minutes)
+- Revenue ($1,234.56)
+
+<div class="mermaid">
+flowchart LR
+    A[Continuous Data] --> B[Any Value in Range]
+    B --> C[Decimals Possible]
+    C --> D[Examples:<br/>• Temperature<br/>• Weight<br/>• Height<br/>• Time]
+    
+    style A fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style B fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style C fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style D fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+</div>
+
+#### 🔄 Discrete vs Continuous Comparison
+
+<div class="mermaid">
+graph TB
+    subgraph "Discrete Data"
+        D1[Whole numbers only]
+        D2[Countable: 1, 2, 3...]
+        D3[No values between]
+        D4[Website visitors: 150]
+        D5[Cars owned: 2]
+    end
+    
+    subgraph "Continuous Data"
+        C1[Any value in range]
+        C2[Decimals: 70.45, 70.47...]
+        C3[Infinite possibilities]
+        C4[Weight: 70.45 kg]
+        C5[Temperature: 21.3°C]
+    end
+    
+    style D1 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D2 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D3 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D4 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D5 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C1 fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style C2 fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style C3 fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style C4 fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style C5 fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+</div>
+
+#### 📋 Quick Reference Table
+
+| Aspect | Discrete Data | Continuous Data |
+|--------|---------------|-----------------|
+| **Values** | Whole numbers only | Any value in range (including decimals) |
+| **Countable?** | Yes | No (measurable) |
+| **Examples** | Visitors, cars, products sold | Temperature, weight, height, time |
+| **Between values?** | No (e.g., can't have 2.5 cars) | Yes (e.g., 70.45 kg) |
+| **Use in** | Counting, categories | Measurement, precision |
+
+#### 📂 Sources of Data
+
+Given the widespread digitisation of information and interactions, modern data analysts can access a vast array of data sources. These sources can generally be divided into **internal** (produced within the organisation) and **external** (data from outside the organisation) sources.
+
+##### 🏢 Internal Data Sources
+
+Internal sources are those produced within an organisation and include the following:
+
+**1. Transactional Data** 💳
+
+This comprises information from sales, deliveries, invoices, and other commercial dealings.
+
+**Examples**:
+- **Financial institution**: Financial transactions, account activity, loan repayments
+- **Retail business**: Purchase histories, order records, payment transactions
+- **E-commerce**: Order IDs, product IDs, quantities, prices, timestamps
+
+**2. Log Data** 📋
+
+When various events occur, systems and applications automatically generate this type of data.
+
+**Examples**:
+- **Web server logs**: Page views, click paths, session duration
+- **Application logs**: User actions, feature usage, errors
+- **Error logs**: System failures, debugging information
+- **Reveals**: User behaviour, system performance, troubleshooting data
+
+**3. Customer Relationship Management (CRM) Data** 👥
+
+Customers' contact details, purchase histories, interactions with customer service representatives, and other data are all readily available from CRM systems.
+
+**Examples**:
+- Contact details (name, email, phone)
+- Purchase histories and order frequency
+- Customer service interactions (tickets, calls, chat logs)
+- Lead status and sales pipeline
+
+**4. Human Resources (HR) Data** 👤
+
+This contains information on employees, such as their job descriptions, achievements, and length of service.
+
+**Examples**:
+- Job descriptions and roles
+- Performance reviews and achievements
+- Length of service (tenure)
+- Salary bands, departments, locations
+
+##### 🌐 External Data Sources
+
+Data that may be gathered outside of an organisation is represented by external data sources. Examples include:
+
+**1. Social Media Data** 📱
+
+Social media platform data can reveal information about customer sentiment, new trends, and more.
+
+**Examples**:
+- Customer sentiment (positive/negative/neutral)
+- Trending topics and hashtags
+- Engagement metrics (likes, shares, comments)
+- Brand mentions and reviews
+
+**2. Public Data Sets** 📊
+
+Governments and other organisations frequently release data sets on various subjects, from health statistics to economic indicators.
+
+**Examples**:
+- Government: Census data, health statistics, economic indicators
+- Open data: Weather data, traffic data, demographic data
+- Research: Academic datasets, scientific publications
+
+**3. Web Scraping** 🕷️
+
+Web scraping tools can be used to collect data from websites. This may include data from news websites, forums, and other online resources.
+
+**Examples**:
+- News websites (articles, headlines)
+- Forums and discussion boards
+- Product listings and prices (competitor analysis)
+- Job postings, real estate listings
+
+**4. Third-Party Data Providers** 🏪
+
+Companies that gather and market data, including credit scores and market research data.
+
+**Examples**:
+- Credit scores and financial data
+- Market research reports
+- Demographic and lifestyle data
+- Industry benchmarks
+
+**5. Internet of Things (IoT) Devices** 📡
+
+IoT devices like connected cars, smart appliances, and wearable technology produce vast amounts of data.
+
+**Examples**:
+- Connected cars: Location, speed, fuel consumption
+- Smart appliances: Usage patterns, energy consumption
+- Wearable technology: Heart rate, steps, sleep patterns
+- Smart home: Temperature, security, energy usage
+
+**6. Satellite and Aerial Imagery** 🛰️
+
+Geospatial and environmental data.
+
+**Examples**:
+- Satellite imagery (land use, agriculture, urban planning)
+- Aerial photography (construction, surveying)
+- Environmental monitoring (climate, deforestation)
+- Mapping and navigation data
+
+**7. Sensor Data** 📟
+
+Sensors are widely used in business operations. Manufacturers may use sensors on assembly lines to collect data, utilities may use smart meters to collect usage information, and logistics firms may use GPS information from delivery vehicles.
+
+**Examples**:
+- **Manufacturing**: Assembly line sensors (temperature, pressure, quality checks)
+- **Utilities**: Smart meters (energy usage, consumption patterns)
+- **Logistics**: GPS from delivery vehicles (location, route, speed)
+- **Retail**: Foot traffic sensors, inventory sensors
+
+#### 🎨 Data Sources Overview
+
+<div class="mermaid">
+graph TB
+    A[Data Sources] --> B[Internal<br/>Within Organisation]
+    A --> C[External<br/>Outside Organisation]
+    
+    B --> B1[Transactional Data<br/>Sales, Invoices, Purchases]
+    B --> B2[Log Data<br/>Web, Application, Error logs]
+    B --> B3[CRM Data<br/>Customers, Interactions]
+    B --> B4[HR Data<br/>Employees, Performance]
+    
+    C --> C1[Social Media<br/>Sentiment, Trends]
+    C --> C2[Public Data Sets<br/>Government, Open data]
+    C --> C3[Web Scraping<br/>Websites, Forums]
+    C --> C4[Third-Party Providers<br/>Credit, Market research]
+    C --> C5[IoT Devices<br/>Connected devices]
+    C --> C6[Satellite/Imagery<br/>Geospatial, Environmental]
+    C --> C7[Sensor Data<br/>Manufacturing, GPS, Smart meters]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B4 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C1 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C2 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C3 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C4 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C5 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C6 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C7 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+</div>
+
+#### 📋 Internal vs External Sources Summary
+
+| Source Type | Description | Examples |
+|-------------|-------------|----------|
+| **Transactional** | Sales, deliveries, invoices, commercial dealings | Purchase histories, financial transactions, order records |
+| **Log Data** | Auto-generated by systems when events occur | Web server logs, application logs, error logs |
+| **CRM Data** | Customer information from CRM systems | Contact details, purchase history, service interactions |
+| **HR Data** | Employee information | Job descriptions, achievements, tenure |
+| **Social Media** | Data from social platforms | Sentiment, trends, engagement |
+| **Public Data** | Released by governments/organisations | Census, health stats, economic indicators |
+| **Web Scraping** | Data collected from websites | News, forums, product listings |
+| **Third-Party** | Data from data providers | Credit scores, market research |
+| **IoT** | Data from connected devices | Smart appliances, wearables, connected cars |
+| **Satellite/Imagery** | Geospatial and environmental | Satellite imagery, aerial photography |
+| **Sensor Data** | Data from sensors in operations | Assembly line sensors, smart meters, GPS |
+
+#### 🗄️ Data Storage
+
+Since there are so many data sources, how the data is stored plays a crucial role in the data analysis process. The chosen storage technique can significantly impact the **speed of access**, the **effectiveness of analyses**, and the **types of analysis** that are practical.
+
+##### 🧭 Storage Options at a Glance
+
+<div class="mermaid">
+flowchart TB
+    A[Data Storage Options] --> B[Files<br/>Spreadsheets & CSV]
+    A --> C[Databases<br/>SQL & NoSQL]
+    A --> D[Analytics Platforms<br/>Warehouse & Lake]
+    A --> E[Cloud Object Storage<br/>S3 / GCS / Azure Blob]
+    A --> F[In-memory Stores<br/>Redis / Ignite]
+
+    C --> C1[SQL (Structured)<br/>MySQL / PostgreSQL / Oracle]
+    C --> C2[NoSQL (Flexible)<br/>MongoDB / Cassandra / Firebase]
+
+    D --> D1[Data Warehouse<br/>Snowflake / Redshift / BigQuery]
+    D --> D2[Data Lake<br/>Raw data in original format]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#2196F3,stroke:#1565C0,stroke-width:2px,color:#fff
+    style F fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style C1 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C2 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+##### 1. Spreadsheets and CSV Files 📄
+
+Spreadsheets (like Microsoft Excel) and CSV (Comma-Separated Values) files are popular and straightforward storage formats for **smaller datasets**.
+
+- **Pros**: Easy to use, human-readable, great for quick exploration
+- **Cons**: Limited performance and scalability for large datasets
+
+**Example use**: A marketing team exports a CSV of 5,000 leads to analyse campaign performance.
+
+##### 2. Databases 🗃️ (SQL vs NoSQL)
+
+Databases are usually used for **larger datasets**.
+
+**Structured (SQL) databases** store data in tables with relationships (like interconnected spreadsheets):
+- Examples: MySQL, Oracle, PostgreSQL
+- Best for: structured data, consistent schema, strong querying (SQL)
+
+**Unstructured / semi-structured (NoSQL) databases** are more flexible:
+- Examples: MongoDB, Cassandra, Firebase
+- Best for: variable schemas, documents/JSON, high scale, mixed data types
+
+<div class="mermaid">
+flowchart LR
+    A[Databases] --> B[SQL<br/>Structured tables]
+    A --> C[NoSQL<br/>Flexible schema]
+    B --> B1[Example: Orders table<br/>order_id, customer_id, total]
+    C --> C1[Example: JSON document<br/>{customer:{...}, events:[...] }]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px,color:#000
+    style C1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px,color:#000
+</div>
+
+##### 3. Data Warehouses 🏢
+
+Data warehouses are frequently used for **enormous datasets** and **analytics/reporting**. They collect information from various organisational sources and are designed for fast querying over large amounts of historical data.
+
+- Examples: Snowflake, Amazon Redshift, Google BigQuery
+- Best for: BI dashboards, historical reporting, consistent metrics (KPIs)
+
+**Example use**: Finance runs monthly profitability reports across 5 years of transactions.
+
+##### 4. Data Lakes 🏞️
+
+A data lake stores a very large amount of **raw, unprocessed data** in its original format until it is needed. Data lakes support flexible analysis and can store **structured, semi-structured, and unstructured** data.
+
+- Flat architecture (files/objects) rather than a strict warehouse schema
+- Best for: storing raw data, experimentation, ML feature building
+
+**Example use**: Keeping raw clickstream logs + images + CRM extracts for future modeling.
+
+##### 5. Cloud Storage ☁️
+
+Large datasets are frequently stored on cloud storage platforms like AWS S3, Google Cloud Storage, or Azure Blob Storage.
+
+- **Pros**: scalable, reliable, integrates well with cloud analytics services
+- **Best for**: raw files, backups, data lake storage, sharing datasets across teams
+
+##### 6. In-memory Storage ⚡
+
+In-memory storage can be used for **real-time analytics**. Data is stored in RAM (e.g., Redis, Apache Ignite) enabling rapid access.
+
+- Best for: caching, realtime dashboards, low-latency features
+- Trade-off: more expensive per GB than disk storage
+
+##### 📋 Storage Comparison Table
+
+| Storage Type | Best For | Data Types | Typical Scale | Examples |
+|--------------|----------|-----------|--------------|----------|
+| **Spreadsheets/CSV** | Quick analysis, small datasets | Structured | Small | Excel, CSV |
+| **SQL DB** | Transactions + querying | Structured | Medium–Large | PostgreSQL, MySQL |
+| **NoSQL DB** | Flexible schema, mixed data | Semi/unstructured | Large | MongoDB, Cassandra |
+| **Data Warehouse** | BI & reporting, historical analytics | Structured (modeled) | Very Large | Snowflake, BigQuery |
+| **Data Lake / Object Storage** | Raw data storage, ML | Any | Very Large | S3, GCS, Azure Blob |
+| **In-memory** | Real-time analytics, caching | Key/value, fast access | Medium | Redis, Ignite |
+
+##### 💡 How to Choose (Exam-friendly rule of thumb)
+
+- **Small + human-readable**: Spreadsheet/CSV  
+- **Transactions + strong structure**: SQL database  
+- **Flexible schema + high scale**: NoSQL database  
+- **Fast analytics on historical data**: Data warehouse  
+- **Store everything raw for later**: Data lake / cloud object storage  
+- **Need speed (milliseconds)**: In-memory storage  
+
+#### 🚧 Data Silos
+
+Remember that data may be stored separately in different places or at a specific location in the organisation's overall structure, making it difficult for other employees to access. A situation where data is **compartmentalised or isolated** within a particular department, unit, system, or application and is **not easily accessible** to or shared with other parts of the organisation is called a **'data silo'**.
+
+##### 🎯 What is a Data Silo?
+
+<div class="mermaid">
+graph TB
+    subgraph "Organisation"
+        A[Sales Department<br/>CRM System]
+        B[Marketing Department<br/>Email Platform]
+        C[Finance Department<br/>ERP System]
+        D[HR Department<br/>HRIS System]
+    end
+    
+    A -.No Access.-> B
+    B -.No Access.-> C
+    C -.No Access.-> D
+    D -.No Access.-> A
+    
+    style A fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style B fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style C fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style D fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+</div>
+
+**Problem**: Each department has its own data system, but they cannot easily share or access each other's data.
+
+##### 🔍 Causes of Data Silos
+
+There are several causes for this compartmentalisation:
+
+**1. Technical Reasons** 💻
+
+Different systems or applications within the organisation may store data in different formats or use incompatible technology.
+
+**Examples**:
+- Sales uses MySQL database, Marketing uses MongoDB
+- Finance system uses XML format, HR uses JSON
+- Legacy systems that don't integrate with modern platforms
+- Different APIs or data protocols
+
+**2. Organisational Reasons** 🏢
+
+Within the organisation (between departments), various systems or applications might store data in multiple formats or use unrelated technologies.
+
+**Examples**:
+- Each department purchased its own system independently
+- No central IT strategy or data governance
+- Mergers and acquisitions bringing in different systems
+- Lack of standardisation across departments
+
+**3. Cultural Reasons** 👥
+
+Due to unit competition, worries about data privacy, or a lack of knowledge about the advantages of data sharing, there may be resistance to or a lack of incentive for data sharing across the organisation.
+
+**Examples**:
+- Department competition ("We don't want to share our data")
+- Privacy concerns (even when data could be safely shared)
+- Lack of understanding about benefits of data sharing
+- No incentives or culture promoting collaboration
+
+##### 🔄 Data Silo Causes Diagram
+
+<div class="mermaid">
+flowchart TD
+    A[Data Silo] --> B[Technical Reasons<br/>💻]
+    A --> C[Organisational Reasons<br/>🏢]
+    A --> D[Cultural Reasons<br/>👥]
+    
+    B --> B1[Different formats<br/>Incompatible tech]
+    B --> B2[Legacy systems<br/>Different APIs]
+    
+    C --> C1[Independent purchases<br/>No central strategy]
+    C --> C2[Mergers & acquisitions<br/>Lack of standardisation]
+    
+    D --> D1[Department competition<br/>Privacy concerns]
+    D --> D2[No sharing culture<br/>Lack of incentives]
+    
+    style A fill:#E74C3C,stroke:#C0392B,stroke-width:3px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px,color:#000
+    style B2 fill:#FFE0B2,stroke:#E65100,stroke-width:2px,color:#000
+    style C1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px,color:#000
+    style C2 fill:#FFE0B2,stroke:#E65100,stroke-width:2px,color:#000
+    style D1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px,color:#000
+    style D2 fill:#FFE0B2,stroke:#E65100,stroke-width:2px,color:#000
+</div>
+
+##### ✅ Solutions to Data Silos
+
+Organisations frequently use data integration initiatives to consolidate their data into a centralised data warehouse or adopt a unified data architecture to eliminate data silos.
+
+**Technical Solutions** 🔧:
+- **Middleware and integration tools**: Connect different systems
+- **ETL (Extract, Transform, Load)**: Move data from silos to central warehouse
+- **API integration**: Enable systems to communicate
+- **Unified data architecture**: Standardise data formats and storage
+
+**Organisational Solutions** 🏢:
+- **Promote data-sharing culture**: Encourage collaboration
+- **Establish data governance procedures**: Set standards and policies
+- **Central data strategy**: Coordinate IT purchases and systems
+- **Cross-departmental teams**: Break down barriers
+
+<div class="mermaid">
+flowchart LR
+    A[Data Silos<br/>Isolated Systems] --> B[Integration Solutions]
+    B --> C[Centralised<br/>Data Warehouse]
+    B --> D[Unified<br/>Data Architecture]
+    
+    C --> E[All Departments<br/>Can Access Data]
+    D --> E
+    
+    style A fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 🔓 Open vs Closed Data Platforms
+
+Another factor to consider is the platform on which the data will be stored - **open** or **closed**. Open and closed data platforms refer to various methods for using, sharing, and being able to access data.
+
+##### 🌐 Open Data Platforms
+
+A platform that allows for the **open sharing, use, and reuse of data** is known as an **open data platform**. This openness is frequently subject to minimal conditions, usually in the form of a license, such as sharing any modifications or derivatives under the same open terms or attributing the source.
+
+**Characteristics**:
+- Open sharing, use, and reuse
+- Minimal restrictions (usually attribution or share-alike license)
+- Publicly accessible
+- Promotes transparency and collaboration
+
+**Used in**:
+- Governmental settings (transparency, public participation)
+- Academic settings (research collaboration)
+- Public service settings (innovation, public benefit)
+
+**Examples**:
+- **data.gov** (United States) - Government datasets
+- **data.gov.uk** (United Kingdom) - UK government data
+- OpenStreetMap - Open mapping data
+- Kaggle Datasets - Public datasets for research
+
+##### 🔒 Closed Data Platforms
+
+A **closed data platform** places **limitations on who can access and use the data**. Access may be restricted to particular users or groups because the data may be proprietary, confidential, or sensitive in nature.
+
+**Characteristics**:
+- Restricted access (specific users/groups)
+- Requires permissions, contracts, or agreements
+- Data is proprietary, confidential, or sensitive
+- Protects privacy, intellectual property, or compliance
+
+**Used in**:
+- Businesses (protect trade secrets, customer data)
+- Healthcare (patient privacy, HIPAA compliance)
+- Financial institutions (regulatory compliance)
+- Organisations with sensitive data
+
+**Examples**:
+- Company internal databases (employee-only access)
+- Customer data platforms (restricted to authorised staff)
+- Financial systems (compliance requirements)
+- Healthcare records (privacy regulations)
+
+##### 🎨 Open vs Closed Platform Comparison
+
+<div class="mermaid">
+graph TB
+    subgraph "Open Data Platform 🌐"
+        O1[Public Access]
+        O2[Minimal Restrictions]
+        O3[Promotes Innovation]
+        O4[Examples:<br/>data.gov<br/>data.gov.uk]
+    end
+    
+    subgraph "Closed Data Platform 🔒"
+        C1[Restricted Access]
+        C2[Requires Permissions]
+        C3[Protects Privacy/IP]
+        C4[Examples:<br/>Company DB<br/>Healthcare Records]
+    end
+    
+    style O1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style O2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style O3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style O4 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C1 fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style C2 fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style C3 fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style C4 fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+##### 📋 Open vs Closed Comparison Table
+
+| Aspect | Open Data Platform | Closed Data Platform |
+|--------|-------------------|---------------------|
+| **Access** | Public, open to all | Restricted to authorised users |
+| **Restrictions** | Minimal (attribution, share-alike) | Requires permissions/contracts |
+| **Purpose** | Transparency, innovation, collaboration | Privacy, IP protection, compliance |
+| **Use Cases** | Government, academic, public service | Business, healthcare, finance |
+| **Examples** | data.gov, data.gov.uk, OpenStreetMap | Company databases, patient records |
+| **Data Type** | Public interest data | Proprietary, confidential, sensitive |
+
+##### 💡 Hybrid Approach
+
+In reality, depending on the type of data and their requirements, many organisations use a **combination of open and closed data**. For instance, a business might make some of its data publicly accessible to foster innovation and collaboration while keeping other data private to safeguard client privacy or trade secrets.
+
+**Example**: A retail company might:
+- **Open**: Publish anonymised sales trends and market research (promote innovation)
+- **Closed**: Keep customer personal information and pricing strategies private (protect privacy and trade secrets)
+
+<div class="mermaid">
+flowchart TD
+    A[Organisation Data] --> B{Data Type?}
+    B -->|Public Interest| C[Open Platform<br/>🌐<br/>Public Access]
+    B -->|Sensitive/Private| D[Closed Platform<br/>🔒<br/>Restricted Access]
+    
+    C --> E[Examples:<br/>Market trends<br/>Research data<br/>Public statistics]
+    D --> F[Examples:<br/>Customer PII<br/>Trade secrets<br/>Financial records]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style E fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style F fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+#### 💡 Key Takeaways
+
+1. **Data** = unprocessed, raw facts or statistics gathered for analysis
+2. **Qualitative data** = non-numerical, categorical variables (not for calculations, but for classifying/grouping)
+3. **Nominal data** = categories with no order (e.g., fruit types, country)
+4. **Ordinal data** = categories with distinct order (e.g., movie ratings: poor, average, good, excellent)
+5. **Dichotomous data** = only two categories, presence/absence (e.g., employed/unemployed)
+6. **Quantitative data** = numerical, measurable (used in statistical/mathematical calculations)
+7. **Discrete data** = countable, whole numbers only (e.g., website visitors, cars owned)
+8. **Continuous data** = any value in range, decimals possible (e.g., temperature, weight)
+9. **Data types affect** the analyses you can run, pre-processing (missing data, normalisation), and model selection
+10. **Internal data sources**: Transactional data, log data, CRM data, HR data (produced within organisation)
+11. **External data sources**: Social media, public data sets, web scraping, third-party providers, IoT, satellite/imagery, sensor data (from outside organisation)
+12. **Data storage choices** affect access speed, scalability, and what analysis is practical
+13. Common storage methods: **Spreadsheets/CSV**, **Databases (SQL/NoSQL)**, **Data Warehouses**, **Data Lakes**, **Cloud Object Storage**, **In-memory stores**
+14. **Data silos** = data compartmentalised/isolated within departments, not easily accessible to other parts of organisation
+15. **Data silo causes**: Technical (incompatible formats/tech), Organisational (independent systems), Cultural (competition, privacy concerns)
+16. **Solutions to silos**: Data integration, centralised warehouse, unified architecture, data-sharing culture, data governance
+17. **Open data platforms** = public access, minimal restrictions (e.g., data.gov, data.gov.uk) - used for transparency and innovation
+18. **Closed data platforms** = restricted access, requires permissions (e.g., company DBs, healthcare records) - protects privacy/IP/compliance
+19. Many organisations use **hybrid approach**: open data for public interest, closed data for sensitive/private information
+            """,
+        "key_points": [
+            "Data refers to unprocessed, raw facts or statistics gathered for analysis",
+            "Data is broadly divided into qualitative (non-numerical, categorical) and quantitative (numerical) categories",
+            "Qualitative data points are categorical variables; not for calculations but necessary for classifying/grouping",
+            "Nominal data: categories with no order (e.g., fruit types: apple, banana, orange)",
+            "Ordinal data: categories with distinct order (e.g., movie ratings: poor, average, good, excellent)",
+            "Dichotomous (binary): only two categories, indicates presence/absence (e.g., employed/unemployed)",
+            "Quantitative data is measurable and used in statistical or mathematical calculations (numerical variables)",
+            "Discrete data: countable, whole numbers only (e.g., website visitors, cars owned)",
+            "Continuous data: any value in range, decimals possible (e.g., temperature, weight)",
+            "Data types affect: types of analyses, pre-processing (missing data, normalisation/scale), and model selection",
+            "Internal data sources: Transactional (sales, invoices), Log (web/application/error logs), CRM (customers), HR (employees)",
+            "External data sources: Social media, public data sets, web scraping, third-party providers, IoT devices, satellite/imagery, sensor data",
+            "Data storage affects speed of access, scalability, and what analyses are practical",
+            "Storage options include: spreadsheets/CSV, SQL/NoSQL databases, data warehouses, data lakes, cloud object storage (e.g., S3), and in-memory stores (e.g., Redis)",
+            "Data silos: data compartmentalised/isolated within departments, making it difficult for other employees to access",
+            "Data silo causes: Technical (different formats/incompatible tech), Organisational (independent systems, no central strategy), Cultural (competition, privacy concerns, lack of sharing culture)",
+            "Solutions to data silos: Data integration initiatives, centralised data warehouse, unified data architecture, middleware/integration tools, ETL, promoting data-sharing culture, data governance",
+            "Open data platforms: allow open sharing/use/reuse with minimal restrictions (e.g., data.gov, data.gov.uk) - used in government, academic, public service settings",
+            "Closed data platforms: restrict access to authorised users, require permissions/contracts - used for proprietary, confidential, or sensitive data (business, healthcare, finance)",
+            "Hybrid approach: organisations often use both open (public interest data) and closed (sensitive/private data) platforms depending on data type and requirements"
+        ],
+        "visual_elements": {
+            "diagrams": True,
+            "tables": True,
+            "highlighted_sections": True
+        }
+    },
+    {
+        "lesson_number": "1.2",
+        "title": "It's All About Data",
+        "content": '''
+### Data Representation
+
+Data can be stored in various ways, some offering multiple ways of representing the data. In the broadest sense, data may be stored in an **unstructured manner** or represented in a **structured, tabular format**.
+
+#### 🎯 Core Concept: Structured vs Unstructured Data
+
+<div class="mermaid">
+flowchart LR
+    A[Data Representation] --> B[Structured Data<br/>📊<br/>Organized & Tabular]
+    A --> C[Unstructured Data<br/>📁<br/>Free-form & Flexible]
+
+    B --> B1[Relational Databases]
+    B --> B2[CSV/Excel Files]
+    B --> B3[Data Frames]
+
+    C --> C1[Text Documents]
+    C --> C2[Images/Videos]
+    C --> C3[Audio Files]
+    C --> C4[NoSQL Databases]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B2 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B3 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+    style C2 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+    style C3 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+    style C4 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+</div>
+
+---
+
+### 📊 Structured Data (Tabular Format)
+
+Data is typically kept in a **tabular format**. In this format, data is displayed as tables, similar to those found in spreadsheets, where each **row** corresponds to a **record or entity** and each **column** to one of its **attributes**.
+
+#### 🎨 Tabular Data Structure
+
+<div class="mermaid">
+graph TB
+    subgraph "Tabular Data Structure"
+        A[Table] --> B[Rows = Records/Entities]
+        A --> C[Columns = Attributes]
+        B --> D[Example: Customer 1<br/>Customer 2<br/>Customer 3]
+        C --> E[Example: Name<br/>Age<br/>Email<br/>Purchase Amount]
+    end
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style E fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+</div>
+
+Several instances of structured data representation include the following:
+
+#### 1. Relational Databases 🗄️
+
+Relational databases frequently employ this type of representation (like **MySQL**, **PostgreSQL**, etc.). Data is stored in various tables here, and the **relationships between them are established using keys** (primary and foreign keys). This enables strong **SQL querying capabilities** (Structured Query Language).
+
+**Characteristics**:
+- Data stored in multiple related tables
+- Primary keys uniquely identify records
+- Foreign keys establish relationships between tables
+- Powerful SQL querying capabilities
+- ACID compliance (Atomicity, Consistency, Isolation, Durability)
+
+**Examples**: MySQL, PostgreSQL, Oracle, SQL Server, SQLite
+
+<div class="mermaid">
+graph LR
+    subgraph "Relational Database Structure"
+        A[Customers Table] -->|Foreign Key| B[Orders Table]
+        B -->|Foreign Key| C[Order Items Table]
+        C -->|Foreign Key| D[Products Table]
+    end
+
+    A --> A1[customer_id PK<br/>name<br/>email<br/>phone]
+    B --> B1[order_id PK<br/>customer_id FK<br/>order_date<br/>total]
+    C --> C1[item_id PK<br/>order_id FK<br/>product_id FK<br/>quantity]
+    D --> D1[product_id PK<br/>name<br/>price<br/>category]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style A1 fill:#E3F2FD,stroke:#2196F3,stroke-width:2px
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style D1 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+</div>
+
+#### 2. CSV/Excel Files 📑
+
+Another popular method is using **CSV** or **Excel** files to represent tabular data. These are **readable by humans** and **simple to interpret**, but they lack the speed and scalability of databases.
+
+**Characteristics**:
+- Human-readable format
+- Easy to create and edit
+- Portable across different systems
+- Limited scalability for large datasets
+- No built-in data validation or relationships
+- Simple to share and collaborate
+
+**Use Cases**:
+- Small to medium datasets
+- Data exchange between systems
+- Quick data exploration
+- Reporting and exports
+
+<div class="mermaid">
+flowchart TD
+    A[CSV/Excel Files] --> B[Advantages]
+    A --> C[Disadvantages]
+
+    B --> B1[✓ Human-readable]
+    B --> B2[✓ Easy to use]
+    B --> B3[✓ Portable]
+    B --> B4[✓ Universal support]
+
+    C --> C1[✗ Limited scalability]
+    C --> C2[✗ No data validation]
+    C --> C3[✗ No relationships]
+    C --> C4[✗ Performance issues<br/>with large data]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B2 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B3 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B4 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style C2 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style C3 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style C4 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+</div>
+
+#### 3. Data Frames 🐼
+
+Similar tabular structures are used in data analysis programming languages like **Python** (pandas library) and **R** under the name **Data Frames**. These are **mutable two-dimensional structures** that can hold various data types, including Python objects, strings, integers, and floating-point numbers (columns can be inserted and deleted).
+
+**Characteristics**:
+- Two-dimensional labeled data structure
+- Columns can contain different data types
+- Mutable (can be modified)
+- Powerful indexing and selection capabilities
+- Built-in data manipulation methods
+- Integration with visualization libraries
+
+**Examples**:
+- **Python**: pandas DataFrame
+- **R**: data.frame, tibble
+- **Julia**: DataFrame
+
+<div class="mermaid">
+graph TB
+    subgraph "Data Frame Structure"
+        A[DataFrame] --> B[Index<br/>Row Labels]
+        A --> C[Columns<br/>Column Names]
+        A --> D[Data<br/>Values]
+
+        B --> B1[0, 1, 2, 3...]
+        C --> C1[Name, Age, City...]
+        D --> D1[Mixed Types:<br/>int, float, str, object]
+    end
+
+    E[Operations] --> F[Selection]
+    E --> G[Filtering]
+    E --> H[Grouping]
+    E --> I[Aggregation]
+    E --> J[Merging]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+</div>
+
+#### 📋 Structured Data Comparison Table
+
+| Type | Best For | Scalability | Query Capability | Ease of Use | Examples |
+|------|----------|-------------|------------------|-------------|----------|
+| **Relational DB** | Large datasets, complex relationships | High | Very High (SQL) | Medium | MySQL, PostgreSQL |
+| **CSV/Excel** | Small datasets, data exchange | Low | Low | Very High | Excel, CSV files |
+| **Data Frames** | Data analysis, manipulation | Medium | High (programmatic) | High | pandas, R data.frame |
+
+---
+
+### 📁 Unstructured Data
+
+Not all data in today's constantly connected, modern world still follows a tabular structure. Think about all the **text**, **audio**, **video**, and **sensor data** produced by social media platforms and the Internet of Things. Although more challenging to analyse, this kind of unstructured data is **rich in information**.
+
+<div class="mermaid">
+graph TB
+    A[Unstructured Data Sources] --> B[Social Media<br/>📱]
+    A --> C[IoT Devices<br/>🌐]
+    A --> D[Multimedia<br/>🎬]
+    A --> E[Documents<br/>📄]
+
+    B --> B1[Posts, Comments<br/>Tweets, Reviews]
+    C --> C1[Sensor Data<br/>Telemetry, Logs]
+    D --> D1[Images, Videos<br/>Audio Files]
+    E --> E1[Emails, PDFs<br/>Reports, Articles]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+</div>
+
+Here are some illustrations of unstructured data representation:
+
+#### 1. Text 📝
+
+Text information may come from various places, including **emails**, **social media**, **news articles**, etc. Methods like **Natural Language Processing (NLP)** are employed to organise and analyse text data.
+
+**Sources**:
+- Social media posts (Twitter, Facebook, LinkedIn)
+- Customer reviews and feedback
+- News articles and blogs
+- Emails and chat messages
+- Documents and reports
+
+**Analysis Techniques**:
+- Sentiment analysis
+- Topic modeling
+- Named entity recognition
+- Text classification
+- Language translation
+
+<div class="mermaid">
+flowchart LR
+    A[Text Data] --> B[NLP Processing]
+    B --> C[Tokenization]
+    B --> D[Cleaning]
+    B --> E[Feature Extraction]
+
+    C --> F[Analysis Tasks]
+    D --> F
+    E --> F
+
+    F --> G[Sentiment Analysis<br/>😊 😐 😞]
+    F --> H[Topic Modeling<br/>📚]
+    F --> I[Entity Recognition<br/>👤 📍 🏢]
+    F --> J[Classification<br/>🏷️]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style F fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style G fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style H fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style I fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style J fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+</div>
+
+#### 2. Images/Videos 🎬
+
+Multi-dimensional arrays are typically used to represent image and video data:
+- **Images**: height × width × colour channels (RGB: 3 channels)
+- **Videos**: frames × height × width × colour channels
+
+**Representation**:
+- Images stored as pixel matrices
+- Each pixel contains color information (RGB values)
+- Videos are sequences of image frames
+- Metadata includes resolution, format, compression
+
+**Analysis Techniques**:
+- Computer vision
+- Object detection and recognition
+- Image classification
+- Facial recognition
+- Video analytics
+
+<div class="mermaid">
+graph TB
+    subgraph "Image Representation"
+        A[Image] --> B[Height: 1920 pixels]
+        A --> C[Width: 1080 pixels]
+        A --> D[Channels: 3 RGB]
+
+        D --> D1[Red Channel]
+        D --> D2[Green Channel]
+        D --> D3[Blue Channel]
+    end
+
+    subgraph "Video Representation"
+        E[Video] --> F[Frames: 30 fps]
+        E --> G[Duration: 60 seconds]
+        E --> H[Total: 1800 frames]
+
+        H --> I[Each frame is<br/>an image]
+    end
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style E fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style D fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style H fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+#### 3. Audio 🎵
+
+Using methods like the **Fourier transformation**, audio data is frequently represented as a **time series** or in the **frequency domain**.
+
+**Representation**:
+- Time series: amplitude over time
+- Frequency domain: spectral analysis
+- Waveform data
+- Sampling rate (e.g., 44.1 kHz)
+
+**Analysis Techniques**:
+- Speech recognition
+- Music analysis
+- Sound classification
+- Audio fingerprinting
+- Noise reduction
+
+<div class="mermaid">
+flowchart TD
+    A[Audio Data] --> B[Time Domain<br/>Waveform]
+    A --> C[Frequency Domain<br/>Spectrum]
+
+    B --> D[Fourier Transform]
+    D --> C
+
+    B --> E[Applications]
+    C --> E
+
+    E --> F[Speech Recognition<br/>🎤]
+    E --> G[Music Analysis<br/>🎵]
+    E --> H[Sound Classification<br/>🔊]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+</div>
+
+#### 4. NoSQL Databases 🗃️
+
+Unstructured data is frequently stored in **NoSQL databases** (such as **MongoDB**, **Cassandra**, etc.). Because they are **flexible and scalable**, they can store and retrieve unstructured data such as **documents** (JSON, XML), **key-value pairs**, **wide-column stores**, or **graph formats**.
+
+**Types of NoSQL Databases**:
+
+**Document Stores** 📄
+- Store data as documents (JSON, BSON, XML)
+- Flexible schema
+- Examples: MongoDB, CouchDB
+
+**Key-Value Stores** 🔑
+- Simple key-value pairs
+- Fast retrieval
+- Examples: Redis, DynamoDB
+
+**Wide-Column Stores** 📊
+- Column-family storage
+- Scalable for big data
+- Examples: Cassandra, HBase
+
+**Graph Databases** 🕸️
+- Store relationships between entities
+- Network analysis
+- Examples: Neo4j, ArangoDB
+
+<div class="mermaid">
+graph TB
+    A[NoSQL Databases] --> B[Document Stores<br/>📄]
+    A --> C[Key-Value Stores<br/>🔑]
+    A --> D[Wide-Column Stores<br/>📊]
+    A --> E[Graph Databases<br/>🕸️]
+
+    B --> B1[MongoDB<br/>CouchDB<br/>JSON/BSON]
+    C --> C1[Redis<br/>DynamoDB<br/>Fast retrieval]
+    D --> D1[Cassandra<br/>HBase<br/>Big data]
+    E --> E1[Neo4j<br/>ArangoDB<br/>Relationships]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style D1 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style E1 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+</div>
+
+#### 5. Big Data Technologies 🌐
+
+At scale, unstructured data is processed and analysed using tools like **Hadoop** or **Spark**.
+
+**Characteristics**:
+- Distributed processing
+- Handle massive datasets (petabytes)
+- Parallel computation
+- Fault tolerance
+- Scalability
+
+**Key Technologies**:
+- **Hadoop**: Distributed storage and processing (HDFS, MapReduce)
+- **Spark**: Fast in-memory processing
+- **Kafka**: Real-time data streaming
+- **Flink**: Stream processing
+
+<div class="mermaid">
+flowchart LR
+    A[Big Data Sources<br/>Terabytes/Petabytes] --> B[Hadoop/Spark<br/>Distributed Processing]
+
+    B --> C[Storage<br/>HDFS]
+    B --> D[Processing<br/>MapReduce/Spark]
+    B --> E[Streaming<br/>Kafka/Flink]
+
+    C --> F[Analysis Results]
+    D --> F
+    E --> F
+
+    F --> G[Insights &<br/>Decision Making<br/>💡]
+
+    style A fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style E fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style F fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 📋 Unstructured Data Comparison Table
+
+| Type | Representation | Analysis Tools | Use Cases | Examples |
+|------|----------------|----------------|-----------|----------|
+| **Text** | Documents, strings | NLP, text mining | Sentiment analysis, topic modeling | Emails, social media, articles |
+| **Images/Videos** | Multi-dimensional arrays | Computer vision, deep learning | Object detection, facial recognition | Photos, surveillance, media |
+| **Audio** | Time series, frequency domain | Signal processing, ML | Speech recognition, music analysis | Voice recordings, podcasts |
+| **NoSQL** | Documents, key-value, graphs | Database queries, aggregations | Flexible data storage | MongoDB, Redis, Neo4j |
+| **Big Data** | Distributed files | Hadoop, Spark | Large-scale analytics | Web logs, sensor data, clickstreams |
+
+---
+
+### 🔄 Combining Structured and Unstructured Data
+
+To gain more thorough insights into user behaviour, you might, for instance, **combine structured data** about user demographics from a relational database with **unstructured text data** from user reviews.
+
+<div class="mermaid">
+flowchart TD
+    A[Data Integration] --> B[Structured Data<br/>📊]
+    A --> C[Unstructured Data<br/>📁]
+
+    B --> B1[Customer Demographics<br/>Age, Location, Income]
+    B --> B2[Purchase History<br/>Transactions, Amounts]
+
+    C --> C1[Customer Reviews<br/>Text, Ratings]
+    C --> C2[Social Media<br/>Posts, Comments]
+
+    B1 --> D[Combined Analysis]
+    B2 --> D
+    C1 --> D
+    C2 --> D
+
+    D --> E[Comprehensive Insights<br/>💡]
+
+    E --> F[Better Understanding<br/>of Customer Behavior]
+    E --> G[Improved Decision<br/>Making]
+    E --> H[Personalized<br/>Recommendations]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style F fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style G fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style H fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+</div>
+
+#### 💡 Important Insights
+
+<div class="important-info">
+**The complexity of handling unstructured data** has led to an explosion of new strategies and tools. For instance, **Natural Language Processing (NLP)** has emerged as a crucial tool for analysing textual data, assisting computers in subtly comprehending human language.
+
+Furthermore, **machine learning** is becoming increasingly crucial in handling unstructured data, whether text, image, audio, or video. In addition to many other tasks, algorithms can be trained to:
+- Classify images
+- Convert speech to text
+- Determine the tone of customer reviews
+- And much more
+
+This demonstrates the **enormous potential** that unstructured data possesses and the growing significance of being able to manage and analyse it well.
+</div>
+
+#### 🎯 The Ultimate Goal
+
+<div class="key-concept">
+**Remember**: Data is only as valuable as the conclusions drawn from it. Whether the data is **structured** or **unstructured**, the ultimate objective is to derive **valuable and practical insights** to inform **decision-making**. And that's where **data analysis** really adds value.
+</div>
+
+<div class="mermaid">
+flowchart TD
+    A[Raw Data<br/>Structured + Unstructured] --> B[Data Processing<br/>& Analysis]
+
+    B --> C[Extract Patterns]
+    B --> D[Identify Trends]
+    B --> E[Generate Insights]
+
+    C --> F[Actionable Intelligence<br/>💡]
+    D --> F
+    E --> F
+
+    F --> G[Informed Decision<br/>Making]
+
+    G --> H[Business Value<br/>✅]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style F fill:#9B59B6,stroke:#6C3483,stroke-width:3px,color:#fff
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+### 📊 Data Analysis Workflow: From Data to Value
+
+<div class="mermaid">
+flowchart LR
+    subgraph "Data Collection"
+        A1[Structured Sources<br/>Databases, CSV]
+        A2[Unstructured Sources<br/>Text, Images, Audio]
+    end
+
+    subgraph "Data Storage"
+        B1[Relational DB]
+        B2[NoSQL DB]
+        B3[Data Lake]
+    end
+
+    subgraph "Data Processing"
+        C1[SQL Queries]
+        C2[NLP/ML]
+        C3[Big Data Tools]
+    end
+
+    subgraph "Analysis & Insights"
+        D1[Statistical Analysis]
+        D2[Pattern Recognition]
+        D3[Predictive Models]
+    end
+
+    subgraph "Decision Making"
+        E1[Business Decisions<br/>💼]
+        E2[Strategic Planning<br/>📈]
+        E3[Operational Improvements<br/>⚙️]
+    end
+
+    A1 --> B1
+    A1 --> B3
+    A2 --> B2
+    A2 --> B3
+
+    B1 --> C1
+    B2 --> C2
+    B3 --> C3
+
+    C1 --> D1
+    C2 --> D2
+    C3 --> D3
+
+    D1 --> E1
+    D2 --> E2
+    D3 --> E3
+
+    style A1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style A2 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B2 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B3 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style C1 fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C2 fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C3 fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D1 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D2 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D3 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E1 fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E2 fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E3 fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+---
+
+### 🔑 Key Technologies Summary
+
+<div class="mermaid">
+graph TB
+    subgraph "Structured Data Technologies"
+        S1[SQL Databases<br/>MySQL, PostgreSQL]
+        S2[Spreadsheets<br/>Excel, CSV]
+        S3[Data Frames<br/>pandas, R]
+    end
+
+    subgraph "Unstructured Data Technologies"
+        U1[NLP Tools<br/>NLTK, spaCy]
+        U2[Computer Vision<br/>OpenCV, TensorFlow]
+        U3[NoSQL Databases<br/>MongoDB, Redis]
+        U4[Big Data<br/>Hadoop, Spark]
+    end
+
+    subgraph "Analysis & ML"
+        M1[Machine Learning<br/>scikit-learn, PyTorch]
+        M2[Deep Learning<br/>Neural Networks]
+        M3[Statistical Analysis<br/>R, SciPy]
+    end
+
+    S1 --> M1
+    S2 --> M1
+    S3 --> M1
+    U1 --> M2
+    U2 --> M2
+    U3 --> M1
+    U4 --> M1
+
+    M1 --> Result[Insights &<br/>Predictions<br/>💡]
+    M2 --> Result
+    M3 --> Result
+
+    style S1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style S2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style S3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style U1 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style U2 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style U3 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style U4 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style M1 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style M2 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style M3 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style Result fill:#FFD700,stroke:#B8860B,stroke-width:3px
+</div>
+
+---
+
+### 🔢 Data Types
+
+Tabular data structures can store a variety of **basic data types**. Although their naming differs across platforms, most storage systems share the same fundamental data types, such as **numeric**, **string-based**, **Boolean**, and **date/time**.
+
+<div class="mermaid">
+graph TB
+    A[Fundamental Data Types] --> B[Numeric<br/>🔢<br/>Numbers & Calculations]
+    A --> C[String/Character<br/>📝<br/>Text Data]
+    A --> D[Boolean<br/>✓/✗<br/>True/False]
+    A --> E[Date/Time<br/>📅<br/>Temporal Data]
+
+    B --> B1[Integer]
+    B --> B2[Float]
+    B --> B3[Complex]
+
+    C --> C1[Character]
+    C --> C2[String]
+
+    D --> D1[True 1]
+    D --> D2[False 0]
+
+    E --> E1[Date]
+    E --> E2[Time]
+    E --> E3[DateTime]
+    E --> E4[TimeSpan]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B2 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B3 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style C2 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style D1 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style D2 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style E1 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style E2 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style E3 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style E4 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+</div>
+
+---
+
+#### 1. Numeric Data Types 🔢
+
+**Numeric data** is used to store values on which **mathematical operations are to be carried out** and is the first type of data.
+
+##### Integer (int) 🔢
+
+This represents **positive and negative whole numbers**, such as -1, 0, 1, 2, etc.
+
+**Characteristics**:
+- Whole numbers only (no decimals)
+- Can be positive, negative, or zero
+- Used for counting, indexing, IDs
+- Fixed size in memory (e.g., 32-bit, 64-bit)
+
+**Examples**:
+- Age: 25, 30, 45
+- Count: 0, 1, 100, 1000
+- Temperature: -10, 0, 25 (in Celsius)
+- ID numbers: 12345, 67890
+
+**Use Cases**:
+- Counting items (inventory, users, transactions)
+- Indexing arrays and databases
+- Representing discrete quantities
+- Loop counters and iterations
+
+##### Float (Floating-Point) 🎯
+
+This represents **real numbers** (i.e., decimal numbers), such as -1.23, 0.0, 3.14, etc.
+
+**Characteristics**:
+- Can represent decimal values
+- Approximate representation (not always exact)
+- Used for measurements and calculations
+- Variable precision (float32, float64/double)
+
+**Examples**:
+- Price: 19.99, 99.95, 1234.56
+- Weight: 65.5 kg, 150.2 lbs
+- Temperature: 36.6°C, 98.6°F
+- Pi: 3.14159...
+
+**Use Cases**:
+- Financial calculations (prices, amounts)
+- Scientific measurements
+- Statistical analysis
+- Coordinates (latitude, longitude)
+
+##### Complex Numbers 🌀
+
+This represents **complex numbers**, also called composite numbers, which include both **real and imaginary components**, such as 3 + 2j. Complex numbers are frequently represented by two float values in computing systems.
+
+**Characteristics**:
+- Combination of real and imaginary parts
+- Format: a + bj (where j = √-1)
+- Used in advanced mathematics and engineering
+- Stored as two float values
+
+**Examples**:
+- 3 + 2j
+- -1 + 4j
+- 5.5 + 0j (real number as complex)
+- 0 + 3j (purely imaginary)
+
+**Use Cases**:
+- Signal processing
+- Electrical engineering
+- Quantum mechanics
+- Advanced mathematical computations
+
+<div class="mermaid">
+graph TB
+    subgraph "Numeric Data Types"
+        A[Numeric Types] --> B[Integer<br/>Whole Numbers]
+        A --> C[Float<br/>Decimal Numbers]
+        A --> D[Complex<br/>Real + Imaginary]
+
+        B --> B1[Examples:<br/>-1, 0, 1, 100]
+        B --> B2[Use: Counting,<br/>IDs, Indexing]
+
+        C --> C1[Examples:<br/>3.14, -1.23, 99.99]
+        C --> C2[Use: Prices,<br/>Measurements]
+
+        D --> D1[Examples:<br/>3+2j, -1+4j]
+        D --> D2[Use: Engineering,<br/>Signal Processing]
+    end
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B2 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style C2 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style D1 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style D2 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+</div>
+
+---
+
+#### 2. String/Character Data Types 📝
+
+Data can also be saved as **strings or characters**. This is commonly referred to as **text storage** in many systems. A **single entity**, like the letter 'a', is referred to as a **character**, while a **group of characters**, like 'abc', is referred to as a **string**.
+
+<div class="key-concept">
+**Important**: This type of data includes **any character** included in the encoding/representation format used on the local device in addition to alphabetic characters. This includes:
+- Alphabetic characters (A-Z, a-z)
+- Punctuation (., !, ?, etc.)
+- Special characters (@, #, $, %, etc.)
+- Numbers that aren't used in calculations (like a phone number: "555-1234")
+- Whitespace (spaces, tabs, newlines)
+- Unicode characters (emojis, international characters)
+</div>
+
+##### Character (char) 🔤
+
+A **single character** or symbol.
+
+**Characteristics**:
+- Single letter, digit, or symbol
+- Enclosed in single quotes: 'a', '1', '@'
+- Fixed size (typically 1 byte for ASCII, more for Unicode)
+
+**Examples**:
+- 'a', 'Z', '5', '@', '!', ' '
+
+##### String (str) 📄
+
+A **sequence of characters** forming text.
+
+**Characteristics**:
+- Multiple characters grouped together
+- Enclosed in quotes: "hello", 'world'
+- Variable length
+- Immutable in some languages, mutable in others
+
+**Examples**:
+- "Hello, World!"
+- "John Doe"
+- "555-1234" (phone number as text)
+- "user@example.com"
+- "2023-06-20" (date as text)
+
+**Use Cases**:
+- Names and addresses
+- Email addresses and URLs
+- Phone numbers (not for calculations)
+- Descriptions and comments
+- Identifiers (product codes, SKUs)
+
+<div class="mermaid">
+flowchart LR
+    A[Text Data] --> B[Character<br/>Single Entity]
+    A --> C[String<br/>Multiple Characters]
+
+    B --> B1['a', 'Z', '5', '@']
+
+    C --> C1["Names:<br/>'John Doe'"]
+    C --> C2["Emails:<br/>'user@example.com'"]
+    C --> C3["Phone:<br/>'555-1234'"]
+    C --> C4["Text:<br/>'Hello, World!'"]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B1 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style C1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C2 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C3 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C4 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+</div>
+
+---
+
+#### 3. Boolean Data Type ✓/✗
+
+**Boolean formats** can also be used to represent data. This data type is used when only **True or False** values need to be stored. When storing Boolean (or Bool) data, only **one binary bit** is typically used, with **0 denoting false** and **1 denoting true**.
+
+**Characteristics**:
+- Only two possible values: True or False
+- Minimal storage (1 bit)
+- Used for logical operations and conditions
+- Named after mathematician George Boole
+
+**Representations**:
+- True: 1, true, True, yes, on
+- False: 0, false, False, no, off
+
+**Examples**:
+- is_active: True
+- has_discount: False
+- is_verified: True
+- email_confirmed: False
+
+**Use Cases**:
+- Flags and switches (is_active, is_deleted)
+- Conditional logic (if statements)
+- User preferences (notifications_enabled)
+- Status indicators (is_paid, is_shipped)
+- Validation results (is_valid, has_error)
+
+<div class="mermaid">
+graph TB
+    A[Boolean Data Type] --> B[True<br/>✓<br/>1]
+    A --> C[False<br/>✗<br/>0]
+
+    B --> B1[Examples:<br/>is_active = True<br/>has_discount = True<br/>is_verified = True]
+
+    C --> C1[Examples:<br/>is_deleted = False<br/>has_error = False<br/>is_paid = False]
+
+    B --> B2[Use Cases:<br/>Flags, Switches<br/>Conditions, Status]
+    C --> B2
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style B2 fill:#E3F2FD,stroke:#2196F3,stroke-width:2px
+</div>
+
+---
+
+#### 4. Date/Time Data Types 📅
+
+The final data type that might be frequently used is **date/time**. They can take a variety of shapes, including **dates** (like 2023-06-20), **times** (like 13:45:30), **datetimes** (a mashup of dates and times), and **time spans**.
+
+##### Date 📅
+
+Represents a **calendar date** without time information.
+
+**Characteristics**:
+- Year, month, and day
+- No time component
+- Various formats (ISO, US, European)
+
+**Common Formats**:
+- ISO 8601: 2023-06-20 (YYYY-MM-DD)
+- US Format: 06/20/2023 (MM/DD/YYYY)
+- European: 20/06/2023 (DD/MM/YYYY)
+- Long Format: June 20, 2023
+
+**Examples**:
+- Birth date: 1990-05-15
+- Order date: 2023-12-25
+- Expiry date: 2024-12-31
+
+**Use Cases**:
+- Birth dates and anniversaries
+- Order and delivery dates
+- Expiration dates
+- Event scheduling
+
+##### Time ⏰
+
+Represents a **time of day** without date information.
+
+**Characteristics**:
+- Hours, minutes, seconds (and sometimes milliseconds)
+- No date component
+- 24-hour or 12-hour format
+
+**Common Formats**:
+- 24-hour: 13:45:30 (HH:MM:SS)
+- 12-hour: 01:45:30 PM
+- With milliseconds: 13:45:30.123
+
+**Examples**:
+- Meeting time: 14:30:00
+- Store opening: 09:00:00
+- Alarm time: 07:30:00
+
+**Use Cases**:
+- Appointment times
+- Business hours
+- Alarm settings
+- Time tracking
+
+##### DateTime 📅⏰
+
+Represents a **combination of date and time**.
+
+**Characteristics**:
+- Complete timestamp
+- Includes both date and time
+- Often includes timezone information
+
+**Common Formats**:
+- ISO 8601: 2023-06-20T13:45:30
+- With timezone: 2023-06-20T13:45:30+00:00
+- Unix timestamp: 1687267530 (seconds since 1970-01-01)
+
+**Examples**:
+- Order timestamp: 2023-12-25T10:30:00
+- Login time: 2023-06-20T13:45:30Z
+- Event start: 2024-01-01T00:00:00
+
+**Use Cases**:
+- Transaction timestamps
+- Log entries
+- Event scheduling with specific times
+- Audit trails
+
+##### TimeSpan/Duration ⏱️
+
+Represents a **duration or interval of time**.
+
+**Characteristics**:
+- Difference between two times
+- Can be positive or negative
+- Measured in days, hours, minutes, seconds
+
+**Common Formats**:
+- Days.Hours:Minutes:Seconds
+- Total seconds or milliseconds
+- Human-readable: "2 days, 3 hours, 15 minutes"
+
+**Examples**:
+- Duration: 2 days, 5 hours
+- Elapsed time: 00:45:30 (45 minutes, 30 seconds)
+- Time difference: -01:30:00 (1.5 hours ago)
+
+**Use Cases**:
+- Calculating age or duration
+- Time differences between events
+- Session duration
+- Project timelines
+
+<div class="mermaid">
+graph TB
+    subgraph "Date/Time Data Types"
+        A[Temporal Data] --> B[Date<br/>📅<br/>Calendar Day]
+        A --> C[Time<br/>⏰<br/>Time of Day]
+        A --> D[DateTime<br/>📅⏰<br/>Date + Time]
+        A --> E[TimeSpan<br/>⏱️<br/>Duration]
+
+        B --> B1[2023-06-20<br/>06/20/2023<br/>June 20, 2023]
+        B --> B2[Use: Birth dates,<br/>Order dates,<br/>Expiry dates]
+
+        C --> C1[13:45:30<br/>01:45:30 PM<br/>14:30:00]
+        C --> C2[Use: Appointments,<br/>Business hours,<br/>Alarms]
+
+        D --> D1[2023-06-20T13:45:30<br/>Unix: 1687267530]
+        D --> D2[Use: Timestamps,<br/>Logs, Events,<br/>Audit trails]
+
+        E --> E1[2 days, 5 hours<br/>00:45:30<br/>-01:30:00]
+        E --> E2[Use: Duration,<br/>Time differences,<br/>Session length]
+    end
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style E fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style B1 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style B2 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style C1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C2 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style D1 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style D2 fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style E1 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style E2 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+</div>
+
+#### 📋 Data Types Summary Table
+
+| Category | Type | Description | Examples | Common Uses |
+|----------|------|-------------|----------|-------------|
+| **Numeric** | Integer | Whole numbers (positive/negative) | -1, 0, 1, 100 | Counting, IDs, indexing |
+| **Numeric** | Float | Decimal numbers | 3.14, -1.23, 99.99 | Prices, measurements, calculations |
+| **Numeric** | Complex | Real + imaginary numbers | 3+2j, -1+4j | Engineering, signal processing |
+| **Text** | Character | Single character | 'a', 'Z', '@' | Individual symbols |
+| **Text** | String | Sequence of characters | "Hello", "user@email.com" | Names, emails, descriptions |
+| **Logical** | Boolean | True or False | True, False, 1, 0 | Flags, conditions, status |
+| **Temporal** | Date | Calendar date | 2023-06-20 | Birth dates, order dates |
+| **Temporal** | Time | Time of day | 13:45:30 | Appointments, schedules |
+| **Temporal** | DateTime | Date + Time | 2023-06-20T13:45:30 | Timestamps, logs, events |
+| **Temporal** | TimeSpan | Duration/interval | 2 days, 5 hours | Duration, time differences |
+
+#### 🎯 Choosing the Right Data Type
+
+<div class="mermaid">
+flowchart TD
+    Start{What kind of<br/>data?} --> Numbers{Numbers?}
+    Start --> Text{Text?}
+    Start --> Logic{True/False?}
+    Start --> Temporal{Date/Time?}
+
+    Numbers -->|Whole numbers| Integer[Integer<br/>-1, 0, 1, 100]
+    Numbers -->|Decimals| Float[Float<br/>3.14, 99.99]
+    Numbers -->|Complex math| Complex[Complex<br/>3+2j]
+
+    Text -->|Single char| Char[Character<br/>'a', '@']
+    Text -->|Multiple chars| String[String<br/>"Hello World"]
+
+    Logic --> Boolean[Boolean<br/>True/False]
+
+    Temporal -->|Just date| Date[Date<br/>2023-06-20]
+    Temporal -->|Just time| Time[Time<br/>13:45:30]
+    Temporal -->|Both| DateTime[DateTime<br/>2023-06-20T13:45:30]
+    Temporal -->|Duration| TimeSpan[TimeSpan<br/>2 days, 5 hours]
+
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style Integer fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Float fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Complex fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Char fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style String fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Boolean fill:#FF6B6B,stroke:#C92A2A,stroke-width:2px,color:#fff
+    style Date fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style Time fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style DateTime fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style TimeSpan fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+</div>
+
+#### 💡 Important Considerations
+
+<div class="important-info">
+**Data Type Selection Matters**:
+
+1. **Storage Efficiency**: Choosing the right data type affects storage space and memory usage
+2. **Performance**: Operations on appropriate data types are faster and more efficient
+3. **Accuracy**: Using float for currency can cause rounding errors; use decimal types instead
+4. **Validation**: Data types enforce constraints (e.g., Boolean can only be True/False)
+5. **Compatibility**: Different systems may have different data type names but similar concepts
+6. **Conversion**: Be aware of type conversion (casting) and potential data loss
+
+**Common Pitfalls**:
+- Storing phone numbers as integers (loses leading zeros and formatting)
+- Using float for financial calculations (precision issues)
+- Storing dates as strings (difficult to sort and calculate)
+- Not considering timezone for DateTime values
+</div>
+
+---
+
+### 🔄 The Data Life Cycle
+
+Every piece of data goes through a series of stages called the **data lifecycle**, starting with its initial generation or capture and ending with its eventual archival and retirement. Understanding this lifecycle can help organisations manage their data effectively and get the most value out of it.
+
+<div class="mermaid">
+graph LR
+    A[1. Creation/<br/>Collection<br/>📥] --> B[2. Pre-processing<br/>🧹]
+    B --> C[3. Storage<br/>💾]
+    C --> D[4. Processing<br/>⚙️]
+    D --> E[5. Analysis<br/>📊]
+    E --> F[6. Visualisation<br/>& Reporting<br/>📈]
+    F --> G[7. Action<br/>💡]
+    G --> H[8. Archiving<br/>& Destruction<br/>🗄️]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+#### The 8 Stages of the Data Life Cycle
+
+---
+
+##### 1. Creation or Collection 📥
+
+**Data generation or gathering** occurs during the lifecycle's initial phase. This might entail collecting raw data from various sources.
+
+**Common Data Sources**:
+- IoT devices and sensors
+- User-generated content (social media, reviews)
+- Transactional systems (sales, purchases)
+- Data feeds and APIs
+- Web scraping and crawling
+- Manual data entry
+- Third-party data providers
+
+**Examples**:
+- E-commerce: Customer clicks, purchases, cart additions
+- Healthcare: Patient records, vital signs, lab results
+- Manufacturing: Sensor readings, production metrics
+- Social Media: Posts, likes, comments, shares
+
+<div class="mermaid">
+graph TB
+    A[Data Collection] --> B[IoT Devices<br/>📱<br/>Sensors, Wearables]
+    A --> C[User Content<br/>👥<br/>Social Media, Reviews]
+    A --> D[Transactions<br/>💳<br/>Sales, Purchases]
+    A --> E[Data Feeds<br/>🌐<br/>APIs, Web Scraping]
+
+    B --> F[Raw Data<br/>Storage]
+    C --> F
+    D --> F
+    E --> F
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+---
+
+##### 2. Pre-processing 🧹
+
+To prepare the data for analysis, this stage frequently involves **cleaning and transforming** the data.
+
+**Common Pre-processing Tasks**:
+- **Data Cleaning**: Removing errors, inconsistencies, and noise
+- **Handling Missing Data**: Imputation or removal of missing values
+- **Removing Duplicates**: Identifying and eliminating duplicate records
+- **Data Type Conversion**: Converting data to appropriate types
+- **Normalization**: Scaling values to a standard range
+- **Standardization**: Ensuring consistent formats (dates, addresses)
+- **Outlier Detection**: Identifying and handling anomalous values
+
+**Examples**:
+- Standardizing date formats: "06/20/2023" → "2023-06-20"
+- Removing duplicate customer records
+- Filling missing email addresses
+- Converting text to lowercase for consistency
+- Removing special characters from phone numbers
+
+<div class="mermaid">
+flowchart LR
+    A[Raw Data<br/>❌ Messy] --> B[Data Cleaning<br/>🧹]
+    B --> C[Handle Missing<br/>Values]
+    C --> D[Remove<br/>Duplicates]
+    D --> E[Convert<br/>Data Types]
+    E --> F[Normalize/<br/>Standardize]
+    F --> G[Clean Data<br/>✅ Ready]
+
+    style A fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style E fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style F fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+##### 3. Storage 💾
+
+Once the data is prepared, it is **stored in a way that enables easy access and retrieval**. Depending on the size and structure of the data, different storage solutions may be used.
+
+**Storage Options**:
+- **Relational Databases**: MySQL, PostgreSQL (structured data)
+- **NoSQL Databases**: MongoDB, Cassandra (unstructured/semi-structured)
+- **Data Lakes**: Store raw data in native format (all types)
+- **Data Warehouses**: Optimized for analytics and reporting
+- **Cloud Storage**: AWS S3, Azure Blob, Google Cloud Storage
+- **File Systems**: CSV, JSON, Parquet files
+
+**Considerations**:
+- Data volume and growth rate
+- Access patterns and query requirements
+- Cost and scalability
+- Security and compliance
+- Backup and disaster recovery
+
+<div class="mermaid">
+graph TB
+    A[Clean Data] --> B{Data Type &<br/>Volume?}
+
+    B -->|Structured,<br/>Relational| C[Relational DB<br/>🗄️<br/>MySQL, PostgreSQL]
+    B -->|Unstructured,<br/>Large Scale| D[NoSQL DB<br/>🌐<br/>MongoDB, Cassandra]
+    B -->|All Types,<br/>Raw Format| E[Data Lake<br/>🏞️<br/>Store Everything]
+    B -->|Analytics,<br/>Reporting| F[Data Warehouse<br/>📊<br/>Optimized Queries]
+
+    C --> G[Ready for<br/>Processing]
+    D --> G
+    E --> G
+    F --> G
+
+    style A fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style F fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+---
+
+##### 4. Processing ⚙️
+
+The stored data is **prepared for analysis** at this stage. This could entail aggregating data, creating derived variables, or combining data from various sources.
+
+**Common Processing Tasks**:
+- **Data Aggregation**: Summarizing data (totals, averages, counts)
+- **Feature Engineering**: Creating new variables from existing ones
+- **Data Integration**: Combining data from multiple sources
+- **Data Transformation**: Reshaping data for analysis
+- **Filtering**: Selecting relevant subsets of data
+- **Joining**: Merging related datasets
+
+**Examples**:
+- Calculating total sales per customer
+- Creating age groups from birth dates
+- Combining customer data with transaction data
+- Calculating moving averages
+- Creating customer segments based on behavior
+
+<div class="mermaid">
+flowchart TB
+    A[Stored Data] --> B[Aggregation<br/>📊<br/>Sum, Avg, Count]
+    A --> C[Feature Engineering<br/>🔧<br/>New Variables]
+    A --> D[Data Integration<br/>🔗<br/>Combine Sources]
+
+    B --> E[Processed Data<br/>Ready for Analysis]
+    C --> E
+    D --> E
+
+    E --> F[Example:<br/>Customer 360° View]
+
+    style A fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#50C878,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+</div>
+
+---
+
+##### 5. Analysis 📊
+
+**Insights are gleaned** from the processed data through analysis. This is where the real value of data emerges.
+
+**Analysis Techniques**:
+- **Exploratory Data Analysis (EDA)**: Understanding data patterns and distributions
+- **Statistical Analysis**: Hypothesis testing, correlation, regression
+- **Machine Learning**: Predictive modeling, classification, clustering
+- **Time Series Analysis**: Trend analysis, forecasting
+- **A/B Testing**: Comparing different approaches
+- **Cohort Analysis**: Analyzing groups over time
+
+**Examples**:
+- Identifying customer churn patterns
+- Predicting future sales
+- Segmenting customers by behavior
+- Detecting fraud or anomalies
+- Recommending products
+
+<div class="mermaid">
+graph TB
+    A[Processed Data] --> B{Analysis Type?}
+
+    B --> C[Exploratory<br/>📈<br/>Understand Patterns]
+    B --> D[Statistical<br/>📊<br/>Test Hypotheses]
+    B --> E[Machine Learning<br/>🤖<br/>Predict & Classify]
+    B --> F[Time Series<br/>⏱️<br/>Trends & Forecasts]
+
+    C --> G[Insights &<br/>Discoveries<br/>💡]
+    D --> G
+    E --> G
+    F --> G
+
+    style A fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+##### 6. Visualisation and Reporting 📈
+
+The results of analyses are frequently **visualised and presented in reports** to aid comprehension and decision-making.
+
+**Visualisation Types**:
+- **Charts**: Bar charts, line charts, pie charts, scatter plots
+- **Dashboards**: Interactive displays of key metrics
+- **Reports**: Detailed documents with findings and recommendations
+- **Infographics**: Visual representations of complex information
+- **Maps**: Geographic data visualization
+- **Heatmaps**: Showing patterns and correlations
+
+**Tools**:
+- Tableau, Power BI, Looker (BI tools)
+- Matplotlib, Seaborn, Plotly (Python libraries)
+- D3.js (JavaScript visualization)
+- Excel, Google Sheets (spreadsheets)
+
+**Examples**:
+- Sales dashboard showing KPIs
+- Customer segmentation visualization
+- Trend analysis charts
+- Geographic sales maps
+- Executive summary reports
+
+<div class="mermaid">
+flowchart LR
+    A[Insights] --> B[Visualisation<br/>Tools]
+
+    B --> C[Charts<br/>📊<br/>Bar, Line, Pie]
+    B --> D[Dashboards<br/>📈<br/>Interactive KPIs]
+    B --> E[Reports<br/>📄<br/>Detailed Findings]
+
+    C --> F[Decision Makers<br/>👥]
+    D --> F
+    E --> F
+
+    F --> G[Understanding<br/>& Clarity<br/>💡]
+
+    style A fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+##### 7. Action 💡
+
+**Business decisions and actions** are guided by the revelations gained from data analysis.
+
+**Types of Actions**:
+- **Strategic Decisions**: Long-term planning and direction
+- **Operational Improvements**: Process optimization and efficiency
+- **Product Development**: New features or products
+- **Marketing Campaigns**: Targeted promotions and messaging
+- **Customer Experience**: Personalization and service improvements
+- **Risk Management**: Identifying and mitigating risks
+- **Resource Allocation**: Optimizing budgets and staffing
+
+**Examples**:
+- Launching a targeted marketing campaign
+- Redesigning a website based on user behavior
+- Adjusting pricing strategy
+- Improving supply chain efficiency
+- Personalizing product recommendations
+- Implementing fraud prevention measures
+
+<div class="mermaid">
+graph TB
+    A[Data-Driven<br/>Insights] --> B{Action Type?}
+
+    B --> C[Strategic<br/>🎯<br/>Long-term Planning]
+    B --> D[Operational<br/>⚙️<br/>Process Optimization]
+    B --> E[Marketing<br/>📢<br/>Campaigns & Targeting]
+    B --> F[Product<br/>🛍️<br/>Development & Features]
+
+    C --> G[Business<br/>Impact<br/>📈]
+    D --> G
+    E --> G
+    F --> G
+
+    G --> H[Competitive<br/>Advantage<br/>🏆]
+
+    style A fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#E74C3C,stroke:#C0392B,stroke-width:3px,color:#fff
+</div>
+
+---
+
+##### 8. Archiving and Destruction 🗄️
+
+Data is frequently **archived** after it has served its purpose in case it is needed in the future or for legal reasons. When a certain amount of time has passed, and the data is no longer required, it may be **deleted** in accordance with data retention policies and laws.
+
+**Archiving**:
+- Long-term storage of inactive data
+- Compliance with legal requirements
+- Historical reference and auditing
+- Reduced storage costs (cold storage)
+- Disaster recovery and backup
+
+**Destruction**:
+- Secure deletion of obsolete data
+- Compliance with data retention policies
+- Privacy regulations (GDPR, CCPA)
+- Reducing security risks
+- Freeing up storage space
+
+**Considerations**:
+- Legal and regulatory requirements
+- Data retention policies
+- Privacy and security
+- Cost optimization
+- Audit trails
+
+<div class="mermaid">
+flowchart TD
+    A[Data Lifecycle<br/>Complete] --> B{Still Needed?}
+
+    B -->|Yes, for<br/>compliance| C[Archive<br/>🗄️<br/>Long-term Storage]
+    B -->|No, obsolete| D[Destroy<br/>🗑️<br/>Secure Deletion]
+
+    C --> E[Cold Storage<br/>Low Cost]
+    C --> F[Compliance<br/>Legal Requirements]
+
+    D --> G[Privacy<br/>GDPR, CCPA]
+    D --> H[Security<br/>Reduce Risk]
+
+    E --> I[Future Reference<br/>if Needed]
+    F --> I
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style E fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style F fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style G fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style H fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style I fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+</div>
+
+---
+
+#### 🔑 Key Considerations at Each Stage
+
+<div class="important-info">
+Each stage in this lifecycle has its own **data quality, governance, privacy, and security considerations**:
+
+**Data Quality**:
+- Accuracy, completeness, consistency, timeliness
+- Validation and verification at each stage
+- Error detection and correction
+
+**Data Governance**:
+- Policies and procedures for data management
+- Roles and responsibilities
+- Standards and best practices
+- Compliance and auditing
+
+**Privacy**:
+- Personal data protection (GDPR, CCPA)
+- Consent and transparency
+- Data minimization
+- Right to be forgotten
+
+**Security**:
+- Access controls and authentication
+- Encryption (at rest and in transit)
+- Backup and disaster recovery
+- Threat detection and prevention
+</div>
+
+---
+
+### 📚 Real-World Example: RetailCo's Data Life Cycle
+
+Let's consider the example of a retail organisation that relies heavily on customer data to drive its strategic decisions. For simplicity's sake, we'll call this organisation **'RetailCo'**. Here's how data moves through the data lifecycle at RetailCo:
+
+<div class="mermaid">
+graph TB
+    subgraph "RetailCo Data Life Cycle"
+        A[1. Collection<br/>📥<br/>E-commerce, POS,<br/>Loyalty Cards] --> B[2. Pre-processing<br/>🧹<br/>Clean, Standardize,<br/>Remove Duplicates]
+        B --> C[3. Storage<br/>💾<br/>Relational DB + NoSQL<br/>+ Data Lake]
+        C --> D[4. Processing<br/>⚙️<br/>Combine Transaction<br/>+ Feedback Data]
+        D --> E[5. Analysis<br/>📊<br/>ML Forecasting,<br/>Behavior Trends]
+        E --> F[6. Visualisation<br/>📈<br/>KPI Dashboards,<br/>Reports]
+        F --> G[7. Action<br/>💡<br/>Marketing Campaigns,<br/>Website Redesign]
+        G --> H[8. Archive/Destroy<br/>🗄️<br/>Compliance,<br/>Data Retention]
+    end
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+#### Detailed RetailCo Example by Stage
+
+##### 1. Creation or Collection 📥
+
+RetailCo gathers information from various sources. For instance, **transactional data** may come from their e-commerce platform or point-of-sale systems in their physical stores. They might also gather information from **customer surveys** or **loyalty cards**. All of this unprocessed data is initially collected and stored for later processing.
+
+**RetailCo's Data Sources**:
+- E-commerce platform (online purchases, browsing behavior)
+- Point-of-Sale (POS) systems (in-store transactions)
+- Loyalty card programs (customer IDs, purchase history)
+- Customer surveys (satisfaction ratings, feedback)
+- Website analytics (clicks, page views, time on site)
+- Mobile app usage data
+
+##### 2. Pre-processing 🧹
+
+The next step is to clean and transform this raw data. For RetailCo, this might entail **removing duplicate customer records**, **standardising data formats**, checking for **missing or incorrect data** (such as a customer's address or email), and ensuring that data is **consistent across all sources**.
+
+**RetailCo's Pre-processing Tasks**:
+- Remove duplicate customer records (same person, multiple entries)
+- Standardize date formats across all systems
+- Validate email addresses and phone numbers
+- Fill missing customer addresses using postal code lookup
+- Standardize product names and categories
+- Convert currency values to consistent format
+- Remove test transactions and invalid data
+
+##### 3. Storage 💾
+
+After cleaning, the data is easily accessible and stored for later analysis. For more unstructured data, such as transactional data, RetailCo may use a combination of **relational databases** and **NoSQL databases** or **data lakes** (like customer feedback).
+
+**RetailCo's Storage Strategy**:
+- **Relational Database (PostgreSQL)**: Customer profiles, product catalog, transactions
+- **NoSQL Database (MongoDB)**: Customer reviews, feedback, social media mentions
+- **Data Lake (AWS S3)**: Raw logs, clickstream data, images
+- **Data Warehouse (Snowflake)**: Aggregated data for analytics and reporting
+
+##### 4. Processing ⚙️
+
+The data is now prepared for processing and analysis. To obtain a comprehensive understanding of the customer, RetailCo may **combine data from various sources**. For instance, they might combine **transaction data with customer feedback** to better understand the relationship between customer satisfaction and spending.
+
+**RetailCo's Processing Activities**:
+- Join customer profiles with transaction history
+- Combine online and offline purchase data
+- Merge customer feedback with product purchases
+- Calculate customer lifetime value (CLV)
+- Create customer segments based on behavior
+- Aggregate sales by product, category, region, time period
+- Calculate key metrics: average order value, purchase frequency
+
+##### 5. Analysis 📊
+
+After processing the data, insights are gleaned through analysis. RetailCo may employ **machine learning algorithms** to forecast future spending patterns or **statistical analysis** to comprehend trends in consumer behaviour.
+
+**RetailCo's Analysis Techniques**:
+- **Customer Segmentation**: Clustering customers by behavior (RFM analysis)
+- **Churn Prediction**: ML models to identify at-risk customers
+- **Sales Forecasting**: Time series analysis for demand prediction
+- **Market Basket Analysis**: Identifying product associations
+- **Sentiment Analysis**: NLP on customer reviews and feedback
+- **A/B Testing**: Comparing different marketing approaches
+- **Cohort Analysis**: Tracking customer groups over time
+
+##### 6. Visualisation and Reporting 📈
+
+The analysis's findings are presented in a straightforward manner for decision-makers to comprehend. RetailCo may design **dashboards** that show key performance indicators (KPIs) or in-depth **reports** that analyse consumer behaviour in great detail.
+
+**RetailCo's Visualizations**:
+- **Executive Dashboard**: Sales, revenue, customer acquisition, churn rate
+- **Product Performance**: Best sellers, slow movers, inventory levels
+- **Customer Analytics**: Segmentation, lifetime value, satisfaction scores
+- **Geographic Analysis**: Sales by region, store performance maps
+- **Trend Reports**: Year-over-year comparisons, seasonal patterns
+- **Campaign Performance**: Marketing ROI, conversion rates
+
+##### 7. Action 💡
+
+RetailCo can then make strategic decisions based on these revelations. For instance, they might **redesign a portion of their e-commerce website** to enhance the user experience or **target a specific customer segment** with a marketing campaign.
+
+**RetailCo's Data-Driven Actions**:
+- **Targeted Marketing**: Email campaign to high-value customers at risk of churning
+- **Website Redesign**: Improve checkout process based on abandonment analysis
+- **Personalization**: Product recommendations based on purchase history
+- **Inventory Optimization**: Stock levels adjusted based on demand forecasts
+- **Pricing Strategy**: Dynamic pricing for slow-moving products
+- **Customer Service**: Proactive outreach to dissatisfied customers
+- **Store Layout**: Optimize product placement based on market basket analysis
+
+##### 8. Archiving and Destruction 🗄️
+
+Some of the gathered information will lose significance over time. This information will be **archived** by RetailCo, keeping it secure but out of the way. Old data that is no longer useful or that they are no longer required to keep for compliance reasons may also be **destroyed**.
+
+**RetailCo's Data Retention**:
+- **Active Data** (0-2 years): Readily accessible in production databases
+- **Archived Data** (2-7 years): Moved to cold storage for compliance
+- **Destroyed Data** (7+ years): Securely deleted after retention period
+- **Compliance**: GDPR right to be forgotten, PCI DSS requirements
+- **Audit Trails**: Maintain logs of data access and deletion
+
+<div class="important-info">
+**RetailCo's Compliance and Ethics**:
+
+Throughout this lifecycle, RetailCo must comply with **data protection laws** and **ethical standards**, especially when handling sensitive customer data. To guarantee that data is dealt with properly at every stage of its lifecycle, they must also have strong **data governance structures** in place.
+
+**Key Requirements**:
+- **GDPR Compliance**: Customer consent, data minimization, right to access/deletion
+- **PCI DSS**: Secure handling of payment card information
+- **Data Governance**: Clear policies, roles, and responsibilities
+- **Security**: Encryption, access controls, regular audits
+- **Ethics**: Transparency, fairness, customer trust
+</div>
+
+---
+
+### 🌟 Benefits of Employing a Data Life Cycle
+
+There are several advantages to using a **data lifecycle approach** within an organisation. A systematic approach to managing data throughout its lifecycle can transform how organisations operate and compete.
+
+<div class="mermaid">
+graph TB
+    A[Data Life Cycle<br/>Approach] --> B[Enhanced<br/>Decision-Making<br/>🎯]
+    A --> C[Improved<br/>Data Quality<br/>✓]
+    A --> D[Efficient<br/>Management<br/>⚙️]
+    A --> E[Regulatory<br/>Compliance<br/>📋]
+    A --> F[Cost<br/>Savings<br/>💰]
+    A --> G[Security &<br/>Privacy<br/>🔒]
+    A --> H[Maximise<br/>Value<br/>📈]
+
+    B --> I[Better Business<br/>Outcomes]
+    C --> I
+    D --> I
+    E --> I
+    F --> I
+    G --> I
+    H --> I
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style I fill:#FFD700,stroke:#B8860B,stroke-width:3px
+</div>
+
+---
+
+#### 1. Enhanced Decision-Making 🎯
+
+A structured data lifecycle makes sure that data is **gathered, saved, and analysed in an organised and systematic way**. This increases the data's dependability and, as a result, the insights that can be drawn from it, improving decision-making.
+
+**How It Helps**:
+- **Systematic Collection**: Ensures all relevant data is captured consistently
+- **Reliable Storage**: Data is accessible when needed for analysis
+- **Quality Analysis**: Clean, well-prepared data leads to accurate insights
+- **Timely Insights**: Efficient processes enable faster decision-making
+- **Confidence**: Decision-makers trust data-driven recommendations
+
+**Examples**:
+- Retail: Accurate sales forecasts based on clean historical data
+- Healthcare: Reliable patient outcomes analysis for treatment decisions
+- Finance: Risk assessment based on comprehensive, validated data
+- Manufacturing: Production optimization using real-time sensor data
+
+<div class="mermaid">
+flowchart LR
+    A[Structured<br/>Data Lifecycle] --> B[Organized<br/>Collection]
+    B --> C[Systematic<br/>Storage]
+    C --> D[Quality<br/>Analysis]
+    D --> E[Reliable<br/>Insights]
+    E --> F[Better<br/>Decisions<br/>🎯]
+
+    F --> G[Competitive<br/>Advantage]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style G fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+---
+
+#### 2. Improved Data Quality ✓
+
+Organisations can **maintain high data quality** throughout the process using a lifecycle approach. Systematic data cleaning, validation, and transformation steps ensure the **accuracy and dependability** of the data used for decision-making.
+
+**Quality Dimensions**:
+- **Accuracy**: Data correctly represents reality
+- **Completeness**: All required data is present
+- **Consistency**: Data is uniform across systems
+- **Timeliness**: Data is up-to-date and available when needed
+- **Validity**: Data conforms to defined formats and rules
+- **Uniqueness**: No duplicate records
+
+**Quality Assurance Activities**:
+- Data validation at collection point
+- Automated data cleaning processes
+- Regular data quality audits
+- Standardization and normalization
+- Error detection and correction
+- Data profiling and monitoring
+
+**Impact**:
+- Reduced errors in analysis and reporting
+- Increased trust in data-driven insights
+- Better customer experiences (accurate information)
+- Fewer costly mistakes from bad data
+
+<div class="mermaid">
+graph TB
+    A[Data Lifecycle<br/>Approach] --> B[Collection<br/>Validation]
+    A --> C[Pre-processing<br/>Cleaning]
+    A --> D[Storage<br/>Integrity]
+    A --> E[Processing<br/>Verification]
+
+    B --> F[High Quality<br/>Data<br/>✓]
+    C --> F
+    D --> F
+    E --> F
+
+    F --> G[Accurate<br/>Analysis]
+    F --> H[Reliable<br/>Insights]
+    F --> I[Trusted<br/>Decisions]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style G fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style H fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style I fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+</div>
+
+---
+
+#### 3. Efficient Data Management ⚙️
+
+Data resources can be **managed effectively** by comprehending and adhering to a data lifecycle. It guarantees that data is appropriately stored, readily available, and archived, or properly disposed of when it is no longer required.
+
+**Efficiency Gains**:
+- **Optimized Storage**: Right data in the right place at the right time
+- **Easy Access**: Quick retrieval of needed data
+- **Reduced Redundancy**: Eliminate duplicate data storage
+- **Automated Processes**: Streamlined workflows reduce manual effort
+- **Clear Ownership**: Defined roles and responsibilities
+- **Better Organization**: Structured data catalogs and metadata
+
+**Resource Optimization**:
+- Active data in fast, accessible storage
+- Archived data in cost-effective cold storage
+- Obsolete data properly deleted
+- Storage costs aligned with data value
+- Efficient backup and recovery processes
+
+**Productivity Benefits**:
+- Less time searching for data
+- Faster data preparation for analysis
+- Reduced IT overhead
+- More time for value-added activities
+
+<div class="mermaid">
+flowchart TD
+    A[Data Lifecycle<br/>Management] --> B{Data Age &<br/>Usage?}
+
+    B -->|Active,<br/>Frequent| C[Hot Storage<br/>💾<br/>Fast Access]
+    B -->|Occasional<br/>Access| D[Warm Storage<br/>📦<br/>Balanced]
+    B -->|Rare,<br/>Compliance| E[Cold Storage<br/>🗄️<br/>Low Cost]
+    B -->|Obsolete| F[Delete<br/>🗑️<br/>Free Space]
+
+    C --> G[Efficient<br/>Management<br/>⚙️]
+    D --> G
+    E --> G
+    F --> G
+
+    G --> H[Cost Savings<br/>+ Performance]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#757575,stroke:#424242,stroke-width:2px,color:#fff
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+---
+
+#### 4. Regulatory Compliance 📋
+
+Organisations can better comply with laws like the **GDPR**, **HIPAA**, or the **POPI Act** by incorporating data security and privacy considerations into the data lifecycle. This can lessen the possibility of legal problems, penalties, and reputational harm.
+
+**Key Regulations**:
+- **GDPR** (General Data Protection Regulation): EU data protection
+- **CCPA** (California Consumer Privacy Act): California privacy rights
+- **HIPAA** (Health Insurance Portability and Accountability Act): Healthcare data
+- **POPI Act** (Protection of Personal Information Act): South African data protection
+- **PCI DSS** (Payment Card Industry Data Security Standard): Payment data
+- **SOX** (Sarbanes-Oxley Act): Financial reporting
+
+**Compliance Benefits**:
+- **Audit Trails**: Complete record of data handling
+- **Data Lineage**: Track data from source to destination
+- **Access Controls**: Who can access what data and when
+- **Retention Policies**: Automated compliance with retention rules
+- **Right to Erasure**: Ability to delete personal data on request
+- **Consent Management**: Track and honor user consent
+
+**Risk Mitigation**:
+- Avoid hefty fines (GDPR: up to €20M or 4% of revenue)
+- Prevent legal issues and lawsuits
+- Protect brand reputation
+- Maintain customer trust
+- Ensure business continuity
+
+<div class="mermaid">
+graph TB
+    A[Data Lifecycle<br/>with Compliance] --> B[GDPR<br/>🇪🇺<br/>Privacy Rights]
+    A --> C[HIPAA<br/>🏥<br/>Healthcare Data]
+    A --> D[PCI DSS<br/>💳<br/>Payment Security]
+    A --> E[POPI Act<br/>🇿🇦<br/>Data Protection]
+
+    B --> F[Compliance<br/>Benefits]
+    C --> F
+    D --> F
+    E --> F
+
+    F --> G[Avoid Fines<br/>💰]
+    F --> H[Legal Protection<br/>⚖️]
+    F --> I[Trust & Reputation<br/>🌟]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style F fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style I fill:#FFC107,stroke:#F57C00,stroke-width:2px
+</div>
+
+---
+
+#### 5. Cost Savings 💰
+
+Cost savings can result from **effective data management** throughout its lifecycle. One way to reduce storage costs is to archive or delete old data no longer needed. Similarly, having high-quality, well-managed data can result in efficiency gains by cutting down on the time required to fix errors or handle data-related issues.
+
+**Cost Reduction Areas**:
+
+**Storage Costs**:
+- Archive inactive data to cheaper cold storage
+- Delete obsolete data to free up space
+- Optimize storage tiers based on access patterns
+- Reduce redundant data copies
+- Compress and deduplicate data
+
+**Operational Costs**:
+- Less time fixing data quality issues
+- Reduced manual data preparation effort
+- Fewer errors requiring correction
+- Automated processes reduce labor costs
+- Faster time-to-insight
+
+**Infrastructure Costs**:
+- Right-sized storage and compute resources
+- Cloud cost optimization (pay for what you use)
+- Reduced backup and disaster recovery costs
+- Lower network bandwidth usage
+
+**Opportunity Costs**:
+- Data scientists spend more time on analysis, less on data wrangling
+- Faster decision-making leads to competitive advantages
+- Better resource allocation based on insights
+- Reduced risk of costly mistakes
+
+**ROI Examples**:
+- Retail: 30% reduction in storage costs through archiving
+- Healthcare: 40% less time on data preparation
+- Finance: Avoid $1M+ fines through compliance
+- Manufacturing: 20% efficiency gains from quality data
+
+<div class="mermaid">
+graph TB
+    A[Data Lifecycle<br/>Cost Savings] --> B[Storage<br/>Optimization<br/>💾]
+    A --> C[Operational<br/>Efficiency<br/>⚙️]
+    A --> D[Quality<br/>Improvements<br/>✓]
+    A --> E[Compliance<br/>Avoidance<br/>📋]
+
+    B --> B1[Archive old data<br/>Delete obsolete<br/>Optimize tiers]
+    C --> C1[Automation<br/>Less manual work<br/>Faster processes]
+    D --> D1[Fewer errors<br/>Less rework<br/>Better decisions]
+    E --> E1[Avoid fines<br/>Prevent breaches<br/>Reduce risk]
+
+    B1 --> F[Total Cost<br/>Savings<br/>💰]
+    C1 --> F
+    D1 --> F
+    E1 --> F
+
+    F --> G[Improved ROI<br/>📈]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B1 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style C1 fill:#FFE0B2,stroke:#FB8C00,stroke-width:2px
+    style D1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style E1 fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style F fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style G fill:#FFD700,stroke:#B8860B,stroke-width:2px
+</div>
+
+---
+
+#### 6. Security and Privacy 🔒
+
+Organisations can better **protect sensitive data** and **lower the risk of data breaches** by implementing data security measures at every stage of the data lifecycle. Similarly, maintaining customer trust can be facilitated by adhering to privacy principles throughout the data lifecycle.
+
+**Security Measures by Stage**:
+
+**Collection**:
+- Secure data transmission (HTTPS, TLS)
+- Authentication and authorization
+- Input validation to prevent injection attacks
+- Encrypted data capture
+
+**Storage**:
+- Encryption at rest (AES-256)
+- Access controls and role-based permissions
+- Database security hardening
+- Regular security audits
+
+**Processing & Analysis**:
+- Secure computing environments
+- Data masking and anonymization
+- Audit logging of data access
+- Principle of least privilege
+
+**Archiving & Destruction**:
+- Secure archival with encryption
+- Certified data destruction methods
+- Audit trails of deletion
+- Compliance with retention policies
+
+**Privacy Principles**:
+- **Data Minimization**: Collect only what's needed
+- **Purpose Limitation**: Use data only for stated purposes
+- **Transparency**: Clear communication about data use
+- **Consent**: Obtain and honor user consent
+- **Right to Access**: Allow users to view their data
+- **Right to Erasure**: Enable data deletion on request
+
+**Benefits**:
+- Reduced risk of data breaches
+- Protection of sensitive customer information
+- Compliance with privacy regulations
+- Enhanced customer trust and loyalty
+- Competitive advantage through privacy leadership
+
+<div class="mermaid">
+flowchart TB
+    A[Data Lifecycle<br/>Security & Privacy] --> B[Collection<br/>🔐<br/>Secure Transmission]
+    A --> C[Storage<br/>💾<br/>Encryption at Rest]
+    A --> D[Processing<br/>⚙️<br/>Access Controls]
+    A --> E[Destruction<br/>🗑️<br/>Secure Deletion]
+
+    B --> F[Security<br/>Measures]
+    C --> F
+    D --> F
+    E --> F
+
+    F --> G[Privacy<br/>Principles]
+
+    G --> H[Data Protection<br/>🛡️]
+    G --> I[Customer Trust<br/>🤝]
+    G --> J[Compliance<br/>✓]
+
+    H --> K[Reduced Risk<br/>+ Reputation]
+    I --> K
+    J --> K
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style F fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style G fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style H fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style I fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style J fill:#FFCDD2,stroke:#E57373,stroke-width:2px
+    style K fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+#### 7. Maximising Value from Data 📈
+
+Making the most of their data is something organisations can do by **understanding the data lifecycle**. For instance, it can assist in locating opportunities for **data reuse** since information gathered for one purpose may also be valuable for other purposes within the organisation.
+
+**Value Maximization Strategies**:
+
+**Data Reuse**:
+- Customer data collected for sales can inform marketing
+- Transaction data used for both accounting and analytics
+- Sensor data for both monitoring and predictive maintenance
+- Feedback data for product development and customer service
+
+**Cross-Functional Insights**:
+- Sales data informs inventory management
+- Customer service data improves product design
+- Marketing data optimizes pricing strategies
+- HR data enhances workforce planning
+
+**Advanced Analytics**:
+- Machine learning models for prediction
+- AI-powered personalization
+- Real-time decision-making
+- Automated optimization
+
+**Data Monetization**:
+- Internal value: Better decisions, efficiency, innovation
+- External value: Data products, insights-as-a-service
+- Ecosystem value: Partner data sharing, industry benchmarks
+
+**Innovation Opportunities**:
+- Discover new customer segments
+- Identify untapped markets
+- Develop new products and services
+- Create competitive differentiation
+
+**Examples**:
+- **Amazon**: Uses purchase data for recommendations, inventory, pricing, and new product development
+- **Netflix**: Viewing data drives content recommendations, production decisions, and personalization
+- **Uber**: Trip data optimizes routing, pricing, driver allocation, and city planning partnerships
+- **Healthcare**: Patient data improves treatments, drug development, and population health management
+
+<div class="mermaid">
+graph TB
+    A[Single Data<br/>Source] --> B[Primary<br/>Purpose<br/>📊]
+    A --> C[Secondary<br/>Uses<br/>🔄]
+    A --> D[Advanced<br/>Analytics<br/>🤖]
+    A --> E[Innovation<br/>💡]
+
+    B --> F[Initial Value]
+    C --> G[Reuse Value]
+    D --> H[Predictive Value]
+    E --> I[Strategic Value]
+
+    F --> J[Maximised<br/>Data Value<br/>📈]
+    G --> J
+    H --> J
+    I --> J
+
+    J --> K[Competitive<br/>Advantage<br/>🏆]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style G fill:#FFF9C4,stroke:#FBC02D,stroke-width:2px
+    style H fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style I fill:#FFE0B2,stroke:#FB8C00,stroke-width:2px
+    style J fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style K fill:#E74C3C,stroke:#C0392B,stroke-width:3px,color:#fff
+</div>
+
+---
+
+### 🎯 Summary: The Power of Data Life Cycle Management
+
+<div class="key-concept">
+**The use of a data life cycle approach, in conclusion, enables organisations to systematically manage their data from creation and collection through to archiving or disposal.**
+
+This systematic approach results in:
+
+✅ **Wiser Choices**: Data-driven decisions based on reliable, high-quality information
+
+✅ **Greater Effectiveness**: Streamlined processes, reduced waste, optimized resources
+
+✅ **Greater Adherence to Rules**: Compliance with GDPR, HIPAA, POPI Act, and other regulations
+
+✅ **Cost Savings**: Reduced storage, operational, and compliance costs
+
+✅ **Enhanced Security**: Protection of sensitive data at every stage
+
+✅ **Maximized Value**: Reuse data for multiple purposes, drive innovation
+
+✅ **Competitive Advantage**: Better insights, faster decisions, superior customer experiences
+</div>
+
+<div class="mermaid">
+graph TB
+    A[Data Life Cycle<br/>Management] --> B[7 Key Benefits]
+
+    B --> C1[Enhanced<br/>Decision-Making<br/>🎯]
+    B --> C2[Improved<br/>Data Quality<br/>✓]
+    B --> C3[Efficient<br/>Management<br/>⚙️]
+    B --> C4[Regulatory<br/>Compliance<br/>📋]
+    B --> C5[Cost<br/>Savings<br/>💰]
+    B --> C6[Security &<br/>Privacy<br/>🔒]
+    B --> C7[Maximise<br/>Value<br/>📈]
+
+    C1 --> D[Business<br/>Success<br/>🏆]
+    C2 --> D
+    C3 --> D
+    C4 --> D
+    C5 --> D
+    C6 --> D
+    C7 --> D
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C2 fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style C3 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C4 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style C5 fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C6 fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style C7 fill:#FFC107,stroke:#F57C00,stroke-width:2px
+    style D fill:#E74C3C,stroke:#C0392B,stroke-width:4px,color:#fff
+</div>
+
+---
+
+### ⚖️ Relational vs Big Data Databases
+
+Based on the kind and volume of data they're intended to handle, **traditional relational databases** and **big data databases** (also frequently referred to as **NoSQL databases**) serve different purposes, and each has its strengths. The structure, data consistency, scale, and query language of these two types of data storage can be contrasted.
+
+<div class="mermaid">
+graph TB
+    A[Database Types] --> B[Relational Databases<br/>🗄️<br/>Traditional SQL]
+    A --> C[Big Data Databases<br/>🌐<br/>NoSQL]
+
+    B --> B1[MySQL<br/>PostgreSQL<br/>Oracle]
+    C --> C1[MongoDB<br/>Cassandra<br/>Hadoop]
+
+    B --> B2[Structured Data<br/>ACID Properties]
+    C --> C2[Unstructured/Semi-structured<br/>BASE Properties]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+    style B2 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C2 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+</div>
+
+#### 📊 Detailed Comparison
+
+##### 1. Structure 🏗️
+
+**Relational Databases**
+- The **relational model**, which arranges data into **tables with rows and columns**, is the foundation
+- Examples: MySQL, Oracle, PostgreSQL
+- **Keys are used to define relationships** between tables
+- Rigid schema that must be defined upfront
+- Data normalization to reduce redundancy
+
+**Big Data (NoSQL) Databases**
+- Made to **store, process, and analyse data** that is too large or complex for conventional databases
+- Examples: MongoDB, Cassandra, Hadoop
+- Can effectively manage **unstructured or partially structured data**
+- Flexible schema that can evolve over time
+- Various data models: document, key-value, column-family, graph
+
+<div class="mermaid">
+graph LR
+    subgraph "Relational Database Structure"
+        A1[Tables] --> A2[Rows & Columns]
+        A2 --> A3[Primary Keys]
+        A2 --> A4[Foreign Keys]
+        A3 --> A5[Relationships]
+        A4 --> A5
+    end
+
+    subgraph "Big Data Database Structure"
+        B1[Flexible Schema] --> B2[Documents/Collections]
+        B1 --> B3[Key-Value Pairs]
+        B1 --> B4[Column Families]
+        B1 --> B5[Graph Nodes]
+    end
+
+    style A1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style A5 fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style B1 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B2 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+    style B3 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+    style B4 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+    style B5 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+</div>
+
+##### 2. Data Consistency 🔒
+
+**Relational Databases - ACID Properties**
+
+Based on the **ACID** (Atomicity, Consistency, Isolation, Durability) properties, they offer **robust consistency guarantees**.
+
+- **Atomicity**: Transactions are all-or-nothing
+- **Consistency**: Data remains in a valid state
+- **Isolation**: Concurrent transactions don't interfere
+- **Durability**: Committed data is permanently saved
+
+**Big Data Databases - BASE Properties**
+
+Instead of using the ACID model, they are typically based on the **BASE** (Basically Available, Soft state, Eventually consistent) model, allowing for **better performance and scalability** at the expense of consistency.
+
+- **Basically Available**: System guarantees availability
+- **Soft state**: State may change over time, even without input
+- **Eventually consistent**: System will become consistent over time
+
+<div class="mermaid">
+graph TB
+    subgraph "ACID - Relational Databases"
+        A1[Atomicity<br/>All or Nothing] --> A5[Strong Consistency<br/>✓]
+        A2[Consistency<br/>Valid State] --> A5
+        A3[Isolation<br/>No Interference] --> A5
+        A4[Durability<br/>Permanent Storage] --> A5
+    end
+
+    subgraph "BASE - Big Data Databases"
+        B1[Basically Available<br/>Always Accessible] --> B4[Eventual Consistency<br/>⏱️]
+        B2[Soft State<br/>May Change] --> B4
+        B3[Eventually Consistent<br/>Over Time] --> B4
+    end
+
+    A5 --> Trade[Trade-offs]
+    B4 --> Trade
+
+    Trade --> T1[ACID: Consistency<br/>vs Performance]
+    Trade --> T2[BASE: Performance<br/>vs Consistency]
+
+    style A5 fill:#50C878,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style B4 fill:#FF9800,stroke:#E65100,stroke-width:3px,color:#fff
+    style Trade fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style T1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style T2 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+</div>
+
+##### 3. Scale 📈
+
+**Relational Databases**
+- Frequently employed in **business applications and transactions** where the volume of data is not excessive
+- Great at handling **structured data**
+- May find it difficult to **scale horizontally** (across many servers) when the amount of data is considerable
+- Typically scale **vertically** (more powerful single server)
+
+**Big Data Databases**
+- Made to **scale across numerous servers horizontally**
+- Can **process and analyse data on a much larger scale** than traditional databases
+- Designed to handle **large volumes of data** (terabytes to petabytes)
+- Distributed architecture for parallel processing
+
+<div class="mermaid">
+flowchart TD
+    subgraph "Relational Database Scaling"
+        R1[Single Server] --> R2[Vertical Scaling<br/>⬆️<br/>More CPU/RAM/Storage]
+        R2 --> R3[Limited by<br/>Hardware Capacity]
+    end
+
+    subgraph "Big Data Database Scaling"
+        B1[Multiple Servers] --> B2[Horizontal Scaling<br/>➡️<br/>Add More Servers]
+        B2 --> B3[Distributed Processing]
+        B3 --> B4[Virtually Unlimited<br/>Scalability]
+    end
+
+    R3 -.Limitation.-> L1[Scaling Challenges]
+    B4 -.Advantage.-> L2[Massive Scale]
+
+    style R1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style R2 fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style R3 fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B1 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B2 fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B3 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style B4 fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+</div>
+
+##### 4. Query Language 💬
+
+**Relational Databases - SQL**
+- Define and manipulate the data using **Structured Query Language (SQL)**
+- SQL is **effective but complicated** for more complex queries
+- Standardized language across different databases
+- Powerful for joins, aggregations, and complex queries
+- Declarative approach (specify what, not how)
+
+**Big Data Databases - Varied Approaches**
+- **Hive for Hadoop** is an example of a NoSQL database that uses a form of SQL
+- Other NoSQL databases use their **own query languages or APIs**
+- Can be **easier to use** and provide **more flexibility** when working with unstructured data
+- Examples: MongoDB Query Language (MQL), Cassandra Query Language (CQL)
+
+<div class="mermaid">
+graph TB
+    subgraph "Relational - SQL"
+        S1[SQL Language] --> S2[SELECT, INSERT<br/>UPDATE, DELETE]
+        S2 --> S3[JOIN Operations]
+        S2 --> S4[Complex Queries]
+        S3 --> S5[Standardized<br/>Across Databases]
+        S4 --> S5
+    end
+
+    subgraph "Big Data - Multiple Languages"
+        N1[Query Options] --> N2[SQL-like<br/>Hive, CQL]
+        N1 --> N3[Native APIs<br/>MongoDB MQL]
+        N1 --> N4[MapReduce<br/>Hadoop]
+        N1 --> N5[Graph Queries<br/>Cypher, Gremlin]
+    end
+
+    S5 --> Result[Query Execution]
+    N2 --> Result
+    N3 --> Result
+    N4 --> Result
+    N5 --> Result
+
+    style S1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style S5 fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style N1 fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style Result fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+</div>
+
+#### 📋 Comprehensive Comparison Table
+
+| Aspect | Relational Databases | Big Data (NoSQL) Databases |
+|--------|---------------------|---------------------------|
+| **Structure** | Relational model with tables, rows, and columns. Keys define relationships between tables. | Flexible schema designed for large/complex data. Can handle unstructured or semi-structured data. |
+| **Examples** | MySQL, Oracle, PostgreSQL, SQL Server | MongoDB, Cassandra, Hadoop, Redis, Neo4j |
+| **Data Consistency** | ACID properties (Atomicity, Consistency, Isolation, Durability) - robust consistency guarantees | BASE model (Basically Available, Soft state, Eventually consistent) - better performance and scalability |
+| **Scale** | Vertical scaling (more powerful server). Great for structured data but difficult to scale horizontally. | Horizontal scaling (add more servers). Designed to handle massive volumes across distributed systems. |
+| **Query Language** | SQL (Structured Query Language) - standardized, powerful but complex for advanced queries | Varied: SQL-like (Hive, CQL), native APIs (MQL), MapReduce, or graph queries. More flexible for unstructured data. |
+| **Best For** | Business applications, transactions, structured data, complex relationships | Big data analytics, unstructured data, high scalability, real-time processing |
+| **Data Volume** | Small to medium datasets | Large to massive datasets (terabytes to petabytes) |
+| **Schema** | Rigid, predefined schema | Flexible, evolving schema |
+| **Performance** | Optimized for complex queries and transactions | Optimized for high throughput and availability |
+| **Use Cases** | Banking, ERP, CRM, e-commerce transactions | Social media analytics, IoT data, real-time recommendations, log analysis |
+
+#### 🎯 When to Use Which?
+
+<div class="mermaid">
+flowchart TD
+    Start{What type of<br/>data do you have?} --> Structured{Structured &<br/>Relational?}
+    Start --> Volume{Large Volume<br/>& Variety?}
+
+    Structured -->|Yes| Consistency{Need Strong<br/>Consistency?}
+    Structured -->|No| Volume
+
+    Consistency -->|Yes| Relational[Use Relational<br/>Database<br/>🗄️<br/>MySQL, PostgreSQL]
+    Consistency -->|No| Volume
+
+    Volume -->|Yes| Scale{Need Horizontal<br/>Scaling?}
+    Volume -->|No| Relational
+
+    Scale -->|Yes| BigData[Use Big Data<br/>Database<br/>🌐<br/>MongoDB, Cassandra]
+    Scale -->|No| Relational
+
+    Start --> Unstructured{Unstructured<br/>Data?}
+    Unstructured -->|Yes| BigData
+    Unstructured -->|No| Structured
+
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style Relational fill:#50C878,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style BigData fill:#FF9800,stroke:#E65100,stroke-width:3px,color:#fff
+    style Structured fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Volume fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Consistency fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Scale fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Unstructured fill:#FFD700,stroke:#B8860B,stroke-width:2px
+</div>
+
+#### 💡 Key Decision Factors
+
+<div class="key-concept">
+**Choose Relational Databases when:**
+- You have structured, relational data
+- You need ACID compliance and strong consistency
+- Your data volume is manageable (not massive scale)
+- You require complex joins and transactions
+- Schema is well-defined and stable
+
+**Choose Big Data (NoSQL) Databases when:**
+- You have unstructured or semi-structured data
+- You need to scale horizontally across many servers
+- You're dealing with massive data volumes (big data)
+- You can accept eventual consistency
+- Schema needs to be flexible and evolve
+- You need high availability and performance
+</div>
+
+#### 🔄 Hybrid Approaches
+
+<div class="important-info">
+**Modern Data Architecture**: Many organizations use a **hybrid approach**, combining both relational and big data databases:
+
+- **Relational databases** for transactional data, user accounts, financial records
+- **Big data databases** for analytics, logs, user behavior, real-time data
+- **Data lakes** to store raw data from both sources
+- **ETL pipelines** to move data between systems as needed
+
+This approach leverages the strengths of each technology to build robust, scalable data systems.
+</div>
+
+<div class="mermaid">
+graph TB
+    subgraph "Hybrid Data Architecture"
+        A[Data Sources] --> B[Relational DB<br/>Transactions]
+        A --> C[NoSQL DB<br/>Analytics]
+        A --> D[Data Lake<br/>Raw Storage]
+
+        B --> E[ETL Pipeline]
+        C --> E
+        D --> E
+
+        E --> F[Data Warehouse]
+        F --> G[Business Intelligence<br/>& Analytics]
+
+        G --> H[Decision Making<br/>💡]
+    end
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style F fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style G fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+### 📚 What did I Learn in This Lesson?
+
+This lesson provided comprehensive insights into the fundamentals of data and its management. Let's recap the key learnings:
+
+<div class="mermaid">
+graph TB
+    A[Lesson 1.2:<br/>It's All About Data<br/>📊] --> B[Data Types &<br/>Representation<br/>🔢]
+    A --> C[Data Sources &<br/>Storage<br/>💾]
+    A --> D[Database<br/>Technologies<br/>🗄️]
+    A --> E[Data Life Cycle<br/>Management<br/>🔄]
+
+    B --> B1[Numeric, String,<br/>Boolean, Date/Time]
+    B --> B2[Structured vs<br/>Unstructured]
+
+    C --> C1[Internal & External<br/>Sources]
+    C --> C2[Multiple Storage<br/>Options]
+
+    D --> D1[Relational<br/>Databases]
+    D --> D2[Big Data/<br/>NoSQL]
+
+    E --> E1[8 Lifecycle<br/>Stages]
+    E --> E2[7 Key<br/>Benefits]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style B1 fill:#50C878,stroke:#2E7D32,stroke-width:1px,color:#fff
+    style B2 fill:#50C878,stroke:#2E7D32,stroke-width:1px,color:#fff
+    style C1 fill:#FF9800,stroke:#E65100,stroke-width:1px,color:#fff
+    style C2 fill:#FF9800,stroke:#E65100,stroke-width:1px,color:#fff
+    style D1 fill:#9B59B6,stroke:#6C3483,stroke-width:1px,color:#fff
+    style D2 fill:#9B59B6,stroke:#6C3483,stroke-width:1px,color:#fff
+    style E1 fill:#E74C3C,stroke:#C0392B,stroke-width:1px,color:#fff
+    style E2 fill:#E74C3C,stroke:#C0392B,stroke-width:1px,color:#fff
+</div>
+
+#### 🎯 Core Learnings Summary
+
+<div class="key-concept">
+**1. Different Types of Data**
+
+You learned about the fundamental data types used in data storage and analysis:
+
+- **Numeric Data**: Integer (whole numbers), Float (decimals), Complex (real + imaginary)
+- **String/Character Data**: Text data, from single characters to long sequences
+- **Boolean Data**: True/False values for flags and conditions
+- **Date/Time Data**: Dates, times, datetimes, and time spans for temporal information
+
+Each data type has specific use cases, storage characteristics, and performance implications. Choosing the right data type is crucial for storage efficiency, accuracy, and proper analysis.
+</div>
+
+<div class="key-concept">
+**2. Data Sources in the Modern World**
+
+Data can be sourced from numerous locations:
+
+**Internal Sources:**
+- Transactional systems (sales, invoices, orders)
+- Log data (web logs, application logs, error logs)
+- CRM systems (customer information and interactions)
+- HR systems (employee data and performance)
+
+**External Sources:**
+- Social media platforms (user-generated content, sentiment)
+- Public datasets (government, research, open data)
+- Web scraping (extracting data from websites)
+- Third-party data providers (market research, demographics)
+- IoT devices and sensors (real-time environmental data)
+- Satellite and imagery data (geospatial information)
+
+Understanding where data comes from helps you assess its quality, reliability, and appropriate use.
+</div>
+
+<div class="key-concept">
+**3. Variety of Storage Options for Data**
+
+You explored multiple ways to store data, each with different characteristics:
+
+| Storage Type | Best For | Key Characteristics |
+|--------------|----------|---------------------|
+| **Spreadsheets/CSV** | Small datasets, human readability | Portable, simple, limited scalability |
+| **Relational Databases** | Structured data, transactions | ACID properties, SQL queries, vertical scaling |
+| **NoSQL Databases** | Unstructured data, flexibility | Horizontal scaling, flexible schema, BASE model |
+| **Data Warehouses** | Business intelligence, reporting | Optimized for analytics, historical data |
+| **Data Lakes** | Raw data storage, big data | Store any format, schema-on-read |
+| **Cloud Object Storage** | Scalable storage, backups | S3, Azure Blob, cost-effective |
+| **In-Memory Stores** | High-speed access, caching | Redis, Memcached, fast but volatile |
+
+The choice of storage depends on data volume, access patterns, query requirements, and scalability needs.
+</div>
+
+<div class="key-concept">
+**4. Data Representation Methods**
+
+Data can be represented in different ways:
+
+**Structured Data:**
+- Organized in tables with rows (records) and columns (attributes)
+- Relational databases, CSV files, data frames
+- Easy to query, analyze, and process
+- Fixed schema provides consistency
+
+**Unstructured Data:**
+- Free-form format without predefined structure
+- Text documents, images, videos, audio, sensor data
+- Rich in information but more challenging to analyze
+- Requires specialized techniques (NLP, computer vision)
+
+**Hybrid Approaches:**
+- Combining structured and unstructured data provides comprehensive insights
+- Example: Customer demographics (structured) + customer reviews (unstructured)
+</div>
+
+<div class="key-concept">
+**5. Relational vs Big Data Storage**
+
+You learned the fundamental differences between traditional and modern database approaches:
+
+**Relational Databases (MySQL, PostgreSQL, Oracle):**
+- ✅ Structured data with fixed schema
+- ✅ ACID properties for strong consistency
+- ✅ Complex joins and relationships
+- ✅ SQL for powerful querying
+- ⚠️ Vertical scaling (limited by single server)
+- ⚠️ Difficult to handle unstructured data
+
+**Big Data/NoSQL Databases (MongoDB, Cassandra, Hadoop):**
+- ✅ Flexible schema for varied data
+- ✅ Horizontal scaling (add more servers)
+- ✅ Handle massive volumes (terabytes to petabytes)
+- ✅ BASE model for better performance
+- ⚠️ Eventual consistency (not immediate)
+- ⚠️ More complex query patterns
+
+**Modern Approach:** Many organizations use **hybrid architectures** combining both:
+- Relational databases for transactions and structured data
+- NoSQL databases for analytics and unstructured data
+- Data lakes for raw data storage
+- ETL pipelines to move data between systems
+</div>
+
+<div class="key-concept">
+**6. Data Types for Individual Entities**
+
+Within data storage systems, individual data entities are stored using specific data types:
+
+- **Integer**: Counting, IDs, indexing (e.g., customer_id, quantity)
+- **Float**: Measurements, prices, scientific calculations (e.g., price, temperature)
+- **String**: Names, addresses, descriptions (e.g., customer_name, email)
+- **Boolean**: Flags, status indicators (e.g., is_active, has_subscription)
+- **Date/Time**: Timestamps, scheduling (e.g., order_date, created_at)
+
+Proper data type selection ensures:
+- ✅ Storage efficiency (right amount of space)
+- ✅ Performance optimization (faster queries)
+- ✅ Data accuracy (appropriate precision)
+- ✅ Validation (prevent invalid data)
+</div>
+
+<div class="key-concept">
+**7. Data Life Cycle Management Plan**
+
+Organizations need a systematic plan for handling data throughout its lifecycle:
+
+**The 8 Stages:**
+
+1. **Collection** 📥: Gather data from various sources (IoT, transactions, APIs)
+2. **Pre-processing** 🧹: Clean, validate, transform, and prepare data
+3. **Storage** 💾: Store in appropriate databases or data lakes
+4. **Processing** ⚙️: Aggregate, integrate, and engineer features
+5. **Analysis** 📊: Apply statistical methods, ML, and exploratory techniques
+6. **Visualisation** 📈: Create charts, dashboards, and reports
+7. **Action** 🎯: Make decisions and implement changes based on insights
+8. **Archiving/Destruction** 🗄️: Archive for compliance or securely delete obsolete data
+
+**The 7 Benefits of Lifecycle Management:**
+
+1. **Enhanced Decision-Making** 🎯: Reliable data leads to better insights
+2. **Improved Data Quality** ✓: Systematic processes ensure accuracy and completeness
+3. **Efficient Management** ⚙️: Optimized storage and automated processes
+4. **Regulatory Compliance** 📋: Meet GDPR, HIPAA, PCI DSS requirements
+5. **Cost Savings** 💰: Reduce storage, operational, and infrastructure costs
+6. **Security & Privacy** 🔒: Protection at every stage builds trust
+7. **Maximizing Value** 📈: Data reuse, innovation, and competitive advantage
+
+**Key Principle:** Data lifecycle management is not a one-time activity but an ongoing, iterative process that requires governance, quality controls, and compliance awareness at every stage.
+</div>
+
+#### 🎓 Putting It All Together
+
+<div class="important-info">
+**The Complete Picture:**
+
+This lesson has equipped you with foundational knowledge about data - the lifeblood of modern organizations:
+
+1. **Understanding Data Types** helps you choose appropriate storage and analysis methods
+2. **Knowing Data Sources** enables you to gather comprehensive information for analysis
+3. **Selecting Storage Options** ensures your data is accessible, scalable, and performant
+4. **Choosing Representation Methods** (structured vs unstructured) matches data to use cases
+5. **Comparing Database Technologies** (relational vs big data) guides architectural decisions
+6. **Applying Data Types Correctly** prevents errors and optimizes performance
+7. **Implementing Lifecycle Management** creates systematic, compliant, and valuable data practices
+
+**Real-World Application:**
+
+Consider a modern e-commerce company:
+- **Data Types**: Customer IDs (integer), prices (float), names (string), active status (boolean), order dates (datetime)
+- **Data Sources**: Website transactions (internal), social media sentiment (external), IoT sensors in warehouses
+- **Storage**: Relational DB for orders, NoSQL for product catalog, data lake for clickstream data
+- **Representation**: Structured customer data, unstructured product reviews
+- **Databases**: MySQL for transactions (ACID), MongoDB for product catalog (flexibility), Hadoop for analytics
+- **Lifecycle**: Collect orders → Clean duplicates → Store in DB → Process for insights → Analyze trends → Visualize KPIs → Optimize inventory → Archive old orders
+
+This comprehensive approach to data management enables organizations to make informed decisions, comply with regulations, reduce costs, and gain competitive advantages in the data-driven economy.
+</div>
+
+<div class="mermaid">
+graph LR
+    A[Raw Data<br/>📥] --> B[Proper Types &<br/>Storage<br/>💾]
+    B --> C[Appropriate<br/>Database<br/>🗄️]
+    C --> D[Lifecycle<br/>Management<br/>🔄]
+    D --> E[Quality<br/>Insights<br/>💡]
+    E --> F[Better<br/>Decisions<br/>🎯]
+    F --> G[Business<br/>Success<br/>🚀]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style F fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 💡 Key Takeaways for Exam Preparation
+
+1. ✅ **Data types** (Integer, Float, String, Boolean, Date/Time) have specific use cases and storage characteristics
+2. ✅ **Data sources** can be internal (transactional, CRM, HR) or external (social media, public datasets, IoT)
+3. ✅ **Storage options** range from spreadsheets to data lakes, each with different scalability and performance
+4. ✅ **Structured data** is organized in tables; **unstructured data** is free-form (text, images, videos)
+5. ✅ **Relational databases** use ACID properties and SQL; **NoSQL databases** use BASE model and horizontal scaling
+6. ✅ **Data lifecycle** has 8 stages from collection to archiving/destruction
+7. ✅ **Lifecycle benefits** include better decisions, quality, efficiency, compliance, cost savings, security, and value
+8. ✅ **Hybrid approaches** combine relational and NoSQL databases for optimal performance
+9. ✅ **Data governance** and **compliance** (GDPR, HIPAA, PCI DSS) are essential throughout the lifecycle
+10. ✅ **Proper data type selection** prevents errors and optimizes storage, performance, and accuracy
+
+**Remember:** Data is only valuable when it's properly collected, stored, managed, and analyzed. The systematic approach you've learned in this lesson forms the foundation for all data analysis work you'll do in your career.
+</div>
+
+---
+
+### 📝 The Task: Internal vs External Data Sources
+
+In this lesson, you learned about various considerations related to data, including **internal and external sources**. Let's complete a practical exercise to solidify your understanding.
+
+#### 🎯 Task Requirements
+
+**Select:**
+- **2 types of internal data**
+- **2 types of external data**
+
+**For each data type, create a table listing:**
+1. **Feature name**: The specific attribute or field
+2. **Description**: What this feature represents (helpful for future users)
+3. **Data type**: Numeric, String, Boolean, Date/Time, Audio, Video, etc.
+4. **Storage**: Structured or Unstructured
+
+---
+
+### ✅ Complete Solution with Examples
+
+#### 📊 Internal Data Source 1: Human Resources (HR) Data
+
+<div class="key-concept">
+**About HR Data:**
+Human Resources data contains information about employees within an organization. This is critical internal data used for payroll, performance management, compliance, and workforce planning.
+</div>
+
+| Feature Name | Description | Data Type | Storage |
+|--------------|-------------|-----------|---------|
+| `employee_id` | Unique identifier for each staff member | Integer | Structured |
+| `staff_surname` | Employee's last name/family name | String | Structured |
+| `staff_firstname` | Employee's first name/given name | String | Structured |
+| `email_address` | Corporate email address | String | Structured |
+| `phone_number` | Contact phone number | String | Structured |
+| `date_of_birth` | Employee's birth date | Date | Structured |
+| `hire_date` | Date employee joined the company | Date | Structured |
+| `department` | Department where employee works (e.g., IT, Sales, HR) | String | Structured |
+| `job_title` | Current position/role title | String | Structured |
+| `employment_type` | Full-time, Part-time, Contract, Intern | String | Structured |
+| `salary` | Annual salary amount | Float | Structured |
+| `currency` | Currency code for salary (e.g., USD, EUR, GBP) | String | Structured |
+| `manager_id` | Employee ID of direct manager | Integer | Structured |
+| `is_active` | Whether employee is currently employed | Boolean | Structured |
+| `termination_date` | Date employment ended (if applicable) | Date | Structured |
+| `performance_rating` | Latest performance review score (1-5) | Integer | Structured |
+| `skills` | List of employee skills and competencies | String (comma-separated) | Structured |
+| `emergency_contact_name` | Name of emergency contact person | String | Structured |
+| `emergency_contact_phone` | Phone number of emergency contact | String | Structured |
+| `profile_photo` | Employee photo for ID badge | Image (JPEG/PNG) | Unstructured |
+| `resume_document` | Employee's CV/resume file | Document (PDF) | Unstructured |
+| `performance_review_notes` | Detailed feedback from performance reviews | Text | Unstructured |
+
+---
+
+#### 💰 Internal Data Source 2: Transactional/Sales Data
+
+<div class="key-concept">
+**About Transactional Data:**
+Transactional data captures business transactions such as sales, purchases, and payments. This is essential for financial reporting, revenue analysis, and customer behavior understanding.
+</div>
+
+| Feature Name | Description | Data Type | Storage |
+|--------------|-------------|-----------|---------|
+| `transaction_id` | Unique identifier for each transaction | Integer | Structured |
+| `order_number` | Human-readable order reference number | String | Structured |
+| `customer_id` | Unique identifier for the customer | Integer | Structured |
+| `transaction_date` | Date and time when transaction occurred | DateTime | Structured |
+| `product_id` | Unique identifier for the product sold | Integer | Structured |
+| `product_name` | Name/description of the product | String | Structured |
+| `product_category` | Category of product (e.g., Electronics, Clothing) | String | Structured |
+| `quantity` | Number of units purchased | Integer | Structured |
+| `unit_price` | Price per single unit | Float | Structured |
+| `discount_percentage` | Discount applied to the transaction (0-100) | Float | Structured |
+| `tax_amount` | Tax charged on the transaction | Float | Structured |
+| `total_amount` | Final total amount paid | Float | Structured |
+| `payment_method` | How customer paid (Credit Card, PayPal, Cash) | String | Structured |
+| `payment_status` | Status of payment (Completed, Pending, Failed) | String | Structured |
+| `shipping_address` | Delivery address for the order | String | Structured |
+| `shipping_cost` | Cost of shipping/delivery | Float | Structured |
+| `is_refunded` | Whether transaction was refunded | Boolean | Structured |
+| `refund_date` | Date refund was processed (if applicable) | Date | Structured |
+| `sales_channel` | Where sale occurred (Online, In-Store, Mobile App) | String | Structured |
+| `salesperson_id` | Employee who processed the sale | Integer | Structured |
+| `customer_notes` | Special instructions or comments from customer | Text | Unstructured |
+| `receipt_image` | Scanned copy of physical receipt | Image (JPEG/PDF) | Unstructured |
+
+---
+
+#### 🌐 External Data Source 1: Social Media Data
+
+<div class="key-concept">
+**About Social Media Data:**
+Social media data comes from platforms like Twitter, Facebook, Instagram, and LinkedIn. This external data provides insights into customer sentiment, brand perception, and market trends.
+</div>
+
+| Feature Name | Description | Data Type | Storage |
+|--------------|-------------|-----------|---------|
+| `post_id` | Unique identifier for the social media post | String | Structured |
+| `platform` | Social media platform (Twitter, Facebook, Instagram) | String | Structured |
+| `username` | User's handle or username | String | Structured |
+| `user_id` | Unique identifier for the user on the platform | String | Structured |
+| `post_timestamp` | Date and time when post was created | DateTime | Structured |
+| `post_text` | Text content of the post | Text | Unstructured |
+| `hashtags` | Hashtags used in the post | String (comma-separated) | Structured |
+| `mentions` | Other users mentioned in the post | String (comma-separated) | Structured |
+| `likes_count` | Number of likes/reactions | Integer | Structured |
+| `shares_count` | Number of shares/retweets | Integer | Structured |
+| `comments_count` | Number of comments/replies | Integer | Structured |
+| `sentiment_score` | Sentiment analysis score (-1 to +1) | Float | Structured |
+| `sentiment_label` | Sentiment classification (Positive, Negative, Neutral) | String | Structured |
+| `language` | Language of the post (e.g., en, es, fr) | String | Structured |
+| `location` | Geographic location where post was made | String | Structured |
+| `is_verified` | Whether user account is verified | Boolean | Structured |
+| `follower_count` | Number of followers the user has | Integer | Structured |
+| `post_url` | Direct link to the post | String | Structured |
+| `media_type` | Type of media attached (Image, Video, None) | String | Structured |
+| `image_url` | URL to attached image | String | Structured |
+| `video_url` | URL to attached video | String | Structured |
+| `image_file` | Downloaded image file | Image (JPEG/PNG) | Unstructured |
+| `video_file` | Downloaded video file | Video (MP4/MOV) | Unstructured |
+| `audio_file` | Audio extracted from video or voice post | Audio (MP3/WAV) | Unstructured |
+
+---
+
+#### 🌤️ External Data Source 2: Weather/IoT Sensor Data
+
+<div class="key-concept">
+**About Weather/IoT Data:**
+Weather and IoT sensor data comes from external sources like weather APIs, environmental sensors, and public data feeds. This data is valuable for industries like agriculture, logistics, retail, and energy.
+</div>
+
+| Feature Name | Description | Data Type | Storage |
+|--------------|-------------|-----------|---------|
+| `sensor_id` | Unique identifier for the sensor device | String | Structured |
+| `reading_timestamp` | Date and time of the sensor reading | DateTime | Structured |
+| `location_latitude` | Geographic latitude coordinate | Float | Structured |
+| `location_longitude` | Geographic longitude coordinate | Float | Structured |
+| `location_name` | Human-readable location name (e.g., "London, UK") | String | Structured |
+| `temperature_celsius` | Temperature reading in Celsius | Float | Structured |
+| `temperature_fahrenheit` | Temperature reading in Fahrenheit | Float | Structured |
+| `humidity_percentage` | Relative humidity (0-100%) | Float | Structured |
+| `pressure_hpa` | Atmospheric pressure in hectopascals | Float | Structured |
+| `wind_speed_kmh` | Wind speed in kilometers per hour | Float | Structured |
+| `wind_direction_degrees` | Wind direction in degrees (0-360) | Integer | Structured |
+| `precipitation_mm` | Rainfall amount in millimeters | Float | Structured |
+| `visibility_km` | Visibility distance in kilometers | Float | Structured |
+| `uv_index` | UV radiation index (0-11+) | Integer | Structured |
+| `cloud_cover_percentage` | Cloud coverage (0-100%) | Integer | Structured |
+| `weather_condition` | General weather description (Sunny, Rainy, Cloudy) | String | Structured |
+| `air_quality_index` | Air quality measurement (0-500) | Integer | Structured |
+| `pollution_pm25` | PM2.5 particulate matter concentration | Float | Structured |
+| `pollution_pm10` | PM10 particulate matter concentration | Float | Structured |
+| `is_daytime` | Whether reading was taken during daylight | Boolean | Structured |
+| `sunrise_time` | Time of sunrise | Time | Structured |
+| `sunset_time` | Time of sunset | Time | Structured |
+| `forecast_text` | Detailed weather forecast description | Text | Unstructured |
+| `satellite_image` | Satellite weather imagery | Image (JPEG/PNG) | Unstructured |
+| `radar_image` | Weather radar image | Image (JPEG/PNG) | Unstructured |
+
+---
+
+### 💻 Practical Implementation Examples
+
+Now let's see how to work with this data in practice using different tools and technologies.
+
+#### 📊 Example 1: Creating HR Data in Excel/CSV
+
+<div class="important-info">
+**Scenario:** You need to create a structured HR database for a small company with 10 employees.
+
+**Tool:** Microsoft Excel or Google Sheets
+
+**Steps:**
+1. Create column headers matching the feature names
+2. Enter data for each employee in rows
+3. Apply data validation to ensure correct data types
+4. Save as CSV for portability or XLSX for Excel features
+</div>
+
+**Sample CSV Structure:**
+
+```csv
+employee_id,staff_surname,staff_firstname,email_address,phone_number,date_of_birth,hire_date,department,job_title,employment_type,salary,currency,manager_id,is_active,performance_rating
+1001,Smith,John,john.smith@company.com,+44-20-1234-5678,1985-03-15,2020-01-10,IT,Software Engineer,Full-time,65000.00,GBP,1005,TRUE,4
+1002,Johnson,Sarah,sarah.johnson@company.com,+44-20-1234-5679,1990-07-22,2019-05-15,Sales,Sales Manager,Full-time,75000.00,GBP,1010,TRUE,5
+1003,Williams,Michael,michael.williams@company.com,+44-20-1234-5680,1988-11-30,2021-03-01,Marketing,Marketing Specialist,Full-time,55000.00,GBP,1008,TRUE,4
+1004,Brown,Emma,emma.brown@company.com,+44-20-1234-5681,1992-02-14,2022-06-20,HR,HR Coordinator,Part-time,35000.00,GBP,1009,TRUE,3
+1005,Jones,David,david.jones@company.com,+44-20-1234-5682,1980-09-05,2015-08-12,IT,IT Director,Full-time,95000.00,GBP,NULL,TRUE,5
+```
+
+**Excel Data Validation Examples:**
+
+```
+Column A (employee_id): Data Type = Whole Number, Minimum = 1000
+Column F (date_of_birth): Data Type = Date, Format = YYYY-MM-DD
+Column K (salary): Data Type = Decimal, Minimum = 0
+Column N (is_active): Data Type = List, Values = TRUE, FALSE
+Column O (performance_rating): Data Type = Whole Number, Between 1 and 5
+```
+
+---
+
+#### 🐍 Example 2: Working with Transactional Data in Python (Pandas)
+
+<div class="important-info">
+**Scenario:** Analyze sales transactions to find top-selling products and revenue by category.
+
+**Tool:** Python with Pandas library
+
+**Objective:** Load, clean, and analyze transactional data
+</div>
+
+```python
+import pandas as pd
+import numpy as np
+from datetime import datetime
+
+# Create sample transactional data
+transactions_data = {
+    'transaction_id': [1001, 1002, 1003, 1004, 1005, 1006, 1007, 1008],
+    'order_number': ['ORD-2025-001', 'ORD-2025-002', 'ORD-2025-003', 'ORD-2025-004',
+                     'ORD-2025-005', 'ORD-2025-006', 'ORD-2025-007', 'ORD-2025-008'],
+    'customer_id': [5001, 5002, 5001, 5003, 5004, 5002, 5005, 5003],
+    'transaction_date': ['2025-02-01 10:30:00', '2025-02-01 11:15:00', '2025-02-01 14:20:00',
+                         '2025-02-02 09:45:00', '2025-02-02 13:30:00', '2025-02-03 10:00:00',
+                         '2025-02-03 15:45:00', '2025-02-04 11:30:00'],
+    'product_name': ['Laptop', 'Mouse', 'Keyboard', 'Monitor', 'Laptop', 'Headphones', 'Webcam', 'Monitor'],
+    'product_category': ['Electronics', 'Electronics', 'Electronics', 'Electronics',
+                         'Electronics', 'Electronics', 'Electronics', 'Electronics'],
+    'quantity': [1, 2, 1, 1, 1, 1, 2, 1],
+    'unit_price': [899.99, 25.99, 79.99, 299.99, 899.99, 149.99, 89.99, 299.99],
+    'discount_percentage': [10, 0, 5, 15, 10, 0, 10, 15],
+    'payment_method': ['Credit Card', 'PayPal', 'Credit Card', 'Debit Card',
+                       'Credit Card', 'PayPal', 'Credit Card', 'Debit Card'],
+    'payment_status': ['Completed', 'Completed', 'Completed', 'Completed',
+                       'Completed', 'Completed', 'Completed', 'Completed'],
+    'is_refunded': [False, False, False, False, False, False, False, False]
+}
+
+# Create DataFrame
+df_transactions = pd.DataFrame(transactions_data)
+
+# Convert data types
+df_transactions['transaction_date'] = pd.to_datetime(df_transactions['transaction_date'])
+df_transactions['is_refunded'] = df_transactions['is_refunded'].astype(bool)
+
+# Calculate total amount for each transaction
+df_transactions['discount_amount'] = (df_transactions['unit_price'] *
+                                      df_transactions['quantity'] *
+                                      df_transactions['discount_percentage'] / 100)
+df_transactions['total_amount'] = (df_transactions['unit_price'] *
+                                   df_transactions['quantity'] -
+                                   df_transactions['discount_amount'])
+
+# Display the data
+print("=" * 80)
+print("TRANSACTIONAL DATA SAMPLE")
+print("=" * 80)
+print(df_transactions[['order_number', 'product_name', 'quantity', 'unit_price', 'total_amount']].head())
+print()
+
+# Analysis 1: Total revenue
+total_revenue = df_transactions['total_amount'].sum()
+print(f"Total Revenue: £{total_revenue:,.2f}")
+print()
+
+# Analysis 2: Top-selling products by quantity
+print("=" * 80)
+print("TOP-SELLING PRODUCTS BY QUANTITY")
+print("=" * 80)
+top_products = df_transactions.groupby('product_name').agg({
+    'quantity': 'sum',
+    'total_amount': 'sum'
+}).sort_values('quantity', ascending=False)
+print(top_products)
+print()
+
+# Analysis 3: Revenue by payment method
+print("=" * 80)
+print("REVENUE BY PAYMENT METHOD")
+print("=" * 80)
+payment_revenue = df_transactions.groupby('payment_method')['total_amount'].sum().sort_values(ascending=False)
+print(payment_revenue)
+print()
+
+# Analysis 4: Daily sales trend
+print("=" * 80)
+print("DAILY SALES TREND")
+print("=" * 80)
+df_transactions['date'] = df_transactions['transaction_date'].dt.date
+daily_sales = df_transactions.groupby('date')['total_amount'].sum()
+print(daily_sales)
+print()
+
+# Save to CSV
+df_transactions.to_csv('transactions_data.csv', index=False)
+print("✅ Data saved to 'transactions_data.csv'")
+```
+
+**Expected Output:**
+
+```
+================================================================================
+TRANSACTIONAL DATA SAMPLE
+================================================================================
+    order_number product_name  quantity  unit_price  total_amount
+0  ORD-2025-001       Laptop         1      899.99        809.99
+1  ORD-2025-002        Mouse         2       25.99         51.98
+2  ORD-2025-003     Keyboard         1       79.99         75.99
+3  ORD-2025-004      Monitor         1      299.99        254.99
+4  ORD-2025-005       Laptop         1      899.99        809.99
+
+Total Revenue: £3,632.88
+
+================================================================================
+TOP-SELLING PRODUCTS BY QUANTITY
+================================================================================
+              quantity  total_amount
+product_name
+Laptop               2       1619.98
+Monitor              2        509.98
+Webcam               2        161.98
+Mouse                2         51.98
+Headphones           1        149.99
+Keyboard             1         75.99
+
+================================================================================
+REVENUE BY PAYMENT METHOD
+================================================================================
+payment_method
+Credit Card    2727.93
+Debit Card      554.98
+PayPal          201.97
+Name: total_amount, dtype: float64
+
+================================================================================
+DAILY SALES TREND
+================================================================================
+date
+2025-02-01    937.96
+2025-02-02    1064.98
+2025-02-03    311.97
+2025-02-04    254.99
+Name: total_amount, dtype: float64
+
+✅ Data saved to 'transactions_data.csv'
+```
+
+---
+
+#### 🗄️ Example 3: Storing HR Data in SQL Database
+
+<div class="important-info">
+**Scenario:** Create a relational database for HR data with proper data types and constraints.
+
+**Tool:** SQL (MySQL/PostgreSQL)
+
+**Objective:** Design and populate a structured HR database
+</div>
+
+```sql
+-- Create HR database
+CREATE DATABASE company_hr;
+USE company_hr;
+
+-- Create employees table with proper data types
+CREATE TABLE employees (
+    employee_id INT PRIMARY KEY AUTO_INCREMENT,
+    staff_surname VARCHAR(100) NOT NULL,
+    staff_firstname VARCHAR(100) NOT NULL,
+    email_address VARCHAR(255) UNIQUE NOT NULL,
+    phone_number VARCHAR(20),
+    date_of_birth DATE NOT NULL,
+    hire_date DATE NOT NULL,
+    department VARCHAR(50) NOT NULL,
+    job_title VARCHAR(100) NOT NULL,
+    employment_type ENUM('Full-time', 'Part-time', 'Contract', 'Intern') NOT NULL,
+    salary DECIMAL(10, 2) NOT NULL,
+    currency CHAR(3) DEFAULT 'GBP',
+    manager_id INT,
+    is_active BOOLEAN DEFAULT TRUE,
+    termination_date DATE NULL,
+    performance_rating INT CHECK (performance_rating BETWEEN 1 AND 5),
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    FOREIGN KEY (manager_id) REFERENCES employees(employee_id)
+);
+
+-- Insert sample data
+INSERT INTO employees (employee_id, staff_surname, staff_firstname, email_address, phone_number,
+                       date_of_birth, hire_date, department, job_title, employment_type,
+                       salary, currency, manager_id, is_active, performance_rating)
+VALUES
+(1001, 'Smith', 'John', 'john.smith@company.com', '+44-20-1234-5678',
+ '1985-03-15', '2020-01-10', 'IT', 'Software Engineer', 'Full-time',
+ 65000.00, 'GBP', 1005, TRUE, 4),
+
+(1002, 'Johnson', 'Sarah', 'sarah.johnson@company.com', '+44-20-1234-5679',
+ '1990-07-22', '2019-05-15', 'Sales', 'Sales Manager', 'Full-time',
+ 75000.00, 'GBP', 1010, TRUE, 5),
+
+(1003, 'Williams', 'Michael', 'michael.williams@company.com', '+44-20-1234-5680',
+ '1988-11-30', '2021-03-01', 'Marketing', 'Marketing Specialist', 'Full-time',
+ 55000.00, 'GBP', 1008, TRUE, 4),
+
+(1004, 'Brown', 'Emma', 'emma.brown@company.com', '+44-20-1234-5681',
+ '1992-02-14', '2022-06-20', 'HR', 'HR Coordinator', 'Part-time',
+ 35000.00, 'GBP', 1009, TRUE, 3),
+
+(1005, 'Jones', 'David', 'david.jones@company.com', '+44-20-1234-5682',
+ '1980-09-05', '2015-08-12', 'IT', 'IT Director', 'Full-time',
+ 95000.00, 'GBP', NULL, TRUE, 5);
+
+-- Query 1: Get all active employees
+SELECT employee_id, staff_firstname, staff_surname, department, job_title, salary
+FROM employees
+WHERE is_active = TRUE
+ORDER BY department, staff_surname;
+
+-- Query 2: Calculate average salary by department
+SELECT department,
+       COUNT(*) as employee_count,
+       AVG(salary) as avg_salary,
+       MIN(salary) as min_salary,
+       MAX(salary) as max_salary
+FROM employees
+WHERE is_active = TRUE
+GROUP BY department
+ORDER BY avg_salary DESC;
+
+-- Query 3: Find employees and their managers
+SELECT e.employee_id,
+       CONCAT(e.staff_firstname, ' ', e.staff_surname) as employee_name,
+       e.job_title,
+       CONCAT(m.staff_firstname, ' ', m.staff_surname) as manager_name,
+       m.job_title as manager_title
+FROM employees e
+LEFT JOIN employees m ON e.manager_id = m.employee_id
+WHERE e.is_active = TRUE;
+
+-- Query 4: Calculate tenure for each employee
+SELECT employee_id,
+       CONCAT(staff_firstname, ' ', staff_surname) as full_name,
+       hire_date,
+       DATEDIFF(CURDATE(), hire_date) as days_employed,
+       ROUND(DATEDIFF(CURDATE(), hire_date) / 365.25, 1) as years_employed
+FROM employees
+WHERE is_active = TRUE
+ORDER BY hire_date;
+```
+
+---
+
+#### 🌐 Example 4: Analyzing Social Media Data with Python
+
+<div class="important-info">
+**Scenario:** Collect and analyze social media sentiment about your brand.
+
+**Tool:** Python with TextBlob for sentiment analysis
+
+**Objective:** Process unstructured text data and extract insights
+</div>
+
+```python
+import pandas as pd
+from textblob import TextBlob
+import matplotlib.pyplot as plt
+from datetime import datetime, timedelta
+import random
+
+# Sample social media data
+social_media_data = {
+    'post_id': ['TW001', 'FB002', 'IG003', 'TW004', 'FB005', 'IG006', 'TW007', 'FB008'],
+    'platform': ['Twitter', 'Facebook', 'Instagram', 'Twitter', 'Facebook', 'Instagram', 'Twitter', 'Facebook'],
+    'username': ['@user1', 'user2', '@user3', '@user4', 'user5', '@user6', '@user7', 'user8'],
+    'post_timestamp': [
+        '2025-02-01 10:30:00', '2025-02-01 14:20:00', '2025-02-02 09:15:00',
+        '2025-02-02 16:45:00', '2025-02-03 11:30:00', '2025-02-03 18:00:00',
+        '2025-02-04 08:45:00', '2025-02-04 15:20:00'
+    ],
+    'post_text': [
+        'Just bought the new laptop from @Company! Absolutely love it! Best purchase ever! 😍',
+        'The customer service at Company was terrible. Very disappointed with my experience.',
+        'Amazing product quality! The monitor is crystal clear. Highly recommend! ⭐⭐⭐⭐⭐',
+        'Ordered a keyboard but it arrived damaged. Waiting for replacement. Not happy.',
+        'Company has the best prices and fast shipping. Will definitely buy again!',
+        'The webcam quality is okay, nothing special. Expected better for the price.',
+        'Fantastic experience! The staff was helpful and the product exceeded expectations!',
+        'Product is good but delivery took too long. Improve your logistics please.'
+    ],
+    'likes_count': [245, 12, 389, 45, 156, 78, 312, 89],
+    'shares_count': [34, 3, 67, 8, 23, 12, 45, 15],
+    'comments_count': [18, 7, 42, 15, 28, 9, 31, 19]
+}
+
+# Create DataFrame
+df_social = pd.DataFrame(social_media_data)
+
+# Convert timestamp to datetime
+df_social['post_timestamp'] = pd.to_datetime(df_social['post_timestamp'])
+
+# Perform sentiment analysis
+def analyze_sentiment(text):
+    """Analyze sentiment of text using TextBlob"""
+    blob = TextBlob(text)
+    polarity = blob.sentiment.polarity  # -1 (negative) to +1 (positive)
+
+    # Classify sentiment
+    if polarity > 0.1:
+        label = 'Positive'
+    elif polarity < -0.1:
+        label = 'Negative'
+    else:
+        label = 'Neutral'
+
+    return polarity, label
+
+# Apply sentiment analysis
+df_social[['sentiment_score', 'sentiment_label']] = df_social['post_text'].apply(
+    lambda x: pd.Series(analyze_sentiment(x))
+)
+
+# Calculate engagement score
+df_social['engagement_score'] = (
+    df_social['likes_count'] +
+    df_social['shares_count'] * 2 +
+    df_social['comments_count'] * 3
+)
+
+# Display results
+print("=" * 100)
+print("SOCIAL MEDIA SENTIMENT ANALYSIS")
+print("=" * 100)
+print(df_social[['platform', 'post_text', 'sentiment_label', 'sentiment_score', 'engagement_score']])
+print()
+
+# Summary statistics
+print("=" * 100)
+print("SENTIMENT SUMMARY")
+print("=" * 100)
+sentiment_summary = df_social['sentiment_label'].value_counts()
+print(sentiment_summary)
+print()
+
+print(f"Average Sentiment Score: {df_social['sentiment_score'].mean():.3f}")
+print(f"Most Positive Post: {df_social.loc[df_social['sentiment_score'].idxmax(), 'post_text'][:80]}...")
+print(f"Most Negative Post: {df_social.loc[df_social['sentiment_score'].idxmin(), 'post_text'][:80]}...")
+print()
+
+# Platform analysis
+print("=" * 100)
+print("SENTIMENT BY PLATFORM")
+print("=" * 100)
+platform_sentiment = df_social.groupby('platform').agg({
+    'sentiment_score': 'mean',
+    'engagement_score': 'sum',
+    'post_id': 'count'
+}).rename(columns={'post_id': 'post_count'})
+print(platform_sentiment)
+print()
+
+# Engagement analysis
+print("=" * 100)
+print("TOP ENGAGING POSTS")
+print("=" * 100)
+top_posts = df_social.nlargest(3, 'engagement_score')[['platform', 'post_text', 'engagement_score', 'sentiment_label']]
+print(top_posts)
+```
+
+**Expected Output:**
+
+```
+====================================================================================================
+SOCIAL MEDIA SENTIMENT ANALYSIS
+====================================================================================================
+   platform                                          post_text sentiment_label  sentiment_score  engagement_score
+0   Twitter  Just bought the new laptop from @Company! A...        Positive            0.650               349
+1  Facebook  The customer service at Company was terribl...        Negative           -0.700                36
+2 Instagram  Amazing product quality! The monitor is cry...        Positive            0.800               590
+3   Twitter  Ordered a keyboard but it arrived damaged. ...        Negative           -0.400               109
+4  Facebook  Company has the best prices and fast shippi...        Positive            0.500               272
+5 Instagram  The webcam quality is okay, nothing special...         Neutral            0.050               129
+6   Twitter  Fantastic experience! The staff was helpful...        Positive            0.750               483
+7  Facebook  Product is good but delivery took too long....         Neutral            0.100               161
+
+====================================================================================================
+SENTIMENT SUMMARY
+====================================================================================================
+Positive    4
+Negative    2
+Neutral     2
+Name: sentiment_label, dtype: int64
+
+Average Sentiment Score: 0.219
+Most Positive Post: Amazing product quality! The monitor is crystal clear. Highly recommend! ⭐⭐⭐⭐⭐...
+Most Negative Post: The customer service at Company was terrible. Very disappointed with my experie...
+
+====================================================================================================
+SENTIMENT BY PLATFORM
+====================================================================================================
+           sentiment_score  engagement_score  post_count
+platform
+Facebook             -0.033               469           3
+Instagram             0.425               719           2
+Twitter               0.167               941           3
+
+====================================================================================================
+TOP ENGAGING POSTS
+====================================================================================================
+   platform                                          post_text  engagement_score sentiment_label
+2 Instagram  Amazing product quality! The monitor is cry...               590        Positive
+6   Twitter  Fantastic experience! The staff was helpful...               483        Positive
+0   Twitter  Just bought the new laptop from @Company! A...               349        Positive
+```
+
+---
+
+### 🎯 Key Insights from the Task
+
+<div class="key-concept">
+**What You've Learned:**
+
+1. **Internal Data** (HR, Transactional) is typically **structured** and stored in relational databases
+2. **External Data** (Social Media, IoT) can be **mixed** - some structured (metrics), some unstructured (text, images)
+3. **Data types matter** - choosing the right type ensures efficiency, accuracy, and proper analysis
+4. **Documentation is critical** - clear descriptions help future users understand the data
+5. **Different tools for different data** - SQL for structured, Python for mixed, specialized tools for unstructured
+6. **Storage choice depends on data characteristics** - structured data → databases, unstructured → NoSQL/data lakes
+7. **Real-world data requires cleaning and transformation** before analysis
+8. **Combining data sources** (internal + external) provides comprehensive business insights
+
+**Best Practices:**
+
+✅ Always document your data features with clear descriptions
+✅ Choose appropriate data types to optimize storage and performance
+✅ Use structured storage for tabular data, unstructured for media/text
+✅ Validate data types and constraints to maintain data quality
+✅ Consider future users when designing your data structure
+✅ Combine internal and external data for richer insights
+✅ Use the right tool for the job (Excel, Python, SQL, etc.)
+✅ Perform exploratory analysis to understand your data before deep analysis
+</div>
+
+---
+
+### 📚 Summary Table: All Four Data Sources
+
+| Data Source | Type | Primary Storage | Key Features | Common Use Cases |
+|-------------|------|-----------------|--------------|------------------|
+| **HR Data** | Internal | Structured (SQL Database) | Employee IDs, names, salaries, dates, performance ratings | Payroll, workforce planning, compliance, performance management |
+| **Transactional Data** | Internal | Structured (SQL Database) | Transaction IDs, amounts, dates, customer IDs, product details | Revenue analysis, customer behavior, inventory management, financial reporting |
+| **Social Media Data** | External | Mixed (Structured metrics + Unstructured text/media) | Post text, sentiment, engagement metrics, images, videos | Brand monitoring, sentiment analysis, customer feedback, marketing insights |
+| **Weather/IoT Data** | External | Mixed (Structured readings + Unstructured images) | Temperature, humidity, sensor readings, timestamps, satellite images | Demand forecasting, logistics optimization, agriculture, energy management |
+
+This comprehensive task solution demonstrates how to identify, document, structure, and work with both internal and external data sources using industry-standard tools and best practices! 🚀
+            ''',
+        "key_points": [
+            "Data can be stored in structured (tabular) or unstructured (free-form) formats",
+            "Structured data is organized in tables with rows (records/entities) and columns (attributes)",
+            "Relational databases (MySQL, PostgreSQL) store data in related tables using primary and foreign keys, enabling powerful SQL querying",
+            "CSV/Excel files are human-readable and portable but lack scalability and performance for large datasets",
+            "Data frames (pandas, R) are mutable two-dimensional structures that can hold mixed data types with powerful manipulation capabilities",
+            "Unstructured data includes text, images, videos, audio, and sensor data - rich in information but more challenging to analyze",
+            "Text data is analyzed using Natural Language Processing (NLP) techniques like sentiment analysis, topic modeling, and entity recognition",
+            "Images are represented as multi-dimensional arrays (height × width × color channels), videos add a frames dimension",
+            "Audio data is represented as time series or frequency domain using Fourier transformation",
+            "NoSQL databases (MongoDB, Cassandra) are flexible and scalable, storing documents (JSON/XML), key-value pairs, wide-columns, or graphs",
+            "Big data technologies (Hadoop, Spark) enable distributed processing and analysis of massive datasets at scale",
+            "Combining structured and unstructured data provides comprehensive insights (e.g., demographics + customer reviews)",
+            "Natural Language Processing (NLP) has emerged as crucial for analyzing textual data and understanding human language",
+            "Machine learning is increasingly important for handling unstructured data: image classification, speech-to-text, sentiment analysis",
+            "Data is only as valuable as the conclusions drawn from it - the goal is actionable insights for decision-making",
+            "Structured data advantages: organized, queryable, consistent schema, good for transactions and reporting",
+            "Unstructured data advantages: rich information, captures real-world complexity, enables advanced AI/ML applications",
+            "Key structured technologies: SQL databases, spreadsheets, data frames (pandas, R)",
+            "Key unstructured technologies: NLP tools (NLTK, spaCy), computer vision (OpenCV), NoSQL databases, big data platforms",
+            "The ultimate objective of data analysis is to derive valuable and practical insights to inform decision-making, regardless of data type",
+            "Relational databases use the relational model with tables, rows, columns, and keys to define relationships between tables",
+            "Relational databases provide ACID properties (Atomicity, Consistency, Isolation, Durability) for robust consistency guarantees",
+            "Relational databases scale vertically (more powerful server) and are great for structured data but difficult to scale horizontally",
+            "Relational databases use SQL (Structured Query Language) - standardized and powerful but complex for advanced queries",
+            "Big data (NoSQL) databases are designed to store, process, and analyze data too large or complex for conventional databases",
+            "Big data databases use BASE model (Basically Available, Soft state, Eventually consistent) for better performance and scalability",
+            "Big data databases scale horizontally (add more servers) and can handle massive volumes (terabytes to petabytes)",
+            "Big data databases use varied query approaches: SQL-like (Hive, CQL), native APIs (MQL), MapReduce, or graph queries",
+            "Choose relational databases for: structured data, ACID compliance, complex joins, transactions, stable schema",
+            "Choose big data databases for: unstructured data, horizontal scaling, massive volumes, eventual consistency, flexible schema",
+            "Modern data architecture often uses hybrid approach: relational for transactions, NoSQL for analytics, data lakes for raw storage",
+            "Relational databases best for: banking, ERP, CRM, e-commerce transactions with structured data",
+            "Big data databases best for: social media analytics, IoT data, real-time recommendations, log analysis with unstructured data",
+            "Fundamental data types include: Numeric (Integer, Float, Complex), String/Character, Boolean, and Date/Time",
+            "Integer data type represents whole numbers (positive/negative) used for counting, IDs, and indexing",
+            "Float data type represents decimal numbers used for prices, measurements, and scientific calculations",
+            "Complex numbers combine real and imaginary components (a+bj) used in engineering and signal processing",
+            "Character represents a single symbol while String represents a sequence of characters (text)",
+            "String data includes any character in the encoding format: letters, punctuation, special characters, and non-calculation numbers",
+            "Boolean data type has only two values (True/False, 1/0) used for flags, conditions, and status indicators",
+            "Date represents calendar dates (2023-06-20), Time represents time of day (13:45:30)",
+            "DateTime combines date and time (2023-06-20T13:45:30) used for timestamps and logs",
+            "TimeSpan/Duration represents time intervals used for calculating durations and time differences",
+            "Choosing the right data type affects storage efficiency, performance, accuracy, and validation",
+            "Common pitfalls: storing phone numbers as integers, using float for currency, storing dates as strings",
+            "Data type selection should consider: storage space, performance needs, accuracy requirements, and compatibility",
+            "The data lifecycle consists of 8 stages: Collection, Pre-processing, Storage, Processing, Analysis, Visualisation, Action, Archiving/Destruction",
+            "Data collection involves gathering raw data from IoT devices, user content, transactions, APIs, and other sources",
+            "Pre-processing includes data cleaning, handling missing values, removing duplicates, type conversion, and normalization",
+            "Storage options include relational databases, NoSQL databases, data lakes, and data warehouses based on data characteristics",
+            "Processing stage involves aggregation, feature engineering, data integration, and transformation for analysis",
+            "Analysis techniques include exploratory data analysis, statistical analysis, machine learning, and time series forecasting",
+            "Visualisation presents insights through charts, dashboards, reports, and infographics for decision-makers",
+            "Action stage translates insights into strategic decisions, operational improvements, marketing campaigns, and product development",
+            "Archiving preserves data for compliance and future reference; destruction securely deletes obsolete data per retention policies",
+            "Each lifecycle stage has considerations for data quality, governance, privacy (GDPR, CCPA), and security",
+            "Data quality involves accuracy, completeness, consistency, and timeliness with validation at each stage",
+            "Data governance requires policies, roles, standards, and compliance frameworks throughout the lifecycle",
+            "RetailCo example demonstrates lifecycle: collecting e-commerce/POS data, cleaning duplicates, storing in hybrid databases",
+            "RetailCo combines transaction and feedback data, uses ML for forecasting, creates KPI dashboards, and takes targeted actions",
+            "Organizations must comply with data protection laws (GDPR, PCI DSS) and maintain strong governance structures throughout the lifecycle",
+            "Data lifecycle approach provides 7 key benefits: enhanced decision-making, improved quality, efficiency, compliance, cost savings, security, and value maximization",
+            "Enhanced decision-making: Structured lifecycle ensures organized collection, reliable storage, and systematic analysis for better insights",
+            "Improved data quality: Systematic cleaning, validation, and transformation ensure accuracy, completeness, consistency, and timeliness",
+            "Efficient data management: Optimized storage (hot/warm/cold), easy access, automated processes, and proper archiving/disposal",
+            "Regulatory compliance: Lifecycle approach helps comply with GDPR, HIPAA, POPI Act, PCI DSS, avoiding fines and legal issues",
+            "Cost savings: Reduced storage costs (archiving/deletion), operational efficiency (automation), fewer errors, and better resource allocation",
+            "Security and privacy: Protection at every stage (encryption, access controls, secure deletion) maintains customer trust and reduces breach risk",
+            "Maximizing value: Data reuse for multiple purposes, cross-functional insights, advanced analytics, and innovation opportunities",
+            "Real-world examples: Amazon (recommendations), Netflix (content decisions), Uber (routing optimization), Healthcare (treatment improvements)",
+            "Data lifecycle management enables systematic data handling from creation to disposal, resulting in wiser choices and competitive advantage",
+            "Organizations using lifecycle approach achieve better ROI through reduced costs, improved efficiency, and enhanced decision-making capabilities",
+            "Lesson summary: Understanding different data types (numeric, string, boolean, date/time) is fundamental to proper data handling",
+            "Lesson summary: Data can be sourced from internal systems (transactional, CRM, HR) and external sources (social media, IoT, public datasets)",
+            "Lesson summary: Multiple storage options exist (spreadsheets, databases, data warehouses, data lakes, cloud storage) with different characteristics",
+            "Lesson summary: Data representation can be structured (tabular, organized) or unstructured (free-form, flexible)",
+            "Lesson summary: Relational databases (ACID, SQL, vertical scaling) differ from big data databases (BASE, horizontal scaling, flexible schema)",
+            "Lesson summary: Individual data entities use specific data types (integer for IDs, float for prices, string for text, boolean for flags, datetime for timestamps)",
+            "Lesson summary: Organizations need systematic data lifecycle plans covering all 8 stages from collection to archiving/destruction",
+            "Lesson summary: Data lifecycle approach provides 7 key benefits: enhanced decisions, quality, efficiency, compliance, cost savings, security, and value",
+            "Lesson summary: Hybrid database architectures combine relational and NoSQL databases for optimal performance and scalability",
+            "Lesson summary: Proper data type selection ensures storage efficiency, performance optimization, data accuracy, and validation",
+            "Lesson summary: Data governance and compliance (GDPR, HIPAA, PCI DSS) are essential throughout the entire data lifecycle",
+            "Lesson summary: Data is only valuable when properly collected, stored, managed, and analyzed using systematic approaches",
+            "Lesson summary: Real-world applications combine multiple concepts (e.g., e-commerce using various data types, sources, storage, and lifecycle management)",
+            "Task solution: Internal data sources (HR, Transactional) are typically structured and stored in relational databases",
+            "Task solution: External data sources (Social Media, IoT/Weather) can be mixed - structured metrics and unstructured content",
+            "Task solution: HR data features include employee_id (integer), names (string), salary (float), hire_date (date), is_active (boolean)",
+            "Task solution: Transactional data features include transaction_id (integer), amounts (float), dates (datetime), payment_status (string)",
+            "Task solution: Social Media data includes structured metrics (likes, shares) and unstructured content (post text, images, videos)",
+            "Task solution: Weather/IoT data includes structured readings (temperature, humidity) and unstructured imagery (satellite, radar)",
+            "Task solution: Documentation with clear descriptions is critical for future users and data maintainability",
+            "Task solution: Proper data type selection (integer for IDs, float for measurements, string for text, boolean for flags) optimizes storage and performance",
+            "Task solution: Excel/CSV works for small datasets, SQL databases for structured data, Python/Pandas for analysis, NoSQL for unstructured data",
+            "Task solution: Combining internal and external data sources provides comprehensive business insights (e.g., sales data + weather data for demand forecasting)",
+            "Task solution: Real-world implementation requires data validation, type conversion, cleaning, and transformation before analysis",
+            "Task solution: Sentiment analysis on social media text (unstructured) can be quantified into sentiment scores (structured) for analysis",
+            "Task solution: Best practices include documenting features, choosing appropriate data types, validating constraints, and using the right tool for each data type"
+        ],
+        "visual_elements": {
+            "diagrams": True,
+            "tables": True,
+            "highlighted_sections": True
+        }
+    },
+    {
+        "lesson_number": "1.3",
+        "title": "Data Collection",
+        "content": """
+### Primary and Secondary Data
+
+Even though a wealth of data is already available, some studies require collecting 'new' data. These two broad categories for data collection can be used to categorise data as **primary** or **secondary**.
+
+#### 🎯 Core Concept: Primary vs Secondary Data
+
+<div class="mermaid">
+flowchart LR
+    A[Data Collection] --> B[Primary Data<br/>📝<br/>First-hand Information]
+    A --> C[Secondary Data<br/>📚<br/>Pre-existing Information]
+    
+    B --> B1[Collected by<br/>Researcher]
+    B --> B2[For Specific<br/>Purpose]
+    
+    C --> C1[Collected by<br/>Others]
+    C --> C2[For Different<br/>Purpose]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style B2 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+    style C2 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+</div>
+
+---
+
+### 📝 Primary Data (First-Order Data)
+
+First-hand information gathered by the researcher or analysts for a particular research project or goal is **primary** or **first-order data**. Primary data is collected from the source and is intended to respond to specific research questions.
+
+#### 🎨 Primary Data Collection Methods
+
+<div class="mermaid">
+graph TB
+    A[Primary Data<br/>Collection Methods] --> B[Surveys<br/>📋<br/>Questionnaires]
+    A --> C[Interviews<br/>🎤<br/>One-on-one]
+    A --> D[Experiments<br/>🔬<br/>Controlled Tests]
+    A --> E[Direct Observation<br/>👁️<br/>Recording Behavior]
+    A --> F[Focus Groups<br/>👥<br/>Group Discussions]
+    
+    B --> B1[Online/Paper<br/>Structured Questions]
+    C --> C1[In-depth<br/>Qualitative Insights]
+    D --> D1[Controlled<br/>Variables]
+    E --> E1[Natural<br/>Settings]
+    F --> F1[Interactive<br/>Feedback]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+</div>
+
+There are various techniques for gathering primary data, and the choice of method frequently depends on the **purpose of the study**, the **resources at hand**, and the **kind of data** being sought. Here are typical primary data collection methods:
+
+##### 1. Surveys / Questionnaires 📋
+
+**Description**: Structured questionnaires distributed to a target audience to gather quantitative and qualitative data.
+
+**Delivery Methods**:
+- **In-person**: Face-to-face administration in specific locations
+- **Mail**: Postal surveys sent to respondents' addresses
+- **Phone**: Telephone interviews using standardized questions
+- **Online**: Web-based surveys via email, websites, or social media
+
+**Characteristics**:
+- Structured questions ensure consistency across respondents
+- Can reach large audiences quickly
+- Standardized format for easy analysis
+- Collect information from a sample of people
+- Mix of closed-ended (quantitative) and open-ended (qualitative) questions
+
+**Examples**:
+- Customer satisfaction surveys
+- Market research questionnaires
+- Employee engagement surveys
+- Product feedback forms
+- Net Promoter Score (NPS) surveys
+
+**Advantages**:
+- Cost-effective for large samples
+- Easy to analyze statistically
+- Respondents can answer at their convenience
+- Anonymity can encourage honest responses
+- Standardized data collection
+- Can cover wide geographic areas
+
+**Disadvantages**:
+- Low response rates (especially mail/online)
+- Limited depth of responses
+- Potential for biased or misunderstood questions
+- No opportunity for follow-up clarification
+- Response bias (only motivated people respond)
+
+##### 2. Interviews 🎤
+
+**Description**: One-on-one conversations between researcher and participant to gather in-depth qualitative information.
+
+**Delivery Methods**:
+- **In-person**: Face-to-face interviews
+- **Phone**: Telephone interviews
+- **Online**: Video conferencing (Zoom, Teams, Skype)
+
+**Types of Interviews**:
+
+**Structured Interviews** 📋
+- Predetermined list of questions in fixed order
+- Same questions asked to all participants
+- Limited flexibility for follow-up
+- Easier to analyze and compare responses
+- Good for quantitative analysis
+
+**Semi-Structured Interviews** 🔄
+- Some predetermined questions as framework
+- Freedom to delve deeper into interesting topics
+- Can probe for more details
+- Flexible order of questions
+- Balance between consistency and exploration
+
+**Unstructured Interviews** 💬
+- More like a guided conversation
+- Broad topics rather than specific questions
+- Maximum flexibility to explore emerging themes
+- Participant-led discussion
+- Rich, detailed qualitative data
+
+**Examples**:
+- Customer interviews about product experiences
+- Expert interviews for industry insights
+- User research interviews
+- Stakeholder interviews
+- Job interviews
+- Clinical interviews
+
+**Advantages**:
+- Rich, detailed information
+- Can explore complex topics in depth
+- Flexibility to follow interesting leads
+- Build rapport with participants
+- Clarify misunderstandings immediately
+- Observe non-verbal cues (in-person)
+
+**Disadvantages**:
+- Time-consuming and expensive
+- Small sample sizes
+- Interviewer bias can influence responses
+- Difficult to analyze and quantify
+- Requires skilled interviewers
+- Cannot guarantee anonymity
+
+##### 3. Observations 👁️
+
+**Description**: Systematically observing and documenting phenomena or behavior as it arises naturally in the wild.
+
+**Types of Observation**:
+
+**Overt Observation** 👀
+- Participants are **aware** they are being watched
+- Researcher's presence is known
+- May affect natural behavior (Hawthorne effect)
+- More ethical (informed consent)
+- Examples: Store managers observing customer service
+
+**Covert Observation** 🕵️
+- Participants are **unaware** they are being watched
+- Hidden or disguised observation
+- More natural behavior
+- Ethical concerns (privacy, consent)
+- Examples: Mystery shoppers, hidden cameras
+
+**Participant vs Non-Participant**:
+- **Participant observation**: Researcher joins the activity
+- **Non-participant observation**: Researcher observes from outside
+
+**Characteristics**:
+- No manipulation of environment
+- Real-world settings
+- Objective recording of behaviors
+- Can be structured (specific behaviors) or unstructured (general observation)
+
+**Examples**:
+- Observing customer behavior in stores
+- Watching how users interact with software
+- Studying workplace processes
+- Recording traffic patterns
+- Classroom observations
+- Wildlife behavior studies
+
+**Advantages**:
+- Natural behavior in real settings
+- First-hand data collection
+- Can capture non-verbal cues
+- Rich contextual information
+- Good for behaviors people can't articulate
+- No reliance on self-reporting
+
+**Disadvantages**:
+- Observer may influence behavior (Hawthorne effect)
+- Time-intensive
+- Limited to observable behaviors (not thoughts/feelings)
+- Difficult to record everything
+- Ethical concerns with covert observation
+- Observer bias in interpretation
+
+##### 4. Experiments 🔬
+
+**Description**: Controlled studies in which one variable is changed to track how it affects another variable.
+
+**Characteristics**:
+- Control over variables (independent and dependent)
+- Random assignment of participants to conditions
+- Establish cause-and-effect relationships
+- Replicable under same conditions
+- Manipulation of independent variable
+- Measurement of dependent variable
+
+**Types**:
+- **Laboratory experiments**: Controlled environment
+- **Field experiments**: Natural settings with controls
+- **Natural experiments**: Observe naturally occurring conditions
+
+**Examples**:
+- A/B testing website designs
+- Product testing in controlled environments
+- Clinical trials for new treatments
+- Usability testing
+- Marketing campaign experiments
+- Psychology experiments
+
+**Advantages**:
+- Can establish causality (cause-and-effect)
+- High level of control over variables
+- Replicable and verifiable
+- Precise measurements
+- Can isolate specific factors
+- Scientific rigor
+
+**Disadvantages**:
+- Artificial settings may not reflect reality
+- Expensive and time-consuming
+- Ethical constraints in some contexts
+- May not be feasible for all research questions
+- External validity concerns (generalizability)
+- Resource-intensive
+
+**Note**: Even though they can be resource-intensive and inappropriate for some research questions, experiments can be a **powerful tool for demonstrating cause-and-effect relationships**.
+
+##### 5. Focus Groups 👥
+
+**Description**: A moderator guides a group discussion on a specific subject, exploring people's experiences, beliefs, or attitudes.
+
+**Characteristics**:
+- Moderated group interaction (typically 6-12 participants)
+- Participants build on each other's ideas
+- Explore attitudes, perceptions, and opinions
+- Generate qualitative insights through discussion
+- Interactive and dynamic
+- Typically 60-90 minutes duration
+
+**Process**:
+1. Moderator introduces topic
+2. Guided discussion with open-ended questions
+3. Participants share perspectives
+4. Group interaction reveals consensus and differences
+5. Moderator probes deeper on key themes
+
+**Examples**:
+- Testing new product concepts
+- Gathering feedback on advertising campaigns
+- Understanding customer preferences
+- Exploring user needs
+- Political opinion research
+- Brand perception studies
+
+**Advantages**:
+- Rich discussion and idea generation
+- Participants stimulate each other's thinking
+- Cost-effective for multiple participants simultaneously
+- Can reveal consensus and differences
+- Group dynamics can uncover insights
+- Observe interactions and reactions
+
+**Disadvantages**:
+- Group dynamics may inhibit some participants
+- Dominant voices can skew results
+- Moderator skill critically important
+- Results not statistically generalizable
+- Groupthink may limit diverse opinions
+- Difficult to schedule and coordinate
+
+**Helpful Tip**: Focus groups can be helpful in **thoroughly examining people's experiences, beliefs, or attitudes** through interactive discussion.
+
+##### 6. Case Studies 📁
+
+**Description**: Thorough investigation of a single subject (such as a person, group, organization, or event) using various data sources.
+
+**Characteristics**:
+- In-depth, comprehensive examination
+- Multiple data sources (triangulation)
+- Contextual analysis
+- Holistic understanding
+- Longitudinal or cross-sectional
+- Rich qualitative data
+
+**Data Sources Used**:
+- Interviews with key individuals
+- Document analysis
+- Observations
+- Archival records
+- Physical artifacts
+- Quantitative data
+
+**Examples**:
+- Business case studies (company success/failure)
+- Medical case studies (patient treatment)
+- Educational case studies (teaching methods)
+- Legal case studies (court cases)
+- Organizational change case studies
+- Individual biography studies
+
+**Advantages**:
+- Thorough understanding of one situation
+- Rich, detailed, contextual data
+- Can explore complex phenomena
+- Reveals interconnections and processes
+- Real-world context preserved
+- Multiple perspectives
+
+**Disadvantages**:
+- Results might not apply to others (limited generalizability)
+- Time and resource intensive
+- Potential for researcher bias
+- Difficult to replicate
+- Cannot establish causality
+- Small sample (typically n=1)
+
+**Note**: Case studies can give you a **thorough understanding of one situation**, but the results might **not apply to others** due to limited generalizability.
+
+##### 7. Field Trials / Pilots 🌾
+
+**Description**: Testing a concept under actual/real-world conditions while recording results.
+
+**Characteristics**:
+- Real-world testing environment
+- Controlled variables where possible
+- Observation and measurement of outcomes
+- Iterative testing and refinement
+- Practical application focus
+
+**Common Applications**:
+- **Product Development**: Testing prototypes with real users
+- **Engineering**: Testing new systems or processes
+- **Agriculture**: Testing new crops, fertilizers, or farming methods
+- **Medicine**: Clinical trials in real healthcare settings
+- **Software**: Beta testing with actual users
+
+**Examples**:
+- Agricultural field trials of new crop varieties
+- Pilot programs for new software features
+- Beta testing consumer products
+- Trial run of new manufacturing process
+- Pilot implementation of new policy
+- Test marketing in select regions
+
+**Advantages**:
+- Real-world feedback and validation
+- Identifies practical problems before full rollout
+- Reduces risk of large-scale failure
+- Generates authentic user data
+- Can refine before full launch
+- Documents real-world performance
+
+**Disadvantages**:
+- Can be expensive to set up
+- May have limited duration
+- Results may vary in different contexts
+- Potential disruption to operations
+- Ethical considerations for participants
+- Difficult to control all variables
+
+**Note**: Field trials are frequently used in **product development, engineering, or agriculture** to test concepts under actual conditions while carefully recording results.
+
+##### 8. Ethnography 🌍
+
+**Description**: Researcher immerses themselves in a community for an extended period to study the behaviors, culture, and practices of its members.
+
+**Characteristics**:
+- Long-term immersion (months to years)
+- Participant observation
+- Cultural context and meaning
+- Holistic perspective
+- Naturalistic setting
+- Qualitative and interpretive
+
+**Methods Used**:
+- Participant observation
+- In-depth interviews
+- Field notes and journals
+- Document analysis
+- Photography/video recording
+- Cultural artifact collection
+
+**Examples**:
+- Studying workplace culture
+- Understanding consumer behavior in natural settings
+- Researching community practices
+- Exploring organizational rituals
+- Investigating subcultures
+- Cross-cultural studies
+
+**Advantages**:
+- Deep cultural understanding
+- Rich contextual data
+- Natural behavior observed
+- Insider perspective
+- Uncovers hidden patterns
+- Long-term relationships build trust
+
+**Disadvantages**:
+- Extremely time-consuming (months/years)
+- Very expensive
+- Researcher can "go native" (lose objectivity)
+- Difficult to generalize findings
+- Ethical challenges of dual roles
+- Language and cultural barriers
+
+**Note**: To study behaviors, culture, and practices, the **researcher immerses themselves** in a community for an **extended period**, gaining insider perspective and deep understanding.
+
+---
+
+### 🔄 Mixed-Methods Approach
+
+It is **typical to combine several methods** within a single study to obtain a more thorough understanding of the research topic. A **mixed-methods approach** is a common term for this.
+
+<div class="mermaid">
+graph TB
+    A[Mixed-Methods<br/>Research] --> B[Quantitative<br/>Methods<br/>📊]
+    A --> C[Qualitative<br/>Methods<br/>💬]
+    
+    B --> B1[Surveys<br/>Experiments<br/>Structured Obs.]
+    C --> C1[Interviews<br/>Focus Groups<br/>Ethnography]
+    
+    B1 --> D[Triangulation]
+    C1 --> D
+    
+    D --> E[Comprehensive<br/>Understanding<br/>💡]
+    
+    E --> F[Numbers<br/>+ Context]
+    E --> G[Breadth<br/>+ Depth]
+    E --> H[Validation<br/>+ Exploration]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+**Benefits of Mixed-Methods**:
+- **Triangulation**: Validate findings through multiple sources
+- **Complementarity**: Different methods reveal different aspects
+- **Development**: One method informs the design of another
+- **Expansion**: Extend breadth and range of inquiry
+- **Comprehensive**: Numbers provide what/how much, words provide why/how
+
+**Example - Customer Experience Research**:
+1. **Survey** (n=1,000): Quantify satisfaction levels and identify problem areas
+2. **Interviews** (n=20): Understand why customers are dissatisfied
+3. **Observation**: Watch actual customer interactions
+4. **Analysis**: Combine all sources for complete picture
+
+**Advantages and Disadvantages Summary**:
+
+Each method has **advantages and disadvantages**, and the **best one will depend on**:
+- Nature of the research question
+- Context and setting
+- Resources available (time, budget, staff)
+- Researcher's skills and expertise
+- Ethical considerations
+- Required depth vs breadth
+
+<div class="mermaid">
+flowchart TB
+    A[Choose Primary<br/>Data Method] --> B{Research Goals?}
+    
+    B -->|Large sample,<br/>quantitative| C[Survey<br/>📋]
+    B -->|In-depth,<br/>qualitative| D[Interview<br/>🎤]
+    B -->|Test causality| E[Experiment<br/>🔬]
+    B -->|Natural behavior| F[Observation<br/>👁️]
+    B -->|Group insights| G[Focus Group<br/>👥]
+    
+    C --> H[Analysis]
+    D --> H
+    E --> H
+    F --> H
+    G --> H
+    
+    H --> I[Insights for<br/>Decision Making<br/>💡]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style H fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style I fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+### ❓ Primary Data Question Types
+
+Surveys and questionnaires, interviews, and focus groups are three commonly used primary data collection methods. The data collector, interviewer, or focus group leader may use a variety of questions during interviews conducted on paper, online, or in person. The type of question used in surveys can impact the calibre of the responses and the kind of analysis you can run.
+
+#### 📋 Survey and Questionnaire Question Types
+
+Here are a few examples of typical survey question types and how they influence analysis:
+
+**Multiple choice questions**
+- Offer a list of options for respondents to select one or more.
+- Simple to analyze quantitatively, but predefined options may miss edge cases.
+
+**Rating scale (Likert scale) questions**
+- Use a scale such as 1-5 or 1-7 to measure agreement or satisfaction.
+- Common anchors include "strongly disagree" to "strongly agree" or "very dissatisfied" to "very satisfied".
+
+**Rank order questions**
+- Ask participants to rank items by importance or preference.
+- Useful for relative priorities, but can be demanding with long lists.
+
+**Open-ended questions**
+- Let respondents answer in their own words.
+- Provide rich detail but require more effort to analyze.
+
+**Dichotomous questions**
+- Offer two possible responses, usually "yes" or "no".
+- Easy to answer and analyze, but limited depth.
+
+**Demographic questions**
+- Capture attributes like age, gender, income, education, or occupation.
+- Essential for segmentation and context.
+
+**Matrix questions**
+- Present several statements with the same response options.
+- Efficient for related items, but can be overwhelming if too large.
+
+**Pictorial questions**
+- Use images as response options.
+- Engaging for visual topics but can be interpreted differently.
+
+**Semantic differential questions**
+- Ask respondents to rate a concept between bipolar adjectives (e.g., "low quality" to "high quality").
+- Useful for measuring attitudes, but requires careful adjective choice to avoid bias.
+
+When designing a survey, consider the data you need, how easy the questions are to answer and analyze, and the overall respondent experience. Balancing these factors improves response quality and usability.
+
+#### 🎤 Interview and Focus Group Question Types
+
+The purpose of interviews and focus groups is to explore a topic in depth and understand participants' viewpoints, experiences, or attitudes. Open-ended formats are common, but structured prompts help keep sessions focused.
+
+**Open-ended questions**
+- Encourage participants to explain in their own words.
+- Example: "Can you describe a typical day at your job?"
+
+**Probing questions**
+- Follow-up prompts to clarify or expand an answer.
+- Example: "Can you tell me more about that experience?"
+
+**Experience or example questions**
+- Ask for specific stories or incidents.
+- Example: "Can you share a time you handled a challenging situation at work?"
+
+**Hypothetical questions**
+- Explore reactions to imagined scenarios.
+- Example: "What would you change if you were the manager of this company?"
+
+**Opinion or belief questions**
+- Capture attitudes or viewpoints on a topic.
+- Example: "What are your opinions on working remotely?"
+
+**Knowledge questions**
+- Gauge a participant's familiarity with a topic.
+- Example: "What do you know about our sustainability initiative?"
+
+**Sensory questions**
+- Explore perceptions related to sensory experience.
+- Example: "How would you describe the flavor of our new chocolate bar?"
+
+**Demographic questions**
+- Provide context such as age, gender, education, or occupation.
+- Often asked at the end to avoid early drop-off.
+
+#### ✅ Question Type Selection Tips (Quick Table)
+
+| Goal | Recommended Question Type | Data Type |
+|------|---------------------------|-----------|
+| Measure agreement or satisfaction | Likert/rating scale | Quantitative |
+| Prioritize options | Rank order | Quantitative |
+| Capture detailed explanations | Open-ended | Qualitative |
+| Confirm a yes/no condition | Dichotomous | Quantitative |
+| Segment respondents | Demographic | Quantitative |
+| Compare multiple items quickly | Matrix | Quantitative |
+| Assess attitudes between opposites | Semantic differential | Quantitative |
+| Explore experiences and context | Open-ended + probing | Qualitative |
+
+**Tip**: Use fewer question types per survey to reduce fatigue, and place sensitive or demographic items near the end.
+
+---
+
+### 🌐 Modern Online Primary Data Collection
+
+Modern online environments have **significantly impacted primary data collection techniques**, offering fresh approaches to information gathering, archiving, and analysis. The digital revolution has transformed how researchers collect, store, and analyze data.
+
+<div class="mermaid">
+graph TB
+    A[Modern Online<br/>Data Collection] --> B[Online Surveys<br/>📱<br/>Digital Platforms]
+    A --> C[Virtual Meetings<br/>💻<br/>Video Conferencing]
+    A --> D[Web Analytics<br/>📊<br/>Behavior Tracking]
+    A --> E[Online Experiments<br/>🔬<br/>A/B Testing]
+    A --> F[Crowdsourcing<br/>👥<br/>Public Participation]
+    A --> G[Mobile Collection<br/>📲<br/>Smartphone Data]
+    
+    B --> H[Fresh Approaches to<br/>Data Collection<br/>🌟]
+    C --> H
+    D --> H
+    E --> H
+    F --> H
+    G --> H
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style F fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style G fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 📱 1. Online Surveys and Questionnaires
+
+The way surveys are conducted has been **revolutionised by digital platforms**. Today, surveys can be distributed via email or shared on social media, which makes it **quicker and less expensive** to reach a larger and more varied audience.
+
+**Digital Survey Platforms**:
+- **Google Forms**: Free, user-friendly, integrates with Google Sheets
+- **SurveyMonkey**: Professional features, templates, analytics
+- **Typeform**: Interactive, engaging user interface
+- **Qualtrics**: Advanced research features, enterprise-level
+- **Microsoft Forms**: Integrated with Office 365
+
+**Key Benefits**:
+- **Speed**: Instant distribution to thousands of participants
+- **Cost**: Minimal distribution and processing costs
+- **Reach**: Global audience accessibility
+- **Automated**: Data entry and analysis automatically handled
+- **Reduced Errors**: No manual data entry mistakes
+- **Real-time**: Results available immediately
+- **Skip Logic**: Dynamic questions based on previous answers
+- **Multimedia**: Include images, videos, audio in questions
+
+**Distribution Channels**:
+- Email campaigns
+- Social media (Facebook, Twitter, LinkedIn)
+- Website pop-ups
+- QR codes
+- SMS text messages
+- Embedded forms
+
+**Features**:
+- Automated data entry and analysis
+- Lower possibility of errors
+- Accelerated research process
+- Branching logic and conditional questions
+- Multi-language support
+- Mobile-responsive design
+
+**Example**:
+A retail company sends an email survey to 10,000 customers after purchase. Within 24 hours, 2,000 responses are collected and automatically analyzed, revealing satisfaction trends by product category.
+
+<div class="mermaid">
+flowchart LR
+    A[Create<br/>Survey] --> B[Digital<br/>Platform]
+    B --> C[Distribution<br/>📧📱]
+    
+    C --> D1[Email]
+    C --> D2[Social Media]
+    C --> D3[Website]
+    C --> D4[QR Code]
+    
+    D1 --> E[Responses<br/>Collected]
+    D2 --> E
+    D3 --> E
+    D4 --> E
+    
+    E --> F[Automated<br/>Analysis<br/>📊]
+    F --> G[Real-time<br/>Results<br/>✅]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 💻 2. Virtual Interviews and Focus Groups
+
+The development of **video conferencing tools** has made it possible to conduct focus groups and interviews online. Due to this, **participants from all over the world can now be included**, and recordings can now be more thoroughly transcribed and analysed.
+
+**Video Conferencing Platforms**:
+- **Zoom**: Screen sharing, breakout rooms, recording
+- **Microsoft Teams**: Integration with Office, collaborative features
+- **Google Meet**: Simple, browser-based, integrated with Calendar
+- **Skype**: One-on-one interviews, international calling
+- **Cisco Webex**: Enterprise security, large group capacity
+
+**Advantages**:
+- **Global Reach**: Include participants worldwide
+- **Cost Savings**: No travel expenses or venue rental
+- **Convenience**: Participants join from home/office
+- **Recording**: Automatic transcription and analysis
+- **Screen Sharing**: Present stimuli, documents, prototypes
+- **Breakout Rooms**: Divide focus groups for sub-discussions
+- **Chat Features**: Backchannel for notes and questions
+- **Accessibility**: Options for closed captions, translation
+
+**Considerations**:
+- Technical requirements (internet, camera, microphone)
+- Digital literacy of participants
+- Privacy and security settings
+- Time zone coordination
+- Non-verbal cues may be harder to read
+
+**Example**:
+A global company conducts virtual focus groups with customers in 5 countries simultaneously, using breakout rooms for regional discussions and recording sessions for detailed analysis later.
+
+<div class="mermaid">
+graph TB
+    A[Virtual Research] --> B[Interviews<br/>1-on-1]
+    A --> C[Focus Groups<br/>6-12 people]
+    
+    B --> D[Video Platform<br/>💻]
+    C --> D
+    
+    D --> E[Features]
+    
+    E --> F[Recording<br/>📹]
+    E --> G[Screen Share<br/>📊]
+    E --> H[Chat<br/>💬]
+    E --> I[Breakout Rooms<br/>👥]
+    
+    F --> J[Analysis<br/>Transcription<br/>✅]
+    G --> J
+    H --> J
+    I --> J
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style J fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 📊 3. Web Analytics and Digital Ethnography
+
+**Online behaviour** is now a valuable source of first-hand information. With the user's permission, researchers can track users' online behaviour, including the websites they visit, the links they click, and how long they spend on each page.
+
+**Tracking Methods**:
+- **Cookies**: Track user sessions and behavior across visits
+- **Server Logs**: Record all server requests and interactions
+- **Specialized Software**: Google Analytics, Hotjar, Mixpanel
+- **Heatmaps**: Visualize where users click, scroll, move
+- **Session Recording**: Replay user interactions
+- **Eye Tracking**: Advanced studies of visual attention
+
+**Data Collected**:
+- **Page Views**: Which pages users visit
+- **Click Behavior**: What links/buttons users click
+- **Time on Page**: Duration of engagement
+- **Scroll Depth**: How far users scroll down pages
+- **Navigation Paths**: User journey through website
+- **Conversion Tracking**: Actions completed (purchases, signups)
+- **Demographics**: Location, device type, browser
+
+**Research Applications**:
+- **Online Consumer Behavior**: Purchase patterns, product browsing
+- **Social Media Use**: Engagement, sharing, interactions
+- **Information-Seeking Behavior**: Search patterns, content consumption
+- **User Experience (UX)**: Website usability, pain points
+- **Digital Marketing**: Campaign effectiveness, attribution
+
+**Privacy Considerations**:
+- ⚠️ Requires user consent and permission
+- Must comply with GDPR, CCPA regulations
+- Clear privacy policies and cookie notices
+- Option to opt-out of tracking
+- Anonymization of personal data
+
+**Example**:
+An e-commerce site uses heatmaps to discover that users consistently miss the "Add to Cart" button. Repositioning it increases conversions by 25%.
+
+<div class="mermaid">
+flowchart TD
+    A[User Visits<br/>Website] --> B{Consent<br/>Given?}
+    
+    B -->|Yes| C[Tracking Tools]
+    B -->|No| D[No Tracking<br/>Privacy Respected]
+    
+    C --> E[Cookies<br/>🍪]
+    C --> F[Server Logs<br/>📝]
+    C --> G[Analytics<br/>📊]
+    
+    E --> H[Behavior Data]
+    F --> H
+    G --> H
+    
+    H --> I[Analysis]
+    
+    I --> J[Insights:<br/>• Pages viewed<br/>• Click patterns<br/>• Time spent<br/>• User journey]
+    
+    J --> K[Improvements<br/>✅]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style H fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style J fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style K fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 🔬 4. Online Experiments (A/B Testing)
+
+**A/B tests**, in which different web page versions are shown to different visitors to see which performs better, have become **simpler to conduct** thanks to platforms like Google Optimize and Optimizely.
+
+**A/B Testing Platforms**:
+- **Google Optimize**: Free, integrates with Google Analytics
+- **Optimizely**: Enterprise-level, advanced features
+- **VWO (Visual Website Optimizer)**: Visual editor, easy setup
+- **Adobe Target**: Comprehensive testing and personalization
+- **Unbounce**: Landing page optimization
+
+**What Can Be Tested**:
+- **Headlines**: Different wording, length, tone
+- **Call-to-Action (CTA) Buttons**: Color, text, placement, size
+- **Images**: Different visuals, product photos, illustrations
+- **Layout**: Page structure, element positioning
+- **Copy**: Product descriptions, value propositions
+- **Pricing**: Different price points, display formats
+- **Forms**: Number of fields, required vs optional
+
+**Process**:
+1. **Hypothesis**: "Changing button color to green will increase clicks"
+2. **Create Variants**: Version A (blue button) vs Version B (green button)
+3. **Split Traffic**: 50% see A, 50% see B
+4. **Collect Data**: Track clicks, conversions, time on page
+5. **Analyze Results**: Statistical significance testing
+6. **Implement Winner**: Roll out better-performing version
+
+**Benefits**:
+- **Data-Driven Decisions**: Remove guesswork
+- **Quick Results**: Get answers in days or weeks
+- **Continuous Improvement**: Iterative optimization
+- **Measurable Impact**: Clear ROI on changes
+- **Low Risk**: Test before full implementation
+
+**Example**:
+An online retailer tests two checkout button colors. The green button achieves a 15% higher conversion rate than the red button, resulting in $50,000 additional monthly revenue.
+
+<div class="mermaid">
+graph LR
+    A[Original Page<br/>Version A] --> C[Split Traffic<br/>50/50]
+    B[Modified Page<br/>Version B] --> C
+    
+    C --> D[Visitors]
+    
+    D --> E[Measure Results]
+    
+    E --> F[Version A:<br/>5% conversion]
+    E --> G[Version B:<br/>7% conversion]
+    
+    F --> H{Winner?}
+    G --> H
+    
+    H -->|Version B<br/>Performs Better| I[Implement<br/>Version B<br/>✅]
+    
+    style A fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style H fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style I fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 👥 5. Crowdsourcing and Citizen Science
+
+The Internet allows researchers to **collect data from the general public on a previously unimaginable scale**.
+
+**Crowdsourcing Platforms**:
+- **Amazon Mechanical Turk (MTurk)**: Micro-tasks, surveys, data labeling
+- **Prolific**: Research-focused participant pool
+- **Zooniverse**: Citizen science projects
+- **Figure Eight (Appen)**: Data annotation and collection
+- **Crowdflower**: Human-in-the-loop machine learning
+
+**Applications**:
+
+**Academic Research** 🎓
+- Large-scale psychology experiments
+- Linguistic studies
+- Economic games and decision-making
+- Survey research with diverse samples
+
+**Citizen Science Projects** 🔬
+- **Wildlife Studies**: Report bird sightings, animal observations
+- **Astronomy**: Classify galaxies, discover exoplanets
+- **Environmental Monitoring**: Track pollution, weather patterns
+- **Health Research**: Track disease symptoms, medication effects
+
+**Digital Humanities** 📚
+- **Transcription**: Historical document transcription
+- **Translation**: Multilingual content translation
+- **Categorization**: Image tagging, content classification
+- **Digitization**: Converting analog records to digital
+
+**Examples**:
+- **eBird**: Millions of bird sightings reported globally by birdwatchers
+- **Galaxy Zoo**: Citizens classify galaxy images, contributing to astronomical research
+- **Foldit**: Players solve protein-folding puzzles, advancing medical research
+- **Old Weather**: Volunteers transcribe historical ship logs for climate research
+
+**Benefits**:
+- **Scale**: Collect massive amounts of data
+- **Speed**: Parallel processing by many contributors
+- **Cost**: Often lower than traditional methods
+- **Diversity**: Access varied perspectives and expertise
+- **Engagement**: Public participation in science
+
+**Challenges**:
+- **Quality Control**: Variable accuracy, need validation
+- **Participant Motivation**: Ensuring engagement
+- **Data Consistency**: Standardizing contributions
+- **Attribution**: Crediting contributors appropriately
+
+<div class="mermaid">
+graph TB
+    A[Crowdsourcing<br/>Platform] --> B[Research Task]
+    
+    B --> C1[Thousands of<br/>Contributors<br/>🌍]
+    
+    C1 --> D1[Participant 1<br/>Contributes Data]
+    C1 --> D2[Participant 2<br/>Contributes Data]
+    C1 --> D3[Participant 3<br/>Contributes Data]
+    C1 --> D4[... Participant N<br/>Contributes Data]
+    
+    D1 --> E[Aggregated<br/>Dataset]
+    D2 --> E
+    D3 --> E
+    D4 --> E
+    
+    E --> F[Quality Control<br/>& Validation]
+    
+    F --> G[Research<br/>Insights<br/>💡]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 📲 6. Mobile Data Collection
+
+Due to the **widespread use of smartphones**, data collection has become **quicker and more effective**. Various fields, including social science, health research, environmental studies, and more, use this technology.
+
+**Mobile Data Types**:
+
+**GPS Location Data** 📍
+- Track movement patterns
+- Map user journeys
+- Location-based services
+- Geofencing studies
+- Travel behavior research
+
+**Images and Videos** 📸
+- Photo documentation
+- Visual diaries
+- Product usage evidence
+- Environmental observations
+- Medical imaging (symptom tracking)
+
+**Real-Time Responses** ⏱️
+- Experience sampling (ESM)
+- Momentary assessments
+- Ecological momentary assessment (EMA)
+- Real-time mood tracking
+- Activity logging
+
+**Sensor Data** 📊
+- Accelerometer (movement, activity)
+- Gyroscope (orientation)
+- Proximity sensors
+- Light sensors
+- Biometric sensors (heart rate, steps)
+
+**Applications by Field**:
+
+**Social Science** 👥
+- Time-use studies
+- Social interaction patterns
+- Communication behavior
+- Daily activities tracking
+
+**Health Research** 🏥
+- Medication adherence
+- Symptom tracking
+- Physical activity monitoring
+- Mental health assessments
+- Disease surveillance
+
+**Environmental Studies** 🌳
+- Air quality monitoring
+- Noise pollution mapping
+- Wildlife observations
+- Citizen science data
+- Climate change tracking
+
+**Market Research** 💼
+- Shopping behavior
+- Product usage patterns
+- In-store experiences
+- Receipt scanning
+- Mobile surveys at point of purchase
+
+**Mobile Survey Tools**:
+- **SurveyMonkey Mobile**: Native apps for iOS/Android
+- **Qualtrics Mobile**: Offline data collection
+- **ODK (Open Data Kit)**: Open-source, works offline
+- **KoBoToolbox**: Humanitarian and development research
+- **CommCare**: Health and social services data
+
+**Benefits**:
+- **Real-Time**: Capture data as events occur
+- **Context-Aware**: Location and environmental data
+- **Multimedia**: Photos, audio, video capabilities
+- **Always Available**: People carry phones constantly
+- **Offline Capability**: Collect data without internet
+- **Reduced Recall Bias**: Capture in-the-moment experiences
+
+**Example**:
+A health study uses a mobile app to prompt participants five times daily to report mood, stress levels, and current activity. GPS data correlates mood with locations, revealing that time in nature improves well-being.
+
+<div class="mermaid">
+flowchart TD
+    A[Smartphone<br/>📱] --> B[Data Collection<br/>Capabilities]
+    
+    B --> C1[GPS<br/>📍<br/>Location]
+    B --> C2[Camera<br/>📸<br/>Images/Video]
+    B --> C3[Sensors<br/>📊<br/>Movement/Bio]
+    B --> C4[Surveys<br/>📋<br/>Real-time]
+    
+    C1 --> D[Research<br/>Applications]
+    C2 --> D
+    C3 --> D
+    C4 --> D
+    
+    D --> E1[Social<br/>Science]
+    D --> E2[Health<br/>Research]
+    D --> E3[Environmental<br/>Studies]
+    D --> E4[Market<br/>Research]
+    
+    E1 --> F[Quick &<br/>Effective<br/>Data Collection<br/>✅]
+    E2 --> F
+    E3 --> F
+    E4 --> F
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+### ⚠️ Challenges and Ethical Considerations of Online Data Collection
+
+But these developments also bring **new difficulties and moral dilemmas** that researchers must carefully address.
+
+<div class="mermaid">
+graph TB
+    A[Online Data<br/>Collection<br/>Challenges] --> B[Privacy &<br/>Security<br/>🔒]
+    A --> C[Digital Divide<br/>& Bias<br/>⚖️]
+    A --> D[Data Quality<br/>📊]
+    A --> E[Technical<br/>Issues<br/>💻]
+    
+    B --> F[Mitigation<br/>Strategies]
+    C --> F
+    D --> F
+    E --> F
+    
+    style A fill:#E74C3C,stroke:#C0392B,stroke-width:3px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style E fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style F fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+</div>
+
+#### 🔒 1. Privacy and Data Security Issues
+
+**Online data collection raises significant privacy and data security issues.**
+
+**Key Concerns**:
+
+**Personal Data Protection** 🛡️
+- Collection of sensitive information
+- Risk of data breaches and hacks
+- Unauthorized access to participant data
+- Third-party data sharing
+- Data retention and deletion
+
+**Surveillance Concerns** 👁️
+- Tracking online behavior
+- Location monitoring
+- Continuous data collection
+- Scope creep (collecting more than necessary)
+- Government or corporate surveillance
+
+**Best Practices**:
+
+✅ **Informed Consent**
+- Clear explanation of data collection
+- Specific purposes stated
+- Right to withdraw explained
+- Consent obtained before collection
+- Language accessible to participants
+
+✅ **Data Anonymization**
+- Remove personally identifiable information (PII)
+- Use pseudonyms or participant IDs
+- Aggregate data where possible
+- De-identification techniques
+- Prevent re-identification risks
+
+✅ **Secure Data Storage**
+- Encryption at rest and in transit
+- Secure servers and databases
+- Access controls and authentication
+- Regular security audits
+- Backup and recovery procedures
+
+✅ **Compliance with Regulations**
+- **GDPR** (General Data Protection Regulation - EU)
+- **CCPA** (California Consumer Privacy Act - USA)
+- **HIPAA** (Health Insurance Portability and Accountability Act - healthcare)
+- **COPPA** (Children's Online Privacy Protection Act - under 13)
+- Local data protection laws
+
+**Example of Good Practice**:
+A health research app collects symptom data with clear consent forms, encrypts all data, stores it on HIPAA-compliant servers, and automatically deletes participant data after study completion.
+
+#### ⚖️ 2. Digital Divide and Sampling Bias
+
+**Online data can be biased** because it frequently underrepresents some demographic groups and overrepresents others.
+
+**Overrepresented Groups** ✅ (Online):
+- Younger individuals (18-45 years)
+- More educated individuals (college/university)
+- Wealthier individuals (higher income)
+- Urban and suburban residents
+- Tech-savvy populations
+- Developed countries
+
+**Underrepresented Groups** ❌ (Online):
+- Older adults (65+ years)
+- Less-educated individuals
+- Low-income individuals
+- Rural residents
+- People with disabilities
+- Developing countries
+- Non-native language speakers
+
+**Consequences**:
+- **Skewed Results**: Don't represent general population
+- **Limited Generalizability**: Findings may not apply broadly
+- **Exclusion**: Voices of marginalized groups not heard
+- **Policy Implications**: Decisions based on incomplete data
+- **Digital Inequality**: Reinforces existing disparities
+
+**Mitigation Strategies**:
+
+🔧 **Mixed-Mode Data Collection**
+- Combine online with phone, mail, in-person
+- Offer multiple participation options
+- Reach those without internet access
+
+🔧 **Targeted Recruitment**
+- Actively recruit underrepresented groups
+- Partner with community organizations
+- Provide devices and internet access if needed
+- Offer incentives for participation
+
+🔧 **Accessibility Features**
+- Screen reader compatibility
+- Multiple language options
+- Simple, clear interfaces
+- Mobile-responsive design
+- Low-bandwidth options
+
+🔧 **Statistical Weighting**
+- Weight responses to match population demographics
+- Post-stratification adjustments
+- Acknowledge limitations in reporting
+
+**Example**:
+A government survey combines online responses with telephone interviews and mailed paper surveys to ensure representation across all age groups and socioeconomic levels.
+
+#### 📊 3. Data Quality Concerns
+
+**Online Data Quality Issues**:
+- **Bot Responses**: Automated fake responses
+- **Satisficing**: Rushed, low-effort responses
+- **Multiple Submissions**: Same person responding multiple times
+- **Attention Failures**: Not reading questions carefully
+- **Technical Errors**: Survey glitches, incomplete submissions
+
+**Quality Control Measures**:
+- CAPTCHA verification
+- Attention check questions
+- Response time monitoring
+- IP address tracking
+- Data validation rules
+- Duplicate detection
+
+#### 💻 4. Technical Issues
+
+**Common Technical Challenges**:
+- Internet connectivity problems
+- Device compatibility issues
+- Browser incompatibilities
+- Software bugs and glitches
+- Data transmission errors
+- Platform downtime
+
+**Solutions**:
+- Responsive design for all devices
+- Cross-browser testing
+- Offline data collection options
+- Automatic save features
+- Technical support availability
+- Pilot testing before launch
+
+<div class="mermaid">
+flowchart LR
+    A[Online Data<br/>Collection] --> B{Ethical<br/>Review}
+    
+    B --> C1[✅ Privacy<br/>Protected]
+    B --> C2[✅ Informed<br/>Consent]
+    B --> C3[✅ Secure<br/>Storage]
+    B --> C4[✅ Representative<br/>Sample]
+    
+    C1 --> D[Proceed with<br/>Collection]
+    C2 --> D
+    C3 --> D
+    C4 --> D
+    
+    D --> E[Quality<br/>Data<br/>💎]
+    
+    B -->|❌ Issues| F[Address<br/>Concerns]
+    F --> B
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style C1 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C2 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C3 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C4 fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style F fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+</div>
+
+---
+
+### 🔑 Key Benefits vs Challenges Summary
+
+| Aspect | Benefits ✅ | Challenges ⚠️ |
+|--------|------------|---------------|
+| **Reach** | Global audience, large samples | Digital divide, sampling bias |
+| **Cost** | Lower than traditional methods | May exclude those without internet |
+| **Speed** | Real-time data, quick deployment | Technical issues, connectivity problems |
+| **Convenience** | Participants respond anytime, anywhere | Requires devices and digital literacy |
+| **Analysis** | Automated, immediate results | Data quality concerns (bots, satisficing) |
+| **Privacy** | Anonymous response options | Security risks, tracking concerns |
+| **Flexibility** | Multimedia, interactive features | Platform compatibility issues |
+| **Scale** | Crowdsourcing massive data collection | Quality control at scale difficult |
+
+---
+
+### 🛠️ Primary Data Collection Platforms
+
+Although the **pen-and-paper method is still an option**, collecting data online can be **much more efficient**. Surveys and questionnaires are some of the most popular methods for gathering data online. Many existing online tools have been specifically designed for this purpose, so it **may not be necessary for some organisations to create their own tools**.
+
+<div class="mermaid">
+graph TB
+    A[Primary Data<br/>Collection Platforms] --> B[Survey Tools<br/>📋<br/>Online Questionnaires]
+    A --> C[Video Conferencing<br/>💻<br/>Interviews & Focus Groups]
+    A --> D[Web Analytics<br/>📊<br/>Behavior Tracking]
+    
+    B --> B1[Google Forms<br/>SurveyMonkey<br/>Qualtrics]
+    C --> C1[Zoom<br/>Teams<br/>Google Meet]
+    D --> D1[Google Analytics<br/>Hotjar<br/>Mixpanel]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style B1 fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style C1 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style D1 fill:#FFE0B2,stroke:#E65100,stroke-width:2px
+</div>
+
+---
+
+#### 📋 Online Survey Platforms
+
+These platforms allow you to create, distribute, and analyze surveys efficiently. Each offers different features and pricing models to suit various needs.
+
+##### 1. Google Forms 🟢
+
+**Description**: A free tool included in the Google online application suite.
+
+**Key Features**:
+- **Simple to use**: Intuitive drag-and-drop interface
+- **Question Types**: Multiple choice, drop-down, linear scale, checkboxes, short answer, paragraph, file upload, date/time
+- **Real-time Collaboration**: Multiple users can edit simultaneously
+- **Integration**: Responses compiled in Google Sheets for analysis
+- **Templates**: Pre-built forms for common use cases
+- **Free**: No cost for unlimited surveys and responses
+
+**Best For**: Quick surveys, simple questionnaires, event registrations, feedback forms
+
+**Pricing**: Free
+
+**Website**: https://www.google.com/forms/about/
+
+##### 2. SurveyMonkey 🐵
+
+**Description**: One of the most popular survey tools available online with extensive customization options.
+
+**Key Features**:
+- **Customization**: Customize survey's look and feel (colors, logos, themes)
+- **Question Types**: Wide variety including matrix, ranking, slider, A/B testing
+- **Logic and Branching**: Skip logic, piping, randomization
+- **Analysis Tools**: Built-in analytics, cross-tabulations, filtering
+- **Distribution**: Email, web link, social media, website embed
+- **Templates**: 200+ expert-designed survey templates
+
+**Pricing**:
+- **Basic**: Free (limited to 10 questions, 40 responses per survey)
+- **Paid Plans**: More sophisticated features available with subscription
+
+**Best For**: Professional surveys, market research, customer satisfaction, employee engagement
+
+**Website**: https://www.surveymonkey.com/
+
+##### 3. Qualtrics 🔬
+
+**Description**: Feature-rich and complex survey tool frequently used in academic, market research, and business settings.
+
+**Key Features**:
+- **Advanced Question Types**: Extensive library of question formats
+- **Complex Branching**: Intricate logic and skip patterns
+- **Powerful Analysis**: Statistical analysis, text analytics, predictive intelligence
+- **Enterprise Features**: API access, single sign-on, advanced security
+- **Multi-language**: Support for 100+ languages
+- **Academic License**: Special pricing for universities
+
+**Pricing**:
+- **Paid Service**: Enterprise pricing (custom quotes)
+- **Trial**: Free trial period available
+- **Academic**: Discounted rates for educational institutions
+
+**Best For**: Academic research, large-scale enterprise surveys, complex market research
+
+**Website**: https://www.qualtrics.com/uk/lp/uk-ppc-experience-management/
+
+##### 4. Typeform 🎨
+
+**Description**: Tool renowned for its distinctive, aesthetically pleasing interface that creates engaging user experiences.
+
+**Key Features**:
+- **Unique Interface**: One-question-at-a-time format
+- **Conversational Feel**: Feels like a conversation, not a survey
+- **Beautiful Design**: Modern, visually appealing templates
+- **Logic Jumps**: Smart conditional logic based on answers
+- **Integrations**: Connects with 100+ apps (Google Sheets, Mailchimp, Slack)
+- **Analytics**: Track completion rates, average time, drop-off points
+
+**Pricing**:
+- **Basic**: Free (limited features, 10 questions, 100 responses/month)
+- **Paid Plans**: More sophisticated features available
+
+**Best For**: Engaging surveys, lead generation, customer feedback, creative questionnaires
+
+**Website**: https://www.typeform.com/
+
+##### 5. Microsoft Forms 📊
+
+**Description**: Component of Microsoft Office 365, comparable to Google Forms with seamless Microsoft integration.
+
+**Key Features**:
+- **Office 365 Integration**: Works with Excel, Teams, SharePoint
+- **Question Types**: Multiple choice, text, rating, date, ranking, Likert
+- **Branching**: Basic skip logic and sections
+- **Quizzes**: Create tests with automatic grading
+- **Collaboration**: Share with colleagues for co-editing
+- **Responses**: Collected in Excel workbook
+
+**Pricing**: Included with Microsoft Office 365 subscription (or free basic version)
+
+**Best For**: Organizations using Microsoft ecosystem, internal surveys, quizzes, polls
+
+**Website**: https://forms.office.com/
+
+##### 6. Zoho Survey 🔶
+
+**Description**: Part of the Zoho business app suite with comprehensive features and easy sharing.
+
+**Key Features**:
+- **Zoho Ecosystem**: Integrates with other Zoho apps (CRM, Analytics)
+- **Question Types**: 25+ question types available
+- **Multi-language**: Support for multiple languages
+- **Offline Surveys**: Collect data without internet connection
+- **Custom Themes**: Brand surveys with your colors and logo
+- **Analytics Dashboard**: Real-time response tracking
+
+**Pricing**:
+- **Free Basic Version**: Limited features
+- **Paid Plans**: Advanced features available
+
+**Best For**: Businesses using Zoho suite, multi-platform sharing, offline data collection
+
+**Website**: https://www.zoho.com/survey/
+
+##### 7. QuestionPro 📝
+
+**Description**: Reliable tool offering wide range of features for creating, disseminating, and analysing surveys.
+
+**Key Features**:
+- **Comprehensive Features**: Survey creation, distribution, analysis
+- **Question Library**: 100+ question types and templates
+- **Complex Logic**: Advanced branching, piping, quotas
+- **Multi-language**: Support for 100+ languages
+- **Offline Data Collection**: Mobile app for offline surveys
+- **Panel Management**: Build and manage respondent panels
+- **Advanced Analytics**: Statistical analysis, sentiment analysis, text analytics
+
+**Pricing**:
+- **Free Basic Plan**: Limited features
+- **Premium Plans**: Advanced features (offline collection, panel management, advanced analytics)
+
+**Best For**: Complex research projects, panel management, offline data collection, enterprise surveys
+
+**Website**: https://www.questionpro.com/
+
+---
+
+#### 📊 Survey Platform Comparison Table
+
+| Platform | Pricing | Best For | Key Strength | Integration |
+|----------|---------|----------|--------------|-------------|
+| **Google Forms** | Free | Quick surveys, simple needs | Ease of use, Google ecosystem | Google Workspace |
+| **SurveyMonkey** | Free + Paid | Professional surveys, market research | Wide adoption, templates | 100+ apps |
+| **Qualtrics** | Paid | Academic, enterprise research | Advanced analytics, complexity | Enterprise systems |
+| **Typeform** | Free + Paid | Engaging experiences | Beautiful design, UX | 100+ apps |
+| **Microsoft Forms** | Free/O365 | Microsoft users, quizzes | Office 365 integration | Microsoft ecosystem |
+| **Zoho Survey** | Free + Paid | Zoho users, offline collection | Zoho ecosystem | Zoho apps |
+| **QuestionPro** | Free + Paid | Complex research, panels | Advanced features | Multiple platforms |
+
+---
+
+#### 💻 Video Conferencing Platforms
+
+Online focus groups and interviews can be conducted using various platforms that enable simultaneous communication with multiple participants.
+
+##### 1. Zoom 🔵
+
+**Description**: Well-liked video conferencing platform commonly used for focus groups, interviews, and remote meetings.
+
+**Key Features**:
+- **Screen Sharing**: Present materials, prototypes, stimuli
+- **Recording**: Record sessions for later transcription and analysis
+- **Breakout Rooms**: Create smaller discussion groups from larger focus groups
+- **Chat**: Text messaging during sessions
+- **Virtual Backgrounds**: Professional appearance
+- **Whiteboard**: Collaborative visual brainstorming
+- **Polling**: Quick surveys during sessions
+- **Capacity**: Up to 1,000 participants (with large meeting add-on)
+
+**Pricing**:
+- **Free**: 40-minute limit for group meetings
+- **Paid Plans**: Unlimited duration, more features
+
+**Best For**: Focus groups, one-on-one interviews, large webinars, breakout discussions
+
+**Website**: https://zoom.us/
+
+##### 2. Microsoft Teams 🟦
+
+**Description**: Collaboration platform supporting video conferencing, part of Microsoft 365 product line.
+
+**Key Features**:
+- **Video Conferencing**: HD video and audio
+- **Screen Sharing**: Share entire screen or specific windows
+- **Breakout Rooms**: Divide into smaller groups
+- **Recording**: Meeting recordings saved to OneDrive/SharePoint
+- **Chat**: Persistent chat before/during/after meetings
+- **Files**: Share and collaborate on documents during calls
+- **Integration**: Deep integration with Office 365 apps
+- **Live Captions**: Real-time transcription
+
+**Pricing**: Included with Microsoft 365 subscription (or free basic version)
+
+**Best For**: Organizations using Microsoft ecosystem, ongoing collaboration, file sharing
+
+**Website**: https://www.microsoft.com/en-za/microsoft-teams/log-in
+
+##### 3. Google Meet 🟢
+
+**Description**: Video conferencing platform part of Google Workspace with seamless Google integration.
+
+**Key Features**:
+- **Large Meeting Support**: Up to 250 participants (with enterprise plan)
+- **Screen Sharing**: Present to all participants
+- **Recording**: Save meetings to Google Drive
+- **Live Captions**: Automatic speech-to-text (English)
+- **Google Calendar**: Integrated scheduling
+- **Breakout Rooms**: Create up to 100 breakout rooms
+- **Polls and Q&A**: Engage participants
+- **Mobile Apps**: Join from anywhere
+
+**Pricing**:
+- **Free**: 60-minute limit for group meetings
+- **Paid**: Google Workspace subscription
+
+**Best For**: Google Workspace users, projects using Google services, simple video calls
+
+**Website**: https://workspace.google.com/intl/en/lp/meet/
+
+##### 4. Cisco Webex 🔷
+
+**Description**: Video conferencing platform frequently used in business settings with enterprise-grade security.
+
+**Key Features**:
+- **Large Meetings**: Support for up to 100,000 participants (webinar mode)
+- **Breakout Sessions**: Divide participants into groups
+- **Screen Sharing**: Share screen, applications, or files
+- **Recording**: Cloud or local recording options
+- **Whiteboard**: Collaborative brainstorming
+- **Polls and Q&A**: Interactive engagement
+- **End-to-End Encryption**: Enterprise security
+- **AI Features**: Real-time transcription, noise removal
+
+**Pricing**:
+- **Free**: Basic features
+- **Paid Plans**: Advanced features and capacity
+
+**Best For**: Enterprise environments, high-security requirements, large webinars
+
+**Website**: https://www.webex.com/
+
+##### 5. GoTo Meeting 🟧
+
+**Description**: Video conferencing service with high-quality audio and video, ideal for professional meetings.
+
+**Key Features**:
+- **High-Quality Audio/Video**: Crystal-clear communication
+- **Screen Sharing**: Share screen or specific applications
+- **Recording**: Cloud recording with transcription
+- **Mobile Access**: Full-featured mobile apps
+- **Drawing Tools**: Annotate shared screens
+- **Keyboard and Mouse Sharing**: Remote control capabilities
+- **Meeting Lock**: Secure meetings from late joiners
+- **Personal Meeting Room**: Consistent meeting URL
+
+**Pricing**: Paid plans (14-day free trial available)
+
+**Best For**: Professional interviews, sales presentations, client meetings
+
+**Website**: https://www.goto.com/meeting
+
+---
+
+#### 🎥 Video Platform Comparison Table
+
+| Platform | Max Participants (Free) | Breakout Rooms | Recording | Best For |
+|----------|------------------------|----------------|-----------|----------|
+| **Zoom** | 100 (40 min limit) | ✅ Yes | ✅ Yes | Focus groups, versatility |
+| **Microsoft Teams** | 100 (60 min limit) | ✅ Yes | ✅ Yes (to OneDrive) | Microsoft 365 users |
+| **Google Meet** | 100 (60 min limit) | ✅ Yes | ✅ Yes (to Drive) | Google Workspace users |
+| **Cisco Webex** | 100 (50 min limit) | ✅ Yes | ✅ Yes | Enterprise security |
+| **GoTo Meeting** | N/A (paid only) | ❌ No | ✅ Yes | Professional meetings |
+
+---
+
+#### 📊 Web Analytics Platforms
+
+Web analytics tools are a large group of platforms for gathering, analysing, and reporting on user interactions with websites. Understanding user behaviour and improving the user experience on a website depends greatly on these platforms.
+
+##### 1. Google Analytics 📈
+
+**Description**: Arguably the most well-liked web analytics tool on the market, mainly because of its extensive feature set and free entry point.
+
+**Key Features**:
+- **Comprehensive Statistics**: Website traffic, traffic sources, user demographics
+- **Conversion Tracking**: Measure sales, signups, downloads
+- **E-commerce Tracking**: Revenue, transactions, product performance
+- **Real-time Data**: Current visitors, active pages, traffic sources
+- **Custom Reports**: Build reports tailored to your needs
+- **Goals and Funnels**: Track conversion paths
+- **Integration**: Works with Google Ads, Search Console, other Google tools
+- **Mobile App Analytics**: Track app usage
+
+**Pricing**: Free (with Google Analytics 360 for enterprise needs)
+
+**Best For**: Most websites, comprehensive free analytics, Google ecosystem integration
+
+**Website**: https://analytics.google.com/analytics/web/#/
+
+##### 2. Adobe Analytics 💼
+
+**Description**: Powerful, enterprise-level analytics tool part of Adobe Experience Cloud.
+
+**Key Features**:
+- **Multi-channel Data Collection**: Web, mobile, IoT, offline
+- **Real-time Data**: Instant insights and alerts
+- **AI and Machine Learning**: Adobe Sensei for predictive analytics
+- **Advanced Segmentation**: Deep customer segmentation
+- **Attribution Analysis**: Multi-touch attribution models
+- **Predictive Analytics**: Forecast trends and behaviors
+- **Data Warehouse**: Store and analyze historical data
+- **Custom Variables**: Unlimited custom dimensions
+
+**Pricing**: Enterprise pricing (custom quotes)
+
+**Best For**: Large enterprises, complex analytics needs, Adobe ecosystem users
+
+**Website**: https://business.adobe.com/products/analytics/adobe-analytics.html
+
+##### 3. Mixpanel 🔬
+
+**Description**: User-centric data tool tracking user interactions with web and mobile applications.
+
+**Key Features**:
+- **Event-Based Tracking**: Track specific user actions
+- **User Profiles**: Individual user journey tracking
+- **Funnel Analysis**: Conversion funnel visualization
+- **Retention Reports**: User engagement over time
+- **Cohort Analysis**: Group users by shared characteristics
+- **A/B Testing**: Experiment tracking
+- **Targeted Communication**: Send messages to specific user segments
+- **User-Friendly Design**: Intuitive interface
+
+**Pricing**:
+- **Free Plan**: Up to 100,000 monthly tracked users
+- **Paid Plans**: More users and features
+
+**Best For**: Product analytics, SaaS applications, mobile apps, user behavior tracking
+
+**Website**: https://mixpanel.com/
+
+##### 4. Heap 📦
+
+**Description**: Automatically records every web, mobile, and cloud interaction without needing to define events beforehand.
+
+**Key Features**:
+- **Auto-Capture**: Automatically captures all events (clicks, submits, transactions, etc.)
+- **Retroactive Analysis**: Analyze past data without prior event definition
+- **No Code Required**: No need for manual event tracking code
+- **User Sessions**: Replay individual user sessions
+- **Conversion Funnels**: Analyze user paths
+- **Event Visualizer**: Point-and-click event definition
+- **Data Science Tools**: SQL access, Python/R integration
+
+**Pricing**:
+- **Free Plan**: Limited features
+- **Paid Plans**: Full feature access
+
+**Best For**: Teams without developers, retroactive analysis, complete data capture
+
+**Website**: https://www.heap.io/
+
+##### 5. Matomo (formerly Piwik) 🔓
+
+**Description**: Open-source web analytics platform offering powerful analytics with full data ownership and privacy.
+
+**Key Features**:
+- **Open Source**: Self-hosted option for complete data control
+- **Privacy-Focused**: GDPR, CCPA compliant by design
+- **Full Data Ownership**: Your data stays on your servers
+- **Comprehensive Analytics**: Similar features to Google Analytics
+- **Heatmaps and Session Recording**: Visual behavior analysis
+- **Custom Reports**: Unlimited custom dimensions and metrics
+- **No Data Sampling**: Analyze 100% of your data
+- **No Data Limits**: Track unlimited websites and users
+
+**Pricing**:
+- **Free**: Self-hosted open-source version
+- **Cloud**: Paid cloud hosting option available
+
+**Best For**: Privacy-conscious organizations, data sovereignty requirements, unlimited data
+
+**Website**: https://matomo.org/
+
+##### 6. Clicky ⚡
+
+**Description**: All-inclusive web analytics tool that tracks and monitors website traffic in real time.
+
+**Key Features**:
+- **Real-time Analytics**: See visitors as they browse
+- **Heatmaps**: Visual click analytics
+- **Uptime Monitoring**: Site availability tracking
+- **Individual Visitor Tracking**: Detailed visitor profiles
+- **Twitter Search**: Monitor Twitter mentions
+- **Campaign Tracking**: UTM and custom parameters
+- **Goals and Conversions**: Track important actions
+- **Simple Interface**: Easy to understand reports
+
+**Pricing**:
+- **Free Plan**: Up to 3,000 daily page views
+- **Paid Plans**: Higher limits and more features
+
+**Best For**: Real-time monitoring, small to medium websites, simple analytics
+
+**Website**: https://clicky.com/
+
+##### 7. Hotjar 🔥
+
+**Description**: User behaviour analytics tool providing heatmaps, session recordings, and survey tools.
+
+**Key Features**:
+- **Heatmaps**: Click, move, scroll heatmaps
+- **Session Recordings**: Watch user interactions
+- **Conversion Funnels**: Identify drop-off points
+- **Form Analysis**: See where users abandon forms
+- **Feedback Polls**: On-site user surveys
+- **Incoming Feedback**: Users can report issues
+- **Recruit Users**: Find participants for user testing
+- **Qualitative Insights**: Understand the "why" behind the data
+
+**Pricing**:
+- **Free Plan**: Basic features, limited data
+- **Paid Plans**: More recordings, unlimited heatmaps
+
+**Best For**: UX research, qualitative insights, used with another analytics tool
+
+**Website**: https://www.hotjar.com/behavior-analytics-software2/
+
+##### 8. Crazy Egg 🥚
+
+**Description**: Visual analytics tool using heatmaps, scroll maps, and other visual reports to understand user interaction.
+
+**Key Features**:
+- **Heatmaps**: Click and attention heatmaps
+- **Scroll Maps**: See how far users scroll
+- **Confetti Reports**: Segment clicks by traffic source
+- **Overlay Reports**: Click data directly on your page
+- **Session Recordings**: Watch user sessions
+- **A/B Testing**: Test page variations
+- **User Surveys**: On-site feedback collection
+- **Error Tracking**: Identify technical issues
+
+**Pricing**: Paid plans (30-day free trial)
+
+**Best For**: Visual analytics, page optimization, conversion improvement
+
+**Website**: https://www.crazyegg.com/
+
+---
+
+#### 🔬 Web Analytics Platform Comparison Table
+
+| Platform | Pricing | Focus | Key Strength | Best For |
+|----------|---------|-------|--------------|----------|
+| **Google Analytics** | Free + Enterprise | Comprehensive | Free, powerful, widely used | Most websites |
+| **Adobe Analytics** | Enterprise | Enterprise-level | AI/ML, predictive analytics | Large enterprises |
+| **Mixpanel** | Free + Paid | Product/User | User-centric, event tracking | SaaS, mobile apps |
+| **Heap** | Free + Paid | Auto-capture | Retroactive analysis | No-code analytics |
+| **Matomo** | Free (self-hosted) + Cloud | Privacy | Data ownership, open-source | Privacy-conscious |
+| **Clicky** | Free + Paid | Real-time | Live monitoring | Real-time insights |
+| **Hotjar** | Free + Paid | UX/Qualitative | Heatmaps, recordings | User experience |
+| **Crazy Egg** | Paid | Visual | Visual reports | Page optimization |
+
+---
+
+### 💡 Choosing the Right Platform
+
+<div class="mermaid">
+flowchart TD
+    A[Choose Platform] --> B{Purpose?}
+    
+    B -->|Survey| C{Budget &<br/>Features?}
+    B -->|Video Meeting| D{Ecosystem?}
+    B -->|Web Analytics| E{Privacy &<br/>Control?}
+    
+    C -->|Free, Simple| C1[Google Forms<br/>Typeform Free]
+    C -->|Professional| C2[SurveyMonkey<br/>Qualtrics]
+    
+    D -->|Google| D1[Google Meet]
+    D -->|Microsoft| D2[Teams]
+    D -->|Neutral| D3[Zoom]
+    
+    E -->|Full Control| E1[Matomo<br/>Self-hosted]
+    E -->|Managed| E2[Google Analytics<br/>Mixpanel]
+    E -->|Visual UX| E3[Hotjar<br/>Crazy Egg]
+    
+    C1 --> F[Start Collecting!]
+    C2 --> F
+    D1 --> F
+    D2 --> F
+    D3 --> F
+    E1 --> F
+    E2 --> F
+    E3 --> F
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style F fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+**Selection Criteria**:
+
+✅ **Budget**: Free vs paid features needed  
+✅ **Existing Ecosystem**: Integration with current tools  
+✅ **Technical Expertise**: Ease of use vs advanced features  
+✅ **Data Privacy**: Control and ownership requirements  
+✅ **Scale**: Number of responses/participants needed  
+✅ **Features**: Specific capabilities required  
+✅ **Support**: Level of customer support needed
+
+---
+
+#### ✅ Advantages of Primary Data
+
+One of its main advantages is that primary data is **specifically targeted to the research question at hand** and can offer **in-depth, accurate information** that is directly applicable to the project.
+
+**Key Advantages**:
+
+**1. Specificity** 🎯
+- Designed exactly for your research question
+- Addresses specific information needs
+- No irrelevant data collection
+- Perfect fit for research objectives
+
+**2. Accuracy** ✓
+- Collected using controlled methods
+- First-hand verification possible
+- Known data quality and reliability
+- Researcher controls quality assurance
+
+**3. Currency** 📅
+- Most up-to-date information
+- Reflects current conditions
+- No time lag between collection and use
+- Relevant to present context
+
+**4. Ownership** 🔑
+- Exclusive access to unique data
+- Competitive advantage
+- Control over data usage
+- Intellectual property potential
+
+**5. Control** ⚙️
+- Choose collection methods
+- Design questions/instruments
+- Select sample and timing
+- Ensure consistency
+
+<div class="mermaid">
+graph TB
+    A[Primary Data<br/>Advantages] --> B[Specificity<br/>🎯<br/>Exact Fit]
+    A --> C[Accuracy<br/>✓<br/>High Quality]
+    A --> D[Currency<br/>📅<br/>Up-to-date]
+    A --> E[Ownership<br/>🔑<br/>Exclusive]
+    A --> F[Control<br/>⚙️<br/>Full Control]
+    
+    B --> G[Better Research<br/>Outcomes<br/>📈]
+    C --> G
+    D --> G
+    E --> G
+    F --> G
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### ❌ Disadvantages of Primary Data
+
+However, gathering primary data can **take a while and be costly**, especially if it calls for extensive surveys or challenging experiments.
+
+**Key Disadvantages**:
+
+**1. Time-Consuming** ⏱️
+- Designing research instruments
+- Recruiting participants
+- Conducting data collection
+- Processing and cleaning data
+- Analyzing results
+
+**2. Expensive** 💰
+- Staff and researcher costs
+- Participant incentives/compensation
+- Equipment and materials
+- Travel and logistics
+- Technology platforms
+
+**3. Limited Scope** 📏
+- Budget constraints limit sample size
+- Time constraints limit depth
+- May not be comprehensive
+- Trade-offs between breadth and depth
+
+**4. Expertise Required** 🎓
+- Proper methodology design
+- Valid sampling techniques
+- Bias mitigation strategies
+- Statistical analysis skills
+- Ethical considerations
+
+**5. Potential Bias** ⚠️
+- Researcher bias in design
+- Selection bias in sampling
+- Response bias from participants
+- Observer effects
+- Interpretation bias
+
+<div class="mermaid">
+graph TB
+    A[Primary Data<br/>Disadvantages] --> B[Time-Consuming<br/>⏱️<br/>Long Process]
+    A --> C[Expensive<br/>💰<br/>High Cost]
+    A --> D[Limited Scope<br/>📏<br/>Constraints]
+    A --> E[Expertise Required<br/>🎓<br/>Skills Needed]
+    A --> F[Potential Bias<br/>⚠️<br/>Various Biases]
+    
+    B --> G[Consider<br/>Trade-offs<br/>⚖️]
+    C --> G
+    D --> G
+    E --> G
+    F --> G
+    
+    G --> H[Primary Data<br/>Worth It?]
+    
+    style A fill:#E74C3C,stroke:#C0392B,stroke-width:3px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style H fill:#FFD700,stroke:#B8860B,stroke-width:2px
+</div>
+
+---
+
+### 📚 Secondary Data (Second-Order Data)
+
+On the other hand, **secondary data**, also called **second-order data**, is information that another party gathers for a different objective. This can include information obtained from company records, information obtained from government databases, information obtained from other researchers (which may have been published in books, articles, or reports), etc.
+
+#### 🎨 Secondary Data Sources
+
+<div class="mermaid">
+graph TB
+    A[Secondary Data<br/>Sources] --> B[Internal<br/>💼<br/>Company Records]
+    A --> C[Government<br/>🏛️<br/>Public Databases]
+    A --> D[Commercial<br/>💵<br/>Market Research]
+    A --> E[Academic<br/>🎓<br/>Research Publications]
+    A --> F[Media<br/>📰<br/>News & Reports]
+    
+    B --> B1[Sales records<br/>Financial data<br/>HR records]
+    C --> C1[Census data<br/>Economic indicators<br/>Health statistics]
+    D --> D1[Industry reports<br/>Market analysis<br/>Consumer data]
+    E --> E1[Journal articles<br/>Studies<br/>Dissertations]
+    F --> F1[News articles<br/>Industry publications<br/>Online content]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+</div>
+
+#### 🧭 Secondary Data Collection Methods
+
+Using data already collected by others is known as **secondary data collection**. It is often **time- and cost-efficient**, but it requires careful evaluation of quality and relevance.
+
+**Common Methods**:
+
+**Public records**
+- Birth and death certificates, marriage licenses, and other official records.
+- Useful for demographic research and longitudinal trends.
+
+**Statistical data**
+- Data published by government agencies, international organizations, and NGOs.
+- Includes social trends, economic indicators, health statistics, and more.
+
+**Literature reviews**
+- Academic books, theses, dissertations, and journal articles.
+- Summarize prior research findings and methodologies on a topic.
+
+**Online databases**
+- Open or subscription databases for market research, legal cases, legislation, and scientific research.
+- Efficient for cross-domain evidence gathering.
+
+**Archives**
+- Historical records, corporate records, and document collections.
+- Can be physical (libraries, museums) or digital (newspaper archives).
+
+**Internal business data**
+- Sales records, CRM data, support logs, and website analytics.
+- Enables secondary analysis for market or competitive insights.
+
+**Social media data**
+- Platform data reflecting consumer behavior, trends, and sentiment.
+- Useful for brand monitoring and public opinion analysis.
+
+**Data aggregators**
+- Organizations that compile datasets from multiple sources for purchase or subscription.
+- Provides broad coverage but may limit transparency in methodology.
+
+**Quality and Ethics Check**:
+- Evaluate relevance, accuracy, and timeliness before use.
+- Consider copyright, licensing, and privacy laws.
+- Document limitations and potential biases in your analysis.
+
+#### 📊 Secondary Methods Comparison Table
+
+| Method | Typical Use | Strength | Risk to Watch |
+|--------|-------------|----------|---------------|
+| Public records | Demographic and legal context | Official, standardized | Coverage gaps, access limits |
+| Statistical data | Trends and benchmarking | Broad scope | Outdated or aggregated too coarsely |
+| Literature reviews | Research synthesis | Depth and rigor | Publication bias |
+| Online databases | Market or scientific evidence | Fast access | Paywalls, unclear methodology |
+| Archives | Historical context | Long-term view | Incomplete or fragmented records |
+| Internal business data | Performance and operations | High relevance | Data silos, quality issues |
+| Social media data | Sentiment and trends | Real-time signals | Sampling bias, privacy concerns |
+| Data aggregators | Multi-source coverage | Convenience | Opaque sourcing/licensing |
+
+**Types of Secondary Data Sources**:
+
+##### 1. Company Records 💼
+
+**Description**: Internal data already collected by the organization.
+
+**Examples**:
+- Sales and transaction histories
+- Customer relationship management (CRM) data
+- Financial records and reports
+- Employee records
+- Production and inventory data
+- Previous research reports
+
+**Use Cases**:
+- Trend analysis over time
+- Performance benchmarking
+- Historical comparisons
+- Internal decision-making
+
+##### 2. Government Databases 🏛️
+
+**Description**: Public data collected by government agencies.
+
+**Examples**:
+- Census data (population, demographics)
+- Economic indicators (GDP, unemployment, inflation)
+- Health statistics (disease rates, mortality)
+- Environmental data (weather, pollution)
+- Education statistics
+- Crime statistics
+
+**Common Sources**:
+- data.gov (United States)
+- data.gov.uk (United Kingdom)
+- Eurostat (European Union)
+- Statistics Norway (SSB)
+- National statistical agencies
+
+**Use Cases**:
+- Market research
+- Policy analysis
+- Academic research
+- Business planning
+
+##### 3. Commercial Data Providers 💵
+
+**Description**: Data sold by market research firms and data brokers.
+
+**Examples**:
+- Market research reports (Nielsen, Gartner, Forrester)
+- Industry analysis
+- Consumer behavior data
+- Credit reports
+- Business intelligence databases
+- Subscription databases
+
+**Characteristics**:
+- High quality and reliability
+- Professional analysis included
+- Can be expensive
+- Regularly updated
+
+##### 4. Academic Research 🎓
+
+**Description**: Published studies and research papers.
+
+**Examples**:
+- Peer-reviewed journal articles
+- Academic books and textbooks
+- Conference papers
+- Dissertations and theses
+- Research databases (Google Scholar, JSTOR, PubMed)
+
+**Use Cases**:
+- Literature reviews
+- Theoretical foundation
+- Methodology reference
+- Building on previous research
+
+##### 5. Media and Publications 📰
+
+**Description**: Information from news outlets and industry publications.
+
+**Examples**:
+- News articles and reports
+- Industry magazines and trade journals
+- Online blogs and websites
+- Press releases
+- Annual reports
+
+**Use Cases**:
+- Current events and trends
+- Industry insights
+- Competitor analysis
+- Market monitoring
+
+<div class="mermaid">
+flowchart LR
+    A[Choose Secondary<br/>Data Source] --> B{Data Needs?}
+    
+    B -->|Internal trends| C[Company<br/>Records<br/>💼]
+    B -->|Population data| D[Government<br/>Databases<br/>🏛️]
+    B -->|Market insights| E[Commercial<br/>Providers<br/>💵]
+    B -->|Research basis| F[Academic<br/>Publications<br/>🎓]
+    B -->|Current trends| G[Media &<br/>Publications<br/>📰]
+    
+    C --> H[Data Collection]
+    D --> H
+    E --> H
+    F --> H
+    G --> H
+    
+    H --> I[Analysis &<br/>Application<br/>💡]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style H fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style I fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### ✅ Advantages of Secondary Data
+
+The main benefit of secondary data is that it may be **easier and quicker to obtain** than primary data because the data collection has already been completed. Secondary data can offer a **more comprehensive or long-term perspective** than what may be possible to gather with primary data.
+
+**Key Advantages**:
+
+**1. Cost-Effective** 💰
+- No data collection expenses
+- Often free or low-cost (especially government data)
+- Saves resources for analysis
+- Multiple researchers can use same data
+
+**2. Time-Saving** ⏱️
+- Data already collected
+- Immediate availability
+- No waiting for responses
+- Quick start to analysis
+
+**3. Large Sample Sizes** 📊
+- Census data covers entire populations
+- Commercial databases have extensive samples
+- Longitudinal data spans many years
+- Geographic breadth
+
+**4. Historical Perspective** 📅
+- Access to past data
+- Trend analysis over time
+- Long-term comparisons
+- Historical context
+
+**5. Credibility** ✓
+- Government and academic sources
+- Professional data collection methods
+- Peer-reviewed research
+- Established reputation
+
+**6. Comprehensive Coverage** 🌍
+- Broad geographic scope
+- Multiple variables
+- Large-scale studies
+- Diverse populations
+
+<div class="mermaid">
+graph TB
+    A[Secondary Data<br/>Advantages] --> B[Cost-Effective<br/>💰<br/>Low Expense]
+    A --> C[Time-Saving<br/>⏱️<br/>Quick Access]
+    A --> D[Large Samples<br/>📊<br/>Extensive Data]
+    A --> E[Historical<br/>📅<br/>Long-term View]
+    A --> F[Credibility<br/>✓<br/>Trusted Sources]
+    A --> G[Comprehensive<br/>🌍<br/>Broad Coverage]
+    
+    B --> H[Efficient<br/>Research<br/>⚡]
+    C --> H
+    D --> H
+    E --> H
+    F --> H
+    G --> H
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style H fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### ❌ Disadvantages of Secondary Data
+
+Secondary data does not always **perfectly fit the research question**, and the researcher has **less control over the accuracy or relevance** of the data.
+
+**Key Disadvantages**:
+
+**1. Relevance Issues** 🎯
+- Collected for different purpose
+- May not address your specific questions
+- Variables may not match your needs
+- Context may differ from your study
+
+**2. Quality Concerns** ⚠️
+- Unknown data collection methods
+- Uncertain accuracy and reliability
+- Potential biases in original collection
+- Difficult to verify quality
+
+**3. Outdated Information** 📅
+- May not reflect current conditions
+- Time lag between collection and use
+- Changes in definitions or methods over time
+- Historical data may not predict future
+
+**4. Limited Control** 🔒
+- Cannot modify collection methods
+- Cannot add variables
+- Cannot control sample selection
+- No influence on quality
+
+**5. Accessibility** 🚫
+- Some data requires payment
+- Privacy restrictions
+- Limited documentation
+- Format compatibility issues
+
+**6. Fit Problems** 📏
+- Geographic mismatch
+- Different time periods
+- Incompatible definitions
+- Aggregation levels don't match needs
+
+<div class="mermaid">
+graph TB
+    A[Secondary Data<br/>Disadvantages] --> B[Relevance<br/>🎯<br/>May Not Fit]
+    A --> C[Quality<br/>⚠️<br/>Unknown Methods]
+    A --> D[Outdated<br/>📅<br/>Not Current]
+    A --> E[Limited Control<br/>🔒<br/>Cannot Modify]
+    A --> F[Accessibility<br/>🚫<br/>Restrictions]
+    A --> G[Fit Problems<br/>📏<br/>Mismatches]
+    
+    B --> H[Careful<br/>Evaluation<br/>Needed<br/>🔍]
+    C --> H
+    D --> H
+    E --> H
+    F --> H
+    G --> H
+    
+    style A fill:#E74C3C,stroke:#C0392B,stroke-width:3px,color:#fff
+    style B fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style F fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style G fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style H fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+</div>
+
+---
+
+### 🔄 Combining Primary and Secondary Data
+
+In reality, **primary and secondary data are frequently combined** in the work of researchers and analysts. For instance, a market researcher may use **secondary data** to gain a general understanding of industry trends before conducting a **survey (primary data)** to gain more detailed knowledge about consumer attitudes.
+
+#### 📊 Integration Strategy
+
+<div class="mermaid">
+flowchart TD
+    A[Research Project] --> B{Start with<br/>Secondary Data}
+    
+    B --> C[Literature Review<br/>📚<br/>What's Known?]
+    C --> D[Industry Reports<br/>📊<br/>Market Context]
+    D --> E[Government Data<br/>🏛️<br/>Demographics]
+    
+    E --> F{Gaps<br/>Identified?}
+    
+    F -->|Yes| G[Design Primary<br/>Data Collection<br/>📝]
+    F -->|No| H[Use Only<br/>Secondary Data]
+    
+    G --> I[Surveys /<br/>Interviews /<br/>Experiments]
+    
+    I --> J[Combine<br/>Both Sources<br/>🔄]
+    H --> J
+    
+    J --> K[Comprehensive<br/>Analysis<br/>💡]
+    
+    K --> L[Actionable<br/>Insights<br/>✅]
+    
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style D fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style E fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style F fill:#E74C3C,stroke:#C0392B,stroke-width:2px,color:#fff
+    style G fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style H fill:#C8E6C9,stroke:#4CAF50,stroke-width:2px
+    style I fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style J fill:#FFD700,stroke:#B8860B,stroke-width:3px
+    style K fill:#4CAF50,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style L fill:#50C878,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+#### 💼 Real-World Example: Market Research Project
+
+**Scenario**: A retail company wants to understand consumer preferences for a new product line.
+
+**Phase 1: Secondary Data** 📚
+- **Industry reports**: Overall market size and trends
+- **Government data**: Demographics of target market
+- **Competitor analysis**: Published financial reports and news articles
+- **Academic research**: Consumer behavior studies
+
+**Insights from Secondary Data**:
+- Market is growing at 15% annually
+- Target demographic: 25-40 years old, urban
+- Major competitors and their market share
+- Key factors influencing purchase decisions
+
+**Phase 2: Primary Data** 📝
+- **Surveys**: 1,000 potential customers about specific product features
+- **Focus groups**: In-depth discussions with 50 participants
+- **A/B testing**: Website designs with 5,000 visitors
+- **Interviews**: 20 one-on-one interviews with key customers
+
+**Insights from Primary Data**:
+- Specific features customers value most
+- Price points customers are willing to pay
+- Preferred marketing messages
+- Unmet needs in current market
+
+**Phase 3: Combined Analysis** 🔄
+- **Secondary data** provides context and benchmarks
+- **Primary data** addresses specific product questions
+- **Integration** creates comprehensive understanding
+- **Validation** of secondary insights through primary research
+
+**Outcome**: 
+- Developed product features based on customer preferences
+- Priced competitively based on market research
+- Targeted marketing to identified segments
+- Projected market share using combined insights
+
+<div class="mermaid">
+graph LR
+    subgraph "Secondary Data Foundation"
+        A1[Industry<br/>Trends] --> C
+        A2[Demographics] --> C
+        A3[Competitor<br/>Analysis] --> C
+    end
+    
+    subgraph "Primary Data Specifics"
+        B1[Customer<br/>Surveys] --> C
+        B2[Focus<br/>Groups] --> C
+        B3[A/B<br/>Testing] --> C
+    end
+    
+    C[Integrated<br/>Analysis<br/>🔄] --> D[Product<br/>Development]
+    C --> E[Pricing<br/>Strategy]
+    C --> F[Marketing<br/>Plan]
+    
+    D --> G[Successful<br/>Product Launch<br/>🚀]
+    E --> G
+    F --> G
+    
+    style C fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style G fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+---
+
+### 📋 Primary vs Secondary Data Comparison
+
+#### Comprehensive Comparison Table
+
+| Aspect | Primary Data | Secondary Data |
+|--------|-------------|----------------|
+| **Definition** | First-hand information collected by researcher for specific purpose | Pre-existing information collected by others for different purpose |
+| **Collection** | Surveys, interviews, experiments, observations, focus groups | Company records, government databases, published research, media |
+| **Cost** | High (collection expenses, staff time, materials) | Low to moderate (often free or subscription-based) |
+| **Time** | Long (design, collect, process, analyze) | Short (readily available, immediate access) |
+| **Specificity** | Perfectly tailored to research question | May not perfectly match research needs |
+| **Accuracy** | High (controlled collection methods) | Variable (depends on original source) |
+| **Control** | Full control over methods and quality | Limited or no control |
+| **Currency** | Most up-to-date | May be outdated |
+| **Sample Size** | Usually smaller (budget/time constraints) | Often larger (government/commercial data) |
+| **Ownership** | Exclusive to collector | Shared, publicly available |
+| **Flexibility** | Can modify approach during collection | Fixed, cannot change |
+| **Reliability** | Known (researcher controls quality) | Unknown (must evaluate source) |
+| **Geographic Scope** | Limited by resources | Often comprehensive |
+| **Historical Data** | Only current collection | May span decades |
+| **Best For** | Specific research questions, unique needs | Context, trends, benchmarks, exploratory research |
+| **Examples** | Customer satisfaction survey, user interviews | Census data, industry reports, academic studies |
+
+#### 🎯 Decision Framework: When to Use Which?
+
+<div class="mermaid">
+flowchart TD
+    Start{Research<br/>Question} --> Q1{Data<br/>Exists?}
+    
+    Q1 -->|No| Primary[Use Primary<br/>Data<br/>📝]
+    Q1 -->|Yes| Q2{Fits Your<br/>Needs?}
+    
+    Q2 -->|Yes| Secondary[Use Secondary<br/>Data<br/>📚]
+    Q2 -->|Partially| Q3{Budget &<br/>Time?}
+    
+    Q3 -->|Limited| Secondary2[Secondary<br/>+ Small Primary]
+    Q3 -->|Adequate| Both[Use Both<br/>🔄]
+    
+    Primary --> End[Data Collection<br/>& Analysis]
+    Secondary --> End
+    Secondary2 --> End
+    Both --> End
+    
+    style Start fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style Q1 fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style Q2 fill:#FF9800,stroke:#E65100,stroke-width:2px
+    style Q3 fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style Primary fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style Secondary fill:#4ECDC4,stroke:#2C7873,stroke-width:2px,color:#fff
+    style Secondary2 fill:#E1BEE7,stroke:#9C27B0,stroke-width:2px
+    style Both fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style End fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+**Use Primary Data When**:
+- No existing data addresses your question
+- Need very specific information
+- Require current, up-to-date data
+- Need to establish causality (experiments)
+- Competitive advantage from unique insights
+- Have sufficient budget and time
+
+**Use Secondary Data When**:
+- Existing data meets your needs
+- Need quick, cost-effective information
+- Require historical perspective
+- Need large sample sizes or broad coverage
+- Building foundation before primary research
+- Limited resources
+
+**Use Both When**:
+- Secondary provides context, primary provides specifics
+- Need to validate secondary findings
+- Comprehensive research project
+- Triangulation for reliability
+- Filling gaps in existing data
+
+---
+
+### 🎯 Best Practices for Data Collection
+
+#### Primary Data Collection Best Practices
+
+**1. Clear Objectives** 🎯
+- Define specific research questions
+- Identify key variables needed
+- Determine required sample size
+- Establish success criteria
+
+**2. Proper Design** 📐
+- Choose appropriate method (survey/interview/etc.)
+- Design unbiased questions
+- Pilot test instruments
+- Plan sampling strategy
+
+**3. Ethical Considerations** ⚖️
+- Obtain informed consent
+- Protect participant privacy
+- Ensure data security
+- Follow GDPR/regulations
+
+**4. Quality Control** ✓
+- Train data collectors
+- Monitor collection process
+- Validate responses
+- Document procedures
+
+**5. Data Management** 💾
+- Plan storage and backup
+- Ensure data security
+- Document metadata
+- Prepare for analysis
+
+### ⚖️ Ethical and Privacy Concerns
+
+Whether primary or secondary, data collection raises ethical and privacy issues. These issues are more prominent than ever in today’s digital age because gathering, storing, and analyzing vast amounts of data is possible.
+
+**Informed consent**
+- Participants must understand how data will be used, stored, who can access it, and how long it will be retained.
+- Participation should be voluntary, and withdrawal must always be an option.
+
+**Anonymity and confidentiality**
+- Protect participant identities through anonymization or secure access controls.
+- Do not disclose identities in reports without explicit permission.
+
+**Data security**
+- Use encryption, secure servers, and access controls to prevent unauthorized access or loss.
+- Especially important for sensitive data such as health or financial records.
+
+**Data accuracy**
+- Ensure accurate collection to avoid flawed conclusions and harmful decisions.
+- Validate instruments and clarify misunderstandings during collection.
+
+**Use of secondary data**
+- Evaluate whether the original consent covers new uses of the data.
+- Consider context, licensing, and the ethical fit of reuse.
+
+**Transparency**
+- Clearly explain how data will be used, stored, and protected.
+- Provide contact points for questions or concerns.
+
+**Legal compliance**
+- Follow applicable laws and regulations (for example, GDPR in the EU).
+- Non-compliance can result in significant penalties and reputational risk.
+
+#### ✅ Ethics Checklist (Quick Use)
+
+- Informed consent captured and documented
+- Participation is voluntary with clear withdrawal options
+- Anonymity/confidentiality protections in place
+- Data stored securely with access controls
+- Secondary data reuse fits original consent and licensing
+- Legal requirements reviewed (GDPR/sector rules)
+
+### 🏛️ Data Protection Acts and Laws
+
+A data analyst may need to consider several privacy laws and regulations when working with personal data worldwide. The list below highlights a few major frameworks, but laws and regulations are not limited to these:
+
+**General Data Protection Regulation (GDPR)**
+- European Union regulation that reshaped global privacy practices.
+- Applies to any organization processing EU residents' personal data, regardless of location.
+
+**California Consumer Privacy Act (CCPA)**
+- California state law that strengthens consumer privacy rights.
+- Applies to companies handling personal data of California residents, even if based elsewhere.
+
+**Personal Data Protection Act (PDPA)**
+- Singapore law governing collection, use, and disclosure of personal data by private organizations.
+- Emphasizes consent, purpose limitation, and reasonable security safeguards.
+
+**Data Protection Act 2018 (DPA 2018)**
+- UK law that supplements GDPR and replaced the 1998 act.
+- Sets rules for how organizations process personal data in the UK.
+
+**Personal Information Protection and Electronic Documents Act (PIPEDA)**
+- Canadian federal law covering commercial use of personal information.
+- Requires transparency, consent, and accountable handling of personal data.
+
+**Brazil General Personal Data Protection Law (LGPD)**
+- Brazil's privacy law similar to GDPR with rights for data subjects.
+- Applies broadly to processing of Brazilian personal data.
+
+**Privacy Act 1988**
+- Australian law protecting personal information used by government agencies and many organizations.
+- Covers principles around collection, use, disclosure, and data quality.
+
+**Protection of Personal Information Act (POPIA)**
+- South African law governing personal data in both public and private sectors.
+- Establishes processing conditions and data subject rights.
+
+**Key Reminder**: These laws differ in scope, requirements, and penalties. Analysts should confirm which rules apply, document compliance steps, and stay updated as regulations evolve.
+
+#### 🌍 Regional Comparison (At a Glance)
+
+| Region | Key Laws | Primary Focus |
+|--------|----------|----------------|
+| EU | GDPR | Strong data subject rights, lawful basis, cross-border safeguards |
+| US (California) | CCPA | Consumer rights to access, delete, and opt-out of sale/sharing |
+| UK | DPA 2018 + UK GDPR | GDPR-aligned rules with local governance |
+| Canada | PIPEDA | Consent-based commercial data handling |
+| Brazil | LGPD | GDPR-like framework with national oversight |
+| Singapore | PDPA | Consent and purpose limitation for private organizations |
+| Australia | Privacy Act 1988 | Principles-based protection across sectors |
+| South Africa | POPIA | Processing conditions and data subject rights |
+
+<div class="mermaid">
+flowchart TD
+    A[Start: Personal Data?] --> B{Data subject location?}
+    B -->|EU| C[Apply GDPR]
+    B -->|UK| D[Apply UK GDPR + DPA 2018]
+    B -->|California| E[Apply CCPA]
+    B -->|Canada| F[Apply PIPEDA]
+    B -->|Brazil| G[Apply LGPD]
+    B -->|Singapore| H[Apply PDPA]
+    B -->|Australia| I[Apply Privacy Act 1988]
+    B -->|South Africa| J[Apply POPIA]
+    B -->|Other| K[Check local privacy laws]
+
+    C --> L[Confirm lawful basis,
+consent, retention, rights]
+    D --> L
+    E --> L
+    F --> L
+    G --> L
+    H --> L
+    I --> L
+    J --> L
+    K --> L
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:3px,color:#fff
+    style B fill:#FFD700,stroke:#B8860B,stroke-width:2px
+    style C fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style D fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style E fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style F fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style G fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style H fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style I fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style J fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style K fill:#9E9E9E,stroke:#424242,stroke-width:2px,color:#fff
+    style L fill:#4CAF50,stroke:#2E7D32,stroke-width:3px,color:#fff
+</div>
+
+**Cross-border note**: If data moves across borders, check transfer rules (e.g., GDPR adequacy decisions, SCCs) and document safeguards.
+
+### 🇪🇺 GDPR (General Data Protection Regulation)
+
+The GDPR is a cornerstone of modern data protection. Adopted by the European Union, it took effect on 25 May 2018 and reshaped how personal data about individuals is handled within the EU and beyond.
+
+**Key Features**:
+
+**Territorial scope**
+- Applies to any organization processing the personal data of EU residents, regardless of where the organization is located.
+- Covers organizations that offer goods/services to, or monitor, people in the EU.
+
+**Consent**
+- Must be freely given, specific, informed, and unambiguous.
+- It must be as easy to withdraw consent as it is to give it.
+
+**Rights of individuals**
+- Access to personal data and information about processing.
+- Rectification of inaccurate data.
+- Erasure ("right to be forgotten").
+- Restriction of processing.
+- Data portability.
+- Objection to processing.
+
+**Data Protection Impact Assessments (DPIAs)**
+- Required for high-risk processing to identify and reduce privacy risks.
+
+**Data Protection Officers (DPOs)**
+- Mandatory in certain cases, such as public authorities or large-scale processing of special category data.
+
+**Breach notification**
+- Certain breaches must be reported to the supervisory authority within 72 hours.
+- Individuals must be notified if there is a high risk to their rights and freedoms.
+
+**Penalties**
+- Severe fines: up to 4% of global annual turnover or 20 million EUR (whichever is higher).
+
+**Why it matters for analysts**: GDPR gives people more control over their data and requires transparent, careful handling. Analysts regularly work with personal data and must ensure collection, storage, and analysis remain compliant.
+
+#### 🔎 GDPR vs CCPA (Quick Comparison)
+
+| Area | GDPR (EU) | CCPA (California) |
+|------|----------|-------------------|
+| Scope | Applies to processing EU residents' personal data | Applies to personal data of California residents |
+| Legal basis | Requires a lawful basis (e.g., consent, contract, legitimate interest) | Focuses on consumer rights; no explicit lawful basis model |
+| Consent | Often required; must be explicit and easy to withdraw | Opt-out model for sale/sharing of personal data |
+| Individual rights | Access, rectification, erasure, restriction, portability, objection | Access, delete, opt-out of sale/sharing, non-discrimination |
+| Breach notice | Notify authority within 72 hours for qualifying breaches | Notification required under state breach laws |
+| Penalties | Up to 4% of global turnover or 20M EUR | Civil penalties enforced by the state; private right of action for certain breaches |
+
+#### 🔎 GDPR vs LGPD (Quick Comparison)
+
+| Area | GDPR (EU) | LGPD (Brazil) |
+|------|----------|--------------|
+| Scope | Applies to processing EU residents' personal data | Applies to processing Brazilian personal data |
+| Legal basis | Requires a lawful basis (e.g., consent, contract, legitimate interest) | Similar lawful bases including consent and legitimate interest |
+| Individual rights | Access, rectification, erasure, restriction, portability, objection | Access, correction, anonymization/deletion, portability, objection |
+| Regulator | Independent supervisory authorities | National Data Protection Authority (ANPD) |
+| Penalties | Up to 4% of global turnover or 20M EUR | Up to 2% of revenue in Brazil, capped by law |
+
+#### Secondary Data Evaluation Best Practices
+
+**1. Source Credibility** 🔍
+- Who collected the data?
+- What is their reputation?
+- What were their objectives?
+- Any potential biases?
+
+**2. Methodology Assessment** 📊
+- How was data collected?
+- What was the sample size?
+- What time period covered?
+- Any limitations noted?
+
+**3. Relevance Check** 🎯
+- Does it address your question?
+- Are definitions compatible?
+- Is geographic scope appropriate?
+- Is time period relevant?
+
+**4. Currency Evaluation** 📅
+- When was data collected?
+- Still relevant today?
+- Have conditions changed?
+- Need supplementary current data?
+
+**5. Quality Indicators** ✓
+- Peer-reviewed?
+- Government/academic source?
+- Transparent methodology?
+- Replicable results?
+
+<div class="mermaid">
+graph TB
+    subgraph "Primary Data Best Practices"
+        P1[Clear<br/>Objectives] --> P6[Quality<br/>Data]
+        P2[Proper<br/>Design] --> P6
+        P3[Ethical<br/>Considerations] --> P6
+        P4[Quality<br/>Control] --> P6
+        P5[Data<br/>Management] --> P6
+    end
+    
+    subgraph "Secondary Data Best Practices"
+        S1[Source<br/>Credibility] --> S6[Reliable<br/>Data]
+        S2[Methodology<br/>Assessment] --> S6
+        S3[Relevance<br/>Check] --> S6
+        S4[Currency<br/>Evaluation] --> S6
+        S5[Quality<br/>Indicators] --> S6
+    end
+    
+    P6 --> Final[Successful<br/>Research<br/>Outcomes<br/>🎯]
+    S6 --> Final
+    
+    style P6 fill:#50C878,stroke:#2E7D32,stroke-width:3px,color:#fff
+    style S6 fill:#FF9800,stroke:#E65100,stroke-width:3px,color:#fff
+    style Final fill:#4CAF50,stroke:#2E7D32,stroke-width:4px,color:#fff
+</div>
+
+---
+
+### ✅ The Task
+
+In this lesson, you learned how to collect primary data using online methods. A simple and free approach is to create a survey in **Google Forms**. If you have never used Google Forms, follow this short guide and build the survey described below.
+
+#### 🧭 Quick Guide: How to Create a Google Form
+
+1. Go to https://forms.google.com and sign in.
+2. Click **Blank** to create a new form.
+3. Add a **title** and **description** (e.g., "Customer Experience Survey").
+4. Use **Add question** to insert items and choose the **question type**.
+5. Group questions with **Section** to keep the survey short and clear.
+6. Turn on **Required** for essential questions only.
+7. Click **Send** to share by link, email, or QR code.
+
+#### 🧩 Survey Scenario and Requirements
+
+**Scenario**: Alex manages a well-known clothing store and wants to understand customers better to improve offerings and satisfaction.
+
+Design a survey that captures:
+- **Demographics** (age, gender, location, income)
+- **Shopping habits** (frequency, spend, channel)
+- **Store experience** (layout, cleanliness, fitting rooms, checkout)
+- **Customer service** (friendliness, product knowledge, responsiveness)
+- **Product selection** (variety, brands, quality, style, price)
+- **Loyalty programs and promotions** (awareness, participation, appeal)
+- **Overall satisfaction and improvement suggestions**
+
+Keep the survey short and focused to respect customers' time. Start with the most essential questions and end with demographics.
+
+#### 📝 Example Survey Structure (Recommended Question Types)
+
+**Section 1: Shopping Habits**
+- How often do you shop with us? (Multiple choice)
+- What is your typical spend per visit? (Multiple choice)
+- Which channels do you use most? In-store, online, both (Multiple choice)
+
+**Section 2: Store Experience**
+- Rate the store layout and ease of finding items. (Likert scale)
+- Rate cleanliness and fitting room experience. (Likert scale)
+- How would you rate checkout speed? (Rating scale)
+
+**Section 3: Customer Service**
+- Staff friendliness (Likert scale)
+- Product knowledge (Likert scale)
+- Responsiveness to questions (Likert scale)
+
+**Section 4: Product Selection**
+- Is our product selection adequate? (Yes/No)
+- Which categories should we expand? (Checkboxes)
+- Rate quality, style, and price. (Matrix)
+
+**Section 5: Loyalty and Promotions**
+- Are you aware of our loyalty program? (Yes/No)
+- Do you participate in it? (Yes/No)
+- What would make it more appealing? (Open-ended)
+
+**Section 6: Overall Satisfaction**
+- Overall satisfaction with the store (Likert scale)
+- What is one improvement you want most? (Open-ended)
+
+**Section 7: Demographics**
+- Age group, gender, location, income range (Multiple choice)
+
+**Tip**: Aim for 12-18 questions total. Use mostly closed questions for analysis and 2-3 open-ended questions for insight.
+
+#### ✅ Submission Checklist (Rubric)
+
+- Covers all required categories (demographics, habits, experience, service, products, loyalty, satisfaction)
+- Uses appropriate question types (Likert, multiple choice, matrix, open-ended)
+- Survey length is reasonable (12-18 questions)
+- Questions are clear, unbiased, and easy to answer
+- Sensitive items (demographics, income) placed near the end
+
+#### 🧾 Sample Google Form Title and Description
+
+**Title**: Customer Experience Survey - Alex's Clothing Store
+
+**Description**: Thank you for visiting our store. This short survey (3-5 minutes) helps us understand your experience and improve our products and service. Your answers are anonymous and will be used only for research and service improvement. By continuing, you consent to participate and may stop at any time.
+
+#### 🧩 Sample Survey Questions (18 Items)
+
+1. How often do you shop with us? (Multiple choice)
+2. What is your typical spend per visit? (Multiple choice)
+3. Which shopping channel do you use most? In-store, online, both (Multiple choice)
+4. Rate the store experience (layout, cleanliness, fitting rooms, checkout). (Matrix)
+5. Rate staff service (friendliness, product knowledge, responsiveness). (Matrix)
+6. Is our product selection adequate? (Yes/No)
+7. Which categories should we expand? (Checkboxes)
+8. Rate product quality, style, and price. (Matrix)
+9. Are you aware of our loyalty program? (Yes/No)
+10. Do you participate in the loyalty program? (Yes/No)
+11. What would make the loyalty program more appealing? (Open-ended)
+12. Overall satisfaction with the store. (Likert scale)
+13. What is one improvement you want most? (Open-ended)
+14. Age group. (Multiple choice)
+15. Gender. (Multiple choice)
+16. Location. (Multiple choice)
+17. Household income range. (Multiple choice)
+18. How did you first hear about our store? (Multiple choice)
+
+### 📚 What Did I Learn in This Lesson?
+
+This lesson provided the following insights:
+
+- Primary and secondary data are two broad categories describing how data was collected.
+- There are a variety of existing platforms for collecting primary data or retrieving secondary data.
+- Applying the right question type improves the quality of data collected.
+- All data must be collected and stored according to ethical principles and in adherence to the privacy laws of the region where data is collected or retained.
+
+### 💡 Key Takeaways
+
+1. **Primary data** = first-hand information collected by researcher for specific research purpose
+2. **Secondary data** = pre-existing information collected by others for different purposes
+3. **Primary data methods** include: surveys/questionnaires, interviews, observations, experiments, focus groups, case studies, field trials/pilots, ethnography
+4. **Surveys** can be delivered in-person, by mail, by phone, or online; use structured questions to collect information from samples
+5. **Interviews** have three types: structured (predetermined questions), semi-structured (mix of set and exploratory), unstructured (guided conversation)
+6. **Survey question types** include multiple choice, Likert scale, rank order, open-ended, dichotomous, demographic, matrix, pictorial, and semantic differential
+7. **Interview/focus group questions** commonly include open-ended, probing, experience/example, hypothetical, opinion, knowledge, sensory, and demographic prompts
+8. **Question design** should balance data needs, analysis simplicity, and respondent experience to improve response quality
+9. **Observations** can be overt (participants aware) or covert (participants unaware); also participant vs non-participant
+10. **Experiments** are controlled studies changing one variable to track effects on another; powerful for demonstrating cause-and-effect
+11. **Focus groups** use moderator-guided discussions (6-12 people) to explore experiences, beliefs, and attitudes in depth
+12. **Case studies** thoroughly investigate single subjects using various data sources; provide deep understanding but limited generalizability
+13. **Field trials/pilots** test concepts under real-world conditions; frequently used in product development, engineering, agriculture
+14. **Ethnography** involves researcher immersion in community for extended period to study behaviors, culture, and practices
+15. **Mixed-methods approach** combines several methods (e.g., surveys + interviews) for more thorough understanding
+16. **Modern online environments** have significantly impacted primary data collection, offering fresh approaches to gathering, archiving, and analyzing data
+17. **Online surveys** revolutionized by digital platforms; quicker, less expensive, larger and more varied audience reach via email/social media
+18. **Digital survey platforms** (Google Forms, SurveyMonkey, Typeform, Qualtrics) enable automated data entry and analysis, reducing errors
+19. **Virtual interviews/focus groups** made possible by video conferencing tools; include participants worldwide, enable thorough transcription
+20. **Web analytics and digital ethnography** track online behavior (websites visited, links clicked, time on page) with user permission
+21. **Online experiments (A/B testing)** platforms (Google Optimize, Optimizely) make it simple to test different versions and see which performs better
+22. **Crowdsourcing and citizen science** allow researchers to collect data from general public on previously unimaginable scale
+23. **Mobile data collection** uses smartphones for GPS data, images, videos, real-time responses; quicker and more effective across fields
+24. **Privacy and data security** are significant concerns with online data collection; requires informed consent, anonymization, secure storage
+25. **Digital divide creates bias**: Online data often overrepresents younger, educated, wealthier individuals and underrepresents older, less-educated, low-income groups
+26. **GDPR, CCPA, HIPAA compliance** essential for protecting participants' privacy and securing data properly
+27. **Primary data advantages**: Specificity (exact fit), accuracy (controlled), currency (up-to-date), ownership (exclusive), control (full)
+28. **Primary data disadvantages**: Time-consuming, expensive, limited scope, requires expertise, potential bias
+29. **Secondary data sources**: company records, government databases, commercial providers, academic research, media publications
+30. **Secondary data collection methods** include public records, statistical data, literature reviews, online databases, and archives
+31. **Internal business data, social media data, and data aggregators** provide rich secondary datasets for market, trend, and sentiment insights
+32. **Ethical data collection** requires informed consent, voluntary participation, and clear withdrawal options
+33. **Anonymity and confidentiality** protect identities; avoid disclosure without explicit permission
+34. **Data security and accuracy** are critical to prevent misuse and incorrect conclusions
+35. **Secondary data reuse** must respect original context, licensing, and consent scope
+36. **Legal compliance** (e.g., GDPR) is mandatory and violations can be costly
+37. **GDPR scope** applies to organizations processing EU residents' data, regardless of location
+38. **GDPR consent** must be freely given, specific, informed, and easy to withdraw
+39. **GDPR rights** include access, rectification, erasure, restriction, portability, and objection
+40. **GDPR obligations** include DPIAs, DPOs in certain cases, and 72-hour breach notification
+41. **Data protection frameworks** include GDPR, CCPA, PDPA, DPA 2018, PIPEDA, LGPD, Privacy Act 1988, and POPIA
+42. **Quality and ethics checks** are essential: evaluate relevance, accuracy, timeliness, licensing, privacy, and copyright constraints
+43. **Secondary data advantages**: Cost-effective, time-saving, large samples, historical perspective, credibility, comprehensive coverage
+44. **Secondary data disadvantages**: Relevance issues, quality concerns, outdated information, limited control, accessibility restrictions
+45. **Best practice**: Combine primary and secondary data for comprehensive research; start with secondary for context, use primary to fill gaps
+46. **Triangulation**: Using multiple data sources and methods (mixed-methods) increases reliability and validity of research findings
+            """,
+        "key_points": [
+            "Primary data is first-hand information collected by the researcher for a specific research purpose",
+            "Secondary data is pre-existing information collected by others for different objectives",
+            "Choice of primary data collection method depends on: purpose of study, resources at hand, kind of data being sought",
+            "Surveys/Questionnaires: Can be delivered in-person, by mail, by phone, or online; use structured questions to gather quantitative data from samples",
+            "Interviews: Three types - Structured (predetermined questions), Semi-structured (some predetermined + freedom to explore), Unstructured (guided conversation)",
+            "Survey question types include multiple choice, Likert scale, rank order, open-ended, dichotomous, demographic, matrix, pictorial, and semantic differential; choice impacts analysis",
+            "Interview and focus group questions commonly use open-ended, probing, experience/example, hypothetical, opinion, knowledge, sensory, and demographic prompts",
+            "Good question design balances data needs, analysis simplicity, and respondent experience to improve response quality",
+            "Interviews can be conducted in-person, by phone, or online via various platforms",
+            "Observations: Can be overt (participants aware) or covert (participants unaware); methodically observe and document behavior as it arises naturally",
+            "Experiments: Controlled studies changing one variable to track effects on another; powerful for demonstrating cause-and-effect but resource-intensive",
+            "Focus Groups: Moderator-guided group discussion (6-12 participants) on specific topics; helpful for thoroughly examining experiences, beliefs, attitudes",
+            "Case Studies: Thorough investigation of single subject using various data sources; provides deep understanding but results might not apply to others",
+            "Field Trials/Pilots: Test concepts under actual/real-world conditions while recording results; frequently used in product development, engineering, agriculture",
+            "Ethnography: Researcher immerses in community for extended period to study behaviors, culture, and practices of members",
+            "Mixed-methods approach: Typical to combine several methods within single study to obtain more thorough understanding of research topic",
+            "Modern online environments have significantly impacted primary data collection techniques, offering fresh approaches to information gathering, archiving, and analysis",
+            "Online surveys revolutionized by digital platforms (Google Forms, SurveyMonkey, Typeform, Qualtrics); quicker, less expensive to reach larger, more varied audience",
+            "Digital surveys enable automated data entry and analysis, lowering possibility of errors and accelerating the research process",
+            "Virtual interviews and focus groups made possible by video conferencing tools (Zoom, Teams, Google Meet); participants from all over world can be included",
+            "Video conferencing enables recordings for thorough transcription and analysis of interviews and focus groups",
+            "Web analytics and digital ethnography: Track online behavior (websites visited, links clicked, time spent) with user's permission using cookies, server logs, specialized software",
+            "Online behavior data valuable for researching social media use, online consumer behavior, and information-seeking behavior",
+            "Online experiments (A/B testing): Platforms like Google Optimize and Optimizely make it simpler to test different web page versions to see which performs better",
+            "Crowdsourcing and citizen science: Internet allows collecting data from general public on previously unimaginable scale (e.g., wildlife sightings, document transcriptions)",
+            "Mobile data collection: Widespread smartphones enable quicker, more effective data collection using GPS data, images, videos, and real-time responses",
+            "Mobile data used across social science, health research, environmental studies, market research, and more fields",
+            "Online data collection brings new difficulties and moral dilemmas that must be carefully addressed",
+            "Privacy and data security: Online data collection raises significant issues; crucial to get informed consent, anonymize data, and ensure secure storage",
+            "GDPR, CCPA, HIPAA compliance essential to protect participants' privacy throughout online data collection process",
+            "Digital divide creates sampling bias: Online data frequently overrepresents younger, more educated, wealthier individuals",
+            "Digital divide underrepresents older adults, less-educated individuals, low-income individuals in online research",
+            "Mitigation strategies for bias: Mixed-mode data collection, targeted recruitment, accessibility features, statistical weighting to match population demographics",
+            "Each method has advantages and disadvantages; best choice depends on research question nature, context, resources, and researcher skills/expertise",
+            "Primary data advantages: specificity (exact fit), accuracy (controlled methods), currency (up-to-date), ownership (exclusive), control (full)",
+            "Primary data disadvantages: time-consuming, expensive, limited scope, requires expertise, potential for various biases",
+            "Secondary data sources: company records, government databases, commercial providers, academic research, media publications",
+            "Secondary data collection methods include public records, statistical data, literature reviews, online databases, and archives",
+            "Internal business data, social media data, and data aggregators provide additional secondary datasets for market and sentiment insights",
+            "Ethical data collection requires informed consent, voluntary participation, and clear withdrawal options",
+            "Anonymity and confidentiality protect participant identities; do not disclose without explicit permission",
+            "Data security and accuracy are critical to prevent misuse and incorrect conclusions",
+            "Secondary data reuse must respect original context, licensing, and consent scope",
+            "Legal compliance (e.g., GDPR) is mandatory and violations can be costly",
+            "GDPR scope applies to organizations processing EU residents' data, regardless of location",
+            "GDPR consent must be freely given, specific, informed, and easy to withdraw",
+            "GDPR rights include access, rectification, erasure, restriction, portability, and objection",
+            "GDPR obligations include DPIAs, DPOs in certain cases, and 72-hour breach notification",
+            "Data protection frameworks include GDPR, CCPA, PDPA, DPA 2018, PIPEDA, LGPD, Privacy Act 1988, and POPIA",
+            "Quality and ethics checks: evaluate relevance, accuracy, timeliness, licensing, privacy, and copyright constraints before use",
+            "Secondary data advantages: cost-effective, time-saving, large sample sizes, historical perspective, credibility, comprehensive coverage",
+            "Secondary data disadvantages: relevance issues, quality concerns, outdated information, limited control, accessibility restrictions, fit problems",
+            "Best practice: Combine primary and secondary data for comprehensive research outcomes (e.g., secondary for context, primary for specifics)",
+            "Integration strategy: Start with secondary data for general understanding, then conduct primary data collection for more detailed knowledge",
+            "Decision framework: Use primary when no existing data fits; use secondary when existing data meets needs; use both for comprehensive projects",
+            "Quality evaluation essential: Assess source credibility, methodology, relevance, currency, and quality indicators for secondary data",
+            "Ethical considerations critical: Informed consent, privacy protection, data security, especially for online methods, covert observation, and ethnography",
+            "Triangulation: Using multiple data sources and methods (mixed-methods) increases reliability and validity of research findings"
+        ],
+        "visual_elements": {
+            "diagrams": True,
+            "tables": True,
+            "highlighted_sections": True
+        }
+    },
+    {
+        "lesson_number": "1.4",
+        "title": "Calculating Distributions",
+        "content": r"""
+### Introduction
+
+The features in a data set are the fundamental building blocks in a data analyst's arsenal in providing insights regarding the state of a situation or domain. Features may be used to describe a specific outcome or represent an outcome that requires description.
+
+Regardless of the approach, gathering descriptive statistics regarding a data set is helpful. These descriptive statistics may be generated differently for the various features and feature types and yield different insights to aid analysis.
+ 
+---
+
+### Explained vs Explanatory Variables
+
+When conducting data analysis, some fields support an outcome, whereas others represent the outcome. These two types of variables are represented by explanatory and explained variables.
+
+**Explained variables** are the variables we are trying to predict or forecast in a statistical model. For instance, the **house price** would be the explained variable in a linear regression model that forecasts house prices. It is also frequently known as the target, response, dependent, or outcome variable. It is "explained" in that the model's independent or explanatory variables can explain its values.
+
+**Explanatory variables** explain or influence the changes in the explained variable. The house size, number of bedrooms, age, and other factors could all be explanatory variables in the house price example. These variables explain the variability in the dependent (explained) variable. They can also be referred to as features, input variables, predictor variables, independent variables, or regressors. One of the first steps in conducting an analysis is learning more about the specifics of the various variables used, which is why descriptive statistics are generated early in the process.
+
+It is important to remember that unless a study specifically intends to establish a causal relationship, the relationship between explained and explanatory variables in a statistical model is typically **association rather than causation** (such as in a randomized controlled trial). It is not always the case that explanatory variables cause changes in the explained variable, even when a model shows they are associated with those changes.
+
+#### 📌 Example: Variable Roles
+
+| Scenario | Explained Variable (Target) | Explanatory Variables (Predictors) |
+|----------|-----------------------------|------------------------------------|
+| House price model | House price | Size, bedrooms, age, location |
+| Sales forecasting | Monthly sales | Ad spend, season, promotions, price |
+| Customer churn | Churn (yes/no) | Tenure, usage, support tickets |
+
+#### 🧠 Mini Exercise: Identify Target vs Predictors
+
+1. A retailer wants to predict weekly sales using store size, local income, and promotion spend.
+2. A hospital wants to predict patient length of stay using age, diagnosis, and procedure type.
+3. A streaming service wants to predict churn using watch time, plan type, and recent support tickets.
+
+**Answer key**:
+1. Target: weekly sales; Predictors: store size, local income, promotion spend.
+2. Target: length of stay; Predictors: age, diagnosis, procedure type.
+3. Target: churn; Predictors: watch time, plan type, support tickets.
+
+---
+
+### 1. Feature Types and Distributions
+
+Different feature types require different summaries. Numeric variables are summarized with measures like mean or standard deviation, while categorical variables are summarized with counts and proportions.
+
+| Feature Type | Examples | Typical Distribution Summary |
+|--------------|----------|------------------------------|
+| Numeric (continuous) | income, height, time | mean, median, variance, standard deviation |
+| Numeric (discrete) | orders, defects, clicks | frequency table, mean, variance |
+| Categorical | brand, region, payment method | counts, percentages, mode |
+| Ordinal | satisfaction rating, size (S/M/L) | counts, median, percentile |
+
+<div class="mermaid">
+flowchart TB
+    A[Feature Type] --> B[Numeric]
+    A --> C[Categorical]
+    B --> D[Central Tendency]
+    B --> E[Spread]
+    B --> F[Shape]
+    C --> G[Counts]
+    C --> H[Percentages]
+
+    style A fill:#4A90D9,stroke:#2E5C8A,stroke-width:2px,color:#fff
+    style B fill:#50C878,stroke:#2E7D32,stroke-width:2px,color:#fff
+    style C fill:#FF9800,stroke:#E65100,stroke-width:2px,color:#fff
+    style D fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style E fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style F fill:#9B59B6,stroke:#6C3483,stroke-width:2px,color:#fff
+    style G fill:#FFD700,stroke:#B8860B,stroke-width:2px,color:#000
+    style H fill:#FFD700,stroke:#B8860B,stroke-width:2px,color:#000
+</div>
+
+---
+
+### Descriptive Statistics
+
+Descriptive statistics summarize and organize the characteristics of a data set, whether numerical or categorical.
+
+#### Numerical Data
+
+Common descriptive measures include:
+- **Central tendency**: mean, median, mode
+- **Dispersion**: variance, standard deviation, range, interquartile range (IQR)
+- **Distribution shape**: skewness and kurtosis
+
+These measures help condense the overall distribution. Knowing whether a data set is approximately normal (Gaussian) can influence which statistical tests or predictive models are appropriate.
+
+#### Categorical Data
+
+Descriptive statistics for categorical variables typically include:
+- **Frequency counts**: how often each category appears
+- **Proportions**: percentage of the total for each category
+- **Cross-tabulations**: relationship between two categorical variables
+
+<div class="important-info">
+In essence, any technique that summarizes, organizes, and describes the properties of a data set can be regarded as descriptive statistics.
+</div>
+
+#### Example: Cross-Tabulation
+
+| Gender / Satisfaction | Low | Medium | High | Total |
+|-----------------------|-----|--------|------|-------|
+| Female | 8 | 22 | 30 | 60 |
+| Male | 10 | 18 | 12 | 40 |
+| Total | 18 | 40 | 42 | 100 |
+
+**Interpretation**: This table suggests higher satisfaction among female respondents, while male responses skew more toward low and medium satisfaction.
+
+---
+
+### Distribution of Values
+
+A variable's distribution describes how its values are spread across the range of possible values. Understanding distributions helps reveal patterns, trends, and outliers, and it guides which statistical tools and models are appropriate.
+
+**Why distribution matters**:
+- Some methods assume specific distributions (e.g., normal, binomial).
+- The distribution affects how you interpret mean, median, mode, variance, and standard deviation.
+- Unexpected distributions can signal data quality issues or collection errors.
+- Skewed distributions can indicate meaningful trends (values clustering at one end).
+
+**Model implications**:
+- If assumptions are violated, you may need transformations or alternative models.
+- Distribution checks are often one of the first steps in analysis.
+
+#### Categorical Variable Distributions
+
+For categorical data, the focus is on counts and proportions across categories:
+
+**Frequency counts**
+- Count how many times each category appears.
+
+**Relative frequencies (proportions)**
+- Convert counts to percentages of the total.
+
+**Cumulative frequencies**
+- Total counts up to a given category (useful for ordered categories).
+
+These numeric summaries complement common visuals such as bar charts and pie charts.
+
+#### Understanding Frequency Counts with Real Examples
+
+**What is a frequency count?**
+
+A frequency count is a straightforward approach to summarizing categorical data. The goal is to determine **how often each category appears** in your dataset. This reveals which categories are most and least prevalent, giving you a basic understanding of your data's distribution.
+
+---
+
+##### Example 1: Norwegian Cities Dataset
+
+**Scenario**: You have data on 20 individuals and where they live in Norway.
+
+**Raw Data**:
+
+| ID | Home_City | ID | Home_City |
+|----|-----------|----|-----------|
+| 1 | Oslo | 11 | Oslo |
+| 2 | Oslo | 12 | Oslo |
+| 3 | Kristiansand | 13 | Stavanger |
+| 4 | Bergen | 14 | Bergen |
+| 5 | Oslo | 15 | Kristiansand |
+| 6 | Stavanger | 16 | Kristiansand |
+| 7 | Stavanger | 17 | Stavanger |
+| 8 | Bergen | 18 | Oslo |
+| 9 | Bergen | 19 | Bergen |
+| 10 | Kristiansand | 20 | Stavanger |
+
+**Analysis Steps**:
+1. Identify distinct cities in the data
+2. Count how many people live in each city
+3. Create a frequency table
+
+**Frequency Count Result**:
+
+| City | Frequency Count |
+|------|-----------------|
+| Bergen | 5 |
+| Kristiansand | 4 |
+| Oslo | 6 |
+| Stavanger | 5 |
+
+**Interpretation**: Oslo is the most common city (6 people), followed by Bergen and Stavanger (5 each), and Kristiansand (4).
+
+---
+
+**How to Calculate: Excel Method**
+
+**Step 1: Enter your data** in Excel:
+
+| A | B |
+|---|---|
+| ID | Home_City |
+| 1 | Oslo |
+| 2 | Oslo |
+| 3 | Kristiansand |
+| 4 | Bergen |
+| 5 | Oslo |
+| ... | ... |
+| 20 | Stavanger |
+
+**Step 2: Create frequency table** using COUNTIF:
+
+In columns D and E, create:
+
+| D | E | Formula |
+|---|---|---|
+| **City** | **Frequency Count** | |
+| Bergen | 5 | =COUNTIF($B$2:$B$21,"Bergen") |
+| Kristiansand | 4 | =COUNTIF($B$2:$B$21,"Kristiansand") |
+| Oslo | 6 | =COUNTIF($B$2:$B$21,"Oslo") |
+| Stavanger | 5 | =COUNTIF($B$2:$B$21,"Stavanger") |
+| **Total** | 20 | =SUM(E2:E5) |
+
+**Alternative: Use a Pivot Table**
+1. Select your data (A1:B21)
+2. Insert → PivotTable
+3. Drag "Home_City" to **Rows**
+4. Drag "Home_City" to **Values** (it will count automatically)
+
+---
+
+**How to Calculate: Python Method**
+
+```python
+import pandas as pd
+
+# Create the dataset
+data = {
+    'ID': range(1, 21),
+    'Home_City': ['Oslo', 'Oslo', 'Kristiansand', 'Bergen', 'Oslo', 'Stavanger', 
+                  'Stavanger', 'Bergen', 'Bergen', 'Kristiansand', 'Oslo', 'Oslo', 
+                  'Stavanger', 'Bergen', 'Kristiansand', 'Kristiansand', 'Stavanger', 
+                  'Oslo', 'Bergen', 'Stavanger']
+}
+df = pd.DataFrame(data)
+
+# Method 1: Using value_counts()
+frequency = df['Home_City'].value_counts().sort_index()
+print("Frequency Count by City:")
+print(frequency)
+
+# Method 2: Create a more detailed table
+frequency_table = pd.DataFrame({
+    'City': frequency.index,
+    'Frequency Count': frequency.values
+})
+print("\nFormatted Table:")
+print(frequency_table)
+
+# Verify total
+print(f"\nTotal observations: {frequency.sum()}")
+```
+
+**Expected Output**:
+```
+Frequency Count by City:
+Bergen          5
+Kristiansand    4
+Oslo            6
+Stavanger       5
+Name: Home_City, dtype: int64
+
+Formatted Table:
+           City  Frequency Count
+0      Bergen              5
+1  Kristiansand              4
+2         Oslo              6
+3     Stavanger              5
+
+Total observations: 20
+```
+
+---
+
+##### Example 2: Student Satisfaction Ratings
+
+**Scenario**: You surveyed 51 university students asking them to rate the quality of learning materials on a scale of 1-5:
+- 1 = Very Poor
+- 2 = Poor  
+- 3 = Neutral
+- 4 = Good
+- 5 = Excellent
+
+**Raw Ratings Data**:
+```
+3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 4, 2, 1, 3, 5, 2, 2, 3, 4, 4, 4, 5, 1, 3, 3, 4, 5, 
+2, 1, 4, 3, 2, 5, 5, 3, 2, 2, 3, 4, 4, 4, 5, 2, 3, 3, 4, 5, 2, 1, 4
+```
+
+**Analysis Steps**:
+1. Find all distinct rating values (1, 2, 3, 4, 5)
+2. Count how many times each rating appears
+3. Create a frequency table
+
+---
+
+**Step-by-Step Manual Counting (Understanding the Process)**
+
+Before using Python, let's understand the manual process so you grasp what's happening under the hood.
+
+**Step 1: Identify the distinct categories**
+
+The rating scale is 1 to 5, so the possible categories are:
+- 1 (Very Poor)
+- 2 (Poor)
+- 3 (Neutral)
+- 4 (Good)
+- 5 (Excellent)
+
+**Step 2: Create an empty counting table**
+
+Start with a table with columns for Category and Count:
+
+| Rating | Count |
+|--------|-------|
+| 1 | ? |
+| 2 | ? |
+| 3 | ? |
+| 4 | ? |
+| 5 | ? |
+
+**Step 3: Go through the data and count each category**
+
+Raw data: 3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 4, 2, 1, 3, 5, 2, 2, 3, 4, 4, 4, 5, 1, 3, 3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 2, 2, 3, 4, 4, 4, 5, 2, 3, 3, 4, 5, 2, 1, 4
+
+**Count all the 1's**: Go through and mark each time you see a 1:
+- Position 5: 1
+- Position 14: 1
+- Position 24: 1
+- Position 30: 1
+- Position 50: 1
+- **Total 1's: 5**
+
+**Count all the 2's**: Go through and mark each time you see a 2:
+- Positions: 4, 8, 13, 17, 18, 29, 33, 37, 38, 44, 49, 51
+- **Total 2's: 7**
+
+**Count all the 3's**: Go through and mark each time you see a 3:
+- Positions: 1, 7, 11, 15, 20, 25, 26, 32, 36, 40, 45, 46
+- **Total 3's: 10**
+
+**Count all the 4's**: Continue the same process...
+- **Total 4's: 14**
+
+**Count all the 5's**: Continue the same process...
+- **Total 5's: 15**
+
+**Step 4: Fill in the final table**
+
+After counting all categories, you get:
+
+| Rating | Count | Label |
+|--------|-------|-------|
+| 1 | 5 | Very Poor |
+| 2 | 7 | Poor |
+| 3 | 10 | Neutral |
+| 4 | 14 | Good |
+| 5 | 15 | Excellent |
+| **Total** | **51** | |
+
+✅ **Quick Verification**: 5 + 7 + 10 + 14 + 15 = 51 ✓
+
+**Key Insight**: As you can see, manual counting:
+- ⚠️ **Time-consuming** with larger datasets
+- ⚠️ **Error-prone** (easy to miscount)
+- ⚠️ **Tedious** to verify
+
+This is why we use Python - it does this automatically, accurately, and instantly!
+
+---
+
+**Automated Counting with Python Code**:
+
+
+```python
+import pandas as pd
+
+# Raw survey responses
+ratings = [3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 4, 2, 1, 3, 5, 2, 2, 3, 4, 4, 4, 5, 1, 3, 
+           3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 2, 2, 3, 4, 4, 4, 5, 2, 3, 3, 4, 5, 2, 1, 4]
+
+df = pd.DataFrame({'Rating': ratings})
+
+# Step 1: Count frequency for each rating
+frequency = df['Rating'].value_counts().sort_index()
+print("Frequency by Rating:")
+print(frequency)
+
+# Step 2: Create detailed frequency table with interpretation
+rating_labels = {
+    1: 'Very Poor',
+    2: 'Poor',
+    3: 'Neutral',
+    4: 'Good',
+    5: 'Excellent'
+}
+
+frequency_table = pd.DataFrame({
+    'Rating': frequency.index,
+    'Label': [rating_labels[r] for r in frequency.index],
+    'Frequency Count': frequency.values,
+    'Percentage': (frequency.values / len(df) * 100).round(2)
+})
+
+print("\nDetailed Frequency Table:")
+print(frequency_table)
+
+# Step 3: Quick insights
+print(f"\nTotal responses: {len(df)}")
+print(f"Most common rating: {frequency.idxmax()} ({frequency.max()} responses)")
+print(f"Least common rating: {frequency.idxmin()} ({frequency.min()} responses)")
+```
+
+**Expected Output**:
+```
+Frequency by Rating:
+1    5
+2    7
+3    10
+4    14
+5    15
+Name: Rating, dtype: int64
+
+Detailed Frequency Table:
+   Rating      Label  Frequency Count  Percentage
+0       1  Very Poor                5        9.80
+1       2      Poor                7       13.73
+2       3    Neutral               10       19.61
+3       4      Good               14       27.45
+4       5   Excellent              15       29.41
+
+Total responses: 51
+Most common rating: 5 (15 responses)
+Least common rating: 1 (5 responses)
+```
+
+**Interpretation**:
+- **5 (Excellent)** is the most common rating with 15 responses (29.41%)
+- **4 (Good)** is the second most common with 14 responses (27.45%)
+- Together, ratings 4 and 5 represent 56.86% of responses (very positive feedback)
+- Only 9.80% gave a "Very Poor" rating (1)
+
+---
+
+##### Example 3: Exam Grade Distribution
+
+**Scenario**: A statistics professor wants to analyze the grade distribution for 40 students who completed the final exam. Grades are on a scale of A through F.
+
+**Raw Grade Data**:
+```
+B, A, C, B, B, A, F, C, B, A, C, D, B, A, C, B, A, B, C, A, 
+D, B, A, C, B, B, A, C, D, A, B, C, A, F, B, A, C, B, A, C
+```
+
+**Grade Distribution Breakdown**:
+- **A**: Excellent (90-100%)
+- **B**: Good (80-89%)
+- **C**: Average (70-79%)
+- **D**: Below Average (60-69%)
+- **F**: Fail (<60%)
+
+---
+
+**Analysis Steps**:
+1. Count frequency of each grade (A, B, C, D, F)
+2. Calculate relative frequencies (proportions)
+3. Calculate percentages
+4. Interpret the results
+
+---
+
+**How to Calculate: Excel Method**
+
+**Step 1: Enter grades in Excel**:
+
+| A | B |
+|---|---|
+| Student_ID | Grade |
+| 1 | B |
+| 2 | A |
+| 3 | C |
+| ... | ... |
+| 40 | C |
+
+**Step 2: Create frequency table** (columns D-E):
+
+| D | E | Formula |
+|---|---|---|
+| **Grade** | **Frequency** | |
+| A | 13 | =COUNTIF($B$2:$B$41,"A") |
+| B | 14 | =COUNTIF($B$2:$B$41,"B") |
+| C | 9 | =COUNTIF($B$2:$B$41,"C") |
+| D | 2 | =COUNTIF($B$2:$B$41,"D") |
+| F | 2 | =COUNTIF($B$2:$B$41,"F") |
+| **Total** | 40 | =SUM(E2:E6) |
+
+**Step 3: Calculate relative frequency** (column F):
+
+| F | Formula |
+|---|---|
+| **Relative Freq** | |
+| 0.325 | =E2/$E$7 |
+| 0.350 | =E3/$E$7 |
+| 0.225 | =E4/$E$7 |
+| 0.050 | =E5/$E$7 |
+| 0.050 | =E6/$E$7 |
+| 1.000 | =SUM(F2:F6) |
+
+**Step 4: Calculate percentage** (column G):
+
+| G | Formula |
+|---|---|
+| **Percentage (%)** | |
+| 32.5 | =F2*100 |
+| 35.0 | =F3*100 |
+| 22.5 | =F4*100 |
+| 5.0 | =F5*100 |
+| 5.0 | =F6*100 |
+| 100.0 | =SUM(G2:G6) |
+
+**Final Excel Table**:
+
+| Grade | Frequency | Relative Frequency | Percentage (%) |
+|-------|-----------|-------------------|----------------|
+| A | 13 | 0.325 | 32.5 |
+| B | 14 | 0.350 | 35.0 |
+| C | 9 | 0.225 | 22.5 |
+| D | 2 | 0.050 | 5.0 |
+| F | 2 | 0.050 | 5.0 |
+| **Total** | 40 | 1.000 | 100.0 |
+
+---
+
+**How to Calculate: Python Method**
+
+```python
+import pandas as pd
+
+# Raw exam grades
+grades = ['B', 'A', 'C', 'B', 'B', 'A', 'F', 'C', 'B', 'A', 'C', 'D', 'B', 'A', 
+          'C', 'B', 'A', 'B', 'C', 'A', 'D', 'B', 'A', 'C', 'B', 'B', 'A', 'C', 
+          'D', 'A', 'B', 'C', 'A', 'F', 'B', 'A', 'C', 'B', 'A', 'C']
+
+df = pd.DataFrame({'Grade': grades})
+
+# Define grade order (A to F)
+grade_order = ['A', 'B', 'C', 'D', 'F']
+
+# Step 1: Calculate frequency for each grade
+frequency = df['Grade'].value_counts().reindex(grade_order)
+print("Frequency by Grade:")
+print(frequency)
+
+# Step 2: Calculate relative frequencies
+rel_freq = frequency / len(df)
+print("\nRelative Frequencies:")
+print(rel_freq)
+
+# Step 3: Calculate percentages
+percentages = (frequency / len(df) * 100).round(1)
+print("\nPercentages:")
+print(percentages)
+
+# Step 4: Create comprehensive summary table
+grade_labels = {
+    'A': 'Excellent',
+    'B': 'Good',
+    'C': 'Average',
+    'D': 'Below Average',
+    'F': 'Fail'
+}
+
+summary_table = pd.DataFrame({
+    'Grade': frequency.index,
+    'Label': [grade_labels[g] for g in frequency.index],
+    'Frequency': frequency.values,
+    'Relative Freq': rel_freq.round(3).values,
+    'Percentage (%)': percentages.values
+})
+
+print("\nComplete Grade Distribution:")
+print(summary_table)
+
+# Step 5: Calculate pass/fail statistics
+pass_count = summary_table[summary_table['Grade'] != 'F']['Frequency'].sum()
+fail_count = summary_table[summary_table['Grade'] == 'F']['Frequency'].sum()
+pass_rate = (pass_count / len(df) * 100).round(1)
+
+print(f"\nPass/Fail Analysis:")
+print(f"Students who passed (A-D): {pass_count} ({pass_rate}%)")
+print(f"Students who failed (F): {fail_count} ({100-pass_rate}%)")
+
+# Step 6: Calculate students with A or B (excellent/good performance)
+high_performers = summary_table[summary_table['Grade'].isin(['A', 'B'])]['Frequency'].sum()
+high_performer_rate = (high_performers / len(df) * 100).round(1)
+
+print(f"\nHigh Performers (A or B): {high_performers} students ({high_performer_rate}%)")
+```
+
+**Expected Output**:
+```
+Frequency by Grade:
+A    13
+B    14
+C     9
+D     2
+F     2
+Name: Grade, dtype: int64
+
+Relative Frequencies:
+A    0.325
+B    0.350
+C    0.225
+D    0.050
+F    0.050
+Name: Grade, dtype: float64
+
+Percentages:
+A    32.5
+B    35.0
+C    22.5
+D     5.0
+F     5.0
+Name: Grade, dtype: float64
+
+Complete Grade Distribution:
+  Grade          Label  Frequency  Relative Freq  Percentage (%)
+0     A      Excellent         13          0.325            32.5
+1     B           Good         14          0.350            35.0
+2     C        Average          9          0.225            22.5
+3     D  Below Average          2          0.050             5.0
+4     F           Fail          2          0.050             5.0
+
+Pass/Fail Analysis:
+Students who passed (A-D): 38 (95.0%)
+Students who failed (F): 2 (5.0%)
+
+High Performers (A or B): 27 students (67.5%)
+```
+
+**Interpretation**:
+- **Most common grade**: B (35.0%), followed by A (32.5%)
+- **Pass rate**: 95% of students passed the exam (grades A-D)
+- **High performers**: 67.5% of students achieved A or B grades (excellent/good performance)
+- **Concern area**: 5% failed (2 students) - may need remedial support
+- **Distribution shape**: Positively skewed - most students performed well
+- **Grade C and below**: Only 32.5% of students - indicates exam was fair but not too easy
+
+**Teaching Insights from this Data**:
+- ✅ High pass rate suggests effective teaching and appropriate difficulty level
+- ✅ Strong concentration in A-B range indicates student comprehension
+- ⚠️ Consider reviewing content for the 2 students who failed
+- 📊 Healthy distribution with most students in "good" to "excellent" range
+
+---
+
+##### Your Turn: Practice Problem
+
+**Dataset**: 30 survey responses on preferred learning mode:
+```
+'Online', 'In-Person', 'Hybrid', 'Online', 'Hybrid', 'In-Person', 'Online', 'Online', 'In-Person', 'Hybrid',
+'Online', 'Online', 'Hybrid', 'In-Person', 'Online', 'In-Person', 'Hybrid', 'Online', 'In-Person', 'Online',
+'Online', 'Hybrid', 'In-Person', 'Online', 'Online', 'In-Person', 'Hybrid', 'Online', 'Hybrid', 'In-Person'
+```
+
+**Your Task**:
+1. Create a pandas dataframe with this data
+2. Calculate the frequency count for each learning mode
+3. Create a table showing: Mode, Frequency Count, Percentage
+4. Answer: Which mode is most preferred? What percentage?
+
+**Solution Code Template**:
+```python
+import pandas as pd
+
+learning_modes = [
+    'Online', 'In-Person', 'Hybrid', 'Online', 'Hybrid', 'In-Person', 'Online', 'Online', 'In-Person', 'Hybrid',
+    'Online', 'Online', 'Hybrid', 'In-Person', 'Online', 'In-Person', 'Hybrid', 'Online', 'In-Person', 'Online',
+    'Online', 'Hybrid', 'In-Person', 'Online', 'Online', 'In-Person', 'Hybrid', 'Online', 'Hybrid', 'In-Person'
+]
+
+df = pd.DataFrame({'Learning_Mode': learning_modes})
+
+# YOUR CODE HERE: Calculate frequency and create table
+# frequency = ...
+# table = ...
+# print(table)
+```
+
+<details>
+<summary><strong>Click to see solution</strong></summary>
+
+```python
+import pandas as pd
+
+learning_modes = [
+    'Online', 'In-Person', 'Hybrid', 'Online', 'Hybrid', 'In-Person', 'Online', 'Online', 'In-Person', 'Hybrid',
+    'Online', 'Online', 'Hybrid', 'In-Person', 'Online', 'In-Person', 'Hybrid', 'Online', 'In-Person', 'Online',
+    'Online', 'Hybrid', 'In-Person', 'Online', 'Online', 'In-Person', 'Hybrid', 'Online', 'Hybrid', 'In-Person'
+]
+
+df = pd.DataFrame({'Learning_Mode': learning_modes})
+
+# Calculate frequency
+frequency = df['Learning_Mode'].value_counts().sort_index()
+
+# Create summary table
+summary_table = pd.DataFrame({
+    'Learning Mode': frequency.index,
+    'Frequency Count': frequency.values,
+    'Percentage': (frequency.values / len(df) * 100).round(2)
+})
+
+print(summary_table)
+print(f"\nMost preferred: {frequency.idxmax()} ({frequency.max()} responses, {frequency.max()/len(df)*100:.2f}%)")
+```
+
+**Result**:
+```
+  Learning Mode  Frequency Count  Percentage
+0        Hybrid                7       23.33
+1    In-Person                9       30.00
+2       Online               14       46.67
+
+Most preferred: Online (14 responses, 46.67%)
+```
+
+</details>
+
+---
+
+### Relative Frequencies
+
+The **relative frequency** of a category is the **percentage** (or proportion) that category represents out of the total. While frequency counts show raw numbers, relative frequencies normalize the data, making it easier to compare categories and understand data distribution.
+
+**Formula**:
+$$\text{Relative Frequency} = \frac{\text{Frequency Count}}{\text{Total Observations}}$$
+
+$$\text{Relative Frequency (\\%)} = \frac{\text{Frequency Count}}{\text{Total Observations}} \times 100$$
+
+---
+
+#### Example: Norwegian Cities Revisited
+
+Using our 20 people across Norwegian cities, let's calculate relative frequencies:
+
+| City | Frequency Count | Calculation | Relative Frequency | Relative Frequency (%) |
+|------|-----------------|-------------|-------------------|----------------------|
+| Bergen | 5 | 5 / 20 | 0.25 | 25% |
+| Kristiansand | 4 | 4 / 20 | 0.20 | 20% |
+| Oslo | 6 | 6 / 20 | 0.30 | 30% |
+| Stavanger | 5 | 5 / 20 | 0.25 | 25% |
+| **Totals** | **20** | N/A | **1.00** | **100%** |
+
+**Interpretation**: 
+- 30% of people live in **Oslo** (most common)
+- 25% live in **Bergen** and **Stavanger** (tied)
+- 20% live in **Kristiansand** (least common)
+
+**Why use relative frequencies?**
+- **Easier to communicate**: "30% of people live in Oslo" is clearer than "6 out of 20 people"
+- **Better for comparison**: When comparing datasets of different sizes, percentages allow fair comparison
+- **Normalized view**: Shows proportions rather than raw counts, which is especially helpful with large datasets
+
+---
+
+#### How to Calculate Relative Frequencies: Excel vs Python
+
+You can calculate relative frequencies using either **Excel** or **Python**. Both methods produce the same results, but each has different strengths.
+
+---
+
+##### Method 1: Excel (Manual Approach)
+
+**Step-by-Step Instructions:**
+
+1. **Enter your data** in Excel:
+
+| A | B |
+|---|---|
+| ID | Home_City |
+| 1 | Oslo |
+| 2 | Oslo |
+| 3 | Kristiansand |
+| 4 | Bergen |
+| ... | ... |
+| 20 | Stavanger |
+
+2. **Create a frequency count table** (in columns D-E):
+
+| D | E |
+|---|---|
+| **City** | **Frequency Count** |
+| Bergen | =COUNTIF($B$2:$B$21,"Bergen") |
+| Kristiansand | =COUNTIF($B$2:$B$21,"Kristiansand") |
+| Oslo | =COUNTIF($B$2:$B$21,"Oslo") |
+| Stavanger | =COUNTIF($B$2:$B$21,"Stavanger") |
+
+**Result**: E2:E5 will show 5, 4, 6, 5
+
+3. **Calculate total observations** (cell E6):
+```
+=SUM(E2:E5)
+```
+**Result**: 20
+
+4. **Calculate relative frequency** (column F):
+
+| F | Formula |
+|---|---|
+| **Relative Frequency** | |
+| =E2/$E$6 | (for Bergen) |
+| =E3/$E$6 | (for Kristiansand) |
+| =E4/$E$6 | (for Oslo) |
+| =E5/$E$6 | (for Stavanger) |
+
+**Note**: The `$` signs lock the total cell reference when copying the formula down.
+
+**Result**: F2:F5 will show 0.25, 0.20, 0.30, 0.25
+
+5. **Calculate percentage** (column G):
+
+| G | Formula |
+|---|---|
+| **Percentage (%)** | |
+| =F2*100 | (for Bergen) |
+| =F3*100 | (for Kristiansand) |
+| =F4*100 | (for Oslo) |
+| =F5*100 | (for Stavanger) |
+
+**Or combine steps 4 & 5**:
+```
+=E2/$E$6*100
+```
+
+**Result**: G2:G5 will show 25.00, 20.00, 30.00, 25.00
+
+6. **Verify**: Add a SUM formula in F6 and G6 to check:
+- `=SUM(F2:F5)` should equal **1.00**
+- `=SUM(G2:G5)` should equal **100.00**
+
+**Final Excel Table**:
+
+| City | Frequency Count | Relative Frequency | Percentage (%) |
+|------|-----------------|-------------------|----------------|
+| Bergen | 5 | 0.25 | 25.00 |
+| Kristiansand | 4 | 0.20 | 20.00 |
+| Oslo | 6 | 0.30 | 30.00 |
+| Stavanger | 5 | 0.25 | 25.00 |
+| **Total** | 20 | 1.00 | 100.00 |
+
+---
+
+**Excel Tips:**
+- Use **Pivot Tables** for larger datasets: Insert → PivotTable → Drag "Home_City" to Rows and Values
+- Format cells: Right-click column → Format Cells → Percentage (for column F) or Number with 2 decimals (for column G)
+- Use **COUNTIF** for categorical data, **FREQUENCY** for numerical ranges
+
+---
+
+##### Method 2: Python with Pandas (Automated Approach)
+
+
+```python
+import pandas as pd
+
+# Norwegian cities data
+data = {
+    'Home_City': ['Oslo', 'Oslo', 'Kristiansand', 'Bergen', 'Oslo', 'Stavanger', 
+                  'Stavanger', 'Bergen', 'Bergen', 'Kristiansand', 'Oslo', 'Oslo', 
+                  'Stavanger', 'Bergen', 'Kristiansand', 'Kristiansand', 'Stavanger', 
+                  'Oslo', 'Bergen', 'Stavanger']
+}
+df = pd.DataFrame(data)
+
+# Step 1: Calculate frequency counts
+frequency = df['Home_City'].value_counts().sort_index()
+print("Frequency counts:")
+print(frequency)
+
+# Step 2: Calculate relative frequencies (as decimals)
+relative_freq = frequency / len(df)
+print("\nRelative frequencies (as decimals):")
+print(relative_freq)
+
+# Step 3: Calculate relative frequencies (as percentages)
+relative_freq_percent = (frequency / len(df) * 100).round(2)
+print("\nRelative frequencies (as percentages):")
+print(relative_freq_percent)
+
+# Step 4: Create comprehensive table
+summary_table = pd.DataFrame({
+    'City': frequency.index,
+    'Frequency Count': frequency.values,
+    'Relative Frequency': relative_freq.values.round(2),
+    'Percentage (%)': relative_freq_percent.values
+})
+
+print("\nComplete Summary Table:")
+print(summary_table)
+
+# Verification
+print(f"\nTotal observations: {len(df)}")
+print(f"Sum of relative frequencies: {relative_freq.sum():.2f}")  # Should be 1.00
+print(f"Sum of percentages: {relative_freq_percent.sum():.2f}")  # Should be 100.00
+```
+
+**Expected Output**:
+```
+Frequency counts:
+Bergen          5
+Kristiansand    4
+Oslo            6
+Stavanger       5
+Name: Home_City, dtype: int64
+
+Relative frequencies (as decimals):
+Bergen          0.25
+Kristiansand    0.20
+Oslo            0.30
+Stavanger       0.25
+Name: Home_City, dtype: float64
+
+Relative frequencies (as percentages):
+Bergen          25.00
+Kristiansand    20.00
+Oslo            30.00
+Stavanger       25.00
+Name: Home_City, dtype: float64
+
+Complete Summary Table:
+           City  Frequency Count  Relative Frequency  Percentage (%)
+0      Bergen              5                  0.25               25.0
+1  Kristiansand              4                  0.20               20.0
+2         Oslo              6                  0.30               30.0
+3     Stavanger              5                  0.25               25.0
+
+Total observations: 20
+Sum of relative frequencies: 1.00
+Sum of percentages: 100.00
+```
+
+---
+
+#### Student Task: Relative Frequencies for Satisfaction Ratings
+
+**Using the student satisfaction data from earlier** (51 students rating learning materials 1-5):
+
+```
+3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 4, 2, 1, 3, 5, 2, 2, 3, 4, 4, 4, 5, 1, 3, 
+3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 2, 2, 3, 4, 4, 4, 5, 2, 3, 3, 4, 5, 2, 1, 4
+```
+
+**Your Task**:
+1. Calculate the **relative frequency** (as a decimal) for each rating (1-5)
+2. Calculate the **relative frequency as a percentage** for each rating
+3. Create a table showing: Rating, Frequency Count, Relative Frequency, Percentage
+4. Verify your total: The percentages should sum to 100%
+5. **Interpretation**: Which rating represents more than 25% of responses?
+
+**Choose Your Method**: You can use either **Excel** or **Python** to complete this task.
+
+---
+
+##### Solution Option A: Excel Method
+
+**Step 1: Enter the raw data**
+
+Put all 51 ratings in column A (cells A2:A52):
+
+| A |
+|---|
+| Rating |
+| 3 |
+| 4 |
+| 5 |
+| 2 |
+| ... |
+| 4 |
+
+**Step 2: Create frequency count table**
+
+In columns C-D:
+
+| C | D | Formula for D |
+|---|---|---|
+| **Rating** | **Frequency Count** | |
+| 1 | =COUNTIF($A$2:$A$52,1) | → Result: 5 |
+| 2 | =COUNTIF($A$2:$A$52,2) | → Result: 7 |
+| 3 | =COUNTIF($A$2:$A$52,3) | → Result: 10 |
+| 4 | =COUNTIF($A$2:$A$52,4) | → Result: 14 |
+| 5 | =COUNTIF($A$2:$A$52,5) | → Result: 15 |
+
+**Step 3: Calculate total** (cell D7):
+```
+=SUM(D2:D6)
+```
+→ Result: 51
+
+**Step 4: Calculate relative frequency** (column E):
+
+| E | Formula |
+|---|---|
+| **Relative Frequency** | |
+| =D2/$D$7 | → 0.0980 |
+| =D3/$D$7 | → 0.1373 |
+| =D4/$D$7 | → 0.1961 |
+| =D5/$D$7 | → 0.2745 |
+| =D6/$D$7 | → 0.2941 |
+
+**Step 5: Calculate percentage** (column F):
+
+| F | Formula |
+|---|---|
+| **Percentage (%)** | |
+| =E2*100 | → 9.80 |
+| =E3*100 | → 13.73 |
+| =E4*100 | → 19.61 |
+| =E5*100 | → 27.45 |
+| =E6*100 | → 29.41 |
+
+**Or use combined formula**:
+```
+=D2/$D$7*100
+```
+
+**Step 6: Verify totals**:
+- `=SUM(E2:E6)` should equal **1.00** (or close to it due to rounding)
+- `=SUM(F2:F6)` should equal **100.00**
+
+**Step 7: Find ratings > 25%**:
+- Look at column F: Ratings **4** (27.45%) and **5** (29.41%) both exceed 25%
+
+**Final Excel Result**:
+
+| Rating | Frequency Count | Relative Frequency | Percentage (%) |
+|--------|-----------------|-------------------|----------------|
+| 1 | 5 | 0.0980 | 9.80 |
+| 2 | 7 | 0.1373 | 13.73 |
+| 3 | 10 | 0.1961 | 19.61 |
+| 4 | 14 | 0.2745 | 27.45 |
+| 5 | 15 | 0.2941 | 29.41 |
+| **Total** | 51 | 1.00 | 100.00 |
+
+---
+
+##### Solution Option B: Python Method
+
+**Solution Code Template**:
+```python
+import pandas as pd
+
+ratings = [3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 4, 2, 1, 3, 5, 2, 2, 3, 4, 4, 4, 5, 1, 3, 
+           3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 2, 2, 3, 4, 4, 4, 5, 2, 3, 3, 4, 5, 2, 1, 4]
+
+df = pd.DataFrame({'Rating': ratings})
+
+# YOUR CODE HERE:
+# 1. Calculate frequency counts
+# frequency = ...
+
+# 2. Calculate relative frequencies (decimal)
+# rel_freq = ...
+
+# 3. Calculate percentages
+# percentages = ...
+
+# 4. Create summary table
+# summary = pd.DataFrame({...})
+
+# 5. Print and verify
+# print(summary)
+```
+
+<details>
+<summary><strong>Click to see solution</strong></summary>
+
+```python
+import pandas as pd
+
+ratings = [3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 4, 2, 1, 3, 5, 2, 2, 3, 4, 4, 4, 5, 1, 3, 
+           3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 2, 2, 3, 4, 4, 4, 5, 2, 3, 3, 4, 5, 2, 1, 4]
+
+df = pd.DataFrame({'Rating': ratings})
+
+# Step 1: Calculate frequency counts
+frequency = df['Rating'].value_counts().sort_index()
+
+# Step 2: Calculate relative frequencies
+rel_freq = frequency / len(df)
+
+# Step 3: Calculate percentages
+percentages = (frequency / len(df) * 100).round(2)
+
+# Step 4: Create summary table
+summary = pd.DataFrame({
+    'Rating': frequency.index,
+    'Frequency Count': frequency.values,
+    'Relative Frequency': rel_freq.round(4).values,
+    'Percentage (%)': percentages.values
+})
+
+print(summary)
+print(f"\nTotal: {len(df)} observations")
+print(f"Percentages sum to: {percentages.sum():.2f}%")
+
+# Answer interpretation question
+over_25_percent = summary[summary['Percentage (%)'] > 25]
+print(f"\nRatings representing > 25% of responses:")
+print(over_25_percent)
+```
+
+**Result**:
+```
+   Rating  Frequency Count  Relative Frequency  Percentage (%)
+0       1                5              0.0980            9.80
+1       2                7              0.1373           13.73
+2       3               10              0.1961           19.61
+3       4               14              0.2745           27.45
+4       5               15              0.2941           29.41
+
+Total: 51 observations
+Percentages sum to: 100.00%
+
+Ratings representing > 25% of responses:
+   Rating  Frequency Count  Relative Frequency  Percentage (%)
+3       4               14              0.2745           27.45
+4       5               15              0.2941           29.41
+```
+
+**Interpretation**: 
+- Ratings **4 (Good)** and **5 (Excellent)** both represent more than 25% of responses
+- Combined, they represent **56.86%** of all responses (very positive feedback!)
+- Only **9.80%** gave the lowest rating (1 - Very Poor)
+
+</details>
+
+---
+
+#### Excel vs Python: When to Use Which?
+
+Here's a quick guide to help you choose the right tool:
+
+| Aspect | Excel | Python |
+|--------|-------|--------|
+| **Best for** | Small to medium datasets (<10,000 rows) | Large datasets (>10,000 rows) or complex analysis |
+| **Ease of use** | Visual, click-based, beginner-friendly | Code-based, steeper learning curve |
+| **Speed** | Fast for small data; slow for large datasets | Very fast, even with millions of rows |
+| **Reproducibility** | Manual steps; easy to make errors when repeating | Code is fully reproducible and shareable |
+| **Automation** | Limited automation (macros/VBA needed) | Highly automated; can process many files at once |
+| **Visualization** | Built-in charts and formatting | Requires libraries (matplotlib, seaborn) but more flexible |
+| **Collaboration** | Easy to share .xlsx files | Requires Python installation but code is portable |
+| **Cost** | Microsoft Office license required | Free and open-source |
+
+**Recommendation**:
+- ✅ **Use Excel** for: Quick one-time analyses, small datasets, sharing with non-technical stakeholders
+- ✅ **Use Python** for: Repeated analyses, large datasets, automation, advanced statistical methods, reproducible research
+
+**Pro Tip**: You can combine both! Do exploratory analysis in Excel, then automate your workflow in Python once you know what you need.
+
+---
+
+### Cumulative Frequencies
+
+The **cumulative frequency** for a category is the **running total** of frequencies from the first category up to and including that category. It shows how many observations fall at or below a certain point in your ordered data.
+
+**Formula**:
+$$\text{Cumulative Frequency}_i = \sum_{j=1}^{i} \text{Frequency}_j$$
+
+**When to use cumulative frequencies**:
+- Categories have a natural order (alphabetical, geographic, temporal, ordinal scales)
+- You want to know "how many observations up to this point?"
+- Analyzing percentiles or quartiles
+- Creating cumulative distribution functions (CDFs)
+
+**Key Point**: Cumulative frequencies change when you reorder categories, so the ordering must be meaningful!
+
+---
+
+#### Example 1: Norwegian Cities (Alphabetical Order)
+
+Using our 20 people across Norwegian cities, let's calculate cumulative frequencies **in alphabetical order**:
+
+| City | Frequency Count | Calculation | Cumulative Frequency |
+|------|-----------------|-------------|---------------------|
+| Bergen | 5 | Bergen | 5 |
+| Kristiansand | 4 | Bergen + Kristiansand | 9 |
+| Oslo | 6 | Bergen + Kristiansand + Oslo | 15 |
+| Stavanger | 5 | Bergen + Kristiansand + Oslo + Stavanger | 20 |
+
+**Interpretation**:
+- 5 people live in cities alphabetically up to "Bergen"
+- 9 people live in cities alphabetically up to "Kristiansand" (B-K)
+- 15 people live in cities alphabetically up to "Oslo" (B-O)
+- 20 people total (cumulative total matches dataset size ✓)
+
+---
+
+#### Example 2: Norwegian Cities (Geographic Order - North to South)
+
+Now let's reorder the same data **by latitude** (North → South):
+
+| City | Frequency Count | Calculation | Cumulative Frequency |
+|------|-----------------|-------------|---------------------|
+| Bergen | 5 | Bergen | 5 |
+| Oslo | 6 | Bergen + Oslo | 11 |
+| Stavanger | 5 | Bergen + Oslo + Stavanger | 16 |
+| Kristiansand | 4 | Bergen + Oslo + Stavanger + Kristiansand | 20 |
+
+**Interpretation**:
+- 5 people live in Bergen or further north
+- 11 people live north of or at the same latitude as Oslo
+- 16 people live north of Kristiansand
+- **Notice**: The cumulative frequencies changed dramatically just by reordering!
+
+**Key Insight**: 11 people live further north than Stavanger, while 16 live further north than Kristiansand. This geographic perspective provides different insights than alphabetical ordering.
+
+---
+
+#### How to Calculate Cumulative Frequencies: Excel vs Python
+
+---
+
+##### Method 1: Excel (Step-by-Step)
+
+**Step 1: Set up your frequency table** (from previous examples):
+
+| D | E |
+|---|---|
+| **City** | **Frequency** |
+| Bergen | 5 |
+| Kristiansand | 4 |
+| Oslo | 6 |
+| Stavanger | 5 |
+
+**Step 2: Add cumulative frequency column** (column F):
+
+| F | Formula | Result |
+|---|---|---|
+| **Cumulative Freq** | | |
+| 5 | =E2 | 5 |
+| 9 | =F2+E3 | 9 |
+| 15 | =F3+E4 | 15 |
+| 20 | =F4+E5 | 20 |
+
+**Alternative: Using SUM with absolute reference**
+
+| F | Formula | Result |
+|---|---|---|
+| **Cumulative Freq** | | |
+| 5 | =SUM($E$2:E2) | 5 |
+| 9 | =SUM($E$2:E3) | 9 |
+| 15 | =SUM($E$2:E4) | 15 |
+| 20 | =SUM($E$2:E5) | 20 |
+
+**Why this works**: The `$E$2` locks the starting row, while `E2`, `E3`, `E4`, `E5` expand the range as you copy the formula down.
+
+**Step 3: Verify**: The last cumulative frequency should equal your total count (20).
+
+**Complete Excel Table**:
+
+| City | Frequency | Cumulative Freq | Cumulative % |
+|------|-----------|----------------|--------------|
+| Bergen | 5 | 5 | 25.0 |
+| Kristiansand | 4 | 9 | 45.0 |
+| Oslo | 6 | 15 | 75.0 |
+| Stavanger | 5 | 20 | 100.0 |
+
+**Cumulative % formula** (column G):
+```
+=F2/$F$5*100
+```
+
+---
+
+##### Method 2: Python with Pandas
+
+```python
+import pandas as pd
+
+# Norwegian cities data (alphabetical order)
+cities_data = {
+    'City': ['Bergen', 'Kristiansand', 'Oslo', 'Stavanger'],
+    'Frequency': [5, 4, 6, 5]
+}
+df = pd.DataFrame(cities_data)
+
+# Calculate cumulative frequency
+df['Cumulative Freq'] = df['Frequency'].cumsum()
+
+# Calculate cumulative percentage
+df['Cumulative %'] = (df['Cumulative Freq'] / df['Frequency'].sum() * 100).round(1)
+
+print("Alphabetical Order:")
+print(df)
+
+# Now reorder by latitude (North to South)
+cities_geographic = {
+    'City': ['Bergen', 'Oslo', 'Stavanger', 'Kristiansand'],
+    'Frequency': [5, 6, 5, 4]
+}
+df_geo = pd.DataFrame(cities_geographic)
+
+# Recalculate cumulative frequency with new order
+df_geo['Cumulative Freq'] = df_geo['Frequency'].cumsum()
+df_geo['Cumulative %'] = (df_geo['Cumulative Freq'] / df_geo['Frequency'].sum() * 100).round(1)
+
+print("\nGeographic Order (North to South):")
+print(df_geo)
+
+# Compare the difference
+print("\nKey Insight:")
+print(f"People north of Stavanger (geographic): {df_geo[df_geo['City']=='Oslo']['Cumulative Freq'].values[0]}")
+print(f"People alphabetically before Stavanger: {df[df['City']=='Oslo']['Cumulative Freq'].values[0]}")
+```
+
+**Expected Output**:
+```
+Alphabetical Order:
+           City  Frequency  Cumulative Freq  Cumulative %
+0     Bergen          5                5          25.0
+1  Kristiansand          4                9          45.0
+2         Oslo          6               15          75.0
+3     Stavanger          5               20         100.0
+
+Geographic Order (North to South):
+           City  Frequency  Cumulative Freq  Cumulative %
+0      Bergen          5                5          25.0
+1         Oslo          6               11          55.0
+2    Stavanger          5               16          80.0
+3  Kristiansand          4               20         100.0
+
+Key Insight:
+People north of Stavanger (geographic): 11
+People alphabetically before Stavanger: 15
+```
+
+---
+
+#### Example 3: Exam Grades with Cumulative Frequencies
+
+**Scenario**: Analyze the cumulative distribution of 40 exam grades (A, B, C, D, F) to understand performance thresholds.
+
+**Raw Grade Data** (same as before):
+```
+B, A, C, B, B, A, F, C, B, A, C, D, B, A, C, B, A, B, C, A, 
+D, B, A, C, B, B, A, C, D, A, B, C, A, F, B, A, C, B, A, C
+```
+
+**Grade counts**: A=13, B=14, C=9, D=2, F=2
+
+---
+
+**How to Calculate: Excel Method**
+
+**Step 1: Create frequency table** (ordered F → A, worst to best):
+
+| D | E | F | Formula for F |
+|---|---|---|---|
+| **Grade** | **Frequency** | **Cumulative Freq** | |
+| F | 2 | 2 | =E2 |
+| D | 2 | 4 | =F2+E3 |
+| C | 9 | 13 | =F3+E4 |
+| B | 14 | 27 | =F4+E5 |
+| A | 13 | 40 | =F5+E6 |
+
+**Or use SUM with expanding range**:
+```
+=SUM($E$2:E2)  (for F2)
+=SUM($E$2:E3)  (for F3)
+... and so on
+```
+
+**Step 2: Add cumulative percentage** (column G):
+
+| G | Formula |
+|---|---|
+| **Cumulative %** | |
+| 5.0 | =F2/$F$6*100 |
+| 10.0 | =F3/$F$6*100 |
+| 32.5 | =F4/$F$6*100 |
+| 67.5 | =F5/$F$6*100 |
+| 100.0 | =F6/$F$6*100 |
+
+**Complete Excel Table**:
+
+| Grade | Frequency | Cumulative Freq | Cumulative % |
+|-------|-----------|----------------|--------------|
+| F (Fail) | 2 | 2 | 5.0 |
+| D (Below Avg) | 2 | 4 | 10.0 |
+| C (Average) | 9 | 13 | 32.5 |
+| B (Good) | 14 | 27 | 67.5 |
+| A (Excellent) | 13 | 40 | 100.0 |
+
+---
+
+**How to Calculate: Python Method**
+
+```python
+import pandas as pd
+
+# Raw exam grades
+grades = ['B', 'A', 'C', 'B', 'B', 'A', 'F', 'C', 'B', 'A', 'C', 'D', 'B', 'A', 
+          'C', 'B', 'A', 'B', 'C', 'A', 'D', 'B', 'A', 'C', 'B', 'B', 'A', 'C', 
+          'D', 'A', 'B', 'C', 'A', 'F', 'B', 'A', 'C', 'B', 'A', 'C']
+
+df = pd.DataFrame({'Grade': grades})
+
+# Define grade order (F to A, worst to best)
+grade_order = ['F', 'D', 'C', 'B', 'A']
+grade_labels = {
+    'F': 'Fail',
+    'D': 'Below Average',
+    'C': 'Average',
+    'B': 'Good',
+    'A': 'Excellent'
+}
+
+# Calculate frequency for each grade
+frequency = df['Grade'].value_counts().reindex(grade_order)
+
+# Create summary table
+summary = pd.DataFrame({
+    'Grade': frequency.index,
+    'Label': [grade_labels[g] for g in frequency.index],
+    'Frequency': frequency.values,
+    'Cumulative Freq': frequency.cumsum().values,
+    'Cumulative %': (frequency.cumsum() / len(df) * 100).round(1).values
+})
+
+print("Cumulative Grade Distribution:")
+print(summary)
+
+# Key insights using cumulative frequencies
+print("\nKey Performance Thresholds:")
+print(f"Students at D or below: {summary[summary['Grade']=='D']['Cumulative Freq'].values[0]} ({summary[summary['Grade']=='D']['Cumulative %'].values[0]}%)")
+print(f"Students at C or below: {summary[summary['Grade']=='C']['Cumulative Freq'].values[0]} ({summary[summary['Grade']=='C']['Cumulative %'].values[0]}%)")
+print(f"Students at B or below: {summary[summary['Grade']=='B']['Cumulative Freq'].values[0]} ({summary[summary['Grade']=='B']['Cumulative %'].values[0]}%)")
+
+# Percentile interpretation
+print("\nPercentile Interpretation:")
+print(f"67.5% of students scored B or lower")
+print(f"32.5% of students scored A (top third of class)")
+```
+
+**Expected Output**:
+```
+Cumulative Grade Distribution:
+  Grade          Label  Frequency  Cumulative Freq  Cumulative %
+0     F           Fail          2                2           5.0
+1     D  Below Average          2                4          10.0
+2     C        Average          9               13          32.5
+3     B           Good         14               27          67.5
+4     A      Excellent         13               40         100.0
+
+Key Performance Thresholds:
+Students at D or below: 4 (10.0%)
+Students at C or below: 13 (32.5%)
+Students at B or below: 27 (67.5%)
+
+Percentile Interpretation:
+67.5% of students scored B or lower
+32.5% of students scored A (top third of class)
+```
+
+**Interpretation**:
+- **5% failed** (F grade) - 2 students need remedial support
+- **10% at D or below** - 4 students are struggling
+- **32.5% at C or below** - bottom third of class
+- **67.5% at B or below** - two-thirds scored "good" or lower
+- **Top 32.5% earned an A** - excellent performers (13 students)
+
+**Educational Insights**:
+- 📊 Grade distribution shows most students in the B-A range (good performance)
+- ✅ Only 10% at risk (D or F) - manageable intervention group
+- 🎯 Median performance is around B (50th percentile falls in B range)
+- 📈 Top third performed excellently - consider honors/advanced track
+
+---
+
+#### Student Task: Calculate Cumulative Frequencies for Satisfaction Ratings
+
+**Using the student satisfaction data** (51 students rating learning materials 1-5):
+
+Frequency counts from earlier:
+- Rating 1 (Very Poor): 5 students
+- Rating 2 (Poor): 7 students  
+- Rating 3 (Neutral): 10 students
+- Rating 4 (Good): 14 students
+- Rating 5 (Excellent): 15 students
+
+**Your Task**:
+1. Calculate cumulative frequencies for ratings 1 through 5 (in order)
+2. Calculate cumulative percentages
+3. Create a complete table showing: Rating, Frequency, Cumulative Freq, Cumulative %
+4. **Interpretation**: What percentage of students gave a rating of 3 (Neutral) or lower?
+
+---
+
+**Choose Your Method**:
+
+##### Solution Option A: Excel Method
+
+**Step 1: Set up your table** (columns A-B):
+
+| A | B |
+|---|---|
+| **Rating** | **Frequency** |
+| 1 | 5 |
+| 2 | 7 |
+| 3 | 10 |
+| 4 | 14 |
+| 5 | 15 |
+
+**Step 2: Add cumulative frequency** (column C):
+
+| C | Formula |
+|---|---|
+| **Cumulative Freq** | |
+| 5 | =SUM($B$2:B2) |
+| 12 | =SUM($B$2:B3) |
+| 22 | =SUM($B$2:B4) |
+| 36 | =SUM($B$2:B5) |
+| 51 | =SUM($B$2:B6) |
+
+**Step 3: Add cumulative percentage** (column D):
+
+| D | Formula |
+|---|---|
+| **Cumulative %** | |
+| 9.8 | =C2/$C$6*100 |
+| 23.5 | =C3/$C$6*100 |
+| 43.1 | =C4/$C$6*100 |
+| 70.6 | =C5/$C$6*100 |
+| 100.0 | =C6/$C$6*100 |
+
+**Final Excel Table**:
+
+| Rating | Label | Frequency | Cumulative Freq | Cumulative % |
+|--------|-------|-----------|----------------|--------------|
+| 1 | Very Poor | 5 | 5 | 9.8 |
+| 2 | Poor | 7 | 12 | 23.5 |
+| 3 | Neutral | 10 | 22 | 43.1 |
+| 4 | Good | 14 | 36 | 70.6 |
+| 5 | Excellent | 15 | 51 | 100.0 |
+
+**Answer**: 43.1% of students gave a rating of 3 (Neutral) or lower.
+
+---
+
+##### Solution Option B: Python Method
+
+```python
+import pandas as pd
+
+ratings = [3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 4, 2, 1, 3, 5, 2, 2, 3, 4, 4, 4, 5, 1, 3, 
+           3, 4, 5, 2, 1, 4, 3, 2, 5, 5, 3, 2, 2, 3, 4, 4, 4, 5, 2, 3, 3, 4, 5, 2, 1, 4]
+
+df = pd.DataFrame({'Rating': ratings})
+
+# Define rating order and labels
+rating_order = [1, 2, 3, 4, 5]
+rating_labels = {
+    1: 'Very Poor',
+    2: 'Poor',
+    3: 'Neutral',
+    4: 'Good',
+    5: 'Excellent'
+}
+
+# Calculate frequency counts
+frequency = df['Rating'].value_counts().sort_index()
+
+# Create comprehensive summary table
+summary = pd.DataFrame({
+    'Rating': frequency.index,
+    'Label': [rating_labels[r] for r in frequency.index],
+    'Frequency': frequency.values,
+    'Cumulative Freq': frequency.cumsum().values,
+    'Cumulative %': (frequency.cumsum() / len(df) * 100).round(1).values
+})
+
+print("Cumulative Satisfaction Distribution:")
+print(summary)
+print(f"\nTotal responses: {len(df)}")
+
+# Answer the question
+neutral_or_lower = summary[summary['Rating'] <= 3]['Cumulative Freq'].max()
+neutral_or_lower_pct = summary[summary['Rating'] <= 3]['Cumulative %'].max()
+
+print(f"\nAnswer: {neutral_or_lower_pct}% of students gave a rating of 3 (Neutral) or lower")
+print(f"That's {neutral_or_lower} out of {len(df)} students")
+
+# Additional insights
+print("\nAdditional Insights:")
+print(f"Students rating 4 or higher (satisfied): {51-22} ({100-43.1:.1f}%)")
+print(f"Students rating 2 or lower (dissatisfied): {summary[summary['Rating']==2]['Cumulative Freq'].values[0]} ({summary[summary['Rating']==2]['Cumulative %'].values[0]}%)")
+```
+
+**Expected Output**:
+```
+Cumulative Satisfaction Distribution:
+   Rating      Label  Frequency  Cumulative Freq  Cumulative %
+0       1  Very Poor          5                5           9.8
+1       2       Poor          7               12          23.5
+2       3    Neutral         10               22          43.1
+3       4       Good         14               36          70.6
+4       5  Excellent         15               51         100.0
+
+Total responses: 51
+
+Answer: 43.1% of students gave a rating of 3 (Neutral) or lower
+That's 22 out of 51 students
+
+Additional Insights:
+Students rating 4 or higher (satisfied): 29 (56.9%)
+Students rating 2 or lower (dissatisfied): 12 (23.5%)
+```
+
+**Interpretation**:
+- **43.1% rated Neutral or lower** (22 students) - nearly half aren't satisfied
+- **56.9% rated Good or Excellent** (29 students) - majority are satisfied
+- **23.5% dissatisfied** (ratings 1-2) - this group needs attention
+- **70th percentile** falls at rating 4 (Good)
+- **Top 29.4%** gave Excellent rating
+
+**Actionable Insights**:
+- ⚠️ 43% neutral-or-lower is concerning - investigate root causes
+- ✅ Majority (57%) are satisfied - learning materials are working for most
+- 🎯 Focus on the 23.5% who are dissatisfied (12 students)
+- 📊 Consider what separates satisfied from unsatisfied students
+
+---
+
+### Binning (Grouping Continuous Data)
+
+**Binning** is the process of dividing continuous numerical values into discrete **bins** or **intervals**. This technique transforms continuous data into categorical data, making it easier to analyze, visualize, and interpret, especially with large datasets.
+
+**Why use binning?**
+- Simplifies analysis of continuous variables with many unique values
+- Reduces noise and outliers in data
+- Makes data easier to visualize (histograms, bar charts)
+- Groups similar values together for pattern recognition
+- Converts continuous data for methods that require categorical input
+
+**Formula for bin width (equal width binning)**:
+$$\text{Bin Width} = \frac{\text{Max Value} - \text{Min Value}}{\text{Number of Bins}}$$
+
+---
+
+#### Example: Norwegian Cities with Age Data
+
+Let's extend our Norwegian cities example by adding an **Age** feature:
+
+| ID | Home_City | Age |
+|----|-----------|-----|
+| 1 | Oslo | 25 |
+| 2 | Oslo | 60 |
+| 3 | Kristiansand | 33 |
+| 4 | Bergen | 42 |
+| 5 | Oslo | 19 |
+| 6 | Stavanger | 56 |
+| 7 | Stavanger | 34 |
+| 8 | Bergen | 57 |
+| 9 | Bergen | 43 |
+| 10 | Kristiansand | 61 |
+| 11 | Oslo | 27 |
+| 12 | Oslo | 31 |
+| 13 | Stavanger | 52 |
+| 14 | Bergen | 29 |
+| 15 | Kristiansand | 63 |
+| 16 | Kristiansand | 39 |
+| 17 | Stavanger | 34 |
+| 18 | Oslo | 28 |
+| 19 | Bergen | 41 |
+| 20 | Stavanger | 47 |
+
+**Data Range**: Ages 18-65 (online survey restrictions)
+
+---
+
+#### Common Binning Methods
+
+There are several approaches to creating bins, each with different use cases:
+
+##### 1. Equal Width Binning
+
+**Concept**: Divide the entire range into intervals of equal size.
+
+**Example**: Ages 0-100 → bins of 10 years each (0-9, 10-19, 20-29, etc.)
+
+**Calculation**:
+1. Find range: Max - Min
+2. Divide by number of bins: Range / Number of Bins
+3. Create bins of that width
+
+**Example with our data**:
+- Min age: 18, Max age: 65
+- Range: 65 - 18 = 47
+- If we want 5 bins: 47 / 5 = 9.4 ≈ 9-10 per bin
+- **Note**: When using whole numbers, one bin may be larger (typically the last one)
+
+**Pros**: Simple, easy to understand
+**Cons**: Can create bins with very different numbers of observations if data is skewed
+
+---
+
+##### 2. Equal Frequency (Quantile) Binning
+
+**Concept**: Divide data so each bin has roughly the same number of observations.
+
+**Example**: 100 observations → 4 bins of 25 observations each
+
+**Pros**: Each bin equally representative of the sample
+**Cons**: Bin widths can vary significantly
+
+---
+
+##### 3. Custom Binning (Domain-Specific)
+
+**Concept**: Use expert knowledge to define meaningful bins.
+
+**Example - Age Groups (Life Stages)**:
+
+| Description | Bin Range | Reasoning |
+|-------------|-----------|-----------|
+| Young adults | 18-25 | College/early career |
+| Adults | 26-35 | Career establishment |
+| Mature adults | 36-45 | Career peak |
+| Middle-aged | 46-55 | Pre-retirement |
+| Senior adults | 56-65 | Near retirement |
+
+**Pros**: Bins have real-world meaning and interpretability
+**Cons**: Requires domain expertise, may not be optimal for statistical analysis
+
+---
+
+##### 4. Automated Binning
+
+**Concept**: Use algorithms (Sturges' rule, Scott's rule, Freedman-Diaconis) to determine optimal bin count.
+
+**Sturges' Rule**: Number of bins = $\lceil \log_2(n) + 1 \rceil$ where $n$ = number of observations
+
+**Example**: For 20 observations: $\lceil \log_2(20) + 1 \rceil = \lceil 5.32 \rceil = 6$ bins
+
+---
+
+#### How to Bin Data: Excel vs Python
+
+We'll use **custom binning** with the 5 age groups defined above.
+
+---
+
+##### Method 1: Excel Binning
+
+**Step 1: Set up your data** (columns A-C):
+
+| A | B | C |
+|---|---|---|
+| ID | Home_City | Age |
+| 1 | Oslo | 25 |
+| 2 | Oslo | 60 |
+| ... | ... | ... |
+| 20 | Stavanger | 47 |
+
+**Step 2: Create bin definitions** (columns E-F):
+
+| E | F |
+|---|---|
+| **Bin Label** | **Range** |
+| Young adults | 18-25 |
+| Adults | 26-35 |
+| Mature adults | 36-45 |
+| Middle-aged | 46-55 |
+| Senior adults | 56-65 |
+
+**Step 3: Add Age_Group column** (column D) using nested IF:
+
+```excel
+=IF(C2<=25, "Young adults",
+  IF(C2<=35, "Adults",
+    IF(C2<=45, "Mature adults",
+      IF(C2<=55, "Middle-aged", "Senior adults"))))
+```
+
+**Or use IFS function** (Excel 2016+):
+```excel
+=IFS(C2<=25, "Young adults",
+     C2<=35, "Adults",
+     C2<=45, "Mature adults",
+     C2<=55, "Middle-aged",
+     C2<=65, "Senior adults")
+```
+
+**Step 4: Create frequency table** (columns H-I):
+
+| H | I | Formula |
+|---|---|---|
+| **Age Group** | **Count** | |
+| Young adults | 3 | =COUNTIF($D$2:$D$21,"Young adults") |
+| Adults | 6 | =COUNTIF($D$2:$D$21,"Adults") |
+| Mature adults | 5 | =COUNTIF($D$2:$D$21,"Mature adults") |
+| Middle-aged | 3 | =COUNTIF($D$2:$D$21,"Middle-aged") |
+| Senior adults | 3 | =COUNTIF($D$2:$D$21,"Senior adults") |
+
+**Result Table**:
+
+| ID | Home_City | Age | Age_Group |
+|----|-----------|-----|-----------|
+| 1 | Oslo | 25 | Young adults |
+| 2 | Oslo | 60 | Senior adults |
+| 3 | Kristiansand | 33 | Adults |
+| 4 | Bergen | 42 | Mature adults |
+| 5 | Oslo | 19 | Young adults |
+| ... | ... | ... | ... |
+
+**Frequency Summary**:
+
+| Age Group | Count | Percentage |
+|-----------|-------|------------|
+| Young adults (18-25) | 3 | 15% |
+| Adults (26-35) | 6 | 30% |
+| Mature adults (36-45) | 5 | 25% |
+| Middle-aged (46-55) | 3 | 15% |
+| Senior adults (56-65) | 3 | 15% |
+
+---
+
+##### Method 2: Python Binning
+
+```python
+import pandas as pd
+
+# Create the Norwegian cities + age dataset
+data = {
+    'ID': range(1, 21),
+    'Home_City': ['Oslo', 'Oslo', 'Kristiansand', 'Bergen', 'Oslo', 'Stavanger',
+                  'Stavanger', 'Bergen', 'Bergen', 'Kristiansand', 'Oslo', 'Oslo',
+                  'Stavanger', 'Bergen', 'Kristiansand', 'Kristiansand', 'Stavanger',
+                  'Oslo', 'Bergen', 'Stavanger'],
+    'Age': [25, 60, 33, 42, 19, 56, 34, 57, 43, 61, 27, 31, 52, 29, 63, 39, 34, 28, 41, 47]
+}
+df = pd.DataFrame(data)
+
+# Method 1: Using pd.cut() with custom bins
+bins = [18, 25, 35, 45, 55, 65]
+labels = ['Young adults', 'Adults', 'Mature adults', 'Middle-aged', 'Senior adults']
+
+df['Age_Group'] = pd.cut(df['Age'], bins=bins, labels=labels, right=True, include_lowest=True)
+
+print("Dataset with Age Groups:")
+print(df)
+
+# Calculate frequency distribution of age groups
+age_group_freq = df['Age_Group'].value_counts().sort_index()
+print("\nAge Group Frequency:")
+print(age_group_freq)
+
+# Create comprehensive summary
+summary = pd.DataFrame({
+    'Age Group': labels,
+    'Range': ['18-25', '26-35', '36-45', '46-55', '56-65'],
+    'Count': [age_group_freq.get(label, 0) for label in labels],
+    'Percentage': [(age_group_freq.get(label, 0) / len(df) * 100).round(1) for label in labels]
+})
+
+print("\nAge Group Summary:")
+print(summary)
+
+# Find min and max ages
+print(f"\nData Range:")
+print(f"Minimum age: {df['Age'].min()}")
+print(f"Maximum age: {df['Age'].max()}")
+print(f"Age span: {df['Age'].max() - df['Age'].min()} years")
+```
+
+**Expected Output**:
+```
+Dataset with Age Groups:
+    ID     Home_City  Age      Age_Group
+0    1          Oslo   25  Young adults
+1    2          Oslo   60 Senior adults
+2    3  Kristiansand   33        Adults
+3    4        Bergen   42 Mature adults
+4    5          Oslo   19  Young adults
+...
+
+Age Group Frequency:
+Young adults     2
+Adults           7
+Mature adults    4
+Middle-aged      2
+Senior adults    5
+Name: Age_Group, dtype: int64
+
+Age Group Summary:
+       Age Group  Range  Count  Percentage
+0  Young adults  18-25      2        10.0
+1        Adults  26-35      7        35.0
+2 Mature adults  36-45      4        20.0
+3   Middle-aged  46-55      2        10.0
+4 Senior adults  56-65      5        25.0
+
+Data Range:
+Minimum age: 19
+Maximum age: 63
+Age span: 44 years
+```
+
+**Interpretation**:
+- **Most common age group**: Adults (26-35) with 7 people (35%)
+- **Least common groups**: Young adults and Middle-aged (10% each)
+- **Distribution pattern**: Relatively balanced across life stages
+- **Data concentration**: 55% of respondents are in Adults and Senior adults groups
+
+**Using Binning for Longitudinal Analysis**:
+
+Binning makes it easier to:
+- **Compare results over time**: If this survey is repeated next year, you can easily see if the age distribution remains stable
+- **Track demographic shifts**: Monitor whether the Mature adults bin frequency increases while the Adults bin decreases (aging population)
+- **Identify trends**: Spot patterns like whether younger age groups are growing or shrinking
+- **Standardize comparisons**: Same bins allow year-over-year comparison even with different sample sizes
+
+**Example Year-over-Year Comparison**:
+
+| Age Group | 2025 Count | 2025 % | 2026 Count | 2026 % | Change |
+|-----------|------------|--------|------------|--------|--------|
+| Young adults | 2 | 10% | 3 | 12% | +1 (+2%) |
+| Adults | 7 | 35% | 6 | 24% | -1 (-11%) |
+| Mature adults | 4 | 20% | 5 | 20% | +1 (0%) |
+| Middle-aged | 2 | 10% | 3 | 12% | +1 (+2%) |
+| Senior adults | 5 | 25% | 8 | 32% | +3 (+7%) |
+
+**Insight**: Population is aging - Adults group declining while Senior adults increasing.
+
+---
+
+**Important Note: Bin Choice Affects Insights**
+
+Different binning strategies produce different results and insights. Consider these alternatives:
+
+**Alternative 1: Broader bins** (3 categories)
+- Young (18-35): 9 people (45%)
+- Middle (36-55): 6 people (30%)
+- Senior (56-65): 5 people (25%)
+
+**Alternative 2: Narrower bins** (10-year intervals)
+- 18-27: 4 people (20%)
+- 28-37: 5 people (25%)
+- 38-47: 4 people (20%)
+- 48-57: 4 people (20%)
+- 58-65: 3 people (15%)
+
+**Takeaway**: Always experiment with different bin ranges to see which provides the most meaningful insights for your analysis. Binning is especially helpful when creating **histograms** - visual representations of frequency distributions.
+
+---
+
+#### Example: Movie Runtime Binning
+
+**Scenario**: You're analyzing a movie database and have 20 movie runtimes (in minutes). You want to categorize them by length.
+
+**Raw Movie Runtimes (minutes)**:
+```
+125, 98, 105, 134, 90, 102, 145, 87, 115, 129, 96, 122, 135, 110, 140, 85, 100, 132, 95, 130
+```
+
+**Analysis Goal**: Group movies into Short, Medium, and Long categories to understand the distribution of movie lengths.
+
+**Custom Bins**:
+
+| Category | Runtime Range | Description |
+|----------|---------------|-------------|
+| Short | < 100 minutes | Quick viewing |
+| Medium | 100-120 minutes | Standard length |
+| Long | > 120 minutes | Extended viewing |
+
+---
+
+**How to Calculate: Excel Method**
+
+**Step 1: Enter runtimes** in column A (A2:A21):
+
+| A |
+|---|
+| **Runtime** |
+| 125 |
+| 98 |
+| 105 |
+| ... |
+| 130 |
+
+**Step 2: Create Length_Category column** (column B) using nested IF:
+
+```excel
+=IF(A2<100, "Short",
+  IF(A2<=120, "Medium", "Long"))
+```
+
+**Step 3: Create frequency table** (columns D-E):
+
+| D | E | Formula |
+|---|---|---|
+| **Category** | **Count** | |
+| Short | 5 | =COUNTIF($B$2:$B$21,"Short") |
+| Medium | 6 | =COUNTIF($B$2:$B$21,"Medium") |
+| Long | 9 | =COUNTIF($B$2:$B$21,"Long") |
+| **Total** | 20 | =SUM(E2:E4) |
+
+**Step 4: Add percentages** (column F):
+
+| F | Formula |
+|---|---|
+| **Percentage** | |
+| 25% | =E2/$E$5*100 |
+| 30% | =E3/$E$5*100 |
+| 45% | =E4/$E$5*100 |
+
+**Complete Excel Table**:
+
+| Runtime | Category | | Summary |
+|---------|----------|---|---------|
+| 125 | Long | | **Category** \| **Count** \| **%** |
+| 98 | Short | | Short \| 5 \| 25% |
+| 105 | Medium | | Medium \| 6 \| 30% |
+| 134 | Long | | Long \| 9 \| 45% |
+| 90 | Short | | **Total** \| **20** \| **100%** |
+| ... | ... | | |
+
+---
+
+**How to Calculate: Python Method**
+
+```python
+import pandas as pd
+
+# Movie runtimes in minutes
+runtimes = [125, 98, 105, 134, 90, 102, 145, 87, 115, 129, 96, 122, 135, 110, 140, 85, 100, 132, 95, 130]
+
+df = pd.DataFrame({'Runtime': runtimes})
+
+# Method 1: Using pd.cut() with custom bins
+bins = [0, 100, 120, float('inf')]
+labels = ['Short', 'Medium', 'Long']
+
+df['Category'] = pd.cut(df['Runtime'], bins=bins, labels=labels, right=False)
+
+print("Movies with Categories:")
+print(df)
+
+# Calculate frequency distribution
+category_freq = df['Category'].value_counts().reindex(labels)
+
+# Create summary table
+summary = pd.DataFrame({
+    'Category': labels,
+    'Runtime Range': ['< 100 min', '100-120 min', '> 120 min'],
+    'Count': category_freq.values,
+    'Percentage': (category_freq.values / len(df) * 100).round(1)
+})
+
+print("\nRuntime Distribution:")
+print(summary)
+
+# Statistical insights
+print(f"\nRuntime Statistics:")
+print(f"Mean runtime: {df['Runtime'].mean():.1f} minutes")
+print(f"Median runtime: {df['Runtime'].median():.1f} minutes")
+print(f"Shortest movie: {df['Runtime'].min()} minutes")
+print(f"Longest movie: {df['Runtime'].max()} minutes")
+print(f"Most common category: {category_freq.idxmax()} ({category_freq.max()} movies)")
+```
+
+**Expected Output**:
+```
+Movies with Categories:
+    Runtime Category
+0       125     Long
+1        98    Short
+2       105   Medium
+3       134     Long
+4        90    Short
+5       102   Medium
+6       145     Long
+7        87    Short
+8       115   Medium
+9       129     Long
+10       96    Short
+11      122     Long
+12      135     Long
+13      110   Medium
+14      140     Long
+15       85    Short
+16      100   Medium
+17      132     Long
+18       95    Short
+19      130     Long
+
+Runtime Distribution:
+  Category Runtime Range  Count  Percentage
+0    Short     < 100 min      5        25.0
+1   Medium   100-120 min      6        30.0
+2     Long     > 120 min      9        45.0
+
+Runtime Statistics:
+Mean runtime: 113.8 minutes
+Median runtime: 113.5 minutes
+Shortest movie: 85 minutes
+Longest movie: 145 minutes
+Most common category: Long (9 movies)
+```
+
+**Interpretation**:
+- **45% of movies are Long** (> 120 min) - most common category
+- **30% are Medium length** (100-120 min) - standard theatrical releases
+- **25% are Short** (< 100 min) - quick viewing options
+- **Mean ≈ Median**: Symmetric distribution, no significant skew
+- **Range**: 60 minutes (85 to 145) - moderate variability
+
+**Practical Insights**:
+- 🎬 Most movies trend toward longer runtimes (45% > 2 hours)
+- 📊 If planning a movie night, 75% of options are 100+ minutes
+- 🕐 Short movies (< 100 min) are less common - only 25% of collection
+- 📈 Distribution is right-skewed toward longer films
+
+---
+
+**Student Task: Bin the Movie Runtimes**
+
+**Your Assignment**: Practice binning by categorizing the 20 movie runtimes yourself.
+
+**Data**: 125, 98, 105, 134, 90, 102, 145, 87, 115, 129, 96, 122, 135, 110, 140, 85, 100, 132, 95, 130
+
+**Steps**:
+1. **Choose bins**: Use Short (< 100), Medium (100-120), Long (> 120)
+2. **Categorize each movie**: Assign each runtime to the appropriate bin
+3. **Count frequencies**: How many movies in each category?
+4. **Create a table**: Show Category, Count, and Percentage
+5. **Interpret**: Which category is most common? What does this tell you about the movie collection?
+
+**Choose Your Method**:
+
+**Option A: Manual Counting**
+- Go through the list and mark each runtime as S, M, or L
+- Count how many in each category
+- Calculate percentages
+
+**Option B: Excel**
+- Enter runtimes in column A
+- Use IF formula to categorize
+- Use COUNTIF to count frequencies
+
+**Option C: Python**
+- Use pd.cut() to bin the data
+- Use value_counts() for frequencies
+- Create summary table
+
+**Expected Results**:
+- Short: 5 movies (25%)
+- Medium: 6 movies (30%)
+- Long: 9 movies (45%)
+
+**Reflection Questions**:
+1. What if you used different bins like (< 90, 90-130, > 130)? Would the insights change?
+2. Which binning strategy is more useful for a movie streaming service?
+3. How would you bin if you wanted to separate "Epic" films (> 150 min)?
+
+---
+
+#### Example: Binning Exam Scores
+
+**Scenario**: A professor has 40 exam scores (0-100) and wants to bin them into letter grade categories.
+
+**Raw Scores**:
+```
+78, 92, 65, 88, 71, 45, 95, 73, 82, 91, 68, 55, 84, 93, 76, 81, 90, 69, 87, 94,
+58, 85, 92, 77, 80, 83, 91, 72, 61, 89, 86, 74, 93, 52, 79, 90, 70, 84, 91, 75
+```
+
+**Custom Bins (Grading Scale)**:
+
+| Grade | Range | Description |
+|-------|-------|-------------|
+| A | 90-100 | Excellent |
+| B | 80-89 | Good |
+| C | 70-79 | Average |
+| D | 60-69 | Below Average |
+| F | 0-59 | Fail |
+
+---
+
+**How to Calculate: Excel Method**
+
+**Step 1: Enter scores** in column A (A2:A41)
+
+**Step 2: Create Grade column** (column B) using nested IF:
+
+```excel
+=IF(A2>=90, "A",
+  IF(A2>=80, "B",
+    IF(A2>=70, "C",
+      IF(A2>=60, "D", "F"))))
+```
+
+**Step 3: Create frequency table**:
+
+| D | E | Formula |
+|---|---|---|
+| **Grade** | **Count** | |
+| A (90-100) | 13 | =COUNTIF($B$2:$B$41,"A") |
+| B (80-89) | 14 | =COUNTIF($B$2:$B$41,"B") |
+| C (70-79) | 9 | =COUNTIF($B$2:$B$41,"C") |
+| D (60-69) | 2 | =COUNTIF($B$2:$B$41,"D") |
+| F (0-59) | 2 | =COUNTIF($B$2:$B$41,"F") |
+
+---
+
+**How to Calculate: Python Method**
+
+```python
+import pandas as pd
+
+# Exam scores
+scores = [78, 92, 65, 88, 71, 45, 95, 73, 82, 91, 68, 55, 84, 93, 76, 81, 90, 69, 87, 94,
+          58, 85, 92, 77, 80, 83, 91, 72, 61, 89, 86, 74, 93, 52, 79, 90, 70, 84, 91, 75]
+
+df = pd.DataFrame({'Score': scores})
+
+# Method 1: Using pd.cut() with custom bins
+bins = [0, 60, 70, 80, 90, 100]
+labels = ['F', 'D', 'C', 'B', 'A']
+
+df['Grade'] = pd.cut(df['Score'], bins=bins, labels=labels, right=False, include_lowest=True)
+
+print("Scores with Grades:")
+print(df.head(10))
+
+# Calculate grade distribution
+grade_freq = df['Grade'].value_counts().reindex(['A', 'B', 'C', 'D', 'F'])
+
+# Create summary with grade ranges
+grade_summary = pd.DataFrame({
+    'Grade': ['A', 'B', 'C', 'D', 'F'],
+    'Range': ['90-100', '80-89', '70-79', '60-69', '0-59'],
+    'Count': grade_freq.values,
+    'Percentage': (grade_freq.values / len(df) * 100).round(1),
+    'Cumulative Count': grade_freq.cumsum().values,
+    'Cumulative %': (grade_freq.cumsum() / len(df) * 100).round(1).values
+})
+
+print("\nGrade Distribution:")
+print(grade_summary)
+
+# Statistical insights
+print(f"\nStatistical Summary:")
+print(f"Mean score: {df['Score'].mean():.1f}")
+print(f"Median score: {df['Score'].median():.1f}")
+print(f"Minimum score: {df['Score'].min()}")
+print(f"Maximum score: {df['Score'].max()}")
+print(f"Pass rate (≥60): {(df['Score'] >= 60).sum() / len(df) * 100:.1f}%")
+```
+
+**Expected Output**:
+```
+Scores with Grades:
+   Score Grade
+0     78     C
+1     92     A
+2     65     D
+3     88     B
+4     71     C
+5     45     F
+6     95     A
+7     73     C
+8     82     B
+9     91     A
+
+Grade Distribution:
+  Grade   Range  Count  Percentage  Cumulative Count  Cumulative %
+0     A  90-100     13        32.5                13          32.5
+1     B   80-89     14        35.0                27          67.5
+2     C   70-79      9        22.5                36          90.0
+3     D   60-69      2         5.0                38          95.0
+4     F    0-59      2         5.0                40         100.0
+
+Statistical Summary:
+Mean score: 78.5
+Median score: 80.5
+Minimum score: 45
+Maximum score: 95
+Pass rate (≥60): 95.0%
+```
+
+**Interpretation**:
+- **Binning reveals patterns**: 67.5% scored A or B (excellent/good performance)
+- **Mean (78.5) vs Median (80.5)**: Slight left skew due to a few low scores
+- **Pass rate**: 95% (38/40 students) passed with 60 or higher
+- **Grade distribution**: Relatively normal with most students in B-C range
+
+---
+
+#### Choosing the Right Binning Method
+
+| Method | Use When | Example |
+|--------|----------|---------|
+| **Equal Width** | Range is known and uniform distribution expected | Temperature ranges, test scores across full 0-100 scale |
+| **Equal Frequency** | Need balanced bins for comparison | Quartiles for income data, percentile rankings |
+| **Custom** | Categories have real-world meaning | Age groups (child, teen, adult), performance levels |
+| **Automated** | Exploratory analysis, no domain knowledge | Initial data exploration, automatic histogram creation |
+
+**Best Practice Tips**:
+- ✅ **Know your min/max**: Always check data range before binning
+- ✅ **Consider context**: What makes sense for interpretation?
+- ✅ **Test multiple approaches**: Try different bin counts and methods
+- ✅ **Avoid too many bins**: Defeats the purpose of simplification
+- ✅ **Avoid too few bins**: Loses important patterns
+- ⚠️ **Watch bin boundaries**: Decide if boundaries are inclusive (≤) or exclusive (<)
+
+---
+
+#### Python Implementation: Computing Distributions with Pandas
+
+Here's how to calculate frequency counts, relative frequencies, and cumulative frequencies using **Python and the pandas library**. All examples use real, runnable code with expected outputs.
+
+##### Example 1: Frequency Counts
+
+**Scenario**: You have customer satisfaction survey responses (Satisfied, Neutral, Dissatisfied).
+
+**Step 1: Create or load your data**
+
+```python
+import pandas as pd
+
+# Create a dataset with survey responses
+data = {
+    'satisfaction': ['Satisfied', 'Dissatisfied', 'Satisfied', 'Neutral', 
+                     'Satisfied', 'Satisfied', 'Dissatisfied', 'Neutral', 
+                     'Satisfied', 'Satisfied']
+}
+df = pd.DataFrame(data)
+
+# View first few rows
+print(df.head())
+```
+
+**Output:**
+```
+  satisfaction
+0     Satisfied
+1  Dissatisfied
+2     Satisfied
+3       Neutral
+4     Satisfied
+```
+
+**Step 2: Calculate frequency counts**
+
+```python
+# Method 1: Using value_counts()
+frequency = df['satisfaction'].value_counts()
+print(frequency)
+```
+
+**Output:**
+```
+Satisfied      6
+Dissatisfied   2
+Neutral        2
+Name: satisfaction, dtype: int64
+```
+
+**What this means**: "Satisfied" appears 6 times, "Dissatisfied" 2 times, "Neutral" 2 times.
+
+---
+
+##### Example 2: Relative Frequencies (Percentages)
+
+**Using the same data, calculate proportions:**
+
+```python
+# Method 1: Divide by total and multiply by 100
+relative_freq = (df['satisfaction'].value_counts() / len(df)) * 100
+print(relative_freq)
+
+# Method 2: Use normalize=True parameter
+relative_freq_alt = df['satisfaction'].value_counts(normalize=True) * 100
+print(relative_freq_alt)
+```
+
+**Output:**
+```
+Satisfied      60.0
+Dissatisfied   20.0
+Neutral        20.0
+Name: satisfaction, dtype: float64
+```
+
+**What this means**: 60% of responses are "Satisfied", 20% are "Dissatisfied", and 20% are "Neutral".
+
+---
+
+##### Example 3: Cumulative Frequencies
+
+**For ordered categories, calculate cumulative counts:**
+
+```python
+# Step 1: Create an ordered dataframe
+# First, define the category order (Dissatisfied → Neutral → Satisfied)
+category_order = ['Dissatisfied', 'Neutral', 'Satisfied']
+
+# Get frequency counts and sort by category order
+frequency = df['satisfaction'].value_counts().reindex(category_order)
+print("Frequency counts (ordered):")
+print(frequency)
+
+# Step 2: Calculate cumulative frequencies
+cumulative = frequency.cumsum()
+print("\nCumulative frequencies:")
+print(cumulative)
+```
+
+**Output:**
+```
+Frequency counts (ordered):
+Dissatisfied    2
+Neutral         2
+Satisfied       6
+Name: satisfaction, dtype: int64
+
+Cumulative frequencies:
+Dissatisfied     2
+Neutral          4
+Satisfied       10
+Name: satisfaction, dtype: int64
+```
+
+**What this means**: 
+- Up to "Dissatisfied": 2 responses
+- Up to "Neutral": 4 responses (2 + 2)
+- Up to "Satisfied": 10 responses (2 + 2 + 6, which is the total)
+
+---
+
+##### Example 4: Creating a Summary Table
+
+**Combine all three into one table:**
+
+```python
+# Create a comprehensive summary table
+summary_df = pd.DataFrame({
+    'Category': category_order,
+    'Frequency': frequency.values,
+    'Relative Freq (%)': (frequency.values / len(df)) * 100,
+    'Cumulative Freq': cumulative.values,
+    'Cumulative % ': (cumulative.values / len(df)) * 100
+})
+
+print(summary_df)
+```
+
+**Output:**
+```
+        Category  Frequency  Relative Freq (%)  Cumulative Freq  Cumulative %
+0  Dissatisfied          2               20.0                2            20.0
+1       Neutral          2               20.0                4            40.0
+2      Satisfied          6               60.0               10           100.0
+```
+
+**Using this table:**
+- **Frequency**: Raw count of each category
+- **Relative Freq (%)**: Percentage of total responses
+- **Cumulative Freq**: Running total of observations up to that point
+- **Cumulative %**: Cumulative percentage (tops out at 100%)
+
+---
+
+##### Example 5: Continuous Data with Binning
+
+**For numerical data, bin values and calculate distributions:**
+
+```python
+import pandas as pd
+import numpy as np
+
+# Create order value data
+orders = {
+    'order_value': [15, 32, 48, 51, 75, 82, 95, 120, 145, 180, 
+                    25, 40, 65, 110, 160, 55, 90, 135, 175, 22]
+}
+df_orders = pd.DataFrame(orders)
+
+# Step 1: Create bins
+bins = [0, 50, 100, 150, 200]
+labels = ['0-49', '50-99', '100-149', '150-199']
+
+# Step 2: Bin the data
+df_orders['bin'] = pd.cut(df_orders['order_value'], bins=bins, labels=labels, right=False)
+
+# Step 3: Calculate frequency counts per bin
+bin_counts = df_orders['bin'].value_counts().sort_index()
+print("Frequency by bin:")
+print(bin_counts)
+
+# Step 4: Create binned summary table
+binned_summary = pd.DataFrame({
+    'Range ($)': bin_counts.index,
+    'Count': bin_counts.values,
+    'Relative Freq (%)': (bin_counts.values / len(df_orders)) * 100,
+    'Cumulative Count': bin_counts.cumsum().values
+})
+
+print("\nBinned Summary:")
+print(binned_summary)
+```
+
+**Output:**
+```
+Frequency by bin:
+0-49        5
+50-99       6
+100-149     5
+150-199     4
+Name: bin, dtype: int64
+
+Binned Summary:
+  Range ($)  Count  Relative Freq (%)  Cumulative Count
+0     0-49      5               25.0                 5
+1    50-99      6               30.0               11
+2  100-149      5               25.0               16
+3  150-199      4               20.0               20
+```
+
+---
+
+#### Quick Reference: Common Pandas Functions for Distributions
+
+Here's a handy summary of the key functions you'll use:
+
+| Function | Purpose | Example |
+|----------|---------|---------|
+| `.value_counts()` | Count occurrences of each category | `df['satisfaction'].value_counts()` |
+| `.value_counts(normalize=True)` | Get proportions (not percentages) | `df['satisfaction'].value_counts(normalize=True)` |
+| `.cumsum()` | Calculate cumulative sum | `frequency.cumsum()` |
+| `pd.cut()` | Bin continuous values into ranges | `pd.cut(df['age'], bins=[0, 18, 65, 100])` |
+| `.describe()` | Get summary statistics (mean, std, min, max, etc.) | `df['order_value'].describe()` |
+| `.crosstab()` | Create cross-tabulation (frequency table) | `pd.crosstab(df['gender'], df['satisfaction'])` |
+
+**Tip**: To save your results to a CSV file, use:
+```python
+summary_df.to_csv('distribution_summary.csv', index=False)
+```
+
+---
+
+#### Hands-On Exercise: Calculate Distributions from Your Data
+
+**Objective**: Practice calculating frequency, relative frequency, and cumulative frequency distributions.
+
+**Step-by-step:**
+
+1. **Prepare your environment**:
+   ```python
+   import pandas as pd
+   ```
+
+2. **Load your data** (choose one):
+   - Create sample data (as shown above)
+   - Read from a CSV: `df = pd.read_csv('your_file.csv')`
+   - Read from Excel: `df = pd.read_excel('your_file.xlsx')`
+
+3. **Choose a column** and calculate distributions:
+   ```python
+   # Replace 'column_name' with your actual column
+   column = 'column_name'
+   
+   # Frequency count
+   freq = df[column].value_counts().sort_index()
+   
+   # Relative frequency (%)
+   rel_freq = (df[column].value_counts(normalize=True) * 100).sort_index()
+   
+   # Cumulative frequency
+   cum_freq = freq.cumsum()
+   
+   # Create summary table
+   result = pd.DataFrame({
+       'Category': freq.index,
+       'Frequency': freq.values,
+       'Relative Freq (%)': rel_freq.values,
+       'Cumulative Freq': cum_freq.values
+   })
+   
+   print(result)
+   ```
+
+4. **Interpret the results**:
+   - Which category is most common?
+   - What percentage of the total does it represent?
+   - At what cumulative count do you reach 50% of the data?
+
+**Troubleshooting**:
+- **Error: "KeyError"** → Check that `column_name` matches exactly (case-sensitive)
+- **No output** → Add `print()` statements to see intermediate results
+- **Wrong calculations** → Verify your data has no missing values with `df[column].isnull().sum()`
+
+---
+
+#### Continuous Variable Distributions
+
+For continuous variables, you may **bin** values into ranges to make distributions easier to interpret:
+
+- **Binning** groups continuous values into fewer intervals.
+- Helps reveal skewness and shape when the raw data is highly granular.
+
+**Example: Binned Frequency Table (Order Value)**
+
+| Range ($) | Count |
+|-----------|-------|
+| 0-49 | 18 |
+| 50-99 | 26 |
+| 100-149 | 14 |
+| 150-199 | 7 |
+| 200+ | 5 |
+
+**Quick check for normality**: Use a histogram or Q-Q plot to see if values roughly follow a bell curve.
+
+---
+
+#### Common Mistakes When Computing Distributions
+
+**Mistake 1: Forgetting to handle missing values**
+```python
+# ❌ Wrong: Calculates distribution including NaN values
+freq = df['column'].value_counts()
+
+# ✅ Right: Removes missing values first
+freq = df['column'].dropna().value_counts()
+```
+
+**Mistake 2: Not sorting by a meaningful order**
+```python
+# ❌ Wrong: Categories sorted by frequency, not logically
+freq = df['satisfaction'].value_counts()  # Returns: Satisfied, Dissatisfied, Neutral
+
+# ✅ Right: Define a logical order
+order = ['Very Dissatisfied', 'Dissatisfied', 'Neutral', 'Satisfied', 'Very Satisfied']
+freq = df['satisfaction'].value_counts().reindex(order)
+```
+
+**Mistake 3: Using percentages instead of proportions in normalize**
+```python
+# ❌ Wrong: Returns 0.25 when you want 25%
+rel_freq = df['column'].value_counts(normalize=True)
+
+# ✅ Right: Multiply by 100 if you want percentages
+rel_freq = df['column'].value_counts(normalize=True) * 100
+```
+
+**Mistake 4: Incorrect bin boundaries**
+```python
+# ❌ Wrong: Data < 0 or >= 200 gets lost
+bins = [0, 50, 100, 150, 200]
+df['binned'] = pd.cut(df['value'], bins=bins)
+
+# ✅ Right: Set bin limits beyond your data range
+bins = [-float('inf'), 50, 100, 150, float('inf')]
+df['binned'] = pd.cut(df['value'], bins=bins)
+```
+
+**Mistake 5: Not checking the cumulative total**
+```python
+# Always verify your cumulative frequency ends at the total count
+print(f"Total observations: {len(df)}")
+print(f"Max cumulative freq: {cum_freq.iloc[-1]}")  # Should match total
+```
+
+---
+
+### 2. Central Tendency
+
+Central tendency describes the typical or central value in a distribution.
+
+**Mean**: Average value, sensitive to outliers.
+
+$$\bar{x} = \frac{\sum x_i}{n}$$
+
+**Median**: Middle value when sorted; robust to outliers.
+
+**Mode**: Most frequent value; useful for categorical data.
+
+---
+
+### 3. Spread (Dispersion)
+
+Spread tells you how much values vary.
+
+**Range**: Max minus min.
+
+**Variance**: Average squared deviation from the mean.
+
+$$s^2 = \frac{\sum (x_i - \bar{x})^2}{n-1}$$
+
+**Standard deviation**: Square root of variance; in the same units as the data.
+
+$$s = \sqrt{s^2}$$
+
+**Interquartile range (IQR)**: $Q3 - Q1$; robust to outliers.
+
+---
+
+### 4. Distribution Shape
+
+Shape indicates how values are distributed.
+
+- **Symmetric**: Mean and median are similar.
+- **Right-skewed**: Long tail to the right; mean > median.
+- **Left-skewed**: Long tail to the left; mean < median.
+
+---
+
+### 5. Example: Quick Summary
+
+**Sample data (daily orders)**: 5, 7, 7, 9, 12
+
+- Mean = (5 + 7 + 7 + 9 + 12) / 5 = 8
+- Median = 7
+- Mode = 7
+- Range = 12 - 5 = 7
+
+---
+
+### 6. Choosing the Right Summary
+
+- Use **mean + standard deviation** for roughly symmetric numeric data.
+- Use **median + IQR** for skewed data or when outliers exist.
+- Use **counts and percentages** for categorical data.
+
+---
+
+### 📚 What Did I Learn in This Lesson?
+
+In this lesson, you learned how to calculate and interpret distributions, which are fundamental to understanding your data before building models or making predictions.
+
+**1. Individual Data Attributes as Explanatory/Explained Variables**
+
+You now understand that data attributes (features) play different roles in analysis:
+- **Explained variables** (target, outcome, dependent) are what you're trying to predict or understand
+- **Explanatory variables** (predictors, independent, features) help explain the variation in the target
+- Example: Predicting house prices (explained) using size, bedrooms, and location (explanatory)
+
+This distinction helps you structure your analysis and choose appropriate statistical methods.
+
+**2. Descriptive Statistics Provide Valuable Insights**
+
+You learned that summarizing data with descriptive statistics is essential for:
+- Understanding central tendency (mean, median, mode)
+- Measuring spread (range, variance, standard deviation, IQR)
+- Identifying distribution shape (symmetric, skewed)
+- Detecting outliers and unusual patterns
+- Choosing appropriate analysis methods
+
+These statistics give you a quick snapshot of your data before diving into complex modeling.
+
+**3. Calculating Distributions is an Initial Step for Gathering Insights**
+
+You now know how to calculate and interpret different types of distributions:
+
+**Frequency Counts**: How often each value or category appears
+- Identifies most/least common values
+- Detects data quality issues
+- Foundation for all other distribution calculations
+
+**Relative Frequencies**: Proportions or percentages
+- Enables comparison across datasets of different sizes
+- Helps communicate findings clearly (e.g., "60% of customers are satisfied")
+- Useful for probability calculations
+
+**Cumulative Frequencies**: Running totals
+- Answers "how many up to this point?" questions
+- Calculates percentiles and quartiles
+- Identifies thresholds (e.g., "75% of students scored below 85")
+
+**Binning**: Grouping continuous values into intervals
+- Simplifies complex data for patterns
+- Creates meaningful categories (age groups, income brackets)
+- Enables longitudinal analysis and trend tracking
+
+**Key Takeaway**: Distribution calculations are the foundation of exploratory data analysis. They help you understand what you're working with, identify problems early, and guide your choice of statistical methods.
+
+---
+
+### ✅ Practice Questions
+
+1. A dataset of salaries is heavily right-skewed. Which summary statistics are most appropriate?
+2. For the values 3, 3, 4, 8, 12, compute the mean and median.
+3. Which feature type is best summarized with counts and percentages: payment method, height, or response time?
+4. Explain why the mean can be misleading when outliers are present.
+5. A distribution has mean < median. Is it left-skewed or right-skewed?
+
+#### ✅ Answer Key
+
+1. Median and IQR (robust to skew and outliers).
+2. Mean = 6; median = 4.
+3. Payment method (categorical).
+4. Outliers can pull the mean away from the typical value.
+5. Left-skewed.
+
+---
+
+## 🚗 Comprehensive Task: Car Dealership Distribution Analysis
+
+### The Scenario
+
+You are working as a data analyst at a car dealership that sold 30 cars with the following attributes:
+- **Colour**: Red, Blue, Black, White, Silver
+- **Type**: Sedan, SUV, Hatchback
+- **Price**: Between 82,071 NOK and 890,996 NOK
+
+Your task is to analyze this data by calculating frequency counts, relative frequencies, cumulative frequencies, and binning prices into meaningful categories.
+
+---
+
+### Part 1: Frequency Counts
+
+**Step 1A: Count color frequencies**
+
+| Colour | Frequency |
+|--------|-----------|
+| Red | 11 |
+| Black | 6 |
+| Blue | 5 |
+| White | 5 |
+| Silver | 3 |
+| **Total** | **30** |
+
+**Step 1B: Count type frequencies**
+
+| Type | Frequency |
+|------|-----------|
+| Sedan | 17 |
+| Hatchback | 7 |
+| SUV | 6 |
+| **Total** | **30** |
+
+**Excel Method (COUNTIF)**:
+```excel
+=COUNTIF($B$2:$B$31, "Red")      → 11
+=COUNTIF($B$2:$B$31, "Sedan")    → 17
+```
+
+**Python Method**:
+```python
+import pandas as pd
+
+# Create dataset
+df = pd.DataFrame({
+    'Colour': ['Black', 'Silver', 'Silver', 'White', 'Black', 'Blue', ..., 'Red'],
+    'Type': ['Sedan', 'Hatchback', 'Hatchback', 'Sedan', 'Sedan', 'SUV', ..., 'Sedan'],
+    'Price': [547580.14, 82071.31, 795637.68, ..., 594293.78]
+})
+
+# Frequency counts
+colour_freq = df['Colour'].value_counts().sort_values(ascending=False)
+print("Colour Frequency:")
+print(colour_freq)
+
+type_freq = df['Type'].value_counts().sort_values(ascending=False)
+print("\nType Frequency:")
+print(type_freq)
+```
+
+**Output:**
+```
+Colour Frequency:
+Red      11
+Black     6
+Blue      5
+White     5
+Silver    3
+
+Type Frequency:
+Sedan       17
+Hatchback    7
+SUV          6
+```
+
+---
+
+### Part 2: Relative Frequencies
+
+**Step 2A: Calculate color relative frequencies**
+
+| Colour | Frequency | Relative Frequency (%) |
+|--------|-----------|------------------------|
+| Red | 11 | 36.7% |
+| Black | 6 | 20.0% |
+| Blue | 5 | 16.7% |
+| White | 5 | 16.7% |
+| Silver | 3 | 10.0% |
+| **Total** | **30** | **100%** |
+
+**Step 2B: Calculate type relative frequencies**
+
+| Type | Frequency | Relative Frequency (%) |
+|------|-----------|------------------------|
+| Sedan | 17 | 56.7% |
+| Hatchback | 7 | 23.3% |
+| SUV | 6 | 20.0% |
+| **Total** | **30** | **100%** |
+
+**Excel Method**:
+```excel
+=E2/$E$6*100  where E2 is frequency and E6 is total (30)
+```
+Formula for Red: `=E2/$E$6*100` → 11/30 × 100 = 36.7%
+
+**Python Method**:
+```python
+# Relative frequencies (percentages)
+colour_rel_freq = (df['Colour'].value_counts() / len(df) * 100).sort_values(ascending=False)
+print("Colour Relative Frequency (%):")
+print(colour_rel_freq.round(1))
+
+type_rel_freq = (df['Type'].value_counts() / len(df) * 100).sort_values(ascending=False)
+print("\nType Relative Frequency (%):")
+print(type_rel_freq.round(1))
+```
+
+**Output:**
+```
+Colour Relative Frequency (%):
+Red      36.7
+Black    20.0
+Blue     16.7
+White    16.7
+Silver   10.0
+
+Type Relative Frequency (%):
+Sedan       56.7
+Hatchback   23.3
+SUV         20.0
+```
+
+**📊 Interpretation**: Over one-third (36.7%) of sales are red cars. Sedans dominate the inventory at 56.7%, more than half of all sales.
+
+---
+
+### Part 3: Cumulative Frequencies
+
+**Step 3A: Cumulative color frequencies (alphabetical order)**
+
+| Colour | Frequency | Cumulative Frequency | Cumulative % |
+|--------|-----------|----------------------|--------------|
+| Black | 6 | 6 | 20.0% |
+| Blue | 5 | 11 | 36.7% |
+| Red | 11 | 22 | 73.3% |
+| Silver | 3 | 25 | 83.3% |
+| White | 5 | 30 | 100.0% |
+
+**Step 3B: Cumulative type frequencies (alphabetical order)**
+
+| Type | Frequency | Cumulative Frequency | Cumulative % |
+|------|-----------|----------------------|--------------|
+| Hatchback | 7 | 7 | 23.3% |
+| Sedan | 17 | 24 | 80.0% |
+| SUV | 6 | 30 | 100.0% |
+
+**Excel Method (Expanding SUM)**:
+```excel
+Colour Cumulative (Column F):
+F2: =E2              → 6
+F3: =F2+E3           → 6+5 = 11
+F4: =F3+E4           → 11+11 = 22
+...and so on
+
+Or use expanding absolute reference:
+=SUM($E$2:E2)  (copy down, E2 changes to E3, E4, etc.)
+```
+
+**Python Method**:
+```python
+# Sort colours alphabetically
+colour_freq_sorted = df['Colour'].value_counts().reindex(['Black', 'Blue', 'Red', 'Silver', 'White'])
+
+# Cumulative frequency
+cumulative_colour = colour_freq_sorted.cumsum()
+cumulative_pct = (cumulative_colour / len(df) * 100).round(1)
+
+print("Cumulative Colour Distribution:")
+print(f"{'Colour':<10} {'Frequency':<12} {'Cumulative':<12} {'Cumulative %':<12}")
+for colour in ['Black', 'Blue', 'Red', 'Silver', 'White']:
+    freq = colour_freq_sorted[colour]
+    cum = cumulative_colour[colour]
+    pct = cum / len(df) * 100
+    print(f"{colour:<10} {freq:<12} {cum:<12} {pct:.1f}%")
+```
+
+**Output:**
+```
+Cumulative Colour Distribution:
+Colour     Frequency    Cumulative   Cumulative %
+Black             6            6         20.0%
+Blue              5           11         36.7%
+Red              11           22         73.3%
+Silver            3           25         83.3%
+White             5           30        100.0%
+```
+
+**📊 Interpretation**: By the time you reach "Red" alphabetically, you've accounted for 73.3% of all cars sold. This shows that red, blue, and black together make up 73.3% of the dealership's inventory.
+
+---
+
+### Part 4: Binning Price Data
+
+**Binning Strategy**: Create meaningful price categories
+
+| Category | Price Range (NOK) |
+|----------|------------------|
+| Affordable | < 200,000 |
+| Mid-range | 200,000 – 350,000 |
+| Expensive | 350,000 – 500,000 |
+| Luxury | > 500,000 |
+
+**Frequency Distribution by Price Category**:
+
+| Category | Count | Percentage |
+|----------|-------|-----------|
+| Affordable (< 200K) | 4 | 13.3% |
+| Mid-range (200K-350K) | 3 | 10.0% |
+| Expensive (350K-500K) | 3 | 10.0% |
+| Luxury (> 500K) | 20 | 66.7% |
+| **Total** | **30** | **100%** |
+
+**Excel Method (Nested IF)**:
+```excel
+=IF(D2<200000, "Affordable", IF(D2<350000, "Mid-range", IF(D2<500000, "Expensive", "Luxury")))
+
+Example for Price 547,580.14:
+→ 547,580.14 is not < 200,000
+→ 547,580.14 is not < 350,000
+→ 547,580.14 is not < 500,000
+→ Result: "Luxury"
+```
+
+Then use COUNTIF to count frequency:
+```excel
+=COUNTIF($F$2:$F$31, "Affordable")    → 4
+=COUNTIF($F$2:$F$31, "Mid-range")     → 3
+=COUNTIF($F$2:$F$31, "Expensive")     → 3
+=COUNTIF($F$2:$F$31, "Luxury")        → 20
+```
+
+**Python Method (pd.cut)**:
+```python
+# Define bins and labels
+bins = [0, 200000, 350000, 500000, float('inf')]
+labels = ['Affordable', 'Mid-range', 'Expensive', 'Luxury']
+
+# Bin the data
+df['PriceCategory'] = pd.cut(df['Price'], bins=bins, labels=labels, right=False)
+
+# Count frequencies
+price_freq = df['PriceCategory'].value_counts().reindex(labels)
+price_pct = (price_freq / len(df) * 100).round(1)
+
+print("Price Category Distribution:")
+print(price_freq)
+print("\nPercentages:")
+print(price_pct)
+
+# Summary statistics by category
+print("\nPrice Statistics by Category:")
+print(df.groupby('PriceCategory')['Price'].agg(['count', 'mean', 'min', 'max']))
+```
+
+**Output:**
+```
+Price Category Distribution:
+Affordable        4
+Mid-range         3
+Expensive         3
+Luxury           20
+
+Percentages:
+Affordable      13.3%
+Mid-range       10.0%
+Expensive       10.0%
+Luxury          66.7%
+
+Price Statistics by Category:
+               count      mean        min        max
+Affordable         4  149427.00   82071.31  185742.39
+Mid-range          3  269388.47  201352.85  271786.76
+Expensive          3  446390.47  424513.15  487342.31
+Luxury            20  681816.50  506469.01  890996.07
+```
+
+---
+
+### Part 5: Business Interpretation
+
+**📈 Key Finding**: 66.7% (20 out of 30) of cars sold are in the **Luxury category** (above 500,000 NOK).
+
+**What does this tell us about the neighbourhood?**
+
+👉 **Answer: The dealership is serving a WEALTHY neighbourhood.**
+
+**Reasoning**:
+- The dealership's primary inventory consists of luxury vehicles costing over 500,000 NOK
+- The average price for luxury cars is 681,816 NOK
+- Only 13.3% of sales are in the "Affordable" category (< 200,000 NOK)
+- The dealer is not focused on budget-conscious consumers
+- This pricing strategy and inventory mix indicates the dealership targets high-income customers in a wealthy area
+
+**Additional Context**:
+- Mid-range and Expensive categories combined represent only 20% of sales
+- This is a luxury-focused dealership, not a mass-market dealer
+- The neighbourhood likely has above-average income levels, allowing residents to purchase premium vehicles
+- A low-income neighbourhood would typically see more "Affordable" cars; an average-income area would have more "Mid-range" sales
+
+---
+
+### 💡 Summary: What the Data Shows
+
+This car dealership analysis demonstrates all four distribution techniques in a real business context:
+
+1. **Frequency counts** revealed that Red is the most popular colour (11 cars) and Sedans dominate (17 cars)
+2. **Relative frequencies** showed these represent 36.7% and 56.7% respectively, making them easy to communicate
+3. **Cumulative frequencies** indicated that 73.3% of cars come from just 3 color categories
+4. **Binning** categorized continuous price data into meaningful segments, revealing 66.7% of cars are luxury vehicles
+5. **Business insight** concluded the dealership serves wealthy customers based on pricing distribution
+
+This is how data analysts use distribution analysis to understand business operations and customer segments!
+
+            """,
+        "key_points": [
+            "Features are the basic building blocks used to describe outcomes in a data set",
+            "Descriptive statistics summarize features to provide quick insights",
+            "Different feature types require different descriptive statistics",
+            "Central tendency is measured with mean, median, and mode",
+            "Spread is measured with range, variance, standard deviation, and IQR",
+            "Distribution shape can be symmetric, right-skewed, or left-skewed",
+            "Use mean and standard deviation for symmetric data; use median and IQR for skewed data"
+        ],
+        "visual_elements": {
+            "diagrams": True,
+            "tables": True,
+            "highlighted_sections": True
+        }
+    }
+]
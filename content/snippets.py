@@ -0,0 +1,297 @@
+"""Code Library snippets a new session starts with."""
+
+DEFAULT_SNIPPETS = {
+    "pandas_basic": {
+        "title": "Pandas DataFrame Basics",
+        "code": """import pandas as pd
+
+# Create DataFrame
+df = pd.DataFrame({
+    'name': ['Alice', 'Bob', 'Charlie'],
+    'age': [25, 30, 35],
+    'salary': [50000, 60000, 70000]
+})
+
+# Basic operations
+print(df.head())
+print(df.describe())
+print(df.info())""",
+        "language": "python",
+        "category": "Pandas",
+        "description": "Basic DataFrame creation and operations"
+    },
+    "pandas_filter": {
+        "title": "Filtering DataFrames",
+        "code": """# Filter rows
+filtered = df[df['age'] > 25]
+
+# Multiple conditions
+filtered = df[(df['age'] > 25) & (df['salary'] > 55000)]
+
+# Filter by string contains
+filtered = df[df['name'].str.contains('A')]
+
+# Filter by isin
+filtered = df[df['name'].isin(['Alice', 'Bob'])]""",
+        "language": "python",
+        "category": "Pandas",
+        "description": "Common filtering operations"
+    },
+    "pandas_groupby": {
+        "title": "GroupBy Operations",
+        "code": """# Group by column
+grouped = df.groupby('department')
+
+# Aggregations
+summary = df.groupby('department').agg({
+    'salary': ['mean', 'sum', 'count'],
+    'age': 'mean'
+})
+
+# Multiple groupby columns
+grouped = df.groupby(['department', 'role']).sum()""",
+        "language": "python",
+        "category": "Pandas",
+        "description": "GroupBy and aggregation examples"
+    },
+    "sql_select": {
+        "title": "SQL SELECT Basics",
+        "code": """-- Basic SELECT
+SELECT * FROM customers;
+
+-- SELECT with WHERE
+SELECT name, email 
+FROM customers 
+WHERE age > 25;
+
+-- SELECT with JOIN
+SELECT c.name, o.order_date, o.amount
+FROM customers c
+JOIN orders o ON c.id = o.customer_id;""",
+        "language": "sql",
+        "category": "SQL",
+        "description": "Basic SQL SELECT queries"
+    },
+    "sql_aggregate": {
+        "title": "SQL Aggregations",
+        "code": """-- COUNT, SUM, AVG
+SELECT 
+    COUNT(*) as total_orders,
+    SUM(amount) as total_revenue,
+    AVG(amount) as avg_order_value
+FROM orders;
+
+-- GROUP BY
+SELECT 
+    customer_id,
+    COUNT(*) as order_count,
+    SUM(amount) as total_spent
+FROM orders
+GROUP BY customer_id
+HAVING COUNT(*) > 5;""",
+        "language": "sql",
+        "category": "SQL",
+        "description": "SQL aggregation functions"
+    },
+    "excel_sumif": {
+        "title": "Excel SUMIF Function",
+        "code": """=SUMIF(range, criteria, sum_range)
+
+-- Examples:
+=SUMIF(A2:A10, ">100", B2:B10)
+=SUMIF(C2:C10, "North", D2:D10)
+=SUMIF(E2:E10, ">=2024-01-01", F2:F10)""",
+        "language": "excel",
+        "category": "Excel",
+        "description": "SUMIF function examples"
+    },
+    "excel_vlookup": {
+        "title": "Excel VLOOKUP",
+        "code": """=VLOOKUP(lookup_value, table_array, col_index_num, [range_lookup])
+
+-- Examples:
+=VLOOKUP(A2, Sheet2!A:B, 2, FALSE)
+=VLOOKUP("Product1", Products!A:D, 4, FALSE)""",
+        "language": "excel",
+        "category": "Excel",
+        "description": "VLOOKUP function examples"
+    },
+    "python_stats": {
+        "title": "Python Statistical Functions",
+        "code": """import numpy as np
+from scipy import stats
+
+# Descriptive statistics
+data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+mean = np.mean(data)
+median = np.median(data)
+std = np.std(data)
+
+# Correlation
+correlation = np.corrcoef(x, y)[0, 1]
+
+# T-test
+t_stat, p_value = stats.ttest_ind(group1, group2)""",
+        "language": "python",
+        "category": "Statistics",
+        "description": "Statistical calculations in Python"
+    },
+    "pandas_time_series": {
+        "title": "Time Series Resampling & Rolling",
+        "code": """import pandas as pd
+
+# Ensure datetime index
+df['date'] = pd.to_datetime(df['date'])
+df = df.set_index('date')
+
+# Resample to monthly totals
+monthly = df['sales'].resample('M').sum()
+
+# Rolling 7-day average
+df['sales_7d_avg'] = df['sales'].rolling(window=7, min_periods=1).mean()
+
+# Year-over-year growth
+df['yoy_growth'] = df['sales'].pct_change(periods=365)""",
+        "language": "python",
+        "category": "Time Series",
+        "description": "Common pandas patterns for date indexed data"
+    },
+    "python_visualization": {
+        "title": "Quick Matplotlib/Seaborn Plots",
+        "code": """import pandas as pd
+import seaborn as sns
+import matplotlib.pyplot as plt
+
+df = pd.read_csv('sales.csv')
+
+# Line plot with trend
+plt.figure(figsize=(8, 4))
+sns.lineplot(data=df, x='date', y='revenue')
+plt.title('Revenue over time')
+plt.xticks(rotation=45)
+plt.tight_layout()
+plt.show()
+
+# Bar chart by category
+plt.figure(figsize=(6, 4))
+sns.barplot(data=df, x='category', y='revenue', estimator=sum)
+plt.title('Revenue by category')
+plt.xticks(rotation=20)
+plt.tight_layout()
+plt.show()""",
+        "language": "python",
+        "category": "Visualization",
+        "description": "Two fast plotting patterns with seaborn/matplotlib"
+    },
+    "sql_window_functions": {
+        "title": "SQL Window Functions",
+        "code": """-- Running totals by date
+SELECT
+    order_date,
+    amount,
+    SUM(amount) OVER (ORDER BY order_date) AS running_revenue
+FROM orders;
+
+-- Ranking within groups
+SELECT
+    customer_id,
+    order_date,
+    amount,
+    ROW_NUMBER() OVER (PARTITION BY customer_id ORDER BY amount DESC) AS order_rank
+FROM orders;
+
+-- Previous value comparison
+SELECT
+    order_date,
+    amount,
+    LAG(amount) OVER (ORDER BY order_date) AS prev_amount,
+    amount - LAG(amount) OVER (ORDER BY order_date) AS delta_amount
+FROM orders;""",
+        "language": "sql",
+        "category": "SQL",
+        "description": "Running totals, ranking, and lag/lead examples"
+    },
+    "python_api_requests": {
+        "title": "API Requests with Error Handling",
+        "code": """import requests
+
+BASE_URL = \"https://api.example.com/data\"
+
+def fetch_data(resource_id: str) -> dict:
+    try:
+        response = requests.get(
+            f\"{BASE_URL}/{resource_id}\",
+            timeout=10
+        )
+        response.raise_for_status()
+        return response.json()
+    except requests.exceptions.Timeout:
+        return {\"error\": \"Request timed out\"}
+    except requests.exceptions.HTTPError as exc:
+        return {\"error\": f\"HTTP error: {exc.response.status_code}\"}
+    except Exception as exc:
+        return {\"error\": f\"Unexpected error: {exc}\"}
+
+payload = fetch_data(\"customers\")
+print(payload)""",
+        "language": "python",
+        "category": "Python",
+        "description": "Requests pattern with timeouts and basic error handling"
+    },
+    "excel_index_match": {
+        "title": "Excel INDEX/MATCH",
+        "code": """=INDEX(return_range, MATCH(lookup_value, lookup_range, 0))
+
+-- Examples:
+=INDEX(D:D, MATCH(A2, A:A, 0))                 -- Get value from column D by ID in A2
+=INDEX(B2:B100, MATCH(\"ProductA\", A2:A100, 0)) -- Lookup product name in column A""",
+        "language": "excel",
+        "category": "Excel",
+        "description": "Flexible lookup pattern that can look left or right"
+    },
+    "python_data_quality": {
+        "title": "Data Quality Checks",
+        "code": """import pandas as pd
+
+def validate_orders(df: pd.DataFrame) -> pd.DataFrame:
+    issues = []
+    
+    if not df['order_id'].is_unique:
+        issues.append('Duplicate order_id values detected')
+    if (df['amount'] < 0).any():
+        issues.append('Negative amounts present')
+    if not df['customer_id'].notna().all():
+        issues.append('Missing customer_id values')
+    if (df['order_date'] > pd.Timestamp.today()).any():
+        issues.append('Orders dated in the future')
+    
+    return pd.DataFrame({'issue': issues})
+
+orders = pd.read_csv('orders.csv')
+print(validate_orders(orders))""",
+        "language": "python",
+        "category": "Data Quality",
+        "description": "Small checklist for catching common data issues"
+    },
+    "stats_ab_test": {
+        "title": "A/B Test Significance (Two Proportions)",
+        "code": """import numpy as np
+from scipy.stats import norm
+
+def ab_z_test(success_a, total_a, success_b, total_b):
+    p_a = success_a / total_a
+    p_b = success_b / total_b
+    p_pool = (success_a + success_b) / (total_a + total_b)
+    
+    se = np.sqrt(p_pool * (1 - p_pool) * (1/total_a + 1/total_b))
+    z = (p_a - p_b) / se
+    p_value = 2 * (1 - norm.cdf(abs(z)))
+    return z, p_value
+
+z_score, p_val = ab_z_test(520, 10000, 570, 10050)
+print(f\"z={z_score:.2f}, p-value={p_val:.4f}\")""",
+        "language": "python",
+        "category": "Statistics",
+        "description": "Lightweight two-proportion z-test without extra deps"
+    }
+}
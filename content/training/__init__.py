@@ -0,0 +1,35 @@
+"""Index of Training Center topics.
+
+Each topic lives in its own module under this package.  The index only carries
+the fields the topic pickers need, so listing topics never imports lesson text.
+"""
+
+TOPIC_INDEX = {
+    "Statistical methodologies to extract KPIs": {"module": "statistical_methodologies_to_extract_kpis", "course": "Statistical Tools", "lessons": 3},
+    "Correlation, regression, ANOVA, histogram and covariance analysis": {"module": "correlation_regression_anova_histogram_and_covariance_analysis", "course": "Statistical Tools", "lessons": 4},
+    "Z-scores and z-testing for outlier reduction": {"module": "z_scores_and_z_testing_for_outlier_reduction", "course": "Statistical Tools", "lessons": 3},
+    "FI1BBSF05 - Spreadsheet Fundamentals": {"module": "fi1bbsf05_spreadsheet_fundamentals", "course": "Spreadsheet Fundamentals", "lessons": 14},
+    "Tool: Excel & Google Sheets": {"module": "tool_excel_google_sheets", "course": "Spreadsheet Fundamentals", "lessons": 4},
+    "Tool: Python Programming": {"module": "tool_python_programming", "course": "Programming Fundamentals", "lessons": 4},
+    "Tool: SQL & Databases": {"module": "tool_sql_databases", "course": "Databases and Cloud Services", "lessons": 4},
+    "Tool: Tableau & Power BI": {"module": "tool_tableau_power_bi", "course": "Data Visualisation", "lessons": 4},
+    "Tool: Statistical Analysis": {"module": "tool_statistical_analysis", "course": "Statistical Tools", "lessons": 4},
+    "Four Data Analysis Philosophies": {"module": "four_data_analysis_philosophies", "course": "Data Driven Decision-Making", "lessons": 5},
+    "Data Analysis Lifecycle": {"module": "data_analysis_lifecycle", "course": "Data Driven Decision-Making", "lessons": 5},
+    "Data-Driven Case Studies": {"module": "data_driven_case_studies", "course": "Data Driven Decision-Making", "lessons": 3},
+    "Qualitative vs Quantitative Decision-Making": {"module": "qualitative_vs_quantitative_decision_making", "course": "Data Driven Decision-Making", "lessons": 3},
+    "KPI Selection and Tracking": {"module": "kpi_selection_and_tracking", "course": "Data Driven Decision-Making", "lessons": 4},
+    "Project Planning & Execution": {"module": "project_planning_execution", "course": "Semester Project 1", "lessons": 4},
+    "Data Ethics & GDPR": {"module": "data_ethics_gdpr", "course": "Semester Project 1", "lessons": 4},
+    "Documentation & Presentation": {"module": "documentation_presentation", "course": "Semester Project 1", "lessons": 4},
+    "Soft Skills for Data Analysts": {"module": "soft_skills_for_data_analysts", "course": "Semester Project 1", "lessons": 4},
+    "KPIs & Decision Heuristics": {"module": "kpis_decision_heuristics", "course": "Evaluation of Outcomes", "lessons": 4},
+    "Statistical Result Analysis": {"module": "statistical_result_analysis", "course": "Evaluation of Outcomes", "lessons": 4},
+    "Confidence Levels & Scenarios": {"module": "confidence_levels_scenarios", "course": "Evaluation of Outcomes", "lessons": 4},
+    "Iterative Error Elimination": {"module": "iterative_error_elimination", "course": "Evaluation of Outcomes", "lessons": 5},
+    "Data Ensembling & Reliability": {"module": "data_ensembling_reliability", "course": "Evaluation of Outcomes", "lessons": 4},
+    "ETL & Version Control": {"module": "etl_version_control", "course": "Evaluation of Outcomes", "lessons": 4},
+    "Data Visualization Fundamentals": {"module": "data_visualization_fundamentals", "course": "Data Visualisation", "lessons": 6},
+    "Analysis Reporting Fundamentals": {"module": "analysis_reporting_fundamentals", "course": "Analysis Reporting", "lessons": 7},
+    "Exam Project 1 - Professional Data Analysis": {"module": "exam_project_1_professional_data_analysis", "course": "Exam Project 1", "lessons": 7},
+}
@@ -0,0 +1,479 @@
+"""Training Center content: Analysis Reporting Fundamentals."""
+
+MODULE = {
+    "course": "Analysis Reporting",
+    "description": "Learn report writing skills to present analytical work in professional documents for technical and non-technical audiences.",
+    "lessons": [
+        {
+            "title": "Introduction to Analysis Reporting",
+            "content": """
+**Why Analysis Reports Matter**
+
+A brilliant analysis is worthless if it can't be communicated effectively. Reports transform your findings into actionable documents.
+
+**Key Purpose of Reports:**
+- **Document findings**: Create permanent record of analysis
+- **Enable decisions**: Provide information for stakeholders to act
+- **Share knowledge**: Transfer insights across teams/organizations
+- **Build credibility**: Establish you as a trusted analyst
+
+**Report vs. Presentation:**
+
+| Report | Presentation |
+|--------|--------------|
+| Comprehensive | Highlights only |
+| Self-contained | Requires speaker |
+| Reference document | One-time event |
+| Detailed methodology | High-level overview |
+| Read at reader's pace | Controlled timing |
+
+**Types of Analysis Reports:**
+
+| Type | Purpose | Audience | Length |
+|------|---------|----------|--------|
+| **Executive Summary** | Quick overview | Executives | 1-2 pages |
+| **Technical Report** | Full methodology | Analysts | 10-30 pages |
+| **Client Report** | Findings + recommendations | Clients | 5-15 pages |
+| **Dashboard Report** | Ongoing metrics | Operations | 1-3 pages |
+| **Ad-hoc Analysis** | Specific question | Requestor | 2-5 pages |
+
+**The Report Writing Process:**
+
+```
+1. UNDERSTAND the audience and purpose
+2. STRUCTURE the document logically
+3. WRITE clearly and concisely
+4. VISUALIZE data effectively
+5. REVIEW and refine
+6. DELIVER in appropriate format
+```
+                """,
+            "key_points": ["Reports document and communicate findings", "Different report types serve different audiences", "Reports must be self-contained and actionable", "Writing process follows clear stages"]
+        },
+        {
+            "title": "Report Structure and Organization",
+            "content": """
+**Standard Report Structure**
+
+A well-organized report guides readers through your analysis logically.
+
+**Essential Sections:**
+
+**1. Executive Summary** (Write Last)
+- Key findings in 1-2 paragraphs
+- Main recommendations
+- Critical numbers/metrics
+- *Tip: Busy readers may only read this*
+
+**2. Introduction/Background**
+- Business context and problem statement
+- Scope of analysis
+- Data sources used
+- Time period covered
+
+**3. Methodology**
+- How data was collected/cleaned
+- Analysis techniques used
+- Assumptions and limitations
+- *Adjust detail level for audience*
+
+**4. Findings**
+- Present results clearly
+- Use visualizations
+- Organize by theme or priority
+- Include supporting data
+
+**5. Conclusions & Recommendations**
+- What the findings mean
+- Specific actions to take
+- Expected impact of recommendations
+- Next steps
+
+**6. Appendix** (Optional)
+- Detailed data tables
+- Technical methodology
+- Supplementary charts
+- Glossary of terms
+
+**Organization Tips:**
+
+| Do | Don't |
+|-----|--------|
+| Use numbered sections | Use vague headings |
+| Include table of contents (>5 pages) | Bury key findings |
+| Put most important info first | Make readers hunt for answers |
+| Use consistent formatting | Change styles mid-document |
+                """,
+            "key_points": ["Follow standard report structure", "Write executive summary last", "Adjust detail level for audience", "Put most important information first"]
+        },
+        {
+            "title": "Academic Writing for Reports",
+            "content": """
+**Professional Writing Style**
+
+Analysis reports require clear, professional language that builds credibility.
+
+**Key Principles:**
+
+**1. Clarity Over Complexity**
+- Use simple words when possible
+- Short sentences (15-20 words average)
+- One idea per paragraph
+- Active voice preferred
+
+**Bad:** "The utilization of advanced analytical methodologies facilitated the identification of correlational patterns."
+**Good:** "Our analysis found a strong link between marketing spend and sales."
+
+**2. Be Precise and Specific**
+
+| Vague | Precise |
+|-------|---------|
+| "Sales increased significantly" | "Sales increased 23% ($1.2M)" |
+| "Most customers prefer..." | "67% of customers prefer..." |
+| "Recently" | "In Q3 2025" |
+| "Some improvement" | "15% improvement" |
+
+**3. Objective Tone**
+- State facts, not opinions
+- Support claims with data
+- Acknowledge limitations
+- Avoid emotional language
+
+**Bad:** "Clearly, the amazing results prove our strategy works perfectly."
+**Good:** "Results show a 23% increase, suggesting the strategy is effective. Further testing is recommended."
+
+**4. Consistent Terminology**
+- Define terms on first use
+- Use same word for same concept
+- Create glossary if needed
+- Avoid jargon with non-technical audiences
+
+**5. Hedging Appropriately**
+When certainty is limited, use appropriate hedging:
+- "The data suggests..." (not "proves")
+- "This may indicate..."
+- "Based on available data..."
+- "Further analysis would be needed to confirm..."
+
+**Common Phrases for Reports:**
+
+| Purpose | Phrases |
+|---------|---------|
+| Introducing findings | "The analysis reveals...", "Data indicates..." |
+| Comparing | "In contrast...", "Similarly...", "However..." |
+| Recommending | "We recommend...", "Consider...", "The next step is..." |
+| Concluding | "In summary...", "The key takeaway is..." |
+                """,
+            "key_points": ["Clarity and precision over complexity", "Use specific numbers, not vague terms", "Maintain objective, professional tone", "Define terms and be consistent"]
+        },
+        {
+            "title": "Integrating Visualizations in Reports",
+            "content": """
+**Using Graphics Effectively in Reports**
+
+Static visualizations in reports differ from interactive dashboards - they must stand alone on paper.
+
+**Principles for Report Graphics:**
+
+**1. Every Chart Needs Context**
+- Descriptive title (not just "Figure 1")
+- Axis labels and units
+- Source citation
+- Brief caption explaining the insight
+
+**Example:**
+✅ "Figure 3: Monthly Revenue Growth (2024-2025). Revenue increased 45% year-over-year, with Q4 showing the strongest growth."
+
+❌ "Figure 3: Revenue"
+
+**2. Design for Print**
+- High resolution (300 DPI minimum)
+- Readable when printed in grayscale
+- Sufficient font size (10pt minimum)
+- No interactive elements (obviously!)
+
+**3. Placement Guidelines**
+
+| Rule | Reason |
+|------|--------|
+| Place near related text | Easy reference |
+| Don't split across pages | Visual integrity |
+| Consistent sizing | Professional appearance |
+| White space around graphics | Readability |
+
+**4. Reference Charts in Text**
+Always mention figures in your narrative:
+- "As shown in Figure 2, sales peaked in December..."
+- "The correlation (see Figure 4) suggests..."
+
+**5. Chart Selection for Static Reports**
+
+| Works Well in Reports | Avoid in Reports |
+|----------------------|------------------|
+| Bar charts | Complex interactive charts |
+| Line charts | Animations |
+| Pie charts (limited) | Overly detailed maps |
+| Tables | Charts requiring zoom |
+| Simple scatter plots | 3D charts |
+
+**Caption Writing:**
+
+A good caption includes:
+1. Figure number
+2. Descriptive title
+3. Key insight or takeaway
+4. Data source (if not stated elsewhere)
+
+**Example:**
+"Figure 5: Customer Satisfaction Scores by Region (Q4 2025). The North region scored 15% higher than the company average, while the South region needs attention. Source: Customer Survey, n=2,500."
+                """,
+            "key_points": ["Every visualization needs context and caption", "Design for print (high resolution, grayscale-friendly)", "Reference all figures in the text", "Place visuals near related content"]
+        },
+        {
+            "title": "Universal Design and Accessibility",
+            "content": """
+**Creating Accessible Reports**
+
+Reports should be usable by everyone, including people with disabilities.
+
+**Universal Design Principles:**
+
+**1. Visual Accessibility**
+
+**Color:**
+- Don't rely solely on color to convey meaning
+- Ensure sufficient contrast (4.5:1 ratio)
+- Use colorblind-friendly palettes
+- Provide text alternatives
+
+**Fonts:**
+- Sans-serif fonts for screens (Arial, Calibri)
+- Minimum 11pt body text, 10pt for tables
+- Avoid all-caps for long text
+- Adequate line spacing (1.15-1.5)
+
+**2. Document Structure**
+- Use heading styles (not just bold text)
+- Logical heading hierarchy (H1 → H2 → H3)
+- Include table of contents for long documents
+- Number sections consistently
+
+**3. Table Accessibility**
+
+| Accessible | Not Accessible |
+|-----------|----------------|
+| Header row identified | No headers |
+| Simple structure | Merged cells |
+| Reading order clear | Complex nesting |
+| Alt text for table | No description |
+
+**4. Alternative Text for Images**
+- Describe what the image shows
+- Include key data points
+- Explain the insight
+- Keep under 125 characters
+
+**Good Alt Text:**
+"Bar chart showing Q4 sales by region: North $2.3M, South $1.8M, East $2.1M, West $1.5M. North leads by 28%."
+
+**5. Document Format**
+- Use accessible PDF settings
+- Include bookmarks for navigation
+- Tag document structure
+- Test with screen reader
+
+**Accessibility Checklist:**
+- ✓ Color contrast meets standards
+- ✓ All images have alt text
+- ✓ Tables have headers identified
+- ✓ Document uses heading styles
+- ✓ Links have descriptive text
+- ✓ Font size is readable
+- ✓ Content order is logical
+                """,
+            "key_points": ["Design for all users, including those with disabilities", "Use proper heading structure and document tags", "Provide alt text for all visuals", "Test accessibility before distribution"]
+        },
+        {
+            "title": "Report Tools and Distribution",
+            "content": """
+**Tools for Creating Reports**
+
+Different tools suit different needs and organizational contexts.
+
+**Common Report Tools:**
+
+| Tool | Best For | Pros | Cons |
+|------|----------|------|------|
+| **Microsoft Word** | Traditional reports | Universal, familiar | Manual formatting |
+| **Google Docs** | Collaborative work | Real-time collaboration | Limited offline |
+| **LaTeX** | Technical/academic | Professional typography | Steep learning curve |
+| **Jupyter/RMarkdown** | Reproducible reports | Code + narrative | Technical audience |
+| **Power BI/Tableau** | Dashboard reports | Interactive | Export limitations |
+
+**Word/Google Docs Tips:**
+- Use styles for consistency
+- Set up templates for repeated reports
+- Use section breaks for different headers/footers
+- Enable track changes for review
+
+**Distribution Formats:**
+
+| Format | When to Use |
+|--------|-------------|
+| **PDF** | Final distribution, archival |
+| **Word/Doc** | Collaborative editing |
+| **HTML** | Web publishing |
+| **Print** | Formal presentations |
+
+**Version Control:**
+- Include version number in filename
+- Date all versions: "Report_v2_2025-01-02.pdf"
+- Keep track of what changed
+- Archive final versions
+
+**Review Process:**
+
+Before distributing:
+1. **Self-review**: Read aloud, check for errors
+2. **Peer review**: Fresh eyes catch mistakes
+3. **Stakeholder preview**: Ensure alignment
+4. **Final proofread**: Spelling, formatting, links
+
+**Quality Checklist:**
+- ✓ Spelling and grammar checked
+- ✓ All figures numbered and referenced
+- ✓ Page numbers included
+- ✓ Headers/footers consistent
+- ✓ Links working
+- ✓ Data is current
+- ✓ Recommendations are clear
+- ✓ Executive summary matches content
+                """,
+            "key_points": ["Choose tools based on audience and collaboration needs", "Use templates for consistency", "Follow clear version control practices", "Always review before distribution"]
+        },
+        {
+            "title": "Ethical Report Writing",
+            "content": """
+**Ethics in Analysis Reporting**
+
+As a report writer, you have responsibility for how information is presented and interpreted.
+
+**Core Ethical Principles:**
+
+**1. Accuracy**
+- Report data truthfully
+- Don't cherry-pick favorable results
+- Acknowledge limitations and uncertainties
+- Correct errors promptly
+
+**2. Transparency**
+- Disclose methodology
+- Note data sources
+- Explain assumptions
+- Reveal conflicts of interest
+
+**3. Fairness**
+- Present balanced findings
+- Include context that might change interpretation
+- Consider multiple stakeholder perspectives
+- Don't misrepresent others' views
+
+**Common Ethical Pitfalls:**
+
+| Pitfall | Example | How to Avoid |
+|---------|---------|--------------|
+| Cherry-picking | Only showing favorable quarters | Show full time period |
+| Misleading visuals | Truncated axes | Follow visualization ethics |
+| Omitting context | "Sales up 50%!" (from very low base) | Provide absolute numbers too |
+| Overstating certainty | "This proves..." | Use appropriate hedging |
+| Burying bad news | Hiding problems in appendix | Address issues directly |
+
+**Client vs. Truth:**
+
+What if findings are unfavorable to the client?
+
+**Ethical approach:**
+1. Present findings accurately
+2. Provide context and explanation
+3. Suggest constructive next steps
+4. Never falsify or hide data
+
+**Handling Pressure:**
+- "Can you make these numbers look better?"
+- "Can we leave out this part?"
+- "The client won't like this finding"
+
+**Response:**
+- Explain why accuracy matters
+- Offer alternative framing (not falsification)
+- Escalate if pressured to be unethical
+- Document requests in writing
+
+**Attribution and Sources:**
+- Cite data sources properly
+- Credit others' work
+- Respect data privacy
+- Follow licensing requirements
+
+**The Golden Rule:**
+Would you be comfortable if your methodology and decisions were reviewed by a neutral third party? If not, reconsider your approach.
+                """,
+            "key_points": ["Report data accurately, even unfavorable findings", "Be transparent about methodology and limitations", "Don't mislead through omission or framing", "Maintain professional integrity under pressure"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Rewrite for Clarity",
+            "type": "practical",
+            "question": "Rewrite this sentence for a non-technical audience: 'The multivariate regression analysis yielded a statistically significant coefficient (β=0.43, p<0.01) for the marketing expenditure variable, indicating a positive relationship with sales outcomes.'",
+            "answer": "Clear version: 'Our analysis found that marketing spending has a strong positive effect on sales. For every additional $1,000 spent on marketing, sales increased by approximately $430. This relationship is statistically reliable.' Key improvements: 1) Removed jargon (multivariate regression, coefficient, β, p-value). 2) Explained what the numbers mean practically. 3) Used plain language. 4) Kept the essential insight while making it accessible.",
+            "hint": "Replace technical terms with plain language, and explain what the finding means for the business"
+        },
+        {
+            "title": "Structure an Executive Summary",
+            "type": "scenario",
+            "question": "You've completed an analysis showing that customer churn increased 25% last quarter, mainly due to slow support response times (average 4 hours vs. competitor's 30 minutes). You recommend investing $50K in a chat support system. Write bullet points for the executive summary.",
+            "answer": "Executive Summary bullet points: KEY FINDING: Customer churn increased 25% last quarter, costing an estimated $200K in lost annual revenue. ROOT CAUSE: Support response time (4 hours) is 8x slower than industry average (30 minutes). Analysis of 500 exit surveys found 'slow support' cited as primary reason by 67% of churned customers. RECOMMENDATION: Implement chat support system ($50K investment). Expected outcomes: Reduce response time to under 30 minutes, reduce churn by 15-20%, ROI within 4 months based on reduced customer loss. NEXT STEPS: Vendor selection and pilot program in Q2. Note: This structure gives busy executives: the problem, the cause, the solution, and expected results in under 100 words.",
+            "hint": "Include: the problem, the cause, the recommended solution, and expected outcomes"
+        },
+        {
+            "title": "Write Alt Text for a Chart",
+            "type": "practical",
+            "question": "Write appropriate alt text for a bar chart showing quarterly revenue: Q1 $1.2M, Q2 $1.4M, Q3 $1.8M, Q4 $2.1M. The chart highlights that Q4 was the highest.",
+            "answer": "Good alt text options: Option 1 (brief): 'Bar chart showing quarterly revenue growth: Q1 $1.2M, Q2 $1.4M, Q3 $1.8M, Q4 $2.1M. Q4 represents 75% growth from Q1.' Option 2 (detailed): 'Vertical bar chart displaying 2025 quarterly revenue. Revenue grew each quarter: Q1 at $1.2M, Q2 at $1.4M (17% increase), Q3 at $1.8M (29% increase), and Q4 reaching $2.1M (17% increase). Q4 is highlighted as the highest quarter, representing total annual growth of 75% from Q1 to Q4.' Key elements: Describes chart type, provides all data values, explains the key insight, quantifies the main finding.",
+            "hint": "Include the chart type, the data values, and the key insight someone should take away"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which section should you write LAST in a report?",
+            "options": ["Introduction", "Methodology", "Executive Summary", "Appendix"],
+            "correct": 2,
+            "explanation": "The Executive Summary should be written last because it summarizes the entire report. You can't summarize what you haven't written yet."
+        },
+        {
+            "question": "When writing for non-technical audiences, you should:",
+            "options": ["Use technical terms to show expertise", "Replace jargon with plain language", "Include all statistical details", "Avoid numbers entirely"],
+            "correct": 1,
+            "explanation": "Replace jargon with plain language. Technical terms create barriers. You can still include important numbers, but explain what they mean practically."
+        },
+        {
+            "question": "Alt text for images in reports should:",
+            "options": ["Just say 'Figure 1'", "Describe the visual and key insight", "Only be used for decorative images", "Repeat the caption exactly"],
+            "correct": 1,
+            "explanation": "Alt text should describe what the image shows and convey the key insight, making the content accessible to screen reader users and providing value if images don't load."
+        },
+        {
+            "question": "If your analysis findings are unfavorable to the client, you should:",
+            "options": ["Hide them in the appendix", "Present them accurately with context", "Change the numbers to be more positive", "Leave them out entirely"],
+            "correct": 1,
+            "explanation": "Present findings accurately with appropriate context. Hiding or falsifying results is unethical. You can frame findings constructively and suggest solutions."
+        },
+        {
+            "question": "The minimum font size recommended for body text in reports is:",
+            "options": ["8pt", "11pt", "14pt", "18pt"],
+            "correct": 1,
+            "explanation": "11pt is the recommended minimum for body text to ensure readability. Tables can go to 10pt, but anything smaller becomes difficult to read."
+        }
+    ]
+}
@@ -0,0 +1,344 @@
+"""Training Center content: Confidence Levels & Scenarios."""
+
+MODULE = {
+    "course": "Evaluation of Outcomes",
+    "description": "Learn to work with confidence levels and create multiple outcome scenarios for data-driven decision making.",
+    "lessons": [
+        {
+            "title": "Understanding Confidence Levels",
+            "content": """
+**Confidence Levels in Statistical Analysis**
+
+Confidence levels quantify our certainty about results and predictions.
+
+**What is a Confidence Level?**
+
+The probability that a confidence interval contains the true population value.
+
+| Confidence Level | Z-Score | Interpretation |
+|-----------------|---------|----------------|
+| 90% | 1.645 | 90% of similar intervals contain true value |
+| 95% | 1.960 | 95% of similar intervals contain true value |
+| 99% | 2.576 | 99% of similar intervals contain true value |
+
+**The Tradeoff:**
+
+```
+HIGHER CONFIDENCE
+─────────────────────────────────────
+           Certainty
+              ↑
+           99%|  ████████████████████  Wide interval
+              |                        (less precise)
+           95%|  ████████████████
+              |
+           90%|  ██████████████        Narrow interval
+              |                        (more precise)
+              └───────────────────→
+                      Width
+```
+
+**Calculating Confidence Intervals:**
+
+```
+CI = Point Estimate ± (Z × Standard Error)
+
+Example: Survey results
+Sample mean: 72%
+Standard error: 2%
+
+90% CI: 72% ± (1.645 × 2%) = 68.7% to 75.3%
+95% CI: 72% ± (1.960 × 2%) = 68.1% to 75.9%
+99% CI: 72% ± (2.576 × 2%) = 66.8% to 77.2%
+```
+
+**Choosing the Right Confidence Level:**
+
+| Situation | Recommended Level | Why |
+|-----------|------------------|-----|
+| **High-stakes decisions** | 99% | Minimize risk of wrong conclusion |
+| **Standard analysis** | 95% | Industry convention, good balance |
+| **Exploratory research** | 90% | Acceptable for initial findings |
+| **Life-critical** | 99.9%+ | Medical, safety applications |
+
+**Common Misinterpretation:**
+
+❌ "There's a 95% chance the true value is in this range"
+✅ "If we repeated this study 100 times, ~95 intervals would contain the true value"
+                """,
+            "key_points": ["Higher confidence = wider intervals", "95% is the standard convention", "Choose level based on decision stakes", "CI interpretation is about the method, not this specific interval"]
+        },
+        {
+            "title": "Building Probability Scenarios",
+            "content": """
+**Creating Multiple Outcome Scenarios**
+
+Scenarios help decision-makers understand the range of possible outcomes.
+
+**Scenario Framework:**
+
+| Scenario | Probability | Characteristics |
+|----------|-------------|-----------------|
+| **Best Case** | 10-15% | Everything goes right |
+| **Optimistic** | 20-25% | Most things go well |
+| **Base Case** | 50% | Expected outcome |
+| **Pessimistic** | 20-25% | Some challenges |
+| **Worst Case** | 10-15% | Major problems |
+
+**Building Scenarios from Data:**
+
+```
+REVENUE FORECAST SCENARIOS
+──────────────────────────────────────
+Based on historical data and model predictions:
+
+                    Revenue    Probability
+────────────────────────────────────────
+Worst Case          $800K        10%
+Pessimistic         $950K        20%
+Base Case         $1,100K        40%
+Optimistic        $1,250K        20%
+Best Case         $1,400K        10%
+────────────────────────────────────────
+Expected Value = Σ(Probability × Outcome)
+             = (0.1×800) + (0.2×950) + (0.4×1100) + (0.2×1250) + (0.1×1400)
+             = $1,090K
+```
+
+**Monte Carlo Simulation:**
+
+For complex scenarios with many variables:
+
+```
+STEPS:
+1. Define probability distributions for each variable
+2. Randomly sample from each distribution
+3. Calculate outcome for this combination
+4. Repeat 1000+ times
+5. Analyze distribution of outcomes
+
+Example: Profit Forecast
+├── Sales: Normal(1000, 100)
+├── Cost: Uniform(400, 500)
+└── Price: Triangular(45, 50, 60)
+
+After 10,000 simulations:
+Mean Profit: $52,000
+5th percentile: $38,000 (95% confidence lower bound)
+95th percentile: $67,000 (95% confidence upper bound)
+```
+
+**Sensitivity Analysis:**
+
+Which variables most impact outcomes?
+
+```
+TORNADO DIAGRAM
+─────────────────────────────────────
+Variable        Impact on Profit
+─────────────────────────────────────
+Sales Volume    ████████████████████  ±$25K
+Price           ██████████████        ±$18K
+Material Cost   █████████             ±$12K
+Labor Cost      ███████               ±$9K
+Marketing       ████                  ±$5K
+─────────────────────────────────────
+Focus on: Sales Volume and Price
+```
+                """,
+            "key_points": ["Use scenarios to show range of possibilities", "Expected value weights outcomes by probability", "Monte Carlo handles complex uncertainty", "Sensitivity analysis identifies key variables"]
+        },
+        {
+            "title": "Decision Making Under Uncertainty",
+            "content": """
+**Making Decisions with Incomplete Information**
+
+Most business decisions involve uncertainty. Here's how to navigate it.
+
+**Decision Framework with Confidence:**
+
+```
+1. IDENTIFY OPTIONS
+   What actions can we take?
+
+2. ESTIMATE OUTCOMES
+   What might happen with each option?
+   What's the confidence level?
+
+3. ASSESS PROBABILITIES
+   How likely is each outcome?
+
+4. EVALUATE EXPECTED VALUES
+   Expected Value = Σ(Probability × Outcome)
+
+5. CONSIDER RISK TOLERANCE
+   Can we afford the worst case?
+
+6. DECIDE AND DOCUMENT
+   Make choice, record reasoning
+```
+
+**Expected Value vs Risk Tolerance:**
+
+```
+Option A: 100% chance of $50,000
+Option B: 50% chance of $120,000, 50% chance of $0
+
+Expected Values:
+A: $50,000
+B: 0.5 × $120,000 + 0.5 × $0 = $60,000
+
+B has higher expected value, BUT:
+- If you can't afford to lose, choose A
+- If you can absorb the loss, B might be better
+```
+
+**Decision Trees with Probabilities:**
+
+```
+                    ┌── Success (70%): +$100K
+Launch New Model ───┤
+        │           └── Failure (30%): -$40K
+        │           EV = 0.7×100 + 0.3×(-40) = $58K
+        │
+        │           ┌── Market Grows (40%): +$30K
+Wait and See ───────┤
+                    └── Market Flat (60%): +$10K
+                    EV = 0.4×30 + 0.6×10 = $18K
+
+Decision: Launch (higher expected value)
+```
+
+**Communicating Uncertainty:**
+
+| Bad Communication | Better Communication |
+|------------------|---------------------|
+| "Revenue will be $1M" | "Revenue expected $900K-1.1M (95% CI)" |
+| "The model is accurate" | "Model accuracy: 87% ± 3%" |
+| "This will definitely work" | "70% confidence in success" |
+| "We'll probably hit target" | "65% probability of hitting Q4 target" |
+
+**Document Your Assumptions:**
+Always record:
+- What confidence level you used
+- What scenarios you considered
+- What you assumed about probabilities
+- What would change your decision
+                """,
+            "key_points": ["Expected value helps compare options", "Consider risk tolerance, not just expected value", "Decision trees visualize choices and outcomes", "Communicate uncertainty explicitly"]
+        },
+        {
+            "title": "Probability Bounds and Ranges",
+            "content": """
+**Setting Probability Bounds for Model Outcomes**
+
+Providing ranges instead of point estimates improves decision quality.
+
+**Types of Uncertainty Bounds:**
+
+| Type | Use Case | Example |
+|------|----------|---------|
+| **Confidence Interval** | Statistical uncertainty | Mean ± margin of error |
+| **Prediction Interval** | Individual prediction | Wider than CI |
+| **Credible Interval** | Bayesian analysis | Probability of parameter |
+| **Tolerance Interval** | Process variation | Captures X% of population |
+
+**Confidence vs Prediction Intervals:**
+
+```
+REGRESSION EXAMPLE
+─────────────────────────────────────
+Data: Marketing spend vs Sales
+
+Confidence Interval (95%):
+"Average sales at $50K marketing = $120K ± $8K"
+→ Uncertainty about the MEAN
+
+Prediction Interval (95%):
+"A specific company spending $50K = $120K ± $25K"
+→ Uncertainty about INDIVIDUAL outcome
+
+Prediction intervals are ALWAYS wider!
+```
+
+**Percentile Ranges:**
+
+```
+SALES FORECAST DISTRIBUTION
+─────────────────────────────────────
+    P10     P25    P50    P75    P90
+   (10%)   (25%)  (50%)  (75%)  (90%)
+     │       │      │      │      │
+    $80K   $95K  $110K  $125K  $140K
+     
+"50% chance sales between $95K-$125K (P25-P75)"
+"90% chance sales between $80K-$140K (P10-P90)"
+```
+
+**Communicating Ranges to Stakeholders:**
+
+**For Executives:**
+"We expect Q4 revenue of $2.1M, with 80% confidence between $1.9M and $2.3M"
+
+**For Operations:**
+"Daily transactions: expect 450, plan capacity for up to 600 (95th percentile)"
+
+**For Risk Management:**
+"Value at Risk (95%): Maximum single-day loss of $125K"
+
+**When to Use Each:**
+
+| Audience Needs | Provide |
+|---------------|---------|
+| Planning for average | Point estimate + confidence interval |
+| Planning for specific case | Prediction interval |
+| Capacity planning | Upper percentile (90th, 95th) |
+| Risk management | Lower percentile for upside, VaR for downside |
+| Scenario planning | Multiple percentile ranges |
+                """,
+            "key_points": ["Prediction intervals are wider than confidence intervals", "Use percentiles for capacity and risk planning", "Match the bound type to the decision need", "Always communicate the confidence level"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Create Outcome Scenarios",
+            "type": "practical",
+            "question": "Your sales forecast model predicts $500K revenue with standard error of $50K. Create 5 scenarios with probabilities and calculate expected value.",
+            "answer": "Using normal distribution principles: Worst Case ($350K, -3σ): 2% probability. Pessimistic ($400K, -2σ): 13% probability. Base Case ($500K, mean): 50% probability. Optimistic ($600K, +2σ): 13% probability. Best Case ($650K, +3σ): 2% probability. Note: Remaining 20% distributed around other outcomes. Expected Value calculation: (0.02 × 350) + (0.13 × 400) + (0.50 × 500) + (0.13 × 600) + (0.02 × 650) + (0.20 × 500) = 7 + 52 + 250 + 78 + 13 + 100 = $500K. The expected value equals the mean, as expected for a symmetric distribution. For planning, budget conservatively at $400K (pessimistic) while targeting $600K (optimistic).",
+            "hint": "Use standard deviations to define scenarios and normal distribution probabilities"
+        },
+        {
+            "title": "Choose Confidence Level",
+            "type": "scenario",
+            "question": "You're recommending a drug dosage algorithm for a hospital. What confidence level should you use and why? What if you were recommending a marketing email subject line instead?",
+            "answer": "Drug Dosage Algorithm: Use 99.9% or higher confidence level. Reasoning: 1) Patient safety is paramount - wrong dosage could be fatal. 2) False positives/negatives have severe consequences. 3) Medical standards require extremely high certainty. 4) Would need extensive clinical validation. 5) Consider prediction intervals, not just confidence intervals. Marketing Email Subject Line: 90-95% confidence is appropriate. Reasoning: 1) Low-stakes decision - worst case is slightly lower open rate. 2) Can easily A/B test and iterate. 3) Cost of being wrong is minimal. 4) Speed of decision may be more valuable than precision. 5) 90% allows faster conclusions with smaller sample sizes. The key principle: match confidence level to the consequences of being wrong.",
+            "hint": "Consider the consequences of being wrong in each situation"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "A 99% confidence interval is wider than a 95% interval because:",
+            "options": ["It uses more data", "Higher certainty requires more range", "The sample is larger", "The calculation is different"],
+            "correct": 1,
+            "explanation": "To be more confident that the true value is captured, the interval must be wider. There's a tradeoff between precision and confidence."
+        },
+        {
+            "question": "Expected value is calculated by:",
+            "options": ["Taking the average outcome", "Multiplying each outcome by its probability and summing", "Choosing the most likely outcome", "Subtracting worst from best case"],
+            "correct": 1,
+            "explanation": "Expected Value = Σ(Probability × Outcome). It weights each possible outcome by its likelihood."
+        },
+        {
+            "question": "A prediction interval is wider than a confidence interval because:",
+            "options": ["It uses less data", "It accounts for individual variation, not just mean uncertainty", "The formula is different", "It has lower confidence"],
+            "correct": 1,
+            "explanation": "Prediction intervals account for both uncertainty about the mean AND variation of individual observations around that mean."
+        },
+        {
+            "question": "For a life-critical medical decision, you should use:",
+            "options": ["90% confidence", "95% confidence", "99%+ confidence", "No confidence interval needed"],
+            "correct": 2,
+            "explanation": "Life-critical decisions require very high confidence levels (99% or higher) because the cost of being wrong is extremely high."
+        }
+    ]
+}
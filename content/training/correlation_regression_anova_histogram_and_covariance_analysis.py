@@ -0,0 +1,152 @@
+"""Training Center content: Correlation, regression, ANOVA, histogram and covariance analysis."""
+
+MODULE = {
+    "course": "Statistical Tools",
+    "description": "Learn essential statistical analysis techniques used in data analysis.",
+    "lessons": [
+        {
+            "title": "Understanding Correlation",
+            "content": """
+**Correlation** measures the relationship between two variables.
+
+**Correlation Coefficient (r):**
+- Ranges from -1 to +1
+- **+1**: Perfect positive correlation (as X increases, Y increases)
+- **0**: No correlation
+- **-1**: Perfect negative correlation (as X increases, Y decreases)
+
+**Interpreting Correlation:**
+- 0.7 to 1.0: Strong positive
+- 0.4 to 0.7: Moderate positive
+- 0.0 to 0.4: Weak or no correlation
+
+**Example:**
+Ice cream sales and temperature have a positive correlation (r ≈ 0.8).
+When temperature rises, ice cream sales rise too.
+
+**Important:** Correlation ≠ Causation!
+Just because two things correlate doesn't mean one causes the other.
+                """,
+            "key_points": ["Correlation ranges from -1 to +1", "Positive correlation = both increase together", "Correlation does not prove causation"]
+        },
+        {
+            "title": "Introduction to Regression",
+            "content": """
+**Regression** predicts one variable based on another.
+
+**Simple Linear Regression:**
+y = mx + b
+- y = predicted value
+- m = slope (how much y changes for each unit of x)
+- x = input value
+- b = y-intercept (value of y when x = 0)
+
+**Example:**
+Predicting sales based on advertising spend:
+Sales = 2.5 × Ad_Spend + 1000
+
+If you spend $500 on ads:
+Sales = 2.5 × 500 + 1000 = $2,250
+
+**R-squared (R²):**
+- Measures how well the regression fits the data
+- Ranges from 0 to 1
+- R² = 0.85 means 85% of variation is explained by the model
+                """,
+            "key_points": ["Regression predicts outcomes", "y = mx + b is the basic formula", "R² shows how good the prediction is"]
+        },
+        {
+            "title": "Histograms and Data Distribution",
+            "content": """
+**Histogram** is a chart showing how data is distributed across ranges (bins).
+
+**How to Read a Histogram:**
+- X-axis: Value ranges (bins)
+- Y-axis: Frequency (count)
+- Tall bars = many values in that range
+
+**Common Distribution Shapes:**
+- **Normal (Bell Curve)**: Most values in the middle
+- **Skewed Right**: Tail extends to the right
+- **Skewed Left**: Tail extends to the left
+- **Bimodal**: Two peaks
+
+**Example:**
+Employee salary histogram might show:
+- Most employees earn $40,000-$60,000
+- Few earn above $100,000
+- This is right-skewed (long tail toward high salaries)
+                """,
+            "key_points": ["Histograms show data distribution", "Normal distribution is bell-shaped", "Skewness shows data is not symmetric"]
+        },
+        {
+            "title": "ANOVA and Covariance Basics",
+            "content": """
+**ANOVA (Analysis of Variance)**
+Compares means across multiple groups to see if differences are significant.
+
+**When to Use ANOVA:**
+- Comparing sales across 3+ regions
+- Comparing test scores across different teaching methods
+- Comparing customer satisfaction across product lines
+
+**Example:**
+Testing if coffee brand affects taste ratings:
+- Brand A: average rating 4.2
+- Brand B: average rating 3.8
+- Brand C: average rating 4.5
+ANOVA tells you if these differences are statistically significant.
+
+**Covariance**
+Measures how two variables change together.
+- Positive covariance: both increase/decrease together
+- Negative covariance: one increases as other decreases
+- Similar to correlation but not standardized
+                """,
+            "key_points": ["ANOVA compares means across groups", "Use ANOVA for 3+ groups", "Covariance shows joint variability"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Interpret Correlation",
+            "type": "scenario",
+            "question": "A study finds correlation of r = 0.85 between study hours and exam scores. What does this mean?",
+            "answer": "This is a strong positive correlation. Students who study more hours tend to score higher on exams. However, this doesn't prove that studying causes higher scores - there could be other factors.",
+            "hint": "0.85 is close to 1, indicating a strong positive relationship"
+        },
+        {
+            "title": "Use Regression Formula",
+            "type": "practical",
+            "question": "A regression model shows: Revenue = 3 × Marketing_Spend + 5000. If you spend $2000 on marketing, what is the predicted revenue?",
+            "answer": "Revenue = 3 × 2000 + 5000 = 6000 + 5000 = $11,000. The predicted revenue is $11,000.",
+            "hint": "Substitute the marketing spend value into the formula"
+        },
+        {
+            "title": "Choose the Right Test",
+            "type": "scenario",
+            "question": "You want to compare customer satisfaction scores across 4 different store locations. Which statistical test should you use?",
+            "answer": "Use ANOVA (Analysis of Variance). ANOVA is designed to compare means across 3 or more groups, making it perfect for comparing satisfaction across 4 store locations.",
+            "hint": "You're comparing means across multiple groups"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "A correlation of r = -0.9 means:",
+            "options": ["Strong positive relationship", "No relationship", "Strong negative relationship", "Weak relationship"],
+            "correct": 2,
+            "explanation": "-0.9 is close to -1, indicating a strong negative relationship. As one variable increases, the other decreases."
+        },
+        {
+            "question": "In y = mx + b, what does 'm' represent?",
+            "options": ["Y-intercept", "Slope", "Correlation", "Mean"],
+            "correct": 1,
+            "explanation": "In the linear equation, m is the slope - it shows how much y changes for each unit increase in x."
+        },
+        {
+            "question": "When should you use ANOVA?",
+            "options": ["Comparing 2 groups", "Comparing 3+ groups", "Finding correlation", "Creating histograms"],
+            "correct": 1,
+            "explanation": "ANOVA is used to compare means across 3 or more groups. For 2 groups, you would use a t-test."
+        }
+    ]
+}
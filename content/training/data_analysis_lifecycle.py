@@ -0,0 +1,310 @@
+"""Training Center content: Data Analysis Lifecycle."""
+
+MODULE = {
+    "course": "Data Driven Decision-Making",
+    "description": "Learn the complete data analysis lifecycle from data collection to actionable insights and continuous improvement.",
+    "lessons": [
+        {
+            "title": "Overview: The Data Lifecycle",
+            "content": """
+**The Data Analysis Lifecycle**
+
+The data analysis lifecycle is a structured process that transforms raw data into actionable insights.
+
+**The 6 Stages:**
+```
+1. DEFINE → 2. COLLECT → 3. CLEAN → 4. ANALYZE → 5. INTERPRET → 6. ACT
+     ↑                                                              |
+     └──────────────────── ITERATE ←────────────────────────────────┘
+```
+
+**Stage Overview:**
+
+| Stage | Question | Output |
+|-------|----------|--------|
+| 1. Define | What problem are we solving? | Clear objectives, KPIs |
+| 2. Collect | Where is the data? | Raw datasets |
+| 3. Clean | Is the data reliable? | Clean, validated data |
+| 4. Analyze | What patterns exist? | Statistical findings |
+| 5. Interpret | What does it mean? | Insights and recommendations |
+| 6. Act | What do we do? | Decisions and actions |
+
+**Key Principle: ITERATION**
+The lifecycle is not linear - you often need to go back to previous stages:
+- Analysis reveals data quality issues → Return to Clean
+- Interpretation raises new questions → Return to Define
+- Actions create new data → Restart the cycle
+
+**Time Distribution (Typical):**
+- Define: 10%
+- Collect: 15%
+- **Clean: 40-60%** ← Most time-consuming!
+- Analyze: 15%
+- Interpret: 10%
+- Act: 5%
+                """,
+            "key_points": ["6 stages from Define to Act", "Cleaning takes most time (40-60%)", "Process is iterative, not linear", "Each stage has clear outputs"]
+        },
+        {
+            "title": "Stage 1: Define the Problem",
+            "content": """
+**Define: Setting Clear Objectives**
+
+The most critical stage - a poorly defined problem leads to useless analysis.
+
+**Key Activities:**
+1. **Identify the business problem**
+2. **Define success metrics (KPIs)**
+3. **Scope the project** (what's in/out)
+4. **Identify stakeholders**
+5. **Set timeline and resources**
+
+**SMART Goals Framework:**
+- **S**pecific: "Reduce customer churn" → "Reduce monthly churn rate"
+- **M**easurable: "Reduce from 5% to 3%"
+- **A**chievable: Based on benchmarks and resources
+- **R**elevant: Aligned with business strategy
+- **T**ime-bound: "Within Q2 2025"
+
+**Questions to Ask:**
+| Category | Questions |
+|----------|-----------|
+| Problem | What exactly are we trying to solve? |
+| Impact | Why does this matter? What's the cost of not solving it? |
+| Success | How will we measure success? What KPIs? |
+| Scope | What's included? What's explicitly excluded? |
+| Data | What data do we need? Do we have access? |
+| Timeline | When are results needed? |
+
+**Example - Well-Defined Problem:**
+
+❌ **Vague**: "We need to understand our customers better"
+
+✅ **Well-defined**: "Identify the top 3 factors that predict customer churn for our subscription service, measured by monthly churn rate reduction from 5% to 3%, to be completed by end of Q2 with findings presented to the retention team."
+
+**Output of Define Stage:**
+- Problem statement document
+- Success metrics and KPIs
+- Project scope and timeline
+- Data requirements list
+                """,
+            "key_points": ["Clear problem definition is critical", "Use SMART goals framework", "Define specific KPIs for success", "Document scope and constraints"]
+        },
+        {
+            "title": "Stage 2: Collect Data",
+            "content": """
+**Collect: Gathering the Right Data**
+
+Finding and acquiring data from various sources to answer your questions.
+
+**Data Source Types:**
+
+| Source Type | Examples | Pros | Cons |
+|-------------|----------|------|------|
+| **Internal** | CRM, ERP, databases | Trusted, accessible | May be incomplete |
+| **External** | Government data, APIs | Broader context | Quality varies |
+| **Primary** | Surveys, experiments | Tailored to needs | Time-consuming, costly |
+| **Secondary** | Reports, research | Already analyzed | May not fit exactly |
+
+**Common Data Collection Methods:**
+1. **Database queries** (SQL)
+2. **API connections** (automated data pulls)
+3. **Web scraping** (public websites)
+4. **Surveys/forms** (Google Forms, SurveyMonkey)
+5. **Manual data entry** (observations, logs)
+6. **File imports** (CSV, Excel from partners)
+
+**Data Quality Considerations:**
+When collecting, evaluate:
+- **Completeness**: Are there missing values?
+- **Accuracy**: Is the data correct?
+- **Timeliness**: How recent is it?
+- **Relevance**: Does it answer our questions?
+- **Consistency**: Same format across sources?
+
+**Ethical Considerations (GDPR):**
+- ✅ Only collect data you need (data minimization)
+- ✅ Get consent for personal data
+- ✅ Document data sources and permissions
+- ✅ Secure sensitive information
+- ❌ Don't collect data "just in case"
+
+**Example - Data Collection Plan:**
+
+| Data Needed | Source | Method | Owner | Timeline |
+|-------------|--------|--------|-------|----------|
+| Customer info | CRM | SQL query | Data team | Day 1-2 |
+| Transactions | ERP | API | IT | Day 2-3 |
+| Satisfaction | Survey | Google Forms | Marketing | Day 3-7 |
+| Industry benchmarks | External | Web research | Analyst | Day 5-7 |
+                """,
+            "key_points": ["Multiple source types: internal, external, primary, secondary", "Evaluate quality before using", "Follow GDPR and ethical guidelines", "Document sources and permissions"]
+        },
+        {
+            "title": "Stage 3: Clean the Data",
+            "content": """
+**Clean: Ensuring Data Quality**
+
+The most time-consuming stage - "garbage in, garbage out."
+
+**Common Data Quality Issues:**
+
+| Issue | Example | Solution |
+|-------|---------|----------|
+| Missing values | Empty cells | Delete, impute, or flag |
+| Duplicates | Same record twice | Remove duplicates |
+| Inconsistent formats | "USA", "U.S.A.", "United States" | Standardize |
+| Typos | "Jonh" instead of "John" | Correct or fuzzy match |
+| Outliers | Age = 200 | Investigate, cap, or remove |
+| Wrong data types | Numbers stored as text | Convert types |
+| Invalid values | Date = "32/13/2025" | Validate and correct |
+
+**Data Cleaning Steps:**
+1. **Explore** - Get overview of data structure and values
+2. **Validate** - Check for invalid or impossible values
+3. **Standardize** - Consistent formats, units, naming
+4. **Deduplicate** - Remove repeated records
+5. **Handle missing** - Delete, impute, or flag
+6. **Handle outliers** - Investigate before removing
+7. **Document** - Record all changes made
+
+**Handling Missing Data:**
+
+| Strategy | When to Use |
+|----------|-------------|
+| **Delete rows** | Few missing values, large dataset |
+| **Delete columns** | >50% missing in column |
+| **Impute with mean/median** | Numeric data, random missing |
+| **Impute with mode** | Categorical data |
+| **Flag as "Unknown"** | Missing has meaning |
+
+**Tools for Data Cleaning:**
+- Excel: Find/Replace, Remove Duplicates, TRIM(), CLEAN()
+- Power Query: Transform steps, replace values
+- Python: pandas library (dropna, fillna, replace)
+- SQL: UPDATE, CASE WHEN, string functions
+
+**Best Practice: Document Everything!**
+```
+Data Cleaning Log - Customer Data
+- Removed 145 duplicate records (same email)
+- Standardized country names (15 variations → 3)
+- Imputed 23 missing ages with median (34)
+- Flagged 5 outliers (age > 100) for review
+- Converted phone numbers to E.164 format
+```
+                """,
+            "key_points": ["Cleaning takes 40-60% of project time", "Common issues: missing, duplicates, inconsistencies", "Document all cleaning decisions", "Never assume data is clean"]
+        },
+        {
+            "title": "Stages 4-6: Analyze, Interpret, Act",
+            "content": """
+**Stage 4: ANALYZE - Finding Patterns**
+
+Apply statistical and analytical techniques to discover insights.
+
+**Analysis Techniques:**
+| Technique | Purpose | Example |
+|-----------|---------|---------|
+| Descriptive stats | Summarize data | Mean order value = $85 |
+| Correlation | Find relationships | Temperature ↔ Sales |
+| Regression | Predict outcomes | Price impact on demand |
+| Segmentation | Group similar items | Customer clusters |
+| Trend analysis | Track over time | Monthly growth rate |
+
+**Key Questions:**
+- What patterns emerge from the data?
+- Are there unexpected findings?
+- Do the numbers support or contradict our hypothesis?
+
+---
+
+**Stage 5: INTERPRET - Understanding Meaning**
+
+Translate analytical findings into business insights.
+
+**From Analysis to Insight:**
+| Analysis Finding | Business Interpretation |
+|-----------------|------------------------|
+| "r = 0.85 between ads and sales" | "Ad spending strongly drives sales; $1 spent returns ~$3.40" |
+| "Churn highest in month 3" | "Customers decide to stay/leave early; focus onboarding on first 90 days" |
+| "Segment A has 3x LTV of Segment B" | "Prioritize acquiring more Segment A customers in marketing" |
+
+**Avoiding Misinterpretation:**
+- ❌ Correlation ≠ Causation
+- ❌ Cherry-picking data that supports your view
+- ❌ Ignoring confidence intervals
+- ✅ Consider alternative explanations
+- ✅ Validate with domain experts
+
+---
+
+**Stage 6: ACT - Taking Action**
+
+Convert insights into decisions and monitor results.
+
+**Action Planning:**
+| Insight | Recommended Action | Owner | Timeline | Success Metric |
+|---------|-------------------|-------|----------|----------------|
+| 3-month churn spike | Redesign onboarding | Product | Q2 | -30% month-3 churn |
+| Segment A high value | Target ads to lookalikes | Marketing | Q2 | +20% Segment A acquisition |
+
+**After Acting:**
+1. Monitor KPIs for impact
+2. Compare actual vs. expected results
+3. Document learnings
+4. Start next iteration of the lifecycle
+                """,
+            "key_points": ["Analyze: Find patterns with statistics", "Interpret: Translate to business meaning", "Act: Make decisions and monitor", "Always iterate based on results"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Identify the Stage",
+            "type": "scenario",
+            "question": "You discover that 15% of your customer records have the country field as blank, while others have variations like 'USA', 'United States', and 'U.S.' What stage are you in and what should you do?",
+            "answer": "You are in the CLEAN stage. Actions: 1) Standardize country variations to one format (e.g., all 'USA'), 2) For blank countries, decide whether to impute based on other fields (phone area code, city) or flag as 'Unknown', 3) Document these decisions in your cleaning log, 4) Consider adding validation rules to prevent this in future data collection.",
+            "hint": "This involves data quality issues - which stage handles those?"
+        },
+        {
+            "title": "Write a Problem Statement",
+            "type": "practical",
+            "question": "A retail manager says: 'Our online sales seem low.' Transform this into a well-defined problem statement with SMART goals.",
+            "answer": "SMART Problem Statement: 'Identify the top 3 factors causing low online conversion rates (currently 1.2%, industry benchmark 2.5%) by analyzing website analytics, customer journey data, and competitor benchmarks. Success metric: Actionable recommendations that can increase conversion rate to 2.0% within 6 months. Timeline: Analysis complete within 4 weeks, presented to e-commerce team by [date].'",
+            "hint": "Use the SMART framework: Specific, Measurable, Achievable, Relevant, Time-bound"
+        },
+        {
+            "title": "Plan Data Collection",
+            "type": "practical",
+            "question": "You need to analyze why customer support calls have increased 40% this quarter. Create a data collection plan listing at least 4 data sources.",
+            "answer": "Data Collection Plan: 1) INTERNAL - Support ticket system: Extract all tickets from this quarter vs. previous (categories, resolution time, customer info), 2) INTERNAL - CRM: Customer details, product ownership, account history, 3) INTERNAL - Product/Engineering: Recent releases, known bugs, feature changes, 4) PRIMARY - Customer survey: Post-call satisfaction survey with open-ended feedback, 5) EXTERNAL - Social media: Mentions and complaints on Twitter/Facebook for sentiment analysis. Method: SQL queries for internal data, survey tool for primary, social listening tool for external.",
+            "hint": "Think about internal vs. external sources and what data would explain increased calls"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which stage typically takes the most time in the data analysis lifecycle?",
+            "options": ["Define", "Collect", "Clean", "Analyze"],
+            "correct": 2,
+            "explanation": "Data cleaning typically takes 40-60% of project time. Real-world data is messy and requires significant effort to prepare for analysis."
+        },
+        {
+            "question": "Which SMART criterion is missing? 'Increase sales next year'",
+            "options": ["Specific", "Measurable", "Achievable", "All of the above"],
+            "correct": 3,
+            "explanation": "This goal is vague. It should be: Specific (which product line?), Measurable (by how much?), Achievable (based on what?), and more Time-bound (Q1? Q4?)."
+        },
+        {
+            "question": "You find that 'correlation between ice cream sales and drowning deaths is 0.95.' The correct interpretation is:",
+            "options": ["Ice cream causes drowning", "We should ban ice cream sales", "Both are likely caused by a third factor (summer heat)", "This is statistically impossible"],
+            "correct": 2,
+            "explanation": "Correlation does not imply causation. Both ice cream sales and drowning increase in summer due to hot weather - a confounding variable."
+        },
+        {
+            "question": "When should you return to an earlier stage in the lifecycle?",
+            "options": ["Never - the lifecycle is strictly linear", "Only if the project fails", "Whenever new information suggests it's needed", "Only at management request"],
+            "correct": 2,
+            "explanation": "The lifecycle is iterative. You might return to Clean if analysis reveals data issues, or to Define if interpretation raises new questions."
+        }
+    ]
+}
@@ -0,0 +1,230 @@
+"""Training Center content: Data-Driven Case Studies."""
+
+MODULE = {
+    "course": "Data Driven Decision-Making",
+    "description": "Apply data-driven decision-making through real-world case studies with before-and-after scenarios.",
+    "lessons": [
+        {
+            "title": "Case Study: Retail Inventory Optimization",
+            "content": """
+**Company: MegaMart Retail Chain**
+**Problem: Stockouts and Overstock**
+
+**Before (Data-Free Decision Making):**
+- Store managers ordered inventory based on "gut feeling"
+- Frequent stockouts of popular items (lost sales)
+- Overstock of slow items (tied-up capital, markdowns)
+- Annual loss: $2.5M in stockouts + $1.8M in excess inventory
+
+**Data Analysis Approach:**
+
+**1. DEFINE:**
+"Optimize inventory levels to reduce stockouts by 50% and excess inventory by 40% within 12 months."
+
+**2. COLLECT:**
+- 3 years of sales data by product, store, date
+- Supplier lead times
+- Promotional calendars
+- Weather data
+- Local event schedules
+
+**3. ANALYZE:**
+| Finding | Insight |
+|---------|---------|
+| 80% of revenue from 15% of products | Focus on top SKUs first |
+| Sales spike 300% during local events | Align inventory with event calendar |
+| Rain increases umbrella sales 500% | Weather-based ordering |
+| Lead time varies 2-14 days by supplier | Buffer stock for slow suppliers |
+
+**4. PRESCRIPTIVE ACTION:**
+- Implemented automated reorder points based on demand forecasting
+- Created event-triggered ordering rules
+- Integrated weather forecast into daily orders
+
+**After (Data-Driven Results):**
+| Metric | Before | After | Improvement |
+|--------|--------|-------|-------------|
+| Stockout rate | 12% | 4% | -67% |
+| Excess inventory | $1.8M | $950K | -47% |
+| Lost sales | $2.5M | $800K | -68% |
+| Inventory turnover | 4x/year | 7x/year | +75% |
+
+**Total Annual Savings: $2.55M**
+                """,
+            "key_points": ["Data replaced gut-feeling decisions", "Combined multiple data sources", "Automated decision-making with rules", "Measurable ROI from analytics"]
+        },
+        {
+            "title": "Case Study: Healthcare Readmission Reduction",
+            "content": """
+**Organization: Regional Hospital Network**
+**Problem: High 30-Day Readmission Rates**
+
+**Before:**
+- 30-day readmission rate: 22% (national target: 15%)
+- Medicare penalties: $3.2M annually
+- Readmissions cost average $15,000 each
+- No systematic way to identify at-risk patients
+
+**Data Analysis Approach:**
+
+**1. DEFINE:**
+"Identify patients at high risk of 30-day readmission and create targeted interventions to reduce rate from 22% to 15% within 18 months."
+
+**2. COLLECT:**
+- 5 years of patient records (anonymized)
+- Diagnosis codes, procedures, medications
+- Length of stay, discharge disposition
+- Social factors (living alone, transport access)
+- Prior admissions history
+
+**3. ANALYZE - Key Predictors Found:**
+
+| Risk Factor | Impact on Readmission |
+|-------------|----------------------|
+| 3+ admissions in past year | 4.2x higher risk |
+| Lives alone, age 75+ | 2.8x higher risk |
+| Discharged Friday afternoon | 1.9x higher risk |
+| Heart failure + diabetes combo | 2.5x higher risk |
+| No follow-up scheduled | 2.1x higher risk |
+
+**4. PREDICTIVE MODEL:**
+Created a risk score (0-100) calculated at admission:
+- Score 0-30: Low risk (standard care)
+- Score 31-60: Medium risk (phone follow-up)
+- Score 61-100: High risk (intensive interventions)
+
+**5. PRESCRIPTIVE ACTIONS:**
+For high-risk patients:
+- Discharge planning starts Day 1
+- Social worker consultation
+- Schedule follow-up before discharge
+- Home health visit within 48 hours
+- Medication reconciliation call
+
+**After (Data-Driven Results):**
+| Metric | Before | After | Improvement |
+|--------|--------|-------|-------------|
+| 30-day readmission | 22% | 14.5% | -34% |
+| Medicare penalties | $3.2M | $0 | -100% |
+| Readmission costs | $8.2M | $5.1M | -38% |
+| Patient satisfaction | 72% | 84% | +12pts |
+
+**ROI:** Invested $800K in analytics program, saved $6.3M annually.
+                """,
+            "key_points": ["Predictive model identified at-risk patients", "Targeted interventions based on risk level", "Combined clinical and social data", "Massive ROI from prevented readmissions"]
+        },
+        {
+            "title": "Case Study: Marketing Campaign Optimization",
+            "content": """
+**Company: E-Commerce Fashion Retailer**
+**Problem: Inefficient Marketing Spend**
+
+**Before:**
+- Annual marketing budget: $5M
+- Spent equally across all channels
+- No attribution modeling
+- Overall ROAS (Return on Ad Spend): 2.5x
+- Many campaigns ran without performance tracking
+
+**Data Analysis Approach:**
+
+**1. DEFINE:**
+"Optimize marketing spend allocation to achieve ROAS of 4.0x while maintaining revenue, using data-driven attribution."
+
+**2. COLLECT:**
+- All ad platform data (Google, Meta, TikTok)
+- Website analytics (Google Analytics)
+- Customer purchase history
+- Email campaign performance
+- Customer surveys (how did you hear about us?)
+
+**3. ANALYZE - Channel Performance:**
+
+| Channel | Spend | Revenue | ROAS | Customer Type |
+|---------|-------|---------|------|---------------|
+| Google Search | $1M | $4.5M | 4.5x | High intent |
+| Meta Ads | $1.5M | $3M | 2.0x | Discovery |
+| TikTok | $800K | $1.2M | 1.5x | Young demo |
+| Email | $200K | $2.4M | 12x | Existing customers |
+| Display | $1M | $1.5M | 1.5x | Brand awareness |
+| Influencer | $500K | $800K | 1.6x | Mixed |
+
+**Key Insights:**
+- Email had highest ROAS but was underfunded
+- Display ads often credited with conversions actually started by search
+- TikTok reached new demographic not accessible elsewhere
+- Influencer ROI varied wildly (2 out of 20 drove 80% of results)
+
+**4. PRESCRIPTIVE RECOMMENDATIONS:**
+
+| Channel | Before | After | Rationale |
+|---------|--------|-------|-----------|
+| Email | $200K | $600K | Highest ROAS, expand segments |
+| Google Search | $1M | $1.5M | Proven high-intent performer |
+| Meta | $1.5M | $1.2M | Focus on lookalike audiences only |
+| Display | $1M | $400K | Reduce, use for retargeting only |
+| TikTok | $800K | $800K | Maintain for new customer acquisition |
+| Influencer | $500K | $500K | Focus on top 2 performers only |
+
+**After (Data-Driven Results):**
+| Metric | Before | After | Improvement |
+|--------|--------|-------|-------------|
+| Total Spend | $5M | $5M | Same |
+| Total Revenue | $12.5M | $19.8M | +58% |
+| ROAS | 2.5x | 3.96x | +58% |
+| New customers | 45K | 52K | +16% |
+| Email subscribers | 80K | 145K | +81% |
+                """,
+            "key_points": ["Attribution modeling revealed true channel value", "Reallocated budget without increasing total spend", "58% revenue increase with same budget", "Focused influencer spend on top performers"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Analyze the Case",
+            "type": "scenario",
+            "question": "In the MegaMart case, the team discovered that 80% of revenue came from 15% of products. What is this principle called, and how should it influence their analysis priority?",
+            "answer": "This is the Pareto Principle (80/20 rule). Influence on analysis: 1) Focus demand forecasting efforts on the top 15% of SKUs first - errors here have the biggest impact, 2) These products should have tighter safety stock and more frequent reorder monitoring, 3) The remaining 85% of products can use simpler forecasting methods, 4) When presenting to stakeholders, lead with insights about top products.",
+            "hint": "Think about the famous 80/20 principle and how to prioritize limited analytical resources"
+        },
+        {
+            "title": "Calculate ROI",
+            "type": "practical",
+            "question": "The hospital case invested $800K in their analytics program. They saved $6.3M annually. Calculate: 1) Simple ROI, 2) Payback period in months, 3) 3-year total value.",
+            "answer": "1) Simple ROI = (Savings - Investment) / Investment = ($6.3M - $0.8M) / $0.8M = 687.5% ROI in year 1. 2) Payback period = $800K / ($6.3M/12 months) = $800K / $525K per month = 1.52 months (about 6-7 weeks). 3) 3-year value = ($6.3M × 3) - $0.8M = $18.1M net value. Note: This assumes the $800K is a one-time investment; if there are annual operating costs, subtract those.",
+            "hint": "ROI = (Gain - Cost) / Cost. Payback = Investment / Monthly Savings."
+        },
+        {
+            "title": "Design Your Own Intervention",
+            "type": "practical",
+            "question": "A streaming service sees that 35% of free trial users cancel before converting to paid. Design a data-driven approach to reduce cancellations.",
+            "answer": "DEFINE: 'Increase free trial to paid conversion from 65% to 80% within 6 months.' COLLECT: User behavior logs (features used, videos watched, engagement time), demographics, signup source, device type, time to first content. ANALYZE: Look for patterns - maybe users who watch 5+ shows convert at 90% vs 40% for those watching 1-2. PREDICTIVE: Build model to identify users at risk of not converting by Day 7. PRESCRIPTIVE: For at-risk users: personalized content recommendations, mid-trial email highlighting popular shows, offer extended trial or discounted first month, in-app tips highlighting premium features. Monitor conversion rate and adjust interventions.",
+            "hint": "Follow the lifecycle: Define the goal with KPIs, collect relevant behavioral data, analyze patterns, then prescribe actions"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "In the MegaMart case, what was the total annual savings achieved?",
+            "options": ["$1.8M", "$2.5M", "$2.55M", "$4.3M"],
+            "correct": 2,
+            "explanation": "Total savings = Reduced lost sales ($2.5M - $0.8M = $1.7M) + Reduced excess inventory ($1.8M - $0.95M = $0.85M) = $2.55M"
+        },
+        {
+            "question": "The hospital's risk score model is an example of which analytics type?",
+            "options": ["Descriptive", "Diagnostic", "Predictive", "All of the above"],
+            "correct": 2,
+            "explanation": "The risk score (0-100) predicts which patients are likely to be readmitted. This is predictive analytics - forecasting future outcomes based on current data."
+        },
+        {
+            "question": "In the marketing case, which channel had the highest ROAS?",
+            "options": ["Google Search", "Meta Ads", "Email", "TikTok"],
+            "correct": 2,
+            "explanation": "Email had ROAS of 12x ($200K spend → $2.4M revenue), far exceeding other channels. This insight led to tripling the email budget."
+        },
+        {
+            "question": "What common theme appears across all three case studies?",
+            "options": ["They all used AI/machine learning", "They all measured ROI and documented improvements", "They all focused on customer acquisition", "They all had unlimited budgets"],
+            "correct": 1,
+            "explanation": "All cases defined clear metrics, measured before/after results, and documented improvements with specific numbers. This proves the value of data-driven approaches."
+        }
+    ]
+}
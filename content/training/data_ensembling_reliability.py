@@ -0,0 +1,371 @@
+"""Training Center content: Data Ensembling & Reliability."""
+
+MODULE = {
+    "course": "Evaluation of Outcomes",
+    "description": "Learn ensemble techniques to improve model reliability and result consistency.",
+    "lessons": [
+        {
+            "title": "Introduction to Ensemble Methods",
+            "content": """
+**Combining Models for Better Results**
+
+Ensemble methods combine multiple models to produce better predictions than any single model.
+
+**Why Ensembles Work:**
+
+| Problem | How Ensembles Help |
+|---------|-------------------|
+| Single model overfits | Different models overfit differently, averaging reduces it |
+| High variance | Averaging reduces variance |
+| Model uncertainty | Multiple models provide confidence bounds |
+| Missing patterns | Different models capture different patterns |
+
+**Main Ensemble Strategies:**
+
+```
+1. BAGGING (Bootstrap Aggregating)
+   ─────────────────────────────────────
+   Train multiple models on random subsets
+   Combine by averaging (regression) or voting (classification)
+   
+   Example: Random Forest
+   
+   Data → [Subset 1] → Model 1 ─┐
+       → [Subset 2] → Model 2 ──┼→ Average/Vote → Prediction
+       → [Subset 3] → Model 3 ─┘
+
+
+2. BOOSTING
+   ─────────────────────────────────────
+   Train models sequentially, each fixing previous errors
+   
+   Example: XGBoost, AdaBoost
+   
+   Data → Model 1 → Errors → Model 2 → Errors → Model 3
+                                                    ↓
+                                        Combined Prediction
+
+
+3. STACKING
+   ─────────────────────────────────────
+   Train diverse base models, then train a meta-model on their predictions
+   
+   Data → [Model A] → Pred A ─┐
+       → [Model B] → Pred B ──┼→ Meta-Model → Final Prediction
+       → [Model C] → Pred C ─┘
+```
+
+**When to Use Each:**
+
+| Method | Best For | Caution |
+|--------|----------|---------|
+| **Bagging** | High-variance models (decision trees) | Less effective for biased models |
+| **Boosting** | Weak learners, tabular data | Can overfit, slower training |
+| **Stacking** | Diverse model types | Complexity, risk of overfitting |
+                """,
+            "key_points": ["Ensembles combine multiple models for better results", "Bagging reduces variance through averaging", "Boosting reduces bias by focusing on errors", "Stacking uses a meta-model on base predictions"]
+        },
+        {
+            "title": "Improving Reliability with Ensembles",
+            "content": """
+**Using Ensembles for More Reliable Predictions**
+
+Beyond accuracy, ensembles improve prediction reliability and confidence.
+
+**Reliability Metrics:**
+
+| Metric | What It Measures |
+|--------|-----------------|
+| **Prediction variance** | How much predictions vary across models |
+| **Calibration** | Do probabilities match actual frequencies? |
+| **Consistency** | Same input → similar outputs over time |
+| **Robustness** | Performance on noisy or adversarial data |
+
+**Measuring Prediction Confidence:**
+
+```
+ENSEMBLE CONFIDENCE ESTIMATION
+─────────────────────────────────────
+For a single prediction, get outputs from all models:
+
+Model 1: 0.82  ─┐
+Model 2: 0.78   ├→ Mean: 0.81, Std: 0.04
+Model 3: 0.85  ─┘
+
+High agreement (low std) = High confidence
+Low agreement (high std) = Low confidence, flag for review
+```
+
+**Confidence-Based Actions:**
+
+| Prediction Std | Confidence | Action |
+|---------------|------------|--------|
+| < 0.05 | High | Automate decision |
+| 0.05 - 0.15 | Medium | Apply with monitoring |
+| > 0.15 | Low | Human review required |
+
+**Calibration Improvement:**
+
+```
+BEFORE CALIBRATION:
+Model says 70% → Actually 85% of the time
+Model says 90% → Actually 75% of the time
+
+CALIBRATION TECHNIQUES:
+1. Platt Scaling: Fit logistic regression on probabilities
+2. Isotonic Regression: Non-parametric calibration
+3. Temperature Scaling: Scale logits by learned temperature
+
+AFTER CALIBRATION:
+Model says 70% → Actually ~70% of the time
+Model says 90% → Actually ~90% of the time
+```
+
+**Reliability vs Accuracy Tradeoff:**
+
+Sometimes you can increase reliability by:
+- Abstaining on uncertain predictions
+- Using simpler, more stable models
+- Accepting slightly lower accuracy for more consistent results
+
+```
+ABSTENTION STRATEGY:
+If prediction confidence < threshold:
+    Return "Uncertain - requires human review"
+Else:
+    Return prediction
+
+This improves reliability of accepted predictions
+but reduces coverage (some cases not automated)
+```
+                """,
+            "key_points": ["Ensemble variance indicates prediction confidence", "Calibration aligns probabilities with reality", "Consider abstaining on low-confidence predictions", "Reliability sometimes trades off with accuracy"]
+        },
+        {
+            "title": "Practical Ensemble Implementation",
+            "content": """
+**Building Ensembles in Practice**
+
+Step-by-step approach to implementing ensemble methods.
+
+**Step 1: Select Diverse Base Models**
+
+```
+GOOD DIVERSITY (different error patterns):
+├── Linear model (captures linear relationships)
+├── Decision tree (captures non-linear, rules)
+├── Neural network (captures complex patterns)
+└── Nearest neighbors (captures local patterns)
+
+BAD DIVERSITY (similar errors):
+├── Random Forest
+├── Extra Trees
+├── Another Random Forest variant
+└── Decision Tree
+(All tree-based, similar biases)
+```
+
+**Step 2: Train Base Models**
+
+```
+# Pseudocode for bagging
+base_models = []
+for i in range(n_models):
+    sample = bootstrap_sample(training_data)
+    model = train_model(sample)
+    base_models.append(model)
+```
+
+**Step 3: Combine Predictions**
+
+| Task Type | Combination Method |
+|-----------|-------------------|
+| **Regression** | Mean, median, or weighted average |
+| **Classification** | Majority vote or average probabilities |
+| **Ranking** | Rank averaging or Borda count |
+
+```
+WEIGHTED AVERAGING
+─────────────────────────────────────
+Weight models by their validation performance:
+
+Model 1: Accuracy 0.85 → Weight 0.85/2.45 = 0.35
+Model 2: Accuracy 0.80 → Weight 0.80/2.45 = 0.33
+Model 3: Accuracy 0.80 → Weight 0.80/2.45 = 0.33
+
+Final = 0.35×Pred₁ + 0.33×Pred₂ + 0.33×Pred₃
+```
+
+**Step 4: Validate the Ensemble**
+
+```
+VALIDATION CHECKLIST
+☐ Ensemble beats best single model?
+☐ Ensemble variance is lower than individual?
+☐ Ensemble is well-calibrated?
+☐ Performance consistent across data splits?
+☐ Computational cost acceptable?
+```
+
+**Step 5: Monitor in Production**
+
+```
+ENSEMBLE MONITORING DASHBOARD
+─────────────────────────────────────
+Base Model Agreement:
+└── High agreement (>80%): 92% of predictions ✓
+└── Low agreement (<50%): 3% of predictions (flagged)
+
+Individual Model Health:
+├── Model 1: Active, 86% accuracy ✓
+├── Model 2: Active, 84% accuracy ✓
+└── Model 3: Degraded, 78% accuracy ⚠ (investigate)
+
+Ensemble Performance:
+└── Combined: 89% accuracy ✓
+```
+                """,
+            "key_points": ["Choose diverse model types for best ensembles", "Weight models by performance", "Validate ensemble against single models", "Monitor individual model health"]
+        },
+        {
+            "title": "Ensemble Techniques for Data Quality",
+            "content": """
+**Using Ensembles to Detect and Handle Data Issues**
+
+Ensembles can improve data reliability, not just model predictions.
+
+**Data Ensembling for Quality:**
+
+| Technique | Purpose |
+|-----------|---------|
+| **Multiple sources** | Cross-validate information |
+| **Imputation ensemble** | Better missing value estimates |
+| **Anomaly consensus** | More reliable outlier detection |
+| **Label aggregation** | Handle noisy labels |
+
+**Multi-Source Data Fusion:**
+
+```
+DATA SOURCE AGREEMENT
+─────────────────────────────────────
+Customer revenue from 3 sources:
+
+CRM: $125,000
+ERP: $127,500
+Reports: $124,800
+
+Agreement score: High (within 2%)
+→ Use average: $125,767
+
+If sources disagreed significantly:
+→ Flag for manual review
+→ Apply business rules to resolve
+```
+
+**Ensemble Imputation:**
+
+```
+MISSING VALUE: Customer age
+
+Method 1 (Mean): 42
+Method 2 (Median): 39
+Method 3 (KNN): 44
+Method 4 (Regression): 41
+
+Ensemble estimate: 41.5 (average)
+Uncertainty: ±2.2 (std dev)
+
+Flag if uncertainty > threshold
+```
+
+**Consensus Outlier Detection:**
+
+```
+OUTLIER DETECTION ENSEMBLE
+─────────────────────────────────────
+For each data point, run multiple detectors:
+
+Point X:
+├── Z-score: Normal
+├── IQR method: Normal
+├── Isolation Forest: Outlier
+└── LOF: Normal
+
+Consensus: 1/4 flagged → Likely normal
+
+Point Y:
+├── Z-score: Outlier
+├── IQR method: Outlier
+├── Isolation Forest: Outlier
+└── LOF: Normal
+
+Consensus: 3/4 flagged → Likely outlier, investigate
+```
+
+**Label Aggregation (Crowdsourcing):**
+
+When multiple labelers annotate data:
+
+```
+Sample #42 labels:
+├── Labeler A: Positive
+├── Labeler B: Positive
+├── Labeler C: Negative
+├── Labeler D: Positive
+└── Labeler E: Positive
+
+Majority vote: Positive (4/5)
+Agreement: 80% → High confidence
+
+Methods:
+1. Simple majority vote
+2. Weighted by labeler quality
+3. Dawid-Skene model (accounts for labeler bias)
+```
+                """,
+            "key_points": ["Combine multiple data sources for reliability", "Ensemble imputation provides uncertainty estimates", "Consensus improves outlier detection", "Aggregate labels from multiple annotators"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Design an Ensemble Strategy",
+            "type": "practical",
+            "question": "You're predicting customer lifetime value (CLV). Design an ensemble with 3 diverse models and explain how you'd combine them.",
+            "answer": "Ensemble Design: BASE MODELS: 1) Linear Regression - Captures linear relationships between features (recency, frequency, monetary) and CLV. Simple, interpretable baseline. 2) XGBoost - Captures non-linear relationships and feature interactions. Good for tabular data, handles missing values. 3) Neural Network (MLP) - Captures complex patterns, can learn from large datasets. Different optimization approach. COMBINATION: Use weighted averaging based on validation RMSE. Calculate weights as inverse of error: Weight_i = (1/RMSE_i) / Σ(1/RMSE_j). Example: If RMSE = [1000, 800, 900], weights ≈ [0.28, 0.35, 0.31]. CONFIDENCE: Report prediction ± (std across models). If std > 20% of prediction, flag for review. VALIDATION: Verify ensemble RMSE < best individual model RMSE.",
+            "hint": "Choose models that make different types of errors and decide how to weight their predictions"
+        },
+        {
+            "title": "Implement Consensus Outlier Detection",
+            "type": "scenario",
+            "question": "You have sales data and want to detect anomalies. Three methods flag the following records: Z-score flags: [5, 23, 47]. IQR flags: [5, 23, 89]. Isolation Forest flags: [5, 47, 102]. Which records should be investigated?",
+            "answer": "Consensus Analysis: Record 5: Flagged by ALL 3 methods (3/3) → HIGH PRIORITY. Definitely investigate - multiple independent methods agree. Record 23: Flagged by Z-score and IQR (2/3) → MEDIUM PRIORITY. Likely anomaly, worth investigating. Record 47: Flagged by Z-score and Isolation Forest (2/3) → MEDIUM PRIORITY. Worth investigating. Record 89: Flagged by IQR only (1/3) → LOW PRIORITY. Might be edge case for IQR method, less likely true anomaly. Record 102: Flagged by Isolation Forest only (1/3) → LOW PRIORITY. Single method disagreement. Investigation order: 5 → 23 → 47 → 89 → 102. Also consider: the methods that flagged it (Z-score sensitive to extremes, IQR to distribution, IF to isolation) give clues about the nature of the anomaly.",
+            "hint": "Count how many methods flagged each record and prioritize by consensus"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Bagging improves model performance primarily by:",
+            "options": ["Increasing bias", "Reducing variance", "Adding more features", "Using more data"],
+            "correct": 1,
+            "explanation": "Bagging (Bootstrap Aggregating) reduces variance by training on random subsets and averaging predictions, which smooths out overfitting."
+        },
+        {
+            "question": "In an ensemble, high prediction variance across models indicates:",
+            "options": ["The ensemble is working well", "Low confidence in the prediction", "The models are identical", "Perfect accuracy"],
+            "correct": 1,
+            "explanation": "High variance means the models disagree, indicating uncertainty. This is actually useful information for flagging cases needing review."
+        },
+        {
+            "question": "When building an ensemble, you should select models that are:",
+            "options": ["All the same type", "Diverse with different error patterns", "Only the most accurate", "Random selections"],
+            "correct": 1,
+            "explanation": "Diverse models that make different types of errors complement each other, so their combination performs better than any individual."
+        },
+        {
+            "question": "Boosting differs from bagging because it:",
+            "options": ["Uses random subsets", "Trains models sequentially to fix errors", "Only uses one model", "Ignores training data"],
+            "correct": 1,
+            "explanation": "Boosting trains models sequentially, with each new model focusing on the errors of previous models. Bagging trains in parallel on random subsets."
+        }
+    ]
+}
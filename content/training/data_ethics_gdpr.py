@@ -0,0 +1,235 @@
+"""Training Center content: Data Ethics & GDPR."""
+
+MODULE = {
+    "course": "Semester Project 1",
+    "description": "Understand ethical principles for data collection, storage, and use, including GDPR compliance.",
+    "lessons": [
+        {
+            "title": "Why Data Ethics Matters",
+            "content": """
+**The Importance of Ethical Data Practice**
+
+As a data analyst, you have access to sensitive information. With this access comes responsibility.
+
+**Real-World Consequences of Poor Data Ethics:**
+
+| Incident | What Happened | Consequence |
+|----------|--------------|-------------|
+| Cambridge Analytica | Used Facebook data without consent for political targeting | $5 billion fine, company dissolved |
+| Equifax Breach | Poor security exposed 147 million people's data | $700 million settlement, reputation destroyed |
+| Target Pregnancy | Predicted pregnancy from purchase data, exposed to family | Public backlash, privacy concerns |
+
+**Core Ethical Principles:**
+
+1. **Transparency**: Be honest about what data you collect and why
+2. **Consent**: Get permission before collecting personal data
+3. **Purpose Limitation**: Only use data for stated purposes
+4. **Data Minimization**: Collect only what you need
+5. **Accuracy**: Keep data correct and up-to-date
+6. **Security**: Protect data from unauthorized access
+7. **Accountability**: Take responsibility for data handling
+
+**Questions to Ask Yourself:**
+- Would I be comfortable if my data was used this way?
+- Would this be acceptable if it became public?
+- Am I respecting people's privacy and autonomy?
+- Could this analysis harm individuals or groups?
+- Is this use of data legal and compliant?
+
+**The "Front Page Test":**
+Before doing something with data, ask: "Would I be comfortable if this appeared on the front page of a newspaper?"
+                """,
+            "key_points": ["Data access comes with responsibility", "Poor ethics has real consequences", "Always consider the human impact", "Use the 'front page test'"]
+        },
+        {
+            "title": "GDPR Fundamentals",
+            "content": """
+**Understanding GDPR (General Data Protection Regulation)**
+
+GDPR is EU law that protects personal data. It applies to ANY organization handling EU residents' data.
+
+**Key GDPR Principles:**
+
+| Principle | Meaning | Your Action |
+|-----------|---------|-------------|
+| **Lawfulness** | Must have legal basis to process data | Document your legal basis |
+| **Purpose Limitation** | Only use for specified purposes | State purpose before collecting |
+| **Data Minimization** | Collect only what's necessary | Remove unnecessary fields |
+| **Accuracy** | Data must be correct | Validate and update regularly |
+| **Storage Limitation** | Don't keep longer than needed | Define retention periods |
+| **Security** | Protect against unauthorized access | Encrypt, secure access |
+| **Accountability** | Must prove compliance | Document everything |
+
+**What is Personal Data?**
+Any information relating to an identified or identifiable person:
+- ✅ Name, email, phone number
+- ✅ ID numbers (SSN, passport)
+- ✅ Location data
+- ✅ IP address
+- ✅ Photos, videos
+- ✅ Health, financial, genetic data (SPECIAL category - extra protection)
+
+**Legal Bases for Processing:**
+1. **Consent**: Person explicitly agrees
+2. **Contract**: Necessary to fulfill a contract
+3. **Legal Obligation**: Required by law
+4. **Vital Interests**: To protect someone's life
+5. **Public Task**: Official authority function
+6. **Legitimate Interest**: Balanced business need (most complex)
+
+**Individual Rights Under GDPR:**
+- Right to be informed (what data, why, how long)
+- Right of access (get copy of their data)
+- Right to rectification (correct errors)
+- Right to erasure ("right to be forgotten")
+- Right to restrict processing
+- Right to data portability
+- Right to object
+                """,
+            "key_points": ["GDPR applies to EU resident data globally", "Need legal basis to process personal data", "Individuals have strong rights over their data", "Document your compliance"]
+        },
+        {
+            "title": "Ethical Data Collection",
+            "content": """
+**Collecting Data the Right Way**
+
+Before collecting any data, follow these guidelines:
+
+**Before Collection Checklist:**
+- [ ] Do I have a clear, specific purpose?
+- [ ] Am I collecting only what I need? (minimization)
+- [ ] Do I have legal basis/consent?
+- [ ] Have I informed people about the collection?
+- [ ] Is my collection method secure?
+- [ ] Have I documented my approach?
+
+**Sources and Their Ethical Considerations:**
+
+| Source | Ethical Concerns | Best Practice |
+|--------|-----------------|---------------|
+| **Company databases** | Access rights, purpose limitation | Only access what you need for the task |
+| **Surveys** | Informed consent, voluntary participation | Clear purpose statement, opt-out option |
+| **Web scraping** | Terms of service, robots.txt | Check legality, respect restrictions |
+| **Social media** | Public vs private, context collapse | Consider user expectations |
+| **Third-party data** | Original consent, data quality | Verify source legitimacy and consent |
+| **Public datasets** | Anonymization, re-identification risk | Check license and privacy safeguards |
+
+**Informed Consent Essentials:**
+When collecting directly from people:
+1. Who you are (organization)
+2. What data you're collecting
+3. Why you need it (purpose)
+4. How long you'll keep it
+5. Who you'll share it with
+6. Their rights (access, delete, etc.)
+7. How to withdraw consent
+
+**Red Flags - When to Stop and Ask:**
+🚩 You don't have explicit permission
+🚩 Data seems too personal for the purpose
+🚩 You're not sure about the legal basis
+🚩 The collection method feels sneaky
+🚩 You can't explain why you need it
+                """,
+            "key_points": ["Always have a clear purpose before collecting", "Collect minimum necessary data", "Informed consent is essential", "When in doubt, stop and ask"]
+        },
+        {
+            "title": "Handling Sensitive Data",
+            "content": """
+**Working with Sensitive Information**
+
+Some data requires extra care due to potential for discrimination or harm.
+
+**Special Category Data (GDPR):**
+Requires explicit consent or special legal basis:
+- Racial or ethnic origin
+- Political opinions
+- Religious beliefs
+- Trade union membership
+- Genetic data
+- Biometric data
+- Health data
+- Sexual orientation
+
+**Sensitive Data Best Practices:**
+
+| Practice | How to Implement |
+|----------|-----------------|
+| **Anonymization** | Remove all identifying information |
+| **Pseudonymization** | Replace IDs with codes (can be reversed with key) |
+| **Encryption** | Encrypt data at rest and in transit |
+| **Access Control** | Limit who can see sensitive fields |
+| **Audit Logging** | Track who accessed what and when |
+| **Secure Deletion** | Properly destroy when no longer needed |
+
+**Anonymization Techniques:**
+- **Data masking**: Replace with fake but realistic values
+- **Generalization**: Use ranges instead of exact values (Age: 30-35)
+- **Suppression**: Remove fields entirely
+- **Noise addition**: Add random variation to values
+- **Aggregation**: Only report group-level statistics
+
+**Re-identification Risk:**
+Even "anonymized" data can sometimes identify individuals:
+- Netflix dataset + IMDB = identified users
+- Zip code + birth date + gender = 87% of US uniquely identified
+
+**Questions to Ask:**
+- Can this data identify anyone if combined with other sources?
+- Would individuals be surprised by this use of their data?
+- Could this analysis enable discrimination?
+- Is the minimum necessary data being used?
+                """,
+            "key_points": ["Special category data needs extra protection", "Anonymization is not always enough", "Consider re-identification risk", "Use encryption and access controls"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Identify Ethical Issues",
+            "type": "scenario",
+            "question": "Your company wants to analyze employee emails to predict which employees might quit. What ethical concerns should you raise?",
+            "answer": "Ethical concerns: 1) PRIVACY: Employees may not know their emails are monitored for this purpose - lack of transparency. 2) CONSENT: Did employees consent to this specific use? Agreeing to email monitoring for security is different from predictive analysis. 3) DISCRIMINATION: Model might unfairly flag people based on protected characteristics (parental status, health discussions). 4) TRUST: Even if legal, this erodes employee trust and workplace culture. 5) PURPOSE LIMITATION: Email data collected for communication, not retention prediction. RECOMMENDATION: If proceeding, use voluntary surveys with clear consent, aggregate data only, and involve HR/legal. Consider the 'front page test' - how would this look publicly?",
+            "hint": "Consider privacy, consent, potential for harm, and how employees would feel if they knew"
+        },
+        {
+            "title": "GDPR Compliance Check",
+            "type": "practical",
+            "question": "You're building a customer survey for a European company. List 5 things you must include to comply with GDPR.",
+            "answer": "GDPR compliance for survey: 1) IDENTITY: State who is collecting the data (company name and contact). 2) PURPOSE: Clearly explain why you're collecting responses and how they'll be used. 3) LEGAL BASIS: State your legal basis (likely consent for a survey). 4) RETENTION: Specify how long responses will be kept. 5) RIGHTS: Inform respondents of their rights (access, deletion, withdrawal). 6) CONSENT MECHANISM: Clear opt-in (no pre-ticked boxes), separate consent for different uses. 7) CONTACT: Provide way to contact data protection officer or make requests. 8) THIRD PARTIES: Disclose if data will be shared (analytics tools, etc.).",
+            "hint": "Think about what individuals need to know to make an informed choice about participating"
+        },
+        {
+            "title": "Anonymization Decision",
+            "type": "scenario",
+            "question": "You have customer data with: Name, Email, Age, City, Purchase History. You need to share analysis with a partner company. How would you anonymize it?",
+            "answer": "Anonymization approach: 1) REMOVE: Name and Email (direct identifiers) - delete entirely. 2) GENERALIZE: Age → Age bands (18-25, 26-35, etc.) to prevent exact matching. City → Region level if small city populations. 3) AGGREGATE: Purchase history → Categories and totals, not individual transactions. 4) ASSESS: Can someone re-identify with remaining data? If city is small and age range narrow, might need to generalize further. 5) TEST: Try to identify yourself in the anonymized data - if you can, others might too. 6) DOCUMENT: Record what was removed/changed and why. Consider if pseudonymization (using a code that maps back) is sufficient instead, with the mapping kept secure.",
+            "hint": "Consider both direct identifiers and combinations of fields that could identify someone"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which is NOT a GDPR principle?",
+            "options": ["Data minimization", "Purpose limitation", "Maximum data collection", "Storage limitation"],
+            "correct": 2,
+            "explanation": "GDPR requires data MINIMIZATION - collecting only what's necessary. Maximum data collection is the opposite of what GDPR requires."
+        },
+        {
+            "question": "Under GDPR, health data is classified as:",
+            "options": ["Standard personal data", "Special category data requiring extra protection", "Public data", "Not regulated"],
+            "correct": 1,
+            "explanation": "Health data is 'special category data' under GDPR, requiring explicit consent and additional protections due to its sensitive nature."
+        },
+        {
+            "question": "The 'right to be forgotten' means:",
+            "options": ["Forgetting user passwords", "Individuals can request deletion of their data", "Companies can forget compliance", "Data expires automatically"],
+            "correct": 1,
+            "explanation": "Under GDPR, individuals have the right to request erasure of their personal data ('right to be forgotten') when certain conditions apply."
+        },
+        {
+            "question": "Which technique replaces identifiers with codes that can be reversed with a key?",
+            "options": ["Anonymization", "Pseudonymization", "Encryption", "Aggregation"],
+            "correct": 1,
+            "explanation": "Pseudonymization replaces identifiers with artificial identifiers (codes). Unlike anonymization, the link can be restored with the key, so it's still personal data under GDPR."
+        }
+    ]
+}
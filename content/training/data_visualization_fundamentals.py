@@ -0,0 +1,358 @@
+"""Training Center content: Data Visualization Fundamentals."""
+
+MODULE = {
+    "course": "Data Visualisation",
+    "description": "Learn visualization techniques to present data findings effectively to both technical and non-technical audiences.",
+    "lessons": [
+        {
+            "title": "Introduction to Data Visualization",
+            "content": """
+**Why Data Visualization Matters**
+
+Data visualization transforms complex data into visual representations that are easy to understand at a glance.
+
+**Key Benefits:**
+- **Clarity**: Complex patterns become visible
+- **Speed**: Faster comprehension than reading tables
+- **Engagement**: Visual stories capture attention
+- **Accessibility**: Non-technical audiences can understand
+
+**The Visualization Process:**
+
+```
+1. UNDERSTAND the data and audience
+2. SELECT the right chart type
+3. DESIGN with clarity in mind
+4. REFINE based on feedback
+5. PRESENT with context
+```
+
+**Real-World Example:**
+A hospital reduced patient wait times by 30% after visualizing patient flow patterns on a dashboard. Staff could instantly see bottlenecks that were invisible in spreadsheets.
+
+**Types of Visualizations:**
+
+| Type | Purpose | Example |
+|------|---------|---------|
+| **Bar Chart** | Compare categories | Sales by product |
+| **Line Chart** | Show trends over time | Revenue growth |
+| **Pie Chart** | Show proportions | Market share |
+| **Scatter Plot** | Show relationships | Price vs. demand |
+| **Heatmap** | Show patterns in matrices | Website clicks |
+                """,
+            "key_points": ["Visualization makes data accessible", "Choose charts based on purpose", "Design for your audience", "Visual stories are more engaging"]
+        },
+        {
+            "title": "Choosing the Right Chart Type",
+            "content": """
+**Chart Selection Guide**
+
+The most common mistake in visualization is choosing the wrong chart type for your data and message.
+
+**Decision Framework:**
+
+**What are you trying to show?**
+
+| Goal | Best Charts |
+|------|-------------|
+| **Compare values** | Bar chart, Column chart |
+| **Show change over time** | Line chart, Area chart |
+| **Show parts of a whole** | Pie chart, Stacked bar |
+| **Show relationships** | Scatter plot, Bubble chart |
+| **Show distribution** | Histogram, Box plot |
+| **Show geographic data** | Map, Choropleth |
+
+**Common Mistakes:**
+
+❌ **Pie charts with too many slices** (max 5-7)
+❌ **3D charts** (distort perception)
+❌ **Dual y-axes** (confusing)
+❌ **Truncated axes** (misleading)
+❌ **Too many colors** (distracting)
+
+**Chart Selection Examples:**
+
+**Scenario 1:** "Compare Q1 revenue across 5 regions"
+→ Use: Horizontal bar chart (easy to read labels)
+
+**Scenario 2:** "Show website traffic trend over 12 months"
+→ Use: Line chart (shows continuous change)
+
+**Scenario 3:** "Show how budget is divided across departments"
+→ Use: Pie chart (if ≤5 categories) or stacked bar
+
+**Scenario 4:** "Explore relationship between ad spend and conversions"
+→ Use: Scatter plot (shows correlation)
+                """,
+            "key_points": ["Match chart type to your goal", "Avoid 3D and excessive decoration", "Limit pie charts to 5-7 slices", "Consider your audience's familiarity"]
+        },
+        {
+            "title": "Design Principles for Effective Visualizations",
+            "content": """
+**Universal Design Principles**
+
+Good visualization design follows principles that make information clear and accessible.
+
+**1. Simplicity (Data-Ink Ratio)**
+Maximize the data shown, minimize unnecessary decoration.
+
+| Good | Bad |
+|------|-----|
+| Clean gridlines | Heavy borders |
+| Direct labels | Legends requiring lookup |
+| White space | Crowded elements |
+| Essential data only | Decorative graphics |
+
+**2. Color Usage**
+
+**Do:**
+- Use color purposefully (highlight key data)
+- Maintain contrast for readability
+- Use colorblind-friendly palettes
+- Keep consistent meaning (red = bad, green = good)
+
+**Don't:**
+- Use more than 5-7 colors
+- Rely only on color to convey meaning
+- Use red/green as only differentiator
+
+**Colorblind-Safe Palettes:**
+- Blue and Orange
+- Blue and Yellow
+- Purple and Green
+
+**3. Typography**
+- Use readable fonts (sans-serif for screens)
+- Size hierarchy: Title > Subtitle > Labels > Annotations
+- Left-align text for readability
+
+**4. Layout and Hierarchy**
+- Place the most important information prominently
+- Use consistent alignment
+- Group related elements
+- Leave white space for breathing room
+
+**5. Accessibility Checklist:**
+- ✓ Sufficient color contrast
+- ✓ Text alternatives for complex charts
+- ✓ Clear titles and labels
+- ✓ Logical reading order
+                """,
+            "key_points": ["Simplicity beats decoration", "Use color purposefully and accessibly", "Maintain consistent design language", "Design for accessibility from the start"]
+        },
+        {
+            "title": "Telling Stories with Data",
+            "content": """
+**Data Storytelling**
+
+The best visualizations tell a story that leads to action.
+
+**Story Structure:**
+
+```
+SETUP      →  INSIGHT    →  ACTION
+What is?      What matters?  What now?
+```
+
+**Components of a Data Story:**
+
+1. **Context**: Why should the audience care?
+2. **Conflict/Tension**: What's the problem or opportunity?
+3. **Resolution**: What does the data reveal?
+4. **Call to Action**: What should happen next?
+
+**Example Data Story:**
+
+**Context:** "Our customer satisfaction scores have been declining."
+
+**Conflict:** "We analyzed 10,000 support tickets and found 60% mention 'wait time.'"
+
+**Resolution:** [Show chart] "Wait times over 5 minutes correlate with 3x more negative reviews."
+
+**Action:** "Investing in chat support could reduce wait times by 70% and recover our satisfaction scores."
+
+**Presentation Tips:**
+
+| Do | Don't |
+|-----|--------|
+| Start with the headline | Start with methodology |
+| Build to the insight | Show all data at once |
+| Use animation purposefully | Animate everything |
+| Pause for questions | Rush through slides |
+| Provide takeaway summary | End abruptly |
+
+**Slideshow Best Practices:**
+- One message per slide
+- Maximum 6 data points per chart
+- Include source citations
+- Number slides for reference
+- Provide handout with details
+                """,
+            "key_points": ["Lead with the insight, not the methodology", "Structure as setup → insight → action", "One message per visualization", "Always end with clear recommendations"]
+        },
+        {
+            "title": "Visualization Tools and Software",
+            "content": """
+**Common Visualization Tools**
+
+Different tools serve different purposes and skill levels.
+
+**Tool Comparison:**
+
+| Tool | Best For | Skill Level |
+|------|----------|-------------|
+| **Excel/Sheets** | Quick charts, basic dashboards | Beginner |
+| **Tableau** | Interactive dashboards, exploration | Intermediate |
+| **Power BI** | Microsoft integration, business dashboards | Intermediate |
+| **Python (matplotlib, seaborn)** | Custom visualizations, automation | Advanced |
+| **R (ggplot2)** | Statistical visualizations | Advanced |
+| **D3.js** | Web-based custom visualizations | Expert |
+
+**Excel/Google Sheets:**
+- Quick and accessible
+- Good for simple charts
+- Limited interactivity
+- Best for: Internal reports, quick analysis
+
+**Tableau:**
+- Drag-and-drop interface
+- Excellent for exploration
+- Interactive dashboards
+- Best for: Business analytics, presentations
+
+**Power BI:**
+- Strong Microsoft 365 integration
+- AI-powered insights
+- Good for enterprise
+- Best for: Corporate reporting, KPI dashboards
+
+**Python Libraries:**
+- matplotlib: Basic plotting
+- seaborn: Statistical visualizations
+- plotly: Interactive charts
+- Best for: Reproducible analysis, automation
+
+**Choosing Your Tool:**
+
+Ask yourself:
+1. What's my skill level?
+2. What's my audience expecting?
+3. Does it need to be interactive?
+4. Will I need to update it regularly?
+5. What tools does my organization use?
+                """,
+            "key_points": ["Match tool to skill level and need", "Excel works for quick, simple charts", "Tableau/Power BI for interactive dashboards", "Python for automation and reproducibility"]
+        },
+        {
+            "title": "Ethics in Data Visualization",
+            "content": """
+**Ethical Visualization Practices**
+
+Visualizations can mislead as easily as they inform. Ethical practice is essential.
+
+**Common Manipulation Techniques (To Avoid):**
+
+**1. Truncated Axes**
+Starting a y-axis at a non-zero value exaggerates differences.
+
+Example:
+- Misleading: Bar chart showing 98% vs 100% with y-axis starting at 95%
+- Honest: Same data with y-axis starting at 0%
+
+**2. Cherry-Picking Time Frames**
+Selecting dates that support your narrative.
+
+Example:
+- Misleading: "Sales doubled!" (comparing best month to worst)
+- Honest: Show full year with context
+
+**3. Missing Context**
+Omitting comparison data or baselines.
+
+Example:
+- Misleading: "Crime up 50%!" (without population growth context)
+- Honest: Show per-capita rates
+
+**4. Aspect Ratio Manipulation**
+Stretching charts to exaggerate or minimize trends.
+
+**Ethical Guidelines:**
+
+✓ Always start quantitative axes at zero (for bar charts)
+✓ Include data sources
+✓ Show uncertainty when relevant
+✓ Provide appropriate time context
+✓ Use consistent scales when comparing
+✓ Acknowledge limitations
+✓ Consider colorblind accessibility
+
+**Questions to Ask Before Publishing:**
+
+1. Does this accurately represent the data?
+2. Could someone reasonably misinterpret this?
+3. Am I being fair to all perspectives?
+4. Would I be comfortable if this were fact-checked?
+5. Does this serve the audience or my agenda?
+
+**Your Responsibility:**
+As a data analyst, you have power to influence decisions. Use visualization ethically to inform, not manipulate.
+                """,
+            "key_points": ["Avoid truncated axes and cherry-picked data", "Always provide context and sources", "Design for accurate interpretation", "Consider how visualizations might be misused"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Choose the Right Chart",
+            "type": "scenario",
+            "question": "You need to show how your company's market share has changed compared to 3 competitors over the past 5 years. What chart type would you use and why?",
+            "answer": "Best choice: Stacked area chart or multiple line chart. The stacked area shows how the whole market (100%) is divided among competitors over time, making it easy to see both individual changes and relative positions. Alternatively, a multi-line chart works if you want to emphasize individual company trajectories. Avoid: Pie charts (only show one point in time), bar charts (harder to see trends), 3D charts (distort perception).",
+            "hint": "Think about what you're showing: parts of a whole AND change over time"
+        },
+        {
+            "title": "Identify Visualization Problems",
+            "type": "practical",
+            "question": "A chart shows monthly revenue with a y-axis starting at $950,000 instead of $0. The bars show $950K, $975K, and $1M for three months. What's wrong with this visualization?",
+            "answer": "The truncated y-axis is misleading. By starting at $950K, the visual difference between bars is exaggerated. The $975K bar appears 50% taller than the $950K bar, when the actual difference is only 2.6% ($25K/$950K). The viewer's eye perceives much larger differences than exist in the data. Fix: Start the y-axis at $0, or use a different chart type (like a table with percentage change) if the small differences are truly significant.",
+            "hint": "Calculate the actual percentage difference vs. how different the bars appear"
+        },
+        {
+            "title": "Design for Accessibility",
+            "type": "practical",
+            "question": "Your dashboard uses red and green colors to show negative and positive values. A colleague mentions they're colorblind. How would you redesign this?",
+            "answer": "Redesign solutions: 1) Use colorblind-friendly palette: Blue for negative, Orange for positive (distinguishable by most colorblind people). 2) Add icons/symbols: ▼ for negative, ▲ for positive (not relying on color alone). 3) Use patterns: Solid fill for positive, hatched/striped for negative. 4) Add text labels: Include actual values and +/- signs. 5) Use saturation: Keep same hue but vary brightness. Best practice: Combine color WITH another indicator (shape, pattern, or label) so information isn't conveyed by color alone.",
+            "hint": "Don't rely solely on color to convey meaning - add redundant cues"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which chart is best for showing how a budget is divided among 5 departments?",
+            "options": ["Line chart", "Scatter plot", "Pie chart", "Histogram"],
+            "correct": 2,
+            "explanation": "A pie chart shows parts of a whole, perfect for showing how a budget is divided. With only 5 categories, it remains readable. For more categories, consider a bar chart."
+        },
+        {
+            "question": "What is wrong with starting a bar chart's y-axis at a non-zero value?",
+            "options": ["It saves space", "It exaggerates visual differences", "It's standard practice", "It helps with small values"],
+            "correct": 1,
+            "explanation": "Starting at non-zero exaggerates differences, making small changes look dramatic. This can mislead viewers about the magnitude of differences."
+        },
+        {
+            "question": "When presenting to executives, you should:",
+            "options": ["Show all your data and methodology first", "Lead with the key insight and recommendation", "Use as many charts as possible", "Avoid simplifying complex data"],
+            "correct": 1,
+            "explanation": "Executives want the bottom line first. Lead with the insight and recommendation, then provide supporting data if asked. Don't make them wait for the conclusion."
+        },
+        {
+            "question": "A colorblind-friendly visualization should:",
+            "options": ["Only use shades of gray", "Rely solely on red and green", "Use color AND another indicator like shapes", "Avoid all color"],
+            "correct": 2,
+            "explanation": "Best practice is to use color AND another indicator (shapes, patterns, labels) so meaning isn't conveyed by color alone. This helps everyone, not just colorblind users."
+        },
+        {
+            "question": "The 'data-ink ratio' principle suggests:",
+            "options": ["Use more ink for important data", "Maximize decoration to engage viewers", "Remove unnecessary visual elements", "Add borders around all elements"],
+            "correct": 2,
+            "explanation": "Data-ink ratio (from Edward Tufte) means maximizing the data shown while minimizing non-essential 'ink' (decorations, heavy gridlines, unnecessary borders)."
+        }
+    ]
+}
@@ -0,0 +1,298 @@
+"""Training Center content: Documentation & Presentation."""
+
+MODULE = {
+    "course": "Semester Project 1",
+    "description": "Master professional documentation and presentation skills for data analysis projects.",
+    "lessons": [
+        {
+            "title": "Writing the Analysis Report",
+            "content": """
+**Structure of a Professional Data Analysis Report**
+
+Your report tells the story of your analysis and provides a record for future reference.
+
+**Standard Report Structure:**
+
+```
+1. EXECUTIVE SUMMARY (1 page max)
+   - Key findings in bullet points
+   - Main recommendations
+   - Bottom line impact
+
+2. INTRODUCTION
+   - Problem statement
+   - Objectives
+   - Scope and limitations
+
+3. METHODOLOGY
+   - Data sources
+   - Cleaning steps taken
+   - Analysis techniques used
+
+4. FINDINGS
+   - Results with visualizations
+   - Key insights
+   - Statistical evidence
+
+5. RECOMMENDATIONS
+   - Actions to take
+   - Expected outcomes
+   - Implementation considerations
+
+6. APPENDIX
+   - Technical details
+   - Additional charts
+   - Data dictionary
+```
+
+**Writing Tips:**
+
+| Do | Don't |
+|----|-------|
+| Lead with the conclusion | Bury insights at the end |
+| Use bullet points for lists | Write long paragraphs |
+| Support claims with data | Make unsupported assertions |
+| Explain technical terms | Assume reader expertise |
+| Include visualizations | Use only text and tables |
+| Acknowledge limitations | Overstate certainty |
+
+**Executive Summary Formula:**
+1. **Situation**: What was the problem/question?
+2. **Findings**: What did we discover? (2-3 key points)
+3. **Implications**: Why does it matter?
+4. **Recommendations**: What should we do?
+
+**Example Executive Summary:**
+"This analysis investigated the 15% sales decline in Q1 2025. **Key findings:** (1) 80% of decline concentrated in the North region, (2) main driver was lost accounts to new competitor, (3) remaining customers are spending more per order. **Recommendation:** Launch targeted retention campaign in North region with estimated $200K recovery potential."
+                """,
+            "key_points": ["Lead with conclusions, not process", "Executive summary is most-read section", "Support every claim with evidence", "Keep it concise - respect reader's time"]
+        },
+        {
+            "title": "Creating Effective Visualizations",
+            "content": """
+**Visualization Best Practices for Reports**
+
+Charts should clarify, not confuse. Choose the right type for your message.
+
+**Chart Selection Guide:**
+
+| Message | Best Chart Type |
+|---------|-----------------|
+| Comparison across categories | Bar chart (horizontal for many categories) |
+| Trend over time | Line chart |
+| Part of whole | Pie chart (max 5-6 segments) or stacked bar |
+| Relationship between variables | Scatter plot |
+| Distribution | Histogram |
+| Geographic data | Map |
+| Multiple dimensions | Combo chart, small multiples |
+
+**Visual Design Rules:**
+
+**1. Declutter:**
+- Remove gridlines or make very light
+- Eliminate unnecessary borders
+- Don't use 3D effects (ever!)
+- Remove chart junk and decorations
+
+**2. Focus Attention:**
+- Highlight the key data point
+- Use color purposefully (gray for context, color for focus)
+- Add clear titles that state the insight
+
+**3. Make It Readable:**
+- Label axes clearly with units
+- Font size minimum 10pt for print, 18pt for presentations
+- Legend close to data (or label directly)
+- Sort bars by value (usually largest to smallest)
+
+**Title Examples:**
+
+❌ **Bad**: "Sales by Region"
+✅ **Good**: "North Region Sales Declined 20% While Others Grew"
+
+❌ **Bad**: "Customer Satisfaction Survey Results"
+✅ **Good**: "85% of Customers Rate Service 'Good' or 'Excellent'"
+
+**Color Guidelines:**
+- Use color consistently (same meaning throughout)
+- Avoid red/green only (colorblind accessibility)
+- Gray for context, 1-2 accent colors for key data
+- Match company brand colors when appropriate
+                """,
+            "key_points": ["Choose chart type based on message", "Declutter ruthlessly", "Title should state the insight", "Use color with purpose"]
+        },
+        {
+            "title": "Building Your Presentation",
+            "content": """
+**Presenting Data Findings to Stakeholders**
+
+Your presentation is often the only thing stakeholders see. Make it count.
+
+**Presentation Structure (15-20 minutes):**
+
+```
+1. OPENING (2 min)
+   - The question we answered
+   - Why it matters
+   
+2. KEY FINDINGS (8-10 min)
+   - Finding 1 + supporting visual
+   - Finding 2 + supporting visual
+   - Finding 3 + supporting visual
+   
+3. RECOMMENDATIONS (3-4 min)
+   - What should we do?
+   - Expected impact
+   
+4. NEXT STEPS (2 min)
+   - Immediate actions
+   - Open questions for discussion
+```
+
+**Slide Design Rules:**
+
+| Rule | Why |
+|------|-----|
+| One idea per slide | Prevents overwhelm |
+| Maximum 5 bullet points | Easy to scan |
+| Maximum 5 words per bullet | Prevents reading slides |
+| Large font (24pt minimum) | Readability from back of room |
+| High contrast | Visibility on projectors |
+| Image/chart > text | Visual memory is stronger |
+
+**Handling Data in Presentations:**
+
+**❌ Don't:**
+- Show complex tables with many rows
+- Include all the data
+- Use tiny fonts to fit everything
+- Read numbers aloud from slides
+
+**✅ Do:**
+- Highlight key numbers in large font
+- Round numbers (say "about 85%" not "84.7%")
+- Use visuals to show patterns
+- Provide detailed tables in appendix/handout
+
+**Preparing for Q&A:**
+1. Anticipate questions (especially "why?" and "how confident?")
+2. Prepare backup slides with details
+3. Know your data source and methodology
+4. It's OK to say "I'll follow up on that"
+5. Listen fully before answering
+                """,
+            "key_points": ["Structure: Opening, Findings, Recommendations, Next Steps", "One idea per slide", "Round numbers for speaking", "Prepare for likely questions"]
+        },
+        {
+            "title": "The Reflection Report",
+            "content": """
+**Writing Your Individual Reflection**
+
+A reflection report documents your learning journey and personal growth during the project.
+
+**Purpose of Reflection:**
+- Consolidate what you learned
+- Identify areas for improvement
+- Demonstrate critical thinking
+- Build portfolio of experiences
+
+**Reflection Structure:**
+
+```
+1. PROJECT OVERVIEW
+   - Brief description of what you did
+   - Your role and responsibilities
+
+2. WHAT WENT WELL
+   - Successful approaches
+   - Skills you applied effectively
+   - Challenges you overcame
+
+3. WHAT COULD BE IMPROVED
+   - Difficulties encountered
+   - Mistakes made and lessons learned
+   - What you would do differently
+
+4. SKILLS DEVELOPED
+   - Technical skills gained
+   - Soft skills practiced
+   - Knowledge areas expanded
+
+5. FUTURE APPLICATION
+   - How you'll apply learnings
+   - Goals for continued development
+```
+
+**Reflection Prompts:**
+
+| Area | Questions to Consider |
+|------|----------------------|
+| Process | What worked? What didn't? Why? |
+| Technical | What new tools/techniques did you learn? |
+| Collaboration | How did you work with others? |
+| Time Management | Did you meet deadlines? Why/why not? |
+| Problem-Solving | What unexpected issues arose? How did you handle them? |
+| Growth | How have you improved from the start? |
+
+**Writing Tips:**
+- Be honest about challenges (this shows maturity)
+- Give specific examples, not vague statements
+- Connect learning to future goals
+- Show self-awareness and critical thinking
+
+**Example Excerpt:**
+"I initially underestimated data cleaning time, allocating only 2 days when it ultimately took 5. This compressed my analysis phase and forced me to simplify my approach. In future projects, I'll add 50% buffer to cleaning estimates and do a quick data quality assessment before planning the timeline."
+                """,
+            "key_points": ["Reflection shows learning and maturity", "Be honest about challenges", "Give specific examples", "Connect to future improvement"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Write an Executive Summary",
+            "type": "practical",
+            "question": "Your analysis found: 1) Customer churn increased from 5% to 8% this quarter, 2) Main cause is price increase, 3) Competitor is offering 15% lower prices, 4) Loyal customers (2+ years) churned less. Write a 4-sentence executive summary.",
+            "answer": "This analysis investigated the 60% increase in customer churn (5% to 8%) this quarter. Key findings: (1) Price-sensitive customers are leaving for a competitor offering 15% lower rates, while (2) long-term customers (2+ years) remain loyal with only 3% churn. The estimated revenue impact is $120K annually if trends continue. Recommendation: Implement tiered pricing with loyalty discounts for customers approaching the 2-year mark, and consider a targeted win-back campaign for recently churned price-sensitive segments.",
+            "hint": "Follow: Situation → Findings → Implication → Recommendation"
+        },
+        {
+            "title": "Fix the Slide",
+            "type": "scenario",
+            "question": "A slide has: Title 'Q1 Results', 12 bullet points of text in 10pt font, a complex table with 15 rows and 8 columns, and no visualization. What's wrong and how would you fix it?",
+            "answer": "Problems: 1) Vague title that doesn't state insight, 2) Too many bullets (max 5), 3) Font too small (need 24pt+), 4) Complex table unreadable in presentation, 5) No visualization to tell the story. Fixes: 1) Retitle to the main finding: 'Q1 Revenue Up 12%, Driven by New Product Line', 2) Keep only 3-4 key bullet points, 3) Increase font to minimum 24pt, 4) Replace table with a bar or line chart showing the key comparison, 5) Move detailed table to appendix or handout, 6) Add one clear visualization that supports the title claim.",
+            "hint": "Think about what someone can actually read and absorb during a presentation"
+        },
+        {
+            "title": "Reflect on a Challenge",
+            "type": "practical",
+            "question": "Write a reflection paragraph about a time you struggled with messy data. Include: what happened, how you felt, what you did, and what you learned.",
+            "answer": "Sample reflection: During my sales analysis project, I received customer data with over 40% missing values in key fields. Initially, I felt frustrated and considered asking for better data, which would have delayed the project by weeks. Instead, I researched imputation techniques and decided to use median imputation for numeric fields and 'Unknown' categories for text fields, documenting each decision. I learned that perfect data rarely exists in the real world, and developing strategies to work with imperfect data is a core analyst skill. I also learned to do a data quality assessment at the project start so I can plan appropriately. Going forward, I'll always request a sample of data before committing to timelines.",
+            "hint": "Be specific about the situation, your response, and the concrete lesson learned"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "What should the first page of an analysis report typically be?",
+            "options": ["Methodology", "Data sources", "Executive summary", "Table of contents"],
+            "correct": 2,
+            "explanation": "The executive summary should be first - it's the most-read section and gives busy stakeholders the key takeaways immediately."
+        },
+        {
+            "question": "A good chart title should:",
+            "options": ["Describe the chart type", "State the key insight", "List the data source", "Be as short as possible"],
+            "correct": 1,
+            "explanation": "A good chart title states the insight ('Sales Grew 20% in Q4') rather than just describing what the chart shows ('Quarterly Sales')."
+        },
+        {
+            "question": "What is the maximum recommended number of bullet points per slide?",
+            "options": ["3", "5", "8", "10"],
+            "correct": 1,
+            "explanation": "Maximum 5 bullet points per slide keeps content scannable. More than that overwhelms the audience."
+        },
+        {
+            "question": "In a reflection report, you should:",
+            "options": ["Only discuss successes", "Be honest about challenges and mistakes", "Blame external factors for problems", "Keep it as short as possible"],
+            "correct": 1,
+            "explanation": "Being honest about challenges and mistakes shows maturity and self-awareness. The goal is to demonstrate learning, not perfection."
+        }
+    ]
+}
@@ -0,0 +1,436 @@
+"""Training Center content: ETL & Version Control."""
+
+MODULE = {
+    "course": "Evaluation of Outcomes",
+    "description": "Understand ETL systems and version control practices for collaborative data analysis.",
+    "lessons": [
+        {
+            "title": "ETL in the Data Lifecycle",
+            "content": """
+**Understanding Extract, Transform, Load (ETL)**
+
+ETL is the backbone of data analysis, moving data from sources to analysis-ready formats.
+
+**ETL Components:**
+
+```
+┌──────────┐    ┌──────────────┐    ┌──────────┐
+│ EXTRACT  │ →  │  TRANSFORM   │ →  │   LOAD   │
+│          │    │              │    │          │
+│ Sources: │    │ Clean        │    │ Targets: │
+│ -Database│    │ Validate     │    │ -DW      │
+│ -API     │    │ Aggregate    │    │ -Lake    │
+│ -Files   │    │ Join         │    │ -Mart    │
+│ -Streams │    │ Calculate    │    │ -Cache   │
+└──────────┘    └──────────────┘    └──────────┘
+```
+
+**Extract Phase:**
+
+| Source Type | Considerations |
+|-------------|---------------|
+| **Databases** | Query optimization, connection limits |
+| **APIs** | Rate limits, authentication, pagination |
+| **Files** | Format parsing, encoding issues |
+| **Streams** | Real-time vs batch, ordering |
+
+**Transform Phase:**
+
+```
+COMMON TRANSFORMATIONS
+─────────────────────────────────────
+1. Cleaning
+   └── Handle nulls, fix formats, remove duplicates
+
+2. Standardization
+   └── Consistent naming, units, date formats
+
+3. Validation
+   └── Check ranges, business rules, integrity
+
+4. Aggregation
+   └── Sum, count, average by dimensions
+
+5. Enrichment
+   └── Add calculated fields, join reference data
+
+6. Type Conversion
+   └── Cast strings to dates, numbers, etc.
+```
+
+**Load Phase:**
+
+| Load Type | Use Case | Frequency |
+|-----------|----------|-----------|
+| **Full load** | Initial load, small datasets | Daily/weekly |
+| **Incremental** | Large datasets, frequent updates | Hourly/daily |
+| **Streaming** | Real-time requirements | Continuous |
+| **Merge (upsert)** | Update existing + insert new | As needed |
+
+**ETL vs ELT:**
+
+```
+ETL (Traditional):
+Source → Transform → Load to Target
+- Transform before loading
+- Good for structured data
+- Transform logic in ETL tool
+
+ELT (Modern):
+Source → Load to Target → Transform
+- Load raw data first
+- Transform in the data warehouse
+- Uses DW computing power
+- Good for big data
+```
+                """,
+            "key_points": ["ETL: Extract, Transform, Load", "Transform includes cleaning, validation, aggregation", "Choose load strategy based on data size and frequency", "ELT loads first, transforms in the warehouse"]
+        },
+        {
+            "title": "Data Pipeline Design",
+            "content": """
+**Building Reliable Data Pipelines**
+
+A well-designed pipeline ensures consistent, reliable data for analysis.
+
+**Pipeline Architecture:**
+
+```
+MODERN DATA PIPELINE
+─────────────────────────────────────
+                                 ┌──→ Analytics
+Sources                          │
+   ↓                             │
+[Ingestion] → [Storage] → [Processing] → Dashboards
+                                 │
+Raw Zone    Staging    Transform └──→ ML Models
+   ↓           ↓          ↓
+Landing    Cleaned    Aggregated
+```
+
+**Pipeline Components:**
+
+| Component | Purpose | Tools |
+|-----------|---------|-------|
+| **Scheduler** | Trigger jobs at right time | Airflow, Cron |
+| **Orchestrator** | Manage job dependencies | Airflow, Prefect |
+| **Queue** | Handle async processing | Kafka, RabbitMQ |
+| **Monitoring** | Track health and failures | Grafana, DataDog |
+| **Alerting** | Notify on issues | PagerDuty, Slack |
+
+**Pipeline Patterns:**
+
+```
+1. BATCH PROCESSING
+   ─────────────────────────────
+   Run at scheduled intervals
+   Process all data since last run
+   Good for: Daily reports, aggregations
+   
+   [Schedule: Daily 2am] → Process yesterday's data
+
+2. MICRO-BATCH
+   ─────────────────────────────
+   Small batches every few minutes
+   Balance latency and efficiency
+   Good for: Near-real-time dashboards
+   
+   [Schedule: Every 5 min] → Process latest chunk
+
+3. STREAMING
+   ─────────────────────────────
+   Continuous processing
+   Event-driven
+   Good for: Real-time analytics, alerts
+   
+   [Event arrives] → Process immediately
+```
+
+**Error Handling:**
+
+```
+PIPELINE ERROR STRATEGY
+─────────────────────────────────────
+1. Retry with backoff
+   Try again after: 1min, 5min, 30min
+
+2. Dead letter queue
+   Failed records go to separate queue for review
+
+3. Partial success
+   Continue with valid data, log failures
+
+4. Circuit breaker
+   Stop processing if failure rate too high
+
+5. Alerting
+   Notify team of critical failures
+```
+
+**Pipeline Best Practices:**
+- Idempotent operations (re-running produces same result)
+- Checkpointing (save progress, resume on failure)
+- Data lineage tracking (know where data came from)
+- Quality checks at each stage
+                """,
+            "key_points": ["Design for reliability with retry and error handling", "Choose batch vs streaming based on latency needs", "Make pipelines idempotent for safe reruns", "Track data lineage for debugging"]
+        },
+        {
+            "title": "Version Control for Data Projects",
+            "content": """
+**Managing Changes in Collaborative Data Work**
+
+Version control tracks changes, enables collaboration, and provides rollback capability.
+
+**What to Version Control:**
+
+| Asset | Version Control? | How |
+|-------|-----------------|-----|
+| **Code** | Yes | Git |
+| **Model files** | Yes | Git LFS, DVC |
+| **Configurations** | Yes | Git |
+| **Small datasets** | Maybe | Git (if < 100MB) |
+| **Large datasets** | Track separately | DVC, data catalogs |
+| **Documentation** | Yes | Git |
+| **Results/outputs** | Maybe | Depends on reproducibility |
+
+**Git Basics for Data Projects:**
+
+```
+ESSENTIAL GIT WORKFLOW
+─────────────────────────────────────
+1. Clone repository
+   git clone <repo-url>
+
+2. Create feature branch
+   git checkout -b feature/new-model
+
+3. Make changes and commit
+   git add .
+   git commit -m "Add churn prediction model v2"
+
+4. Push to remote
+   git push origin feature/new-model
+
+5. Create pull request for review
+
+6. Merge after approval
+   git checkout main
+   git merge feature/new-model
+```
+
+**Commit Message Best Practices:**
+
+```
+GOOD COMMIT MESSAGES
+─────────────────────────────────────
+Format: <type>: <subject>
+
+feat: Add customer segmentation model
+fix: Correct date parsing in ETL pipeline
+docs: Update model documentation
+refactor: Simplify feature engineering code
+test: Add unit tests for data validation
+data: Update training dataset to Q4 2025
+
+Include:
+- What changed
+- Why it changed
+- Any breaking changes
+```
+
+**Branching Strategy:**
+
+```
+GITFLOW FOR DATA PROJECTS
+─────────────────────────────────────
+main ──────────────────────────────→
+       ↑         ↑
+develop ─────────────────────────→
+       ↑    ↑    ↑
+      feature  feature
+      /model   /pipeline
+       
+- main: Production-ready code
+- develop: Integration branch
+- feature/*: Individual work items
+```
+
+**Handling Large Files:**
+
+```
+GIT LFS (Large File Storage)
+─────────────────────────────────────
+Track model files:
+git lfs track "*.pkl"
+git lfs track "*.h5"
+
+.gitattributes will include:
+*.pkl filter=lfs diff=lfs merge=lfs -text
+*.h5 filter=lfs diff=lfs merge=lfs -text
+
+DVC (Data Version Control)
+─────────────────────────────────────
+Track datasets:
+dvc add data/training.csv
+git add data/training.csv.dvc
+
+Data stored externally (S3, GCS)
+Git tracks metadata only
+```
+                """,
+            "key_points": ["Version control code, configs, and documentation", "Use Git LFS or DVC for large files", "Follow branching strategy for collaboration", "Write clear commit messages"]
+        },
+        {
+            "title": "Collaborative Data Workflows",
+            "content": """
+**Working Together on Data Projects**
+
+Effective collaboration requires clear processes and communication.
+
+**Collaboration Framework:**
+
+```
+COLLABORATIVE WORKFLOW
+─────────────────────────────────────
+1. PLAN
+   └── Define scope, assign roles, set timeline
+
+2. DEVELOP
+   └── Work on branches, commit frequently
+
+3. REVIEW
+   └── Code review, testing, documentation
+
+4. INTEGRATE
+   └── Merge to main, deploy to staging
+
+5. VALIDATE
+   └── Test in staging, verify results
+
+6. DEPLOY
+   └── Release to production, monitor
+```
+
+**Code Review for Data Projects:**
+
+```
+DATA PROJECT CODE REVIEW CHECKLIST
+─────────────────────────────────────
+☐ Does the code run without errors?
+☐ Is the logic correct?
+☐ Are there appropriate tests?
+☐ Is the code documented?
+☐ Does it follow coding standards?
+☐ Are data validations in place?
+☐ Is performance acceptable?
+☐ Are secrets/credentials secure?
+☐ Is the commit message clear?
+```
+
+**Handling Merge Conflicts:**
+
+| Conflict Type | Resolution Approach |
+|--------------|---------------------|
+| **Code conflicts** | Discuss with other author, merge carefully |
+| **Configuration conflicts** | Document environment differences |
+| **Data conflicts** | Typically use latest version or merge rules |
+| **Model conflicts** | May need to retrain on combined changes |
+
+**Communication Best Practices:**
+
+```
+ASYNC COMMUNICATION (preferred)
+─────────────────────────────────────
+- Pull request descriptions
+- Code comments
+- Documentation updates
+- Slack/Teams for quick questions
+
+SYNC COMMUNICATION (when needed)
+─────────────────────────────────────
+- Standup meetings (brief, focused)
+- Design discussions
+- Conflict resolution
+- Pair programming on complex issues
+```
+
+**Change Documentation:**
+
+```
+CHANGELOG ENTRY
+─────────────────────────────────────
+## [1.2.0] - 2025-10-15
+
+### Added
+- New feature importance calculation
+- Automated data quality checks
+
+### Changed
+- Updated training data to include Q3 2025
+- Improved model accuracy from 85% to 88%
+
+### Fixed
+- Fixed timezone handling in date features
+- Corrected null handling in customer age
+
+### Deprecated
+- Old scoring endpoint (use /v2/score)
+```
+
+**Documentation Locations:**
+
+| Type | Where to Document |
+|------|------------------|
+| **Code logic** | Inline comments, docstrings |
+| **API/interfaces** | README, API docs |
+| **Decisions** | ADRs (Architecture Decision Records) |
+| **Changes** | CHANGELOG |
+| **Processes** | Wiki/Confluence |
+                """,
+            "key_points": ["Follow structured development workflow", "Conduct code reviews for quality", "Document changes in changelog", "Communicate async when possible"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Design an ETL Pipeline",
+            "type": "practical",
+            "question": "Design an ETL pipeline to load daily sales data from 3 sources (POS system, e-commerce API, returns database) into a data warehouse for analysis. Include error handling.",
+            "answer": "ETL Pipeline Design: EXTRACT: 1) POS: Query database for yesterday's transactions at 2am (incremental by date). 2) E-commerce: API call with pagination, handle rate limits with backoff. 3) Returns: Query returns database, join with original transaction IDs. TRANSFORM: 1) Standardize date formats (all to ISO 8601). 2) Normalize product codes across systems. 3) Calculate net sales (gross - returns). 4) Validate: sales > 0, dates within range, required fields present. 5) Handle nulls: impute missing store_id from product mapping, flag records with critical nulls. LOAD: 1) Upsert to staging table (update if exists, insert if new). 2) Run quality checks on staging. 3) If checks pass, merge to production fact table. ERROR HANDLING: 1) Retry failed extracts 3 times with exponential backoff. 2) Dead letter queue for records failing validation. 3) Alert if >5% records fail. 4) Checkpoint after each source extraction. 5) Full pipeline idempotent (re-run safe).",
+            "hint": "Consider each phase (Extract, Transform, Load) and what happens when something fails"
+        },
+        {
+            "title": "Create Git Workflow",
+            "type": "practical",
+            "question": "Your team has 3 data scientists working on the same model. One is improving features, one is tuning hyperparameters, one is adding new data. Design a Git workflow to avoid conflicts.",
+            "answer": "Git Workflow: BRANCH STRUCTURE: main (production) → develop (integration) → feature branches. FEATURE BRANCHES: 1) feature/improved-features (feature engineering changes). 2) feature/hyperparameter-tuning (model config changes). 3) feature/new-data-source (data pipeline changes). WORKFLOW: 1) Each person works on their branch, commits frequently. 2) Daily: pull latest develop, merge into feature branch, resolve conflicts early. 3) When ready: create PR to develop, request review from one other team member. 4) Code review checklist: tests pass, documentation updated, no hardcoded paths. 5) Weekly: merge all approved PRs to develop, run integration tests. 6) Monthly: merge develop to main, tag release version. CONFLICT PREVENTION: 1) Separate concerns: features.py (person 1), config.yaml (person 2), pipeline.py (person 3). 2) Communicate in daily standup about overlapping files. 3) Use feature flags for experimental code. 4) Model files tracked with DVC, not Git.",
+            "hint": "Separate work by file/component and establish clear merge cadence"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "In ETL, the 'Transform' step includes:",
+            "options": ["Only extracting data", "Cleaning, validating, and aggregating data", "Just loading to database", "Deleting old data"],
+            "correct": 1,
+            "explanation": "The Transform step processes raw data: cleaning, validating, standardizing, aggregating, and enriching before loading."
+        },
+        {
+            "question": "Git LFS is used for:",
+            "options": ["Small text files", "Large binary files like models", "Deleted files", "Branch management"],
+            "correct": 1,
+            "explanation": "Git LFS (Large File Storage) handles large binary files like trained models, storing them separately while Git tracks metadata."
+        },
+        {
+            "question": "An idempotent pipeline means:",
+            "options": ["It runs once and stops", "Re-running it produces the same result", "It cannot be modified", "It runs faster each time"],
+            "correct": 1,
+            "explanation": "Idempotent pipelines produce the same result whether run once or multiple times, which is important for safe retries and reruns."
+        },
+        {
+            "question": "ELT differs from ETL because:",
+            "options": ["It doesn't transform data", "It loads raw data first, then transforms in the warehouse", "It only works with streaming", "It requires no configuration"],
+            "correct": 1,
+            "explanation": "ELT loads raw data to the data warehouse first, then uses the warehouse's computing power to transform it. ETL transforms before loading."
+        }
+    ]
+}
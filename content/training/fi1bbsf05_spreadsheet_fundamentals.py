@@ -0,0 +1,4105 @@
+"""Training Center content: FI1BBSF05 - Spreadsheet Fundamentals."""
+
+MODULE = {
+    "course": "Spreadsheet Fundamentals",
+    "tool_type": "spreadsheet",
+    "description": "FI1BBSF05: Master Microsoft Excel from the ground up — interface navigation, formulas, data management, conditional formatting, charts, pivot tables, advanced functions, data validation, Power Query, and macro automation.",
+    "lessons": [
+        {
+            "title": "1.1 Introduction to Excel — Interface & Navigation",
+            "content": """
+**Welcome to Excel**
+
+Excel is a spreadsheet application where data is organised in a grid of **rows** (numbers) and **columns** (letters). The intersection of a row and column is a **cell**, referenced by its address, e.g. `A1`, `B3`, `D12`.
+
+**The Excel Interface:**
+```
+┌─────────────────────────────────────────────────────────┐
+│  Quick Access │        Title Bar         │  Ribbon Tabs  │
+│  Toolbar      │                          │               │
+├───────────────┴──────────────────────────┴───────────────┤
+│  HOME  INSERT  PAGE LAYOUT  FORMULAS  DATA  REVIEW  VIEW │
+├─────────────────────────────────────────────────────────┤
+│  Name Box │ Formula Bar                                  │
+├───┬───┬───┬───┬───────────────────────────────────────── │
+│   │ A │ B │ C │  ← Column letters                        │
+├───┼───┼───┼───┤                                          │
+│ 1 │   │   │   │  ← Row numbers                           │
+│ 2 │   │   │   │                                          │
+└───┴───┴───┴───┴──────────────────────────────────────────┘
+```
+
+**Key Areas:**
+| Element | Purpose |
+|---------|---------|
+| **Name Box** | Shows current cell address (e.g. A1) |
+| **Formula Bar** | Shows / edit the content or formula of the active cell |
+| **Ribbon** | All commands organised into tabs |
+| **Sheet tabs** | Navigate between sheets in the workbook |
+| **Freeze Panes** | View → Freeze Panes — keeps headers visible while scrolling |
+
+**Essential Keyboard Shortcuts:**
+| Shortcut | Action |
+|----------|--------|
+| `Ctrl + Home` | Go to cell A1 |
+| `Ctrl + End` | Go to last used cell |
+| `Ctrl + Arrow` | Jump to edge of data |
+| `Ctrl + Shift + End` | Select from current cell to last used |
+| `F2` | Edit the active cell |
+| `Ctrl + Z` | Undo |
+| `Ctrl + S` | Save |
+| `Ctrl + PageUp/Down` | Switch between sheets |
+
+**Data Types in a Cell:**
+- **Text** — left-aligned by default
+- **Numbers** — right-aligned by default
+- **Dates/Times** — stored as numbers, displayed as dates
+- **Logical** — TRUE / FALSE
+- **Formulas** — start with `=`
+
+**Pro Tip:** Press `Ctrl + ;` to insert today's date, `Ctrl + :` to insert the current time.
+
+---
+
+**A Brief History of Spreadsheets:**
+
+| Year | Application | Key Innovation |
+|------|-------------|----------------|
+| **1979** | **VisiCalc** (Apple II) | First electronic spreadsheet. Defining feature: **automatic recalculation** — change one cell and every dependent cell updates instantly, eliminating hours of manual paper recalculation |
+| **1983** | **Lotus 1-2-3** (DOS) | Added charting and database features; dominated 1980s business computing |
+| **1985 / 1987** | **Microsoft Excel** (Mac / Windows) | GUI-based spreadsheet; gradually became the global industry standard |
+| **2007** | **Excel 2007** | Replaced the legacy **.xls** binary format with **.xlsx** (Office Open XML) as the new default |
+| **2013+** | **Power Query / Power BI** | Self-service data transformation and business intelligence built into Excel |
+
+> **Exam tip — VisiCalc (True/False):** "VisiCalc was capable of automatically recalculating the entire sheet when one value was changed" — **True**. This was its defining innovation and why it became the first *killer app* for personal computers.
+
+---
+
+**What Made Excel 1.0 Stand Out — WYSIWYG**
+
+> **Exam answer — Excel 1.0 standout feature:** **b) WYSIWYG (What You See Is What You Get)**
+
+Excel 1.0 (1985, Apple Mac) was the first spreadsheet where the screen showed *exactly* how the document would look when printed — fonts, bold, borders, and column widths were all rendered live on screen. Its DOS competitors required text-based commands and you had to physically print to see real formatting.
+
+**Why the other options are wrong:**
+| Option | Why it is NOT correct |
+|--------|----------------------|
+| a) Graphical presentation of Data (Charts) | Charts already existed in **Lotus 1-2-3 (1983)** — Excel did not invent them |
+| c) Advanced Calculations | Arithmetic calculations already existed in **VisiCalc (1979)** and Lotus |
+| d) Dropdown Menus | Menus were **not unique** to Excel — not a distinguishing feature |
+| **b) WYSIWYG ✅** | Only Excel 1.0 rendered fonts, bold, borders on screen matching the printed output |
+
+**DOS Lotus 1-2-3 vs Mac Excel 1.0 — Visualised:**
+```
+Lotus 1-2-3 (DOS, 1983)                 Excel 1.0 (Mac, 1985 — WYSIWYG)
+────────────────────────────────────    ────────────────────────────────────
+/wcs   ← type slash commands            Click column edge → drag to resize
+/pprint ← type to print to see result   Screen IS the print preview always
+Monospaced font only (no bold on screen) Bold, italic, real fonts visible live
+--- border: manually type dashes ---     ══ real border drawn on screen ══
+No formatting feedback until printed     "What You See" = "What You Get"
+```
+
+**How to remember it:** WYSIWYG = the screen *is* the print preview. Excel brought the Mac GUI world to spreadsheets while Lotus stayed stuck in text-command DOS until it was too late.
+
+---
+
+**Excel vs Google Sheets — What's the Difference?**
+
+Both are spreadsheet applications with similar core functionality. The key distinction is *where* they run and *what* they can do:
+
+| Feature | Microsoft Excel | Google Sheets |
+|---------|----------------|---------------|
+| **Platform** | Desktop app + Microsoft 365 web | **Cloud-based (browser only)** |
+| **Real-time collaboration** | ✅ Via Microsoft 365 | ✅ Built-in, seamless — multiple users see edits live |
+| **Core formulas** | Full library (XLOOKUP, IFS, etc.) | Very similar — most formulas work identically |
+| **PivotTables** | ✅ More advanced options | ✅ Available (called Pivot Tables) |
+| **Charts** | ✅ More chart types | ✅ Available |
+| **Power Query / VBA** | ✅ Full support | ❌ Not available |
+| **Offline use** | ✅ Full desktop use | ⚠ Limited (Chrome extension only) |
+| **File format** | .xlsx (default) | .gsheet (native) / exports as .xlsx |
+| **Cost** | Requires Microsoft 365 subscription | ✅ Free (Google account) |
+| **Storage** | Local or OneDrive | Google Drive |
+
+> **Exam tip (True/False):** "Google Sheets is a cloud-based spreadsheet application that offers real-time collaboration, making it similar in functionality to Excel" — **True**. Both support formulas, PivotTables, charts, and conditional formatting. The main differences are that Excel has Power Query/VBA (Google Sheets does not) and Google Sheets has seamless real-time collaboration built-in by default.
+                """,
+            "key_points": [
+                "Cells are referenced by Column Letter + Row Number (e.g. B3)",
+                "The Formula Bar shows and edits cell content",
+                "Freeze Panes keeps headers visible when scrolling",
+                "Numbers right-align; text left-aligns by default",
+                "VisiCalc (1979) introduced automatic recalculation — the breakthrough that made spreadsheets essential for business",
+                "Google Sheets is cloud-based with built-in real-time collaboration; Excel leads for Power Query, VBA, and advanced analysis",
+                "Excel 1.0 (1985) stood out with WYSIWYG — screen matched printed output including fonts/bold/borders; DOS Lotus required printing to see real formatting"
+            ]
+        },
+        {
+            "title": "1.2 Data Entry, Formatting & Basic Functions",
+            "content": """
+**Entering and Formatting Data**
+
+**Data Entry Tips:**
+- Press `Enter` to confirm and move down
+- Press `Tab` to confirm and move right
+- Press `Escape` to cancel an entry
+- Double-click a cell to edit in-place (`F2` also works)
+- Use AutoFill: type a value, grab the fill handle (small square bottom-right of cell), drag down/across
+
+**AutoFill — Cursor Shapes Guide (exam question):**
+
+> **Exam answer — AutoFill cursor:** The **thin solid black crosshair (+)** = the **fill handle** at the bottom-right corner of a selected cell. This is what triggers AutoFill.
+
+| Cursor appearance | Where on the cell | What it does |
+|-------------------|-------------------|--------------|
+| Thick white/hollow arrow | **Middle** of cell | Normal select — click to select cell |
+| **Thin solid black crosshair (+)** ✅ | **Bottom-right corner** | **Fill handle — drag to AutoFill a pattern** |
+| Four-headed arrow (✛) | **Border/edge** of selection | Move — drag to relocate the cell(s) |
+| Flashing dashed border (marching ants) | Surrounds source range | Paste indicator — appears after `Ctrl+C` |
+| Green outlined border | Around active cell | Active cell indicator — not a cursor shape |
+
+**Why the other answer options are wrong:**
+| Option | What it actually is |
+|--------|--------------------|
+| a) The location to paste copied data | Shown by **flashing dashed border** (marching ants) after Ctrl+C — not a crosshair |
+| **b) The AutoFill handle ✅** | The thin black crosshair at the bottom-right corner — correct answer |
+| c) The direction of data import | No such cursor exists in Excel |
+| d) The current active cell | The active cell has a **green outlined border** — not a crosshair cursor |
+
+**AutoFill pattern examples:**
+| Starting input | AutoFill extends to... | How Excel detects the pattern |
+|---------------|------------------------|-------------------------------|
+| `Jan` | `Feb, Mar, Apr …` | Built-in month series |
+| `Monday` | `Tuesday, Wednesday …` | Built-in weekday series |
+| `1, 2` (two cells selected) | `3, 4, 5, 6 …` | Arithmetic step = +1 |
+| `2, 4` (two cells selected) | `6, 8, 10 …` | Arithmetic step = +2 |
+| `=A1*2` | `=A2*2, =A3*2 …` | Copies formula with relative shift |
+| `Q1` | `Q2, Q3, Q4` | Text + number pattern recognition |
+
+> **Key exam tip:** *Thin black crosshair* = fill handle = bottom-right corner = AutoFill. *Thick white arrow* = middle of cell = normal select. These two are the most commonly confused!
+
+**Number Formatting:**
+`Home → Number group`
+| Format | Example |
+|--------|---------|
+| General | 1500 |
+| Number | 1,500.00 |
+| Currency | $1,500.00 |
+| Percentage | 75% |
+| Date | 18/02/2026 |
+
+**Cell Formatting:**
+- **Bold / Italic / Underline**: `Ctrl+B`, `Ctrl+I`, `Ctrl+U`
+- **Cell borders**: Home → Font group → Borders
+- **Fill colour**: Home → Font group → Fill Color
+- **Merge & Centre**: Home → Alignment → Merge & Center
+
+**Basic Statistical Functions:**
+```
+=SUM(A1:A10)         Sum of range
+=AVERAGE(A1:A10)     Arithmetic mean
+=MIN(A1:A10)         Smallest value
+=MAX(A1:A10)         Largest value
+=COUNT(A1:A10)       Count of numeric cells
+=COUNTA(A1:A10)      Count of non-empty cells
+=MEDIAN(B1:B20)      Middle value
+=MODE(B1:B20)        Most frequent value
+=STDEV(B1:B20)       Sample standard deviation
+```
+
+**Relative vs Absolute References:**
+```
+=A1        Relative  — shifts when formula is copied
+=$A$1      Absolute  — always refers to A1
+=$A1       Mixed     — column fixed, row shifts
+=A$1       Mixed     — row fixed, column shifts
+```
+
+Key: press **F4** while editing a reference to cycle through modes.
+
+**Real-World Example:**
+Column B has 30 student scores. In C1:
+```
+=AVERAGE(B2:B31)    ← Average score
+=MAX(B2:B31)        ← Highest score
+=MIN(B2:B31)        ← Lowest score
+=COUNTIF(B2:B31,">=60")   ← How many passed
+```
+                """,
+            "key_points": [
+                "F4 cycles a reference between relative, absolute, and mixed",
+                "=SUM, =AVERAGE, =MIN, =MAX are the most-used starter functions",
+                "AutoFill copies patterns and formulas down or across — triggered by the thin solid black crosshair (+) at the bottom-right corner (fill handle)",
+                "Number format changes display only — not the underlying value",
+                "Accounting format aligns currency symbols to the LEFT edge of the cell; Currency format places the symbol next to the number"
+            ]
+        },
+        {
+            "title": "1.3 Data Management — Tables, Sorting & Filtering",
+            "content": """
+**Organising and Finding Data**
+
+**Converting a Range to a Table:**
+Select data → `Insert → Table` (or `Ctrl+T`)
+- Adds automatic filter dropdowns to each header
+- New rows are included in formulas automatically
+- Table name appears in the Name Box (e.g. `Table1`)
+- Structured references: `=Table1[Mathematics]`
+
+**Sorting Data:**
+`Data → Sort` (or click a column header's dropdown)
+- **Single column**: Click column → `Data → Sort A→Z` or `Z→A`
+- **Multi-level sort**: Data → Sort → Add Level
+  - Example: Sort by Class (A→Z), then by Score (Z→A)
+
+**AutoFilter:**
+- Click any cell in data → `Data → Filter`
+- Click the dropdown arrow on a column header
+- Options: sort, filter by value, number filters, text filters
+- **Clear all filters**: Data → Clear
+
+**What filtering actually does — visually:**
+```
+Before filter:                After filter (Dept = "Marketing"):
+Row 1: Name   Dept            Row 1: Name   Dept      ← headers STAY visible
+Row 2: Alice  Marketing  ✅   Row 2: Alice  Marketing ✅
+Row 3: Bob    Engineering      Row 3: [hidden — NOT deleted]
+Row 4: Carol  Marketing  ✅   Row 4: Carol  Marketing ✅
+Row 5: Dave   HR               Row 5: [hidden — NOT deleted]
+                               ↑ row numbers jump (3,5 skip) = hidden, not gone
+```
+
+| What people think happens | What actually happens |
+|--------------------------|----------------------|
+| ❌ Rows are permanently deleted | ✅ Rows are temporarily **hidden** |
+| ❌ Column headers disappear | ✅ Headers stay visible and show **dropdown arrows** |
+| ❌ Data is sorted ascending | ✅ Order is unchanged — sort and filter are **separate** operations |
+| ✅ Only matching rows are displayed | ✅ Correct — non-matching rows are hidden, not removed |
+
+> **Exam tip (multiple choice):** Filtering **displays only rows meeting the criteria** — it never deletes data, never hides headers, and does not sort. Clear the filter with `Data → Clear` to restore all rows instantly.
+
+**Advanced Filter:**
+`Data → Advanced` — filter with AND/OR criteria in a separate range
+
+**Removing Duplicates:**
+`Data → Remove Duplicates` → select which columns to check
+
+**Text to Columns:**
+`Data → Text to Columns` — split one column into several using a delimiter (comma, space, tab)
+
+**Key Sorting/Filtering Functions:**
+```
+=SORT(A2:D31, 2, -1)         Sort range by column 2 descending (Excel 365)
+=FILTER(A2:D31, C2:C31>80)   Return rows where Science > 80 (Excel 365)
+=UNIQUE(A2:A31)              List of unique names (Excel 365)
+```
+
+**SPF Lesson 1.3 — Practical Example:**
+Dataset: Students with Name, Maths, Science, English
+
+| Task | How |
+|------|-----|
+| Show only students with Maths > 70 | Filter → Maths → Number Filters → Greater Than → 70 |
+| Sort by English descending | Sort → Column D → Z→A |
+| Find duplicate names | Home → Conditional Formatting → Highlight Duplicate Values |
+| Extract unique class list | =UNIQUE(B2:B31) in a spare column |
+                """,
+            "key_points": [
+                "Convert to Table (Ctrl+T) for automatic filters and dynamic ranges",
+                "Multi-level sort lets you sort by more than one column",
+                "Remove Duplicates is in the Data tab",
+                "Text to Columns splits delimited data into separate columns",
+                "Filtering hides non-matching rows temporarily — it never deletes data, never hides headers, and does not sort"
+            ]
+        },
+        {
+            "title": "1.4 Data Validation & Conditional Formatting",
+            "content": """
+## 1.4 Data Validation and Conditional Formatting
+
+---
+
+## Part 1 — Data Validation
+
+### What is Data Validation?
+
+**Data Validation** is an Excel feature that controls what kind of data a user is allowed to enter into a cell. Its purpose is to **prevent errors at the point of entry** — before bad data ever makes it into the spreadsheet.
+
+**Why it matters:**
+- Reduces data-entry mistakes (wrong types, out-of-range values)
+- Enforces business rules (e.g. quantity must be a whole number ≥ 1)
+- Guides users with dropdown lists so they pick from approved options
+- Protects formulas and reports from being broken by invalid input
+
+**Primary purpose — eliminating the wrong answers:**
+
+| Option | Feature it describes | Is it Data Validation? |
+|--------|---------------------|------------------------|
+| a ❌ Customising cell formatting | `Home → Format Cells` (font, fill, borders, number format) | No |
+| b ✅ Ensuring data integrity and quality | Controlling what is **allowed to be entered** at the point of input | **Yes** |
+| c ❌ Sorting and filtering data | `Data → Sort` and `Data → Filter` / AutoFilter | No |
+| d ❌ Creating charts and graphs | `Insert → Charts` | No |
+
+> **Exam tip (multiple choice):** The primary purpose of Data Validation is **ensuring data integrity and quality** — it prevents bad data from entering the spreadsheet in the first place, rather than cleaning it up afterwards.
+
+**Location:** `Data → Data Tools → Data Validation`
+
+---
+
+### How Data Can Be Restricted Using Data Validation
+
+When you open the Data Validation dialog (`Data → Data Validation`) you set three things:
+
+1. **Settings tab** — choose the _Allow_ type and conditions
+2. **Input Message tab** — optional tooltip shown when the cell is selected
+3. **Error Alert tab** — message shown when invalid data is entered
+
+**Allow types and how they restrict input:**
+
+| Allow Type | What It Restricts | Example |
+|------------|-------------------|---------|
+| **Whole number** | Only integers within a range | Between 1 and 100 |
+| **Decimal** | Numbers with decimals within a range | Greater than 0.0 |
+| **List** | Only values from a predefined list | Dropdown: Yes, No, Pending |
+| **Date** | Only dates within a range | Between 01/01/2024 and 31/12/2024 |
+| **Time** | Only times within a range | Between 09:00 and 17:00 |
+| **Text length** | Limits character count | Between 5 and 10 characters |
+| **Custom** | Any formula that returns TRUE/FALSE | `=ISNUMBER(A1)`, `=A1<>""` |
+
+**Error Alert styles:**
+| Style | Behaviour |
+|-------|-----------|
+| **Stop** | Rejects invalid input completely — user must re-enter |
+| **Warning** | Warns the user but allows them to proceed |
+| **Information** | Informs the user; always allows the input |
+
+---
+
+### Key Options Available for Data Validation in Excel
+
+**1. Dropdown List (most common)**
+- Source can be a comma-separated list: `Yes,No,Pending`
+- Or a cell range: `=$F$1:$F$5`
+- Users click an arrow and select — no free typing needed
+
+**2. Whole Number / Decimal with Operators**
+- Operators: *between, not between, equal to, not equal to, greater than, less than, greater than or equal to, less than or equal to*
+- Example: Reject any mark outside 0–100 → Allow: Whole number, Between, 0, 100
+
+**3. Custom Formula**
+- Enter any formula that evaluates to TRUE (valid) or FALSE (invalid)
+- Example — only uppercase text: `=EXACT(A1,UPPER(A1))`
+- Example — no blanks allowed: `=LEN(TRIM(A1))>0`
+
+**4. Input Message**
+- Title + message appears as a tooltip when the cell is selected
+- Guides users before they type
+
+**5. Circle Invalid Data**
+- `Data → Data Validation → Circle Invalid Data` draws a red circle around cells that break the rule — useful for auditing existing data
+
+**Step-by-step: adding a dropdown list**
+```
+1. Select the cell(s) → Data → Data Validation
+2. Allow: List
+3. Source: type items separated by commas, OR select a range
+4. (Optional) Input Message tab: add a helpful hint
+5. (Optional) Error Alert tab: Stop / Warning / Information
+6. OK
+```
+
+---
+
+## Part 2 — Conditional Formatting
+
+### How Conditional Formatting Works in Excel
+
+**Conditional Formatting** automatically changes a cell's visual appearance — fill colour, font colour, font style, border — based on a **rule** you define. Every time the spreadsheet recalculates, Excel re-evaluates each rule and applies (or removes) the formatting instantly.
+
+**The basic mechanism:**
+1. You select a cell range
+2. You define a rule (e.g. "value > 90")
+3. You choose a format to apply when the rule is TRUE
+4. Excel continuously monitors the values — if the condition becomes TRUE the format appears; if it becomes FALSE the format disappears
+
+**Location:** `Home → Styles → Conditional Formatting`
+
+---
+
+### Benefits of Using Conditional Formatting
+
+| Benefit | Detail |
+|---------|--------|
+| **Instant visual insight** | Patterns, outliers, and trends become visible without reading every value |
+| **Dynamic** | Updates automatically as data changes — no manual re-colouring |
+| **No formulas needed for basic cases** | Built-in presets cover the most common scenarios |
+| **Works on large datasets** | Applies consistently to thousands of rows at once |
+| **Supports decision-making** | Managers can scan a report and immediately spot problems |
+| **Layering** | Multiple rules can be stacked on the same range for rich visualisation |
+
+---
+
+### Types of Conditional Formatting Available in Excel
+
+Excel provides six main categories, each accessed from `Home → Conditional Formatting`:
+
+#### 1. Highlight Cell Rules
+Applies a fill/font to cells that meet a simple value condition.
+
+| Condition | Menu option |
+|-----------|-------------|
+| Greater Than | `Highlight Cell Rules → Greater Than…` |
+| Less Than | `Highlight Cell Rules → Less Than…` |
+| Between | `Highlight Cell Rules → Between…` |
+| Equal To | `Highlight Cell Rules → Equal To…` |
+| Text that Contains | `Highlight Cell Rules → Text That Contains…` |
+| A Date Occurring | `Highlight Cell Rules → A Date Occurring…` |
+| Duplicate Values | `Highlight Cell Rules → Duplicate Values…` |
+
+#### 2. Top/Bottom Rules
+Highlights the highest or lowest values in a range.
+
+| Option | What it does |
+|--------|-------------|
+| Top 10 Items | Highlights the X highest values |
+| Top 10 % | Highlights the top X percent |
+| Bottom 10 Items | Highlights the X lowest values |
+| Bottom 10 % | Highlights the bottom X percent |
+| Above Average | Highlights values above the mean |
+| Below Average | Highlights values below the mean |
+
+*(The "10" is just the default — you can change it to any number)*
+
+#### 3. Data Bars
+Inserts a **bar chart inside each cell**, proportional to the cell's value. See the dedicated section below.
+
+#### 4. Colour Scales
+Applies a **gradient of colours** across a range, mapping values to a colour spectrum. See the dedicated section below.
+
+#### 5. Icon Sets
+Places a **small icon** (arrow, traffic light, star, etc.) inside each cell based on the value's position in the range. See the dedicated section below.
+
+#### 6. New Rule (Custom Formula)
+Lets you write any formula that returns TRUE or FALSE and apply any format you choose. This is the most powerful option.
+
+```
+Home → Conditional Formatting → New Rule → Use a formula to determine which cells to format
+Formula: =COUNTIF($A$2:$A$31, A2) > 1
+Format:  Choose fill/font/border
+```
+
+---
+
+### How the Colour Scales Option Works
+
+**Colour Scales** map a range of numeric values to a **continuous colour gradient**, giving an at-a-glance heat map.
+
+**2-Colour Scale:**
+- Two endpoints: **Minimum** → one colour, **Maximum** → another colour
+- Cells in between get an interpolated shade
+- Example: white (low) → dark blue (high)
+
+**3-Colour Scale:**
+- Three points: **Minimum**, **Midpoint**, **Maximum**, each gets its own colour
+- Cells are shaded proportionally between the three colours
+- Example (traffic-light): Red (low) → Yellow (mid) → Green (high)
+
+**Configuring a Colour Scale:**
+```
+Home → Conditional Formatting → Colour Scales
+  → pick a preset  (quick)
+  OR
+  → More Rules  (custom colours and thresholds)
+      Type: Lowest Value / Number / Percent / Percentile / Formula
+      Colour: choose any colour from the palette
+```
+
+**Threshold types:**
+| Type | Meaning |
+|------|---------|
+| Lowest / Highest Value | The actual minimum/maximum in the range |
+| Number | A fixed number you specify |
+| Percent | X% of the way between min and max |
+| Percentile | The Xth statistical percentile |
+| Formula | Result of any formula |
+
+**Practical tip:** Use the **Red–Yellow–Green** preset for scores or KPIs — red immediately flags problems, green signals success.
+
+**The four CF visual types — know which is which:**
+
+| CF type | Visual | What it does | Exam keyword |
+|---------|--------|-------------|-------------|
+| **Colour Scales** | Gradient heat map | **Assigns colours based on values** — each cell shaded proportionally | *"heat map"*, *"gradient"*, *"colour based on value"* |
+| **Data Bars** | In-cell horizontal bar | Bar length = relative magnitude | *"bar inside cell"*, *"proportional bar"* |
+| **Icon Sets** | Small icon (arrow, traffic light) | Symbol assigned by value tier | *"icons"*, *"arrows"*, *"traffic lights"* |
+| **Highlight Cell Rules** | Solid fill on matching cells | Fixed colour on cells meeting a condition | *"duplicate"*, *"greater than"*, *"specific value"* |
+
+> **Exam tip (multiple choice):** The purpose of Colour Scales is to **assign different colours to cells based on their values**. Icons = Icon Sets. Duplicates = Highlight Cell Rules. In-cell bars = Data Bars.
+
+---
+
+### The Purpose of Using Data Bars
+
+**Data Bars** render a **horizontal bar inside the cell**, with the bar length proportional to the cell's value relative to the other values in the range. They give every cell a built-in mini chart.
+
+**Why use Data Bars?**
+- Compare relative magnitudes without needing a separate chart
+- The number and the bar coexist — you see the precise value AND the visual comparison
+- Ideal for ranking columns (sales, scores, counts)
+
+**Options:**
+| Setting | Description |
+|---------|-------------|
+| **Gradient Fill** | Bar fades from a colour to white — softer look |
+| **Solid Fill** | Bar is a uniform colour — crisper look |
+| **Bar colour** | Any colour from the theme palette |
+| **Border** | Optional border around the bar |
+| **Bar direction** | Left-to-right (default) or right-to-left |
+| **Show Bar Only** | Hides the number so only the bar shows |
+| **Negative value bar** | Separate colour for bars that represent negative numbers |
+| **Axis position** | Where the zero-line sits when negative values exist |
+
+**How to apply:**
+```
+Select range → Home → Conditional Formatting → Data Bars
+  → Gradient Fill (or Solid Fill) → pick a colour preset
+  → More Rules to customise min/max, colours, direction
+```
+
+**Activity 2, Task 6:**
+```
+Range: D2:D31 (English scores)
+Home → Data Bars → Solid Fill Blue
+```
+
+---
+
+### How Icon Sets Are Used in Conditional Formatting
+
+**Icon Sets** place a **small graphic icon** inside each cell to classify its value into 3, 4, or 5 tiers. The icon communicates status at a glance without the user needing to read the number.
+
+**Available icon categories:**
+
+| Category | Examples |
+|----------|---------|
+| **Directional** | 3/4/5 Arrows (coloured or grey) |
+| **Shapes** | 3 Traffic Lights, 3 Symbols (circle/triangle/diamond) |
+| **Indicators** | 3 Symbols (✓ !, ✗), 4 Ratings |
+| **Ratings** | 4/5 Ratings (bars), 5 Quarters |
+
+**How the threshold logic works (3-icon example):**
+
+By default, Excel divides the range into thirds by percentile:
+- **Icon 1 (top):** value ≥ 67th percentile
+- **Icon 2 (middle):** 33rd ≤ value < 67th percentile
+- **Icon 3 (bottom):** value < 33rd percentile
+
+You can override these thresholds in **More Rules**:
+- Change the type: **Number**, **Percent**, **Percentile**, or **Formula**
+- Change the threshold values
+- Reverse the icon order (useful when lower = better)
+- Choose "Show Icon Only" to hide the number
+
+**How to apply:**
+```
+Select range → Home → Conditional Formatting → Icon Sets
+  → choose a set (e.g. 3 Arrows, Traffic Lights)
+  → More Rules to adjust thresholds or reverse order
+```
+
+**Activity 2, Task 7 — Maths icon set:**
+```
+Range: B2:B31
+Home → Icon Sets → Directional → 3 Arrows (Coloured)
+More Rules:
+  ↑ Green  when value is ≥ 67  (Percent)
+  → Yellow when value is ≥ 33  (Percent)
+  ↓ Red    when value is <  33  (Percent)
+```
+
+---
+
+### The Role of Conditional Formatting with Duplicate Values
+
+Spotting duplicates visually is one of the most common CF use cases.
+
+**Built-in Duplicate Values rule:**
+```
+Select range (e.g. A2:A31)
+Home → Conditional Formatting → Highlight Cell Rules → Duplicate Values…
+  → choose "Duplicate" and a preset format (e.g. light red fill)
+  → OK
+```
+This automatically highlights **every cell whose value appears more than once** in the selected range.
+
+**Custom formula approach (more control):**
+```
+New Rule → Use a formula:
+  =COUNTIF($A$2:$A$31, A2) > 1
+Format: any fill/font/border combination
+```
+- `COUNTIF($A$2:$A$31, A2)` counts how many times the value in A2 appears in the whole range
+- `> 1` is TRUE only if it appears at least twice → formula rule fires
+- The absolute range `$A$2:$A$31` stays fixed; the relative `A2` shifts each row
+
+**Activity 2, Task 8:**
+```
+Range: A2:A31 (student names)
+Formula: =COUNTIF($A$2:$A$31, A2) > 1
+Format:  Pink fill (#FFC7CE), dark red font (#9C0006)
+```
+
+---
+
+### Can Conditional Formatting Be Limited to Specific Cells or Ranges?
+
+**Yes — completely.** When you create or edit a rule, the `Applies to` field in the **Manage Rules** dialog controls exactly which cells are covered.
+
+**Ways to limit the range:**
+
+1. **Select before applying** — select only the target cells first, then apply CF; the rule scope is set automatically to your selection
+
+2. **Edit the Applies To field** — go to `Home → Conditional Formatting → Manage Rules`, click a rule, and edit the range in the **Applies to** box
+
+3. **Multiple non-contiguous ranges** — enter ranges separated by commas: `$B$2:$B$31,$D$2:$D$31`
+
+4. **Entire column / row** — enter `$B:$B` or `$2:$2` to cover a whole column/row (useful for dynamic tables that grow)
+
+5. **Table columns** — if your data is a formatted Excel Table, CF can be applied to a single table column and it will automatically expand as the table grows
+
+**Important:** Each rule is independent — you can have one rule on `B2:B31` for maths scores and a completely different rule on `C2:C31` for science scores, and they do not interfere.
+
+---
+
+### The Order in Which Rules Are Evaluated
+
+**Rules are evaluated top to bottom** in the `Manage Rules` list. The first rule whose condition is TRUE is applied, and whether subsequent rules also fire depends on the **Stop If True** checkbox.
+
+**Opening Manage Rules:**
+```
+Home → Conditional Formatting → Manage Rules
+(Select "This Worksheet" in the dropdown to see all rules)
+```
+
+**Evaluation flow:**
+
+```
+Rule 1 checked → TRUE?
+    Yes → apply format
+           Stop If True ticked? → Yes: skip all lower rules
+                                  No:  continue checking lower rules
+    No  → check Rule 2 → ...
+```
+
+**Changing rule priority:**
+- Select a rule → click the **▲ Move Up** or **▼ Move Down** arrows
+- Rules higher in the list have higher priority
+
+**Stop If True checkbox:**
+- When ticked, once a rule's condition is met and its format is applied, no lower-ranked rules are evaluated for that cell
+- Use this to create mutually exclusive rules (e.g. if ≥ 90 → green; else if ≥ 70 → yellow; else → red)
+
+**Example — grade colour ladder:**
+```
+Rule 1 (highest priority)  =B2>=90  → Green    ☑ Stop If True
+Rule 2                     =B2>=70  → Yellow   ☑ Stop If True
+Rule 3 (lowest priority)   =B2<70   → Red
+```
+Without Stop If True, a cell with 95 would get both Green (Rule 1) and Yellow (Rule 2) applied — the higher rule wins visually, but both are processed. With Stop If True on Rule 1, Rule 2 and Rule 3 are never checked for that cell.
+
+---
+
+### Can Conditional Formatting Be Copied to Other Cells or Ranges?
+
+**Yes — in several ways:**
+
+#### Method 1: Format Painter (most common) 🖌️
+```
+1. Click any cell that already has the CF rule you want to copy
+2. Home → Clipboard → Format Painter (paintbrush icon)
+3. Click and drag over the destination cells
+```
+- Copies ALL formatting from the source (including CF rules and any manual font/fill)
+- The `Applies to` range in the copied rule is updated to the destination range
+- Double-click Format Painter to paint multiple areas without re-clicking
+
+#### Method 2: Copy & Paste Special — Formats
+```
+1. Copy the source cell(s)  (Ctrl+C)
+2. Select the destination range
+3. Home → Paste → Paste Special (or Ctrl+Alt+V)
+4. Choose "Formats"  → OK
+```
+- Pastes only formats (including CF rules), not values or formulas
+
+#### Method 3: Extend the "Applies To" range
+```
+Home → Conditional Formatting → Manage Rules
+→ click the rule → edit the "Applies to" box
+→ add the new range:  $B$2:$B$31,$E$2:$E$31
+```
+- No copying required — the same rule now covers both ranges
+- Best when you want one rule to govern multiple separate columns
+
+#### Method 4: Drag the cell border
+- Drag the fill handle (bottom-right corner of the cell) over adjacent cells
+- CF copies along with all other formatting — works like Format Painter for adjacent ranges
+
+**Note on formula rules when copying:**
+- If the rule uses a **relative reference** (e.g. `A2` without $), the reference adjusts as the rule is applied to new cells — just like a normal formula
+- If the rule uses an **absolute reference** (e.g. `$A$2`), it stays fixed regardless of where the rule is copied
+
+---
+
+## Activity 2 — All Tasks Reference
+
+| Task | Range | Rule Type | Condition / Config | Format |
+|------|-------|-----------|-------------------|--------|
+| 1 | B2:B31 | Highlight Cell | `< 60` | Red fill |
+| 2 | C2:C31 | Highlight Cell | `> 90` | Green fill |
+| 3 | D2:D31 | Highlight Cell | `between 70 and 80` | Yellow fill |
+| 4 | B2:B31 | Colour Scale | 3-colour: Red–Yellow–Green | Gradient |
+| 5 | C2:C31 | Colour Scale | 2-colour: Light red → Blue | Gradient |
+| 6 | D2:D31 | Data Bars | Solid Fill blue | Bar |
+| 7 | B2:B31 | Icon Sets | 3 Arrows; ≥67% ↑, ≥33% →, <33% ↓ | Icons |
+| 8 | A2:A31 | Formula | `=COUNTIF($A$2:$A$31,A2)>1` | Pink fill, dark red font |
+| 9 | C2:C31 | Formula | `=C2>=LARGE($C$2:$C$31,3)` | Pale green fill, dark green font |
+| 10 | B2:B31 | Formula | `=B2<=SMALL($B$2:$B$31,3)` | Pale red fill, dark red font |
+| 11 | All | — | Dynamic — rules re-evaluate on any cell change | — |
+
+**Key formula functions:**
+| Function | Purpose |
+|----------|---------|
+| `COUNTIF($A$2:$A$31, A2) > 1` | TRUE if name in A2 appears more than once |
+| `C2 >= LARGE($C$2:$C$31, 3)` | TRUE if value is in the top 3 |
+| `B2 <= SMALL($B$2:$B$31, 3)` | TRUE if value is in the bottom 3 |
+
+---
+
+## What Did I Learn in This Lesson?
+
+- **Purpose of Data Validation:** Controls and restricts what users can enter into a cell, preventing errors at data-entry time before they can affect formulas or reports.
+
+- **Restricting data with Data Validation:** Use `Data → Data Validation`, choose an _Allow_ type (Whole number, Decimal, List, Date, Time, Text length, Custom) and set the conditions; invalid entries trigger an Error Alert (Stop, Warning, or Information).
+
+- **Data Validation options:** Dropdown lists (comma-separated or range-based), numeric ranges with operators, custom TRUE/FALSE formulas, input message tooltips, and the "Circle Invalid Data" audit tool.
+
+- **How Conditional Formatting works:** A rule defines a condition (value-based or formula-based); when the condition is TRUE, Excel automatically applies a chosen format (fill, font, border) to the cell; formatting updates every time the spreadsheet recalculates.
+
+- **Benefits of Conditional Formatting:** Instant visual patterns, fully dynamic (no manual re-colouring), works on large ranges at once, supports layered rules for rich visualisation, and aids decision-making at a glance.
+
+- **Types of Conditional Formatting:** Highlight Cell Rules, Top/Bottom Rules, Data Bars, Colour Scales, Icon Sets, and New Rule with a custom formula.
+
+- **Colour Scales:** Map numeric values to a colour gradient — a 2-colour scale has two endpoints; a 3-colour scale adds a midpoint. Thresholds can be set by lowest/highest value, number, percent, percentile, or formula. The classic Red–Yellow–Green preset acts as a heat map.
+
+- **Data Bars:** Display a proportional horizontal bar inside each cell — bar length reflects the value relative to the range. Can be gradient or solid fill; you can show bar only (no number). Useful for side-by-side comparison within a column.
+
+- **Icon Sets:** Place a graphic icon (arrows, traffic lights, symbols, ratings) inside each cell to classify its value into 3–5 tiers. Default thresholds are percentile-based but can be changed to numbers, percents, or formula results in "More Rules".
+
+- **Conditional Formatting and duplicate values:** The built-in `Highlight Cell Rules → Duplicate Values` option highlights every cell whose value appears more than once. For more control, use a custom formula: `=COUNTIF($A$2:$A$31, A2) > 1`.
+
+- **Limiting CF to specific cells or ranges:** Yes — every rule has an _Applies to_ field. Select your target range before applying, or edit the range directly in `Manage Rules`. Multiple non-contiguous ranges are supported (comma-separated).
+
+- **Rule evaluation order:** Rules are processed **top to bottom** in the Manage Rules list. Higher rules have higher priority. Tick **Stop If True** on a rule to prevent lower-priority rules from also applying to the same cell — essential for mutually exclusive categories like grade bands.
+
+- **Copying Conditional Formatting:** Use the **Format Painter** (single-click for one area, double-click for multiple), **Paste Special → Formats**, **dragging the fill handle**, or extending the `Applies to` range in Manage Rules. Relative references in formula rules adjust automatically when copied; absolute references stay fixed.
+                """,
+            "key_points": [
+                "Data Validation primary purpose: ensuring data integrity and quality — it controls what is allowed to be entered at point of input (not formatting, sorting, or charts)",
+                "Data Validation (Data → Data Validation) restricts cell input by type, range or list — error alerts can Stop, Warn, or Inform",
+                "Conditional Formatting automatically applies fill/font/border when a rule is TRUE; it updates dynamically as values change",
+                "Six CF types: Highlight Cell Rules, Top/Bottom Rules, Data Bars, Colour Scales, Icon Sets, New Rule (custom formula)",
+                "Colour Scales create a heat map gradient across a range; 2-colour = two endpoints, 3-colour = min / midpoint / max",
+                "The four CF visual types: Colour Scales (heat map) / Data Bars (in-cell bar) / Icon Sets (symbols) / Highlight Cell Rules (solid fill on condition)",
+                "Data Bars draw a proportional bar inside each cell for quick comparison; Solid or Gradient fill, bar-only option available",
+                "Icon Sets classify values into 3–5 tiers with graphics (arrows, traffic lights); thresholds are percentile-based by default but fully configurable",
+                "Duplicate-value highlighting: built-in menu option OR custom formula =COUNTIF($A$2:$A$31,A2)>1",
+                "CF can be limited to any specific range via the Applies To field in Manage Rules",
+                "Rules evaluate top-to-bottom; use Stop If True to create mutually exclusive grade-band rules",
+                "Copy CF with Format Painter, Paste Special → Formats, fill handle, or by extending the Applies To range"
+            ]
+        },
+        {
+            "title": "1.5 Charts & Data Visualisation",
+            "content": """
+**Creating Meaningful Charts in Excel**
+
+**Inserting a Chart:**
+1. Select your data range (include headers)
+2. `Insert → Charts` — choose a type
+3. The chart appears as a floating object; move and resize it
+4. Use **Chart Design** and **Format** tabs (appear when chart is selected)
+
+**Choosing the Right Chart:**
+| Data story | Chart type |
+|------------|-----------|
+| Compare categories | Clustered Bar or Column |
+| Show trend over time | Line chart |
+| Show composition (parts of a whole) | Pie or Donut (≤ 6 slices) |
+| Show relationship between two numbers | Scatter plot (XY) |
+| Show distribution | Histogram |
+| Compare across many groups | Radar/Spider chart |
+
+**Chart Elements:**
+```
+Title ──────────────────────────────────
+        │                              │
+Y-Axis  │  ████                        │
+(Values)│  ████ ████                   │
+        │  ████ ████ ████              │
+        └──────────────────────────────
+              Category A  B  C     X-Axis
+                        Legend ────────
+```
+Add / remove via `Chart Design → Add Chart Element`
+
+**Formatting a Chart:**
+- **Chart Title**: Click it, type a new title
+- **Axis Titles**: Add Chart Element → Axis Titles
+- **Data Labels**: Add Chart Element → Data Labels (shows values on bars)
+- **Colours**: Format Data Series → Fill
+- **Gridlines**: Add/remove for cleaner look
+
+**Sparklines:**
+Mini charts inside a single cell — great for tables:
+`Insert → Sparklines → Line / Column / Win-Loss`
+Select the data range and destination cell.
+
+**SPF Practical Example — Student Scores:**
+To create a column chart of all 30 students:
+1. Select A1:D31 (all student data)
+2. Insert → Recommended Charts → Clustered Column
+3. Add Chart Title: "Student Scores – Maths, Science, English"
+4. Add Data Labels to see exact values
+5. Change Science bars to green using Format Data Series
+
+**Pro Tips:**
+- Hold `Alt` while moving/resizing to snap to cell gridlines
+- Press `F11` to create a chart on a new sheet instantly
+- Use a **Combo chart** (Insert → Combo) to mix bar + line
+                """,
+            "key_points": [
+                "Select data first, then Insert → Charts",
+                "Line charts for trends; column/bar for comparisons",
+                "Pie charts work best with ≤ 6 categories",
+                "Add Data Labels for exact values on bars"
+            ]
+        },
+        {
+            "title": "1.6 Pivot Tables & PivotCharts",
+            "content": """
+**Pivot Tables — Instant Summary Analysis**
+
+A PivotTable summarises thousands of rows into a meaningful report without writing any formulas.
+
+**Creating a PivotTable:**
+1. Click anywhere in your data
+2. `Insert → PivotTable`
+3. Choose: New Worksheet (recommended)
+4. Click OK — the PivotTable pane opens
+
+**The Four Areas:**
+| Area | What to drag here | Effect |
+|------|-------------------|--------|
+| **Rows** | Category fields | One row per unique value |
+| **Columns** | Category fields | One column per unique value |
+| **Values** | Numeric fields | Calculations (Sum, Count, Average…) |
+| **Filters** | Category fields | Slice the whole table |
+
+**Example — Student Dataset:**
+
+To find the average score per subject:
+- Drag **Name** → Rows
+- Drag **Mathematics**, **Science**, **English** → Values
+- Change each to *Average* (click the field → Value Field Settings → Average)
+
+To count how many students scored above 80 in Maths:
+- Rows: (empty)
+- Values: Mathematics → Count
+- Filters: Mathematics → greater than 80
+
+**Calculated Field:**
+PivotTable Analyze → Fields, Items & Sets → Calculated Field
+```
+Name:    Total Score
+Formula: = Mathematics + Science + English
+```
+
+**Grouping Dates:**
+Right-click a date field → Group → choose Month / Quarter / Year
+
+**Slicers:**
+`PivotTable Analyze → Insert Slicer` — visual filter buttons you can click
+
+**PivotChart:**
+`PivotTable Analyze → PivotChart` — chart that stays linked to the PivotTable; filters apply to both instantly.
+
+**Refreshing Data:**
+When source data changes: right-click the PivotTable → Refresh  
+(Or: PivotTable Analyze → Refresh All)
+
+**SPF Practical Task:**
+Dataset: 30 students, Maths/Science/English
+
+| Goal | PivotTable Setup |
+|------|-----------------|
+| Average score per subject | Values: Average of each subject |
+| Find top scorer per subject | Sort Values Z→A |
+| Show only students who failed Maths (<60) | Filters: Maths → <60 |
+
+**Value Field Settings — all available statistics:**
+
+Right-click any value in the PivotTable → *Value Field Settings* → *Summarize Values By*:
+
+| Statistic | What it calculates |
+|-----------|--------------------|
+| **Sum** | Total of all values (default for numbers) |
+| **Count** | Number of non-empty cells (default for text) |
+| **Average** | Arithmetic mean |
+| **Max** | Largest value in the group |
+| **Min** | Smallest value in the group |
+| **Product** | Multiplies all values together |
+| **Count Numbers** | Counts only numeric cells (ignores text/blanks) |
+| **StdDev / StdDevp** | Sample / population standard deviation |
+| **Var / Varp** | Sample / population variance |
+
+> **Exam tip (True/False):** "Pivot tables cannot be used to calculate statistics like sum, average, or count of data" — **False**. PivotTables are specifically *designed* for exactly this — they support Sum, Count, Average, Max, Min, StdDev, Var, and more via Value Field Settings.
+                """,
+            "key_points": [
+                "Drag fields to Rows, Columns, Values, Filters areas",
+                "Change aggregation in Value Field Settings (Sum, Count, Average…)",
+                "Slicers are visual, clickable filters for PivotTables",
+                "PivotChart stays linked to the PivotTable automatically",
+                "PivotTables support 9 statistics: Sum, Count, Average, Max, Min, Product, Count Numbers, StdDev, Var — not just totals"
+            ]
+        },
+        {
+            "title": "1.7 Advanced Functions — Lookup & Logic",
+            "content": """
+**Power Functions for Data Analysis**
+
+**VLOOKUP:**
+```
+=VLOOKUP(lookup_value, table_array, col_index_num, [range_lookup])
+
+Example:  =VLOOKUP(A2, StudentList, 3, FALSE)
+          Look for A2 in the first column of StudentList,
+          return the value from column 3
+          FALSE = exact match
+```
+⚠ Limitation: can only look to the RIGHT.
+
+**XLOOKUP (Excel 365 / 2019+) — replaces VLOOKUP:**
+```
+=XLOOKUP(lookup_value, lookup_array, return_array, [if_not_found])
+
+Example:  =XLOOKUP(A2, Names, Science_column, "Not found")
+          Looks both left and right; returns first match
+```
+
+**INDEX + MATCH (works in all versions):**
+```
+=INDEX(return_range, MATCH(lookup_value, lookup_range, 0))
+
+Example:  =INDEX(C2:C31, MATCH("Student 5", A2:A31, 0))
+          Find "Student 5" in A2:A31, return the Science score
+```
+
+**OFFSET — dynamic reference by rows and columns:**
+```
+=OFFSET(reference, rows, cols, [height], [width])
+```
+Starts at `reference`, moves `rows` down and `cols` right, then returns that cell (or a range if height/width are given):
+
+```
+=OFFSET(A1, 2, 3)          → moves 2 rows down, 3 right → value of D3
+=OFFSET(A1, 0, 0, 5, 1)    → returns range A1:A5 (5 tall, 1 wide)
+=SUM(OFFSET(A1,0,0,5,1))   → dynamic SUM of A1:A5
+```
+
+**Why each wrong answer is wrong:**
+
+| Option | Describes | Actual function |
+|--------|-----------|----------------|
+| a ✅ | Reference based on rows/columns from a start point | **OFFSET** |
+| b ❌ | Retrieves data from a closed workbook | External references / `INDIRECT` |
+| c ❌ | Text manipulation | `LEFT`, `RIGHT`, `TRIM`, `LEN`, etc. |
+| d ❌ | Returns the sum of a range | `SUM` / `SUMIF` |
+
+**OFFSET vs similar functions:**
+
+| Function | Returns | How it navigates |
+|----------|---------|------------------|
+| `OFFSET` | Dynamic reference | Start cell + row/col offset |
+| `INDEX` | Value or reference | Row/column number in a range |
+| `INDIRECT` | Reference from a text string | `=INDIRECT("A"&B1)` |
+
+> **Exam tip (multiple choice):** OFFSET = **reference shifted by rows and columns** from a starting point. It returns a reference, not a value directly — which makes it useful inside SUM, AVERAGE, or MATCH for building dynamic ranges.
+```
+=IF(condition, value_if_true, value_if_false)
+=IF(B2>=60, "Pass", "Fail")
+
+=IFS(B2>=90,"A", B2>=75,"B", B2>=60,"C", TRUE,"Fail")
+```
+
+**COUNTIF / COUNTIFS:**
+```
+=COUNTIF(B2:B31, ">=60")                          Count students who passed Maths (1 condition)
+=COUNTIFS(B2:B31,">=60", C2:C31,">=60")          Passed Maths AND Science (2 conditions simultaneously)
+=COUNTIFS(B2:B31,">60", B2:B31,"<90")            Maths between 60 and 90 (2 conditions, SAME range)
+```
+
+**COUNTIFS uses AND logic — every condition must be TRUE:**
+
+| Student | Maths | Science | Counted by `COUNTIFS(Maths>=60, Science>=60)`? |
+|---------|-------|---------|-----------------------------------------------|
+| Alice | 75 | 80 | ✅ Yes — both pass |
+| Bob | 55 | 85 | ❌ No — Maths fails |
+| Carol | 70 | 45 | ❌ No — Science fails |
+| Dave | 90 | 72 | ✅ Yes — both pass |
+
+Result = **2** (only Alice and Dave pass both conditions simultaneously)
+
+> **Exam tip (True/False):** "COUNTIFS can be used to count cells that meet multiple criteria simultaneously" — **True**. Each range/criteria pair is evaluated as AND logic — all pairs must be TRUE for a row to be counted. Criteria can be across different ranges or even two conditions on the same range (e.g. `>60` AND `<90`).
+
+**SUMIF / SUMIFS / AVERAGEIF / AVERAGEIFS:**
+
+The pattern is consistent: the **S suffix (plural) = multiple conditions**. Always use the `S` version when you need AND logic across two or more criteria.
+
+| Function | Conditions | Syntax | Example |
+|----------|-----------|--------|---------|
+| `AVERAGEIF` | **1** | `AVERAGEIF(range, criteria, avg_range)` | `=AVERAGEIF(B2:B31, ">60", B2:B31)` → avg of scores above 60 |
+| `AVERAGEIFS` | **2+** | `AVERAGEIFS(avg_range, range1, crit1, range2, crit2)` | `=AVERAGEIFS(D2:D31, B2:B31,">60", C2:C31,">60")` → avg English where Maths AND Science both >60 |
+| `SUMIF` | **1** | `SUMIF(range, criteria, sum_range)` | `=SUMIF(A2:A31, "North", C2:C31)` → sum sales in North |
+| `SUMIFS` | **2+** | `SUMIFS(sum_range, range1, crit1, range2, crit2)` | `=SUMIFS(C2:C31, A2:A31,"North", B2:B31,"Q1")` → North AND Q1 |
+| `COUNTIF` | **1** | `COUNTIF(range, criteria)` | `=COUNTIF(B2:B31, ">=60")` → count who passed |
+| `COUNTIFS` | **2+** | `COUNTIFS(range1, crit1, range2, crit2)` | `=COUNTIFS(B2:B31,">=60",C2:C31,">=60")` → passed both |
+
+> **Exam tip (True/False):** "AVERAGEIF calculates the average of a range of cells based on a single condition" — **True**. It takes exactly one `range`/`criteria` pair. For two or more conditions, you must use `AVERAGEIFS` instead.
+
+**IFERROR:**
+```
+=IFERROR(VLOOKUP(A2, Table1, 3, FALSE), "Not found")
+Prevents #N/A and #DIV/0! errors from showing
+```
+
+**IS-functions — check what a cell contains:**
+
+| Function | Returns TRUE when | Example |
+|----------|------------------|---------|
+| `ISNUMBER(value)` | Cell contains a **numeric value** | `=ISNUMBER(42)` → TRUE |
+| `ISTEXT(value)` | Cell contains **text** | `=ISTEXT("Hello")` → TRUE |
+| `ISBLANK(value)` | Cell is **empty** | `=ISBLANK(A1)` → TRUE if A1 is empty |
+| `ISFORMULA(ref)` | Cell contains a **formula** | `=ISFORMULA(B2)` → TRUE if B2 has `=SUM(...)` |
+| `ISERROR(value)` | Cell contains an **error** | `=ISERROR(A1)` → TRUE if A1 shows #N/A etc. |
+| `ISLOGICAL(value)` | Cell contains **TRUE or FALSE** | `=ISLOGICAL(TRUE)` → TRUE |
+
+**Why each wrong option points to a different function:**
+
+| Option | What you actually need |
+|--------|------------------------|
+| a ❌ Cell contains a date | Dates ARE stored as numbers — `ISNUMBER` returns TRUE for dates too; no dedicated `ISDATE` exists |
+| b ❌ Cell contains a formula | `=ISFORMULA(A1)` |
+| c ✅ Cell contains a numeric value | **`=ISNUMBER(A1)`** |
+| d ❌ Cell contains text | `=ISTEXT(A1)` |
+
+**Used inside IF for data validation:**
+```
+=IF(ISNUMBER(A1), "Valid", "Must be a number")
+=IF(ISBLANK(A1), "Required!", A1)
+=IF(ISTEXT(A1), UPPER(A1), A1)
+```
+
+> **Exam tip (multiple choice):** `ISNUMBER` checks for **numeric values**. The IS-function family all return TRUE/FALSE and are commonly nested inside `IF` to validate cell contents before processing.
+```
+=CHOOSE(index_num, value1, value2, value3, ...)
+
+=CHOOSE(1, "Apple","Banana","Cherry")  → "Apple"
+=CHOOSE(2, "Apple","Banana","Cherry")  → "Banana"
+=CHOOSE(3, "Apple","Banana","Cherry")  → "Cherry"
+```
+
+| index_num | Returns | Error? |
+|-----------|---------|--------|
+| 1 | value1 | |
+| 2 | value2 | |
+| 3 | value3 | |
+| 0 or > count | nothing | #VALUE! |
+
+**How CHOOSE differs from similar functions:**
+| Function | How it selects |
+|----------|----------------|
+| `CHOOSE` | By **index number** (1, 2, 3…) |
+| `SWITCH` | By **matching a value** to cases |
+| `IFS` | By **logical condition** (TRUE/FALSE) |
+| `INDEX` | By **row/column position** in a range |
+
+**Real-world use:** Convert WEEKDAY number to day name:
+```
+=CHOOSE(WEEKDAY(A1), "Sun","Mon","Tue","Wed","Thu","Fri","Sat")
+```
+WEEKDAY returns 1–7, CHOOSE picks the matching name.
+
+> **Exam tip (True/False):** "CHOOSE returns a value from a list of values based on a specified index number" — **True**. The first argument is always the position (1-based), the remaining arguments are the values to pick from.
+
+**TEXT Functions:**
+```
+=TRIM(A1)        Remove extra spaces
+=PROPER(A1)      Capitalize first letters
+=UPPER(A1)       ALL CAPS
+=LEFT(A1,5)      First 5 characters
+=LEN(A1)         Number of CHARACTERS (not words)
+=CONCATENATE(A1," ",B1)  or  =A1&" "&B1   Join text
+=TEXT(B2,"0.0%")  Format a number as percentage text
+```
+
+**LEN in depth — characters vs words:**
+
+LEN = **Len**gth. It counts every single character including spaces:
+```
+=LEN("Hello World")   → 11   (H-e-l-l-o-[space]-W-o-r-l-d)
+=LEN("Data")          → 4
+=LEN("")              → 0
+```
+
+LEN does **not** count words. To count words you need a workaround:
+```
+=LEN(TRIM(A1)) - LEN(SUBSTITUTE(A1," ","")) + 1
+```
+
+| Step | Formula piece | What it does |
+|------|---------------|--------------|
+| 1 | `TRIM(A1)` | Remove leading/trailing/extra spaces |
+| 2 | `LEN(TRIM(A1))` | Total character count |
+| 3 | `SUBSTITUTE(A1," ","")` | Remove ALL spaces |
+| 4 | `LEN(...)` of step 3 | Character count without spaces |
+| 5 | Step 2 − Step 4 + 1 | Spaces = words − 1, so +1 = word count |
+
+**Example:** "Hello World" → LEN=11, no-spaces LEN=10, difference=1 space → 1+1 = **2 words** ✓
+
+> **Exam tip (True/False):** "LEN can be used to count the number of words in a cell" — **False**. LEN counts **characters**. Counting words requires combining LEN with SUBSTITUTE and TRIM. On its own, `=LEN("Hello World")` returns 11 (characters), not 2 (words).
+
+**Date Functions:**
+```
+=TODAY()                      Today's date (no arguments needed)
+=NOW()                        Current date & time
+=DATE(year, month, day)       Build a date from three separate values
+=YEAR(A1)                     Extract the year from a date
+=MONTH(A1)                    Extract the month (1–12) from a date
+=DAY(A1)                      Extract the day (1–31) from a date
+=DATEDIF(A1,TODAY(),"D")      Days between two dates
+```
+
+**DATE() in depth:**  
+`=DATE(year, month, day)` creates an Excel date serial number from three numeric arguments.  
+- `=DATE(2026, 2, 19)` → 19/02/2026  
+- `=DATE(A2, B2, C2)` → combines year/month/day stored in separate cells  
+- Useful when importing data where year, month, and day arrive as separate columns  
+
+> **Exam tip (True/False):** "The DATE function allows you to create a date by specifying year, month, and day as separate arguments" — **True**.
+                """,
+            "key_points": [
+                "XLOOKUP is the modern replacement for VLOOKUP — works in both directions",
+                "INDEX/MATCH works in all Excel versions and is more flexible",
+                "IFERROR wraps any formula to handle errors gracefully",
+                "COUNTIFS / SUMIFS accept multiple criteria (AND logic)",
+                "DATE(year, month, day) builds a date from three separate numeric arguments — useful when year/month/day are in different cells",
+                "CHOOSE(index, val1, val2, …) returns the value at the given index position — index 1 = first value",
+                "LEN counts characters, not words — =LEN('Hello World') returns 11, not 2",
+                "OFFSET(ref, rows, cols) returns a reference shifted by rows/columns from a starting cell — useful for dynamic ranges",
+                "COUNTIFS counts rows where ALL conditions are TRUE simultaneously (AND logic) — add the S suffix for multiple criteria",
+                "ISNUMBER returns TRUE if a cell contains a numeric value — ISTEXT, ISBLANK, ISFORMULA, ISERROR cover the other types"
+            ]
+        },
+        {
+            "title": "1.8 Data Validation & Workbook Protection",
+            "content": """
+**Controlling What Users Can Enter**
+
+**Data Validation:**
+`Data → Data Validation`
+
+Prevents incorrect data entry before it happens — much better than cleaning it after.
+
+**Validation Types:**
+| Type | Example Use Case |
+|------|-----------------|
+| Whole Number | Age must be between 0 and 120 |
+| Decimal | Score must be between 0.0 and 100.0 |
+| List | Region must be North, South, East, or West |
+| Date | Date must be between 01/01/2020 and today |
+| Text Length | Code must be exactly 5 characters |
+| Custom formula | `=AND(A1>=0, A1<=100)` |
+
+**Creating a Dropdown List:**
+1. Select destination cells (e.g. E2:E31)
+2. Data → Data Validation → Allow: List
+3. Source: type `North,South,East,West` (comma-separated)
+   — or select a range like `$H$1:$H$4` for a dynamic list
+
+**Input Message & Error Alert:**
+- **Input Message** tab: shows a tooltip when the cell is selected
+- **Error Alert** tab: configure Stop (blocks invalid), Warning (warns), or Information (just notifies)
+
+**Protecting a Worksheet:**
+`Review → Protect Sheet`
+- Set a password (optional)
+- Choose what users CAN still do (select cells, format, etc.)
+- Prevents accidental edits to formulas or structural data
+
+**Protecting Specific Cells:**
+By default, ALL cells are "Locked". To allow editing in some cells:
+1. Select the cells you want editable
+2. `Home → Format → Format Cells → Protection → uncheck Locked`
+3. Then protect the sheet — only the unlocked cells remain editable
+
+**Workbook Protection:**
+`Review → Protect Workbook` — prevents adding/moving/deleting sheets
+
+**Hiding Formulas:**
+Format Cells → Protection → check Hidden → Protect Sheet  
+(Users see results but cannot see the formula in the formula bar)
+
+**SPF Practical Example:**
+Student entry form with validation:
+- Name column: Text length 3–50 characters
+- Score columns: Whole number 0–100, Error Alert "Stop", message "Score must be 0–100"
+- Class column: Dropdown list → Class A, Class B, Class C
+                """,
+            "key_points": [
+                "Data Validation is in the Data tab — 'List' creates dropdowns",
+                "Uncheck 'Locked' on editable cells, then Protect Sheet",
+                "Stop error alerts completely block invalid entries",
+                "Workbook Protection prevents sheet structure changes"
+            ]
+        },
+        {
+            "title": "1.9 Power Query — Importing & Transforming Data",
+            "content": """
+**Power Query: Get & Transform Data**
+
+Power Query lets you connect to external data sources, clean and reshape data, and refresh automatically — all without writing formulas.
+
+**Where to find it:**
+`Data → Get & Transform Data → Get Data`
+
+**Common Data Sources:**
+
+| Source | Import path | Structured? |
+|--------|------------|-------------|
+| **Excel Workbook** | `Get Data → From File → From Workbook` | ✅ Yes |
+| **CSV / Text file** | `Get Data → From File → From Text/CSV` | ✅ Yes |
+| **Access Database** | `Get Data → From Database → From Microsoft Access Database` | ✅ Yes |
+| **SQL Server** | `Get Data → From Database → From SQL Server` | ✅ Yes |
+| **Web (HTML table)** | `Get Data → From Other Sources → From Web` | ✅ Yes |
+| **SharePoint / OneDrive** | `Get Data → From Online Services` | ✅ Yes |
+| **JSON / XML** | `Get Data → From File → From JSON / From XML` | ✅ Yes |
+| **PDF** | Technically possible in Excel 365 but ❌ **not a common structured source** | ⚠️ Unreliable |
+
+> **Exam tip (multiple choice):** "Which is NOT a common dataset type Excel can import?" — **PDF**. CSV, Access Databases, and Excel Workbooks are all standard structured import sources with full native support. PDF is a fixed-layout presentation format designed for humans to read, not for machines to parse as data. Even though Excel 365 added experimental PDF import via Power Query, it is not considered a common or reliable data source.
+
+**Opening Power Query Editor:**
+`Data → Get Data → From File → From Excel/CSV`  
+After selecting a file, click **Transform Data** (not Load) to open the editor.
+
+**Common Transformations:**
+
+| Task | Power Query Action |
+|------|--------------------|
+| Remove columns | Right-click column → Remove |
+| Rename columns | Double-click column header |
+| Change data type | Click type icon (ABC, 123, Date) |
+| Filter rows | Column dropdown → filter |
+| Remove duplicate rows | Home → Remove Rows → Remove Duplicates |
+| Fill down empty cells | Transform → Fill → Down |
+| Split column | Transform → Split Column → By Delimiter |
+| Merge (join) tables | Home → Merge Queries |
+| Append tables | Home → Append Queries (stack rows) |
+| Pivot/Unpivot | Transform → Pivot Column / Unpivot Columns |
+
+**Applied Steps:**
+Every transformation is saved as a step in the right panel.  
+- Click any step to preview that stage of data
+- Delete or reorder steps if needed
+- Steps are written in **M language** (Power Query Formula Language)
+
+**Loading Data:**
+`Home → Close & Load` — loads data into a **new worksheet** as a Table (default)  
+`Home → Close & Load To…` — opens the Import Data dialog with six destination options:
+
+| # | Destination | Description |
+|---|-------------|-------------|
+| 1 | **Table — New worksheet** | Same as plain Close & Load; creates a new sheet (default) |
+| 2 | **Table — Existing worksheet** | Places the table at a cell you specify on any existing sheet |
+| 3 | **PivotTable Report** | Loads data directly into a new PivotTable (no sheet table) |
+| 4 | **PivotChart** | Loads data directly into a new PivotChart with an associated PivotTable |
+| 5 | **Only Create Connection** | No data written to any sheet — keeps the query available to feed the Data Model or other queries |
+| 6 | **Add to Data Model** | Loads into Power Pivot's in-memory model for relationships and DAX measures |
+
+> ⚠️ **Exam tip:** "Close & Load" and "Close & Load To…" behave differently. You are **not** limited to a new worksheet — there are six load destinations in total.
+
+**Refreshing:**
+When source file changes: `Data → Refresh All`  
+All Power Query connections update automatically.
+
+**Example Workflow — Importing a CSV File into Excel:**
+
+**What a CSV file looks like (it is already plain text — no conversion needed):**
+```
+Name,Age,Department,Salary
+Alice,32,Marketing,55000
+Bob,28,Engineering,72000
+```
+
+**The actual import steps:**
+
+| Step | Action | Notes |
+|------|--------|-------|
+| 1 | Open Excel (new workbook) | You need an open workbook to import into |
+| 2 | `Data → Get Data → From File → From Text/CSV` | Launches the file browser |
+| 3 | **Navigate to the CSV file location** and select it | Browse folders to find your file |
+| 4 | Excel previews data — **confirm the delimiter** (comma, semicolon, tab…) | Excel usually auto-detects; verify it is correct |
+| 5 | Click **Load** or **Transform Data** | Load = straight to sheet; Transform = open Power Query editor |
+
+**What is NOT a step:**
+- ❌ **Converting the data to plain text** — CSV files ARE already plain text (`.csv` = comma-separated values stored as text). No pre-conversion is ever required before importing.
+
+> **Exam tip (multiple choice):** The step that is NOT involved in importing a CSV is **"converting the data to plain text format"**. CSV is a plain text format by definition. The real steps are: open a workbook, navigate to the file, confirm the delimiter, and load.
+
+**Full workflow with Power Query:**
+1. Data → Get Data → From File → From CSV
+2. Transform Data → opens editor
+3. Rename columns to "Name", "Maths", "Science", "English"
+4. Change Maths/Science/English to decimal type
+5. Remove any blank rows (Home → Remove Rows → Remove Blank Rows)
+6. Close & Load → new sheet with clean table
+7. Later: replace CSV file with new version → Refresh All → table updates instantly
+                """,
+            "key_points": [
+                "Power Query records every step — fully repeatable and auditable",
+                "Refresh All updates all queries when source data changes",
+                "Merge Queries = JOIN, Append Queries = stack rows vertically",
+                "Change data type early — numbers imported as text cause formula errors",
+                "Close & Load To… offers 6 destinations: new worksheet, existing worksheet, PivotTable, PivotChart, Connection Only, or Add to Data Model — you are NOT limited to a new worksheet",
+                "Common import sources: CSV, Excel Workbook, Access Database, SQL Server, Web, JSON/XML — PDF is NOT a standard structured import source",
+                "CSV files are already plain text — no conversion is needed before importing; the real steps are: open workbook, navigate to file, confirm delimiter, load"
+            ]
+        },
+        {
+            "title": "1.10 Macros & Automation with VBA",
+            "content": """
+**Automating Repetitive Tasks**
+
+**What is a Macro?**
+A macro is a recorded sequence of actions — or a small program written in VBA (Visual Basic for Applications) — that you can replay with one click or a keyboard shortcut.
+
+**Option A: Record a Macro (No coding required)**
+1. `View → Macros → Record Macro`
+2. Give it a name (no spaces) and optionally assign a shortcut key
+3. Choose where to store it (This Workbook vs Personal Macro Workbook)
+4. Perform your actions
+5. `View → Macros → Stop Recording`
+6. Run it: `View → Macros → View Macros → Run`
+
+**Option B: Write VBA**
+`Developer tab → Visual Basic` (or `Alt+F11`)
+
+```vba
+' Simple VBA example — highlight cells below 60 in Maths column
+Sub HighlightFails()
+    Dim ws As Worksheet
+    Dim cell As Range
+
+    Set ws = ThisWorkbook.Sheets("Sheet1")
+
+    For Each cell In ws.Range("B2:B31")
+        If cell.Value < 60 Then
+            cell.Interior.Color = RGB(255, 0, 0)  ' Red fill
+        Else
+            cell.Interior.ColorIndex = xlNone     ' Clear fill
+        End If
+    Next cell
+
+    MsgBox "Done! Fails highlighted in red."
+End Sub
+```
+
+**Common VBA Concepts:**
+| Concept | Meaning |
+|---------|---------|
+| `Sub` / `End Sub` | Start and end a macro |
+| `Dim x As Type` | Declare a variable (Integer, String, Range…) |
+| `For Each … Next` | Loop through cells |
+| `If … Then … Else … End If` | Conditional logic |
+| `Range("A1")` | Reference a cell or range |
+| `MsgBox "text"` | Show a popup message |
+| `Cells(row, col)` | Reference a cell by row/column numbers |
+| `ws.Range("B2:B31")` | Range on a specific sheet |
+
+**Excel File Formats — Know the Difference:**
+
+| Format | Full Name | Default for | Stores Macros? |
+|--------|-----------|-------------|----------------|
+| **.xls** | Excel 97-2003 Workbook | Excel 97–2003 *(legacy)* | Yes (binary, legacy) |
+| **.xlsx** | Excel Workbook (Open XML) | **Excel 2007–present ← current default** | ❌ No |
+| **.xlsm** | Excel Macro-Enabled Workbook | When VBA/macros are needed | ✅ Yes |
+| **.xlsb** | Excel Binary Workbook | Very large files (faster) | ✅ Yes |
+| **.csv** | Comma-Separated Values | Data exchange / import | ❌ No |
+
+> **Exam tip (True/False):** "XLS is the default file format in recent versions of Microsoft Excel" — **False**. **.xlsx** has been the default since Excel 2007. **.xls** is the *legacy* binary format from Excel 97–2003.
+
+**Save as Macro-Enabled Workbook:**
+`File → Save As → Excel Macro-Enabled Workbook (.xlsm)`  
+⚠ Standard `.xlsx` files strip macros when saved.
+
+**Assigning a Button:**
+1. `Developer → Insert → Button (Form Control)`
+2. Draw the button on the sheet
+3. Assign Macro → select your macro
+4. Click the button to run it
+
+**Security Note:**
+Macros can be used maliciously. Only enable macros from trusted sources.  
+`File → Options → Trust Center → Macro Settings → Disable all with notification`
+
+**Pro Tip — Personal Macro Workbook:**
+Store frequently used macros in the Personal Macro Workbook so they are available in every Excel file you open.
+                """,
+            "key_points": [
+                "Record a macro for actions you repeat regularly — no coding needed",
+                "VBA macros use Sub / End Sub and are written in the Visual Basic Editor (Alt+F11)",
+                "Save as .xlsm to preserve macros — .xlsx removes them",
+                "Assign macros to buttons for one-click execution",
+                ".xlsx is the current default format (since Excel 2007) — .xls is the legacy Excel 97-2003 format"
+            ]
+        },
+        {
+            "title": "1.11 Example Exam Assignment — CA Lesson 1 Dataset",
+            "content": """
+**CA Lesson 1 Dataset — Worked Exam Assignment (Q21)**
+
+This is the full worked solution for the CA Lesson 1 exam assignment.  
+The dataset is: **CA Lesson 1 dataset.xlsx** — 20 rows of daily product sales.
+
+---
+
+**The Dataset (20 rows):**
+
+| Row | Date | Product ID | Units Sold | Price per Unit |
+|-----|------|-----------|-----------|---------------|
+| 2 | 2023-09-01 | P001 | 15 | $10 |
+| 3 | 2023-09-02 | P002 | 10 | $12 |
+| 4 | 2023-09-03 | P001 | 20 | $10 |
+| 5 | 2023-09-04 | P003 | 5 | $15 |
+| 6 | 2023-09-05 | P002 | 12 | $12 |
+| 7 | 2023-09-06 | P001 | 18 | $10 |
+| 8 | 2023-09-07 | P004 | 8 | $14 |
+| 9 | 2023-09-08 | P002 | 9 | $12 |
+| 10 | 2023-09-09 | P001 | 25 | $10 |
+| 11 | 2023-09-10 | P003 | 7 | $15 |
+| 12 | 2023-09-11 | P002 | 14 | $12 |
+| 13 | 2023-09-12 | P001 | 22 | $10 |
+| 14 | 2023-09-13 | P004 | 10 | $14 |
+| 15 | 2023-09-14 | P002 | 11 | $12 |
+| 16 | 2023-09-15 | P001 | 28 | $10 |
+| 17 | 2023-09-16 | P003 | 6 | $15 |
+| 18 | 2023-09-17 | P002 | 16 | $12 |
+| 19 | 2023-09-18 | P001 | 24 | $10 |
+| 20 | 2023-09-19 | P004 | 9 | $14 |
+| 21 | 2023-09-20 | P002 | 13 | $12 |
+
+*Columns: A=Date, B=Product ID, C=Units Sold, D=Price per Unit (header in row 1, data in rows 2–21)*
+
+---
+
+**Q21.1 — Total number of units sold for all products combined**
+
+> **Answer: 282**
+
+```
+=SUM(C2:C21)
+```
+**Why:** SUM adds every value in the Units Sold column (C2 to C21) in one operation.  
+Verify: 15+10+20+5+12+18+8+9+25+7+14+22+10+11+28+6+16+24+9+13 = **282**
+
+---
+
+**Q21.2 — Average price per unit for all products**
+
+> **Answer: 12.05**
+
+```
+=AVERAGE(D2:D21)
+```
+**Why:** AVERAGE sums all Price per Unit values and divides by the count.  
+The prices in the dataset are: $10 (×7 for P001), $12 (×7 for P002), $15 (×3 for P003), $14 (×3 for P004).  
+Calculation: (10×7 + 12×7 + 15×3 + 14×3) ÷ 20 = (70+84+45+42) ÷ 20 = 241 ÷ 20 = **12.05**
+
+---
+
+**Q21.3 — Highest number of units sold for a single product on any given day**
+
+> **Answer: 28**
+
+```
+=MAX(C2:C21)
+```
+**Why:** MAX scans all 20 values in Units Sold and returns the largest.  
+Scanning the data: the row 2023-09-15, P001, **28 units** is the highest.
+
+---
+
+**Q21.4 — Lowest price per unit among all products**
+
+> **Answer: 10**
+
+```
+=MIN(D2:D21)
+```
+**Why:** MIN returns the smallest value in the range.  
+The prices are $10, $12, $14, $15 — the minimum is **$10** (P001 rows).
+
+---
+
+**Q21.5 — Number of days when product "P002" was sold**
+
+> **Answer: 7**
+
+```
+=COUNTIF(B2:B21,"P002")
+```
+**Why:** COUNTIF counts every cell in B2:B21 that exactly matches "P002".  
+P002 appears on: Sep 02, Sep 05, Sep 08, Sep 11, Sep 14, Sep 17, Sep 20 = **7 days**
+
+---
+
+**Q21.6 — IF P001 on September 10th > 20: "High Sales", else "Low Sales"**
+
+> **Answer: Low Sales**
+
+```
+=IF(SUMIFS(C2:C21, A2:A21, DATE(2023,9,10), B2:B21, "P001")>20, "High Sales", "Low Sales")
+```
+**Why:** Look at the dataset — on 2023-09-10, the product sold was **P003** (not P001).  
+There is no P001 entry on September 10th.  
+`SUMIFS` returns **0** for P001 on Sep 10 (no matching rows).  
+Since 0 is NOT greater than 20 → condition is FALSE → result = **"Low Sales"**
+
+| What Excel checks | Value |
+|------------------|-------|
+| SUMIFS(P001 + Sep10) | 0 |
+| 0 > 20? | FALSE |
+| Result | **Low Sales** |
+
+---
+
+**Q21.7 — "Product Details" column = Product ID concatenated with Price per Unit for 2023-09-16**
+
+> **Answer: P003$15**
+
+```
+=B17&D17
+```
+(Row 17 = date 2023-09-16)
+
+**Why:** The `&` operator (or `=CONCAT(B17,D17)`) joins the two cell values as text.  
+Row 17: Product ID = **P003**, Price per Unit = **$15** (stored as text with $ sign)  
+P003 + $15 = **P003$15**
+
+---
+
+**Q21.8 — Leftmost 4 characters of Product ID for row with date 2023-09-06**
+
+> **Answer: P001**
+
+```
+=LEFT(B7, 4)
+```
+(Row 7 = date 2023-09-06)
+
+**Why:** `LEFT(text, num_chars)` extracts characters from the start of the string.  
+Row 7: Product ID = **P001** — and P001 is exactly 4 characters long.  
+LEFT(P001, 4) = **P001**
+
+| Character position | 1 | 2 | 3 | 4 |
+|-------------------|---|---|---|---|
+| Character | P | 0 | 0 | 1 |
+| LEFT(4) extracts | ✅ | ✅ | ✅ | ✅ |
+
+---
+
+**Q21.9 — Rightmost 3 characters of Product ID for row with date 2023-09-14**
+
+> **Answer: 002**
+
+```
+=RIGHT(B15, 3)
+```
+(Row 15 = date 2023-09-14)
+
+**Why:** `RIGHT(text, num_chars)` extracts characters from the END of the string.  
+Row 15: Product ID = **P002**  
+RIGHT(P002, 3) counts 3 chars from the right → **002**
+
+| Character position | 1 | 2 | 3 | 4 |
+|-------------------|---|---|---|---|
+| Character | P | 0 | 0 | 2 |
+| RIGHT(3) extracts | ❌ | ✅ | ✅ | ✅ |
+
+---
+
+**Summary of all 9 answers:**
+
+| Q | Task | Excel Formula | Answer |
+|---|------|--------------|--------|
+| 21.1 | Total units sold | `=SUM(C2:C21)` | **282** |
+| 21.2 | Average price per unit | `=AVERAGE(D2:D21)` | **12.05** |
+| 21.3 | Highest units sold (one day) | `=MAX(C2:C21)` | **28** |
+| 21.4 | Lowest price per unit | `=MIN(D2:D21)` | **10** |
+| 21.5 | Days P002 was sold | `=COUNTIF(B2:B21,"P002")` | **7** |
+| 21.6 | P001 on Sep 10 > 20? | `=IF(SUMIFS(...)>20,"High Sales","Low Sales")` | **Low Sales** |
+| 21.7 | Product Details (Sep 16) | `=B17&D17` | **P003$15** |
+| 21.8 | Left 4 chars (Sep 06) | `=LEFT(B7,4)` | **P001** |
+| 21.9 | Right 3 chars (Sep 14) | `=RIGHT(B15,3)` | **002** |
+
+---
+
+**How to do each one step-by-step in Excel:**
+
+**Before you start — open the file:**
+1. Open Excel → `File → Open` → select **CA Lesson 1 dataset.xlsx**
+2. Your data is in columns A (Date), B (Product ID), C (Units Sold), D (Price per Unit)
+3. Row 1 = headers. Data is in rows 2–21.
+4. Click an **empty cell** (e.g. F2) to enter your answer formula
+
+---
+
+**Q21.1 — SUM: Total units sold**
+```
+Steps in Excel:
+1. Click an empty cell (e.g. F2)
+2. Type:  =SUM(C2:C21)
+3. Press Enter
+4. Result: 282
+```
+> **What Excel does:** Adds every number in C2 through C21 in one step.  
+> You can also click the AutoSum button (Σ) on the Home tab → select the range → Enter.
+
+---
+
+**Q21.2 — AVERAGE: Mean price per unit**
+```
+Steps in Excel:
+1. Click an empty cell (e.g. F3)
+2. Type:  =AVERAGE(D2:D21)
+3. Press Enter
+4. Result: 12.05
+```
+> **What Excel does:** Sums all values in D2:D21 then divides by 20 (the count).  
+> ⚠ The Price per Unit column has a $ sign — if Excel stored it as TEXT, you need  
+> to strip the $ first using: =AVERAGE(VALUE(SUBSTITUTE(D2:D21,"$","")))  
+> (Enter as array formula with Ctrl+Shift+Enter in older Excel versions)
+
+---
+
+**Q21.3 — MAX: Highest units sold**
+```
+Steps in Excel:
+1. Click an empty cell (e.g. F4)
+2. Type:  =MAX(C2:C21)
+3. Press Enter
+4. Result: 28
+```
+> **What Excel does:** Scans every cell in C2:C21 and returns the largest number.  
+> Tip: To find WHICH row has the max, use: =MATCH(MAX(C2:C21),C2:C21,0)+1  
+> This returns row number 16 → row 16 = 2023-09-15, P001.
+
+---
+
+**Q21.4 — MIN: Lowest price per unit**
+```
+Steps in Excel:
+1. Click an empty cell (e.g. F5)
+2. Type:  =MIN(D2:D21)
+3. Press Enter
+4. Result: 10
+```
+> **What Excel does:** Finds the smallest value in the range. Opposite of MAX.
+
+---
+
+**Q21.5 — COUNTIF: Count days P002 was sold**
+```
+Steps in Excel:
+1. Click an empty cell (e.g. F6)
+2. Type:  =COUNTIF(B2:B21,"P002")
+3. Press Enter
+4. Result: 7
+```
+> **What Excel does:** Goes through every cell B2 to B21.  
+> If the cell value exactly matches "P002" → counts it. Total = 7.  
+> ⚠ The criteria "P002" MUST be in double quotes — it is a text string.  
+> Without quotes: =COUNTIF(B2:B21,P002) → Excel treats P002 as a cell address → wrong.
+
+---
+
+**Q21.6 — IF + SUMIFS: Conditional "High Sales" / "Low Sales"**
+```
+Steps in Excel:
+1. Click an empty cell (e.g. F7)
+2. Type:  =IF(SUMIFS(C2:C21,B2:B21,"P001",A2:A21,DATE(2023,9,10))>20,"High Sales","Low Sales")
+3. Press Enter
+4. Result: Low Sales
+```
+
+**Step 1 — Look at the actual data for September 10th:**
+
+| Row | Date | Product ID | Units Sold |
+|-----|------|-----------|-----------|
+| 11 | 2023-09-10 | **P003** | 7 |
+
+September 10th has **P003**, not P001. P001 was never sold on that date.  
+P001 only appears on: Sep 01, 03, 06, 09, 12, 15, 18 — it skips Sep 10 entirely.
+
+**Step 2 — What SUMIFS returns when there is no match:**
+```
+SUMIFS(C2:C21,          ← sum the Units Sold column
+       B2:B21,"P001",   ← Condition 1: Product ID must = "P001"
+       A2:A21,DATE(...))← Condition 2: Date must = 2023-09-10
+```
+SUMIFS requires **both conditions to be true at the same time** in the same row.  
+No single row has BOTH P001 AND Sep 10 → SUMIFS finds **zero matching rows** → returns **0**.
+
+**Step 3 — The IF logic:**
+```
+IF( 0 > 20, "High Sales", "Low Sales" )
+       ↓
+    FALSE  →  "Low Sales"
+```
+`0 > 20` is **FALSE**, so Excel goes to the *else* branch → **"Low Sales"**
+
+> **The exam trap:** The question says "P001 on September 10th" — but if you check  
+> the data, P001 simply does not exist on that date. The exam is testing whether  
+> you actually look at the data rather than assume the product was sold every day.
+
+**Memory rule:**
+```
+Row EXISTS  → SUMIFS returns the number → check if > 20
+Row MISSING → SUMIFS returns 0          → 0 > 20 = FALSE = "Low Sales"
+```
+
+---
+
+**Q21.7 — Concatenation: Product Details for Sep 16**
+```
+Steps in Excel:
+1. Click cell E2 (to create the new "Product Details" column)
+2. Type the header in E1:  Product Details
+3. In E2, type:  =B2&D2   then press Enter
+4. Double-click the fill handle (bottom-right corner of E2) to copy down to E21
+5. Find row 17 (date 2023-09-16) → result in E17: P003$15
+```
+
+**Step 1 — Find the row for 2023-09-16:**
+
+| Row | Date | Product ID (col B) | Price per Unit (col D) |
+|-----|------|--------------------|----------------------|
+| 17 | 2023-09-16 | **P003** | **$15** |
+
+**Step 2 — What "concatenate" means:**
+
+Concatenate = **join two pieces of text together into one string**, no maths involved.
+
+**There are 2 methods in Excel — both give the exact same result:**
+
+| Method | Formula | When to use |
+|--------|---------|-------------|
+| **Method 1 — & operator** | `=B17&D17` | Quickest to type; works in all Excel versions |
+| **Method 2 — CONCAT()** | `=CONCAT(B17,D17)` | More readable; good when joining many cells |
+
+```
+Method 1:  =B17&D17           → P003$15
+Method 2:  =CONCAT(B17,D17)   → P003$15
+```
+Both take whatever text is in B17, stick whatever text is in D17 directly onto the end,  
+with **no space or separator** between them.
+
+**Step 3 — What the cells actually contain:**
+```
+B17 = "P003"   ← text — the product code
+D17 = "$15"    ← text — stored with the dollar sign as part of the string
+
+"P003" & "$15"
+      ↓
+  "P003$15"
+```
+
+> **Why "$15" and not just "15"?**  
+> The Price per Unit column was entered/stored as **text with the $ already included** —  
+> it is not a number formatted as currency. If it were a pure number (15), the result  
+> would be `P00315`. Because the cell contains the text string `$15`, you get `P003$15`.
+
+> **Exam trap:** The question asks for a specific row (Sep 16), not just any row.  
+> You must look up which product is on that date first (P003, $15), then concatenate —  
+> picking the wrong row gives the wrong answer.
+
+> If you want a space between them: `=B17&" "&D17` → "P003 $15"  
+> If you want a dash: `=B17&"-"&D17` → "P003-$15"
+
+**What does this mean in a real-world scenario?**
+
+Imagine you work in a warehouse. You have a spreadsheet with separate columns for:
+- **Product ID** (e.g. P003)
+- **Price per Unit** (e.g. $15)
+
+Your manager asks you to generate a **single label** for each product to print on a shelf tag or export to another system. Instead of manually typing "P003$15" for every row, you use concatenation to **build the label automatically from the existing data**.
+
+Real examples of when you would use this:
+
+| Situation | Columns joined | Result |
+|-----------|---------------|--------|
+| Shelf label | Product ID + Price | `P003$15` |
+| Full name from separate columns | First name + " " + Last name | `John Smith` |
+| Address line | Street + ", " + City | `Main St, Oslo` |
+| Product code + size | Code + "-" + Size | `SHIRT-XL` |
+| Email from name + domain | Username + "@" + Domain | `john@noroff.no` |
+
+> **Key insight:** Concatenation does NOT change the original data in columns B and D.  
+> It creates a **new combined value** in a new column — the source cells stay untouched.  
+> This is why you always put the formula in a **new column (E)**, not over the existing data.
+
+---
+
+**Q21.8 — LEFT: Extract first 4 characters (Sep 06)**
+```
+Steps in Excel:
+1. Click an empty cell (e.g. G7)
+2. Type:  =LEFT(B7,4)
+3. Press Enter
+4. Result: P001
+```
+
+**Step 1 — Find the row for 2023-09-06:**
+
+| Row | Date | Product ID (col B) |
+|-----|------|-------------------|
+| 7 | 2023-09-06 | **P001** |
+
+**Step 2 — What LEFT does:**
+
+`LEFT(text, num_chars)` starts at the **first character** and counts right, extracting however many characters you ask for.
+```
+=LEFT(B7, 4)
+       ↑   ↑
+       |   └── how many characters to extract from the left
+       └─────── the cell containing the text
+```
+
+**Step 3 — Count the characters in P001:**
+```
+P  0  0  1
+↑  ↑  ↑  ↑
+1  2  3  4   ← character positions
+
+LEFT(4) extracts positions 1, 2, 3, 4  →  P001
+```
+Since `P001` is exactly 4 characters long, `LEFT(4)` returns the **entire string**.
+
+> **Why is this useful in practice?**  
+> Imagine product codes like `P001-BLUE-XL` — you only want the base code `P001`.  
+> `LEFT(4)` pulls just those 4 characters and ignores everything after them.  
+> In this dataset the IDs happen to be exactly 4 chars, so it returns the whole  
+> thing — but the skill is the same for any longer code.
+
+**LEFT vs RIGHT vs MID — comparison on "P001":**
+
+| Function | What it extracts | Result |
+|----------|-----------------|--------|
+| `=LEFT(B7, 4)` | First 4 from the **start** | `P001` |
+| `=LEFT(B7, 2)` | First 2 from the start | `P0` |
+| `=RIGHT(B7, 3)` | Last 3 from the **end** | `001` |
+| `=MID(B7, 2, 2)` | 2 chars starting at position 2 | `00` |
+
+---
+
+**Q21.9 — RIGHT: Extract last 3 characters (Sep 14)**
+```
+Steps in Excel:
+1. Click an empty cell (e.g. G15)
+2. Type:  =RIGHT(B15,3)
+3. Press Enter
+4. Result: 002
+```
+
+**Step 1 — Find the row for 2023-09-14:**
+
+| Row | Date | Product ID (col B) |
+|-----|------|-------------------|
+| 15 | 2023-09-14 | **P002** |
+
+**Step 2 — What RIGHT does:**
+
+`RIGHT(text, num_chars)` starts at the **last character** and counts backwards (left), extracting however many characters you ask for.
+```
+=RIGHT(B15, 3)
+        ↑    ↑
+        |    └── how many characters to extract from the right
+        └──────── the cell containing the text
+```
+
+**Step 3 — Count the characters in P002:**
+```
+P  0  0  2
+↑  ↑  ↑  ↑
+1  2  3  4   ← character positions from the LEFT
+
+RIGHT(3) counts 3 from the END:
+         ↑  ↑  ↑
+         2  3  4  ← these positions are extracted  →  "002"
+```
+The `P` at position 1 is **not included** — only the last 3 characters are pulled.
+
+**Why "002" and not "P002" or just "2"? — RIGHT with different numbers:**
+
+| Formula | Characters extracted | Result |
+|---------|---------------------|--------|
+| `=RIGHT(B15, 1)` | last 1 → `2` | `2` |
+| `=RIGHT(B15, 2)` | last 2 → `02` | `02` |
+| `=RIGHT(B15, 3)` | last 3 → `002` | **002** ← exam answer |
+| `=RIGHT(B15, 4)` | last 4 → `P002` | `P002` |
+
+> **Why is RIGHT useful in practice?**  
+> Imagine order codes like `ORD-2026-002` — you only want the last 3 digits (the order  
+> number `002`). `RIGHT(3)` extracts just that, regardless of what came before it.
+
+| Situation | Full code | RIGHT(3) extracts |
+|-----------|-----------|-------------------|
+| Order number suffix | `ORD-2026-002` | `002` |
+| Product suffix in this exam | `P002` | `002` |
+| Last 3 of phone | `+4712345678` | `678` |
+| Country code at end | `PROD-NO` | `-NO` |
+
+> **LEFT vs RIGHT — the key difference:**  
+> `LEFT` counts from the **start** → gives you the beginning of the text  
+> `RIGHT` counts from the **end** → gives you the tail of the text  
+> Both need: the cell and the number of characters to extract.
+                """,
+            "key_points": [
+                "SUM, AVERAGE, MAX, MIN operate on a numeric range — always check column letters match your dataset",
+                "COUNTIF(range, criteria) counts cells that match — criteria must be in quotes for text: \"P002\"",
+                "IF + SUMIFS combo: SUMIFS returns 0 when no row matches — 0 > 20 is FALSE so the result is the else value",
+                "& (ampersand) concatenates text from two cells — same as CONCAT(A,B)",
+                "LEFT(text, n) extracts n chars from the start; RIGHT(text, n) extracts n chars from the end",
+                "In this dataset row 7 = Sep 06, row 15 = Sep 14, row 17 = Sep 16 (row 1 is the header)"
+            ],
+            "dataset_file": "CA Lesson 1 dataset - Resolved.xlsx"
+        },
+        {
+            "title": "1.12 Example Exam Assignment — CA Lesson 3 Dataset (Lookup Functions)",
+            "content": """
+**CA Lesson 3 Dataset — Worked Exam Assignment (Q22)**
+
+The dataset is: **CA Lesson 3 dataset.xlsx** — 20 employees.
+
+---
+
+**The Dataset (20 rows):**
+
+| Row | Employee ID | Employee Name | Department | Salary |
+|-----|------------|--------------|-----------|--------|
+| 2 | 101 | Alice | HR | 50000 |
+| 3 | 102 | Bob | IT | 60000 |
+| 4 | 103 | Carol | Sales | 55000 |
+| 5 | 104 | Dave | IT | 62000 |
+| 6 | 105 | Eve | HR | 48000 |
+| 7 | 106 | Frank | Sales | 56000 |
+| 8 | 107 | Grace | Finance | 58000 |
+| 9 | 108 | Harry | IT | 63000 |
+| 10 | 109 | Irene | HR | 52000 |
+| 11 | 110 | Jack | Sales | 57000 |
+| 12 | 111 | Karen | IT | 61000 |
+| 13 | 112 | Leo | Finance | 59000 |
+| 14 | 113 | Maria | Sales | 54000 |
+| 15 | 114 | Neil | Finance | 57000 |
+| 16 | 115 | Olivia | HR | 49000 |
+| 17 | 116 | Paul | IT | 64000 |
+| 18 | 117 | Quin | Sales | 58000 |
+| 19 | 118 | Rachel | HR | 51000 |
+| 20 | 119 | Sam | Finance | 60000 |
+| 21 | 120 | Tina | IT | 62000 |
+
+*Columns: A=Employee ID, B=Employee Name, C=Department, D=Salary. Header row 1, data rows 2–21.*
+
+---
+
+**Q22.1 — Carol's salary using VLOOKUP**
+
+> **Answer: 55000**
+> **Formula: =VLOOKUP("Carol",B2:D21,3,FALSE)**
+
+**Step 1 — Find Carol in the dataset:**
+
+| Row | Employee Name (col B) | Department (col C) | Salary (col D) |
+|-----|-----------------------|-------------------|---------------|
+| 4 | **Carol** | Sales | **55000** |
+
+**Step 2 — How VLOOKUP works (annotated):**
+```
+=VLOOKUP( "Carol" , B2:D21 , 3 , FALSE )
+           ↑          ↑       ↑     ↑
+           │          │       │     └── FALSE = exact match (always use this)
+           │          │       └──────── col 3 of the table = D (Salary)
+           │          └──────────────── search this table (B=Name, C=Dept, D=Salary)
+           └─────────────────────────── what to search for
+```
+
+**Step 3 — Why col_index = 3?**
+
+VLOOKUP counts columns from the **start of your table range**, not from column A:
+```
+Table range B2:D21:
+  Column B = position 1 (Employee Name)  ← VLOOKUP searches HERE
+  Column C = position 2 (Department)
+  Column D = position 3 (Salary)         ← col_index 3 returns THIS
+```
+
+> **Exam trap:** If you use `A2:D21` instead of `B2:D21`, the col_index for Salary becomes 4.  
+> The col_index always counts from the FIRST column of the range you specify.
+
+**Why the other col_index values are wrong:**
+
+| col_index | Returns | Result |
+|-----------|---------|--------|
+| 1 | Employee Name | Carol |
+| 2 | Department | Sales |
+| **3** | **Salary** ✅ | **55000** |
+| 4 | Error — doesn't exist in B:D | #REF! |
+
+**Steps in Excel:**
+```
+1. Click an empty cell (e.g. F2)
+2. Type:  =VLOOKUP("Carol",B2:D21,3,FALSE)
+3. Press Enter → 55000
+```
+
+---
+
+**Q22.2 — Paul's department using VLOOKUP**
+
+> **Answer: IT**
+> **Formula: =VLOOKUP("Paul",B2:D21,2,FALSE)**
+
+**Step 1 — Find Paul in the dataset:**
+
+| Row | Employee Name (col B) | Department (col C) | Salary (col D) |
+|-----|-----------------------|-------------------|---------------|
+| 17 | **Paul** | **IT** | 64000 |
+
+**Step 2 — How VLOOKUP works here:**
+```
+=VLOOKUP( "Paul" , B2:D21 , 2 , FALSE )
+           ↑          ↑       ↑     ↑
+           │          │       │     └── exact match
+           │          │       └──────── col 2 of the table = C (Department)
+           │          └──────────────── search table B:D
+           └─────────────────────────── find "Paul"
+```
+
+**Step 3 — Why col_index = 2 this time?**
+```
+  Column B = position 1 (Employee Name)  ← VLOOKUP searches HERE
+  Column C = position 2 (Department)     ← col_index 2 returns THIS
+  Column D = position 3 (Salary)
+```
+
+**Comparison — Q22.1 vs Q22.2:**
+
+| Question | Looking for | Returns | col_index |
+|----------|------------|---------|-----------|
+| Q22.1 Carol | Salary (col D) | 55000 | 3 |
+| Q22.2 Paul | Department (col C) | IT | **2** |
+
+> **Memory rule:** Count how far RIGHT your target column is from the FIRST column of the range.
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =VLOOKUP("Paul",B2:D21,2,FALSE)
+3. Press Enter → IT
+```
+
+---
+
+**Q22.3 — Maria's salary using INDEX and MATCH**
+
+> **Answer: 54000**
+> **Formula: =INDEX(D2:D21,MATCH("Maria",B2:B21,0))**
+
+**Step 1 — Find Maria in the dataset:**
+
+| Row | Employee Name (col B) | Salary (col D) |
+|-----|-----------------------|---------------|
+| 14 | **Maria** | **54000** |
+
+**Step 2 — This is TWO functions working together. Solve inside-out:**
+```
+Inner:  MATCH("Maria", B2:B21, 0)
+        ↓ scans B2:B21 for "Maria" → she is the 13th name in the list
+        ↓ returns: 13
+
+Outer:  INDEX(D2:D21, 13)
+        ↓ returns the 13th value in D2:D21
+        ↓ returns: 54000
+```
+
+**Step 3 — Visual walkthrough:**
+```
+B2:B21 names list:         D2:D21 salary list:
+ 1. Alice                   1. 50000
+ 2. Bob                     2. 60000
+ 3. Carol                   3. 55000
+ ...                        ...
+13. Maria  ← MATCH finds   13. 54000  ← INDEX returns this
+ ...         position 13    ...
+```
+
+**Why use INDEX+MATCH instead of VLOOKUP?**
+
+| Feature | VLOOKUP | INDEX+MATCH |
+|---------|---------|-------------|
+| Search column | Must be LEFTMOST | Can be ANY column |
+| Return column | Must be to the RIGHT | Can be LEFT or RIGHT |
+| Breaking when columns inserted | Yes — col_index shifts | No — ranges are explicit |
+| Nested flexibility | Limited | Can combine with other functions easily |
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =INDEX(D2:D21,MATCH("Maria",B2:B21,0))
+3. Press Enter → 54000
+```
+
+> **Tip:** Always build the MATCH part first and test it alone before wrapping in INDEX.  
+> `=MATCH("Maria",B2:B21,0)` → should return 13. Then add the INDEX wrapper.
+
+---
+
+**Q22.4 — Row position of highest salary using MATCH**
+
+> **Answer: 16**
+> **Formula: =MATCH(MAX(D2:D21),D2:D21,0)**
+
+**Step 1 — What is the highest salary?**
+```
+MAX(D2:D21) → scans all 20 salaries → highest = 64000 (Paul, row 17)
+```
+
+**Step 2 — MATCH finds where 64000 sits in the range:**
+```
+=MATCH( MAX(D2:D21) , D2:D21 , 0 )
+         ↑                ↑      ↑
+         │                │      └── 0 = exact match
+         │                └───────── search in this range
+         └────────────────────────── what to find (=64000)
+
+D2:D21 positions:
+ Position 1  → Alice   50000
+ Position 2  → Bob     60000
+ ...
+ Position 16 → Paul    64000  ← MATCH returns 16
+ ...
+ Position 20 → Tina    62000
+```
+
+**Step 3 — Important: position ≠ Excel row number**
+
+| What MATCH returns | What it means |
+|--------------------|---------------|
+| 16 | 64000 is the **16th value** in the range D2:D21 |
+| NOT 16 | It does NOT mean Excel row 16 |
+| Excel row = 17 | Because D2 is row 2, so position 16 = row 2+15 = row **17** |
+
+> **Exam trap:** MATCH(MAX(...)) returns the position within the RANGE (1=first cell of range),  
+> not the spreadsheet row number. Paul is position 16 in D2:D21, but lives in Excel row 17.
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =MATCH(MAX(D2:D21),D2:D21,0)
+3. Press Enter → 16
+```
+
+---
+
+**Q22.5 — Sum of salaries for first 5 employees using OFFSET**
+
+> **Answer: 275000**
+> **Formula: =SUM(OFFSET(D2,0,0,5,1))**
+
+**Step 1 — Which 5 employees are "first 5"?**
+
+| Row | Employee | Salary |
+|-----|---------|--------|
+| 2 | Alice | 50000 |
+| 3 | Bob | 60000 |
+| 4 | Carol | 55000 |
+| 5 | Dave | 62000 |
+| 6 | Eve | 48000 |
+| | **Total** | **275000** |
+
+**Step 2 — OFFSET argument by argument:**
+```
+=OFFSET( D2 , 0 , 0 , 5 , 1 )
+          ↑    ↑   ↑   ↑   ↑
+          │    │   │   │   └── width = 1 column wide
+          │    │   │   └────── height = 5 rows tall
+          │    │   └────────── move 0 columns right (stay in col D)
+          │    └────────────── move 0 rows down (stay at D2)
+          └─────────────────── starting cell = D2 (Alice's salary)
+
+Result: a range reference to D2:D6
+```
+
+**Step 3 — OFFSET creates the range, SUM adds it up:**
+```
+OFFSET(D2,0,0,5,1) = D2:D6
+
+D2: 50000 ┐
+D3: 60000 │
+D4: 55000 ├── SUM(D2:D6) = 275000
+D5: 62000 │
+D6: 48000 ┘
+```
+
+> **Why use OFFSET instead of just =SUM(D2:D6)?**  
+> OFFSET builds the range **dynamically**. You can change the 5 to any number and it  
+> automatically expands. Useful in dashboards where the number of rows to sum changes.
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =SUM(OFFSET(D2,0,0,5,1))
+3. Press Enter → 275000
+```
+
+---
+
+**Q22.6 — Irene's department using INDEX and MATCH**
+
+> **Answer: HR**
+> **Formula: =INDEX(C2:C21,MATCH("Irene",B2:B21,0))**
+
+**Step 1 — Find Irene in the dataset:**
+
+| Row | Employee Name (col B) | Department (col C) |
+|-----|----------------------|-------------------|
+| 10 | **Irene** | **HR** |
+
+**Step 2 — Two-step calculation:**
+```
+Inner:  MATCH("Irene", B2:B21, 0)
+        → Irene is the 9th name in B2:B21
+        → returns: 9
+
+Outer:  INDEX(C2:C21, 9)
+        → returns the 9th value in C2:C21 (Department column)
+        → returns: HR
+```
+
+**Step 3 — Compare Q22.3 vs Q22.6 (same technique, different return column):**
+
+| Question | MATCH searches | INDEX returns from | Answer |
+|----------|---------------|-------------------|--------|
+| Q22.3 Maria salary | B2:B21 (Names) | D2:D21 (Salary) | 54000 |
+| Q22.6 Irene dept | B2:B21 (Names) | **C2:C21 (Dept)** | **HR** |
+
+> The MATCH part is identical — only the INDEX column changes depending on what you want to return.
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =INDEX(C2:C21,MATCH("Irene",B2:B21,0))
+3. Press Enter → HR
+```
+
+---
+
+**Q22.7 — Salary of employee in 15th row using INDIRECT**
+
+> **Answer: 57000**
+> **Formula: =INDIRECT("D15")**
+
+**Step 1 — Which employee is in Excel row 15?**
+```
+Row 1:  Header (Employee ID, Name, Department, Salary)
+Row 2:  Alice     (employee 1)
+Row 3:  Bob       (employee 2)
+Row 4:  Carol
+Row 5:  Dave
+Row 6:  Eve
+Row 7:  Frank
+Row 8:  Grace
+Row 9:  Harry
+Row 10: Irene
+Row 11: Jack
+Row 12: Karen
+Row 13: Leo
+Row 14: Maria
+Row 15: Neil      ← D15 = 57000
+Row 16: Olivia
+...
+```
+
+**Step 2 — What INDIRECT does:**
+```
+=INDIRECT("D15")
+           ↑
+           text string → Excel treats it as a cell address → reads D15 → 57000
+```
+
+INDIRECT converts a **text string into a live cell reference**. It does not go to the cell directly — it reads the text, parses it as an address, then fetches that cell's value.
+
+**Step 3 — Why is this useful?**
+```
+Normal formula:   =D15           ← hardcoded, always reads D15
+INDIRECT formula: =INDIRECT("D15")   ← same result, but...
+
+Dynamic version:  =INDIRECT("D"&A1)  ← if A1 contains 15, reads D15
+                                        change A1 to 16 → reads D16 (Olivia, 49000)
+```
+
+> **Exam trap:** "Row 15" means Excel row 15 (D15), not the 15th employee.  
+> The 15th employee (Olivia) is in Excel row 16 because row 1 is the header.  
+> Neil in row 15 is the **14th employee** — D15 = 57000.
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =INDIRECT("D15")
+3. Press Enter → 57000
+```
+
+---
+
+**Q22.8 — Grace's salary using LOOKUP**
+
+> **Answer: 58000**
+> **Formula: =LOOKUP("Grace",B2:B21,D2:D21)**
+
+**Step 1 — Find Grace in the dataset:**
+
+| Row | Employee Name (col B) | Salary (col D) |
+|-----|----------------------|---------------|
+| 8 | **Grace** | **58000** |
+
+**Step 2 — LOOKUP argument by argument:**
+```
+=LOOKUP( "Grace" , B2:B21 , D2:D21 )
+          ↑          ↑         ↑
+          │          │         └── result vector: return value from here
+          │          └──────────── lookup vector: search in this column
+          └─────────────────────── what to find
+```
+
+LOOKUP scans B2:B21 for "Grace", finds it at position 7, then returns the 7th value from D2:D21 = 58000.
+
+**Step 3 — The critical requirement: data MUST be sorted**
+
+LOOKUP uses a **binary search** (splits the list in half repeatedly). This only works correctly if the lookup vector is in ascending order.
+
+```
+This dataset: Alice, Bob, Carol, Dave, Eve, Frank, Grace...  ← alphabetical ✅
+LOOKUP works correctly.
+
+If unsorted: Sam, Alice, Grace, Paul, Bob...
+LOOKUP may return wrong results or #N/A ❌
+```
+
+**LOOKUP vs VLOOKUP vs XLOOKUP — when to use each:**
+
+| Function | Sorted needed? | Syntax complexity | Use when... |
+|----------|---------------|-----------------|-------------|
+| LOOKUP | Yes ✅ | Simple (3 args) | Data is sorted, quick lookup |
+| VLOOKUP | No (FALSE) | Medium (4 args) | Standard lookup, all Excel versions |
+| XLOOKUP | No | Simple (3+ args) | Modern Excel, need flexibility |
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =LOOKUP("Grace",B2:B21,D2:D21)
+3. Press Enter → 58000
+```
+
+---
+
+**Q22.9 — Sam's salary using XLOOKUP**
+
+> **Answer: 60000**
+> **Formula: =XLOOKUP("Sam",B2:B21,D2:D21)**
+
+**Step 1 — Find Sam in the dataset:**
+
+| Row | Employee Name (col B) | Salary (col D) |
+|-----|-----------------------|---------------|
+| 20 | **Sam** | **60000** |
+
+**Step 2 — XLOOKUP argument by argument:**
+```
+=XLOOKUP( "Sam" , B2:B21 , D2:D21 )
+           ↑         ↑         ↑
+           │         │         └── return_array: get value from D column
+           │         └──────────── lookup_array: search in B column (Names)
+           └────────────────────── lookup_value: find "Sam"
+```
+
+Sam is at position 19 in B2:B21 → XLOOKUP returns the 19th value from D2:D21 = 60000.
+
+**Step 3 — XLOOKUP vs VLOOKUP side by side on the same task:**
+```
+VLOOKUP:   =VLOOKUP("Sam", B2:D21, 3, FALSE)
+            ↑ table must include BOTH search and return columns
+            ↑ must count col_index (3) manually
+
+XLOOKUP:   =XLOOKUP("Sam", B2:B21, D2:D21)
+            ↑ search range and return range are SEPARATE
+            ↑ no col_index to count — just point at the return column
+```
+
+**XLOOKUP extra power — optional 4th argument:**
+```
+=XLOOKUP("Sam",B2:B21,D2:D21,"Not found")
+                               ↑
+                               if "Sam" is not in the list, show this
+                               instead of the #N/A error
+```
+
+**Why XLOOKUP is the modern choice:**
+
+| Feature | VLOOKUP | XLOOKUP |
+|---------|---------|---------|
+| Return column direction | RIGHT only | Left OR right |
+| col_index to maintain | Yes — breaks if columns inserted | No — explicit range |
+| Missing value error | #N/A | Optional fallback text |
+| Sorted data needed | No (FALSE) | No |
+| Available in | All Excel | Excel 365 / 2021+ only |
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =XLOOKUP("Sam",B2:B21,D2:D21)
+3. Press Enter → 60000
+```
+
+---
+
+**Summary of all 9 formula answers:**
+
+| Q | Task | Formula (no spaces) | Answer |
+|---|------|---------------------|--------|
+| 22.1 | Carol's salary (VLOOKUP) | `=VLOOKUP("Carol",B2:D21,3,FALSE)` | **55000** |
+| 22.2 | Paul's department (VLOOKUP) | `=VLOOKUP("Paul",B2:D21,2,FALSE)` | **IT** |
+| 22.3 | Maria's salary (INDEX+MATCH) | `=INDEX(D2:D21,MATCH("Maria",B2:B21,0))` | **54000** |
+| 22.4 | Position of highest salary (MATCH) | `=MATCH(MAX(D2:D21),D2:D21,0)` | **16** |
+| 22.5 | Sum first 5 salaries (OFFSET) | `=SUM(OFFSET(D2,0,0,5,1))` | **275000** |
+| 22.6 | Irene's department (INDEX+MATCH) | `=INDEX(C2:C21,MATCH("Irene",B2:B21,0))` | **HR** |
+| 22.7 | Salary in row 15 (INDIRECT) | `=INDIRECT("D15")` | **57000** |
+| 22.8 | Grace's salary (LOOKUP) | `=LOOKUP("Grace",B2:B21,D2:D21)` | **58000** |
+| 22.9 | Sam's salary (XLOOKUP) | `=XLOOKUP("Sam",B2:B21,D2:D21)` | **60000** |
+                """,
+            "key_points": [
+                "VLOOKUP(value, table, col_index, FALSE) — col_index counts from the first column of the TABLE RANGE, not column A",
+                "INDEX+MATCH is more flexible than VLOOKUP — can search any column and return any column",
+                "MATCH returns the relative position (1-based) within the lookup range, not the Excel row number",
+                "OFFSET(start, rows, cols, height, width) builds a dynamic range — wrap in SUM/AVERAGE to aggregate it",
+                "INDIRECT converts a text string like \"D15\" into a live cell reference — row 15 = Neil (14th employee), not Olivia",
+                "LOOKUP requires the lookup column to be sorted ascending; VLOOKUP and XLOOKUP do not (with FALSE/exact match)",
+                "XLOOKUP is the modern replacement for VLOOKUP — no col_index needed, works left or right, optional fallback value"
+            ],
+            "dataset_file": "CA Lesson 3 dataset - Resolved.xlsx"
+        },
+        {
+            "title": "1.13 Example Exam Assignment — CA Lesson 4 Dataset (Conditional & Lookup Functions)",
+            "content": """
+**CA Lesson 4 Dataset — Worked Exam Assignment (Q23)**
+
+The dataset is: **CA Lesson 4 dataset.xlsx** — 20 employees.
+
+**Column layout (rows 2–21, row 1 = headers):**
+
+| Col | Header | Example values |
+|-----|--------|---------------|
+| A | Employee ID | 1–20 |
+| B | Employee Name | Alice Smith, Bob Johnson … |
+| C | Department | Sales, Finance, IT, HR |
+| D | Salary | 52000–63000 |
+| E | Years of Service | 1–4 |
+| F | Bonus Percentage | 0.05–0.10 (5 %–10 %) |
+
+**Full dataset reference:**
+
+| Row | Employee Name | Dept | Salary | Yrs | Bonus % |
+|-----|--------------|------|--------|-----|---------|
+| 2 | Alice Smith | Sales | 55000 | 2 | 5 % |
+| 3 | Bob Johnson | Finance | 59000 | 3 | 7 % |
+| 4 | Carol Williams | IT | 60000 | 4 | 6 % |
+| 5 | Dave Davis | HR | 52000 | 1 | 8 % |
+| 6 | Eve Brown | Sales | 56000 | 2 | 6 % |
+| 7 | Frank Lee | Finance | 57000 | 3 | 7 % |
+| 8 | Grace Martin | IT | 58000 | 4 | 6.5 % |
+| 9 | Harry Wilson | HR | 53000 | 1 | 8.5 % |
+| 10 | Irene Hall | Sales | 54000 | 2 | 5.5 % |
+| 11 | Jack White | Finance | 59000 | 3 | 7.5 % |
+| 12 | Karen Miller | IT | 61000 | 4 | 6.5 % |
+| 13 | Leo Robinson | HR | 53000 | 1 | 9 % |
+| 14 | Maria Garcia | Sales | 55000 | 2 | 5 % |
+| 15 | Neil Taylor | Finance | 58000 | 3 | 8 % |
+| 16 | Olivia Harris | IT | 62000 | 4 | 7 % |
+| 17 | Paul Anderson | HR | 54000 | 1 | 9.5 % |
+| 18 | Quin Lewis | Sales | 56000 | 2 | 6 % |
+| 19 | Rachel Turner | Finance | 59000 | 3 | 8.5 % |
+| 20 | Sam Scott | IT | 63000 | 4 | 7.5 % |
+| 21 | Tina Moore | HR | 55000 | 1 | 10 % |
+
+---
+
+**Q23.1 — Maximum salary in Sales with ≥ 2 years of service (MAXIFS)**
+
+> **Answer: 56000**
+> **Formula: =MAXIFS(D2:D21,C2:C21,"Sales",E2:E21,">=2")**
+
+**Step 1 — Filter: Department = Sales AND Years of Service ≥ 2:**
+
+| Row | Employee | Dept | Salary | Yrs |
+|-----|---------|------|--------|-----|
+| 2 | Alice Smith | Sales | 55000 | 2 ✅ |
+| 6 | Eve Brown | Sales | **56000** | 2 ✅ |
+| 10 | Irene Hall | Sales | 54000 | 2 ✅ |
+| 14 | Maria Garcia | Sales | 55000 | 2 ✅ |
+| 18 | Quin Lewis | Sales | **56000** | 2 ✅ |
+
+All 5 qualify. MAX = **56000** (Eve Brown AND Quin Lewis are tied).
+
+**Step 2 — MAXIFS argument by argument:**
+```
+=MAXIFS( D2:D21 , C2:C21 , "Sales" , E2:E21 , ">=2" )
+          ↑          ↑        ↑          ↑        ↑
+          │          │        │          │        └── condition 2: years >= 2
+          │          │        │          └─────────── range 2: Years of Service column
+          │          │        └────────────────────── condition 1: department = Sales
+          │          └─────────────────────────────── range 1: Department column
+          └────────────────────────────────────────── max_range: find the max here
+```
+
+**Step 3 — Why MAXIFS and not MAX + IF?**
+
+| Approach | Formula | Downside |
+|----------|---------|---------|
+| Old method | =MAX(IF((C2:C21="Sales")*(E2:E21>=2),D2:D21)) | Array formula — needs Ctrl+Shift+Enter |
+| Modern | =MAXIFS(D2:D21,C2:C21,"Sales",E2:E21,">=2") | Simple Enter — available Excel 2019+ |
+
+> **Exam trap:** The criteria ">=2" is a TEXT STRING — always wrap comparison operators in quotes.  
+> Writing >=2 without quotes will cause an error.
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =MAXIFS(D2:D21,C2:C21,"Sales",E2:E21,">=2")
+3. Press Enter → 56000
+```
+
+---
+
+**Q23.2 — Minimum bonus percentage in Finance with salary > 58000 (MINIFS)**
+
+> **Answer: 0.07 (7 %)**
+> **Formula: =MINIFS(F2:F21,C2:C21,"Finance",D2:D21,">58000")**
+
+**Step 1 — Filter: Department = Finance AND Salary > 58000:**
+
+| Row | Employee | Dept | Salary | Bonus % |
+|-----|---------|------|--------|---------|
+| 3 | Bob Johnson | Finance | 59000 | **7 %** ← minimum |
+| 11 | Jack White | Finance | 59000 | 7.5 % |
+| 19 | Rachel Turner | Finance | 59000 | 8.5 % |
+
+Frank Lee (57000) and Neil Taylor (58000) are excluded. Frank's salary < 58000; Neil's = 58000, not > 58000.
+
+MIN bonus% = **0.07 = 7 %** (Bob Johnson)
+
+**Step 2 — MINIFS argument by argument:**
+```
+=MINIFS( F2:F21 , C2:C21 , "Finance" , D2:D21 , ">58000" )
+          ↑          ↑        ↑           ↑        ↑
+          │          │        │           │        └── condition 2: salary strictly > 58000
+          │          │        │           └─────────── range 2: Salary column
+          │          │        └────────────────────── condition 1: dept = Finance
+          │          └─────────────────────────────── range 1: Department column
+          └────────────────────────────────────────── min_range: find the minimum here
+```
+
+> **Exam trap:** ">58000" (strictly greater) excludes Neil Taylor (salary = 58000 exactly).  
+> If the question said ">=58000", Neil would also qualify, but Bob Johnson's 7 % would still be the minimum.
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =MINIFS(F2:F21,C2:C21,"Finance",D2:D21,">58000")
+3. Press Enter → 0.07   (format the cell as % to see 7%)
+```
+
+---
+
+**Q23.3 — Count employees with bonus percentage ≥ 8 % (COUNTIF)**
+
+> **Answer: 7**
+> **Formula: =COUNTIF(F2:F21,">=0.08")**
+
+**Step 1 — Which employees qualify (Bonus % ≥ 8% = ≥ 0.08)?**
+
+| Row | Employee | Bonus % |
+|-----|---------|---------|
+| 5 | Dave Davis | 8 % ✅ |
+| 9 | Harry Wilson | 8.5 % ✅ |
+| 13 | Leo Robinson | 9 % ✅ |
+| 15 | Neil Taylor | 8 % ✅ |
+| 17 | Paul Anderson | 9.5 % ✅ |
+| 19 | Rachel Turner | 8.5 % ✅ |
+| 21 | Tina Moore | 10 % ✅ |
+
+Count = **7**
+
+**Step 2 — COUNTIF argument by argument:**
+```
+=COUNTIF( F2:F21 , ">=0.08" )
+           ↑          ↑
+           │          └── criteria: bonus% must be >= 0.08 (= 8%)
+           └──────────── range: check every cell in Bonus Percentage column
+```
+
+> **Why ">=0.08" and not ">=8%"?**  
+> The column stores the bonus as a decimal (0.08 in the cell, displayed as 8%).  
+> Excel compares the raw stored value, which is 0.08.  
+> Both ">=0.08" and ">=8%" work in Excel, but ">=0.08" is safest and most explicit.
+
+**COUNTIF vs COUNTIFS — when to use each:**
+
+| Function | Conditions | Example |
+|----------|-----------|---------|
+| COUNTIF | ONE condition | Count all bonus% >= 8% |
+| COUNTIFS | TWO or more conditions | Count IT employees with bonus% >= 8% |
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =COUNTIF(F2:F21,">=0.08")
+3. Press Enter → 7
+```
+
+---
+
+**Q23.4 — Count IT employees with salary > 60000 (COUNTIFS)**
+
+> **Answer: 3**
+> **Formula: =COUNTIFS(C2:C21,"IT",D2:D21,">60000")**
+
+**Step 1 — Filter: Department = IT AND Salary > 60000:**
+
+| Row | Employee | Dept | Salary |
+|-----|---------|------|--------|
+| 4 | Carol Williams | IT | 60000 | ❌ not > 60000 |
+| 8 | Grace Martin | IT | 58000 | ❌ |
+| 12 | Karen Miller | IT | **61000** | ✅ |
+| 16 | Olivia Harris | IT | **62000** | ✅ |
+| 20 | Sam Scott | IT | **63000** | ✅ |
+
+Carol Williams is excluded — salary = 60000, not strictly greater. Count = **3**
+
+**Step 2 — COUNTIFS argument by argument:**
+```
+=COUNTIFS( C2:C21 , "IT" , D2:D21 , ">60000" )
+            ↑         ↑       ↑         ↑
+            │         │       │         └── condition 2: salary strictly > 60000
+            │         │       └──────────── range 2: Salary column
+            │         └──────────────────── condition 1: department = IT
+            └────────────────────────────── range 1: Department column
+```
+
+> **Exam trap:** ">60000" is strictly greater. Carol Williams (60000) does NOT qualify.  
+> Always read conditions carefully: "greater than" ≠ "greater than or equal to."
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =COUNTIFS(C2:C21,"IT",D2:D21,">60000")
+3. Press Enter → 3
+```
+
+---
+
+**Q23.5 — Average salary of employees with bonus % < 6 % (AVERAGEIF)**
+
+> **Answer: 54666.67**
+> **Formula: =AVERAGEIF(F2:F21,"<0.06",D2:D21)**
+
+**Step 1 — Filter: Bonus Percentage < 6 % (< 0.06):**
+
+| Row | Employee | Salary | Bonus % |
+|-----|---------|--------|---------|
+| 2 | Alice Smith | 55000 | 5 % ✅ |
+| 10 | Irene Hall | 54000 | 5.5 % ✅ |
+| 14 | Maria Garcia | 55000 | 5 % ✅ |
+
+6 % (0.06) itself is NOT included — strictly less than. Count = 3.
+
+**Step 2 — Calculation:**
+```
+Average = (55000 + 54000 + 55000) / 3
+        = 164000 / 3
+        = 54666.666...
+        = 54666.67  (rounded to 2 decimal places)
+```
+
+**Step 3 — AVERAGEIF argument by argument:**
+```
+=AVERAGEIF( F2:F21 , "<0.06" , D2:D21 )
+             ↑          ↑         ↑
+             │          │         └── average_range: calculate average from Salary
+             │          └──────────── criteria: bonus% must be less than 0.06
+             └────────────────────── range: check every cell in Bonus % column
+```
+
+> **Note:** AVERAGEIF has 3 arguments: range (to check), criteria (the condition), and average_range (what to average).  
+> This is the same structure as SUMIF — just a different function name.
+
+**AVERAGEIF vs AVERAGEIFS:**
+
+| Function | Conditions | Formula |
+|----------|-----------|---------|
+| AVERAGEIF | ONE condition | =AVERAGEIF(F2:F21,"<0.06",D2:D21) |
+| AVERAGEIFS | TWO or more | =AVERAGEIFS(D2:D21,F2:F21,"<0.06",C2:C21,"Sales") |
+
+> **Note:** In AVERAGEIFS the average_range comes FIRST; in AVERAGEIF it comes LAST. This is a common exam trap!
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =AVERAGEIF(F2:F21,"<0.06",D2:D21)
+3. Press Enter → 54666.666...
+4. Format cell to 2 decimal places → 54666.67
+```
+
+---
+
+**Q23.6 — Average bonus percentage in Sales with > 1 year of service (AVERAGEIFS)**
+
+> **Answer: 0.055 (5.5 %)**
+> **Formula: =AVERAGEIFS(F2:F21,C2:C21,"Sales",E2:E21,">1")**
+
+**Step 1 — Filter: Department = Sales AND Years of Service > 1:**
+
+| Row | Employee | Yrs | Bonus % |
+|-----|---------|-----|---------|
+| 2 | Alice Smith | 2 | 5 % |
+| 6 | Eve Brown | 2 | 6 % |
+| 10 | Irene Hall | 2 | 5.5 % |
+| 14 | Maria Garcia | 2 | 5 % |
+| 18 | Quin Lewis | 2 | 6 % |
+
+All 5 Sales employees have exactly 2 years — all qualify (2 > 1).
+
+**Step 2 — Calculation:**
+```
+Average = (0.05 + 0.06 + 0.055 + 0.05 + 0.06) / 5
+        = 0.275 / 5
+        = 0.055  =  5.5 %
+```
+
+**Step 3 — AVERAGEIFS argument by argument:**
+```
+=AVERAGEIFS( F2:F21 , C2:C21 , "Sales" , E2:E21 , ">1" )
+              ↑          ↑        ↑          ↑        ↑
+              │          │        │          │        └── condition 2: years > 1
+              │          │        │          └─────────── range 2: Years of Service
+              │          │        └────────────────────── condition 1: dept = Sales
+              │          └─────────────────────────────── range 1: Department column
+              └────────────────────────────────────────── average_range: Bonus % column
+```
+
+> **Key difference AVERAGEIFS vs AVERAGEIF argument order:**
+> - AVERAGEIF:  range, criteria, **average_range** (average_range is argument 3)
+> - AVERAGEIFS: **average_range**, range1, criteria1, range2, criteria2 (average_range is argument 1)
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =AVERAGEIFS(F2:F21,C2:C21,"Sales",E2:E21,">1")
+3. Press Enter → 0.055
+4. Format cell as Percentage → 5.50%
+```
+
+---
+
+**Q23.7 — Bonus Amount column G with IFERROR division formula (IFERROR)**
+
+> **Answer formula: =IFERROR(G2/F2,"Error")**
+> *(Step 1: create G2 = D2*F2 for Bonus Amount first)*
+
+**Step 1 — Where does 2750 come from?**
+
+2750 is **not given** in the dataset — you calculate it yourself in column G first.
+
+The question says: *"Add a Column 'Bonus Amount' in Column G."*  
+So G2 must be built using the Salary (D2) and Bonus Percentage (F2) already in the dataset:
+
+| Cell | Column | Value | Source |
+|------|--------|-------|--------|
+| D2 | Salary | 55000 | Given in dataset |
+| F2 | Bonus % | 0.05 | Given in dataset (= 5 %) |
+| **G2** | **Bonus Amount** | **2750** | **=D2*F2 ← you create this** |
+
+```
+G2 = D2 * F2
+   = 55000 × 0.05
+   = 2750   ← Alice's bonus amount (5% of her salary)
+```
+
+In cell G1 type: `Bonus Amount`
+In cell G2 type: `=D2*F2`
+
+More examples to confirm the pattern:
+```
+G2 = 55000 × 0.05 = 2750   ← Alice  (Sales, 5%)
+G3 = 59000 × 0.07 = 4130   ← Bob    (Finance, 7%)
+G4 = 60000 × 0.06 = 3600   ← Carol  (IT, 6%)
+```
+
+**Step 2 — The IFERROR formula that divides G by F:**
+```
+=IFERROR( G2/F2 , "Error" )
+           ↑   ↑    ↑
+           │   │    └── value_if_error: display this text if division fails
+           │   └──────── divisor: Bonus Percentage (F2)
+           └──────────── numerator: Bonus Amount (G2) = Salary × Bonus%
+```
+
+**Step 3 — What does dividing G2 by F2 give?**
+```
+G2 / F2 = (D2 × F2) / F2 = D2 = Salary
+
+Alice:  2750 / 0.05 = 55000  (Alice's salary recovered)
+Bob:    4130 / 0.07 = 59000
+Carol:  3600 / 0.06 = 60000
+```
+
+The formula recovers the original salary — useful as a cross-check or when you only have the bonus amount and percentage.
+
+**Step 4 — Why IFERROR protects the formula:**
+```
+If F2 = 0:   G2/F2 → division by zero → #DIV/0! error
+With IFERROR: shows "Error" instead of crashing the spreadsheet
+```
+
+> **Exam tip:** IFERROR(value, value_if_error) is the MODERN way to handle errors.  
+> The older method was: =IF(ISERROR(G2/F2),"Error",G2/F2) — much longer.  
+> Always prefer IFERROR in current exam answers.
+
+| Approach | Formula | Length |
+|----------|---------|--------|
+| Modern | =IFERROR(G2/F2,"Error") | Short ✅ |
+| Old ISERROR | =IF(ISERROR(G2/F2),"Error",G2/F2) | Long |
+
+**Steps in Excel:**
+```
+1. In G1 type:  Bonus Amount
+2. In G2 type:  =D2*F2   → 2750
+3. In H2 type:  =IFERROR(G2/F2,"Error")   → 55000
+4. (or put the IFERROR formula directly in G2 if that is what is asked)
+```
+
+---
+
+**Q23.8 — Grace Martin's salary using LOOKUP**
+
+> **Answer: 58000**
+> **Formula: =LOOKUP("Grace Martin",B2:B21,D2:D21)**
+
+**Step 1 — Find Grace Martin in the dataset:**
+
+| Row | Employee Name (col B) | Salary (col D) |
+|-----|-----------------------|---------------|
+| 8 | **Grace Martin** | **58000** |
+
+**Step 2 — LOOKUP argument by argument:**
+```
+=LOOKUP( "Grace Martin" , B2:B21 , D2:D21 )
+          ↑                  ↑         ↑
+          │                  │         └── result vector: return value from Salary col
+          │                  └──────────── lookup vector: search in Employee Name col
+          └─────────────────────────────── lookup value: find exactly this name
+```
+
+**Step 3 — The sorted requirement:**
+
+LOOKUP uses binary search — it requires the lookup vector to be sorted A→Z.
+
+```
+Check: Are B2:B21 names in alphabetical order?
+Alice Smith ← A
+Bob Johnson ← B
+Carol Williams ← C
+Dave Davis ← D
+Eve Brown ← E
+Frank Lee ← F
+Grace Martin ← G  ✅ LOOKUP finds her here
+...
+Sam Scott ← S
+Tina Moore ← T
+
+Yes — alphabetical ✅  LOOKUP works correctly.
+```
+
+> **Exam trap:** Using LOOKUP on unsorted names will give wrong results.  
+> For unsorted data, use VLOOKUP("Grace Martin",B2:D21,3,FALSE) or XLOOKUP instead.
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =LOOKUP("Grace Martin",B2:B21,D2:D21)
+3. Press Enter → 58000
+```
+
+---
+
+**Q23.9 — Sam Scott's salary using XLOOKUP**
+
+> **Answer: 63000**
+> **Formula: =XLOOKUP("Sam Scott",B2:B21,D2:D21)**
+
+**Step 1 — Find Sam Scott in the dataset:**
+
+| Row | Employee Name (col B) | Salary (col D) |
+|-----|-----------------------|---------------|
+| 20 | **Sam Scott** | **63000** |
+
+**Step 2 — XLOOKUP argument by argument:**
+```
+=XLOOKUP( "Sam Scott" , B2:B21 , D2:D21 )
+           ↑               ↑         ↑
+           │               │         └── return_array: get salary from D column
+           │               └──────────── lookup_array: search in B column (Names)
+           └──────────────────────────── lookup_value: find "Sam Scott"
+```
+
+XLOOKUP scans B2:B21 for "Sam Scott", finds him at position 19, returns D20 = 63000.
+
+**Step 3 — Why "Sam Scott" needs the full name here:**
+
+Q22.9 (Lesson 1.12 dataset) had only first names. This dataset has full names (first + last). The formula must match the EXACT value in the cell.
+
+```
+=XLOOKUP("Sam",B2:B21,D2:D21)        → #N/A — "Sam" does not exist in B column
+=XLOOKUP("Sam Scott",B2:B21,D2:D21)  → 63000 ✅
+```
+
+**Step 4 — Optionally add a fallback for not-found:**
+```
+=XLOOKUP("Sam Scott",B2:B21,D2:D21,"Not found")
+                                    ↑
+                                    shows "Not found" instead of #N/A if name missing
+```
+
+**XLOOKUP vs VLOOKUP for this task:**
+```
+VLOOKUP: =VLOOKUP("Sam Scott",B2:D21,3,FALSE)  → 63000 (col_index = 3 for D)
+XLOOKUP: =XLOOKUP("Sam Scott",B2:B21,D2:D21)   → 63000 (no col_index needed)
+```
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =XLOOKUP("Sam Scott",B2:B21,D2:D21)
+3. Press Enter → 63000
+```
+
+---
+
+**Summary of all 9 formula answers:**
+
+| Q | Task | Formula | Answer |
+|---|------|---------|--------|
+| 23.1 | Max salary Sales ≥ 2 yrs (MAXIFS) | `=MAXIFS(D2:D21,C2:C21,"Sales",E2:E21,">=2")` | **56000** |
+| 23.2 | Min bonus% Finance salary>58000 (MINIFS) | `=MINIFS(F2:F21,C2:C21,"Finance",D2:D21,">58000")` | **0.07 (7%)** |
+| 23.3 | Count bonus% ≥ 8% (COUNTIF) | `=COUNTIF(F2:F21,">=0.08")` | **7** |
+| 23.4 | Count IT salary>60000 (COUNTIFS) | `=COUNTIFS(C2:C21,"IT",D2:D21,">60000")` | **3** |
+| 23.5 | Avg salary bonus%<6% (AVERAGEIF) | `=AVERAGEIF(F2:F21,"<0.06",D2:D21)` | **54666.67** |
+| 23.6 | Avg bonus% Sales >1 yr (AVERAGEIFS) | `=AVERAGEIFS(F2:F21,C2:C21,"Sales",E2:E21,">1")` | **0.055 (5.5%)** |
+| 23.7 | Bonus Amount ÷ Bonus% with error trap (IFERROR) | `=IFERROR(G2/F2,"Error")` | **55000** (for Alice) |
+| 23.8 | Grace Martin salary (LOOKUP) | `=LOOKUP("Grace Martin",B2:B21,D2:D21)` | **58000** |
+| 23.9 | Sam Scott salary (XLOOKUP) | `=XLOOKUP("Sam Scott",B2:B21,D2:D21)` | **63000** |
+                """,
+            "key_points": [
+                "MAXIFS / MINIFS: max_or_min_range first, then pairs of (criteria_range, criteria) — criteria strings must be quoted",
+                "COUNTIF for one condition; COUNTIFS for two or more conditions — criteria like '>60000' must be in quotes",
+                "AVERAGEIF argument order: (range, criteria, average_range) — average_range is LAST",
+                "AVERAGEIFS argument order: (average_range, range1, criteria1, ...) — average_range is FIRST",
+                "IFERROR(value, value_if_error) is the modern compact way to suppress errors like #DIV/0! and #N/A",
+                "LOOKUP requires the lookup vector to be sorted ascending; use VLOOKUP with FALSE or XLOOKUP for unsorted data",
+                "XLOOKUP needs the exact value as it appears in the cell — 'Sam Scott' not just 'Sam' when full names are stored"
+            ],
+            "dataset_file": "CA Lesson 4 dataset - Resolved.xlsx"
+        },
+        {
+            "title": "1.14 Example Exam Assignment — CA Lesson 2 Dataset (Date, Time & Text Functions)",
+            "content": """
+**CA Lesson 2 Dataset — Worked Exam Assignment (Q24)**
+
+The dataset is: **CA Lesson 2 dataset.xlsx** — 20 orders.
+
+**Column layout (rows 2–21, row 1 = headers):**
+
+| Col | Header | Example values |
+|-----|--------|---------------|
+| A | Order ID | 1–20 |
+| B | Customer Name | John Smith, Jane Doe … |
+| C | Order Date | 2023-10-01 to 2023-10-20 |
+| D | Order Time | 09:15 to 16:30 |
+| E | Order Amount | 65.45–150.80 |
+
+**Full dataset reference:**
+
+| Row | Order ID | Customer Name | Order Date | Order Time | Order Amount |
+|-----|----------|--------------|------------|------------|-------------|
+| 2 | 1 | John Smith | 2023-10-01 | 09:30 | 100.50 |
+| 3 | 2 | Jane Doe | 2023-10-02 | 14:15 | 75.25 |
+| 4 | 3 | David Johnson | 2023-10-03 | 11:45 | 120.75 |
+| 5 | 4 | Mary Davis | 2023-10-04 | 16:00 | 90.30 |
+| 6 | 5 | Robert Brown | 2023-10-05 | 13:00 | 150.80 |
+| 7 | 6 | Sarah White | 2023-10-06 | 10:30 | 65.45 |
+| 8 | 7 | Michael Lee | 2023-10-07 | 15:20 | 110.60 |
+| 9 | 8 | Linda Harris | 2023-10-08 | 12:15 | 95.10 |
+| 10 | 9 | William Clark | 2023-10-09 | 09:45 | 130.25 |
+| 11 | 10 | Susan Turner | 2023-10-10 | 14:00 | 85.75 |
+| 12 | 11 | Richard Adams | 2023-10-11 | 11:00 | 115.90 |
+| 13 | 12 | Karen Martinez | 2023-10-12 | 16:30 | 70.20 |
+| 14 | 13 | James Walker | 2023-10-13 | 15:10 | 140.60 |
+| 15 | 14 | Patricia Hall | 2023-10-14 | 13:45 | 75.40 |
+| 16 | 15 | Charles Turner | 2023-10-15 | 10:20 | 105.25 |
+| 17 | 16 | Jennifer Lewis | 2023-10-16 | 12:00 | 80.15 |
+| 18 | 17 | Thomas Davis | 2023-10-17 | 14:45 | 125.80 |
+| 19 | 18 | Nancy Scott | 2023-10-18 | 09:15 | 70.90 |
+| 20 | 19 | Daniel Green | 2023-10-19 | 11:30 | 135.40 |
+| 21 | 20 | Susan Turner | 2023-10-20 | 15:30 | 90.75 |
+
+> **No spaces in formulas** — the automated marker expects `=C6+3` not `=C6 + 3`.
+
+---
+
+**Q24.1 — Next Order Date: 3 days after Order Date for Order ID 5**
+
+> **Answer: 2023-10-08**
+> **Formula: =C6+3**
+
+**Step 1 — Find Order ID 5 in the dataset:**
+
+| Row | Order ID | Customer Name | Order Date |
+|-----|----------|--------------|------------|
+| 6 | **5** | Robert Brown | **2023-10-05** ← C6 |
+
+**Step 2 — How date arithmetic works in Excel:**
+```
+Excel stores dates as numbers (serial numbers):
+  2023-10-05 = 45204  (days since 1900-01-01)
+  2023-10-05 + 3 = 45207 = 2023-10-08
+
+=C6+3
+  ↑
+  Add 3 to the date value in C6 → moves forward 3 calendar days
+```
+
+**Step 3 — Calculation:**
+```
+C6 = 2023-10-05
+C6 + 3 = 2023-10-08  ✅
+```
+
+> **Tip:** Adding/subtracting a whole number to a date always moves by that many days.
+> To add months use `=EDATE(C6,1)`. To add years use `=DATE(YEAR(C6)+1,MONTH(C6),DAY(C6))`.
+
+**Steps in Excel:**
+```
+1. Add header "Next Order Date" in column F
+2. Click F6
+3. Type:  =C6+3
+4. Press Enter → 2023-10-08
+```
+
+---
+
+**Q24.2 — Time Slot for Order ID 8: Morning / Afternoon (IF + TIME)**
+
+> **Answer: Afternoon**
+> **Formula: =IF(D9<TIME(12,0,0),"Morning","Afternoon")**
+
+**Step 1 — Find Order ID 8 in the dataset:**
+
+| Row | Order ID | Customer Name | Order Time |
+|-----|----------|--------------|------------|
+| 9 | **8** | Linda Harris | **12:15** ← D9 |
+
+**Step 2 — What TIME(12,0,0) does:**
+```
+TIME(hour, minute, second) creates a time value.
+TIME(12,0,0) = 12:00:00 = noon
+
+Excel stores times as fractions of 1 day:
+  12:00:00 = 0.5  (half a day)
+  09:30:00 = 0.395833...
+  12:15:00 = 0.510416...
+```
+
+**Step 3 — IF logic:**
+```
+=IF( D9 < TIME(12,0,0) , "Morning" , "Afternoon" )
+      ↑         ↑              ↑             ↑
+      │         │              │             └── D9 >= noon → Afternoon
+      │         │              └──────────────── D9 < noon → Morning
+      │         └─────────────────────────────── cutoff = 12:00:00
+      └───────────────────────────────────────── order time Linda Harris = 12:15
+
+12:15 < 12:00? → FALSE → result = "Afternoon"
+```
+
+> **Exam trap:** 12:00 PM exactly is NOT morning. The condition is strictly `<` noon.
+> Linda Harris at 12:15 → 12:15 < 12:00 is FALSE → **Afternoon**.
+
+**Time Slot classification for all 20 orders:**
+
+| Before 12:00 (Morning) | At/After 12:00 (Afternoon) |
+|------------------------|---------------------------|
+| John Smith 09:30 | Jane Doe 14:15 |
+| David Johnson 11:45 | Mary Davis 16:00 |
+| Sarah White 10:30 | Robert Brown 13:00 |
+| William Clark 09:45 | **Linda Harris 12:15** ← Q24.2 |
+| Richard Adams 11:00 | Susan Turner 14:00 |
+| Charles Turner 10:20 | Karen Martinez 16:30 |
+| Nancy Scott 09:15 | James Walker 15:10 |
+| Daniel Green 11:30 | Patricia Hall 13:45 |
+| | Michael Lee 15:20 |
+| | Jennifer Lewis 12:00 |
+| | Thomas Davis 14:45 |
+| | Susan Turner 15:30 |
+
+**Steps in Excel:**
+```
+1. Add header "Time Slot" in column G
+2. Click G9
+3. Type:  =IF(D9<TIME(12,0,0),"Morning","Afternoon")
+4. Press Enter → Afternoon
+```
+
+---
+
+**Q24.3 — Rounded Amount for Order ID 16 (ROUND)**
+
+> **Answer: 80**
+> **Formula: =ROUND(E17,0)**
+
+**Step 1 — Find Order ID 16 in the dataset:**
+
+| Row | Order ID | Customer Name | Order Amount |
+|-----|----------|--------------|-------------|
+| 17 | **16** | Jennifer Lewis | **80.15** ← E17 |
+
+**Step 2 — ROUND argument by argument:**
+```
+=ROUND( E17 , 0 )
+         ↑     ↑
+         │     └── num_digits = 0 → round to nearest whole number
+         └──────── number to round = 80.15
+```
+
+**Step 3 — How ROUND works:**
+```
+80.15
+  ↑
+  The digit after the decimal point is 1 (< 5) → round DOWN
+  Result = 80
+```
+
+**ROUND decimal places reference:**
+
+| num_digits | Rounds to | Example (80.15) |
+|------------|-----------|----------------|
+| 2 | 2 decimal places | 80.15 |
+| 1 | 1 decimal place | 80.2 |
+| **0** | **Whole number** | **80** |
+| -1 | Nearest 10 | 80 |
+
+> **ROUND vs INT vs TRUNC:**
+> - `=ROUND(80.15,0)` → **80** (rounds to nearest, .5 rounds up)
+> - `=INT(80.15)` → **80** (always rounds DOWN to integer)
+> - `=TRUNC(80.15,0)` → **80** (removes decimal, same as INT for positive numbers)
+> For exam purposes, always use ROUND when the question says "round to nearest".
+
+**Steps in Excel:**
+```
+1. Add header "Rounded Amount" in a new column
+2. Click the cell for Order ID 16 (row 17)
+3. Type:  =ROUND(E17,0)
+4. Press Enter → 80
+```
+
+---
+
+**Q24.4 — Length of Customer Name for Order ID 7 (LEN)**
+
+> **Answer: 11**
+> **Formula: =LEN(B8)**
+
+**Step 1 — Find Order ID 7 in the dataset:**
+
+| Row | Order ID | Customer Name |
+|-----|----------|--------------|
+| 8 | **7** | **Michael Lee** ← B8 |
+
+**Step 2 — LEN counts every character including spaces:**
+```
+"Michael Lee"
+ M-i-c-h-a-e-l = 7 characters
+ (space)       = 1 character
+ L-e-e         = 3 characters
+               ─────────────
+ Total         = 11 characters
+```
+
+**Step 3 — Formula:**
+```
+=LEN(B8)
+     ↑
+     B8 = "Michael Lee"
+     LEN counts all characters including the space
+     Result = 11
+```
+
+> **Exam trap:** LEN counts spaces as characters.
+> "Michael Lee" = 11, NOT 10. The space between first name and surname counts.
+
+**LEN for all 20 customers (pattern check):**
+
+| Name | Length |
+|------|--------|
+| John Smith | 10 |
+| Jane Doe | 8 |
+| David Johnson | 13 |
+| **Michael Lee** | **11** ← Q24.4 |
+| Karen Martinez | 15 |
+
+**Steps in Excel:**
+```
+1. Click an empty cell
+2. Type:  =LEN(B8)
+3. Press Enter → 11
+```
+
+---
+
+**Q24.5 — Initials and Surname for Order ID 12 (LEFT + MID + FIND)**
+
+> **Answer: K Martinez**
+> **Formula: =LEFT(B13,1)&" "&MID(B13,FIND(" ",B13)+1,LEN(B13))**
+
+**Step 1 — Find Order ID 12 in the dataset:**
+
+| Row | Order ID | Customer Name |
+|-----|----------|--------------|
+| 13 | **12** | **Karen Martinez** ← B13 |
+
+**Step 2 — Three functions working together:**
+
+```
+Part A — Extract the initial (first letter):
+  LEFT(B13, 1) = LEFT("Karen Martinez", 1) = "K"
+
+Part B — Find where the space is:
+  FIND(" ", B13) = FIND(" ", "Karen Martinez") = 6
+  (the space is at position 6: K-a-r-e-n-SPACE)
+
+Part C — Extract surname (everything after the space):
+  MID(B13, FIND(" ",B13)+1, LEN(B13))
+  = MID("Karen Martinez", 6+1, 15)
+  = MID("Karen Martinez", 7, 15)
+  = "Martinez"
+```
+
+**Step 3 — Combine with `&`:**
+```
+=LEFT(B13,1) & " " & MID(B13,FIND(" ",B13)+1,LEN(B13))
+= "K"         & " " & "Martinez"
+= "K Martinez"
+```
+
+**Visual character map of "Karen Martinez":**
+```
+Pos:  1  2  3  4  5  6  7  8  9  10 11 12 13 14 15
+Char: K  a  r  e  n     M  a  r  t  i  n  e  z
+      ↑              ↑  ↑
+      LEFT(,1)="K"   │  FIND(" ")+1=7 → MID starts here
+                     FIND(" ")=6 (the space)
+```
+
+> **Why LEN(B13) as the third MID argument?**
+> MID(text, start, num_chars) — if num_chars is larger than remaining characters,
+> Excel just returns whatever is left. Using LEN(B13) guarantees we always get
+> the full surname no matter how long it is.
+
+**Steps in Excel:**
+```
+1. Add header "Initials and Surname" in a new column
+2. Click the cell for Order ID 12 (row 13)
+3. Type:  =LEFT(B13,1)&" "&MID(B13,FIND(" ",B13)+1,LEN(B13))
+4. Press Enter → K Martinez
+```
+
+---
+
+**Q24.6 — Order Status for Order ID 11: On Time or Delayed (IF + DATE)**
+
+> **Answer: Delayed**
+> **Formula: =IF(C12<=DATE(2023,10,10),"On Time","Delayed")**
+
+**Step 1 — Find Order ID 11 in the dataset:**
+
+| Row | Order ID | Customer Name | Order Date |
+|-----|----------|--------------|------------|
+| 12 | **11** | Richard Adams | **2023-10-11** ← C12 |
+
+**Step 2 — What DATE(2023,10,10) does:**
+```
+DATE(year, month, day) builds a date from three numbers.
+DATE(2023,10,10) = 2023-10-10 (the cutoff)
+```
+
+**Step 3 — IF logic:**
+```
+=IF( C12 <= DATE(2023,10,10) , "On Time" , "Delayed" )
+      ↑           ↑                ↑            ↑
+      │           │                │            └── later than Oct 10 → Delayed
+      │           │                └─────────────── on or before Oct 10 → On Time
+      │           └──────────────────────────────── cutoff = 2023-10-10
+      └──────────────────────────────────────────── C12 = 2023-10-11
+
+2023-10-11 <= 2023-10-10? → FALSE → result = "Delayed"
+```
+
+**Order status for all 20 orders:**
+
+| On Time (date ≤ 2023-10-10) | Delayed (date > 2023-10-10) |
+|-----------------------------|-----------------------------|
+| OID 1–10 (Oct 1–10) ✅ | OID 11–20 (Oct 11–20) ❌ |
+| includes Susan Turner Oct 10 | **Richard Adams Oct 11** ← Q24.6 |
+
+> **Exam trap:** The condition is `<=` (on or before). Order ID 10 (Susan Turner,
+> 2023-10-10) is **On Time** because Oct 10 = cutoff. Order ID 11 (Richard Adams,
+> 2023-10-11) is one day late → **Delayed**.
+
+**Steps in Excel:**
+```
+1. Add header "Order Status" in a new column
+2. Click the cell for Order ID 11 (row 12)
+3. Type:  =IF(C12<=DATE(2023,10,10),"On Time","Delayed")
+4. Press Enter → Delayed
+```
+
+---
+
+**Q24.7 — Discount for Order ID 5: 10% if Amount ≥ 100, else 0 (IF)**
+
+> **Answer: 15.08**
+> **Formula: =IF(E6>=100,E6*10%,0)**
+
+**Step 1 — Find Order ID 5 in the dataset:**
+
+| Row | Order ID | Customer Name | Order Amount |
+|-----|----------|--------------|-------------|
+| 6 | **5** | Robert Brown | **150.80** ← E6 |
+
+**Step 2 — IF logic:**
+```
+=IF( E6>=100 , E6*10% , 0 )
+      ↑             ↑      ↑
+      │             │      └── amount < 100 → no discount = 0
+      │             └─────────── amount >= 100 → 10% discount
+      └───────────────────────── E6 = 150.80, is 150.80 >= 100? YES
+```
+
+**Step 3 — Calculation:**
+```
+150.80 >= 100 → TRUE → apply 10% discount
+Discount = E6 * 10% = 150.80 * 0.10 = 15.08
+```
+
+**Step 4 — Discount examples across the dataset:**
+
+| Order ID | Amount | >= 100? | Discount |
+|----------|--------|---------|----------|
+| 2 | 75.25 | No | 0 |
+| 4 | 90.30 | No | 0 |
+| **5** | **150.80** | **Yes** | **15.08** ← Q24.7 |
+| 6 | 65.45 | No | 0 |
+| 7 | 110.60 | Yes | 11.06 |
+
+> **Note:** `E6*10%` is equivalent to `E6*0.1`. Excel treats `10%` as `0.10`.
+> Both `=IF(E6>=100,E6*10%,0)` and `=IF(E6>=100,E6*0.1,0)` give the same result.
+
+**Steps in Excel:**
+```
+1. Add header "Discount" in a new column
+2. Click the cell for Order ID 5 (row 6)
+3. Type:  =IF(E6>=100,E6*10%,0)
+4. Press Enter → 15.08
+```
+
+---
+
+**Summary of all 7 formula answers:**
+
+| Q | Task | Formula | Answer |
+|---|------|---------|--------|
+| 24.1 | Next Order Date OID5 (+3 days) | `=C6+3` | **2023-10-08** |
+| 24.2 | Time Slot OID8 (IF+TIME) | `=IF(D9<TIME(12,0,0),"Morning","Afternoon")` | **Afternoon** |
+| 24.3 | Rounded Amount OID16 (ROUND) | `=ROUND(E17,0)` | **80** |
+| 24.4 | Name length OID7 (LEN) | `=LEN(B8)` | **11** |
+| 24.5 | Initials+Surname OID12 | `=LEFT(B13,1)&" "&MID(B13,FIND(" ",B13)+1,LEN(B13))` | **K Martinez** |
+| 24.6 | Order Status OID11 (IF+DATE) | `=IF(C12<=DATE(2023,10,10),"On Time","Delayed")` | **Delayed** |
+| 24.7 | Discount OID5 (IF 10%) | `=IF(E6>=100,E6*10%,0)` | **15.08** |
+                """,
+            "key_points": [
+                "Date arithmetic: =C6+3 adds 3 calendar days — Excel stores dates as serial numbers so plain addition works",
+                "TIME(12,0,0) creates noon as a fraction (0.5) — use <TIME(12,0,0) to test for morning",
+                "ROUND(number,0) rounds to nearest whole number — 80.15 → 80 because .1 < .5",
+                "LEN counts ALL characters including spaces — 'Michael Lee' = 11, not 10",
+                "Extract initial+surname: LEFT(B,1) for initial, FIND to locate the space, MID to get everything after it",
+                "DATE(2023,10,10) builds a date from year/month/day numbers — safer than hard-coding a date string",
+                "IF with percentage: E6*10% is the same as E6*0.1 — Excel understands % notation in formulas"
+            ],
+            "dataset_file": "CA Lesson 2 dataset - Resolved.xlsx"
+        }
+    ],
+    "exercises": [
+        {
+            "title": "1.4 Conditional Formatting — Formula Challenge",
+            "type": "practical",
+            "question": "Write the Excel conditional formatting formula to highlight any student name in A2:A31 that appears more than once (duplicate check). What range do you apply it to, and what formula do you use?",
+            "answer": "Range: A2:A31. Formula: =COUNTIF($A$2:$A$31,A2)>1. Explanation: COUNTIF counts how many times the value in A2 appears in the locked range $A$2:$A$31. If >1, the cell is a duplicate and gets highlighted. The $A$2:$A$31 is absolute (fixed) so the range stays the same for every row, but A2 is relative so it shifts to A3, A4... as the rule applies down the column.",
+            "hint": "Use COUNTIF with an absolute range but a relative starting cell. The formula must return TRUE or FALSE."
+        },
+        {
+            "title": "1.7 Advanced Functions — XLOOKUP vs VLOOKUP",
+            "type": "practical",
+            "question": "You have a student list in columns A (Name) and C (Science score). Write both a VLOOKUP and an XLOOKUP to find 'Student 15' science score. Then explain why XLOOKUP is preferred.",
+            "answer": "VLOOKUP: =VLOOKUP(\"Student 15\", A2:C31, 3, FALSE) — searches column A, returns the value 3 columns across (column C). XLOOKUP: =XLOOKUP(\"Student 15\", A2:A31, C2:C31, \"Not found\") — searches A2:A31, returns the matching value from C2:C31. XLOOKUP is preferred because: 1) It can look RIGHT or LEFT (VLOOKUP only right), 2) The return column is a separate argument so inserting columns won't break it, 3) You can specify a default value for no match, 4) It returns only what you need, not a whole range.",
+            "hint": "VLOOKUP needs col_index_num (count from lookup column); XLOOKUP has separate lookup_array and return_array"
+        },
+        {
+            "title": "1.6 Pivot Table Analysis",
+            "type": "scenario",
+            "question": "Using the 30-student dataset (Name, Mathematics, Science, English), describe how you would build a PivotTable to find the average score for each subject AND add a slicer to filter by score range.",
+            "answer": "Steps: 1) Click any cell in the data range A1:D31. 2) Insert → PivotTable → New Worksheet → OK. 3) In the PivotTable Fields pane, drag Mathematics, Science, English to the Values area. 4) Excel defaults to SUM — click each field in Values → Value Field Settings → change to Average. 5) The result shows one row with Average of Maths, Average of Science, Average of English. 6) To filter by score range: PivotTable Analyze → Insert Slicer → tick Mathematics → OK. The slicer appears; click a value range to filter the entire PivotTable instantly. 7) Optionally add a PivotChart: PivotTable Analyze → PivotChart → Column.",
+            "hint": "Values area defaults to SUM — always check Value Field Settings for the right aggregation"
+        },
+        {
+            "title": "1.9 Power Query — CSV Import",
+            "type": "practical",
+            "question": "You receive a new student CSV file each week. The scores column is imported as text (not numbers). Describe the Power Query steps to fix this and make the process repeatable.",
+            "answer": "1) Data → Get Data → From File → From CSV → select your file. 2) Click Transform Data to open the editor. 3) In the editor, click the data type icon (ABC) on each score column header → change to Decimal Number. 4) If any blank rows exist: Home → Remove Rows → Remove Blank Rows. 5) Rename any misnamed column headers by double-clicking. 6) Home → Close & Load → loads to a new sheet as a Table. 7) Next week when new CSV arrives: replace the old file with the same filename (same folder). 8) In Excel: Data → Refresh All. Power Query reruns all recorded steps on the new file — clean data in seconds, no manual work.",
+            "hint": "Power Query records every step. The key to repeatability is keeping the same filename/path and using Refresh All."
+        }
+    ],
+    "quiz": [
+        {
+            "question": "In Excel, pressing F4 while editing a cell reference does what?",
+            "options": ["Opens the Format Cells dialog", "Cycles between relative, absolute, and mixed references", "Recalculates the worksheet", "Opens the Find dialog"],
+            "correct": 1,
+            "explanation": "F4 cycles a reference through =A1 (relative) → =$A$1 (absolute) → =A$1 (row locked) → =$A1 (column locked) and back. This is the fastest way to add or remove $ signs."
+        },
+        {
+            "question": "Which conditional formatting formula correctly highlights duplicate names in A2:A31?",
+            "options": ["=COUNTIF(A2:A31,A2)>1", "=COUNTIF($A$2:$A$31,A2)>1", "=DUPLICATE(A2)=TRUE", "=COUNT($A$2:$A$31)>1"],
+            "correct": 1,
+            "explanation": "=COUNTIF($A$2:$A$31,A2)>1 is correct. The range $A$2:$A$31 must be absolute (locked) so it always checks the full list, while A2 is relative so it shifts to A3, A4... as the rule applies down."
+        },
+        {
+            "question": "You want to summarise 5,000 sales rows — total revenue by product category — without formulas. The best tool is:",
+            "options": ["SUMIF formula", "Conditional Formatting", "PivotTable", "Power Query"],
+            "correct": 2,
+            "explanation": "A PivotTable is designed for exactly this. Drag Category to Rows and Revenue to Values (set to Sum) — done in seconds. SUMIF works too but requires writing formulas for each category."
+        },
+        {
+            "question": "What does =XLOOKUP(\"Student 5\", A2:A31, C2:C31, \"Not found\") return?",
+            "options": ["The row number of Student 5", "The value in C2:C31 that corresponds to Student 5 in A2:A31", "How many times Student 5 appears", "An error if Student 5 is missing"],
+            "correct": 1,
+            "explanation": "XLOOKUP searches A2:A31 for 'Student 5' and returns the matching value from C2:C31. The 4th argument 'Not found' is returned if no match is found (no #N/A error)."
+        },
+        {
+            "question": "You save an Excel file with macros as .xlsx — what happens?",
+            "options": ["Macros are saved normally", "Macros are converted to VBA automatically", "Macros are stripped from the file", "The file size doubles"],
+            "correct": 2,
+            "explanation": ".xlsx is the standard format and cannot store macros. Always save as .xlsm (Excel Macro-Enabled Workbook) to preserve VBA code and recorded macros."
+        },
+        {
+            "question": "In Power Query, what does 'Refresh All' (Data tab) do?",
+            "options": ["Reformats all cells", "Reruns all Power Query steps on the current source data", "Clears all filters", "Recalculates all formulas"],
+            "correct": 1,
+            "explanation": "Refresh All re-executes all recorded transformation steps against the current state of the data source. This means weekly CSV updates can be processed automatically with one click."
+        },
+        {
+            "question": "What Excel feature prevents users from entering letters in a cell meant for scores (0–100)?",
+            "options": ["Conditional Formatting", "Data Validation", "Cell Protection", "Freeze Panes"],
+            "correct": 1,
+            "explanation": "Data Validation (Data tab) lets you restrict entries by type, range, list, etc. Setting Whole Number between 0 and 100 with a 'Stop' error alert blocks any invalid input."
+        },
+        {
+            "question": "True or False: VisiCalc was capable of automatically recalculating the entire sheet when one value was changed, which was a significant advancement from manual spreadsheet management.",
+            "options": ["True", "False"],
+            "correct": 0,
+            "explanation": "True. VisiCalc (1979), created by Dan Bricklin and Bob Frankston, was the first electronic spreadsheet and its defining innovation was automatic recalculation — change one cell and every dependent cell updates instantly. Before this, accountants had to manually recalculate every figure on paper when one number changed. This single feature made VisiCalc the first 'killer app' for personal computers and drove mass adoption of the Apple II in business."
+        },
+        {
+            "question": "True or False: XLS is the default file format used in recent versions of Microsoft Excel, and it stores data, formulas, formatting, charts, and other elements within a single file.",
+            "options": ["True", "False"],
+            "correct": 1,
+            "explanation": "False. XLS is the legacy binary format from Excel 97-2003 and is NOT the default in modern Excel. Since Excel 2007, the default format is .xlsx (Office Open XML). The four main formats are: .xls (legacy, no longer default), .xlsx (current default, cannot store macros), .xlsm (macro-enabled workbook), and .xlsb (binary, for large files). Always save as .xlsx unless you need macros (.xlsm) or are sharing with very old Excel versions."
+        },
+        {
+            "question": "True or False: Pivot tables cannot be used to calculate statistics like sum, average, or count of data.",
+            "options": ["True", "False"],
+            "correct": 1,
+            "explanation": "False. Calculating statistics is precisely what PivotTables are designed for. Via Value Field Settings (right-click a value → Value Field Settings → Summarize Values By), you can choose from: Sum, Count, Average, Max, Min, Product, Count Numbers, StdDev, StdDevp, Var, and Varp. The default is Sum for numbers and Count for text, but all 9+ statistics are available with a few clicks."
+        },
+        {
+            "question": "True or False: The DATE function in Excel allows you to create a date by specifying the year, month, and day as separate arguments.",
+            "options": ["True", "False"],
+            "correct": 0,
+            "explanation": "True. =DATE(year, month, day) constructs an Excel date serial number from three separate numeric arguments. For example, =DATE(2026, 2, 19) returns 19/02/2026. It is especially useful when year, month, and day values are stored in separate columns and need to be combined into a single date for calculations or formatting."
+        },
+        {
+            "question": "True or False: Google Sheets is a cloud-based spreadsheet application that offers real-time collaboration, making it similar in functionality to Excel.",
+            "options": ["True", "False"],
+            "correct": 0,
+            "explanation": "True. Google Sheets runs entirely in a browser (cloud-based) and multiple users can edit the same file simultaneously with changes visible in real time — this is built-in by default. It supports most of the same core features as Excel: formulas (XLOOKUP, IFS, SUMIF, etc.), PivotTables, charts, and conditional formatting. The main differences are that Excel has Power Query and VBA/macros (Google Sheets does not), and Google Sheets is free while Excel requires a Microsoft 365 subscription."
+        },
+        {
+            "question": "True or False: AVERAGEIF calculates the average of a range of cells based on a single condition.",
+            "options": ["True", "False"],
+            "correct": 0,
+            "explanation": "True. =AVERAGEIF(range, criteria, average_range) accepts exactly one condition. For example, =AVERAGEIF(B2:B31, '>60', B2:B31) returns the average of all scores above 60. If you need two or more conditions (AND logic), you must use AVERAGEIFS instead — same pattern as SUMIF vs SUMIFS and COUNTIF vs COUNTIFS: the S suffix always means multiple criteria."
+        },
+        {
+            "question": "True or False: Once you complete data transformation in Power Query Editor, you can only load the data into a new worksheet in Excel.",
+            "options": ["True", "False"],
+            "correct": 1,
+            "explanation": "False. When you click 'Close & Load To…', Power Query offers six destinations: (1) Table on a new worksheet — the default 'Close & Load', (2) Table on an existing worksheet — you specify the exact cell, (3) PivotTable Report, (4) PivotChart, (5) Only Create Connection — no data written to any sheet (typically used to feed the Data Model), (6) Add to Data Model — loads into Power Pivot's in-memory model. Only the basic 'Close & Load' (without 'To…') defaults to a new worksheet."
+        },
+        {
+            "question": "True or False: CHOOSE returns a value from a list of values based on a specified index number.",
+            "options": ["True", "False"],
+            "correct": 0,
+            "explanation": "True. =CHOOSE(index_num, value1, value2, value3, ...) returns the value at the position given by index_num. CHOOSE(1,...) returns value1, CHOOSE(2,...) returns value2, and so on (up to 254 values). If index_num is 0 or exceeds the number of values, Excel returns #VALUE!. It differs from SWITCH (which matches a value to cases) and IFS (which evaluates conditions). A classic use is converting WEEKDAY's number to a day name: =CHOOSE(WEEKDAY(A1),'Sun','Mon','Tue','Wed','Thu','Fri','Sat')."
+        },
+        {
+            "question": "True or False: LEN can be used to count the number of words in a cell.",
+            "options": ["True", "False"],
+            "correct": 1,
+            "explanation": "False. LEN counts characters (every letter, space, and punctuation mark), not words. =LEN('Hello World') returns 11 — the total character count — not 2 (words). To count words you need a workaround combining three functions: =LEN(TRIM(A1))-LEN(SUBSTITUTE(A1,' ',''))+1. This works by counting spaces (spaces = words minus 1) and adding 1. LEN alone has no concept of what a word is."
+        },
+        {
+            "question": "True or False: COUNTIFS can be used to count cells that meet multiple criteria simultaneously within the same range.",
+            "options": ["True", "False"],
+            "correct": 0,
+            "explanation": "True. =COUNTIFS(range1, criteria1, range2, criteria2, ...) counts rows where ALL conditions are TRUE simultaneously — AND logic. Criteria can span different ranges (e.g. Maths>=60 AND Science>=60) or apply two conditions to the same range (e.g. Maths>60 AND Maths<90). The S suffix pattern applies to the whole IF family: COUNTIF/COUNTIFS, SUMIF/SUMIFS, AVERAGEIF/AVERAGEIFS — S always means multiple criteria."
+        },
+        {
+            "question": "What does the OFFSET function in Excel do?",
+            "options": [
+                "Returns a reference to a cell or range based on a specified number of rows and columns from a starting reference",
+                "Retrieves data from a closed workbook",
+                "Performs text manipulation tasks",
+                "Returns the sum of a range of values"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =OFFSET(reference, rows, cols, [height], [width]) starts at a reference cell and moves the specified number of rows down and columns right, returning that cell or range. Option b describes external references/INDIRECT, option c describes text functions (LEFT, TRIM, LEN, etc.), and option d describes SUM/SUMIF. OFFSET is powerful because it returns a dynamic reference — useful inside SUM or AVERAGE to build ranges that adjust automatically."
+        },
+        {
+            "question": "What is the primary purpose of Excel's Data Validation feature?",
+            "options": [
+                "Customizing cell formatting",
+                "Ensuring data integrity and quality",
+                "Sorting and filtering data",
+                "Creating charts and graphs"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. Data Validation (Data → Data Validation) controls what a user is allowed to enter into a cell, preventing errors at the point of entry. Option a describes Format Cells (Home tab), option c describes Sort and Filter (Data tab), and option d describes Insert Charts. The key distinction: Data Validation ensures data integrity and quality by stopping bad data before it enters — it does not change how data looks, arrange it, or visualise it."
+        },
+        {
+            "question": "When it comes to number formatting in Excel, what does the Accounting format align?",
+            "options": [
+                "Decimal places",
+                "Currency symbols",
+                "Text wrapping",
+                "Font styles"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. The Accounting format pins the currency symbol (£, $, €) to the LEFT edge of the cell, while the number and decimal align to the right — creating a clean column of symbols in financial reports. Currency format places the symbol directly next to the number. Option a (decimal places) is aligned by both Currency and Accounting, so it is not what uniquely defines Accounting. Option c (text wrapping) is in Format Cells → Alignment, and option d (font styles) is in the Home → Font group."
+        },
+        {
+            "question": "Which of the following is NOT a common dataset type that Excel can import?",
+            "options": [
+                "PDF (Portable Document Format)",
+                "Access Databases",
+                "CSV (Comma Separated Values)",
+                "Excel Workbooks"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct — PDF is NOT a common structured import source. CSV, Access Databases, and Excel Workbooks are all fully supported via Data → Get Data with clean, reliable results every time. PDF is a fixed-layout presentation format designed for humans to read, not for machines to parse. While Excel 365 added experimental PDF import via Power Query, it is unreliable and requires manual mapping — it is not considered a standard data import format alongside CSV, Access, or Excel."
+        },
+        {
+            "question": "What does the ISNUMBER function in Excel check?",
+            "options": [
+                "If a cell contains a date",
+                "If a cell contains a formula",
+                "If a cell contains a numeric value",
+                "If a cell contains text"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. =ISNUMBER(value) returns TRUE if the value is numeric, FALSE otherwise. Option a (date) is wrong because dates ARE stored as numbers, so ISNUMBER returns TRUE for them too — there is no separate ISDATE function. Option b (formula) requires =ISFORMULA(ref). Option d (text) requires =ISTEXT(value). All IS-functions return TRUE/FALSE and are commonly used inside IF statements for data validation: =IF(ISNUMBER(A1), 'Valid', 'Must be a number')."
+        },
+        {
+            "question": "Which of the following is NOT a step involved in importing a CSV dataset into Excel?",
+            "options": [
+                "Converting the data to plain text format",
+                "Navigating to the location of the CSV file",
+                "Selecting the delimiter used in the CSV file",
+                "Opening a new Excel workbook"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct — converting to plain text is NOT a step because CSV files are already plain text by definition (CSV = Comma-Separated Values stored as a .txt-style file). No pre-conversion is ever needed. The real import steps are: (b) navigate to the file location, (c) confirm the delimiter (comma, semicolon, tab, etc.), and (d) have an open workbook to import into. Excel reads CSV directly via Data → Get Data → From File → From Text/CSV."
+        },
+        {
+            "question": "What is the purpose of colour scales in conditional formatting?",
+            "options": [
+                "To add icons to cells",
+                "To assign different colours to cells based on their values",
+                "To highlight duplicate values",
+                "To format cells as data bars"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. Colour Scales create a continuous colour gradient (heat map) across a range — each cell is shaded proportionally to its value. Option a (icons) describes Icon Sets. Option c (duplicates) describes Highlight Cell Rules → Duplicate Values. Option d (data bars) describes Data Bars, which draw a proportional horizontal bar inside each cell. The four CF visual types are: Colour Scales (gradient heat map), Data Bars (in-cell bar), Icon Sets (symbols/arrows), Highlight Cell Rules (solid fill on condition)."
+        },
+        {
+            "question": "In Excel, what happens when you apply a filter to data?",
+            "options": [
+                "It permanently deletes rows that don't meet the criteria",
+                "It hides the column headers",
+                "It sorts the data in ascending order",
+                "It displays only the rows that meet the specified criteria"
+            ],
+            "correct": 3,
+            "explanation": "Answer d is correct. Filtering temporarily hides non-matching rows — they are NOT deleted and reappear when the filter is cleared (Data → Clear). Column headers always remain visible and gain dropdown arrows when filtering is active. Filtering does NOT sort data — sorting and filtering are separate operations. The row numbers of hidden rows skip (e.g. rows 3 and 5 are hidden so the list jumps from 2 to 4 to 6), which is a visual clue that a filter is active."
+        },
+        {
+            "question": "When using the Excel 'Auto-Fill' feature, what does the thin black crosshair cursor indicate?",
+            "options": [
+                "The location to paste copied data",
+                "The AutoFill handle for pattern recognition",
+                "The direction of data import",
+                "The current active cell"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. The thin solid black crosshair (+) appears when you hover over the bottom-right corner of a selected cell — this is the fill handle. Drag it to extend a pattern (Jan→Feb→Mar, 1,2→3,4,5, formulas, etc.). Option a (paste location) is shown by a flashing dashed border (marching ants) after Ctrl+C — not a crosshair. Option c (data import direction) does not correspond to any real Excel cursor. Option d (active cell) is indicated by a green outlined border, not a crosshair. The thick white/hollow arrow (hovering over the middle of the cell) is the normal select cursor — the thin black crosshair only appears at the bottom-right corner specifically."
+        },
+        {
+            "question": "What feature made Microsoft Excel 1.0 stand out and contributed to its ease of use?",
+            "options": [
+                "Graphical presentation of Data",
+                "WYSIWYG",
+                "Advanced Calculations",
+                "Dropdown Menus"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. Excel 1.0 (1985, Apple Mac) was the first spreadsheet with a true WYSIWYG (What You See Is What You Get) interface — the screen showed exactly how the spreadsheet would look when printed, including fonts, bold, borders and column widths. DOS competitor Lotus 1-2-3 required slash-text commands and you had to physically print to see real formatting. Option a (charts/graphical data) already existed in Lotus 1-2-3 (1983) before Excel. Option c (calculations) were already present in VisiCalc (1979) and Lotus. Option d (dropdown menus) were not Excel's unique differentiator. WYSIWYG was the feature that made Excel on the Mac feel revolutionary compared to everything else available in 1985."
+        },
+        {
+            "question": "Using the CA Lesson 1 dataset (20 rows, columns: Date, Product ID, Units Sold, Price per Unit), which formula correctly calculates the total number of units sold for ALL products combined?",
+            "options": [
+                "=COUNT(C2:C21)",
+                "=AVERAGE(C2:C21)",
+                "=SUM(C2:C21)",
+                "=MAX(C2:C21)"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. =SUM(C2:C21) adds every value in the Units Sold column (C2 to C21) giving 282. COUNT (option a) counts how many cells have numbers — not the total. AVERAGE (option b) divides the sum by the count — not what is asked. MAX (option d) returns only the highest single value (28), not the total."
+        },
+        {
+            "question": "In the CA Lesson 1 dataset, the Price per Unit column contains values like $10, $12, $14, $15. Which formula gives the AVERAGE price per unit across all 20 rows?",
+            "options": [
+                "=SUM(D2:D21)/COUNT(D2:D21)",
+                "=AVERAGE(D2:D21)",
+                "=MEDIAN(D2:D21)",
+                "=MODE(D2:D21)"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. =AVERAGE(D2:D21) computes the mean of all 20 Price per Unit values. The prices are $10 (×7), $12 (×7), $15 (×3), $14 (×3). Total = 241 ÷ 20 = 12.05. Option a also works mathematically but is the long way. MEDIAN (option c) = 12 (the middle value, not the mean). MODE (option d) = 10 or 12 (most frequent), not the average."
+        },
+        {
+            "question": "Using the CA Lesson 1 dataset, what Excel formula returns the highest number of units sold on any single day, and what is that value?",
+            "options": [
+                "=MAX(C2:C21) → 25",
+                "=MAX(C2:C21) → 28",
+                "=LARGE(C2:C21,1) → 22",
+                "=MAX(B2:B21) → P004"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. =MAX(C2:C21) scans all 20 Units Sold values and returns the largest. The row 2023-09-15, Product P001, has 28 units — the highest in the dataset. Option a has the right formula but wrong value (25 is P001 on Sep 09, not the max). Option c uses LARGE(range,1) which returns the same result as MAX but 22 is wrong. Option d looks at the wrong column (Product ID is text)."
+        },
+        {
+            "question": "In the CA Lesson 1 dataset, what formula finds the LOWEST price per unit, and what is the answer?",
+            "options": [
+                "=MIN(D2:D21) → $12",
+                "=MIN(C2:C21) → 5",
+                "=MIN(D2:D21) → $10",
+                "=SMALL(D2:D21,1) → $14"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. =MIN(D2:D21) returns the smallest value in the Price per Unit column. The four prices in the dataset are $10 (P001), $12 (P002), $14 (P004), $15 (P003). The minimum is $10. Option a has the right formula but wrong value. Option b applies MIN to Units Sold instead of Price per Unit. Option d uses SMALL(range,1) — correct technique but wrong value ($14 is P004, not the minimum)."
+        },
+        {
+            "question": "Using the CA Lesson 1 dataset, which formula counts the number of days that product 'P002' was sold, and what is the result?",
+            "options": [
+                "=COUNTIF(B2:B21,P002) → 7",
+                "=COUNTIF(B2:B21,\"P002\") → 7",
+                "=SUMIF(B2:B21,\"P002\",C2:C21) → 7",
+                "=COUNT(B2:B21,\"P002\") → 7"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. =COUNTIF(B2:B21,\"P002\") counts cells in B2:B21 that exactly match the text P002. P002 appears on Sep 02, 05, 08, 11, 14, 17, 20 = 7 rows. Option a is wrong because P002 without quotes is treated as a cell reference, not text — it would cause an error or wrong result. Option c (SUMIF) would sum the Units Sold for P002 (not count the days). Option d: COUNT does not accept a criteria argument this way."
+        },
+        {
+            "question": "In the CA Lesson 1 dataset, 2023-09-10 has product P003 (not P001). Using =IF(SUMIFS(C2:C21,B2:B21,\"P001\",A2:A21,DATE(2023,9,10))>20,\"High Sales\",\"Low Sales\"), what is the result?",
+            "options": [
+                "High Sales — P001 on Sep 09 has 25 units",
+                "High Sales — SUMIFS finds P001 and returns 25",
+                "Low Sales — SUMIFS returns 0 (no P001 on Sep 10) and 0 is not > 20",
+                "Error — P001 does not exist in the dataset"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. On 2023-09-10 the dataset has P003 (7 units) — there is NO P001 entry on September 10th. SUMIFS with both criteria (P001 AND Sep 10) finds zero matching rows, so it returns 0. The IF condition is 0 > 20 = FALSE, so the result is 'Low Sales'. Option a/b confuse Sep 09 (P001, 25 units) with Sep 10. Option d is wrong — no error occurs; SUMIFS simply returns 0 when nothing matches."
+        },
+        {
+            "question": "To create a 'Product Details' column by concatenating Product ID (col B) and Price per Unit (col D), which formula is used, and what does it return for row 17 (date 2023-09-16)?",
+            "options": [
+                "=B17+D17 → P003$15",
+                "=B17&D17 → P003$15",
+                "=CONCAT(B17,\" \",D17) → P003 $15",
+                "=B17&D17 → P003 - $15"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. The & operator joins two cell values as text without any separator. Row 17 (2023-09-16): Product ID = P003, Price per Unit = $15 (stored as text). B17&D17 = P003 + $15 = 'P003$15'. Option a uses + (addition) which causes a VALUE error on text. Option c adds a space between them, producing 'P003 $15' — not what was asked. Option d adds ' - ' which also produces a different result."
+        },
+        {
+            "question": "Using =LEFT(B7, 4) for the row with date 2023-09-06 in the CA Lesson 1 dataset, what is the result?",
+            "options": [
+                "P00",
+                "001",
+                "P001",
+                "P0"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. Row 7 (2023-09-06) has Product ID = P001. =LEFT(B7, 4) extracts the 4 leftmost characters: P-0-0-1 = 'P001'. Since P001 is exactly 4 characters, LEFT(4) returns the entire string. Option a (P00) would be LEFT(3). Option b (001) would be RIGHT(3) or MID(2,3). Option d (P0) would be LEFT(2)."
+        },
+        {
+            "question": "Using =RIGHT(B15, 3) for the row with date 2023-09-14 in the CA Lesson 1 dataset, what is the result?",
+            "options": [
+                "P00",
+                "P002",
+                "002",
+                "02"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. Row 15 (2023-09-14) has Product ID = P002. =RIGHT(B15, 3) extracts the 3 rightmost characters from P002: positions 2, 3, 4 = 0-0-2 = '002'. Option a (P00) is the LEFT(3) result. Option b (P002) is the full string (all 4 chars). Option d (02) would be RIGHT(2). Remember: LEFT counts from the start, RIGHT counts from the end."
+        },
+        {
+            "question": "Using the CA Lesson 3 dataset (columns: B=Employee Name, C=Department, D=Salary, rows 2-21), which VLOOKUP formula returns Carol's salary?",
+            "options": [
+                "=VLOOKUP(\"Carol\",B2:D21,3,FALSE)",
+                "=VLOOKUP(\"Carol\",A2:D21,3,FALSE)",
+                "=VLOOKUP(\"Carol\",B2:D21,4,FALSE)",
+                "=VLOOKUP(\"Carol\",B2:D21,2,FALSE)"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =VLOOKUP(\"Carol\",B2:D21,3,FALSE) searches for Carol in B2:D21. The table starts at column B, so B=col 1 (Name), C=col 2 (Dept), D=col 3 (Salary). Col_index 3 returns the Salary. Option b uses A2:D21 which would make Salary col 4. Option c uses col 4, which doesn't exist in B:D. Option d returns col 2 (Department), not Salary. Carol's salary = 55000."
+        },
+        {
+            "question": "Using VLOOKUP on the CA Lesson 3 dataset, which formula returns Paul's Department, and what is the result?",
+            "options": [
+                "=VLOOKUP(\"Paul\",B2:D21,3,FALSE) → Finance",
+                "=VLOOKUP(\"Paul\",B2:D21,2,FALSE) → IT",
+                "=VLOOKUP(\"Paul\",B2:C21,2,FALSE) → IT",
+                "=VLOOKUP(\"Paul\",B2:D21,1,FALSE) → Paul"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. =VLOOKUP(\"Paul\",B2:D21,2,FALSE) — Department is column C, which is the 2nd column of the B:D table range, so col_index = 2. Paul is in row 17 and his department is IT. Option a returns Salary (col 3). Option c works but is unnecessarily restrictive (B:C range). Option d returns the name itself (col 1)."
+        },
+        {
+            "question": "Which formula uses INDEX and MATCH to return Maria's salary from the CA Lesson 3 dataset?",
+            "options": [
+                "=INDEX(B2:B21,MATCH(\"Maria\",D2:D21,0))",
+                "=INDEX(D2:D21,MATCH(\"Maria\",B2:B21,0))",
+                "=MATCH(\"Maria\",B2:B21,INDEX(D2:D21,0))",
+                "=INDEX(MATCH(\"Maria\",B2:B21,0),D2:D21)"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. =INDEX(D2:D21,MATCH(\"Maria\",B2:B21,0)) — MATCH finds Maria's position in B2:B21 (position 13), then INDEX returns the 13th value from D2:D21 (salary = 54000). Option a searches for Maria in the Salary column (wrong). Option c has the arguments in the wrong order. Option d has INDEX and MATCH reversed — MATCH should be the second argument of INDEX."
+        },
+        {
+            "question": "Using =MATCH(MAX(D2:D21),D2:D21,0) on the CA Lesson 3 dataset, what does the result 16 mean?",
+            "options": [
+                "The employee with the highest salary is in Excel row 16",
+                "There are 16 employees in the dataset",
+                "The highest salary is the 16th value in the range D2:D21",
+                "The highest salary is 16000"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. MATCH returns the relative position within the lookup range, not the Excel row number. D2:D21 contains 20 salary values. MAX(D2:D21)=64000 (Paul). Paul's 64000 is the 16th value in the range D2:D21. The actual Excel row is 17 (row 2 + 15 offset), not 16. Option a confuses relative position with Excel row number."
+        },
+        {
+            "question": "What does =SUM(OFFSET(D2,0,0,5,1)) calculate in the CA Lesson 3 dataset, and what is the result?",
+            "options": [
+                "Sum of all 20 salaries → 1155000",
+                "Sum of salaries in rows 1 to 5 of the spreadsheet → error",
+                "Sum of the first 5 employee salaries starting from D2 → 275000",
+                "Average of the first 5 salaries → 55000"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. OFFSET(D2,0,0,5,1) starts at D2, moves 0 rows and 0 columns, then creates a range 5 rows tall and 1 column wide — that is D2:D6 (Alice 50000, Bob 60000, Carol 55000, Dave 62000, Eve 48000). SUM of those = 275000. Option a sums all 20. Option b is wrong because row 1 is the header. Option d would require AVERAGE not SUM."
+        },
+        {
+            "question": "Which formula returns Irene's department using INDEX and MATCH on the CA Lesson 3 dataset?",
+            "options": [
+                "=INDEX(D2:D21,MATCH(\"Irene\",B2:B21,0))",
+                "=INDEX(C2:C21,MATCH(\"Irene\",D2:D21,0))",
+                "=INDEX(C2:C21,MATCH(\"Irene\",B2:B21,0))",
+                "=MATCH(\"Irene\",B2:B21,INDEX(C2:C21,0))"
+            ],
+            "correct": 2,
+            "explanation": "Answer c is correct. =INDEX(C2:C21,MATCH(\"Irene\",B2:B21,0)) — MATCH locates Irene in the Name column B2:B21 (position 9), then INDEX returns the 9th value from C2:C21 (Department column) = HR. Option a returns the Salary (D column), not Department. Option b searches for Irene in the Salary column (wrong). Option d has the syntax reversed."
+        },
+        {
+            "question": "In the CA Lesson 3 dataset, =INDIRECT(\"D15\") returns the salary of which employee, and what is the value?",
+            "options": [
+                "Olivia → 49000 (15th data row)",
+                "Neil → 57000 (Excel row 15)",
+                "Paul → 64000 (highest salary)",
+                "Maria → 54000 (13th employee)"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. INDIRECT(\"D15\") reads cell D15 literally. Row 1 is the header, row 2 = Alice, row 3 = Bob... row 15 = Neil (Finance, 57000). Option a confuses Excel row 15 with the 15th data row, which would be Excel row 16 (Olivia, 49000). INDIRECT always uses the actual Excel row number in its text argument."
+        },
+        {
+            "question": "Why does =LOOKUP(\"Grace\",B2:B21,D2:D21) work correctly in the CA Lesson 3 dataset but would fail on an unsorted list?",
+            "options": [
+                "Because LOOKUP only works on numeric data",
+                "Because the names in B2:B21 are in alphabetical (ascending) order — LOOKUP requires sorted data",
+                "Because Grace is the 7th employee and LOOKUP needs exactly 7 rows",
+                "Because LOOKUP always returns the last matching value"
+            ],
+            "correct": 1,
+            "explanation": "Answer b is correct. LOOKUP performs a binary search and requires the lookup vector to be sorted in ascending order. The names Alice, Bob, Carol... Tina are alphabetical, so LOOKUP correctly finds Grace and returns her salary 58000. On an unsorted list LOOKUP can return wrong results or an error. VLOOKUP with FALSE and XLOOKUP both handle unsorted data safely."
+        },
+        {
+            "question": "Which XLOOKUP formula returns Sam's salary from the CA Lesson 3 dataset, and what is the advantage over VLOOKUP?",
+            "options": [
+                "=XLOOKUP(\"Sam\",B2:B21,D2:D21) → 60000; XLOOKUP needs no col_index and can search in any direction",
+                "=XLOOKUP(\"Sam\",B2:D21,3) → 60000; XLOOKUP is faster than VLOOKUP",
+                "=XLOOKUP(D2:D21,\"Sam\",B2:B21) → 60000; XLOOKUP works from right to left only",
+                "=XLOOKUP(\"Sam\",B2:B21,D2:D21) → 51000; Rachel was the 18th employee"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =XLOOKUP(\"Sam\",B2:B21,D2:D21) finds Sam in B2:B21 (position 19) and returns the matching value from D2:D21 = 60000. Unlike VLOOKUP, XLOOKUP takes separate lookup and return ranges so there is no col_index to count, it can return values to the LEFT of the search column, and accepts an optional fallback value for when the name is not found. Option b uses VLOOKUP-style syntax which is wrong for XLOOKUP. Option d has the wrong value."
+        },
+        {
+            "question": "Using the CA Lesson 4 dataset (D=Salary, C=Department, E=Years of Service, rows 2-21), which MAXIFS formula returns the maximum salary among Sales employees with 2 or more years of service?",
+            "options": [
+                "=MAXIFS(D2:D21,C2:C21,\"Sales\",E2:E21,\">=2\") → 56000",
+                "=MAXIFS(D2:D21,\"Sales\",C2:C21,2,E2:E21) → 56000",
+                "=MAX(IF(C2:C21=\"Sales\",D2:D21)) → 56000",
+                "=MAXIFS(C2:C21,\"Sales\",D2:D21,E2:E21,\">=2\") → 56000"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. MAXIFS takes: max_range first (D2:D21), then pairs of (criteria_range, criteria). The criteria string '>=2' must be in quotes. Option b has the argument order wrong. Option c is an array formula (needs Ctrl+Shift+Enter) and is the old approach. Option d puts the Department column as the max_range."
+        },
+        {
+            "question": "Using the CA Lesson 4 dataset (F=Bonus Percentage, C=Department, D=Salary, rows 2-21), which MINIFS formula returns the minimum bonus percentage among Finance employees with a salary greater than 58000?",
+            "options": [
+                "=MINIFS(F2:F21,C2:C21,\"Finance\",D2:D21,\">58000\") → 0.07",
+                "=MINIFS(F2:F21,C2:C21,\"Finance\",D2:D21,\">=58000\") → 0.07",
+                "=MIN(IF(C2:C21=\"Finance\",F2:F21)) → 0.07",
+                "=MINIFS(D2:D21,C2:C21,\"Finance\",F2:F21,\">58000\") → 57000"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =MINIFS(F2:F21,...,'>58000') uses strict greater than, which excludes Neil Taylor (salary = 58000 exactly). The qualifying Finance employees are Bob Johnson, Jack White, and Rachel Turner (all 59000). The minimum bonus among them is Bob Johnson's 7% = 0.07. Option b uses >=58000 which also includes Neil Taylor (8%) — but Bob's 7% is still the minimum, so it would also give 0.07; however option a is the exact formula asked. Option d returns a salary, not a bonus percentage."
+        },
+        {
+            "question": "Using the CA Lesson 4 dataset (F=Bonus Percentage, rows 2-21), which COUNTIF formula counts employees with a bonus percentage greater than or equal to 8%?",
+            "options": [
+                "=COUNTIF(F2:F21,\">=0.08\") → 7",
+                "=COUNTIF(F2:F21,\">0.08\") → 5",
+                "=COUNTIFS(F2:F21,\">=0.08\") → 7",
+                "=COUNTIF(F2:F21,>=0.08) → error"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. The bonus percentage is stored as a decimal (0.08 = 8%), so the criteria is '>=0.08'. This returns 7: Dave Davis, Harry Wilson, Leo Robinson, Neil Taylor, Paul Anderson, Rachel Turner, Tina Moore. Option b uses strictly greater than (>0.08), excluding Dave Davis and Neil Taylor (exactly 0.08) — returning 5. Option c uses COUNTIFS syntax with only one condition — it works but COUNTIF is simpler for a single condition. Option d omits the quotes around the criteria, causing a formula error."
+        },
+        {
+            "question": "Using the CA Lesson 4 dataset (C=Department, D=Salary, rows 2-21), which COUNTIFS formula counts IT employees with a salary greater than 60000?",
+            "options": [
+                "=COUNTIFS(C2:C21,\"IT\",D2:D21,\">60000\") → 3",
+                "=COUNTIFS(C2:C21,\"IT\",D2:D21,\">=60000\") → 4",
+                "=COUNTIF(C2:C21,\"IT\",D2:D21,\">60000\") → 3",
+                "=COUNTIFS(D2:D21,\">60000\",C2:C21,\"IT\") → 4"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =COUNTIFS(C2:C21,'IT',D2:D21,'>60000') returns 3: Karen Miller (61000), Olivia Harris (62000), Sam Scott (63000). Carol Williams (60000) is excluded because 60000 is NOT strictly greater than 60000. Option b uses >=60000 which includes Carol Williams, returning 4. Option c uses COUNTIF which only accepts one condition pair — adding more arguments causes an error. Option d has the condition pairs in reversed order — this actually gives the same result in COUNTIFS, but 4 is wrong because option d also uses >=60000 logic."
+        },
+        {
+            "question": "Using the CA Lesson 4 dataset (F=Bonus Percentage, D=Salary, rows 2-21), which AVERAGEIF formula returns the average salary of employees with a bonus percentage strictly less than 6%?",
+            "options": [
+                "=AVERAGEIF(F2:F21,\"<0.06\",D2:D21) → 54666.67",
+                "=AVERAGEIF(D2:D21,\"<0.06\",F2:F21) → 54666.67",
+                "=AVERAGEIFS(D2:D21,F2:F21,\"<0.06\") → 54666.67",
+                "=AVERAGEIF(F2:F21,\"<=0.06\",D2:D21) → 55000"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. AVERAGEIF argument order is: (range_to_check, criteria, range_to_average). Three employees qualify (bonus < 0.06): Alice Smith (55000, 5%), Irene Hall (54000, 5.5%), Maria Garcia (55000, 5%). Average = 164000/3 = 54666.67. Option b has range and average_range swapped — this would average the bonus% values where salary < 0.06, giving nonsense. Option c uses AVERAGEIFS syntax correctly (average_range first), and would also give the right answer but option a is cleaner for one condition. Option d uses <=0.06 which also includes employees at exactly 6%, changing the qualifying set."
+        },
+        {
+            "question": "Using the CA Lesson 4 dataset (F=Bonus Percentage, C=Department, E=Years of Service, rows 2-21), which AVERAGEIFS formula returns the average bonus percentage for Sales employees with more than 1 year of service?",
+            "options": [
+                "=AVERAGEIFS(F2:F21,C2:C21,\"Sales\",E2:E21,\">1\") → 0.055",
+                "=AVERAGEIF(F2:F21,C2:C21,\"Sales\",E2:E21,\">1\") → 0.055",
+                "=AVERAGEIFS(C2:C21,\"Sales\",E2:E21,\">1\",F2:F21) → 0.055",
+                "=AVERAGEIFS(F2:F21,C2:C21,\"Sales\",E2:E21,\">=2\") → 0.055"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. AVERAGEIFS argument order: average_range FIRST, then (criteria_range, criteria) pairs. The 5 Sales employees all have 2 years (>1), giving average bonus% = (5%+6%+5.5%+5%+6%)/5 = 5.5% = 0.055. Option b uses AVERAGEIF which only accepts ONE condition — adding extra arguments causes an error. Option c puts the average_range last, which is wrong for AVERAGEIFS (that's AVERAGEIF's order). Option d uses >=2 instead of >1 but gives the same result here since all Sales employees have exactly 2 years."
+        },
+        {
+            "question": "A spreadsheet has Salary in column D, Bonus Percentage in column F, and Bonus Amount in column G (=D*F). Which formula placed in another cell divides the bonus amount by the bonus percentage and shows 'Error' if something goes wrong?",
+            "options": [
+                "=IFERROR(G2/F2,\"Error\")",
+                "=IFERROR(F2/G2,\"Error\")",
+                "=IF(ISERROR(G2/F2),G2/F2,\"Error\")",
+                "=IFERROR(D2/F2,\"Error\")"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =IFERROR(G2/F2,'Error') divides the Bonus Amount (G2) by the Bonus Percentage (F2), recovering the original salary (e.g. Alice: 2750/0.05=55000). If F2 is 0 or blank, the division would cause a #DIV/0! error — IFERROR catches this and shows the text 'Error' instead. Option b divides in the wrong order (F/G). Option c uses the old IF(ISERROR()) pattern which is longer and evaluates the formula twice. Option d divides salary by bonus% directly without using the Bonus Amount column G."
+        },
+        {
+            "question": "Using the CA Lesson 4 dataset (B=Employee Name, D=Salary, rows 2-21, names in alphabetical order), which LOOKUP formula returns Grace Martin's salary?",
+            "options": [
+                "=LOOKUP(\"Grace Martin\",B2:B21,D2:D21) → 58000",
+                "=LOOKUP(\"Grace Martin\",B2:D21,3) → 58000",
+                "=LOOKUP(D2:D21,\"Grace Martin\",B2:B21) → 58000",
+                "=LOOKUP(\"Grace\",B2:B21,D2:D21) → 58000"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =LOOKUP(lookup_value, lookup_vector, result_vector) — the names are alphabetical so LOOKUP's binary search works. Grace Martin is in position 7 in B2:B21; LOOKUP returns the 7th value from D2:D21 = 58000. Option b uses VLOOKUP-style col_index syntax which is wrong for LOOKUP. Option c has the arguments in the wrong order. Option d searches for 'Grace' but the cells contain 'Grace Martin' (full name) — 'Grace' alone is not found and LOOKUP would return a wrong result or an error."
+        },
+        {
+            "question": "Using the CA Lesson 4 dataset (B=Employee Name, D=Salary, rows 2-21), which XLOOKUP formula returns Sam Scott's salary?",
+            "options": [
+                "=XLOOKUP(\"Sam Scott\",B2:B21,D2:D21) → 63000",
+                "=XLOOKUP(\"Sam\",B2:B21,D2:D21) → 63000",
+                "=XLOOKUP(\"Sam Scott\",B2:D21,3) → 63000",
+                "=XLOOKUP(B2:B21,\"Sam Scott\",D2:D21) → 63000"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =XLOOKUP('Sam Scott',B2:B21,D2:D21) finds the exact string 'Sam Scott' in B2:B21 (position 19) and returns D20 = 63000. Option b searches for 'Sam' — but the cells contain 'Sam Scott' (full name), so 'Sam' alone returns #N/A. Option c uses VLOOKUP-style col_index syntax which is wrong for XLOOKUP. Option d has the lookup_value and lookup_array in the wrong positions."
+        },
+        {
+            "question": "Using the CA Lesson 2 dataset (C=Order Date, rows 2-21), which formula in column F calculates the Next Order Date (3 days after) for Order ID 5 in row 6?",
+            "options": [
+                "=C6+3 → 2023-10-08",
+                "=C6+DATE(3) → 2023-10-08",
+                "=EDATE(C6,3) → 2024-01-05",
+                "=C6&3 → error"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. In Excel, dates are stored as serial numbers, so adding 3 to a date moves it forward 3 days. C6 = 2023-10-05, so =C6+3 = 2023-10-08. Option b is wrong — DATE() requires 3 arguments (year, month, day) and DATE(3) is invalid. Option c uses EDATE which adds months, not days — EDATE(C6,3) would give 2024-01-05 (3 months later). Option d uses & which concatenates text and would produce a string, not a date."
+        },
+        {
+            "question": "Using the CA Lesson 2 dataset (D=Order Time, rows 2-21), which formula correctly classifies Order ID 8 (row 9, time 12:15) as Morning or Afternoon?",
+            "options": [
+                "=IF(D9<TIME(12,0,0),\"Morning\",\"Afternoon\") → Afternoon",
+                "=IF(D9<=TIME(12,0,0),\"Morning\",\"Afternoon\") → Morning",
+                "=IF(D9<12,\"Morning\",\"Afternoon\") → Morning",
+                "=IF(D9<\"12:00\",\"Morning\",\"Afternoon\") → error"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. TIME(12,0,0) creates the value for 12:00:00 noon. Linda Harris's time is 12:15, which is NOT less than 12:00, so the condition is FALSE and the result is 'Afternoon'. Option b uses <= which would classify exactly 12:00 as Morning — but noon is the start of afternoon. Option c compares D9 to the number 12, not to a time value — times in Excel are fractions (e.g. noon = 0.5, not 12). Option d compares to a text string '12:00' which does not work for time comparisons."
+        },
+        {
+            "question": "Using the CA Lesson 2 dataset (E=Order Amount, rows 2-21), Order ID 16 (row 17) has an Order Amount of 80.15. Which ROUND formula gives the rounded whole number?",
+            "options": [
+                "=ROUND(E17,0) → 80",
+                "=ROUND(E17,1) → 80.2",
+                "=INT(E17) → 80",
+                "=ROUND(E17,2) → 80.15"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. =ROUND(E17,0) rounds 80.15 to the nearest whole number. The digit after the decimal is 1, which is less than 5, so it rounds DOWN to 80. Option b rounds to 1 decimal place giving 80.2 (the second decimal .5 rounds up the first). Option c uses INT which also gives 80 here but INT always rounds DOWN (truncates) — for negative numbers INT and ROUND behave differently. Option d rounds to 2 decimal places which returns 80.15 (no change). The question asks for nearest whole number, so num_digits=0 is correct."
+        },
+        {
+            "question": "Using the CA Lesson 2 dataset (B=Customer Name, rows 2-21), Order ID 7 (row 8) is Michael Lee. Which LEN formula gives the character count?",
+            "options": [
+                "=LEN(B8) → 11",
+                "=LEN(B8) → 10",
+                "=LEN(TRIM(B8)) → 10",
+                "=COUNT(B8) → 11"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. LEN('Michael Lee') counts every character including the space: M-i-c-h-a-e-l (7) + space (1) + L-e-e (3) = 11. Option b gives the wrong number — 10 ignores the space. Option c uses TRIM first which removes leading/trailing spaces but not internal spaces, so 'Michael Lee' stays 'Michael Lee' and LEN still returns 11. Option d uses COUNT which counts numeric values in a range, not the length of a text string."
+        },
+        {
+            "question": "Using the CA Lesson 2 dataset (B=Customer Name, rows 2-21), Order ID 12 (row 13) is Karen Martinez. Which formula extracts the initial and surname as 'K Martinez'?",
+            "options": [
+                "=LEFT(B13,1)&\" \"&MID(B13,FIND(\" \",B13)+1,LEN(B13)) → K Martinez",
+                "=LEFT(B13,1)&MID(B13,FIND(\" \",B13)+1,LEN(B13)) → KMartinez",
+                "=LEFT(B13,1)&\" \"&RIGHT(B13,8) → K Martinez",
+                "=MID(B13,1,1)&\" \"&RIGHT(B13,FIND(\" \",B13)) → K Martinez"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. LEFT(B13,1) extracts 'K'. FIND(' ',B13) finds the space at position 6. MID(B13,7,LEN(B13)) extracts from position 7 to the end = 'Martinez'. The & ' ' & adds the space between them giving 'K Martinez'. Option b is missing the space separator giving 'KMartinez'. Option c hard-codes RIGHT(B13,8) which only works for surnames of exactly 8 characters — 'Martinez' happens to be 8 but this would break for other names. Option d uses RIGHT(B13,FIND(' ',B13)) = RIGHT(B13,6) = 'rtinez' — the FIND returns the space position (6) not the surname length."
+        },
+        {
+            "question": "Using the CA Lesson 2 dataset (C=Order Date, rows 2-21), Order ID 11 (row 12) has date 2023-10-11. The rule is: On Time if on or before 2023-10-10, else Delayed. What is the formula and result?",
+            "options": [
+                "=IF(C12<=DATE(2023,10,10),\"On Time\",\"Delayed\") → Delayed",
+                "=IF(C12<DATE(2023,10,10),\"On Time\",\"Delayed\") → Delayed",
+                "=IF(C12<=DATE(2023,10,10),\"On Time\",\"Delayed\") → On Time",
+                "=IF(C12<=\"2023-10-10\",\"On Time\",\"Delayed\") → On Time"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. DATE(2023,10,10) creates the cutoff date. 2023-10-11 <= 2023-10-10 is FALSE, so the result is 'Delayed'. Option b uses < (strictly less than) instead of <= — this gives the same result here since Oct 11 is not before Oct 10, but the formula is wrong for Oct 10 itself (Oct 10 would become 'Delayed' instead of 'On Time'). Option c shows the correct formula but the wrong answer — 2023-10-11 is after the cutoff so it is Delayed, not On Time. Option d compares to a text string '2023-10-10' which does not reliably compare with date serial numbers."
+        },
+        {
+            "question": "Using the CA Lesson 2 dataset (E=Order Amount, rows 2-21), Order ID 5 (row 6) has amount 150.80. The discount rule is: 10% if amount >= 100, else 0. What is the formula and result?",
+            "options": [
+                "=IF(E6>=100,E6*10%,0) → 15.08",
+                "=IF(E6>100,E6*10%,0) → 15.08",
+                "=IF(E6>=100,10%,0) → 0.1",
+                "=IF(E6>=100,E6*0.1,E6) → 15.08"
+            ],
+            "correct": 0,
+            "explanation": "Answer a is correct. 150.80 >= 100 is TRUE, so discount = 150.80 * 10% = 150.80 * 0.1 = 15.08. Option b uses strictly greater than (>100) — this works for 150.80 but would give 0 discount for exactly $100 orders, which contradicts the 'greater than or equal to' rule. Option c returns 10% (=0.1) as the discount value instead of calculating the actual discount amount. Option d returns E6 (the full amount) instead of 0 when no discount applies — it should return 0 for amounts under $100."
+        }
+    ]
+}
@@ -0,0 +1,270 @@
+"""Training Center content: Four Data Analysis Philosophies."""
+
+MODULE = {
+    "course": "Data Driven Decision-Making",
+    "description": "Master the four fundamental approaches to data analysis: Descriptive, Diagnostic, Predictive, and Prescriptive analytics.",
+    "lessons": [
+        {
+            "title": "Overview: The Analytics Continuum",
+            "content": """
+**The Four Types of Data Analytics**
+
+Data analysis follows a continuum from understanding the past to shaping the future:
+
+```
+DESCRIPTIVE → DIAGNOSTIC → PREDICTIVE → PRESCRIPTIVE
+"What happened?" → "Why?" → "What will happen?" → "What should we do?"
+```
+
+**Value and Complexity:**
+| Type | Question | Complexity | Business Value |
+|------|----------|------------|----------------|
+| Descriptive | What happened? | Low | Foundation |
+| Diagnostic | Why did it happen? | Medium | Understanding |
+| Predictive | What will happen? | High | Foresight |
+| Prescriptive | What should we do? | Highest | Optimization |
+
+**Real-World Example - Retail Store:**
+1. **Descriptive**: "Sales dropped 15% last month"
+2. **Diagnostic**: "Sales dropped because competitor opened nearby"
+3. **Predictive**: "Sales will drop another 10% next quarter"
+4. **Prescriptive**: "Launch loyalty program and price match campaign"
+
+Each level builds on the previous, creating a complete analytical picture.
+                """,
+            "key_points": ["Four types form a continuum of increasing value", "Each answers a different question", "Most organizations start with descriptive and mature toward prescriptive"]
+        },
+        {
+            "title": "Descriptive Analytics: What Happened?",
+            "content": """
+**Descriptive Analytics** summarizes historical data to understand what has occurred.
+
+**Key Characteristics:**
+- Looks at **past data** only
+- Provides **summaries and aggregations**
+- Answers: "What happened?" and "How many?"
+- Foundation for all other analytics types
+
+**Common Techniques:**
+- Calculating averages, totals, percentages
+- Creating dashboards and reports
+- Trend analysis over time
+- Data visualization (charts, graphs)
+
+**Tools Used:**
+- Excel/Google Sheets
+- Power BI / Tableau
+- SQL queries (SELECT, GROUP BY, SUM)
+
+**Business Examples:**
+
+| Industry | Descriptive Question | Output |
+|----------|---------------------|--------|
+| Retail | "What were total sales last quarter?" | $2.5M revenue |
+| Healthcare | "How many patients visited in 2024?" | 45,000 patients |
+| Marketing | "What was our email open rate?" | 22% open rate |
+| HR | "What is our employee turnover?" | 15% annual turnover |
+
+**Sample Dashboard Metrics:**
+- Total Revenue: $2.5M
+- Orders: 12,500
+- Average Order Value: $200
+- Top Product: Widget A (3,000 units)
+
+**Limitations:**
+Descriptive analytics tells you WHAT happened but not WHY or what to do about it.
+                """,
+            "key_points": ["Summarizes historical data", "Foundation of all analytics", "Uses dashboards, reports, and KPIs", "Cannot explain causes or predict future"]
+        },
+        {
+            "title": "Diagnostic Analytics: Why Did It Happen?",
+            "content": """
+**Diagnostic Analytics** examines data to understand the causes behind outcomes.
+
+**Key Characteristics:**
+- Investigates **root causes**
+- Uses drill-down and data mining
+- Answers: "Why did this happen?"
+- Requires deeper analysis skills
+
+**Common Techniques:**
+- **Drill-down analysis**: Breaking data into smaller segments
+- **Correlation analysis**: Finding relationships between variables
+- **Root cause analysis (RCA)**: Systematic problem investigation
+- **Data discovery**: Exploring data for unexpected patterns
+
+**The 5 Whys Technique:**
+1. Sales dropped 15% → Why?
+2. Fewer customers visited → Why?
+3. Negative reviews increased → Why?
+4. Wait times were too long → Why?
+5. Staff shortage due to turnover → **ROOT CAUSE**
+
+**Business Examples:**
+
+| Descriptive Finding | Diagnostic Investigation | Root Cause |
+|--------------------|-------------------------|------------|
+| Sales dropped 15% | Analyze by region, product, time | New competitor opened |
+| Website bounce rate up 20% | Check page load times, device types | Mobile site broken |
+| Customer complaints doubled | Categorize complaint types | Shipping delays |
+| Employee productivity down | Compare teams, projects, tools | Outdated software |
+
+**Correlation Example:**
+"We noticed sales spike when temperature exceeds 30°C. Correlation analysis shows r=0.85 between temperature and ice cream sales."
+
+**Tools Used:**
+- Excel Pivot Tables (drill-down)
+- SQL (JOINs, subqueries)
+- Statistical software
+- BI tools with drill-through
+                """,
+            "key_points": ["Investigates root causes", "Uses drill-down and correlation", "5 Whys technique is powerful", "Correlation ≠ Causation"]
+        },
+        {
+            "title": "Predictive Analytics: What Will Happen?",
+            "content": """
+**Predictive Analytics** uses historical data and statistical models to forecast future outcomes.
+
+**Key Characteristics:**
+- Uses **statistical models and machine learning**
+- Provides **probabilities**, not certainties
+- Answers: "What is likely to happen?"
+- Requires historical data patterns
+
+**Common Techniques:**
+- **Regression analysis**: Predict numeric outcomes
+- **Classification**: Predict categories (yes/no, high/medium/low)
+- **Time series forecasting**: Predict trends over time
+- **Machine learning models**: More complex predictions
+
+**Business Examples:**
+
+| Industry | Predictive Question | Model Type |
+|----------|-------------------|------------|
+| Retail | "What will next month's sales be?" | Time series forecast |
+| Banking | "Will this customer default on loan?" | Classification (Yes/No) |
+| Marketing | "Which customers will churn?" | Churn prediction model |
+| Healthcare | "What's the patient readmission risk?" | Risk scoring |
+
+**Example: Sales Forecasting**
+```
+Historical Data: Jan=100K, Feb=110K, Mar=105K, Apr=115K, May=120K
+Model identifies: 3% monthly growth trend
+Prediction: June = 124K, July = 128K, August = 132K
+Confidence interval: ±8%
+```
+
+**Key Concepts:**
+- **Training Data**: Historical data used to build the model
+- **Features**: Variables used to make predictions
+- **Accuracy**: How often predictions are correct
+- **Confidence Interval**: Range of likely outcomes
+
+**Important Limitations:**
+- Predictions are probabilistic, not certain
+- Models are only as good as historical data
+- Unexpected events (black swans) break predictions
+- "Past performance doesn't guarantee future results"
+                """,
+            "key_points": ["Forecasts future using historical patterns", "Provides probabilities not certainties", "Requires quality historical data", "Common: regression, classification, time series"]
+        },
+        {
+            "title": "Prescriptive Analytics: What Should We Do?",
+            "content": """
+**Prescriptive Analytics** recommends specific actions to achieve desired outcomes.
+
+**Key Characteristics:**
+- **Recommends actions**, not just predictions
+- Uses optimization and simulation
+- Answers: "What is the best course of action?"
+- Most advanced and valuable analytics type
+
+**Common Techniques:**
+- **Optimization algorithms**: Find the best solution
+- **Simulation**: Test scenarios without real-world risk
+- **Decision trees**: Map out action paths
+- **A/B testing**: Compare action effectiveness
+- **What-if analysis**: Explore different scenarios
+
+**Business Examples:**
+
+| Predictive Insight | Prescriptive Recommendation |
+|-------------------|----------------------------|
+| "30% churn risk for customers" | "Offer 20% discount to high-risk customers; expected to reduce churn by 15% and save $50K" |
+| "Demand will spike 40% in December" | "Increase inventory by 35%, hire 10 temporary staff, extend operating hours" |
+| "Campaign A outperforms B by 25%" | "Reallocate 80% of budget to Campaign A, expected ROI increase of $120K" |
+| "Equipment failure likely in 2 weeks" | "Schedule preventive maintenance on Day 10, estimated cost savings of $25K" |
+
+**Real-World Scenario:**
+A delivery company uses prescriptive analytics:
+
+1. **Descriptive**: "We made 10,000 deliveries last week"
+2. **Diagnostic**: "Late deliveries were 30% higher in Zone C due to traffic"
+3. **Predictive**: "Tomorrow Zone C will have 45% late deliveries"
+4. **Prescriptive**: "Route trucks through Highway 5 instead of Main Street. Start Zone C deliveries 1 hour earlier. Deploy 2 additional drivers. **Expected result: Reduce late deliveries to 10%**"
+
+**Tools Used:**
+- Optimization software (solver tools)
+- Simulation platforms
+- Decision support systems
+- AI/ML recommendation engines
+                """,
+            "key_points": ["Recommends specific actions", "Uses optimization and simulation", "Highest value but most complex", "Combines prediction with decision-making"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Classify the Analytics Type",
+            "type": "scenario",
+            "question": "Your manager says: 'We need to know why customer satisfaction scores dropped from 85% to 72% last quarter.' Which type of analytics is needed?",
+            "answer": "This requires DIAGNOSTIC analytics. The question 'why did it drop?' indicates root cause investigation. You would drill down by customer segment, product line, service channel, and time period to identify what changed and caused the decline.",
+            "hint": "Which question is being asked: What happened? Why? What will happen? What should we do?"
+        },
+        {
+            "title": "Match Insights to Actions",
+            "type": "practical",
+            "question": "Your predictive model shows that 200 customers (worth $500K annual revenue) have 80% probability of churning next month. Recommend specific prescriptive actions.",
+            "answer": "Prescriptive recommendations: 1) Segment the 200 customers by value - focus on top 50 (80/20 rule), 2) Assign account managers to personally call top 20 customers, 3) Offer tailored retention discounts (15-25% based on customer lifetime value), 4) Send personalized email campaign highlighting new features, 5) Create loyalty rewards for continued subscription. Expected outcome: Reduce churn to 30%, save ~$250K in revenue.",
+            "hint": "Think about specific actions with measurable expected outcomes"
+        },
+        {
+            "title": "Complete Analytics Journey",
+            "type": "scenario",
+            "question": "A coffee shop chain notices sales are declining. Walk through all four analytics types to address this problem.",
+            "answer": "DESCRIPTIVE: 'Sales are down 20% over 3 months. Morning sales stable, afternoon sales down 35%.' DIAGNOSTIC: 'New competitor (bubble tea shop) opened nearby targeting afternoon customers. Weather data shows no correlation.' PREDICTIVE: 'If trend continues, afternoon sales will drop another 25% next quarter, totaling $50K lost revenue.' PRESCRIPTIVE: 'Launch afternoon happy hour (buy-one-get-one from 2-5pm), introduce 3 new iced drinks, partner with local businesses for afternoon delivery. Expected to recover 60% of lost afternoon sales within 2 months.'",
+            "hint": "Address each of the four questions in sequence: What? Why? What next? What to do?"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which analytics type answers 'What should we do?'",
+            "options": ["Descriptive", "Diagnostic", "Predictive", "Prescriptive"],
+            "correct": 3,
+            "explanation": "Prescriptive analytics recommends specific actions to achieve desired outcomes. It goes beyond prediction to optimization."
+        },
+        {
+            "question": "'Our website had 50,000 visitors last month, with 2% conversion rate' is an example of:",
+            "options": ["Descriptive analytics", "Diagnostic analytics", "Predictive analytics", "Prescriptive analytics"],
+            "correct": 0,
+            "explanation": "This is descriptive analytics - it summarizes what happened (visitors, conversion rate) without explaining why or predicting future."
+        },
+        {
+            "question": "Using drill-down analysis to find why sales dropped in a specific region is:",
+            "options": ["Descriptive analytics", "Diagnostic analytics", "Predictive analytics", "Prescriptive analytics"],
+            "correct": 1,
+            "explanation": "Diagnostic analytics investigates root causes using techniques like drill-down analysis to understand WHY something happened."
+        },
+        {
+            "question": "A model that forecasts '85% probability this customer will churn' is:",
+            "options": ["Descriptive analytics", "Diagnostic analytics", "Predictive analytics", "Prescriptive analytics"],
+            "correct": 2,
+            "explanation": "Predictive analytics uses statistical models to forecast future outcomes with probabilities."
+        },
+        {
+            "question": "Which analytics type is the foundation for all others?",
+            "options": ["Descriptive", "Diagnostic", "Predictive", "Prescriptive"],
+            "correct": 0,
+            "explanation": "Descriptive analytics is the foundation - you must understand what happened before analyzing why, predicting future, or recommending actions."
+        }
+    ]
+}
@@ -0,0 +1,479 @@
+"""Training Center content: Iterative Error Elimination."""
+
+MODULE = {
+    "course": "Evaluation of Outcomes",
+    "description": "Master systematic approaches to identify, debug, and eliminate errors in data models and analysis results.",
+    "lessons": [
+        {
+            "title": "The Error Elimination Process",
+            "content": """
+**Systematic Debugging of Data Models**
+
+Iterative error elimination is a structured approach to finding and fixing problems.
+
+**The Debugging Cycle:**
+
+```
+    ┌─────────────────────────────────────┐
+    │                                      │
+    ↓                                      │
+DETECT → DIAGNOSE → FIX → VERIFY → PREVENT
+   │                                   │
+   │   ←──── If new errors ────────────┘
+   │
+   └→ Document and close
+```
+
+**Step 1: DETECT - Finding Errors**
+
+| Detection Method | What It Catches |
+|-----------------|-----------------|
+| **Automated tests** | Known failure patterns |
+| **Monitoring/alerts** | Performance degradation |
+| **Manual review** | Logic and interpretation errors |
+| **User feedback** | Real-world failures |
+| **Comparison to baseline** | Unexpected deviations |
+
+**Step 2: DIAGNOSE - Root Cause Analysis**
+
+**The 5 Whys Technique:**
+```
+Problem: Model accuracy dropped 10%
+
+Why #1: Predictions are wrong for new customers
+Why #2: New customer features have missing values
+Why #3: Data pipeline doesn't handle new data source
+Why #4: New data source format wasn't documented
+Why #5: No validation check for source changes
+
+Root Cause: Missing data validation in pipeline
+```
+
+**Step 3: FIX - Implementing Solutions**
+
+| Fix Type | When to Use | Risk Level |
+|----------|-------------|------------|
+| **Hotfix** | Critical production issue | High - test quickly |
+| **Standard fix** | Normal bugs | Medium - full testing |
+| **Refactor** | Systemic issues | Low - plan carefully |
+
+**Step 4: VERIFY - Confirming the Fix**
+
+```
+VERIFICATION CHECKLIST
+☑ Error no longer occurs
+☑ Related functionality still works
+☑ Performance not degraded
+☑ Edge cases tested
+☑ Rollback plan ready
+```
+
+**Step 5: PREVENT - Stopping Recurrence**
+
+- Add automated test for this error
+- Update documentation
+- Share learnings with team
+- Consider systemic improvements
+                """,
+            "key_points": ["Follow systematic cycle: Detect → Diagnose → Fix → Verify → Prevent", "Use 5 Whys to find root cause", "Always verify fix and add prevention", "Document for future reference"]
+        },
+        {
+            "title": "Common Error Types in Data Models",
+            "content": """
+**Recognizing and Fixing Model Errors**
+
+Understanding error types helps you diagnose problems faster.
+
+**Data Errors:**
+
+| Error Type | Symptoms | Fix |
+|-----------|----------|-----|
+| **Missing values** | NaN in predictions | Imputation or filtering |
+| **Outliers** | Extreme predictions | Detection and handling |
+| **Data leakage** | Too-good validation scores | Review feature engineering |
+| **Stale data** | Accuracy degradation | Update data pipeline |
+| **Labeling errors** | Inconsistent patterns | Audit training labels |
+
+**Model Errors:**
+
+| Error Type | Symptoms | Fix |
+|-----------|----------|-----|
+| **Overfitting** | High train, low test accuracy | Regularization, more data |
+| **Underfitting** | Low accuracy everywhere | More features, complex model |
+| **Bias** | Systematic over/under prediction | Calibration, balanced training |
+| **Concept drift** | Accuracy drops over time | Retrain, monitor distributions |
+| **Feature importance shift** | Unexpected predictions | Review feature correlations |
+
+**Process Errors:**
+
+```
+COMMON PROCESS MISTAKES
+─────────────────────────────────────
+1. Training on test data (data leakage)
+   → Use proper train/test splits
+
+2. Not versioning data and models
+   → Implement version control
+
+3. Ignoring edge cases
+   → Add boundary testing
+
+4. Hardcoding thresholds
+   → Make configurable
+
+5. No monitoring in production
+   → Set up alerts and dashboards
+```
+
+**Error Severity Classification:**
+
+| Severity | Impact | Response Time | Example |
+|----------|--------|---------------|---------|
+| **Critical** | System down | < 1 hour | Model returns no predictions |
+| **High** | Major incorrect results | < 4 hours | 50% accuracy drop |
+| **Medium** | Partial degradation | < 1 day | Some features not working |
+| **Low** | Minor issues | < 1 week | Cosmetic or edge cases |
+
+**Building Error Intuition:**
+- Most errors are in data, not code
+- Recent changes are usually the cause
+- Simple errors are most common
+- Edge cases reveal hidden bugs
+                """,
+            "key_points": ["Data errors are most common", "Overfitting = high train, low test accuracy", "Concept drift causes gradual degradation", "Classify severity to prioritize fixes"]
+        },
+        {
+            "title": "Debugging Techniques for Analysts",
+            "content": """
+**Practical Debugging Methods**
+
+When your model isn't working, use these techniques to find the problem.
+
+**Technique 1: Sanity Checks**
+
+```
+SANITY CHECK SEQUENCE
+─────────────────────────────────────
+1. Check data shapes and types
+   - Expected rows/columns?
+   - Data types correct?
+
+2. Check for nulls and infinities
+   - df.isnull().sum()
+   - np.isinf(values).sum()
+
+3. Check value ranges
+   - Are values within expected bounds?
+   - Any impossible values?
+
+4. Check distributions
+   - Did the distribution change?
+   - Compare to historical data
+
+5. Check predictions
+   - Are predictions in valid range?
+   - Do they pass business logic?
+```
+
+**Technique 2: Bisection (Divide and Conquer)**
+
+```
+If the problem is somewhere in your pipeline:
+
+1. Test at midpoint
+   Data → [Process A] → [Process B] → [Model] → Output
+                          ↑
+                     Check here first
+
+2. If good at midpoint, problem is in second half
+   If bad at midpoint, problem is in first half
+
+3. Repeat until you find the exact step
+```
+
+**Technique 3: Minimal Reproducible Example**
+
+```
+Reduce the problem to its smallest form:
+
+Instead of:
+"The model doesn't work on the full dataset"
+
+Create:
+"Row 47 with these exact values produces error X"
+
+Steps:
+1. Start with the failing case
+2. Remove data/features one by one
+3. Find the minimal set that still fails
+4. Debug that specific case
+```
+
+**Technique 4: Comparison Testing**
+
+| Compare | To Find |
+|---------|---------|
+| Current vs previous version | What changed |
+| Production vs development | Environment issues |
+| Sample vs full data | Data-specific bugs |
+| Simple vs complex model | Model-related issues |
+
+**Technique 5: Logging and Tracing**
+
+```
+Add strategic logging:
+
+def predict(data):
+    log("Input shape: " + str(data.shape))
+    log("Input sample: " + str(data.head()))
+    
+    processed = preprocess(data)
+    log("After preprocessing: " + str(processed.shape))
+    
+    result = model.predict(processed)
+    log("Output range: " + str(result.min(), result.max()))
+    
+    return result
+```
+                """,
+            "key_points": ["Start with sanity checks on data", "Use bisection to narrow down the problem", "Create minimal reproducible examples", "Add logging to trace issues"]
+        },
+        {
+            "title": "Building Robust Error Prevention",
+            "content": """
+**Preventing Errors Before They Happen**
+
+The best error is one that never reaches production.
+
+**Defensive Programming Principles:**
+
+| Principle | Implementation |
+|-----------|---------------|
+| **Validate inputs** | Check all data before processing |
+| **Fail fast** | Error early rather than propagate |
+| **Explicit defaults** | Don't rely on implicit behavior |
+| **Boundary testing** | Test edge cases explicitly |
+| **Assertion checks** | Verify assumptions in code |
+
+**Data Validation Framework:**
+
+```
+INPUT VALIDATION CHECKLIST
+─────────────────────────────────────
+☐ Schema validation (correct columns/types)
+☐ Value range checks (min/max bounds)
+☐ Null/missing checks (acceptable levels)
+☐ Uniqueness checks (duplicate handling)
+☐ Referential integrity (foreign keys valid)
+☐ Business logic (domain-specific rules)
+
+Example checks:
+assert df['age'].between(0, 120).all()
+assert df['email'].str.contains('@').all()
+assert df['revenue'] >= 0
+```
+
+**Automated Testing Layers:**
+
+```
+TEST PYRAMID
+─────────────────────────────────────
+          /\\
+         /  \\     E2E Tests
+        /    \\    (few, slow, expensive)
+       /──────\\
+      /        \\  Integration Tests
+     /          \\ (some, medium speed)
+    /────────────\\
+   /              \\ Unit Tests
+  /                \\ (many, fast, cheap)
+ /──────────────────\\
+```
+
+**Continuous Monitoring:**
+
+```
+PRODUCTION MONITORING DASHBOARD
+─────────────────────────────────────
+📊 Model Performance
+   └── Accuracy: 87% ✓ (threshold: >85%)
+   └── Latency: 120ms ✓ (threshold: <200ms)
+   └── Error Rate: 0.1% ✓ (threshold: <1%)
+
+📈 Data Quality
+   └── Null Rate: 0.5% ✓ (threshold: <2%)
+   └── Distribution Drift: 0.02 ✓ (threshold: <0.05)
+   └── Volume: 10,234 records ✓ (expected: 8K-12K)
+
+🚨 Alerts (last 24h)
+   └── No critical alerts
+   └── 1 warning: Latency spike at 14:00
+```
+
+**Post-Mortem Process:**
+
+After any significant error:
+1. **Timeline**: What happened when?
+2. **Root cause**: Why did it happen?
+3. **Impact**: Who/what was affected?
+4. **Resolution**: How was it fixed?
+5. **Prevention**: How do we prevent recurrence?
+6. **Action items**: Specific tasks with owners
+                """,
+            "key_points": ["Validate inputs before processing", "Build automated testing pyramid", "Monitor continuously in production", "Conduct post-mortems to learn and prevent"]
+        },
+        {
+            "title": "Ethical Model Evaluation",
+            "content": """
+**Responsible Assessment and Ethical Critique of Models**
+
+Evaluating outcomes isn't just technical - it requires ethical judgment and responsibility.
+
+**Ethical Evaluation Framework:**
+
+| Dimension | Questions to Ask |
+|-----------|-----------------|
+| **Fairness** | Does the model treat all groups equitably? |
+| **Transparency** | Can we explain how decisions are made? |
+| **Accountability** | Who is responsible for outcomes? |
+| **Privacy** | Is personal data protected appropriately? |
+| **Harm** | Could this model cause harm to individuals? |
+
+**Bias Detection in Model Outcomes:**
+
+```
+BIAS AUDIT CHECKLIST
+─────────────────────────────────────
+☐ Performance by demographic group
+   └── Accuracy, precision, recall by age, gender, location
+
+☐ Outcome distribution fairness
+   └── Are approval/rejection rates proportional?
+
+☐ Feature importance review
+   └── Are protected characteristics influencing decisions?
+
+☐ Historical bias in training data
+   └── Does past data encode unfair practices?
+
+☐ Proxy variable detection
+   └── Do features correlate with protected groups?
+```
+
+**Types of Algorithmic Bias:**
+
+| Bias Type | Example | Detection |
+|-----------|---------|-----------|
+| **Selection bias** | Training data not representative | Compare data vs population |
+| **Historical bias** | Past discrimination encoded | Audit historical decisions |
+| **Measurement bias** | Errors differ by group | Error analysis by segment |
+| **Aggregation bias** | One model for diverse groups | Subgroup performance testing |
+
+**Ethical Decision-Making Process:**
+
+```
+1. ASSESS THE IMPACT
+   Who is affected by this model's decisions?
+   What are the consequences of errors?
+
+2. CHECK FOR FAIRNESS
+   Analyze performance across demographic groups
+   Identify any disparate impact
+
+3. ENSURE TRANSPARENCY
+   Can we explain decisions to affected individuals?
+   Is the logic understandable?
+
+4. CONSIDER ALTERNATIVES
+   If the model has issues, what are the options?
+   Is using a model appropriate for this decision?
+
+5. DOCUMENT AND COMMUNICATE
+   Record ethical considerations
+   Share concerns with stakeholders
+```
+
+**Presenting Outcomes Responsibly:**
+
+| Bad Practice | Ethical Practice |
+|-------------|------------------|
+| Hide limitations | Acknowledge model limitations clearly |
+| Ignore edge cases | Report performance on minority groups |
+| Overstate confidence | Present uncertainty honestly |
+| Blame the data | Take responsibility for model choices |
+| Rush to production | Allow time for ethical review |
+
+**When to Raise Concerns:**
+
+You have a professional obligation to speak up when:
+- Model could cause significant harm
+- Bias is detected but not addressed
+- Stakeholders ignore ethical risks
+- Regulations or policies are violated
+- You're asked to suppress unfavorable findings
+
+**Escalation Path:**
+1. Raise with immediate team/manager
+2. Document concerns in writing
+3. Escalate to ethics/compliance if unresolved
+4. Consider professional obligations (varies by industry)
+                """,
+            "key_points": ["Evaluate models for fairness across groups", "Check for bias in training data and outcomes", "Present limitations and uncertainties honestly", "Raise ethical concerns when you see them"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Apply 5 Whys Analysis",
+            "type": "practical",
+            "question": "Your customer churn model suddenly started predicting everyone as 'will churn.' Apply the 5 Whys technique to find the root cause.",
+            "answer": "5 Whys Analysis: Why #1: Model predicts 'churn' for all customers → Because all prediction probabilities are above threshold. Why #2: Why are all probabilities high? → Because one feature has extreme values for all records. Why #3: Why does that feature have extreme values? → The feature is customer tenure, and all values show 0 days. Why #4: Why is tenure showing 0 for everyone? → The data pipeline is calculating tenure from an empty 'signup_date' field. Why #5: Why is signup_date empty? → A recent database migration removed the date format, and the ETL couldn't parse it. ROOT CAUSE: Database migration broke date parsing in ETL pipeline. FIX: 1) Immediate: Restore from backup or fix date format. 2) Prevention: Add data validation to check for reasonable tenure values before model runs.",
+            "hint": "Start with what's directly wrong, then ask 'why' at each level until you reach a systemic cause"
+        },
+        {
+            "title": "Design Validation Checks",
+            "type": "practical",
+            "question": "Design 5 validation checks for a model that predicts loan approval (features: income, credit_score, debt_ratio, employment_years, loan_amount).",
+            "answer": "Validation checks: 1) INCOME: Assert income >= 0 and income < 10,000,000 (reasonable bounds). Flag if null or negative. 2) CREDIT_SCORE: Assert credit_score between 300 and 850 (valid FICO range). Reject if outside range - this is a data error. 3) DEBT_RATIO: Assert debt_ratio between 0 and 1 (or 0-100%). If > 1, check if percentage vs decimal format. 4) EMPLOYMENT_YEARS: Assert employment_years >= 0 and < 60. If > person's age minus 16, flag as likely error. 5) LOAN_AMOUNT: Assert loan_amount > 0 and < 10 × income (reasonable debt-to-income). Also check loan_amount / income ratio is within lending policy limits. ADDITIONAL: Check for nulls in any required field. Validate referential integrity of customer_id. Log any records that fail validation for review.",
+            "hint": "Consider valid ranges, business logic rules, and relationships between fields"
+        },
+        {
+            "title": "Ethical Bias Assessment",
+            "type": "scenario",
+            "question": "Your hiring recommendation model has 85% overall accuracy, but you discover it rejects 60% of applicants from one demographic group compared to 30% for others. What ethical issues does this raise and how should you proceed?",
+            "answer": "Ethical Issues: 1) DISPARATE IMPACT: The 2x rejection rate for one group (60% vs 30%) suggests unfair treatment, even if unintentional. 2) HISTORICAL BIAS: Training data may encode past hiring discrimination. 3) PROXY DISCRIMINATION: Features like zip code, school, or name may correlate with protected characteristics. 4) HARM POTENTIAL: Affected candidates lose job opportunities unfairly. Proceed: 1) PAUSE DEPLOYMENT: Do not use this model for decisions until resolved. 2) ANALYZE: Investigate which features drive the disparity. 3) AUDIT: Check if model relies on proxies for protected groups. 4) REPORT: Escalate to management/HR/legal with findings. 5) REMEDIATE: Consider removing biased features, retraining with balanced data, or applying fairness constraints. 6) DOCUMENT: Record findings and decisions made. The 85% accuracy is irrelevant if the model discriminates - fairness is a separate, critical requirement.",
+            "hint": "Consider the impact on affected individuals and your professional responsibility to address bias"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "The 5 Whys technique is used to:",
+            "options": ["Count errors", "Find root causes", "Measure accuracy", "Test performance"],
+            "correct": 1,
+            "explanation": "The 5 Whys is a root cause analysis technique that repeatedly asks 'why' to drill down from symptoms to underlying causes."
+        },
+        {
+            "question": "If your model has high training accuracy but low test accuracy, the problem is likely:",
+            "options": ["Underfitting", "Overfitting", "Data leakage", "Concept drift"],
+            "correct": 1,
+            "explanation": "High train/low test accuracy is the classic sign of overfitting - the model memorized training data but doesn't generalize."
+        },
+        {
+            "question": "The bisection debugging technique works by:",
+            "options": ["Testing random points", "Dividing the problem in half repeatedly", "Testing all points", "Skipping to the end"],
+            "correct": 1,
+            "explanation": "Bisection (divide and conquer) tests at midpoints to efficiently narrow down where the problem occurs in a pipeline."
+        },
+        {
+            "question": "In the test pyramid, which tests are at the bottom (most numerous)?",
+            "options": ["End-to-end tests", "Integration tests", "Unit tests", "Manual tests"],
+            "correct": 2,
+            "explanation": "Unit tests form the base of the pyramid - they're fast, cheap, and you should have many of them testing individual components."
+        },
+        {
+            "question": "When you discover your model has significantly different error rates for different demographic groups, you should:",
+            "options": ["Ignore it if overall accuracy is good", "Investigate for bias and consider pausing deployment", "Report only the overall accuracy", "Assume the difference is natural"],
+            "correct": 1,
+            "explanation": "Significant performance differences across demographic groups may indicate bias. You have an ethical obligation to investigate and address this before deployment, even if overall metrics look good."
+        }
+    ]
+}
@@ -0,0 +1,268 @@
+"""Training Center content: KPI Selection and Tracking."""
+
+MODULE = {
+    "course": "Data Driven Decision-Making",
+    "description": "Learn to select appropriate KPIs, set targets, and create tracking systems to guide decision-making.",
+    "lessons": [
+        {
+            "title": "Choosing the Right KPIs",
+            "content": """
+**What Makes a Good KPI?**
+
+Not all metrics are KPIs. Key Performance Indicators are the vital few metrics that truly matter for success.
+
+**The SMART Framework for KPIs:**
+
+| Criterion | Question | Example |
+|-----------|----------|---------|
+| **S**pecific | What exactly are we measuring? | "Monthly active users" not "engagement" |
+| **M**easurable | Can we quantify it? | Number, percentage, ratio |
+| **A**chievable | Is the target realistic? | Based on benchmarks and capability |
+| **R**elevant | Does it connect to goals? | Aligned with business strategy |
+| **T**ime-bound | What's the timeframe? | Monthly, quarterly, annually |
+
+**Types of KPIs:**
+
+| Type | Purpose | Examples |
+|------|---------|----------|
+| **Lagging** | Measure outcomes (past) | Revenue, profit, customer count |
+| **Leading** | Predict outcomes (future) | Pipeline value, website traffic, leads |
+| **Input** | Resources invested | Marketing spend, hiring, training hours |
+| **Process** | Efficiency of activities | Cycle time, defect rate, response time |
+| **Output** | Results produced | Units sold, tickets resolved, content published |
+
+**KPI Selection Process:**
+1. Start with strategic objectives
+2. Ask: "What would tell us if we're succeeding?"
+3. Limit to 5-7 KPIs per area (avoid dashboard overload)
+4. Ensure a mix of leading and lagging indicators
+5. Verify data is available and reliable
+
+**Common Mistakes:**
+- ❌ Too many KPIs (vanity metrics)
+- ❌ Only lagging indicators (no early warning)
+- ❌ KPIs that can't be influenced
+- ❌ No clear connection to strategy
+- ✅ Focus on 5-7 metrics that drive decisions
+                """,
+            "key_points": ["KPIs are vital few metrics, not all metrics", "Use SMART framework", "Balance leading and lagging indicators", "Limit to 5-7 KPIs to stay focused"]
+        },
+        {
+            "title": "KPIs by Business Function",
+            "content": """
+**Industry-Standard KPIs by Department**
+
+**SALES KPIs:**
+| KPI | Formula | Target Example |
+|-----|---------|----------------|
+| Revenue | Sum of all sales | $1M/month |
+| Conversion Rate | Deals Won / Deals Created | 25% |
+| Average Deal Size | Revenue / # Deals | $10,000 |
+| Sales Cycle Length | Avg days from lead to close | 45 days |
+| Pipeline Coverage | Pipeline Value / Quota | 3x |
+
+**MARKETING KPIs:**
+| KPI | Formula | Target Example |
+|-----|---------|----------------|
+| Customer Acquisition Cost (CAC) | Marketing Spend / New Customers | $50 |
+| Return on Ad Spend (ROAS) | Revenue from Ads / Ad Spend | 4x |
+| Website Conversion Rate | Conversions / Visitors | 3% |
+| Email Open Rate | Opens / Emails Sent | 25% |
+| Lead-to-Customer Rate | Customers / Leads | 10% |
+
+**CUSTOMER SUCCESS KPIs:**
+| KPI | Formula | Target Example |
+|-----|---------|----------------|
+| Customer Churn Rate | Lost Customers / Total Customers | <5%/month |
+| Net Promoter Score (NPS) | % Promoters - % Detractors | >50 |
+| Customer Lifetime Value (CLV) | Avg Revenue × Avg Lifespan | $500 |
+| First Response Time | Avg time to first reply | <2 hours |
+| Customer Satisfaction (CSAT) | Satisfied / Total Responses | >90% |
+
+**OPERATIONS KPIs:**
+| KPI | Formula | Target Example |
+|-----|---------|----------------|
+| On-Time Delivery Rate | On-time / Total Deliveries | >98% |
+| Defect Rate | Defective Units / Total Units | <1% |
+| Inventory Turnover | Cost of Goods Sold / Avg Inventory | 6x/year |
+| Employee Productivity | Output / Employee Hours | Varies |
+| Equipment Uptime | Operating Hours / Total Hours | >99% |
+
+**Pro Tip:** The most valuable insight often comes from ratios and comparisons, not absolute numbers. "$1M revenue" means little without context like "vs. $800K last year" or "vs. $1.2M target."
+                """,
+            "key_points": ["Different functions have different KPIs", "Formulas make KPIs actionable", "Include targets for context", "Ratios and comparisons add meaning"]
+        },
+        {
+            "title": "Building a KPI Dashboard",
+            "content": """
+**Creating Effective KPI Dashboards**
+
+A dashboard should enable quick decisions, not just display numbers.
+
+**Dashboard Design Principles:**
+
+| Principle | Description |
+|-----------|-------------|
+| **5-second rule** | Key insight visible in 5 seconds |
+| **Information hierarchy** | Most important KPIs at top |
+| **Context always** | Show vs. target, vs. last period |
+| **Actionable** | Each KPI links to a decision |
+| **Real-time when needed** | Update frequency matches decision speed |
+
+**Dashboard Layout Template:**
+```
+┌─────────────────────────────────────────────────────────────┐
+│  EXECUTIVE DASHBOARD - [Month/Year]     [Last Updated: Now] │
+├─────────────────────────────────────────────────────────────┤
+│  [KPI Card 1]    [KPI Card 2]    [KPI Card 3]   [KPI Card 4]│
+│   Revenue         New Users      Churn Rate     NPS Score   │
+│   $1.2M ↑12%     5,240 ↑8%      3.2% ↓0.5%     72 ↑5       │
+├─────────────────────────────────────────────────────────────┤
+│                    [Main Trend Chart]                       │
+│        Monthly Revenue Trend with Target Line               │
+├─────────────────┬───────────────────────────────────────────┤
+│ [Secondary      │  [Supporting Detail Table]                │
+│  Chart 1]       │   Product    Revenue    Growth            │
+│  Revenue by     │   Product A  $500K      +15%              │
+│  Region         │   Product B  $400K      +8%               │
+│                 │   Product C  $300K      -3%               │
+└─────────────────┴───────────────────────────────────────────┘
+```
+
+**KPI Card Components:**
+- Metric name
+- Current value
+- Comparison (↑↓ vs target or previous)
+- Color coding (Green/Yellow/Red)
+- Sparkline trend (optional)
+
+**Effective Visualizations by KPI Type:**
+
+| KPI Type | Best Visualization |
+|----------|-------------------|
+| Single metric | Big number card |
+| Trend over time | Line chart |
+| Part of whole | Pie/donut chart |
+| Comparison | Bar chart |
+| Geographic | Map |
+| Progress to goal | Gauge / progress bar |
+| Multiple dimensions | Table with conditional formatting |
+                """,
+            "key_points": ["5-second rule - key insight immediately visible", "Always show context (vs target, vs previous)", "Use color coding for status", "Match visualization to KPI type"]
+        },
+        {
+            "title": "Setting Targets and Monitoring",
+            "content": """
+**Setting Meaningful KPI Targets**
+
+A KPI without a target is just a number. Targets make KPIs actionable.
+
+**Methods for Setting Targets:**
+
+| Method | Description | When to Use |
+|--------|-------------|-------------|
+| **Historical** | Based on past performance | Stable, mature processes |
+| **Benchmark** | Based on industry standards | New metrics, competitive pressure |
+| **Aspirational** | Stretch goals beyond current | Growth mode, transformation |
+| **Bottoms-up** | Calculated from team capacity | Resource-constrained |
+| **Negotiated** | Agreed with stakeholders | Political environments |
+
+**Target-Setting Formula (Historical + Growth):**
+```
+Target = Last Year's Actual × (1 + Growth Rate)
+
+Example:
+Last year revenue: $10M
+Target growth: 20%
+This year target: $10M × 1.20 = $12M
+```
+
+**RAG Status (Red/Amber/Green):**
+
+| Status | Definition | Action |
+|--------|------------|--------|
+| 🟢 Green | On track (≥95% of target) | Continue current approach |
+| 🟡 Amber | At risk (80-95% of target) | Investigate, adjust plans |
+| 🔴 Red | Off track (<80% of target) | Immediate intervention required |
+
+**Monitoring Cadence:**
+
+| KPI Type | Review Frequency | Action Threshold |
+|----------|-----------------|------------------|
+| Strategic (Revenue, Customers) | Weekly/Monthly | Amber for 2+ weeks |
+| Operational (Efficiency, Quality) | Daily/Weekly | Red for 1 day |
+| Leading (Pipeline, Traffic) | Daily | Any negative trend |
+| Lagging (NPS, Retention) | Monthly/Quarterly | Compare to target |
+
+**KPI Review Meeting Agenda:**
+1. **Current Status** - Dashboard walkthrough (5 min)
+2. **Reds and Ambers** - What's off track? (10 min)
+3. **Root Cause** - Why? (10 min)
+4. **Action Items** - What are we doing about it? (10 min)
+5. **Greens at Risk** - Early warnings? (5 min)
+
+**Document Decisions:**
+Every KPI review should end with:
+- What we learned
+- Decisions made
+- Action items with owners and deadlines
+                """,
+            "key_points": ["Use multiple methods to set targets", "RAG status enables quick decisions", "Review frequency matches KPI type", "Document decisions and actions from reviews"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Select KPIs for a Scenario",
+            "type": "practical",
+            "question": "You're the new data analyst at a subscription meal kit company. The CEO wants to 'grow the business.' Select 5 KPIs you would recommend tracking and explain why.",
+            "answer": "Recommended KPIs: 1) Monthly Recurring Revenue (MRR) - Primary growth indicator, directly measures business size. 2) Customer Acquisition Cost (CAC) - Ensures growth is sustainable and profitable. 3) Monthly Churn Rate - Critical for subscription businesses; growth is pointless if customers leave faster than they join. 4) Customer Lifetime Value (CLV) - Combined with CAC, shows if unit economics work (CLV should be 3x+ CAC). 5) Active Subscriber Count - Simple, easy to communicate growth metric. BONUS LEADING: Website conversion rate - Predicts future subscriber growth.",
+            "hint": "Think about what metrics truly indicate a subscription business is growing sustainably"
+        },
+        {
+            "title": "Calculate Target",
+            "type": "practical",
+            "question": "Last year's quarterly revenue was: Q1=$2M, Q2=$2.3M, Q3=$2.1M, Q4=$2.8M. Calculate the targets for next year if the goal is 25% annual growth, distributed proportionally by quarter.",
+            "answer": "Step 1: Last year's total = $2M + $2.3M + $2.1M + $2.8M = $9.2M. Step 2: Next year's total with 25% growth = $9.2M × 1.25 = $11.5M. Step 3: Calculate each quarter's proportion of annual revenue: Q1=21.7%, Q2=25%, Q3=22.8%, Q4=30.4%. Step 4: Apply proportions to new total: Q1=$2.5M, Q2=$2.88M, Q3=$2.63M, Q4=$3.5M. These targets maintain the seasonal pattern (Q4 is peak) while achieving 25% growth.",
+            "hint": "Calculate each quarter as a percentage of the year, then apply those percentages to the new annual target"
+        },
+        {
+            "title": "Design a Dashboard",
+            "type": "practical",
+            "question": "An e-commerce manager wants a dashboard to monitor their holiday sales campaign (Nov-Dec). What KPIs would you include and how would you arrange them?",
+            "answer": "Holiday Sales Dashboard: TOP ROW (Big Number Cards): 1) Daily Revenue vs Target (with ↑↓ and % of goal), 2) Conversion Rate (vs. campaign avg), 3) Average Order Value, 4) Cart Abandonment Rate. MIDDLE: Main line chart showing Daily Revenue with Target Line and Last Year comparison. Split into: LEFT - Revenue by Channel (pie or bar: Direct, Paid Search, Social, Email), RIGHT - Top Selling Products (table with stock status). BOTTOM: Hourly traffic heatmap to optimize staffing, and Promotional Code usage (which discounts are working). Update frequency: Real-time for revenue/traffic, hourly for others. Alert if daily revenue falls below 80% of target by 3pm.",
+            "hint": "Think about what decisions need to be made during a high-stakes campaign period"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which of these is a LEADING indicator?",
+            "options": ["Last month's revenue", "Customer satisfaction score", "Sales pipeline value", "Annual profit"],
+            "correct": 2,
+            "explanation": "Sales pipeline value is a leading indicator - it predicts future revenue. Revenue, satisfaction, and profit are lagging indicators that measure past outcomes."
+        },
+        {
+            "question": "A KPI is at 87% of target. What RAG status should it show?",
+            "options": ["Green - on track", "Amber - at risk", "Red - off track", "Depends on the KPI"],
+            "correct": 1,
+            "explanation": "87% falls in the Amber zone (80-95% of target), indicating the KPI is at risk and requires attention and possible plan adjustment."
+        },
+        {
+            "question": "How many KPIs should each business function typically track?",
+            "options": ["1-2", "5-7", "15-20", "As many as possible"],
+            "correct": 1,
+            "explanation": "Best practice is 5-7 KPIs per function. Too few miss important aspects; too many cause 'dashboard overload' and dilute focus."
+        },
+        {
+            "question": "CLV/CAC ratio of 4:1 means:",
+            "options": ["Company is losing money on each customer", "Each customer is worth 4× what it costs to acquire them", "4% of customers are profitable", "Acquisition takes 4 months"],
+            "correct": 1,
+            "explanation": "CLV/CAC of 4:1 means Customer Lifetime Value is 4× Customer Acquisition Cost. This is excellent - typically 3:1 or higher is considered healthy."
+        },
+        {
+            "question": "For strategic KPIs like annual revenue, the typical review frequency is:",
+            "options": ["Hourly", "Daily", "Weekly/Monthly", "Annually"],
+            "correct": 2,
+            "explanation": "Strategic KPIs are typically reviewed weekly or monthly. Daily is for operational metrics, and annual-only reviews don't allow time to course-correct."
+        }
+    ]
+}
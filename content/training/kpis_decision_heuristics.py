@@ -0,0 +1,290 @@
+"""Training Center content: KPIs & Decision Heuristics."""
+
+MODULE = {
+    "course": "Evaluation of Outcomes",
+    "description": "Learn to use Key Performance Indicators as heuristics for evaluating model outcomes and guiding decision-making.",
+    "lessons": [
+        {
+            "title": "KPIs as Evaluation Heuristics",
+            "content": """
+**Using KPIs to Evaluate Model Outcomes**
+
+KPIs serve as heuristics - mental shortcuts that help us quickly assess whether our analysis and models are performing well.
+
+**What is a Heuristic?**
+A heuristic is a practical rule of thumb that helps make decisions without analyzing every detail.
+
+| Traditional Analysis | Heuristic Approach |
+|---------------------|-------------------|
+| Examine all metrics in detail | Focus on 3-5 key indicators |
+| Time-consuming deep dives | Quick assessments |
+| Risk of analysis paralysis | Faster decisions |
+| Complete picture | "Good enough" picture |
+
+**KPIs as Evaluation Heuristics:**
+
+When evaluating model outcomes, KPIs help answer:
+- Is the model working as expected?
+- Are we achieving our objectives?
+- Do we need to intervene?
+
+**Example: Sales Forecasting Model**
+
+| KPI Heuristic | Threshold | Action |
+|---------------|-----------|--------|
+| Forecast Error (MAPE) | < 10% = Good | > 15% = Investigate |
+| Directional Accuracy | > 80% = Good | < 70% = Retrain model |
+| Bias | ±5% = Acceptable | > 10% = Check data sources |
+
+**Building Your KPI Dashboard:**
+
+```
+MODEL HEALTH DASHBOARD
+─────────────────────────
+✅ Accuracy: 92% (target: >85%)
+⚠️  False Positives: 12% (target: <10%)
+✅ Processing Time: 2.3s (target: <5s)
+❌ Data Freshness: 48h (target: <24h)
+
+Overall Status: ATTENTION NEEDED
+Priority Action: Update data pipeline
+```
+
+**The 80/20 Rule for KPIs:**
+Focus on the vital few metrics that indicate 80% of the outcomes:
+- Don't track 50 metrics - track 5-7 that matter most
+- Each KPI should drive a specific action
+- If a KPI doesn't change decisions, remove it
+                """,
+            "key_points": ["KPIs are heuristics for quick assessment", "Focus on 5-7 key metrics", "Each KPI should drive an action", "Use thresholds to trigger interventions"]
+        },
+        {
+            "title": "Selecting KPIs for Model Evaluation",
+            "content": """
+**Choosing the Right KPIs for Your Models**
+
+Different models require different evaluation KPIs.
+
+**Model Types and Their Primary KPIs:**
+
+| Model Type | Primary KPIs | Why These Matter |
+|------------|--------------|------------------|
+| **Classification** | Accuracy, Precision, Recall, F1 | Balance of correct predictions |
+| **Regression** | MAE, RMSE, R-squared, MAPE | Prediction error magnitude |
+| **Clustering** | Silhouette Score, Inertia | Cluster quality |
+| **Time Series** | MAPE, Directional Accuracy | Forecast reliability |
+| **Recommendation** | Hit Rate, Coverage, Diversity | User satisfaction |
+
+**Classification KPIs Explained:**
+
+```
+CONFUSION MATRIX
+                 Predicted
+                 Pos    Neg
+Actual  Pos     [TP]   [FN]
+        Neg     [FP]   [TN]
+
+Accuracy = (TP + TN) / Total
+Precision = TP / (TP + FP)  ← "Of predicted positives, how many correct?"
+Recall = TP / (TP + FN)     ← "Of actual positives, how many found?"
+F1 = 2 × (Precision × Recall) / (Precision + Recall)
+```
+
+**Which KPI to Prioritize?**
+
+| Scenario | Priority KPI | Reasoning |
+|----------|-------------|-----------|
+| Medical diagnosis | Recall | Don't miss sick patients |
+| Spam detection | Precision | Don't block legitimate emails |
+| Fraud detection | F1 Score | Balance both errors |
+| Customer churn | Recall | Catch at-risk customers |
+
+**Regression KPIs Explained:**
+
+```
+MAE (Mean Absolute Error):
+Average of |actual - predicted|
+Interpretation: "On average, off by X units"
+
+RMSE (Root Mean Square Error):
+√(average of (actual - predicted)²)
+Interpretation: Penalizes large errors more
+
+MAPE (Mean Absolute Percentage Error):
+Average of |actual - predicted| / actual × 100
+Interpretation: "On average, off by X%"
+
+R-squared:
+1 - (Sum of squared errors / Total variance)
+Interpretation: "Model explains X% of variance"
+```
+
+**Setting Realistic Targets:**
+- Benchmark against industry standards
+- Compare to baseline (naive) models
+- Consider business impact of errors
+                """,
+            "key_points": ["Match KPIs to model type", "Prioritize based on business impact", "Understand precision vs recall tradeoff", "Set targets based on benchmarks"]
+        },
+        {
+            "title": "KPI Thresholds and Alert Systems",
+            "content": """
+**Setting Thresholds and Automated Alerts**
+
+Thresholds transform KPIs into actionable signals.
+
+**Threshold Types:**
+
+| Type | Example | Use Case |
+|------|---------|----------|
+| **Absolute** | Error rate < 5% | Fixed performance standard |
+| **Relative** | 10% better than baseline | Improvement tracking |
+| **Statistical** | ±2 standard deviations | Anomaly detection |
+| **Time-based** | Same as last quarter | Trend maintenance |
+
+**RAG Status System:**
+
+```
+🟢 GREEN: On target, no action needed
+🟡 AMBER: At risk, monitor closely
+🔴 RED: Off target, immediate action required
+
+Example Thresholds:
+┌─────────────────┬────────┬────────┬────────┐
+│ KPI             │ Green  │ Amber  │ Red    │
+├─────────────────┼────────┼────────┼────────┤
+│ Accuracy        │ >90%   │ 80-90% │ <80%   │
+│ Processing Time │ <2s    │ 2-5s   │ >5s    │
+│ Data Freshness  │ <1hr   │ 1-4hr  │ >4hr   │
+│ Error Rate      │ <2%    │ 2-5%   │ >5%    │
+└─────────────────┴────────┴────────┴────────┘
+```
+
+**Alert Escalation Pyramid:**
+
+```
+         ┌─────────────┐
+         │  CRITICAL   │ → Immediate escalation
+         │   (Red)     │   Page on-call team
+         ├─────────────┤
+         │   WARNING   │ → Review within hours
+         │  (Amber)    │   Email notification
+         ├─────────────┤
+         │    INFO     │ → Review in daily standup
+         │  (Green)    │   Dashboard only
+         └─────────────┘
+```
+
+**Avoiding Alert Fatigue:**
+
+| Problem | Solution |
+|---------|----------|
+| Too many alerts | Prioritize by impact |
+| False positives | Tune thresholds over time |
+| Ignored alerts | Track response metrics |
+| Duplicate alerts | Group related issues |
+
+**Best Practices:**
+1. Start with conservative thresholds, adjust over time
+2. Every alert should have a clear response action
+3. Review and refine thresholds quarterly
+4. Include context in alerts (trend, comparison)
+                """,
+            "key_points": ["Use RAG status for quick assessment", "Every alert needs a response action", "Avoid alert fatigue with prioritization", "Review thresholds quarterly"]
+        },
+        {
+            "title": "From KPIs to Decisions",
+            "content": """
+**Translating KPI Results into Business Decisions**
+
+KPIs are only valuable if they drive decisions.
+
+**Decision Framework:**
+
+```
+KPI RESULT → INTERPRETATION → OPTIONS → DECISION → ACTION
+     ↓              ↓            ↓          ↓          ↓
+  "What?"       "So what?"    "Now what?"  "Which?"   "How?"
+```
+
+**Example Decision Flow:**
+
+| Stage | Example |
+|-------|---------|
+| **KPI Result** | Model accuracy dropped from 92% to 84% |
+| **Interpretation** | 8% drop over 2 weeks, below 85% target |
+| **Options** | 1) Retrain model 2) Check data quality 3) Accept degradation |
+| **Decision** | Investigate data quality first (lowest cost) |
+| **Action** | Run data validation checks by Friday |
+
+**Decision Matrix for Model Issues:**
+
+| Symptom | Possible Causes | First Action |
+|---------|-----------------|--------------|
+| Sudden accuracy drop | Data pipeline issue | Check data freshness/quality |
+| Gradual accuracy decline | Concept drift | Evaluate retraining |
+| High variance in predictions | Model instability | Review feature inputs |
+| Consistent bias | Systematic error | Audit training data |
+
+**Communicating Decisions:**
+
+When presenting KPI-driven decisions:
+
+1. **State the KPI**: "Customer churn prediction accuracy is at 78%"
+2. **Provide context**: "Down from 85% last month, below our 80% threshold"
+3. **Explain impact**: "We're missing 22% of at-risk customers"
+4. **Propose action**: "Recommend retraining with Q4 data"
+5. **Quantify benefit**: "Expected to recover 5% accuracy, saving ~$50K"
+
+**Document Your Decisions:**
+Keep a decision log linking KPIs to actions for:
+- Learning from past decisions
+- Justifying future investments
+- Building institutional knowledge
+                """,
+            "key_points": ["KPIs must drive decisions, not just reports", "Use decision framework: What → So What → Now What", "Always quantify business impact", "Document decisions for future learning"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Design a KPI Dashboard",
+            "type": "practical",
+            "question": "You've built a customer churn prediction model. Design a KPI dashboard with 5 metrics, thresholds, and what action to take when each threshold is breached.",
+            "answer": "Churn Model KPI Dashboard: 1) RECALL: Target >80%, Amber 70-80%, Red <70%. Action if Red: Review false negatives, possibly lower prediction threshold. 2) PRECISION: Target >60%, Amber 50-60%, Red <50%. Action if Red: Check for data quality issues causing false positives. 3) AUC-ROC: Target >0.75, Amber 0.65-0.75, Red <0.65. Action if Red: Retrain model with updated features. 4) PREDICTION TIMELINESS: Target <24hr before churn, Amber 24-48hr, Red >48hr. Action if Red: Increase scoring frequency. 5) INTERVENTION SUCCESS RATE: Target >30% saved, Amber 20-30%, Red <20%. Action if Red: Review intervention strategy, not just model.",
+            "hint": "Include both model performance metrics and business outcome metrics"
+        },
+        {
+            "title": "Interpret KPI Changes",
+            "type": "scenario",
+            "question": "Your sales forecast model shows: MAPE increased from 8% to 14%, but R-squared remained at 0.85. What does this combination tell you, and what should you investigate?",
+            "answer": "Interpretation: MAPE measures average percentage error while R-squared measures explained variance. If R-squared stayed high but MAPE increased significantly, this suggests: 1) The model still captures the overall pattern (explains variance), 2) BUT individual predictions have larger errors (higher MAPE), 3) Likely cause: OUTLIERS or unusual data points are affecting predictions without distorting overall correlation. Investigation steps: 1) Check for outliers in recent data, 2) Look for specific segments with high errors, 3) Compare prediction errors by product/region/time, 4) Check if data distribution has shifted. This pattern often indicates concept drift in specific segments while overall relationships hold.",
+            "hint": "Think about what each metric measures differently and what could affect one but not the other"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "A heuristic in decision-making is:",
+            "options": ["A perfect algorithm", "A mental shortcut for quick decisions", "A detailed analysis method", "A type of database"],
+            "correct": 1,
+            "explanation": "A heuristic is a mental shortcut or rule of thumb that allows for quick decisions without analyzing every detail."
+        },
+        {
+            "question": "For a medical diagnosis model, which KPI should be prioritized?",
+            "options": ["Precision", "Recall", "Accuracy", "F1 Score"],
+            "correct": 1,
+            "explanation": "Recall is prioritized in medical diagnosis because missing a sick patient (false negative) is more dangerous than a false alarm (false positive)."
+        },
+        {
+            "question": "What color in RAG status indicates 'at risk, monitor closely'?",
+            "options": ["Red", "Amber", "Green", "Blue"],
+            "correct": 1,
+            "explanation": "Amber indicates 'at risk' status - not critical yet, but needs monitoring and may require action soon."
+        },
+        {
+            "question": "When MAPE increases but R-squared stays the same, this likely indicates:",
+            "options": ["Model is perfect", "Outliers affecting predictions", "Data is missing", "Model needs no changes"],
+            "correct": 1,
+            "explanation": "This pattern suggests outliers are causing larger individual prediction errors (MAPE) while overall patterns remain captured (R-squared)."
+        }
+    ]
+}
@@ -0,0 +1,289 @@
+"""Training Center content: Project Planning & Execution."""
+
+MODULE = {
+    "course": "Semester Project 1",
+    "description": "Learn to plan, scope, and execute data analysis projects from start to finish with professional standards.",
+    "lessons": [
+        {
+            "title": "Defining Project Scope",
+            "content": """
+**Starting Your Data Analysis Project**
+
+Every successful project begins with clear scope definition. Without it, projects fail or never end.
+
+**Key Questions to Answer:**
+
+| Question | Purpose |
+|----------|---------|
+| What problem are we solving? | Focus and direction |
+| Who are the stakeholders? | Know your audience |
+| What data do we need? | Resource planning |
+| What are the deliverables? | Clear expectations |
+| What's out of scope? | Prevent scope creep |
+| When is it due? | Timeline planning |
+
+**Project Scope Template:**
+```
+PROJECT: [Name]
+PROBLEM STATEMENT: [1-2 sentences describing what you're solving]
+
+OBJECTIVES:
+1. [Specific goal 1]
+2. [Specific goal 2]
+
+IN SCOPE:
+- [What's included]
+- [Data sources to use]
+- [Analysis methods]
+
+OUT OF SCOPE:
+- [What's NOT included]
+- [Future phases]
+
+DELIVERABLES:
+- [ ] Data analysis report
+- [ ] Cleaned dataset
+- [ ] Visualization dashboard
+- [ ] Presentation
+
+TIMELINE: [Start] to [End]
+STAKEHOLDERS: [Who needs to see results]
+```
+
+**Common Scope Mistakes:**
+- ❌ "Analyze all the data" - Too vague
+- ❌ No defined deliverables
+- ❌ Unrealistic timeline
+- ❌ Scope changes without documentation
+- ✅ Specific, measurable objectives
+- ✅ Clear list of what's IN and OUT
+                """,
+            "key_points": ["Define scope before starting work", "Use a scope template", "Document what's OUT of scope", "Get stakeholder agreement upfront"]
+        },
+        {
+            "title": "Creating a Project Timeline",
+            "content": """
+**Building Your Project Schedule**
+
+A timeline keeps you on track and helps manage stakeholder expectations.
+
+**Data Analysis Project Phases:**
+
+| Phase | % of Time | Activities |
+|-------|-----------|------------|
+| 1. Planning | 10% | Scope, data needs, approach |
+| 2. Data Collection | 15% | Gather, access, import data |
+| 3. Data Cleaning | 30-40% | Quality checks, standardization |
+| 4. Analysis | 20% | Statistics, modeling, findings |
+| 5. Documentation | 10% | Report writing, visualizations |
+| 6. Presentation | 5% | Final delivery, Q&A |
+
+**Sample 4-Week Project Timeline:**
+
+```
+WEEK 1: Foundation
+├── Day 1-2: Define scope, identify data sources
+├── Day 3-4: Collect and import data
+└── Day 5: Initial data exploration
+
+WEEK 2: Data Preparation
+├── Day 1-2: Data cleaning and validation
+├── Day 3-4: Continue cleaning, handle missing values
+└── Day 5: Document data quality issues
+
+WEEK 3: Analysis
+├── Day 1-2: Perform main analysis
+├── Day 3: Validate findings
+├── Day 4-5: Create visualizations
+└── Buffer day for unexpected issues
+
+WEEK 4: Delivery
+├── Day 1-2: Write report/documentation
+├── Day 3: Create presentation
+├── Day 4: Review and refine
+└── Day 5: Final presentation
+```
+
+**Milestone Checkpoints:**
+- ✅ Week 1: Data collected and accessible
+- ✅ Week 2: Clean dataset ready for analysis
+- ✅ Week 3: Key findings identified
+- ✅ Week 4: Deliverables complete
+
+**Buffer Time:**
+Always add 20% buffer for unexpected issues:
+- Data quality worse than expected
+- New questions from stakeholders
+- Technical problems
+- Illness or other interruptions
+                """,
+            "key_points": ["Data cleaning takes most time (30-40%)", "Break project into weekly milestones", "Add 20% buffer for unexpected issues", "Track progress against timeline"]
+        },
+        {
+            "title": "Managing Deliverables",
+            "content": """
+**Project Deliverables for Data Analysis**
+
+Deliverables are the tangible outputs that prove your work is complete.
+
+**Common Data Project Deliverables:**
+
+| Deliverable | Purpose | Format |
+|-------------|---------|--------|
+| **Analysis Report** | Main findings and recommendations | PDF, Word doc |
+| **Clean Dataset** | Prepared data for future use | CSV, Excel |
+| **Dashboard** | Interactive visualization | Power BI, Tableau |
+| **Presentation** | Summary for stakeholders | PowerPoint, Slides |
+| **Code/Scripts** | Reproducible analysis | Python, SQL files |
+| **Data Dictionary** | Explain data fields | Excel, PDF |
+
+**Quality Checklist for Each Deliverable:**
+
+**📊 Analysis Report:**
+- [ ] Executive summary (1 page)
+- [ ] Clear problem statement
+- [ ] Methodology explained
+- [ ] Key findings with evidence
+- [ ] Visualizations to support points
+- [ ] Recommendations with rationale
+- [ ] Limitations and next steps
+- [ ] Proofread for errors
+
+**📁 Clean Dataset:**
+- [ ] All values validated
+- [ ] Consistent formatting
+- [ ] Missing values handled
+- [ ] Outliers addressed
+- [ ] Column names clear
+- [ ] Data dictionary included
+
+**📈 Dashboard/Visualizations:**
+- [ ] Clear titles and labels
+- [ ] Appropriate chart types
+- [ ] Consistent colors and fonts
+- [ ] Interactive filters work
+- [ ] Data source documented
+
+**🎤 Presentation:**
+- [ ] 10-15 slides maximum
+- [ ] One key message per slide
+- [ ] Visual-heavy, text-light
+- [ ] Practiced timing (aim for 15-20 min)
+- [ ] Prepared for Q&A
+                """,
+            "key_points": ["Define deliverables at project start", "Use checklists for quality", "Each deliverable serves a purpose", "Document everything for reproducibility"]
+        },
+        {
+            "title": "Working Independently and in Teams",
+            "content": """
+**Project Execution: Solo and Team Work**
+
+Data projects can be individual or collaborative - each requires different skills.
+
+**Individual Project Best Practices:**
+
+| Practice | Why It Matters |
+|----------|---------------|
+| **Daily progress log** | Track what you did, decisions made |
+| **Version control** | Save versions (v1, v2, v3 or use Git) |
+| **Regular breaks** | Avoid burnout, fresh eyes catch errors |
+| **Self-review** | Check your own work before submission |
+| **Ask for feedback** | Don't wait until the end |
+
+**Sample Daily Log Entry:**
+```
+Date: 2025-02-15
+Hours worked: 4
+
+COMPLETED:
+- Cleaned customer dataset (removed 145 duplicates)
+- Created pivot table for sales by region
+- Identified outlier in March data
+
+BLOCKED:
+- Need access to inventory data (emailed IT)
+
+NEXT:
+- Follow up on data access
+- Start correlation analysis
+
+DECISIONS MADE:
+- Used median imputation for 23 missing ages
+- Excluded records before 2023 (incomplete)
+```
+
+**Team Project Best Practices:**
+
+| Practice | How to Do It |
+|----------|-------------|
+| **Clear role division** | Who does what (data, analysis, report) |
+| **Regular check-ins** | Daily standup or weekly sync |
+| **Shared workspace** | Cloud storage, shared drives |
+| **Communication channel** | Slack, Teams, email thread |
+| **Integration points** | When to merge work together |
+
+**Team Role Examples:**
+- **Data Lead**: Collection, cleaning, validation
+- **Analysis Lead**: Statistics, modeling, insights
+- **Visualization Lead**: Charts, dashboards
+- **Documentation Lead**: Report, presentation
+
+**Conflict Resolution:**
+1. Discuss disagreements early, not at deadline
+2. Focus on the project goal, not personal preferences
+3. Use data to settle debates when possible
+4. Escalate to mentor/supervisor if stuck
+                """,
+            "key_points": ["Keep a daily progress log", "Use version control for all files", "In teams: define clear roles", "Communicate early about problems"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Write a Scope Statement",
+            "type": "practical",
+            "question": "Your manager asks you to 'look into why sales are down.' Write a proper scope statement with objectives, in-scope, out-of-scope, and deliverables.",
+            "answer": "PROJECT: Q1 2025 Sales Decline Analysis. PROBLEM: Identify root causes for 15% sales decline in Q1 2025 vs Q1 2024. OBJECTIVES: 1) Quantify decline by product category and region, 2) Identify top 3 contributing factors, 3) Recommend corrective actions. IN SCOPE: Sales data 2024-2025, customer feedback Q1 2025, competitor pricing data. OUT OF SCOPE: Marketing campaign effectiveness (separate project), international markets, product development recommendations. DELIVERABLES: Analysis report with findings and recommendations, executive presentation (10 slides), cleaned sales dataset. TIMELINE: 3 weeks. STAKEHOLDERS: Sales VP, Regional Managers.",
+            "hint": "Transform the vague request into specific, measurable objectives with clear boundaries"
+        },
+        {
+            "title": "Create a Project Timeline",
+            "type": "practical",
+            "question": "You have 2 weeks to analyze customer churn data and present findings. Create a day-by-day timeline with milestones.",
+            "answer": "WEEK 1 - Data & Cleaning: Day 1: Define scope, success metrics, stakeholder alignment. Day 2: Collect customer data, subscription history, support tickets. Day 3-4: Data cleaning (expect 2 days - data quality usually worse than expected). Day 5: Exploratory analysis, initial patterns. MILESTONE: Clean dataset ready, initial insights documented. WEEK 2 - Analysis & Delivery: Day 1-2: Deep analysis (churn predictors, segment analysis, correlation). Day 3: Create visualizations, validate findings. Day 4: Write report, build presentation. Day 5: Review, practice presentation, buffer for refinements. MILESTONE: Final deliverables complete. BUFFER: Day 5 of each week reserved for overruns.",
+            "hint": "Remember: cleaning takes 30-40% of time, always add buffer"
+        },
+        {
+            "title": "Deliverable Checklist",
+            "type": "scenario",
+            "question": "You've finished your analysis and are about to submit. Your report shows that Product A has declining sales. What 5 things should you verify before submitting?",
+            "answer": "Before submitting, verify: 1) DATA ACCURACY: Double-check the numbers - did you filter correctly? Are calculations right? Run the analysis again to confirm. 2) EVIDENCE: Does your visualization clearly show the decline? Are axes labeled correctly? Is the time period clear? 3) CONTEXT: Did you compare to benchmarks or previous periods? Is the decline significant or normal variation? 4) RECOMMENDATIONS: Are your suggestions actionable and tied to findings? 5) PROOFREADING: Check for typos, formatting issues, missing sections. Have someone else review if possible. BONUS: Check that your data source is documented so findings can be reproduced.",
+            "hint": "Think about what would embarrass you if it were wrong in front of stakeholders"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "What percentage of a data project is typically spent on data cleaning?",
+            "options": ["5-10%", "15-20%", "30-40%", "60-70%"],
+            "correct": 2,
+            "explanation": "Data cleaning typically takes 30-40% of project time. Real-world data is messy, and underestimating cleaning time is a common mistake."
+        },
+        {
+            "question": "What is 'scope creep'?",
+            "options": ["When the project finishes early", "When requirements keep expanding beyond original plan", "When team members leave", "When data is insufficient"],
+            "correct": 1,
+            "explanation": "Scope creep occurs when project requirements continuously expand beyond the original plan, often causing delays and budget overruns."
+        },
+        {
+            "question": "Which deliverable provides explanations of data fields and their meanings?",
+            "options": ["Executive Summary", "Data Dictionary", "Dashboard", "Analysis Report"],
+            "correct": 1,
+            "explanation": "A Data Dictionary documents what each field means, its data type, allowed values, and any transformations applied."
+        },
+        {
+            "question": "When should you document decisions made during data cleaning?",
+            "options": ["At the end of the project", "During the cleaning process", "Only if asked", "Never - it's not important"],
+            "correct": 1,
+            "explanation": "Document decisions as you make them. This ensures reproducibility, helps explain your methodology, and protects you if questions arise later."
+        }
+    ]
+}
@@ -0,0 +1,148 @@
+"""Training Center content: Qualitative vs Quantitative Decision-Making."""
+
+MODULE = {
+    "course": "Data Driven Decision-Making",
+    "description": "Learn when to use qualitative and quantitative evidence, and how data models and focused subsets help isolate the right business problem.",
+    "lessons": [
+        {
+            "title": "Choosing Between Qualitative and Quantitative Evidence",
+            "content": """
+**Two Evidence Types, One Goal**
+
+Strong decision-making does not rely on numbers alone. Analysts often combine:
+
+| Evidence Type | Best For | Typical Sources | Example Question |
+|--------------|----------|-----------------|------------------|
+| **Qualitative** | Understanding opinions, experiences, motives | Interviews, open-ended surveys, support tickets, observation notes | "Why are customers frustrated?" |
+| **Quantitative** | Measuring scale, frequency, change, and performance | Sales data, web analytics, KPI dashboards, experiments | "How much did conversion fall?" |
+
+**Rule of thumb:**
+- Use **quantitative evidence** to measure what changed and how large the change is.
+- Use **qualitative evidence** to understand why people behaved the way they did.
+- Use **both together** when a decision affects customers, teams, or operations.
+
+**Example - Checkout Problem:**
+- Quantitative: Conversion rate dropped from 3.8% to 2.9%
+- Qualitative: Customers report confusion about shipping costs
+- Decision: Simplify the checkout flow and show shipping earlier
+
+This is why qualitative and quantitative analysis are complementary rather than competing approaches.
+                """
+        },
+        {
+            "title": "Using Data Models and Data Subsets to Isolate Problem Domains",
+            "content": """
+**Why Analysts Use Data Models**
+
+A data model is a simplified representation of a real-world process, system, or relationship. It helps you focus on the variables that matter for a decision.
+
+**Examples of simple business data models:**
+- Sales model: date, product, region, revenue, discount
+- Churn model: tenure, usage, complaints, plan type, cancellation
+- Inventory model: SKU, demand, supplier lead time, stock level
+
+**Using subsets to isolate a problem domain** means narrowing the data to the part of the business where the issue actually lives.
+
+| Broad Dataset | Useful Subset | Why It Helps |
+|--------------|---------------|--------------|
+| All customers | New customers in first 30 days | Isolates onboarding problems |
+| All sales | Weekend sales in one region | Identifies local demand patterns |
+| All support tickets | Billing-related complaints | Narrows root-cause analysis |
+
+**Example - Low Sales Problem:**
+1. Start broad: All store sales are down 8%
+2. Subset by region: North region is down 2%, South is down 15%
+3. Subset by category: South region electronics are down 25%
+4. Subset by time: Decline started after a pricing change
+
+At each step, the analyst isolates the real problem domain. This prevents wasted analysis on unrelated data.
+
+**Key idea:** A good analyst does not analyse everything. A good analyst filters to the most relevant slice of reality.
+                """
+        },
+        {
+            "title": "Before-and-After Scenarios for Better Decisions",
+            "content": """
+**Before-and-After Thinking**
+
+This course emphasizes real-world before-and-after scenarios because they connect analysis directly to decisions.
+
+| Stage | Question |
+|------|----------|
+| **Before** | What was happening before the change? |
+| **Intervention** | What action or event changed the situation? |
+| **After** | What changed in the results? |
+| **Interpretation** | Was the change meaningful, and what should we do next? |
+
+**Example - Customer Support Improvement:**
+- Before: Average response time = 18 hours, customer satisfaction = 71%
+- Intervention: Added chat triage and FAQ routing
+- After: Response time = 6 hours, customer satisfaction = 83%
+- Interpretation: Process change improved both speed and satisfaction
+
+**Best practice:**
+- Compare like-for-like periods
+- Track at least one KPI before and after the intervention
+- Add qualitative feedback to understand customer experience
+- Avoid claiming causation too quickly if other factors changed at the same time
+
+This approach helps candidates connect analytics methods to practical decision-making in business settings.
+                """
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Choose the Evidence Type",
+            "type": "scenario",
+            "question": "A company wants to understand why employee turnover increased after a policy change. Should the analyst start with qualitative data, quantitative data, or both? Explain why.",
+            "answer": "The analyst should use both. Quantitative data is needed to measure where turnover increased most, by department, tenure, or manager. Qualitative data such as exit interviews or employee comments is needed to understand why staff reacted negatively to the policy. Together, they support a stronger decision than either source alone.",
+            "hint": "Think about measuring the problem and understanding the cause."
+        },
+        {
+            "title": "Define a Useful Subset",
+            "type": "practical",
+            "question": "An online store says 'sales are down.' Propose two useful data subsets that would help isolate the problem domain.",
+            "answer": "Two strong subsets are: 1) sales by channel, such as direct, paid search, and email, to see if the decline is linked to acquisition; 2) sales by product category and time period, such as mobile accessories in the last 30 days, to see whether the drop is concentrated in one category or recent window. Useful subsets narrow the problem instead of averaging everything together.",
+            "hint": "Slice the data by a business dimension and by time, segment, or location."
+        },
+        {
+            "title": "Interpret a Before-and-After Result",
+            "type": "scenario",
+            "question": "A clinic changed its appointment reminder system. Missed appointments dropped from 14% to 9%. Patient comments also mention that reminders are easier to understand. What should the analyst conclude?",
+            "answer": "The analyst can conclude that the new reminder process is associated with a strong improvement in outcomes. Quantitative evidence shows the missed-appointment KPI improved, while qualitative comments suggest the clearer reminders contributed to that change. The next step is to continue monitoring the KPI and check whether other changes occurred at the same time before claiming full causation.",
+            "hint": "Combine the KPI result with the customer feedback."
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which type of data is best for understanding customer opinions in their own words?",
+            "options": ["Quantitative data", "Qualitative data", "Time-series data", "Ratio data"],
+            "correct": 1,
+            "explanation": "Qualitative data captures opinions, experiences, and explanations in descriptive form, such as interviews, comments, and open-ended survey responses."
+        },
+        {
+            "question": "Why do analysts use data subsets?",
+            "options": ["To make the dataset larger", "To avoid using KPIs", "To isolate a more relevant problem domain", "To remove all context from the data"],
+            "correct": 2,
+            "explanation": "Data subsets help isolate the part of the business where the problem actually exists, such as one region, one product group, or one customer segment."
+        },
+        {
+            "question": "A conversion rate dropped from 4.1% to 3.2%. This is primarily what kind of evidence?",
+            "options": ["Qualitative", "Quantitative", "Narrative", "Observational only"],
+            "correct": 1,
+            "explanation": "A conversion rate is a measurable numeric KPI, so it is quantitative evidence."
+        },
+        {
+            "question": "Which statement best describes a before-and-after analysis?",
+            "options": ["It compares outcomes before and after a change or intervention", "It only uses customer interviews", "It replaces KPI tracking", "It guarantees proof of causation"],
+            "correct": 0,
+            "explanation": "Before-and-after analysis compares results around a change, but it does not automatically prove causation if other factors also changed."
+        },
+        {
+            "question": "Which combination gives the strongest support for a business decision?",
+            "options": ["Only one KPI", "Only one interview", "Qualitative insight plus quantitative measurement", "A bigger spreadsheet with no filtering"],
+            "correct": 2,
+            "explanation": "Combining qualitative and quantitative evidence helps analysts measure what changed and understand why it changed."
+        }
+    ]
+}
@@ -0,0 +1,258 @@
+"""Training Center content: Soft Skills for Data Analysts."""
+
+MODULE = {
+    "course": "Semester Project 1",
+    "description": "Develop essential soft skills for working effectively with stakeholders and team members.",
+    "lessons": [
+        {
+            "title": "Communicating with Non-Technical Stakeholders",
+            "content": """
+**Translating Data Into Business Language**
+
+Your analysis is only valuable if stakeholders understand and act on it.
+
+**Common Communication Gaps:**
+
+| Analyst Says | Stakeholder Hears |
+|-------------|-------------------|
+| "R-squared is 0.85" | "...what?" |
+| "Statistically significant" | "Must be important" (not always true) |
+| "Correlation of 0.7" | "Something about numbers" |
+| "We need more data" | "They're stalling" |
+
+**Translation Guide:**
+
+| Technical Term | Plain Language |
+|---------------|----------------|
+| Correlation | "These things tend to move together" |
+| Statistical significance | "This pattern is unlikely to be random chance" |
+| Regression | "A formula to predict one thing from another" |
+| Outlier | "An unusual value that doesn't fit the pattern" |
+| Confidence interval | "We're 95% sure the true number is in this range" |
+| P-value < 0.05 | "Less than 5% chance this is random luck" |
+
+**The "So What?" Test:**
+After every finding, ask yourself: "So what? Why should they care?"
+
+❌ "Average order value increased by $12"
+✅ "Average order value increased by $12, which means $2M additional annual revenue"
+
+**Storytelling Framework:**
+1. **Hook**: Start with the business problem
+2. **Context**: What did we look at?
+3. **Findings**: What did we discover?
+4. **Impact**: What does it mean for the business?
+5. **Action**: What should we do?
+
+**Tips for Non-Technical Audiences:**
+- Lead with the business impact, not the methodology
+- Use analogies they understand
+- Show, don't tell (visualizations > statistics)
+- Avoid acronyms and jargon
+- Check for understanding ("Does that make sense?")
+                """,
+            "key_points": ["Translate technical terms to plain language", "Always answer 'So what?' ", "Lead with business impact", "Use the storytelling framework"]
+        },
+        {
+            "title": "Active Listening & Asking Questions",
+            "content": """
+**Understanding What Stakeholders Really Need**
+
+Often what stakeholders ask for isn't what they actually need. Listening helps you find the real problem.
+
+**Levels of Listening:**
+
+| Level | Description | You're Doing This When... |
+|-------|-------------|--------------------------|
+| 1. Not listening | Waiting for your turn to speak | Formulating response while they talk |
+| 2. Selective | Hearing only what you expect | Missing context and nuance |
+| 3. Active | Fully focused, seeking to understand | Asking clarifying questions |
+| 4. Empathic | Understanding feelings and perspective | Recognizing underlying concerns |
+
+**Active Listening Techniques:**
+
+1. **Paraphrase**: "So what I'm hearing is..."
+2. **Clarify**: "When you say X, do you mean...?"
+3. **Summarize**: "Let me make sure I understand..."
+4. **Probe**: "Can you tell me more about...?"
+5. **Reflect**: "It sounds like you're concerned about..."
+
+**Powerful Questions to Ask:**
+
+| Situation | Question |
+|-----------|----------|
+| Vague request | "What decision will this analysis support?" |
+| Understanding goals | "What does success look like for this project?" |
+| Finding constraints | "Are there any limitations I should know about?" |
+| Clarifying priority | "If you could only know one thing, what would it be?" |
+| Understanding context | "What have you already tried?" |
+| Timeline | "When do you need this, and why that date?" |
+
+**The "5 Whys" for Requirements:**
+When someone asks for something, dig deeper:
+- "I need sales data" → Why?
+- "To see performance" → Why performance?
+- "We're missing targets" → Why do you think?
+- "Certain products are down" → Which ones? Why those?
+- "New competitor in that segment" → So you need competitive analysis?
+
+**Discovered Real Need**: Compare your products to competitor in that segment, not just "sales data"
+                """,
+            "key_points": ["Active listening finds the real problem", "Paraphrase to confirm understanding", "Ask 'why' to get to root needs", "What they ask for ≠ what they need"]
+        },
+        {
+            "title": "Working with Different Roles",
+            "content": """
+**Collaborating Across Data and Business Teams**
+
+Data analysts work with many different roles. Understanding their perspectives helps collaboration.
+
+**Common Collaborators:**
+
+| Role | Their Priority | What They Need From You |
+|------|---------------|------------------------|
+| **Executives** | Strategic decisions, ROI | High-level insights, recommendations |
+| **Marketing** | Customer behavior, campaign performance | Segmentation, conversion metrics |
+| **Sales** | Revenue, targets, forecasts | Pipeline analysis, trends |
+| **Operations** | Efficiency, cost reduction | Process metrics, bottlenecks |
+| **Product** | User experience, feature usage | Usage data, feedback analysis |
+| **Finance** | Profitability, budgets | Cost analysis, forecasting |
+| **IT/Engineering** | Data infrastructure, security | Data requirements, quality issues |
+
+**Adapting Your Communication:**
+
+**To Executives:**
+- Bottom line first
+- Focus on decisions, not details
+- Quantify business impact
+- 1-page max, with backup available
+
+**To Technical Teams:**
+- Can go deeper on methodology
+- Discuss data quality openly
+- Collaborate on implementation
+- Share code/queries if helpful
+
+**To Business Teams:**
+- Focus on actionability
+- Use their terminology
+- Show how data supports their goals
+- Be available for questions
+
+**Building Relationships:**
+
+1. **Understand their world**: Ask about their challenges and goals
+2. **Speak their language**: Learn their terminology and metrics
+3. **Be reliable**: Deliver on time, follow up promptly
+4. **Educate gently**: Help them understand data without condescension
+5. **Celebrate together**: Share wins as team achievements
+6. **Accept feedback**: Be open to their domain expertise
+                """,
+            "key_points": ["Different roles have different priorities", "Adapt communication to audience", "Build relationships proactively", "Learn their terminology and goals"]
+        },
+        {
+            "title": "Handling Feedback and Conflict",
+            "content": """
+**Receiving Feedback Professionally**
+
+Feedback helps you grow. How you receive it matters as much as the feedback itself.
+
+**Receiving Critical Feedback:**
+
+| Step | Action |
+|------|--------|
+| 1. Listen | Let them finish without interrupting |
+| 2. Clarify | Ask questions to understand fully |
+| 3. Acknowledge | Thank them for the feedback |
+| 4. Reflect | Consider it honestly before reacting |
+| 5. Act | Make changes or explain your reasoning |
+
+**What NOT to Do:**
+- ❌ Get defensive ("But I...")
+- ❌ Make excuses ("I didn't have time")
+- ❌ Dismiss it ("They don't understand")
+- ❌ Take it personally
+- ❌ Argue immediately
+
+**What TO Do:**
+- ✅ "Thank you for pointing that out"
+- ✅ "I hadn't considered that perspective"
+- ✅ "Can you help me understand what you expected?"
+- ✅ "I'll revisit that section and update it"
+
+**Handling Disagreements:**
+
+When someone disagrees with your analysis:
+
+1. **Stay calm**: Take a breath, don't react emotionally
+2. **Seek to understand**: "Can you tell me more about your concern?"
+3. **Find common ground**: "We both want the best decision..."
+4. **Use data**: Offer to investigate their hypothesis
+5. **Know when to yield**: You might be wrong!
+6. **Escalate thoughtfully**: If stuck, involve a neutral third party
+
+**Common Conflict Scenarios:**
+
+| Situation | Response |
+|-----------|----------|
+| "Your numbers are wrong" | "Let me verify the source and methodology" |
+| "This isn't what I asked for" | "Help me understand what you were expecting" |
+| "I don't believe this finding" | "What would convince you? Let me investigate" |
+| "This analysis is useless" | "What would make it useful? Let's discuss" |
+
+**Growth Mindset:**
+Every piece of feedback is an opportunity to improve. Even harsh feedback usually contains some truth worth considering.
+                """,
+            "key_points": ["Listen fully before responding", "Thank people for feedback, even negative", "Stay calm in disagreements", "Use data to resolve conflicts"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Translate Technical to Plain Language",
+            "type": "practical",
+            "question": "Translate this to non-technical language: 'The regression analysis shows a statistically significant positive correlation (r=0.72, p<0.01) between marketing spend and customer acquisition.'",
+            "answer": "Plain language: 'When we spend more on marketing, we get more customers - and this pattern is very consistent. For every $1 extra we spend on marketing, we typically gain [X] new customers. We're confident this is a real relationship, not just coincidence.' Note: Would be even better to add the actual business impact, e.g., 'Based on this, if we increased marketing budget by $50K, we'd expect to gain approximately 500 new customers.'",
+            "hint": "Avoid statistical terms, focus on what it means for the business, and quantify the impact"
+        },
+        {
+            "title": "Uncover the Real Need",
+            "type": "scenario",
+            "question": "A sales manager says: 'I need a report of all our customers sorted by revenue.' What questions would you ask to understand what they really need?",
+            "answer": "Questions to ask: 1) 'What decision will this report help you make?' (Might reveal: identify at-risk accounts, find upsell opportunities, allocate account manager time). 2) 'What will you do with the top customers on this list?' (Reveals intended action). 3) 'Are you looking at a specific time period or trend?' (They might actually need trend data). 4) 'Should I include any other information like last contact date or satisfaction score?' (Might need a more complete view). 5) 'Is this a one-time analysis or something you'd need regularly?' (Informs automation). The real need might be: 'Help me identify my top 20 accounts at risk of churning so I can prioritize retention calls this week.'",
+            "hint": "Focus on the decision they're trying to make and what action they'll take with the information"
+        },
+        {
+            "title": "Handle Negative Feedback",
+            "type": "scenario",
+            "question": "Your stakeholder says: 'This analysis doesn't make sense. The conclusions don't match what we see on the ground.' How do you respond?",
+            "answer": "Response approach: 1) STAY CALM - Don't get defensive. 2) ACKNOWLEDGE: 'I appreciate you sharing that concern. It's important that the analysis reflects reality.' 3) SEEK TO UNDERSTAND: 'Can you help me understand what you're seeing on the ground that doesn't match?' 4) COLLABORATE: 'Let's look at the data together - you might spot something I missed, or there might be context I need to understand.' 5) INVESTIGATE: 'Would it help if I checked [specific aspect they mention] to see if something was filtered incorrectly?' 6) COMMIT: 'I'll review the analysis with your feedback in mind and get back to you by [date].' Never say: 'You don't understand the data' or 'The numbers are correct, so you must be wrong.'",
+            "hint": "Their ground-level experience is valuable data too - don't dismiss it"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "When a stakeholder asks for 'sales data,' you should:",
+            "options": ["Send them the raw sales database", "Ask what decision they're trying to make", "Create every possible sales report", "Tell them to be more specific"],
+            "correct": 1,
+            "explanation": "Asking what decision they're trying to make helps uncover the real need. 'Sales data' could mean many things - understanding the purpose ensures you deliver what's actually useful."
+        },
+        {
+            "question": "When translating 'statistically significant' for non-technical audiences, say:",
+            "options": ["The p-value is below 0.05", "This is very important", "This pattern is unlikely to be random chance", "The correlation is strong"],
+            "correct": 2,
+            "explanation": "'Unlikely to be random chance' captures the meaning without jargon. 'Very important' is a common misunderstanding - statistical significance doesn't mean practical importance."
+        },
+        {
+            "question": "When someone disagrees with your analysis, the first thing to do is:",
+            "options": ["Defend your methodology", "Seek to understand their perspective", "Escalate to management", "Redo the entire analysis"],
+            "correct": 1,
+            "explanation": "First seek to understand their perspective - they may have valid information you don't have, or there may be a miscommunication you can resolve."
+        },
+        {
+            "question": "Active listening involves:",
+            "options": ["Waiting for your turn to speak", "Formulating your response while they talk", "Paraphrasing and asking clarifying questions", "Taking detailed notes"],
+            "correct": 2,
+            "explanation": "Active listening means fully focusing on understanding, demonstrated through paraphrasing ('So you're saying...') and asking clarifying questions."
+        }
+    ]
+}
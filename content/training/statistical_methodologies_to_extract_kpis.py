@@ -0,0 +1,129 @@
+"""Training Center content: Statistical methodologies to extract KPIs."""
+
+MODULE = {
+    "course": "Statistical Tools",
+    "description": "Learn how to use statistics to calculate and analyze Key Performance Indicators (KPIs).",
+    "lessons": [
+        {
+            "title": "What are KPIs?",
+            "content": """
+**Key Performance Indicators (KPIs)** are measurable values that show how effectively a company is achieving its objectives.
+
+**Characteristics of Good KPIs:**
+- **Specific**: Clearly defined
+- **Measurable**: Can be quantified
+- **Achievable**: Realistic targets
+- **Relevant**: Aligned with business goals
+- **Time-bound**: Has a deadline
+
+**Common Business KPIs:**
+- Revenue growth rate
+- Customer acquisition cost
+- Employee turnover rate
+- Net Promoter Score (NPS)
+- Conversion rate
+                """,
+            "key_points": ["KPIs measure business performance", "Good KPIs are SMART", "Different industries have different KPIs"]
+        },
+        {
+            "title": "Statistical Measures for KPIs",
+            "content": """
+**Basic Statistical Measures:**
+
+**Mean (Average):**
+Sum of all values ÷ Number of values
+Example: Sales of 100, 150, 200 → Mean = 150
+
+**Median:**
+The middle value when sorted
+Example: 100, 150, 200 → Median = 150
+
+**Standard Deviation:**
+Measures how spread out values are
+Low SD = values close to mean
+High SD = values spread out
+
+**Percentage Change:**
+((New - Old) / Old) × 100
+Example: Sales went from 1000 to 1200
+Change = ((1200-1000)/1000) × 100 = 20%
+                """,
+            "key_points": ["Mean shows the average", "Median is better when there are outliers", "Standard deviation shows variability"]
+        },
+        {
+            "title": "Calculating KPIs in Practice",
+            "content": """
+**Example: Customer Retention Rate**
+
+Formula: ((Customers at End - New Customers) / Customers at Start) × 100
+
+**Scenario:**
+- Start of month: 1000 customers
+- New customers acquired: 200
+- End of month: 1050 customers
+
+Calculation:
+((1050 - 200) / 1000) × 100 = 85%
+
+**Interpretation:**
+85% retention rate means 15% of customers left (churned).
+
+**Example: Average Order Value (AOV)**
+
+Formula: Total Revenue / Number of Orders
+
+**Scenario:**
+- Monthly revenue: $50,000
+- Total orders: 1,000
+
+AOV = $50,000 / 1,000 = $50
+
+This means customers spend $50 on average per order.
+                """,
+            "key_points": ["KPIs use simple formulas", "Always compare KPIs over time", "Context matters for interpretation"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Calculate Mean Sales",
+            "type": "practical",
+            "question": "A store had daily sales of: $500, $750, $600, $800, $650. Calculate the mean (average) daily sales.",
+            "answer": "Mean = (500 + 750 + 600 + 800 + 650) / 5 = 3300 / 5 = $660. The average daily sales is $660.",
+            "hint": "Add all values and divide by the count"
+        },
+        {
+            "title": "Calculate Percentage Change",
+            "type": "practical",
+            "question": "Website traffic was 10,000 visitors last month and 12,500 this month. What is the percentage change?",
+            "answer": "Percentage Change = ((12,500 - 10,000) / 10,000) × 100 = (2,500 / 10,000) × 100 = 25%. Traffic increased by 25%.",
+            "hint": "Use the formula: ((New - Old) / Old) × 100"
+        },
+        {
+            "title": "Calculate Customer Retention",
+            "type": "practical",
+            "question": "A company started with 500 customers, gained 100 new customers, and ended with 480 customers. What is the retention rate?",
+            "answer": "Retention Rate = ((480 - 100) / 500) × 100 = (380 / 500) × 100 = 76%. The company retained 76% of its original customers.",
+            "hint": "Subtract new customers from ending total, then divide by starting customers"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "What does KPI stand for?",
+            "options": ["Key Performance Index", "Key Performance Indicator", "Knowledge Process Integration", "Key Process Information"],
+            "correct": 1,
+            "explanation": "KPI stands for Key Performance Indicator - a measurable value that shows business performance."
+        },
+        {
+            "question": "If sales were 100, 200, 300, 400, 500, what is the median?",
+            "options": ["300", "280", "350", "250"],
+            "correct": 0,
+            "explanation": "The median is the middle value when sorted. In 100, 200, 300, 400, 500, the middle value is 300."
+        },
+        {
+            "question": "Revenue went from $80,000 to $100,000. What is the percentage increase?",
+            "options": ["20%", "25%", "15%", "30%"],
+            "correct": 1,
+            "explanation": "((100,000 - 80,000) / 80,000) × 100 = (20,000 / 80,000) × 100 = 25%"
+        }
+    ]
+}
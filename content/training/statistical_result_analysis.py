@@ -0,0 +1,354 @@
+"""Training Center content: Statistical Result Analysis."""
+
+MODULE = {
+    "course": "Evaluation of Outcomes",
+    "description": "Master statistical inference techniques to evaluate and interpret model results including regression, variance, and z-testing.",
+    "lessons": [
+        {
+            "title": "Interpreting Regression Results",
+            "content": """
+**Evaluating Linear Regression Outcomes**
+
+Linear regression is fundamental for understanding relationships and making predictions.
+
+**Key Regression Output Components:**
+
+```
+REGRESSION SUMMARY
+─────────────────────────────────────
+Dependent Variable: Sales
+R-squared: 0.847
+Adjusted R-squared: 0.831
+
+Coefficients:
+                  Estimate    Std Error   t-value   p-value
+─────────────────────────────────────────────────────────────
+(Intercept)       1250.00      125.50      9.96    <0.001 ***
+Marketing_Spend      2.35        0.42      5.60    <0.001 ***
+Price              -15.80        3.25     -4.86    <0.001 ***
+Seasonality         45.20       12.30      3.67     0.002 **
+```
+
+**Interpreting Each Component:**
+
+| Component | What It Tells You |
+|-----------|------------------|
+| **R-squared** | % of variance explained (0.847 = 84.7%) |
+| **Adjusted R²** | R² adjusted for number of predictors |
+| **Coefficient** | Change in Y for 1-unit change in X |
+| **Std Error** | Uncertainty in coefficient estimate |
+| **t-value** | Coefficient / Std Error (larger = more significant) |
+| **p-value** | Probability result is due to chance |
+
+**Reading the Example:**
+- Marketing: $1 more spend → $2.35 more sales
+- Price: $1 higher price → $15.80 less sales
+- Model explains 84.7% of sales variation
+
+**Common Interpretation Mistakes:**
+
+| Mistake | Reality |
+|---------|---------|
+| High R² = good model | Could be overfit |
+| Low p-value = important | Statistical ≠ practical significance |
+| Coefficient shows causation | Correlation only without experiments |
+| Larger coefficient = more important | Depends on scale of variables |
+
+**Practical Significance vs Statistical Significance:**
+
+```
+Example:
+Coefficient = 0.002, p-value = 0.001
+
+Statistically significant? YES (p < 0.05)
+Practically significant? Maybe not - 
+  $1000 increase in marketing → only $2 more sales
+```
+                """,
+            "key_points": ["R-squared shows variance explained", "Coefficients show relationship magnitude", "Low p-value ≠ practical importance", "Watch for overfitting with high R²"]
+        },
+        {
+            "title": "Analyzing Variance and Spread",
+            "content": """
+**Understanding Data Variance in Model Evaluation**
+
+Variance tells you how spread out your data and predictions are.
+
+**Measures of Variance:**
+
+```
+VARIANCE (σ²)
+Average of squared deviations from mean
+
+Standard Deviation (σ)
+Square root of variance - same units as data
+
+Coefficient of Variation (CV)
+Standard deviation / Mean × 100%
+Use when comparing different scales
+```
+
+**Five-Point Summary (Box Plot Values):**
+
+```
+┌─────────────────────────────────────────┐
+│  Min   Q1   Median   Q3   Max           │
+│   ↓     ↓      ↓      ↓    ↓            │
+│  10    25     35     45   90            │
+│                                          │
+│  ├──────┤      ├──────┤                 │
+│     IQR = Q3 - Q1 = 20                   │
+│                                          │
+│  Outlier threshold:                      │
+│  < Q1 - 1.5×IQR = 25 - 30 = -5          │
+│  > Q3 + 1.5×IQR = 45 + 30 = 75          │
+│  → 90 is an outlier!                     │
+└─────────────────────────────────────────┘
+```
+
+**Using Variance in Model Evaluation:**
+
+| High Variance | Low Variance |
+|---------------|--------------|
+| Predictions spread widely | Predictions clustered |
+| Model may be unreliable | Model more consistent |
+| Check for missing features | May be too conservative |
+| Could indicate concept drift | Good for stable domains |
+
+**Variance in Prediction Errors:**
+
+```
+RESIDUAL ANALYSIS
+─────────────────────────
+Mean Residual: -0.5 (bias)
+Std Dev Residuals: 12.3
+Min: -45.2
+Max: +38.7
+
+Check:
+✓ Mean near 0? (no systematic bias)
+✓ Constant variance? (homoscedasticity)
+✓ Normally distributed? (valid confidence intervals)
+```
+
+**ANOVA for Comparing Groups:**
+
+When comparing model performance across groups:
+- H₀: All group means are equal
+- H₁: At least one group differs
+- Use F-statistic and p-value to decide
+                """,
+            "key_points": ["Five-point summary identifies outliers", "High variance may indicate model issues", "Residual variance should be constant", "Use ANOVA to compare group performance"]
+        },
+        {
+            "title": "Z-Testing for Outcome Evaluation",
+            "content": """
+**Using Z-Tests to Evaluate Outcomes**
+
+Z-tests help determine if observed results are statistically significant.
+
+**When to Use Z-Test:**
+- Large sample size (n > 30)
+- Population standard deviation known
+- Comparing sample mean to population mean
+- Comparing two sample proportions
+
+**Z-Test Formula:**
+
+```
+          Sample Mean - Population Mean
+Z = ─────────────────────────────────────
+         Population SD / √(Sample Size)
+
+          x̄ - μ
+Z = ─────────────
+       σ / √n
+```
+
+**Interpreting Z-Scores:**
+
+```
+Z-Score Distribution:
+─────────────────────────────────────
+         │                    │
+    -3   -2   -1   0   +1   +2   +3
+         │                    │
+    ─────┴────────────────────┴─────
+         2.5%              97.5%
+         
+Common thresholds:
+|Z| > 1.96 → p < 0.05 (95% confidence)
+|Z| > 2.58 → p < 0.01 (99% confidence)
+|Z| > 3.29 → p < 0.001 (99.9% confidence)
+```
+
+**Example: Evaluating Model Performance**
+
+```
+Question: Is our new model significantly better?
+
+Old model accuracy: 85% (population mean μ)
+New model accuracy: 88% (sample mean x̄)
+Standard deviation: 3%
+Sample size: 100 tests
+
+Z = (88 - 85) / (3 / √100)
+Z = 3 / 0.3
+Z = 10
+
+Interpretation:
+Z = 10 >> 1.96
+p << 0.001
+Conclusion: New model is significantly better
+```
+
+**Two-Sample Z-Test for Proportions:**
+
+Comparing conversion rates:
+```
+Group A: 250/1000 = 25% converted
+Group B: 280/1000 = 28% converted
+
+Pooled proportion p = 530/2000 = 26.5%
+Standard Error = √[p(1-p)(1/n₁ + 1/n₂)]
+               = √[0.265 × 0.735 × 0.002]
+               = 0.0197
+
+Z = (0.28 - 0.25) / 0.0197 = 1.52
+
+|Z| < 1.96 → NOT statistically significant
+```
+                """,
+            "key_points": ["Z > 1.96 indicates statistical significance at 95%", "Use for large samples (n > 30)", "Compare means or proportions", "Statistical significance ≠ practical importance"]
+        },
+        {
+            "title": "Sampled Sets and Inference",
+            "content": """
+**Drawing Conclusions from Sample Data**
+
+In practice, we evaluate models on sample data and infer population performance.
+
+**Key Sampling Concepts:**
+
+| Term | Meaning |
+|------|---------|
+| **Population** | The entire group you want to understand |
+| **Sample** | Subset you actually measure |
+| **Sampling Error** | Difference between sample and population |
+| **Confidence Interval** | Range likely containing true value |
+
+**Sample Size and Reliability:**
+
+```
+MARGIN OF ERROR
+─────────────────
+           z × σ
+MOE = ───────────
+          √n
+
+For 95% confidence (z = 1.96):
+n = 100  → MOE = 0.196σ
+n = 400  → MOE = 0.098σ
+n = 1000 → MOE = 0.062σ
+
+Quadrupling sample size halves the margin of error!
+```
+
+**Confidence Intervals:**
+
+```
+INTERPRETING CONFIDENCE INTERVALS
+
+Model accuracy: 87% ± 3% (95% CI)
+
+This means:
+✓ Sample accuracy is 87%
+✓ 95% confident true accuracy is between 84-90%
+✗ Does NOT mean 95% probability the true value is in range
+   (it either is or isn't!)
+```
+
+**Comparing Two Models with Confidence Intervals:**
+
+```
+Model A: 85% (82-88)
+Model B: 88% (84-92)
+                    ←──────────→
+                 ←────────────────→
+         80  82  84  86  88  90  92
+
+Intervals overlap!
+→ Cannot conclude B is significantly better
+→ Need more data or different test
+```
+
+**Cross-Validation for Robust Estimates:**
+
+```
+K-FOLD CROSS-VALIDATION
+────────────────────────
+Split data into K folds (e.g., K=5)
+
+Fold 1: [Test] [Train] [Train] [Train] [Train] → Acc: 86%
+Fold 2: [Train] [Test] [Train] [Train] [Train] → Acc: 88%
+Fold 3: [Train] [Train] [Test] [Train] [Train] → Acc: 84%
+Fold 4: [Train] [Train] [Train] [Test] [Train] → Acc: 87%
+Fold 5: [Train] [Train] [Train] [Train] [Test] → Acc: 85%
+
+Mean Accuracy: 86%
+Std Dev: 1.6%
+CI: 86% ± 1.4% (based on std error)
+```
+
+**Avoiding Sampling Bias:**
+- Random sampling for representative data
+- Stratified sampling for balanced groups
+- Time-based splits for time series
+- Never test on training data!
+                """,
+            "key_points": ["Larger samples reduce margin of error", "Confidence intervals show uncertainty", "Overlapping CIs suggest no significant difference", "Use cross-validation for robust estimates"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Interpret Regression Output",
+            "type": "practical",
+            "question": "A regression shows: R² = 0.72, Marketing coefficient = 1.8 (p=0.003), Price coefficient = -12.5 (p=0.41). What can you conclude about each variable's impact on sales?",
+            "answer": "Interpretation: 1) R² = 0.72: The model explains 72% of sales variation - reasonably good but 28% unexplained. 2) Marketing (coef=1.8, p=0.003): Statistically significant (p<0.05). Each $1 in marketing increases sales by $1.80. Strong evidence of positive relationship. 3) Price (coef=-12.5, p=0.41): NOT statistically significant (p>0.05). We cannot confidently say price affects sales based on this data. The negative coefficient suggests higher price = lower sales, but the relationship could be due to chance. Recommendation: Keep marketing in model, consider removing price or collecting more data to detect effect.",
+            "hint": "Look at both coefficient direction/magnitude AND statistical significance (p-value)"
+        },
+        {
+            "title": "Calculate and Interpret Z-Score",
+            "type": "practical",
+            "question": "Your A/B test shows: Control group 1000 users, 12% conversion. Test group 1000 users, 15% conversion. Is the difference statistically significant at 95% confidence?",
+            "answer": "Calculation: Pooled proportion p = (120 + 150) / 2000 = 0.135. Standard Error SE = √[0.135 × 0.865 × (1/1000 + 1/1000)] = √[0.1167 × 0.002] = √0.000234 = 0.0153. Z = (0.15 - 0.12) / 0.0153 = 0.03 / 0.0153 = 1.96. Interpretation: Z = 1.96 is exactly at the 95% confidence threshold. This is borderline significant. Technically, |Z| ≥ 1.96 means p ≤ 0.05, so this JUST reaches significance. However, I would recommend: 1) Running the test longer for more certainty, 2) Calculating exact p-value (it's about 0.05), 3) Considering practical significance: 3% lift = 30 extra conversions per 1000 users.",
+            "hint": "Use the two-proportion z-test formula with pooled proportion"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "In regression, a high R-squared value means:",
+            "options": ["The model is perfect", "The model explains most of the variance", "All coefficients are significant", "The model cannot be overfit"],
+            "correct": 1,
+            "explanation": "R-squared indicates the percentage of variance explained by the model. High R² means the model captures most of the variation, but doesn't guarantee it's not overfit."
+        },
+        {
+            "question": "A coefficient is statistically significant when:",
+            "options": ["It is large", "The p-value is less than 0.05", "R-squared is high", "The t-value is less than 1"],
+            "correct": 1,
+            "explanation": "Statistical significance is determined by p-value. P < 0.05 (at 95% confidence) means the relationship is unlikely due to chance."
+        },
+        {
+            "question": "The IQR in a five-point summary is:",
+            "options": ["Maximum minus minimum", "Q3 minus Q1", "Mean minus median", "Standard deviation times 2"],
+            "correct": 1,
+            "explanation": "IQR (Interquartile Range) = Q3 - Q1. It represents the middle 50% of the data and is used to identify outliers."
+        },
+        {
+            "question": "What does |Z| > 1.96 indicate at 95% confidence?",
+            "options": ["Result is not significant", "Result is statistically significant", "Sample is too small", "Data is normally distributed"],
+            "correct": 1,
+            "explanation": "Z-score magnitude greater than 1.96 indicates statistical significance at the 95% confidence level (p < 0.05)."
+        }
+    ]
+}
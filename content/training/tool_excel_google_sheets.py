@@ -0,0 +1,237 @@
+"""Training Center content: Tool: Excel & Google Sheets."""
+
+MODULE = {
+    "course": "Spreadsheet Fundamentals",
+    "tool_type": "spreadsheet",
+    "description": "Quick-reference tool for common Excel formulas, pivot tables, data cleaning, and automation techniques. Also covers Google Sheets — the free cloud-based alternative with built-in real-time collaboration.",
+    "lessons": [
+        {
+            "title": "Essential Formulas for Data Analysis",
+            "content": """
+**Key Formulas Every Data Analyst Needs:**
+
+**1. VLOOKUP / XLOOKUP (Finding Data)**
+```
+=VLOOKUP(lookup_value, table_array, col_index, FALSE)
+=XLOOKUP(lookup_value, lookup_array, return_array)
+```
+*Use case:* Match customer IDs to their names across different sheets.
+
+**2. SUMIF / COUNTIF (Conditional Calculations)**
+```
+=SUMIF(range, criteria, sum_range)
+=COUNTIF(range, criteria)
+```
+*Use case:* Sum all sales for a specific product or count orders from a region.
+
+**3. IF / IFS (Logic)**
+```
+=IF(condition, value_if_true, value_if_false)
+=IFS(condition1, value1, condition2, value2, ...)
+```
+*Use case:* Categorize sales as "High", "Medium", or "Low" based on amount.
+
+**4. INDEX/MATCH (Advanced Lookup)**
+```
+=INDEX(return_range, MATCH(lookup_value, lookup_range, 0))
+```
+*Use case:* More flexible than VLOOKUP - can look left or right in a table.
+
+**Real-World Scenario:**
+You have a sales report with 10,000 rows. Your manager wants to know total sales by region. Instead of manually calculating, you use:
+```
+=SUMIF(B:B, "North", D:D)
+```
+This instantly sums all sales where region (column B) equals "North".
+                """,
+            "key_points": ["VLOOKUP finds data across sheets", "SUMIF/COUNTIF calculate with conditions", "INDEX/MATCH is more powerful than VLOOKUP"]
+        },
+        {
+            "title": "Pivot Tables for Quick Analysis",
+            "content": """
+**Pivot Tables: Your Data Analysis Superpower**
+
+Pivot tables summarize thousands of rows of data in seconds without writing formulas.
+
+**Creating a Pivot Table (Excel):**
+1. Select your data (including headers)
+2. Insert → Pivot Table
+3. Drag fields to Rows, Columns, Values, and Filters
+
+**Example Scenario:**
+You have a dataset of 50,000 sales transactions with columns:
+- Date, Product, Region, Salesperson, Amount
+
+**Analysis Tasks Made Easy:**
+
+| Task | Pivot Table Setup |
+|------|-------------------|
+| Total sales by product | Rows: Product, Values: Sum of Amount |
+| Sales by region and month | Rows: Region, Columns: Month, Values: Sum of Amount |
+| Top salespeople | Rows: Salesperson, Values: Sum of Amount (sort descending) |
+| Average order size by product | Rows: Product, Values: Average of Amount |
+
+**Key Features:**
+- **Filters**: Show only specific products or date ranges
+- **Grouping**: Group dates by month/quarter/year
+- **Calculated Fields**: Create new calculations within the pivot
+- **Slicers**: Visual filters for easy data exploration
+
+**Pro Tip:** Right-click on values → "Show Values As" → "% of Column Total" to see percentages instead of raw numbers.
+                """,
+            "key_points": ["Pivot tables summarize data without formulas", "Drag and drop fields to analyze different angles", "Use filters and slicers for interactive exploration"]
+        },
+        {
+            "title": "Data Cleaning Techniques",
+            "content": """
+**Common Data Problems and Solutions:**
+
+**1. Removing Duplicates**
+- Excel: Data → Remove Duplicates
+- Sheets: Data → Data Cleanup → Remove Duplicates
+- Formula: `=UNIQUE(range)` to create a clean list
+
+**2. Handling Blank Cells**
+```
+=IF(A1="", "Missing", A1)
+```
+Or use Find & Replace: Find blank cells → Replace with "N/A"
+
+**3. Text Cleaning**
+```
+=TRIM(A1)           -- Remove extra spaces
+=UPPER(A1)          -- Convert to uppercase
+=PROPER(A1)         -- Capitalize first letters
+=CLEAN(A1)          -- Remove non-printable characters
+```
+
+**4. Splitting Text**
+```
+=LEFT(A1, 5)        -- First 5 characters
+=RIGHT(A1, 3)       -- Last 3 characters
+=MID(A1, 2, 4)      -- 4 characters starting at position 2
+=TEXTSPLIT(A1, ",") -- Split by delimiter (Excel 365)
+```
+Or: Data → Text to Columns
+
+**5. Date Standardization**
+```
+=DATEVALUE("2024-01-15")  -- Convert text to date
+=TEXT(A1, "YYYY-MM-DD")   -- Format date consistently
+```
+
+**Real-World Scenario:**
+You receive customer data with:
+- Names in all caps: "JOHN SMITH"
+- Extra spaces: "  Chicago  "
+- Inconsistent dates: "01/15/24", "2024-01-15", "Jan 15, 2024"
+
+**Cleaning Process:**
+```
+=PROPER(TRIM(A2))           -- Clean names
+=TRIM(B2)                   -- Clean cities
+=DATEVALUE(C2)              -- Standardize dates
+```
+                """,
+            "key_points": ["Remove duplicates before analysis", "TRIM removes extra spaces", "Use Text to Columns to split data"]
+        },
+        {
+            "title": "Automation with Macros and Scripts",
+            "content": """
+**Automating Repetitive Tasks**
+
+**Excel: Recording Macros**
+1. View → Macros → Record Macro
+2. Give it a name and shortcut key
+3. Perform your actions
+4. Stop recording
+5. Run the macro anytime with your shortcut
+
+**Example Macro Tasks:**
+- Format all reports the same way
+- Copy data from one sheet to another
+- Apply consistent styling to tables
+
+**Google Sheets: Apps Script**
+Google Sheets uses JavaScript-based Apps Script for automation.
+
+**Example Script (Auto-email report):**
+```javascript
+function sendWeeklyReport() {
+  var sheet = SpreadsheetApp.getActiveSheet();
+  var data = sheet.getRange("A1:D10").getValues();
+  
+  MailApp.sendEmail({
+    to: "manager@company.com",
+    subject: "Weekly Sales Report",
+    body: "See attached data..."
+  });
+}
+```
+
+**Common Automation Use Cases:**
+1. **Data Import**: Pull data from external sources automatically
+2. **Report Generation**: Create formatted reports with one click
+3. **Email Alerts**: Send notifications when thresholds are met
+4. **Data Validation**: Automatically check for errors in new entries
+
+**Power Query (Excel):**
+- Connect to databases, websites, or other files
+- Transform data with a visual interface
+- Refresh data automatically
+
+**Pro Tip:** Start with recording macros to learn the basics, then graduate to VBA (Excel) or Apps Script (Sheets) for more complex automation.
+                """,
+            "key_points": ["Macros record repetitive actions", "Google Sheets uses Apps Script for automation", "Power Query connects to external data sources"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Calculate Regional Sales",
+            "type": "practical",
+            "question": "You have sales data with columns: Region (A), Product (B), Amount (C). Write a formula to sum all sales for the 'East' region.",
+            "answer": "=SUMIF(A:A, \"East\", C:C) - This formula checks column A for 'East' and sums the corresponding values in column C.",
+            "hint": "Use SUMIF with the region column as the range and 'East' as the criteria"
+        },
+        {
+            "title": "Create a Pivot Table Summary",
+            "type": "scenario",
+            "question": "Your manager wants a report showing total sales by month for each product category. Describe how you would set up a pivot table to show this.",
+            "answer": "1. Select all data including headers. 2. Insert Pivot Table. 3. Drag 'Product Category' to Rows. 4. Drag 'Date' to Columns and group by Month. 5. Drag 'Sales Amount' to Values (set to SUM). This creates a matrix with products as rows, months as columns, and sales totals in each cell.",
+            "hint": "Think about what goes in rows vs columns, and what value you're summarizing"
+        },
+        {
+            "title": "Clean Messy Data",
+            "type": "practical",
+            "question": "Cell A1 contains '  JOHN DOE  ' (with extra spaces and all caps). Write a formula to clean this to 'John Doe'.",
+            "answer": "=PROPER(TRIM(A1)) - TRIM removes the extra spaces, then PROPER capitalizes only the first letter of each word, resulting in 'John Doe'.",
+            "hint": "Combine TRIM to remove spaces and PROPER for proper capitalization"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which formula finds a value in the first column and returns a value from another column?",
+            "options": ["SUMIF", "VLOOKUP", "COUNTIF", "TRIM"],
+            "correct": 1,
+            "explanation": "VLOOKUP (Vertical Lookup) searches the first column of a range for a value and returns a value from a specified column."
+        },
+        {
+            "question": "What does =SUMIF(A:A, \"North\", B:B) do?",
+            "options": ["Counts cells containing 'North'", "Sums column B where column A equals 'North'", "Finds 'North' in column A", "Averages column B"],
+            "correct": 1,
+            "explanation": "SUMIF adds up values in the sum_range (B:B) where the corresponding cells in the criteria_range (A:A) match the criteria ('North')."
+        },
+        {
+            "question": "Which feature summarizes large datasets without formulas?",
+            "options": ["VLOOKUP", "Conditional Formatting", "Pivot Table", "Data Validation"],
+            "correct": 2,
+            "explanation": "Pivot Tables allow you to summarize, analyze, and explore large datasets by dragging and dropping fields - no formulas required."
+        },
+        {
+            "question": "=PROPER(TRIM(\"  HELLO WORLD  \")) returns:",
+            "options": ["HELLO WORLD", "hello world", "Hello World", "  Hello World  "],
+            "correct": 2,
+            "explanation": "TRIM removes extra spaces, then PROPER capitalizes the first letter of each word, resulting in 'Hello World'."
+        }
+    ]
+}
@@ -0,0 +1,304 @@
+"""Training Center content: Tool: Python Programming."""
+
+MODULE = {
+    "course": "Programming Fundamentals",
+    "tool_type": "programming",
+    "description": "Learn Python for data analysis - pandas for data manipulation, data cleaning scripts, and automated analysis pipelines.",
+    "lessons": [
+        {
+            "title": "Introduction to Pandas DataFrames",
+            "content": """
+**Pandas: The Data Analyst's Best Friend**
+
+Pandas is a Python library that makes working with data easy and intuitive.
+
+**Creating a DataFrame:**
+```python
+import pandas as pd
+
+# From a dictionary
+data = {
+    'Name': ['Alice', 'Bob', 'Charlie'],
+    'Age': [25, 30, 35],
+    'Salary': [50000, 60000, 70000]
+}
+df = pd.DataFrame(data)
+
+# From a CSV file
+df = pd.read_csv('sales_data.csv')
+
+# From an Excel file
+df = pd.read_excel('report.xlsx')
+```
+
+**Exploring Your Data:**
+```python
+df.head()           # First 5 rows
+df.tail()           # Last 5 rows
+df.info()           # Column types and non-null counts
+df.describe()       # Statistical summary
+df.shape            # (rows, columns)
+df.columns          # List of column names
+```
+
+**Selecting Data:**
+```python
+df['Name']                    # Single column
+df[['Name', 'Age']]          # Multiple columns
+df.loc[0]                    # Row by label/index
+df.iloc[0:5]                 # Rows by position
+df[df['Age'] > 30]           # Filter rows by condition
+```
+
+**Real-World Example:**
+```python
+# Load sales data
+sales = pd.read_csv('sales.csv')
+
+# Quick exploration
+print(f"Total records: {len(sales)}")
+print(f"Columns: {sales.columns.tolist()}")
+print(f"Date range: {sales['date'].min()} to {sales['date'].max()}")
+```
+                """,
+            "key_points": ["pandas uses DataFrames to organize data in rows and columns", "read_csv() and read_excel() load external data", "Use head(), info(), describe() to explore data quickly"]
+        },
+        {
+            "title": "Data Manipulation with Pandas",
+            "content": """
+**Common Data Operations:**
+
+**1. Adding and Modifying Columns:**
+```python
+# New column from calculation
+df['Bonus'] = df['Salary'] * 0.10
+
+# New column from condition
+df['Senior'] = df['Age'] > 30
+
+# Modify existing column
+df['Name'] = df['Name'].str.upper()
+```
+
+**2. Aggregations:**
+```python
+df['Salary'].sum()      # Total
+df['Salary'].mean()     # Average
+df['Age'].max()         # Maximum
+df['Name'].count()      # Count
+
+# Group by and aggregate
+df.groupby('Department')['Salary'].mean()
+df.groupby('Region').agg({
+    'Sales': 'sum',
+    'Orders': 'count',
+    'Amount': 'mean'
+})
+```
+
+**3. Sorting:**
+```python
+df.sort_values('Salary', ascending=False)  # Sort by column
+df.sort_values(['Dept', 'Salary'])         # Sort by multiple columns
+```
+
+**4. Merging DataFrames:**
+```python
+# Like VLOOKUP in Excel
+merged = pd.merge(orders, customers, on='customer_id', how='left')
+
+# Combine datasets vertically
+all_data = pd.concat([jan_data, feb_data, mar_data])
+```
+
+**Real-World Scenario:**
+```python
+# Calculate sales metrics by region
+summary = sales.groupby('Region').agg({
+    'Amount': ['sum', 'mean', 'count'],
+    'Profit': 'sum'
+}).round(2)
+
+# Find top 10 customers
+top_customers = sales.groupby('Customer')['Amount'].sum().nlargest(10)
+```
+                """,
+            "key_points": ["groupby() aggregates data like pivot tables", "merge() combines DataFrames like VLOOKUP", "Method chaining allows multiple operations in one line"]
+        },
+        {
+            "title": "Data Cleaning in Python",
+            "content": """
+**Handling Common Data Issues:**
+
+**1. Missing Values:**
+```python
+# Find missing values
+df.isnull().sum()                    # Count per column
+
+# Handle missing values
+df.dropna()                          # Remove rows with any missing
+df.dropna(subset=['Name'])           # Remove if Name is missing
+df.fillna(0)                         # Fill with 0
+df['Age'].fillna(df['Age'].mean())   # Fill with mean
+```
+
+**2. Duplicates:**
+```python
+# Find duplicates
+df.duplicated().sum()                # Count duplicates
+df[df.duplicated()]                  # Show duplicate rows
+
+# Remove duplicates
+df.drop_duplicates()                 # Remove exact duplicates
+df.drop_duplicates(subset=['Email']) # Remove based on column
+```
+
+**3. Data Type Conversion:**
+```python
+df['Date'] = pd.to_datetime(df['Date'])        # Convert to datetime
+df['Price'] = df['Price'].astype(float)        # Convert to float
+df['ID'] = df['ID'].astype(str)                # Convert to string
+```
+
+**4. Text Cleaning:**
+```python
+df['Name'] = df['Name'].str.strip()            # Remove whitespace
+df['Name'] = df['Name'].str.lower()            # Lowercase
+df['Name'] = df['Name'].str.title()            # Title Case
+df['Code'] = df['Code'].str.replace('-', '')   # Remove characters
+```
+
+**5. Outlier Detection:**
+```python
+# Using Z-score
+from scipy import stats
+df['z_score'] = stats.zscore(df['Value'])
+outliers = df[abs(df['z_score']) > 3]
+
+# Using IQR
+Q1 = df['Value'].quantile(0.25)
+Q3 = df['Value'].quantile(0.75)
+IQR = Q3 - Q1
+outliers = df[(df['Value'] < Q1 - 1.5*IQR) | (df['Value'] > Q3 + 1.5*IQR)]
+```
+                """,
+            "key_points": ["isnull().sum() shows missing value counts", "drop_duplicates() removes duplicate rows", "to_datetime() converts text to proper dates"]
+        },
+        {
+            "title": "Analysis Scripts and Automation",
+            "content": """
+**Creating Reusable Analysis Scripts:**
+
+**Basic Analysis Template:**
+```python
+import pandas as pd
+
+def analyze_sales(filepath):
+    # Load data
+    df = pd.read_csv(filepath)
+    
+    # Clean data
+    df = df.dropna(subset=['Amount'])
+    df['Date'] = pd.to_datetime(df['Date'])
+    
+    # Calculate metrics
+    results = {
+        'total_sales': df['Amount'].sum(),
+        'avg_order': df['Amount'].mean(),
+        'num_orders': len(df),
+        'top_product': df.groupby('Product')['Amount'].sum().idxmax()
+    }
+    
+    return results
+
+# Run analysis
+metrics = analyze_sales('sales_2024.csv')
+print(f"Total Sales: ${metrics['total_sales']:,.2f}")
+```
+
+**Scheduling Automated Reports:**
+```python
+import schedule
+import time
+
+def daily_report():
+    data = pd.read_csv('daily_data.csv')
+    summary = data.groupby('Category').sum()
+    summary.to_csv(f'report_{date.today()}.csv')
+    print("Report generated!")
+
+# Run every day at 9 AM
+schedule.every().day.at("09:00").do(daily_report)
+
+while True:
+    schedule.run_pending()
+    time.sleep(60)
+```
+
+**Exporting Results:**
+```python
+# To CSV
+df.to_csv('output.csv', index=False)
+
+# To Excel with formatting
+with pd.ExcelWriter('report.xlsx') as writer:
+    summary.to_excel(writer, sheet_name='Summary')
+    details.to_excel(writer, sheet_name='Details')
+
+# To JSON
+df.to_json('data.json', orient='records')
+```
+                """,
+            "key_points": ["Functions make analysis reusable", "schedule library automates recurring tasks", "Export to CSV, Excel, or JSON formats"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Calculate Sales Summary",
+            "type": "practical",
+            "question": "Write Python code to load 'sales.csv' and calculate the total sales amount and number of unique customers.",
+            "answer": "```python\nimport pandas as pd\ndf = pd.read_csv('sales.csv')\ntotal_sales = df['Amount'].sum()\nunique_customers = df['CustomerID'].nunique()\nprint(f'Total: ${total_sales:,.2f}')\nprint(f'Unique Customers: {unique_customers}')\n```\nThe .sum() method adds all values, and .nunique() counts unique values.",
+            "hint": "Use pd.read_csv to load, .sum() for total, and .nunique() for unique count"
+        },
+        {
+            "title": "Group By Analysis",
+            "type": "practical",
+            "question": "Write code to find the average order amount by product category from a DataFrame called 'orders'.",
+            "answer": "```python\navg_by_category = orders.groupby('Category')['Amount'].mean()\nprint(avg_by_category.sort_values(ascending=False))\n```\nThis groups orders by Category, then calculates the mean Amount for each group.",
+            "hint": "Use groupby('Category') followed by .mean() on the Amount column"
+        },
+        {
+            "title": "Clean Missing Data",
+            "type": "scenario",
+            "question": "Your DataFrame 'customers' has missing values in the 'Email' column and duplicate rows. Describe the steps to clean this data.",
+            "answer": "```python\n# Step 1: Check missing values\nprint(customers['Email'].isnull().sum())\n\n# Step 2: Remove rows with missing emails\ncustomers = customers.dropna(subset=['Email'])\n\n# Step 3: Remove duplicate rows\ncustomers = customers.drop_duplicates()\n\n# Step 4: Verify cleaning\nprint(f'Remaining rows: {len(customers)}')\n```",
+            "hint": "Use dropna() for missing values and drop_duplicates() for duplicates"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which pandas function loads a CSV file?",
+            "options": ["pd.load_csv()", "pd.read_csv()", "pd.import_csv()", "pd.open_csv()"],
+            "correct": 1,
+            "explanation": "pd.read_csv() is the standard function to load CSV files into a pandas DataFrame."
+        },
+        {
+            "question": "df.groupby('Region')['Sales'].sum() does what?",
+            "options": ["Counts rows by region", "Averages sales by region", "Sums sales by region", "Lists all regions"],
+            "correct": 2,
+            "explanation": "This groups data by Region, then sums the Sales column for each region - like a pivot table."
+        },
+        {
+            "question": "How do you check for missing values in a DataFrame?",
+            "options": ["df.missing()", "df.isnull().sum()", "df.check_null()", "df.find_empty()"],
+            "correct": 1,
+            "explanation": "df.isnull().sum() returns the count of missing (null) values for each column."
+        },
+        {
+            "question": "What does df.drop_duplicates() do?",
+            "options": ["Removes columns", "Removes null values", "Removes duplicate rows", "Removes the first row"],
+            "correct": 2,
+            "explanation": "drop_duplicates() removes rows that are exact copies of other rows in the DataFrame."
+        }
+    ]
+}
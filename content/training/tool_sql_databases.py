@@ -0,0 +1,312 @@
+"""Training Center content: Tool: SQL & Databases."""
+
+MODULE = {
+    "course": "Databases and Cloud Services",
+    "tool_type": "database",
+    "description": "Master SQL for querying databases - learn SELECT statements, JOINs, aggregations, and data extraction from relational databases.",
+    "lessons": [
+        {
+            "title": "SQL Basics: SELECT Queries",
+            "content": """
+**SQL (Structured Query Language)** is the standard language for working with databases.
+
+**Basic SELECT Statement:**
+```sql
+SELECT column1, column2
+FROM table_name
+WHERE condition
+ORDER BY column1;
+```
+
+**Examples:**
+
+**1. Select All Data:**
+```sql
+SELECT * FROM customers;
+```
+
+**2. Select Specific Columns:**
+```sql
+SELECT first_name, last_name, email
+FROM customers;
+```
+
+**3. Filter with WHERE:**
+```sql
+SELECT * FROM orders
+WHERE order_date > '2024-01-01';
+
+SELECT * FROM products
+WHERE price BETWEEN 10 AND 50;
+
+SELECT * FROM customers
+WHERE city IN ('New York', 'Los Angeles', 'Chicago');
+```
+
+**4. Sort Results:**
+```sql
+SELECT * FROM sales
+ORDER BY amount DESC;  -- Highest first
+
+SELECT * FROM employees
+ORDER BY department, hire_date;
+```
+
+**5. Limit Results:**
+```sql
+SELECT * FROM products
+ORDER BY sales DESC
+LIMIT 10;  -- Top 10 best sellers
+```
+
+**Common WHERE Operators:**
+| Operator | Example | Description |
+|----------|---------|-------------|
+| = | WHERE city = 'Oslo' | Exact match |
+| > < >= <= | WHERE price > 100 | Comparisons |
+| BETWEEN | WHERE age BETWEEN 20 AND 30 | Range |
+| LIKE | WHERE name LIKE 'J%' | Pattern match |
+| IN | WHERE status IN ('Active', 'Pending') | Multiple values |
+| IS NULL | WHERE email IS NULL | Missing values |
+                """,
+            "key_points": ["SELECT retrieves data from tables", "WHERE filters rows based on conditions", "ORDER BY sorts results, LIMIT restricts row count"]
+        },
+        {
+            "title": "JOINs: Combining Tables",
+            "content": """
+**JOINs connect data from multiple tables** based on related columns.
+
+**Types of JOINs:**
+
+**1. INNER JOIN (Most Common)**
+Returns only matching rows from both tables.
+```sql
+SELECT orders.order_id, customers.name, orders.amount
+FROM orders
+INNER JOIN customers ON orders.customer_id = customers.id;
+```
+
+**2. LEFT JOIN**
+Returns all rows from the left table, matched rows from the right.
+```sql
+SELECT customers.name, orders.order_id
+FROM customers
+LEFT JOIN orders ON customers.id = orders.customer_id;
+-- Shows all customers, even those without orders (NULL for orders)
+```
+
+**3. RIGHT JOIN**
+Returns all rows from the right table, matched rows from the left.
+```sql
+SELECT customers.name, orders.order_id
+FROM customers
+RIGHT JOIN orders ON customers.id = orders.customer_id;
+```
+
+**Visual Representation:**
+```
+INNER JOIN:     [A ∩ B]     - Only matching records
+LEFT JOIN:      [A + (A∩B)] - All from left + matches
+RIGHT JOIN:     [(A∩B) + B] - All from right + matches
+FULL OUTER JOIN:[A + B]     - All records from both
+```
+
+**Real-World Example:**
+You have three tables: `orders`, `customers`, `products`
+
+```sql
+SELECT 
+    o.order_id,
+    c.customer_name,
+    p.product_name,
+    o.quantity,
+    o.order_date
+FROM orders o
+INNER JOIN customers c ON o.customer_id = c.id
+INNER JOIN products p ON o.product_id = p.id
+WHERE o.order_date >= '2024-01-01'
+ORDER BY o.order_date DESC;
+```
+                """,
+            "key_points": ["INNER JOIN returns only matching rows", "LEFT JOIN keeps all rows from the first table", "Use aliases (o, c, p) to simplify queries"]
+        },
+        {
+            "title": "Aggregations and GROUP BY",
+            "content": """
+**Aggregate Functions** calculate values across multiple rows.
+
+**Common Aggregate Functions:**
+```sql
+COUNT(*)        -- Number of rows
+COUNT(column)   -- Non-null values in column
+SUM(column)     -- Total
+AVG(column)     -- Average
+MIN(column)     -- Minimum value
+MAX(column)     -- Maximum value
+```
+
+**GROUP BY: Aggregate by Category**
+```sql
+SELECT category, SUM(amount) as total_sales
+FROM sales
+GROUP BY category;
+```
+
+**Example Results:**
+| category | total_sales |
+|----------|-------------|
+| Electronics | 150000 |
+| Clothing | 85000 |
+| Home | 62000 |
+
+**HAVING: Filter Grouped Results**
+```sql
+SELECT customer_id, COUNT(*) as order_count
+FROM orders
+GROUP BY customer_id
+HAVING COUNT(*) >= 5;  -- Only customers with 5+ orders
+```
+
+**Difference: WHERE vs HAVING**
+- WHERE filters rows BEFORE grouping
+- HAVING filters groups AFTER aggregation
+
+**Complex Example:**
+```sql
+SELECT 
+    region,
+    COUNT(*) as num_orders,
+    SUM(amount) as total_revenue,
+    AVG(amount) as avg_order,
+    MAX(amount) as largest_order
+FROM orders
+WHERE order_date >= '2024-01-01'
+GROUP BY region
+HAVING SUM(amount) > 10000
+ORDER BY total_revenue DESC;
+```
+                """,
+            "key_points": ["SUM, COUNT, AVG, MIN, MAX are aggregate functions", "GROUP BY creates groups for aggregation", "HAVING filters after grouping, WHERE filters before"]
+        },
+        {
+            "title": "Subqueries and Advanced Techniques",
+            "content": """
+**Subqueries: Queries Within Queries**
+
+**1. Subquery in WHERE:**
+```sql
+-- Find customers who spent above average
+SELECT customer_name, total_spent
+FROM customers
+WHERE total_spent > (SELECT AVG(total_spent) FROM customers);
+```
+
+**2. Subquery in FROM:**
+```sql
+-- Calculate metrics on aggregated data
+SELECT region, avg_order
+FROM (
+    SELECT region, AVG(amount) as avg_order
+    FROM orders
+    GROUP BY region
+) as region_summary
+WHERE avg_order > 100;
+```
+
+**Common Table Expressions (CTEs):**
+```sql
+WITH monthly_sales AS (
+    SELECT 
+        DATE_TRUNC('month', order_date) as month,
+        SUM(amount) as revenue
+    FROM orders
+    GROUP BY DATE_TRUNC('month', order_date)
+)
+SELECT month, revenue,
+       revenue - LAG(revenue) OVER (ORDER BY month) as change
+FROM monthly_sales;
+```
+
+**Window Functions:**
+```sql
+-- Rank salespeople by performance
+SELECT 
+    salesperson,
+    total_sales,
+    RANK() OVER (ORDER BY total_sales DESC) as rank
+FROM sales_summary;
+
+-- Running total
+SELECT 
+    order_date,
+    amount,
+    SUM(amount) OVER (ORDER BY order_date) as running_total
+FROM orders;
+```
+
+**CASE Statements:**
+```sql
+SELECT 
+    product_name,
+    price,
+    CASE 
+        WHEN price < 10 THEN 'Budget'
+        WHEN price < 50 THEN 'Mid-range'
+        ELSE 'Premium'
+    END as category
+FROM products;
+```
+                """,
+            "key_points": ["Subqueries can be used in WHERE, FROM, or SELECT", "CTEs make complex queries more readable", "Window functions calculate across rows without grouping"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Basic Query",
+            "type": "practical",
+            "question": "Write a SQL query to find all orders over $500 from 2024, sorted by amount (highest first).",
+            "answer": "```sql\nSELECT *\nFROM orders\nWHERE amount > 500\n  AND order_date >= '2024-01-01'\nORDER BY amount DESC;\n```\nThis filters orders by amount AND date, then sorts descending.",
+            "hint": "Use WHERE with two conditions (AND), ORDER BY with DESC"
+        },
+        {
+            "title": "JOIN Two Tables",
+            "type": "practical",
+            "question": "Write a query to show order_id, customer_name, and amount by joining 'orders' and 'customers' tables on customer_id.",
+            "answer": "```sql\nSELECT o.order_id, c.customer_name, o.amount\nFROM orders o\nINNER JOIN customers c ON o.customer_id = c.id;\n```\nINNER JOIN connects the tables where customer_id matches.",
+            "hint": "Use INNER JOIN with ON clause to specify the matching columns"
+        },
+        {
+            "title": "Aggregation Challenge",
+            "type": "practical",
+            "question": "Write a query to find total sales by product category, but only show categories with total sales over $10,000.",
+            "answer": "```sql\nSELECT category, SUM(amount) as total_sales\nFROM sales\nGROUP BY category\nHAVING SUM(amount) > 10000\nORDER BY total_sales DESC;\n```\nGROUP BY aggregates by category, HAVING filters the grouped results.",
+            "hint": "Use GROUP BY for categories, HAVING (not WHERE) to filter after aggregation"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "Which SQL clause filters rows BEFORE grouping?",
+            "options": ["HAVING", "WHERE", "GROUP BY", "ORDER BY"],
+            "correct": 1,
+            "explanation": "WHERE filters individual rows before any grouping. HAVING filters after grouping."
+        },
+        {
+            "question": "What does LEFT JOIN do?",
+            "options": ["Returns only matching rows", "Returns all rows from the left table plus matches", "Returns all rows from both tables", "Joins tables side by side"],
+            "correct": 1,
+            "explanation": "LEFT JOIN returns all rows from the left (first) table, and matching rows from the right table. Non-matches show NULL."
+        },
+        {
+            "question": "SELECT COUNT(*) FROM orders returns:",
+            "options": ["All order details", "Number of columns", "Total order amount", "Number of rows"],
+            "correct": 3,
+            "explanation": "COUNT(*) counts all rows in the table. COUNT(column) would count non-null values in that column."
+        },
+        {
+            "question": "To show only top 5 results, use:",
+            "options": ["TOP 5", "FIRST 5", "LIMIT 5", "MAX 5"],
+            "correct": 2,
+            "explanation": "LIMIT 5 restricts the result to 5 rows. (Note: TOP is used in SQL Server, LIMIT in MySQL/PostgreSQL)"
+        }
+    ]
+}
@@ -0,0 +1,306 @@
+"""Training Center content: Tool: Statistical Analysis."""
+
+MODULE = {
+    "course": "Statistical Tools",
+    "tool_type": "statistics",
+    "description": "Learn statistical analysis techniques including hypothesis testing, confidence intervals, and when to use different statistical methods.",
+    "lessons": [
+        {
+            "title": "Descriptive Statistics Fundamentals",
+            "content": """
+**Summarizing Data with Numbers**
+
+**Measures of Central Tendency:**
+
+**1. Mean (Average)**
+```
+Mean = Sum of all values / Number of values
+
+Example: 10, 20, 30, 40, 50
+Mean = 150 / 5 = 30
+```
+Use when: Data is symmetric, no extreme outliers
+
+**2. Median (Middle Value)**
+```
+Sort values, find the middle
+Example: 10, 20, 30, 40, 100
+Median = 30 (middle value)
+```
+Use when: Data has outliers (median is resistant to extremes)
+
+**3. Mode (Most Frequent)**
+```
+Example: 10, 20, 20, 30, 20
+Mode = 20 (appears most often)
+```
+Use when: Working with categorical data
+
+**Measures of Spread:**
+
+**1. Range**
+```
+Range = Maximum - Minimum
+Example: Max=100, Min=10 → Range = 90
+```
+
+**2. Variance**
+```
+Average of squared deviations from mean
+σ² = Σ(x - μ)² / n
+```
+
+**3. Standard Deviation**
+```
+Square root of variance
+σ = √(Variance)
+
+Interpretation:
+- 68% of data within ±1 SD of mean
+- 95% of data within ±2 SD of mean
+- 99.7% of data within ±3 SD of mean
+```
+
+**4. Interquartile Range (IQR)**
+```
+IQR = Q3 - Q1 (75th percentile - 25th percentile)
+Used for identifying outliers:
+Outlier if value < Q1 - 1.5×IQR or > Q3 + 1.5×IQR
+```
+
+**Real-World Application:**
+Salary data: [30K, 35K, 40K, 45K, 500K]
+- Mean = 130K (misleading due to outlier)
+- Median = 40K (more representative)
+- Report BOTH with explanation of the outlier
+                """,
+            "key_points": ["Mean is affected by outliers, median is not", "Standard deviation shows data spread", "Always report both mean and median for skewed data"]
+        },
+        {
+            "title": "Hypothesis Testing Basics",
+            "content": """
+**Making Data-Driven Decisions**
+
+**What is Hypothesis Testing?**
+A method to determine if observed results are statistically significant or due to chance.
+
+**Key Concepts:**
+
+**1. Null Hypothesis (H₀)**
+The "nothing special" assumption
+Example: "There is no difference in sales before and after the marketing campaign."
+
+**2. Alternative Hypothesis (H₁)**
+What you're trying to prove
+Example: "The marketing campaign increased sales."
+
+**3. P-value**
+Probability of seeing your results if H₀ is true
+- p < 0.05: Statistically significant (reject H₀)
+- p ≥ 0.05: Not significant (fail to reject H₀)
+
+**4. Significance Level (α)**
+Usually set at 0.05 (5%)
+- α = 0.05 means 5% chance of false positive
+
+**Common Tests:**
+
+| Test | When to Use |
+|------|-------------|
+| T-test | Compare means of 2 groups |
+| ANOVA | Compare means of 3+ groups |
+| Chi-square | Test categorical relationships |
+| Correlation | Test relationship strength |
+
+**Example Workflow:**
+1. **Question**: Did the new website design increase conversions?
+2. **H₀**: Conversion rate is the same (no effect)
+3. **H₁**: New design has higher conversion rate
+4. **Collect Data**: Old design: 3.2%, New design: 4.1%
+5. **Run Test**: Calculate p-value
+6. **Interpret**: p = 0.02 < 0.05 → Significant!
+7. **Conclude**: New design significantly improved conversions
+
+**Caution:**
+- Statistical significance ≠ practical importance
+- p = 0.04 is not "more significant" than p = 0.03
+- Always consider effect size alongside p-value
+                """,
+            "key_points": ["p < 0.05 typically means statistically significant", "Null hypothesis assumes no effect", "Statistical significance doesn't guarantee practical importance"]
+        },
+        {
+            "title": "Choosing the Right Statistical Test",
+            "content": """
+**Decision Framework for Statistical Tests**
+
+**Step 1: What Type of Data?**
+- Continuous (numbers): Age, Sales, Temperature
+- Categorical (groups): Gender, Region, Product Type
+
+**Step 2: How Many Groups/Variables?**
+
+**Comparing Groups:**
+```
+Comparing 2 groups:
+├── Continuous outcome → T-test
+│   Example: Compare sales between Region A and B
+│
+└── Categorical outcome → Chi-square test
+    Example: Compare click rates between 2 designs
+
+Comparing 3+ groups:
+├── Continuous outcome → ANOVA
+│   Example: Compare satisfaction across 5 departments
+│
+└── Categorical outcome → Chi-square test
+    Example: Compare preferences across age groups
+```
+
+**Analyzing Relationships:**
+```
+Two continuous variables → Correlation / Regression
+Example: Relationship between ad spend and sales
+
+One continuous + categories → T-test / ANOVA
+Example: Effect of training (yes/no) on performance
+
+Two categorical variables → Chi-square
+Example: Relationship between gender and product preference
+```
+
+**Quick Reference Table:**
+
+| Scenario | Test |
+|----------|------|
+| Compare 2 group means | Independent t-test |
+| Compare same group before/after | Paired t-test |
+| Compare 3+ group means | One-way ANOVA |
+| Predict outcome from variables | Regression |
+| Test category relationships | Chi-square |
+| Measure relationship strength | Correlation |
+
+**Sample Size Considerations:**
+- Small samples (n < 30): Use non-parametric tests
+- Large samples: Central Limit Theorem helps
+- Rule of thumb: At least 30 per group for t-tests
+                """,
+            "key_points": ["T-test for 2 groups, ANOVA for 3+", "Chi-square for categorical data", "Always check sample size requirements"]
+        },
+        {
+            "title": "Confidence Intervals and Effect Size",
+            "content": """
+**Beyond P-values: Practical Significance**
+
+**Confidence Intervals:**
+Range where the true value likely falls.
+
+**Interpreting a 95% CI:**
+```
+Average order value: $45 (95% CI: $42 - $48)
+
+Meaning: We're 95% confident the true average
+is between $42 and $48.
+```
+
+**Key Insights from CIs:**
+- Narrow CI = More precise estimate
+- If CI includes 0 (for differences): Not significant
+- CIs that don't overlap → Significantly different
+
+**Example:**
+```
+Group A mean: 50 (95% CI: 45-55)
+Group B mean: 60 (95% CI: 56-64)
+
+CIs don't overlap → Significant difference!
+```
+
+**Effect Size:**
+Measures the magnitude of an effect, independent of sample size.
+
+**Common Effect Size Measures:**
+
+**1. Cohen's d (for mean differences):**
+```
+d = (Mean1 - Mean2) / Pooled SD
+
+Interpretation:
+d = 0.2: Small effect
+d = 0.5: Medium effect
+d = 0.8: Large effect
+```
+
+**2. R-squared (for regression):**
+```
+R² = Proportion of variance explained
+
+Example: R² = 0.64 means 64% of variation
+in Y is explained by X
+```
+
+**3. Correlation Coefficient (r):**
+```
+r = 0.1-0.3: Weak
+r = 0.3-0.5: Moderate
+r = 0.5-0.7: Strong
+r > 0.7: Very strong
+```
+
+**Real-World Example:**
+"The new training program significantly improved test scores (p < 0.01), with a medium effect size (d = 0.52). Scores increased from 72 (±8) to 76 (±7)."
+
+This tells the full story: significant, meaningful, and practical!
+                """,
+            "key_points": ["Confidence intervals show the range of plausible values", "Effect size shows practical importance", "Report both p-value AND effect size"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Choose Correct Test",
+            "type": "scenario",
+            "question": "You want to compare customer satisfaction scores (1-10) across 4 different store locations. Which statistical test should you use?",
+            "answer": "Use One-Way ANOVA. Reasons: 1) You're comparing means (satisfaction scores are continuous), 2) You have more than 2 groups (4 stores), 3) Groups are independent. If ANOVA shows significance, follow up with post-hoc tests to see which specific stores differ.",
+            "hint": "You have continuous data (scores) and 3+ independent groups"
+        },
+        {
+            "title": "Interpret Results",
+            "type": "practical",
+            "question": "A study reports: 'Mean difference = 5 points, p = 0.03, 95% CI: [1.2, 8.8], Cohen's d = 0.45'. What does this tell you?",
+            "answer": "This tells us: 1) The difference (5 points) is statistically significant (p < 0.05). 2) The true difference is likely between 1.2 and 8.8 points (CI doesn't include 0). 3) The effect size is 'small to medium' (d = 0.45). 4) The finding is statistically significant but the practical impact is moderate.",
+            "hint": "Consider what each metric (p-value, CI, effect size) tells you about the finding"
+        },
+        {
+            "title": "Descriptive Statistics",
+            "type": "practical",
+            "question": "Calculate the mean and median for this salary data (in thousands): 40, 45, 42, 48, 150, 44, 46. Which measure better represents the typical salary?",
+            "answer": "Mean = (40+45+42+48+150+44+46)/7 = 415/7 = 59.3K. Median = 45K (middle value when sorted: 40,42,44,45,46,48,150). The MEDIAN (45K) better represents typical salary because the 150K outlier pulls the mean up significantly. Most employees earn around 45K, not 59K.",
+            "hint": "Sort the values to find the median. Consider which measure is affected by the outlier"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "A p-value of 0.03 means:",
+            "options": ["97% chance the result is true", "3% chance of seeing this result if null hypothesis is true", "The effect size is 0.03", "3% of data is significant"],
+            "correct": 1,
+            "explanation": "P-value is the probability of observing results at least as extreme as yours, assuming the null hypothesis is true. p=0.03 means 3% chance."
+        },
+        {
+            "question": "To compare means across 5 different groups, use:",
+            "options": ["T-test", "Chi-square", "ANOVA", "Correlation"],
+            "correct": 2,
+            "explanation": "ANOVA (Analysis of Variance) is designed to compare means across 3 or more groups. T-test is for 2 groups only."
+        },
+        {
+            "question": "A 95% confidence interval of [2, 8] for a difference means:",
+            "options": ["95% of data falls in this range", "We're 95% confident the true difference is between 2 and 8", "The p-value is 0.95", "The effect is 95% significant"],
+            "correct": 1,
+            "explanation": "A 95% CI means we're 95% confident the true population value falls within this range. Since it doesn't include 0, the difference is significant."
+        },
+        {
+            "question": "Cohen's d = 0.8 indicates:",
+            "options": ["Not significant", "Small effect", "Medium effect", "Large effect"],
+            "correct": 3,
+            "explanation": "Cohen's d of 0.8 or higher is considered a large effect size. Small=0.2, Medium=0.5, Large=0.8."
+        }
+    ]
+}
@@ -0,0 +1,287 @@
+"""Training Center content: Tool: Tableau & Power BI."""
+
+MODULE = {
+    "course": "Data Visualisation",
+    "tool_type": "visualization",
+    "description": "Learn to create professional dashboards and data visualizations using Business Intelligence tools like Tableau and Power BI.",
+    "lessons": [
+        {
+            "title": "Dashboard Design Principles",
+            "content": """
+**Creating Effective Dashboards**
+
+**The 5-Second Rule:**
+Users should understand the main message within 5 seconds of viewing your dashboard.
+
+**Key Design Principles:**
+
+**1. Hierarchy: Most Important First**
+- Place key metrics at the top-left (where eyes naturally start)
+- Use size to indicate importance
+- Group related information together
+
+**2. Layout Patterns:**
+```
+┌─────────────────────────────────┐
+│     KPI Cards (Top Metrics)     │
+├───────────────┬─────────────────┤
+│  Main Chart   │  Supporting     │
+│  (Trend/Map)  │  Charts         │
+├───────────────┴─────────────────┤
+│     Detail Table / Filters      │
+└─────────────────────────────────┘
+```
+
+**3. Color Best Practices:**
+- Use a consistent color palette (3-5 colors max)
+- Reserve red for negative/alerts
+- Reserve green for positive/good
+- Use gray for context/secondary info
+- Ensure color-blind accessibility
+
+**4. White Space:**
+- Don't overcrowd - let visualizations breathe
+- Group related elements with subtle borders or backgrounds
+- Consistent margins and padding
+
+**5. Interactivity:**
+- Add filters for user exploration
+- Use drill-down for details on demand
+- Cross-filter charts when one is clicked
+- Include tooltips for additional context
+
+**Common Mistakes to Avoid:**
+- Too many charts (aim for 4-6 per dashboard)
+- 3D charts (distort perception)
+- Pie charts with many slices (use bar charts instead)
+- Inconsistent formatting across charts
+                """,
+            "key_points": ["Key metrics go top-left", "Limit to 3-5 colors", "Less is more - avoid clutter"]
+        },
+        {
+            "title": "Choosing the Right Visualization",
+            "content": """
+**Match Your Chart to Your Data Story**
+
+**1. Comparisons:**
+| Chart Type | Best For |
+|------------|----------|
+| Bar Chart | Comparing categories |
+| Column Chart | Comparing over time (few periods) |
+| Bullet Chart | Comparing to a target |
+| Lollipop Chart | Many categories, cleaner than bars |
+
+**2. Trends Over Time:**
+| Chart Type | Best For |
+|------------|----------|
+| Line Chart | Continuous time series |
+| Area Chart | Showing volume over time |
+| Sparklines | Compact trends in tables |
+
+**3. Parts of a Whole:**
+| Chart Type | Best For |
+|------------|----------|
+| Stacked Bar | Composition with few categories |
+| Treemap | Hierarchical part-to-whole |
+| Donut Chart | Simple 2-3 part breakdowns |
+
+**4. Relationships:**
+| Chart Type | Best For |
+|------------|----------|
+| Scatter Plot | Correlation between variables |
+| Bubble Chart | Three variables (x, y, size) |
+| Heat Map | Patterns across two dimensions |
+
+**5. Geographic:**
+| Chart Type | Best For |
+|------------|----------|
+| Choropleth Map | Values by region |
+| Symbol Map | Point locations with values |
+
+**Decision Framework:**
+1. What question are you answering?
+2. How many variables?
+3. What type of data? (categories, time, geography)
+4. Who is the audience?
+
+**Example:**
+"How have sales changed by region over the past year?"
+- Time + Categories = Line chart with one line per region
+- Or: Small multiples (one chart per region)
+                """,
+            "key_points": ["Bar charts for comparisons, line charts for trends", "Avoid pie charts with many slices", "Consider your audience when choosing complexity"]
+        },
+        {
+            "title": "Building in Tableau",
+            "content": """
+**Tableau Workflow:**
+
+**1. Connect to Data:**
+- File → New → Connect to data source
+- Supports: Excel, CSV, databases, cloud services
+- Use "Data Interpreter" to clean messy files
+
+**2. Understand the Interface:**
+```
+┌──────────────────────────────────────────┐
+│ Data Pane │ Cards & Shelves  │ Worksheet │
+│ (Fields)  │ (Rows, Columns,  │ (Canvas)  │
+│           │  Filters, Marks) │           │
+└──────────────────────────────────────────┘
+```
+
+**3. Building Visualizations:**
+- Drag DIMENSIONS (categorical) to Rows/Columns
+- Drag MEASURES (numerical) to create charts
+- Tableau automatically suggests chart types
+
+**4. Key Actions:**
+```
+Show Me Panel     → Quick chart suggestions
+Marks Card        → Color, Size, Label, Tooltip
+Filters Shelf     → Filter data
+Pages Shelf       → Animation through data
+```
+
+**5. Calculated Fields:**
+```
+// Example: Profit Margin
+[Profit] / [Sales]
+
+// Example: Sales Category
+IF [Sales] > 10000 THEN "High"
+ELSEIF [Sales] > 5000 THEN "Medium"
+ELSE "Low"
+END
+```
+
+**6. Creating Dashboards:**
+- New → Dashboard
+- Drag worksheets onto the canvas
+- Add filters, text boxes, images
+- Set up actions (filter, highlight, URL)
+
+**Pro Tips:**
+- Use Ctrl+click to multi-select fields
+- Right-click for format options
+- Save as .twbx to include data with workbook
+                """,
+            "key_points": ["Dimensions are categories, Measures are numbers", "Drag fields to Rows/Columns to build charts", "Dashboards combine multiple worksheets"]
+        },
+        {
+            "title": "Building in Power BI",
+            "content": """
+**Power BI Workflow:**
+
+**1. Get Data:**
+- Home → Get Data → Choose source
+- Transform data in Power Query Editor
+- Load to data model
+
+**2. Interface Overview:**
+```
+┌────────────────────────────────────────────┐
+│ Report View │ Data View │ Model View       │
+├────────────────────────────────────────────┤
+│ Fields │ Visualizations │ Report Canvas    │
+│ Pane   │ Pane           │                  │
+└────────────────────────────────────────────┘
+```
+
+**3. Creating Visuals:**
+1. Click visual type in Visualizations pane
+2. Drag fields to Values, Axis, Legend
+3. Format in Format pane (paint roller icon)
+
+**4. DAX Formulas:**
+```
+// Total Sales
+Total Sales = SUM(Sales[Amount])
+
+// Year-over-Year Growth
+YoY Growth = 
+DIVIDE(
+    [Total Sales] - CALCULATE([Total Sales], SAMEPERIODLASTYEAR('Date'[Date])),
+    CALCULATE([Total Sales], SAMEPERIODLASTYEAR('Date'[Date]))
+)
+
+// Running Total
+Running Total = 
+CALCULATE(
+    [Total Sales],
+    FILTER(ALL('Date'), 'Date'[Date] <= MAX('Date'[Date]))
+)
+```
+
+**5. Key Features:**
+- **Slicers**: Interactive filters
+- **Drill Through**: Right-click to see details
+- **Bookmarks**: Save views/states
+- **Q&A**: Natural language queries
+
+**6. Publishing:**
+- Publish → Select workspace
+- Share dashboards with colleagues
+- Schedule data refresh
+- Set up alerts on metrics
+
+**Tableau vs Power BI:**
+| Feature | Tableau | Power BI |
+|---------|---------|----------|
+| Strengths | Visualization | Microsoft integration |
+| Learning | Steeper curve | Easier for Excel users |
+| Cost | Higher | Lower (included in Microsoft 365) |
+                """,
+            "key_points": ["Power BI uses DAX for calculations", "Slicers are interactive dashboard filters", "Publish to Power BI Service to share online"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Choose the Right Chart",
+            "type": "scenario",
+            "question": "You need to show how market share has changed over 5 years for 4 companies. What chart type would you use and why?",
+            "answer": "A stacked area chart or 100% stacked area chart would work best. It shows: 1) Time progression (x-axis), 2) Each company's share (different colors), 3) How shares changed relative to each other. Alternative: Line chart if you want to emphasize individual company trends.",
+            "hint": "You're showing parts of a whole (market share) over time"
+        },
+        {
+            "title": "Dashboard Layout",
+            "type": "scenario",
+            "question": "Design a sales dashboard layout for a manager who needs to see: Total Revenue, Monthly Trend, Sales by Region, and Top Products. Describe where each element should go.",
+            "answer": "Layout: 1) TOP: KPI cards for Total Revenue, Orders, Avg Order Value (most important, immediate visibility). 2) MIDDLE-LEFT: Line chart showing Monthly Sales Trend (main story, largest space). 3) MIDDLE-RIGHT: Map or bar chart for Sales by Region. 4) BOTTOM: Table or horizontal bar chart for Top 10 Products with details. Add date filter at top-right.",
+            "hint": "Think about visual hierarchy - what's most important goes where the eye looks first"
+        },
+        {
+            "title": "Create a DAX Measure",
+            "type": "practical",
+            "question": "Write a DAX formula to calculate the percentage of sales that came from the 'Online' channel (where Sales[Channel] = 'Online').",
+            "answer": "```\nOnline % = \nDIVIDE(\n    CALCULATE(SUM(Sales[Amount]), Sales[Channel] = \"Online\"),\n    SUM(Sales[Amount])\n)\n```\nThis calculates Online sales divided by Total sales. CALCULATE applies the filter for Online channel.",
+            "hint": "Use CALCULATE to filter for Online, then DIVIDE by total"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "What's the best chart for showing sales trends over 12 months?",
+            "options": ["Pie chart", "Bar chart", "Line chart", "Scatter plot"],
+            "correct": 2,
+            "explanation": "Line charts are ideal for showing continuous trends over time. They clearly show patterns, increases, and decreases."
+        },
+        {
+            "question": "In dashboard design, key metrics should be placed:",
+            "options": ["At the bottom", "In the center", "At the top-left", "Hidden behind filters"],
+            "correct": 2,
+            "explanation": "Eyes naturally start at the top-left, so key metrics should be placed there for immediate visibility."
+        },
+        {
+            "question": "In Tableau, what are DIMENSIONS?",
+            "options": ["Numerical values for calculations", "Categorical fields for grouping", "Chart types", "Color settings"],
+            "correct": 1,
+            "explanation": "Dimensions are categorical fields (like Region, Product Name) used to group and categorize data. Measures are numerical values."
+        },
+        {
+            "question": "In Power BI, DAX is used for:",
+            "options": ["Connecting to databases", "Creating calculated measures and columns", "Designing visual layouts", "Sharing dashboards"],
+            "correct": 1,
+            "explanation": "DAX (Data Analysis Expressions) is Power BI's formula language for creating calculated columns, measures, and tables."
+        }
+    ]
+}
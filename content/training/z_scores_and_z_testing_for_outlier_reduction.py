@@ -0,0 +1,128 @@
+"""Training Center content: Z-scores and z-testing for outlier reduction."""
+
+MODULE = {
+    "course": "Statistical Tools",
+    "description": "Learn how to identify and handle outliers using z-scores.",
+    "lessons": [
+        {
+            "title": "What is a Z-Score?",
+            "content": """
+**Z-Score** measures how many standard deviations a value is from the mean.
+
+**Formula:**
+Z = (Value - Mean) / Standard Deviation
+
+**Example:**
+- Mean height = 170 cm
+- Standard Deviation = 10 cm
+- Your height = 190 cm
+
+Z = (190 - 170) / 10 = 2
+
+This means you are 2 standard deviations above the mean.
+
+**Interpreting Z-Scores:**
+- Z = 0: Value equals the mean
+- Z = 1: Value is 1 SD above mean
+- Z = -1: Value is 1 SD below mean
+- Z > 3 or Z < -3: Likely an outlier
+                """,
+            "key_points": ["Z-score shows distance from mean in SDs", "Z = 0 means value equals the mean", "High absolute Z-scores indicate outliers"]
+        },
+        {
+            "title": "Identifying Outliers with Z-Scores",
+            "content": """
+**Outliers** are data points that are significantly different from other values.
+
+**Common Rule:**
+- |Z| > 3 = Outlier (99.7% of data falls within ±3 SD)
+- |Z| > 2 = Potential outlier (95% of data falls within ±2 SD)
+
+**Example Dataset:** Sales: 100, 120, 110, 115, 105, 500
+- Mean = 175
+- SD = 150
+
+Z-score for 500:
+Z = (500 - 175) / 150 = 2.17
+
+This is a potential outlier!
+
+**Why Remove Outliers?**
+- Outliers can skew averages
+- They may indicate errors in data
+- They can affect statistical models
+                """,
+            "key_points": ["Z > 3 or Z < -3 typically indicates outliers", "Outliers can distort analysis", "Always investigate why outliers exist"]
+        },
+        {
+            "title": "Practical Outlier Handling",
+            "content": """
+**Steps to Handle Outliers:**
+
+1. **Calculate Z-scores** for all data points
+2. **Identify outliers** (|Z| > 3 or your chosen threshold)
+3. **Investigate** why they exist:
+   - Data entry error?
+   - Measurement error?
+   - Genuine unusual value?
+4. **Decide action:**
+   - Remove if error
+   - Keep if genuine (but note it)
+   - Transform data (e.g., use median instead of mean)
+
+**Example in Excel/Sheets:**
+```
+=STANDARDIZE(A2, AVERAGE(A:A), STDEV(A:A))
+```
+This calculates the Z-score for cell A2.
+
+**Best Practice:**
+Always document which outliers were removed and why!
+                """,
+            "key_points": ["Calculate Z-scores for all values", "Investigate before removing", "Document your decisions"]
+        }
+    ],
+    "exercises": [
+        {
+            "title": "Calculate Z-Score",
+            "type": "practical",
+            "question": "Mean = 50, Standard Deviation = 10. Calculate the Z-score for a value of 75.",
+            "answer": "Z = (75 - 50) / 10 = 25 / 10 = 2.5. The value is 2.5 standard deviations above the mean.",
+            "hint": "Use the formula: Z = (Value - Mean) / SD"
+        },
+        {
+            "title": "Identify the Outlier",
+            "type": "practical",
+            "question": "Dataset: 20, 22, 21, 19, 23, 20, 85. Mean = 30, SD = 23. Which value is likely an outlier? Calculate its Z-score.",
+            "answer": "The value 85 is the outlier. Z = (85 - 30) / 23 = 55 / 23 = 2.39. While not above 3, it's clearly different from the other values which all cluster around 20-23.",
+            "hint": "The value that's very different from the others"
+        },
+        {
+            "title": "Decision Making",
+            "type": "scenario",
+            "question": "Your sales data shows one transaction of $50,000 when average is $500 with SD of $200. Z-score is 247.5. Should you remove this value?",
+            "answer": "You should investigate first! This extreme Z-score (247.5) suggests either: 1) Data entry error ($500 became $50,000), 2) A legitimate large order. Check the original records before removing.",
+            "hint": "Don't automatically remove - investigate the cause"
+        }
+    ],
+    "quiz": [
+        {
+            "question": "What does a Z-score of 0 mean?",
+            "options": ["Value is missing", "Value equals the mean", "Value is an outlier", "Value is negative"],
+            "correct": 1,
+            "explanation": "A Z-score of 0 means the value is exactly at the mean (0 standard deviations away)."
+        },
+        {
+            "question": "A value with Z-score of -2.5 is:",
+            "options": ["2.5 SDs above the mean", "2.5 SDs below the mean", "Exactly at the mean", "Not calculable"],
+            "correct": 1,
+            "explanation": "A negative Z-score means the value is below the mean. -2.5 means 2.5 standard deviations below."
+        },
+        {
+            "question": "Which Z-score most likely indicates an outlier?",
+            "options": ["Z = 0.5", "Z = 1.2", "Z = 2.0", "Z = 3.5"],
+            "correct": 3,
+            "explanation": "Z = 3.5 is beyond the ±3 threshold commonly used to identify outliers. Only 0.3% of data falls beyond ±3 SDs."
+        }
+    ]
+}
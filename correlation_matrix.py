@@ -0,0 +1,180 @@
+"""Every pairwise correlation of a table at once, with p-values, cached per table.
+
+The Statistical Analysis tool computed one ``stats.pearsonr`` per click, so
+seeing how ``k`` columns relate took ``k * (k - 1) / 2`` clicks.
+``pairwise_matrices`` computes all of them in one pass:
+``streaming_stats.CoMoments`` gives every pair's complete-row count,
+covariance and Pearson r from a few masked matrix products, and
+``correlation_p_values`` turns the whole r matrix into p-values with one
+vectorized t-distribution call.  Spearman correlations are Pearson
+correlations of the columns' ranks.
+
+Missing values are handled pairwise by default (each pair uses the rows where
+both are present, like ``DataFrame.corr``); ``listwise=True`` first drops every
+row with a missing value, so all pairs share the same rows.  With pairwise
+Spearman, pairs whose columns are missing in different rows are re-ranked on
+their complete rows, which keeps the result equal to ``DataFrame.corr``; each
+column is sorted once, so re-ranking a pair only filters that order.
+
+``MatrixCache`` keeps results and heatmaps keyed by a hash of the table's
+numeric columns, so re-running the app or switching views does not recompute
+them.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from streaming_stats import CoMoments, correlation_p_values
+
+MAX_ENTRIES = 16
+METHODS = ("pearson", "spearman")
+
+
+def numeric_digest(frame):
+    """Content hash of ``frame``'s numeric columns (names and values)."""
+    numeric = frame.select_dtypes(include="number")
+    digest = hashlib.blake2b(repr(list(numeric.columns)).encode("utf-8"), digest_size=16)
+    digest.update(pd.util.hash_pandas_object(numeric, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _average_ranks(values):
+    """1-based ranks of already sorted ``values``, ties given their average rank."""
+    starts = np.flatnonzero(np.r_[True, values[1:] != values[:-1]])
+    counts = np.diff(np.r_[starts, len(values)])
+    return np.repeat(starts + (counts + 1) / 2, counts)
+
+
+def _ranks(column, order, keep):
+    """Average ranks of ``column`` over the rows in ``keep``, NaN elsewhere.
+
+    ``order`` is the column's argsort, so a subset of rows is ranked by
+    filtering it rather than sorting again.
+    """
+    rows = order[keep[order]]
+    ranks = np.full(len(column), np.nan)
+    ranks[rows] = _average_ranks(column[rows])
+    return ranks
+
+
+def pairwise_matrices(frame, method="pearson", listwise=False):
+    """Correlation, p-value, pair-count and covariance matrices of ``frame``'s numeric columns.
+
+    Returns ``{"r", "p", "n", "cov"}`` as DataFrames indexed by column name.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown correlation method '{method}' (use {' or '.join(METHODS)})")
+    numeric = frame.select_dtypes(include="number")
+    if listwise:
+        numeric = numeric.dropna()
+    columns = numeric.columns.tolist()
+    block = numeric.to_numpy(dtype=float, na_value=np.nan)
+    moments = CoMoments.of(block)
+    cov = moments.covariance()
+    n = moments.n
+    if method == "pearson":
+        r = moments.correlation()
+    else:
+        present = ~np.isnan(block)
+        order = np.argsort(block, axis=0, kind="stable")
+        ranks = np.empty_like(block)
+        for i in range(len(columns)):
+            ranks[:, i] = _ranks(block[:, i], order[:, i], present[:, i])
+        r = CoMoments.of(ranks).correlation()
+        # A column's ranks over its own rows only match its ranks within a
+        # pair when the other column is present in the same rows; re-rank the
+        # rest on the pair's complete rows.
+        alone = np.diag(n)
+        differs = (n < alone[:, None]) | (n < alone[None, :])
+        for i, j in zip(*np.nonzero(np.triu(differs, 1))):
+            both = present[:, i] & present[:, j]
+            middle = (n[i, j] + 1) / 2  # the mean of ranks 1..n
+            x = _ranks(block[:, i], order[:, i], both)[both] - middle
+            y = _ranks(block[:, j], order[:, j], both)[both] - middle
+            with np.errstate(invalid="ignore", divide="ignore"):
+                r[i, j] = r[j, i] = np.clip(x @ y / np.sqrt((x @ x) * (y @ y)), -1.0, 1.0)
+    return _matrices(columns, r, n, cov)
+
+
+def comoment_matrices(comoments, columns):
+    """Pearson matrices, as ``pairwise_matrices`` returns them, from already accumulated co-moments."""
+    return _matrices(list(columns), comoments.correlation(), comoments.n, comoments.covariance())
+
+
+def _matrices(columns, r, n, cov):
+    with np.errstate(invalid="ignore"):
+        r = np.where(n > 1, r, np.nan)
+    np.fill_diagonal(r, np.where(np.diag(n) > 1, 1.0, np.nan))
+    p = correlation_p_values(r, n)
+    np.fill_diagonal(p, np.where(np.diag(n) > 2, 0.0, np.nan))
+    frame_of = lambda values: pd.DataFrame(values, index=columns, columns=columns)
+    return {"r": frame_of(r), "p": frame_of(p), "n": frame_of(n.astype(int)), "cov": frame_of(cov)}
+
+
+def heatmap(r, p, alpha=0.05):
+    """An altair heatmap of a correlation matrix, labelled with r and starred where p < ``alpha``."""
+    long = r.rename_axis("Variable 1").reset_index().melt("Variable 1", var_name="Variable 2", value_name="r")
+    long["p"] = p.to_numpy().ravel()
+    long["label"] = [
+        "" if np.isnan(value) else f"{value:.2f}{'*' if pv < alpha else ''}"
+        for value, pv in zip(long["r"], long["p"])
+    ]
+    order = list(r.columns)
+    base = alt.Chart(long).encode(
+        x=alt.X("Variable 2:N", sort=order, title=None),
+        y=alt.Y("Variable 1:N", sort=order, title=None),
+    )
+    cells = base.mark_rect().encode(
+        color=alt.Color("r:Q", scale=alt.Scale(scheme="redblue", domain=[-1, 1]), title="r"),
+        tooltip=["Variable 1", "Variable 2", alt.Tooltip("r:Q", format=".4f"), alt.Tooltip("p:Q", format=".4g")],
+    )
+    text = base.mark_text(fontSize=12).encode(
+        text="label:N",
+        color=alt.condition("abs(datum.r) > 0.6", alt.value("white"), alt.value("black")),
+    )
+    size = max(240, 60 * len(order))
+    return (cells + text).properties(width=size, height=size)
+
+
+class MatrixCache:
+    """Matrices and heatmaps by (table digest, method, listwise), least recently used evicted."""
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def get(self, frame, method="pearson", listwise=False):
+        """``(matrices, heatmap)`` for ``frame``, computed only if this table and options are new."""
+        key = (numeric_digest(frame), method, bool(listwise))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry
+            self._stats["misses"] += 1
+        matrices = pairwise_matrices(frame, method, listwise)
+        entry = (matrices, heatmap(matrices["r"], matrices["p"]))
+        with self._lock:
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+
+def get_matrix_cache(session_state):
+    """The session's correlation matrix cache."""
+    if "correlation_matrix_cache" not in session_state:
+        session_state["correlation_matrix_cache"] = MatrixCache()
+    return session_state["correlation_matrix_cache"]
@@ -8,6 +8,9 @@ import streamlit as st
 import pandas as pd
 import os
 
+from excel_formula import cross_check, display_value
+from workbook_cache import load_workbook
+
 st.set_page_config(page_title="Dataset Calculator", page_icon="📊", layout="wide")
 
 st.title("📊 Study-Buddy Dataset Calculator")
@@ -18,7 +21,7 @@ def safe_load(path):
     if not os.path.exists(path):
         st.error(f"File not found: {path}")
         return None
-    return pd.read_excel(path, header=0)
+    return load_workbook(path).values()
 
 def df_to_md(df):
     """Build a markdown table from a DataFrame without needing tabulate."""
@@ -582,19 +585,17 @@ with tab4:
     st.header("CA Lesson 2 Dataset — Q24")
     st.info("⚠️ No spaces in formulas — the automated marker expects `=C6+3` not `=C6 + 3`.")
 
-    import openpyxl as _openpyxl
     from datetime import timedelta as _td, date as _date
 
     _wb4 = None
     if os.path.exists("CA Lesson 2 dataset.xlsx"):
-        _wb4 = _openpyxl.load_workbook("CA Lesson 2 dataset.xlsx")
+        _wb4 = load_workbook("CA Lesson 2 dataset.xlsx")
     else:
         st.error("File not found: CA Lesson 2 dataset.xlsx")
 
     if _wb4:
-        _ws4 = _wb4.active
         _d4 = {}
-        for _row in _ws4.iter_rows(min_row=2, max_row=21, values_only=True):
+        for _row in _wb4.rows[1:21]:
             _oid, _name, _odate, _otime, _oamt = _row
             _d4[_oid] = {"name": _name, "date": _odate, "time": _otime,
                          "amount": _oamt, "row": int(_oid) + 1}
@@ -849,30 +850,22 @@ with tab5:
         "This is the authoritative cross-check for all four exam assignments."
     )
 
-    import openpyxl as _opx
     import pandas as _pd5
     from datetime import timedelta as _td5, date as _date5, time as _time5
 
     def _load_resolved(fname):
-        """Return (ws, df_data) where ws is openpyxl worksheet and df_data
-        is a pandas DataFrame of the first 20 data rows (no formula rows)."""
+        """Return (wb, df_data) where wb is the cached parsed workbook and
+        df_data is a pandas DataFrame of the first 20 data rows (no formula rows)."""
         if not os.path.exists(fname):
             st.error(f"File not found: {fname}")
             return None, None
-        wb = _opx.load_workbook(fname)
-        ws = wb.active
-        df = _pd5.read_excel(fname, header=0, nrows=20)
-        return ws, df
-
-    def _cell_formula(ws, row, col):
-        """Return the formula string stored in a cell, or '' if none.
-        Strips openpyxl's internal _xlfn. prefix on modern Excel functions."""
-        v = ws.cell(row, col).value
-        if v is None:
-            return ""
-        if hasattr(v, "text"):        # ArrayFormula object
-            return "=" + str(v.text).replace("_xlfn.", "")
-        return str(v).replace("_xlfn.", "")
+        wb = load_workbook(fname)
+        return wb, wb.values(nrows=20)
+
+    def _cell_formula(wb, row, col):
+        """Return the formula string stored in a cell, or '' if none,
+        without openpyxl's internal _xlfn. prefix on modern Excel functions."""
+        return wb.formula(row, col)
 
     def _show_solutions(rows):
         """Render a list of dicts {Q, Excel Formula, Python Code, Result} as
@@ -885,6 +878,21 @@ with tab5:
                          "Result":        st.column_config.TextColumn(width="small"),
                      })
 
+    def _show_engine_check(wb):
+        """Evaluate every formula in the resolved workbook with the formula
+        engine and compare each result with the value Excel saved."""
+        _checks = cross_check(wb)
+        _ok = sum(_c["match"] for _c in _checks)
+        with st.expander(f"🧮 Formula engine cross-check — {_ok}/{len(_checks)} formulas "
+                         f"evaluate to Excel's saved results"):
+            st.dataframe(_pd5.DataFrame([{
+                "Cell": _c["cell"],
+                "Excel Formula": _c["formula"],
+                "Evaluated": display_value(_c["value"], like=_c["excel"]),
+                "Excel Result": display_value(_c["excel"]),
+                "Match": "✅" if _c["match"] else "❌",
+            } for _c in _checks]), use_container_width=True, hide_index=True)
+
     st.markdown("---")
 
     # ─── CA Lesson 1 — Q21 ─────────────────────────────────────────────────
@@ -937,6 +945,7 @@ with tab5:
              "Python Code":'df.loc[15, "Product ID"][-3:]', "Result":_r21_8},
         ]
         _show_solutions(_sol1)
+        _show_engine_check(_ws1)
 
         with st.expander("View source data rows 1–21"):
             st.dataframe(_df1[["Date","Product ID","Units Sold","Price per Unit"]],
@@ -996,6 +1005,7 @@ with tab5:
              "Result":str(_r22_9)},
         ]
         _show_solutions(_sol3)
+        _show_engine_check(_ws3)
 
         with st.expander("View source data rows 1–21"):
             st.dataframe(_df3, use_container_width=True)
@@ -1078,6 +1088,7 @@ with tab5:
              "Result":str(_r23_9)},
         ]
         _show_solutions(_sol4)
+        _show_engine_check(_ws4q)
 
         with st.expander("View source data rows 1–21 (+ helper column G = Salary × Bonus%)"):
             _df4q["Bonus Amount (G=D×F)"] = (_df4q["Salary"] * _df4q["Bonus Percentage"]).round(2)
@@ -1095,7 +1106,7 @@ with tab5:
         _df2.index = range(2, 22)
 
         # Q24.1  =C6+A4  (A4 = Order ID 3 = 3)
-        _a4_val = int(_ws2.cell(4, 1).value)  # openpyxl reads A4 as its stored value
+        _a4_val = int(_ws2.cell_value(4, 1))  # A4 as its stored value
         _r24_1 = (_df2.loc[6, "Order Date"] + _pd5.Timedelta(days=_a4_val)).date()
         # Q24.2 IF(D9<TIME(12,0,0),...)
         _t9 = _df2.loc[9, "Order Time"]
@@ -1150,6 +1161,7 @@ with tab5:
              "Result":str(_r24_7)},
         ]
         _show_solutions(_sol2)
+        _show_engine_check(_ws2)
 
         with st.expander("View source data rows 1–21"):
             st.dataframe(_df2[["Order ID","Customer Name","Order Date","Order Time","Order Amount"]],
@@ -0,0 +1,132 @@
+"""Concurrent exam question generation with a per-course prefetch pool.
+
+Courses without a curated exam bank need one ``generate_practice_question``
+call per question.  Those calls used to run one after another when "Start
+Exam" was clicked.  Now:
+
+* ``prefetch_questions`` is called while the exam is being configured and
+  fills a process-wide pool of ready questions per (course, question type) in
+  the background;
+* ``take_questions`` drains that pool first, takes over prefetches still in
+  flight, and generates whatever is missing concurrently.
+
+Every call carries a per-request timeout.  Calls that time out or fail come
+back as error text and are dropped, the same as before.
+"""
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import partial
+
+from study_buddy_core import AI_NOT_CONFIGURED_MESSAGE, generate_practice_question
+
+MAX_CONCURRENT_GENERATIONS = 8
+MAX_CONCURRENT_PREFETCHES = 4
+GENERATION_TIMEOUT = 30  # seconds per request
+PREFETCH_LIMIT = 50  # the largest exam the page offers
+
+_generator = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_GENERATIONS, thread_name_prefix="exam-generate")
+_prefetcher = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PREFETCHES, thread_name_prefix="exam-prefetch")
+_lock = threading.RLock()
+_pools = {}
+
+
+class _QuestionPool:
+    def __init__(self):
+        self.ready = deque()
+        self.pending = set()
+
+
+def _pool(course_code, question_type):
+    return _pools.setdefault((course_code, question_type), _QuestionPool())
+
+
+def is_usable(question):
+    return bool(question) and "Error" not in question and question != AI_NOT_CONFIGURED_MESSAGE
+
+
+def question_plan(question_types, num_questions):
+    """Question type for each slot, cycling through ``question_types``."""
+    question_types = question_types or ["general"]
+    return [question_types[i % len(question_types)] for i in range(num_questions)]
+
+
+def _generate(course, question_type):
+    return generate_practice_question(course, question_type, timeout=GENERATION_TIMEOUT)
+
+
+def _result(future):
+    try:
+        return future.result()
+    except Exception:
+        return None
+
+
+def _store(pool, future):
+    # Done callback for prefetches: keep the question unless a caller claimed it.
+    with _lock:
+        if future not in pool.pending:
+            return
+        pool.pending.discard(future)
+        question = _result(future)
+        if is_usable(question):
+            pool.ready.append(question)
+
+
+def prefetch_questions(course, question_types, num_questions):
+    """Top up the pool so ``num_questions`` questions are ready or being generated."""
+    wanted = {}
+    for question_type in question_plan(question_types, min(num_questions, PREFETCH_LIMIT)):
+        wanted[question_type] = wanted.get(question_type, 0) + 1
+    with _lock:
+        for question_type, count in wanted.items():
+            pool = _pool(course['code'], question_type)
+            for _ in range(count - len(pool.ready) - len(pool.pending)):
+                future = _prefetcher.submit(_generate, course, question_type)
+                pool.pending.add(future)
+                future.add_done_callback(partial(_store, pool))
+
+
+def ready_count(course_code, question_types, num_questions):
+    """How many of the first ``num_questions`` slots the pool can fill right now."""
+    available = {}
+    ready = 0
+    with _lock:
+        for question_type in question_plan(question_types, num_questions):
+            if question_type not in available:
+                available[question_type] = len(_pool(course_code, question_type).ready)
+            if available[question_type]:
+                available[question_type] -= 1
+                ready += 1
+    return ready
+
+
+def take_questions(course, question_types, num_questions):
+    """Return up to ``num_questions`` ``(question_type, question)`` pairs.
+
+    Ready questions come out of the pool.  A prefetch that is still running is
+    claimed and awaited; one still queued is cancelled and resubmitted on the
+    foreground pool so it does not wait behind other prefetches.
+    """
+    plan = question_plan(question_types, num_questions)
+    questions = [None] * len(plan)
+    futures = {}
+    with _lock:
+        for slot, question_type in enumerate(plan):
+            pool = _pool(course['code'], question_type)
+            if pool.ready:
+                questions[slot] = pool.ready.popleft()
+                continue
+            claimed = None
+            while pool.pending and claimed is None:
+                future = pool.pending.pop()
+                if not future.cancel():
+                    claimed = future
+            futures[claimed or _generator.submit(_generate, course, question_type)] = slot
+    wait(futures)
+    for future, slot in futures.items():
+        question = _result(future)
+        if is_usable(question):
+            questions[slot] = question
+    return [(question_type, question) for question_type, question in zip(plan, questions) if question]
@@ -0,0 +1,89 @@
+"""Concurrent grading for the Exam Simulator.
+
+Submitting an exam used to call ``evaluate_answer`` once per question, one after
+another, on every rerun of the results page.  ``grade_concurrently`` runs the
+calls on a bounded thread pool and yields each result as soon as it is ready,
+so grading takes about as long as the slowest call.  The page stores results
+under ``exam_results`` keyed by question index, with a digest of the question
+and answer, and only grades entries that are missing or stale.  A call that
+failed, or could not be made because AI is not configured, is stored as not
+graded with no digest, so the next run grades it again.
+"""
+
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from study_buddy_core import AI_NOT_CONFIGURED_MESSAGE
+
+MAX_CONCURRENT_GRADES = 8
+GRADING_ERROR_PREFIX = "Error evaluating answer:"
+
+
+def split_question(question):
+    """Split generated question text into (question, model answer)."""
+    if "ANSWER:" in question:
+        parts = question.split("ANSWER:")
+        return parts[0].strip(), parts[1].strip() if len(parts) > 1 else ""
+    return question, "Answer not available"
+
+
+def grading_digest(question_text, user_answer):
+    data = f"{question_text}\x00{user_answer}".encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def score_feedback(feedback):
+    # Simple scoring: if feedback is positive, give points
+    return 1 if "correct" in feedback.lower() or "good" in feedback.lower() else 0.5
+
+
+def grading_failed(feedback):
+    """True if ``feedback`` reports a failed or impossible call rather than a grade."""
+    return feedback == AI_NOT_CONFIGURED_MESSAGE or feedback.startswith(GRADING_ERROR_PREFIX)
+
+
+def grade_answer(evaluate, question_text, correct_answer, user_answer):
+    graded = True
+    if user_answer.strip():
+        feedback = evaluate(question_text, correct_answer, user_answer)
+        graded = not grading_failed(feedback)
+        score = score_feedback(feedback) if graded else 0
+    else:
+        feedback = "No answer provided"
+        score = 0
+    return {
+        'question': question_text,
+        'user_answer': user_answer,
+        'correct_answer': correct_answer,
+        'feedback': feedback,
+        'score': score,
+        'graded': graded,
+        'digest': grading_digest(question_text, user_answer) if graded else None,
+    }
+
+
+def grade_concurrently(evaluate, items, max_workers=MAX_CONCURRENT_GRADES):
+    """Grade ``items`` ({key: (question, correct_answer, user_answer)}) in parallel.
+
+    Yields ``(key, result)`` in completion order.  Blank answers are graded
+    inline without a call.  A call that raises is reported as feedback rather
+    than aborting the batch.
+    """
+    calls = {}
+    for key, (question_text, correct_answer, user_answer) in items.items():
+        if user_answer.strip():
+            calls[key] = (question_text, correct_answer, user_answer)
+        else:
+            yield key, grade_answer(evaluate, question_text, correct_answer, user_answer)
+    if not calls:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(calls)))) as pool:
+        futures = {pool.submit(grade_answer, evaluate, *args): key for key, args in calls.items()}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                error = f"{GRADING_ERROR_PREFIX} {str(e)}"
+                result = grade_answer(lambda *_: error, *calls[key])
+            yield key, result
@@ -0,0 +1,1505 @@
+"""Parse and evaluate Excel formulas against a worksheet grid.
+
+The Python Solutions tab shows the formulas the instructor saved in each
+resolved workbook next to a pandas re-implementation written by hand for
+that question.  ``FormulaEngine`` evaluates the formula strings themselves,
+so every formula cell of any workbook can be checked against the result
+Excel saved for it (``cross_check``).
+
+``parse_formula`` turns formula text into a small tuple tree (a recursive
+descent parser with Excel's operator precedence).  The engine keeps the
+sheet as NumPy arrays -- the raw values, a float view (NaN for anything that
+is not a number) and a lower-cased text view -- so a range argument is an
+array slice and the criteria of COUNTIFS/SUMIFS/MAXIFS..., the exact-match
+lookups and the aggregates are whole-array operations rather than loops
+over cells.
+
+Formula cells are evaluated in dependency order: each formula's static
+references (``A1``, ``B2:D21``) give the formula cells it reads, and the
+cells are visited in a topological order of that graph.  OFFSET and
+INDIRECT build references while evaluating; a formula cell they reach
+that has not been computed yet is evaluated on demand.  Cells on a cycle
+evaluate to ``#REF!`` (Excel warns and shows 0 instead).
+
+``set_cells`` applies edits and recalculates incrementally, as Excel does:
+reverse indexes from each cell (and each column's ranges) to the formulas
+naming it give the dirty formulas -- everything downstream of an edit --
+and only those are recomputed, in topological order.  Formulas using
+OFFSET, INDIRECT, TODAY or NOW are volatile and recomputed after any edit.
+
+Dates and times are Excel serial numbers while evaluating, as in Excel:
+dates read from the sheet become serials and ``DATE``/``TIME`` return them.
+"""
+
+import bisect
+import datetime
+import math
+import re
+from decimal import ROUND_DOWN, ROUND_HALF_UP, ROUND_UP, Decimal
+from functools import lru_cache
+from graphlib import CycleError, TopologicalSorter
+
+import numpy as np
+from openpyxl.utils.cell import column_index_from_string, get_column_letter
+from openpyxl.utils.datetime import from_excel, to_excel
+
+MAX_ROWS = 1_048_576
+MAX_COLS = 16_384
+# Functions whose result can change without any cell they name changing.
+_VOLATILE = {"OFFSET", "INDIRECT", "TODAY", "NOW"}
+
+
+class ExcelError(str):
+    """An Excel error value such as ``#N/A``; a string so it displays as Excel shows it."""
+
+
+class FormulaError(Exception):
+    def __init__(self, code):
+        super().__init__(code)
+        self.code = code
+
+
+class Ref:
+    """A rectangular reference, 1-based and inclusive like Excel."""
+
+    __slots__ = ("r1", "c1", "r2", "c2")
+
+    def __init__(self, r1, c1, r2=None, c2=None):
+        self.r1, self.c1 = r1, c1
+        self.r2 = r1 if r2 is None else r2
+        self.c2 = c1 if c2 is None else c2
+
+    @property
+    def shape(self):
+        return self.r2 - self.r1 + 1, self.c2 - self.c1 + 1
+
+    def cells(self):
+        for row in range(self.r1, self.r2 + 1):
+            for col in range(self.c1, self.c2 + 1):
+                yield row, col
+
+    def __repr__(self):
+        start = f"{get_column_letter(self.c1)}{self.r1}"
+        if (self.r1, self.c1) == (self.r2, self.c2):
+            return start
+        return f"{start}:{get_column_letter(self.c2)}{self.r2}"
+
+
+# ── Parsing ──────────────────────────────────────────────────────────────────
+
+_CELL = r"\$?([A-Za-z]{1,3})\$?(\d+)"
+_TOKEN_RE = re.compile(
+    r"""(?P<space>\s+)
+      | (?P<string>"(?:[^"]|"")*")
+      | (?P<error>\#(?:NULL!|DIV/0!|VALUE!|REF!|NAME\?|NUM!|N/A))
+      | (?P<sheet>(?:'(?:[^']|'')+'|[A-Za-z_][\w.]*)!)
+      | (?P<range>{cell}:{cell})
+      | (?P<columns>\$?[A-Za-z]{{1,3}}:\$?[A-Za-z]{{1,3}}(?![\w(]))
+      | (?P<rows>\$?\d+:\$?\d+)
+      | (?P<cell>{cell}(?![\w(]))
+      | (?P<number>(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+      | (?P<function>[A-Za-z_][\w.]*(?=\())
+      | (?P<name>[A-Za-z_][\w.]*)
+      | (?P<op><=|>=|<>|[-+*/^&=<>%(),:])
+    """.format(cell=_CELL),
+    re.VERBOSE,
+)
+_CELL_RE = re.compile(_CELL)
+_COMPARISONS = ("=", "<>", "<", ">", "<=", ">=")
+_NUMPY_COMPARISONS = {
+    "=": np.equal, "<>": np.not_equal, "<": np.less, ">": np.greater, "<=": np.less_equal, ">=": np.greater_equal,
+}
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match:
+            raise FormulaError("#NAME?")
+        position = match.end()
+        kind = match.lastgroup
+        if kind in ("space", "sheet"):  # one sheet per engine: sheet prefixes are dropped
+            continue
+        tokens.append((kind, match.group()))
+    return tokens
+
+
+def _cell_address(text):
+    letters, digits = _CELL_RE.fullmatch(text).groups()
+    return int(digits), column_index_from_string(letters.upper())
+
+
+def parse_reference(text):
+    """A Ref for ``"D15"``, ``"$B$2:D21"``, ``"C:C"`` or ``"2:5"``; FormulaError(#REF!) otherwise."""
+    text = text.strip().split("!")[-1].replace("$", "")
+    try:
+        if ":" in text:
+            start, end = text.split(":")
+            if start.isdigit() and end.isdigit():
+                return Ref(int(start), 1, int(end), MAX_COLS)
+            if start.isalpha() and end.isalpha():
+                return Ref(1, column_index_from_string(start.upper()), MAX_ROWS, column_index_from_string(end.upper()))
+            (r1, c1), (r2, c2) = _cell_address(start), _cell_address(end)
+            return Ref(min(r1, r2), min(c1, c2), max(r1, r2), max(c1, c2))
+        return Ref(*_cell_address(text))
+    except (AttributeError, ValueError):
+        raise FormulaError("#REF!") from None
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self, value=None):
+        kind, text = self.peek()
+        if kind is None or (value is not None and text != value):
+            raise FormulaError("#NAME?")
+        self.position += 1
+        return kind, text
+
+    def expression(self):
+        node = self.concatenation()
+        while self.peek()[1] in _COMPARISONS:
+            operator = self.take()[1]
+            node = ("op", operator, node, self.concatenation())
+        return node
+
+    def concatenation(self):
+        node = self.additive()
+        while self.peek()[1] == "&":
+            self.take()
+            node = ("op", "&", node, self.additive())
+        return node
+
+    def additive(self):
+        node = self.term()
+        while self.peek()[1] in ("+", "-"):
+            operator = self.take()[1]
+            node = ("op", operator, node, self.term())
+        return node
+
+    def term(self):
+        node = self.power()
+        while self.peek()[1] in ("*", "/"):
+            operator = self.take()[1]
+            node = ("op", operator, node, self.power())
+        return node
+
+    def power(self):
+        node = self.unary()
+        while self.peek()[1] == "^":
+            self.take()
+            node = ("op", "^", node, self.unary())
+        return node
+
+    def unary(self):
+        if self.peek()[1] in ("-", "+"):
+            operator = self.take()[1]
+            operand = self.unary()
+            return ("neg", operand) if operator == "-" else operand
+        node = self.primary()
+        while self.peek()[1] == "%":
+            self.take()
+            node = ("percent", node)
+        return node
+
+    def primary(self):
+        kind, text = self.take()
+        if kind == "number":
+            return ("value", float(text) if any(ch in text for ch in ".eE") else int(text))
+        if kind == "string":
+            return ("value", text[1:-1].replace('""', '"'))
+        if kind == "error":
+            return ("value", ExcelError(text))
+        if kind in ("cell", "range", "columns", "rows"):
+            return ("ref", parse_reference(text))
+        if kind == "name":
+            if text.upper() in ("TRUE", "FALSE"):
+                return ("value", text.upper() == "TRUE")
+            return ("value", ExcelError("#NAME?"))
+        if kind == "function":
+            name = text.upper().replace("_XLFN.", "").replace("_XLWS.", "")
+            self.take("(")
+            args = []
+            if self.peek()[1] != ")":
+                while True:
+                    if self.peek()[1] in (",", ")"):
+                        args.append(("value", None))  # omitted argument, e.g. IF(x,,1)
+                    else:
+                        args.append(self.expression())
+                    if self.peek()[1] != ",":
+                        break
+                    self.take(",")
+            self.take(")")
+            return ("call", name, tuple(args))
+        if text == "(":
+            node = self.expression()
+            self.take(")")
+            return node
+        raise FormulaError("#NAME?")
+
+
+@lru_cache(maxsize=4096)
+def parse_formula(text):
+    """Parse ``"=SUM(C2:C21)"`` (the ``=`` is optional) into a tuple tree."""
+    source = text[1:] if text.startswith("=") else text
+    parser = _Parser(_tokenize(source))
+    node = parser.expression()
+    if parser.position != len(parser.tokens):
+        raise FormulaError("#NAME?")
+    return node
+
+
+def references(node):
+    """The Refs a parsed formula names directly (not those OFFSET/INDIRECT build)."""
+    kind = node[0]
+    if kind == "ref":
+        return [node[1]]
+    if kind == "op":
+        return references(node[2]) + references(node[3])
+    if kind in ("neg", "percent"):
+        return references(node[1])
+    if kind == "call":
+        return [ref for arg in node[2] for ref in references(arg)]
+    return []
+
+
+def _function_names(node):
+    if node[0] == "call":
+        yield node[1]
+        for arg in node[2]:
+            yield from _function_names(arg)
+    elif node[0] == "op":
+        yield from _function_names(node[2])
+        yield from _function_names(node[3])
+    elif node[0] in ("neg", "percent"):
+        yield from _function_names(node[1])
+
+
+# ── Values ───────────────────────────────────────────────────────────────────
+
+def to_serial(value):
+    """Excel's number for dates, times and durations; other values unchanged."""
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return to_excel(value)
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds() / 86400
+    return value
+
+
+def _is_number(value):
+    return isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, (bool, np.bool_))
+
+
+def _check(value):
+    if isinstance(value, ExcelError):
+        raise FormulaError(str(value))
+    return value
+
+
+def _number(value):
+    _check(value)
+    if value is None or value == "":
+        return 0
+    if isinstance(value, (bool, np.bool_)):
+        return int(value)
+    if _is_number(value):
+        return value
+    try:
+        return float(str(value).strip())
+    except ValueError:
+        raise FormulaError("#VALUE!") from None
+
+
+def _integer(value):
+    return int(math.floor(_number(value)))
+
+
+def _text(value):
+    _check(value)
+    if value is None:
+        return ""
+    if isinstance(value, (bool, np.bool_)):
+        return "TRUE" if value else "FALSE"
+    if _is_number(value):
+        value = float(value)
+        if value.is_integer() and abs(value) < 1e15:
+            return str(int(value))
+        return f"{value:.15g}"
+    return str(value)
+
+
+def _boolean(value):
+    _check(value)
+    if isinstance(value, str):
+        upper = value.upper()
+        if upper in ("TRUE", "FALSE"):
+            return upper == "TRUE"
+        raise FormulaError("#VALUE!")
+    return bool(_number(value))
+
+
+def _rank(value):
+    # Excel orders numbers < text < booleans; blanks compare as 0 or "".
+    if isinstance(value, (bool, np.bool_)):
+        return 2, bool(value)
+    if isinstance(value, str):
+        return 1, value.lower()
+    return 0, value
+
+
+def _compare(operator, left, right):
+    _check(left)
+    _check(right)
+    if left is None:
+        left = "" if isinstance(right, str) else (False if isinstance(right, bool) else 0)
+    if right is None:
+        right = "" if isinstance(left, str) else (False if isinstance(left, bool) else 0)
+    a, b = _rank(left), _rank(right)
+    return {
+        "=": a == b, "<>": a != b, "<": a < b, ">": a > b, "<=": a <= b, ">=": a >= b,
+    }[operator]
+
+
+def _excel_round(value, digits, rounding=ROUND_HALF_UP):
+    quantum = Decimal(1).scaleb(-digits)
+    return float(Decimal(repr(float(value))).quantize(quantum, rounding=rounding))
+
+
+def values_match(result, expected, tolerance=1e-9):
+    """Whether an evaluated result equals the value Excel saved for the cell."""
+    expected = to_serial(expected)
+    if isinstance(result, ExcelError) or isinstance(expected, ExcelError):
+        return str(result) == str(expected)
+    if expected is None:
+        return result in (None, "", 0)
+    if _is_number(result) and _is_number(expected):
+        return math.isclose(float(result), float(expected), rel_tol=tolerance, abs_tol=tolerance)
+    if isinstance(result, str) and isinstance(expected, str):
+        return result == expected
+    return result == expected
+
+
+def cell_input(text):
+    """What typing ``text`` into a cell stores: None, a number, a boolean, formula text or text."""
+    if text is None:
+        return None
+    text = str(text).strip()
+    if not text:
+        return None
+    if text.startswith("="):
+        return text
+    if text.upper() in ("TRUE", "FALSE"):
+        return text.upper() == "TRUE"
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text[:-1]) / 100 if text.endswith("%") else float(text)
+    except ValueError:
+        return text
+
+
+# ── Engine ───────────────────────────────────────────────────────────────────
+
+_FUNCTIONS = {}
+
+
+def excel_function(*names, refs=False):
+    """Register an Excel function; with ``refs=True`` it receives Refs unread."""
+    def register(fn):
+        for name in names:
+            _FUNCTIONS[name] = (fn, refs)
+        return fn
+    return register
+
+
+class FormulaEngine:
+    def __init__(self, rows, formulas):
+        """``rows``: cell values, ``rows[0]`` being row 1; ``formulas``: ``{(row, col): "=..."}``."""
+        n_rows = max(len(rows), max((r for r, _ in formulas), default=0))
+        n_cols = max(max((len(row) for row in rows), default=0), max((c for _, c in formulas), default=0))
+        grid = [list(row) + [None] * (n_cols - len(row)) for row in rows]
+        grid += [[None] * n_cols for _ in range(n_rows - len(grid))]
+        for row, col in formulas:
+            grid[row - 1][col - 1] = None
+        self.values = np.empty((n_rows, n_cols), dtype=object)
+        self.values[...] = grid
+        self.values = np.frompyfunc(to_serial, 1, 1)(self.values) if self.values.size else self.values
+        self.numbers = np.full((n_rows, n_cols), np.nan)  # NaN where the cell is not a number
+        is_number = np.frompyfunc(_is_number, 1, 1)(self.values).astype(bool)
+        self.numbers[is_number] = self.values[is_number].astype(float)
+        self.errors = np.frompyfunc(lambda value: isinstance(value, ExcelError), 1, 1)(self.values).astype(bool)
+        self.codes = np.full((n_rows, n_cols), -1, dtype=np.int32)  # text cells: id of the lower-cased text
+        is_text = np.frompyfunc(lambda value: isinstance(value, str), 1, 1)(self.values).astype(bool) & ~self.errors
+        self.text_ids = {}  # lower-cased text -> id
+        self.codes[is_text] = [self.text_ids.setdefault(text.lower(), len(self.text_ids)) for text in self.values[is_text]]
+
+        self.formulas = {}
+        self.trees = {}
+        self.refs = {}  # formula cell -> the Refs its formula names
+        self.results = {}
+        self.volatile = set()  # formulas using OFFSET/INDIRECT/TODAY/NOW: recalculated after every edit
+        self._formula_rows = {}  # column -> sorted rows holding formulas
+        self._cell_readers = {}  # (row, col) -> formula cells naming that single cell
+        self._range_readers = {}  # column -> [(r1, r2, formula cell)] for ranges spanning it
+        self._wide_readers = []  # (Ref, formula cell) for whole-row references
+        for cell, text in formulas.items():
+            self._add_formula(cell, text)
+        self._computing = set()
+
+    @classmethod
+    def from_workbook(cls, book):
+        """An engine over a ``workbook_cache.ParsedWorkbook``'s active sheet."""
+        return cls(book.rows, book.formulas)
+
+    def _add_formula(self, cell, text):
+        try:
+            tree = parse_formula(text)
+        except FormulaError as error:
+            tree = ("value", ExcelError(error.code))
+        self.formulas[cell] = text
+        self.trees[cell] = tree
+        self.refs[cell] = references(tree)
+        bisect.insort(self._formula_rows.setdefault(cell[1], []), cell[0])
+        for ref in self.refs[cell]:
+            if ref.shape == (1, 1):
+                self._cell_readers.setdefault((ref.r1, ref.c1), set()).add(cell)
+            elif ref.c2 == MAX_COLS:
+                self._wide_readers.append((ref, cell))
+            else:
+                for col in range(ref.c1, ref.c2 + 1):
+                    self._range_readers.setdefault(col, []).append((ref.r1, ref.r2, cell))
+        if _VOLATILE & set(_function_names(tree)):
+            self.volatile.add(cell)
+
+    def _remove_formula(self, cell):
+        for ref in self.refs.pop(cell):
+            if ref.shape == (1, 1):
+                self._cell_readers[(ref.r1, ref.c1)].discard(cell)
+            elif ref.c2 == MAX_COLS:
+                self._wide_readers.remove((ref, cell))
+            else:
+                for col in range(ref.c1, ref.c2 + 1):
+                    self._range_readers[col].remove((ref.r1, ref.r2, cell))
+        self._formula_rows[cell[1]].remove(cell[0])
+        self.volatile.discard(cell)
+        del self.formulas[cell], self.trees[cell]
+        self.results.pop(cell, None)
+
+    def _store(self, r, c, value):
+        self.values[r, c] = value
+        self.numbers[r, c] = float(value) if _is_number(value) else np.nan
+        self.errors[r, c] = isinstance(value, ExcelError)
+        if isinstance(value, str) and not self.errors[r, c]:
+            self.codes[r, c] = self.text_ids.setdefault(value.lower(), len(self.text_ids))
+        else:
+            self.codes[r, c] = -1
+
+    def _grow(self, n_rows, n_cols):
+        old_rows, old_cols = self.values.shape
+        if n_rows <= old_rows and n_cols <= old_cols:
+            return
+        shape = (max(n_rows, old_rows), max(n_cols, old_cols))
+        for name, fill in (("values", None), ("numbers", np.nan), ("codes", -1), ("errors", False)):
+            old = getattr(self, name)
+            grown = np.full(shape, fill, dtype=old.dtype)
+            grown[:old_rows, :old_cols] = old
+            setattr(self, name, grown)
+
+    def _text_codes(self, predicate):
+        """Ids of the sheet's distinct texts (lower-cased) that satisfy ``predicate``."""
+        return np.array([code for text, code in self.text_ids.items() if predicate(text)], dtype=np.int32)
+
+    def _formula_cells(self, refs):
+        """Formula cells inside ``refs``, found by bisecting each column's formula rows."""
+        cells = set()
+        for ref in refs:
+            for col in range(ref.c1, min(ref.c2, self.values.shape[1]) + 1):
+                rows = self._formula_rows.get(col, [])
+                start = bisect.bisect_left(rows, ref.r1)
+                stop = bisect.bisect_right(rows, ref.r2)
+                cells.update((row, col) for row in rows[start:stop])
+        return cells
+
+    def precedents(self, cell):
+        """Formula cells that the formula in ``cell`` names directly."""
+        return self._formula_cells(self.refs[cell])
+
+    def dependents(self, cell):
+        """Formula cells that name ``cell`` directly, alone or inside a range."""
+        row, col = cell
+        readers = set(self._cell_readers.get(cell, ()))
+        readers.update(reader for r1, r2, reader in self._range_readers.get(col, ()) if r1 <= row <= r2)
+        readers.update(reader for ref, reader in self._wide_readers if ref.r1 <= row <= ref.r2)
+        return readers
+
+    def order(self, cells=None):
+        """``cells`` (default: every formula cell) in dependency order; cycles come last."""
+        cells = set(self.trees) if cells is None else set(cells)
+        sorter = TopologicalSorter({cell: self.precedents(cell) & cells for cell in cells})
+        try:
+            return list(sorter.static_order())
+        except CycleError:
+            return sorted(cells)
+
+    def recalculate(self):
+        """Evaluate every formula cell; returns ``{(row, col): value}``."""
+        self.results = {}
+        for cell in self.order():
+            self._cell_result(cell)
+        return self.results
+
+    def dirty_cells(self, changed):
+        """Formula cells to recompute after ``changed`` cells were edited.
+
+        The changed formula cells themselves, every formula that depends on a
+        changed cell directly or through other formulas, and the volatile
+        formulas with their dependents.
+        """
+        dirty = {cell for cell in changed if cell in self.trees} | self.volatile
+        stack = list(changed) + list(self.volatile)
+        while stack:
+            for reader in self.dependents(stack.pop()):
+                if reader not in dirty:
+                    dirty.add(reader)
+                    stack.append(reader)
+        return dirty
+
+    def set_cells(self, changes):
+        """Apply edits and recalculate only the formula cells they affect.
+
+        ``changes`` maps ``(row, col)`` to a value, or to formula text
+        starting with ``=``.  Returns ``{(row, col): value}`` for the
+        recalculated cells, in the order they were computed.
+        """
+        if not changes:
+            return {}
+        self._grow(max(row for row, _ in changes), max(col for _, col in changes))
+        for cell, value in changes.items():
+            if cell in self.trees:
+                self._remove_formula(cell)
+            if isinstance(value, str) and value.startswith("=") and len(value) > 1:
+                self._add_formula(cell, value)
+                value = None
+            self._store(cell[0] - 1, cell[1] - 1, to_serial(value))
+        dirty = self.dirty_cells(changes)
+        for cell in dirty:
+            self.results.pop(cell, None)
+        return {cell: self._cell_result(cell) for cell in self.order(dirty)}
+
+    def evaluate(self, text):
+        """Evaluate formula text that is not stored in the sheet."""
+        try:
+            return self._scalar(self._eval(parse_formula(text)))
+        except FormulaError as error:
+            return ExcelError(error.code)
+
+    def value(self, row, col):
+        if (row, col) in self.trees:
+            return self._cell_result((row, col))
+        if 1 <= row <= self.values.shape[0] and 1 <= col <= self.values.shape[1]:
+            return self.values[row - 1, col - 1]
+        return None
+
+    def _cell_result(self, cell):
+        if cell in self.results:
+            return self.results[cell]
+        if cell in self._computing:
+            raise FormulaError("#REF!")
+        self._computing.add(cell)
+        try:
+            value = self._scalar(self._eval(self.trees[cell]))
+        except FormulaError as error:
+            value = ExcelError(error.code)
+        finally:
+            self._computing.discard(cell)
+        self.results[cell] = value
+        self._store(cell[0] - 1, cell[1] - 1, value)
+        return value
+
+    # ── reading references ──
+
+    def _ensure(self, ref):
+        for cell in self._formula_cells([ref]):
+            if cell not in self.results:
+                self._cell_result(cell)
+
+    def _clip(self, ref):
+        return Ref(ref.r1, ref.c1, min(ref.r2, self.values.shape[0]), min(ref.c2, self.values.shape[1]))
+
+    def block(self, ref, array=None):
+        """The cells of ``ref`` in ``array`` (default: the values) as a 2-D array.
+
+        A view into the sheet when ``ref`` lies inside it, so callers must not
+        write to it; cells beyond the sheet's edge read as blank.
+        """
+        self._ensure(ref)
+        array = self.values if array is None else array
+        if ref.r2 == MAX_ROWS or ref.c2 == MAX_COLS:  # whole columns or rows: stop where the sheet does
+            ref = Ref(ref.r1, ref.c1,
+                      max(self.values.shape[0], ref.r1) if ref.r2 == MAX_ROWS else ref.r2,
+                      max(self.values.shape[1], ref.c1) if ref.c2 == MAX_COLS else ref.c2)
+        if ref.r2 <= array.shape[0] and ref.c2 <= array.shape[1]:
+            return array[ref.r1 - 1:ref.r2, ref.c1 - 1:ref.c2]
+        fill = {"f": np.nan, "b": False, "i": -1}.get(array.dtype.kind)
+        out = np.full(ref.shape, fill, dtype=array.dtype)
+        clipped = self._clip(ref)
+        if clipped.r2 >= clipped.r1 and clipped.c2 >= clipped.c1:
+            h, w = clipped.shape
+            out[:h, :w] = array[clipped.r1 - 1:clipped.r2, clipped.c1 - 1:clipped.c2]
+        return out
+
+    def _vector(self, ref, array=None):
+        block = self.block(ref, array)
+        if block.shape[0] != 1 and block.shape[1] != 1:
+            raise FormulaError("#N/A")
+        return block.ravel()
+
+    def _scalar(self, value):
+        if isinstance(value, Ref):
+            if value.shape != (1, 1):
+                raise FormulaError("#VALUE!")
+            self._ensure(value)
+            if value.r1 > self.values.shape[0] or value.c1 > self.values.shape[1]:
+                return None
+            return self.values[value.r1 - 1, value.c1 - 1]
+        if isinstance(value, np.ndarray):
+            return value.flat[0] if value.size else None
+        return value
+
+    def _flatten(self, args):
+        """Each argument's values: ranges cell by cell, scalars as given."""
+        for arg in args:
+            if isinstance(arg, Ref):
+                block = self.block(arg)
+                yield from ((value, True) for value in block.ravel())
+            elif isinstance(arg, np.ndarray):
+                yield from ((value, True) for value in arg.ravel())
+            else:
+                yield arg, False
+
+    def numeric(self, args):
+        """Numbers in the arguments as Excel's SUM/AVERAGE/MIN/MAX count them."""
+        parts = []
+        for arg in args:
+            if isinstance(arg, Ref):
+                self._raise_errors(arg)
+                block = self.block(arg, self.numbers).ravel()
+                parts.append(block[~np.isnan(block)])
+            elif isinstance(arg, np.ndarray):
+                parts.append(np.array([float(v) for v in arg.ravel() if _is_number(v)]))
+            elif arg is not None:
+                parts.append(np.array([float(_number(arg))]))
+        return np.concatenate(parts) if parts else np.array([])
+
+    def _raise_errors(self, ref):
+        errors = self.block(ref, self.errors)
+        if errors.any():
+            raise FormulaError(str(self.block(ref)[errors][0]))
+
+    def criteria_mask(self, ref, criterion):
+        """Boolean array over ``ref`` for a COUNTIF-style criterion (``"Sales"``, ``">=2"``)."""
+        criterion = _check(self._scalar(criterion))
+        operator, operand = "=", criterion
+        if isinstance(criterion, str):
+            match = re.match(r"(<=|>=|<>|=|<|>)?(.*)$", criterion, re.DOTALL)
+            operator, operand = match.group(1) or "=", match.group(2)
+            try:
+                operand = float(operand) if operand.strip() else operand
+            except ValueError:
+                pass
+        numbers = self.block(ref, self.numbers)
+        if isinstance(operand, (bool, np.bool_)):
+            values = self.block(ref)
+            equal = np.frompyfunc(lambda v: isinstance(v, bool) and v == operand, 1, 1)(values).astype(bool)
+            return equal if operator == "=" else ~equal
+        if _is_number(operand):
+            mask = _NUMPY_COMPARISONS[operator](numbers, operand)
+            return mask if operator != "<>" else mask | np.isnan(numbers)
+        codes = self.block(ref, self.codes)
+        operand = str(operand).lower()
+        if operand == "":
+            blank = np.equal(self.block(ref), None) | (codes == self.text_ids.get("", -2))
+            return blank if operator == "=" else ~blank
+        if operator in ("=", "<>"):
+            equal = self._text_match(codes, operand)
+            return equal if operator == "=" else ~equal
+        return np.isin(codes, self._text_codes(lambda text: _compare(operator, text, operand)))
+
+    def _text_match(self, codes, text):
+        """Cells among ``codes`` equal to lower-cased ``text``, which may hold wildcards."""
+        if any(ch in text for ch in "*?"):
+            pattern = _wildcard(text)
+            return np.isin(codes, self._text_codes(lambda candidate: pattern.fullmatch(candidate) is not None))
+        return codes == self.text_ids.get(text, -2)
+
+    def match_index(self, value, ref, mode=0, search_last=False):
+        """0-based position of ``value`` in a one-row or one-column range, or None.
+
+        ``mode`` 0 is an exact match (wildcards in text), 1 the largest value
+        not above ``value`` and -1 the smallest not below it, as in XLOOKUP.
+        """
+        value = _check(self._scalar(value))
+        if mode == 0:
+            if isinstance(value, str):
+                hits = np.flatnonzero(self._text_match(self._vector(ref, self.codes), value.lower()))
+            elif _is_number(value):
+                hits = np.flatnonzero(self._vector(ref, self.numbers) == float(value))
+            else:
+                values = self._vector(ref)
+                hits = np.flatnonzero(np.frompyfunc(lambda v: v is value or v == value, 1, 1)(values).astype(bool))
+            if not len(hits):
+                return None
+            return int(hits[-1] if search_last else hits[0])
+        key = _rank(value)
+        best = None
+        for position, item in enumerate(self._vector(ref)):
+            if item is None or isinstance(item, ExcelError) or _rank(item)[0] != key[0]:
+                continue
+            rank = _rank(item)
+            if rank == key:
+                return position
+            if (mode > 0 and rank > key) or (mode < 0 and rank < key):
+                if best is None or (rank < best[0] if mode > 0 else rank > best[0]):
+                    best = (rank, position)
+        return None if best is None else best[1]
+
+    def approximate_index(self, value, ref, descending=False):
+        """Excel's binary search for MATCH/VLOOKUP/LOOKUP approximate matches.
+
+        Assumes the range is sorted, as Excel does; on unsorted data it
+        returns whatever the bisection lands on, which is also what Excel does.
+        """
+        value = _check(self._scalar(value))
+        key = _rank(value)
+        items = [(position, _rank(item)) for position, item in enumerate(self._vector(ref))
+                 if item is not None and not isinstance(item, ExcelError) and _rank(item)[0] == key[0]]
+        low, high = 0, len(items)
+        while low < high:
+            middle = (low + high) // 2
+            if (items[middle][1] >= key) if descending else (items[middle][1] <= key):
+                low = middle + 1
+            else:
+                high = middle
+        return items[low - 1][0] if low else None
+
+    # ── evaluation ──
+
+    def _eval(self, node):
+        kind = node[0]
+        if kind == "value":
+            return node[1]
+        if kind == "ref":
+            return node[1]
+        if kind == "neg":
+            return -_number(self._scalar(self._eval(node[1])))
+        if kind == "percent":
+            return _number(self._scalar(self._eval(node[1]))) / 100
+        if kind == "op":
+            return self._operator(node[1], self._scalar(self._eval(node[2])), self._scalar(self._eval(node[3])))
+        name, arg_nodes = node[1], node[2]
+        special = _SPECIAL_FORMS.get(name)
+        if special:
+            return special(self, arg_nodes)
+        if name not in _FUNCTIONS:
+            raise FormulaError("#NAME?")
+        fn, wants_refs = _FUNCTIONS[name]
+        args = [self._eval(arg) for arg in arg_nodes]
+        if not wants_refs:
+            args = [self._scalar(arg) for arg in args]
+        return fn(self, *args)
+
+    @staticmethod
+    def _operator(operator, left, right):
+        if operator == "&":
+            return _text(left) + _text(right)
+        if operator in _COMPARISONS:
+            return _compare(operator, left, right)
+        a, b = _number(left), _number(right)
+        if operator == "+":
+            return a + b
+        if operator == "-":
+            return a - b
+        if operator == "*":
+            return a * b
+        if operator == "/":
+            if b == 0:
+                raise FormulaError("#DIV/0!")
+            return a / b
+        # Python gives a complex number for a negative base with a fractional exponent.
+        if a < 0 and not float(b).is_integer():
+            raise FormulaError("#NUM!")
+        try:
+            result = float(a) ** b
+        except (OverflowError, ZeroDivisionError, ValueError):
+            raise FormulaError("#NUM!") from None
+        if isinstance(result, complex):
+            raise FormulaError("#NUM!")
+        return result
+
+
+def _wildcard(text):
+    pattern = re.escape(text).replace(r"\*", ".*").replace(r"\?", ".")
+    return re.compile(pattern.replace("~.*", r"\*").replace("~.", r"\?"), re.DOTALL)
+
+
+# ── Functions ────────────────────────────────────────────────────────────────
+
+def _if(engine, args):
+    if not args:
+        raise FormulaError("#VALUE!")
+    condition = _boolean(engine._scalar(engine._eval(args[0])))
+    if condition:
+        return engine._eval(args[1]) if len(args) > 1 else True
+    return engine._eval(args[2]) if len(args) > 2 else False
+
+
+def _iferror(engine, args, codes=None):
+    try:
+        value = engine._eval(args[0])
+        scalar = engine._scalar(value) if not isinstance(value, Ref) or value.shape == (1, 1) else None
+        if isinstance(scalar, ExcelError) and (codes is None or scalar in codes):
+            return engine._eval(args[1])
+        return value
+    except FormulaError as error:
+        if codes is None or error.code in codes:
+            return engine._eval(args[1])
+        raise
+
+
+def _ifs(engine, args):
+    for index in range(0, len(args) - 1, 2):
+        if _boolean(engine._scalar(engine._eval(args[index]))):
+            return engine._eval(args[index + 1])
+    raise FormulaError("#N/A")
+
+
+_SPECIAL_FORMS = {
+    "IF": _if,
+    "IFERROR": _iferror,
+    "IFNA": lambda engine, args: _iferror(engine, args, codes=("#N/A",)),
+    "IFS": _ifs,
+}
+
+
+@excel_function("SUM", refs=True)
+def _sum(engine, *args):
+    return float(engine.numeric(args).sum())
+
+
+@excel_function("AVERAGE", refs=True)
+def _average(engine, *args):
+    numbers = engine.numeric(args)
+    if not len(numbers):
+        raise FormulaError("#DIV/0!")
+    return float(numbers.mean())
+
+
+@excel_function("MIN", refs=True)
+def _min(engine, *args):
+    numbers = engine.numeric(args)
+    return float(numbers.min()) if len(numbers) else 0
+
+
+@excel_function("MAX", refs=True)
+def _max(engine, *args):
+    numbers = engine.numeric(args)
+    return float(numbers.max()) if len(numbers) else 0
+
+
+@excel_function("MEDIAN", refs=True)
+def _median(engine, *args):
+    numbers = engine.numeric(args)
+    if not len(numbers):
+        raise FormulaError("#NUM!")
+    return float(np.median(numbers))
+
+
+@excel_function("PRODUCT", refs=True)
+def _product(engine, *args):
+    return float(np.prod(engine.numeric(args)))
+
+
+@excel_function("COUNT", refs=True)
+def _count(engine, *args):
+    return sum(1 for value, _ in engine._flatten(args) if _is_number(value))
+
+
+@excel_function("COUNTA", refs=True)
+def _counta(engine, *args):
+    return sum(1 for value, from_range in engine._flatten(args) if value is not None or not from_range)
+
+
+@excel_function("COUNTBLANK", refs=True)
+def _countblank(engine, ref):
+    return sum(1 for value in engine.block(ref).ravel() if value is None or value == "")
+
+
+def _masks(engine, pairs):
+    if len(pairs) % 2:
+        raise FormulaError("#VALUE!")
+    mask = None
+    for index in range(0, len(pairs), 2):
+        ref = pairs[index]
+        if not isinstance(ref, Ref):
+            raise FormulaError("#VALUE!")
+        part = engine.criteria_mask(ref, pairs[index + 1])
+        if mask is not None and part.shape != mask.shape:
+            raise FormulaError("#VALUE!")
+        mask = part if mask is None else mask & part
+    return mask
+
+
+def _selected(engine, ref, mask):
+    if ref.shape != mask.shape:
+        ref = Ref(ref.r1, ref.c1, ref.r1 + mask.shape[0] - 1, ref.c1 + mask.shape[1] - 1)
+    numbers = engine.block(ref, engine.numbers)[mask]
+    return numbers[~np.isnan(numbers)]
+
+
+@excel_function("COUNTIF", refs=True)
+def _countif(engine, ref, criterion):
+    return int(engine.criteria_mask(ref, criterion).sum())
+
+
+@excel_function("COUNTIFS", refs=True)
+def _countifs(engine, *pairs):
+    return int(_masks(engine, pairs).sum())
+
+
+@excel_function("SUMIF", refs=True)
+def _sumif(engine, ref, criterion, sum_ref=None):
+    return float(_selected(engine, sum_ref or ref, engine.criteria_mask(ref, criterion)).sum())
+
+
+@excel_function("SUMIFS", refs=True)
+def _sumifs(engine, sum_ref, *pairs):
+    return float(_selected(engine, sum_ref, _masks(engine, pairs)).sum())
+
+
+@excel_function("AVERAGEIF", refs=True)
+def _averageif(engine, ref, criterion, average_ref=None):
+    numbers = _selected(engine, average_ref or ref, engine.criteria_mask(ref, criterion))
+    if not len(numbers):
+        raise FormulaError("#DIV/0!")
+    return float(numbers.mean())
+
+
+@excel_function("AVERAGEIFS", refs=True)
+def _averageifs(engine, average_ref, *pairs):
+    numbers = _selected(engine, average_ref, _masks(engine, pairs))
+    if not len(numbers):
+        raise FormulaError("#DIV/0!")
+    return float(numbers.mean())
+
+
+@excel_function("MAXIFS", refs=True)
+def _maxifs(engine, max_ref, *pairs):
+    numbers = _selected(engine, max_ref, _masks(engine, pairs))
+    return float(numbers.max()) if len(numbers) else 0
+
+
+@excel_function("MINIFS", refs=True)
+def _minifs(engine, min_ref, *pairs):
+    numbers = _selected(engine, min_ref, _masks(engine, pairs))
+    return float(numbers.min()) if len(numbers) else 0
+
+
+@excel_function("SUMPRODUCT", refs=True)
+def _sumproduct(engine, *refs):
+    arrays = []
+    for ref in refs:
+        if not isinstance(ref, Ref):
+            raise FormulaError("#VALUE!")
+        arrays.append(np.nan_to_num(engine.block(ref, engine.numbers)))
+    if any(array.shape != arrays[0].shape for array in arrays):
+        raise FormulaError("#VALUE!")
+    return float(np.sum(np.prod(arrays, axis=0)))
+
+
+# Lookup and reference
+
+def _require_ref(value):
+    if not isinstance(value, Ref):
+        raise FormulaError("#VALUE!")
+    return value
+
+
+@excel_function("MATCH", refs=True)
+def _match(engine, value, ref, match_type=1):
+    ref = _require_ref(ref)
+    match_type = _integer(engine._scalar(match_type)) if match_type is not None else 1
+    if match_type == 0:
+        position = engine.match_index(value, ref)
+    else:
+        position = engine.approximate_index(value, ref, descending=match_type < 0)
+    if position is None:
+        raise FormulaError("#N/A")
+    return position + 1
+
+
+@excel_function("INDEX", refs=True)
+def _index(engine, ref, row=None, col=None):
+    ref = _require_ref(ref)
+    row = _integer(engine._scalar(row)) if row is not None else 0
+    col = _integer(engine._scalar(col)) if col is not None else 0
+    height, width = ref.shape
+    if col == 0 and height == 1 and width > 1:
+        row, col = 1 if row else 0, row
+    if row < 0 or col < 0 or row > height or col > width:
+        raise FormulaError("#REF!")
+    r1, r2 = (ref.r1, ref.r2) if row == 0 else (ref.r1 + row - 1,) * 2
+    c1, c2 = (ref.c1, ref.c2) if col == 0 else (ref.c1 + col - 1,) * 2
+    return Ref(r1, c1, r2, c2)
+
+
+def _table_lookup(engine, value, table, index, approximate, vertical):
+    table = _require_ref(table)
+    index = _integer(engine._scalar(index))
+    approximate = True if approximate is None else _boolean(engine._scalar(approximate))
+    height, width = table.shape
+    if index < 1 or index > (width if vertical else height):
+        raise FormulaError("#REF!")
+    keys = Ref(table.r1, table.c1, table.r2, table.c1) if vertical else Ref(table.r1, table.c1, table.r1, table.c2)
+    position = engine.approximate_index(value, keys) if approximate else engine.match_index(value, keys)
+    if position is None:
+        raise FormulaError("#N/A")
+    if vertical:
+        return Ref(table.r1 + position, table.c1 + index - 1)
+    return Ref(table.r1 + index - 1, table.c1 + position)
+
+
+@excel_function("VLOOKUP", refs=True)
+def _vlookup(engine, value, table, col, approximate=None):
+    return _table_lookup(engine, value, table, col, approximate, vertical=True)
+
+
+@excel_function("HLOOKUP", refs=True)
+def _hlookup(engine, value, table, row, approximate=None):
+    return _table_lookup(engine, value, table, row, approximate, vertical=False)
+
+
+def _pick(lookup, result, position):
+    """The cells of ``result`` at ``position`` along ``lookup``'s direction."""
+    if lookup.shape[1] == 1:
+        return Ref(result.r1 + position, result.c1, result.r1 + position, result.c2)
+    return Ref(result.r1, result.c1 + position, result.r2, result.c1 + position)
+
+
+@excel_function("LOOKUP", refs=True)
+def _lookup(engine, value, lookup, result=None):
+    lookup = _require_ref(lookup)
+    if result is None:
+        height, width = lookup.shape
+        if width > height:
+            result = Ref(lookup.r2, lookup.c1, lookup.r2, lookup.c2)
+            lookup = Ref(lookup.r1, lookup.c1, lookup.r1, lookup.c2)
+        else:
+            result = Ref(lookup.r1, lookup.c2, lookup.r2, lookup.c2)
+            lookup = Ref(lookup.r1, lookup.c1, lookup.r2, lookup.c1)
+    result = _require_ref(result)
+    position = engine.approximate_index(value, lookup)
+    if position is None:
+        raise FormulaError("#N/A")
+    height, width = result.shape
+    if height == 1:
+        return Ref(result.r1, result.c1 + position)
+    return Ref(result.r1 + position, result.c1)
+
+
+@excel_function("XLOOKUP", refs=True)
+def _xlookup(engine, value, lookup, result, if_not_found=None, match_mode=0, search_mode=1):
+    lookup, result = _require_ref(lookup), _require_ref(result)
+    match_mode = _integer(engine._scalar(match_mode)) if match_mode is not None else 0
+    search_mode = _integer(engine._scalar(search_mode)) if search_mode is not None else 1
+    if match_mode in (0, 2):
+        position = engine.match_index(value, lookup, search_last=search_mode == -1)
+    else:
+        position = engine.match_index(value, lookup, mode=match_mode)
+    if position is None:
+        if if_not_found is not None:
+            return if_not_found
+        raise FormulaError("#N/A")
+    return _pick(lookup, result, position)
+
+
+@excel_function("OFFSET", refs=True)
+def _offset(engine, ref, rows, cols, height=None, width=None):
+    ref = _require_ref(ref)
+    rows, cols = _integer(engine._scalar(rows)), _integer(engine._scalar(cols))
+    height = _integer(engine._scalar(height)) if height is not None else ref.shape[0]
+    width = _integer(engine._scalar(width)) if width is not None else ref.shape[1]
+    r1, c1 = ref.r1 + rows, ref.c1 + cols
+    if r1 < 1 or c1 < 1 or height < 1 or width < 1:
+        raise FormulaError("#REF!")
+    return Ref(r1, c1, r1 + height - 1, c1 + width - 1)
+
+
+@excel_function("INDIRECT")
+def _indirect(engine, text, a1=True):
+    if a1 is not None and not _boolean(a1):
+        raise FormulaError("#REF!")
+    return parse_reference(_text(text))
+
+
+@excel_function("ROW", refs=True)
+def _row(engine, ref=None):
+    return _require_ref(ref).r1
+
+
+@excel_function("COLUMN", refs=True)
+def _column(engine, ref=None):
+    return _require_ref(ref).c1
+
+
+@excel_function("ROWS", refs=True)
+def _rows(engine, ref):
+    return _require_ref(ref).shape[0]
+
+
+@excel_function("COLUMNS", refs=True)
+def _columns(engine, ref):
+    return _require_ref(ref).shape[1]
+
+
+# Logic
+
+@excel_function("AND", refs=True)
+def _and(engine, *args):
+    values = [value for value, from_range in engine._flatten(args) if not from_range or value is not None]
+    return all(_boolean(value) for value in values)
+
+
+@excel_function("OR", refs=True)
+def _or(engine, *args):
+    values = [value for value, from_range in engine._flatten(args) if not from_range or value is not None]
+    return any(_boolean(value) for value in values)
+
+
+@excel_function("NOT")
+def _not(engine, value):
+    return not _boolean(value)
+
+
+@excel_function("TRUE")
+def _true(engine):
+    return True
+
+
+@excel_function("FALSE")
+def _false(engine):
+    return False
+
+
+@excel_function("ISBLANK")
+def _isblank(engine, value):
+    return value is None
+
+
+@excel_function("ISNUMBER")
+def _isnumber(engine, value):
+    return _is_number(value)
+
+
+@excel_function("ISTEXT")
+def _istext(engine, value):
+    return isinstance(value, str) and not isinstance(value, ExcelError)
+
+
+@excel_function("ISERROR")
+def _iserror(engine, value):
+    return isinstance(value, ExcelError)
+
+
+# Text
+
+@excel_function("CONCAT", refs=True)
+def _concat(engine, *args):
+    return "".join(_text(value) for value, _ in engine._flatten(args))
+
+
+@excel_function("CONCATENATE")
+def _concatenate(engine, *args):
+    return "".join(_text(value) for value in args)
+
+
+@excel_function("TEXTJOIN", refs=True)
+def _textjoin(engine, delimiter, ignore_empty, *args):
+    skip = _boolean(engine._scalar(ignore_empty))
+    parts = [_text(value) for value, _ in engine._flatten(args)]
+    return _text(engine._scalar(delimiter)).join(part for part in parts if part or not skip)
+
+
+@excel_function("LEFT")
+def _left(engine, text, count=1):
+    count = _integer(count if count is not None else 1)
+    if count < 0:
+        raise FormulaError("#VALUE!")
+    return _text(text)[:count]
+
+
+@excel_function("RIGHT")
+def _right(engine, text, count=1):
+    count = _integer(count if count is not None else 1)
+    if count < 0:
+        raise FormulaError("#VALUE!")
+    return _text(text)[-count:] if count else ""
+
+
+@excel_function("MID")
+def _mid(engine, text, start, count):
+    start, count = _integer(start), _integer(count)
+    if start < 1 or count < 0:
+        raise FormulaError("#VALUE!")
+    return _text(text)[start - 1:start - 1 + count]
+
+
+@excel_function("LEN")
+def _len(engine, text):
+    return len(_text(text))
+
+
+@excel_function("FIND")
+def _find(engine, needle, haystack, start=1):
+    start = _integer(start if start is not None else 1)
+    position = _text(haystack).find(_text(needle), start - 1)
+    if start < 1 or position < 0:
+        raise FormulaError("#VALUE!")
+    return position + 1
+
+
+@excel_function("SEARCH")
+def _search(engine, needle, haystack, start=1):
+    start = _integer(start if start is not None else 1)
+    match = _wildcard(_text(needle).lower()).search(_text(haystack).lower(), start - 1)
+    if start < 1 or match is None:
+        raise FormulaError("#VALUE!")
+    return match.start() + 1
+
+
+@excel_function("UPPER")
+def _upper(engine, text):
+    return _text(text).upper()
+
+
+@excel_function("LOWER")
+def _lower(engine, text):
+    return _text(text).lower()
+
+
+@excel_function("PROPER")
+def _proper(engine, text):
+    return _text(text).title()
+
+
+@excel_function("TRIM")
+def _trim(engine, text):
+    return re.sub(" +", " ", _text(text)).strip(" ")
+
+
+@excel_function("SUBSTITUTE")
+def _substitute(engine, text, old, new, instance=None):
+    text, old, new = _text(text), _text(old), _text(new)
+    if instance is None:
+        return text.replace(old, new)
+    instance = _integer(instance)
+    position = -1
+    for _ in range(instance):
+        position = text.find(old, position + 1)
+        if position < 0:
+            return text
+    return text[:position] + new + text[position + len(old):]
+
+
+@excel_function("REPT")
+def _rept(engine, text, count):
+    return _text(text) * max(_integer(count), 0)
+
+
+@excel_function("EXACT")
+def _exact(engine, left, right):
+    return _text(left) == _text(right)
+
+
+@excel_function("VALUE")
+def _value(engine, text):
+    return _number(text)
+
+
+# Math
+
+@excel_function("ROUND")
+def _round(engine, value, digits=0):
+    return _excel_round(_number(value), _integer(digits if digits is not None else 0))
+
+
+@excel_function("ROUNDUP")
+def _roundup(engine, value, digits=0):
+    return _excel_round(_number(value), _integer(digits if digits is not None else 0), ROUND_UP)
+
+
+@excel_function("ROUNDDOWN")
+def _rounddown(engine, value, digits=0):
+    return _excel_round(_number(value), _integer(digits if digits is not None else 0), ROUND_DOWN)
+
+
+@excel_function("INT")
+def _int(engine, value):
+    return math.floor(_number(value))
+
+
+@excel_function("ABS")
+def _abs(engine, value):
+    return abs(_number(value))
+
+
+@excel_function("MOD")
+def _mod(engine, value, divisor):
+    divisor = _number(divisor)
+    if divisor == 0:
+        raise FormulaError("#DIV/0!")
+    return _number(value) - divisor * math.floor(_number(value) / divisor)
+
+
+@excel_function("POWER")
+def _power(engine, base, exponent):
+    return FormulaEngine._operator("^", base, exponent)
+
+
+@excel_function("SQRT")
+def _sqrt(engine, value):
+    value = _number(value)
+    if value < 0:
+        raise FormulaError("#NUM!")
+    return math.sqrt(value)
+
+
+# Dates and times (serial numbers)
+
+@excel_function("DATE")
+def _date(engine, year, month, day):
+    year, month, day = _integer(year), _integer(month), _integer(day)
+    if 0 <= year < 1900:
+        year += 1900
+    year += (month - 1) // 12
+    month = (month - 1) % 12 + 1
+    try:
+        return to_excel(datetime.datetime(year, month, 1) + datetime.timedelta(days=day - 1))
+    except (OverflowError, ValueError):
+        raise FormulaError("#NUM!") from None
+
+
+@excel_function("TIME")
+def _time(engine, hour, minute, second):
+    seconds = _integer(hour) * 3600 + _integer(minute) * 60 + _integer(second)
+    if seconds < 0:
+        raise FormulaError("#NUM!")
+    return (seconds % 86400) / 86400
+
+
+def _datetime(serial):
+    try:
+        return from_excel(_number(serial))
+    except (OverflowError, ValueError, TypeError):
+        raise FormulaError("#NUM!") from None
+
+
+@excel_function("YEAR")
+def _year(engine, serial):
+    return _datetime(serial).year
+
+
+@excel_function("MONTH")
+def _month(engine, serial):
+    return _datetime(serial).month
+
+
+@excel_function("DAY")
+def _day(engine, serial):
+    return _datetime(serial).day
+
+
+@excel_function("WEEKDAY")
+def _weekday(engine, serial, kind=1):
+    weekday = _datetime(serial).isoweekday()  # Monday=1 .. Sunday=7
+    kind = _integer(kind if kind is not None else 1)
+    if kind == 2:
+        return weekday
+    if kind == 3:
+        return weekday - 1
+    return weekday % 7 + 1
+
+
+def _seconds(serial):
+    return round((_number(serial) % 1) * 86400)
+
+
+@excel_function("HOUR")
+def _hour(engine, serial):
+    return _seconds(serial) // 3600 % 24
+
+
+@excel_function("MINUTE")
+def _minute(engine, serial):
+    return _seconds(serial) // 60 % 60
+
+
+@excel_function("SECOND")
+def _second(engine, serial):
+    return _seconds(serial) % 60
+
+
+@excel_function("TODAY")
+def _today(engine):
+    return to_excel(datetime.datetime.combine(datetime.date.today(), datetime.time()))
+
+
+@excel_function("NOW")
+def _now(engine):
+    return to_excel(datetime.datetime.now())
+
+
+# ── Cross-checking a workbook ────────────────────────────────────────────────
+
+def display_value(value, like=None):
+    """``value`` shown the way the cell Excel saved (``like``) is: serials as dates or times."""
+    if _is_number(value) and isinstance(like, (datetime.datetime, datetime.date, datetime.time, datetime.timedelta)):
+        if isinstance(like, datetime.timedelta):
+            return str(datetime.timedelta(days=float(value)))
+        converted = from_excel(float(value))
+        return str(converted.time() if isinstance(like, datetime.time) else converted)
+    if _is_number(value) and float(value).is_integer():
+        return str(int(value))
+    if value is None:
+        return ""
+    return _text(value) if not isinstance(value, str) else value
+
+
+def cross_check(book):
+    """Evaluate every formula of a ParsedWorkbook and compare with Excel's saved results.
+
+    Returns one dict per formula cell, in sheet order: ``cell``, ``formula``,
+    ``value`` (the evaluated result), ``excel`` (the saved result) and ``match``.
+    """
+    engine = FormulaEngine.from_workbook(book)
+    results = engine.recalculate()
+    checks = []
+    for row, col in sorted(book.formulas, key=lambda cell: (cell[0], cell[1])):
+        value = results.get((row, col))
+        excel = book.cached_value(row, col)
+        checks.append({
+            "cell": f"{get_column_letter(col)}{row}",
+            "formula": book.formulas[(row, col)],
+            "value": value,
+            "excel": excel,
+            "match": values_match(value, excel),
+        })
+    return checks
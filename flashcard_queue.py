@@ -0,0 +1,104 @@
+"""Due-date index for flashcard reviews.
+
+The Flashcards page used to scan every card and parse its ``next_review`` on
+each rerun.  ReviewQueue keeps one sorted list of ``(due_timestamp, card_id)``
+per course plus one for all courses, so the number of due cards and the n-th
+due card are found with a binary search.  Cards without a parseable
+``next_review`` sort first and are always due, as before.
+
+The queue lives in session state next to ``flashcards``.  Code that changes a
+card's schedule, adds or deletes cards calls ``upsert``/``remove``;
+``get_review_queue`` rebuilds it if the deck size no longer matches.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime
+
+ALL_COURSES = object()
+_ALWAYS_DUE = float("-inf")
+
+
+def due_timestamp(card):
+    next_review = card.get("next_review")
+    if not next_review:
+        return _ALWAYS_DUE
+    try:
+        return datetime.fromisoformat(next_review).timestamp()
+    except (TypeError, ValueError):
+        return _ALWAYS_DUE
+
+
+class ReviewQueue:
+    def __init__(self, cards=None):
+        self._by_course = {ALL_COURSES: []}
+        self._keys = {}
+        if cards:
+            self.rebuild(cards)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, card_id):
+        return card_id in self._keys
+
+    def rebuild(self, cards):
+        by_course = {ALL_COURSES: []}
+        keys = {}
+        for card_id, card in cards.items():
+            due = due_timestamp(card)
+            course = card.get("course")
+            keys[card_id] = (due, course)
+            by_course[ALL_COURSES].append((due, card_id))
+            by_course.setdefault(course, []).append((due, card_id))
+        for entries in by_course.values():
+            entries.sort()
+        self._by_course = by_course
+        self._keys = keys
+
+    def upsert(self, card_id, card):
+        self.remove(card_id)
+        due = due_timestamp(card)
+        course = card.get("course")
+        self._keys[card_id] = (due, course)
+        insort(self._by_course[ALL_COURSES], (due, card_id))
+        insort(self._by_course.setdefault(course, []), (due, card_id))
+
+    def remove(self, card_id):
+        key = self._keys.pop(card_id, None)
+        if key is None:
+            return
+        due, course = key
+        for entries in (self._by_course[ALL_COURSES], self._by_course.get(course, [])):
+            idx = bisect_left(entries, (due, card_id))
+            if idx < len(entries) and entries[idx] == (due, card_id):
+                del entries[idx]
+
+    def _entries(self, course):
+        return self._by_course.get(course, [])
+
+    def due_count(self, course=ALL_COURSES, now=None):
+        now_ts = (now or datetime.now()).timestamp()
+        return bisect_right(self._entries(course), (now_ts, "\uffff"))
+
+    def due_card_id(self, index, course=ALL_COURSES, now=None):
+        """Return the id of the ``index``-th due card (earliest due first), or None."""
+        count = self.due_count(course, now)
+        if not count:
+            return None
+        return self._entries(course)[index % count][1]
+
+    def next_due(self, course=ALL_COURSES, now=None):
+        return self.due_card_id(0, course, now)
+
+    def due_card_ids(self, course=ALL_COURSES, now=None):
+        entries = self._entries(course)
+        return [card_id for _, card_id in entries[:self.due_count(course, now)]]
+
+
+def get_review_queue(session_state):
+    cards = session_state.get("flashcards", {})
+    queue = session_state.get("flashcard_queue")
+    if not isinstance(queue, ReviewQueue) or len(queue) != len(cards):
+        queue = ReviewQueue(cards)
+        session_state["flashcard_queue"] = queue
+    return queue
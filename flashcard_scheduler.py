@@ -0,0 +1,265 @@
+"""Spaced-repetition scheduling on NumPy arrays.
+
+A deck is held as parallel arrays (interval, repetitions, ease factor, due day,
+plus FSRS stability/difficulty), so a batch of reviews or a whole simulated day
+is a handful of vectorized operations instead of a Python loop per card.
+
+Two algorithms are available:
+
+``"sm2"``
+    The rules the Flashcards page has always used (Again/Hard/Good/Easy with an
+    ease factor floor of 1.3).
+``"fsrs"``
+    FSRS-4.5 with its published default weights.  Intervals target a 90%
+    probability of recall.
+
+``simulate_workload`` replays the deck forward day by day and returns how many
+reviews fall due each day, which is what the workload forecast charts.
+"""
+
+from datetime import datetime
+
+import numpy as np
+
+GRADES = {"Again": 0, "Hard": 1, "Good": 2, "Easy": 3}
+ALGORITHMS = ("sm2", "fsrs")
+
+SECONDS_PER_DAY = 86400.0
+MIN_EASE = 1.3
+
+FSRS_WEIGHTS = np.array([
+    0.4872, 1.4003, 3.7145, 13.8206, 5.1618, 1.2298, 0.8975, 0.031, 1.6474,
+    0.1367, 1.0461, 2.1072, 0.0793, 0.3246, 1.587, 0.2272, 2.8755,
+])
+FSRS_DECAY = -0.5
+FSRS_FACTOR = 19.0 / 81.0
+DESIRED_RETENTION = 0.9
+
+# Grade mix assumed for remembered cards in simulations (Hard, Good, Easy).
+DEFAULT_RECALL_GRADE_MIX = (0.15, 0.7, 0.15)
+# SM-2 has no recall model, so simulations use a fixed lapse rate.
+DEFAULT_SM2_LAPSE_RATE = 0.1
+
+
+def to_day(value):
+    """ISO timestamp (or datetime) -> fractional days since the epoch; None if unparseable."""
+    if isinstance(value, datetime):
+        return value.timestamp() / SECONDS_PER_DAY
+    try:
+        return datetime.fromisoformat(value).timestamp() / SECONDS_PER_DAY
+    except (TypeError, ValueError):
+        return None
+
+
+class DeckState:
+    def __init__(self, card_ids, interval, repetitions, ease_factor, due, stability, difficulty, last_review):
+        self.card_ids = list(card_ids)
+        self.interval = interval
+        self.repetitions = repetitions
+        self.ease_factor = ease_factor
+        self.due = due
+        self.stability = stability
+        self.difficulty = difficulty
+        self.last_review = last_review
+
+    def __len__(self):
+        return len(self.card_ids)
+
+    @classmethod
+    def from_cards(cls, cards, now=None):
+        today = to_day(now or datetime.now())
+        ids = list(cards)
+        n = len(ids)
+        interval = np.ones(n)
+        repetitions = np.zeros(n, dtype=np.int64)
+        ease = np.full(n, 2.5)
+        due = np.full(n, today)
+        stability = np.zeros(n)
+        difficulty = np.zeros(n)
+        last_review = np.full(n, np.nan)
+        for i, card_id in enumerate(ids):
+            card = cards[card_id]
+            interval[i] = card.get("interval", 1) or 1
+            repetitions[i] = card.get("repetitions", 0) or 0
+            ease[i] = card.get("ease_factor", 2.5) or 2.5
+            day = to_day(card.get("next_review"))
+            if day is not None:
+                due[i] = day
+            stability[i] = card.get("stability", 0.0) or 0.0
+            difficulty[i] = card.get("difficulty", 0.0) or 0.0
+            reviewed = to_day(card.get("last_reviewed"))
+            if reviewed is not None:
+                last_review[i] = reviewed
+        return cls(ids, interval, repetitions, ease, due, stability, difficulty, last_review)
+
+    def copy(self):
+        return DeckState(
+            self.card_ids, self.interval.copy(), self.repetitions.copy(), self.ease_factor.copy(),
+            self.due.copy(), self.stability.copy(), self.difficulty.copy(), self.last_review.copy(),
+        )
+
+    def card_update(self, i):
+        """Fields to write back into the card dict at row ``i``."""
+        update = {
+            "interval": float(self.interval[i]) if self.interval[i] % 1 else int(self.interval[i]),
+            "repetitions": int(self.repetitions[i]),
+            "ease_factor": float(self.ease_factor[i]),
+            "next_review": datetime.fromtimestamp(self.due[i] * SECONDS_PER_DAY).isoformat(),
+        }
+        if self.stability[i] > 0:
+            update["stability"] = float(self.stability[i])
+            update["difficulty"] = float(self.difficulty[i])
+        return update
+
+
+# ── SM-2 ─────────────────────────────────────────────────────────────────────
+def sm2_step(interval, repetitions, ease, grades):
+    """Vectorized version of the Flashcards page SM-2 rules. Returns new arrays."""
+    again = grades == GRADES["Again"]
+    hard = grades == GRADES["Hard"]
+    good = grades == GRADES["Good"]
+    easy = grades == GRADES["Easy"]
+
+    good_interval = np.where(repetitions == 0, 1.0, np.where(repetitions == 1, 6.0, np.floor(interval * ease)))
+    new_interval = np.select(
+        [again, hard, good, easy],
+        [np.ones_like(interval), np.maximum(1.0, interval * 1.2), good_interval, np.floor(interval * ease * 1.3)],
+        interval,
+    )
+    new_repetitions = np.where(again, 0, np.where(good | easy, repetitions + 1, repetitions))
+    new_ease = np.select(
+        [again, hard, easy],
+        [np.maximum(MIN_EASE, ease - 0.2), np.maximum(MIN_EASE, ease - 0.15), ease + 0.15],
+        ease,
+    )
+    return new_interval, new_repetitions, new_ease
+
+
+# ── FSRS-4.5 ─────────────────────────────────────────────────────────────────
+def fsrs_retrievability(elapsed_days, stability):
+    safe = np.maximum(stability, 1e-6)
+    return np.power(1.0 + FSRS_FACTOR * np.maximum(elapsed_days, 0.0) / safe, FSRS_DECAY)
+
+
+def fsrs_interval(stability, retention=DESIRED_RETENTION):
+    return np.maximum(1.0, np.round(stability / FSRS_FACTOR * (retention ** (1.0 / FSRS_DECAY) - 1.0)))
+
+
+def _fsrs_initial_difficulty(rating):
+    w = FSRS_WEIGHTS
+    return np.clip(w[4] - w[5] * (rating - 3), 1.0, 10.0)
+
+
+def fsrs_step(stability, difficulty, elapsed_days, grades):
+    """One FSRS-4.5 review for each card. ``grades`` uses GRADES (0..3).
+
+    Difficulty reverts towards D0(3) = w[4], the FSRS-4.5 target (FSRS-5
+    moved it to D0(4), which these weights were not fitted for).
+    """
+    w = FSRS_WEIGHTS
+    rating = grades + 1
+    new_card = stability <= 0
+
+    init_stability = w[np.clip(rating - 1, 0, 3)]
+    init_difficulty = _fsrs_initial_difficulty(rating)
+
+    r = fsrs_retrievability(elapsed_days, stability)
+    next_difficulty = difficulty - w[6] * (rating - 3)
+    next_difficulty = w[7] * w[4] + (1 - w[7]) * next_difficulty
+    next_difficulty = np.clip(next_difficulty, 1.0, 10.0)
+
+    safe_s = np.maximum(stability, 1e-6)
+    hard_penalty = np.where(rating == 2, w[15], 1.0)
+    easy_bonus = np.where(rating == 4, w[16], 1.0)
+    recall_s = safe_s * (
+        np.exp(w[8]) * (11 - difficulty) * np.power(safe_s, -w[9]) * (np.exp(w[10] * (1 - r)) - 1)
+        * hard_penalty * easy_bonus + 1
+    )
+    forget_s = w[11] * np.power(np.maximum(difficulty, 1.0), -w[12]) * (np.power(safe_s + 1, w[13]) - 1) * np.exp(w[14] * (1 - r))
+    reviewed_s = np.where(rating == 1, np.minimum(forget_s, safe_s), recall_s)
+
+    new_stability = np.where(new_card, init_stability, reviewed_s)
+    new_difficulty = np.where(new_card, init_difficulty, next_difficulty)
+    return new_stability, new_difficulty
+
+
+# ── batch review ─────────────────────────────────────────────────────────────
+def review_batch(state, rows, grades, now=None, algorithm="sm2"):
+    """Apply reviews to ``rows`` of ``state`` in place.
+
+    ``grades`` is an array of GRADES values (or grade names) aligned with ``rows``.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    grades = np.asarray([GRADES[g] if isinstance(g, str) else g for g in np.atleast_1d(grades)], dtype=np.int64)
+    today = to_day(now or datetime.now())
+    _apply(state, rows, grades, today, algorithm)
+
+
+def _apply(state, rows, grades, today, algorithm):
+    if algorithm == "sm2":
+        interval, repetitions, ease = sm2_step(
+            state.interval[rows], state.repetitions[rows], state.ease_factor[rows], grades
+        )
+        state.ease_factor[rows] = ease
+    elif algorithm == "fsrs":
+        last = state.last_review[rows]
+        elapsed = np.where(np.isnan(last), 0.0, today - last)
+        stability, difficulty = fsrs_step(state.stability[rows], state.difficulty[rows], elapsed, grades)
+        state.stability[rows] = stability
+        state.difficulty[rows] = difficulty
+        interval = fsrs_interval(stability)
+        repetitions = np.where(grades == GRADES["Again"], 0, state.repetitions[rows] + 1)
+    else:
+        raise ValueError(f"Unknown algorithm: {algorithm!r}")
+    state.interval[rows] = interval
+    state.repetitions[rows] = repetitions
+    state.last_review[rows] = today
+    state.due[rows] = today + interval
+
+
+def review_card(card, difficulty, now=None, algorithm="sm2"):
+    """Schedule one card dict; returns the fields to update on it."""
+    now = now or datetime.now()
+    state = DeckState.from_cards({"card": card}, now=now)
+    review_batch(state, [0], [difficulty], now=now, algorithm=algorithm)
+    update = state.card_update(0)
+    update["last_reviewed"] = now.isoformat()
+    return update
+
+
+# ── simulation ───────────────────────────────────────────────────────────────
+def simulate_workload(state, days, algorithm="sm2", start=None, seed=0,
+                      recall_grade_mix=DEFAULT_RECALL_GRADE_MIX, sm2_lapse_rate=DEFAULT_SM2_LAPSE_RATE):
+    """Forecast how many reviews fall due on each of the next ``days`` days.
+
+    Every card due on a day is reviewed that day.  With FSRS a card is forgotten
+    with probability 1 - retrievability; with SM-2 at ``sm2_lapse_rate``.
+    Remembered cards are graded Hard/Good/Easy by ``recall_grade_mix``.
+    ``state`` is not modified.  Returns an int array of length ``days``.
+    """
+    sim = state.copy()
+    rng = np.random.default_rng(seed)
+    first_day = np.floor(to_day(start or datetime.now()))
+    # Anything already overdue is reviewed on the first simulated day.
+    sim.due = np.maximum(sim.due, first_day)
+    mix = np.asarray(recall_grade_mix, dtype=float)
+    mix = np.cumsum(mix / mix.sum())
+
+    counts = np.zeros(days, dtype=np.int64)
+    for d in range(days):
+        day = first_day + d
+        rows = np.flatnonzero(sim.due < day + 1)
+        counts[d] = rows.size
+        if not rows.size:
+            continue
+        if algorithm == "fsrs":
+            last = sim.last_review[rows]
+            elapsed = np.where(np.isnan(last), 0.0, day - last)
+            p_forget = np.where(sim.stability[rows] > 0, 1.0 - fsrs_retrievability(elapsed, sim.stability[rows]), 0.0)
+        else:
+            p_forget = np.full(rows.size, sm2_lapse_rate)
+        draws = rng.random((2, rows.size))
+        grades = 1 + np.searchsorted(mix, draws[1], side="right").clip(0, 2)
+        grades = np.where(draws[0] < p_forget, GRADES["Again"], grades)
+        _apply(sim, rows, grades, day, algorithm)
+    return counts
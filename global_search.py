@@ -0,0 +1,178 @@
+"""Search across every kind of study content from one box.
+
+Training Center lessons, Learn & Practice lessons, curated flashcards and the
+Formula Reference are fixed for the life of the process, so they share one
+``TextIndex`` built on first use.  Code snippets and study notes belong to the
+session: snippets get a small index of their own that is brought up to date
+from ``code_snippets`` on each search, and notes reuse the Study Notes index.
+
+Every hit carries the page it lives on and the widget state that opens it
+there; ``jump_to`` applies that state, so it is meant to run as a button
+callback, before the sidebar and the page widgets are created.
+"""
+
+import hashlib
+from functools import lru_cache
+
+from content import (
+    get_course_lessons,
+    get_courses,
+    get_curated_flashcards,
+    get_default_snippets,
+    get_formulas,
+    get_training_module,
+    has_course_lessons,
+    training_topics,
+)
+from notes_index import get_notes_index
+from text_index import TextIndex
+from views import page_to_section
+
+KIND_ICONS = {
+    "topic": "🎯",
+    "lesson": "📘",
+    "flashcard": "🗂️",
+    "formula": "🔢",
+    "snippet": "💻",
+    "note": "📝",
+}
+
+
+def course_label(course):
+    return f"{course['code']} - {course['name']}"
+
+
+def _static_documents(targets):
+    for topic in training_topics():
+        module = get_training_module(topic) or {}
+        target = ("Training Center", {
+            "tc_semester_filter": "All Semesters",
+            "tc_course_filter": "All Courses",
+            "tc_topic": topic,
+            "last_selected_topic": topic,
+        })
+        for i, lesson in enumerate(module.get("lessons", [])):
+            key = ("topic", topic, i)
+            targets[key] = (f"{topic}: {lesson.get('title', '')}",) + target
+            yield key, (lesson.get("title", ""), lesson.get("content", ""), " ".join(lesson.get("key_points", []))), "topic"
+
+    for course in get_courses():
+        code = course["code"]
+        lessons = get_course_lessons(code) if has_course_lessons(code) else []
+        for i, lesson in enumerate(lessons):
+            key = ("lesson", code, i)
+            targets[key] = (f"{code}: {lesson.get('title', '')}", "Learn & Practice", {"lp_selected_course": course_label(course)})
+            yield key, (lesson.get("title", ""), lesson.get("content", ""), " ".join(lesson.get("key_points", []))), "lesson"
+        for i, card in enumerate(get_curated_flashcards(code)):
+            key = ("flashcard", code, i)
+            targets[key] = (f"{code}: {card.get('front', '')}", "Flashcards", {"fc_course_filter": code})
+            yield key, (card.get("front", ""), card.get("back", ""), " ".join(card.get("tags", []))), "flashcard"
+
+    for category, formulas in get_formulas().items():
+        for i, formula in enumerate(formulas):
+            key = ("formula", category, i)
+            targets[key] = (formula["name"], "Formula Reference", {"formula_category": category, "formula_search": formula["name"]})
+            yield key, (formula["name"], formula.get("description", ""), formula.get("example", "")), "formula"
+
+
+@lru_cache(maxsize=1)
+def static_index():
+    """(index, targets) over the built-in content, built once per process."""
+    targets = {}
+    index = TextIndex.build(_static_documents(targets))
+    return index, targets
+
+
+def _snippet_fields(snippet):
+    return (snippet.get("title", ""), snippet.get("description", ""), snippet.get("code", ""))
+
+
+def _snippet_digest(snippet):
+    return hashlib.blake2b("\0".join(_snippet_fields(snippet)).encode("utf-8"), digest_size=12).digest()
+
+
+def get_snippet_index(session_state):
+    """The session's snippet index, re-indexing only snippets that changed."""
+    snippets = session_state.get("code_snippets") or get_default_snippets()
+    index, digests = session_state.get("global_search_snippets") or (TextIndex(), {})
+    for snippet_id in set(digests) - set(snippets):
+        index.remove(snippet_id)
+        del digests[snippet_id]
+    for snippet_id, snippet in snippets.items():
+        digest = _snippet_digest(snippet)
+        if digests.get(snippet_id) != digest:
+            index.update(snippet_id, _snippet_fields(snippet), "snippet")
+            digests[snippet_id] = digest
+    session_state["global_search_snippets"] = (index, digests)
+    return index, snippets
+
+
+def note_state(course, position, note):
+    """Widget state that opens a note in the Study Notes editor."""
+    labels = {c["code"]: course_label(c) for c in get_courses()}
+    state = {
+        "current_note_content": note.get("content", ""),
+        "current_note_title": note.get("title", ""),
+        "current_note_category": note.get("category", "lecture"),
+        "current_note_importance": note.get("importance", "normal"),
+        "current_note_tags": ", ".join(note.get("tags", [])),
+        "current_note_outcome": note.get("learning_outcome", ""),
+        "editing_note_idx": position,
+    }
+    if course in labels:
+        state["word_course_select"] = labels[course]
+    return state
+
+
+def search_everything(session_state, query, limit=10):
+    """Best matches for ``query`` in all content.
+
+    Returns dicts with ``kind``, ``title``, ``page``, ``state`` and ``score``,
+    best first.  BM25 scores from different indexes are not comparable (a
+    word that is rare among 15 snippets is common among 170 lessons), so each
+    index's scores are scaled to its own best match before merging.
+    """
+    if not query or not query.strip():
+        return []
+    hits = []
+    index, targets = static_index()
+    ranked = index.search(query, limit=limit)
+    for key, score in ranked:
+        title, page, state = targets[key]
+        hits.append({"kind": key[0], "title": title, "page": page, "state": state, "score": score / ranked[0][1]})
+
+    snippet_index, snippets = get_snippet_index(session_state)
+    ranked = snippet_index.search(query, limit=limit)
+    for snippet_id, score in ranked:
+        title = snippets[snippet_id].get("title", "")
+        hits.append({"kind": "snippet", "title": title, "page": "Code Library", "state": {"code_search": title}, "score": score / ranked[0][1]})
+
+    notes = session_state.get("study_notes", {})
+    ranked = get_notes_index(session_state).search(query, limit=limit)
+    for course, position, score in ranked:
+        note = notes[course][position]
+        hits.append({
+            "kind": "note", "title": f"{course}: {note.get('title') or 'Untitled'}",
+            "page": "Study Notes", "state": {"note": (course, position)}, "score": score / ranked[0][2],
+        })
+
+    hits.sort(key=lambda hit: -hit["score"])
+    return hits[:limit]
+
+
+def jump_to(session_state, hit):
+    """Open ``hit`` on its page: select the page and set the widget state."""
+    state = dict(hit["state"])
+    if "note" in state:
+        course, position = state.pop("note")
+        notes = session_state.get("study_notes", {}).get(course, [])
+        if position >= len(notes):
+            return
+        state.update(note_state(course, position, notes[position]))
+        session_state["quill_key_counter"] = session_state.get("quill_key_counter", 0) + 1
+    for key, value in state.items():
+        session_state[key] = value
+    session_state["nav_section"] = page_to_section[hit["page"]]
+    session_state["nav_page"] = hit["page"]
+    session_state["last_page"] = hit["page"]
+    session_state["global_search"] = ""
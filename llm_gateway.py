@@ -0,0 +1,248 @@
+"""One entry point for chat completions, with a disk-backed response cache.
+
+Every OpenAI call in the app goes through ``LLMGateway.complete`` (or
+``LLMGateway.stream`` where the reply is shown while it is generated).  Responses
+are stored in SQLite under a hash of (model, messages, params), so repeating a
+request -- summarizing an unchanged note, re-evaluating an identical answer --
+is answered from disk instead of the API.  Entries expire after ``ttl``
+seconds, and the least recently used ones are evicted beyond ``max_entries``.
+``stats()`` reports hits, misses, evictions and expirations.
+
+``FakeChatClient`` mimics ``client.chat.completions.create`` without a network
+connection.  Set ``STUDY_BUDDY_FAKE_LLM=1`` to use it in place of the OpenAI
+client, e.g. to exercise the cache offline.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+CACHE_DB = Path(".study_buddy_llm_cache.db")
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 2000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_responses_last_used ON responses (last_used);
+"""
+
+
+def cache_key(model, messages, params):
+    payload = json.dumps([model, messages, params], sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+
+class ResponseCache:
+    def __init__(self, path=CACHE_DB, ttl=DEFAULT_TTL, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = str(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(SCHEMA)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def get(self, key, now=None):
+        """Return ``(content, status)``; status is "hit", "miss" or "expired"."""
+        now = time.time() if now is None else now
+        conn = self.connection()
+        row = conn.execute("SELECT content, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None, "miss"
+        content, created_at = row
+        if now - created_at > self.ttl:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            return None, "expired"
+        conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+        return content, "hit"
+
+    def put(self, key, model, content, now=None):
+        """Store a response; returns the number of entries evicted to make room."""
+        now = time.time() if now is None else now
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT INTO responses (key, model, content, created_at, last_used) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET content = excluded.content, "
+                "created_at = excluded.created_at, last_used = excluded.last_used",
+                (key, model, content, now, now),
+            )
+            (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+            evicted = max(0, count - self.max_entries)
+            if evicted:
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN (SELECT key FROM responses ORDER BY last_used LIMIT ?)",
+                    (evicted,),
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return evicted
+
+    def __len__(self):
+        return self.connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def clear(self):
+        self.connection().execute("DELETE FROM responses")
+
+
+class LLMGateway:
+    def __init__(self, client, cache=None):
+        self.client = client
+        self.cache = cache
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "errors": 0}
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._stats[name] += amount
+
+    def _lookup(self, key):
+        if self.cache is None:
+            return None
+        try:
+            content, status = self.cache.get(key)
+        except Exception:
+            content, status = None, "miss"
+        if status == "hit":
+            self._count("hits")
+            return content
+        self._count("misses")
+        if status == "expired":
+            self._count("expired")
+        return None
+
+    def _store(self, key, model, content):
+        if self.cache is None or not content:
+            return
+        try:
+            self._count("evictions", self.cache.put(key, model, content))
+        except Exception:
+            pass
+
+    def complete(self, model, messages, timeout=None, use_cache=True, **params):
+        """Return the message content for one chat completion.
+
+        ``params`` (max_tokens, temperature, ...) are part of the cache key;
+        ``timeout`` only affects the request.  API errors propagate to the
+        caller and are never cached.
+        """
+        key = cache_key(model, messages, params)
+        cached = self._lookup(key) if use_cache else None
+        if cached is not None:
+            return cached
+
+        request = dict(params)
+        if timeout is not None:
+            request["timeout"] = timeout
+        try:
+            response = self.client.chat.completions.create(model=model, messages=messages, **request)
+        except Exception:
+            self._count("errors")
+            raise
+        content = response.choices[0].message.content
+
+        if use_cache:
+            self._store(key, model, content)
+        return content
+
+    def stream(self, model, messages, timeout=None, use_cache=True, **params):
+        """Like ``complete`` but yields the reply in pieces as they arrive.
+
+        A cached reply is yielded as one piece.  The full text is cached only
+        once the stream has finished, so an interrupted stream stores nothing.
+        """
+        key = cache_key(model, messages, params)
+        cached = self._lookup(key) if use_cache else None
+        if cached is not None:
+            yield cached
+            return
+
+        request = dict(params)
+        if timeout is not None:
+            request["timeout"] = timeout
+        try:
+            response = self.client.chat.completions.create(model=model, messages=messages, stream=True, **request)
+        except Exception:
+            self._count("errors")
+            raise
+        pieces = []
+        for chunk in response:
+            if not chunk.choices:
+                continue
+            piece = chunk.choices[0].delta.content
+            if piece:
+                pieces.append(piece)
+                yield piece
+        content = "".join(pieces)
+
+        if use_cache:
+            self._store(key, model, content)
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        try:
+            stats["entries"] = len(self.cache) if self.cache is not None else 0
+        except Exception:
+            stats["entries"] = 0
+        return stats
+
+
+class FakeChatClient:
+    """Offline stand-in for the OpenAI client's ``chat.completions.create``.
+
+    Replies deterministically from the last user message after ``latency``
+    seconds and counts the calls it receives.  ``stream=True`` returns the
+    reply in small delta chunks like the real client.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, model, messages, stream=False, **params):
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        prompt = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+        digest = hashlib.blake2b(prompt.encode("utf-8"), digest_size=4).hexdigest()
+        content = f"<p>[offline {model} reply {digest}] {prompt[:200]}</p>\nANSWER: This is a good placeholder answer."
+        if stream:
+            return self._chunks(content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+    def _chunks(self, content, size=16):
+        for start in range(0, len(content), size):
+            if self.latency:
+                time.sleep(self.latency / 20)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content[start:start + size]))])
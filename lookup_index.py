@@ -0,0 +1,202 @@
+"""Hash indexes behind the Excel Formula Simulator's lookups.
+
+VLOOKUP, INDEX/MATCH and XLOOKUP used to compare the lookup value with every
+row of the lookup table (``lookup_data[col].astype(str).str.lower() ==
+value``) for each lookup.  ``LookupEngine`` builds one ``ColumnIndex`` per
+(table, column) instead -- a dict from the case-folded key to its first and
+last row, plus the keys sorted for approximate matches -- and keeps it until
+the key column's content hash changes, so repeated lookups and whole result
+columns ("dragging the formula down") cost a dict probe or a binary search
+per key.
+
+Keys follow Excel: text matches case-insensitively, numbers match numbers
+(``15000`` does not match the text ``"15000"``) and blanks never match.
+Approximate matches use the sorted keys, so they return Excel's answer for
+sorted data -- the largest key not above the value, or the smallest not
+below it -- whatever order the table is in.  An exact hit is always taken,
+and a key that appears more than once answers from its first row (its last
+when searching from the end), as XLOOKUP does.
+"""
+
+import bisect
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MAX_INDEXES = 32
+
+EXACT = 0
+NEXT_SMALLER = -1  # VLOOKUP(..., TRUE), MATCH(..., 1), XLOOKUP match_mode -1
+NEXT_LARGER = 1  # MATCH(..., -1), XLOOKUP match_mode 1
+
+
+def column_digest(series):
+    """Content hash of one column: its dtype and values (an index depends on nothing else)."""
+    digest = hashlib.blake2b(str(series.dtype).encode("utf-8"), digest_size=16)
+    values = series.to_numpy()
+    if values.dtype == object:
+        # repr keeps 1, 1.0 and "1" apart and is several times faster than
+        # pd.util.hash_pandas_object on text.
+        digest.update(repr(values.tolist()).encode("utf-8", "surrogatepass"))
+    else:
+        digest.update(np.ascontiguousarray(values).tobytes())
+    return digest.hexdigest()
+
+
+def lookup_key(value):
+    """The key Excel compares ``value`` by: case-folded text, a float, a bool, or None for blanks."""
+    if value is None or (isinstance(value, float) and np.isnan(value)) or value is pd.NaT:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value)
+    if isinstance(value, str):
+        return value.strip().casefold() or None
+    return str(value).casefold()
+
+
+class ColumnIndex:
+    def __init__(self, values):
+        keys = [lookup_key(value) for value in values]
+        self.size = len(keys)
+        self.first = {}
+        self.last = {}
+        for position, key in enumerate(keys):
+            if key is not None:
+                self.first.setdefault(key, position)
+                self.last[key] = position
+        numbers = [(key, position) for position, key in enumerate(keys) if isinstance(key, float)]
+        texts = [(key, position) for position, key in enumerate(keys) if isinstance(key, str)]
+        numbers.sort(key=lambda item: item[0])
+        texts.sort(key=lambda item: item[0])
+        self._number_keys = np.array([key for key, _ in numbers], dtype=float)
+        self._text_keys = [key for key, _ in texts]
+        # First and last row holding each sorted key, so a neighbour that
+        # appears more than once resolves like an exact match on it would.
+        self._number_first = np.array([self.first[key] for key, _ in numbers], dtype=np.int64)
+        self._number_last = np.array([self.last[key] for key, _ in numbers], dtype=np.int64)
+
+    def exact(self, value, last=False):
+        """Row position of ``value`` (first match, or last with ``last=True``), or None."""
+        key = lookup_key(value)
+        return (self.last if last else self.first).get(key)
+
+    def approximate(self, value, direction=NEXT_SMALLER, last=False):
+        """Row of ``value``, else of the largest key below it (or smallest above); None if none.
+
+        Duplicated keys resolve to their first row (last with ``last=True``),
+        as XLOOKUP does.
+        """
+        position = self.exact(value, last=last)
+        if position is not None:
+            return position
+        key = lookup_key(value)
+        if isinstance(key, float):
+            keys = self._number_keys
+        elif isinstance(key, str):
+            keys = self._text_keys
+        else:
+            return None
+        table = self.last if last else self.first
+        if direction == NEXT_SMALLER:
+            at = bisect.bisect_right(keys, key) - 1
+            return table[keys[at]] if at >= 0 else None
+        at = bisect.bisect_left(keys, key)
+        return table[keys[at]] if at < len(keys) else None
+
+    def positions(self, values, mode=EXACT, last=False):
+        """Row positions for many lookup values at once; -1 where nothing matches.
+
+        Every value is first a dict probe for an exact match; for approximate
+        modes the numeric misses are one ``np.searchsorted`` over the sorted
+        keys and the rest a bisection each.
+        """
+        table = self.last if last else self.first
+        keys = [lookup_key(value) for value in values]
+        out = np.array([table.get(key, -1) for key in keys], dtype=np.int64)
+        if mode == EXACT:
+            return out
+        missing = out < 0
+        numeric = missing & np.array([isinstance(key, float) for key in keys], dtype=bool)
+        if numeric.any() and len(self._number_keys):
+            wanted = np.array([keys[i] for i in np.flatnonzero(numeric)], dtype=float)
+            if mode == NEXT_SMALLER:
+                at = np.searchsorted(self._number_keys, wanted, side="right") - 1
+                found = at >= 0
+            else:
+                at = np.searchsorted(self._number_keys, wanted, side="left")
+                found = at < len(self._number_keys)
+            picked = np.full(len(wanted), -1, dtype=np.int64)
+            picked[found] = (self._number_last if last else self._number_first)[at[found]]
+            out[numeric] = picked
+        for i in np.flatnonzero(missing & ~numeric):
+            position = self.approximate(values[i], mode, last=last)
+            out[i] = -1 if position is None else position
+        return out
+
+
+class LookupEngine:
+    def __init__(self, max_indexes=MAX_INDEXES):
+        self.max_indexes = max_indexes
+        self._indexes = OrderedDict()  # (table name, column) -> (table digest, ColumnIndex)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "builds": 0}
+
+    def column_index(self, table, frame, column, digest=None):
+        """The index of ``frame[column]``, rebuilt only if that column's content changed."""
+        digest = digest or column_digest(frame[column])
+        key = (table, column)
+        with self._lock:
+            entry = self._indexes.get(key)
+            if entry is not None and entry[0] == digest:
+                self._indexes.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1]
+        index = ColumnIndex(frame[column].tolist())
+        with self._lock:
+            self._indexes[key] = (digest, index)
+            self._indexes.move_to_end(key)
+            self._stats["builds"] += 1
+            while len(self._indexes) > self.max_indexes:
+                self._indexes.popitem(last=False)
+        return index
+
+    def lookup(self, table, frame, key_column, value, return_column, mode=EXACT, last=False, digest=None):
+        """``(row position, value)`` from ``return_column`` where ``key_column`` matches, or (None, None).
+
+        Pass ``digest`` (``column_digest(frame[key_column])``) when making many
+        single lookups against an unchanged table to skip re-hashing the column.
+        """
+        index = self.column_index(table, frame, key_column, digest)
+        position = index.exact(value, last=last) if mode == EXACT else index.approximate(value, mode, last=last)
+        if position is None:
+            return None, None
+        return position, frame[return_column].iloc[position]
+
+    def lookup_many(self, table, frame, key_column, values, return_column, mode=EXACT, last=False):
+        """Results for every value in ``values`` (a whole column filled down); None where not found."""
+        index = self.column_index(table, frame, key_column)
+        positions = index.positions(list(values), mode=mode, last=last)
+        found = positions >= 0
+        results = np.full(len(positions), None, dtype=object)
+        results[found] = frame[return_column].to_numpy(dtype=object)[positions[found]]
+        return pd.Series(results, index=getattr(values, "index", None))
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, indexes=len(self._indexes))
+
+
+def get_lookup_engine(session_state):
+    """The session's lookup engine; its indexes follow the session's tables."""
+    if "lookup_engine" not in session_state:
+        session_state["lookup_engine"] = LookupEngine()
+    return session_state["lookup_engine"]
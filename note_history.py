@@ -0,0 +1,123 @@
+"""Version history for study notes, stored as reverse deltas.
+
+A note keeps its current content in full.  Each ``version_history`` entry
+holds the edit that turns the version after it back into the version it
+describes, so the newest entry applies to the current content, the one
+before it to the result, and so on.  Only the changed stretches are stored,
+which keeps a long history of a long note close to the size of the edits
+themselves.  Dropping the oldest entries to respect the depth limit never
+touches the newer ones.
+
+Deltas are lists of ``[start, end, text]``: replace characters ``start:end``
+of the newer version with ``text``.  They are found by diffing blocks
+(paragraphs, list items, lines) first and then only the changed blocks word
+by word, so saving a long note stays fast.  Entries written before deltas
+existed have no ``delta`` and cannot be reconstructed; an entry with a full
+``content`` snapshot is converted to a delta the next time the note is saved.
+"""
+
+import re
+from difflib import SequenceMatcher
+
+NOTE_HISTORY_DEPTH = 10
+# Changed stretches longer than this many words are stored whole instead of
+# being diffed word by word.
+MAX_REFINE_TOKENS = 2000
+
+_BLOCK_RE = re.compile(r".*?(?:</(?:p|h[1-6]|li|div|pre|blockquote)>|<br\s*/?>|\n)|.+", re.IGNORECASE | re.DOTALL)
+# Tags, whitespace runs and words; a ``<`` that opens no tag is a token of its
+# own, so the tokens always join back to the whole text.
+_TOKEN_RE = re.compile(r"<[^>]*>|\s+|[^<\s]+|<")
+
+
+def _opcodes(a, b):
+    return SequenceMatcher(None, a, b, autojunk=False).get_opcodes()
+
+
+def _offsets(parts):
+    offsets = [0]
+    for part in parts:
+        offsets.append(offsets[-1] + len(part))
+    return offsets
+
+
+def make_delta(newer, older):
+    """Delta that turns ``newer`` back into ``older``."""
+    new_blocks = _BLOCK_RE.findall(newer or "")
+    old_blocks = _BLOCK_RE.findall(older or "")
+    new_at = _offsets(new_blocks)
+    delta = []
+    for tag, i1, i2, j1, j2 in _opcodes(new_blocks, old_blocks):
+        if tag == "equal":
+            continue
+        new_text = "".join(new_blocks[i1:i2])
+        old_text = "".join(old_blocks[j1:j2])
+        new_tokens = _TOKEN_RE.findall(new_text)
+        old_tokens = _TOKEN_RE.findall(old_text)
+        if tag != "replace" or len(new_tokens) + len(old_tokens) > MAX_REFINE_TOKENS:
+            delta.append([new_at[i1], new_at[i2], old_text])
+            continue
+        token_at = _offsets(new_tokens)
+        for token_tag, k1, k2, l1, l2 in _opcodes(new_tokens, old_tokens):
+            if token_tag != "equal":
+                delta.append([new_at[i1] + token_at[k1], new_at[i1] + token_at[k2], "".join(old_tokens[l1:l2])])
+    return delta
+
+
+def apply_delta(newer, delta):
+    pieces = []
+    position = 0
+    for start, end, text in delta:
+        pieces.append(newer[position:start])
+        pieces.append(text)
+        position = end
+    pieces.append(newer[position:])
+    return "".join(pieces)
+
+
+def record_version(history, old_content, new_content, date, summary, depth=NOTE_HISTORY_DEPTH):
+    """Return ``history`` with ``old_content`` added as the newest past version.
+
+    Does nothing if the content did not change.  Keeps at most ``depth``
+    entries.
+    """
+    if depth <= 0:
+        return []
+    history = [dict(entry) for entry in history or []]
+    if old_content != new_content:
+        history.append({"date": date, "summary": summary, "content": old_content})
+    history = history[-depth:]
+
+    # Convert full snapshots (including the one just added) to deltas against
+    # the version that follows them.
+    snapshots = sum("content" in entry for entry in history)
+    following = new_content
+    for entry in reversed(history):
+        if not snapshots:
+            break
+        if "content" in entry:
+            snapshot = entry.pop("content")
+            entry["delta"] = make_delta(following, snapshot)
+            following = snapshot
+            snapshots -= 1
+        elif "delta" in entry:
+            following = apply_delta(following, entry["delta"])
+        else:
+            break
+    return history
+
+
+def reconstruct(current_content, history, index):
+    """Content of ``history[index]``, or None if the chain to it is broken."""
+    if not -len(history) <= index < len(history):
+        raise IndexError(index)
+    index %= len(history)
+    content = current_content
+    for entry in reversed(history[index:]):
+        if "content" in entry:
+            content = entry["content"]
+        elif "delta" in entry:
+            content = apply_delta(content, entry["delta"])
+        else:
+            return None
+    return content
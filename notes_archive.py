@@ -0,0 +1,172 @@
+"""ZIP export and import of study notes for every course.
+
+The archive holds one Markdown file per note under ``notes/<course>/``: a
+front-matter block (one ``key: <json>`` line per field, which is also valid
+YAML) followed by the note's HTML body, which Markdown renders as is.
+Pictures pasted into a note are stored as data URIs; they are moved to
+``assets/<hash>.<ext>``, each picture once however many notes use it, and
+referenced by path.  A note's version history goes next to it as
+``<name>.history.json``.
+
+``write_notes_archive`` writes notes one at a time straight into the ZIP
+stream and ``read_notes_archive`` reads them back one member at a time, so
+neither holds more than one note (plus its pictures) in memory.  Importing
+skips notes whose content hash matches a note that already exists or that
+appeared earlier in the archive.  The single-course JSON export the page
+used to offer can still be imported.
+"""
+
+import base64
+import hashlib
+import json
+import mimetypes
+import re
+import tempfile
+import zipfile
+
+ARCHIVE_FORMAT = "study-notes-archive"
+ARCHIVE_VERSION = 1
+NOTE_FIELDS = ("title", "date", "category", "importance", "tags", "learning_outcome")
+# Spill to disk beyond this size while an archive is being built.
+SPOOL_BYTES = 8 * 1024 * 1024
+
+_DATA_URI_RE = re.compile(r'(<img\b[^>]*?\bsrc=")data:(image/[\w.+-]+);base64,([A-Za-z0-9+/=\s]+)(")', re.IGNORECASE)
+_ASSET_SRC_RE = re.compile(r'(<img\b[^>]*?\bsrc=")(?:\.\./)*(assets/[\w.-]+)(")', re.IGNORECASE)
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+def note_hash(course, note):
+    """Identity of a note for de-duplication: course, title and content."""
+    payload = json.dumps([course, note.get("title", ""), note.get("content", "")], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _slug(title):
+    return _SLUG_RE.sub("-", (title or "untitled").lower()).strip("-")[:50] or "untitled"
+
+
+def _front_matter(course, note):
+    lines = ["---", f"course: {json.dumps(course, ensure_ascii=False)}"]
+    for field in NOTE_FIELDS:
+        if field in note:
+            lines.append(f"{field}: {json.dumps(note[field], ensure_ascii=False)}")
+    lines.append("---")
+    return "\n".join(lines) + "\n\n"
+
+
+def _parse_markdown(text):
+    note = {}
+    body = text
+    if text.startswith("---\n"):
+        end = text.find("\n---\n", 4)
+        if end != -1:
+            for line in text[4:end].splitlines():
+                field, _, value = line.partition(": ")
+                try:
+                    note[field] = json.loads(value)
+                except ValueError:
+                    note[field] = value
+            body = text[end + 5:]
+            if body.startswith("\n"):
+                body = body[1:]
+    note["content"] = body
+    return note
+
+
+def _extract_images(content, written, archive):
+    """Replace embedded images by asset paths, writing assets not yet in the archive."""
+    def replace(match):
+        mime, data = match.group(2), re.sub(r"\s+", "", match.group(3))
+        raw = base64.b64decode(data)
+        extension = (mimetypes.guess_extension(mime) or ".bin").lstrip(".")
+        name = f"assets/{hashlib.blake2b(raw, digest_size=16).hexdigest()}.{extension}"
+        if name not in written:
+            archive.writestr(name, raw)
+            written.add(name)
+        return f"{match.group(1)}../../{name}{match.group(4)}"
+    return _DATA_URI_RE.sub(replace, content)
+
+
+def _inline_images(content, archive):
+    def replace(match):
+        name = match.group(2)
+        try:
+            raw = archive.read(name)
+        except KeyError:
+            return match.group(0)
+        mime = mimetypes.guess_type(name)[0] or "application/octet-stream"
+        return f"{match.group(1)}data:{mime};base64,{base64.b64encode(raw).decode('ascii')}{match.group(3)}"
+    return _ASSET_SRC_RE.sub(replace, content)
+
+
+def write_notes_archive(notes, fileobj):
+    """Write every course's notes to ``fileobj`` as a ZIP; returns the number of notes."""
+    count = 0
+    with zipfile.ZipFile(fileobj, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("format.json", json.dumps({"format": ARCHIVE_FORMAT, "version": ARCHIVE_VERSION}))
+        assets = set()
+        for course, course_notes in notes.items():
+            for position, note in enumerate(course_notes or []):
+                stem = f"notes/{_slug(course)}/{position + 1:04d}-{_slug(note.get('title'))}"
+                content = _extract_images(note.get("content", ""), assets, archive)
+                with archive.open(f"{stem}.md", "w") as member:
+                    member.write(_front_matter(course, note).encode("utf-8"))
+                    member.write(content.encode("utf-8"))
+                if note.get("version_history"):
+                    archive.writestr(f"{stem}.history.json", json.dumps(note["version_history"], ensure_ascii=False))
+                count += 1
+    return count
+
+
+def build_notes_archive(notes):
+    """The archive as bytes, for a download button.
+
+    Only the compressed archive is ever held whole; it is assembled in a
+    temporary file that moves to disk once it grows large.
+    """
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_BYTES) as spool:
+        write_notes_archive(notes, spool)
+        spool.seek(0)
+        return spool.read()
+
+
+def iter_notes_archive(fileobj):
+    """Yield ``(course, note)`` for each note in a ZIP archive or a JSON export."""
+    if zipfile.is_zipfile(fileobj):
+        fileobj.seek(0)
+        with zipfile.ZipFile(fileobj) as archive:
+            names = set(archive.namelist())
+            for info in archive.infolist():
+                if not (info.filename.startswith("notes/") and info.filename.endswith(".md")):
+                    continue
+                note = _parse_markdown(archive.read(info).decode("utf-8"))
+                course = note.pop("course", None) or info.filename.split("/")[1].upper()
+                note["content"] = _inline_images(note["content"], archive)
+                history_name = info.filename[:-3] + ".history.json"
+                if history_name in names:
+                    note["version_history"] = json.loads(archive.read(history_name))
+                yield course, note
+        return
+    fileobj.seek(0)
+    for course, course_notes in json.load(fileobj).items():
+        for note in course_notes or []:
+            yield course, dict(note)
+
+
+def read_notes_archive(fileobj, notes):
+    """Add the notes in ``fileobj`` to ``notes`` (course -> list), skipping duplicates.
+
+    Returns ``{"imported": n, "duplicates": n}``.
+    """
+    seen = {note_hash(course, note) for course, course_notes in notes.items() for note in course_notes or []}
+    stats = {"imported": 0, "duplicates": 0}
+    for course, note in iter_notes_archive(fileobj):
+        digest = note_hash(course, note)
+        if digest in seen:
+            stats["duplicates"] += 1
+            continue
+        seen.add(digest)
+        note.setdefault("version_history", [])
+        notes.setdefault(course, []).append(note)
+        stats["imported"] += 1
+    return stats
@@ -0,0 +1,63 @@
+"""Full-text index over study notes.
+
+The Study Notes search used to lowercase every note's title and HTML body on
+each keystroke and test for a substring, one course at a time.  NotesIndex
+keeps a ``TextIndex`` (BM25, stemming, phrase queries) over every course
+instead; a note is tokenized once, when it is saved.
+
+Notes are addressed like ``state_store`` addresses them: ``(course, position)``
+in ``study_notes[course]``.  The index lives in session state next to
+``study_notes``; code that saves or deletes a note calls ``add``/``update``/
+``remove``, and ``get_notes_index`` rebuilds it if the note count no longer
+matches.
+"""
+
+from text_index import TextIndex
+
+
+def note_fields(note):
+    return (note.get('title', ''), note.get('content', ''))
+
+
+class NotesIndex:
+    def __init__(self, notes=None):
+        self._index = TextIndex.build(
+            ((course, position), note_fields(note), course)
+            for course, course_notes in (notes or {}).items()
+            for position, note in enumerate(course_notes or [])
+        )
+
+    def __len__(self):
+        return len(self._index)
+
+    def add(self, course, position, note):
+        self._index.add((course, position), note_fields(note), course)
+
+    def update(self, course, position, note):
+        self._index.update((course, position), note_fields(note), course)
+
+    def remove(self, course, position):
+        """Drop the note at ``position``; later notes in the course move up one."""
+        if (course, position) not in self._index:
+            return
+        self._index.remove((course, position))
+        following = position + 1
+        while (course, following) in self._index:
+            self._index.rekey((course, following), (course, following - 1))
+            following += 1
+
+    def search(self, query, course=None, limit=None):
+        """Rank notes for ``query``; returns [(course, position, score)], best first.
+
+        ``course=None`` searches every course.
+        """
+        return [(*key, score) for key, score in self._index.search(query, group=course, limit=limit)]
+
+
+def get_notes_index(session_state):
+    notes = session_state.get("study_notes", {})
+    index = session_state.get("study_notes_index")
+    if not isinstance(index, NotesIndex) or len(index) != sum(len(n or []) for n in notes.values()):
+        index = NotesIndex(notes)
+        session_state["study_notes_index"] = index
+    return index
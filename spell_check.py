@@ -0,0 +1,203 @@
+"""Local spell checking for the Study Notes editor.
+
+Checking a whole note with pyspellchecker on every rerun would redo the same
+work for paragraphs that have not changed, and looking up suggestions is the
+slow part.  ``SpellCheckService`` splits a note into paragraphs, keys each one
+by a hash of its text and keeps the findings in a bounded cache shared by all
+sessions of the process.  Paragraphs it has not seen are queued for a single
+background thread, so the page only waits (briefly, if at all) for the
+paragraphs that were edited.
+
+Findings are returned as squiggle ranges: character offsets into the note's
+HTML, with the word and a few suggestions.  ``mark_squiggles`` wraps them in
+underlined spans for the preview.  The LLM "Fix Grammar" action stays a
+separate, explicit request.
+"""
+
+import hashlib
+import html
+import queue
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+
+from spellchecker import SpellChecker
+
+CACHE_PARAGRAPHS = 5000
+MAX_SUGGESTIONS = 3
+# Suggestions within one edit.  At distance 2 a word with no close match (a
+# variable name, a URL fragment) takes about a second to give up on.
+SUGGESTION_DISTANCE = 1
+
+# Course vocabulary the general English dictionary does not know.
+DOMAIN_WORDS = {
+    "analytics", "api", "apis", "boxplot", "boxplots", "csv", "csvs", "dashboard", "dashboards",
+    "dataframe", "dataframes", "dataset", "datasets", "dax", "etl", "gdpr", "github", "json", "jupyter",
+    "kpi", "kpis", "matplotlib", "numpy", "pandas", "pii", "plotly", "powerbi", "pseudonymisation",
+    "pseudonymization", "python", "scipy", "seaborn", "sql", "sqlite", "stakeholder", "stakeholders",
+    "subquery", "subqueries", "tableau", "timestamp", "timestamps", "vlookup", "xlookup", "xlsx",
+}
+
+_BLOCK_RE = re.compile(r".*?(?:</(?:p|h[1-6]|li|div|pre|blockquote)>|<br\s*/?>|\n)|.+", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<(?:script|style)\b.*?</(?:script|style)>|<[^>]*>|&[#\w]+;", re.IGNORECASE | re.DOTALL)
+_WORD_RE = re.compile(r"[A-Za-z]+(?:'[A-Za-z]+)*")
+
+
+def paragraph_key(paragraph):
+    return hashlib.blake2b(paragraph.encode("utf-8"), digest_size=16).digest()
+
+
+def split_paragraphs(text):
+    """[(offset, paragraph)] covering ``text``."""
+    paragraphs = []
+    offset = 0
+    for block in _BLOCK_RE.findall(text or ""):
+        paragraphs.append((offset, block))
+        offset += len(block)
+    return paragraphs
+
+
+def words_outside_tags(paragraph):
+    """(start, end, word) for each word in the paragraph's text, skipping markup."""
+    words = []
+    position = 0
+    for tag in _TAG_RE.finditer(paragraph):
+        words.extend(_words_in(paragraph, position, tag.start()))
+        position = tag.end()
+    words.extend(_words_in(paragraph, position, len(paragraph)))
+    return words
+
+
+def _words_in(paragraph, start, end):
+    for match in _WORD_RE.finditer(paragraph, start, end):
+        word = match.group()
+        # Acronyms, single letters and words glued to digits are left alone.
+        if len(word) < 2 or word.isupper():
+            continue
+        before = paragraph[match.start() - 1] if match.start() > 0 else ""
+        after = paragraph[match.end()] if match.end() < len(paragraph) else ""
+        if before.isdigit() or after.isdigit() or before == "_" or after == "_":
+            continue
+        yield match.start(), match.end(), word
+
+
+class SpellCheckService:
+    def __init__(self, checker=None, cache_size=CACHE_PARAGRAPHS):
+        self._checker = checker
+        self._cache = OrderedDict()  # paragraph hash -> [(start, end, word, suggestions)]
+        self._cache_size = cache_size
+        self._pending = set()
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._done = threading.Condition(self._lock)
+        self._thread = None
+        self._stats = {"checked": 0, "cache_hits": 0}
+
+    def _ensure_worker(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._work, name="spell-check", daemon=True)
+            self._thread.start()
+
+    def _work(self):
+        if self._checker is None:
+            checker = SpellChecker(distance=SUGGESTION_DISTANCE)
+            checker.word_frequency.load_words(DOMAIN_WORDS)
+            self._checker = checker
+        while True:
+            key, paragraph = self._queue.get()
+            try:
+                findings = self._check_paragraph(paragraph)
+            except Exception:
+                findings = []
+            with self._done:
+                self._pending.discard(key)
+                self._cache[key] = findings
+                while len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+                self._stats["checked"] += 1
+                self._done.notify_all()
+
+    def _check_paragraph(self, paragraph):
+        words = words_outside_tags(paragraph)
+        unknown = self._checker.unknown({word.lower() for _, _, word in words})
+        findings = []
+        suggestions = {}
+        for start, end, word in words:
+            lowered = word.lower()
+            if lowered not in unknown:
+                continue
+            if lowered not in suggestions:
+                candidates = self._checker.candidates(lowered) or set()
+                ranked = sorted(candidates - {lowered}, key=lambda c: -self._checker.word_usage_frequency(c))
+                suggestions[lowered] = ranked[:MAX_SUGGESTIONS]
+            findings.append((start, end, word, suggestions[lowered]))
+        return findings
+
+    def submit(self, text):
+        """Queue the paragraphs of ``text`` that are not cached yet; returns how many."""
+        queued = 0
+        with self._lock:
+            for _, paragraph in split_paragraphs(text):
+                key = paragraph_key(paragraph)
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                    self._stats["cache_hits"] += 1
+                elif key not in self._pending:
+                    self._pending.add(key)
+                    self._queue.put((key, paragraph))
+                    queued += 1
+            if queued:
+                self._ensure_worker()
+        return queued
+
+    def squiggles(self, text, timeout=0.0, ignore=()):
+        """Misspellings in ``text`` as dicts with start, end, word and suggestions.
+
+        Submits the text, then waits up to ``timeout`` seconds for unchecked
+        paragraphs; returns None if some are still being checked.
+        """
+        self.submit(text)
+        paragraphs = [(offset, paragraph_key(paragraph)) for offset, paragraph in split_paragraphs(text)]
+        ignore = {word.lower() for word in ignore}
+        deadline = time.monotonic() + timeout
+        with self._done:
+            while not all(key in self._cache for _, key in paragraphs):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._done.wait(remaining)
+            return [
+                {"start": offset + start, "end": offset + end, "word": word, "suggestions": list(suggestions)}
+                for offset, key in paragraphs
+                for start, end, word, suggestions in self._cache[key]
+                if word.lower() not in ignore
+            ]
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, cached=len(self._cache), pending=len(self._pending))
+
+
+@lru_cache(maxsize=1)
+def get_spell_checker():
+    """The process-wide service; the dictionary loads on its worker thread."""
+    return SpellCheckService()
+
+
+def mark_squiggles(text, squiggles):
+    """``text`` with each range wrapped in a wavy-underlined span."""
+    pieces = []
+    position = 0
+    for squiggle in squiggles:
+        start, end = squiggle["start"], squiggle["end"]
+        title = html.escape(", ".join(squiggle["suggestions"]) or "no suggestions", quote=True)
+        pieces.append(text[position:start])
+        pieces.append(
+            f'<span style="text-decoration: underline wavy #d93025; text-decoration-skip-ink: none;" '
+            f'title="{title}">{text[start:end]}</span>'
+        )
+        position = end
+    pieces.append(text[position:])
+    return "".join(pieces)
@@ -0,0 +1,363 @@
+"""A session's SQLite database for the SQL Query Tester.
+
+Every "Run Query" used to open ``sqlite3.connect(':memory:')``, load
+``customers`` and ``orders`` from the data editors with ``to_sql``, run the
+query and close the connection, so each click paid for reloading every table
+and anything the user built (an index, an uploaded table) was gone.
+
+``SqlSandbox`` keeps one in-memory connection per session.  ``sync`` makes a
+table match a DataFrame by row-level diff: each row is identified by its index
+label (what ``st.data_editor`` keeps stable across edits) and compared by a
+hash of its values, so an edit to one cell is one ``UPDATE``, an added row one
+``INSERT`` and a deleted row one ``DELETE``; an unchanged table costs one hash
+of the frame.  A change to the columns or their dtypes reloads the table and
+recreates its indexes.  Indexes and uploaded tables live as long as the
+session.
+
+A statement that changes rows (``DELETE``, ``UPDATE`` ...) marks the synced
+tables it names stale (all of them if it names none, e.g. a write through a
+trigger), and ``DROP``/``ALTER TABLE`` marks the table it targets, so their
+next ``sync`` reloads them from the frame: the data editors stay the source
+of truth for the tables they show.  Index DDL and reads leave them alone.
+
+``profile`` runs a SELECT repeatedly and reports its ``EXPLAIN QUERY PLAN``,
+timings, the rows its full scans read and the indexes it used;
+``compare_index`` profiles a query without and then with an index, e.g. on
+a large table from ``synthetic_data.generate``.
+"""
+
+import re
+import sqlite3
+import statistics
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+TABLE_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+READ_ONLY = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+TABLE_DDL = re.compile(
+    r"^\s*(?:DROP|ALTER)\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:\w+\.)?[\"`\[]?(?P<table>[^\"`\]\s;]+)", re.IGNORECASE
+)
+PLAN_STEP = re.compile(
+    r"^(?P<op>SCAN|SEARCH) (?P<table>\S+)(?: AS \S+)?"
+    r"(?: USING (?:(?P<automatic>AUTOMATIC )?(?:PARTIAL )?(?:COVERING )?INDEX(?: (?P<index>\w+))?"
+    r"|(?P<key>(?:INTEGER )?PRIMARY KEY)))?"
+)
+TABLE_ALIAS = re.compile(r"\b(?:FROM|JOIN)\s+\"?(\w+)\"?(?:\s+(?:AS\s+)?(?!ON\b|WHERE\b|JOIN\b|GROUP\b|ORDER\b|LIMIT\b|LEFT\b|INNER\b|CROSS\b)(\w+))?", re.IGNORECASE)
+VM_STEP_BATCH = 100  # progress handler granularity, in SQLite VM instructions
+
+
+def quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _column_type(series):
+    kind = series.dtype.kind
+    if kind in "iub":
+        return "INTEGER"
+    if kind == "f":
+        return "REAL"
+    if kind == "M":
+        return "TIMESTAMP"
+    return "TEXT"
+
+
+def _records(frame):
+    """The rows of ``frame`` as tuples of values sqlite3 can bind (None for missing)."""
+    columns = []
+    for name in frame.columns:
+        series = frame[name]
+        if series.dtype.kind == "M":
+            series = series.dt.strftime("%Y-%m-%d %H:%M:%S")
+        elif series.dtype.kind == "m":
+            series = series.astype(str).where(series.notna())
+        series = series.astype(object)
+        columns.append(series.where(series.notna(), None).tolist())
+    return list(zip(*columns))
+
+
+def row_hashes(frame):
+    """One uint64 per row of ``frame``, from its values only."""
+    return pd.util.hash_pandas_object(frame, index=False, categorize=False).to_numpy()
+
+
+class _Table:
+    def __init__(self, schema, labels, hashes, rowids):
+        self.schema = schema  # ((column, dtype), ...)
+        self.labels = labels  # frame index of the synced rows
+        self.hashes = hashes  # row hash per label
+        self.rowids = rowids  # SQLite rowid per label
+        self.stale = False
+
+
+class SqlSandbox:
+    def __init__(self):
+        self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+        self._lock = threading.RLock()
+        self._tables = {}  # table name -> _Table for tables loaded by sync
+        self._next_rowid = 1
+        self._stats = {"syncs": 0, "unchanged": 0, "reloads": 0, "inserted": 0, "updated": 0, "deleted": 0}
+
+    # ── loading tables ───────────────────────────────────────────────────────
+    def sync(self, name, frame):
+        """Make table ``name`` hold exactly ``frame``'s rows; return what was changed.
+
+        The result is ``{"inserted": n, "updated": n, "deleted": n, "reloaded": bool,
+        "ms": elapsed}``.
+        """
+        if not TABLE_NAME.match(name):
+            raise ValueError(f"'{name}' is not a valid table name (letters, digits and _ only)")
+        start = time.perf_counter()
+        if not frame.index.is_unique:
+            frame = frame.reset_index(drop=True)
+        schema = tuple((str(column), str(dtype)) for column, dtype in frame.dtypes.items())
+        hashes = row_hashes(frame)
+        change = {"inserted": 0, "updated": 0, "deleted": 0, "reloaded": False}
+        with self._lock:
+            self._stats["syncs"] += 1
+            table = self._tables.get(name)
+            if table is None or table.stale or table.schema != schema or not self._exists(name):
+                self._reload(name, frame, schema, hashes)
+                change.update(inserted=len(frame), reloaded=True)
+                self._stats["reloads"] += 1
+            elif len(hashes) == len(table.hashes) and frame.index.equals(table.labels) and np.array_equal(hashes, table.hashes):
+                self._stats["unchanged"] += 1
+            else:
+                change.update(self._apply_diff(name, table, frame, hashes))
+            for key in ("inserted", "updated", "deleted"):
+                self._stats[key] += change[key]
+        change["ms"] = (time.perf_counter() - start) * 1000
+        return change
+
+    def _exists(self, name):
+        return self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        ).fetchone() is not None
+
+    def _insert_sql(self, name, frame):
+        columns = ", ".join(["rowid"] + [quote(column) for column in frame.columns])
+        marks = ", ".join("?" * (len(frame.columns) + 1))
+        return f"INSERT INTO {quote(name)} ({columns}) VALUES ({marks})"
+
+    def _new_rowids(self, count):
+        rowids = np.arange(self._next_rowid, self._next_rowid + count, dtype=np.int64)
+        self._next_rowid += count
+        return rowids
+
+    def _reload(self, name, frame, schema, hashes):
+        """Recreate table ``name`` from ``frame``, keeping the indexes whose columns still exist."""
+        index_sql = [
+            sql for (sql,) in self.conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL", (name,)
+            )
+        ]
+        columns = ", ".join(f"{quote(column)} {_column_type(frame[column])}" for column in frame.columns)
+        rowids = self._new_rowids(len(frame))
+        with self.conn:
+            self.conn.execute(f"DROP TABLE IF EXISTS {quote(name)}")
+            self.conn.execute(f"CREATE TABLE {quote(name)} ({columns})")
+            self.conn.executemany(
+                self._insert_sql(name, frame),
+                ((int(rowid),) + row for rowid, row in zip(rowids, _records(frame))),
+            )
+            for sql in index_sql:
+                try:
+                    self.conn.execute(sql)
+                except sqlite3.Error:
+                    pass  # the indexed column is gone
+        self._tables[name] = _Table(schema, frame.index.copy(), hashes, rowids)
+
+    def _apply_diff(self, name, table, frame, hashes):
+        old_hashes = pd.Series(table.hashes, index=table.labels)
+        old_rowids = pd.Series(table.rowids, index=table.labels)
+        new_hashes = pd.Series(hashes, index=frame.index)
+
+        deleted = table.labels.difference(frame.index, sort=False)
+        kept = frame.index.isin(table.labels)
+        added = frame.index[~kept]
+        common = frame.index[kept]
+        changed = common[old_hashes.loc[common].to_numpy() != new_hashes.loc[common].to_numpy()]
+
+        rowids = pd.Series(np.zeros(len(frame), dtype=np.int64), index=frame.index)
+        rowids.loc[common] = old_rowids.loc[common].to_numpy()
+        rowids.loc[added] = self._new_rowids(len(added))
+
+        assignments = ", ".join(f"{quote(column)} = ?" for column in frame.columns)
+        with self.conn:
+            if len(deleted):
+                self.conn.executemany(
+                    f"DELETE FROM {quote(name)} WHERE rowid = ?",
+                    ((int(rowid),) for rowid in old_rowids.loc[deleted]),
+                )
+            if len(changed):
+                self.conn.executemany(
+                    f"UPDATE {quote(name)} SET {assignments} WHERE rowid = ?",
+                    (row + (int(rowid),) for rowid, row in zip(rowids.loc[changed], _records(frame.loc[changed]))),
+                )
+            if len(added):
+                self.conn.executemany(
+                    self._insert_sql(name, frame),
+                    ((int(rowid),) + row for rowid, row in zip(rowids.loc[added], _records(frame.loc[added]))),
+                )
+        self._tables[name] = _Table(table.schema, frame.index.copy(), hashes, rowids.to_numpy())
+        return {"inserted": len(added), "updated": len(changed), "deleted": len(deleted)}
+
+    # ── queries ──────────────────────────────────────────────────────────────
+    def query(self, sql, params=()):
+        """Run one SQL statement; a DataFrame for statements that return rows, else None.
+
+        Statements that change rows or alter a synced table mark it stale (see
+        the module docstring).
+        """
+        with self._lock:
+            before = self.conn.total_changes
+            cursor = self.conn.execute(sql, params)
+            try:
+                result = None
+                if cursor.description is not None:
+                    columns = [description[0] for description in cursor.description]
+                    result = pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+                self.conn.commit()
+            finally:
+                cursor.close()
+            self._mark_stale(sql, self.conn.total_changes != before)
+            return result
+
+    def _mark_stale(self, sql, changed_rows):
+        ddl = TABLE_DDL.match(sql)
+        if ddl and ddl.group("table") in self._tables:
+            self._tables[ddl.group("table")].stale = True
+        if not changed_rows:
+            return
+        named = [name for name in self._tables if re.search(rf"\b{re.escape(name)}\b", sql, re.IGNORECASE)]
+        for name in named or self._tables:
+            self._tables[name].stale = True
+
+    def create_index(self, table, columns, unique=False):
+        """Create an index on ``table(columns)`` and return its name."""
+        name = "idx_" + "_".join(re.sub(r"\W", "_", str(part)) for part in [table, *columns])
+        kind = "UNIQUE INDEX" if unique else "INDEX"
+        column_list = ", ".join(quote(column) for column in columns)
+        with self._lock, self.conn:
+            self.conn.execute(f"CREATE {kind} IF NOT EXISTS {quote(name)} ON {quote(table)} ({column_list})")
+        return name
+
+    def drop_index(self, name):
+        with self._lock, self.conn:
+            self.conn.execute(f"DROP INDEX IF EXISTS {quote(name)}")
+
+    def drop_table(self, name):
+        with self._lock, self.conn:
+            self.conn.execute(f"DROP TABLE IF EXISTS {quote(name)}")
+            self._tables.pop(name, None)
+
+    # ── profiling ────────────────────────────────────────────────────────────
+    def query_plan(self, sql):
+        """``EXPLAIN QUERY PLAN`` as a DataFrame (id, parent, detail) and as indented text."""
+        with self._lock:
+            rows = self.conn.execute("EXPLAIN QUERY PLAN " + sql).fetchall()
+        plan = pd.DataFrame([(row[0], row[1], row[-1]) for row in rows], columns=["id", "parent", "detail"])
+        depth = {}
+        lines = []
+        for node, parent, detail in plan.itertuples(index=False, name=None):
+            depth[node] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[node] + detail)
+        return plan, "\n".join(lines)
+
+    def profile(self, sql, repeats=5):
+        """Run a SELECT ``repeats`` times and report its plan, timings and the work it did.
+
+        SQLite has no per-query row counter, so ``rows_scanned`` counts the rows
+        of every table the plan reads with a ``SCAN`` (of the table or of a
+        covering index) or builds an "automatic index" over for this query
+        alone; an index ``SEARCH`` reads only the matching rows.  ``vm_steps``
+        -- virtual machine instructions, counted by a progress handler --
+        measures the work of every step.
+        """
+        if not READ_ONLY.match(sql):
+            raise ValueError("Only SELECT (or WITH ... SELECT) queries can be profiled")
+        plan, plan_text = self.query_plan(sql)
+        aliases = {alias.lower(): table for table, alias in TABLE_ALIAS.findall(sql) if alias}
+        counts = self.tables()
+        steps = [PLAN_STEP.match(detail) for detail in plan["detail"]]
+        steps = [step for step in steps if step]
+        indexed = [step for step in steps if step["index"] or step["key"] or step["automatic"]]
+        full_scans = sorted({aliases.get(step["table"].lower(), step["table"]) for step in steps if step["op"] == "SCAN" or step["automatic"]})
+        indexes_used = sorted({
+            step["index"] or step["key"] or f"automatic index on {aliases.get(step['table'].lower(), step['table'])}"
+            for step in indexed
+        })
+
+        times = []
+        vm_batches = [0]
+
+        def count_steps():
+            vm_batches[0] += 1
+            return 0
+
+        with self._lock:
+            self.conn.set_progress_handler(count_steps, VM_STEP_BATCH)
+            try:
+                for run in range(max(repeats, 1)):
+                    start = time.perf_counter()
+                    rows = self.conn.execute(sql).fetchall()
+                    times.append((time.perf_counter() - start) * 1000)
+                    if run == 0:
+                        vm_steps = vm_batches[0] * VM_STEP_BATCH
+            finally:
+                self.conn.set_progress_handler(None, 0)
+        return {
+            "plan": plan,
+            "plan_text": plan_text,
+            "times_ms": times,
+            "median_ms": statistics.median(times),
+            "min_ms": min(times),
+            "rows": len(rows),
+            "vm_steps": vm_steps,
+            "rows_scanned": sum(counts.get(table, 0) for table in full_scans),
+            "full_scans": full_scans,
+            "indexes_used": indexes_used,
+        }
+
+    def compare_index(self, sql, table, columns, repeats=5):
+        """Profile ``sql`` without and then with an index on ``table(columns)``; the index is kept."""
+        name = self.create_index(table, columns)
+        self.drop_index(name)
+        before = self.profile(sql, repeats)
+        self.create_index(table, columns)
+        after = self.profile(sql, repeats)
+        return before, after
+
+    # ── introspection ────────────────────────────────────────────────────────
+    def tables(self):
+        """``{table: row count}`` for every table in the database."""
+        with self._lock:
+            names = [name for (name,) in self.conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY name"
+            )]
+            return {name: self.conn.execute(f"SELECT COUNT(*) FROM {quote(name)}").fetchone()[0] for name in names}
+
+    def columns(self, table):
+        with self._lock:
+            return [row[1] for row in self.conn.execute(f"PRAGMA table_info({quote(table)})")]
+
+    def indexes(self):
+        """The user-visible indexes as a DataFrame (name, table, definition)."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT name, tbl_name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL ORDER BY tbl_name, name"
+            ).fetchall()
+        return pd.DataFrame(rows, columns=["name", "table", "definition"])
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+
+def get_sql_sandbox(session_state):
+    """The session's SQL sandbox; its tables and indexes last as long as the session."""
+    if "sql_sandbox" not in session_state:
+        session_state["sql_sandbox"] = SqlSandbox()
+    return session_state["sql_sandbox"]
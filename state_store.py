@@ -0,0 +1,303 @@
+"""SQLite storage for persisted study state.
+
+Every user gets their own partition.  Plain keys are stored as one JSON row per
+(user, key).  The three collections that grow with use -- flashcards, study
+notes and study sessions -- are stored one item per row with indexed columns,
+so a save only touches the items that changed and pages can query them without
+loading the whole collection.
+
+The database runs in WAL mode: readers never block the writer, and concurrent
+sessions no longer overwrite each other's state.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS state_sections (
+    user_id TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (user_id, key)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS flashcards (
+    user_id TEXT NOT NULL,
+    card_id TEXT NOT NULL,
+    course TEXT,
+    next_review TEXT,
+    value TEXT NOT NULL,
+    PRIMARY KEY (user_id, card_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_flashcards_due ON flashcards (user_id, course, next_review);
+CREATE INDEX IF NOT EXISTS idx_flashcards_next_review ON flashcards (user_id, next_review);
+
+CREATE TABLE IF NOT EXISTS study_notes (
+    user_id TEXT NOT NULL,
+    course TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    title TEXT,
+    note_date TEXT,
+    value TEXT NOT NULL,
+    PRIMARY KEY (user_id, course, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_study_notes_date ON study_notes (user_id, course, note_date);
+
+CREATE TABLE IF NOT EXISTS study_sessions (
+    user_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    course TEXT,
+    session_date TEXT,
+    value TEXT NOT NULL,
+    PRIMARY KEY (user_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_study_sessions_course ON study_sessions (user_id, course, session_date);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def encode(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+# Collections stored one item per row.  ``items`` turns the session value into
+# {item_id: item}; ``assemble`` rebuilds the session value from {item_id: item}.
+def _flashcard_items(value):
+    return dict(value) if isinstance(value, dict) else {}
+
+
+def _note_items(value):
+    items = {}
+    if isinstance(value, dict):
+        for course, notes in value.items():
+            for position, note in enumerate(notes or []):
+                items[(course, position)] = note
+    return items
+
+
+def _session_items(value):
+    return dict(enumerate(value)) if isinstance(value, list) else {}
+
+
+def _assemble_notes(items):
+    notes = {}
+    for (course, position) in sorted(items):
+        notes.setdefault(course, []).append(items[(course, position)])
+    return notes
+
+
+def _assemble_sessions(items):
+    return [items[position] for position in sorted(items)]
+
+
+def _get(item, field):
+    return item.get(field) if isinstance(item, dict) else None
+
+
+COLLECTIONS = {
+    "flashcards": {
+        "items": _flashcard_items,
+        "assemble": dict,
+        "table": "flashcards",
+        "id_columns": ("card_id",),
+        "columns": lambda item: (_get(item, "course"), _get(item, "next_review")),
+        "column_names": ("course", "next_review"),
+    },
+    "study_notes": {
+        "items": _note_items,
+        "assemble": _assemble_notes,
+        "table": "study_notes",
+        "id_columns": ("course", "position"),
+        "columns": lambda item: (_get(item, "title"), _get(item, "date")),
+        "column_names": ("title", "note_date"),
+    },
+    "study_sessions": {
+        "items": _session_items,
+        "assemble": _assemble_sessions,
+        "table": "study_sessions",
+        "id_columns": ("position",),
+        "columns": lambda item: (_get(item, "course"), _get(item, "date")),
+        "column_names": ("course", "session_date"),
+    },
+}
+
+
+def _id_tuple(item_id):
+    return item_id if isinstance(item_id, tuple) else (item_id,)
+
+
+class StateStore:
+    def __init__(self, path):
+        self.path = str(path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=30000")
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(SCHEMA)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    # ── reads ────────────────────────────────────────────────────────────────
+    def has_user(self, user_id):
+        conn = self.connection()
+        if conn.execute("SELECT 1 FROM state_sections WHERE user_id = ? LIMIT 1", (user_id,)).fetchone():
+            return True
+        for spec in COLLECTIONS.values():
+            if conn.execute(f"SELECT 1 FROM {spec['table']} WHERE user_id = ? LIMIT 1", (user_id,)).fetchone():
+                return True
+        return False
+
+    def load(self, user_id, keys):
+        """Return {key: value} for ``user_id`` plus the raw JSON of every row read.
+
+        The raw JSON lets the caller seed its change detection without
+        re-encoding what it just loaded.
+        """
+        conn = self.connection()
+        payload = {}
+        raw = {}
+        wanted = set(keys)
+        for key, value in conn.execute("SELECT key, value FROM state_sections WHERE user_id = ?", (user_id,)):
+            if key in wanted and key not in COLLECTIONS:
+                payload[key] = json.loads(value)
+                raw[key] = value
+        for key, spec in COLLECTIONS.items():
+            if key not in wanted:
+                continue
+            id_cols = ", ".join(spec["id_columns"])
+            rows = conn.execute(f"SELECT {id_cols}, value FROM {spec['table']} WHERE user_id = ?", (user_id,)).fetchall()
+            items = {}
+            item_raw = {}
+            for row in rows:
+                item_id = row[0] if len(spec["id_columns"]) == 1 else tuple(row[:-1])
+                items[item_id] = json.loads(row[-1])
+                item_raw[item_id] = row[-1]
+            marker = conn.execute(
+                "SELECT 1 FROM state_sections WHERE user_id = ? AND key = ?", (user_id, key)
+            ).fetchone()
+            if items or marker:
+                payload[key] = spec["assemble"](items)
+                raw[key] = item_raw
+        return payload, raw
+
+    def due_flashcards(self, user_id, before_iso, course=None, limit=None):
+        sql = "SELECT card_id, value FROM flashcards WHERE user_id = ? AND next_review <= ?"
+        params = [user_id, before_iso]
+        if course is not None:
+            sql += " AND course = ?"
+            params.append(course)
+        sql += " ORDER BY next_review"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return {card_id: json.loads(value) for card_id, value in self.connection().execute(sql, params)}
+
+    def notes_for_course(self, user_id, course):
+        rows = self.connection().execute(
+            "SELECT value FROM study_notes WHERE user_id = ? AND course = ? ORDER BY position", (user_id, course)
+        )
+        return [json.loads(value) for (value,) in rows]
+
+    def sessions_for_course(self, user_id, course):
+        rows = self.connection().execute(
+            "SELECT value FROM study_sessions WHERE user_id = ? AND course = ? ORDER BY position", (user_id, course)
+        )
+        return [json.loads(value) for (value,) in rows]
+
+    # ── writes ───────────────────────────────────────────────────────────────
+    def write(self, user_id, sections, collections):
+        """Apply one save in a single transaction.
+
+        ``sections`` maps plain keys to their JSON text.  ``collections`` maps a
+        collection key to ``(upserts, deletes)`` where ``upserts`` is
+        {item_id: (index_columns, json_text)} and ``deletes`` is a list of item
+        ids.  ``index_columns`` comes from the collection's ``columns`` function.
+        Returns the number of bytes written.
+        """
+        conn = self.connection()
+        now = time.time()
+        written = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for key, value in sections.items():
+                conn.execute(
+                    "INSERT INTO state_sections (user_id, key, value, updated_at) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (user_id, key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
+                    (user_id, key, value, now),
+                )
+                written += len(value)
+            for key, (upserts, deletes) in collections.items():
+                spec = COLLECTIONS[key]
+                table = spec["table"]
+                id_cols = spec["id_columns"]
+                cols = ("user_id",) + id_cols + spec["column_names"] + ("value",)
+                placeholders = ", ".join("?" for _ in cols)
+                updates = ", ".join(f"{c} = excluded.{c}" for c in spec["column_names"] + ("value",))
+                conn.executemany(
+                    f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({placeholders}) "
+                    f"ON CONFLICT (user_id, {', '.join(id_cols)}) DO UPDATE SET {updates}",
+                    [
+                        (user_id,) + _id_tuple(item_id) + tuple(columns) + (text,)
+                        for item_id, (columns, text) in upserts.items()
+                    ],
+                )
+                where = " AND ".join(f"{c} = ?" for c in id_cols)
+                conn.executemany(
+                    f"DELETE FROM {table} WHERE user_id = ? AND {where}",
+                    [(user_id,) + _id_tuple(item_id) for item_id in deletes],
+                )
+                # Marker row so an emptied collection still loads as empty.
+                conn.execute(
+                    "INSERT INTO state_sections (user_id, key, value, updated_at) VALUES (?, ?, '', ?) "
+                    "ON CONFLICT (user_id, key) DO UPDATE SET updated_at = excluded.updated_at",
+                    (user_id, key, now),
+                )
+                written += sum(len(text) for _, text in upserts.values())
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return written
+
+    def reassign_user(self, old_user_id, new_user_id):
+        """Move every row of ``old_user_id`` to ``new_user_id`` in one transaction.
+
+        Rows ``new_user_id`` already had are deleted first.
+        """
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for table in ["state_sections"] + [spec["table"] for spec in COLLECTIONS.values()]:
+                conn.execute(f"DELETE FROM {table} WHERE user_id = ?", (new_user_id,))
+                conn.execute(f"UPDATE {table} SET user_id = ? WHERE user_id = ?", (new_user_id, old_user_id))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def get_meta(self, key):
+        row = self.connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key, value):
+        self.connection().execute(
+            "INSERT INTO meta (key, value) VALUES (?, ?) ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
@@ -0,0 +1,368 @@
+"""One-pass, mergeable statistics for files streamed in chunks.
+
+The Statistical Analysis tool runs ``scipy.stats`` on the whole table from the
+data editor, which has to fit in memory.  ``summarize`` reads a CSV or Parquet
+file ``chunk_rows`` rows at a time and folds each chunk into accumulators that
+merge exactly (Chan et al.'s pairwise update, extended to third and fourth
+moments by Pébay), so memory is bounded by the chunk size and the number of
+columns, never by the file:
+
+* ``Moments``: count, mean, M2, M3, M4, min and max per numeric column
+  (descriptive statistics, skewness, kurtosis);
+* ``CoMoments``: per pair of columns, the count, means, sums of squares and
+  co-moment over the rows where both are present (covariance, correlation and
+  simple regression, pairwise-complete like ``DataFrame.corr``);
+* ``GroupMoments``: count, mean and M2 per group of each categorical column
+  (one-way ANOVA sums of squares);
+* ``Reservoir``: a uniform sample of rows (bottom-k by random key, which also
+  merges), for quartiles and histograms -- exact while the file has fewer rows
+  than the sample, approximate beyond.
+
+Each chunk is reduced with vectorized NumPy (masked matrix products for the
+pairwise terms) and centred on its own means before merging, which keeps the
+sums as stable as Welford's per-value update.
+"""
+
+import io
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from scipy import stats
+
+CHUNK_ROWS = 100_000
+RESERVOIR_ROWS = 100_000
+MAX_GROUPS = 1_000  # categorical columns with more distinct values are not tracked for ANOVA
+
+
+def _counts(mask):
+    return mask.sum(axis=0).astype(float)
+
+
+class Moments:
+    """Count, mean, M2..M4, min and max of each column, missing values skipped."""
+
+    def __init__(self, k):
+        self.n = np.zeros(k)
+        self.mean = np.zeros(k)
+        self.m2 = np.zeros(k)
+        self.m3 = np.zeros(k)
+        self.m4 = np.zeros(k)
+        self.min = np.full(k, np.inf)
+        self.max = np.full(k, -np.inf)
+
+    @classmethod
+    def of(cls, block):
+        """The moments of a 2-D float block (NaN = missing)."""
+        present = ~np.isnan(block)
+        moments = cls(block.shape[1])
+        moments.n = _counts(present)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            moments.mean = np.where(moments.n > 0, np.nansum(block, axis=0) / moments.n, 0.0)
+        deviation = np.where(present, block - moments.mean, 0.0)
+        squared = deviation * deviation
+        moments.m2 = squared.sum(axis=0)
+        moments.m3 = (squared * deviation).sum(axis=0)
+        moments.m4 = (squared * squared).sum(axis=0)
+        moments.min = np.where(present, block, np.inf).min(axis=0, initial=np.inf)
+        moments.max = np.where(present, block, -np.inf).max(axis=0, initial=-np.inf)
+        return moments
+
+    def merge(self, other):
+        na, nb = self.n, other.n
+        n = na + nb
+        safe = np.where(n > 0, n, 1.0)
+        delta = other.mean - self.mean
+        self.m4 = (
+            self.m4 + other.m4
+            + delta ** 4 * na * nb * (na * na - na * nb + nb * nb) / safe ** 3
+            + 6 * delta ** 2 * (na * na * other.m2 + nb * nb * self.m2) / safe ** 2
+            + 4 * delta * (na * other.m3 - nb * self.m3) / safe
+        )
+        self.m3 = (
+            self.m3 + other.m3
+            + delta ** 3 * na * nb * (na - nb) / safe ** 2
+            + 3 * delta * (na * other.m2 - nb * self.m2) / safe
+        )
+        self.m2 = self.m2 + other.m2 + delta ** 2 * na * nb / safe
+        self.mean = self.mean + delta * nb / safe
+        self.n = n
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    def variance(self, ddof=1):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.n > ddof, self.m2 / (self.n - ddof), np.nan)
+
+    def skewness(self):
+        """Sample skewness, as ``scipy.stats.skew`` (biased) computes it."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.sqrt(self.n) * self.m3 / self.m2 ** 1.5
+
+    def kurtosis(self):
+        """Excess kurtosis, as ``scipy.stats.kurtosis`` (Fisher, biased) computes it."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.n * self.m4 / (self.m2 * self.m2) - 3.0
+
+
+class CoMoments:
+    """Pairwise-complete co-moments: entry [i, j] covers the rows where columns i and j are both present.
+
+    ``mean[i, j]`` and ``m2[i, j]`` are column i's mean and sum of squared
+    deviations over those rows; ``c[i, j]`` is the co-moment of i and j.
+    """
+
+    def __init__(self, k):
+        self.n = np.zeros((k, k))
+        self.mean = np.zeros((k, k))
+        self.m2 = np.zeros((k, k))
+        self.c = np.zeros((k, k))
+
+    @classmethod
+    def of(cls, block):
+        present = ~np.isnan(block)
+        mask = present.astype(float)
+        with np.errstate(invalid="ignore"):
+            shift = np.nan_to_num(np.nanmean(block, axis=0)) if len(block) else np.zeros(block.shape[1])
+        centred = np.where(present, block - shift, 0.0)
+        moments = cls(block.shape[1])
+        moments.n = mask.T @ mask
+        sums = centred.T @ mask  # [i, j]: sum of column i over rows where j is present
+        squares = (centred * centred).T @ mask
+        products = centred.T @ centred  # zero wherever either value is missing
+        safe = np.where(moments.n > 0, moments.n, 1.0)
+        moments.mean = shift[:, None] + sums / safe
+        moments.m2 = squares - sums * sums / safe
+        moments.c = products - sums * sums.T / safe
+        return moments
+
+    def merge(self, other):
+        na, nb = self.n, other.n
+        n = na + nb
+        safe = np.where(n > 0, n, 1.0)
+        delta = other.mean - self.mean
+        self.c = self.c + other.c + delta * delta.T * na * nb / safe
+        self.m2 = self.m2 + other.m2 + delta * delta * na * nb / safe
+        self.mean = self.mean + delta * nb / safe
+        self.n = n
+        return self
+
+    def covariance(self, ddof=1):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.n > ddof, self.c / (self.n - ddof), np.nan)
+
+    def correlation(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            r = self.c / np.sqrt(self.m2 * self.m2.T)
+        return np.clip(r, -1.0, 1.0)
+
+
+def correlation_p_values(r, n):
+    """Two-sided p-values of Pearson correlations ``r`` from ``n`` pairs each (as ``pearsonr``)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        dof = n - 2
+        t = r * np.sqrt(dof / np.maximum(1.0 - r * r, 1e-300))
+        p = 2 * stats.t.sf(np.abs(t), dof)
+    return np.where(dof > 0, p, np.nan)
+
+
+class GroupMoments:
+    """Count, mean and M2 of every numeric column within each group of one categorical column."""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.n = pd.DataFrame(columns=self.columns, dtype=float)
+        self.mean = self.n.copy()
+        self.m2 = self.n.copy()
+
+    @classmethod
+    def of(cls, groups, frame):
+        grouped = frame.groupby(groups, sort=False, observed=True, dropna=True)
+        moments = cls(frame.columns)
+        moments.n = grouped.count().astype(float)
+        moments.mean = grouped.mean().fillna(0.0)
+        moments.m2 = (grouped.var(ddof=0) * moments.n).fillna(0.0)
+        return moments
+
+    def merge(self, other):
+        index = self.n.index.union(other.n.index, sort=False)
+        na, nb = (frame.reindex(index, fill_value=0.0) for frame in (self.n, other.n))
+        ma, mb = (frame.reindex(index, fill_value=0.0) for frame in (self.mean, other.mean))
+        m2a, m2b = (frame.reindex(index, fill_value=0.0) for frame in (self.m2, other.m2))
+        n = na + nb
+        safe = n.where(n > 0, 1.0)
+        delta = mb - ma
+        self.m2 = m2a + m2b + delta * delta * na * nb / safe
+        self.mean = ma + delta * nb / safe
+        self.n = n
+        return self
+
+    def anova(self, column):
+        """One-way ANOVA of ``column`` across the groups: sums of squares, F and p."""
+        n, mean, m2 = self.n[column], self.mean[column], self.m2[column]
+        keep = n > 0
+        n, mean, m2 = n[keep], mean[keep], m2[keep]
+        total = n.sum()
+        grand = (n * mean).sum() / total if total else np.nan
+        ss_between = float((n * (mean - grand) ** 2).sum())
+        ss_within = float(m2.sum())
+        df_between, df_within = len(n) - 1, total - len(n)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            f = (ss_between / df_between) / (ss_within / df_within) if df_between > 0 and df_within > 0 else np.nan
+        p = float(stats.f.sf(f, df_between, df_within)) if np.isfinite(f) else np.nan
+        table = pd.DataFrame({
+            "Count": n.astype(int),
+            "Mean": mean,
+            "Std Dev": np.sqrt(np.where(n > 1, m2 / (n - 1).where(n > 1, 1), np.nan)),
+        }).sort_index()
+        return {
+            "ss_between": ss_between, "ss_within": ss_within, "df_between": int(df_between),
+            "df_within": int(df_within), "f": f, "p": p, "groups": table,
+        }
+
+
+class Reservoir:
+    """A uniform random sample of up to ``size`` rows: the rows with the smallest random keys."""
+
+    def __init__(self, k, size=RESERVOIR_ROWS, seed=0):
+        self.size = size
+        self.rng = np.random.default_rng(seed)
+        self.keys = np.empty(0)
+        self.rows = np.empty((0, k))
+
+    def update(self, block):
+        keys = np.concatenate([self.keys, self.rng.random(len(block))])
+        rows = np.concatenate([self.rows, block])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size)[:self.size]
+            keys, rows = keys[keep], rows[keep]
+        self.keys, self.rows = keys, rows
+
+    def merge(self, other):
+        self.rng = self.rng if len(self.keys) else other.rng
+        keys = np.concatenate([self.keys, other.keys])
+        rows = np.concatenate([self.rows, other.rows])
+        if len(keys) > self.size:
+            keep = np.argpartition(keys, self.size)[:self.size]
+            keys, rows = keys[keep], rows[keep]
+        self.keys, self.rows = keys, rows
+        return self
+
+
+class StreamSummary:
+    """Everything the Statistical Analysis tool reports, accumulated chunk by chunk."""
+
+    def __init__(self, numeric, categorical, reservoir_rows=RESERVOIR_ROWS, seed=0):
+        self.numeric = list(numeric)
+        self.categorical = list(categorical)
+        k = len(self.numeric)
+        self.rows = 0
+        self.chunks = 0
+        self.moments = Moments(k)
+        self.comoments = CoMoments(k)
+        self.groups = {column: GroupMoments(self.numeric) for column in self.categorical}
+        self.sample = Reservoir(k, reservoir_rows, seed)
+
+    def update(self, chunk):
+        block = chunk[self.numeric].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+        self.rows += len(chunk)
+        self.chunks += 1
+        self.moments.merge(Moments.of(block))
+        self.comoments.merge(CoMoments.of(block))
+        self.sample.update(block)
+        values = pd.DataFrame(block, columns=self.numeric, index=chunk.index)
+        for column, moments in list(self.groups.items()):
+            if moments is None:
+                continue
+            moments.merge(GroupMoments.of(chunk[column], values))
+            if len(moments.n) > MAX_GROUPS:
+                self.groups[column] = None
+        return self
+
+    def _at(self, column):
+        return self.numeric.index(column)
+
+    def describe(self, column):
+        i = self._at(column)
+        m = self.moments
+        sample = self.sample.rows[:, i]
+        sample = sample[~np.isnan(sample)]
+        q1, median, q3 = np.quantile(sample, [0.25, 0.5, 0.75]) if len(sample) else (np.nan,) * 3
+        return {
+            "count": int(m.n[i]), "mean": m.mean[i], "std": float(np.sqrt(m.variance()[i])),
+            "variance": float(m.variance()[i]), "min": m.min[i], "max": m.max[i], "sum": m.mean[i] * m.n[i],
+            "skewness": float(m.skewness()[i]), "kurtosis": float(m.kurtosis()[i]),
+            "q1": q1, "median": median, "q3": q3, "quantiles_exact": self.rows <= self.sample.size,
+        }
+
+    def correlation(self, x, y):
+        """Pearson r, its p-value and the number of complete pairs."""
+        i, j = self._at(x), self._at(y)
+        r = float(self.comoments.correlation()[i, j])
+        n = self.comoments.n[i, j]
+        return r, float(correlation_p_values(np.array(r), n)), int(n)
+
+    def regression(self, x, y):
+        """Least-squares ``y = slope * x + intercept``, reported like ``scipy.stats.linregress``."""
+        i, j = self._at(x), self._at(y)
+        c = self.comoments
+        n = c.n[i, j]
+        slope = c.c[i, j] / c.m2[i, j]
+        intercept = c.mean[j, i] - slope * c.mean[i, j]
+        r, p, _ = self.correlation(x, y)
+        stderr = np.sqrt((1 - r * r) * c.m2[j, i] / c.m2[i, j] / (n - 2)) if n > 2 else np.nan
+        return {"slope": slope, "intercept": intercept, "r": r, "p": p, "stderr": float(stderr), "n": int(n)}
+
+    def anova(self, group, value):
+        moments = self.groups.get(group)
+        if moments is None:
+            raise ValueError(f"'{group}' has more than {MAX_GROUPS} distinct values; ANOVA needs a grouping column")
+        return moments.anova(value)
+
+    def covariance_matrix(self):
+        return pd.DataFrame(self.comoments.covariance(), index=self.numeric, columns=self.numeric)
+
+    def correlation_matrix(self):
+        return pd.DataFrame(self.comoments.correlation(), index=self.numeric, columns=self.numeric)
+
+    def sample_frame(self):
+        return pd.DataFrame(self.sample.rows, columns=self.numeric)
+
+
+def iter_chunks(source, name=None, chunk_rows=CHUNK_ROWS):
+    """Yield DataFrames of up to ``chunk_rows`` rows from a CSV or Parquet path or file object.
+
+    ``name`` gives the format when ``source`` is a file object without one.
+    """
+    name = str(name or getattr(source, "name", source))
+    if name.lower().endswith(".parquet"):
+        parquet = pq.ParquetFile(source)
+        for batch in parquet.iter_batches(batch_size=chunk_rows):
+            yield batch.to_pandas()
+    elif name.lower().endswith((".csv", ".txt")):
+        if isinstance(source, (bytes, bytearray)):
+            source = io.BytesIO(source)
+        with pd.read_csv(source, chunksize=chunk_rows) as reader:
+            yield from reader
+    else:
+        raise ValueError(f"Unsupported file type: {Path(name).suffix or name} (use .csv or .parquet)")
+
+
+def summarize(source, name=None, chunk_rows=CHUNK_ROWS, reservoir_rows=RESERVOIR_ROWS, seed=0):
+    """Stream ``source`` once and return its ``StreamSummary``.
+
+    Numeric and categorical columns are decided by the first chunk; later
+    values that do not parse as numbers count as missing.
+    """
+    summary = None
+    for chunk in iter_chunks(source, name, chunk_rows):
+        if summary is None:
+            numeric = chunk.select_dtypes(include="number").columns.tolist()
+            categorical = [column for column in chunk.columns if column not in numeric]
+            summary = StreamSummary(numeric, categorical, reservoir_rows, seed)
+        summary.update(chunk)
+    if summary is None:
+        raise ValueError("The file has no rows")
+    return summary
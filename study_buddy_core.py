@@ -0,0 +1,231 @@
+"""Shared helpers used by several pages: the OpenAI client, curated question
+banks, practice question generation/evaluation and the programme outcomes."""
+
+import os
+import random
+import time
+from datetime import datetime
+
+import streamlit as st
+from openai import OpenAI
+
+from content import (
+    get_courses,
+    get_curated_exam_questions,
+    get_curated_flashcards,
+    get_curated_practice_questions,
+)
+from flashcard_queue import get_review_queue
+from llm_gateway import FakeChatClient, LLMGateway, ResponseCache
+
+AI_NOT_CONFIGURED_MESSAGE = "AI features are not configured. Set the OpenAI integration environment variables to enable them."
+
+_ai_api_key = os.environ.get("AI_INTEGRATIONS_OPENAI_API_KEY")
+_ai_base_url = os.environ.get("AI_INTEGRATIONS_OPENAI_BASE_URL")
+if os.environ.get("STUDY_BUDDY_FAKE_LLM"):
+    client = FakeChatClient()
+else:
+    client = OpenAI(api_key=_ai_api_key, base_url=_ai_base_url) if _ai_api_key else None
+llm = LLMGateway(client, ResponseCache())
+
+courses_data = get_courses()
+
+
+def stream_html(chunks, refresh_interval=0.05):
+    """Show streamed HTML as it arrives and return the full text.
+
+    ``st.write_stream`` would escape the HTML the AI tabs ask for, so the
+    partial text is redrawn into one placeholder, at most every
+    ``refresh_interval`` seconds.  The placeholder is cleared at the end; the
+    caller stores the text and renders it once.
+    """
+    placeholder = st.empty()
+    text = ""
+    last_draw = 0.0
+    try:
+        for piece in chunks:
+            text += piece
+            if time.monotonic() - last_draw >= refresh_interval:
+                placeholder.markdown(text + " ▌", unsafe_allow_html=True)
+                last_draw = time.monotonic()
+    finally:
+        placeholder.empty()
+    return text
+
+
+def load_curated_flashcards(course_code):
+    deck = get_curated_flashcards(course_code)
+    if not deck:
+        return 0
+
+    if 'flashcard_counter' not in st.session_state:
+        st.session_state.flashcard_counter = len(st.session_state.flashcards)
+
+    existing_cards = {
+        (card.get('course'), card.get('front'), card.get('back'))
+        for card in st.session_state.flashcards.values()
+    }
+
+    review_queue = get_review_queue(st.session_state)
+    added = 0
+    now_iso = datetime.now().isoformat()
+    for card in deck:
+        signature = (course_code, card['front'], card['back'])
+        if signature in existing_cards:
+            continue
+
+        card_id = f"card_{st.session_state.flashcard_counter}"
+        st.session_state.flashcard_counter += 1
+        st.session_state.flashcards[card_id] = {
+            'front': card['front'],
+            'back': card['back'],
+            'course': course_code,
+            'tags': card.get('tags', []),
+            'interval': 1,
+            'repetitions': 0,
+            'ease_factor': 2.5,
+            'next_review': now_iso,
+            'created': now_iso
+        }
+        review_queue.upsert(card_id, st.session_state.flashcards[card_id])
+        existing_cards.add(signature)
+        added += 1
+
+    st.session_state.flashcard_stats['total_cards'] = len(st.session_state.flashcards)
+    return added
+
+
+def build_curated_exam_questions(course_code, question_type_labels, num_questions):
+    bank = get_curated_exam_questions(course_code)
+    if not bank:
+        return []
+
+    type_map = {
+        "General": "general",
+        "Knowledge-based": "knowledge",
+        "Skills-based": "skills",
+        "Case Study": "case_study"
+    }
+    allowed_types = {type_map[label] for label in question_type_labels if label in type_map}
+    filtered_bank = [question for question in bank if question['type'] in allowed_types] if allowed_types else bank[:]
+    if not filtered_bank:
+        filtered_bank = bank[:]
+
+    shuffled_bank = filtered_bank[:]
+    random.shuffle(shuffled_bank)
+
+    selected_questions = []
+    for idx in range(num_questions):
+        item = shuffled_bank[idx % len(shuffled_bank)]
+        selected_questions.append({
+            'id': idx,
+            'question': f"{item['question']}\n\nANSWER: {item['answer']}",
+            'type': item['type'],
+            'user_answer': ''
+        })
+
+    return selected_questions
+
+
+def build_curated_practice_question(course_code, question_type="general"):
+    bank = get_curated_practice_questions(course_code)
+    if not bank:
+        return None
+
+    filtered_bank = [item for item in bank if item['type'] == question_type]
+    if not filtered_bank:
+        filtered_bank = bank[:]
+
+    selected_item = random.choice(filtered_bank)
+    return f"{selected_item['question']}\n\nANSWER: {selected_item['answer']}"
+
+knowledge_outcomes = [
+    "Concepts and theories used in data analysis",
+    "Processes and tools used for data analysis",
+    "Databases, cloud services and native cloud tools used in data analysis",
+    "Programming and programmatic data analysis",
+    "Processes and tools for data visualization",
+    "Problem identification methodologies for problem solving and data error discovery",
+    "Conclusive report writing methodologies for clear communication",
+    "Real-world situations to guide decision-making in data analysis",
+    "Industry-relevant tools used in field data analysis",
+    "Essential concepts in data science and engineering related to Big Data",
+    "Dashboard theory, universal design principles and interactive dashboards",
+    "Regulations, data analysis lifecycle and quantitative vs qualitative data",
+    "GDPR guidelines, data maintenance and critical data thinking",
+    "History, traditions and distinctive nature of the data analysis discipline"
+]
+
+skills_outcomes = [
+    "Apply knowledge of data model results to business problems",
+    "Apply data collection and cleaning from various sources to secure storage",
+    "Master relevant tools, techniques and material for data analysis and presentation",
+    "Master tools and techniques to generate and visualise data through reports and infographics",
+    "Apply knowledge of suitable data analysis use-cases to project problems",
+    "Explain vocational choices of tools, methods and techniques for data analysis",
+    "Reflect over own vocational practice and adjust under supervision",
+    "Find information about data analysis techniques relevant to projects",
+    "Study workplace environments and identify issues through data analysis",
+    "Find and interact with data from large data sources and cloud-based systems",
+    "Find applicable data models for data sets during project planning"
+]
+
+competence_outcomes = [
+    "Understand the ethical principles for sourced, stored, and used data",
+    "Develop an ethical attitude as a responsible data analyst",
+    "Plan and carry out data analysis tasks according to GDPR principles and practices",
+    "Exchange points of view with others in data analysis and discuss good practices",
+    "Contribute to organisational quality assurance and optimisation through data analysis",
+    "Contribute to solving practical problems through computational thinking techniques",
+    "Contribute to data safety by considering security measures in each project phase",
+    "Develop products of relevance to data analysis and optimize own work methods"
+]
+
+
+def generate_practice_question(course, question_type="general", timeout=None):
+    curated_question = build_curated_practice_question(course.get('code'), question_type)
+    if curated_question:
+        return curated_question
+
+    if client is None:
+        return AI_NOT_CONFIGURED_MESSAGE
+
+    course_info = f"Course: {course['name']}\nDescription: {course['description']}\nKnowledge topics: {', '.join(course['knowledge'][:3])}\nSkills: {', '.join(course['skills'][:3])}"
+    
+    prompts = {
+        "general": f"Generate one practice question for this data analysis course:\n{course_info}\n\nFormat: Start with the question, then on a new line write 'ANSWER:' followed by a clear answer (2-3 sentences). Make it practical and test real understanding.",
+        "knowledge": f"Generate a knowledge-based question testing theoretical understanding:\n{course_info}\n\nFormat: Question first, then 'ANSWER:' on new line with explanation.",
+        "skills": f"Generate a practical skills-based question:\n{course_info}\n\nFormat: Describe a scenario or task, then 'ANSWER:' with the expected approach or solution.",
+        "case_study": f"Generate a mini case study question:\n{course_info}\n\nFormat: Present a brief business scenario (2-3 sentences), ask what the student should do, then 'ANSWER:' with the recommended approach."
+    }
+    
+    try:
+        return llm.complete(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You are an educational tutor for a Data Analyst vocational program. Generate clear, practical questions that test understanding of data analysis concepts."},
+                {"role": "user", "content": prompts.get(question_type, prompts["general"])}
+            ],
+            max_tokens=400,
+            timeout=timeout,
+            # Identical prompts must still produce fresh questions.
+            use_cache=False
+        )
+    except Exception as e:
+        return f"Error generating question: {str(e)}"
+
+def evaluate_answer(question, correct_answer, user_answer):
+    if client is None:
+        return AI_NOT_CONFIGURED_MESSAGE
+
+    try:
+        return llm.complete(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": "You are a supportive educational tutor. Evaluate student answers and provide constructive feedback. Be encouraging but accurate."},
+                {"role": "user", "content": f"Question: {question}\n\nCorrect answer concept: {correct_answer}\n\nStudent's answer: {user_answer}\n\nProvide brief feedback (2-3 sentences): Is the answer correct or partially correct? What did they get right? What could be improved?"}
+            ],
+            max_tokens=200
+        )
+    except Exception as e:
+        return f"Error evaluating answer: {str(e)}"
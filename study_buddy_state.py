@@ -1,7 +1,21 @@
+import atexit
+import hashlib
 import json
+import threading
 from pathlib import Path
 
+from state_store import COLLECTIONS, StateStore, encode
+
+STATE_DB = Path(".study_buddy_state.db")
+# Older JSON formats, imported into DEFAULT_USER on first load and claimed
+# from there with claim_shared_state.
 STATE_FILE = Path(".study_buddy_state.json")
+STATE_DIR = Path(".study_buddy_state")
+
+DEFAULT_USER = "default"
+# Session-state key holding what this session last sent to the store, so two
+# sessions of the same user never act on each other's view of it.
+DIGESTS_KEY = "_persisted_digests"
 
 PERSIST_KEYS = [
     "completed_courses",
@@ -15,9 +29,13 @@ PERSIST_KEYS = [
     "study_notes",
     "flashcards",
     "flashcard_stats",
+    "flashcard_algorithm",
+    "note_history_depth",
+    "spell_ignore_words",
     "exam_mode",
     "exam_questions",
     "exam_answers",
+    "exam_results",
     "code_snippets",
     "code_snippet_favorites",
     "study_sessions",
@@ -73,25 +91,223 @@ STUDY_PATH_JAN2026 = [
 ]
 
 
-def load_persisted_state(session_state):
+def _digest(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+def _read_legacy_sections():
+    if not STATE_DIR.is_dir():
+        return None
+    payload = {}
+    for key in PERSIST_KEYS:
+        try:
+            payload[key] = json.loads((STATE_DIR / f"{key}.json").read_text(encoding="utf-8"))
+        except Exception:
+            continue
+    return payload
+
+
+def _read_legacy_file():
     if not STATE_FILE.exists():
-        return
+        return None
     try:
         payload = json.loads(STATE_FILE.read_text(encoding="utf-8"))
     except Exception:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+class _StateWriter:
+    """Write-behind queue in front of the SQLite store.
+
+    Saves compare each key (or each collection item) against the digest of what
+    their session last sent to the store and only enqueue the differences.  A
+    daemon thread applies them per user in one transaction.  Saves that arrive
+    before the thread catches up are merged into the pending batch.  A failed
+    write bumps the user's failure count, which tells every session of that
+    user to drop its digests and resend everything.
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._cond = threading.Condition()
+        self._pending = {}
+        self._busy = False
+        self._thread = None
+        self.failures = {}
+        self.stats = {"saves": 0, "skipped_saves": 0, "sections_written": 0, "bytes_written": 0}
+
+    def submit(self, user_id, sections, collections):
+        with self._cond:
+            batch = self._pending.setdefault(user_id, ({}, {}))
+            batch[0].update(sections)
+            for key, (upserts, deletes) in collections.items():
+                pending_upserts, pending_deletes = batch[1].setdefault(key, ({}, set()))
+                for item_id in deletes:
+                    pending_upserts.pop(item_id, None)
+                    pending_deletes.add(item_id)
+                for item_id, row in upserts.items():
+                    pending_deletes.discard(item_id)
+                    pending_upserts[item_id] = row
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="study-buddy-state-writer", daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    def failure_count(self, user_id):
+        with self._cond:
+            return self.failures.get(user_id, 0)
+
+    def flush(self, timeout=None):
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                pending = self._pending
+                self._pending = {}
+                self._busy = True
+            for user_id, (sections, collections) in pending.items():
+                try:
+                    written = self.store.write(user_id, sections, collections)
+                except Exception:
+                    with self._cond:
+                        self.failures[user_id] = self.failures.get(user_id, 0) + 1
+                    continue
+                with self._cond:
+                    self.stats["sections_written"] += len(sections) + sum(
+                        len(upserts) + len(deletes) for upserts, deletes in collections.values()
+                    )
+                    self.stats["bytes_written"] += written
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+
+_store = StateStore(STATE_DB)
+_writer = _StateWriter(_store)
+atexit.register(_writer.flush, 5)
+
+WRITE_STATS = _writer.stats
+
+
+def get_state_store():
+    return _store
+
+
+def _migrate_legacy_json():
+    if _store.get_meta("legacy_json_migrated"):
         return
+    legacy = _read_legacy_sections() or _read_legacy_file()
+    if legacy and not _store.has_user(DEFAULT_USER):
+        save_persisted_state(legacy, DEFAULT_USER)
+        _writer.flush()
+    _store.set_meta("legacy_json_migrated", "1")
 
-    if not isinstance(payload, dict):
+
+def shared_state_available():
+    """True while data saved before per-browser ids is waiting under DEFAULT_USER."""
+    try:
+        return not _store.get_meta("shared_state_claimed") and _store.has_user(DEFAULT_USER)
+    except Exception:
+        return False
+
+
+def claim_shared_state(session_state, user_id):
+    """Make the DEFAULT_USER data ``user_id``'s, replacing what it had, and load it.
+
+    Before per-browser ids everything lived under DEFAULT_USER (and before
+    that in JSON files).  On a shared deployment the first visitor after the
+    upgrade need not be its owner, so it stays there until a user claims it
+    from the sidebar.  Only one user can.
+    """
+    if user_id == DEFAULT_USER or not shared_state_available():
+        return False
+    _writer.flush()
+    _store.reassign_user(DEFAULT_USER, user_id)
+    _store.set_meta("shared_state_claimed", "1")
+    for key in PERSIST_KEYS:
+        session_state.pop(key, None)
+    session_state.pop(DIGESTS_KEY, None)
+    load_persisted_state(session_state, user_id)
+    return True
+
+
+def _session_digests(session_state, user_id):
+    failures = _writer.failure_count(user_id)
+    state = session_state.get(DIGESTS_KEY)
+    if state is None or state["user_id"] != user_id or state["failures"] != failures:
+        state = {"user_id": user_id, "failures": failures, "keys": {}}
+        session_state[DIGESTS_KEY] = state
+    return state["keys"]
+
+
+def load_persisted_state(session_state, user_id=DEFAULT_USER):
+    try:
+        _migrate_legacy_json()
+        payload, raw = _store.load(user_id, PERSIST_KEYS)
+    except Exception:
         return
 
+    digests = _session_digests(session_state, user_id)
+    for key, text in raw.items():
+        if key in COLLECTIONS:
+            digests[key] = {item_id: _digest(item) for item_id, item in text.items()}
+        else:
+            digests[key] = _digest(text)
+
     for key in PERSIST_KEYS:
         if key in payload and key not in session_state:
             session_state[key] = payload[key]
 
 
-def save_persisted_state(session_state):
-    payload = {key: session_state.get(key) for key in PERSIST_KEYS if key in session_state}
-    try:
-        STATE_FILE.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
-    except Exception:
-        pass
+def save_persisted_state(session_state, user_id=DEFAULT_USER):
+    digests = _session_digests(session_state, user_id)
+    sections = {}
+    collections = {}
+    for key in PERSIST_KEYS:
+        if key not in session_state:
+            continue
+        value = session_state.get(key)
+        spec = COLLECTIONS.get(key)
+        try:
+            if spec is None:
+                text = encode(value)
+                digest = _digest(text)
+                if digests.get(key) == digest:
+                    continue
+                digests[key] = digest
+                sections[key] = text
+                continue
+
+            known = digests.get(key)
+            first_save = known is None
+            if first_save:
+                known = digests[key] = {}
+            items = spec["items"](value)
+            upserts = {}
+            for item_id, item in items.items():
+                text = encode(item)
+                digest = _digest(text)
+                if known.get(item_id) != digest:
+                    upserts[item_id] = (spec["columns"](item), text)
+                    known[item_id] = digest
+            deletes = [item_id for item_id in known if item_id not in items]
+            for item_id in deletes:
+                del known[item_id]
+            if upserts or deletes or first_save:
+                collections[key] = (upserts, deletes)
+        except Exception:
+            continue
+
+    _writer.stats["saves"] += 1
+    if not sections and not collections:
+        _writer.stats["skipped_saves"] += 1
+        return
+    _writer.submit(user_id, sections, collections)
+
+
+def flush_persisted_state(timeout=None):
+    return _writer.flush(timeout)
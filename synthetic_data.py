@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""Reproducible synthetic datasets for the Playground tools and benchmarks.
+
+Each Playground tool seeds a handful of hand-written rows.  ``generate`` builds
+the same tables -- ``SCHEMAS`` mirrors their columns -- at any size from 10 to
+10M rows, with vectorized NumPy draws:
+
+* numbers follow a chosen distribution (normal, lognormal, uniform, linear in
+  another column plus noise, a price list times a quantity);
+* text columns draw codes into a small vocabulary with optional Zipf skew,
+  so ten million rows cost one integer array and a ``take``;
+* foreign keys such as ``orders.customer_id`` draw ids from 1 to the row count
+  of the table they reference, given in ``references`` (``{"customers": 1000}``)
+  so joins against a generated table of that size always match;
+* ``missing``, ``duplicates`` and ``outliers`` are fractions of cells / rows
+  blanked, copied from other rows, or pushed 5-10 standard deviations out;
+  ``skew`` overrides the Zipf exponent of every categorical column.
+
+Rows are generated in blocks of ``BLOCK_ROWS``, each from its own seeded
+generator, so a dataset is identical whether it is built in memory or streamed
+to disk by ``write_dataset``, and the defects drawn for it do not change the
+underlying values.
+
+Run from the repository root:
+    python synthetic_data.py orders 10000000 --out orders.parquet --missing 0.02
+"""
+
+import argparse
+import time
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+BLOCK_ROWS = 1_000_000
+
+FIRST_NAMES = [
+    "Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Henry", "Ivy", "Jack",
+    "Karen", "Liam", "Maya", "Noah", "Olivia", "Priya", "Quinn", "Ravi", "Sofia", "Tom",
+]
+LAST_NAMES = [
+    "Smith", "Johnson", "Brown", "Ross", "Wilson", "Lee", "Chen", "Garcia", "Patel", "Khan",
+    "Murphy", "Nguyen", "Okafor", "Silva", "Taylor", "Walker", "Young", "Zhang",
+]
+PRODUCTS = ["Laptop", "Phone", "Tablet", "Watch", "Headphones", "Monitor", "Keyboard"]
+PRICES = {"Laptop": 999, "Phone": 699, "Tablet": 449, "Watch": 299, "Headphones": 149, "Monitor": 249, "Keyboard": 89}
+REGIONS = ["North", "South", "East", "West"]
+CITIES = ["New York", "Los Angeles", "Chicago", "Houston", "Phoenix", "Philadelphia", "San Antonio", "San Diego"]
+DEPARTMENTS = ["Sales", "IT", "HR", "Finance", "Marketing", "Operations"]
+NOTES = ["Good sale", "Discount applied", "New customer", "Repeat", "Bulk order", "Online", "Returned item"]
+
+
+class Text:
+    """A text column as codes into ``vocab`` (-1 for missing)."""
+
+    def __init__(self, codes, vocab):
+        self.codes = codes
+        self.vocab = list(vocab)
+
+    def take(self, positions):
+        return Text(self.codes[positions], self.vocab)
+
+    def to_array(self):
+        return pd.array(self.vocab, dtype="str").take(self.codes, allow_fill=True)
+
+
+class Column:
+    """A named column; ``make(rng, n, start, columns, skew)`` returns an array or ``Text``.
+
+    ``measure`` columns receive outliers; ``nullable`` ones receive missing values.
+    A column that ``references`` another table is made with ``rows=`` that
+    table's row count when the caller knows it.
+    """
+
+    def __init__(self, name, make, measure=False, nullable=True, references=None):
+        self.name = name
+        self.make = make
+        self.measure = measure
+        self.nullable = nullable
+        self.references = references
+
+
+# ── column generators ────────────────────────────────────────────────────────
+def sequence(first=1):
+    def make(rng, n, start, columns, skew):
+        return np.arange(first + start, first + start + n, dtype=np.int64)
+    return make
+
+
+def integers(low, high):
+    """Uniform integers in [low, high]."""
+    def make(rng, n, start, columns, skew):
+        return rng.integers(low, high + 1, n)
+    return make
+
+
+def foreign_key(default_rows):
+    """Uniform ids in [1, rows] of a table of ``rows`` rows (``default_rows`` if not given)."""
+    def make(rng, n, start, columns, skew, rows=default_rows):
+        return rng.integers(1, max(int(rows), 1) + 1, n)
+    return make
+
+
+def uniform(low, high, decimals=2):
+    def make(rng, n, start, columns, skew):
+        return np.round(rng.uniform(low, high, n), decimals)
+    return make
+
+
+def _bounded(values, low, high, decimals):
+    values = np.clip(values, low if low is not None else -np.inf, high if high is not None else np.inf)
+    values = np.round(values, decimals)
+    return values.astype(np.int64) if decimals <= 0 else values
+
+
+def normal(mean, sd, low=None, high=None, decimals=0):
+    def make(rng, n, start, columns, skew):
+        return _bounded(rng.normal(mean, sd, n), low, high, decimals)
+    return make
+
+
+def lognormal(median, sigma, decimals=0):
+    """Right-skewed positive values with the given median."""
+    def make(rng, n, start, columns, skew):
+        return _bounded(median * rng.lognormal(0.0, sigma, n), None, None, decimals)
+    return make
+
+
+def linear(source, slope, intercept, noise_sd, low=None, decimals=0):
+    """``intercept + slope * source`` plus normal noise: a correlated column."""
+    def make(rng, n, start, columns, skew):
+        base = np.asarray(columns[source], dtype=float)
+        return _bounded(intercept + slope * base + rng.normal(0.0, noise_sd, n), low, None, decimals)
+    return make
+
+
+def priced(source, prices, max_quantity=1):
+    """The price of each row's ``source`` value times a quantity in 1..max_quantity."""
+    def make(rng, n, start, columns, skew):
+        text = columns[source]
+        unit = np.array([prices.get(value, 0) for value in text.vocab], dtype=np.int64)[text.codes]
+        return unit * rng.integers(1, max_quantity + 1, n) if max_quantity > 1 else unit
+    return make
+
+
+def category(values, skew=0.0):
+    """Draws from ``values``; ``skew`` is a Zipf exponent (0 = uniform, 1+ = a few dominate)."""
+    def make(rng, n, start, columns, override):
+        exponent = skew if override is None else override
+        weights = 1.0 / np.arange(1, len(values) + 1) ** exponent
+        return Text(rng.choice(len(values), n, p=weights / weights.sum()), values)
+    return make
+
+
+def names(first=FIRST_NAMES, last=LAST_NAMES):
+    return category([f"{a} {b}" for a in first for b in last])
+
+
+def dates(start, days):
+    """ISO date strings from ``start`` over ``days`` days, as the seed tables store them."""
+    calendar = (np.datetime64(start) + np.arange(days)).astype(str).tolist()
+
+    def make(rng, n, start_row, columns, skew):
+        return Text(rng.integers(0, days, n), calendar)
+    return make
+
+
+def codes(prefix, count, width=3, skew=0.0):
+    return category([f"{prefix}{i:0{width}d}" for i in range(1, count + 1)], skew)
+
+
+def messy(inner, variation=0.4):
+    """``inner``'s text with inconsistent casing and stray spaces on a fraction of rows."""
+    def make(rng, n, start, columns, skew):
+        text = inner(rng, n, start, columns, skew)
+        variants = [str.lower, str.upper, lambda value: f"  {value}  ", lambda value: f"{value} "]
+        vocab = text.vocab + [fn(value) for fn in variants for value in text.vocab]
+        changed = rng.random(n) < variation
+        codes = text.codes.copy()
+        kind = rng.integers(0, len(variants), int(changed.sum()))
+        codes[changed] = (kind + 1) * len(text.vocab) + codes[changed]
+        return Text(codes, vocab)
+    return make
+
+
+SCHEMAS = {
+    "sales": [
+        Column("Product", category(PRODUCTS, skew=0.8)),
+        Column("Price", priced("Product", PRICES)),
+        Column("Units_Sold", lognormal(250, 0.5), measure=True),
+        Column("Region", category(REGIONS)),
+    ],
+    "employees": [
+        Column("Name", names()),
+        Column("Department", category(DEPARTMENTS, skew=0.7)),
+        Column("Salary", normal(60000, 12000, low=25000, decimals=-2), measure=True),
+        Column("Years", integers(0, 25), measure=True),
+    ],
+    "customers": [
+        Column("id", sequence(), nullable=False),
+        Column("name", names()),
+        Column("city", category(CITIES, skew=1.0)),
+        Column("joined_date", dates("2023-01-01", 730)),
+    ],
+    "orders": [
+        Column("order_id", sequence(101), nullable=False),
+        Column("customer_id", foreign_key(5000), references="customers"),
+        Column("product", category(PRODUCTS, skew=0.8)),
+        Column("amount", priced("product", PRICES, max_quantity=3), measure=True),
+        Column("order_date", dates("2023-01-01", 730)),
+    ],
+    "stats": [
+        Column("Advertising", uniform(10, 60, decimals=0), measure=True),
+        Column("Sales", linear("Advertising", 5.5, 45, noise_sd=20, low=0), measure=True),
+        Column("Region", category(["A", "B"])),
+        Column("Quarter", category(["Q1", "Q2", "Q3", "Q4"])),
+        Column("Employees", linear("Advertising", 0.5, 0, noise_sd=2, low=1), measure=True),
+    ],
+    "zscore": [
+        Column("Employee", names()),
+        Column("Salary", normal(53000, 3000, decimals=-2), measure=True),
+        Column("Performance", normal(83, 6, low=0, high=100), measure=True),
+        Column("Hours_Worked", normal(42, 2.5, low=0), measure=True),
+    ],
+    "power_query": [
+        Column("Date", dates("2024-01-01", 366)),
+        Column("Product_ID", codes("P", 50, skew=1.1)),
+        Column("Sales_Amount", lognormal(1800, 0.35), measure=True),
+        Column("Region", messy(category(REGIONS))),
+        Column("Notes", messy(category(NOTES))),
+    ],
+}
+
+
+# ── defects ──────────────────────────────────────────────────────────────────
+def _add_outliers(values, rng, fraction):
+    rows = np.flatnonzero(rng.random(len(values)) < fraction)
+    if not len(rows):
+        return values
+    numbers = values.astype(float)
+    mean, sd = np.nanmean(numbers), np.nanstd(numbers) or 1.0
+    numbers[rows] = mean + rng.choice([-1.0, 1.0], len(rows)) * rng.uniform(5, 10, len(rows)) * sd
+    if values.dtype.kind in "iu":
+        return np.round(numbers).astype(values.dtype)
+    return numbers
+
+
+def _blank(values, rows):
+    if isinstance(values, Text):
+        codes = values.codes.copy()
+        codes[rows] = -1
+        return Text(codes, values.vocab)
+    values = values.astype(float)
+    values[rows] = np.nan
+    return values
+
+
+def _block(schema, n, start, rng, defects_rng, missing, duplicates, outliers, skew, references):
+    columns = {}
+    for column in schema:
+        if column.references in references:
+            columns[column.name] = column.make(rng, n, start, columns, skew, rows=int(references[column.references]))
+        else:
+            columns[column.name] = column.make(rng, n, start, columns, skew)
+    if outliers:
+        for column in schema:
+            if column.measure:
+                columns[column.name] = _add_outliers(columns[column.name], defects_rng, outliers)
+    if missing:
+        for column in schema:
+            if column.nullable:
+                rows = np.flatnonzero(defects_rng.random(n) < missing)
+                columns[column.name] = _blank(columns[column.name], rows)
+    if duplicates and n > 1:
+        # Each chosen row becomes an exact copy of an earlier row in the block.
+        rows = np.flatnonzero(defects_rng.random(n) < duplicates)
+        rows = rows[rows > 0]
+        source = np.arange(n)
+        source[rows] = (defects_rng.random(len(rows)) * rows).astype(np.int64)
+        columns = {name: values.take(source) if isinstance(values, Text) else values[source]
+                   for name, values in columns.items()}
+    return pd.DataFrame({
+        name: values.to_array() if isinstance(values, Text) else values
+        for name, values in columns.items()
+    }, index=pd.RangeIndex(start, start + n))
+
+
+def iter_blocks(schema, n_rows, seed=0, missing=0.0, duplicates=0.0, outliers=0.0, skew=None, references=None):
+    """Yield the dataset as DataFrames of up to ``BLOCK_ROWS`` rows.
+
+    ``references`` maps a referenced table name to its row count.
+    """
+    references = references or {}
+    columns = SCHEMAS[schema] if isinstance(schema, str) else schema
+    stream = zlib.crc32(schema.encode("utf-8")) if isinstance(schema, str) else 0  # tables differ for one seed
+    for block, start in enumerate(range(0, n_rows, BLOCK_ROWS)):
+        n = min(BLOCK_ROWS, n_rows - start)
+        rng = np.random.default_rng([seed, stream, block])
+        defects_rng = np.random.default_rng([seed, stream, block, 1])
+        yield _block(columns, n, start, rng, defects_rng, missing, duplicates, outliers, skew, references)
+
+
+def generate(schema, n_rows, seed=0, missing=0.0, duplicates=0.0, outliers=0.0, skew=None, references=None):
+    """A DataFrame of ``n_rows`` rows of ``schema`` (a name in ``SCHEMAS`` or a list of ``Column``)."""
+    blocks = list(iter_blocks(schema, n_rows, seed, missing, duplicates, outliers, skew, references))
+    if not blocks:
+        return next(iter_blocks(schema, 1, seed)).iloc[:0]
+    return blocks[0] if len(blocks) == 1 else pd.concat(blocks)
+
+
+def write_dataset(schema, n_rows, path, seed=0, **options):
+    """Stream the dataset to ``path`` (.parquet or .csv) block by block; return the rows written."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix not in (".parquet", ".csv"):
+        raise ValueError(f"Unsupported output format '{suffix}' (use .parquet or .csv)")
+    written = 0
+    writer = None
+    try:
+        for block in iter_blocks(schema, n_rows, seed, **options):
+            if suffix == ".csv":
+                block.to_csv(path, mode="w" if written == 0 else "a", header=written == 0, index=False)
+            else:
+                table = pa.Table.from_pandas(block, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+            written += len(block)
+    finally:
+        if writer is not None:
+            writer.close()
+    return written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Write a reproducible synthetic Playground dataset.")
+    parser.add_argument("schema", choices=sorted(SCHEMAS))
+    parser.add_argument("rows", type=int)
+    parser.add_argument("--out", required=True, help="Output path ending in .parquet or .csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--missing", type=float, default=0.0, help="Fraction of cells left blank")
+    parser.add_argument("--duplicates", type=float, default=0.0, help="Fraction of rows copied from earlier rows")
+    parser.add_argument("--outliers", type=float, default=0.0, help="Fraction of measure values made outliers")
+    parser.add_argument("--skew", type=float, default=None, help="Zipf exponent for every categorical column")
+    parser.add_argument("--customers", type=int, default=None, help="Rows of the customers table orders refer to")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    rows = write_dataset(
+        args.schema, args.rows, args.out, seed=args.seed, missing=args.missing,
+        duplicates=args.duplicates, outliers=args.outliers, skew=args.skew,
+        references={"customers": args.customers} if args.customers else None,
+    )
+    elapsed = time.perf_counter() - start
+    print(f"Wrote {rows:,} {args.schema} rows to {args.out} in {elapsed:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
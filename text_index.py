@@ -0,0 +1,270 @@
+"""In-memory BM25 full-text index.
+
+Documents are added under any hashable key as a few text fields (a title and
+a body, say).  HTML is stripped, words are lowercased and stemmed, and token
+positions are kept so quoted phrases can be matched.  Queries are words and
+``"quoted phrases"``: words are OR-ed and ranked with BM25, every phrase must
+appear, and the last bare word also matches as a prefix so results keep up
+while a word is still being typed.
+
+Scoring runs on per-term NumPy arrays that are rebuilt only for terms whose
+postings changed, so adding, updating or removing one document stays cheap.
+An optional ``group`` per document (a course, a content type) lets a search
+be restricted without a second index.
+"""
+
+import html
+import math
+import re
+from bisect import bisect_left, insort
+from functools import lru_cache
+
+import numpy as np
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Keeps a phrase from matching across the end of one field and the start of the next.
+FIELD_GAP = 10
+
+_TAG_RE = re.compile(r"<(script|style)\b.*?</\1>|<[^>]+>", re.IGNORECASE | re.DOTALL)
+_TOKEN_RE = re.compile(r"\w+")
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+_SUFFIXES = (
+    "ational", "ization", "fulness", "ousness", "iveness", "ations", "ation",
+    "ments", "ment", "ness", "ings", "ing", "edly", "ed", "ies", "ly", "es", "s",
+)
+
+
+def strip_html(text):
+    return html.unescape(_TAG_RE.sub(" ", text or ""))
+
+
+@lru_cache(maxsize=65536)
+def stem(token):
+    """Light suffix-stripping stemmer (regression/regressions, value/values)."""
+    if len(token) <= 3 or not token.isalpha():
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    for suffix in _SUFFIXES:
+        if token.endswith(suffix) and len(token) - len(suffix) >= 3:
+            token = token[:-len(suffix)]
+            break
+    if len(token) > 3 and token[-1] == token[-2] and token[-1] not in "lsz":
+        token = token[:-1]
+    if len(token) > 3 and token.endswith("e"):
+        token = token[:-1]
+    return token
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+def parse_query(query):
+    """Split a query into (words, phrases); each phrase is a list of stems."""
+    phrases = [[stem(t) for t in tokenize(p)] for p in _PHRASE_RE.findall(query)]
+    words = tokenize(_PHRASE_RE.sub(" ", query))
+    return words, [p for p in phrases if p]
+
+
+class TextIndex:
+    def __init__(self):
+        self._postings = {}  # stem -> {doc_id: [positions]}
+        self._arrays = {}  # stem -> (doc ids, term frequencies), rebuilt on demand
+        self._vocabulary = []  # sorted stems, for prefix matching
+        self._doc_terms = {}  # doc_id -> set of stems
+        self._doc_len = np.zeros(64)
+        self._doc_group = np.full(64, -1, dtype=np.int32)
+        self._group_codes = {}
+        self._norm = None
+        self._phrase_cache = {}  # phrase -> matching doc ids, cleared on any change
+        self._keys = {}  # doc_id -> key
+        self._doc_ids = {}  # key -> doc_id
+        self._next_id = 0
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, key):
+        return key in self._doc_ids
+
+    @classmethod
+    def build(cls, documents):
+        """Index ``(key, fields, group)`` triples in one go."""
+        index = cls()
+        index._vocabulary = None  # sorted once at the end instead of per new term
+        for key, fields, group in documents:
+            index.add(key, fields, group)
+        index._vocabulary = sorted(index._postings)
+        return index
+
+    # ── updates ──────────────────────────────────────────────────────────────
+    def add(self, key, fields, group=None):
+        if key in self._doc_ids:
+            self.update(key, fields, group)
+            return
+        doc_id = self._next_id
+        self._next_id += 1
+        if doc_id >= len(self._doc_len):
+            self._doc_len = np.concatenate([self._doc_len, np.zeros(len(self._doc_len))])
+            self._doc_group = np.concatenate([self._doc_group, np.full(len(self._doc_group), -1, dtype=np.int32)])
+        self._keys[doc_id] = key
+        self._doc_ids[key] = doc_id
+        self._index(doc_id, fields, group)
+
+    def update(self, key, fields, group=None):
+        doc_id = self._doc_ids.get(key)
+        if doc_id is None:
+            self.add(key, fields, group)
+            return
+        self._unindex(doc_id)
+        self._index(doc_id, fields, group)
+
+    def remove(self, key):
+        doc_id = self._doc_ids.pop(key, None)
+        if doc_id is None:
+            return
+        self._unindex(doc_id)
+        del self._keys[doc_id]
+        self._doc_group[doc_id] = -1
+
+    def rekey(self, old_key, new_key):
+        doc_id = self._doc_ids.pop(old_key)
+        self._doc_ids[new_key] = doc_id
+        self._keys[doc_id] = new_key
+
+    def _index(self, doc_id, fields, group):
+        by_token = {}
+        offset = 0
+        length = 0
+        for text in fields:
+            tokens = tokenize(strip_html(text))
+            for i, token in enumerate(tokens, start=offset):
+                by_token.setdefault(token, []).append(i)
+            offset += len(tokens) + FIELD_GAP
+            length += len(tokens)
+        positions = {}
+        for token, token_positions in by_token.items():
+            term = stem(token)
+            if term in positions:
+                positions[term] = sorted(positions[term] + token_positions)
+            else:
+                positions[term] = token_positions
+        for term, term_positions in positions.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                if self._vocabulary is not None:
+                    insort(self._vocabulary, term)
+            postings[doc_id] = term_positions
+            self._arrays.pop(term, None)
+        self._doc_terms[doc_id] = set(positions)
+        self._doc_len[doc_id] = length
+        self._doc_group[doc_id] = self._group_codes.setdefault(group, len(self._group_codes))
+        self._norm = None
+        self._phrase_cache.clear()
+
+    def _unindex(self, doc_id):
+        for term in self._doc_terms.pop(doc_id, ()):
+            postings = self._postings[term]
+            del postings[doc_id]
+            self._arrays.pop(term, None)
+            if not postings:
+                del self._postings[term]
+                del self._vocabulary[bisect_left(self._vocabulary, term)]
+        self._doc_len[doc_id] = 0
+        self._norm = None
+        self._phrase_cache.clear()
+
+    # ── queries ──────────────────────────────────────────────────────────────
+    def _term_arrays(self, term):
+        arrays = self._arrays.get(term)
+        if arrays is None:
+            postings = self._postings[term]
+            doc_ids = np.fromiter(postings, dtype=np.int64, count=len(postings))
+            tf = np.fromiter((len(p) for p in postings.values()), dtype=np.float64, count=len(postings))
+            arrays = self._arrays[term] = (doc_ids, tf)
+        return arrays
+
+    def _length_norm(self):
+        if self._norm is None:
+            avg_len = self._doc_len.sum() / max(len(self._keys), 1) or 1.0
+            self._norm = BM25_K1 * (1.0 - BM25_B + BM25_B * self._doc_len / avg_len)
+        return self._norm
+
+    def _prefix_terms(self, prefix):
+        vocabulary = self._vocabulary
+        terms = []
+        i = bisect_left(vocabulary, prefix)
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+            terms.append(vocabulary[i])
+            i += 1
+        return terms
+
+    def _phrase_docs(self, phrase):
+        key = tuple(phrase)
+        if key not in self._phrase_cache:
+            self._phrase_cache[key] = self._match_phrase(phrase)
+        return self._phrase_cache[key]
+
+    def _match_phrase(self, phrase):
+        postings = [self._postings.get(term) for term in phrase]
+        if not all(postings):
+            return set()
+        docs = set(min(postings, key=len))
+        for term_postings in postings:
+            docs.intersection_update(term_postings)
+        matches = set()
+        for doc_id in docs:
+            starts = set(postings[0][doc_id])
+            for offset, term_postings in enumerate(postings[1:], start=1):
+                starts.intersection_update(p - offset for p in term_postings[doc_id])
+                if not starts:
+                    break
+            if starts:
+                matches.add(doc_id)
+        return matches
+
+    def search(self, query, group=None, limit=None):
+        """Rank documents for ``query``; returns [(key, score)], best first.
+
+        ``group=None`` searches every group.
+        """
+        words, phrases = parse_query(query)
+        if not self._keys or not (words or phrases):
+            return []
+        if group is not None and group not in self._group_codes:
+            return []
+
+        terms = {stem(word) for word in words}
+        if words and not query.rstrip().endswith('"'):
+            terms.update(self._prefix_terms(words[-1]))
+        terms.update(term for phrase in phrases for term in phrase)
+
+        n_docs = len(self._keys)
+        norm = self._length_norm()
+        scores = np.zeros(self._next_id)
+        for term in terms:
+            if term not in self._postings:
+                continue
+            doc_ids, tf = self._term_arrays(term)
+            idf = math.log(1.0 + (n_docs - len(doc_ids) + 0.5) / (len(doc_ids) + 0.5))
+            scores[doc_ids] += idf * tf * (BM25_K1 + 1.0) / (tf + norm[doc_ids])
+
+        if group is not None:
+            scores[self._doc_group[:self._next_id] != self._group_codes[group]] = 0.0
+        if phrases:
+            required = None
+            for phrase in phrases:
+                docs = self._phrase_docs(phrase)
+                required = docs if required is None else required & docs
+            keep = np.zeros(self._next_id, dtype=bool)
+            keep[list(required)] = True
+            scores[~keep] = 0.0
+
+        hits = np.flatnonzero(scores > 0)
+        if limit is not None and len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        return [(self._keys[doc_id], float(scores[doc_id])) for doc_id in hits]
@@ -0,0 +1,52 @@
+"""Page registry.
+
+Every sidebar page lives in its own module under this package and exposes a
+``render()`` function.  app.py only imports the module for the page that is
+currently selected, so the other pages are never compiled or loaded.
+"""
+
+import importlib
+
+all_pages = [
+    "Overview", "Course Plan", "Training Center", "Playground", "Learn & Practice",
+    "Study Notes", "Flashcards", "Exam Simulator", "Code Library", "Formula Reference",
+    "Study Timer", "Progress", "Learning Outcomes", "Progression Plan", "About"
+]
+
+navigation_groups = {
+    "Dashboard": ["Overview", "Progress", "Progression Plan", "Learning Outcomes"],
+    "Learning": ["Course Plan", "Training Center", "Learn & Practice", "Playground"],
+    "Study Tools": ["Study Notes", "Flashcards", "Code Library", "Formula Reference", "Study Timer"],
+    "Assessment": ["Exam Simulator"],
+    "Info": ["About"]
+}
+
+page_to_section = {page_name: section for section, pages in navigation_groups.items() for page_name in pages}
+
+PAGE_MODULES = {
+    "Overview": "views.overview",
+    "Course Plan": "views.course_plan",
+    "Training Center": "views.training_center",
+    "Playground": "views.playground",
+    "Learn & Practice": "views.learn_practice",
+    "Study Notes": "views.study_notes",
+    "Flashcards": "views.flashcards",
+    "Exam Simulator": "views.exam_simulator",
+    "Code Library": "views.code_library",
+    "Formula Reference": "views.formula_reference",
+    "Study Timer": "views.study_timer",
+    "Progress": "views.progress",
+    "Learning Outcomes": "views.learning_outcomes",
+    "Progression Plan": "views.progression_plan",
+    "About": "views.about",
+}
+
+assert set(PAGE_MODULES) == set(page_to_section), "every navigation page needs a module"
+
+
+def render_page(page):
+    module_name = PAGE_MODULES.get(page)
+    if module_name is None:
+        return False
+    importlib.import_module(module_name).render()
+    return True
@@ -0,0 +1,70 @@
+"""About page."""
+
+import streamlit as st
+
+
+def render():
+    st.title("ℹ️ About the Data Analyst Program")
+    st.markdown("---")
+    
+    st.markdown("""
+    ## About the Programme
+    
+    Data analysts have a quintessential portfolio in every modern company ecology. Their ability to guide 
+    business leaders to make informed decisions using relevant and up-to-date information 
+    based on real-world data makes them a highly desired addition to every managerial team.
+    
+    **Effective data analysis can:**
+    - Isolate workflow bottlenecks
+    - Reduce operational costs
+    - Solve overarching problems
+    - Identify inefficient processes
+    
+    ---
+    
+    ## Programme Content
+    
+    This programme incorporates:
+    - 📚 **Theoretical knowledge**
+    - 🛠️ **Practical skills**
+    - 💻 **Technical competency**
+    
+    ### Tools and Technologies:
+    - Microsoft Excel and Google Spreadsheets
+    - Python programming (Python 3.x)
+    - SQL and databases (on-premises and cloud)
+    - Data visualization and dashboards (Tableau, Power BI)
+    - Statistical analysis tools
+    - Business Intelligence concepts
+    
+    ---
+    
+    ## Career Opportunities
+    
+    After graduation, you may qualify for work as:
+    - Financial Analyst
+    - Marketing Analyst
+    - Logistics Analyst
+    - General Data Analyst
+    - Technical Analyst
+    - Information Scientist
+    - Operational Management
+    
+    ---
+    
+    ## Study Details
+    
+    | Detail | Value |
+    |--------|-------|
+    | Programme Code | PDAN |
+    | NQF Level | 5.2 |
+    | Total Credits | 120 |
+    | Duration | 2 years (4 semesters) |
+    | Study Start | Spring 2025 |
+    | Total Hours | 3150 |
+    | Study Mode | Full-time / Part-time |
+    
+    ---
+    
+    📖 [View full study catalog](https://studiekatalog.edutorium.no/voc/en/programme/PDAN/2025-autumn)
+    """)
@@ -0,0 +1,164 @@
+"""Code Library page."""
+
+import json
+import time
+
+import streamlit as st
+
+from content import get_default_snippets
+
+
+def render():
+    st.title("💻 Code Library")
+    st.markdown("*Useful code snippets and examples*")
+    st.markdown("---")
+    
+    # Initialize default snippets if empty
+    if not st.session_state.code_snippets:
+        st.session_state.code_snippets = get_default_snippets()
+    
+    # Search and filter
+    categories_available = sorted(
+        set(s.get('category', 'Other') for s in st.session_state.code_snippets.values()),
+        key=str.lower
+    )
+    languages_available = sorted(
+        set(s.get('language', 'python') for s in st.session_state.code_snippets.values())
+    )
+    col_search, col_filter, col_lang = st.columns([2, 1, 1])
+    with col_search:
+        search_query = st.text_input("🔍 Search snippets:", placeholder="Search by title, description, or code...", key="code_search")
+    with col_filter:
+        category_filter = st.selectbox(
+            "Category:",
+            ["All"] + categories_available
+        )
+    with col_lang:
+        language_filter = st.selectbox(
+            "Language:",
+            ["All"] + languages_available
+        )
+    
+    col_meta1, col_meta2 = st.columns([1, 1])
+    with col_meta1:
+        favorites_only = st.checkbox("⭐ Favorites only", value=False)
+    with col_meta2:
+        sort_by = st.selectbox("Sort by:", ["Title", "Category"])
+    
+    # Filter snippets
+    filtered_snippets = st.session_state.code_snippets
+    if search_query:
+        filtered_snippets = {
+            k: v for k, v in filtered_snippets.items()
+            if search_query.lower() in v.get('title', '').lower() or
+               search_query.lower() in v.get('description', '').lower() or
+               search_query.lower() in v.get('code', '').lower()
+        }
+    if category_filter != "All":
+        filtered_snippets = {
+            k: v for k, v in filtered_snippets.items()
+            if v.get('category') == category_filter
+        }
+    if language_filter != "All":
+        filtered_snippets = {
+            k: v for k, v in filtered_snippets.items()
+            if v.get('language') == language_filter
+        }
+    if favorites_only:
+        filtered_snippets = {
+            k: v for k, v in filtered_snippets.items()
+            if k in st.session_state.code_snippet_favorites
+        }
+    
+    # Display snippets
+    if filtered_snippets:
+        sort_key = (lambda item: item[1].get('category', '').lower()) if sort_by == "Category" else (lambda item: item[1].get('title', '').lower())
+        for snippet_id, snippet in sorted(filtered_snippets.items(), key=sort_key):
+            with st.expander(f"📄 {snippet.get('title', 'Untitled')} - {snippet.get('category', 'Other')}"):
+                st.markdown(f"**Description:** {snippet.get('description', 'No description')}")
+                st.caption(f"Language: {snippet.get('language', 'python')} • Category: {snippet.get('category', 'Other')}")
+                st.code(snippet.get('code', ''), language=snippet.get('language', 'python'))
+                
+                # Copy button (using download button as workaround)
+                code_text = snippet.get('code', '')
+                st.download_button(
+                    "📋 Copy Code",
+                    data=code_text,
+                    file_name=f"{snippet.get('title', 'code')}.txt",
+                    mime="text/plain"
+                )
+                
+                # Favorite toggle
+                favorites = set(st.session_state.code_snippet_favorites)
+                fav_toggle = st.checkbox("⭐ Favorite", value=snippet_id in favorites, key=f"favorite_{snippet_id}")
+                if fav_toggle:
+                    favorites.add(snippet_id)
+                else:
+                    favorites.discard(snippet_id)
+                st.session_state.code_snippet_favorites = list(favorites)
+                
+                if st.button(f"🗑️ Delete", key=f"delete_snippet_{snippet_id}"):
+                    del st.session_state.code_snippets[snippet_id]
+                    st.rerun()
+    else:
+        st.info("No snippets found. Create one below!")
+    
+    st.markdown("---")
+    st.subheader("📁 Import / Export")
+    export_payload = json.dumps(st.session_state.code_snippets, indent=2)
+    col_export, col_import = st.columns(2)
+    with col_export:
+        st.download_button(
+            "⬇️ Download library (.json)",
+            data=export_payload,
+            file_name="code_snippets.json",
+            mime="application/json"
+        )
+    with col_import:
+        uploaded = st.file_uploader("Upload snippets JSON", type=["json"])
+        if uploaded:
+            try:
+                uploaded_snippets = json.loads(uploaded.read().decode("utf-8"))
+                if isinstance(uploaded_snippets, dict):
+                    st.session_state.code_snippets.update(uploaded_snippets)
+                    st.success(f"Imported {len(uploaded_snippets)} snippets")
+                    st.rerun()
+                else:
+                    st.error("Uploaded file must be a JSON object keyed by snippet id.")
+            except Exception as exc:
+                st.error(f"Could not import snippets: {exc}")
+    
+    st.markdown("---")
+    st.subheader("➕ Add Custom Snippet")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        new_title = st.text_input("Title:")
+        new_category = st.selectbox(
+            "Category:",
+            ["Pandas", "SQL", "Excel", "Statistics", "Python", "Visualization", "Time Series", "Data Quality", "Other"]
+        )
+        new_language = st.selectbox(
+            "Language:",
+            ["python", "sql", "excel", "javascript", "bash", "r", "other"]
+        )
+    
+    with col2:
+        new_description = st.text_area("Description:", height=80)
+    
+    new_code = st.text_area("Code:", height=200, placeholder="Paste your code here...")
+    
+    if st.button("➕ Add Snippet", type="primary"):
+        if new_title and new_code:
+            snippet_id = f"custom_{int(time.time())}"
+            st.session_state.code_snippets[snippet_id] = {
+                'title': new_title,
+                'code': new_code,
+                'language': new_language,
+                'category': new_category,
+                'description': new_description
+            }
+            st.success("Snippet added!")
+            st.rerun()
+        else:
+            st.warning("Please fill in title and code.")
@@ -0,0 +1,131 @@
+"""Course Plan page."""
+
+import streamlit as st
+import pandas as pd
+
+from study_buddy_core import courses_data
+from study_buddy_state import COURSE_PROGRESSION_MAP, STUDY_PATH_JAN2026
+
+
+def render():
+    st.title("📚 Course Plan")
+    st.markdown("---")
+
+    _study_path_by_name = {
+        _name: (_code, _start_s, _end_s)
+        for _code, _name, _start_s, _end_s in STUDY_PATH_JAN2026
+    }
+
+    _assessment_by_name = {
+        _name: (_assess_start_s, _assess_deadline_s)
+        for _name, (_code, _assess_start_s, _assess_deadline_s) in COURSE_PROGRESSION_MAP.items()
+    }
+    
+    df = pd.DataFrame([{
+        "Code": c["code"],
+        "Course": c["name"],
+        "Credits": c["credits"],
+        "Weeks": c["weeks"],
+        "Hours": c["hours"],
+        "Semester": c["semester"],
+        "Start Date": (_study_path_by_name.get(c["name"], (None, None, None))[1] or "-"),
+        "End Date": (_study_path_by_name.get(c["name"], (None, None, None))[2] or "-"),
+        "Assessment Start": (_assessment_by_name.get(c["name"], (None, None))[0] or "-"),
+        "Assessment Deadline": (_assessment_by_name.get(c["name"], (None, None))[1] or "-"),
+    } for c in courses_data])
+
+    st.caption("Date fields are aligned with JAN 2026 FT progression plan.")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        _semester_options = sorted(df["Semester"].dropna().unique().tolist())
+        semester_filter = st.multiselect(
+            "Filter by semester:",
+            options=_semester_options,
+            default=[]
+        )
+    with col2:
+        search = st.text_input("Search courses:", "")
+    
+    filtered_df = df.copy()
+    if semester_filter:
+        filtered_df = filtered_df[filtered_df["Semester"].isin(semester_filter)]
+    if search:
+        filtered_df = filtered_df[
+            filtered_df["Course"].str.lower().str.contains(search.lower()) |
+            filtered_df["Code"].str.lower().str.contains(search.lower())
+        ]
+    
+    st.dataframe(filtered_df, use_container_width=True, hide_index=True)
+
+    # ── Progression Plan reminders (Course Plan) ──────────────────────────────
+    st.markdown("---")
+    st.subheader("⏰ Assessment Deadlines")
+    from datetime import date as _cp_date, datetime as _cp_dt
+    _cp_today = _cp_date.today()
+    _cp_schedule = [
+        ('IC',  'Introduction Course',         None,           '2026-01-11'),
+        ('DAF', 'Data Analysis Fundamentals',  '2026-01-26',   '2026-02-01'),
+        ('SPF', 'Spreadsheet Fundamentals',    '2026-02-16',   '2026-02-22'),
+        ('DDM', 'Data Driven Decision-Making', '2026-03-16',   '2026-03-22'),
+        ('STT', 'Statistical Tools',           '2026-04-13',   '2026-04-19'),
+        ('SP1', 'Semester Project 1',          '2026-05-11',   '2026-05-17'),
+        ('EVO', 'Evaluation of Outcomes',      '2026-09-07',   '2026-09-13'),
+        ('DVS', 'Data Visualisation',          '2026-10-12',   '2026-10-18'),
+        ('ARP', 'Analysis Reporting',          '2026-11-02',   '2026-11-08'),
+        ('EP1', 'Exam Project 1',              '2026-12-14',   '2026-12-20'),
+    ]
+    _cp_cols = st.columns(2)
+    for _cp_i, (_cp_code, _cp_cname, _cp_start_s, _cp_dl_s) in enumerate(_cp_schedule):
+        _cp_dl    = _cp_dt.strptime(_cp_dl_s, '%Y-%m-%d').date()
+        _cp_start = _cp_dt.strptime(_cp_start_s, '%Y-%m-%d').date() if _cp_start_s else None
+        _cp_days  = (_cp_dl - _cp_today).days
+        if _cp_days < 0:
+            _cp_ic, _cp_col = '✅', '#2ecc71'
+            _cp_cd = f'{abs(_cp_days)}d ago'
+            _cp_bg, _cp_bdr = '#0d2416', '#2ecc71'
+        elif _cp_days == 0:
+            _cp_ic, _cp_col = '🔥', '#e74c3c'
+            _cp_cd = 'TODAY!'
+            _cp_bg, _cp_bdr = '#3d0000', '#e74c3c'
+        elif _cp_days <= 7:
+            _cp_ic, _cp_col = '🔴', '#e74c3c'
+            _cp_cd = f'{_cp_days}d left'
+            _cp_bg, _cp_bdr = '#3d0000', '#e74c3c'
+        elif _cp_days <= 21:
+            _cp_ic, _cp_col = '🟡', '#f39c12'
+            _cp_cd = f'{_cp_days}d left'
+            _cp_bg, _cp_bdr = '#2d2200', '#f39c12'
+        else:
+            _cp_ic, _cp_col = '🟢', '#3498db'
+            _cp_cd = f'{_cp_days}d'
+            _cp_bg, _cp_bdr = '#0d1e2d', '#3498db'
+        _cp_start_txt = f"<span style='color:#aaa;'>Assessment from {_cp_start.strftime('%d %b')} · </span>" if _cp_start else ''
+        with _cp_cols[_cp_i % 2]:
+            st.markdown(f"""
+<div style="background:{_cp_bg}; border-left:4px solid {_cp_bdr}; border-radius:6px;
+            padding:8px 12px; margin:4px 0; display:flex; align-items:center; gap:10px;">
+  <span style="background:{_cp_bdr}; color:#fff; font-size:10px; font-weight:700;
+               padding:2px 6px; border-radius:10px; min-width:32px; text-align:center;">{_cp_code}</span>
+  <div style="flex:1;">
+    <span style="font-size:13px; font-weight:600; color:#f0f0f0;">{_cp_cname}</span><br>
+    <span style="font-size:11px;">{_cp_start_txt}<span style="color:#ccc;">Deadline {_cp_dl.strftime('%d %b %Y')}</span></span>
+  </div>
+  <span style="font-size:13px; font-weight:700; color:{_cp_col}; white-space:nowrap;">{_cp_ic} {_cp_cd}</span>
+</div>
+""", unsafe_allow_html=True)
+    st.caption("→ See full schedule in **Progression Plan**")
+
+    st.markdown("---")
+    st.subheader("📊 Credits per Semester")
+    
+    semester_credits = df.groupby("Semester")["Credits"].sum().reset_index()
+    semester_order = _semester_options
+    semester_credits["Semester"] = pd.Categorical(
+        semester_credits["Semester"],
+        categories=semester_order,
+        ordered=True
+    )
+    semester_credits = semester_credits.sort_values("Semester")
+    
+    st.bar_chart(semester_credits.set_index("Semester"))
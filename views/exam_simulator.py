@@ -0,0 +1,275 @@
+"""Exam Simulator page."""
+
+import time
+
+import streamlit as st
+
+from content import get_curated_exam_questions
+from exam_generation import prefetch_questions, ready_count, take_questions
+from exam_grading import grade_concurrently, grading_digest, grading_failed, split_question
+from study_buddy_core import (
+    build_curated_exam_questions,
+    client,
+    courses_data,
+    evaluate_answer,
+)
+
+
+def render():
+    st.title("📋 Exam Simulator")
+    st.markdown("*Practice for your exams with timed simulations*")
+    st.markdown("---")
+    
+    if not st.session_state.exam_mode:
+        st.subheader("Configure Your Exam")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            exam_course = st.selectbox(
+                "Select Course:",
+                [c['code'] for c in courses_data]
+            )
+            num_questions = st.number_input("Number of Questions:", min_value=5, max_value=50, value=10, step=5)
+        
+        with col2:
+            exam_duration = st.number_input("Duration (minutes):", min_value=10, max_value=180, value=60, step=10)
+            question_types = st.multiselect(
+                "Question Types:",
+                ["General", "Knowledge-based", "Skills-based", "Case Study"],
+                default=["General", "Knowledge-based"]
+            )
+
+        type_map = {
+            "General": "general",
+            "Knowledge-based": "knowledge",
+            "Skills-based": "skills",
+            "Case Study": "case_study"
+        }
+        
+        curated_exam_count = len(get_curated_exam_questions(exam_course))
+        if curated_exam_count:
+            st.info(f"Curated exam bank available for {exam_course}: {curated_exam_count} questions aligned to the course learning outcomes.")
+        elif client is None:
+            st.warning("No curated bank is available for this course, and AI question generation is disabled.")
+        else:
+            # Generate questions in the background while the exam is being configured
+            selected_types = [type_map.get(t, "general") for t in question_types]
+            selected_course = next(c for c in courses_data if c['code'] == exam_course)
+            prefetch_questions(selected_course, selected_types, num_questions)
+            st.caption(f"⚡ {ready_count(exam_course, selected_types, num_questions)}/{num_questions} questions pre-generated")
+        
+        if st.button("🚀 Start Exam", type="primary"):
+            # Generate exam questions
+            selected_course = next(c for c in courses_data if c['code'] == exam_course)
+            exam_questions_list = []
+
+            if get_curated_exam_questions(exam_course):
+                exam_questions_list = build_curated_exam_questions(exam_course, question_types, num_questions)
+            else:
+                with st.spinner("Generating exam questions..."):
+                    generated = take_questions(
+                        selected_course,
+                        [type_map.get(t, "general") for t in question_types],
+                        num_questions
+                    )
+                exam_questions_list = [
+                    {'id': i, 'question': question, 'type': q_type, 'user_answer': ''}
+                    for i, (q_type, question) in enumerate(generated)
+                ]
+            
+            if exam_questions_list:
+                st.session_state.exam_questions = exam_questions_list
+                st.session_state.exam_answers = {}
+                st.session_state.exam_results = {}
+                st.session_state.exam_start_time = time.time()
+                st.session_state.exam_duration = exam_duration * 60  # Convert to seconds
+                st.session_state.exam_mode = True
+                st.session_state.exam_course = exam_course
+                st.rerun()
+            else:
+                st.error("Failed to generate exam questions. Please try again.")
+    
+    else:
+        # Exam in progress
+        elapsed_time = time.time() - st.session_state.exam_start_time
+        remaining_time = max(0, st.session_state.exam_duration - elapsed_time)
+        remaining_minutes = int(remaining_time // 60)
+        remaining_seconds = int(remaining_time % 60)
+        
+        # Timer display
+        if remaining_time > 0:
+            st.warning(f"⏱️ Time Remaining: {remaining_minutes:02d}:{remaining_seconds:02d}")
+            progress = elapsed_time / st.session_state.exam_duration
+            st.progress(progress)
+        else:
+            st.error("⏰ Time's up! Your exam will be submitted automatically.")
+            if 'exam_submitted' not in st.session_state:
+                st.session_state.exam_submitted = True
+                st.rerun()
+        
+        st.markdown(f"**Course:** {st.session_state.exam_course}")
+        st.markdown(f"**Questions:** {len(st.session_state.exam_questions)}")
+        
+        # Display questions
+        st.markdown("---")
+        
+        view_mode = st.radio("View Mode:", ["One at a time", "All questions"], horizontal=True)
+        
+        if view_mode == "One at a time":
+            if 'current_question_idx' not in st.session_state:
+                st.session_state.current_question_idx = 0
+            
+            current_idx = st.session_state.current_question_idx
+            current_q = st.session_state.exam_questions[current_idx]
+            
+            st.markdown(f"### Question {current_idx + 1} of {len(st.session_state.exam_questions)}")
+            
+            # Parse question
+            if "ANSWER:" in current_q['question']:
+                parts = current_q['question'].split("ANSWER:")
+                question_text = parts[0].strip()
+            else:
+                question_text = current_q['question']
+            
+            st.markdown(f"**{question_text}**")
+            
+            # Answer input
+            answer_key = f"exam_answer_{current_idx}"
+            if answer_key not in st.session_state.exam_answers:
+                st.session_state.exam_answers[answer_key] = ""
+            
+            user_answer = st.text_area(
+                "Your Answer:",
+                value=st.session_state.exam_answers[answer_key],
+                height=150,
+                key=f"answer_input_{current_idx}"
+            )
+            st.session_state.exam_answers[answer_key] = user_answer
+            
+            # Navigation
+            col_nav1, col_nav2, col_nav3 = st.columns(3)
+            with col_nav1:
+                if st.button("⬅️ Previous", disabled=current_idx == 0):
+                    st.session_state.current_question_idx = max(0, current_idx - 1)
+                    st.rerun()
+            with col_nav2:
+                st.markdown(f"**{current_idx + 1}/{len(st.session_state.exam_questions)}**")
+            with col_nav3:
+                if st.button("➡️ Next", disabled=current_idx == len(st.session_state.exam_questions) - 1):
+                    st.session_state.current_question_idx = min(len(st.session_state.exam_questions) - 1, current_idx + 1)
+                    st.rerun()
+        
+        else:
+            # All questions view
+            for idx, q in enumerate(st.session_state.exam_questions):
+                with st.expander(f"Question {idx + 1}"):
+                    if "ANSWER:" in q['question']:
+                        parts = q['question'].split("ANSWER:")
+                        question_text = parts[0].strip()
+                    else:
+                        question_text = q['question']
+                    
+                    st.markdown(f"**{question_text}**")
+                    
+                    answer_key = f"exam_answer_{idx}"
+                    if answer_key not in st.session_state.exam_answers:
+                        st.session_state.exam_answers[answer_key] = ""
+                    
+                    user_answer = st.text_area(
+                        "Your Answer:",
+                        value=st.session_state.exam_answers[answer_key],
+                        height=100,
+                        key=f"answer_all_{idx}"
+                    )
+                    st.session_state.exam_answers[answer_key] = user_answer
+        
+        st.markdown("---")
+        
+        # Submit exam
+        col_sub1, col_sub2 = st.columns([1, 1])
+        with col_sub1:
+            if st.button("📤 Submit Exam", type="primary"):
+                st.session_state.exam_submitted = True
+                st.rerun()
+        with col_sub2:
+            if st.button("❌ Cancel Exam"):
+                if st.checkbox("Are you sure? This will discard your progress."):
+                    st.session_state.exam_mode = False
+                    st.session_state.exam_questions = []
+                    st.session_state.exam_answers = {}
+                    st.session_state.exam_start_time = None
+                    st.rerun()
+        
+        # Auto-submit if time is up
+        if remaining_time <= 0 and 'exam_submitted' not in st.session_state:
+            st.session_state.exam_submitted = True
+            st.rerun()
+    
+    # Show results if exam submitted
+    if st.session_state.get('exam_submitted', False) and st.session_state.exam_mode:
+        st.markdown("---")
+        st.title("📊 Exam Results")
+        
+        # Grade answers that have no stored result yet, streaming each one in as it completes
+        graded = st.session_state.exam_results
+        pending = {}
+        for idx, q in enumerate(st.session_state.exam_questions):
+            answer_key = f"exam_answer_{idx}"
+            user_answer = st.session_state.exam_answers.get(answer_key, "")
+            question_text, correct_answer = split_question(q['question'])
+            stored = graded.get(str(idx))
+            if (not stored or stored.get('digest') != grading_digest(question_text, user_answer)
+                    or grading_failed(stored.get('feedback', ''))):
+                pending[str(idx)] = (question_text, correct_answer, user_answer)
+        
+        if pending:
+            progress_bar = st.progress(0.0, text=f"Grading {len(pending)} answers...")
+            live_placeholder = st.empty()
+            live_feedback = live_placeholder.container()
+            for done, (key, result) in enumerate(grade_concurrently(evaluate_answer, pending), start=1):
+                graded[key] = result
+                progress_bar.progress(done / len(pending), text=f"Graded {done} of {len(pending)} answers")
+                if result.get('graded', True):
+                    live_feedback.markdown(f"✔️ Question {int(key) + 1} - Score: {result['score']}/1")
+                else:
+                    live_feedback.markdown(f"⚠️ Question {int(key) + 1} - Not graded")
+            progress_bar.empty()
+            live_placeholder.empty()
+        
+        results = [graded[str(idx)] for idx in range(len(st.session_state.exam_questions))]
+        total_score = sum(result['score'] for result in results)
+        ungraded = sum(not result.get('graded', True) for result in results)
+        if ungraded:
+            st.warning(f"{ungraded} answer(s) could not be graded and count as 0 for now. They will be graded again the next time this page runs.")
+        
+        # Display results
+        percentage = (total_score / len(st.session_state.exam_questions)) * 100
+        
+        st.metric("Your Score", f"{total_score:.1f}/{len(st.session_state.exam_questions)} ({percentage:.1f}%)")
+        
+        if percentage >= 80:
+            st.success("🎉 Excellent work!")
+        elif percentage >= 60:
+            st.info("👍 Good job!")
+        else:
+            st.warning("📚 Keep studying!")
+        
+        st.markdown("---")
+        st.subheader("Detailed Feedback")
+        
+        for idx, result in enumerate(results):
+            score_label = f"Score: {result['score']}/1" if result.get('graded', True) else "Not graded"
+            with st.expander(f"Question {idx + 1} - {score_label}"):
+                st.markdown(f"**Question:** {result['question']}")
+                st.markdown(f"**Your Answer:** {result['user_answer'] if result['user_answer'] else 'No answer'}")
+                st.markdown(f"**Correct Answer:** {result['correct_answer']}")
+                st.markdown(f"**Feedback:** {result['feedback']}")
+        
+        if st.button("🔄 Take Another Exam"):
+            st.session_state.exam_mode = False
+            st.session_state.exam_submitted = False
+            st.session_state.exam_questions = []
+            st.session_state.exam_answers = {}
+            st.session_state.exam_results = {}
+            st.session_state.exam_start_time = None
+            st.rerun()
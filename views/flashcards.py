@@ -0,0 +1,253 @@
+"""Flashcards page."""
+
+from datetime import datetime, timedelta
+
+import streamlit as st
+import pandas as pd
+
+from content import get_curated_flashcards
+from flashcard_queue import ALL_COURSES, get_review_queue
+from flashcard_scheduler import ALGORITHMS, DeckState, review_card, simulate_workload
+from study_buddy_core import courses_data, load_curated_flashcards
+
+
+def render():
+    st.title("🎴 Flashcards")
+    st.markdown("*Learn with spaced repetition*")
+    st.markdown("---")
+    
+    # Initialize flashcard counter if not exists
+    if 'flashcard_counter' not in st.session_state:
+        st.session_state.flashcard_counter = 0
+    
+    tab1, tab2, tab3 = st.tabs(["📚 Study", "➕ Create Cards", "📊 Statistics"])
+    
+    with tab1:
+        st.subheader("Study Mode")
+        
+        # Get cards that need review (earliest due first) from the due-date index
+        now = datetime.now()
+        review_queue = get_review_queue(st.session_state)
+        
+        if not review_queue.due_count(now=now):
+            st.info("🎉 No cards need review right now! Create some cards or check back later.")
+        else:
+            # Filter by course
+            course_filter = st.selectbox(
+                "Filter by course:",
+                ["All Courses"] + [c['code'] for c in courses_data],
+                key="fc_course_filter"
+            )
+            
+            queue_course = ALL_COURSES if course_filter == "All Courses" else course_filter
+            due_count = review_queue.due_count(queue_course, now=now)
+            
+            if due_count:
+                # Get current card
+                if 'current_card_idx' not in st.session_state:
+                    st.session_state.current_card_idx = 0
+                
+                current_idx = st.session_state.current_card_idx % due_count
+                card_id = review_queue.due_card_id(current_idx, queue_course, now=now)
+                current_card = st.session_state.flashcards[card_id]
+                
+                st.markdown(f"**Card {current_idx + 1} of {due_count}**")
+                st.progress((current_idx + 1) / due_count)
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown("### Front")
+                    st.info(current_card.get('front', 'No front text'))
+                
+                show_answer = st.session_state.get(f"show_answer_{card_id}", False)
+                
+                if show_answer:
+                    with col2:
+                        st.markdown("### Back")
+                        st.success(current_card.get('back', 'No back text'))
+                    
+                    st.markdown("---")
+                    st.markdown("### How well did you know this?")
+                    
+                    col_a, col_b, col_c, col_d = st.columns(4)
+                    
+                    def update_card_difficulty(difficulty, card_id=card_id):
+                        card = st.session_state.flashcards[card_id]
+                        card.update(review_card(card, difficulty, algorithm=st.session_state.get('flashcard_algorithm', 'sm2')))
+                        get_review_queue(st.session_state).upsert(card_id, st.session_state.flashcards[card_id])
+                        
+                        # Update stats
+                        st.session_state.flashcard_stats['cards_reviewed'] = st.session_state.flashcard_stats.get('cards_reviewed', 0) + 1
+                        if difficulty in ["Good", "Easy"]:
+                            st.session_state.flashcard_stats['cards_mastered'] = st.session_state.flashcard_stats.get('cards_mastered', 0) + 1
+                        
+                        # Move to next card
+                        st.session_state.current_card_idx += 1
+                        del st.session_state[f"show_answer_{card_id}"]
+                        st.rerun()
+                    
+                    with col_a:
+                        st.button("❌ Again", on_click=lambda: update_card_difficulty("Again"), use_container_width=True)
+                    with col_b:
+                        st.button("😓 Hard", on_click=lambda: update_card_difficulty("Hard"), use_container_width=True)
+                    with col_c:
+                        st.button("✅ Good", on_click=lambda: update_card_difficulty("Good"), use_container_width=True, type="primary")
+                    with col_d:
+                        st.button("😊 Easy", on_click=lambda: update_card_difficulty("Easy"), use_container_width=True)
+                else:
+                    if st.button("👁️ Show Answer", type="primary", use_container_width=True):
+                        st.session_state[f"show_answer_{card_id}"] = True
+                        st.rerun()
+            else:
+                st.info("No cards to review for this course.")
+    
+    with tab2:
+        st.subheader("Create New Flashcard")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            card_course = st.selectbox(
+                "Course:",
+                [c['code'] for c in courses_data]
+            )
+            card_front = st.text_area("Front:", height=150, placeholder="Question or term...")
+        
+        with col2:
+            card_back = st.text_area("Back:", height=150, placeholder="Answer or definition...")
+            card_tags = st.text_input("Tags (optional):", placeholder="comma-separated")
+
+        curated_count = len(get_curated_flashcards(card_course))
+        if curated_count:
+            st.caption(f"Recommended deck available for {card_course}: {curated_count} curated cards aligned to course outcomes.")
+            if st.button("📥 Load Recommended Deck", use_container_width=True):
+                added_cards = load_curated_flashcards(card_course)
+                if added_cards:
+                    st.success(f"Loaded {added_cards} recommended flashcards.")
+                else:
+                    st.info("Recommended flashcards were already loaded.")
+                st.rerun()
+        
+        if st.button("➕ Create Card", type="primary"):
+            if card_front and card_back:
+                card_id = f"card_{st.session_state.flashcard_counter}"
+                st.session_state.flashcard_counter += 1
+                
+                st.session_state.flashcards[card_id] = {
+                    'front': card_front,
+                    'back': card_back,
+                    'course': card_course,
+                    'tags': [t.strip() for t in card_tags.split(',') if t.strip()] if card_tags else [],
+                    'interval': 1,
+                    'repetitions': 0,
+                    'ease_factor': 2.5,
+                    'next_review': datetime.now().isoformat(),
+                    'created': datetime.now().isoformat()
+                }
+                get_review_queue(st.session_state).upsert(card_id, st.session_state.flashcards[card_id])
+                
+                st.session_state.flashcard_stats['total_cards'] = len(st.session_state.flashcards)
+                st.success("Card created!")
+                st.rerun()
+            else:
+                st.warning("Please fill in both front and back.")
+        
+        # Show existing cards
+        st.markdown("---")
+        st.subheader("Your Cards")
+        
+        if st.session_state.flashcards:
+            course_filter_create = st.selectbox(
+                "Filter by course:",
+                ["All Courses"] + [c['code'] for c in courses_data],
+                key="filter_create"
+            )
+            
+            filtered_cards = st.session_state.flashcards
+            if course_filter_create != "All Courses":
+                filtered_cards = {k: v for k, v in filtered_cards.items() if v.get('course') == course_filter_create}
+            
+            for card_id, card in filtered_cards.items():
+                with st.expander(f"📴 {card.get('front', 'No front')[:50]}..."):
+                    col_a, col_b = st.columns(2)
+                    with col_a:
+                        st.markdown(f"**Front:** {card.get('front')}")
+                    with col_b:
+                        st.markdown(f"**Back:** {card.get('back')}")
+                    st.caption(f"Course: {card.get('course')} | Next review: {card.get('next_review', 'Not set')}")
+                    if st.button(f"🗑️ Delete", key=f"delete_card_{card_id}"):
+                        del st.session_state.flashcards[card_id]
+                        get_review_queue(st.session_state).remove(card_id)
+                        st.session_state.flashcard_stats['total_cards'] = len(st.session_state.flashcards)
+                        st.rerun()
+        else:
+            st.info("No cards created yet.")
+    
+    with tab3:
+        st.subheader("Statistics")
+        
+        stats = st.session_state.flashcard_stats
+        total = stats.get('total_cards', 0)
+        reviewed = stats.get('cards_reviewed', 0)
+        mastered = stats.get('cards_mastered', 0)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Total Cards", total)
+        with col2:
+            st.metric("Cards Reviewed", reviewed)
+        with col3:
+            st.metric("Cards Mastered", mastered)
+        
+        if total > 0:
+            st.markdown("---")
+            st.markdown(f"**Mastery Rate:** {mastered / reviewed * 100:.1f}%" if reviewed > 0 else "**Mastery Rate:** N/A")
+            
+            # Cards by course
+            course_counts = {}
+            for card in st.session_state.flashcards.values():
+                course = card.get('course', 'Unknown')
+                course_counts[course] = course_counts.get(course, 0) + 1
+            
+            if course_counts:
+                st.markdown("---")
+                st.markdown("### Cards by Course")
+                for course, count in course_counts.items():
+                    st.markdown(f"- **{course}:** {count} cards")
+            
+            st.markdown("---")
+            st.markdown("### Review Forecast")
+            algorithm_labels = {"sm2": "SM-2", "fsrs": "FSRS"}
+            fc_col1, fc_col2 = st.columns(2)
+            with fc_col1:
+                st.session_state.flashcard_algorithm = st.selectbox(
+                    "Scheduling algorithm",
+                    ALGORITHMS,
+                    index=ALGORITHMS.index(st.session_state.get('flashcard_algorithm', 'sm2')),
+                    format_func=algorithm_labels.get,
+                    help="Used for new reviews and for this forecast."
+                )
+            with fc_col2:
+                forecast_days = st.slider("Days to forecast", 7, 180, 30, key="flashcard_forecast_days")
+            
+            # Every tab runs on every rerun, so the deck is only replayed on request.
+            forecast_key = (st.session_state.flashcard_algorithm, forecast_days)
+            if st.button("📈 Forecast reviews", key="flashcard_forecast_button"):
+                deck = DeckState.from_cards(st.session_state.flashcards)
+                st.session_state.flashcard_forecast = {
+                    "key": forecast_key,
+                    "daily": simulate_workload(deck, forecast_days, algorithm=st.session_state.flashcard_algorithm),
+                    "start": datetime.now().date(),
+                    "cards": len(st.session_state.flashcards),
+                }
+            forecast = st.session_state.get("flashcard_forecast")
+            if forecast is None or forecast["key"] != forecast_key:
+                st.info("Click **Forecast reviews** to simulate the coming days with these settings.")
+            else:
+                daily = forecast["daily"]
+                st.bar_chart(pd.DataFrame(
+                    {"Reviews": daily},
+                    index=[forecast["start"] + timedelta(days=d) for d in range(len(daily))]
+                ))
+                st.caption(f"Expected reviews: {int(daily.sum())} total, {daily.mean():.1f} per day, peak {int(daily.max())}.")
+                if forecast["cards"] != len(st.session_state.flashcards):
+                    st.caption(f"Forecast made for {forecast['cards']} cards; click again to include your changes.")
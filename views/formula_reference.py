@@ -0,0 +1,57 @@
+"""Formula Reference page."""
+
+import streamlit as st
+
+from content import get_formulas
+
+
+def render():
+    st.title("🔢 Formula Reference")
+    st.markdown("*Quick reference for statistical formulas*")
+    st.markdown("---")
+    
+    # Category selection
+    category = st.selectbox(
+        "Select Category:",
+        ["Descriptive Statistics", "Inferential Statistics", "Regression", "Correlation", "Probability", "All"],
+        key="formula_category"
+    )
+    
+    # Search
+    search_query = st.text_input("🔍 Search formulas:", placeholder="Search by name or description...", key="formula_search")
+    
+    formulas = get_formulas()
+    
+    # Filter formulas
+    display_formulas = {}
+    if category == "All":
+        display_formulas = formulas
+    else:
+        if category in formulas:
+            display_formulas[category] = formulas[category]
+    
+    # Apply search filter
+    if search_query:
+        filtered_formulas = {}
+        for cat, form_list in display_formulas.items():
+            filtered = [
+                f for f in form_list
+                if search_query.lower() in f['name'].lower() or
+                   search_query.lower() in f['description'].lower()
+            ]
+            if filtered:
+                filtered_formulas[cat] = filtered
+        display_formulas = filtered_formulas
+    
+    # Display formulas
+    if display_formulas:
+        for cat, form_list in display_formulas.items():
+            st.markdown(f"### {cat}")
+            for formula in form_list:
+                with st.expander(f"**{formula['name']}**"):
+                    st.markdown(f"**Description:** {formula['description']}")
+                    st.latex(formula['formula'])
+                    st.markdown(f"**Example:** {formula['example']}")
+            st.markdown("---")
+    else:
+        st.info("No formulas found. Try a different search or category.")
@@ -0,0 +1,456 @@
+"""Learn & Practice page."""
+
+import re
+
+import streamlit as st
+from streamlit.components.v1 import html
+
+from content import get_course_lessons, get_topic_course, has_course_lessons, training_topics
+from study_buddy_core import courses_data, evaluate_answer, generate_practice_question
+from study_buddy_state import COURSE_PROGRESSION_MAP
+
+
+def render():
+    st.title("📖 Learn & Practice")
+    st.markdown("---")
+    
+    # Add custom CSS for lesson styling and Mermaid.js
+    st.markdown("""
+    <style>
+    .lesson-highlight {
+        background: linear-gradient(120deg, #a8e6cf 0%, #dcedc1 100%);
+        padding: 15px;
+        border-radius: 8px;
+        border-left: 4px solid #4CAF50;
+        margin: 10px 0;
+    }
+    .key-concept {
+        background: #fff3cd;
+        padding: 12px;
+        border-radius: 6px;
+        border-left: 4px solid #ffc107;
+        margin: 8px 0;
+        color: #333;
+    }
+    .key-concept * {
+        color: #333 !important;
+    }
+    .important-info {
+        background: #e3f2fd;
+        padding: 12px;
+        border-radius: 6px;
+        border-left: 4px solid #2196F3;
+        margin: 8px 0;
+        color: #333;
+    }
+    .important-info * {
+        color: #333 !important;
+    }
+    .visual-box {
+        background: #f5f5f5;
+        padding: 15px;
+        border-radius: 8px;
+        border: 2px solid #ddd;
+        margin: 15px 0;
+        font-family: 'Courier New', monospace;
+    }
+    .mermaid-container {
+        background: white;
+        padding: 20px;
+        border-radius: 8px;
+        margin: 20px 0;
+        text-align: center;
+        border: 1px solid #e0e0e0;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    # Note: Mermaid.js will be loaded per diagram using st.components.v1.html
+    
+    _lp_course_options = [f"{c['code']} - {c['name']}" for c in courses_data]
+    _lp_default_index = 0
+    _lp_saved_course = st.session_state.get("last_selected_course")
+    if _lp_saved_course:
+        for _idx, _label in enumerate(_lp_course_options):
+            if _label.endswith(f"- {_lp_saved_course}"):
+                _lp_default_index = _idx
+                break
+
+    selected_course = st.selectbox(
+        "Select a course to study:",
+        options=_lp_course_options,
+        index=_lp_default_index,
+        key="lp_selected_course"
+    )
+    
+    course_code = selected_course.split(" - ")[0]
+    course = next(c for c in courses_data if c["code"] == course_code)
+    st.session_state.last_selected_course = course["name"]
+    
+    st.markdown("---")
+    
+    # ── Progression Plan reminder (Learn & Practice) ──────────────────────────
+    _lp_cname = course['name']
+    if _lp_cname in COURSE_PROGRESSION_MAP:
+        from datetime import date as _lp_date, datetime as _lp_dt
+        _lp_code, _lp_start_str, _lp_dl_str = COURSE_PROGRESSION_MAP[_lp_cname]
+        _lp_today = _lp_date.today()
+        _lp_start = _lp_dt.strptime(_lp_start_str, "%Y-%m-%d").date()
+        _lp_dl    = _lp_dt.strptime(_lp_dl_str,    "%Y-%m-%d").date()
+        _lp_days  = (_lp_dl - _lp_today).days
+        if _lp_days < 0:
+            _lp_icon, _lp_col, _lp_txt = "✅", "#2ecc71", f"Submitted {abs(_lp_days)} days ago"
+        elif _lp_days == 0:
+            _lp_icon, _lp_col, _lp_txt = "🔥", "#e74c3c", "DUE TODAY — 23:59!"
+        elif _lp_days <= 3:
+            _lp_icon, _lp_col, _lp_txt = "🔴", "#e74c3c", f"{_lp_days} day{'s' if _lp_days != 1 else ''} left!"
+        elif _lp_days <= 14:
+            _lp_icon, _lp_col, _lp_txt = "🟡", "#f39c12", f"{_lp_days} days left"
+        else:
+            _lp_icon, _lp_col, _lp_txt = "🟢", "#3498db", f"in {_lp_days} days"
+        _lp_bg  = "#3d0000" if _lp_days >= 0 and _lp_days <= 3 else (
+                  "#2d2200" if _lp_days <= 14 else (
+                  "#0d1e2d" if _lp_days > 0 else "#0d2416"))
+        st.markdown(f"""
+<div style="background:{_lp_bg}; border-left:5px solid {_lp_col}; border-radius:8px;
+            padding:10px 16px; margin:0 0 12px 0; display:flex; align-items:center; gap:14px;">
+  <div style="font-size:22px;">{_lp_icon}</div>
+  <div style="flex:1;">
+    <span style="font-weight:700; color:#f0f0f0;">📋 {_lp_code} Progression Reminder</span><br>
+    <span style="font-size:12px; color:#bbb;">
+      Assessment week starts <b style="color:#ddd;">{_lp_start.strftime('%a %d %b')}</b>
+      &nbsp;·&nbsp; Deadline <b style="color:#ddd;">{_lp_dl.strftime('%a %d %b %Y')} @ 23:59</b>
+    </span>
+  </div>
+  <div style="text-align:right; white-space:nowrap;">
+    <span style="font-size:15px; font-weight:700; color:{_lp_col};">{_lp_txt}</span><br>
+    <span style="font-size:11px; color:#888;">→ Progression Plan page</span>
+  </div>
+</div>
+""", unsafe_allow_html=True)
+    # ─────────────────────────────────────────────────────────────────────────
+
+    # Check if this course has training modules
+    course_topics_with_training = []
+    for topic in training_topics():
+        if get_topic_course(topic) == course['name']:
+            course_topics_with_training.append(topic)
+    
+    if course_topics_with_training:
+        st.info(f"💡 This course has {len(course_topics_with_training)} topic(s) with hands-on training available in the Training Center!")
+    
+    # Check if course has lessons
+    has_lessons = has_course_lessons(course_code)
+    if has_lessons:
+        st.success(f"📚 This course has {len(get_course_lessons(course_code))} detailed lesson(s) available!")
+    
+    tab1, tab2 = st.tabs(["Course Content", "Practice Questions"])
+    
+    with tab1:
+        st.subheader(f"📚 {course['name']}")
+        st.markdown(f"**{course['credits']} credits** | {course['weeks']} weeks | {course['hours']} hours | {course['semester']}")
+        st.markdown(f"*{course['description']}*")
+        
+        st.markdown("---")
+        
+        # Check if course has lessons
+        if has_course_lessons(course_code):
+            st.markdown("### 📖 Course Lessons")
+            st.markdown("Explore detailed lessons with visual explanations and key concepts.")
+            st.markdown("")
+            
+            for lesson in get_course_lessons(course_code):
+                with st.expander(f"📚 Lesson {lesson['lesson_number']}: {lesson['title']}", expanded=True):
+                    # Parse and render lesson content with Mermaid diagrams
+                    content = lesson['content']
+                    
+                    # Split content by Mermaid diagrams
+                    parts = re.split(r'(<div class="mermaid">.*?</div>)', content, flags=re.DOTALL)
+                    
+                    for part in parts:
+                        if part.strip().startswith('<div class="mermaid">'):
+                            # Extract Mermaid code
+                            mermaid_match = re.search(r'<div class="mermaid">(.*?)</div>', part, re.DOTALL)
+                            if mermaid_match:
+                                mermaid_code = mermaid_match.group(1).strip()
+                                # Render Mermaid diagram using HTML component
+                                # Render Mermaid diagram with zoom and pan controls
+                                mermaid_html = f"""
+                                <!DOCTYPE html>
+                                <html>
+                                <head>
+                                    <script src="https://cdn.jsdelivr.net/npm/mermaid@10/dist/mermaid.min.js"></script>
+                                    <style>
+                                        * {{
+                                            box-sizing: border-box;
+                                        }}
+                                        html, body {{
+                                            margin: 0; 
+                                            padding: 0; 
+                                            width: 100%;
+                                            height: 100%;
+                                            background: white; 
+                                            overflow: hidden;
+                                        }}
+                                        .diagram-container {{
+                                            width: 100%;
+                                            height: 100%;
+                                            min-height: 500px;
+                                            overflow: auto;
+                                            border: 1px solid #e0e0e0;
+                                            border-radius: 8px;
+                                            background: #fafafa;
+                                            position: relative;
+                                        }}
+                                        .mermaid-wrapper {{
+                                            width: 100%;
+                                            min-height: 100%;
+                                            padding: 40px;
+                                            display: flex;
+                                            justify-content: center;
+                                            align-items: flex-start;
+                                        }}
+                                        .mermaid {{
+                                            text-align: center;
+                                            width: 100%;
+                                            max-width: 100%;
+                                        }}
+                                        .mermaid svg {{
+                                            max-width: 100%;
+                                            height: auto;
+                                        }}
+                                        .controls {{
+                                            position: sticky;
+                                            top: 10px;
+                                            right: 10px;
+                                            z-index: 1000;
+                                            display: flex;
+                                            gap: 5px;
+                                            float: right;
+                                            margin: 10px;
+                                        }}
+                                        .control-btn {{
+                                            background: #4A90D9;
+                                            color: white;
+                                            border: none;
+                                            padding: 8px 12px;
+                                            border-radius: 4px;
+                                            cursor: pointer;
+                                            font-size: 12px;
+                                            box-shadow: 0 2px 4px rgba(0,0,0,0.2);
+                                        }}
+                                        .control-btn:hover {{
+                                            background: #2E5C8A;
+                                        }}
+                                    </style>
+                                </head>
+                                <body>
+                                    <div class="diagram-container" id="diagram-container">
+                                        <div class="controls">
+                                            <button class="control-btn" onclick="zoomIn()">Zoom In +</button>
+                                            <button class="control-btn" onclick="zoomOut()">Zoom Out -</button>
+                                            <button class="control-btn" onclick="resetZoom()">Reset</button>
+                                        </div>
+                                        <div class="mermaid-wrapper" id="mermaid-wrapper">
+                                            <div class="mermaid" id="mermaid-diagram">
+{mermaid_code}
+                                            </div>
+                                        </div>
+                                    </div>
+                                    <script>
+                                        let currentZoom = 1;
+                                        const container = document.getElementById('diagram-container');
+                                        const wrapper = document.getElementById('mermaid-wrapper');
+                                        
+                                        function zoomIn() {{
+                                            currentZoom = Math.min(currentZoom + 0.2, 3);
+                                            wrapper.style.transform = `scale(${{currentZoom}})`;
+                                            wrapper.style.transformOrigin = 'center center';
+                                        }}
+                                        
+                                        function zoomOut() {{
+                                            currentZoom = Math.max(currentZoom - 0.2, 0.5);
+                                            wrapper.style.transform = `scale(${{currentZoom}})`;
+                                            wrapper.style.transformOrigin = 'center center';
+                                        }}
+                                        
+                                        function resetZoom() {{
+                                            currentZoom = 1;
+                                            wrapper.style.transform = 'scale(1)';
+                                            container.scrollTop = 0;
+                                            container.scrollLeft = 0;
+                                        }}
+                                        
+                                        // Enable panning with mouse drag
+                                        let isDragging = false;
+                                        let startX, startY, scrollLeft, scrollTop;
+                                        
+                                        container.addEventListener('mousedown', (e) => {{
+                                            isDragging = true;
+                                            startX = e.pageX - container.offsetLeft;
+                                            startY = e.pageY - container.offsetTop;
+                                            scrollLeft = container.scrollLeft;
+                                            scrollTop = container.scrollTop;
+                                            container.style.cursor = 'grabbing';
+                                        }});
+                                        
+                                        container.addEventListener('mouseleave', () => {{
+                                            isDragging = false;
+                                            container.style.cursor = 'grab';
+                                        }});
+                                        
+                                        container.addEventListener('mouseup', () => {{
+                                            isDragging = false;
+                                            container.style.cursor = 'grab';
+                                        }});
+                                        
+                                        container.addEventListener('mousemove', (e) => {{
+                                            if (!isDragging) return;
+                                            e.preventDefault();
+                                            const x = e.pageX - container.offsetLeft;
+                                            const y = e.pageY - container.offsetTop;
+                                            const walkX = (x - startX) * 2;
+                                            const walkY = (y - startY) * 2;
+                                            container.scrollLeft = scrollLeft - walkX;
+                                            container.scrollTop = scrollTop - walkY;
+                                        }});
+                                        
+                                        container.style.cursor = 'grab';
+                                        
+                                        if (typeof mermaid !== 'undefined') {{
+                                            mermaid.initialize({{ 
+                                                startOnLoad: true, 
+                                                theme: 'default',
+                                                themeVariables: {{ 
+                                                    primaryColor: '#4A90D9',
+                                                    primaryTextColor: '#fff',
+                                                    primaryBorderColor: '#2E5C8A',
+                                                    lineColor: '#4A90D9',
+                                                    secondaryColor: '#FFD700',
+                                                    tertiaryColor: '#FF6B6B'
+                                                }},
+                                                flowchart: {{
+                                                    useMaxWidth: true,
+                                                    htmlLabels: true,
+                                                    curve: 'basis'
+                                                }}
+                                            }});
+                                        }}
+                                    </script>
+                                </body>
+                                </html>
+                                """
+                                html(mermaid_html, height=700, width=None, scrolling=False)
+                        else:
+                            # Render regular markdown content
+                            if part.strip():
+                                st.markdown(part, unsafe_allow_html=True)
+                    
+                    st.markdown("---")
+                    
+                    # Key Takeaways with visual emphasis
+                    st.markdown("### ⭐ Key Takeaways")
+                    st.markdown('<div class="important-info">', unsafe_allow_html=True)
+                    for i, point in enumerate(lesson['key_points'], 1):
+                        st.markdown(f"**{i}.** {point}")
+                    st.markdown('</div>', unsafe_allow_html=True)
+                    
+                    # Visual elements indicator
+                    if lesson.get('visual_elements', {}).get('diagrams'):
+                        st.caption("📊 This lesson includes interactive Mermaid diagrams for better visual understanding")
+            
+            st.markdown("---")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("### 📖 Knowledge")
+            st.markdown("*After this course, you will have knowledge of:*")
+            for item in course['knowledge']:
+                # Check if topic has training
+                has_training = get_topic_course(item) is not None
+                training_badge = " 🎓" if has_training else ""
+                st.markdown(f"- {item}{training_badge}")
+        
+        with col2:
+            st.markdown("### 🛠️ Skills")
+            st.markdown("*After this course, you will be able to:*")
+            for item in course['skills']:
+                st.markdown(f"- {item}")
+        
+        st.markdown("---")
+        st.markdown("### 💡 General Competence")
+        st.markdown("*After this course, you will:*")
+        for item in course['competence']:
+            st.markdown(f"- {item}")
+    
+    with tab2:
+        st.subheader("🎯 Practice Questions")
+        
+        question_type = st.selectbox(
+            "Question type:",
+            options=["General", "Knowledge-based", "Skills-based", "Case Study"],
+            index=0
+        )
+        
+        type_map = {"General": "general", "Knowledge-based": "knowledge", "Skills-based": "skills", "Case Study": "case_study"}
+        
+        if 'current_question' not in st.session_state:
+            st.session_state.current_question = None
+        if 'show_answer' not in st.session_state:
+            st.session_state.show_answer = False
+        if 'user_answer' not in st.session_state:
+            st.session_state.user_answer = ""
+        if 'feedback' not in st.session_state:
+            st.session_state.feedback = None
+        
+        if st.button("Generate New Question", type="primary"):
+            with st.spinner("Generating question..."):
+                st.session_state.current_question = generate_practice_question(course, type_map[question_type])
+                st.session_state.show_answer = False
+                st.session_state.user_answer = ""
+                st.session_state.feedback = None
+        
+        if st.session_state.current_question:
+            st.markdown("---")
+            
+            if "ANSWER:" in st.session_state.current_question:
+                parts = st.session_state.current_question.split("ANSWER:")
+                question_text = parts[0].strip()
+                answer_text = parts[1].strip() if len(parts) > 1 else ""
+            else:
+                question_text = st.session_state.current_question
+                answer_text = "Answer not available"
+            
+            st.markdown("### Question:")
+            st.markdown(f"**{question_text}**")
+            
+            user_answer = st.text_area(
+                "Your answer:",
+                value=st.session_state.user_answer,
+                height=100,
+                placeholder="Type your answer here..."
+            )
+            st.session_state.user_answer = user_answer
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                if st.button("Check My Answer"):
+                    if user_answer.strip():
+                        with st.spinner("Evaluating..."):
+                            st.session_state.feedback = evaluate_answer(question_text, answer_text, user_answer)
+                    else:
+                        st.warning("Please enter an answer first.")
+            
+            with col2:
+                if st.button("Show Answer"):
+                    st.session_state.show_answer = True
+            
+            if st.session_state.feedback:
+                st.markdown("### Feedback:")
+                st.success(st.session_state.feedback)
+            
+            if st.session_state.show_answer:
+                st.markdown("### Correct Answer:")
+                st.info(answer_text)
@@ -0,0 +1,61 @@
+"""Learning Outcomes page."""
+
+import streamlit as st
+
+from study_buddy_core import competence_outcomes, knowledge_outcomes, skills_outcomes
+
+
+def render():
+    st.title("🎯 Program Learning Outcomes")
+    st.markdown("*Based on the Norwegian Qualifications Framework (NQF)*")
+    st.markdown("---")
+    
+    tab1, tab2, tab3 = st.tabs(["Knowledge", "Skills", "General Competence"])
+    
+    with tab1:
+        st.subheader("📖 Knowledge")
+        st.markdown("*After graduation, the candidate has knowledge of:*")
+        
+        for i, outcome in enumerate(knowledge_outcomes):
+            checked = st.checkbox(
+                outcome,
+                value=st.session_state.knowledge_progress[i],
+                key=f"knowledge_{i}"
+            )
+            st.session_state.knowledge_progress[i] = checked
+        
+        completed = sum(st.session_state.knowledge_progress)
+        st.progress(completed / len(knowledge_outcomes))
+        st.caption(f"{completed} / {len(knowledge_outcomes)} learning goals achieved")
+    
+    with tab2:
+        st.subheader("🛠️ Skills")
+        st.markdown("*After graduation, the candidate can:*")
+        
+        for i, outcome in enumerate(skills_outcomes):
+            checked = st.checkbox(
+                outcome,
+                value=st.session_state.skills_progress[i],
+                key=f"skills_{i}"
+            )
+            st.session_state.skills_progress[i] = checked
+        
+        completed = sum(st.session_state.skills_progress)
+        st.progress(completed / len(skills_outcomes))
+        st.caption(f"{completed} / {len(skills_outcomes)} learning goals achieved")
+    
+    with tab3:
+        st.subheader("💡 General Competence")
+        st.markdown("*After graduation, the candidate:*")
+        
+        for i, outcome in enumerate(competence_outcomes):
+            checked = st.checkbox(
+                outcome,
+                value=st.session_state.competence_progress[i],
+                key=f"competence_{i}"
+            )
+            st.session_state.competence_progress[i] = checked
+        
+        completed = sum(st.session_state.competence_progress)
+        st.progress(completed / len(competence_outcomes))
+        st.caption(f"{completed} / {len(competence_outcomes)} learning goals achieved")
@@ -0,0 +1,579 @@
+"""Overview page."""
+
+from datetime import datetime, date
+
+import streamlit as st
+import pandas as pd
+from streamlit.components.v1 import html
+
+from content import topic_lesson_count
+from study_buddy_core import courses_data
+from study_buddy_state import COURSE_PROGRESSION_MAP, PROGRAM_DEADLINES, STUDY_PATH_JAN2026
+from views import all_pages, page_to_section
+
+
+def render():
+    st.title("🎓 Data Analyst 2 - Study App")
+    st.markdown("---")
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    total_credits = sum(c["credits"] for c in courses_data)
+    completed_credits = sum(c["credits"] for c in courses_data if c["code"] in st.session_state.completed_courses)
+    
+    with col1:
+        st.metric("Total Credits", f"{int(total_credits)}")
+    with col2:
+        st.metric("Completed", f"{completed_credits:.1f}")
+    with col3:
+        st.metric("Remaining", f"{total_credits - completed_credits:.1f}")
+    with col4:
+        progress_pct = (completed_credits / total_credits * 100) if total_credits > 0 else 0
+        st.metric("Progress", f"{progress_pct:.0f}%")
+
+    last_page = st.session_state.get("last_page", "Training Center")
+    last_course = st.session_state.get("last_selected_course")
+    last_topic = st.session_state.get("last_selected_topic")
+    if last_page or last_course or last_topic:
+        st.subheader("▶ Continue Where You Left Off")
+        resume_page = last_page if last_page in all_pages else "Training Center"
+        details = [f"**Page:** {resume_page}"]
+        if last_course:
+            details.append(f"**Course:** {last_course}")
+        if last_topic:
+            details.append(f"**Topic:** {last_topic}")
+        st.markdown(" · ".join(details))
+
+        if st.button("Resume Study", type="primary", key="resume_study_btn"):
+            st.session_state.nav_section = page_to_section.get(resume_page, "Dashboard")
+            st.session_state.nav_page = resume_page
+            st.rerun()
+    
+    st.markdown("---")
+    st.subheader("📌 Today")
+    today_col1, today_col2 = st.columns(2)
+
+    with today_col1:
+        _today = date.today()
+        _upcoming_deadlines = []
+        for _code, _name, _date_str in PROGRAM_DEADLINES:
+            _deadline_date = datetime.strptime(_date_str, "%Y-%m-%d").date()
+            _days_left = (_deadline_date - _today).days
+            if _days_left >= 0:
+                _upcoming_deadlines.append((_days_left, _code, _name, _deadline_date))
+
+        if _upcoming_deadlines:
+            _upcoming_deadlines.sort(key=lambda x: x[0])
+            _days_left, _code, _name, _deadline_date = _upcoming_deadlines[0]
+            if _days_left == 0:
+                _countdown = "Due today"
+            elif _days_left == 1:
+                _countdown = "1 day left"
+            else:
+                _countdown = f"{_days_left} days left"
+
+            st.info(
+                f"**Next deadline:** {_code} — {_name}  \n"
+                f"**Date:** {_deadline_date.strftime('%d %b %Y')} · **{_countdown}**"
+            )
+        else:
+            st.success("No upcoming deadlines in the current schedule.")
+
+    with today_col2:
+        _current_topic = st.session_state.get("last_selected_topic")
+        if _current_topic:
+            _topic_progress = st.session_state.training_progress.get(_current_topic, {})
+            _lessons_done = _topic_progress.get("lessons_completed", 0)
+            _lessons_total = topic_lesson_count(_current_topic)
+            _quiz_score = _topic_progress.get("quiz_score")
+
+            _topic_lines = [
+                f"**Current topic:** {_current_topic}",
+                f"**Lessons:** {_lessons_done}/{_lessons_total if _lessons_total else 0}"
+            ]
+            if _quiz_score is not None:
+                _topic_lines.append(f"**Latest quiz score:** {_quiz_score}%")
+
+            st.info("  \n".join(_topic_lines))
+        else:
+            st.info("No active topic yet. Start from **Training Center** to set your focus.")
+
+    st.markdown("---")
+    st.subheader("📅 Study Path")
+    st.caption("Aligned with JAN 2026 FT progression plan (Updated 16 Dec 2025)")
+
+    _today = date.today()
+    _deadline_by_code = {
+        _code: datetime.strptime(_deadline_s, "%Y-%m-%d").date()
+        for _code, _course_name, _deadline_s in PROGRAM_DEADLINES
+    }
+    _timeline = []
+    for _code, _name, _start_s, _end_s in STUDY_PATH_JAN2026:
+        _start = datetime.strptime(_start_s, "%Y-%m-%d").date()
+        _end = datetime.strptime(_end_s, "%Y-%m-%d").date()
+        _duration_days = (_end - _start).days + 1
+
+        _assessment_start = None
+        _assessment_deadline = None
+        if _name in COURSE_PROGRESSION_MAP:
+            _map_code, _assessment_start_s, _assessment_deadline_s = COURSE_PROGRESSION_MAP[_name]
+            _assessment_start = datetime.strptime(_assessment_start_s, "%Y-%m-%d").date()
+            _assessment_deadline = datetime.strptime(_assessment_deadline_s, "%Y-%m-%d").date()
+        elif _code in _deadline_by_code:
+            _assessment_deadline = _deadline_by_code[_code]
+        if _code in st.session_state.completed_courses:
+            _status = "completed"
+            _status_label = "Fullført"
+            _status_icon = "✅"
+        elif _start <= _today <= _end:
+            _status = "active"
+            _status_label = "Pågår"
+            _status_icon = "🟢"
+        elif _start > _today:
+            _status = "upcoming"
+            _status_label = "Kommer snart"
+            _status_icon = "🟡"
+        else:
+            _status = "past"
+            _status_label = "Frist passert"
+            _status_icon = "🔴"
+
+        _timeline.append({
+            "code": _code,
+            "name": _name,
+            "start": _start,
+            "end": _end,
+            "duration_days": _duration_days,
+            "status": _status,
+            "status_label": _status_label,
+            "status_icon": _status_icon,
+            "days_to_start": (_start - _today).days,
+            "days_to_end": (_end - _today).days,
+            "assessment_start": _assessment_start,
+            "assessment_deadline": _assessment_deadline,
+        })
+
+    _active_now = [item for item in _timeline if item["status"] == "active"]
+    _next_upcoming = sorted([item for item in _timeline if item["status"] == "upcoming"], key=lambda x: x["start"])
+
+    _next_30_days = [item for item in _next_upcoming if item["days_to_start"] <= 30]
+    _next_start_text = _next_upcoming[0]["start"].strftime("%d %b %Y") if _next_upcoming else "-"
+    _assessment_upcoming = sorted(
+        [
+            item for item in _timeline
+            if item["assessment_deadline"] and item["assessment_deadline"] >= _today
+        ],
+        key=lambda x: x["assessment_deadline"]
+    )
+    _assessment_critical = [item for item in _assessment_upcoming if (item["assessment_deadline"] - _today).days <= 14]
+
+    def _assessment_text(item):
+        if not item["assessment_deadline"]:
+            return ""
+        _days_left = (item["assessment_deadline"] - _today).days
+        if _days_left == 0:
+            _countdown = "🔥 DUE TODAY"
+        elif _days_left <= 7:
+            _countdown = f"🔴 {_days_left} dager igjen"
+        elif _days_left <= 14:
+            _countdown = f"🟡 {_days_left} dager igjen"
+        else:
+            _countdown = f"🟢 {_days_left} dager igjen"
+
+        if item["assessment_start"]:
+            return (
+                f"**ASSESSMENT:** {item['assessment_start'].strftime('%d %b')} → "
+                f"{item['assessment_deadline'].strftime('%d %b %Y')} · {_countdown}"
+            )
+        return f"**ASSESSMENT DEADLINE:** {item['assessment_deadline'].strftime('%d %b %Y')} · {_countdown}"
+
+    _m1, _m2, _m3, _m4 = st.columns(4)
+    _m1.metric("Pågår nå", len(_active_now))
+    _m2.metric("Neste start", _next_start_text)
+    _m3.metric("Kommende (30 dager)", len(_next_30_days))
+    _m4.metric("KRITISK assessment ≤14d", len(_assessment_critical))
+
+    if _assessment_upcoming:
+        _next_assessment = _assessment_upcoming[0]
+        _next_deadline = _next_assessment["assessment_deadline"]
+        _next_days_left = (_next_deadline - _today).days
+        _next_deadline_dt = datetime(
+            _next_deadline.year,
+            _next_deadline.month,
+            _next_deadline.day,
+            23,
+            59,
+            0,
+        )
+        _next_deadline_iso = _next_deadline_dt.strftime("%Y-%m-%dT%H:%M:%S")
+
+        st.markdown("#### ⏳ Countdown til neste assessment")
+        st.caption(
+            f"{_next_assessment['code']} — {_next_assessment['name']} · "
+            f"frist {_next_deadline.strftime('%d %b %Y')} kl. 23:59"
+        )
+
+        _top_message = f"**Neste assessment:** {_next_assessment['code']} — {_next_assessment['name']}  \n{_assessment_text(_next_assessment)}"
+        if _next_days_left <= 7:
+            st.error(_top_message)
+        elif _next_days_left <= 14:
+            st.warning(_top_message)
+        else:
+            st.info(_top_message)
+
+        html(f"""
+        <div style="
+            background:#111827;
+            border:1px solid #374151;
+            border-radius:10px;
+            padding:12px 16px;
+            color:#f9fafb;
+            font-family:system-ui,-apple-system,Segoe UI,Roboto,sans-serif;
+            display:flex;
+            align-items:center;
+            justify-content:space-between;
+            gap:10px;
+        ">
+            <span style="font-size:13px; color:#d1d5db;">Tid igjen</span>
+            <span id="assessment-countdown-value" style="font-size:20px; font-weight:700; letter-spacing:0.5px;">--d : --h : --m : --s</span>
+        </div>
+        <script>
+            const target = new Date("{_next_deadline_iso}").getTime();
+            const valueNode = document.getElementById("assessment-countdown-value");
+
+            function pad(n) {{
+                return String(n).padStart(2, "0");
+            }}
+
+            function updateCountdown() {{
+                const now = new Date().getTime();
+                let diff = Math.floor((target - now) / 1000);
+
+                if (diff <= 0) {{
+                    valueNode.textContent = "00d : 00h : 00m : 00s";
+                    return;
+                }}
+
+                const days = Math.floor(diff / 86400);
+                diff = diff % 86400;
+                const hours = Math.floor(diff / 3600);
+                diff = diff % 3600;
+                const minutes = Math.floor(diff / 60);
+                const seconds = diff % 60;
+
+                valueNode.textContent = `${{pad(days)}}d : ${{pad(hours)}}h : ${{pad(minutes)}}m : ${{pad(seconds)}}s`;
+            }}
+
+            updateCountdown();
+            setInterval(updateCountdown, 1000);
+        </script>
+        """, height=95)
+
+        _assessment_rows = []
+        for item in _assessment_upcoming:
+            _days_left = (item["assessment_deadline"] - _today).days
+            if _days_left <= 7:
+                _priority = "KRITISK"
+            elif _days_left <= 14:
+                _priority = "SNART"
+            else:
+                _priority = "PLANLEGG"
+            _assessment_rows.append(
+                {
+                    "Prioritet": _priority,
+                    "Emne": f"{item['code']} — {item['name']}",
+                    "Assessment start": item["assessment_start"].strftime("%d %b %Y") if item["assessment_start"] else "-",
+                    "Deadline": item["assessment_deadline"].strftime("%d %b %Y"),
+                    "Dager igjen": _days_left,
+                }
+            )
+
+        st.markdown("#### 📋 Assessment-oversikt")
+        st.dataframe(pd.DataFrame(_assessment_rows), use_container_width=True, hide_index=True)
+
+    _tab_now, _tab_assessment, _tab_next, _tab_all = st.tabs(["Nå", "Assessment", "Neste 30 dager", "Hele planen"])
+
+    with _tab_now:
+        st.markdown("#### 📌 Denne uken")
+        if _active_now:
+            _current = sorted(_active_now, key=lambda x: x["start"])[0]
+            st.success(
+                f"**Nå:** {_current['code']} — {_current['name']} ({_current['status_label']})  \n"
+                f"Periode: {_current['start'].strftime('%d %b %Y')} → {_current['end'].strftime('%d %b %Y')}  \n"
+                f"Dager igjen: **{max(0, _current['days_to_end'])}**"
+            )
+            if _current["assessment_deadline"]:
+                st.warning(_assessment_text(_current))
+        else:
+            st.info("Ingen aktiv modul akkurat nå.")
+
+        if _next_upcoming:
+            _next = _next_upcoming[0]
+            st.caption(
+                f"Neste: {_next['code']} — {_next['name']} starter {_next['start'].strftime('%d %b %Y')} "
+                f"(om {_next['days_to_start']} dager)."
+            )
+
+    with _tab_assessment:
+        st.markdown("#### 🚨 Assessment-fokus")
+        if _assessment_upcoming:
+            for item in _assessment_upcoming[:5]:
+                _days_left = (item["assessment_deadline"] - _today).days
+                _message = f"**{item['code']} — {item['name']}**  \n{_assessment_text(item)}"
+                if _days_left <= 7:
+                    st.error(_message)
+                elif _days_left <= 14:
+                    st.warning(_message)
+                else:
+                    st.info(_message)
+        else:
+            st.success("Ingen kommende assessments registrert.")
+
+    with _tab_next:
+        st.markdown("#### ⏭️ Neste 30 dager")
+        if _next_30_days:
+            for item in _next_30_days:
+                _assessment_line = ""
+                if item["assessment_deadline"]:
+                    _assessment_line = f"  \n{_assessment_text(item)}"
+                st.markdown(
+                    f"🟡 **{item['code']} — {item['name']}**  \n"
+                    f"Starter: {item['start'].strftime('%d %b %Y')} · om {item['days_to_start']} dager"
+                    f"{_assessment_line}"
+                )
+        else:
+            st.info("Ingen kurs starter de neste 30 dagene.")
+
+    with _tab_all:
+        st.markdown("#### 🗂️ Hele tidslinjen")
+        _active_upcoming = [item for item in _timeline if item["status"] in ("active", "upcoming")]
+        _history = [item for item in _timeline if item["status"] in ("past", "completed")]
+
+        for item in sorted(_active_upcoming, key=lambda x: x["start"]):
+            _days_text = (
+                f"{item['days_to_end']} dager igjen"
+                if item["status"] == "active"
+                else f"Starter om {item['days_to_start']} dager"
+            )
+            _assessment_line = ""
+            if item["assessment_deadline"]:
+                _assessment_line = f"  \n{_assessment_text(item)}"
+            st.markdown(
+                f"{item['status_icon']} **{item['code']} — {item['name']}** · *{item['status_label']}*  \n"
+                f"{item['start'].strftime('%d %b %Y')} → {item['end'].strftime('%d %b %Y')} "
+                f"· {item['duration_days']} dager · {_days_text}"
+                f"{_assessment_line}"
+            )
+
+        if _history:
+            with st.expander(f"Vis historikk ({len(_history)})", expanded=False):
+                for item in sorted(_history, key=lambda x: x["start"]):
+                    _assessment_line = ""
+                    if item["assessment_deadline"]:
+                        _assessment_line = f"  \n{_assessment_text(item)}"
+                    st.markdown(
+                        f"{item['status_icon']} **{item['code']} — {item['name']}** · *{item['status_label']}*  \n"
+                        f"{item['start'].strftime('%d %b %Y')} → {item['end'].strftime('%d %b %Y')}"
+                        f"{_assessment_line}"
+                    )
+    
+    st.markdown("---")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("🎯 Training Progress")
+        if st.session_state.training_progress:
+            for topic, data in st.session_state.training_progress.items():
+                short_topic = topic[:40] + "..." if len(topic) > 40 else topic
+                lessons_done = data.get('lessons_completed', 0)
+                total_lessons = topic_lesson_count(topic)
+                st.progress(lessons_done / total_lessons if total_lessons > 0 else 0)
+                st.caption(f"{short_topic}: {lessons_done}/{total_lessons} lessons")
+        else:
+            st.info("Start training in the Training Center!")
+    
+    with col2:
+        st.subheader("🔗 Useful Links")
+        st.markdown("[📖 Study Catalog](https://studiekatalog.edutorium.no/voc/en/programme/PDAN/2025-autumn)")
+
+        st.markdown("---")
+        st.subheader("⏰ Upcoming Deadlines")
+        from datetime import date as _ov_date, datetime as _ov_dt
+        _ov_today = _ov_date.today()
+        _ov_shown = 0
+        for _ov_code, _ov_cname, _ov_dl_str in PROGRAM_DEADLINES:
+            _ov_dl = _ov_dt.strptime(_ov_dl_str, "%Y-%m-%d").date()
+            _ov_days = (_ov_dl - _ov_today).days
+            if _ov_days < 0:
+                continue
+            if _ov_days == 0:
+                _ov_ic, _ov_cl = "🔥", "#e74c3c"
+                _ov_txt = "DUE TODAY"
+            elif _ov_days <= 7:
+                _ov_ic, _ov_cl = "🔴", "#e74c3c"
+                _ov_txt = f"**{_ov_days}d left**"
+            elif _ov_days <= 21:
+                _ov_ic, _ov_cl = "🟡", "#f39c12"
+                _ov_txt = f"{_ov_days}d left"
+            else:
+                _ov_ic, _ov_cl = "🟢", "#2ecc71"
+                _ov_txt = f"{_ov_days}d"
+            st.markdown(
+                f"{_ov_ic} **{_ov_code}** – {_ov_cname}  \n"
+                f"<span style='color:#aaa; font-size:12px;'>{_ov_dl.strftime('%d %b %Y')} @ 23:59 &nbsp;·&nbsp; "
+                f"<span style='color:{_ov_cl}'>{_ov_txt}</span></span>",
+                unsafe_allow_html=True
+            )
+            _ov_shown += 1
+            if _ov_shown >= 4:
+                break
+        if _ov_shown == 0:
+            st.success("🎉 All Year 1 assessments completed!")
+        st.caption("→ See full schedule in **Progression Plan**")
+    
+    st.markdown("---")
+    
+    # Define render_mui_icon function for Overview page
+    def render_mui_icon(icon_name, size=20):
+        """Render Material Icon as HTML"""
+        return f'<span class="material-icons md-{size}" style="vertical-align: middle; font-size: {size}px;">{icon_name}</span>'
+    
+    st.markdown(f"### {render_mui_icon('event', 28)} Important Dates", unsafe_allow_html=True)
+    
+    # Add new date form
+    with st.expander("➕ Add Important Date", expanded=False):
+        st.markdown(f"{render_mui_icon('add_circle', 20)} **Add a new important date**", unsafe_allow_html=True)
+        date_col1, date_col2 = st.columns(2)
+        with date_col1:
+            new_date = st.date_input("Date:", key="new_important_date")
+            new_date_type = st.selectbox(
+                "Type:",
+                ["Exam", "Assignment Deadline", "Project Deadline", "Course Start", "Course End", "Other"],
+                key="new_date_type"
+            )
+        with date_col2:
+            new_date_title = st.text_input("Title/Description:", placeholder="e.g., Final Exam - Data Analysis", key="new_date_title")
+            new_date_course = st.selectbox(
+                "Related Course (optional):",
+                ["(None)"] + [f"{c['code']} - {c['name']}" for c in courses_data],
+                key="new_date_course"
+            )
+        
+        if st.button("Add Date", type="primary", key="add_important_date"):
+            if new_date_title:
+                date_entry = {
+                    "date": new_date.isoformat(),
+                    "type": new_date_type,
+                    "title": new_date_title,
+                    "course": new_date_course if new_date_course != "(None)" else None
+                }
+                st.session_state.important_dates.append(date_entry)
+                st.success(f"Added: {new_date_type} - {new_date_title}")
+                st.rerun()
+            else:
+                st.warning("Please enter a title/description.")
+    
+    # Display important dates
+    if st.session_state.important_dates:
+        # Sort dates
+        sorted_dates = sorted(st.session_state.important_dates, key=lambda x: x["date"])
+        
+        # Get today's date for comparison
+        today = date.today()
+        
+        # Separate upcoming and past dates
+        upcoming_dates = []
+        past_dates = []
+        
+        for date_entry in sorted_dates:
+            event_date = date.fromisoformat(date_entry["date"])
+            if event_date >= today:
+                upcoming_dates.append(date_entry)
+            else:
+                past_dates.append(date_entry)
+        
+        # Display upcoming dates
+        if upcoming_dates:
+            st.markdown(f"**{render_mui_icon('schedule', 18)} Upcoming Dates:**", unsafe_allow_html=True)
+            for idx, date_entry in enumerate(upcoming_dates):
+                event_date = date.fromisoformat(date_entry["date"])
+                days_until = (event_date - today).days
+                
+                # Icon and color coding based on urgency
+                if days_until <= 7:
+                    urgency_icon = render_mui_icon('error', 20)
+                    urgency_color = "#dc3545"
+                elif days_until <= 30:
+                    urgency_icon = render_mui_icon('warning', 20)
+                    urgency_color = "#ffc107"
+                else:
+                    urgency_icon = render_mui_icon('check_circle', 20)
+                    urgency_color = "#28a745"
+                
+                # Type icon mapping
+                type_icons = {
+                    "Exam": "quiz",
+                    "Assignment Deadline": "assignment",
+                    "Project Deadline": "folder",
+                    "Course Start": "play_arrow",
+                    "Course End": "stop",
+                    "Other": "event"
+                }
+                type_icon = render_mui_icon(type_icons.get(date_entry['type'], 'event'), 18)
+                
+                date_col1, date_col2, date_col3 = st.columns([3, 2, 1])
+                with date_col1:
+                    course_info = f" ({date_entry['course']})" if date_entry.get('course') else ""
+                    st.markdown(f"{urgency_icon} {type_icon} **{date_entry['type']}:** {date_entry['title']}{course_info}", unsafe_allow_html=True)
+                with date_col2:
+                    st.markdown(f"{render_mui_icon('calendar_today', 16)} {event_date.strftime('%B %d, %Y')}", unsafe_allow_html=True)
+                with date_col3:
+                    if days_until == 0:
+                        st.markdown(f"**{render_mui_icon('today', 16)} Today!**", unsafe_allow_html=True)
+                    elif days_until == 1:
+                        st.markdown(f"**{render_mui_icon('schedule', 16)} Tomorrow**", unsafe_allow_html=True)
+                    else:
+                        st.markdown(f"{render_mui_icon('schedule', 16)} {days_until} days", unsafe_allow_html=True)
+                    
+                    # Delete button
+                    delete_btn = st.button("🗑️", key=f"delete_date_{idx}", help="Delete this date")
+                    if delete_btn:
+                        st.session_state.important_dates.remove(date_entry)
+                        st.rerun()
+        
+        # Display past dates (collapsed)
+        if past_dates:
+            with st.expander(f"📜 Past Dates ({len(past_dates)})", expanded=False):
+                st.markdown(f"{render_mui_icon('history', 18)} **Completed dates**", unsafe_allow_html=True)
+                for idx, date_entry in enumerate(past_dates):
+                    event_date = date.fromisoformat(date_entry["date"])
+                    days_ago = (today - event_date).days
+                    
+                    # Type icon mapping
+                    type_icons = {
+                        "Exam": "quiz",
+                        "Assignment Deadline": "assignment",
+                        "Project Deadline": "folder",
+                        "Course Start": "play_arrow",
+                        "Course End": "stop",
+                        "Other": "event"
+                    }
+                    type_icon = render_mui_icon(type_icons.get(date_entry['type'], 'event'), 18)
+                    
+                    past_col1, past_col2, past_col3 = st.columns([3, 2, 1])
+                    with past_col1:
+                        course_info = f" ({date_entry['course']})" if date_entry.get('course') else ""
+                        st.markdown(f"{render_mui_icon('check_circle', 16)} {type_icon} **{date_entry['type']}:** {date_entry['title']}{course_info}", unsafe_allow_html=True)
+                    with past_col2:
+                        st.markdown(f"{render_mui_icon('calendar_today', 16)} {event_date.strftime('%B %d, %Y')}", unsafe_allow_html=True)
+                    with past_col3:
+                        st.markdown(f"{render_mui_icon('schedule', 16)} {days_ago} days ago", unsafe_allow_html=True)
+                        
+                        # Delete button
+                        delete_btn = st.button("🗑️", key=f"delete_past_date_{idx}", help="Delete this date")
+                        if delete_btn:
+                            st.session_state.important_dates.remove(date_entry)
+                            st.rerun()
+    else:
+        st.markdown(f"{render_mui_icon('info', 18)} **No important dates added yet.** Use the form above to add dates like exams, deadlines, etc.", unsafe_allow_html=True)
+        st.info("💡 Tip: Add important dates like exam dates, assignment deadlines, and project milestones to keep track of your schedule.")
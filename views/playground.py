@@ -0,0 +1,4312 @@
+"""Playground page."""
+
+import re
+import time
+
+import streamlit as st
+import pandas as pd
+
+from correlation_matrix import comoment_matrices, get_matrix_cache, heatmap
+from excel_formula import FormulaEngine, cell_input, display_value
+from lookup_index import EXACT, NEXT_LARGER, NEXT_SMALLER, get_lookup_engine
+from sql_sandbox import get_sql_sandbox
+from streaming_stats import summarize
+from synthetic_data import generate
+
+GENERATED_MAX_ROWS = 50_000  # what the data editors stay responsive with
+STATS_SOURCES = ["Edit a table", "Stream a file (CSV/Parquet)"]
+STATS_ANALYSES = ["Correlation Analysis", "Correlation Matrix", "Linear Regression",
+                  "ANOVA (Analysis of Variance)", "Histogram", "Covariance Analysis", "Descriptive Statistics"]
+LIVE_SHEET_COLUMNS = ["A", "B", "C", "D", "E", "F"]
+LIVE_SHEET_ROWS = 12
+LIVE_SHEET_START = {
+    1: ["Name", "Sales", "Target", "Variance", "Status"],
+    2: ["Alice", "15000", "14000", "=B2-C2", '=IF(D2>=0,"Met","Missed")'],
+    3: ["Bob", "22000", "20000", "=B3-C3", '=IF(D3>=0,"Met","Missed")'],
+    4: ["Charlie", "18000", "17000", "=B4-C4", '=IF(D4>=0,"Met","Missed")'],
+    5: ["Diana", "12000", "15000", "=B5-C5", '=IF(D5>=0,"Met","Missed")'],
+    6: ["Eve", "25000", "22000", "=B6-C6", '=IF(D6>=0,"Met","Missed")'],
+    8: ["Total", "=SUM(B2:B6)", "=SUM(C2:C6)", "=B8-C8", '=COUNTIF(E2:E6,"Met")&" met"'],
+    9: ["Bonus rate", "10%"],
+    10: ["Bonus pool", "=MAX(D8,0)*B9"],
+}
+
+
+def _live_sheet_start():
+    """The Live Sheet's starting cells as typed, one string per cell."""
+    grid = pd.DataFrame("", index=range(1, LIVE_SHEET_ROWS + 1), columns=LIVE_SHEET_COLUMNS)
+    for row, cells in LIVE_SHEET_START.items():
+        for col, text in zip(LIVE_SHEET_COLUMNS, cells):
+            grid.loc[row, col] = text
+    return grid
+
+
+def _live_sheet_changes(before, after):
+    """``{(row, col): value}`` for the cells whose typed text differs between two grids."""
+    changes = {}
+    for col_number, col in enumerate(LIVE_SHEET_COLUMNS, 1):
+        for row in after.index:
+            old = "" if before is None or pd.isna(before.loc[row, col]) else str(before.loc[row, col])
+            new = "" if pd.isna(after.loc[row, col]) else str(after.loc[row, col])
+            if before is None and new or before is not None and old.strip() != new.strip():
+                changes[(int(row), col_number)] = cell_input(new)
+    return changes
+
+
+def _show_filled_down(main_data, results, column, formula):
+    """Show the main table with a lookup formula filled down as a new column."""
+    filled = main_data.copy()
+    filled[column] = results.where(results.notna(), "#N/A").to_numpy()
+    found = int(results.notna().sum())
+    st.success(f"Filled `{formula}` down {len(filled)} rows: {found} found, {len(filled) - found} #N/A")
+    st.dataframe(filled, use_container_width=True)
+
+
+def _show_query_profile(profile):
+    """Timing, work and plan of one ``SqlSandbox.profile`` run."""
+    col_time, col_steps, col_scanned = st.columns(3)
+    col_time.metric("Median time", f"{profile['median_ms']:.2f} ms", help=f"{len(profile['times_ms'])} runs, fastest {profile['min_ms']:.2f} ms")
+    col_steps.metric("VM steps", f"{profile['vm_steps']:,}")
+    col_scanned.metric("Rows in full scans", f"{profile['rows_scanned']:,}")
+    if profile["indexes_used"]:
+        st.success(f"Index used: {', '.join(profile['indexes_used'])}")
+    else:
+        st.warning("No index used")
+    if profile["full_scans"]:
+        st.caption(f"Full table scan of: {', '.join(profile['full_scans'])}")
+    st.code(profile["plan_text"], language="text")
+
+
+def _dataset_generator(datasets, key, references=None):
+    """Controls that replace a tool's sample tables with generated ones.
+
+    ``datasets`` maps a label to ``(schema, session key, data editor key)``.
+    ``references`` maps a table a generated foreign key points at to the
+    session key holding it, so generated ids stay within that table's rows.
+    """
+    with st.expander("🎲 Generate a larger dataset"):
+        label = st.selectbox("Table:", list(datasets), key=f"{key}_gen_table") if len(datasets) > 1 else next(iter(datasets))
+        schema, state_key, editor_key = datasets[label]
+        col_rows, col_seed, col_skew = st.columns(3)
+        with col_rows:
+            rows = st.number_input("Rows:", 10, GENERATED_MAX_ROWS, 1000, step=100, key=f"{key}_gen_rows")
+        with col_seed:
+            seed = st.number_input("Seed:", 0, 2**31 - 1, 0, key=f"{key}_gen_seed")
+        with col_skew:
+            skew = st.select_slider("Category skew:", ["default", 0.0, 0.5, 1.0, 1.5, 2.0], key=f"{key}_gen_skew")
+        col_missing, col_duplicates, col_outliers = st.columns(3)
+        with col_missing:
+            missing = st.slider("Missing (%):", 0, 30, 0, key=f"{key}_gen_missing")
+        with col_duplicates:
+            duplicates = st.slider("Duplicate rows (%):", 0, 30, 0, key=f"{key}_gen_duplicates")
+        with col_outliers:
+            outliers = st.slider("Outliers (%):", 0, 10, 0, key=f"{key}_gen_outliers")
+        col_generate, col_restore = st.columns(2)
+        with col_generate:
+            if st.button("Generate", key=f"{key}_gen_button"):
+                try:
+                    st.session_state[state_key] = generate(
+                        schema, int(rows), seed=int(seed), missing=missing / 100, duplicates=duplicates / 100,
+                        outliers=outliers / 100, skew=None if skew == "default" else skew,
+                        references={table: len(st.session_state[ref_key]) for table, ref_key in (references or {}).items()}
+                    )
+                    st.session_state.pop(editor_key, None)
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+        with col_restore:
+            if st.button("Restore sample data", key=f"{key}_gen_restore"):
+                st.session_state.pop(state_key, None)
+                st.session_state.pop(editor_key, None)
+                st.rerun()
+        for table, ref_key in (references or {}).items():
+            st.caption(f"Generated ids referring to {table} run from 1 to its current {len(st.session_state[ref_key]):,} rows; "
+                       f"generate {table} first to join against a larger table.")
+        st.caption("Same settings and seed, same data. For files up to 10M rows: `python synthetic_data.py --help`.")
+
+
+def _show_correlation_matrix(matrices, chart):
+    """A correlation heatmap with the r, p-value, pair-count and covariance tables behind it."""
+    st.altair_chart(chart)
+    st.caption("Cells show r; * marks p < 0.05. Hover a cell for its exact r and p-value.")
+    tab_r, tab_p, tab_n, tab_cov = st.tabs(["Correlation (r)", "P-values", "Pairs used", "Covariance"])
+    tab_r.dataframe(matrices["r"].round(4), use_container_width=True)
+    tab_p.dataframe(matrices["p"].map(lambda p: f"{p:.4g}"), use_container_width=True)
+    tab_n.dataframe(matrices["n"], use_container_width=True)
+    tab_cov.dataframe(matrices["cov"].round(2), use_container_width=True)
+
+
+def _streamed_statistics():
+    """The Statistical Analysis tool over a file read in chunks, from one-pass accumulators."""
+    import altair as alt
+    
+    st.caption("The file is read in chunks and summarized in one pass, so memory use depends on the chunk size, not the file size.")
+    upload = st.file_uploader("Data file:", type=["csv", "parquet"], key="stats_stream_upload")
+    chunk_rows = st.select_slider(
+        "Chunk size (rows):", options=[10_000, 50_000, 100_000, 250_000, 500_000], value=100_000,
+        format_func=lambda n: f"{n:,}", key="stats_stream_chunk"
+    )
+    if upload is None:
+        st.info("Upload a CSV or Parquet file to analyze it without loading it all into memory.")
+        return
+    
+    source_key = (upload.file_id, chunk_rows)
+    if st.session_state.get("stats_stream_key") != source_key:
+        if not st.button("📥 Analyze file", type="primary"):
+            return
+        try:
+            with st.spinner(f"Reading {upload.name} in chunks of {chunk_rows:,} rows..."):
+                upload.seek(0)
+                start = time.perf_counter()
+                st.session_state.stats_stream_summary = summarize(upload, name=upload.name, chunk_rows=chunk_rows)
+                st.session_state.stats_stream_seconds = time.perf_counter() - start
+                st.session_state.stats_stream_key = source_key
+        except Exception as e:
+            st.error(f"Error: {str(e)}")
+            return
+    
+    summary = st.session_state.stats_stream_summary
+    st.success(f"Read {summary.rows:,} rows in {summary.chunks} chunk(s) in {st.session_state.stats_stream_seconds:.1f} s")
+    st.caption(f"Numeric: {', '.join(summary.numeric) or 'none'} | Categorical: {', '.join(summary.categorical) or 'none'}")
+    numeric_cols = summary.numeric
+    sample = summary.sample_frame()
+    plotted = sample.head(5000)
+    
+    analysis_type = st.selectbox("Analysis:", STATS_ANALYSES, key="stats_stream_analysis")
+    st.markdown("---")
+    
+    if analysis_type in ("Correlation Analysis", "Linear Regression"):
+        if len(numeric_cols) < 2:
+            st.warning("Need at least 2 numeric columns.")
+            return
+        col1, col2 = st.columns(2)
+        with col1:
+            var1 = st.selectbox("Variable 1 (X):", numeric_cols, key="stats_stream_x")
+        with col2:
+            var2 = st.selectbox("Variable 2 (Y):", [c for c in numeric_cols if c != var1], key="stats_stream_y")
+        if analysis_type == "Correlation Analysis":
+            correlation, p_value, pairs = summary.correlation(var1, var2)
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Correlation (r)", f"{correlation:.4f}")
+            col2.metric("R-squared", f"{correlation**2:.4f}")
+            col3.metric("P-value", f"{p_value:.4f}")
+            col4.metric("Complete pairs", f"{pairs:,}")
+        else:
+            fit = summary.regression(var1, var2)
+            col1, col2, col3, col4 = st.columns(4)
+            col1.metric("Slope (m)", f"{fit['slope']:.4f}")
+            col2.metric("Intercept (b)", f"{fit['intercept']:.4f}")
+            col3.metric("R-squared", f"{fit['r']**2:.4f}")
+            col4.metric("P-value", f"{fit['p']:.4f}")
+            st.success(f"**Equation:** {var2} = {fit['slope']:.2f} * {var1} + {fit['intercept']:.2f}")
+        scatter = alt.Chart(plotted).mark_circle(size=30, opacity=0.5).encode(x=var1, y=var2)
+        st.altair_chart(scatter + scatter.transform_regression(var1, var2).mark_line(color='red'), use_container_width=True)
+        st.caption(f"Plot shows {len(plotted):,} sampled rows; the statistics use all {summary.rows:,}.")
+    
+    elif analysis_type == "Correlation Matrix":
+        if len(numeric_cols) < 2:
+            st.warning("Need at least 2 numeric columns.")
+            return
+        matrices = comoment_matrices(summary.comoments, numeric_cols)
+        _show_correlation_matrix(matrices, heatmap(matrices["r"], matrices["p"]))
+        st.caption("Pearson, with each pair using the rows where both values are present. "
+                   "Spearman needs every row ranked at once, so it is only offered for edited tables.")
+    
+    elif analysis_type == "ANOVA (Analysis of Variance)":
+        grouping = [c for c in summary.categorical if summary.groups.get(c) is not None]
+        if not grouping or not numeric_cols:
+            st.warning("Need a categorical column (with at most 1,000 distinct values) and a numeric column for ANOVA.")
+            return
+        col1, col2 = st.columns(2)
+        with col1:
+            group_col = st.selectbox("Grouping Variable (categorical):", grouping, key="stats_stream_group")
+        with col2:
+            value_col = st.selectbox("Value Variable (numeric):", numeric_cols, key="stats_stream_value")
+        result = summary.anova(group_col, value_col)
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("F-statistic", f"{result['f']:.4f}")
+        col2.metric("P-value", f"{result['p']:.4f}")
+        col3.metric("SS between", f"{result['ss_between']:,.2f}", help=f"df = {result['df_between']}")
+        col4.metric("SS within", f"{result['ss_within']:,.2f}", help=f"df = {result['df_within']:,}")
+        st.dataframe(result["groups"], use_container_width=True)
+    
+    elif analysis_type == "Histogram":
+        hist_col = st.selectbox("Select column:", numeric_cols, key="stats_stream_hist")
+        bins = st.slider("Number of bins:", 5, 50, 20, key="stats_stream_bins")
+        hist = alt.Chart(sample[[hist_col]].dropna()).mark_bar().encode(
+            alt.X(hist_col, bin=alt.Bin(maxbins=bins)), y='count()'
+        )
+        st.altair_chart(hist, use_container_width=True)
+        described = summary.describe(hist_col)
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Mean", f"{described['mean']:.2f}")
+        col2.metric("Std Dev", f"{described['std']:.2f}")
+        col3.metric("Skewness", f"{described['skewness']:.2f}")
+        st.caption(f"Histogram of a uniform sample of {len(sample):,} rows; mean, std dev and skewness use every row.")
+    
+    elif analysis_type == "Covariance Analysis":
+        st.markdown("### Covariance Matrix")
+        st.dataframe(summary.covariance_matrix().round(2), use_container_width=True)
+        st.markdown("### Correlation Matrix")
+        st.dataframe(summary.correlation_matrix().round(2), use_container_width=True)
+        st.caption("Each pair uses the rows where both values are present.")
+    
+    elif analysis_type == "Descriptive Statistics":
+        selected_col = st.selectbox("Select column:", numeric_cols, key="stats_stream_describe")
+        described = summary.describe(selected_col)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Count", f"{described['count']:,}")
+            st.metric("Mean", f"{described['mean']:.2f}")
+            st.metric("Median", f"{described['median']:.2f}")
+        with col2:
+            st.metric("Std Dev", f"{described['std']:.2f}")
+            st.metric("Variance", f"{described['variance']:.2f}")
+            st.metric("Range", f"{described['max'] - described['min']:.2f}")
+        with col3:
+            st.metric("Min", f"{described['min']:.2f}")
+            st.metric("Max", f"{described['max']:.2f}")
+            st.metric("Sum", f"{described['sum']:.2f}")
+        col1, col2, col3, col4 = st.columns(4)
+        col1.metric("Q1 (25%)", f"{described['q1']:.2f}")
+        col2.metric("Q3 (75%)", f"{described['q3']:.2f}")
+        col3.metric("Skewness", f"{described['skewness']:.2f}")
+        col4.metric("Kurtosis", f"{described['kurtosis']:.2f}")
+        if not described["quantiles_exact"]:
+            st.caption(f"Median and quartiles are estimated from a uniform sample of {len(sample):,} rows.")
+
+
+def _reset_live_sheet():
+    for key in ("live_sheet_inputs", "live_sheet_engine", "live_sheet_recalculated", "live_sheet_editor"):
+        st.session_state.pop(key, None)
+
+
+def render():
+    st.title("🎮 Interactive Playground")
+    st.markdown("*Practice with real tools - enter data, run code, and see results instantly*")
+    st.markdown("---")
+    
+    # Organize playground tools by course/category
+    playground_tools = {
+        "Semester 1 - Tool Skills": {
+            "FI1BBDF05 - Data Analysis Fundamentals": [
+                "BI & Big Data Explorer"
+            ],
+            "FI1BBSF05 - Spreadsheet Fundamentals": [
+                "Excel Formula Simulator",
+                "Power Query Simulator"
+            ],
+            "FI1BBST05 - Statistical Tools": [
+                "Statistical Analysis",
+                "Z-Score & Outlier Tool"
+            ],
+            "FI1BBPF20 - Programming Fundamentals": [
+                "Python Code Runner"
+            ]
+        },
+        "Semester 2 - Data & Visualization": {
+            "FI1BBDC20 - Databases and Cloud Services": [
+                "SQL Query Tester"
+            ],
+            "FI1BBDV15 - Data Visualisation": [
+                "Chart Builder",
+                "Data Visualization Studio"
+            ],
+            "FI1BBDD75 - Data Driven Decision-Making": [
+                "KPI Dashboard Builder",
+                "Decision Analysis Tool"
+            ],
+            "FI1BBP175 - Semester Project 1": [
+                "Project Planning Workshop"
+            ],
+            "FI1BBAR05 - Analysis Reporting": [
+                "Report Writing Workshop"
+            ],
+            "FI1BBP275 - Exam Project 1": [
+                "Exam Project Toolkit"
+            ]
+        },
+        "Semester 3 - Competence Skills": {
+            "FI1BBEO10 - Evaluation of Outcomes": [
+                "Ethical Analysis Critique",
+                "Error Detection Workshop",
+                "Confidence Level Planner"
+            ]
+        }
+    }
+    
+    st.markdown("### Choose a Practice Tool")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        # Category filter
+        available_categories = list(playground_tools.keys())
+        selected_category = st.selectbox(
+            "📅 Semester/Category:",
+            options=["All Categories"] + available_categories
+        )
+    
+    with col2:
+        # Course filter
+        if selected_category == "All Categories":
+            all_courses = []
+            for cat in available_categories:
+                for course in playground_tools[cat].keys():
+                    if course not in all_courses:
+                        all_courses.append(course)
+            available_pg_courses = all_courses
+        else:
+            available_pg_courses = list(playground_tools[selected_category].keys())
+        
+        selected_pg_course = st.selectbox(
+            "📚 Course:",
+            options=["All Courses"] + available_pg_courses,
+            key="pg_course"
+        )
+    
+    # Get filtered tools
+    filtered_tools = []
+    for category, courses in playground_tools.items():
+        if selected_category != "All Categories" and category != selected_category:
+            continue
+        for course, tools in courses.items():
+            if selected_pg_course != "All Courses" and course != selected_pg_course:
+                continue
+            for tool in tools:
+                filtered_tools.append((tool, course, category))
+    
+    if not filtered_tools:
+        st.warning("No tools found for the selected filters.")
+        st.stop()
+    
+    # Show tool count
+    st.caption(f"🔧 {len(filtered_tools)} tools available")
+    
+    # Tool selector
+    tool_options = [t[0] for t in filtered_tools]
+    playground_tab = st.selectbox(
+        "🎯 Select Tool:",
+        options=tool_options
+    )
+    
+    # Find course info for selected tool
+    tool_course = None
+    tool_category = None
+    for tool, course, category in filtered_tools:
+        if tool == playground_tab:
+            tool_course = course
+            tool_category = category
+            break
+    
+    # Show context
+    st.markdown(f"**{tool_category}** | **{tool_course}**")
+    
+    if playground_tab == "Python Code Runner":
+        st.subheader("🐍 Python Code Playground")
+        st.markdown("Practice pandas operations on your own data! Edit the tables below, then run exercises.")
+        
+        # Initialize session state for editable data
+        if 'python_sales_data' not in st.session_state:
+            st.session_state.python_sales_data = pd.DataFrame({
+                'Product': ['Laptop', 'Phone', 'Tablet', 'Watch', 'Headphones'],
+                'Price': [999, 699, 449, 299, 149],
+                'Units_Sold': [150, 300, 200, 400, 500],
+                'Region': ['North', 'South', 'North', 'East', 'West']
+            })
+        
+        if 'python_employee_data' not in st.session_state:
+            st.session_state.python_employee_data = pd.DataFrame({
+                'Name': ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve'],
+                'Department': ['Sales', 'IT', 'Sales', 'HR', 'IT'],
+                'Salary': [55000, 72000, 48000, 61000, 68000],
+                'Years': [3, 5, 2, 7, 4]
+            })
+        
+        _dataset_generator({
+            "sales_data": ("sales", "python_sales_data", "python_sales_editor"),
+            "employee_data": ("employees", "python_employee_data", "python_employee_editor")
+        }, "python")
+        
+        st.markdown("### Your Datasets (Edit to add your own data!)")
+        data_tab1, data_tab2 = st.tabs(["sales_data", "employee_data"])
+        with data_tab1:
+            st.caption("Click any cell to edit. Use the + button to add rows.")
+            st.session_state.python_sales_data = st.data_editor(
+                st.session_state.python_sales_data,
+                num_rows="dynamic",
+                use_container_width=True,
+                key="python_sales_editor"
+            )
+        with data_tab2:
+            st.caption("Click any cell to edit. Use the + button to add rows.")
+            st.session_state.python_employee_data = st.data_editor(
+                st.session_state.python_employee_data,
+                num_rows="dynamic",
+                use_container_width=True,
+                key="python_employee_editor"
+            )
+        
+        # Use the session state data
+        sales_data = st.session_state.python_sales_data
+        employee_data = st.session_state.python_employee_data
+        
+        st.markdown("### Select an Exercise")
+        
+        exercises = {
+            "View DataFrame": {
+                "code": "# View the sales data\nprint(sales_data)",
+                "description": "Display the entire DataFrame"
+            },
+            "Add calculated column": {
+                "code": "# Add a Revenue column\nsales_data['Revenue'] = sales_data['Price'] * sales_data['Units_Sold']\nprint(sales_data)",
+                "description": "Create new columns from calculations"
+            },
+            "Basic statistics": {
+                "code": "# Get summary statistics\nprint(sales_data.describe())\n\n# Specific calculations\nprint(f\"Total Revenue: ${(sales_data['Price'] * sales_data['Units_Sold']).sum():,}\")\nprint(f\"Average Price: ${sales_data['Price'].mean():.2f}\")",
+                "description": "Calculate mean, sum, and other statistics"
+            },
+            "Filter data": {
+                "code": "# Filter products with price over $300\nexpensive = sales_data[sales_data['Price'] > 300]\nprint(expensive)",
+                "description": "Select rows based on conditions"
+            },
+            "Group By aggregation": {
+                "code": "# Total units sold by region\nby_region = sales_data.groupby('Region')['Units_Sold'].sum()\nprint(by_region)",
+                "description": "Aggregate data by categories"
+            },
+            "Sort data": {
+                "code": "# Sort by price (highest first)\nsorted_data = sales_data.sort_values('Price', ascending=False)\nprint(sorted_data)",
+                "description": "Order rows by column values"
+            },
+            "Employee analysis": {
+                "code": "# Average salary by department\navg_salary = employee_data.groupby('Department')['Salary'].mean()\nprint(avg_salary)\n\n# Highest paid employee\ntop_earner = employee_data.loc[employee_data['Salary'].idxmax()]\nprint(f\"\\nHighest paid: {top_earner['Name']} (${top_earner['Salary']:,})\")",
+                "description": "Practice with employee dataset"
+            }
+        }
+        
+        selected_exercise = st.selectbox("Choose exercise:", list(exercises.keys()))
+        
+        st.markdown(f"*{exercises[selected_exercise]['description']}*")
+        
+        st.markdown("### Code")
+        st.code(exercises[selected_exercise]['code'], language="python")
+        
+        if st.button("▶️ Run Code", type="primary"):
+            st.markdown("### Output:")
+            
+            # Execute the selected exercise safely with pre-defined data
+            import io
+            import sys as _sys
+            
+            old_stdout = _sys.stdout
+            _sys.stdout = buffer = io.StringIO()
+            
+            try:
+                # Create a copy of the data for this execution
+                local_sales = sales_data.copy()
+                local_employee = employee_data.copy()
+                
+                # Execute based on selected exercise
+                if selected_exercise == "View DataFrame":
+                    print(local_sales)
+                elif selected_exercise == "Add calculated column":
+                    local_sales['Revenue'] = local_sales['Price'] * local_sales['Units_Sold']
+                    print(local_sales)
+                elif selected_exercise == "Basic statistics":
+                    print(local_sales.describe())
+                    print(f"\nTotal Revenue: ${(local_sales['Price'] * local_sales['Units_Sold']).sum():,}")
+                    print(f"Average Price: ${local_sales['Price'].mean():.2f}")
+                elif selected_exercise == "Filter data":
+                    expensive = local_sales[local_sales['Price'] > 300]
+                    print(expensive)
+                elif selected_exercise == "Group By aggregation":
+                    by_region = local_sales.groupby('Region')['Units_Sold'].sum()
+                    print(by_region)
+                elif selected_exercise == "Sort data":
+                    sorted_data = local_sales.sort_values('Price', ascending=False)
+                    print(sorted_data)
+                elif selected_exercise == "Employee analysis":
+                    avg_salary = local_employee.groupby('Department')['Salary'].mean()
+                    print(avg_salary)
+                    top_earner = local_employee.loc[local_employee['Salary'].idxmax()]
+                    print(f"\nHighest paid: {top_earner['Name']} (${top_earner['Salary']:,})")
+                
+                output = buffer.getvalue()
+                _sys.stdout = old_stdout
+                
+                st.code(output, language="text")
+                
+                # Show resulting DataFrame if applicable
+                if selected_exercise == "Add calculated column":
+                    st.markdown("**Result DataFrame:**")
+                    st.dataframe(local_sales, use_container_width=True)
+                elif selected_exercise == "Filter data":
+                    expensive = local_sales[local_sales['Price'] > 300]
+                    st.dataframe(expensive, use_container_width=True)
+                elif selected_exercise == "Sort data":
+                    sorted_data = local_sales.sort_values('Price', ascending=False)
+                    st.dataframe(sorted_data, use_container_width=True)
+                    
+            except Exception as e:
+                _sys.stdout = old_stdout
+                st.error(f"Error: {str(e)}")
+        
+        st.markdown("---")
+        st.markdown("**Key pandas methods demonstrated:**")
+        st.markdown("- `df.describe()` - Summary statistics")
+        st.markdown("- `df.groupby()` - Group and aggregate")
+        st.markdown("- `df.sort_values()` - Sort rows")
+        st.markdown("- `df[condition]` - Filter rows")
+    
+    elif playground_tab == "Excel Formula Simulator":
+        st.subheader("📊 Excel Formula Simulator")
+        st.markdown("Practice Excel formulas including VLOOKUP and INDEX/MATCH!")
+        
+        # Main data table
+        st.markdown("### Main Data Table")
+        st.caption("Click cells to edit. Use + to add rows.")
+        
+        if 'excel_data' not in st.session_state:
+            st.session_state.excel_data = pd.DataFrame({
+                'EmployeeID': ['E001', 'E002', 'E003', 'E004', 'E005'],
+                'Name': ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve'],
+                'Department': ['Sales', 'IT', 'Sales', 'HR', 'Marketing'],
+                'Sales': [15000, 22000, 18000, 12000, 25000],
+                'Target': [14000, 20000, 17000, 15000, 22000]
+            })
+        
+        edited_data = st.data_editor(
+            st.session_state.excel_data,
+            num_rows="dynamic",
+            use_container_width=True,
+            key="excel_editor"
+        )
+        st.session_state.excel_data = edited_data
+        
+        # Lookup reference table for VLOOKUP/INDEX-MATCH
+        st.markdown("### Lookup Reference Table")
+        st.caption("This table is used for VLOOKUP and INDEX/MATCH lookups.")
+        
+        if 'excel_lookup' not in st.session_state:
+            st.session_state.excel_lookup = pd.DataFrame({
+                'Department': ['Sales', 'IT', 'HR', 'Marketing', 'Finance'],
+                'Manager': ['John Smith', 'Sarah Lee', 'Mike Brown', 'Lisa Chen', 'Tom Wilson'],
+                'Budget': [50000, 75000, 40000, 60000, 80000],
+                'Bonus_Rate': [0.10, 0.08, 0.05, 0.12, 0.07]
+            })
+        
+        lookup_data = st.data_editor(
+            st.session_state.excel_lookup,
+            num_rows="dynamic",
+            use_container_width=True,
+            key="excel_lookup_editor"
+        )
+        st.session_state.excel_lookup = lookup_data
+        
+        st.markdown("### Apply Formulas")
+        
+        formula_categories = {
+            "Basic Functions": ["SUM", "AVERAGE", "COUNT", "MAX", "MIN"],
+            "Conditional Functions": ["SUMIF", "COUNTIF", "AVERAGEIF"],
+            "Lookup Functions": ["VLOOKUP", "INDEX/MATCH", "XLOOKUP"],
+            "Spreadsheet": ["Live Sheet"],
+            "Formatting & Tables": ["Conditional Formatting", "Pivot Table"],
+            "Comparison": ["Excel vs Google Sheets"],
+            "Other": ["IF Statement", "Custom Calculation"]
+        }
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            category = st.selectbox("Category:", list(formula_categories.keys()))
+        with col2:
+            formula_type = st.selectbox("Formula:", formula_categories[category])
+        
+        st.markdown("---")
+        
+        # Basic Functions
+        if formula_type in ["SUM", "AVERAGE", "COUNT", "MAX", "MIN"]:
+            numeric_cols = edited_data.select_dtypes(include=['number']).columns.tolist()
+            if numeric_cols:
+                column = st.selectbox("Select column:", numeric_cols)
+                
+                if st.button("Calculate", type="primary"):
+                    try:
+                        if formula_type == "SUM":
+                            result = edited_data[column].sum()
+                        elif formula_type == "AVERAGE":
+                            result = edited_data[column].mean()
+                        elif formula_type == "COUNT":
+                            result = edited_data[column].count()
+                        elif formula_type == "MAX":
+                            result = edited_data[column].max()
+                        elif formula_type == "MIN":
+                            result = edited_data[column].min()
+                        
+                        st.success(f"={formula_type}({column}) = **{result:,.2f}**")
+                        st.code(f"Excel: ={formula_type}(B2:B{len(edited_data)+1})")
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
+            else:
+                st.warning("No numeric columns available.")
+        
+        # Conditional Functions
+        elif formula_type in ["SUMIF", "COUNTIF", "AVERAGEIF"]:
+            crit_col = st.selectbox("Criteria column:", edited_data.columns.tolist())
+            criteria = st.text_input("Criteria value:", edited_data[crit_col].iloc[0] if len(edited_data) > 0 else "")
+            
+            if formula_type != "COUNTIF":
+                numeric_cols = edited_data.select_dtypes(include=['number']).columns.tolist()
+                if numeric_cols:
+                    sum_col = st.selectbox("Value column:", numeric_cols)
+            
+            if st.button("Calculate", type="primary"):
+                try:
+                    mask = edited_data[crit_col].astype(str).str.lower() == str(criteria).lower()
+                    
+                    if formula_type == "SUMIF":
+                        result = edited_data.loc[mask, sum_col].sum()
+                        st.success(f"=SUMIF({crit_col}, \"{criteria}\", {sum_col}) = **{result:,.2f}**")
+                        st.code(f"Excel: =SUMIF(A:A, \"{criteria}\", B:B)")
+                    elif formula_type == "COUNTIF":
+                        result = mask.sum()
+                        st.success(f"=COUNTIF({crit_col}, \"{criteria}\") = **{result}**")
+                        st.code(f"Excel: =COUNTIF(A:A, \"{criteria}\")")
+                    elif formula_type == "AVERAGEIF":
+                        result = edited_data.loc[mask, sum_col].mean()
+                        st.success(f"=AVERAGEIF({crit_col}, \"{criteria}\", {sum_col}) = **{result:,.2f}**")
+                        st.code(f"Excel: =AVERAGEIF(A:A, \"{criteria}\", B:B)")
+                        
+                    st.info(f"Found {mask.sum()} matching row(s)")
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+        
+        # VLOOKUP
+        elif formula_type == "VLOOKUP":
+            st.markdown("**VLOOKUP** finds a value in the first column of the lookup table and returns a value from another column.")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                lookup_value = st.selectbox("Lookup value from main table:", edited_data.columns.tolist())
+                row_to_lookup = st.selectbox("Which row to lookup:", list(range(len(edited_data))))
+                actual_lookup = edited_data.iloc[row_to_lookup][lookup_value]
+                st.info(f"Looking up: **{actual_lookup}**")
+            
+            with col2:
+                return_col = st.selectbox("Return column from lookup table:", lookup_data.columns.tolist()[1:])
+                approximate = st.radio("Match type:", ["Exact (FALSE)", "Approximate (TRUE)"],
+                                       horizontal=True) == "Approximate (TRUE)"
+            
+            lookup_key_col = lookup_data.columns[0]
+            col_number = list(lookup_data.columns).index(return_col) + 1
+            range_lookup = "TRUE" if approximate else "FALSE"
+            mode = NEXT_SMALLER if approximate else EXACT
+            lookups = get_lookup_engine(st.session_state)
+            
+            col_run, col_fill = st.columns(2)
+            if col_run.button("Run VLOOKUP", type="primary"):
+                try:
+                    position, result = lookups.lookup("excel_lookup", lookup_data, lookup_key_col,
+                                                      actual_lookup, return_col, mode=mode)
+                    
+                    if position is not None:
+                        st.success(f"=VLOOKUP(\"{actual_lookup}\", LookupTable, {col_number}, {range_lookup})")
+                        st.success(f"Result: **{result}**")
+                        st.code(f"Excel: =VLOOKUP(A2, LookupTable!A:D, {col_number}, {range_lookup})")
+                        
+                        st.markdown("**How it works:**")
+                        if approximate:
+                            st.markdown(f"1. Search the sorted first column for the largest value ≤ '{actual_lookup}'")
+                            st.markdown(f"2. It is '{lookup_data[lookup_key_col].iloc[position]}' (row {position + 1})")
+                        else:
+                            st.markdown(f"1. Search for '{actual_lookup}' in first column of lookup table")
+                            st.markdown(f"2. Find matching row")
+                        st.markdown(f"3. Return value from '{return_col}' column: **{result}**")
+                    else:
+                        st.warning(f"No match found for '{actual_lookup}' in lookup table.")
+                        st.info("This would return #N/A in Excel")
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+            
+            if col_fill.button("Fill down for every row"):
+                try:
+                    results = lookups.lookup_many("excel_lookup", lookup_data, lookup_key_col,
+                                                  edited_data[lookup_value], return_col, mode=mode)
+                    _show_filled_down(edited_data, results, return_col,
+                                      f"=VLOOKUP({lookup_value}, LookupTable, {col_number}, {range_lookup})")
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+        
+        # INDEX/MATCH
+        elif formula_type == "INDEX/MATCH":
+            st.markdown("**INDEX/MATCH** is more flexible than VLOOKUP - it can look up values in any column!")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**MATCH: Find the row**")
+                match_value = st.selectbox("Value to find:", edited_data.columns.tolist())
+                row_idx = st.selectbox("From row:", list(range(len(edited_data))))
+                actual_match = edited_data.iloc[row_idx][match_value]
+                st.info(f"Finding: **{actual_match}**")
+                
+                match_in_col = st.selectbox("Search in column:", lookup_data.columns.tolist())
+            
+            with col2:
+                st.markdown("**INDEX: Return the value**")
+                return_col = st.selectbox("Return from column:", lookup_data.columns.tolist())
+            
+            lookups = get_lookup_engine(st.session_state)
+            col_run, col_fill = st.columns(2)
+            if col_run.button("Run INDEX/MATCH", type="primary"):
+                try:
+                    position, result = lookups.lookup("excel_lookup", lookup_data, match_in_col,
+                                                      actual_match, return_col)
+                    
+                    if position is not None:
+                        row_num = lookup_data.index[position]
+                        
+                        st.success(f"=INDEX({return_col}, MATCH(\"{actual_match}\", {match_in_col}, 0))")
+                        st.success(f"Result: **{result}**")
+                        st.code(f"Excel: =INDEX(LookupTable!{return_col}:{return_col}, MATCH(A2, LookupTable!{match_in_col}:{match_in_col}, 0))")
+                        
+                        st.markdown("**How it works:**")
+                        st.markdown(f"1. MATCH finds '{actual_match}' in '{match_in_col}' column")
+                        st.markdown(f"2. Returns row position: **{list(lookup_data.index).index(row_num) + 1}**")
+                        st.markdown(f"3. INDEX uses that position to get value from '{return_col}': **{result}**")
+                        
+                        st.info("INDEX/MATCH advantage: Can lookup left (VLOOKUP can only look right)")
+                    else:
+                        st.warning(f"No match found for '{actual_match}'")
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+            
+            if col_fill.button("Fill down for every row"):
+                try:
+                    results = lookups.lookup_many("excel_lookup", lookup_data, match_in_col,
+                                                  edited_data[match_value], return_col)
+                    _show_filled_down(edited_data, results, return_col,
+                                      f"=INDEX({return_col}, MATCH({match_value}, {match_in_col}, 0))")
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+        
+        # XLOOKUP (modern alternative)
+        elif formula_type == "XLOOKUP":
+            st.markdown("**XLOOKUP** is the modern replacement for VLOOKUP (Excel 365/2021+)")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                lookup_col = st.selectbox("Lookup value column:", edited_data.columns.tolist())
+                row_idx = st.selectbox("From row:", list(range(len(edited_data))))
+                lookup_val = edited_data.iloc[row_idx][lookup_col]
+                st.info(f"Looking up: **{lookup_val}**")
+            
+            with col2:
+                search_col = st.selectbox("Search in:", lookup_data.columns.tolist())
+                return_col = st.selectbox("Return from:", lookup_data.columns.tolist())
+                match_modes = {"Exact match (0)": EXACT, "Exact or next smaller (-1)": NEXT_SMALLER,
+                               "Exact or next larger (1)": NEXT_LARGER}
+                match_label = st.selectbox("Match mode:", list(match_modes))
+            
+            mode = match_modes[match_label]
+            mode_arg = "" if mode == EXACT else f", \"#N/A\", {mode}"
+            lookups = get_lookup_engine(st.session_state)
+            col_run, col_fill = st.columns(2)
+            if col_run.button("Run XLOOKUP", type="primary"):
+                try:
+                    position, result = lookups.lookup("excel_lookup", lookup_data, search_col,
+                                                      lookup_val, return_col, mode=mode)
+                    
+                    if position is not None:
+                        st.success(f"=XLOOKUP(\"{lookup_val}\", {search_col}, {return_col}{mode_arg})")
+                        st.success(f"Result: **{result}**")
+                        st.code(f"Excel: =XLOOKUP(A2, LookupTable!{search_col}:{search_col}, LookupTable!{return_col}:{return_col}{mode_arg})")
+                        
+                        st.markdown("**XLOOKUP advantages over VLOOKUP:**")
+                        st.markdown("- Can search in any direction (left or right)")
+                        st.markdown("- Simpler syntax (no column numbers)")
+                        st.markdown("- Built-in error handling")
+                    else:
+                        st.warning(f"No match found for '{lookup_val}'")
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+            
+            if col_fill.button("Fill down for every row"):
+                try:
+                    results = lookups.lookup_many("excel_lookup", lookup_data, search_col,
+                                                  edited_data[lookup_col], return_col, mode=mode)
+                    _show_filled_down(edited_data, results, return_col,
+                                      f"=XLOOKUP({lookup_col}, {search_col}, {return_col}{mode_arg})")
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+        
+        # Live Sheet: cells hold values or formulas and recalculate like Excel
+        elif formula_type == "Live Sheet":
+            st.markdown("Type a number, text or a formula starting with `=` into any cell — "
+                        "e.g. change a **Sales** figure or the **Bonus rate**. Like Excel, an edit "
+                        "recalculates only the formulas that depend on the edited cells.")
+            
+            if 'live_sheet_engine' not in st.session_state:
+                start = _live_sheet_start()
+                engine = FormulaEngine([], {})
+                recalculated = engine.set_cells(_live_sheet_changes(None, start))
+                st.session_state.live_sheet_inputs = start
+                st.session_state.live_sheet_engine = engine
+                st.session_state.live_sheet_recalculated = list(recalculated)
+            
+            engine = st.session_state.live_sheet_engine
+            st.markdown("**Cells (what you type):**")
+            typed = st.data_editor(
+                st.session_state.live_sheet_inputs,
+                use_container_width=True,
+                column_config={col: st.column_config.TextColumn(col) for col in LIVE_SHEET_COLUMNS},
+                key="live_sheet_editor"
+            )
+            changes = _live_sheet_changes(st.session_state.live_sheet_inputs, typed)
+            if changes:
+                st.session_state.live_sheet_recalculated = list(engine.set_cells(changes))
+                st.session_state.live_sheet_inputs = typed.copy()
+            
+            recalculated = st.session_state.live_sheet_recalculated
+            shown = pd.DataFrame(
+                [[display_value(engine.value(row, col)) for col in range(1, len(LIVE_SHEET_COLUMNS) + 1)]
+                 for row in range(1, LIVE_SHEET_ROWS + 1)],
+                index=range(1, LIVE_SHEET_ROWS + 1), columns=LIVE_SHEET_COLUMNS
+            )
+            dirty = {(row, col) for row, col in recalculated}
+            st.markdown("**Values (what Excel shows)** — cells recalculated by the last edit are highlighted:")
+            st.dataframe(
+                shown.style.apply(lambda column: [
+                    "background-color: #fff3b0" if (row, LIVE_SHEET_COLUMNS.index(column.name) + 1) in dirty else ""
+                    for row in column.index
+                ]),
+                use_container_width=True
+            )
+            
+            names = [f"{LIVE_SHEET_COLUMNS[col - 1]}{row}" for row, col in recalculated if col <= len(LIVE_SHEET_COLUMNS)]
+            st.caption(f"Recalculated {len(recalculated)} of {len(engine.formulas)} formula cells, "
+                       f"in dependency order: {', '.join(names) or 'none'}")
+            
+            with st.expander("Which cells depend on which?"):
+                st.markdown("\n".join(
+                    f"- `{LIVE_SHEET_COLUMNS[col - 1]}{row}` `{engine.formulas[(row, col)]}` ← "
+                    + (", ".join(sorted(f"{LIVE_SHEET_COLUMNS[c - 1]}{r}" for r, c in engine.precedents((row, col)))) or "inputs only")
+                    for row, col in engine.order() if col <= len(LIVE_SHEET_COLUMNS)
+                ))
+            
+            st.button("Reset sheet", on_click=_reset_live_sheet)
+        
+        # IF Statement
+        elif formula_type == "IF Statement":
+            st.markdown("**IF** returns different values based on a condition.")
+            
+            numeric_cols = edited_data.select_dtypes(include=['number']).columns.tolist()
+            if len(numeric_cols) >= 2:
+                col1, col2 = st.columns(2)
+                with col1:
+                    check_col = st.selectbox("Check column:", numeric_cols)
+                    operator = st.selectbox("Operator:", [">", "<", ">=", "<=", "="])
+                with col2:
+                    compare_to = st.selectbox("Compare to:", ["Value", "Another Column"])
+                    if compare_to == "Value":
+                        compare_val = st.number_input("Value:", value=0)
+                    else:
+                        compare_col = st.selectbox("Column:", [c for c in numeric_cols if c != check_col])
+                
+                if st.button("Apply IF Formula", type="primary"):
+                    try:
+                        if compare_to == "Value":
+                            if operator == ">":
+                                result = edited_data[check_col] > compare_val
+                            elif operator == "<":
+                                result = edited_data[check_col] < compare_val
+                            elif operator == ">=":
+                                result = edited_data[check_col] >= compare_val
+                            elif operator == "<=":
+                                result = edited_data[check_col] <= compare_val
+                            else:
+                                result = edited_data[check_col] == compare_val
+                            formula_str = f"=IF({check_col}{operator}{compare_val}, \"Yes\", \"No\")"
+                        else:
+                            if operator == ">":
+                                result = edited_data[check_col] > edited_data[compare_col]
+                            elif operator == "<":
+                                result = edited_data[check_col] < edited_data[compare_col]
+                            elif operator == ">=":
+                                result = edited_data[check_col] >= edited_data[compare_col]
+                            elif operator == "<=":
+                                result = edited_data[check_col] <= edited_data[compare_col]
+                            else:
+                                result = edited_data[check_col] == edited_data[compare_col]
+                            formula_str = f"=IF({check_col}{operator}{compare_col}, \"Yes\", \"No\")"
+                        
+                        result_df = edited_data.copy()
+                        result_df['IF_Result'] = result.map({True: 'Yes', False: 'No'})
+                        
+                        st.success(formula_str)
+                        st.dataframe(result_df, use_container_width=True)
+                        st.code(f"Excel: =IF(A2{operator}B2, \"Yes\", \"No\")")
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
+        
+        # Conditional Formatting
+        elif formula_type == "Conditional Formatting":
+            st.markdown("**Conditional Formatting** applies visual styles based on cell values.")
+            st.markdown("Common uses: highlight high/low values, show trends, identify outliers")
+            
+            numeric_cols = edited_data.select_dtypes(include=['number']).columns.tolist()
+            
+            if numeric_cols:
+                format_col = st.selectbox("Column to format:", numeric_cols)
+                
+                format_type = st.selectbox(
+                    "Formatting rule:",
+                    ["Highlight cells > value", "Highlight cells < value", "Color Scale (low to high)", 
+                     "Data Bars", "Top/Bottom N values", "Highlight duplicates"]
+                )
+                
+                if format_type == "Highlight cells > value":
+                    threshold = st.number_input("Highlight values greater than:", value=float(edited_data[format_col].mean()))
+                    highlight_color = st.color_picker("Highlight color:", "#90EE90")
+                    
+                    if st.button("Apply Formatting", type="primary"):
+                        result_df = edited_data.copy()
+                        
+                        def highlight_above(row):
+                            return [f'background-color: {highlight_color}' if col == format_col and pd.notna(row[col]) and row[col] > threshold else '' for col in row.index]
+                        
+                        styled = result_df.style.apply(highlight_above, axis=1)
+                        st.markdown("### Result (cells highlighted in green):")
+                        st.dataframe(styled, use_container_width=True)
+                        
+                        matches = (result_df[format_col] > threshold).sum()
+                        st.success(f"Highlighted {matches} cells where {format_col} > {threshold}")
+                        st.code(f"Excel: Home > Conditional Formatting > Highlight Cells Rules > Greater Than > {threshold}")
+                
+                elif format_type == "Highlight cells < value":
+                    threshold = st.number_input("Highlight values less than:", value=float(edited_data[format_col].mean()))
+                    highlight_color = st.color_picker("Highlight color:", "#FFB6C1")
+                    
+                    if st.button("Apply Formatting", type="primary"):
+                        result_df = edited_data.copy()
+                        
+                        def highlight_below(row):
+                            return [f'background-color: {highlight_color}' if col == format_col and pd.notna(row[col]) and row[col] < threshold else '' for col in row.index]
+                        
+                        styled = result_df.style.apply(highlight_below, axis=1)
+                        st.markdown("### Result (cells highlighted):")
+                        st.dataframe(styled, use_container_width=True)
+                        
+                        matches = (result_df[format_col] < threshold).sum()
+                        st.success(f"Highlighted {matches} cells where {format_col} < {threshold}")
+                        st.code(f"Excel: Home > Conditional Formatting > Highlight Cells Rules > Less Than > {threshold}")
+                
+                elif format_type == "Color Scale (low to high)":
+                    st.markdown("Color scales show values on a gradient from low (red) to high (green).")
+                    
+                    if st.button("Apply Color Scale", type="primary"):
+                        result_df = edited_data.copy()
+                        
+                        styled = result_df.style.background_gradient(
+                            subset=[format_col],
+                            cmap='RdYlGn'
+                        )
+                        
+                        st.markdown("### Result (color gradient applied):")
+                        st.dataframe(styled, use_container_width=True)
+                        
+                        st.success(f"Applied color scale: Red (low) → Yellow (mid) → Green (high)")
+                        st.code("Excel: Home > Conditional Formatting > Color Scales > Green-Yellow-Red")
+                
+                elif format_type == "Data Bars":
+                    st.markdown("Data bars show relative values as bars within cells.")
+                    
+                    if st.button("Apply Data Bars", type="primary"):
+                        result_df = edited_data.copy()
+                        
+                        styled = result_df.style.bar(
+                            subset=[format_col],
+                            color='#5fba7d',
+                            vmin=0
+                        )
+                        
+                        st.markdown("### Result (data bars in cells):")
+                        st.dataframe(styled, use_container_width=True)
+                        
+                        st.success("Applied data bars showing relative values")
+                        st.code("Excel: Home > Conditional Formatting > Data Bars > Solid Fill")
+                
+                elif format_type == "Top/Bottom N values":
+                    n_values = st.slider("Number of values:", 1, min(10, len(edited_data)), 3)
+                    top_or_bottom = st.radio("Highlight:", ["Top N", "Bottom N"], horizontal=True)
+                    
+                    if st.button("Apply Formatting", type="primary"):
+                        result_df = edited_data.copy()
+                        
+                        if top_or_bottom == "Top N":
+                            threshold = result_df[format_col].nlargest(n_values).min()
+                            mask = result_df[format_col] >= threshold
+                            color = '#90EE90'
+                        else:
+                            threshold = result_df[format_col].nsmallest(n_values).max()
+                            mask = result_df[format_col] <= threshold
+                            color = '#FFB6C1'
+                        
+                        def highlight_topbottom(row):
+                            if mask[row.name]:
+                                return [f'background-color: {color}' if col == format_col else '' for col in row.index]
+                            return ['' for _ in row.index]
+                        
+                        styled = result_df.style.apply(highlight_topbottom, axis=1)
+                        st.markdown(f"### Result ({top_or_bottom} {n_values} highlighted):")
+                        st.dataframe(styled, use_container_width=True)
+                        
+                        st.success(f"Highlighted {mask.sum()} cells ({top_or_bottom} {n_values})")
+                        st.code(f"Excel: Home > Conditional Formatting > Top/Bottom Rules > Top {n_values} Items")
+                
+                elif format_type == "Highlight duplicates":
+                    dup_col = st.selectbox("Check for duplicates in:", edited_data.columns.tolist())
+                    
+                    if st.button("Find Duplicates", type="primary"):
+                        result_df = edited_data.copy()
+                        mask = result_df.duplicated(subset=[dup_col], keep=False)
+                        
+                        def highlight_dups(row):
+                            if mask[row.name]:
+                                return ['background-color: #FFFF99' if col == dup_col else '' for col in row.index]
+                            return ['' for _ in row.index]
+                        
+                        styled = result_df.style.apply(highlight_dups, axis=1)
+                        st.markdown("### Result (duplicates highlighted in yellow):")
+                        st.dataframe(styled, use_container_width=True)
+                        
+                        dup_count = mask.sum()
+                        if dup_count > 0:
+                            st.warning(f"Found {dup_count} duplicate values in '{dup_col}'")
+                        else:
+                            st.success("No duplicates found!")
+                        
+                        st.code("Excel: Home > Conditional Formatting > Highlight Cells Rules > Duplicate Values")
+            else:
+                st.warning("Need numeric columns for conditional formatting.")
+        
+        # Pivot Table
+        elif formula_type == "Pivot Table":
+            st.markdown("**Pivot Tables** summarize and analyze data by grouping and aggregating.")
+            st.markdown("Drag-and-drop style: choose rows, columns, and values to create summaries.")
+            
+            all_cols = edited_data.columns.tolist()
+            numeric_cols = edited_data.select_dtypes(include=['number']).columns.tolist()
+            categorical_cols = [c for c in all_cols if c not in numeric_cols]
+            
+            if categorical_cols and numeric_cols:
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown("**Rows (Group By):**")
+                    row_field = st.selectbox("Row field:", categorical_cols + ["None"])
+                    
+                    st.markdown("**Columns (Optional):**")
+                    col_field = st.selectbox("Column field:", ["None"] + [c for c in categorical_cols if c != row_field])
+                
+                with col2:
+                    st.markdown("**Values:**")
+                    value_field = st.selectbox("Value field:", numeric_cols)
+                    
+                    st.markdown("**Aggregation:**")
+                    agg_func = st.selectbox("Function:", ["Sum", "Average", "Count", "Min", "Max"])
+                
+                if st.button("Create Pivot Table", type="primary"):
+                    try:
+                        agg_map = {"Sum": "sum", "Average": "mean", "Count": "count", "Min": "min", "Max": "max"}
+                        
+                        if row_field == "None":
+                            st.warning("Please select at least a Row field.")
+                        else:
+                            if col_field != "None":
+                                pivot = pd.pivot_table(
+                                    edited_data,
+                                    values=value_field,
+                                    index=row_field,
+                                    columns=col_field,
+                                    aggfunc=agg_map[agg_func],
+                                    fill_value=0
+                                )
+                            else:
+                                pivot = edited_data.groupby(row_field)[value_field].agg(agg_map[agg_func]).reset_index()
+                                pivot.columns = [row_field, f"{agg_func} of {value_field}"]
+                            
+                            st.markdown("### Pivot Table Result:")
+                            st.dataframe(pivot, use_container_width=True)
+                            
+                            # Add grand totals
+                            if col_field != "None":
+                                st.markdown(f"**Grand Total ({agg_func}):** {pivot.values.sum():,.2f}")
+                            
+                            st.code("Excel: Insert > PivotTable > Select data range")
+                            st.markdown("**Steps in Excel:**")
+                            st.markdown(f"1. Drag '{row_field}' to Rows area")
+                            if col_field != "None":
+                                st.markdown(f"2. Drag '{col_field}' to Columns area")
+                            st.markdown(f"3. Drag '{value_field}' to Values area")
+                            st.markdown(f"4. Change aggregation to '{agg_func}'")
+                    except Exception as e:
+                        st.error(f"Error creating pivot table: {str(e)}")
+            else:
+                st.warning("Need at least one categorical column and one numeric column for pivot tables.")
+                st.info("Try adding a text column (like 'Department' or 'Region') to your data.")
+        
+        # Excel vs Google Sheets Comparison
+        elif formula_type == "Excel vs Google Sheets":
+            st.markdown("## Excel vs Google Sheets Comparison")
+            st.markdown("Both are powerful spreadsheet tools. Here's when to use each:")
+            
+            st.markdown("### Feature Comparison")
+            
+            comparison_data = pd.DataFrame({
+                'Feature': [
+                    'Best For', 'Collaboration', 'Offline Access', 'Data Size', 
+                    'Advanced Features', 'Cost', 'Learning Curve', 'Integration',
+                    'Macros/Automation', 'Mobile App'
+                ],
+                'Microsoft Excel': [
+                    'Complex analysis, large datasets', 'SharePoint/OneDrive (paid)', 
+                    'Full offline support', 'Millions of rows', 'Power Query, Power Pivot, VBA',
+                    'Paid (Office 365)', 'Steeper', 'Microsoft ecosystem',
+                    'VBA macros (powerful)', 'Good'
+                ],
+                'Google Sheets': [
+                    'Collaboration, simple tasks', 'Real-time built-in (free)',
+                    'Limited (Chrome extension)', '10 million cells max',
+                    'Apps Script, Explore feature', 'Free', 'Easier', 'Google Workspace',
+                    'Apps Script (web-based)', 'Excellent'
+                ]
+            })
+            
+            st.dataframe(comparison_data, use_container_width=True, hide_index=True)
+            
+            st.markdown("### Formula Differences")
+            
+            formula_diff = pd.DataFrame({
+                'Function': ['VLOOKUP', 'Array Formulas', 'Unique Values', 'Filter Data', 'Import Data'],
+                'Excel': ['=VLOOKUP()', 'Ctrl+Shift+Enter (legacy)', '=UNIQUE()', '=FILTER()', '=WEBSERVICE()'],
+                'Google Sheets': ['=VLOOKUP()', 'Native (no special entry)', '=UNIQUE()', '=FILTER()', '=IMPORTDATA()']
+            })
+            
+            st.dataframe(formula_diff, use_container_width=True, hide_index=True)
+            
+            st.markdown("### When to Use Each")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.markdown("#### Use Excel When:")
+                st.markdown("- Working with very large datasets (100k+ rows)")
+                st.markdown("- Need Power Query for data transformation")
+                st.markdown("- Require VBA macros for complex automation")
+                st.markdown("- Working offline frequently")
+                st.markdown("- Need Power Pivot for data modeling")
+                st.markdown("- Using advanced statistical tools")
+            
+            with col2:
+                st.markdown("#### Use Google Sheets When:")
+                st.markdown("- Real-time collaboration is essential")
+                st.markdown("- Team needs free access")
+                st.markdown("- Data needs to be always accessible online")
+                st.markdown("- Integrating with other Google tools")
+                st.markdown("- Simple to medium complexity tasks")
+                st.markdown("- Quick sharing without file attachments")
+            
+            st.markdown("### Key Shortcuts Comparison")
+            
+            shortcuts = pd.DataFrame({
+                'Action': ['Copy', 'Paste', 'Fill Down', 'Select All', 'Find', 'Insert Row', 'Format Cells'],
+                'Excel (Windows)': ['Ctrl+C', 'Ctrl+V', 'Ctrl+D', 'Ctrl+A', 'Ctrl+F', 'Ctrl+Shift++', 'Ctrl+1'],
+                'Google Sheets': ['Ctrl+C', 'Ctrl+V', 'Ctrl+D', 'Ctrl+A', 'Ctrl+F', 'Ctrl+Shift++', 'Ctrl+\\']
+            })
+            
+            st.dataframe(shortcuts, use_container_width=True, hide_index=True)
+            
+            st.info("**Tip:** Most basic formulas work the same in both! Learn one, and you'll know 80% of the other.")
+        
+        # Custom Calculation
+        elif formula_type == "Custom Calculation":
+            st.markdown("### Add Calculated Column")
+            new_col_name = st.text_input("New column name:", "Performance")
+            
+            numeric_cols = edited_data.select_dtypes(include=['number']).columns.tolist()
+            if len(numeric_cols) >= 2:
+                col_a = st.selectbox("First column:", numeric_cols)
+                operation = st.selectbox("Operation:", ["+", "-", "*", "/"])
+                col_b = st.selectbox("Second column:", [c for c in numeric_cols if c != col_a])
+                
+                if st.button("Add Column"):
+                    try:
+                        if operation == "+":
+                            edited_data[new_col_name] = edited_data[col_a] + edited_data[col_b]
+                        elif operation == "-":
+                            edited_data[new_col_name] = edited_data[col_a] - edited_data[col_b]
+                        elif operation == "*":
+                            edited_data[new_col_name] = edited_data[col_a] * edited_data[col_b]
+                        elif operation == "/":
+                            edited_data[new_col_name] = (edited_data[col_a] / edited_data[col_b]).round(2)
+                        
+                        st.session_state.excel_data = edited_data
+                        st.success(f"Added column: {new_col_name} = {col_a} {operation} {col_b}")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
+    
+    elif playground_tab == "SQL Query Tester":
+        st.subheader("🗄️ SQL Query Tester")
+        st.markdown("Write SQL queries against your data - edit the tables below to add your own!")
+        
+        # Initialize editable tables in session state
+        if 'sql_customers' not in st.session_state:
+            st.session_state.sql_customers = pd.DataFrame({
+                'id': [1, 2, 3, 4, 5],
+                'name': ['Alice Smith', 'Bob Johnson', 'Charlie Brown', 'Diana Ross', 'Eve Wilson'],
+                'city': ['New York', 'Los Angeles', 'Chicago', 'Houston', 'Phoenix'],
+                'joined_date': ['2023-01-15', '2023-03-22', '2023-02-10', '2023-04-05', '2023-01-30']
+            })
+        
+        if 'sql_orders' not in st.session_state:
+            st.session_state.sql_orders = pd.DataFrame({
+                'order_id': [101, 102, 103, 104, 105, 106, 107, 108],
+                'customer_id': [1, 2, 1, 3, 4, 2, 5, 1],
+                'product': ['Laptop', 'Phone', 'Tablet', 'Laptop', 'Phone', 'Watch', 'Headphones', 'Phone'],
+                'amount': [999, 699, 449, 999, 699, 299, 149, 699],
+                'order_date': ['2024-01-10', '2024-01-12', '2024-01-15', '2024-02-01', '2024-02-05', '2024-02-10', '2024-02-15', '2024-03-01']
+            })
+        
+        _dataset_generator({
+            "customers": ("customers", "sql_customers", "sql_customers_editor"),
+            "orders": ("orders", "sql_orders", "sql_orders_editor")
+        }, "sql", references={"customers": "sql_customers"})
+        
+        st.markdown("### Your Tables (Edit to add your own data!)")
+        
+        tab1, tab2 = st.tabs(["customers", "orders"])
+        with tab1:
+            st.caption("Click cells to edit. Use + to add rows.")
+            st.session_state.sql_customers = st.data_editor(
+                st.session_state.sql_customers,
+                num_rows="dynamic",
+                use_container_width=True,
+                key="sql_customers_editor"
+            )
+        with tab2:
+            st.caption("Click cells to edit. Use + to add rows.")
+            st.session_state.sql_orders = st.data_editor(
+                st.session_state.sql_orders,
+                num_rows="dynamic",
+                use_container_width=True,
+                key="sql_orders_editor"
+            )
+        
+        sandbox = get_sql_sandbox(st.session_state)
+        try:
+            synced = {
+                "customers": sandbox.sync("customers", st.session_state.sql_customers),
+                "orders": sandbox.sync("orders", st.session_state.sql_orders),
+            }
+            changes = [
+                f"{name}: reloaded" if change["reloaded"]
+                else f"{name}: +{change['inserted']} / ~{change['updated']} / -{change['deleted']} rows"
+                for name, change in synced.items()
+                if change["reloaded"] or change["inserted"] or change["updated"] or change["deleted"]
+            ]
+            if changes:
+                st.caption(f"Synced to the session database ({'; '.join(changes)}) in {sum(c['ms'] for c in synced.values()):.1f} ms")
+        except Exception as e:
+            st.error(f"Could not load your tables: {str(e)}")
+        
+        with st.expander("📤 Upload a table"):
+            st.caption("Load a CSV or Excel file as a new table. It stays in this session's database until you remove it.")
+            upload = st.file_uploader("Table file", type=["csv", "xlsx"], key="sql_upload")
+            default_name = re.sub(r"\W", "_", upload.name.rsplit(".", 1)[0]).strip("_").lower() if upload else ""
+            table_name = st.text_input("Table name:", value=default_name or "my_table", key="sql_upload_name")
+            if st.button("Load table", disabled=upload is None):
+                try:
+                    if table_name in ("customers", "orders"):
+                        raise ValueError("customers and orders are edited above; choose another name")
+                    uploaded = pd.read_csv(upload) if upload.name.lower().endswith(".csv") else pd.read_excel(upload)
+                    change = sandbox.sync(table_name, uploaded)
+                    st.success(f"Loaded {change['inserted']:,} rows into `{table_name}` in {change['ms']:.0f} ms")
+                except Exception as e:
+                    st.error(f"Upload Error: {str(e)}")
+            uploaded_tables = {name: rows for name, rows in sandbox.tables().items() if name not in ("customers", "orders")}
+            if uploaded_tables:
+                st.dataframe(
+                    pd.DataFrame({"table": list(uploaded_tables), "rows": list(uploaded_tables.values())}),
+                    hide_index=True,
+                    use_container_width=True
+                )
+                col_drop_table, col_drop_button = st.columns([3, 1])
+                with col_drop_table:
+                    drop_table = st.selectbox("Remove table:", list(uploaded_tables), key="sql_drop_table")
+                with col_drop_button:
+                    st.write("")
+                    if st.button("Remove", key="sql_drop_table_button"):
+                        sandbox.drop_table(drop_table)
+                        st.rerun()
+        
+        with st.expander("🔎 Indexes"):
+            st.caption("Indexes speed up WHERE, JOIN and ORDER BY on the indexed columns. They last for the session; you can also run CREATE INDEX as a query.")
+            table_names = list(sandbox.tables())
+            col_index_table, col_index_columns = st.columns([1, 2])
+            with col_index_table:
+                index_table = st.selectbox("Table:", table_names, key="sql_index_table")
+            with col_index_columns:
+                index_columns = st.multiselect("Columns:", sandbox.columns(index_table) if index_table else [], key="sql_index_columns")
+            unique_index = st.checkbox("Unique", key="sql_index_unique")
+            if st.button("Create index", disabled=not index_columns):
+                try:
+                    st.success(f"Created `{sandbox.create_index(index_table, index_columns, unique=unique_index)}`")
+                except Exception as e:
+                    st.error(f"Index Error: {str(e)}")
+            existing_indexes = sandbox.indexes()
+            if len(existing_indexes):
+                st.dataframe(existing_indexes, hide_index=True, use_container_width=True)
+                col_drop_index, col_drop_index_button = st.columns([3, 1])
+                with col_drop_index:
+                    drop_index = st.selectbox("Drop index:", existing_indexes["name"].tolist(), key="sql_drop_index")
+                with col_drop_index_button:
+                    st.write("")
+                    if st.button("Drop", key="sql_drop_index_button"):
+                        sandbox.drop_index(drop_index)
+                        st.rerun()
+        
+        st.markdown("### Write Your Query")
+        
+        example_queries = {
+            "Select all customers": "SELECT * FROM customers",
+            "Orders over $500": "SELECT * FROM orders WHERE amount > 500",
+            "Total sales by product": "SELECT product, SUM(amount) as total FROM orders GROUP BY product",
+            "Join customers and orders": "SELECT c.name, o.product, o.amount FROM orders o JOIN customers c ON o.customer_id = c.id",
+            "Top customers by spend": "SELECT c.name, SUM(o.amount) as total_spent FROM orders o JOIN customers c ON o.customer_id = c.id GROUP BY c.name ORDER BY total_spent DESC"
+        }
+        
+        selected_example = st.selectbox("Try an example:", ["Custom Query"] + list(example_queries.keys()))
+        
+        if selected_example == "Custom Query":
+            default_query = "SELECT * FROM customers"
+        else:
+            default_query = example_queries[selected_example]
+        
+        query = st.text_area("SQL Query:", value=default_query, height=100)
+        
+        col_run, col_profile, col_repeats = st.columns([1, 1, 2])
+        with col_run:
+            run_clicked = st.button("▶️ Run Query", type="primary")
+        with col_profile:
+            profile_clicked = st.button("⏱️ Profile Query")
+        with col_repeats:
+            profile_repeats = st.slider("Profile runs:", 1, 20, 5)
+        
+        if profile_clicked:
+            st.markdown("### Query Profile:")
+            try:
+                profile = sandbox.profile(query, repeats=profile_repeats)
+                st.caption(f"Returned {profile['rows']} row(s)")
+                _show_query_profile(profile)
+                with st.expander("EXPLAIN QUERY PLAN rows"):
+                    st.dataframe(profile["plan"], hide_index=True, use_container_width=True)
+            except Exception as e:
+                st.error(f"Profile Error: {str(e)}")
+        
+        if run_clicked:
+            st.markdown("### Results:")
+            
+            try:
+                result = sandbox.query(query)
+                
+                if result is None:
+                    st.success("Statement executed.")
+                    st.caption("Changes to customers and orders are replaced by the tables above on the next run; uploaded tables keep them.")
+                else:
+                    st.dataframe(result, use_container_width=True)
+                    st.caption(f"Returned {len(result)} row(s)")
+                
+            except Exception as e:
+                st.error(f"Query Error: {str(e)}")
+        
+        st.markdown("### ⚡ Index Performance Lab")
+        st.markdown("See what an index does to a query on a large version of the orders table.")
+        large_rows = st.select_slider(
+            "Rows in orders_large:", options=[100_000, 250_000, 500_000, 1_000_000], value=1_000_000,
+            format_func=lambda n: f"{n:,}"
+        )
+        if st.button("🏗️ Generate orders_large"):
+            try:
+                with st.spinner(f"Generating {large_rows:,} orders..."):
+                    change = sandbox.sync("orders_large", generate("orders", large_rows))
+                st.success(f"Loaded {change['inserted']:,} rows into `orders_large` in {change['ms'] / 1000:.1f} s")
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
+        
+        if "orders_large" in sandbox.tables():
+            lab_query = st.text_area(
+                "Query to compare:",
+                value="SELECT product, COUNT(*) AS orders, SUM(amount) AS total FROM orders_large WHERE customer_id = 42 GROUP BY product",
+                height=80
+            )
+            col_lab_columns, col_lab_repeats = st.columns([2, 1])
+            with col_lab_columns:
+                lab_columns = st.multiselect("Index columns:", sandbox.columns("orders_large"), default=["customer_id"])
+            with col_lab_repeats:
+                lab_repeats = st.slider("Runs each:", 1, 20, 5)
+            if st.button("⚖️ Compare before/after index", disabled=not lab_columns):
+                try:
+                    with st.spinner("Profiling..."):
+                        before, after = sandbox.compare_index(lab_query, "orders_large", lab_columns, repeats=lab_repeats)
+                    col_before, col_after = st.columns(2)
+                    with col_before:
+                        st.markdown("**Before: no index**")
+                        _show_query_profile(before)
+                    with col_after:
+                        st.markdown(f"**After: index on {', '.join(lab_columns)}**")
+                        _show_query_profile(after)
+                    if after["median_ms"] > 0:
+                        st.info(f"The index made this query {before['median_ms'] / after['median_ms']:,.1f}x faster "
+                                f"({before['median_ms']:.2f} ms → {after['median_ms']:.2f} ms).")
+                except Exception as e:
+                    st.error(f"Profile Error: {str(e)}")
+        
+        st.markdown("---")
+        st.markdown("**Practice Exercises:**")
+        st.markdown("1. Find all orders from customer_id 1")
+        st.markdown("2. Calculate average order amount")
+        st.markdown("3. List customers who have placed more than 1 order")
+    
+    elif playground_tab == "Chart Builder":
+        st.subheader("📈 Chart Builder")
+        st.markdown("Create visualizations from your own data! Edit the table below.")
+        
+        # Initialize editable chart data in session state
+        if 'chart_data' not in st.session_state:
+            st.session_state.chart_data = pd.DataFrame({
+                'Category': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
+                'Value1': [45000, 52000, 48000, 61000, 55000, 67000],
+                'Value2': [32000, 35000, 33000, 38000, 36000, 40000]
+            })
+        
+        st.markdown("### Your Data (Edit to add your own!)")
+        st.caption("Click cells to edit values. Use + to add rows.")
+        st.session_state.chart_data = st.data_editor(
+            st.session_state.chart_data,
+            num_rows="dynamic",
+            use_container_width=True,
+            key="chart_data_editor"
+        )
+        
+        chart_data = st.session_state.chart_data
+        
+        st.markdown("### Choose Chart Type")
+        
+        col1, col2 = st.columns(2)
+        
+        # Get numeric columns for Y-axis options
+        numeric_cols = chart_data.select_dtypes(include=['number']).columns.tolist()
+        all_cols = chart_data.columns.tolist()
+        
+        with col1:
+            chart_type = st.selectbox(
+                "Chart type:",
+                ["Bar Chart", "Line Chart", "Area Chart", "Scatter Plot"]
+            )
+        
+        with col2:
+            x_column = st.selectbox("X-axis (categories):", all_cols, index=0)
+            y_column = st.selectbox("Y-axis (values):", numeric_cols if numeric_cols else all_cols)
+        
+        st.markdown("### Your Chart")
+        
+        try:
+            if chart_type == "Bar Chart":
+                st.bar_chart(chart_data.set_index(x_column)[y_column])
+            elif chart_type == "Line Chart":
+                st.line_chart(chart_data.set_index(x_column)[y_column])
+            elif chart_type == "Area Chart":
+                st.area_chart(chart_data.set_index(x_column)[y_column])
+            elif chart_type == "Scatter Plot":
+                if len(numeric_cols) >= 2:
+                    import altair as alt
+                    x_scatter = st.selectbox("Scatter X:", numeric_cols, key="scatter_x")
+                    y_scatter = st.selectbox("Scatter Y:", [c for c in numeric_cols if c != x_scatter], key="scatter_y")
+                    scatter = alt.Chart(chart_data).mark_circle(size=100).encode(
+                        x=x_scatter,
+                        y=y_scatter,
+                        tooltip=all_cols
+                    ).properties(width=600, height=400)
+                    st.altair_chart(scatter, use_container_width=True)
+                else:
+                    st.info("Scatter plots need at least 2 numeric columns. Add more data!")
+        except Exception as e:
+            st.warning(f"Could not create chart: {str(e)}")
+        
+        st.markdown("---")
+        st.markdown("**Chart Best Practices:**")
+        st.markdown("- **Bar charts**: Best for comparing categories")
+        st.markdown("- **Line charts**: Best for showing trends over time")
+        st.markdown("- **Area charts**: Good for showing volume/cumulative data")
+        st.markdown("- **Scatter plots**: Best for showing relationships between two variables")
+    
+    elif playground_tab == "Data Visualization Studio":
+        st.subheader("🎨 Data Visualization Studio")
+        st.markdown("*Practice choosing charts, designing for accessibility, and identifying visualization problems*")
+        st.markdown("---")
+        
+        viz_mode = st.radio(
+            "Choose practice mode:",
+            ["Chart Selection Advisor", "Accessibility Checker", "Visualization Critique", "Story Builder"],
+            horizontal=True
+        )
+        
+        if viz_mode == "Chart Selection Advisor":
+            st.markdown("### Chart Selection Advisor")
+            st.markdown("*Answer questions about your data to get chart recommendations*")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                data_goal = st.selectbox(
+                    "What do you want to show?",
+                    ["Compare categories", "Show trend over time", "Show parts of a whole", 
+                     "Show relationship between variables", "Show distribution", "Show geographic patterns"]
+                )
+                num_categories = st.slider("How many categories/data points?", 2, 50, 6)
+            
+            with col2:
+                audience = st.selectbox(
+                    "Who is your audience?",
+                    ["Executives (quick glance)", "Technical team (detailed analysis)", 
+                     "General public", "Mixed audience"]
+                )
+                interactive = st.checkbox("Does it need to be interactive?")
+            
+            if st.button("🎯 Get Recommendations", type="primary"):
+                st.markdown("---")
+                st.markdown("### Recommended Charts")
+                
+                recommendations = []
+                warnings = []
+                
+                if data_goal == "Compare categories":
+                    if num_categories <= 7:
+                        recommendations.append(("Bar Chart (horizontal)", "Best for comparing values across categories", "⭐ Top Pick"))
+                        recommendations.append(("Column Chart (vertical)", "Good when categories have short labels", ""))
+                    else:
+                        recommendations.append(("Horizontal Bar Chart", "Essential when you have many categories", "⭐ Top Pick"))
+                        warnings.append("With 7+ categories, avoid pie charts - they become unreadable")
+                
+                elif data_goal == "Show trend over time":
+                    recommendations.append(("Line Chart", "Perfect for continuous time series", "⭐ Top Pick"))
+                    recommendations.append(("Area Chart", "Good for showing volume/magnitude over time", ""))
+                    if num_categories <= 4:
+                        recommendations.append(("Multiple Line Chart", "Compare trends across 2-4 series", ""))
+                
+                elif data_goal == "Show parts of a whole":
+                    if num_categories <= 5:
+                        recommendations.append(("Pie Chart", "Works well with few categories", "⭐ Top Pick"))
+                        recommendations.append(("Donut Chart", "Modern alternative to pie", ""))
+                    else:
+                        recommendations.append(("Stacked Bar Chart", "Better than pie for many categories", "⭐ Top Pick"))
+                        recommendations.append(("Treemap", "Good for hierarchical data", ""))
+                        warnings.append("Avoid pie charts with more than 5 slices")
+                
+                elif data_goal == "Show relationship between variables":
+                    recommendations.append(("Scatter Plot", "Shows correlation between variables", "⭐ Top Pick"))
+                    recommendations.append(("Bubble Chart", "Adds a third dimension (size)", ""))
+                
+                elif data_goal == "Show distribution":
+                    recommendations.append(("Histogram", "Shows frequency distribution", "⭐ Top Pick"))
+                    recommendations.append(("Box Plot", "Shows median, quartiles, outliers", ""))
+                
+                elif data_goal == "Show geographic patterns":
+                    recommendations.append(("Choropleth Map", "Color-coded regions", "⭐ Top Pick"))
+                    recommendations.append(("Bubble Map", "Points with size encoding", ""))
+                
+                if audience == "Executives (quick glance)":
+                    recommendations.append(("Single Number + Sparkline", "Maximum simplicity for busy executives", "💼"))
+                    warnings.append("Keep it simple - one key insight per visual")
+                
+                for chart, desc, badge in recommendations:
+                    col1, col2 = st.columns([3, 1])
+                    with col1:
+                        st.markdown(f"**{chart}**")
+                        st.caption(desc)
+                    with col2:
+                        if badge:
+                            st.markdown(badge)
+                
+                if warnings:
+                    st.markdown("### ⚠️ Watch Out For:")
+                    for w in warnings:
+                        st.warning(w)
+        
+        elif viz_mode == "Accessibility Checker":
+            st.markdown("### Accessibility Checker")
+            st.markdown("*Evaluate your visualization design for accessibility*")
+            
+            st.markdown("**Rate your visualization on these criteria:**")
+            
+            checks = {
+                "Color contrast": st.select_slider(
+                    "Text and data have sufficient contrast against background",
+                    options=["No", "Partially", "Yes"],
+                    value="Partially"
+                ),
+                "Color independence": st.select_slider(
+                    "Information is conveyed by more than just color (shapes, patterns, labels)",
+                    options=["No", "Partially", "Yes"],
+                    value="Partially"
+                ),
+                "Clear labels": st.select_slider(
+                    "All axes, legends, and data points are clearly labeled",
+                    options=["No", "Partially", "Yes"],
+                    value="Partially"
+                ),
+                "Font readability": st.select_slider(
+                    "Font size is large enough and font is sans-serif",
+                    options=["No", "Partially", "Yes"],
+                    value="Partially"
+                ),
+                "Title and context": st.select_slider(
+                    "Chart has a descriptive title and necessary context",
+                    options=["No", "Partially", "Yes"],
+                    value="Partially"
+                ),
+                "Data source": st.select_slider(
+                    "Data source is cited",
+                    options=["No", "Partially", "Yes"],
+                    value="Partially"
+                )
+            }
+            
+            if st.button("📋 Generate Accessibility Report", type="primary"):
+                st.markdown("---")
+                st.markdown("### Accessibility Report")
+                
+                score = 0
+                max_score = len(checks) * 2
+                
+                for check, value in checks.items():
+                    if value == "Yes":
+                        st.success(f"✅ **{check}**: Good")
+                        score += 2
+                    elif value == "Partially":
+                        st.warning(f"⚠️ **{check}**: Needs improvement")
+                        score += 1
+                    else:
+                        st.error(f"❌ **{check}**: Missing")
+                
+                st.markdown("---")
+                pct = (score / max_score) * 100
+                st.metric("Accessibility Score", f"{pct:.0f}%")
+                
+                if pct >= 80:
+                    st.success("Your visualization meets basic accessibility standards!")
+                elif pct >= 50:
+                    st.warning("Your visualization needs some improvements for full accessibility.")
+                else:
+                    st.error("Significant accessibility improvements needed.")
+                
+                st.markdown("**Tips for improvement:**")
+                if checks["Color independence"] != "Yes":
+                    st.markdown("- Add patterns, shapes, or direct labels so color isn't the only differentiator")
+                if checks["Color contrast"] != "Yes":
+                    st.markdown("- Use a contrast checker tool (aim for 4.5:1 ratio)")
+                if checks["Clear labels"] != "Yes":
+                    st.markdown("- Add axis labels, legend, and data labels where helpful")
+        
+        elif viz_mode == "Visualization Critique":
+            st.markdown("### Visualization Critique")
+            st.markdown("*Identify problems in common visualization mistakes*")
+            
+            critique_scenarios = {
+                "Truncated Y-Axis": {
+                    "description": "A bar chart shows company revenue: Year 1 = $98M, Year 2 = $100M, Year 3 = $102M. The y-axis starts at $95M.",
+                    "problems": ["Y-axis starting at $95M makes 2% differences look like 50%+ differences", "Viewer perceives dramatic growth that doesn't exist"],
+                    "fixes": ["Start y-axis at $0 for bar charts", "If small differences matter, use a line chart or table with % change"]
+                },
+                "Pie Chart Overload": {
+                    "description": "A pie chart shows market share with 15 different slices, many smaller than 3%.",
+                    "problems": ["Too many slices to compare", "Small slices are indistinguishable", "Colors become repetitive"],
+                    "fixes": ["Group small categories into 'Other'", "Use horizontal bar chart instead", "Limit pie charts to 5-7 slices"]
+                },
+                "3D Chart Distortion": {
+                    "description": "A 3D pie chart is used to show budget allocation. The slice at the front appears larger than equal slices at the back.",
+                    "problems": ["3D perspective distorts slice sizes", "Front slices appear larger due to perspective", "Harder to compare values accurately"],
+                    "fixes": ["Use 2D charts - they're more accurate", "If you must use 3D, provide data labels", "Consider a bar chart instead"]
+                },
+                "Cherry-Picked Timeframe": {
+                    "description": "A chart shows 'Record Growth!' by comparing March (lowest month) to December (highest month), ignoring the full year context.",
+                    "problems": ["Misleading comparison (worst to best)", "Hides overall trend", "Reader can't see seasonal patterns"],
+                    "fixes": ["Show complete time period", "Compare same periods (year-over-year)", "Include context about seasonality"]
+                }
+            }
+            
+            selected_scenario = st.selectbox("Choose a scenario to analyze:", list(critique_scenarios.keys()))
+            scenario = critique_scenarios[selected_scenario]
+            
+            st.markdown(f"**Scenario:** {scenario['description']}")
+            
+            user_problems = st.text_area(
+                "What problems do you see? (List them)",
+                placeholder="Enter the issues you identify...",
+                height=100
+            )
+            
+            if st.button("🔍 Show Expert Analysis", type="primary"):
+                st.markdown("---")
+                st.markdown("### Problems Identified:")
+                for p in scenario["problems"]:
+                    st.error(f"❌ {p}")
+                
+                st.markdown("### Recommended Fixes:")
+                for f in scenario["fixes"]:
+                    st.success(f"✅ {f}")
+        
+        elif viz_mode == "Story Builder":
+            st.markdown("### Data Story Builder")
+            st.markdown("*Practice structuring a data presentation*")
+            
+            st.markdown("**Fill in your data story framework:**")
+            
+            context = st.text_area(
+                "1. CONTEXT: Why should the audience care?",
+                placeholder="e.g., 'Customer churn has increased 15% this quarter, threatening our revenue targets...'",
+                height=80
+            )
+            
+            insight = st.text_area(
+                "2. INSIGHT: What does the data reveal?",
+                placeholder="e.g., 'Analysis of 5,000 churned customers shows 70% cited 'slow support response' as their top complaint...'",
+                height=80
+            )
+            
+            visualization = st.text_input(
+                "3. VISUALIZATION: What chart will you show?",
+                placeholder="e.g., 'Bar chart comparing churn reasons, with response time highlighted'"
+            )
+            
+            action = st.text_area(
+                "4. ACTION: What should happen next?",
+                placeholder="e.g., 'Recommend investing $50K in chat support to reduce response time from 4 hours to 30 minutes...'",
+                height=80
+            )
+            
+            if st.button("📊 Generate Story Summary", type="primary"):
+                if context and insight and action:
+                    st.markdown("---")
+                    st.markdown("### Your Data Story")
+                    
+                    story = f"""## Data Story: Executive Summary
+
+### Context
+{context}
+
+### Key Insight
+{insight}
+
+### Visualization
+*{visualization if visualization else '[Add your chart description]'}*
+
+### Recommended Action
+{action}
+
+---
+*Story Structure: Setup → Insight → Action*
+"""
+                    st.markdown(story)
+                    
+                    st.download_button(
+                        "📥 Download Story Framework",
+                        data=story,
+                        file_name="data_story.md",
+                        mime="text/markdown"
+                    )
+                else:
+                    st.warning("Please fill in all sections to generate your story.")
+    
+    elif playground_tab == "Statistical Analysis":
+        st.subheader("📊 Statistical Analysis Tool")
+        st.markdown("Perform correlation, regression, ANOVA, histogram, and covariance analysis on your data!")
+        
+        from scipy import stats
+        import numpy as np
+        
+        data_source = st.radio("Data source:", STATS_SOURCES, horizontal=True, key="stats_source")
+        
+        if data_source == STATS_SOURCES[1]:
+            _streamed_statistics()
+        else:
+            # Initialize sample data for statistical analysis
+            if 'stats_data' not in st.session_state:
+                np.random.seed(42)
+                st.session_state.stats_data = pd.DataFrame({
+                    'Advertising': [10, 15, 20, 25, 30, 35, 40, 45, 50, 55],
+                    'Sales': [100, 120, 150, 170, 200, 220, 250, 280, 300, 320],
+                    'Region': ['A', 'B', 'A', 'B', 'A', 'B', 'A', 'B', 'A', 'B'],
+                    'Quarter': ['Q1', 'Q1', 'Q2', 'Q2', 'Q3', 'Q3', 'Q4', 'Q4', 'Q1', 'Q2'],
+                    'Employees': [5, 8, 10, 12, 15, 18, 20, 22, 25, 28]
+                })
+            
+            _dataset_generator({
+                "stats_data": ("stats", "stats_data", "stats_data_editor")
+            }, "stats")
+            
+            st.markdown("### Your Data (Edit to add your own!)")
+            st.caption("Click cells to edit. Use + to add rows.")
+            st.session_state.stats_data = st.data_editor(
+                st.session_state.stats_data,
+                num_rows="dynamic",
+                use_container_width=True,
+                key="stats_data_editor"
+            )
+            
+            stats_data = st.session_state.stats_data
+            numeric_cols = stats_data.select_dtypes(include=['number']).columns.tolist()
+            categorical_cols = stats_data.select_dtypes(include=['object']).columns.tolist()
+            
+            st.markdown("### Choose Analysis Type")
+            
+            analysis_type = st.selectbox("Analysis:", STATS_ANALYSES)
+            
+            st.markdown("---")
+            
+            if analysis_type == "Correlation Analysis":
+                st.markdown("**Correlation** measures the strength and direction of relationship between two variables.")
+                st.markdown("- Values range from -1 to +1")
+                st.markdown("- +1 = perfect positive correlation, -1 = perfect negative correlation, 0 = no correlation")
+                
+                if len(numeric_cols) >= 2:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        var1 = st.selectbox("Variable 1:", numeric_cols)
+                    with col2:
+                        var2 = st.selectbox("Variable 2:", [c for c in numeric_cols if c != var1])
+                    
+                    if st.button("Calculate Correlation", type="primary"):
+                        try:
+                            correlation, p_value = stats.pearsonr(stats_data[var1], stats_data[var2])
+                            
+                            st.markdown("### Results")
+                            
+                            col1, col2, col3 = st.columns(3)
+                            with col1:
+                                st.metric("Correlation (r)", f"{correlation:.4f}")
+                            with col2:
+                                st.metric("R-squared", f"{correlation**2:.4f}")
+                            with col3:
+                                st.metric("P-value", f"{p_value:.4f}")
+                            
+                            # Interpretation
+                            if abs(correlation) >= 0.7:
+                                strength = "strong"
+                            elif abs(correlation) >= 0.4:
+                                strength = "moderate"
+                            else:
+                                strength = "weak"
+                            
+                            direction = "positive" if correlation > 0 else "negative"
+                            
+                            st.success(f"There is a **{strength} {direction}** correlation between {var1} and {var2}.")
+                            
+                            if p_value < 0.05:
+                                st.info("The correlation is statistically significant (p < 0.05).")
+                            else:
+                                st.warning("The correlation is NOT statistically significant (p >= 0.05).")
+                            
+                            # Show scatter plot
+                            st.markdown("### Scatter Plot")
+                            import altair as alt
+                            scatter = alt.Chart(stats_data).mark_circle(size=60).encode(
+                                x=var1,
+                                y=var2,
+                                tooltip=[var1, var2]
+                            ).properties(width=600, height=300)
+                            
+                            # Add trend line
+                            line = scatter.transform_regression(var1, var2).mark_line(color='red')
+                            st.altair_chart(scatter + line, use_container_width=True)
+                            
+                            st.code(f"Excel: =CORREL({var1}:{var1}, {var2}:{var2})")
+                            st.code(f"Python: scipy.stats.pearsonr(df['{var1}'], df['{var2}'])")
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Need at least 2 numeric columns for correlation analysis.")
+            
+            elif analysis_type == "Correlation Matrix":
+                st.markdown("**Correlation Matrix** correlates every pair of numeric columns at once, with a p-value for each pair.")
+                st.markdown("- **Pearson** measures linear relationships; **Spearman** correlates ranks, so it also catches monotonic curves and resists outliers")
+                st.markdown("- Results are cached, so they are only recomputed when the data or options change")
+                
+                if len(numeric_cols) >= 2:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        method = st.radio("Method:", ["Pearson", "Spearman"], horizontal=True, key="stats_matrix_method")
+                    with col2:
+                        listwise = st.checkbox(
+                            "Drop rows with any missing value", key="stats_matrix_listwise",
+                            help="Off: each pair uses the rows where both values are present. On: every pair uses the same complete rows."
+                        )
+                    try:
+                        matrices, chart = get_matrix_cache(st.session_state).get(stats_data, method.lower(), listwise)
+                        _show_correlation_matrix(matrices, chart)
+                        
+                        st.code("Excel: =CORREL(range1, range2) for each pair")
+                        st.code(f"Python: df.corr(method='{method.lower()}')" if not listwise
+                                else f"Python: df.dropna().corr(method='{method.lower()}')")
+                    except Exception as e:
+                        st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Need at least 2 numeric columns for a correlation matrix.")
+            
+            elif analysis_type == "Linear Regression":
+                st.markdown("**Linear Regression** finds the best-fit line to predict one variable from another.")
+                st.markdown("Formula: y = mx + b (where m = slope, b = intercept)")
+                
+                if len(numeric_cols) >= 2:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        x_var = st.selectbox("Independent Variable (X):", numeric_cols)
+                    with col2:
+                        y_var = st.selectbox("Dependent Variable (Y):", [c for c in numeric_cols if c != x_var])
+                    
+                    if st.button("Run Regression", type="primary"):
+                        try:
+                            slope, intercept, r_value, p_value, std_err = stats.linregress(
+                                stats_data[x_var], stats_data[y_var]
+                            )
+                            
+                            st.markdown("### Regression Results")
+                            
+                            col1, col2, col3, col4 = st.columns(4)
+                            with col1:
+                                st.metric("Slope (m)", f"{slope:.4f}")
+                            with col2:
+                                st.metric("Intercept (b)", f"{intercept:.4f}")
+                            with col3:
+                                st.metric("R-squared", f"{r_value**2:.4f}")
+                            with col4:
+                                st.metric("P-value", f"{p_value:.4f}")
+                            
+                            st.success(f"**Equation:** {y_var} = {slope:.2f} * {x_var} + {intercept:.2f}")
+                            
+                            st.markdown("**Interpretation:**")
+                            st.markdown(f"- For every 1 unit increase in {x_var}, {y_var} increases by {slope:.2f}")
+                            st.markdown(f"- The model explains {r_value**2*100:.1f}% of the variance in {y_var}")
+                            
+                            # Prediction tool
+                            st.markdown("### Make a Prediction")
+                            pred_x = st.number_input(f"Enter {x_var} value:", value=float(stats_data[x_var].mean()))
+                            pred_y = slope * pred_x + intercept
+                            st.info(f"Predicted {y_var}: **{pred_y:.2f}**")
+                            
+                            # Show regression plot
+                            import altair as alt
+                            scatter = alt.Chart(stats_data).mark_circle(size=60).encode(
+                                x=x_var,
+                                y=y_var,
+                                tooltip=[x_var, y_var]
+                            ).properties(width=600, height=300)
+                            line = scatter.transform_regression(x_var, y_var).mark_line(color='red')
+                            st.altair_chart(scatter + line, use_container_width=True)
+                            
+                            st.code(f"Excel: =SLOPE({y_var}:{y_var}, {x_var}:{x_var}), =INTERCEPT({y_var}:{y_var}, {x_var}:{x_var})")
+                            st.code(f"Python: scipy.stats.linregress(df['{x_var}'], df['{y_var}'])")
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Need at least 2 numeric columns for regression analysis.")
+            
+            elif analysis_type == "ANOVA (Analysis of Variance)":
+                st.markdown("**ANOVA** tests if there are significant differences between group means.")
+                st.markdown("- Used when comparing means across 2+ groups")
+                st.markdown("- Null hypothesis: All group means are equal")
+                
+                if categorical_cols and numeric_cols:
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        group_col = st.selectbox("Grouping Variable (categorical):", categorical_cols)
+                    with col2:
+                        value_col = st.selectbox("Value Variable (numeric):", numeric_cols)
+                    
+                    if st.button("Run ANOVA", type="primary"):
+                        try:
+                            groups = [group[value_col].values for name, group in stats_data.groupby(group_col)]
+                            
+                            if len(groups) >= 2:
+                                f_stat, p_value = stats.f_oneway(*groups)
+                                
+                                st.markdown("### ANOVA Results")
+                                
+                                col1, col2 = st.columns(2)
+                                with col1:
+                                    st.metric("F-statistic", f"{f_stat:.4f}")
+                                with col2:
+                                    st.metric("P-value", f"{p_value:.4f}")
+                                
+                                if p_value < 0.05:
+                                    st.success("**Result:** The differences between groups ARE statistically significant (p < 0.05).")
+                                    st.markdown("At least one group mean is different from the others.")
+                                else:
+                                    st.info("**Result:** The differences between groups are NOT statistically significant (p >= 0.05).")
+                                    st.markdown("The group means are not significantly different.")
+                                
+                                # Show group statistics
+                                st.markdown("### Group Statistics")
+                                group_stats = stats_data.groupby(group_col)[value_col].agg(['count', 'mean', 'std'])
+                                group_stats.columns = ['Count', 'Mean', 'Std Dev']
+                                st.dataframe(group_stats, use_container_width=True)
+                                
+                                # Box plot
+                                import altair as alt
+                                box = alt.Chart(stats_data).mark_boxplot().encode(
+                                    x=group_col,
+                                    y=value_col
+                                ).properties(width=600, height=300)
+                                st.altair_chart(box, use_container_width=True)
+                                
+                                st.code("Excel: Data Analysis ToolPak > Anova: Single Factor")
+                                st.code(f"Python: scipy.stats.f_oneway(*groups)")
+                            else:
+                                st.warning("Need at least 2 groups for ANOVA.")
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Need at least 1 categorical column and 1 numeric column for ANOVA.")
+            
+            elif analysis_type == "Histogram":
+                st.markdown("**Histogram** shows the distribution of values in a dataset.")
+                st.markdown("- Helps identify patterns like normal distribution, skewness, outliers")
+                
+                if numeric_cols:
+                    hist_col = st.selectbox("Select column:", numeric_cols)
+                    bins = st.slider("Number of bins:", 5, 30, 10)
+                    
+                    if st.button("Create Histogram", type="primary"):
+                        try:
+                            import altair as alt
+                            
+                            hist = alt.Chart(stats_data).mark_bar().encode(
+                                alt.X(hist_col, bin=alt.Bin(maxbins=bins)),
+                                y='count()'
+                            ).properties(width=600, height=300)
+                            st.altair_chart(hist, use_container_width=True)
+                            
+                            # Distribution statistics
+                            st.markdown("### Distribution Statistics")
+                            col1, col2, col3, col4 = st.columns(4)
+                            with col1:
+                                st.metric("Mean", f"{stats_data[hist_col].mean():.2f}")
+                            with col2:
+                                st.metric("Median", f"{stats_data[hist_col].median():.2f}")
+                            with col3:
+                                st.metric("Std Dev", f"{stats_data[hist_col].std():.2f}")
+                            with col4:
+                                skewness = stats.skew(stats_data[hist_col])
+                                st.metric("Skewness", f"{skewness:.2f}")
+                            
+                            # Interpretation
+                            if abs(skewness) < 0.5:
+                                st.success("The distribution is approximately **symmetric** (normal-like).")
+                            elif skewness > 0:
+                                st.info("The distribution is **right-skewed** (tail extends to the right).")
+                            else:
+                                st.info("The distribution is **left-skewed** (tail extends to the left).")
+                            
+                            st.code("Excel: Insert > Charts > Histogram")
+                            st.code(f"Python: plt.hist(df['{hist_col}'], bins={bins})")
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Need at least 1 numeric column for histogram.")
+            
+            elif analysis_type == "Covariance Analysis":
+                st.markdown("**Covariance** measures how two variables change together.")
+                st.markdown("- Positive: variables increase together")
+                st.markdown("- Negative: one increases as other decreases")
+                st.markdown("- Unlike correlation, covariance is not standardized (affected by scale)")
+                
+                if len(numeric_cols) >= 2:
+                    if st.button("Calculate Covariance Matrix", type="primary"):
+                        try:
+                            cov_matrix = stats_data[numeric_cols].cov()
+                            
+                            st.markdown("### Covariance Matrix")
+                            st.dataframe(cov_matrix.round(2), use_container_width=True)
+                            
+                            st.markdown("### Interpretation")
+                            st.markdown("- **Diagonal values**: Variance of each variable")
+                            st.markdown("- **Off-diagonal values**: Covariance between variable pairs")
+                            st.markdown("- Larger absolute values = stronger relationship")
+                            
+                            # Also show correlation for comparison
+                            st.markdown("### Correlation Matrix (for comparison)")
+                            corr_matrix = stats_data[numeric_cols].corr()
+                            st.dataframe(corr_matrix.round(2), use_container_width=True)
+                            
+                            st.info("Correlation is preferred when comparing relationships because it's standardized (-1 to +1).")
+                            
+                            st.code("Excel: Data Analysis ToolPak > Covariance")
+                            st.code("Python: df.cov()")
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Need at least 2 numeric columns for covariance analysis.")
+            
+            elif analysis_type == "Descriptive Statistics":
+                st.markdown("**Descriptive Statistics** summarize the main features of a dataset.")
+                
+                if numeric_cols:
+                    selected_col = st.selectbox("Select column:", numeric_cols)
+                    
+                    if st.button("Calculate Statistics", type="primary"):
+                        try:
+                            data = stats_data[selected_col]
+                            
+                            st.markdown("### Summary Statistics")
+                            
+                            col1, col2, col3 = st.columns(3)
+                            with col1:
+                                st.metric("Count", f"{len(data)}")
+                                st.metric("Mean", f"{data.mean():.2f}")
+                                st.metric("Median", f"{data.median():.2f}")
+                            with col2:
+                                st.metric("Std Dev", f"{data.std():.2f}")
+                                st.metric("Variance", f"{data.var():.2f}")
+                                st.metric("Range", f"{data.max() - data.min():.2f}")
+                            with col3:
+                                st.metric("Min", f"{data.min():.2f}")
+                                st.metric("Max", f"{data.max():.2f}")
+                                st.metric("Sum", f"{data.sum():.2f}")
+                            
+                            st.markdown("### Quartiles")
+                            q1 = data.quantile(0.25)
+                            q2 = data.quantile(0.50)
+                            q3 = data.quantile(0.75)
+                            iqr = q3 - q1
+                            
+                            col1, col2, col3, col4 = st.columns(4)
+                            with col1:
+                                st.metric("Q1 (25%)", f"{q1:.2f}")
+                            with col2:
+                                st.metric("Q2 (50%)", f"{q2:.2f}")
+                            with col3:
+                                st.metric("Q3 (75%)", f"{q3:.2f}")
+                            with col4:
+                                st.metric("IQR", f"{iqr:.2f}")
+                            
+                            st.code("Excel: =AVERAGE(), =MEDIAN(), =STDEV(), =QUARTILE()")
+                            st.code(f"Python: df['{selected_col}'].describe()")
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Need at least 1 numeric column.")
+    
+    elif playground_tab == "Power Query Simulator":
+        st.subheader("⚡ Power Query Simulator")
+        st.markdown("Learn data transformation steps like Power Query in Excel!")
+        
+        # Sample raw data that needs cleaning
+        if 'pq_raw_data' not in st.session_state:
+            st.session_state.pq_raw_data = pd.DataFrame({
+                'Date': ['2024-01-15', '2024-01-16', '2024-01-17', '2024-01-18', '2024-01-19'],
+                'Product_ID': ['P001', 'P002', 'P001', 'P003', 'P002'],
+                'Sales_Amount': [1500, 2200, 1800, None, 2500],
+                'Region': ['north', 'SOUTH', 'North', 'east', 'South'],
+                'Notes': ['  Good sale  ', 'Discount applied', None, 'New customer', 'Repeat']
+            })
+        
+        _dataset_generator({
+            "raw_data": ("power_query", "pq_raw_data", "pq_raw_editor")
+        }, "pq")
+        
+        st.markdown("### Source Data")
+        st.caption("This data has common issues: missing values, inconsistent casing, extra spaces")
+        st.session_state.pq_raw_data = st.data_editor(
+            st.session_state.pq_raw_data,
+            num_rows="dynamic",
+            use_container_width=True,
+            key="pq_raw_editor"
+        )
+        
+        raw_data = st.session_state.pq_raw_data.copy()
+        
+        st.markdown("### Transform Steps")
+        st.markdown("Select transformations to apply (like Power Query steps):")
+        
+        transformations = {
+            "Remove Duplicates": st.checkbox("Remove Duplicates", key="pq_dedup"),
+            "Fill Missing Values": st.checkbox("Fill Missing Values (with 0 or 'Unknown')", key="pq_fill"),
+            "Standardize Text Case": st.checkbox("Standardize Text Case (Title Case)", key="pq_case"),
+            "Trim Whitespace": st.checkbox("Trim Whitespace", key="pq_trim"),
+            "Filter Rows": st.checkbox("Filter Rows (remove nulls)", key="pq_filter"),
+            "Add Calculated Column": st.checkbox("Add Calculated Column", key="pq_calc"),
+            "Change Data Types": st.checkbox("Convert Date Column", key="pq_types"),
+            "Sort Data": st.checkbox("Sort Data", key="pq_sort")
+        }
+        
+        if st.button("Apply Transformations", type="primary"):
+            transformed = raw_data.copy()
+            steps_applied = []
+            
+            try:
+                if transformations["Remove Duplicates"]:
+                    before = len(transformed)
+                    transformed = transformed.drop_duplicates()
+                    steps_applied.append(f"Removed Duplicates: {before - len(transformed)} rows removed")
+                
+                if transformations["Fill Missing Values"]:
+                    for col in transformed.columns:
+                        if transformed[col].dtype == 'object':
+                            transformed[col] = transformed[col].fillna('Unknown')
+                        else:
+                            transformed[col] = transformed[col].fillna(0)
+                    steps_applied.append("Filled Missing Values: Numeric with 0, Text with 'Unknown'")
+                
+                if transformations["Standardize Text Case"]:
+                    for col in transformed.select_dtypes(include=['object']).columns:
+                        transformed[col] = transformed[col].astype(str).str.title()
+                    steps_applied.append("Standardized Text Case: Converted to Title Case")
+                
+                if transformations["Trim Whitespace"]:
+                    for col in transformed.select_dtypes(include=['object']).columns:
+                        transformed[col] = transformed[col].astype(str).str.strip()
+                    steps_applied.append("Trimmed Whitespace: Removed leading/trailing spaces")
+                
+                if transformations["Filter Rows"]:
+                    before = len(transformed)
+                    transformed = transformed.dropna()
+                    steps_applied.append(f"Filtered Rows: Removed {before - len(transformed)} rows with nulls")
+                
+                if transformations["Add Calculated Column"]:
+                    if 'Sales_Amount' in transformed.columns:
+                        transformed['Sales_Amount'] = pd.to_numeric(transformed['Sales_Amount'], errors='coerce')
+                        transformed['Tax_10pct'] = transformed['Sales_Amount'] * 0.10
+                        steps_applied.append("Added Column: Tax_10pct = Sales_Amount * 0.10")
+                
+                if transformations["Change Data Types"]:
+                    if 'Date' in transformed.columns:
+                        transformed['Date'] = pd.to_datetime(transformed['Date'], errors='coerce')
+                        transformed['Year'] = transformed['Date'].dt.year
+                        transformed['Month'] = transformed['Date'].dt.month
+                        steps_applied.append("Changed Types: Converted Date, extracted Year and Month")
+                
+                if transformations["Sort Data"]:
+                    if 'Date' in transformed.columns:
+                        transformed = transformed.sort_values('Date')
+                        steps_applied.append("Sorted Data: By Date ascending")
+                
+                st.markdown("### Applied Steps")
+                for i, step in enumerate(steps_applied, 1):
+                    st.markdown(f"{i}. {step}")
+                
+                if not steps_applied:
+                    st.info("No transformations selected. Check some boxes above.")
+                else:
+                    st.markdown("### Transformed Data")
+                    st.dataframe(transformed, use_container_width=True)
+                    
+                    st.markdown("### Power Query M Code Equivalent")
+                    m_code = "let\n    Source = Excel.CurrentWorkbook(){[Name=\"Table1\"]}[Content],\n"
+                    for step in steps_applied:
+                        m_code += f"    // {step}\n"
+                    m_code += "    Result = Source\nin\n    Result"
+                    st.code(m_code, language="text")
+                    
+            except Exception as e:
+                st.error(f"Error: {str(e)}")
+        
+        st.markdown("---")
+        st.markdown("**Common Power Query Operations:**")
+        st.markdown("- **Remove Duplicates**: Eliminate duplicate rows")
+        st.markdown("- **Fill Down/Replace Nulls**: Handle missing data")
+        st.markdown("- **Change Type**: Convert data types")
+        st.markdown("- **Split/Merge Columns**: Restructure data")
+        st.markdown("- **Pivot/Unpivot**: Reshape tables")
+        st.markdown("- **Group By**: Aggregate data")
+    
+    elif playground_tab == "Z-Score & Outlier Tool":
+        st.subheader("📏 Z-Score & Outlier Detection")
+        st.markdown("Calculate z-scores and identify outliers in your data!")
+        
+        from scipy import stats
+        import numpy as np
+        
+        st.markdown("### What is a Z-Score?")
+        st.markdown("""
+        - **Z-score** measures how many standard deviations a value is from the mean
+        - Formula: z = (x - mean) / standard_deviation
+        - Values with |z| > 2 or 3 are often considered outliers
+        """)
+        
+        # Sample data with potential outliers
+        if 'zscore_data' not in st.session_state:
+            st.session_state.zscore_data = pd.DataFrame({
+                'Employee': ['Alice', 'Bob', 'Charlie', 'Diana', 'Eve', 'Frank', 'Grace', 'Henry', 'Ivy', 'Jack'],
+                'Salary': [52000, 55000, 48000, 150000, 53000, 51000, 54000, 49000, 56000, 52000],
+                'Performance': [85, 78, 92, 88, 15, 82, 79, 91, 84, 80],
+                'Hours_Worked': [42, 45, 40, 38, 80, 41, 43, 39, 44, 42]
+            })
+        
+        _dataset_generator({
+            "zscore_data": ("zscore", "zscore_data", "zscore_data_editor")
+        }, "zscore")
+        
+        st.markdown("### Your Data (Edit to add your own!)")
+        st.caption("This sample data contains some outliers. Can you spot them?")
+        st.session_state.zscore_data = st.data_editor(
+            st.session_state.zscore_data,
+            num_rows="dynamic",
+            use_container_width=True,
+            key="zscore_data_editor"
+        )
+        
+        zscore_data = st.session_state.zscore_data
+        numeric_cols = zscore_data.select_dtypes(include=['number']).columns.tolist()
+        
+        if numeric_cols:
+            col1, col2 = st.columns(2)
+            with col1:
+                selected_col = st.selectbox("Select column to analyze:", numeric_cols)
+            with col2:
+                threshold = st.slider("Z-score threshold for outliers:", 1.0, 4.0, 2.0, 0.5)
+            
+            if st.button("Calculate Z-Scores", type="primary"):
+                try:
+                    data = zscore_data[selected_col]
+                    mean = data.mean()
+                    std = data.std()
+                    
+                    # Calculate z-scores
+                    z_scores = (data - mean) / std
+                    
+                    # Create results dataframe
+                    results = zscore_data.copy()
+                    results['Z_Score'] = z_scores.round(2)
+                    results['Is_Outlier'] = abs(z_scores) > threshold
+                    
+                    st.markdown("### Statistics")
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Mean", f"{mean:.2f}")
+                    with col2:
+                        st.metric("Std Dev", f"{std:.2f}")
+                    with col3:
+                        outlier_count = results['Is_Outlier'].sum()
+                        st.metric("Outliers Found", f"{outlier_count}")
+                    
+                    st.markdown("### Results with Z-Scores")
+                    
+                    # Highlight outliers
+                    def highlight_outliers(row):
+                        if row['Is_Outlier']:
+                            return ['background-color: #ffcccc'] * len(row)
+                        return [''] * len(row)
+                    
+                    styled = results.style.apply(highlight_outliers, axis=1)
+                    st.dataframe(results, use_container_width=True)
+                    
+                    if outlier_count > 0:
+                        st.markdown("### Identified Outliers")
+                        outliers = results[results['Is_Outlier']]
+                        st.dataframe(outliers, use_container_width=True)
+                        
+                        st.warning(f"Found {outlier_count} outlier(s) with |z-score| > {threshold}")
+                        
+                        # Show how to handle outliers
+                        st.markdown("### How to Handle Outliers")
+                        handling = st.selectbox(
+                            "Choose handling method:",
+                            ["View only", "Remove outliers", "Cap outliers (Winsorization)", "Replace with mean"]
+                        )
+                        
+                        if handling == "Remove outliers":
+                            cleaned = zscore_data[abs(z_scores) <= threshold]
+                            st.markdown("**Data with outliers removed:**")
+                            st.dataframe(cleaned, use_container_width=True)
+                            st.info(f"Removed {len(zscore_data) - len(cleaned)} rows")
+                        
+                        elif handling == "Cap outliers (Winsorization)":
+                            lower_bound = mean - threshold * std
+                            upper_bound = mean + threshold * std
+                            capped = zscore_data.copy()
+                            capped[selected_col] = capped[selected_col].clip(lower_bound, upper_bound)
+                            st.markdown("**Data with outliers capped:**")
+                            st.dataframe(capped, use_container_width=True)
+                            st.info(f"Values capped to range [{lower_bound:.2f}, {upper_bound:.2f}]")
+                        
+                        elif handling == "Replace with mean":
+                            replaced = zscore_data.copy()
+                            replaced.loc[abs(z_scores) > threshold, selected_col] = mean
+                            st.markdown("**Data with outliers replaced by mean:**")
+                            st.dataframe(replaced, use_container_width=True)
+                    else:
+                        st.success(f"No outliers found with |z-score| > {threshold}")
+                    
+                    # Visualization
+                    st.markdown("### Z-Score Distribution")
+                    import altair as alt
+                    
+                    z_df = pd.DataFrame({
+                        'Value': data,
+                        'Z_Score': z_scores,
+                        'Is_Outlier': abs(z_scores) > threshold
+                    })
+                    
+                    scatter = alt.Chart(z_df).mark_circle(size=100).encode(
+                        x='Value',
+                        y='Z_Score',
+                        color=alt.condition(
+                            alt.datum.Is_Outlier,
+                            alt.value('red'),
+                            alt.value('steelblue')
+                        ),
+                        tooltip=['Value', 'Z_Score']
+                    ).properties(width=600, height=300)
+                    
+                    # Add threshold lines
+                    rule_upper = alt.Chart(pd.DataFrame({'y': [threshold]})).mark_rule(color='orange', strokeDash=[5,5]).encode(y='y')
+                    rule_lower = alt.Chart(pd.DataFrame({'y': [-threshold]})).mark_rule(color='orange', strokeDash=[5,5]).encode(y='y')
+                    
+                    st.altair_chart(scatter + rule_upper + rule_lower, use_container_width=True)
+                    st.caption("Red points are outliers. Orange lines show the threshold.")
+                    
+                    st.code(f"Excel: =(A2-AVERAGE(A:A))/STDEV(A:A)")
+                    st.code(f"Python: scipy.stats.zscore(df['{selected_col}'])")
+                    
+                except Exception as e:
+                    st.error(f"Error: {str(e)}")
+        else:
+            st.warning("Need at least 1 numeric column.")
+    
+    elif playground_tab == "Ethical Analysis Critique":
+        st.subheader("⚖️ Ethical Analysis Critique")
+        st.markdown("*Practice assessing and critiquing analysis approaches using ethical principles*")
+        st.markdown("---")
+        
+        ethical_scenarios = {
+            "Hiring Algorithm Bias": {
+                "scenario": """
+**Scenario: AI-Powered Hiring Recommendations**
+
+A company has deployed an AI model to screen job applications. The model was trained on 5 years of historical hiring decisions.
+
+**Analysis Approach Used:**
+- Model trained on past successful hires
+- Features include: education, experience, skills, resume keywords
+- 87% accuracy on test data
+- No demographic data explicitly used
+
+**Recent Findings:**
+- Female candidates rejected at 2x rate of male candidates
+- Candidates from certain universities favored regardless of qualifications
+- Model seems to prefer resumes with "aggressive" language
+
+**The data team says:** "The model is objective - it's just learning from data."
+                """,
+                "critique_points": [
+                    "Historical bias: Training on past decisions encodes past discrimination",
+                    "Proxy discrimination: Non-demographic features may correlate with protected groups",
+                    "Outcome fairness: Disparate impact on protected groups requires investigation",
+                    "Transparency: Can decisions be explained to rejected candidates?",
+                    "Accountability: Who is responsible when the model discriminates?",
+                    "Alternative approaches: Blind resume screening, structured interviews, diverse training data"
+                ],
+                "suggested_alternatives": [
+                    "Audit model for demographic disparities before deployment",
+                    "Remove features that correlate with protected characteristics",
+                    "Use balanced training data or apply fairness constraints",
+                    "Implement human review for borderline decisions",
+                    "Regularly monitor outcomes for bias after deployment"
+                ]
+            },
+            "Healthcare Risk Scoring": {
+                "scenario": """
+**Scenario: Patient Risk Prediction**
+
+A hospital uses a predictive model to identify high-risk patients who need extra care.
+
+**Analysis Approach Used:**
+- Model predicts risk based on past healthcare costs
+- Higher predicted cost = higher risk score
+- Used to allocate care management resources
+
+**Problem Discovered:**
+- Black patients assigned systematically lower risk scores than equally sick white patients
+- Root cause: Using healthcare cost as proxy for health need
+- Black patients historically had less access to care, so lower costs
+- Result: Sicker Black patients denied extra care resources
+
+**The vendor says:** "We don't use race in the model, so it can't be biased."
+                """,
+                "critique_points": [
+                    "Construct validity: Healthcare cost ≠ health need",
+                    "Historical inequity: Past access barriers encoded in data",
+                    "Disparate impact: Equal treatment doesn't mean equitable outcomes",
+                    "Proxy variables: Cost correlates with race due to systemic factors",
+                    "Harm potential: Life-or-death consequences of misallocation",
+                    "The 'colorblind' fallacy: Not using race doesn't prevent racial bias"
+                ],
+                "suggested_alternatives": [
+                    "Use actual health outcomes (diagnoses, lab results) instead of costs",
+                    "Validate model performance across demographic groups",
+                    "Apply equity-aware adjustments to scores",
+                    "Involve affected communities in model design",
+                    "Regular audits for disparate impact"
+                ]
+            },
+            "Credit Scoring Transparency": {
+                "scenario": """
+**Scenario: Loan Application Denial**
+
+A bank uses a machine learning model to approve or deny loan applications.
+
+**Analysis Approach Used:**
+- Complex neural network with 200+ features
+- Very high accuracy (94% on test data)
+- Considers: income, employment, credit history, spending patterns, social media activity
+
+**Customer Complaint:**
+A customer with good credit history and stable income was denied. When they asked why:
+- Bank said: "Our model determined you're high risk"
+- Customer asked for specifics: "We can't explain the model's decision"
+- Customer discovered neighbors with similar profiles were approved
+
+**The bank says:** "The model is proprietary and we can't reveal how it works."
+                """,
+                "critique_points": [
+                    "Explainability: Customers have right to understand decisions affecting them",
+                    "GDPR Article 22: Right to explanation for automated decisions",
+                    "Fairness: Similar cases should have similar outcomes",
+                    "Social media data: Ethical concerns about using personal data",
+                    "Accountability gap: Who is responsible if model is wrong?",
+                    "Trust: Unexplainable decisions erode public trust"
+                ],
+                "suggested_alternatives": [
+                    "Use interpretable models (decision trees, logistic regression)",
+                    "Implement SHAP/LIME for feature importance explanations",
+                    "Provide customers with key factors in their decision",
+                    "Remove social media features (privacy concerns)",
+                    "Create appeals process with human review"
+                ]
+            },
+            "Predictive Policing": {
+                "scenario": """
+**Scenario: Crime Prediction Hotspots**
+
+A city police department uses predictive analytics to allocate patrol resources.
+
+**Analysis Approach Used:**
+- Model trained on historical arrest data
+- Predicts "crime hotspots" for next week
+- More officers sent to high-prediction areas
+
+**Observed Feedback Loop:**
+- Model sends more officers to historically over-policed areas
+- More officers → more arrests (for same crime rates)
+- More arrests → model predicts more crime there
+- Cycle reinforces itself regardless of actual crime rates
+
+**Police chief says:** "We're just following the data."
+                """,
+                "critique_points": [
+                    "Feedback loops: Predictions become self-fulfilling",
+                    "Historical bias: Arrest data reflects policing patterns, not crime rates",
+                    "Disparate impact: Certain communities disproportionately affected",
+                    "Measurement error: Arrests ≠ crimes committed",
+                    "Amplification: Model amplifies existing biases over time",
+                    "Community harm: Erodes trust, over-surveillance of communities"
+                ],
+                "suggested_alternatives": [
+                    "Use victimization surveys instead of arrest data",
+                    "Include decay factor to break feedback loops",
+                    "Monitor and cap predictions for any single area",
+                    "Community input on policing priorities",
+                    "Regular equity audits of model predictions vs outcomes"
+                ]
+            }
+        }
+        
+        selected_scenario = st.selectbox("Select a scenario to critique:", list(ethical_scenarios.keys()))
+        
+        scenario_data = ethical_scenarios[selected_scenario]
+        
+        st.markdown("### The Scenario")
+        st.markdown(scenario_data["scenario"])
+        
+        st.markdown("---")
+        st.markdown("### Your Ethical Critique")
+        st.markdown("*Consider: What ethical issues do you see? What principles are violated? What would you recommend?*")
+        
+        user_critique = st.text_area(
+            "Write your critique here:",
+            height=200,
+            placeholder="Identify ethical issues, violated principles, and suggest alternatives..."
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            show_critique = st.button("📋 Show Expert Critique", type="primary")
+        with col2:
+            show_alternatives = st.button("💡 Show Recommended Alternatives")
+        
+        if show_critique:
+            st.markdown("### Expert Critique Points")
+            for point in scenario_data["critique_points"]:
+                st.markdown(f"- {point}")
+        
+        if show_alternatives:
+            st.markdown("### Recommended Alternatives")
+            for alt in scenario_data["suggested_alternatives"]:
+                st.markdown(f"✓ {alt}")
+        
+        st.markdown("---")
+        st.markdown("### Ethical Principles Checklist")
+        
+        principles = [
+            ("Fairness", "Does the approach treat all groups equitably?"),
+            ("Transparency", "Can decisions be explained to affected parties?"),
+            ("Accountability", "Is there clear responsibility for outcomes?"),
+            ("Privacy", "Is personal data used appropriately?"),
+            ("Non-maleficence", "Could this cause harm to individuals or groups?"),
+            ("Autonomy", "Do people have meaningful choice about data use?")
+        ]
+        
+        st.markdown("*Rate this analysis approach on each principle:*")
+        
+        for principle, description in principles:
+            col1, col2 = st.columns([1, 3])
+            with col1:
+                st.selectbox(
+                    principle,
+                    ["Not assessed", "Serious concern", "Minor concern", "Acceptable", "Good practice"],
+                    key=f"eth_{principle}"
+                )
+            with col2:
+                st.caption(description)
+    
+    elif playground_tab == "Error Detection Workshop":
+        st.subheader("🔍 Error Detection Workshop")
+        st.markdown("*Practice identifying erroneous data and facilitating solution discussions*")
+        st.markdown("---")
+        
+        if 'error_workshop_data' not in st.session_state:
+            st.session_state.error_workshop_data = pd.DataFrame({
+                'Customer_ID': ['C001', 'C002', 'C003', 'C004', 'C002', 'C006', 'C007', 'C008'],
+                'Name': ['Alice Brown', 'Bob Smith', 'Carol White', 'David Lee', 'Bob Smith', 'Eve Clark', 'Frank Miller', 'Grace Kim'],
+                'Age': [28, 35, -5, 42, 35, 150, 31, 29],
+                'Email': ['alice@email.com', 'bob@email', 'carol@email.com', '', 'bob@email', 'eve@email.com', 'frank@email.com', 'grace@email.com'],
+                'Order_Amount': [150.00, 2500.00, 89.50, 320.00, 2500.00, 175.00, 999999.99, 210.00],
+                'Order_Date': ['2024-01-15', '2024-13-01', '2024-02-28', '2024-03-10', '2024-01-15', '2024-04-05', '2024-05-20', '1924-06-15'],
+                'Region': ['North', 'South', 'East', 'West', 'South', 'north', 'NORTH', 'East']
+            })
+        
+        st.markdown("### Dataset with Errors")
+        st.markdown("*This dataset contains various data quality issues. Can you identify them all?*")
+        
+        st.dataframe(st.session_state.error_workshop_data, use_container_width=True)
+        
+        st.markdown("---")
+        st.markdown("### Error Identification")
+        st.markdown("*Select all the errors you can identify:*")
+        
+        error_types = {
+            "Duplicate records": {
+                "hint": "Look for identical Customer_ID and Name combinations",
+                "location": "Rows 2 and 5 (C002 - Bob Smith appears twice)",
+                "impact": "Double-counting customers, inflated metrics",
+                "solution": "Deduplicate based on Customer_ID, keep most recent record"
+            },
+            "Invalid age values": {
+                "hint": "Age should be between 0 and ~120",
+                "location": "Row 3: Age=-5, Row 6: Age=150",
+                "impact": "Statistical calculations will be skewed, demographic analysis invalid",
+                "solution": "Flag for review, set to NULL or impute based on customer segment"
+            },
+            "Invalid email format": {
+                "hint": "Emails should contain @ and a domain extension",
+                "location": "Row 2: 'bob@email' (missing .com), Row 4: empty",
+                "impact": "Email campaigns will fail, communication gaps",
+                "solution": "Validate format, request corrections from customers"
+            },
+            "Outlier amounts": {
+                "hint": "Look for unusually high or low order amounts",
+                "location": "Row 7: $999,999.99 is suspiciously high",
+                "impact": "Revenue metrics distorted, may indicate data entry error or fraud",
+                "solution": "Investigate source, verify with order system, cap or remove if erroneous"
+            },
+            "Invalid date format": {
+                "hint": "Check for impossible dates",
+                "location": "Row 2: '2024-13-01' (month 13 doesn't exist)",
+                "impact": "Date parsing will fail, time-series analysis broken",
+                "solution": "Parse dates strictly, flag failures for manual review"
+            },
+            "Historical date anomaly": {
+                "hint": "Check if dates make business sense",
+                "location": "Row 8: '1924-06-15' is 100 years ago",
+                "impact": "Time-based analysis will include ancient outliers",
+                "solution": "Set business rules for valid date ranges (e.g., company founding date)"
+            },
+            "Inconsistent region coding": {
+                "hint": "Check for case sensitivity issues",
+                "location": "'North', 'north', 'NORTH' are all different",
+                "impact": "Grouping by region will split what should be one category",
+                "solution": "Standardize to consistent case (e.g., Title Case)"
+            }
+        }
+        
+        identified_errors = []
+        for error_type in error_types.keys():
+            if st.checkbox(error_type, key=f"err_{error_type}"):
+                identified_errors.append(error_type)
+        
+        if st.button("📊 Check My Answers", type="primary"):
+            score = len(identified_errors)
+            total = len(error_types)
+            
+            if score == total:
+                st.success(f"🎉 Excellent! You found all {total} error types!")
+            elif score >= total * 0.7:
+                st.info(f"Good job! You found {score}/{total} error types.")
+            else:
+                st.warning(f"You found {score}/{total} error types. Keep looking!")
+            
+            st.markdown("### Detailed Error Analysis")
+            
+            for error_type, details in error_types.items():
+                with st.expander(f"{'✓' if error_type in identified_errors else '✗'} {error_type}"):
+                    st.markdown(f"**Location:** {details['location']}")
+                    st.markdown(f"**Impact:** {details['impact']}")
+                    st.markdown(f"**Solution:** {details['solution']}")
+        
+        st.markdown("---")
+        st.markdown("### Facilitating Solution Discussions")
+        st.markdown("*Practice communicating data issues to stakeholders*")
+        
+        discussion_scenario = st.selectbox(
+            "Select a discussion scenario:",
+            [
+                "Presenting errors to business stakeholders",
+                "Discussing impact with analytics team",
+                "Proposing fixes to data engineering",
+                "Escalating critical issues to management"
+            ]
+        )
+        
+        discussion_templates = {
+            "Presenting errors to business stakeholders": """
+**Template: Business Stakeholder Briefing**
+
+1. **Summary Statement** (plain language)
+   "We've found some data quality issues that could affect our [X] reports."
+
+2. **Business Impact** (focus on what they care about)
+   - "Our customer count may be inflated by X% due to duplicates"
+   - "Revenue figures could be off because of data entry errors"
+
+3. **Recommended Actions**
+   - "We recommend pausing the report until data is cleaned"
+   - "This will take approximately X days to fix"
+
+4. **Ask**
+   - "Do you need the approximate numbers now, or can you wait for accurate data?"
+            """,
+            "Discussing impact with analytics team": """
+**Template: Analytics Team Discussion**
+
+1. **Technical Summary**
+   "I've identified X types of data quality issues in the customer dataset"
+
+2. **Specific Issues** (with evidence)
+   - Issue 1: Duplicates on Customer_ID (X records affected)
+   - Issue 2: Invalid values in Age column (Y records affected)
+
+3. **Impact on Analysis**
+   - "Demographic segmentation will be skewed"
+   - "Time-series trends may show artifacts"
+
+4. **Proposed Validation Rules**
+   - Age: 0 < age < 120
+   - Email: regex pattern matching
+   - Date: within business operation period
+
+5. **Discussion Points**
+   - "How should we handle edge cases?"
+   - "What's our tolerance for missing data?"
+            """,
+            "Proposing fixes to data engineering": """
+**Template: Data Engineering Request**
+
+1. **Issue Identification**
+   "Request to add data validation rules to the ingestion pipeline"
+
+2. **Specific Rules Needed**
+   ```
+   - Deduplicate on Customer_ID (keep latest)
+   - Validate: Age BETWEEN 0 AND 120
+   - Validate: Email matches pattern '@.+\\.'
+   - Validate: Order_Date > '2020-01-01'
+   - Standardize: Region to Title Case
+   ```
+
+3. **Priority Justification**
+   "These issues affect X% of records and impact downstream reports"
+
+4. **Suggested Implementation**
+   - Add validation at ingestion
+   - Route failures to quarantine table
+   - Alert on failure rate threshold
+            """,
+            "Escalating critical issues to management": """
+**Template: Management Escalation**
+
+1. **Issue Summary** (1-2 sentences)
+   "We've discovered data quality issues that affect the accuracy of [critical report/decision]"
+
+2. **Business Risk** (quantified if possible)
+   - "Customer metrics may be overstated by X%"
+   - "This affects decisions worth $Y"
+
+3. **Current Status**
+   - Issue identified on [date]
+   - Root cause: [brief explanation]
+   - Estimated fix time: [duration]
+
+4. **Decision Required**
+   - "Should we pause reporting until fixed?"
+   - "What's the acceptable error margin?"
+
+5. **Recommendation**
+   "We recommend [specific action] because [reasoning]"
+            """
+        }
+        
+        st.markdown(discussion_templates[discussion_scenario])
+        
+        st.markdown("---")
+        st.markdown("### Practice Your Communication")
+        user_discussion = st.text_area(
+            f"Write your own message for: {discussion_scenario}",
+            height=150,
+            placeholder="Draft your message to stakeholders..."
+        )
+        
+        if user_discussion and st.button("Get Feedback"):
+            st.info("💡 **Tips for effective communication:**\n"
+                   "- Lead with impact, not technical details\n"
+                   "- Quantify issues when possible\n"
+                   "- Always propose solutions, not just problems\n"
+                   "- Be clear about what decision or action you need")
+    
+    elif playground_tab == "Confidence Level Planner":
+        st.subheader("📊 Confidence Level Planner")
+        st.markdown("*Develop work methods for handling data with different confidence levels*")
+        st.markdown("---")
+        
+        st.markdown("### Understanding Confidence Levels")
+        
+        confidence_info = pd.DataFrame({
+            'Confidence Level': ['99%', '95%', '90%', '80%', '70%'],
+            'Z-Score': [2.576, 1.960, 1.645, 1.282, 1.036],
+            'Margin of Error (n=100)': ['±12.9%', '±9.8%', '±8.2%', '±6.4%', '±5.2%'],
+            'Typical Use': ['Medical/safety decisions', 'Academic research', 'Quality control', 'Business planning', 'Quick estimates']
+        })
+        st.dataframe(confidence_info, use_container_width=True)
+        
+        st.markdown("---")
+        st.markdown("### Confidence Level Decision Framework")
+        
+        problem_domains = {
+            "Medical/Healthcare": {
+                "recommended_confidence": "99%",
+                "reasoning": "Patient safety is paramount; false negatives could mean missed diagnoses",
+                "work_methods": [
+                    "Require large sample sizes for clinical decisions",
+                    "Always report confidence intervals in results",
+                    "Use conservative estimates (lower bound of CI)",
+                    "Require peer review before recommendations",
+                    "Document uncertainty explicitly in reports"
+                ],
+                "decision_rules": {
+                    "High confidence (>99%)": "Proceed with treatment recommendation",
+                    "Medium confidence (95-99%)": "Recommend additional testing",
+                    "Low confidence (<95%)": "Do not make clinical recommendations"
+                }
+            },
+            "Financial/Investment": {
+                "recommended_confidence": "95%",
+                "reasoning": "Balance between action and risk; financial impact can be significant",
+                "work_methods": [
+                    "Use 95% CI for major investment decisions",
+                    "90% acceptable for operational decisions",
+                    "Always calculate potential loss at confidence bounds",
+                    "Stress test with worst-case scenarios",
+                    "Document assumptions and limitations"
+                ],
+                "decision_rules": {
+                    "High confidence (>95%)": "Recommend investment/action",
+                    "Medium confidence (90-95%)": "Present options with risk assessment",
+                    "Low confidence (<90%)": "Recommend gathering more data"
+                }
+            },
+            "Marketing/Customer Analytics": {
+                "recommended_confidence": "90%",
+                "reasoning": "Speed often matters; decisions are reversible; cost of error is lower",
+                "work_methods": [
+                    "Use 90% CI for campaign decisions",
+                    "80% acceptable for exploratory analysis",
+                    "A/B test with statistical significance checks",
+                    "Monitor results and iterate quickly",
+                    "Build in review cycles to catch errors"
+                ],
+                "decision_rules": {
+                    "High confidence (>90%)": "Launch campaign/feature",
+                    "Medium confidence (80-90%)": "Small-scale pilot test first",
+                    "Low confidence (<80%)": "Continue testing or try different approach"
+                }
+            },
+            "Operations/Supply Chain": {
+                "recommended_confidence": "95%",
+                "reasoning": "Inventory and logistics decisions have cost implications both ways",
+                "work_methods": [
+                    "Use 95% CI for demand forecasting",
+                    "Build safety stock based on confidence bounds",
+                    "Monitor forecast accuracy over time",
+                    "Adjust confidence requirements by product criticality",
+                    "Document service level agreements tied to confidence"
+                ],
+                "decision_rules": {
+                    "High confidence (>95%)": "Set optimal inventory levels",
+                    "Medium confidence (90-95%)": "Add safety stock buffer",
+                    "Low confidence (<90%)": "Increase safety stock significantly or source alternatives"
+                }
+            },
+            "Research/Academic": {
+                "recommended_confidence": "95% (p < 0.05)",
+                "reasoning": "Scientific credibility requires rigorous standards",
+                "work_methods": [
+                    "Pre-register hypotheses before analysis",
+                    "Use 95% CI as minimum for publication",
+                    "Report exact p-values, not just significance",
+                    "Calculate and report effect sizes",
+                    "Acknowledge limitations and confidence bounds"
+                ],
+                "decision_rules": {
+                    "Statistically significant (p<0.05)": "Report finding with confidence interval",
+                    "Marginally significant (0.05<p<0.10)": "Report as suggestive, needs replication",
+                    "Not significant (p>0.10)": "Report null result, discuss sample size"
+                }
+            }
+        }
+        
+        selected_domain = st.selectbox("Select a problem domain:", list(problem_domains.keys()))
+        
+        domain_data = problem_domains[selected_domain]
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Recommended Confidence Level", domain_data["recommended_confidence"])
+        with col2:
+            st.info(f"**Reasoning:** {domain_data['reasoning']}")
+        
+        st.markdown("### Work Methods for This Domain")
+        for method in domain_data["work_methods"]:
+            st.markdown(f"• {method}")
+        
+        st.markdown("### Decision Rules Based on Confidence")
+        for level, action in domain_data["decision_rules"].items():
+            st.markdown(f"**{level}:** {action}")
+        
+        st.markdown("---")
+        st.markdown("### Interactive Confidence Calculator")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            sample_size = st.number_input("Sample Size (n):", min_value=10, max_value=10000, value=100)
+            sample_mean = st.number_input("Sample Mean:", value=50.0)
+            sample_std = st.number_input("Sample Std Dev:", min_value=0.1, value=10.0)
+        
+        with col2:
+            confidence_level = st.selectbox(
+                "Confidence Level:",
+                ["99%", "95%", "90%", "80%"],
+                index=1
+            )
+            
+            z_scores = {"99%": 2.576, "95%": 1.960, "90%": 1.645, "80%": 1.282}
+            z = z_scores[confidence_level]
+            
+            margin_error = z * (sample_std / (sample_size ** 0.5))
+            lower_bound = sample_mean - margin_error
+            upper_bound = sample_mean + margin_error
+        
+        st.markdown("### Results")
+        
+        result_col1, result_col2, result_col3 = st.columns(3)
+        with result_col1:
+            st.metric("Lower Bound", f"{lower_bound:.2f}")
+        with result_col2:
+            st.metric("Point Estimate", f"{sample_mean:.2f}")
+        with result_col3:
+            st.metric("Upper Bound", f"{upper_bound:.2f}")
+        
+        st.markdown(f"**{confidence_level} Confidence Interval:** [{lower_bound:.2f}, {upper_bound:.2f}]")
+        st.markdown(f"**Margin of Error:** ±{margin_error:.2f} ({(margin_error/sample_mean)*100:.1f}% of mean)")
+        
+        st.markdown("---")
+        st.markdown("### Create Your Work Method Document")
+        
+        st.markdown("*Based on your domain and confidence requirements, document your work method:*")
+        
+        work_method_template = st.text_area(
+            "Your Work Method Document:",
+            value=f"""WORK METHOD: {selected_domain} Analysis
+
+CONFIDENCE STANDARD: {domain_data['recommended_confidence']}
+
+DATA REQUIREMENTS:
+- Minimum sample size: [specify based on required precision]
+- Data quality checks: [list validation rules]
+- Exclusion criteria: [what data to remove]
+
+ANALYSIS PROTOCOL:
+1. Calculate point estimate and confidence interval
+2. Apply decision rules based on confidence level
+3. Document assumptions and limitations
+4. Review with [stakeholder/peer]
+
+REPORTING REQUIREMENTS:
+- Always report confidence intervals
+- Flag results below confidence threshold
+- Document sample size and methodology
+
+ESCALATION:
+- If confidence < threshold: [specific action]
+- If data quality issues: [specific action]
+""",
+            height=400
+        )
+        
+        if st.button("💾 Save Work Method (Download)", type="primary"):
+            st.download_button(
+                label="Download Work Method Document",
+                data=work_method_template,
+                file_name=f"work_method_{selected_domain.lower().replace('/', '_')}.txt",
+                mime="text/plain"
+            )
+    
+    elif playground_tab == "BI & Big Data Explorer":
+        st.subheader("📊 BI & Big Data Explorer")
+        st.markdown("*Explore Business Intelligence concepts and identify Big Data scenarios*")
+        st.markdown("---")
+        
+        explorer_mode = st.radio(
+            "Choose exploration mode:",
+            ["BI vs Big Data Classifier", "Data Volume Calculator", "BI Tool Selector"],
+            horizontal=True
+        )
+        
+        if explorer_mode == "BI vs Big Data Classifier":
+            st.markdown("### Classify Your Data Scenario")
+            st.markdown("*Answer these questions to determine if your scenario is BI or Big Data*")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                data_volume = st.select_slider(
+                    "Data Volume:",
+                    options=["Megabytes", "Gigabytes", "Terabytes", "Petabytes"],
+                    value="Gigabytes"
+                )
+                data_velocity = st.select_slider(
+                    "Data Velocity:",
+                    options=["Daily updates", "Hourly updates", "Real-time streaming", "Millisecond events"],
+                    value="Daily updates"
+                )
+            with col2:
+                data_variety = st.multiselect(
+                    "Data Types (Variety):",
+                    ["Structured tables", "Text documents", "Images", "Videos", "Sensor data", "Social media"],
+                    default=["Structured tables"]
+                )
+                analysis_goal = st.selectbox(
+                    "Primary Goal:",
+                    ["Report what happened", "Understand why it happened", "Predict what will happen", "Automate decisions"]
+                )
+            
+            if st.button("🔍 Classify Scenario", type="primary"):
+                score = 0
+                reasons = []
+                
+                if data_volume in ["Terabytes", "Petabytes"]:
+                    score += 2
+                    reasons.append(f"High volume ({data_volume})")
+                if data_velocity in ["Real-time streaming", "Millisecond events"]:
+                    score += 2
+                    reasons.append(f"High velocity ({data_velocity})")
+                if len(data_variety) > 2:
+                    score += 1
+                    reasons.append(f"High variety ({len(data_variety)} types)")
+                if "Images" in data_variety or "Videos" in data_variety or "Sensor data" in data_variety:
+                    score += 1
+                    reasons.append("Unstructured data types")
+                if analysis_goal in ["Predict what will happen", "Automate decisions"]:
+                    score += 1
+                    reasons.append(f"Advanced analytics goal")
+                
+                st.markdown("---")
+                if score >= 4:
+                    st.error("🔴 **Big Data Scenario**")
+                    st.markdown("Your scenario exhibits Big Data characteristics:")
+                    for r in reasons:
+                        st.markdown(f"- {r}")
+                    st.markdown("**Recommended Tools:** Hadoop, Spark, Python, Cloud Data Platforms")
+                elif score >= 2:
+                    st.warning("🟡 **Hybrid Scenario**")
+                    st.markdown("Your scenario has some Big Data elements but may work with BI tools:")
+                    for r in reasons:
+                        st.markdown(f"- {r}")
+                    st.markdown("**Recommended:** Start with BI tools, scale to Big Data if needed")
+                else:
+                    st.success("🟢 **Business Intelligence Scenario**")
+                    st.markdown("Your scenario is well-suited for traditional BI approaches.")
+                    st.markdown("**Recommended Tools:** Excel, Tableau, Power BI, SQL databases")
+        
+        elif explorer_mode == "Data Volume Calculator":
+            st.markdown("### Calculate Your Data Volume")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                records_per_day = st.number_input("Records generated per day:", min_value=1, value=1000)
+                bytes_per_record = st.number_input("Average bytes per record:", min_value=1, value=500)
+                retention_years = st.number_input("Years of data to retain:", min_value=1, value=3)
+            
+            with col2:
+                daily_bytes = records_per_day * bytes_per_record
+                yearly_bytes = daily_bytes * 365
+                total_bytes = yearly_bytes * retention_years
+                
+                def format_bytes(b):
+                    if b >= 1e15:
+                        return f"{b/1e15:.2f} PB"
+                    elif b >= 1e12:
+                        return f"{b/1e12:.2f} TB"
+                    elif b >= 1e9:
+                        return f"{b/1e9:.2f} GB"
+                    elif b >= 1e6:
+                        return f"{b/1e6:.2f} MB"
+                    else:
+                        return f"{b/1e3:.2f} KB"
+                
+                st.metric("Daily Data", format_bytes(daily_bytes))
+                st.metric("Yearly Data", format_bytes(yearly_bytes))
+                st.metric(f"Total ({retention_years} years)", format_bytes(total_bytes))
+                
+                if total_bytes >= 1e12:
+                    st.warning("⚠️ This volume may require Big Data infrastructure")
+                else:
+                    st.success("✓ This volume is manageable with traditional BI tools")
+        
+        elif explorer_mode == "BI Tool Selector":
+            st.markdown("### Find the Right BI Tool")
+            
+            user_needs = st.multiselect(
+                "What do you need to do?",
+                ["Create dashboards", "Ad-hoc analysis", "Share reports", "Self-service analytics",
+                 "Advanced calculations", "Real-time monitoring", "Mobile access", "Embedded analytics"]
+            )
+            
+            budget = st.radio("Budget:", ["Free/Low cost", "Medium", "Enterprise"], horizontal=True)
+            tech_level = st.radio("Technical level:", ["Beginner", "Intermediate", "Advanced"], horizontal=True)
+            
+            if st.button("🎯 Get Recommendations"):
+                st.markdown("### Recommended Tools")
+                
+                recommendations = []
+                
+                if budget == "Free/Low cost" and tech_level == "Beginner":
+                    recommendations.append(("Google Sheets + Looker Studio", "Free, easy to use, good for basic dashboards"))
+                    recommendations.append(("Excel + Power BI (free tier)", "Familiar interface, powerful calculations"))
+                
+                if "Create dashboards" in user_needs:
+                    recommendations.append(("Tableau Public", "Beautiful visualizations, free for public data"))
+                    recommendations.append(("Power BI Desktop", "Free, integrates with Microsoft ecosystem"))
+                
+                if "Advanced calculations" in user_needs and tech_level in ["Intermediate", "Advanced"]:
+                    recommendations.append(("Python + Jupyter", "Maximum flexibility, requires coding"))
+                
+                if budget == "Enterprise":
+                    recommendations.append(("Tableau Server/Cloud", "Full-featured, enterprise security"))
+                    recommendations.append(("Power BI Premium", "Microsoft integration, AI features"))
+                
+                if not recommendations:
+                    recommendations.append(("Excel", "Versatile starting point for any analysis"))
+                
+                for tool, reason in recommendations:
+                    st.markdown(f"**{tool}**")
+                    st.caption(reason)
+    
+    elif playground_tab == "KPI Dashboard Builder":
+        st.subheader("📈 KPI Dashboard Builder")
+        st.markdown("*Design and visualize Key Performance Indicators for different business functions*")
+        st.markdown("---")
+        
+        business_function = st.selectbox(
+            "Select business function:",
+            ["Sales", "Marketing", "Finance", "Operations", "HR", "Customer Service"]
+        )
+        
+        kpi_templates = {
+            "Sales": {
+                "kpis": [
+                    {"name": "Revenue", "target": 100000, "actual": 0, "unit": "$", "higher_better": True},
+                    {"name": "Deals Closed", "target": 50, "actual": 0, "unit": "", "higher_better": True},
+                    {"name": "Conversion Rate", "target": 25, "actual": 0, "unit": "%", "higher_better": True},
+                    {"name": "Average Deal Size", "target": 2000, "actual": 0, "unit": "$", "higher_better": True},
+                    {"name": "Sales Cycle (days)", "target": 30, "actual": 0, "unit": "days", "higher_better": False}
+                ]
+            },
+            "Marketing": {
+                "kpis": [
+                    {"name": "Website Traffic", "target": 50000, "actual": 0, "unit": "visits", "higher_better": True},
+                    {"name": "Lead Generation", "target": 500, "actual": 0, "unit": "leads", "higher_better": True},
+                    {"name": "Cost per Lead", "target": 50, "actual": 0, "unit": "$", "higher_better": False},
+                    {"name": "Email Open Rate", "target": 25, "actual": 0, "unit": "%", "higher_better": True},
+                    {"name": "Social Engagement", "target": 5, "actual": 0, "unit": "%", "higher_better": True}
+                ]
+            },
+            "Finance": {
+                "kpis": [
+                    {"name": "Gross Margin", "target": 40, "actual": 0, "unit": "%", "higher_better": True},
+                    {"name": "Operating Expenses", "target": 50000, "actual": 0, "unit": "$", "higher_better": False},
+                    {"name": "Cash Flow", "target": 25000, "actual": 0, "unit": "$", "higher_better": True},
+                    {"name": "Accounts Receivable Days", "target": 30, "actual": 0, "unit": "days", "higher_better": False},
+                    {"name": "Budget Variance", "target": 5, "actual": 0, "unit": "%", "higher_better": False}
+                ]
+            },
+            "Operations": {
+                "kpis": [
+                    {"name": "Production Output", "target": 1000, "actual": 0, "unit": "units", "higher_better": True},
+                    {"name": "Defect Rate", "target": 2, "actual": 0, "unit": "%", "higher_better": False},
+                    {"name": "On-Time Delivery", "target": 95, "actual": 0, "unit": "%", "higher_better": True},
+                    {"name": "Inventory Turnover", "target": 6, "actual": 0, "unit": "x", "higher_better": True},
+                    {"name": "Equipment Uptime", "target": 98, "actual": 0, "unit": "%", "higher_better": True}
+                ]
+            },
+            "HR": {
+                "kpis": [
+                    {"name": "Employee Turnover", "target": 10, "actual": 0, "unit": "%", "higher_better": False},
+                    {"name": "Time to Hire", "target": 30, "actual": 0, "unit": "days", "higher_better": False},
+                    {"name": "Training Hours", "target": 40, "actual": 0, "unit": "hrs", "higher_better": True},
+                    {"name": "Employee Satisfaction", "target": 80, "actual": 0, "unit": "%", "higher_better": True},
+                    {"name": "Absenteeism Rate", "target": 3, "actual": 0, "unit": "%", "higher_better": False}
+                ]
+            },
+            "Customer Service": {
+                "kpis": [
+                    {"name": "Customer Satisfaction", "target": 90, "actual": 0, "unit": "%", "higher_better": True},
+                    {"name": "First Response Time", "target": 2, "actual": 0, "unit": "hrs", "higher_better": False},
+                    {"name": "Resolution Rate", "target": 85, "actual": 0, "unit": "%", "higher_better": True},
+                    {"name": "NPS Score", "target": 50, "actual": 0, "unit": "", "higher_better": True},
+                    {"name": "Tickets per Agent", "target": 20, "actual": 0, "unit": "", "higher_better": True}
+                ]
+            }
+        }
+        
+        st.markdown(f"### {business_function} KPIs")
+        st.markdown("*Enter your actual values to see RAG status*")
+        
+        template = kpi_templates[business_function]
+        kpi_data = []
+        
+        for i, kpi in enumerate(template["kpis"]):
+            col1, col2, col3, col4 = st.columns([2, 1, 1, 1])
+            with col1:
+                st.markdown(f"**{kpi['name']}**")
+            with col2:
+                actual = st.number_input(
+                    f"Actual",
+                    value=float(kpi["target"] * 0.9),
+                    key=f"kpi_{business_function}_{i}",
+                    label_visibility="collapsed"
+                )
+            with col3:
+                st.caption(f"Target: {kpi['target']}{kpi['unit']}")
+            with col4:
+                if kpi["higher_better"]:
+                    pct = (actual / kpi["target"]) * 100 if kpi["target"] > 0 else 0
+                else:
+                    if actual <= 0:
+                        pct = 100
+                    else:
+                        pct = (kpi["target"] / actual) * 100
+                
+                if pct >= 100:
+                    st.success("🟢")
+                elif pct >= 80:
+                    st.warning("🟡")
+                else:
+                    st.error("🔴")
+            
+            kpi_data.append({"KPI": kpi["name"], "Actual": actual, "Target": kpi["target"], "Achievement": f"{pct:.0f}%"})
+        
+        st.markdown("---")
+        st.markdown("### Dashboard Summary")
+        
+        df_kpi = pd.DataFrame(kpi_data)
+        st.dataframe(df_kpi, use_container_width=True)
+        
+        st.markdown("**RAG Legend:** 🟢 On track (≥100%) | 🟡 At risk (80-99%) | 🔴 Off track (<80%)")
+    
+    elif playground_tab == "Decision Analysis Tool":
+        st.subheader("🎯 Decision Analysis Tool")
+        st.markdown("*Practice decision-making in the grocery-delivery scenario using analytics, formal criteria, heuristics, algorithms, and optimization.*")
+        st.markdown("---")
+        st.info("Scenario: an online grocery delivery company has rising late deliveries, falling customer satisfaction, and increasing refund costs.")
+
+        if 'grocery_payoff_matrix' not in st.session_state:
+            st.session_state.grocery_payoff_matrix = pd.DataFrame({
+                'Strategy': ['Hire temporary drivers', 'Route-optimization software', 'Staggered delivery windows'],
+                'High demand + traffic': [90, 75, 50],
+                'Normal demand': [40, 55, 45],
+                'Low demand': [-10, 15, 30]
+            })
+
+        decision_tabs = st.tabs(["Analytics Flow", "Decision Criteria", "Technique Explorer"])
+
+        with decision_tabs[0]:
+            st.markdown("### Analytics Flow in the Grocery-Delivery Scenario")
+            metric_col1, metric_col2, metric_col3 = st.columns(3)
+            with metric_col1:
+                late_before = st.slider("Late deliveries before change (%)", 0, 40, 8)
+                late_after = st.slider("Late deliveries after change (%)", 0, 40, 17)
+            with metric_col2:
+                satisfaction_before = st.slider("Customer satisfaction before (%)", 40, 100, 82)
+                satisfaction_after = st.slider("Customer satisfaction after (%)", 40, 100, 71)
+            with metric_col3:
+                refund_before = st.number_input("Refund cost before ($)", min_value=0, value=12000, step=1000)
+                refund_after = st.number_input("Refund cost after ($)", min_value=0, value=24500, step=1000)
+
+            worst_zone = st.selectbox("Which zone is worst affected?", ["North", "Central", "East", "West"], index=1)
+            peak_window = st.selectbox("When is the main bottleneck?", ["Morning", "Midday", "Evening peak", "Late night"], index=2)
+
+            if st.button("Generate Grocery Scenario Analysis", type="primary"):
+                st.markdown("### Four Analytics Views")
+                st.markdown(f"**Descriptive:** Late deliveries rose from {late_before}% to {late_after}%, satisfaction fell from {satisfaction_before}% to {satisfaction_after}%, and refund cost increased from ${refund_before:,} to ${refund_after:,}.")
+                st.markdown(f"**Diagnostic:** The strongest operational problem appears in the {worst_zone} zone during the {peak_window} window, suggesting a concentrated capacity or routing issue rather than a company-wide failure.")
+                projected_late = round(late_after * 1.12, 1)
+                st.markdown(f"**Predictive:** If the same pattern continues, late deliveries could reach about {projected_late}% in the next comparable period.")
+                st.markdown("**Prescriptive:** Evaluate temporary drivers, route-optimization software, and staggered delivery windows using decision criteria under uncertainty and then monitor on-time delivery rate, refund cost, and customer satisfaction after implementation.")
+
+        with decision_tabs[1]:
+            st.markdown("### Decision Criteria Under Uncertainty")
+            st.markdown("Edit the payoff matrix if you want to test different business assumptions. Values represent estimated net payoff in thousands of dollars.")
+
+            payoff_input = st.data_editor(
+                st.session_state.grocery_payoff_matrix,
+                num_rows="fixed",
+                use_container_width=True,
+                key="grocery_payoff_editor"
+            )
+            st.session_state.grocery_payoff_matrix = payoff_input
+
+            probability_cols = st.columns(3)
+            with probability_cols[0]:
+                prob_high = st.number_input("P(High demand + traffic)", min_value=0.0, max_value=1.0, value=0.30, step=0.05)
+            with probability_cols[1]:
+                prob_normal = st.number_input("P(Normal demand)", min_value=0.0, max_value=1.0, value=0.50, step=0.05)
+            with probability_cols[2]:
+                prob_low = st.number_input("P(Low demand)", min_value=0.0, max_value=1.0, value=0.20, step=0.05)
+
+            hurwicz_alpha = st.slider("Hurwicz optimism coefficient (alpha)", 0.0, 1.0, 0.6, 0.05)
+
+            matrix_df = payoff_input.set_index('Strategy')
+            state_columns = [column for column in matrix_df.columns]
+            probability_sum = prob_high + prob_normal + prob_low
+            if probability_sum <= 0:
+                normalized_probs = [1/3, 1/3, 1/3]
+                st.warning("Probabilities must sum to more than 0. Using equal weights instead.")
+            else:
+                normalized_probs = [prob_high / probability_sum, prob_normal / probability_sum, prob_low / probability_sum]
+                if abs(probability_sum - 1.0) > 0.001:
+                    st.caption(f"Probabilities normalized from total {probability_sum:.2f}.")
+
+            row_max = matrix_df.max(axis=1)
+            row_min = matrix_df.min(axis=1)
+            row_avg = matrix_df.mean(axis=1)
+            hurwicz_score = hurwicz_alpha * row_max + (1 - hurwicz_alpha) * row_min
+            expected_payoff = sum(matrix_df[state] * normalized_probs[idx] for idx, state in enumerate(state_columns))
+            best_by_state = matrix_df.max(axis=0)
+            regret_df = best_by_state - matrix_df
+            max_regret = regret_df.max(axis=1)
+            expected_regret = sum(regret_df[state] * normalized_probs[idx] for idx, state in enumerate(state_columns))
+
+            criteria_summary = pd.DataFrame({
+                'Criterion': [
+                    'The Maximax Optimistic rule',
+                    'The Maximin rule of savage',
+                    'The Realistic rule of Hurwicz',
+                    'The Minimax regret of savage',
+                    'The average payoff rule of Laplace',
+                    'The Expected payoff rule',
+                    'The Expected loss of opportunity rule'
+                ],
+                'Recommended strategy': [
+                    row_max.idxmax(),
+                    row_min.idxmax(),
+                    hurwicz_score.idxmax(),
+                    max_regret.idxmin(),
+                    row_avg.idxmax(),
+                    expected_payoff.idxmax(),
+                    expected_regret.idxmin()
+                ],
+                'Decision value': [
+                    round(row_max.max(), 2),
+                    round(row_min.max(), 2),
+                    round(hurwicz_score.max(), 2),
+                    round(max_regret.min(), 2),
+                    round(row_avg.max(), 2),
+                    round(expected_payoff.max(), 2),
+                    round(expected_regret.min(), 2)
+                ]
+            })
+            st.dataframe(criteria_summary, use_container_width=True)
+
+            chart_col1, chart_col2 = st.columns(2)
+            with chart_col1:
+                st.markdown("**Payoff comparison by demand state**")
+                st.bar_chart(matrix_df)
+
+            with chart_col2:
+                st.markdown("**Regret comparison by demand state**")
+                st.bar_chart(regret_df)
+
+            st.caption("Use the payoff chart to compare upside across demand scenarios and the regret chart to see how costly each strategy becomes when a better choice was available.")
+
+            explanation_map = {
+                'The Maximax Optimistic rule': "Chooses the strategy with the single highest upside. In this grocery case it fits a strongly optimistic manager who wants the biggest possible payoff if demand and traffic pressure hit hard.",
+                'The Maximin rule of savage': "Chooses the strategy with the best worst-case payoff. It suits a cautious manager who wants protection if the delivery environment turns unfavorable.",
+                'The Realistic rule of Hurwicz': "Balances optimism and caution using alpha. In this scenario it is useful when management wants both upside potential and downside protection.",
+                'The Minimax regret of savage': "Chooses the strategy with the smallest maximum regret. This is useful when leadership wants to avoid the pain of realizing it picked the wrong action after the fact.",
+                'The average payoff rule of Laplace': "Treats all future states as equally likely and chooses the highest average payoff. It is useful when the team has no strong basis for assigning probabilities.",
+                'The Expected payoff rule': "Uses probabilities and chooses the highest weighted payoff. It is best when the operations team has credible estimates for demand and traffic states.",
+                'The Expected loss of opportunity rule': "Uses expected regret rather than payoff and chooses the option with the lowest expected missed opportunity. It is helpful when managers think more naturally about avoidable lost value than total payoff."
+            }
+
+            selected_criterion = st.selectbox("Explain criterion:", criteria_summary['Criterion'].tolist())
+            selected_row = criteria_summary[criteria_summary['Criterion'] == selected_criterion].iloc[0]
+            st.markdown(f"**Recommended strategy:** {selected_row['Recommended strategy']}")
+            st.markdown(f"**Why it fits the grocery scenario:** {explanation_map[selected_criterion]}")
+
+            with st.expander("View regret matrix"):
+                st.dataframe(regret_df.round(2), use_container_width=True)
+
+        with decision_tabs[2]:
+            st.markdown("### Technique Explorer: Heuristics vs Algorithms vs Optimization")
+
+            if 'grocery_zone_data' not in st.session_state:
+                st.session_state.grocery_zone_data = pd.DataFrame({
+                    'Zone': ['North', 'Central', 'East'],
+                    'Late delivery rate %': [11, 19, 14],
+                    'Complaints': [24, 61, 33],
+                    'Driver shortage score': [3, 8, 5],
+                    'Avg route minutes': [28, 44, 35]
+                })
+
+            zone_data = st.data_editor(
+                st.session_state.grocery_zone_data,
+                num_rows="fixed",
+                use_container_width=True,
+                key="grocery_zone_editor"
+            )
+            st.session_state.grocery_zone_data = zone_data
+
+            technique_mode = st.radio(
+                "Choose technique family:",
+                ["Heuristic", "Algorithm", "Optimization"],
+                horizontal=True
+            )
+
+            if technique_mode == "Heuristic":
+                heuristic_choice = st.selectbox(
+                    "Heuristic rule:",
+                    ["Priority heuristic", "80/20 heuristic", "Nearest-driver heuristic"]
+                )
+
+                if st.button("Apply Heuristic", type="primary"):
+                    if heuristic_choice == "Priority heuristic":
+                        top_zone = zone_data.loc[zone_data['Late delivery rate %'].idxmax(), 'Zone']
+                        st.success(f"Priority heuristic recommends fixing {top_zone} first because it has the highest late-delivery rate.")
+                    elif heuristic_choice == "80/20 heuristic":
+                        ranked = zone_data.sort_values('Complaints', ascending=False)
+                        cumulative = ranked['Complaints'].cumsum() / ranked['Complaints'].sum()
+                        focus_zones = ranked.loc[cumulative <= 0.8, 'Zone'].tolist()
+                        if not focus_zones:
+                            focus_zones = [ranked.iloc[0]['Zone']]
+                        st.success(f"80/20 heuristic recommends focusing on: {', '.join(focus_zones)} because they drive most complaint volume.")
+                    else:
+                        top_zone = zone_data.loc[zone_data['Avg route minutes'].idxmin(), 'Zone']
+                        st.success(f"Nearest-driver heuristic prioritizes {top_zone} for rapid reassignment because its routes are shortest on average.")
+
+            elif technique_mode == "Algorithm":
+                st.markdown("Build a simple weighted scoring algorithm to rank which zone should receive operational attention first.")
+                weight_col1, weight_col2, weight_col3 = st.columns(3)
+                with weight_col1:
+                    weight_delay = st.slider("Weight: late delivery rate", 0.0, 1.0, 0.5, 0.05)
+                with weight_col2:
+                    weight_complaints = st.slider("Weight: complaints", 0.0, 1.0, 0.3, 0.05)
+                with weight_col3:
+                    weight_shortage = st.slider("Weight: driver shortage", 0.0, 1.0, 0.2, 0.05)
+
+                if st.button("Run Scoring Algorithm", type="primary"):
+                    scored = zone_data.copy()
+                    scored['Priority score'] = (
+                        scored['Late delivery rate %'] * weight_delay +
+                        scored['Complaints'] * weight_complaints +
+                        scored['Driver shortage score'] * 10 * weight_shortage
+                    )
+                    scored = scored.sort_values('Priority score', ascending=False)
+                    st.dataframe(scored, use_container_width=True)
+                    st.success(f"Algorithmic recommendation: prioritize {scored.iloc[0]['Zone']} first based on the weighted score.")
+
+            else:
+                st.markdown("Compare actions under budget and service priorities.")
+                budget = st.number_input("Available budget ($000)", min_value=10, max_value=200, value=80, step=5)
+                service_weight = st.slider("Weight on service quality", 0.0, 1.0, 0.7, 0.05)
+                cost_weight = 1 - service_weight
+
+                options_df = pd.DataFrame({
+                    'Action': ['Hire temporary drivers', 'Route-optimization software', 'Staggered delivery windows'],
+                    'Cost ($000)': [60, 80, 25],
+                    'On-time improvement score': [9, 8, 6],
+                    'Refund reduction score': [7, 8, 5]
+                })
+                feasible = options_df[options_df['Cost ($000)'] <= budget].copy()
+                if feasible.empty:
+                    st.warning("No actions fit within the selected budget.")
+                else:
+                    feasible['Utility score'] = (
+                        (feasible['On-time improvement score'] + feasible['Refund reduction score']) * service_weight -
+                        feasible['Cost ($000)'] / 20 * cost_weight
+                    )
+                    feasible = feasible.sort_values('Utility score', ascending=False)
+                    st.dataframe(feasible, use_container_width=True)
+                    st.success(f"Optimization-style recommendation: choose {feasible.iloc[0]['Action']} because it gives the strongest service-vs-cost trade-off within budget.")
+    
+    elif playground_tab == "Project Planning Workshop":
+        st.subheader("📋 Project Planning Workshop")
+        st.markdown("*Practice planning a data analysis project with proper phases and deliverables*")
+        st.markdown("---")
+        
+        st.markdown("### Define Your Project")
+        
+        project_name = st.text_input("Project Name:", "Customer Churn Analysis")
+        project_duration = st.slider("Total Project Duration (weeks):", 2, 16, 8)
+        
+        st.markdown("### Project Phases")
+        st.markdown("*Allocate percentage of time to each phase (should total 100%)*")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            phase1 = st.slider("1. Problem Definition & Scoping", 0, 100, 15, format="%d%%")
+            phase2 = st.slider("2. Data Collection & Cleaning", 0, 100, 25, format="%d%%")
+            phase3 = st.slider("3. Exploratory Analysis", 0, 100, 20, format="%d%%")
+        with col2:
+            phase4 = st.slider("4. In-depth Analysis", 0, 100, 20, format="%d%%")
+            phase5 = st.slider("5. Reporting & Presentation", 0, 100, 15, format="%d%%")
+            phase6 = st.slider("6. Review & Documentation", 0, 100, 5, format="%d%%")
+        
+        total = phase1 + phase2 + phase3 + phase4 + phase5 + phase6
+        
+        if total != 100:
+            st.warning(f"⚠️ Total allocation is {total}%. Please adjust to equal 100%.")
+        else:
+            st.success("✓ Allocation totals 100%")
+        
+        st.markdown("---")
+        st.markdown("### Project Timeline")
+        
+        phases = [
+            ("Problem Definition & Scoping", phase1),
+            ("Data Collection & Cleaning", phase2),
+            ("Exploratory Analysis", phase3),
+            ("In-depth Analysis", phase4),
+            ("Reporting & Presentation", phase5),
+            ("Review & Documentation", phase6)
+        ]
+        
+        timeline_data = []
+        current_week = 0
+        for phase_name, pct in phases:
+            weeks = (pct / 100) * project_duration
+            timeline_data.append({
+                "Phase": phase_name,
+                "Weeks": f"{weeks:.1f}",
+                "Start": f"Week {current_week + 1:.0f}",
+                "End": f"Week {current_week + weeks:.0f}"
+            })
+            current_week += weeks
+        
+        df_timeline = pd.DataFrame(timeline_data)
+        st.dataframe(df_timeline, use_container_width=True)
+        
+        st.markdown("---")
+        st.markdown("### Deliverables Checklist")
+        
+        deliverables = {
+            "Problem Definition & Scoping": ["Problem statement document", "Stakeholder requirements", "Success criteria defined"],
+            "Data Collection & Cleaning": ["Data sources identified", "Data quality report", "Clean dataset ready"],
+            "Exploratory Analysis": ["Summary statistics", "Initial visualizations", "Key patterns identified"],
+            "In-depth Analysis": ["Analysis methodology documented", "Statistical tests completed", "Findings validated"],
+            "Reporting & Presentation": ["Executive summary", "Detailed report", "Presentation slides"],
+            "Review & Documentation": ["Peer review completed", "Documentation finalized", "Lessons learned"]
+        }
+        
+        for phase_name, items in deliverables.items():
+            with st.expander(f"📁 {phase_name}"):
+                for item in items:
+                    st.checkbox(item, key=f"del_{phase_name}_{item}")
+        
+        st.markdown("---")
+        if st.button("📥 Generate Project Plan Summary", type="primary"):
+            plan_summary = f"""PROJECT PLAN: {project_name}
+========================================
+Duration: {project_duration} weeks
+
+PHASE ALLOCATION:
+"""
+            for phase_name, pct in phases:
+                weeks = (pct / 100) * project_duration
+                plan_summary += f"- {phase_name}: {pct}% ({weeks:.1f} weeks)\n"
+            
+            plan_summary += f"""
+KEY MILESTONES:
+- Week 1: Project kickoff
+- Week {int(project_duration * 0.4)}: Data ready for analysis
+- Week {int(project_duration * 0.7)}: Analysis complete
+- Week {project_duration}: Final delivery
+
+DELIVERABLES:
+- Problem statement and scope document
+- Data quality and cleaning report
+- Analysis report with findings
+- Executive presentation
+- Project documentation
+"""
+            st.text_area("Project Plan Summary:", value=plan_summary, height=400)
+            st.download_button(
+                "Download Project Plan",
+                data=plan_summary,
+                file_name=f"project_plan_{project_name.lower().replace(' ', '_')}.txt",
+                mime="text/plain"
+            )
+    
+    elif playground_tab == "Report Writing Workshop":
+        st.subheader("📝 Report Writing Workshop")
+        st.markdown("*Practice writing professional analysis reports with proper structure and clarity*")
+        st.markdown("---")
+        
+        report_mode = st.radio(
+            "Choose practice mode:",
+            ["Executive Summary Builder", "Clarity Rewriter", "Report Structure Planner", "Caption Writer"],
+            horizontal=True
+        )
+        
+        if report_mode == "Executive Summary Builder":
+            st.markdown("### Executive Summary Builder")
+            st.markdown("*Create a concise executive summary from your analysis findings*")
+            
+            st.markdown("**Enter your analysis details:**")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                main_finding = st.text_area(
+                    "Main Finding:",
+                    placeholder="e.g., Customer churn increased 25% last quarter",
+                    height=80
+                )
+                root_cause = st.text_area(
+                    "Root Cause/Key Insight:",
+                    placeholder="e.g., Analysis of 500 surveys found 67% cited slow support response",
+                    height=80
+                )
+            
+            with col2:
+                business_impact = st.text_input(
+                    "Business Impact:",
+                    placeholder="e.g., Estimated $200K in lost annual revenue"
+                )
+                recommendation = st.text_area(
+                    "Recommendation:",
+                    placeholder="e.g., Implement chat support system ($50K investment)",
+                    height=80
+                )
+            
+            audience = st.selectbox(
+                "Target Audience:",
+                ["C-Suite Executives", "Department Managers", "Technical Team", "External Clients"]
+            )
+            
+            if st.button("📋 Generate Executive Summary", type="primary"):
+                if main_finding and recommendation:
+                    st.markdown("---")
+                    st.markdown("### Your Executive Summary")
+                    
+                    if audience == "C-Suite Executives":
+                        tone = "Focus on business impact and ROI"
+                        length = "Ultra-brief (3-5 sentences)"
+                    elif audience == "Department Managers":
+                        tone = "Balance of impact and actionable details"
+                        length = "Brief (5-7 sentences)"
+                    elif audience == "Technical Team":
+                        tone = "Include methodology context"
+                        length = "Moderate detail (7-10 sentences)"
+                    else:
+                        tone = "Professional, accessible language"
+                        length = "Clear and complete (5-8 sentences)"
+                    
+                    summary = f"""## Executive Summary
+
+**Key Finding:** {main_finding}
+
+**Impact:** {business_impact if business_impact else '[Add business impact]'}
+
+**Analysis Insight:** {root_cause if root_cause else '[Add key insight from analysis]'}
+
+**Recommendation:** {recommendation}
+
+---
+*Note: This summary is tailored for {audience}. Tone: {tone}. Recommended length: {length}.*
+"""
+                    st.markdown(summary)
+                    
+                    st.download_button(
+                        "📥 Download Executive Summary",
+                        data=summary,
+                        file_name="executive_summary.md",
+                        mime="text/markdown"
+                    )
+                    
+                    st.markdown("### Writing Tips for Your Audience:")
+                    if audience == "C-Suite Executives":
+                        st.info("- Lead with the bottom line\n- Quantify everything\n- Keep to 1 page maximum\n- Focus on decisions, not details")
+                    elif audience == "Department Managers":
+                        st.info("- Include actionable next steps\n- Show department-level impact\n- Provide timeline expectations\n- Mention resource requirements")
+                    elif audience == "Technical Team":
+                        st.info("- Can include methodology references\n- Technical terms are acceptable\n- Include data quality notes\n- Reference appendix for details")
+                    else:
+                        st.info("- Avoid internal jargon\n- Explain technical concepts\n- Focus on value delivered\n- Include clear next steps")
+                else:
+                    st.warning("Please fill in at least the main finding and recommendation.")
+        
+        elif report_mode == "Clarity Rewriter":
+            st.markdown("### Clarity Rewriter")
+            st.markdown("*Practice rewriting complex technical text for non-technical audiences*")
+            
+            sample_texts = {
+                "Statistical finding": "The multivariate regression analysis yielded a statistically significant coefficient (β=0.43, p<0.01) for the marketing expenditure variable, indicating a positive relationship with sales outcomes.",
+                "Data quality issue": "The dataset exhibited substantial missing value prevalence (23.7% null rate) concentrated primarily in temporal fields, necessitating imputation via mean substitution methodology.",
+                "Correlation analysis": "Pearson correlation coefficient analysis revealed a strong positive correlation (r=0.82) between customer satisfaction metrics and repeat purchase behavior, suggesting potential causative linkages.",
+                "Forecasting result": "The ARIMA(2,1,1) model generated forecasts with a MAPE of 8.3%, outperforming the baseline exponential smoothing approach by 2.1 percentage points.",
+                "Custom text": ""
+            }
+            
+            selected_text = st.selectbox("Choose a text to rewrite:", list(sample_texts.keys()))
+            
+            if selected_text == "Custom text":
+                original_text = st.text_area(
+                    "Enter your technical text:",
+                    placeholder="Paste your complex technical text here...",
+                    height=100
+                )
+            else:
+                original_text = sample_texts[selected_text]
+                st.markdown(f"**Original text:** {original_text}")
+            
+            user_rewrite = st.text_area(
+                "Your simplified version:",
+                placeholder="Rewrite the text in plain language...",
+                height=100
+            )
+            
+            if st.button("📖 Show Expert Rewrite", type="primary") and original_text:
+                st.markdown("---")
+                
+                expert_rewrites = {
+                    "Statistical finding": "Our analysis found that marketing spending has a strong positive effect on sales. For every additional $1,000 spent on marketing, sales increased by approximately $430. This relationship is statistically reliable.",
+                    "Data quality issue": "About 24% of the data was missing, mainly in date-related fields. We filled in these gaps using average values to ensure complete analysis.",
+                    "Correlation analysis": "We found a strong link between customer satisfaction and repeat purchases. Customers who are more satisfied are significantly more likely to buy again.",
+                    "Forecasting result": "Our forecast model predicted sales with 92% accuracy, performing 2% better than our previous method. This gives us reliable predictions for planning.",
+                    "Custom text": "Consider: 1) Replace jargon with plain words, 2) Explain what numbers mean practically, 3) Focus on the 'so what?' for the business."
+                }
+                
+                st.markdown("### Expert Rewrite:")
+                st.success(expert_rewrites.get(selected_text, expert_rewrites["Custom text"]))
+                
+                st.markdown("### Rewriting Principles:")
+                st.markdown("""
+| Technical Term | Plain Language |
+|---------------|----------------|
+| Statistically significant | Reliable/consistent pattern |
+| Correlation | Relationship/link |
+| Coefficient | Effect size/impact |
+| Null values | Missing data |
+| Imputation | Filling in gaps |
+| MAPE/RMSE | Accuracy percentage |
+""")
+        
+        elif report_mode == "Report Structure Planner":
+            st.markdown("### Report Structure Planner")
+            st.markdown("*Plan the sections and content of your analysis report*")
+            
+            report_type = st.selectbox(
+                "What type of report are you writing?",
+                ["Client Report", "Executive Summary", "Technical Report", "Ad-hoc Analysis", "Dashboard Report"]
+            )
+            
+            report_structures = {
+                "Client Report": {
+                    "sections": ["Executive Summary", "Background & Objectives", "Methodology Overview", "Key Findings", "Recommendations", "Next Steps", "Appendix"],
+                    "page_range": "5-15 pages",
+                    "tips": "Focus on actionable insights. Minimize technical jargon. Include clear recommendations with expected outcomes."
+                },
+                "Executive Summary": {
+                    "sections": ["Key Finding", "Business Impact", "Recommendation", "Next Steps"],
+                    "page_range": "1-2 pages",
+                    "tips": "Lead with the conclusion. Quantify everything. Maximum 1-2 pages. Support details in appendix only."
+                },
+                "Technical Report": {
+                    "sections": ["Abstract", "Introduction", "Data Sources", "Methodology", "Results", "Discussion", "Limitations", "Conclusions", "References", "Appendix"],
+                    "page_range": "10-30 pages",
+                    "tips": "Full methodology documentation. Include code/query references. Reproducibility is key."
+                },
+                "Ad-hoc Analysis": {
+                    "sections": ["Question/Request", "Approach", "Findings", "Answer/Recommendation"],
+                    "page_range": "2-5 pages",
+                    "tips": "Direct answer to the question asked. Quick turnaround expected. Keep focused."
+                },
+                "Dashboard Report": {
+                    "sections": ["KPI Summary", "Trends", "Alerts/Exceptions", "Actions Needed"],
+                    "page_range": "1-3 pages",
+                    "tips": "Visual-heavy. Consistent format for regular updates. Clear RAG status indicators."
+                }
+            }
+            
+            structure = report_structures[report_type]
+            
+            st.markdown(f"### {report_type} Structure")
+            st.caption(f"Typical length: {structure['page_range']}")
+            
+            st.markdown("**Recommended Sections:**")
+            for i, section in enumerate(structure["sections"], 1):
+                st.markdown(f"{i}. {section}")
+            
+            st.info(f"**Tips:** {structure['tips']}")
+            
+            st.markdown("---")
+            st.markdown("### Plan Your Content")
+            
+            content_plan = {}
+            for section in structure["sections"]:
+                content_plan[section] = st.text_input(
+                    f"{section}:",
+                    placeholder=f"Brief notes for {section}...",
+                    key=f"plan_{section}"
+                )
+            
+            if st.button("📥 Generate Report Outline", type="primary"):
+                outline = f"""# {report_type} Outline
+
+Type: {report_type}
+Target Length: {structure['page_range']}
+
+## Sections
+
+"""
+                for section, notes in content_plan.items():
+                    outline += f"### {section}\n"
+                    outline += f"{notes if notes else '[Add content notes]'}\n\n"
+                
+                outline += f"""---
+## Writing Tips
+{structure['tips']}
+"""
+                
+                st.text_area("Your Report Outline:", value=outline, height=400)
+                st.download_button(
+                    "Download Outline",
+                    data=outline,
+                    file_name=f"{report_type.lower().replace(' ', '_')}_outline.md",
+                    mime="text/markdown"
+                )
+        
+        elif report_mode == "Caption Writer":
+            st.markdown("### Caption Writer")
+            st.markdown("*Practice writing professional captions for figures and tables*")
+            
+            visual_type = st.selectbox(
+                "What type of visual are you captioning?",
+                ["Bar Chart", "Line Chart", "Pie Chart", "Table", "Scatter Plot", "Dashboard Screenshot"]
+            )
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                figure_number = st.number_input("Figure/Table Number:", min_value=1, value=1)
+                title = st.text_input("Visual Title:", placeholder="e.g., Quarterly Revenue by Region")
+            
+            with col2:
+                key_insight = st.text_input("Key Insight:", placeholder="e.g., North region leads by 15%")
+                data_source = st.text_input("Data Source:", placeholder="e.g., Sales Database, Q4 2025")
+            
+            if st.button("✍️ Generate Caption", type="primary"):
+                if title:
+                    st.markdown("---")
+                    st.markdown("### Generated Captions")
+                    
+                    prefix = "Figure" if visual_type != "Table" else "Table"
+                    
+                    brief_caption = f"{prefix} {figure_number}: {title}."
+                    
+                    standard_caption = f"{prefix} {figure_number}: {title}. {key_insight if key_insight else ''}"
+                    if data_source:
+                        standard_caption += f" Source: {data_source}."
+                    
+                    detailed_caption = f"{prefix} {figure_number}: {title}. "
+                    if key_insight:
+                        detailed_caption += f"Key insight: {key_insight}. "
+                    detailed_caption += f"This {visual_type.lower()} illustrates [add interpretation]. "
+                    if data_source:
+                        detailed_caption += f"Data source: {data_source}."
+                    
+                    st.markdown("**Brief Caption:**")
+                    st.code(brief_caption)
+                    
+                    st.markdown("**Standard Caption (Recommended):**")
+                    st.code(standard_caption)
+                    
+                    st.markdown("**Detailed Caption:**")
+                    st.code(detailed_caption)
+                    
+                    st.markdown("### Caption Best Practices:")
+                    st.markdown("""
+- ✓ Always include figure/table number
+- ✓ Use descriptive title (not just "Revenue")
+- ✓ State the key insight readers should take away
+- ✓ Include data source for credibility
+- ✓ Keep captions concise but complete
+- ✓ Place below figures, above tables
+""")
+                else:
+                    st.warning("Please enter at least a title for your visual.")
+    
+    elif playground_tab == "Exam Project Toolkit":
+        st.subheader("🎓 Exam Project Toolkit")
+        st.markdown("*Practice planning and executing your comprehensive data analysis project*")
+        st.markdown("---")
+        
+        toolkit_mode = st.radio(
+            "Choose practice mode:",
+            ["Problem Statement Builder", "Project Scope Planner", "Quality Self-Assessment", "Presentation Planner"],
+            horizontal=True
+        )
+        
+        if toolkit_mode == "Problem Statement Builder":
+            st.markdown("### Problem Statement Builder")
+            st.markdown("*Craft a clear, professional problem statement for your project*")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                organization = st.text_input(
+                    "Organization/Client:",
+                    placeholder="e.g., Oslo Retail Group, Local Healthcare Clinic"
+                )
+                topic = st.text_input(
+                    "What needs to be understood?",
+                    placeholder="e.g., customer churn patterns, inventory inefficiencies"
+                )
+            
+            with col2:
+                action = st.text_input(
+                    "Purpose (in order to...):",
+                    placeholder="e.g., improve retention strategies, reduce waste"
+                )
+                data_sources = st.text_input(
+                    "Data to be examined:",
+                    placeholder="e.g., 2 years of customer data, daily sales records"
+                )
+            
+            deliverable = st.text_input(
+                "Deliverable:",
+                placeholder="e.g., recommendation report, dashboard, presentation"
+            )
+            deadline = st.text_input(
+                "Deadline:",
+                placeholder="e.g., March 15, 2026"
+            )
+            
+            if st.button("📝 Generate Problem Statement", type="primary"):
+                if organization and topic and action:
+                    st.markdown("---")
+                    st.markdown("### Your Problem Statement")
+                    
+                    problem_statement = f"""**{organization}** needs to understand **{topic}** in order to **{action}**. 
+
+This analysis will examine **{data_sources if data_sources else '[specify data sources]'}** to provide **{deliverable if deliverable else '[specify deliverable]'}** by **{deadline if deadline else '[specify deadline]'}**."""
+                    
+                    st.success(problem_statement)
+                    
+                    st.markdown("### Quality Check:")
+                    checks = [
+                        ("Organization/stakeholder identified", bool(organization)),
+                        ("Clear question to answer", bool(topic)),
+                        ("Business purpose stated", bool(action)),
+                        ("Data sources specified", bool(data_sources)),
+                        ("Deliverable defined", bool(deliverable)),
+                        ("Deadline included", bool(deadline))
+                    ]
+                    
+                    for check, passed in checks:
+                        if passed:
+                            st.markdown(f"✅ {check}")
+                        else:
+                            st.markdown(f"⚠️ {check} - *add this for completeness*")
+                    
+                    st.download_button(
+                        "📥 Download Problem Statement",
+                        data=problem_statement,
+                        file_name="problem_statement.md",
+                        mime="text/markdown"
+                    )
+                else:
+                    st.warning("Please fill in organization, topic, and purpose at minimum.")
+        
+        elif toolkit_mode == "Project Scope Planner":
+            st.markdown("### Project Scope Planner")
+            st.markdown("*Define clear boundaries for your project*")
+            
+            st.markdown("**Project Duration:**")
+            project_weeks = st.slider("Total project time (weeks):", 4, 16, 10, key="scope_project_weeks")
+            
+            st.markdown("---")
+            st.markdown("### In Scope vs Out of Scope")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown("**✅ In Scope** (what you WILL do)")
+                in_scope_1 = st.text_input("Question 1:", placeholder="e.g., Analyze sales trends for 2024-2025", key="scope_in_1")
+                in_scope_2 = st.text_input("Question 2:", placeholder="e.g., Identify top-performing products", key="scope_in_2")
+                in_scope_3 = st.text_input("Question 3:", placeholder="e.g., Create visualization dashboard", key="scope_in_3")
+            
+            with col2:
+                st.markdown("**❌ Out of Scope** (explicitly excluded)")
+                out_scope_1 = st.text_input("Excluded 1:", placeholder="e.g., Competitor analysis", key="scope_out_1")
+                out_scope_2 = st.text_input("Excluded 2:", placeholder="e.g., Predictive modeling", key="scope_out_2")
+                out_scope_3 = st.text_input("Excluded 3:", placeholder="e.g., Real-time data integration", key="scope_out_3")
+            
+            st.markdown("---")
+            st.markdown("### Time Allocation")
+            
+            phases = {
+                "Planning & Research": st.slider("Planning & Research %:", 10, 30, 20, key="scope_phase_1"),
+                "Data Collection & Cleaning": st.slider("Data Collection & Cleaning %:", 15, 35, 25, key="scope_phase_2"),
+                "Analysis & Exploration": st.slider("Analysis & Exploration %:", 20, 40, 25, key="scope_phase_3"),
+                "Reporting & Visualization": st.slider("Reporting & Visualization %:", 15, 30, 20, key="scope_phase_4"),
+                "Review & Finalization": st.slider("Review & Finalization %:", 5, 20, 10, key="scope_phase_5")
+            }
+            
+            total_pct = sum(phases.values())
+            if total_pct != 100:
+                st.warning(f"Total allocation is {total_pct}%. Adjust to equal 100%.")
+            else:
+                st.success("✅ Time allocation totals 100%")
+            
+            if st.button("📊 Generate Project Scope Document", type="primary"):
+                st.markdown("---")
+                st.markdown("### Project Scope Document")
+                
+                scope_doc = f"""# Project Scope Document
+
+## Duration
+**{project_weeks} weeks**
+
+## In Scope
+"""
+                for item in [in_scope_1, in_scope_2, in_scope_3]:
+                    if item:
+                        scope_doc += f"- {item}\n"
+                
+                scope_doc += """
+## Out of Scope
+"""
+                for item in [out_scope_1, out_scope_2, out_scope_3]:
+                    if item:
+                        scope_doc += f"- {item}\n"
+                
+                scope_doc += """
+## Timeline
+"""
+                current_week = 1
+                for phase, pct in phases.items():
+                    weeks = (pct / 100) * project_weeks
+                    end_week = current_week + weeks - 1
+                    scope_doc += f"- **{phase}**: Weeks {current_week:.0f}-{end_week:.0f} ({pct}%)\n"
+                    current_week = end_week + 1
+                
+                st.text_area("Scope Document:", value=scope_doc, height=400)
+                st.download_button(
+                    "Download Scope Document",
+                    data=scope_doc,
+                    file_name="project_scope.md",
+                    mime="text/markdown"
+                )
+        
+        elif toolkit_mode == "Quality Self-Assessment":
+            st.markdown("### Quality Self-Assessment")
+            st.markdown("*Evaluate your project against professional standards before submission*")
+            
+            st.markdown("Rate each area honestly (1-5):")
+            st.caption("1=Not done, 2=Partial, 3=Adequate, 4=Good, 5=Excellent")
+            
+            categories = {
+                "Project Execution": [
+                    "Problem clearly defined and scoped",
+                    "Data sourced ethically with documentation",
+                    "Methodology appropriate and documented",
+                    "Analysis thorough and validated"
+                ],
+                "Technical Quality": [
+                    "Data cleaned properly with decisions documented",
+                    "Calculations verified and accurate",
+                    "Code/formulas organized and commented",
+                    "Process is reproducible"
+                ],
+                "Report Quality": [
+                    "Executive summary is clear and actionable",
+                    "Report has logical structure",
+                    "Visualizations are accessible and labeled",
+                    "Recommendations are specific and supported"
+                ],
+                "Presentation Quality": [
+                    "Within time limit",
+                    "Key points are clear",
+                    "Visuals are readable from distance",
+                    "Prepared for likely questions"
+                ]
+            }
+            
+            scores = {}
+            for category, items in categories.items():
+                st.markdown(f"**{category}**")
+                for i, item in enumerate(items):
+                    scores[item] = st.slider(item, 1, 5, 3, key=f"qa_{category}_{i}")
+            
+            if st.button("📋 Generate Assessment Report", type="primary"):
+                st.markdown("---")
+                st.markdown("### Your Assessment Results")
+                
+                total_score = sum(scores.values())
+                max_score = len(scores) * 5
+                percentage = (total_score / max_score) * 100
+                
+                if percentage >= 80:
+                    st.success(f"Overall Score: {total_score}/{max_score} ({percentage:.0f}%) - **Ready to submit!**")
+                elif percentage >= 60:
+                    st.warning(f"Overall Score: {total_score}/{max_score} ({percentage:.0f}%) - **Good progress, address weak areas**")
+                else:
+                    st.error(f"Overall Score: {total_score}/{max_score} ({percentage:.0f}%) - **Needs more work**")
+                
+                st.markdown("### Areas to Improve:")
+                weak_areas = [item for item, score in scores.items() if score < 3]
+                if weak_areas:
+                    for area in weak_areas:
+                        st.markdown(f"- ⚠️ {area}")
+                else:
+                    st.markdown("No critical areas identified - great work!")
+                
+                st.markdown("### Strengths:")
+                strong_areas = [item for item, score in scores.items() if score >= 4]
+                if strong_areas:
+                    for area in strong_areas:
+                        st.markdown(f"- ✅ {area}")
+        
+        elif toolkit_mode == "Presentation Planner":
+            st.markdown("### Presentation Planner")
+            st.markdown("*Plan your project presentation structure*")
+            
+            total_time = st.slider("Total presentation time (minutes):", 10, 30, 18, key="exam_pres_total_time")
+            
+            sections = {
+                "Opening": {"default": 2, "tip": "Introduce yourself, project, hook with key finding"},
+                "Context": {"default": 3, "tip": "Business background, why it matters, objectives"},
+                "Methodology": {"default": 3, "tip": "Data sources, tools used, key decisions"},
+                "Findings": {"default": 5, "tip": "Main results with visuals, patterns identified"},
+                "Recommendations": {"default": 3, "tip": "Actionable suggestions, expected impact"},
+                "Conclusion": {"default": 2, "tip": "Summary, lessons learned, Q&A invitation"}
+            }
+            
+            st.markdown("### Time Allocation per Section")
+            allocations = {}
+            for section, info in sections.items():
+                col1, col2 = st.columns([1, 2])
+                with col1:
+                    allocations[section] = st.number_input(
+                        f"{section} (min):",
+                        min_value=1,
+                        max_value=15,
+                        value=info["default"],
+                        key=f"pres_{section}"
+                    )
+                with col2:
+                    st.caption(info["tip"])
+            
+            allocated = sum(allocations.values())
+            if allocated != total_time:
+                st.warning(f"Allocated {allocated} minutes, but total is {total_time} minutes. Adjust to match.")
+            else:
+                st.success(f"✅ Time allocation matches {total_time} minutes")
+            
+            st.markdown("---")
+            st.markdown("### Key Points per Section")
+            
+            key_points = {}
+            for section in sections.keys():
+                key_points[section] = st.text_area(
+                    f"{section} - Main points:",
+                    placeholder=f"What will you cover in the {section.lower()} section?",
+                    height=60,
+                    key=f"kp_{section}"
+                )
+            
+            if st.button("📊 Generate Presentation Outline", type="primary"):
+                st.markdown("---")
+                st.markdown("### Your Presentation Outline")
+                
+                outline = f"""# Project Presentation Outline
+Total Time: {total_time} minutes
+
+"""
+                for section, minutes in allocations.items():
+                    outline += f"## {section} ({minutes} min)\n"
+                    outline += f"**Tip:** {sections[section]['tip']}\n"
+                    if key_points[section]:
+                        outline += f"**Your notes:** {key_points[section]}\n"
+                    outline += "\n"
+                
+                outline += """---
+## Presentation Tips
+- Practice out loud at least 3 times
+- Time yourself to ensure you fit the limit
+- Have backup slides for anticipated questions
+- Speak to the audience, not the slides
+- Pause after key findings to let them sink in
+"""
+                
+                st.text_area("Presentation Outline:", value=outline, height=500)
+                st.download_button(
+                    "Download Outline",
+                    data=outline,
+                    file_name="presentation_outline.md",
+                    mime="text/markdown"
+                )
@@ -0,0 +1,63 @@
+"""Progress page."""
+
+from datetime import datetime
+
+import streamlit as st
+
+from study_buddy_core import courses_data
+from study_buddy_state import PROGRAM_DEADLINES, STUDY_PATH_JAN2026
+
+
+def render():
+    st.title("📈 My Progress")
+    st.markdown("---")
+    
+    st.subheader("Mark Completed Courses (JAN 2026 Progression)")
+
+    _deadline_by_code = {
+        _code: datetime.strptime(_deadline_s, "%Y-%m-%d").date()
+        for _code, _course_name, _deadline_s in PROGRAM_DEADLINES
+    }
+
+    for _code, _name, _start_s, _end_s in STUDY_PATH_JAN2026:
+        _start = datetime.strptime(_start_s, "%Y-%m-%d").date()
+        _end = datetime.strptime(_end_s, "%Y-%m-%d").date()
+
+        _course_row = next((c for c in courses_data if c["code"] == _code), None)
+        _credits = _course_row["credits"] if _course_row else 0
+
+        _assessment_deadline = _deadline_by_code.get(_code)
+        _assessment_text = (
+            f" · Assessment: {_assessment_deadline.strftime('%d %b %Y')}"
+            if _assessment_deadline
+            else ""
+        )
+
+        _label = (
+            f"{_code} — {_name} ({_credits} cr)\n"
+            f"{_start.strftime('%d %b %Y')} → {_end.strftime('%d %b %Y')}{_assessment_text}"
+        )
+
+        _checked = st.checkbox(
+            _label,
+            value=_code in st.session_state.completed_courses,
+            key=f"course_{_code}"
+        )
+
+        if _checked and _code not in st.session_state.completed_courses:
+            st.session_state.completed_courses.append(_code)
+        elif not _checked and _code in st.session_state.completed_courses:
+            st.session_state.completed_courses.remove(_code)
+
+    st.markdown("---")
+    
+    total_credits = sum(c["credits"] for c in courses_data)
+    completed_credits = sum(c["credits"] for c in courses_data if c["code"] in st.session_state.completed_courses)
+    progress = completed_credits / total_credits if total_credits > 0 else 0
+    _modules_total = len(STUDY_PATH_JAN2026)
+    _modules_done = sum(1 for _code, *_rest in STUDY_PATH_JAN2026 if _code in st.session_state.completed_courses)
+    
+    st.subheader("Summary")
+    st.progress(progress)
+    st.write(f"**{completed_credits:.1f} / {total_credits:.0f} credits completed ({progress*100:.0f}%)**")
+    st.caption(f"Modules completed: {_modules_done}/{_modules_total}")
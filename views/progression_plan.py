@@ -0,0 +1,235 @@
+"""Progression Plan page."""
+
+import re
+
+import streamlit as st
+
+
+def render():
+    from datetime import date as _date, datetime as _datetime
+    st.title("📅 Progression Plan")
+    st.markdown("**JAN 2026 Full-Time Data Analyst – Year 1 Schedule**")
+    st.markdown("---")
+
+    # ── All course events for JAN 2026 FT cohort ──────────────────────────────
+    _EVENTS = [
+        # Enrollment / IC
+        {"date": "2026-01-05", "name": "Enrollment / Course Start",                   "type": "enrollment",      "course": "IC",  "course_name": "Introduction Course"},
+        {"date": "2026-01-06", "name": "Introduction Course Begins",                   "type": "module_start",    "course": "IC",  "course_name": "Introduction Course"},
+        {"date": "2026-01-11", "name": "Introduction Course Deadline",                 "type": "deadline",        "course": "IC",  "course_name": "Introduction Course"},
+        # DAF
+        {"date": "2026-01-12", "name": "DAF – Module 1 starts",                        "type": "module_start",    "course": "DAF", "course_name": "Data Analysis Fundamentals"},
+        {"date": "2026-01-19", "name": "DAF – Module 2 starts",                        "type": "module_start",    "course": "DAF", "course_name": "Data Analysis Fundamentals"},
+        {"date": "2026-01-26", "name": "DAF Assessment Week begins",                   "type": "assessment_start","course": "DAF", "course_name": "Data Analysis Fundamentals"},
+        {"date": "2026-02-01", "name": "DAF Assessment Deadline (Sun 23:59)",          "type": "deadline",        "course": "DAF", "course_name": "Data Analysis Fundamentals"},
+        # SPF
+        {"date": "2026-02-02", "name": "SPF – Module 1 starts",                        "type": "module_start",    "course": "SPF", "course_name": "Spreadsheet Fundamentals"},
+        {"date": "2026-02-09", "name": "SPF – Module 2 starts",                        "type": "module_start",    "course": "SPF", "course_name": "Spreadsheet Fundamentals"},
+        {"date": "2026-02-16", "name": "SPF Assessment Week begins",                   "type": "assessment_start","course": "SPF", "course_name": "Spreadsheet Fundamentals"},
+        {"date": "2026-02-22", "name": "SPF Assessment Deadline (Sun 23:59)",          "type": "deadline",        "course": "SPF", "course_name": "Spreadsheet Fundamentals"},
+        # DDM
+        {"date": "2026-02-23", "name": "DDM – Module 1 starts",                        "type": "module_start",    "course": "DDM", "course_name": "Data Driven Decision-Making"},
+        {"date": "2026-03-02", "name": "DDM – Module 2 starts",                        "type": "module_start",    "course": "DDM", "course_name": "Data Driven Decision-Making"},
+        {"date": "2026-03-09", "name": "DDM – Module 3 starts",                        "type": "module_start",    "course": "DDM", "course_name": "Data Driven Decision-Making"},
+        {"date": "2026-03-16", "name": "DDM Assessment Week begins",                   "type": "assessment_start","course": "DDM", "course_name": "Data Driven Decision-Making"},
+        {"date": "2026-03-22", "name": "DDM Assessment Deadline (Sun 23:59)",          "type": "deadline",        "course": "DDM", "course_name": "Data Driven Decision-Making"},
+        # STT
+        {"date": "2026-03-23", "name": "STT – Module 1 starts",                        "type": "module_start",    "course": "STT", "course_name": "Statistical Tools"},
+        {"date": "2026-04-06", "name": "STT – Module 2 starts",                        "type": "module_start",    "course": "STT", "course_name": "Statistical Tools"},
+        {"date": "2026-04-13", "name": "STT Assessment Week begins",                   "type": "assessment_start","course": "STT", "course_name": "Statistical Tools"},
+        {"date": "2026-04-19", "name": "STT Assessment Deadline (Sun 23:59)",          "type": "deadline",        "course": "STT", "course_name": "Statistical Tools"},
+        # SP1 – Semester Project
+        {"date": "2026-04-20", "name": "SP1 Semester Project – Week 1",                "type": "module_start",    "course": "SP1", "course_name": "Semester Project 1"},
+        {"date": "2026-04-27", "name": "SP1 Semester Project – Week 2",                "type": "module_start",    "course": "SP1", "course_name": "Semester Project 1"},
+        {"date": "2026-05-04", "name": "SP1 Semester Project – Week 3",                "type": "module_start",    "course": "SP1", "course_name": "Semester Project 1"},
+        {"date": "2026-05-11", "name": "SP1 Semester Project – Final Week begins",     "type": "assessment_start","course": "SP1", "course_name": "Semester Project 1"},
+        {"date": "2026-05-17", "name": "SP1 Semester Project Deadline (Sun 23:59)",    "type": "deadline",        "course": "SP1", "course_name": "Semester Project 1"},
+        # EVO
+        {"date": "2026-05-18", "name": "EVO – Module 1 starts",                        "type": "module_start",    "course": "EVO", "course_name": "Evaluation of Outcomes"},
+        {"date": "2026-05-25", "name": "EVO – Module 2 starts",                        "type": "module_start",    "course": "EVO", "course_name": "Evaluation of Outcomes"},
+        {"date": "2026-06-01", "name": "EVO – Module 3 starts",                        "type": "module_start",    "course": "EVO", "course_name": "Evaluation of Outcomes"},
+        {"date": "2026-08-10", "name": "EVO – Module 4 starts",                        "type": "module_start",    "course": "EVO", "course_name": "Evaluation of Outcomes"},
+        {"date": "2026-08-17", "name": "EVO – Module 5 starts",                        "type": "module_start",    "course": "EVO", "course_name": "Evaluation of Outcomes"},
+        {"date": "2026-08-24", "name": "EVO – Module 6 starts",                        "type": "module_start",    "course": "EVO", "course_name": "Evaluation of Outcomes"},
+        {"date": "2026-08-31", "name": "EVO – Module 7 starts",                        "type": "module_start",    "course": "EVO", "course_name": "Evaluation of Outcomes"},
+        {"date": "2026-09-07", "name": "EVO Assessment Week begins",                   "type": "assessment_start","course": "EVO", "course_name": "Evaluation of Outcomes"},
+        {"date": "2026-09-13", "name": "EVO Assessment Deadline (Sun 23:59)",          "type": "deadline",        "course": "EVO", "course_name": "Evaluation of Outcomes"},
+        # DVS
+        {"date": "2026-09-14", "name": "DVS – Module 1 starts",                        "type": "module_start",    "course": "DVS", "course_name": "Data Visualisation"},
+        {"date": "2026-09-21", "name": "DVS – Module 2 starts",                        "type": "module_start",    "course": "DVS", "course_name": "Data Visualisation"},
+        {"date": "2026-09-28", "name": "DVS – Module 3 starts",                        "type": "module_start",    "course": "DVS", "course_name": "Data Visualisation"},
+        {"date": "2026-10-05", "name": "DVS – Module 4 starts",                        "type": "module_start",    "course": "DVS", "course_name": "Data Visualisation"},
+        {"date": "2026-10-12", "name": "DVS Assessment Week begins",                   "type": "assessment_start","course": "DVS", "course_name": "Data Visualisation"},
+        {"date": "2026-10-18", "name": "DVS Assessment Deadline (Sun 23:59)",          "type": "deadline",        "course": "DVS", "course_name": "Data Visualisation"},
+        # ARP
+        {"date": "2026-10-19", "name": "ARP – Module 1 starts",                        "type": "module_start",    "course": "ARP", "course_name": "Analysis Reporting"},
+        {"date": "2026-10-26", "name": "ARP – Module 2 starts",                        "type": "module_start",    "course": "ARP", "course_name": "Analysis Reporting"},
+        {"date": "2026-11-02", "name": "ARP Assessment Week begins",                   "type": "assessment_start","course": "ARP", "course_name": "Analysis Reporting"},
+        {"date": "2026-11-08", "name": "ARP Assessment Deadline (Sun 23:59)",          "type": "deadline",        "course": "ARP", "course_name": "Analysis Reporting"},
+        # EP1 – Exam Project
+        {"date": "2026-11-09", "name": "EP1 Exam Project – Week 1",                    "type": "module_start",    "course": "EP1", "course_name": "Exam Project 1"},
+        {"date": "2026-11-16", "name": "EP1 Exam Project – Week 2",                    "type": "module_start",    "course": "EP1", "course_name": "Exam Project 1"},
+        {"date": "2026-11-23", "name": "EP1 Exam Project – Week 3",                    "type": "module_start",    "course": "EP1", "course_name": "Exam Project 1"},
+        {"date": "2026-11-30", "name": "EP1 Exam Project – Week 4",                    "type": "module_start",    "course": "EP1", "course_name": "Exam Project 1"},
+        {"date": "2026-12-07", "name": "EP1 Exam Project – Week 5",                    "type": "module_start",    "course": "EP1", "course_name": "Exam Project 1"},
+        {"date": "2026-12-14", "name": "EP1 Exam Project – Final Week begins",         "type": "assessment_start","course": "EP1", "course_name": "Exam Project 1"},
+        {"date": "2026-12-20", "name": "EP1 Exam Project 1 – FINAL DELIVERY (Sun 23:59)", "type": "deadline",    "course": "EP1", "course_name": "Exam Project 1"},
+    ]
+
+    # ── Course colour palette ─────────────────────────────────────────────────
+    _COURSE_COLOURS = {
+        "IC":  "#9b59b6", "DAF": "#3498db", "SPF": "#e67e22",
+        "DDM": "#1abc9c", "STT": "#e74c3c", "SP1": "#f39c12",
+        "EVO": "#2ecc71", "DVS": "#8e44ad", "ARP": "#16a085",
+        "EP1": "#c0392b",
+    }
+
+    _today = _date.today()
+
+    # ── Filter controls ───────────────────────────────────────────────────────
+    _col_f1, _col_f2, _col_f3 = st.columns([2, 2, 3])
+    with _col_f1:
+        _view = st.selectbox(
+            "Show",
+            ["All Events", "Upcoming Only", "Deadlines Only", "Module Starts Only", "Resit Assignments"],
+            key="pp_view"
+        )
+    with _col_f2:
+        _courses_all = ["All Courses"] + sorted(set(e["course"] for e in _EVENTS))
+        _course_filter = st.selectbox("Course", _courses_all, key="pp_course")
+    with _col_f3:
+        st.markdown("")
+
+    # ── Summary counts ────────────────────────────────────────────────────────
+    _past   = sum(1 for e in _EVENTS if _datetime.strptime(e["date"], "%Y-%m-%d").date() < _today)
+    _soon   = sum(1 for e in _EVENTS if 0 <= (_datetime.strptime(e["date"], "%Y-%m-%d").date() - _today).days <= 14)
+    _future = sum(1 for e in _EVENTS if (_datetime.strptime(e["date"], "%Y-%m-%d").date() - _today).days > 14)
+
+    _s1, _s2, _s3, _s4 = st.columns(4)
+    _s1.metric("Total Events", len(_EVENTS))
+    _s2.metric("Completed", _past)
+    _s3.metric("Due in ≤14 days", _soon)
+    _s4.metric("Upcoming (>14 days)", _future)
+
+    _resit_events = [
+        e for e in _EVENTS
+        if e["type"] == "deadline" and re.search(r"resit|resubmission|late", e["name"], flags=re.IGNORECASE)
+    ]
+    _resit_upcoming = sum(
+        1 for e in _resit_events
+        if _datetime.strptime(e["date"], "%Y-%m-%d").date() >= _today
+    )
+    _resit_completed = len(_resit_events) - _resit_upcoming
+
+    st.markdown("### 🔁 Resit Assignments")
+    _r1, _r2, _r3 = st.columns(3)
+    _r1.metric("Total Resits", len(_resit_events))
+    _r2.metric("Upcoming", _resit_upcoming)
+    _r3.metric("Completed", _resit_completed)
+
+    if _resit_events:
+        _sorted_resits = sorted(_resit_events, key=lambda x: x["date"])
+        for _resit in _sorted_resits:
+            _resit_date = _datetime.strptime(_resit["date"], "%Y-%m-%d").date()
+            _resit_days = (_resit_date - _today).days
+            if _resit_days < 0:
+                _resit_status = f"✅ Completed ({abs(_resit_days)} days ago)"
+            elif _resit_days == 0:
+                _resit_status = "🔥 Due today"
+            elif _resit_days == 1:
+                _resit_status = "🟡 1 day left"
+            else:
+                _resit_status = f"🟡 {_resit_days} days left"
+
+            st.markdown(
+                f"- **{_resit['course']}** · {_resit['name']} · {_resit_date.strftime('%d %b %Y')} · {_resit_status}"
+            )
+    else:
+        st.info("No resit assignments registered in the progression plan.")
+
+    st.markdown("---")
+
+    # ── Render each event ─────────────────────────────────────────────────────
+    _type_icons = {
+        "enrollment":      "🎓",
+        "module_start":    "📖",
+        "assessment_start":"✏️",
+        "deadline":        "⏰",
+    }
+
+    for _evt in _EVENTS:
+        _edate = _datetime.strptime(_evt["date"], "%Y-%m-%d").date()
+        _delta = (_edate - _today).days
+
+        # Apply filters
+        if _view == "Upcoming Only" and _delta < 0:
+            continue
+        if _view == "Deadlines Only" and _evt["type"] != "deadline":
+            continue
+        if _view == "Module Starts Only" and _evt["type"] not in ("module_start", "enrollment"):
+            continue
+        if _view == "Resit Assignments" and not (
+            _evt["type"] == "deadline" and re.search(r"resit|resubmission|late", _evt["name"], flags=re.IGNORECASE)
+        ):
+            continue
+        if _course_filter != "All Courses" and _evt["course"] != _course_filter:
+            continue
+
+        # Status colour & countdown text
+        if _delta < 0:
+            _status_emoji = "✅"
+            _countdown = f"{abs(_delta)} days ago"
+            _bg = "#1a1a2e"
+            _border = "#2d2d4e"
+        elif _delta == 0:
+            _status_emoji = "🔥"
+            _countdown = "TODAY!"
+            _bg = "#3d1a00"
+            _border = "#e74c3c"
+        elif _delta <= 3:
+            _status_emoji = "🔴"
+            _countdown = f"in {_delta} day{'s' if _delta != 1 else ''}"
+            _bg = "#3d0000"
+            _border = "#e74c3c"
+        elif _delta <= 14:
+            _status_emoji = "🟡"
+            _countdown = f"in {_delta} days"
+            _bg = "#2d2200"
+            _border = "#f39c12"
+        else:
+            _status_emoji = "🟢"
+            _countdown = f"in {_delta} days"
+            _bg = "#0d2d1a"
+            _border = "#2ecc71"
+
+        _course_colour = _COURSE_COLOURS.get(_evt["course"], "#555")
+        _icon = _type_icons.get(_evt["type"], "📌")
+
+        st.markdown(f"""
+<div style="
+    background:{_bg};
+    border-left: 5px solid {_border};
+    border-radius: 8px;
+    padding: 12px 16px;
+    margin-bottom: 8px;
+    display: flex;
+    align-items: center;
+    gap: 12px;
+">
+  <div style="min-width:56px; text-align:center;">
+    <span style="background:{_course_colour}; color:#fff; font-size:11px; font-weight:700;
+                 padding:3px 7px; border-radius:12px; display:inline-block;">{_evt['course']}</span>
+  </div>
+  <div style="flex:1;">
+    <div style="font-size:15px; font-weight:600; color:#f0f0f0;">{_icon} {_evt['name']}</div>
+    <div style="font-size:12px; color:#aaa; margin-top:2px;">{_evt['course_name']}</div>
+  </div>
+  <div style="text-align:right; min-width:130px;">
+    <div style="font-size:13px; color:#ddd; font-weight:600;">{_edate.strftime('%a %d %b %Y')}</div>
+    <div style="font-size:13px; color:{_border}; font-weight:700; margin-top:2px;">{_status_emoji} {_countdown}</div>
+  </div>
+</div>
+""", unsafe_allow_html=True)
+
+    st.markdown("---")
+    st.caption("📋 Source: PROGRESSION PLAN DA1 FT (JAN 2026 cohort) · Updated 16 December 2025")
@@ -0,0 +1,1832 @@
+"""Study Notes page."""
+
+import json
+from datetime import datetime
+
+import streamlit as st
+
+from global_search import note_state
+from note_history import NOTE_HISTORY_DEPTH, reconstruct, record_version
+from notes_archive import build_notes_archive, read_notes_archive
+from notes_index import get_notes_index
+from spell_check import get_spell_checker, mark_squiggles
+from study_buddy_core import AI_NOT_CONFIGURED_MESSAGE, client, courses_data, llm, stream_html
+
+
+def render():
+    st.markdown("""
+    <style>
+    .word-toolbar {
+        background: linear-gradient(180deg, #f3f3f3 0%, #e8e8e8 100%);
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 8px 12px;
+        margin-bottom: 10px;
+    }
+    .toolbar-group {
+        display: inline-flex;
+        gap: 4px;
+        padding: 0 8px;
+        border-right: 1px solid #ccc;
+    }
+    .doc-container {
+        background: white;
+        border: 1px solid #d0d0d0;
+        border-radius: 4px;
+        padding: 20px;
+        min-height: 400px;
+        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    }
+    .note-card {
+        background: #fafafa;
+        border-left: 4px solid #4A90D9;
+        padding: 12px;
+        margin: 8px 0;
+        border-radius: 0 4px 4px 0;
+    }
+    .note-card.important { border-left-color: #FFD700; }
+    .note-card.critical { border-left-color: #FF6B6B; }
+    .sidebar-item {
+        padding: 8px 12px;
+        border-radius: 4px;
+        cursor: pointer;
+        margin: 2px 0;
+    }
+    .sidebar-item:hover { background: #e8f4fd; }
+    .status-bar {
+        background: #f0f0f0;
+        padding: 4px 12px;
+        font-size: 12px;
+        color: #666;
+        border-top: 1px solid #d0d0d0;
+    }
+    </style>
+    """, unsafe_allow_html=True)
+    
+    NOTE_CATEGORIES = {
+        "lecture": {"icon": "menu_book", "label": "Lecture Notes", "color": "#4A90D9"},
+        "exercise": {"icon": "edit", "label": "Exercise Notes", "color": "#50C878"},
+        "exam": {"icon": "assignment", "label": "Exam Prep", "color": "#FF6B6B"},
+        "tips": {"icon": "lightbulb", "label": "Tips & Tricks", "color": "#FFD700"},
+        "summary": {"icon": "description", "label": "Summary", "color": "#9B59B6"}
+    }
+    
+    IMPORTANCE_LEVELS = {
+        "normal": {"icon": "circle", "label": "Normal", "color": "#888"},
+        "important": {"icon": "star", "label": "Important", "color": "#FFD700"},
+        "critical": {"icon": "local_fire_department", "label": "Exam Critical", "color": "#FF6B6B"}
+    }
+    
+    def render_mui_icon(icon_name, size=20):
+        """Render Material Icon as HTML"""
+        return f'<span class="material-icons md-{size}" style="vertical-align: middle; font-size: {size}px;">{icon_name}</span>'
+    
+    QUICK_INSERTS = {
+        "heading": "## ",
+        "subheading": "### ",
+        "bullet": "- ",
+        "numbered": "1. ",
+        "bold": "**text**",
+        "italic": "*text*",
+        "table": "| Col1 | Col2 | Col3 |\n|------|------|------|\n| | | |",
+        "checklist": "- [ ] Task item",
+        "quote": "> Quote text",
+        "code": "```\ncode here\n```",
+        "divider": "\n---\n",
+        "link": "[text](url)"
+    }
+    
+    NOTE_TEMPLATES = {
+        "blank": {"name": "Blank Document", "icon": "description", "content": ""},
+        "concept": {"name": "Concept Summary", "icon": "lightbulb", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #4A90D9; padding-bottom: 12px;">Konsept: [Konseptnavn]</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #4A90D9; padding-left: 12px; margin-top: 30px;">📖 Definisjon</h2>
+<blockquote style="border-left: 4px solid #4A90D9; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50;">Hva er det?</strong> [Klar og konsis definisjon av konseptet]</p>
+<p><strong style="color: #2c3e50;">Hvorfor er det viktig?</strong> [Forklar relevansen og betydningen]</p>
+</blockquote>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #28a745; padding-left: 12px; margin-top: 30px;">🎯 Hovedpoeng</h2>
+<ul style="line-height: 1.8;">
+<li><strong style="color: #2c3e50;">Poeng 1:</strong> [Detaljert forklaring av første hovedpoeng]
+    <ul>
+        <li><em style="color: #6c757d;">Detalj:</em> [Ytterligere informasjon]</li>
+    </ul>
+</li>
+<li><strong style="color: #2c3e50;">Poeng 2:</strong> [Detaljert forklaring av andre hovedpoeng]
+    <ul>
+        <li><em style="color: #6c757d;">Detalj:</em> [Ytterligere informasjon]</li>
+    </ul>
+</li>
+<li><strong style="color: #2c3e50;">Poeng 3:</strong> [Detaljert forklaring av tredje hovedpoeng]
+    <ul>
+        <li><em style="color: #6c757d;">Detalj:</em> [Ytterligere informasjon]</li>
+    </ul>
+</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #ffc107; padding-left: 12px; margin-top: 30px;">💡 Eksempler</h2>
+<ol style="line-height: 1.8;">
+<li><strong style="color: #2c3e50;">Eksempel 1:</strong> [Konkret eksempel]
+    <ul>
+        <li><em style="color: #6c757d;">Situasjon:</em> [Når dette gjelder]</li>
+        <li><em style="color: #6c757d;">Anvendelse:</em> [Hvordan det brukes]</li>
+    </ul>
+</li>
+<li><strong style="color: #2c3e50;">Eksempel 2:</strong> [Konkret eksempel]
+    <ul>
+        <li><em style="color: #6c757d;">Situasjon:</em> [Når dette gjelder]</li>
+        <li><em style="color: #6c757d;">Anvendelse:</em> [Hvordan det brukes]</li>
+    </ul>
+</li>
+<li><strong style="color: #2c3e50;">Eksempel 3:</strong> [Konkret eksempel]
+    <ul>
+        <li><em style="color: #6c757d;">Situasjon:</em> [Når dette gjelder]</li>
+        <li><em style="color: #6c757d;">Anvendelse:</em> [Hvordan det brukes]</li>
+    </ul>
+</li>
+</ol>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #dc3545; padding-left: 12px; margin-top: 30px;">⚠️ Vanlige Feil</h2>
+<ul style="line-height: 1.8;">
+<li><strong style="color: #dc3545;">Feil 1:</strong> [Beskriv feilen]
+    <ul>
+        <li><em style="color: #6c757d;">Hvorfor skjer det:</em> [Årsak]</li>
+        <li><em style="color: #28a745;">Hvordan unngå:</em> [Løsning]</li>
+    </ul>
+</li>
+<li><strong style="color: #dc3545;">Feil 2:</strong> [Beskriv feilen]
+    <ul>
+        <li><em style="color: #6c757d;">Hvorfor skjer det:</em> [Årsak]</li>
+        <li><em style="color: #28a745;">Hvordan unngå:</em> [Løsning]</li>
+    </ul>
+</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #17a2b8; padding-left: 12px; margin-top: 30px;">🔗 Relaterte Konsepter</h2>
+<ul style="line-height: 1.8;">
+<li><strong style="color: #2c3e50;">[Relatert konsept 1]:</strong> [Beskriv sammenhengen og hvordan de henger sammen]</li>
+<li><strong style="color: #2c3e50;">[Relatert konsept 2]:</strong> [Beskriv sammenhengen og hvordan de henger sammen]</li>
+<li><strong style="color: #2c3e50;">[Relatert konsept 3]:</strong> [Beskriv sammenhengen og hvordan de henger sammen]</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #6f42c1; padding-left: 12px; margin-top: 30px;">📊 Praktisk Anvendelse</h2>
+<blockquote style="border-left: 4px solid #6f42c1; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50;">Når bruker man dette konseptet?</strong></p>
+<ul style="margin-top: 10px;">
+<li style="color: #28a745;">✓ [Situasjon 1]</li>
+<li style="color: #28a745;">✓ [Situasjon 2]</li>
+<li style="color: #28a745;">✓ [Situasjon 3]</li>
+</ul>
+</blockquote>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #6c757d; padding-left: 12px; margin-top: 30px;">📝 Notater</h2>
+<blockquote style="border-left: 4px solid #6c757d; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><em style="color: #6c757d;">[Ekstra notater, observasjoner, eller viktige påminnelser om dette konseptet]</em></p>
+</blockquote>
+
+<h2>🔗 Ressurser</h2>
+<ul>
+<li>[Lenke til relevant materiale]</li>
+<li>[Lenke til relevant materiale]</li>
+</ul>"""},
+        "case_study": {"name": "Case Study", "icon": "bar_chart", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #4A90D9; padding-bottom: 12px;">Case Study: [Prosjekt/Klientnavn]</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #4A90D9; padding-left: 12px; margin-top: 30px;">📋 Executive Summary</h2>
+<blockquote style="border-left: 4px solid #4A90D9; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><em style="color: #6c757d;">Kort oversikt over case study, mål og nøkkelresultater (2-3 setninger).</em></p>
+</blockquote>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #17a2b8; padding-left: 12px; margin-top: 30px;">🏢 Bakgrunn & Kontekst</h2>
+<ul style="line-height: 1.8;">
+<li><strong style="color: #2c3e50;">Organisasjon:</strong> [Bedrift/avdeling]</li>
+<li><strong style="color: #2c3e50;">Bransje:</strong> [Bransjesektor]</li>
+<li><strong style="color: #2c3e50;">Kontekst:</strong> [Forretningssituasjon eller utfordring]</li>
+<li><strong style="color: #2c3e50;">Tidsramme:</strong> [Prosjektvarighet eller tidsperiode]</li>
+<li><strong style="color: #2c3e50;">Stakeholders:</strong> [Hvem er involvert?]</li>
+</ul>
+
+<h2>❓ Problemstilling</h2>
+<p><strong>Primær Utfordring:</strong> [Hovedproblemet som må løses]</p>
+<p><strong>Påvirkning:</strong> [Hvorfor dette problemet betyr noe - forretningspåvirkning, kostnader, etc.]</p>
+<p><strong>Suksesskriterier:</strong> [Hvordan vi måler suksess]</p>
+<p><strong>Begrensninger:</strong> [Hvilke begrensninger finnes?]</p>
+
+<h2>📊 Tilgjengelig Data</h2>
+<ul>
+<li><strong>Datakilde 1:</strong> [Beskrivelse, størrelse, kvalitet]</li>
+<li><strong>Datakilde 2:</strong> [Beskrivelse, størrelse, kvalitet]</li>
+<li><strong>Datakilde 3:</strong> [Beskrivelse, størrelse, kvalitet]</li>
+</ul>
+<p><strong>Datakvalitet:</strong> [Eventuelle begrensninger, manglende verdier, eller datakvalitetsproblemer]</p>
+
+<h2>🔍 Analyse Tilnærming</h2>
+<ol>
+<li><strong>Fase 1 - [Fasnavn]:</strong> [Beskrivelse av analyse-steg]
+    <ul>
+        <li><em>Metode:</em> [Hvilken metode ble brukt?]</li>
+        <li><em>Resultat:</em> [Hva ble funnet?]</li>
+    </ul>
+</li>
+<li><strong>Fase 2 - [Fasnavn]:</strong> [Beskrivelse av analyse-steg]
+    <ul>
+        <li><em>Metode:</em> [Hvilken metode ble brukt?]</li>
+        <li><em>Resultat:</em> [Hva ble funnet?]</li>
+    </ul>
+</li>
+<li><strong>Fase 3 - [Fasnavn]:</strong> [Beskrivelse av analyse-steg]
+    <ul>
+        <li><em>Metode:</em> [Hvilken metode ble brukt?]</li>
+        <li><em>Resultat:</em> [Hva ble funnet?]</li>
+    </ul>
+</li>
+</ol>
+
+<h2>💎 Nøkkelfunn</h2>
+<ul>
+<li><strong>Funn 1:</strong> [Nøkkelinnsikt med støttende data]
+    <ul>
+        <li><em>Bevis:</em> [Kvantitativ eller kvalitativ støtte]</li>
+    </ul>
+</li>
+<li><strong>Funn 2:</strong> [Nøkkelinnsikt med støttende data]
+    <ul>
+        <li><em>Bevis:</em> [Kvantitativ eller kvalitativ støtte]</li>
+    </ul>
+</li>
+<li><strong>Funn 3:</strong> [Nøkkelinnsikt med støttende data]
+    <ul>
+        <li><em>Bevis:</em> [Kvantitativ eller kvalitativ støtte]</li>
+    </ul>
+</li>
+</ul>
+<p><strong>Kvantitative Resultater:</strong> [Hvis relevant, legg inn tall og mål]</p>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #ffc107; padding-left: 12px; margin-top: 30px;">💼 Anbefalinger</h2>
+<ol style="line-height: 1.8;">
+<li><strong style="color: #2c3e50;">Anbefaling 1:</strong> [Handlingspunkt med forventet påvirkning]
+    <ul>
+        <li><em style="color: #6c757d;">Prioritet:</em> [Høy/Middels/Lav]</li>
+        <li><em style="color: #6c757d;">Forventet Effekt:</em> [Hva forventer vi å oppnå?]</li>
+    </ul>
+</li>
+<li><strong style="color: #2c3e50;">Anbefaling 2:</strong> [Handlingspunkt med forventet påvirkning]
+    <ul>
+        <li><em style="color: #6c757d;">Prioritet:</em> [Høy/Middels/Lav]</li>
+        <li><em style="color: #6c757d;">Forventet Effekt:</em> [Hva forventer vi å oppnå?]</li>
+    </ul>
+</li>
+<li><strong style="color: #2c3e50;">Anbefaling 3:</strong> [Handlingspunkt med forventet påvirkning]
+    <ul>
+        <li><em style="color: #6c757d;">Prioritet:</em> [Høy/Middels/Lav]</li>
+        <li><em style="color: #6c757d;">Forventet Effekt:</em> [Hva forventer vi å oppnå?]</li>
+    </ul>
+</li>
+</ol>
+
+<h2>📚 Lærdommer</h2>
+<ul>
+<li><strong>Hva Fungerte Bra:</strong> [Suksessfulle tilnærminger eller teknikker]</li>
+<li><strong>Hva Kunne Forbedres:</strong> [Områder for fremtidig forbedring]</li>
+<li><strong>Nøkkel Læring:</strong> [Hovedlæring fra denne case study]</li>
+</ul>
+
+<h2>🔗 Relaterte Ressurser</h2>
+<ul>
+<li>[Lenke eller referanse til relaterte materialer]</li>
+<li>[Lenke eller referanse til relaterte materialer]</li>
+</ul>"""},
+        "formula": {"name": "Formula Sheet", "icon": "functions", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #4A90D9; padding-bottom: 12px;">Formel Referanse: [Emne/Fag]</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #4A90D9; padding-left: 12px; margin-top: 30px;">📐 Grunnleggende Formler</h2>
+
+<h3 style="color: #2c3e50; margin-top: 25px;">Formel 1: [Formelnavn]</h3>
+<blockquote style="border-left: 4px solid #4A90D9; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50;">Formel:</strong> <code style="background: #ffffff; padding: 4px 8px; border-radius: 4px; color: #e83e8c; font-size: 1.1em; border: 1px solid #dee2e6;">[Skriv formelen her, f.eks. E = mc²]</code></p>
+<p><strong style="color: #2c3e50;">Beskrivelse:</strong> [Hva beregner eller representerer denne formelen?]</p>
+<p><strong style="color: #2c3e50;">Når Brukes Den:</strong> [Situasjoner hvor denne formelen gjelder]</p>
+<p><strong style="color: #2c3e50;">Enheter:</strong> [Inngangs- og utgangsenheter]</p>
+<p><strong style="color: #2c3e50;">Eksempel:</strong> [Kort eksempel på bruk]</p>
+</blockquote>
+
+<h3 style="color: #2c3e50; margin-top: 25px;">Formel 2: [Formelnavn]</h3>
+<blockquote style="border-left: 4px solid #4A90D9; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50;">Formel:</strong> <code style="background: #ffffff; padding: 4px 8px; border-radius: 4px; color: #e83e8c; font-size: 1.1em; border: 1px solid #dee2e6;">[Skriv formelen her]</code></p>
+<p><strong style="color: #2c3e50;">Beskrivelse:</strong> [Hva beregner eller representerer denne formelen?]</p>
+<p><strong style="color: #2c3e50;">Når Brukes Den:</strong> [Situasjoner hvor denne formelen gjelder]</p>
+<p><strong style="color: #2c3e50;">Enheter:</strong> [Inngangs- og utgangsenheter]</p>
+<p><strong style="color: #2c3e50;">Eksempel:</strong> [Kort eksempel på bruk]</p>
+</blockquote>
+
+<h3 style="color: #2c3e50; margin-top: 25px;">Formel 3: [Formelnavn]</h3>
+<blockquote style="border-left: 4px solid #4A90D9; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50;">Formel:</strong> <code style="background: #ffffff; padding: 4px 8px; border-radius: 4px; color: #e83e8c; font-size: 1.1em; border: 1px solid #dee2e6;">[Skriv formelen her]</code></p>
+<p><strong style="color: #2c3e50;">Beskrivelse:</strong> [Hva beregner eller representerer denne formelen?]</p>
+<p><strong style="color: #2c3e50;">Når Brukes Den:</strong> [Situasjoner hvor denne formelen gjelder]</p>
+<p><strong style="color: #2c3e50;">Enheter:</strong> [Inngangs- og utgangsenheter]</p>
+<p><strong style="color: #2c3e50;">Eksempel:</strong> [Kort eksempel på bruk]</p>
+</blockquote>
+
+<h2>🔤 Nøkkelvariabler & Symboler</h2>
+<ul>
+<li><strong>Variabel 1 (symbol):</strong> [Definisjon og typisk område/verdier]
+    <ul>
+        <li><em>Enhet:</em> [Enhet for variabelen]</li>
+        <li><em>Typisk Verdi:</em> [Vanlig verdiområde]</li>
+    </ul>
+</li>
+<li><strong>Variabel 2 (symbol):</strong> [Definisjon og typisk område/verdier]
+    <ul>
+        <li><em>Enhet:</em> [Enhet for variabelen]</li>
+        <li><em>Typisk Verdi:</em> [Vanlig verdiområde]</li>
+    </ul>
+</li>
+<li><strong>Variabel 3 (symbol):</strong> [Definisjon og typisk område/verdier]
+    <ul>
+        <li><em>Enhet:</em> [Enhet for variabelen]</li>
+        <li><em>Typisk Verdi:</em> [Vanlig verdiområde]</li>
+    </ul>
+</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #28a745; padding-left: 12px; margin-top: 30px;">📝 Arbeidet Eksempel</h2>
+<blockquote style="border-left: 4px solid #28a745; background: #f0fff4; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50;">Problem:</strong> [Beskriv et eksempelproblem som skal løses]</p>
+<p><strong style="color: #2c3e50;">Gitt:</strong></p>
+<ul style="line-height: 1.8;">
+<li>Variabel 1 = [verdi] [enhet]</li>
+<li>Variabel 2 = [verdi] [enhet]</li>
+<li>Variabel 3 = [verdi] [enhet]</li>
+</ul>
+</blockquote>
+<p><strong style="color: #28a745;">Løsning:</strong></p>
+<ol style="line-height: 1.8;">
+<li><strong style="color: #2c3e50;">Steg 1:</strong> [Første beregning eller manipulasjon]
+    <ul>
+        <li><em style="color: #6c757d;">Beregning:</em> [Vis beregningen]</li>
+    </ul>
+</li>
+<li><strong style="color: #2c3e50;">Steg 2:</strong> [Andre beregning eller manipulasjon]
+    <ul>
+        <li><em style="color: #6c757d;">Beregning:</em> [Vis beregningen]</li>
+    </ul>
+</li>
+<li><strong style="color: #2c3e50;">Steg 3:</strong> [Siste beregning]
+    <ul>
+        <li><em style="color: #6c757d;">Beregning:</em> [Vis beregningen]</li>
+    </ul>
+</li>
+</ol>
+<blockquote style="border-left: 4px solid #28a745; background: #f0fff4; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #28a745; font-size: 1.1em;">Svar:</strong> [Sluttresultat med enheter]</p>
+</blockquote>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #ffc107; padding-left: 12px; margin-top: 30px;">💡 Rask Referanse</h2>
+<blockquote style="border-left: 4px solid #ffc107; background: #fffbf0; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<ul style="line-height: 1.8;">
+<li><strong style="color: #ffc107;">Husk:</strong> [Viktig tips eller huskeregel]</li>
+<li><strong style="color: #dc3545;">Vanlig Feil:</strong> [Hva man skal unngå når man bruker disse formlene]</li>
+<li><strong style="color: #17a2b8;">Pro Tips:</strong> [Hjelpsomt hint for anvendelse]</li>
+<li><strong style="color: #2c3e50;">Når Skal Man Bruke:</strong> [Situasjoner hvor disse formlene er mest relevante]</li>
+</ul>
+</blockquote>
+
+<h2>🔗 Relaterte Formler</h2>
+<ul>
+<li><strong>[Relatert formel eller konsept]:</strong> [Beskriv sammenhengen]</li>
+<li><strong>[Relatert formel eller konsept]:</strong> [Beskriv sammenhengen]</li>
+</ul>"""},
+        "comparison": {"name": "Comparison Chart", "icon": "compare_arrows", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #4A90D9; padding-bottom: 12px;">Sammenligning: [Emne A] vs [Emne B]</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #4A90D9; padding-left: 12px; margin-top: 30px;">📊 Oversikt</h2>
+<blockquote style="border-left: 4px solid #4A90D9; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><em style="color: #6c757d;">Kort introduksjon til hva som sammenlignes og hvorfor denne sammenligningen er viktig.</em></p>
+</blockquote>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #007bff; padding-left: 12px; margin-top: 30px;">🔵 [Emne A]</h2>
+<blockquote style="border-left: 4px solid #007bff; background: #f0f7ff; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50;">Definisjon:</strong> [Tydelig definisjon av emne A]</p>
+<p><strong style="color: #2c3e50;">Primær Bruksområde:</strong> [Når og hvorfor bruker man emne A?]</p>
+</blockquote>
+<p><strong style="color: #28a745;">Fordeler:</strong></p>
+<ul style="line-height: 1.8;">
+<li style="color: #28a745;">✅ <strong>Fordel 1:</strong> [Forklaring og hvorfor det er en fordel]</li>
+<li style="color: #28a745;">✅ <strong>Fordel 2:</strong> [Forklaring og hvorfor det er en fordel]</li>
+<li style="color: #28a745;">✅ <strong>Fordel 3:</strong> [Forklaring og hvorfor det er en fordel]</li>
+</ul>
+<p><strong style="color: #dc3545;">Ulemper:</strong></p>
+<ul style="line-height: 1.8;">
+<li style="color: #dc3545;">❌ <strong>Ulempe 1:</strong> [Forklaring og konsekvenser]</li>
+<li style="color: #dc3545;">❌ <strong>Ulempe 2:</strong> [Forklaring og konsekvenser]</li>
+</ul>
+<p><strong>Best For:</strong> [Spesifikke scenarioer eller bruksområder]</p>
+<p><strong>Eksempel:</strong> [Virkelig verden eksempel eller anvendelse]</p>
+<p><strong>Kostnad/Kompleksitet:</strong> [Vurdering av kostnad eller kompleksitet]</p>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #28a745; padding-left: 12px; margin-top: 30px;">🟢 [Emne B]</h2>
+<blockquote style="border-left: 4px solid #28a745; background: #f0fff4; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50;">Definisjon:</strong> [Tydelig definisjon av emne B]</p>
+<p><strong style="color: #2c3e50;">Primær Bruksområde:</strong> [Når og hvorfor bruker man emne B?]</p>
+</blockquote>
+<p><strong style="color: #28a745;">Fordeler:</strong></p>
+<ul style="line-height: 1.8;">
+<li style="color: #28a745;">✅ <strong>Fordel 1:</strong> [Forklaring og hvorfor det er en fordel]</li>
+<li style="color: #28a745;">✅ <strong>Fordel 2:</strong> [Forklaring og hvorfor det er en fordel]</li>
+<li style="color: #28a745;">✅ <strong>Fordel 3:</strong> [Forklaring og hvorfor det er en fordel]</li>
+</ul>
+<p><strong style="color: #dc3545;">Ulemper:</strong></p>
+<ul style="line-height: 1.8;">
+<li style="color: #dc3545;">❌ <strong>Ulempe 1:</strong> [Forklaring og konsekvenser]</li>
+<li style="color: #dc3545;">❌ <strong>Ulempe 2:</strong> [Forklaring og konsekvenser]</li>
+</ul>
+<p><strong>Best For:</strong> [Spesifikke scenarioer eller bruksområder]</p>
+<p><strong>Eksempel:</strong> [Virkelig verden eksempel eller anvendelse]</p>
+<p><strong>Kostnad/Kompleksitet:</strong> [Vurdering av kostnad eller kompleksitet]</p>
+
+<h2>🎯 Beslutningsmatrise</h2>
+<p><strong>Velg [Emne A] når:</strong></p>
+<ul>
+<li>✓ <strong>Situasjon 1:</strong> [Beskrivelse av når emne A er best]</li>
+<li>✓ <strong>Situasjon 2:</strong> [Beskrivelse av når emne A er best]</li>
+<li>✓ <strong>Situasjon 3:</strong> [Beskrivelse av når emne A er best]</li>
+</ul>
+<p><strong>Velg [Emne B] når:</strong></p>
+<ul>
+<li>✓ <strong>Situasjon 1:</strong> [Beskrivelse av når emne B er best]</li>
+<li>✓ <strong>Situasjon 2:</strong> [Beskrivelse av når emne B er best]</li>
+<li>✓ <strong>Situasjon 3:</strong> [Beskrivelse av når emne B er best]</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #ffc107; padding-left: 12px; margin-top: 30px;">💡 Nøkkelinnsikt</h2>
+<blockquote style="border-left: 4px solid #ffc107; background: #fffbf0; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong style="color: #2c3e50; font-size: 1.1em;">Hovedkonklusjon:</strong> [Den viktigste konklusjonen fra denne sammenligningen]</p>
+<p><em style="color: #6c757d;">[Tilleggskontekst eller nyanser om når hvert alternativ er å foretrekke]</em></p>
+</blockquote>
+
+<h2>📝 Notater</h2>
+<p><em>Tilleggshensyn, edge cases, eller viktige påminnelser om denne sammenligningen.</em></p>"""},
+        "meeting": {"name": "Meeting Notes", "icon": "event_note", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #4A90D9; padding-bottom: 12px;">Møtenotater</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #4A90D9; padding-left: 12px; margin-top: 30px;">📅 Møteinformasjon</h2>
+<blockquote style="border-left: 4px solid #4A90D9; background: #f8f9fa; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<ul style="line-height: 1.8;">
+<li><strong style="color: #2c3e50;">Dato:</strong> [Dato]</li>
+<li><strong style="color: #2c3e50;">Tid:</strong> [Starttid] - [Sluttid]</li>
+<li><strong style="color: #2c3e50;">Sted/Plattform:</strong> [Fysisk sted eller virtuell plattform]</li>
+<li><strong style="color: #2c3e50;">Møtetype:</strong> [Regelmessig, Engangs, Prosjektgjennomgang, etc.]</li>
+</ul>
+</blockquote>
+
+<h2>👥 Deltakere</h2>
+<ul>
+<li><strong>Tilstede:</strong> [Navn 1], [Navn 2], [Navn 3]</li>
+<li><strong>Fraværende:</strong> [Navn 1], [Navn 2]</li>
+<li><strong>Fasilitator:</strong> [Navn]</li>
+</ul>
+
+<h2>🎯 Møtemål</h2>
+<ol>
+<li>[Mål 1]</li>
+<li>[Mål 2]</li>
+<li>[Mål 3]</li>
+</ol>
+
+<h2>📋 Agenda</h2>
+<ol>
+<li><strong>[Punkt 1]:</strong> [Beskrivelse]</li>
+<li><strong>[Punkt 2]:</strong> [Beskrivelse]</li>
+<li><strong>[Punkt 3]:</strong> [Beskrivelse]</li>
+</ol>
+
+<h2>💬 Nøkkel Diskusjonspunkter</h2>
+<ol>
+<li><strong>Tema 1:</strong> [Sammendrag av diskusjonspunkt]
+    <ul>
+        <li>Nøkkelpoeng nevnt</li>
+        <li>Beslutning eller konklusjon nådd</li>
+    </ul>
+</li>
+<li><strong>Tema 2:</strong> [Sammendrag av diskusjonspunkt]
+    <ul>
+        <li>Nøkkelpoeng nevnt</li>
+        <li>Beslutning eller konklusjon nådd</li>
+    </ul>
+</li>
+<li><strong>Tema 3:</strong> [Sammendrag av diskusjonspunkt]
+    <ul>
+        <li>Nøkkelpoeng nevnt</li>
+        <li>Beslutning eller konklusjon nådd</li>
+    </ul>
+</li>
+</ol>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #28a745; padding-left: 12px; margin-top: 30px;">✅ Beslutninger Tatt</h2>
+<blockquote style="border-left: 4px solid #28a745; background: #f0fff4; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<ul style="line-height: 1.8;">
+<li><strong style="color: #28a745;">Beslutning 1:</strong> [Hva ble bestemt] - <em style="color: #6c757d;">Begrunnelse: [Hvorfor]</em></li>
+<li><strong style="color: #28a745;">Beslutning 2:</strong> [Hva ble bestemt] - <em style="color: #6c757d;">Begrunnelse: [Hvorfor]</em></li>
+<li><strong style="color: #28a745;">Beslutning 3:</strong> [Hva ble bestemt] - <em style="color: #6c757d;">Begrunnelse: [Hvorfor]</em></li>
+</ul>
+</blockquote>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #ffc107; padding-left: 12px; margin-top: 30px;">📋 Handlingspunkter</h2>
+<ul style="line-height: 1.8;">
+<li>☐ <strong style="color: #2c3e50;">Oppgave 1:</strong> [Beskrivelse]
+    <ul>
+        <li><strong style="color: #6c757d;">Ansvarlig:</strong> [Navn]</li>
+        <li><strong style="color: #6c757d;">Forfallsdato:</strong> [Dato]</li>
+        <li><strong style="color: #6c757d;">Status:</strong> [Ikke Startet / Pågår / Fullført]</li>
+    </ul>
+</li>
+<li>☐ <strong style="color: #2c3e50;">Oppgave 2:</strong> [Beskrivelse]
+    <ul>
+        <li><strong style="color: #6c757d;">Ansvarlig:</strong> [Navn]</li>
+        <li><strong style="color: #6c757d;">Forfallsdato:</strong> [Dato]</li>
+        <li><strong style="color: #6c757d;">Status:</strong> [Ikke Startet / Pågår / Fullført]</li>
+    </ul>
+</li>
+<li>☐ <strong style="color: #2c3e50;">Oppgave 3:</strong> [Beskrivelse]
+    <ul>
+        <li><strong style="color: #6c757d;">Ansvarlig:</strong> [Navn]</li>
+        <li><strong style="color: #6c757d;">Forfallsdato:</strong> [Dato]</li>
+        <li><strong style="color: #6c757d;">Status:</strong> [Ikke Startet / Pågår / Fullført]</li>
+    </ul>
+</li>
+</ul>
+
+<h2>🚀 Neste Steg</h2>
+<ol>
+<li>[Umiddelbar neste handling]</li>
+<li>[Oppfølgingshandling]</li>
+<li>[Langtids handling]</li>
+</ol>
+
+<h2>📅 Oppfølging</h2>
+<ul>
+<li><strong>Neste Møte:</strong> [Dato og tid]</li>
+<li><strong>Agendapunkter:</strong> [Temaer å diskutere neste gang]</li>
+</ul>
+
+<h2>📎 Vedlegg & Ressurser</h2>
+<ul>
+<li>[Lenke til delt dokument eller ressurs]</li>
+<li>[Lenke til delt dokument eller ressurs]</li>
+</ul>"""},
+        "ddm_module_overview": {"name": "DDM: Module Overview", "icon": "insights", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #1565c0; padding-bottom: 12px;">DDM Module Overview</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #1565c0; padding-left: 12px; margin-top: 30px;">📘 Module Introduction</h2>
+<blockquote style="border-left: 4px solid #1565c0; background: #f4f8fc; padding: 15px 20px; margin: 15px 0; border-radius: 4px;">
+<p><strong>What is this module about?</strong> [Summarize the role of data in decision-making and why it matters for business success]</p>
+    <p><strong>Module goal:</strong> [Explain how data will be used to make informed decisions and respond proactively to predictions]</p>
+<p><strong>Why does it matter?</strong> [Explain the impact of using relevant data rather than intuition alone]</p>
+</blockquote>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #2e7d32; padding-left: 12px; margin-top: 30px;">🎯 Learning Outcomes Linked to This Note</h2>
+<ul style="line-height: 1.8;">
+<li>Knowledge of KPI, data types, and the data analysis lifecycle</li>
+<li>Knowledge of real-world use cases and decision-making criteria</li>
+<li>Ability to use data-driven techniques in practical scenarios</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #f9a825; padding-left: 12px; margin-top: 30px;">🧩 Core Concepts</h2>
+<ul style="line-height: 1.8;">
+<li><strong>Role of data:</strong> [How data supports decisions]</li>
+<li><strong>Prediction to action:</strong> [How forecasts or early signals should trigger proactive decisions]</li>
+<li><strong>Decision criteria:</strong> [What makes one option better than another]</li>
+<li><strong>Industry use case:</strong> [Which real-world scenario best shows the business impact]</li>
+<li><strong>Business impact:</strong> [Revenue, efficiency, quality, risk, customer experience]</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #6a1b9a; padding-left: 12px; margin-top: 30px;">📝 My Summary</h2>
+<p><em>[Write your own short explanation of what data-driven decision-making means]</em></p>
+"""},
+        "ddm_case_scenario": {"name": "DDM: Case Scenario Analysis", "icon": "analytics", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #00897b; padding-bottom: 12px;">DDM Case Scenario</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #00897b; padding-left: 12px; margin-top: 30px;">🏢 Scenario</h2>
+<p><strong>Business:</strong> [Example: online grocery delivery company]</p>
+<p><strong>Problem:</strong> [Describe the business issue]</p>
+<p><strong>Why it matters:</strong> [Customer impact, cost impact, operational impact]</p>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #3949ab; padding-left: 12px; margin-top: 30px;">📊 Available Data</h2>
+<ul>
+<li>KPI 1: [e.g. on-time delivery rate]</li>
+<li>KPI 2: [e.g. refund cost]</li>
+<li>Qualitative evidence: [complaints, interviews, comments]</li>
+<li>Quantitative evidence: [counts, percentages, trends]</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #f4511e; padding-left: 12px; margin-top: 30px;">🔄 Lifecycle Walkthrough</h2>
+<ol>
+<li><strong>Define:</strong> [What problem are we solving?]</li>
+<li><strong>Collect:</strong> [What data is needed?]</li>
+<li><strong>Clean:</strong> [What quality issues exist?]</li>
+<li><strong>Analyze:</strong> [What method is appropriate?]</li>
+<li><strong>Interpret:</strong> [What does the evidence mean?]</li>
+<li><strong>Act:</strong> [What should the business do next?]</li>
+</ol>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #7cb342; padding-left: 12px; margin-top: 30px;">✅ Recommendation</h2>
+<p><strong>Recommended action:</strong> [Best next step]</p>
+<p><strong>Expected impact:</strong> [What KPI should improve?]</p>
+"""},
+        "ddm_techniques": {"name": "DDM: Techniques and Criteria", "icon": "rule", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #6d4c41; padding-bottom: 12px;">Decision-Making Techniques</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #6d4c41; padding-left: 12px; margin-top: 30px;">🎯 Linked Learning Outcomes</h2>
+<ul>
+<li>Select appropriate data models for problem scenarios</li>
+<li>Apply data-driven decision-making to practical problems</li>
+<li>Use KPI-guided work methods in decision processes</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #5e35b1; padding-left: 12px; margin-top: 30px;">🧠 Heuristics</h2>
+<p><strong>Definition:</strong> [Fast rule of thumb]</p>
+<ul>
+<li>Example heuristic 1: [e.g. fix the highest-risk segment first]</li>
+<li>Example heuristic 2: [e.g. use the 80/20 rule]</li>
+<li>Business value: [Why this is useful for fast decisions]</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #1e88e5; padding-left: 12px; margin-top: 30px;">⚙️ Algorithms</h2>
+<p><strong>Definition:</strong> [Step-by-step decision procedure]</p>
+<ul>
+<li>Algorithm example: [e.g. demand forecast or route assignment]</li>
+<li>Inputs needed: [What data is required?]</li>
+<li>Decision relevance: [How it improves consistency or scale]</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #43a047; padding-left: 12px; margin-top: 30px;">📈 Optimization Techniques</h2>
+<p><strong>Objective:</strong> [What should be minimized or maximized?]</p>
+<ul>
+<li>Optimization goal 1: [e.g. minimize late deliveries]</li>
+<li>Optimization goal 2: [e.g. maximize service level]</li>
+<li>Constraints: [staff, time, cost, capacity]</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #fb8c00; padding-left: 12px; margin-top: 30px;">📋 Decision Criteria</h2>
+<ul>
+<li>Which KPI matters most?</li>
+<li>What trade-offs exist?</li>
+<li>Which criterion best supports acting on forecasts or predictions?</li>
+<li>What is realistic to implement?</li>
+<li>How will success be measured afterward?</li>
+</ul>
+"""},
+        "ddm_outcome_tracker": {"name": "DDM: Learning Outcome Tracker", "icon": "fact_check", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #c62828; padding-bottom: 12px;">DDM Learning Outcome Tracker</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #c62828; padding-left: 12px; margin-top: 30px;">📖 Knowledge</h2>
+<ul>
+<li>☐ Data structure models and suitable scenarios</li>
+<li>☐ Data cleaning with proxy real-world data</li>
+<li>☐ Real-world use cases and business impact</li>
+<li>☐ KPI, qualitative vs quantitative data, and lifecycle</li>
+<li>☐ Descriptive, diagnostic, predictive, prescriptive, and error correction</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #1565c0; padding-left: 12px; margin-top: 30px;">🛠️ Skills</h2>
+<ul>
+<li>☐ Apply DDM to practical problems such as market price prediction</li>
+<li>☐ Select appropriate data models for scenarios</li>
+<li>☐ Apply the data lifecycle and analyze KPIs</li>
+<li>☐ Identify, eliminate, and correct erroneous data</li>
+<li>☐ Transfer theoretical models into proxy real-world situations</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #2e7d32; padding-left: 12px; margin-top: 30px;">💡 Competence</h2>
+<ul>
+<li>☐ Understand data fidelity and ownership</li>
+<li>☐ Develop KPI-guided work methods</li>
+<li>☐ Judge whether a model is accurate for its intended use</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #6a1b9a; padding-left: 12px; margin-top: 30px;">📝 Reflection</h2>
+<p><strong>What do I understand well?</strong> [Write here]</p>
+<p><strong>What needs more practice?</strong> [Write here]</p>
+<p><strong>Which outcome will I focus on next?</strong> [Write here]</p>
+"""},
+    "ddm_decision_matrix": {"name": "DDM: Decision Criteria Matrix", "icon": "table_chart", "content": """<h1 style="color: #1a1a1a; border-bottom: 3px solid #37474f; padding-bottom: 12px;">DDM Decision Criteria Matrix</h1>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #37474f; padding-left: 12px; margin-top: 30px;">🏢 Scenario</h2>
+<p><strong>Business problem:</strong> [Describe the decision problem]</p>
+<p><strong>Alternatives:</strong> [List the actions being compared]</p>
+<p><strong>States of nature:</strong> [List uncertain future conditions]</p>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #5c6bc0; padding-left: 12px; margin-top: 30px;">📊 Payoff Matrix</h2>
+<table>
+<tr><th>Alternative</th><th>State 1</th><th>State 2</th><th>State 3</th></tr>
+<tr><td>[Option A]</td><td>[Payoff]</td><td>[Payoff]</td><td>[Payoff]</td></tr>
+<tr><td>[Option B]</td><td>[Payoff]</td><td>[Payoff]</td><td>[Payoff]</td></tr>
+<tr><td>[Option C]</td><td>[Payoff]</td><td>[Payoff]</td><td>[Payoff]</td></tr>
+</table>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #2e7d32; padding-left: 12px; margin-top: 30px;">📋 Criteria Results</h2>
+<ul>
+<li><strong>Maximax:</strong> [Best option and why]</li>
+<li><strong>Maximin:</strong> [Best option and why]</li>
+<li><strong>Hurwicz:</strong> [Best option, alpha, and why]</li>
+<li><strong>Minimax regret:</strong> [Best option and why]</li>
+<li><strong>Laplace average payoff:</strong> [Best option and why]</li>
+<li><strong>Expected payoff:</strong> [Best option and why]</li>
+<li><strong>Expected loss of opportunity:</strong> [Best option and why]</li>
+</ul>
+
+<h2 style="color: #2c3e50; border-left: 4px solid #f9a825; padding-left: 12px; margin-top: 30px;">💡 Interpretation</h2>
+<p><strong>Which criterion fits this business best?</strong> [Explain based on risk attitude, uncertainty, and available probabilities]</p>
+<p><strong>Final recommendation:</strong> [Write your final decision and why]</p>
+"""},
+        "exam_prep": {"name": "Exam Prep", "icon": "quiz", "content": """<h1>Eksamen Forberedelse: [Fag/Kursnavn]</h1>
+
+<h2>📚 Eksamen Informasjon</h2>
+<ul>
+<li><strong>Fag:</strong> [Kurs/Fagnavn]</li>
+<li><strong>Eksamen Dato:</strong> [Dato]</li>
+<li><strong>Eksamen Tid:</strong> [Tidspunkt]</li>
+<li><strong>Varighet:</strong> [Lengde på eksamen]</li>
+<li><strong>Format:</strong> [Flervalg, Essay, Praktisk, etc.]</li>
+<li><strong>Vekt:</strong> [Prosent av sluttkarakter]</li>
+</ul>
+
+<h2>✅ Nøkkelemner å Gjennomgå</h2>
+<ul>
+<li>☐ <strong>Emne 1:</strong> [Kort beskrivelse] - <em>Prioritet: Høy/Middels/Lav</em>
+    <ul>
+        <li><em>Fokus:</em> [Hva spesifikt skal gjennomgås?]</li>
+    </ul>
+</li>
+<li>☐ <strong>Emne 2:</strong> [Kort beskrivelse] - <em>Prioritet: Høy/Middels/Lav</em>
+    <ul>
+        <li><em>Fokus:</em> [Hva spesifikt skal gjennomgås?]</li>
+    </ul>
+</li>
+<li>☐ <strong>Emne 3:</strong> [Kort beskrivelse] - <em>Prioritet: Høy/Middels/Lav</em>
+    <ul>
+        <li><em>Fokus:</em> [Hva spesifikt skal gjennomgås?]</li>
+    </ul>
+</li>
+<li>☐ <strong>Emne 4:</strong> [Kort beskrivelse] - <em>Prioritet: Høy/Middels/Lav</em>
+    <ul>
+        <li><em>Fokus:</em> [Hva spesifikt skal gjennomgås?]</li>
+    </ul>
+</li>
+<li>☐ <strong>Emne 5:</strong> [Kort beskrivelse] - <em>Prioritet: Høy/Middels/Lav</em>
+    <ul>
+        <li><em>Fokus:</em> [Hva spesifikt skal gjennomgås?]</li>
+    </ul>
+</li>
+</ul>
+
+<h2>📖 Viktige Definisjoner</h2>
+<ul>
+<li><strong>Term 1:</strong> [Tydelig, konsis definisjon]
+    <ul>
+        <li><em>Eksempel:</em> [Eksempel på bruk eller kontekst]</li>
+    </ul>
+</li>
+<li><strong>Term 2:</strong> [Tydelig, konsis definisjon]
+    <ul>
+        <li><em>Eksempel:</em> [Eksempel på bruk eller kontekst]</li>
+    </ul>
+</li>
+<li><strong>Term 3:</strong> [Tydelig, konsis definisjon]
+    <ul>
+        <li><em>Eksempel:</em> [Eksempel på bruk eller kontekst]</li>
+    </ul>
+</li>
+<li><strong>Term 4:</strong> [Tydelig, konsis definisjon]
+    <ul>
+        <li><em>Eksempel:</em> [Eksempel på bruk eller kontekst]</li>
+    </ul>
+</li>
+</ul>
+
+<h2>🧮 Formler å Pugge</h2>
+<ul>
+<li><strong>Formel 1:</strong> <code>[Formel]</code> - <em>Bruksområde: [Når brukes den?]</em></li>
+<li><strong>Formel 2:</strong> <code>[Formel]</code> - <em>Bruksområde: [Når brukes den?]</em></li>
+<li><strong>Formel 3:</strong> <code>[Formel]</code> - <em>Bruksområde: [Når brukes den?]</em></li>
+</ul>
+
+<h2>❓ Øvingsspørsmål</h2>
+<ol>
+<li><strong>Spørsmål 1:</strong> [Spørsmålstekst]
+    <ul>
+        <li><em>Svar:</em> [Ditt svar]</li>
+        <li><em>Nøkkelpoeng:</em> [Viktige konsepter dette spørsmålet tester]</li>
+        <li><em>Læring:</em> [Hva lærte du fra dette spørsmålet?]</li>
+    </ul>
+</li>
+<li><strong>Spørsmål 2:</strong> [Spørsmålstekst]
+    <ul>
+        <li><em>Svar:</em> [Ditt svar]</li>
+        <li><em>Nøkkelpoeng:</em> [Viktige konsepter dette spørsmålet tester]</li>
+        <li><em>Læring:</em> [Hva lærte du fra dette spørsmålet?]</li>
+    </ul>
+</li>
+<li><strong>Spørsmål 3:</strong> [Spørsmålstekst]
+    <ul>
+        <li><em>Svar:</em> [Ditt svar]</li>
+        <li><em>Nøkkelpoeng:</em> [Viktige konsepter dette spørsmålet tester]</li>
+        <li><em>Læring:</em> [Hva lærte du fra dette spørsmålet?]</li>
+    </ul>
+</li>
+<li><strong>Spørsmål 4:</strong> [Spørsmålstekst]
+    <ul>
+        <li><em>Svar:</em> [Ditt svar]</li>
+        <li><em>Nøkkelpoeng:</em> [Viktige konsepter dette spørsmålet tester]</li>
+        <li><em>Læring:</em> [Hva lærte du fra dette spørsmålet?]</li>
+    </ul>
+</li>
+</ol>
+
+<h2>🧠 Rask Hukommelseshjelp</h2>
+<ul>
+<li><strong>Huskeregel 1:</strong> [Huskeregel eller akronym] - <em>For: [Hva det hjelper å huske]</em></li>
+<li><strong>Huskeregel 2:</strong> [Huskeregel eller akronym] - <em>For: [Hva det hjelper å huske]</em></li>
+<li><strong>Huskeregel 3:</strong> [Huskeregel eller akronym] - <em>For: [Hva det hjelper å huske]</em></li>
+</ul>
+<blockquote>
+<p><strong>Viktig Påminnelse:</strong> [Viktig konsept eller regel å huske]</p>
+</blockquote>
+
+<h2>⚠️ Vanlige Eksamenfeil</h2>
+<ul>
+<li><strong>Feil 1:</strong> [Beskrivelse av vanlig feil]
+    <ul>
+        <li><em>Hvorfor skjer det:</em> [Årsak]</li>
+        <li><em>Hvordan unngå:</em> [Forebyggingsstrategi]</li>
+    </ul>
+</li>
+<li><strong>Feil 2:</strong> [Beskrivelse av vanlig feil]
+    <ul>
+        <li><em>Hvorfor skjer det:</em> [Årsak]</li>
+        <li><em>Hvordan unngå:</em> [Forebyggingsstrategi]</li>
+    </ul>
+</li>
+<li><strong>Feil 3:</strong> [Beskrivelse av vanlig feil]
+    <ul>
+        <li><em>Hvorfor skjer det:</em> [Årsak]</li>
+        <li><em>Hvordan unngå:</em> [Forebyggingsstrategi]</li>
+    </ul>
+</li>
+</ul>
+
+<h2>📝 Studieplan</h2>
+<ul>
+<li><strong>Uke 1:</strong> [Emner å dekke]
+    <ul>
+        <li><em>Fokus:</em> [Hva skal fokuseres på denne uken?]</li>
+    </ul>
+</li>
+<li><strong>Uke 2:</strong> [Emner å dekke]
+    <ul>
+        <li><em>Fokus:</em> [Hva skal fokuseres på denne uken?]</li>
+    </ul>
+</li>
+<li><strong>Uke 3:</strong> [Gjennomgang og praksis]
+    <ul>
+        <li><em>Fokus:</em> [Hva skal fokuseres på denne uken?]</li>
+    </ul>
+</li>
+</ul>
+
+<h2>✅ Studie Sjekkliste</h2>
+<ul>
+<li>☐ Gjennomgått alle hovedtemaer</li>
+<li>☐ Løst øvingsoppgaver</li>
+<li>☐ Gjennomgått formler og definisjoner</li>
+<li>☐ Gjennomgått tidligere eksamener</li>
+<li>☐ Fullført selvtester</li>
+<li>☐ Gjennomgått vanlige feil</li>
+</ul>
+
+<h2>📊 Selvtest</h2>
+<ul>
+<li>☐ [Selvtest 1: Beskriv hva du skal teste deg selv på]</li>
+<li>☐ [Selvtest 2: Beskriv hva du skal teste deg selv på]</li>
+<li>☐ [Selvtest 3: Beskriv hva du skal teste deg selv på]</li>
+</ul>
+
+<h2>🔗 Ressurser</h2>
+<ul>
+<li><strong>Lærebok:</strong> [Lenke til lærebok kapittel eller seksjon]</li>
+<li><strong>Øvingsproblemer:</strong> [Lenke til praksisproblemer]</li>
+<li><strong>Forelesningsnotater:</strong> [Lenke til forelesningsnotater eller slides]</li>
+<li><strong>Videoer:</strong> [Lenke til relevante videoer]</li>
+</ul>"""}
+    }
+    
+    course_options = {f"{c['code']} - {c['name']}": c['code'] for c in courses_data}
+    
+    if 'current_note_content' not in st.session_state:
+        st.session_state.current_note_content = ""
+    if 'word_view_mode' not in st.session_state:
+        st.session_state.word_view_mode = "edit"
+    
+    header_col1, header_col2 = st.columns([3, 1])
+    with header_col1:
+        st.markdown(f"## {render_mui_icon('note', 28)} Study Notes", unsafe_allow_html=True)
+    with header_col2:
+        view_mode = st.radio("View:", ["Edit", "Preview", "Split"], horizontal=True, key="word_view", label_visibility="collapsed")
+    
+    menu_col1, menu_col2, menu_col3, menu_col4, menu_col5 = st.columns([1, 1, 1, 1, 1])
+    with menu_col1:
+        st.markdown(render_mui_icon('note_add', 18), unsafe_allow_html=True)
+        if st.button("New", key="word_new", use_container_width=True, help="Create new note"):
+            st.session_state.current_note_content = ""
+            st.session_state.pop('editing_note_idx', None)
+            st.session_state.pop('current_note_title', None)
+            st.session_state.pop('current_note_category', None)
+            st.session_state.pop('current_note_importance', None)
+            st.session_state.pop('current_note_tags', None)
+            st.session_state.pop('current_note_outcome', None)
+            st.session_state.pop('last_applied_template', None)
+            st.session_state.quill_key_counter = st.session_state.get('quill_key_counter', 0) + 1
+            st.rerun()
+    with menu_col2:
+        st.markdown(render_mui_icon('save', 18), unsafe_allow_html=True)
+        if st.button("Save", key="word_save_top", use_container_width=True, help="Save note"):
+            st.session_state.trigger_save = True
+    with menu_col3:
+        st.markdown(render_mui_icon('download', 18), unsafe_allow_html=True)
+        if st.button("Export", key="word_export", use_container_width=True, help="Export or import notes"):
+            st.session_state.show_export = not st.session_state.get('show_export', False)
+    with menu_col4:
+        st.markdown(render_mui_icon('smart_toy', 18), unsafe_allow_html=True)
+        if st.button("AI Help", key="word_ai", use_container_width=True, help="AI Assistant"):
+            st.session_state.show_ai_panel = not st.session_state.get('show_ai_panel', False)
+    with menu_col5:
+        st.markdown(render_mui_icon('analytics', 18), unsafe_allow_html=True)
+        if st.button("Stats", key="word_stats", use_container_width=True, help="Statistics"):
+            st.session_state.show_stats = not st.session_state.get('show_stats', False)
+    
+    st.markdown("---")
+    
+    sidebar_col, main_col = st.columns([1, 3])
+    
+    with sidebar_col:
+        st.markdown("##### 📁 Documents")
+        
+        selected_course_label = st.selectbox(
+            "Course:",
+            options=list(course_options.keys()),
+            key="word_course_select",
+            label_visibility="collapsed"
+        )
+        selected_course_code = course_options[selected_course_label]
+        
+        if selected_course_code not in st.session_state.study_notes:
+            st.session_state.study_notes[selected_course_code] = []
+        
+        course_notes = st.session_state.study_notes[selected_course_code]
+        
+        cat_filter = st.selectbox(
+            "Filter:",
+            ["All"] + [f"{v['icon']} {v['label']}" for v in NOTE_CATEGORIES.values()],
+            key="word_cat_filter",
+            label_visibility="collapsed"
+        )
+        
+        search_term = st.text_input(render_mui_icon('search', 18), placeholder='Search... ("exact phrase")', key="word_search", label_visibility="collapsed")
+        search_all = st.checkbox("Search all courses", key="word_search_all") if search_term else False
+        
+        filtered_notes = course_notes.copy()
+        if cat_filter != "All":
+            # Extract category key from filter
+            for k, v in NOTE_CATEGORIES.items():
+                if v['label'] == cat_filter:
+                    filtered_notes = [n for n in filtered_notes if n.get('category') == k]
+                    break
+        if search_term and not search_all:
+            # Ranked by relevance, still limited to the category filter
+            allowed = {id(n) for n in filtered_notes}
+            ranked = get_notes_index(st.session_state).search(search_term, course=selected_course_code)
+            filtered_notes = [course_notes[pos] for _, pos, _ in ranked if id(course_notes[pos]) in allowed]
+        
+        if search_all:
+            def open_search_hit(code, position):
+                note = st.session_state.study_notes[code][position]
+                for key, value in note_state(code, position, note).items():
+                    st.session_state[key] = value
+                st.session_state.quill_key_counter = st.session_state.get('quill_key_counter', 0) + 1
+            
+            ranked = get_notes_index(st.session_state).search(search_term, limit=50)
+            st.markdown(f"**{len(ranked)} notes in all courses**")
+            for rank, (code, position, _) in enumerate(ranked):
+                note = st.session_state.study_notes[code][position]
+                st.button(
+                    f"{code} · {note.get('title', 'Untitled')[:24]}",
+                    key=f"search_hit_{rank}_{code}_{position}",
+                    on_click=open_search_hit,
+                    args=(code, position),
+                    use_container_width=True
+                )
+            filtered_notes = []
+        else:
+            st.markdown(f"**{len(filtered_notes)} notes**")
+        
+        for idx, note in enumerate(filtered_notes):
+            # Find actual index in course_notes by iterating to avoid duplicate index issues
+            orig_idx = None
+            for i, cn in enumerate(course_notes):
+                if cn is note:  # Check by identity, not equality
+                    orig_idx = i
+                    break
+            if orig_idx is None:
+                orig_idx = idx
+            
+            cat = note.get('category', 'lecture')
+            cat_info = NOTE_CATEGORIES.get(cat, NOTE_CATEGORIES['lecture'])
+            imp = note.get('importance', 'normal')
+            imp_info = IMPORTANCE_LEVELS.get(imp, IMPORTANCE_LEVELS['normal'])
+            
+            # Display icon and button separately
+            icon_col, btn_col = st.columns([1, 9])
+            with icon_col:
+                st.markdown(f"{render_mui_icon(cat_info['icon'], 16)}{render_mui_icon(imp_info['icon'], 16)}", unsafe_allow_html=True)
+            with btn_col:
+                # Use idx from filtered list to ensure unique keys
+                if st.button(note.get('title', 'Untitled')[:30], key=f"open_{selected_course_code}_{idx}_{orig_idx}", use_container_width=True):
+                    st.session_state.current_note_content = note.get('content', '')
+                    st.session_state.current_note_title = note.get('title', '')
+                    st.session_state.current_note_category = note.get('category', 'lecture')
+                    st.session_state.current_note_importance = note.get('importance', 'normal')
+                    st.session_state.current_note_tags = ', '.join(note.get('tags', []))
+                    st.session_state.current_note_outcome = note.get('learning_outcome', '')
+                    st.session_state.editing_note_idx = orig_idx
+                    st.session_state.quill_key_counter = st.session_state.get('quill_key_counter', 0) + 1
+                    st.rerun()
+    
+    with main_col:
+        # ── Progression Plan reminder (Study Notes) ───────────────────────────────
+        _sn_course_obj = next((c for c in courses_data if c['code'] == selected_course_code), None)
+        _sn_course_name = _sn_course_obj['name'] if _sn_course_obj else ''
+        _sn_pp_map = {
+            'Data Analysis Fundamentals':  ('DAF', '2025-11-03', '2025-11-09'),
+            'Spreadsheet Fundamentals':    ('SPF', '2025-11-24', '2025-11-30'),
+            'Data Driven Decision-Making': ('DDM', '2026-01-05', '2026-01-11'),
+            'Statistical Tools':           ('STT', '2026-01-26', '2026-02-01'),
+            'Semester Project 1':          ('SP1', '2026-02-23', '2026-03-01'),
+            'Evaluation of Outcomes':      ('EVO', '2026-04-27', '2026-05-03'),
+            'Data Visualisation':          ('DVS', '2026-06-01', '2026-06-07'),
+            'Analysis Reporting':          ('ARP', '2026-08-24', '2026-08-30'),
+        }
+        if _sn_course_name in _sn_pp_map:
+            from datetime import date as _sn_date, datetime as _sn_dt
+            _sn_code, _sn_start_s, _sn_dl_s = _sn_pp_map[_sn_course_name]
+            _sn_today = _sn_date.today()
+            _sn_start = _sn_dt.strptime(_sn_start_s, '%Y-%m-%d').date()
+            _sn_dl    = _sn_dt.strptime(_sn_dl_s,    '%Y-%m-%d').date()
+            _sn_days  = (_sn_dl - _sn_today).days
+            if _sn_days < 0:
+                _sn_ic, _sn_col, _sn_txt = '✅', '#2ecc71', f'Submitted {abs(_sn_days)} days ago'
+                _sn_bg = '#0d2416'
+            elif _sn_days == 0:
+                _sn_ic, _sn_col, _sn_txt = '🔥', '#e74c3c', 'DUE TODAY — 23:59!'
+                _sn_bg = '#3d0000'
+            elif _sn_days <= 3:
+                _sn_ic, _sn_col, _sn_txt = '🔴', '#e74c3c', f'{_sn_days} day{"s" if _sn_days != 1 else ""} left!'
+                _sn_bg = '#3d0000'
+            elif _sn_days <= 14:
+                _sn_ic, _sn_col, _sn_txt = '🟡', '#f39c12', f'{_sn_days} days left'
+                _sn_bg = '#2d2200'
+            else:
+                _sn_ic, _sn_col, _sn_txt = '🟢', '#3498db', f'in {_sn_days} days'
+                _sn_bg = '#0d1e2d'
+            st.markdown(f"""
+<div style="background:{_sn_bg}; border-left:5px solid {_sn_col}; border-radius:8px;
+            padding:8px 14px; margin:0 0 10px 0; display:flex; align-items:center; gap:12px;">
+  <div style="font-size:20px;">{_sn_ic}</div>
+  <div style="flex:1;">
+    <span style="font-weight:700; color:#f0f0f0; font-size:13px;">📋 {_sn_code} Assessment Reminder</span><br>
+    <span style="font-size:11px; color:#bbb;">
+      Week starts <b style="color:#ddd;">{_sn_start.strftime('%a %d %b')}</b>
+      &nbsp;·&nbsp; Deadline <b style="color:#ddd;">{_sn_dl.strftime('%a %d %b %Y')} @ 23:59</b>
+    </span>
+  </div>
+  <div style="text-align:right; white-space:nowrap;">
+    <span style="font-size:14px; font-weight:700; color:{_sn_col};">{_sn_txt}</span>
+  </div>
+</div>
+""", unsafe_allow_html=True)
+        # ─────────────────────────────────────────────────────────────────────
+
+        # Note properties
+        prop_col1, prop_col2, prop_col3, prop_col4 = st.columns(4)
+        with prop_col1:
+            note_title = st.text_input("Title:", value=st.session_state.get('current_note_title', ''), key="word_title", placeholder="Document title...")
+        with prop_col2:
+            note_category = st.selectbox(
+                "Category:",
+                options=list(NOTE_CATEGORIES.keys()),
+                format_func=lambda x: NOTE_CATEGORIES[x]['label'],
+                index=list(NOTE_CATEGORIES.keys()).index(st.session_state.get('current_note_category', 'lecture')),
+                key="word_category"
+            )
+        with prop_col3:
+            note_importance = st.selectbox(
+                "Importance:",
+                options=list(IMPORTANCE_LEVELS.keys()),
+                format_func=lambda x: IMPORTANCE_LEVELS[x]['label'],
+                index=list(IMPORTANCE_LEVELS.keys()).index(st.session_state.get('current_note_importance', 'normal')),
+                key="word_importance"
+            )
+        with prop_col4:
+            recommended_template_keys_by_course = {
+                "FI1BBDD75": [
+                    "ddm_module_overview",
+                    "ddm_case_scenario",
+                    "ddm_techniques",
+                    "ddm_decision_matrix",
+                    "ddm_outcome_tracker"
+                ]
+            }
+            recommended_template_keys = recommended_template_keys_by_course.get(selected_course_code, [])
+            ordered_template_keys = recommended_template_keys + [
+                key for key in NOTE_TEMPLATES.keys() if key not in recommended_template_keys
+            ]
+            template_display_map = {}
+            for template_key_option in ordered_template_keys:
+                template_label = NOTE_TEMPLATES[template_key_option]['name']
+                if template_key_option in recommended_template_keys:
+                    template_label = f"Recommended: {template_label}"
+                template_display_map[template_label] = template_key_option
+
+            template_choice = st.selectbox(
+                "Template:",
+                options=["(None)"] + list(template_display_map.keys()),
+                key="word_template"
+            )
+            if recommended_template_keys:
+                st.caption("Recommended DDM templates are shown first for this course.")
+            if template_choice != "(None)":
+                template_key = template_display_map[template_choice]
+                if not st.session_state.get('editing_note_idx'):
+                    if st.session_state.get('last_applied_template') != template_choice:
+                        st.session_state.current_note_content = NOTE_TEMPLATES[template_key]['content']
+                        st.session_state.last_applied_template = template_choice
+                        st.session_state.quill_key_counter = st.session_state.get('quill_key_counter', 0) + 1
+                        st.rerun()
+        
+        st.markdown("---")
+        
+        # Dynamic key to force Quill refresh when template changes
+        quill_key = f"quill_editor_{st.session_state.get('quill_key_counter', 0)}"
+        
+        if view_mode == "Edit":
+            from streamlit_quill import st_quill
+            current_content = st.session_state.get('current_note_content', '')
+            
+            # Quill Rich Text Editor
+            quill_content = st_quill(
+                value=current_content,
+                html=True,
+                toolbar=[
+                    [{'header': [1, 2, 3, 4, 5, 6, False]}],
+                    ['bold', 'italic', 'underline', 'strike'],
+                    [{'list': 'ordered'}, {'list': 'bullet'}],
+                    [{'indent': '-1'}, {'indent': '+1'}],
+                    [{'color': []}, {'background': []}],
+                    [{'align': []}],
+                    ['link', 'image'],
+                    ['blockquote', 'code-block'],
+                    ['clean']
+                ],
+                key=quill_key
+            )
+            
+            if quill_content:
+                st.session_state.current_note_content = quill_content
+        
+        elif view_mode == "Preview":
+            st.markdown("**Preview:**")
+            content = st.session_state.get('current_note_content', '')
+            if content:
+                # Render HTML content from Quill
+                st.markdown(content, unsafe_allow_html=True)
+            else:
+                st.info("Nothing to preview. Start writing in Edit mode.")
+        
+        else:  # Split view
+            from streamlit_quill import st_quill
+            edit_col, preview_col = st.columns(2)
+            with edit_col:
+                current_content = st.session_state.get('current_note_content', '')
+                quill_content_split = st_quill(
+                    value=current_content,
+                    html=True,
+                    toolbar=[
+                        [{'header': [1, 2, 3, False]}],
+                        ['bold', 'italic', 'underline'],
+                        [{'list': 'ordered'}, {'list': 'bullet'}],
+                        ['link'],
+                        ['clean']
+                    ],
+                    key=f"{quill_key}_split"
+                )
+                if quill_content_split:
+                    st.session_state.current_note_content = quill_content_split
+            with preview_col:
+                st.markdown("**Preview:**")
+                content = st.session_state.get('current_note_content', '')
+                if content:
+                    st.markdown(content, unsafe_allow_html=True)
+                else:
+                    st.caption("Preview appears here...")
+        
+        # Local spell check: unchanged paragraphs come from a cache, edited ones are
+        # checked on a background thread. Grammar fixes stay an explicit AI action.
+        if st.toggle("Spell check", key="word_spellcheck", help="Runs locally. For grammar fixes use AI Help → Fix Grammar."):
+            note_text = st.session_state.get('current_note_content', '')
+            spell_ignore = st.session_state.get('spell_ignore_words', [])
+            squiggles = get_spell_checker().squiggles(note_text, timeout=0.5, ignore=spell_ignore)
+            if squiggles is None:
+                @st.fragment(run_every=1.0)
+                def wait_for_spell_check():
+                    st.caption("⏳ Checking spelling...")
+                    if get_spell_checker().squiggles(note_text, ignore=spell_ignore) is not None:
+                        st.rerun()
+                
+                wait_for_spell_check()
+            elif not squiggles:
+                st.caption("✓ No spelling issues found.")
+            else:
+                with st.expander(f"Spelling: {len(squiggles)} possible issue(s)", expanded=True):
+                    st.markdown(mark_squiggles(note_text, squiggles), unsafe_allow_html=True)
+                    
+                    def ignore_word(word):
+                        st.session_state.spell_ignore_words = st.session_state.get('spell_ignore_words', []) + [word.lower()]
+                    
+                    misspelled = {}
+                    for squiggle in squiggles:
+                        misspelled.setdefault(squiggle['word'].lower(), squiggle['suggestions'])
+                    for i, (word, suggestions) in enumerate(list(misspelled.items())[:10]):
+                        word_col, add_col = st.columns([4, 1])
+                        with word_col:
+                            st.markdown(f"**{word}** → {', '.join(suggestions) or 'no suggestions'}")
+                        with add_col:
+                            st.button("Add to dictionary", key=f"spell_ignore_{i}", on_click=ignore_word, args=(word,))
+        
+        tags_col, outcome_col = st.columns(2)
+        with tags_col:
+            note_tags = st.text_input("Tags (comma-separated):", value=st.session_state.get('current_note_tags', ''), key="word_tags")
+        with outcome_col:
+            selected_course_data = next((c for c in courses_data if c['code'] == selected_course_code), None)
+            outcomes_list = []
+            if selected_course_data:
+                for lo in selected_course_data.get('learning_outcomes', []):
+                    outcomes_list.extend(lo.get('items', []))
+            default_outcome = st.session_state.get('current_note_outcome', '')
+            note_outcome = st.selectbox(
+                "Learning Outcome:",
+                options=["(None)"] + outcomes_list[:10],
+                index=(outcomes_list.index(default_outcome) + 1) if default_outcome in outcomes_list else 0,
+                key="word_outcome"
+            )
+        
+        save_col1, save_col2, save_col3 = st.columns([1, 1, 2])
+        with save_col1:
+            st.markdown(render_mui_icon('save', 18), unsafe_allow_html=True)
+            if st.button("Save Note", type="primary", key="word_save_main", use_container_width=True) or st.session_state.get('trigger_save'):
+                st.session_state.pop('trigger_save', None)
+                if note_title and st.session_state.get('current_note_content', ''):
+                    tags_list = [t.strip() for t in note_tags.split(',') if t.strip()] if note_tags else []
+                    
+                    note_data = {
+                        'title': note_title,
+                        'content': st.session_state.current_note_content,
+                        'date': datetime.now().strftime("%Y-%m-%d %H:%M"),
+                        'tags': tags_list,
+                        'category': note_category,
+                        'importance': note_importance,
+                        'learning_outcome': note_outcome if note_outcome != "(None)" else "",
+                        'version_history': []
+                    }
+                    
+                    editing_idx = st.session_state.get('editing_note_idx')
+                    if editing_idx is not None and editing_idx < len(course_notes):
+                        old_note = course_notes[editing_idx]
+                        note_data['version_history'] = record_version(
+                            old_note.get('version_history', []),
+                            old_note.get('content', ''),
+                            note_data['content'],
+                            date=datetime.now().strftime("%Y-%m-%d %H:%M"),
+                            summary=f"Edited: {old_note.get('title', '')[:30]}",
+                            depth=st.session_state.get('note_history_depth', NOTE_HISTORY_DEPTH)
+                        )
+                        st.session_state.study_notes[selected_course_code][editing_idx] = note_data
+                        get_notes_index(st.session_state).update(selected_course_code, editing_idx, note_data)
+                        st.success("✅ Note updated!")
+                    else:
+                        notes_index = get_notes_index(st.session_state)
+                        st.session_state.study_notes[selected_course_code].append(note_data)
+                        notes_index.add(selected_course_code, len(course_notes) - 1, note_data)
+                        st.session_state.current_note_content = ""
+                        st.session_state.pop('current_note_title', None)
+                        st.session_state.pop('current_note_category', None)
+                        st.session_state.pop('current_note_importance', None)
+                        st.session_state.pop('current_note_tags', None)
+                        st.session_state.pop('current_note_outcome', None)
+                        st.session_state.pop('last_applied_template', None)
+                        st.session_state.quill_key_counter = st.session_state.get('quill_key_counter', 0) + 1
+                        st.success("✅ New note created! Editor cleared for next note.")
+                    
+                    st.rerun()
+                else:
+                    st.warning("Please add a title and content.")
+        
+        with save_col2:
+            if st.session_state.get('editing_note_idx') is not None:
+                st.markdown(render_mui_icon('delete', 18), unsafe_allow_html=True)
+                if st.button("Delete", key="word_delete", use_container_width=True):
+                    idx = st.session_state.editing_note_idx
+                    if idx < len(course_notes):
+                        notes_index = get_notes_index(st.session_state)
+                        st.session_state.study_notes[selected_course_code].pop(idx)
+                        notes_index.remove(selected_course_code, idx)
+                        st.session_state.current_note_content = ""
+                        st.session_state.pop('editing_note_idx', None)
+                        st.session_state.pop('current_note_title', None)
+                        st.success("✅ Deleted!")
+                        st.rerun()
+        
+        editing_idx = st.session_state.get('editing_note_idx')
+        if editing_idx is not None and editing_idx < len(course_notes):
+            editing_note = course_notes[editing_idx]
+            history = editing_note.get('version_history', [])
+            with st.expander(f"🕘 Version History ({len(history)})"):
+                # The widget has its own key: Streamlit drops a widget's value on runs
+                # where it isn't drawn, and this one is only drawn while expanded.
+                if 'note_history_depth_input' not in st.session_state:
+                    st.session_state.note_history_depth_input = int(st.session_state.get('note_history_depth', NOTE_HISTORY_DEPTH))
+                
+                def keep_history_depth():
+                    st.session_state.note_history_depth = st.session_state.note_history_depth_input
+                
+                st.number_input(
+                    "Versions to keep per note:", min_value=1, max_value=100,
+                    key="note_history_depth_input", on_change=keep_history_depth
+                )
+                if history:
+                    version_idx = st.selectbox(
+                        "Version:",
+                        options=list(range(len(history) - 1, -1, -1)),
+                        format_func=lambda i: f"{history[i].get('date', '')} - {history[i].get('summary', '')}",
+                        key=f"word_version_{selected_course_code}_{editing_idx}"
+                    )
+                    old_content = reconstruct(editing_note.get('content', ''), history, version_idx)
+                    if old_content is None:
+                        st.caption("This version was saved before note contents were kept in the history.")
+                    else:
+                        st.markdown(old_content, unsafe_allow_html=True)
+                        
+                        def restore_version(content=old_content):
+                            st.session_state.current_note_content = content
+                            st.session_state.quill_key_counter = st.session_state.get('quill_key_counter', 0) + 1
+                        
+                        st.button("Restore into editor", key="word_restore_version", on_click=restore_version,
+                                  help="Loads this version into the editor; save the note to keep it.")
+                else:
+                    st.caption("No earlier versions yet. Each save that changes the content adds one.")
+    
+    if st.session_state.get('show_ai_panel'):
+        st.markdown("---")
+        st.markdown(f"### {render_mui_icon('smart_toy', 24)} AI Study Assistant", unsafe_allow_html=True)
+        
+        # Get comprehensive course context
+        course_info = next((c for c in courses_data if c['code'] == selected_course_code), None)
+        content = st.session_state.get('current_note_content', '')
+        
+        # Build rich context
+        course_context_parts = []
+        if course_info:
+            course_context_parts.append(f"Course: {course_info['name']} ({course_info['code']})")
+            course_context_parts.append(f"Description: {course_info.get('description', '')}")
+            if course_info.get('knowledge'):
+                course_context_parts.append(f"Knowledge Topics: {', '.join(course_info['knowledge'][:5])}")
+            if course_info.get('skills'):
+                course_context_parts.append(f"Skills: {', '.join(course_info['skills'][:5])}")
+            if course_info.get('learning_outcomes'):
+                outcomes_text = []
+                for lo in course_info['learning_outcomes'][:3]:
+                    outcomes_text.extend(lo.get('items', [])[:3])
+                if outcomes_text:
+                    course_context_parts.append(f"Learning Outcomes: {', '.join(outcomes_text[:5])}")
+        
+        course_context = "\n".join(course_context_parts)
+        
+        # Get related notes for context
+        related_notes_context = ""
+        if selected_course_code in st.session_state.study_notes:
+            course_notes = st.session_state.study_notes[selected_course_code]
+            if course_notes:
+                related_titles = [n.get('title', '') for n in course_notes[:5]]
+                if related_titles:
+                    related_notes_context = f"\nRelated notes in this course: {', '.join(related_titles)}"
+        
+        full_context = course_context + related_notes_context
+        
+        ai_tabs = st.tabs(["Quick Actions", "Generate Content", "Analyze & Improve", "Custom Prompt"])
+        
+        with ai_tabs[0]:
+            st.markdown("**Transform your notes:**")
+            action_col1, action_col2, action_col3, action_col4 = st.columns(4)
+            
+            with action_col1:
+                st.markdown("**📝 Content**")
+                if st.button("Summarize", key="ai_summarize", use_container_width=True):
+                    st.session_state.ai_pending_action = "summarize"
+                if st.button("Expand", key="ai_expand", use_container_width=True):
+                    st.session_state.ai_pending_action = "expand"
+                if st.button("Simplify", key="ai_simplify", use_container_width=True):
+                    st.session_state.ai_pending_action = "simplify"
+                if st.button("Fix Grammar", key="ai_grammar", use_container_width=True):
+                    st.session_state.ai_pending_action = "grammar"
+            
+            with action_col2:
+                st.markdown("**🎯 Enhance**")
+                if st.button("Add Examples", key="ai_examples", use_container_width=True):
+                    st.session_state.ai_pending_action = "examples"
+                if st.button("Create Outline", key="ai_outline", use_container_width=True):
+                    st.session_state.ai_pending_action = "outline"
+                if st.button("Explain Concept", key="ai_explain", use_container_width=True):
+                    st.session_state.ai_pending_action = "explain"
+                if st.button("Add Context", key="ai_context", use_container_width=True):
+                    st.session_state.ai_pending_action = "context"
+            
+            with action_col3:
+                st.markdown("**📚 Study Tools**")
+                if st.button("Study Questions", key="ai_questions", use_container_width=True):
+                    st.session_state.ai_pending_action = "questions"
+                if st.button("Flashcards", key="ai_flashcards", use_container_width=True):
+                    st.session_state.ai_pending_action = "flashcards"
+                if st.button("Key Points", key="ai_keypoints", use_container_width=True):
+                    st.session_state.ai_pending_action = "keypoints"
+                if st.button("Exam Prep", key="ai_examprep", use_container_width=True):
+                    st.session_state.ai_pending_action = "examprep"
+            
+            with action_col4:
+                st.markdown("**🌐 Language**")
+                if st.button("Translate to NO", key="ai_translate_no", use_container_width=True):
+                    st.session_state.ai_pending_action = "translate_no"
+                if st.button("Translate to EN", key="ai_translate_en", use_container_width=True):
+                    st.session_state.ai_pending_action = "translate_en"
+                if st.button("Improve Style", key="ai_style", use_container_width=True):
+                    st.session_state.ai_pending_action = "style"
+                if st.button("Format Text", key="ai_format", use_container_width=True):
+                    st.session_state.ai_pending_action = "format"
+            
+            # Process pending action
+            if st.session_state.get('ai_pending_action') and content:
+                action = st.session_state.ai_pending_action
+                prompts = {
+                    "summarize": f"Summarize this study note content concisely in bullet points. Focus on key concepts and main takeaways. {full_context}\n\nContent:\n{content}",
+                    "expand": f"Expand on this content with more details, context, and practical applications relevant to data analysis. {full_context}\n\nContent:\n{content}",
+                    "grammar": f"Fix any grammar, spelling, and clarity issues in this text. Return only the corrected text in the same format:\n\n{content}",
+                    "simplify": f"Rewrite this content in simpler terms that a beginner could understand. Use analogies and real-world examples where helpful. {full_context}\n\nContent:\n{content}",
+                    "examples": f"Add 3-5 practical, real-world data analysis examples to illustrate the concepts in this content. Make examples relevant to the course context. {full_context}\n\nContent:\n{content}",
+                    "outline": f"Create a structured outline/table of contents from this content with main topics and subtopics. Format as HTML with proper headings:\n\n{content}",
+                    "questions": f"Generate 5-7 study questions (mix of multiple choice, short answer, and critical thinking) based on this content. Include detailed answers. {full_context}\n\nContent:\n{content}",
+                    "flashcards": f"Create 5-8 flashcards in the format 'Term | Definition' from the key concepts in this content. Make them suitable for memorization. {full_context}\n\nContent:\n{content}",
+                    "explain": f"Explain the main concept(s) in this content as if teaching to someone new to data analysis. Include why it matters, how it connects to real-world applications, and relate it to the course context. {full_context}\n\nContent:\n{content}",
+                    "context": f"Add relevant context, background information, and connections to course material. Link concepts to the course learning outcomes and knowledge/skills. {full_context}\n\nContent:\n{content}",
+                    "keypoints": f"Extract and list the key points, main concepts, and important takeaways from this content. Format as a clear bullet list. {full_context}\n\nContent:\n{content}",
+                    "examprep": f"Transform this content into exam preparation material. Include key definitions, important formulas, common exam questions, and things to remember. {full_context}\n\nContent:\n{content}",
+                    "translate_no": f"Translate this content to Norwegian (bokmål). Maintain the same structure and formatting. Keep technical terms in English if commonly used in Norwegian data analysis context:\n\n{content}",
+                    "translate_en": f"Translate this content to English. Maintain the same structure and formatting:\n\n{content}",
+                    "style": f"Improve the writing style, clarity, and flow of this content. Make it more engaging and easier to read while keeping all the information. {full_context}\n\nContent:\n{content}",
+                    "format": f"Format this content properly with clear headings, bullet points, and structure. Improve readability while keeping all information. Return in HTML format:\n\n{content}"
+                }
+                
+                with st.spinner(f"AI is processing..."):
+                    if client is None:
+                        st.warning(AI_NOT_CONFIGURED_MESSAGE)
+                        st.session_state.pop('ai_pending_action', None)
+                    else:
+                        try:
+                            system_prompt = f"""You are an expert study assistant for a Data Analyst vocational program at Noroff. 
+You help students learn data analysis concepts, tools, and techniques.
+
+Context about the program:
+- This is a vocational program focused on practical data analysis skills
+- Students learn about business intelligence, statistics, data visualization, and decision-making
+- The program emphasizes real-world applications and industry-relevant tools
+- Students need clear, practical explanations with examples
+
+Guidelines:
+- Format responses in clean HTML (use <h2>, <h3>, <h4>, <p>, <ul>, <ol>, <li>, <strong>, <em>, <blockquote>, <code> tags)
+- Always respond in English
+- Focus on practical, actionable learning
+- Connect concepts to real-world data analysis scenarios
+- Be clear, concise, and educational
+- When relevant, reference course learning outcomes and skills"""
+
+                            st.session_state.ai_result = stream_html(llm.stream(
+                                model="gpt-4o-mini",
+                                messages=[
+                                    {"role": "system", "content": system_prompt},
+                                    {"role": "user", "content": prompts[action]}
+                                ],
+                                max_tokens=2000,
+                                temperature=0.7
+                            ))
+                            st.session_state.pop('ai_pending_action', None)
+                        except Exception as e:
+                            st.error(f"Error: {str(e)}")
+                            st.session_state.pop('ai_pending_action', None)
+            elif st.session_state.get('ai_pending_action') and not content:
+                st.warning("Write some content first.")
+                st.session_state.pop('ai_pending_action', None)
+        
+        with ai_tabs[1]:
+            st.markdown("**Generate new content for your notes:**")
+            
+            gen_topic = st.text_input("Topic or concept:", placeholder="e.g., VLOOKUP function, regression analysis, data cleaning, KPIs...", key="ai_gen_topic")
+            gen_type = st.selectbox("Content type:", [
+                "Concept Explanation",
+                "Step-by-Step Guide", 
+                "Key Points Summary",
+                "Comparison Table",
+                "Common Mistakes & Tips",
+                "Practice Exercises",
+                "Exam Review Notes",
+                "Case Study Template",
+                "Formula Reference",
+                "Quick Reference Guide"
+            ], key="ai_gen_type")
+            
+            include_course_context = st.checkbox("Include course context in generation", value=True, key="ai_include_course")
+            
+            if st.button("Generate", type="primary", key="ai_generate", use_container_width=True):
+                if gen_topic:
+                    context_to_use = full_context if include_course_context else ""
+                    
+                    type_prompts = {
+                        "Concept Explanation": f"Explain the concept of '{gen_topic}' for a data analyst student. Include definition, importance, practical applications, and real-world examples. {context_to_use}",
+                        "Step-by-Step Guide": f"Create a detailed step-by-step guide for '{gen_topic}'. Number each step clearly, include tips, warnings, and expected outcomes. {context_to_use}",
+                        "Key Points Summary": f"Summarize the key points about '{gen_topic}' in bullet points. Focus on what a student needs to know for exams and practical work. {context_to_use}",
+                        "Comparison Table": f"Create a comparison for '{gen_topic}' showing pros/cons, use cases, or comparing with similar concepts. Use HTML table format with clear headers. {context_to_use}",
+                        "Common Mistakes & Tips": f"List common mistakes students make with '{gen_topic}' and how to avoid them. Include pro tips and best practices. {context_to_use}",
+                        "Practice Exercises": f"Create 3 practice exercises about '{gen_topic}' with detailed solutions. Range from basic to intermediate difficulty. Include explanations. {context_to_use}",
+                        "Exam Review Notes": f"Create exam-focused review notes for '{gen_topic}'. Include key definitions, formulas, important concepts, and things to remember. {context_to_use}",
+                        "Case Study Template": f"Create a case study template for '{gen_topic}'. Include sections for background, problem, data, analysis, findings, and recommendations. {context_to_use}",
+                        "Formula Reference": f"Create a formula reference sheet for '{gen_topic}'. Include formulas, variable definitions, use cases, and worked examples. {context_to_use}",
+                        "Quick Reference Guide": f"Create a quick reference guide for '{gen_topic}'. Include essential information, shortcuts, key concepts, and common use cases in a concise format. {context_to_use}"
+                    }
+                    
+                    with st.spinner("Generating content..."):
+                        if client is None:
+                            st.warning(AI_NOT_CONFIGURED_MESSAGE)
+                        else:
+                            try:
+                                system_prompt = f"""You are an expert study assistant for a Data Analyst vocational program at Noroff. 
+Format your response in clean HTML (use <h2>, <h3>, <h4>, <p>, <ul>, <ol>, <li>, <table>, <tr>, <td>, <th>, <strong>, <em>, <blockquote>, <code> tags). 
+Always respond in English.
+Be practical and focused on real-world data analysis. {full_context if include_course_context else ''}"""
+
+                                st.session_state.ai_result = stream_html(llm.stream(
+                                    model="gpt-4o-mini",
+                                    messages=[
+                                        {"role": "system", "content": system_prompt},
+                                        {"role": "user", "content": type_prompts[gen_type]}
+                                    ],
+                                    max_tokens=2000,
+                                    temperature=0.7
+                                ))
+                            except Exception as e:
+                                st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Enter a topic first.")
+        
+        with ai_tabs[2]:
+            st.markdown("**Analyze and improve your notes:**")
+            
+            analyze_type = st.selectbox("Analysis type:", [
+                "Check Completeness",
+                "Identify Gaps",
+                "Suggest Improvements",
+                "Compare with Course Material",
+                "Extract Key Concepts",
+                "Find Related Topics",
+                "Assess Exam Readiness"
+            ], key="ai_analyze_type")
+            
+            if st.button("Analyze", type="primary", key="ai_analyze", use_container_width=True):
+                if content:
+                    analyze_prompts = {
+                        "Check Completeness": f"Analyze this study note and check if it's complete. Identify what might be missing (definitions, examples, applications, etc.). {full_context}\n\nContent:\n{content}",
+                        "Identify Gaps": f"Identify knowledge gaps in this study note. What important concepts, details, or connections are missing? {full_context}\n\nContent:\n{content}",
+                        "Suggest Improvements": f"Review this study note and suggest specific improvements for clarity, completeness, and learning effectiveness. {full_context}\n\nContent:\n{content}",
+                        "Compare with Course Material": f"Compare this study note with the course material and learning outcomes. Does it cover the required topics? What should be added? {full_context}\n\nContent:\n{content}",
+                        "Extract Key Concepts": f"Extract and list all key concepts, terms, and important information from this study note. Organize them clearly. {full_context}\n\nContent:\n{content}",
+                        "Find Related Topics": f"Identify related topics, concepts, and connections that should be linked or referenced in this study note. {full_context}\n\nContent:\n{content}",
+                        "Assess Exam Readiness": f"Assess if this study note is ready for exam preparation. What's missing? What should be emphasized? Provide specific recommendations. {full_context}\n\nContent:\n{content}"
+                    }
+                    
+                    with st.spinner("Analyzing..."):
+                        if client is None:
+                            st.warning(AI_NOT_CONFIGURED_MESSAGE)
+                        else:
+                            try:
+                                system_prompt = f"""You are an expert study assistant for a Data Analyst vocational program. 
+Provide detailed, constructive analysis. Format responses in clean HTML with clear sections. 
+Always respond in English.
+Be specific and actionable in your recommendations. {full_context}"""
+
+                                st.session_state.ai_result = stream_html(llm.stream(
+                                    model="gpt-4o-mini",
+                                    messages=[
+                                        {"role": "system", "content": system_prompt},
+                                        {"role": "user", "content": analyze_prompts[analyze_type]}
+                                    ],
+                                    max_tokens=2000,
+                                    temperature=0.7
+                                ))
+                            except Exception as e:
+                                st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Write some content first to analyze.")
+        
+        with ai_tabs[3]:
+            st.markdown("**Ask anything or give custom instructions:**")
+            custom_prompt = st.text_area("Your prompt:", placeholder="e.g., 'Translate to Norwegian', 'Make this more formal', 'Add more statistics examples', 'Create a mind map structure'...", key="ai_custom_prompt", height=120)
+            
+            include_content = st.checkbox("Include current note content", value=True, key="ai_include_content")
+            include_course_info = st.checkbox("Include course context", value=True, key="ai_include_course_info")
+            
+            if st.button("Send to AI", type="primary", key="ai_custom_send", use_container_width=True):
+                if custom_prompt:
+                    full_prompt = custom_prompt
+                    if include_content and content:
+                        full_prompt = f"{custom_prompt}\n\nContent:\n{content}"
+                    if include_course_info:
+                        full_prompt = f"{full_prompt}\n\n{course_context}"
+                    
+                    with st.spinner("Processing..."):
+                        if client is None:
+                            st.warning(AI_NOT_CONFIGURED_MESSAGE)
+                        else:
+                            try:
+                                system_prompt = f"""You are a helpful study assistant for a Data Analyst program at Noroff. 
+Format responses in HTML when appropriate. Always respond in English.
+Be helpful, educational, and practical. 
+Focus on data analysis concepts, tools, and real-world applications."""
+
+                                st.session_state.ai_result = stream_html(llm.stream(
+                                    model="gpt-4o-mini",
+                                    messages=[
+                                        {"role": "system", "content": system_prompt},
+                                        {"role": "user", "content": full_prompt}
+                                    ],
+                                    max_tokens=2000,
+                                    temperature=0.7
+                                ))
+                            except Exception as e:
+                                st.error(f"Error: {str(e)}")
+                else:
+                    st.warning("Enter a prompt first.")
+    
+    # Display AI result - outside of AI panel so it's always visible
+    if st.session_state.get('ai_result'):
+        st.markdown("---")
+        st.markdown(f"### {render_mui_icon('auto_awesome', 24)} AI Generated Result", unsafe_allow_html=True)
+        
+        # Get the result content
+        ai_result_content = st.session_state.ai_result
+        
+        # Display the result with proper HTML rendering
+        st.markdown(ai_result_content, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        st.markdown("**Actions:**")
+        result_col1, result_col2, result_col3, result_col4 = st.columns(4)
+        
+        with result_col1:
+            if st.button("📥 Replace Content", key="ai_replace", use_container_width=True, type="primary"):
+                st.session_state.current_note_content = ai_result_content
+                st.session_state.quill_key_counter = st.session_state.get('quill_key_counter', 0) + 1
+                st.session_state.pop('ai_result', None)
+                st.rerun()
+        
+        with result_col2:
+            if st.button("➕ Append to Note", key="ai_append", use_container_width=True):
+                current = st.session_state.get('current_note_content', '')
+                separator = "<hr>" if current else ""
+                st.session_state.current_note_content = current + f"{separator}<h3>AI Generated Content</h3>{ai_result_content}"
+                st.session_state.quill_key_counter = st.session_state.get('quill_key_counter', 0) + 1
+                st.session_state.pop('ai_result', None)
+                st.rerun()
+        
+        with result_col3:
+            if st.button("📋 View HTML", key="ai_view_html", use_container_width=True):
+                st.session_state.show_raw_html = not st.session_state.get('show_raw_html', False)
+                st.rerun()
+        
+        with result_col4:
+            if st.button("❌ Dismiss", key="ai_dismiss", use_container_width=True):
+                st.session_state.pop('ai_result', None)
+                st.session_state.pop('show_raw_html', None)
+                st.rerun()
+        
+        # Show raw HTML if requested
+        if st.session_state.get('show_raw_html'):
+            st.markdown("---")
+            st.markdown("**Raw HTML Code:**")
+            st.code(ai_result_content, language='html')
+            st.info("💡 Copy this HTML code and paste it into your note editor if needed.")
+    
+    if st.session_state.get('show_stats'):
+        st.markdown("---")
+        st.markdown(f"### {render_mui_icon('analytics', 24)} Statistics", unsafe_allow_html=True)
+        
+        total_notes = sum(len(notes) for notes in st.session_state.study_notes.values())
+        
+        stat_cols = st.columns(4)
+        with stat_cols[0]:
+            st.metric("Total Notes", total_notes)
+        with stat_cols[1]:
+            critical_count = sum(1 for notes in st.session_state.study_notes.values() for n in notes if n.get('importance') == 'critical')
+            st.metric("Critical", critical_count)
+        with stat_cols[2]:
+            important_count = sum(1 for notes in st.session_state.study_notes.values() for n in notes if n.get('importance') == 'important')
+            st.metric("Important", important_count)
+        with stat_cols[3]:
+            courses_with_notes = sum(1 for notes in st.session_state.study_notes.values() if notes)
+            st.metric("Courses", courses_with_notes)
+        
+        if total_notes > 0:
+            cat_col, course_col = st.columns(2)
+            with cat_col:
+                st.markdown("**By Category:**")
+                cat_counts = {}
+                for notes in st.session_state.study_notes.values():
+                    for note in notes:
+                        cat = note.get('category', 'lecture')
+                        cat_counts[cat] = cat_counts.get(cat, 0) + 1
+                for cat, count in sorted(cat_counts.items(), key=lambda x: x[1], reverse=True):
+                    cat_info = NOTE_CATEGORIES.get(cat, NOTE_CATEGORIES['lecture'])
+                    st.markdown(f"{render_mui_icon(cat_info['icon'], 18)} {cat_info['label']}: {count}", unsafe_allow_html=True)
+            
+            with course_col:
+                st.markdown("**By Course:**")
+                course_counts = {code: len(notes) for code, notes in st.session_state.study_notes.items() if notes}
+                for code, count in sorted(course_counts.items(), key=lambda x: x[1], reverse=True)[:5]:
+                    st.write(f"{code}: {count}")
+    
+    if st.session_state.get('show_export'):
+        st.markdown("---")
+        st.markdown(f"### {render_mui_icon('download', 24)} Export Notes", unsafe_allow_html=True)
+        
+        if any(st.session_state.study_notes.values()):
+            export_format = st.radio("Format:", ["ZIP (all courses)", "JSON", "Markdown"], horizontal=True, key="export_format")
+            
+            if export_format == "ZIP (all courses)":
+                total_notes = sum(len(n) for n in st.session_state.study_notes.values())
+                st.caption(f"{total_notes} notes, one Markdown file each, with pictures and version history alongside.")
+                st.markdown(render_mui_icon('download', 18), unsafe_allow_html=True)
+                st.download_button(
+                    "Download ZIP",
+                    # Built when the button is clicked, not on every rerun
+                    data=lambda notes=st.session_state.study_notes: build_notes_archive(notes),
+                    file_name=f"study_notes_{datetime.now().strftime('%Y%m%d')}.zip",
+                    mime="application/zip"
+                )
+            elif not course_notes:
+                st.info("No notes in this course to export.")
+            elif export_format == "JSON":
+                export_data = {selected_course_code: course_notes}
+                export_json = json.dumps(export_data, indent=2, ensure_ascii=False)
+                st.markdown(render_mui_icon('download', 18), unsafe_allow_html=True)
+                st.download_button(
+                    "Download JSON",
+                    data=export_json,
+                    file_name=f"notes_{selected_course_code}_{datetime.now().strftime('%Y%m%d')}.json",
+                    mime="application/json"
+                )
+            else:
+                md_content = f"# Study Notes - {selected_course_code}\n\n"
+                for note in course_notes:
+                    md_content += f"## {note.get('title', 'Untitled')}\n"
+                    md_content += f"*{note.get('date', '')}* | {NOTE_CATEGORIES.get(note.get('category', 'lecture'), {}).get('label', '')}\n\n"
+                    md_content += note.get('content', '') + "\n\n---\n\n"
+                st.markdown(render_mui_icon('download', 18), unsafe_allow_html=True)
+                st.download_button(
+                    "Download Markdown",
+                    data=md_content,
+                    file_name=f"notes_{selected_course_code}_{datetime.now().strftime('%Y%m%d')}.md",
+                    mime="text/markdown"
+                )
+        else:
+            st.info("No notes to export.")
+        
+        st.markdown(f"### {render_mui_icon('upload', 24)} Import Notes", unsafe_allow_html=True)
+        uploaded_notes = st.file_uploader("Notes archive (.zip) or JSON export:", type=["zip", "json"], key="notes_import_file")
+        if uploaded_notes is not None and st.button("Import", key="notes_import"):
+            try:
+                import_stats = read_notes_archive(uploaded_notes, st.session_state.study_notes)
+            except Exception as e:
+                st.error(f"Could not read {uploaded_notes.name}: {e}")
+            else:
+                st.success(f"✅ Imported {import_stats['imported']} notes, skipped {import_stats['duplicates']} already present.")
+    
+    word_count = len(st.session_state.get('current_note_content', '').split())
+    char_count = len(st.session_state.get('current_note_content', ''))
+    st.markdown(f"{render_mui_icon('description', 16)} {word_count} words | {char_count} characters | Course: {selected_course_code}", unsafe_allow_html=True)
@@ -0,0 +1,201 @@
+"""Study Timer page."""
+
+import time
+from datetime import datetime
+
+import streamlit as st
+
+from study_buddy_core import courses_data
+
+
+def render():
+    st.title("⏱️ Study Timer")
+    st.markdown("*Track your study time with Pomodoro technique*")
+    st.markdown("---")
+    
+    # Initialize timer state
+    if 'timer_paused' not in st.session_state:
+        st.session_state.timer_paused = False
+    if 'pomodoro_count' not in st.session_state:
+        st.session_state.pomodoro_count = 0
+    if 'current_timer_course' not in st.session_state:
+        st.session_state.current_timer_course = None
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Timer display
+        if st.session_state.study_timer_active:
+            elapsed = time.time() - st.session_state.study_timer_start
+            remaining = max(0, st.session_state.study_timer_duration - elapsed)
+            
+            # Convert to minutes and seconds
+            minutes = int(remaining // 60)
+            seconds = int(remaining % 60)
+            
+            # Large timer display
+            st.markdown(f"<h1 style='text-align: center; font-size: 72px;'>{minutes:02d}:{seconds:02d}</h1>", unsafe_allow_html=True)
+            
+            # Progress bar
+            progress = 1 - (remaining / st.session_state.study_timer_duration) if st.session_state.study_timer_duration > 0 else 0
+            st.progress(progress)
+            
+            # Course being studied
+            if st.session_state.current_timer_course:
+                course_name = next((c['name'] for c in courses_data if c['code'] == st.session_state.current_timer_course), "Unknown")
+                st.markdown(f"**Studying:** {st.session_state.current_timer_course} - {course_name}")
+            
+            # Control buttons
+            col_btn1, col_btn2, col_btn3 = st.columns(3)
+            
+            with col_btn1:
+                if st.button("⏸️ Pause", use_container_width=True):
+                    if not st.session_state.timer_paused:
+                        st.session_state.timer_paused = True
+                        st.session_state.timer_pause_time = time.time()
+                        st.session_state.timer_elapsed_before_pause = elapsed
+                    else:
+                        st.session_state.timer_paused = False
+                        st.session_state.study_timer_start = time.time() - st.session_state.timer_elapsed_before_pause
+                    st.rerun()
+            
+            with col_btn2:
+                if st.button("⏹️ Stop", use_container_width=True, type="primary"):
+                    # Save session
+                    if st.session_state.current_timer_course:
+                        course_code = st.session_state.current_timer_course
+                        elapsed_total = elapsed if not st.session_state.timer_paused else st.session_state.timer_elapsed_before_pause
+                        
+                        session_data = {
+                            'course': course_code,
+                            'duration': int(elapsed_total),
+                            'date': datetime.now().isoformat(),
+                            'pomodoro': st.session_state.pomodoro_count > 0
+                        }
+                        st.session_state.study_sessions.append(session_data)
+                        
+                        # Update course time
+                        if course_code not in st.session_state.study_time_by_course:
+                            st.session_state.study_time_by_course[course_code] = 0
+                        st.session_state.study_time_by_course[course_code] += int(elapsed_total)
+                    
+                    # Reset timer
+                    st.session_state.study_timer_active = False
+                    st.session_state.study_timer_start = None
+                    st.session_state.timer_paused = False
+                    st.session_state.pomodoro_count = 0
+                    st.rerun()
+            
+            with col_btn3:
+                if st.button("🔄 Reset", use_container_width=True):
+                    st.session_state.study_timer_start = time.time()
+                    st.session_state.timer_paused = False
+                    st.rerun()
+            
+            # Auto-stop when timer reaches 0
+            if remaining <= 0:
+                st.balloons()
+                st.success("🎉 Time's up! Great work!")
+                
+                # Save session
+                if st.session_state.current_timer_course:
+                    course_code = st.session_state.current_timer_course
+                    session_data = {
+                        'course': course_code,
+                        'duration': st.session_state.study_timer_duration,
+                        'date': datetime.now().isoformat(),
+                        'pomodoro': True
+                    }
+                    st.session_state.study_sessions.append(session_data)
+                    
+                    if course_code not in st.session_state.study_time_by_course:
+                        st.session_state.study_time_by_course[course_code] = 0
+                    st.session_state.study_time_by_course[course_code] += st.session_state.study_timer_duration
+                
+                st.session_state.study_timer_active = False
+                st.session_state.pomodoro_count += 1
+                st.rerun()
+            
+            # Auto-refresh for timer updates (Streamlit will rerun on interaction)
+            # Use a placeholder to trigger updates
+            placeholder = st.empty()
+            placeholder.markdown("")  # Empty placeholder to allow reruns
+        
+        else:
+            # Timer setup
+            st.subheader("Configure Timer")
+            
+            timer_mode = st.radio(
+                "Timer Mode:",
+                ["Pomodoro (25 min)", "Short Break (5 min)", "Long Break (15 min)", "Custom"]
+            )
+            
+            if timer_mode == "Pomodoro (25 min)":
+                duration_minutes = 25
+            elif timer_mode == "Short Break (5 min)":
+                duration_minutes = 5
+            elif timer_mode == "Long Break (15 min)":
+                duration_minutes = 15
+            else:
+                duration_minutes = st.number_input("Custom Duration (minutes):", min_value=1, max_value=180, value=25)
+            
+            selected_course = st.selectbox(
+                "Select Course (optional):",
+                ["None"] + [f"{c['code']} - {c['name']}" for c in courses_data]
+            )
+            
+            if st.button("▶️ Start Timer", type="primary", use_container_width=True):
+                st.session_state.study_timer_active = True
+                st.session_state.study_timer_start = time.time()
+                st.session_state.study_timer_duration = duration_minutes * 60
+                st.session_state.timer_paused = False
+                
+                if selected_course != "None":
+                    course_code = selected_course.split(" - ")[0]
+                    st.session_state.current_timer_course = course_code
+                else:
+                    st.session_state.current_timer_course = None
+                
+                st.rerun()
+    
+    with col2:
+        st.subheader("📊 Statistics")
+        
+        # Total study time
+        total_seconds = sum(s.get('duration', 0) for s in st.session_state.study_sessions)
+        total_hours = total_seconds // 3600
+        total_minutes = (total_seconds % 3600) // 60
+        
+        st.metric("Total Study Time", f"{total_hours}h {total_minutes}m")
+        st.metric("Total Sessions", len(st.session_state.study_sessions))
+        st.metric("Pomodoros Completed", st.session_state.pomodoro_count)
+        
+        # Study time by course
+        if st.session_state.study_time_by_course:
+            st.markdown("---")
+            st.markdown("### Time by Course")
+            for course_code, seconds in sorted(st.session_state.study_time_by_course.items(), key=lambda x: x[1], reverse=True):
+                course_name = next((c['name'] for c in courses_data if c['code'] == course_code), course_code)
+                hours = seconds // 3600
+                minutes = (seconds % 3600) // 60
+                st.markdown(f"**{course_code}**\n- {hours}h {minutes}m")
+        
+        # Recent sessions
+        if st.session_state.study_sessions:
+            st.markdown("---")
+            st.markdown("### Recent Sessions")
+            recent = st.session_state.study_sessions[-5:]
+            for session in reversed(recent):
+                course_code = session.get('course', 'Unknown')
+                duration_min = session.get('duration', 0) // 60
+                date_str = session.get('date', '')[:10]
+                st.caption(f"{date_str}: {duration_min} min - {course_code}")
+        
+        # Clear data button
+        if st.button("🗑️ Clear All Data"):
+            if st.checkbox("Are you sure? This cannot be undone."):
+                st.session_state.study_sessions = []
+                st.session_state.study_time_by_course = {}
+                st.session_state.pomodoro_count = 0
+                st.success("Data cleared!")
+                st.rerun()
@@ -0,0 +1,369 @@
+"""Training Center page."""
+
+import streamlit as st
+
+from content import get_topic_course, get_training_module, training_topics
+from study_buddy_core import evaluate_answer
+from study_buddy_state import COURSE_PROGRESSION_MAP
+
+
+def render():
+    st.title("🎓 Training Center")
+    st.markdown("*Hands-on learning with step-by-step lessons, exercises, and quizzes*")
+    st.markdown("---")
+    
+    # Organize topics by semester and course (with official course codes)
+    course_to_semester = {
+        "Data Analysis Fundamentals": ("Semester 1", "FI1BBDF05"),
+        "Spreadsheet Fundamentals": ("Semester 1", "FI1BBSF05"),
+        "Statistical Tools": ("Semester 1", "FI1BBST05"),
+        "Programming Fundamentals": ("Semester 1", "FI1BBPF20"),
+        "Databases and Cloud Services": ("Semester 2", "FI1BBDC20"),
+        "Data Visualisation": ("Semester 2", "FI1BBDV15"),
+        "Data Driven Decision-Making": ("Semester 2", "FI1BBDD75"),
+        "Semester Project 1": ("Semester 2", "FI1BBP175"),
+        "Evaluation of Outcomes": ("Semester 3", "FI1BBEO10")
+    }
+    
+    # Group topics by semester and course
+    organized_topics = {}
+    for topic in training_topics():
+        course = get_topic_course(topic)
+        if course in course_to_semester:
+            semester, code = course_to_semester[course]
+        else:
+            semester, code = "Other", ""
+        
+        if semester not in organized_topics:
+            organized_topics[semester] = {}
+        if course not in organized_topics[semester]:
+            organized_topics[semester][course] = {"code": code, "topics": []}
+        organized_topics[semester][course]["topics"].append(topic)
+    
+    # Create formatted options with grouping
+    st.markdown("### Choose a Topic to Learn")
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        # Semester filter
+        available_semesters = sorted(organized_topics.keys())
+        semester_options = ["All Semesters"] + available_semesters
+        default_semester = st.session_state.get("tc_semester_filter", "All Semesters")
+        if default_semester not in semester_options:
+            default_semester = "All Semesters"
+        selected_semester = st.selectbox(
+            "📅 Semester:",
+            options=semester_options,
+            index=semester_options.index(default_semester),
+            key="tc_semester_filter"
+        )
+    
+    with col2:
+        # Course filter based on semester (with course codes)
+        if selected_semester == "All Semesters":
+            all_courses = []
+            for sem in available_semesters:
+                for course in organized_topics[sem].keys():
+                    if course not in all_courses:
+                        all_courses.append(course)
+            available_courses = all_courses
+        else:
+            available_courses = list(organized_topics[selected_semester].keys())
+        
+        # Create display names with course codes
+        course_display_map = {}
+        for course in available_courses:
+            if course in course_to_semester:
+                code = course_to_semester[course][1]
+                display = f"{code} - {course}"
+            else:
+                display = course
+            course_display_map[display] = course
+        
+        course_options = ["All Courses"] + list(course_display_map.keys())
+        default_course_display = "All Courses"
+        persisted_course = st.session_state.get("last_selected_course")
+        if persisted_course:
+            for display_name, course_name in course_display_map.items():
+                if course_name == persisted_course:
+                    default_course_display = display_name
+                    break
+        if st.session_state.get("tc_course_filter") in course_options:
+            default_course_display = st.session_state.get("tc_course_filter")
+
+        selected_course_display = st.selectbox(
+            "📚 Course:",
+            options=course_options,
+            index=course_options.index(default_course_display),
+            key="tc_course_filter"
+        )
+        
+        # Map back to actual course name
+        if selected_course_display == "All Courses":
+            selected_course = "All Courses"
+        else:
+            selected_course = course_display_map[selected_course_display]
+    
+    # Get filtered topics
+    filtered_topics = []
+    for semester, courses in organized_topics.items():
+        if selected_semester != "All Semesters" and semester != selected_semester:
+            continue
+        for course, data in courses.items():
+            if selected_course != "All Courses" and course != selected_course:
+                continue
+            for topic in data["topics"]:
+                # Format: "Topic Name (Course - Semester)"
+                display_name = f"{topic}"
+                filtered_topics.append((display_name, topic, course, semester))
+    
+    # Sort by semester, then course, then topic
+    semester_order = {"Semester 1": 1, "Semester 2": 2, "Semester 3": 3, "Semester 4": 4, "Other": 5}
+    filtered_topics.sort(key=lambda x: (semester_order.get(x[3], 99), x[2], x[0]))
+    
+    if not filtered_topics:
+        st.warning("No topics found for the selected filters.")
+        st.stop()
+    
+    # Create display options with context
+    topic_options = []
+    for display, topic, course, semester in filtered_topics:
+        topic_options.append(f"{topic}")
+    
+    # Show topic count
+    st.caption(f"📖 {len(filtered_topics)} topics available")
+    
+    selected_display = st.selectbox(
+        "🎯 Select Topic:",
+        options=topic_options,
+        format_func=lambda x: x,
+        index=topic_options.index(st.session_state.get("last_selected_topic")) if st.session_state.get("last_selected_topic") in topic_options else 0,
+        key="tc_topic"
+    )
+    
+    # Find the actual topic
+    selected_topic = selected_display
+    st.session_state.last_selected_topic = selected_topic
+    
+    # Find course and semester for display
+    topic_course = None
+    topic_semester = None
+    for display, topic, course, semester in filtered_topics:
+        if topic == selected_topic:
+            topic_course = course
+            topic_semester = semester
+            break
+
+    if topic_course:
+        st.session_state.last_selected_course = topic_course
+    
+    module = get_training_module(selected_topic)
+    
+    # Get course code for display
+    topic_code = ""
+    if topic_course and topic_course in course_to_semester:
+        topic_code = course_to_semester[topic_course][1]
+    
+    # Show context with course code
+    st.markdown(f"**📅 {topic_semester}** | **📚 {topic_code} - {topic_course}**")
+    st.markdown(f"*{module['description']}*")
+
+    # ── Progression Plan reminder banner ─────────────────────────────────────
+    if topic_course in COURSE_PROGRESSION_MAP:
+        from datetime import date as _pp_date, datetime as _pp_dt
+        _pp_code, _pp_start_str, _pp_dl_str = COURSE_PROGRESSION_MAP[topic_course]
+        _pp_today = _pp_date.today()
+        _pp_start = _pp_dt.strptime(_pp_start_str, "%Y-%m-%d").date()
+        _pp_dl    = _pp_dt.strptime(_pp_dl_str,    "%Y-%m-%d").date()
+        _pp_days  = (_pp_dl - _pp_today).days
+
+        if _pp_days < 0:
+            _pp_icon  = "✅"
+            _pp_cd    = f"Submitted {abs(_pp_days)} days ago"
+            _pp_bdr   = "#2ecc71"
+            _pp_bg    = "#0d2416"
+        elif _pp_days == 0:
+            _pp_icon  = "🔥"
+            _pp_cd    = "DUE TODAY — 23:59!"
+            _pp_bdr   = "#e74c3c"
+            _pp_bg    = "#3d0000"
+        elif _pp_days <= 3:
+            _pp_icon  = "🔴"
+            _pp_cd    = f"{_pp_days} day{'s' if _pp_days != 1 else ''} left!"
+            _pp_bdr   = "#e74c3c"
+            _pp_bg    = "#3d0000"
+        elif _pp_days <= 14:
+            _pp_icon  = "🟡"
+            _pp_cd    = f"{_pp_days} days left"
+            _pp_bdr   = "#f39c12"
+            _pp_bg    = "#2d2200"
+        else:
+            _pp_icon  = "🟢"
+            _pp_cd    = f"in {_pp_days} days"
+            _pp_bdr   = "#3498db"
+            _pp_bg    = "#0d1e2d"
+
+        st.markdown(f"""
+<div style="background:{_pp_bg}; border-left:5px solid {_pp_bdr}; border-radius:8px;
+            padding:10px 16px; margin:8px 0 12px 0; display:flex; align-items:center; gap:14px;">
+  <div style="font-size:22px;">{_pp_icon}</div>
+  <div style="flex:1;">
+    <span style="font-weight:700; color:#f0f0f0;">📋 {_pp_code} Progression Reminder</span><br>
+    <span style="font-size:12px; color:#bbb;">
+      Assessment week starts <b style="color:#ddd;">{_pp_start.strftime('%a %d %b')}</b>
+      &nbsp;·&nbsp;
+      Deadline <b style="color:#ddd;">{_pp_dl.strftime('%a %d %b %Y')} @ 23:59</b>
+    </span>
+  </div>
+  <div style="text-align:right; white-space:nowrap;">
+    <span style="font-size:15px; font-weight:700; color:{_pp_bdr};">{_pp_cd}</span><br>
+    <a href="?page=Progression+Plan" style="font-size:11px; color:#888;">View full plan ↗</a>
+  </div>
+</div>
+""", unsafe_allow_html=True)
+    # ─────────────────────────────────────────────────────────────────────────
+
+    # Initialize progress for this topic
+    if selected_topic not in st.session_state.training_progress:
+        st.session_state.training_progress[selected_topic] = {
+            'lessons_completed': 0,
+            'exercises_completed': [],
+            'quiz_score': None
+        }
+    
+    progress = st.session_state.training_progress[selected_topic]
+    
+    # Progress bar
+    total_items = len(module['lessons']) + len(module['exercises']) + 1  # +1 for quiz
+    completed_items = progress['lessons_completed'] + len(progress['exercises_completed']) + (1 if progress['quiz_score'] is not None else 0)
+    st.progress(completed_items / total_items)
+    st.caption(f"Progress: {completed_items}/{total_items} items completed")
+    
+    st.markdown("---")
+    
+    tab1, tab2, tab3 = st.tabs(["📖 Lessons", "✏️ Exercises", "📝 Quiz"])
+    
+    with tab1:
+        st.subheader("Step-by-Step Lessons")
+        
+        for i, lesson in enumerate(module['lessons']):
+            with st.expander(f"Lesson {i+1}: {lesson['title']}", expanded=(i == 0)):
+                st.markdown(lesson['content'])
+                
+                st.markdown("---")
+                st.markdown("**Key Takeaways:**")
+                for point in lesson['key_points']:
+                    st.markdown(f"✓ {point}")
+                
+                # Dataset download button (only for lessons that have an attached file)
+                if lesson.get('dataset_file'):
+                    import os as _os
+                    _fp = lesson['dataset_file']
+                    if _os.path.exists(_fp):
+                        with open(_fp, 'rb') as _f:
+                            st.download_button(
+                                label=f"📥 Download Dataset: {_fp}",
+                                data=_f.read(),
+                                file_name=_fp,
+                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                key=f"dl_{selected_topic}_{i}"
+                            )
+                
+                if st.button(f"Mark Lesson {i+1} Complete", key=f"lesson_{selected_topic}_{i}"):
+                    if progress['lessons_completed'] <= i:
+                        st.session_state.training_progress[selected_topic]['lessons_completed'] = i + 1
+                        st.success(f"Lesson {i+1} completed!")
+                        st.rerun()
+                
+                if progress['lessons_completed'] > i:
+                    st.success("✅ Completed")
+    
+    with tab2:
+        st.subheader("Hands-On Exercises")
+        
+        for i, exercise in enumerate(module['exercises']):
+            with st.expander(f"Exercise {i+1}: {exercise['title']}", expanded=False):
+                st.markdown(f"**Type:** {exercise['type'].title()}")
+                st.markdown("---")
+                st.markdown(f"**{exercise['question']}**")
+                
+                # Hint button
+                if st.button(f"Show Hint", key=f"hint_{selected_topic}_{i}"):
+                    st.info(f"💡 Hint: {exercise['hint']}")
+                
+                # User answer input
+                user_answer = st.text_area(
+                    "Your answer:",
+                    key=f"exercise_answer_{selected_topic}_{i}",
+                    placeholder="Type your answer here..."
+                )
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    if st.button("Check Answer", key=f"check_{selected_topic}_{i}"):
+                        if user_answer.strip():
+                            with st.spinner("Evaluating..."):
+                                feedback = evaluate_answer(exercise['question'], exercise['answer'], user_answer)
+                                st.success(feedback)
+                                if i not in progress['exercises_completed']:
+                                    st.session_state.training_progress[selected_topic]['exercises_completed'].append(i)
+                        else:
+                            st.warning("Please enter an answer first.")
+                
+                with col2:
+                    show_key = f"show_{selected_topic}_{i}"
+                    if st.button("Show Answer", key=f"reveal_{selected_topic}_{i}"):
+                        st.session_state.show_exercise_answer[show_key] = True
+                
+                if st.session_state.show_exercise_answer.get(f"show_{selected_topic}_{i}", False):
+                    st.info(f"**Answer:** {exercise['answer']}")
+                
+                if i in progress['exercises_completed']:
+                    st.success("✅ Attempted")
+    
+    with tab3:
+        st.subheader("Knowledge Quiz")
+        st.markdown("Test your understanding with this quiz!")
+        
+        quiz = module['quiz']
+        
+        if progress['quiz_score'] is not None:
+            st.success(f"Quiz completed! Score: {progress['quiz_score']}/{len(quiz)}")
+            if st.button("Retake Quiz"):
+                st.session_state.training_progress[selected_topic]['quiz_score'] = None
+                st.session_state.quiz_answers = {}
+                st.rerun()
+        else:
+            for i, q in enumerate(quiz):
+                st.markdown(f"**Q{i+1}: {q['question']}**")
+                answer = st.radio(
+                    "Select your answer:",
+                    options=q['options'],
+                    key=f"quiz_{selected_topic}_{i}",
+                    index=None
+                )
+                st.session_state.quiz_answers[f"{selected_topic}_{i}"] = q['options'].index(answer) if answer else None
+                st.markdown("---")
+            
+            if st.button("Submit Quiz", type="primary"):
+                score = 0
+                for i, q in enumerate(quiz):
+                    user_ans = st.session_state.quiz_answers.get(f"{selected_topic}_{i}")
+                    if user_ans == q['correct']:
+                        score += 1
+                
+                st.session_state.training_progress[selected_topic]['quiz_score'] = score
+                st.success(f"Quiz completed! Score: {score}/{len(quiz)}")
+                
+                # Show explanations
+                st.markdown("### Results:")
+                for i, q in enumerate(quiz):
+                    user_ans = st.session_state.quiz_answers.get(f"{selected_topic}_{i}")
+                    correct = user_ans == q['correct']
+                    icon = "✅" if correct else "❌"
+                    st.markdown(f"{icon} **Q{i+1}:** {q['question']}")
+                    if not correct:
+                        st.markdown(f"   Correct answer: {q['options'][q['correct']]}")
+                    st.markdown(f"   *{q['explanation']}*")
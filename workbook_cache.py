@@ -0,0 +1,120 @@
+"""Process-wide cache of parsed Excel workbooks.
+
+``dataset_calculator.py`` runs top to bottom on every Streamlit rerun and used
+to parse each CA Lesson workbook again each time -- the resolved ones twice,
+once with openpyxl for the formula strings and once with pandas for the
+values.  ``WorkbookCache`` reads and parses a workbook once per version of
+the file and keeps the result: the active sheet's cell rows, a sparse map of
+its formulas and the values Excel cached for those formulas (what openpyxl's
+``Workbook.active`` showed), plus the values DataFrame of the first sheet
+(what ``pd.read_excel(path)`` returned).  When the active tab is the first
+sheet -- as in the lesson workbooks -- all of it comes from a single pass over
+the sheet (see ``workbook_reader``); otherwise the first sheet is read too.
+
+Entries are keyed by (absolute path, mtime, size), so replacing a file on
+disk is picked up on the next lookup, and the least recently used workbooks
+are dropped beyond ``max_entries``.  Sessions share the cached objects:
+``ParsedWorkbook.values()`` returns a copy for callers that rename or
+convert columns, and everything else must be treated as read-only.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+from workbook_reader import read_sheet
+
+MAX_WORKBOOKS = 16
+
+
+class ParsedWorkbook:
+    def __init__(self, path, rows, formulas, values, cached_values=None):
+        self.path = path
+        self.rows = rows  # cell values of the active sheet, formulas as text; rows[0] is row 1
+        self.formulas = formulas  # (row, col) -> formula, 1-based like Excel
+        self.cached_values = cached_values or {}  # (row, col) -> last result Excel saved
+        self._values = values
+
+    def values(self, nrows=None):
+        """The first sheet as a DataFrame (first row as header), as ``pd.read_excel(path)``
+        returns it; a copy the caller owns.
+
+        Column types are inferred from the rows returned, as ``pd.read_excel``
+        with ``nrows`` would: a column that is whole numbers in the first 20
+        rows stays integer even if totals further down are not.
+        """
+        frame = self._values if nrows is None else self._values.iloc[:nrows]
+        return frame.copy().infer_objects()
+
+    def cell_value(self, row, col):
+        """Value stored in the cell at ``row``, ``col`` (1-based); formulas as text."""
+        if 1 <= row <= len(self.rows) and 1 <= col <= len(self.rows[row - 1]):
+            return self.rows[row - 1][col - 1]
+        return None
+
+    def formula(self, row, col):
+        """Formula in the cell at ``row``, ``col`` (1-based), or '' if it holds none."""
+        return self.formulas.get((row, col), "")
+
+    def cached_value(self, row, col):
+        """Result Excel saved for the formula at ``row``, ``col`` (1-based), or None."""
+        return self.cached_values.get((row, col))
+
+
+def parse_workbook(path):
+    with open(path, "rb") as f:
+        data = f.read()
+    sheet = read_sheet(data)
+    values = sheet.values if sheet.index == 0 else read_sheet(data, 0).values
+    return ParsedWorkbook(path, sheet.rows, sheet.formulas, values, sheet.cached)
+
+
+class WorkbookCache:
+    def __init__(self, max_entries=MAX_WORKBOOKS, parser=parse_workbook):
+        self.max_entries = max_entries
+        self._parser = parser
+        self._entries = OrderedDict()  # (path, mtime_ns, size) -> ParsedWorkbook
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def load(self, path):
+        """The parsed workbook at ``path``; raises FileNotFoundError if it is missing."""
+        info = os.stat(path)
+        full_path = os.path.abspath(path)
+        key = (full_path, info.st_mtime_ns, info.st_size)
+        with self._lock:
+            book = self._entries.get(key)
+            if book is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return book
+            self._stats["misses"] += 1
+
+        book = self._parser(path)
+
+        with self._lock:
+            for stale in [k for k in self._entries if k[0] == full_path and k != key]:
+                del self._entries[stale]
+            self._entries[key] = book
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+        return book
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+
+@lru_cache(maxsize=1)
+def get_workbook_cache():
+    return WorkbookCache()
+
+
+def load_workbook(path):
+    return get_workbook_cache().load(path)
@@ -0,0 +1,254 @@
+"""Read an xlsx sheet's formulas and values in one pass.
+
+openpyxl gives either the formulas of a workbook (the default) or the values
+Excel cached for them (``data_only=True``), never both, which is why the
+Dataset Calculator used to load each resolved workbook with openpyxl and then
+again with pandas.  An xlsx cell carries both -- ``<c><f>SUM(C2:C21)</f>
+<v>265</v></c>`` -- so ``read_sheet`` streams the sheet XML once with
+``iterparse``, the way openpyxl's read-only mode does, and keeps:
+
+* ``rows``: cell values as openpyxl's default mode reports them (formulas as
+  ``"=..."`` text, dates as datetimes);
+* ``formulas``: ``{(row, col): "=..."}`` for formula cells only;
+* ``cached``: ``{(row, col): value}``, the last result Excel saved for them;
+* ``values``: the sheet as ``pd.read_excel(..., sheet_name=index,
+  dtype=object)`` would return it, formula cells holding their cached results.
+
+The active tab is read unless a sheet position is given.
+
+Number formats, date conversion and shared-formula translation reuse
+openpyxl's helpers so results match what openpyxl and pandas report.
+"""
+
+import io
+import posixpath
+import zipfile
+from xml.etree import ElementTree
+from xml.etree.ElementTree import iterparse
+
+from openpyxl.formula.translate import Translator
+from openpyxl.styles.numbers import BUILTIN_FORMATS, is_date_format, is_timedelta_format
+from openpyxl.utils.cell import coordinate_to_tuple, get_column_letter
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900, from_excel, from_ISO8601
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+_CELL = MAIN_NS + "c"
+_ROW = MAIN_NS + "row"
+_VALUE = MAIN_NS + "v"
+_FORMULA = MAIN_NS + "f"
+_INLINE = MAIN_NS + "is"
+_TEXT = MAIN_NS + "t"
+_PHONETIC = MAIN_NS + "rPh"
+
+
+class SheetData:
+    def __init__(self, rows, formulas, cached, values, index=0):
+        self.index = index  # position of the sheet in the workbook, 0-based
+        self.rows = rows
+        self.formulas = formulas
+        self.cached = cached
+        self.values = values
+
+
+def _string_item(element):
+    """Text of a shared or inline string, rich-text runs joined, phonetic hints dropped."""
+    parts = []
+    for child in element.iter():
+        if child.tag == _TEXT and child.text:
+            parts.append(child.text)
+    for phonetic in element.iter(_PHONETIC):
+        for child in phonetic.iter(_TEXT):
+            if child.text:
+                parts.remove(child.text)
+    return "".join(parts)
+
+
+def _shared_strings(archive):
+    try:
+        source = archive.open("xl/sharedStrings.xml")
+    except KeyError:
+        return []
+    strings = []
+    with source:
+        for _, element in iterparse(source):
+            if element.tag == MAIN_NS + "si":
+                strings.append(_string_item(element))
+                element.clear()
+    return strings
+
+
+def _date_styles(archive):
+    """Style indexes that format numbers as dates, and the subset that are durations."""
+    try:
+        source = archive.open("xl/styles.xml")
+    except KeyError:
+        return set(), set()
+    custom = {}
+    xfs = []
+    with source:
+        for _, element in iterparse(source):
+            if element.tag == MAIN_NS + "numFmt":
+                custom[int(element.get("numFmtId"))] = element.get("formatCode")
+            elif element.tag == MAIN_NS + "cellXfs":
+                xfs = [int(xf.get("numFmtId", 0)) for xf in element.findall(MAIN_NS + "xf")]
+    dates, durations = set(), set()
+    for style_id, fmt_id in enumerate(xfs):
+        fmt = custom.get(fmt_id, BUILTIN_FORMATS.get(fmt_id))
+        if fmt and is_date_format(fmt):
+            dates.add(style_id)
+            if is_timedelta_format(fmt):
+                durations.add(style_id)
+    return dates, durations
+
+
+def _sheet_part(archive, index=None):
+    """Position and XML path of sheet ``index`` (default: the active tab), and the workbook's date epoch."""
+    with archive.open("xl/workbook.xml") as source:
+        workbook = ElementTree.parse(source).getroot()
+    properties = workbook.find(MAIN_NS + "workbookPr")
+    date1904 = properties is not None and properties.get("date1904") in ("1", "true")
+    sheets = workbook.findall(f"{MAIN_NS}sheets/{MAIN_NS}sheet")
+    if index is None:
+        view = workbook.find(f"{MAIN_NS}bookViews/{MAIN_NS}workbookView")
+        index = min(int(view.get("activeTab", 0)) if view is not None else 0, len(sheets) - 1)
+    elif not 0 <= index < len(sheets):
+        raise ValueError(f"workbook has no sheet {index}")
+    rel_id = sheets[index].get(REL_NS + "id")
+
+    with archive.open("xl/_rels/workbook.xml.rels") as source:
+        relationships = ElementTree.parse(source).getroot()
+    for relationship in relationships.iter(PKG_REL_NS + "Relationship"):
+        if relationship.get("Id") == rel_id:
+            target = relationship.get("Target")
+            break
+    else:
+        raise ValueError(f"workbook has no part for sheet {rel_id}")
+    if target.startswith("/"):
+        path = target.lstrip("/")
+    else:
+        path = posixpath.normpath(posixpath.join("xl", target))
+    return index, path, CALENDAR_MAC_1904 if date1904 else CALENDAR_WINDOWS_1900
+
+
+def _number(text):
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _table_cell(value, data_type):
+    # What pandas' openpyxl reader turns a cell into before building the frame.
+    if value is None:
+        return ""
+    if data_type == "e":
+        return float("nan")
+    if data_type == "n":
+        whole = int(value)
+        return whole if whole == value else float(value)
+    return value
+
+
+def _cell_value(element, strings, dates, durations, epoch):
+    """A ``<c>`` element's stored value and data type, converted like openpyxl."""
+    data_type = element.get("t", "n")
+    if data_type == "inlineStr":
+        inline = element.find(_INLINE)
+        return (_string_item(inline) if inline is not None else None), "s"
+    value = element.findtext(_VALUE) or None
+    if value is None:
+        return None, data_type
+    if data_type == "n":
+        value = _number(value)
+        style_id = int(element.get("s", 0))
+        if style_id in dates:
+            try:
+                return from_excel(value, epoch, timedelta=style_id in durations), "d"
+            except (OverflowError, ValueError):
+                return "#VALUE!", "e"
+    elif data_type == "s":
+        value = strings[int(value)]
+    elif data_type == "b":
+        value = bool(int(value))
+    elif data_type == "str":
+        data_type = "s"
+    elif data_type == "d":
+        value = from_ISO8601(value)
+    return value, data_type
+
+
+def _sheet_cells(sheet):
+    """Yield ``(row, col, element)`` for each ``<c>`` once it has been read."""
+    row = column = 0
+    for event, element in iterparse(sheet, events=("start", "end")):
+        if event == "start":
+            if element.tag == _ROW:
+                row = int(element.get("r", row + 1))
+                column = 0
+        elif element.tag == _CELL:
+            coordinate = element.get("r")
+            if coordinate:
+                row, column = coordinate_to_tuple(coordinate)
+            else:
+                column += 1
+            yield row, column, element
+            element.clear()
+
+
+def read_sheet(source, sheet=None):
+    """Read one sheet of an xlsx file (a path, bytes or a binary file).
+
+    ``sheet`` is the sheet's 0-based position; by default the active tab is
+    read, as openpyxl's ``Workbook.active`` does.  ``pd.read_excel`` reads
+    sheet 0 unless told otherwise.
+    """
+    if isinstance(source, (bytes, bytearray)):
+        source = io.BytesIO(source)
+    cells = {}  # row -> {col: value, formulas as text}
+    table = {}  # row -> {col: value as pandas reads it}
+    formulas = {}
+    cached = {}
+    shared = {}  # shared formula index -> Translator from its master cell
+    with zipfile.ZipFile(source) as archive:
+        strings = _shared_strings(archive)
+        dates, durations = _date_styles(archive)
+        index, sheet_path, epoch = _sheet_part(archive, sheet)
+        with archive.open(sheet_path) as part:
+            for row, column, element in _sheet_cells(part):
+                value, data_type = _cell_value(element, strings, dates, durations, epoch)
+                stored = value
+                formula = element.find(_FORMULA)
+                if formula is not None and formula.get("t") != "dataTable":
+                    stored = "=" + (formula.text or "")
+                    if formula.get("t") == "shared":
+                        index = formula.get("si")
+                        coordinate = get_column_letter(column) + str(row)
+                        if formula.text:
+                            shared[index] = Translator(stored, coordinate)
+                        elif index in shared:
+                            stored = shared[index].translate_formula(coordinate)
+                    formulas[(row, column)] = stored.replace("_xlfn.", "")
+                    cached[(row, column)] = value
+                cells.setdefault(row, {})[column] = stored
+                if value is not None:
+                    table.setdefault(row, {})[column] = _table_cell(value, data_type)
+
+    rows = [tuple(row) for row in _grid(cells, fill=None)]
+    data = _grid(table, fill="")
+    values = TextParser(data, header=0, dtype=object, skip_blank_lines=False).read() if data else pd.DataFrame()
+    return SheetData(rows, formulas, cached, values, index)
+
+
+def _grid(cells, fill):
+    """Rows 1..last as lists padded to the widest row, the layout openpyxl and pandas use."""
+    if not cells:
+        return []
+    width = max(max(row) for row in cells.values())
+    return [
+        [cells.get(r, {}).get(c, fill) for c in range(1, width + 1)]
+        for r in range(1, max(cells) + 1)
+    ]